@@ -3,30 +3,35 @@
 APAC specialist page — full deploy script.
 Run from repo root: python3 apac_deploy.py
 """
-import os, base64
+import os
+import sys
+
+from ep_tools.files import print_summary, sync_assets, write_text
 
 BASE = os.path.dirname(os.path.abspath(__file__))
 
-def write(rel, content):
-    path = os.path.join(BASE, rel)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
-    print(f"  \u2713 {rel}")
+# Binary assets are referenced by path + sha256, not embedded in this script.
+# Drop the rendered files into deploy_assets/ (or pass another dir as argv[1]);
+# they're only copied when the repo copy's hash differs.
+ASSETS_DIR = sys.argv[1] if len(sys.argv) > 1 else os.path.join(BASE, "deploy_assets")
+ASSETS = [
+    ("public/og-articles/og-apac-private-banking-recruiter-switzerland.jpg",
+     "a930617ed91ed1b66484750227502bba08445e6cf397feef33d567c3a8f6abf9"),
+]
 
-def write_bin(rel, b64):
-    path = os.path.join(BASE, rel)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "wb") as f:
-        f.write(base64.b64decode(b64))
-    print(f"  \u2713 {rel}")
+STATUSES = []
+
+def write(rel, content):
+    # Skips identical content so mtimes (and Next.js build caches) stay put.
+    STATUSES.append(write_text(BASE, rel, content))
 
 print("Writing files...")
 write("app/en/apac-private-banking-recruiter-switzerland/page.tsx", '// app/en/apac-private-banking-recruiter-switzerland/page.tsx\nimport type { Metadata } from "next"\nimport Link from "next/link"\n\nconst SITE = "https://www.execpartners.ch"\nconst PAGE_URL = `${SITE}/en/apac-private-banking-recruiter-switzerland`\n\nconst jsonLd = {\n  "@context": "https://schema.org",\n  "@type": "ProfessionalService",\n  name: "Executive Partners | APAC Private Banking Recruiter Switzerland",\n  url: PAGE_URL,\n  description: "Specialist private banking recruiter for the Asia-Pacific market. Senior RMs covering Greater China, SEA, Japan and APAC cross-border wealth placed at Swiss and Singapore-based private banks.",\n  address: { "@type": "PostalAddress", addressLocality: "Geneva", addressCountry: "CH" },\n  areaServed: ["Geneva", "Switzerland", "Singapore", "Hong Kong", "Asia-Pacific"],\n  serviceType: "Private Banking Executive Search | APAC Market",\n}\n\nconst faqJsonLd = {\n  "@context": "https://schema.org",\n  "@type": "FAQPage",\n  mainEntity: [\n    {\n      "@type": "Question",\n      name: "What is an APAC private banking desk in Switzerland?",\n      acceptedAnswer: {\n        "@type": "Answer",\n        text: "An APAC private banking desk in Switzerland serves Asian clients whose assets are booked through Swiss or Singapore platforms. Bankers typically cover UHNW and HNW families from Greater China, Southeast Asia, Japan and Korea, advising on cross-border portfolios, offshore structures and intergenerational wealth transfer.",\n      },\n    },\n    {\n      "@type": "Question",\n      name: "What languages are required for an APAC private banker in Switzerland?",\n      acceptedAnswer: {\n        "@type": "Answer",\n        text: "Mandarin is essential for Greater China coverage. Cantonese is a strong advantage for Hong Kong and Mainland China clients. English is required for internal communication and Swiss regulatory compliance. Additional language skills in Bahasa, Thai or Japanese are valued for broader SEA coverage.",\n      },\n    },\n    {\n      "@type": "Question",\n      name: "How portable are APAC private banking books between Switzerland and Singapore?",\n      acceptedAnswer: {\n        "@type": "Answer",\n        text: "APAC books are among the most complex to port across booking centres. Client relationships often span Geneva, Singapore and Hong Kong simultaneously. CRS reporting, MAS regulatory requirements and Swiss cross-border frameworks all apply. Books with genuine advisory depth, multi-product penetration and well-documented KYC transfer at higher rates than pure custody mandates.",\n      },\n    },\n    {\n      "@type": "Question",\n      name: "Which platforms are most active in APAC private banking hiring in Switzerland?",\n      acceptedAnswer: {\n        "@type": "Answer",\n        text: "Platforms with established APAC desks in Geneva and Zurich include Julius Baer, UBS, Pictet, Lombard Odier, EFG International and Union Bancaire Privee. Singapore-based platforms including DBS Private Bank, Bank of Singapore and OCBC are also active in building cross-border coverage teams.",\n      },\n    },\n  ],\n}\n\nexport const metadata: Metadata = {\n  title: "APAC Private Banking Recruiter Switzerland | Senior RM Search",\n  description: "Specialist private banking recruiter for APAC. Senior RMs covering Greater China, SEA and Japan placed at Swiss and Singapore private banks in Geneva and Zurich.",\n  alternates: { canonical: PAGE_URL },\n  openGraph: {\n    title: "APAC Private Banking Recruiter Switzerland | Senior RM Search",\n    description: "Specialist private banking recruiter for Asia-Pacific. Senior RMs with Greater China, SEA and APAC cross-border books placed at leading Swiss and Singapore platforms.",\n    url: PAGE_URL,\n    type: "website",\n    siteName: "Executive Partners",\n    images: [{ url: `${SITE}/og-articles/og-apac-private-banking-recruiter-switzerland.jpg`, width: 1200, height: 630 }],\n  },\n  robots: { index: true, follow: true },\n}\n\nexport default function Page() {\n  return (\n    <>\n      <script type="application/ld+json" dangerouslySetInnerHTML={{ __html: JSON.stringify(jsonLd) }} />\n      <script type="application/ld+json" dangerouslySetInnerHTML={{ __html: JSON.stringify(faqJsonLd) }} />\n      <main className="min-h-screen bg-[#0B0E13] text-white py-20 px-4">\n        <div className="mx-auto max-w-3xl space-y-8">\n\n          <p className="text-sm font-semibold uppercase tracking-widest text-[#C9A14A]">\n            Geneva · Switzerland · Asia-Pacific Private Banking\n          </p>\n\n          <h1 className="text-3xl md:text-5xl font-semibold leading-tight">\n            APAC Private Banking Recruiter in Switzerland\n          </h1>\n\n          <p className="text-white/80 text-lg leading-relaxed">\n            Executive Partners is a Geneva-based private banking recruiter specialising in the placement of Senior Relationship Managers covering the Asia-Pacific market. We place bankers with portable APAC books at leading Swiss private banks in Geneva and Zurich, and at Singapore-based platforms building cross-border coverage teams.\n          </p>\n\n          <div className="flex flex-wrap gap-4 pt-2">\n            <Link href="/en/apply" className="inline-flex items-center justify-center rounded-full px-6 py-3 text-sm font-semibold bg-[#C9A14A] text-black hover:opacity-90 transition">\n              Submit your profile\n            </Link>\n            <Link href="/en/hiring-managers/brief" className="inline-flex items-center justify-center rounded-full px-6 py-3 text-sm font-semibold border border-white/20 text-white hover:bg-white/10 transition">\n              Brief an APAC mandate\n            </Link>\n          </div>\n\n          <hr className="border-white/10" />\n\n          <h2 className="text-2xl font-semibold">What Makes APAC Private Banking Distinct</h2>\n          <p className="text-white/70 leading-relaxed">\n            Asian private wealth is the fastest-growing segment in global private banking. Switzerland and Singapore are the two primary booking centres for APAC cross-border assets, and the flow of talent between the two hubs has intensified. Senior RMs covering Greater China, Southeast Asia and Japan increasingly hold relationships that span both jurisdictions, requiring recruiters with genuine knowledge of both markets.\n          </p>\n          <p className="text-white/70 leading-relaxed">\n            The APAC private banking talent market differs materially from European segments. Mandarin fluency is often a hard requirement for Greater China coverage. MAS licensing adds a regulatory layer for Singapore-based roles. And client relationships in Asian wealth management often run through family networks and multi-generational structures that require both cultural fluency and deep relationship management skills from the banker covering them.\n          </p>\n\n          <h2 className="text-2xl font-semibold">Roles We Place for the APAC Market</h2>\n          <p className="text-white/70 leading-relaxed">\n            Our APAC mandates across Geneva, Zurich and Singapore typically cover Senior Relationship Manager roles with CHF 150M to CHF 1B+ in Greater China, SEA or broader APAC cross-border AUM, Desk Head positions for platforms building or expanding their Asian coverage teams, and Investment Advisor roles servicing APAC UHNW clients with complex structured product and alternative investment needs.\n          </p>\n          <ul className="text-white/60 text-sm space-y-2 list-disc list-inside">\n            <li>Senior Relationship Manager | Greater China (Geneva or Zurich based)</li>\n            <li>Senior Relationship Manager | Southeast Asia Coverage</li>\n            <li>APAC Desk Head | Cross-Border Switzerland to Singapore</li>\n            <li>Investment Advisor | APAC UHNW</li>\n            <li>Market Leader | Asia-Pacific Coverage Build-Out</li>\n          </ul>\n\n          <h2 className="text-2xl font-semibold">Switzerland and Singapore: The Dual-Hub Dynamic</h2>\n          <p className="text-white/70 leading-relaxed">\n            The most senior APAC bankers in Geneva increasingly hold relationships that are dual-booked across Switzerland and Singapore. This creates a specific recruiting challenge: the candidate pool is smaller, the regulatory requirements are layered, and the compensation benchmarks are set by both Swiss and Singapore norms. Executive Partners tracks both markets and advises on cross-border move structures, garden leave implications and client migration strategy before any approach is made.\n          </p>\n\n          <h2 className="text-2xl font-semibold">AUM Portability for APAC Books</h2>\n          <p className="text-white/70 leading-relaxed">\n            APAC books are among the most complex to assess for portability. Client relationships often run through family holding structures across multiple jurisdictions. CRS reporting, beneficial ownership documentation and Swiss cross-border frameworks all apply. Use our{" "}\n            <Link href="/en/portability" className="text-[#C9A14A] hover:underline">AUM Portability Score</Link>\n            {" "}to benchmark your transfer potential, or run a{" "}\n            <Link href="/en/bp-simulator" className="text-[#C9A14A] hover:underline">Business Plan Simulation</Link>\n            {" "}before approaching a new platform.\n          </p>\n\n          <h2 className="text-2xl font-semibold">Frequently Asked Questions</h2>\n          <div className="space-y-5">\n            {[\n              { q: "What is an APAC private banking desk in Switzerland?", a: "An APAC private banking desk in Switzerland serves Asian clients whose assets are booked through Swiss or Singapore platforms. Bankers cover UHNW and HNW families from Greater China, Southeast Asia, Japan and Korea, advising on cross-border portfolios, offshore structures and intergenerational wealth transfer." },\n              { q: "What languages are required for an APAC private banker in Switzerland?", a: "Mandarin is essential for Greater China coverage. Cantonese is a strong advantage for Hong Kong and Mainland China clients. English is required for internal communication and Swiss regulatory compliance. Additional language skills in Bahasa, Thai or Japanese are valued for broader SEA coverage." },\n              { q: "How portable are APAC private banking books between Switzerland and Singapore?", a: "APAC books are among the most complex to port across booking centres. Client relationships often span Geneva, Singapore and Hong Kong simultaneously. CRS reporting, MAS regulatory requirements and Swiss cross-border frameworks all apply. Books with genuine advisory depth and well-documented KYC transfer at higher rates than pure custody mandates." },\n              { q: "Which platforms are most active in APAC private banking hiring in Switzerland?", a: "Platforms with established APAC desks in Geneva and Zurich include Julius Baer, UBS, Pictet, Lombard Odier, EFG International and Union Bancaire Privee. Singapore-based platforms including DBS Private Bank, Bank of Singapore and OCBC are also active in building cross-border coverage teams." },\n            ].map(({ q, a }) => (\n              <div key={q} className="border-t border-white/10 pt-5 pb-2">\n                <h3 className="text-white font-medium mb-2">{q}</h3>\n                <p className="text-white/60 text-sm leading-relaxed">{a}</p>\n              </div>\n            ))}\n          </div>\n\n          <hr className="border-white/10" />\n\n          <section>\n            <p className="text-xs uppercase tracking-widest text-white/30 mb-4">Related</p>\n            <ul className="space-y-2 text-sm text-white/50">\n              <li><Link href="/en/markets/singapore" className="hover:text-white transition">Singapore private banking market hub</Link></li>\n              <li><Link href="/en/markets/hong-kong" className="hover:text-white transition">Hong Kong private banking market hub</Link></li>\n              <li><Link href="/en/private-banking-recruiter-singapore" className="hover:text-white transition">Private banking recruiter Singapore</Link></li>\n              <li><Link href="/en/latam-private-banking-recruiter-geneva" className="hover:text-white transition">LATAM private banking recruiter Geneva</Link></li>\n              <li><Link href="/en/nri-private-banking-recruiter-switzerland" className="hover:text-white transition">NRI private banking recruiter Switzerland</Link></li>\n              <li><Link href="/en/private-banking-recruitment-company" className="hover:text-white transition">About Executive Partners</Link></li>\n              <li><Link href="/en/portability" className="hover:text-white transition">AUM Portability Score</Link></li>\n              <li><Link href="/en/bp-simulator" className="hover:text-white transition">Business Plan Simulator</Link></li>\n            </ul>\n          </section>\n\n        </div>\n      </main>\n    </>\n  )\n}\n')
 write("app/sitemap.ts", '// app/sitemap.ts\nimport type { MetadataRoute } from "next";\nimport { getAllJobsPublic, type PublicJob } from "@/lib/jobs-public";\nimport { MARKET_SLUGS } from "@/lib/markets/data";\nimport { INSIGHTS } from "@/app/en/insights/articles";\n\n/** 🔐 Canonical base — NEVER use env or Vercel here */\nconst CANONICAL_BASE = "https://www.execpartners.ch";\n\n/** If /api/jobs is empty/unavailable, keep these in the sitemap so Jobs stays visible. */\nconst FALLBACK_JOB_SLUGS: string[] = [\n  "senior-relationship-manager-mea-dubai",\n  "senior-relationship-manager-brazil-ch",\n  "senior-relationship-manager-ch-onshore-zurich",\n  "senior-relationship-manager-ch-onshore-lausanne",\n  "senior-relationship-manager-portugal-geneva",\n];\n\n/** Normalize URL against canonical base */\nfunction normalize(base: string, path: string): string {\n  const raw = `${base}${path.startsWith("/") ? path : `/${path}`}`;\n  const collapsed = raw.replace(/([^:]\\/)\\/+/g, "$1");\n  return collapsed === `${base}/` ? `${base}/` : collapsed.replace(/\\/+$/, "");\n}\n\n/** Coerce active flag (API may return boolean or string) */\nfunction isActive(v: unknown): boolean {\n  if (typeof v === "boolean") return v;\n  if (typeof v === "string") return v.toLowerCase() === "true";\n  return true; // default: include unless explicitly false\n}\n\nexport default async function sitemap(): Promise<MetadataRoute.Sitemap> {\n  const base = CANONICAL_BASE;\n  const now = new Date();\n\n  // --- Static pages ---\n  const staticPages: string[] = [\n    "/",\n\n    "/jobs",\n    \n    "/candidates",\n    "/hiring-managers",\n    "/insights",\n    "/about",\n    "/contact",\n\n    "/private-banking-jobs-switzerland",\n\n    "/private-banking-recruiter-switzerland",\n    "/private-banking-recruiter-geneva",\n    "/private-banking-recruiter-zurich",\n    "/private-banking-recruiter-dubai",\n    "/private-banking-recruiter-riyadh",\n    "/private-banking-recruiter-singapore",\n    "/private-banking-recruiter-london",\n    "/private-banking-recruiter-hong-kong",\n    "/private-banking-recruiter-miami",\n    "/private-banking-recruiter-new-york",\n    "/private-banking-recruiter-paris",\n    "/private-banking-recruiter-madrid",\n    "/private-banking-recruiter-lisbon",\n    "/private-banking-jobs-dubai",\n    "/private-banking-jobs-singapore",\n    "/private-banking-jobs-london",\n    "/private-banking-jobs-new-york",\n    "/private-banking-jobs-geneva",\n    "/private-banking-jobs-zurich",\n\n    "/en/jobs",\n    \n    "/en",\n    "/fr",\n    "/de",\n    "/en/candidates",\n    "/en/eam-recruiter-switzerland",\n    "/en/wealth-management-recruiter-switzerland",\n    "/en/private-banking-headhunter-geneva",\n  "/en/private-banking-recruitment-company",\n  "/en/latam-private-banking-recruiter-geneva",\n  "/en/mea-private-banking-recruiter-geneva",\n  "/en/nri-private-banking-recruiter-switzerland",\n  "/en/israeli-market-private-banking-switzerland",\n    "/en/hiring-managers",\n    "/en/insights",\n    "/en/about",\n    "/en/contact",\n    "/en/markets",\n    "/en/private-banker-jobs",\n    "/en/portability",\n    "/en/bp-simulator",\n    "/en/subscribe",\n    "/de/headhunter-genf",\n    "/de/headhunter-zuerich",\n    "/en/faq",\n    "/en/private-banking-recruiter-geneva",\n    "/en/private-banking-recruiter-zurich",\n    "/en/private-banking-recruiter-london",\n    "/en/private-banking-recruiter-dubai",\n    "/en/private-banking-recruiter-riyadh",\n    "/en/private-banking-recruiter-singapore",\n    "/en/private-banking-recruiter-hong-kong",\n    "/en/private-banking-recruiter-new-york",\n    "/en/private-banking-recruiter-milan",\n    "/en/private-banking-recruiter-miami",\n    "/en/private-banking-recruiter-paris",\n    "/en/private-banking-recruiter-madrid",\n    "/en/private-banking-recruiter-lisbon",\n    "/en/private-banker-jobs-riyadh",\n    "/en/private-banker-jobs-dubai",\n    "/en/private-banker-jobs-geneva",\n    "/en/private-banker-jobs-zurich",\n    "/en/private-banker-jobs-london",\n    "/en/private-banker-jobs-singapore",\n    "/en/private-banker-jobs-hong-kong",\n    "/en/private-banker-jobs-new-york",\n    "/en/private-banker-jobs-miami",\n    "/en/private-banker-jobs-paris",\n    "/en/private-banker-jobs-madrid",\n    "/en/private-banker-jobs-milano",\n    "/en/private-banker-jobs-lisbon",\n\n    "/en/executive-search-geneva",\n    "/en/private-banking-recruiter-switzerland",\n    "/en/private-banking-recruitment-agency",\n    "/en/private-banking-recruitment-zurich",\n    "/en/private-banking-recruiter-tel-aviv",\n    "/en/private-banker-jobs-tel-aviv",\n    "/en/markets/tel-aviv",\n    "/en/apac-private-banking-recruiter-switzerland",\n  ];\n\n  const staticEntries: MetadataRoute.Sitemap = staticPages.map((p) => ({\n    url: normalize(base, p),\n    lastModified: now,\n    changeFrequency:\n      p === "/" || p === "/en" || p === "/insights" || p === "/en/insights"\n        ? "daily"\n        : "weekly",\n    priority:\n      p === "/" || p === "/en"\n        ? 1\n        : p === "/insights" || p === "/en/insights"\n        ? 0.8\n        : 0.7,\n  }));\n\n  // --- Dynamic job pages ---\n  let jobs: PublicJob[] = [];\n  try {\n    const data = await getAllJobsPublic();\n    jobs = Array.isArray(data) ? data : [];\n  } catch {\n    // silent fail in production\n  }\n\n  // If jobs API returns nothing, fall back to evergreen slugs\n  if (!jobs.length) {\n    jobs = FALLBACK_JOB_SLUGS.map((slug) => ({ slug, active: true })) as unknown as PublicJob[];\n  }\n\n  // IMPORTANT: PublicJob has no createdAt/updatedAt → lastModified = now (safe + valid)\n  const jobEntries: MetadataRoute.Sitemap = jobs\n    .filter((j) => j?.slug && isActive((j as any).active))\n    .map((j) => ({\n      url: normalize(base, `/en/jobs/${j.slug!}`),\n      lastModified: now,\n      changeFrequency: "weekly",\n      priority: 0.8,\n    }));\n\n  // --- Markets ---\n  const marketEntries: MetadataRoute.Sitemap = MARKET_SLUGS.flatMap((slug) => [\n    {\n      url: normalize(base, `/en/markets/${slug}`),\n      lastModified: now,\n      changeFrequency: "weekly",\n      priority: 0.75,\n    },\n    {\n      url: normalize(base, `/en/private-banker-jobs/${slug}`),\n      lastModified: now,\n      changeFrequency: "weekly",\n      priority: 0.75,\n    },\n  ]);\n\n  // --- Insights ---\n  const insightsEntries: MetadataRoute.Sitemap = INSIGHTS.map((p) => ({\n    url: normalize(base, `/en/insights/${p.slug}`),\n    lastModified: p.date ? new Date(p.date) : now,\n    changeFrequency: "weekly",\n    priority: 0.8,\n  }));\n\n  // --- De-duplicate ---\n  const seen = new Set<string>();\n  return [\n    ...staticEntries,\n    ...jobEntries,\n    ...marketEntries,\n    ...insightsEntries,\n  ].filter((e) => {\n    if (seen.has(e.url)) return false;\n    seen.add(e.url);\n    return true;\n  });\n}')
 write("components/TopNav.tsx", '"use client";\n\nimport Link from "next/link";\nimport { usePathname } from "next/navigation";\nimport { useEffect, useMemo, useRef, useState } from "react";\n\ntype NavItem = { href: string; label: string; external?: boolean };\n\nfunction withBase(base: string, href: string) {\n  if (!href.startsWith("/")) return href;\n  if (!base) return href;\n  if (href.startsWith("/en/")) return href; // avoid double-prefix\n  return `${base}${href}`;\n}\n\nexport default function TopNav() {\n  const pathname = usePathname();\n  const [open, setOpen] = useState(false); // mobile panel\n  const [scrolled, setScrolled] = useState(false);\n  const [dd, setDd] = useState<null | "Tools" | "Insights" | "Specialists">(null); // desktop dropdown\n\n  // ✅ Prevent dropdown from closing instantly when moving cursor button -> panel\n  const closeTimer = useRef<number | null>(null);\n  const openDd = (which: "Tools" | "Insights" | "Specialists") => {\n    if (closeTimer.current) window.clearTimeout(closeTimer.current);\n    setDd(which);\n  };\n  const scheduleCloseDd = () => {\n    if (closeTimer.current) window.clearTimeout(closeTimer.current);\n    closeTimer.current = window.setTimeout(() => setDd(null), 180);\n  };\n\n  // ✅ Nav targets (Markets/Jobs/Candidates/Hiring Managers/About/Contact/Tools/Insights)\n  // have no separate French or German version, so always point at /en regardless of\n  // the current path. Previously this only matched pages already under /en/, so the\n  // bare homepage ("/") and /de fell through to unprefixed links (/markets, /jobs...).\n  const base = "/en";\n\n  // ✅ Normalize pathname for active matching (strip /en)\n  const normalizedPath = useMemo(() => {\n    if (!pathname) return "";\n    return pathname.startsWith("/en/") ? pathname.slice(3) : pathname; // "/en/xyz" -> "/xyz"\n  }, [pathname]);\n\n  // ✅ Active check uses normalizedPath and *unprefixed* route\n  const isActive = (href: string) =>\n    normalizedPath === href || normalizedPath.startsWith(href + "/");\n\n  // ----- Nav structure (unprefixed routes)\n  const TOP: NavItem[] = [\n    { href: "/markets", label: "Markets" },\n    { href: "/jobs", label: "Jobs" },\n    { href: "/candidates", label: "Candidates" },\n    { href: "/hiring-managers", label: "Hiring Managers" },\n    { href: "/about", label: "About" },\n  ];\n\n  const TOOLS: NavItem[] = [\n    { href: "/bp-simulator", label: "Business Plan Simulator" },\n    { href: "/portability", label: "Portability Score" },\n  ];\n\n  const INSIGHTS: NavItem[] = [\n    { href: "/insights", label: "Private Wealth Pulse" },\n    {\n      href: "/insights/private-banking-career-intelligence",\n      label: "Career Intelligence 2026",\n    },\n  ];\n\n  const SPECIALISTS: NavItem[] = [\n    { href: "/latam-private-banking-recruiter-geneva", label: "LATAM Private Banking" },\n    { href: "/mea-private-banking-recruiter-geneva", label: "MEA Private Banking" },\n    { href: "/nri-private-banking-recruiter-switzerland", label: "NRI Private Banking" },\n    { href: "/israeli-market-private-banking-switzerland", label: "Israeli Market" },\n    { href: "/private-banking-recruitment-company", label: "Our Firm" },\n    { href: "/apac-private-banking-recruiter-switzerland", label: "APAC Private Banking" },\n  ];\n\n  const CONTACT: NavItem = { href: "/contact", label: "Contact" };\n\n  // Apply base to internal routes\n  const TOP_BASE = useMemo(\n    () => TOP.map((i) => (i.external ? i : { ...i, href: withBase(base, i.href) })),\n    [base]\n  );\n  const TOOLS_BASE = useMemo(\n    () => TOOLS.map((i) => (i.external ? i : { ...i, href: withBase(base, i.href) })),\n    [base]\n  );\n  const INSIGHTS_BASE = useMemo(\n    () => INSIGHTS.map((i) => (i.external ? i : { ...i, href: withBase(base, i.href) })),\n    [base]\n  );\n  const SPECIALISTS_BASE = useMemo(\n    () => SPECIALISTS.map((i) => (i.external ? i : { ...i, href: withBase(base, i.href) })),\n    [base]\n  );\n\n  const CONTACT_BASE = useMemo(\n    () => (CONTACT.external ? CONTACT : { ...CONTACT, href: withBase(base, CONTACT.href) }),\n    [base]\n  );\n\n  // Body scroll lock when mobile menu is open\n  useEffect(() => {\n    document.body.classList.toggle("ep-lock-scroll", open);\n    return () => document.body.classList.remove("ep-lock-scroll");\n  }, [open]);\n\n  // Close menus on route change\n  useEffect(() => {\n    setOpen(false);\n    setDd(null);\n    document.body.classList.remove("ep-lock-scroll");\n  }, [pathname]);\n\n  // Header style on scroll + ESC to close\n  useEffect(() => {\n    const onScroll = () => setScrolled(window.scrollY > 8);\n    const onKey = (e: KeyboardEvent) => {\n      if (e.key === "Escape") {\n        setOpen(false);\n        setDd(null);\n      }\n    };\n    onScroll();\n    window.addEventListener("scroll", onScroll, { passive: true });\n    window.addEventListener("keydown", onKey);\n    return () => {\n      window.removeEventListener("scroll", onScroll);\n      window.removeEventListener("keydown", onKey);\n    };\n  }, []);\n\n  // Cleanup timer\n  useEffect(() => {\n    return () => {\n      if (closeTimer.current) window.clearTimeout(closeTimer.current);\n    };\n  }, []);\n\n  const bar =\n    "fixed inset-x-0 top-0 z-40 transition-colors " +\n    (scrolled\n      ? "border-b border-white/10 bg-[#050814]/80 backdrop-blur supports-[backdrop-filter]:bg-[#050814]/65"\n      : "bg-transparent");\n\n  const linkClasses = (active: boolean) =>\n    [\n      "relative rounded-full px-3 py-1.5 text-sm whitespace-nowrap transition-colors",\n      active\n        ? "text-[#F5D778] bg-white/5"\n        : "text-slate-200 hover:text-white hover:bg-white/5",\n    ].join(" ");\n\n  const ddButtonClasses = (active: boolean, isOpen: boolean) =>\n    [\n      "relative rounded-full px-3 py-1.5 text-sm whitespace-nowrap transition-colors flex items-center gap-1",\n      active || isOpen\n        ? "text-[#F5D778] bg-white/5"\n        : "text-slate-200 hover:text-white hover:bg-white/5",\n    ].join(" ");\n\n  // ✅ IMPORTANT: open inward & above other elements\n  const ddPanel =\n    "absolute right-0 mt-2 w-72 rounded-2xl border border-white/10 bg-[#050814]/95 backdrop-blur p-2 shadow-xl z-50";\n\n  const ddItemClasses = (active: boolean) =>\n    [\n      "block rounded-xl px-3 py-2 text-sm transition-colors",\n      active\n        ? "bg-white/10 text-[#F5D778]"\n        : "text-slate-200 hover:text-white hover:bg-white/5",\n    ].join(" ");\n\n  const toolsActive = TOOLS.some((i) => isActive(i.href));\n  const insightsActive = INSIGHTS.some((i) => isActive(i.href));\n  const specialistsActive = SPECIALISTS.some((i) => isActive(i.href));\n\n  return (\n    <header className={bar}>\n      <nav className="mx-auto max-w-6xl px-4 sm:px-6 lg:px-8 py-3">\n        <div className="flex items-center justify-between gap-3">\n          {/* Brand */}\n          <Link\n            href={base || "/"}\n            className="shrink-0 text-base sm:text-lg font-semibold tracking-tight text-white hover:text-[#F5D778] transition-colors"\n            aria-label="Executive Partners — Home"\n          >\n            Executive Partners\n          </Link>\n\n          {/* Desktop nav */}\n          <div className="hidden md:flex items-center gap-2">\n            {/* ✅ Left: scrolling links only (no dropdowns inside overflow container) */}\n            <div className="flex items-center gap-2 max-w-[62vw] overflow-x-auto overscroll-x-contain [-webkit-overflow-scrolling:touch] pr-1">\n              {TOP_BASE.map((item) =>\n                item.external ? (\n                  <a\n                    key={item.href}\n                    href={item.href}\n                    target="_blank"\n                    rel="noopener noreferrer"\n                    className={linkClasses(isActive(item.href))}\n                  >\n                    {item.label}\n                  </a>\n                ) : (\n                  <Link\n                    key={item.href}\n                    href={item.href}\n                    className={linkClasses(isActive(item.href))}\n                    aria-current={isActive(item.href) ? "page" : undefined}\n                  >\n                    {item.label}\n                  </Link>\n                )\n              )}\n            </div>\n\n            {/* ✅ Right: dropdowns + CTA (no overflow clipping) */}\n            <div className="relative flex items-center gap-2">\n              {/* Tools dropdown */}\n              <div\n                className="relative"\n                onMouseEnter={() => openDd("Tools")}\n                onMouseLeave={scheduleCloseDd}\n              >\n                <button\n                  type="button"\n                  className={ddButtonClasses(toolsActive, dd === "Tools")}\n                  aria-haspopup="menu"\n                  aria-expanded={dd === "Tools"}\n                  onClick={() => setDd(dd === "Tools" ? null : "Tools")}\n                >\n                  Tools <span className="text-xs opacity-80">▾</span>\n                </button>\n\n                {dd === "Tools" && (\n                  <div\n                    role="menu"\n                    className={ddPanel}\n                    onMouseEnter={() => openDd("Tools")}\n                    onMouseLeave={scheduleCloseDd}\n                  >\n                    {TOOLS_BASE.map((i) => (\n                      <Link\n                        key={i.href}\n                        href={i.href}\n                        role="menuitem"\n                        className={ddItemClasses(isActive(i.href))}\n                        onClick={() => setDd(null)}\n                      >\n                        {i.label}\n                      </Link>\n                    ))}\n                  </div>\n                )}\n              </div>\n\n              {/* Insights dropdown */}\n              <div\n                className="relative"\n                onMouseEnter={() => openDd("Insights")}\n                onMouseLeave={scheduleCloseDd}\n              >\n                <button\n                  type="button"\n                  className={ddButtonClasses(insightsActive, dd === "Insights")}\n                  aria-haspopup="menu"\n                  aria-expanded={dd === "Insights"}\n                  onClick={() => setDd(dd === "Insights" ? null : "Insights")}\n                >\n                  Insights <span className="text-xs opacity-80">▾</span>\n                </button>\n\n                {dd === "Insights" && (\n                  <div\n                    role="menu"\n                    className={ddPanel}\n                    onMouseEnter={() => openDd("Insights")}\n                    onMouseLeave={scheduleCloseDd}\n                  >\n                    {INSIGHTS_BASE.map((i) => (\n                      <Link\n                        key={i.href}\n                        href={i.href}\n                        role="menuitem"\n                        className={ddItemClasses(isActive(i.href))}\n                        onClick={() => setDd(null)}\n                      >\n                        {i.label}\n                      </Link>\n                    ))}\n                  </div>\n                )}\n              </div>\n\n              {/* Specialists dropdown */}\n              <div\n                className="relative"\n                onMouseEnter={() => openDd("Specialists")}\n                onMouseLeave={scheduleCloseDd}\n              >\n                <button\n                  type="button"\n                  className={ddButtonClasses(specialistsActive, dd === "Specialists")}\n                  aria-haspopup="menu"\n                  aria-expanded={dd === "Specialists"}\n                  onClick={() => setDd(dd === "Specialists" ? null : "Specialists")}\n                >\n                  Specialists <span className="text-xs opacity-80">▾</span>\n                </button>\n\n                {dd === "Specialists" && (\n                  <div\n                    role="menu"\n                    className={ddPanel}\n                    onMouseEnter={() => openDd("Specialists")}\n                    onMouseLeave={scheduleCloseDd}\n                  >\n                    {SPECIALISTS_BASE.map((i) => (\n                      <Link\n                        key={i.href}\n                        href={i.href}\n                        role="menuitem"\n                        className={ddItemClasses(isActive(i.href))}\n                        onClick={() => setDd(null)}\n                      >\n                        {i.label}\n                      </Link>\n                    ))}\n                  </div>\n                )}\n              </div>\n\n              {/* German language link */}\n              <Link\n                href="/de"\n                className="rounded-full px-2.5 py-1.5 text-xs font-semibold text-slate-400 hover:text-white hover:bg-white/5 transition-colors"\n                title="Deutsche Version"\n              >\n                DE\n              </Link>\n\n              {/* Contact CTA */}\n              <Link\n                href={CONTACT_BASE.href}\n                className="ml-2 rounded-full bg-[#F5D778] px-4 py-2 text-sm font-semibold text-[#050814] hover:opacity-90 transition"\n              >\n                Contact\n              </Link>\n            </div>\n          </div>\n\n          {/* Mobile burger */}\n          <button\n            type="button"\n            aria-label={open ? "Close menu" : "Open menu"}\n            aria-expanded={open}\n            onClick={() => setOpen((v) => !v)}\n            className="md:hidden rounded-full border border-white/15 bg-white/5 px-3 py-1.5 text-sm text-white hover:bg-white/10"\n          >\n            {open ? "Close" : "Menu"}\n          </button>\n        </div>\n\n        {/* Mobile panel */}\n        <div\n          className={\n            (open ? "mt-3" : "hidden") +\n            " md:hidden rounded-2xl border border-white/10 bg-[#050814]/95 backdrop-blur p-3"\n          }\n        >\n          <ul className="grid gap-1">\n            {TOP_BASE.map((item) => {\n              const active = isActive(item.href.replace(base, "") || item.href);\n              const cls = [\n                "block rounded-md px-3 py-2 text-sm transition-colors",\n                active\n                  ? "bg-white/10 text-[#F5D778]"\n                  : "text-slate-200 hover:text-white hover:bg-white/5",\n              ].join(" ");\n\n              return (\n                <li key={item.href}>\n                  {item.external ? (\n                    <a\n                      href={item.href}\n                      target="_blank"\n                      rel="noopener noreferrer"\n                      className={cls}\n                      onClick={() => setOpen(false)}\n                    >\n                      {item.label}\n                    </a>\n                  ) : (\n                    <Link\n                      href={item.href}\n                      className={cls}\n                      onClick={() => setOpen(false)}\n                      aria-current={active ? "page" : undefined}\n                    >\n                      {item.label}\n                    </Link>\n                  )}\n                </li>\n              );\n            })}\n\n            {/* Mobile section: Tools */}\n            <li className="mt-2 px-3 pt-2 text-xs font-semibold tracking-wider text-slate-400 uppercase">\n              Tools\n            </li>\n            {TOOLS_BASE.map((item) => {\n              const active = isActive(item.href.replace(base, "") || item.href);\n              const cls = [\n                "block rounded-md px-3 py-2 text-sm transition-colors",\n                active\n                  ? "bg-white/10 text-[#F5D778]"\n                  : "text-slate-200 hover:text-white hover:bg-white/5",\n              ].join(" ");\n\n              return (\n                <li key={item.href}>\n                  <Link\n                    href={item.href}\n                    className={cls}\n                    onClick={() => setOpen(false)}\n                    aria-current={active ? "page" : undefined}\n                  >\n                    {item.label}\n                  </Link>\n                </li>\n              );\n            })}\n\n            {/* Mobile section: Insights */}\n            <li className="mt-2 px-3 pt-2 text-xs font-semibold tracking-wider text-slate-400 uppercase">\n              Insights\n            </li>\n            {INSIGHTS_BASE.map((item) => {\n              const active = isActive(item.href.replace(base, "") || item.href);\n              const cls = [\n                "block rounded-md px-3 py-2 text-sm transition-colors",\n                active\n                  ? "bg-white/10 text-[#F5D778]"\n                  : "text-slate-200 hover:text-white hover:bg-white/5",\n              ].join(" ");\n\n              return (\n                <li key={item.href}>\n                  <Link\n                    href={item.href}\n                    className={cls}\n                    onClick={() => setOpen(false)}\n                    aria-current={active ? "page" : undefined}\n                  >\n                    {item.label}\n                  </Link>\n                </li>\n              );\n            })}\n\n            {/* Mobile section: Specialists */}\n            <li className="mt-2 px-3 pt-2 text-xs font-semibold tracking-wider text-slate-400 uppercase">\n              Specialists\n            </li>\n            {SPECIALISTS_BASE.map((item) => {\n              const active = isActive(item.href.replace(base, "") || item.href);\n              const cls = [\n                "block rounded-md px-3 py-2 text-sm transition-colors",\n                active\n                  ? "bg-white/10 text-[#F5D778]"\n                  : "text-slate-200 hover:text-white hover:bg-white/5",\n              ].join(" ");\n              return (\n                <li key={item.href}>\n                  <Link\n                    href={item.href}\n                    className={cls}\n                    onClick={() => setOpen(false)}\n                    aria-current={active ? "page" : undefined}\n                  >\n                    {item.label}\n                  </Link>\n                </li>\n              );\n            })}\n\n            {/* Mobile German language link */}\n            <li className="mt-2">\n              <Link\n                href="/de"\n                className="block rounded-md px-3 py-2 text-sm text-center text-slate-400 hover:text-white hover:bg-white/5 transition-colors"\n                onClick={() => setOpen(false)}\n              >\n                Deutsche Version (DE)\n              </Link>\n            </li>\n\n            {/* Mobile Contact CTA */}\n            <li className="mt-2">\n              <Link\n                href={CONTACT_BASE.href}\n                className="block rounded-xl bg-[#F5D778] px-4 py-3 text-sm font-semibold text-[#050814] text-center hover:opacity-90 transition"\n                onClick={() => setOpen(false)}\n              >\n                Contact\n              </Link>\n            </li>\n          </ul>\n        </div>\n      </nav>\n\n      {/* Subtle divider when not scrolled */}\n      {!scrolled && (\n        <div className="h-px w-full bg-gradient-to-r from-transparent via-white/20 to-transparent" />\n      )}\n    </header>\n  );\n}')
 write("components/Footer.tsx", '// components/Footer.tsx\nimport Link from "next/link";\nimport Image from "next/image";\nimport { ArrowRight, MapPin } from "lucide-react";\n\nconst NAV = [\n  {\n    label: "Candidates",\n    links: [\n      { href: "/en/jobs", text: "Browse Jobs" },\n      { href: "/en/candidates", text: "Career Guidance" },\n      { href: "/en/portability", text: "Portability Score" },\n      { href: "/en/bp-simulator", text: "BP Simulator" },\n    ],\n  },\n  {\n    label: "Employers",\n    links: [\n      { href: "/en/hiring-managers/brief", text: "Brief a Role" },\n      { href: "/en/hiring-managers", text: "Our Process" },\n      { href: "/en/contact", text: "Get a Quote" },\n    ],\n  },\n  {\n    label: "Company",\n    links: [\n      { href: "/en/about", text: "About" },\n      { href: "/en/markets", text: "Markets" },\n      { href: "/en/insights", text: "Insights" },\n      { href: "/en/faq", text: "FAQ" },\n      { href: "/en/contact", text: "Contact" },\n    ],\n  },\n  {\n    label: "Specialists",\n    links: [\n      { href: "/en/latam-private-banking-recruiter-geneva", text: "LATAM" },\n      { href: "/en/mea-private-banking-recruiter-geneva", text: "MEA" },\n      { href: "/en/nri-private-banking-recruiter-switzerland", text: "NRI" },\n      { href: "/en/israeli-market-private-banking-switzerland", text: "Israeli Market" },\n      { href: "/en/private-banking-recruitment-company", text: "Our Firm" },\n      { href: "/en/apac-private-banking-recruiter-switzerland", text: "APAC" },\n    ],\n  },\n];\n\nconst HUBS = [\n  { city: "Geneva", flag: "🇨🇭", slug: "geneva" },\n  { city: "Zurich", flag: "🇨🇭", slug: "zurich" },\n  { city: "London", flag: "🇬🇧", slug: "london" },\n  { city: "Dubai", flag: "🇦🇪", slug: "dubai" },\n  { city: "Riyadh", flag: "🇸🇦", slug: "riyadh" },\n  { city: "Singapore", flag: "🇸🇬", slug: "singapore" },\n  { city: "Hong Kong", flag: "🇭🇰", slug: "hong-kong" },\n  { city: "New York", flag: "🇺🇸", slug: "new-york" },\n  { city: "Miami", flag: "🇺🇸", slug: "miami" },\n  { city: "Paris", flag: "🇫🇷", slug: "paris" },\n  { city: "Milan", flag: "🇮🇹", slug: "milan" },\n  { city: "Madrid", flag: "🇪🇸", slug: "madrid" },\n  { city: "Lisbon", flag: "🇵🇹", slug: "lisbon" },\n  { city: "Tel Aviv", flag: "🇮🇱", slug: "tel-aviv" },\n];\n\nexport default function Footer() {\n  return (\n    <footer className="relative bg-[#05070E] text-white overflow-hidden">\n      {/* Ambient glow */}\n      <div aria-hidden className="pointer-events-none absolute inset-0" style={{background:"radial-gradient(ellipse 70% 35% at 50% 0%, rgba(201,161,74,.10) 0%, transparent 60%)"}} />\n      {/* Gold shimmer line */}\n      <div className="h-px w-full" style={{background:"linear-gradient(90deg, transparent 0%, rgba(201,161,74,.5) 25%, rgba(240,208,96,.85) 50%, rgba(201,161,74,.5) 75%, transparent 100%)"}} />\n\n      <div className="relative mx-auto max-w-7xl px-5 sm:px-6 lg:px-8">\n\n        {/* ── MOBILE ── */}\n        <div className="md:hidden">\n\n          {/* Logo + tagline */}\n          <div className="pt-8 pb-6 flex flex-col items-center text-center border-b border-white/[0.06]">\n            <Image\n              src="/transparent-ep-logo.png"\n              alt="Executive Partners"\n              width={290}\n              height={60}\n              sizes="180px"\n              className="h-auto w-[180px] opacity-90 mb-4"\n            />\n            <div className="flex items-center gap-1.5">\n              <MapPin className="h-3 w-3 flex-shrink-0" style={{color:"#C9A14A"}} />\n              <span className="text-xs tracking-wide" style={{color:"rgba(201,161,74,.7)"}}>Geneva · Zurich · London · Dubai · Singapore</span>\n            </div>\n          </div>\n\n          {/* CTA block — dark with gold border */}\n          <div className="py-5 border-b border-white/[0.06]">\n            <Link href="https://calendly.com/execpartners/15-minute-career-consultation"\n              target="_blank" rel="noopener noreferrer"\n              className="flex flex-col items-center text-center w-full rounded-2xl px-6 py-6 gap-4 transition-all active:scale-[0.99]"\n              style={{background:"rgba(201,161,74,.06)",border:"1px solid rgba(201,161,74,.3)"}}>\n              <div>\n                <div className="text-[10px] font-semibold uppercase tracking-[0.15em] mb-2 text-center" style={{color:"rgba(201,161,74,.8)"}}>Confidential · Senior-level · No obligation</div>\n                <div className="text-lg font-semibold text-white leading-snug">Ready to calibrate<br/>your next move?</div>\n              </div>\n              <div className="inline-flex items-center gap-2 rounded-full px-5 py-2.5 text-sm font-semibold w-full justify-center" style={{background:"linear-gradient(135deg, #C9A14A 0%, #E8C46A 100%)",color:"#090C14",fontWeight:"600"}}>\n                Schedule a confidential call <ArrowRight className="h-4 w-4" />\n              </div>\n            </Link>\n          </div>\n\n          {/* Hub pills */}\n          <div className="py-5 border-b border-white/[0.06]">\n            <div className="text-[10px] font-semibold uppercase tracking-[0.12em] mb-3 text-center" style={{color:"rgba(201,161,74,.6)"}}>Our Hubs</div>\n            <div className="flex flex-wrap gap-1.5 justify-center">\n              {HUBS.map((h) => (\n                <Link key={h.city} href={`/en/markets/${h.slug}`}\n                  className="inline-flex items-center gap-1.5 rounded-full px-3 py-1 text-xs font-medium text-white/70 hover:text-white transition-colors"\n                  style={{background:"rgba(255,255,255,.06)",border:"1px solid rgba(255,255,255,.1)"}}>\n                  <span>{h.flag}</span>{h.city}\n                </Link>\n              ))}\n            </div>\n          </div>\n\n          {/* Nav 2-col */}\n          <div className="py-6 grid grid-cols-3 gap-x-4 gap-y-6 border-b border-white/[0.06]">\n            {NAV.map((col) => (\n              <div key={col.label}>\n                <div className="mb-3.5 text-[10px] font-semibold uppercase tracking-[0.14em] text-center" style={{color:"rgba(201,161,74,.8)"}}>{col.label}</div>\n                <ul className="space-y-3">\n                  {col.links.map((link) => (\n                    <li key={link.href}>\n                      <Link href={link.href} className="text-[13px] font-medium text-white/65 hover:text-white/90 transition-colors block text-center" style={{textDecoration:"none",color:"inherit"}}>{link.text}</Link>\n                    </li>\n                  ))}\n                </ul>\n              </div>\n            ))}\n          </div>\n\n          {/* Bottom bar */}\n          <div className="py-5 flex flex-col gap-2 items-center text-center">\n            <div className="text-[12px] text-white/40">© {new Date().getFullYear()} Executive Partners. All rights reserved.</div>\n            <div className="flex items-center gap-3 text-[11px]">\n              <Link href="/en/privacy" className="text-white/40 hover:text-white/70 transition-colors">GDPR Compliant</Link>\n              <span className="w-px h-3 bg-white/15" />\n              <span className="text-white/30">Confidentiality Guaranteed</span>\n            </div>\n          </div>\n        </div>\n\n        {/* ── DESKTOP ── */}\n        <div className="hidden md:block py-16">\n          <div className="flex items-start justify-between mb-12 pb-12 border-b border-white/[0.06]">\n            <div className="max-w-sm">\n              <Image src="/transparent-ep-logo.png" alt="Executive Partners" width={290} height={60} sizes="220px" className="h-auto w-[220px] opacity-90 mb-4" />\n              <p className="text-sm text-white/80 leading-relaxed">Geneva-based executive search for Private Banking & Wealth Management. 200+ placements across 14 global hubs.</p>\n            </div>\n            <Link href="https://calendly.com/execpartners/15-minute-career-consultation"\n              target="_blank" rel="noopener noreferrer"\n              className="inline-flex items-center gap-2 rounded-full px-5 py-2.5 text-sm font-semibold transition-all hover:brightness-110"\n              style={{background:"linear-gradient(135deg, #C9A14A 0%, #E8C46A 100%)",color:"#0B0E13"}}>\n              Schedule a call <ArrowRight className="h-4 w-4" />\n            </Link>\n          </div>\n          <div className="grid grid-cols-12 gap-10">\n            {NAV.map((col) => (\n              <div key={col.label} className="col-span-2">\n                <h4 className="text-[10px] font-semibold uppercase tracking-[0.14em] mb-4" style={{color:"#C9A14A"}}>{col.label}</h4>\n                <ul className="space-y-3">\n                  {col.links.map((link) => (\n                    <li key={link.href}>\n                      <Link href={link.href} className="text-sm text-white/75 hover:text-white visited:text-white/75 transition-colors">{link.text}</Link>\n                    </li>\n                  ))}\n                </ul>\n              </div>\n            ))}\n            <div className="col-span-4">\n              <h4 className="text-[10px] font-semibold uppercase tracking-[0.14em] mb-4" style={{color:"#C9A14A"}}>Our Hubs</h4>\n              <ul className="grid grid-cols-3 gap-x-6 gap-y-3">\n                {HUBS.map((h) => (\n                  <li key={h.city} className="text-sm text-white/70">\n                    <Link href={`/en/markets/${h.slug}`} className="hover:text-white transition-colors flex items-center gap-2">\n                      <span>{h.flag}</span>{h.city}\n                    </Link>\n                  </li>\n                ))}\n              </ul>\n            </div>\n          </div>\n          <div className="mt-12 pt-8 border-t border-white/[0.06] flex items-center justify-between text-xs text-white/50">\n            <div>© {new Date().getFullYear()} Executive Partners. All rights reserved.</div>\n            <div className="flex items-center gap-4">\n              <Link href="/en/privacy" className="hover:text-white visited:text-white/50 transition-colors">GDPR Compliant</Link>\n              <span className="w-px h-3 bg-white/15" />\n              <span>Confidentiality Guaranteed</span>\n            </div>\n          </div>\n        </div>\n\n      </div>\n    </footer>\n  );\n}\n')
-write_bin("public/og-articles/og-apac-private-banking-recruiter-switzerland.jpg", '/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDAAICAgICAQICAgIDAgIDAwYEAwMDAwcFBQQGCAcJCAgHCAgJCg0LCQoMCggICw8LDA0ODg8OCQsQERAOEQ0ODg7/2wBDAQIDAwMDAwcEBAcOCQgJDg4ODg4ODg4ODg4ODg4ODg4ODg4ODg4ODg4ODg4ODg4ODg4ODg4ODg4ODg4ODg4ODg7/wAARCAJ2BLADASIAAhEBAxEB/8QAHgAAAgICAwEBAAAAAAAAAAAAAAIGBwEDBQgJBAr/xAB0EAABAwMCAwMHBgcICg0IABcBAAIDBAUGBxESITEIEzIUIjc4QYS0CRUWdbPUFyM5UVeUliQlM0JVYXG1GCY1UnaVl9LT1Sc0NkNYYnJ3gYKRpeMZRVRmoaaxxERHhZLwRlNWY2SissHDCmdoc3STp9Hl/8QAHAEAAgIDAQEAAAAAAAAAAAAAAAIBBAMFBwgG/8QASxEAAgECAgUHCQUGBAYCAwEBAAECAxEEMRIhQVGxBTI0YXFykgYTFCI1UoGR0jNCobLRI2JzgqLBU8Li8BYkQ2Th8RVjF0SzB9P/2gAMAwEAAhEDEQA/APn7X35O3UP3D+sKdeIa9vO19+Tt1D9w/rCnXiGvg/ID2PU/iP8ALA+h8oumx7q4sZvRMlb0TLqh8kCEIQI8wHULYtY6hbFJAJx0CROOgUAZTN6JUzeiCHkMhCECAmb0Spm9EAMhCEAOPCFlYHhCygxsZvtTJW+1MgAWxa1sQQCEIQQwTN6JUzeiBRllvVYWW9UEPIdCEIIQLYta2JUDBCEJhRm9EyVvRMgDI8QTpB4gnUbQBCEKGKwHULYtY6hbFKFBM32pUzfah5EPIZZHiCwsjxBGwGOhCFCEBCEJQGb0TJW9EybYJtMt6p0jeqdKDzAdQti1jqFsTMgEIQlFYJx4QkTjwhAplZHiCwsjxBADoQhSgNiEIUGMFsWtbEACEIQBkeIJ0g8QToEYLYta2IIBM3olTN6IAZCEIIeQIHUIQOoQIbEIQgBx0CysDoFlADN6JkreiZAAhCECMFsWtXTaMYtGnk1HkOqFtkqa2SPvrPirXMMtT5vE2aqBP4qEO2bwOBe5wduwhjmuhuxTr4iFCOvXJ5JZvs/u8lmzgcawLyvCnZrlNb8wYRBUCMzAb1dxcA7eKkYRs9xLeHicQ1vnHmGPAfM89+ew+x4vRfRXBodmU9ppjweU7cO01Tsfxsp7th3cXcPCNiTu50ZyXK73ld2bUXWp/c8O7aKggBZSUMezWiOCLfhjaGsYNhzPCCSTzUeHhCVLayvTw86lRVsRrkskso/q/wB75Jbcpm+1Kmb7U5snkMhCEMQEzfalTN9qhAMhCEgDN6JkreilWL4ffMur6qO0U8YpaOMS3Cuqpmw01HFvzkkkdyAADnbDdxDXEA7FO3YwVakKUXObsltZF1a9Np9SY5b4LtqbXSWKjkjD4LJQyRvu9SHjzHiN3mxM8fE6TYgxlvCCQuVfkuKaZTSUuBiPJ8whkmhnymsg/ERNc3hHkkQeW7jmO8dvvs7bjY8AVDW3Cvul0lr7nW1Fxrpdu8qKqZ0sj9gGjdziSdgAP6AEmts1iniMXzLwhvfOfYvurrevqWZOco1Cqr1Yjj1itlPiOHDu3fNFFse+exoHeTS8IdK47Dm7l5jCQXN4jXiEKbJZF6jRpUI6FNWX+9bebfW9ZlvVOkb1ToMzBM3olTN6IQoyEITshgOoWxax1C2JUQgQhCUUceELKsrGdLMivtpZeLk6DFMYHA6S7XeQQRljizYsa7Yv3DwWnkxx5cQKkMeU6d4H3X0Ms30zyKPhd8+3uItp4nju3bwwciPOa/Ynhe09HPCW+41c8bBydOgvOSW7Jdssl2Z9RC8cwDIshtb7oyKCz2Bm3eXm7Timo27lzRs93i3e3g8wO2cQDtupF866eYh5titv4QL0P/OV6pzFb2f8il34n7tcWnvDycwObyUIyDKsiyu6CsyG7T3OVn8G2QhscW4APAxoDWb8Ld+EDcjc7lcCps3mQ6Fas715avdjdL4vU3/SntTJjlWeZRmdwMl9ukk1MJOOKii8ynh5u24WDkSA8gOdu7bkSVEkg8QTqbJZFynSp0YKFNJJbECEIQZQTN6JUzeiAGWW9VhZb1QI8x0DqEIHUIJ2GxCEIFBCEIAZvRMlb0TIE2mR4gnTU8E1VXw01NC+oqJXhkUUTC573E7BoA5kk8gArDotK8xntsdwuNFBjdpdv3ldeaplLHDzLRxtceNu7tmjzeZcPYd1DaWZgrV6ND7SSV97z7N5XS2Ky/ovgNm87Ic7+daqH/bFvx2jM3eb+Hu6l+0Z2Ba5249jm9U/0owGzcsewT51qof9r3DIawzd5v4u8pmbRnYFzW7H2Nd1UX3FT0vT+yhKXwsvnK2rsv1XK2ggmqa2GmpoX1FRK8MiiiYXPe4nYNAHMknkAFOrfpZqBc6J1RTYxVRMa8sIq3Mpn77A8myua4jn1A26/mK+qfVjM/IpqK2VdLjtrewsZQ2qhihihDh53dnYvaSSXbh24JJG3JQW4XS53etbU3W41VzqGsDGy1dQ6V4aCSGguJO25J2/nKPWIbx09kYfOX08WT/6AWSg/HX7UjHqejPmsdaZH3GUv6gGNgaQ3YO87fYHYe1ZEWktr3ZJV5BlVZB54kgijpKOrPiDCHbysb0Y49eRI9irBM32os94no1WXPqyfZZcFf8AEs/6dY3b/wDc/prZabvP9sfO8kly4tvDwcZbwdXb7b78vzKsx4gsLI8QU2SLNKhTo30b697bfzbbHQhClFg78dr78nbqH7h/WFOvENe3na+/J26h+4f1hTrxDXM/ID2PU/iP8sD0D5RdNj3VxYzeiZK3omXVD5IEIQgR5gOoWxax1C2KSATjoEicdAoAymb0Spm9EEPIZCEIEBM3olTN6IAZCEIAceELKwPCFlBjYzfamSt9qZAAti1rYggEIQghgmb0Spm9ECjLLeqwst6oIeQ6EIQQgWxa1sSoGCEITCjN6JkreiZAGR4gnSDxBOo2gCEIUMVgOoWxax1C2KUKCZvtSpm+1DyIeQyyPEFhZHiCNgMdCEKEICEISgM3omSt6Jk2wTaZb1TpG9U6UHmA6hbFrHULYmZAIQhKKwTjwhInHhCBTKyPEFhZHiCAHQhClAbEIQoMYLYta2IAEIQgDI8QTpB4gnQIwWxa1sQQCZvRKmb0QAyEIQQ8gQOoQgdQgQ2IQhADjoFlYHQLKAGb0TJW9EyABbqenqKy4QUlJBJVVU8jY4YYWF75HuOzWtaOZJJAAC5jHMYv2XZMyz45bZLncHRukMbHNaGsb1c5ziGtHQbkjmQOpANkOy22acYzdMbweWO4ZPVxiG65fDJyaOfeQUQ23EYIaO+3BeQXADaNzVb2I12IxDhLzdJaU917WW+T2L8XsWdt39rOllg/+h8i1aZUfzyUmOua3/8AtzztLv8AjNZI32GP8ZUdfcbhdbtLX3SuqLlXS7d7U1UzpZH7ANG7nEk7AAf0ALj1sQlYKGHVJucnpTebfBbkti+Lu7ticeEJE48ITIumUzfalTN9qCHkMhCEMQEzfalTN9qhAMhcvZLBeskv0dssVsqLpXP2PdU8ZdwAuDeJx6MaC4AucQ0b8yFaEs2GaaUz22irp841Bb3UtNdYmh9stTiw7mLziKiVpO4c5vCDwHZrmOacbZRrYmNOXm4LSm9i4t7F1v4JvUfBQ6eQWLGqbJNTJqvHrRPI+KltNNGBdqxzdhu2OQcMbBuSXP8AY0ADz2E8Jked196tTbLa6KnxbFo+TLRbC5kc3NvC+odvvPLsyMF7/awEAEneLXW73K/ZHWXi8VklfcqqTjnnlPNx6DkOQAAAAGwAAAAAAXHp0trMNPDSlJVMQ9KSy3LsW/revsyBM3olTN6KdpsBkIQoZBlvVOkb1TqCGCZvRKmb0QhRkIQnZDAdQtikeK4fkGZZJFbrFQSVLjI1s9SWkQUwO54pXgENGzXH8522AJ2Cmn+x1hf/AO8fJY/6YbRTSD/8up4Xs/mjkY/2FY76yjPFQhPzcU5T3L++xfFrqI9jun+RZFa3XRkUFmx9n8JebtOKajbuS0bPd4t3t4PMDtnEA7bqTU99wHBK6GoxejkznJIJBJDeLrE6nooHA7h0VMCHuOziCZHDhexrmqE5Tl9/zLIpLjfa+SpcZHOgpw4iCmB2HDEwkho2a0fnO25JPNRlLZvMr+j1sQv+Ylqf3Y5fF5v8E9qZI8gyvIssubazIbtPc5m7922QhscW4APAxoDWb8Ld+EDcjc7lcAsDwhZTGwhCFOKhBWS2LUhm+1Mlb7UylA8zI8QTpB4gnQ8yAQhCgATN6JUzeiAGWW9VhZb1QI8x0DqEIHUIJ2GxC56wYvkGU3N1JYLVPcpW/wAI6MARx7gkcb3bNZvwu24iNyNhuVM/oJj9j8/NM2oaOdnN1qs4NbV8TP4WB7hsyGQHZoLi5vFv7GneG0ijUxVClLQbvLctb+Suyrlz1nxbJMg7s2Wx11yidOIO+gpnGJrztydJtwt24gSXEAA7nYKZ/S7CLF+LxbBYLpK3zTcMof5U6Zh84g07SI2ODtgHNO/C3nzcVw151Jzm/wBEKa55JVPpuB8b4qfhp2SNeAHNeIw0PBA22dv1P5you2YfO4up9nBRW+T1/JX/ABaZzY04prQP7d8xteLS+F9DETX1sTzzaJIovC0t87i4iObR1dy3QXbSzHK2E0eO3HOKmN47youlUKSn4mHk+KJgcXMedyWSg7ANB33cqob0TItvFeFnUf7ao31L1V+Hrf1MsybVfK20ctHZBbsSt8zCJaWyW6OBjnEbGTcgua8jYcTXDbhG2xG6gNbXVtyuUlbcayevrJNu8nqJXSSP2AA3c4knYAD+gL4h4gnUpJFinh6FB3pxSfZr+LzYLYta2KSwCEIQKwTN9qVM32oFGWR4gsLI8QQwHQhCEB347X35O3UP3D+sKdeIa9vO19+Tt1D9w/rCnXiGuZ+QHsep/Ef5YHoHyi6bHurixm9EyVvRMuqHyQIQhAjzAdQti1jqFsUkAnHQJE46BQBlM3olTN6IIeQyEIQICZvRKmb0QAyEIQA48IWVgeELKDGxm+1Mlb7UyABbFrWxBAIQhBDBM3olTN6IFGWW9VhZb1QQ8h0IQghAti1rYlQMEIQmFGb0TJW9EyAMjxBOkHiCdRtAEIQoYrAdQti1jqFsUoUEzfalTN9qHkQ8hlkeILCyPEEbAY6EIUIQEIQlAZvRMlb0TJtgm0y3qnSN6p0oPMB1C2LWOoWxMyAQhCUVgnHhCROPCECmVkeILCyPEEAOhCFKA2IQhQYwWxa1sQAIQhAGR4gnSDxBOgRgti1rYggEzeiVM3ogBkIQgh5AgdQhA6hAhsQhCAHHQLKwOgWUAM3oplh2D3vNrtWQWvyeko6KndUXC5V8pipKOMAnikk2O2/CdhsTyJ6NcRsxPBrnktuq7zNLHZcSoJALrfKv+Bphtvs1u/FLIeQEbNyXPYDw8QK+7JM5fVYy/D8WiksWBxyNcyidwmornt/+iKqQDd8jjsSwHgbwsAHmApW3kjW1q1SpJ0cM1pLN7I/rK2S+LsrX+y8ZnT2TGa3DNP6iSmx6ePurtdXwiOqvb/a92/nRQjm1kQI81zuPcvcBWKEKUrGelQp0FaOb1t7W97/3qyVlqBbFrWxSZwTjwhInHhCEBlM32pUzfagh5DIQhDEBTzEcEr8ntVzvVRW09gxW2cJuN4rQ7u2bkbsjaBvLLs7cMG25LQSC9u8hosJsuIWk3fVLyimrJKds9oximlDaqvG7TxTuAPk8R3LSHcMh2k22LNnRLLs2vWa3aknufk9JR0VO2Cgt1DEYqWjjAA4Y2bnbfYbncnkB0a0DGm3kap16mJejhtUds81/L7z2XyT3tNEkv2d0FHYarGNOKKoxzGKqnbHcpqktdX3R3CATM8E8DeRAjjIaeN+42eWir0IUJWLlGhToRtDbm3rbe9va/wD1kM3omSt6JllMzzBM3olTN6KNpAyEIUMgy3qnSN6p1BDBM3olVoWDTv8Aem25Dm91gxDFKnhljfO/esrYt9iaeBoc53Vm7i3YNeHgOCi6RVrV6VCOlN55LNt7ks2+pFfUNBXXS6RUNtop7jWy793T00LpJH7Ak7NaCTsAT/QCrSnw7FcFmb+EG5yXS/NjZKMZs7ubOJoe0VNQfNYDsWuazdwDmvaSCvkrdRmWrHKnH9O7bJiNrmkY6puPlLnXKtMe4a58oIEYI4SY2DYO4tjs5wNWqdb6ilo4nE869OG5c59r+72K761kT3KdQ75ksUltg7uwYs2RxpbFbWNhpomlwds4MA7w8TQ7dw8RcWhu+ygy1jqFsRFJF2jRpUIaFNWX+/m+vMEIQoMg48IWVgeELKAGb7UyVvtTKUI8zI8QTpB4gnQ8yAQhCgATN6JVMcTwXKMyrBHY7Y+amEnBLWy+ZTxc278TzyJAcCWt3dtzAKi9jFUq06MHOo0ktrIkvsoKGtuV0jordRz19ZJv3cFNE6SR+wJOzWgk7AE/0BWP8y6dYvyyG+z5ld2+eKLHngUTS3zgySpeN3teC0ExDdmzxzIC+as1Nu7bbLbsWt9DhFtfs1ws8Xd1MzGkGMS1BPG9zQD5wLS7idvvvsou3ka94mpVf7CF1vepfq/lZ77az7IdLa232Slu2bXuhwm2z7lkdXxTVsjeFuzmU7Obub2hzSQ5vMkDbmC/6fY0e5x/GPpdcoul3v7iKd7/AAv4aRvIxkAubxnjaX8/CFWU889VWzVNTM+oqZnmSWWV5c+RxO5c4nmSTzJK1DqEW3k+jVKi/b1G+peqvw1v4uz3E8vOo2YXuiFFNd30Fqax8UdutzRTU7InADuuFm3EwNAaA8u2H9J3g6EKUki1To0qMdGnFJdSsCEIUmYZvRMlb0TIE2mR4gnSDxBOgGC2LWtiCAQhCBWCZvtSpm+1AoyyPEFhZHiCGA6EIQgO/Ha+/J26h+4f1hTrxDXt52vvyduofuH9YU68Q1zPyA9j1P4j/LA9A+UXTY91cWM3omSt6Jl1Q+SBCEIEeZ277F0nddpzKJe+kpuDCq53fQjd8ez4fObzHMdRzHP2hRGyZzm9f2ntP6zT7Psw1GymCr7qgZlMBiLTIQHxAeV1H4p7Ae8PEzYDf2bijLDkmRYte3XLGb9cccuLojE6qtddJTSlhIJYXxkHhJAO2+3IfmUjn1Q1Lqr/AEN2qdRMmqLpRMkZR1kt+qXTU7ZABI2N5fxNDg1vEARvsN+i+YrcmVJ42riEoyU4qNn1KS16m2nfXZrVvNrDFRjQhT1pxd9XauvPVtTO7HaTo7di3ZwvFJpBSW+DE7nlUzNQai1VBkfBXt4SykdyHBAHFxAHm8XCNm8WzuN7WmVPoNSpLEzUjMbQ6oxemBxy30+9pqg4OB71/ljNuIbh34h3QdfZ0ZpMjyG32K62ugv1xorZdNvnOkgrZI4a3hJI71gO0mxJ24gepUoqtVdUK+w1Frr9SMprbZUQOgnpJ8gqZIZY3DhcxzC/ZzSCQQRsQtXh+Qa2GnRbmp+bctbzlpaOt3Uta0bLqtrVi1V5QhVjNWcdK2pZK18rNane/bc7M6rXfItP9C9D4dIKursOJ3THI6mruFj3jfcridu+bUSM5vcDt+Lcdhu4bebsPmzFl2vfyYmlXHTzVl5bntfDcYmQbSR1Mks7u7cwAcDiXDzdh16Lq1Y84zXGbdLR43mF7x+kldxSwW26zUzHn85axwBKezZxmuPSVslgzC92OSskMlW633WaA1Dj1c8scOIn853VuPJFWnGGi4uUJuek85X0tUn1KWeu9skYZY2EnK97Sja2xZZfLqO6esmXZBZflc6KhxzJrjaKWtudkprrBbrhJCypAMf4uZrHAPHDI7k7fk8/nK5xuT5LcPluqPHa/IbnW4/Q3yV9FbJ6+SSlpnfNr+ccRdwsPnO5gDqfzrz3+c7kMjbeBcKkXdtQKhtd37u/EodxCTj34uIHnxb7781yLcrylue/StuS3VuUcZf88C4Sis4i3gLu+4uPfh83ffpyVf8A4fSoKmmm1RdK9trSSl8Ldo3/AMk3UcmnZ1FO19mvUd0cetdRrRpfrNoxC+N2UWLMZr9jJmdttG+qdFUs39jQHl23tdKPzK28SySgd8oRdsEsFVJT4xgGnFTZKKSDm4SxmAzygbj8ZxANPMbmLr7V5o2zKcmsmVzX2zZHdLRfJuPvrjRV8sNTJxnd/FI1wceI8zueZ6rbacrymx5RVX2y5LdbPe6njFRcKK4Sw1Eoe4OfxSNcHO4nAE7nmRuVhxHk9UreciprRaeirZTkoqUvjo6u9IenynGGi9HWmrvfFNtL8fwRI8/yZ+SXC2uOoOWZ9HTxvAlyqDun0xcRu2IeV1HI7Ak7t6DkV3FxK/yY18nboZdXahfg/t0GX1MlxftVv8vgbUTOfB3dPG8SbgHzZeFh9pXRzIMxy7LXUhyrKbvkxpeLyY3a5S1Xc8W3Fwd448O/C3fbrsPzL4p79fanEaLH6m9V9RYaOV0tJbZKx7qaB7ty57IieFpO53IG53P51uMVyW8ZhqNGTUVCWk7Weq0lq9VL71+b+pSo4xUKs5rXpKyz3p729m89RMNv+HYoLrqjYbfZbFaNR8uiihpL1c6O2d3ZoG91UVLGTyMDuKUySGNm5IkZyVe4FhlZpfdu1pjVDfTirKK1001pvJlmYKank7+SGXjha6TzWOAJY0ncHkvP+vv18u9rtlHdrzXXOjt0PcW+Crq3yx0kfLzImuJDG8hybsOQXL1GeZzVw10dVmd9qY62jZR1jJbvO4VFOzi4IXgu86NvE7Zh3A4jsOZWhXk5XjGcVVTU9G97vVCUXDW73ainHWtbdy8+VabcW4c29v5k1Lsu3fM7O9oi/ZHi+YaYX7GrvX2+51eD00FXmllrXUwyJwDXSSCSNwe4cXCSJNnblu7dg0mf66ZTk4+UM0wxsZHdBjs77FPPa/nCXyWWTyoO43RcXAXbgHcjfcD8y6I1GQX6uxW32KtvdfWWSgc51Db56yR9PSlxJcY4yeFhJJJ2A33X0V+UZNdMopL5c8iudxvVL3fk1wqq+SWoh7s7x8EjnFzeE8xseR6LZU+Q9FUtJxbpxqRvbPSa0X1WtlktlkVZco3c7XWk4vPdmvj/AOz1ipqGyZX2xc4zS1Niosixq311gySlDtnVEbog+jqgP+S18TvbuwdAF1rpsh+jvyWWlVR9OsnwTvb/AF7PKsXp+9mn/GzngePKqfZvt8TuYHL2rp5TZxmlHktzvNHl97pLxcWFlwrobrMyeradtxLIHcTxyHJxPRffZ9R9Q8esENqsGeZFY7XEXGKjt97qIIWFxLnEMY8NG5JJ2HMlaql5N16KjHzikouDSe6MZprWpLOeq6dkrFufKtOo29FptSv8XF31NbI69ees7caU3G5H5PTUWvoNQ5MNrp9QInHJa+aojkPGIOJ0phEjuJ+/nAktJJ4nbblcvll+xvC/lO8wvV8wW50ljnxvhir7PRRSzUxkbGwXaIN3YBvu0P6gu3I4t2ro3NlOT1NludtqMjulRbrjWGtuFLJcJXRVdQTuZpWF2z5CQDxuBPLqvviz7OoLjQVcGa36GroaQUdFMy7ztfTQDb8TG4O3YzzW+aNhyHLkrz5Bm8RVquStU0k1lqkobUtmjtTWvUs063/yUVThBLm2155aWx9uzX/a8+0Bj1TBp/p3l9LqfctScVvLav5olvtO6Ovp+BzGyBzn+fI3cAbnYAjkNnbnrC3ouXveR5DktzbW5HfbjkFa1vA2ouVbJUSBv5g55J2/mXEN6L6fk/D1MJhY0aktJq+uyWpttZJK6Wpuyu9dtZpsTVhWrOcVZO21vZ13+V3bIZZb1WFlvVbIpvIdCEIIQLYta2JUDBCEJhRm9EyVvRMgDI8QTpB4gnUbQBCEKGKwHULYtY6hbFKFBM32pUzfah5EPIZZHiCwsjxBGwGOhCFCEBCEJQGb0TJW9EybYJtMt6p0jeqdKDzAdQti1jqFsTMgEIQlFYJx4QkTjwhAplZHiCwsjxBADoQhSgNiEIUGMFsWtbEACEIQBkeIJ0g8QToEYLYta2IIBM3olTN6IAZCEIIeQIHUIQOoQIbEIQgBx0CnGK4rT3O31eRZFVyWfC7fIGVlZG0GaplI3bS0zTyfM4c/71jfPdy2B5fFNP6etwGqzfMblJjmF08gjhkjhD6q6S8XOCmaSATsHDvDu1pHQhryyN5VlVRktwpIoqSOz2C3xmG0WincTDRRE7nmeb5HHznyO857uZ5bALe+pGslWeIm6VB5apS3dS2OX4R267J83muoFRldutdlttsjxjD7XGG2+yU0xkYx+3nSyPIBkkJLvOI5cR9rnudXyVvRMpSSLlGjSw9NU6asl/u7ebb2t62CEIUmRgti1rYggE48ISJx4QhAZTN9qVSvFcOvuX19XHaKeMUtHGJbhXVUzYaaii35ySyO5AABzthu4hriAdiobsYqtSnSg5zdktrOJtFouV+yWjs9no5K+5VUnBBBEObj1PM8gAASSdgACSQASrYn+jWlXldHH5PlOp9NUDu66PeS3WZw4h5gdt307eTvOZwseW/xo3B3x3XNrLjWKQY3pl5RRzDiF1yl8Qgr688YPDE4HjhgPAxwbuHHYAgEPL6iS62alQq4zXUTjT93Jy725P3c397cfZX3Cvut2lr7nXVFyrpdu9qKqZ0sj9gGjdziSdgAP6AF8rfalTN9qlZG2SUVZZDIQhKSM3omSt6JlkEeYJm9EqZvRRtIGQhChkGW9VKsVw/IMzyOO22GgkqXGRrZ6ktIgpg7ch0rwCGjZrj+c7EAE7BSW34LQ2S1xXnUitnsNE/cQ2SmDReKnclrXiKQbRxbteeN+2/dkAec0ri8izmvvNqbZrZRQYti8fJlothcyObm3hfUO33nk2ZGC93tYCACTul75GrniJ1vVw2v9581dnvPs1b2SeS4YVp/DTjHjHmWbxxkvvT3HyC2VDXEb08RaBOQCSHv3bu2N7epaK5vN+vOR3yS5325T3StfuO8nkLuAFxdwtHRrQXHZrQAN+QC4ZM3ohKzMtHDQpPTb0p+88+xbl1Ky+IyEIWVltgOoWxax1C2JUQgQhCUUceELKwPCFlADN9qZK32plKEeZkeIJ0g8QVmUWm1dT2yK6Zrc4MEtEm/duuEbnVk+xLT3VK38Y7hdwcW/Ds14cNwobSZXrV6VBJzdr5bW+xLW/gVsrEtuml+koX3LJDHhNiikLZa28gwvcQA4sihP4yV/DxFrQAHcJHFuuQ+ndkxf8XpzYPIKsf+f7y1lTcD/wAhuxih5Oew8IPE0jfYhQC83y75DfJLle7jPc61247yd+/CC4u4Wjo1oLjs1oAG/IBLrZT0sXWfqrQjveuXyyXxb60WJNdtNsSmAxq0yZ3dmxtBuF+jLaFjuEcRjpgGueHcTxtIfNLWkF3UxLIs3yvLREMhvU9wij24INmxxAjfZ3dsAbxec4cW2+x232UTTN6IsjLTwlGnJTl60t8tb+GxdiSQyy3qsLLeqYtvMdA6hCB1CCdhsQhCBQQhCAGb0TJW9EyBNpkeIJ0g8QToBgti1rYggEIQgVgmb7UqZvtQKMsjxBTS36c51c610FNi1wje1heTVwGmZtuBydLwgnn0B36/mK5kaZVNCf7Y8qx/HJYvOrKKe4iSsgZ13ETAeNxbs5rQ7c7gciUraKMsZhYu2mm9y1v5K7K1QuTvFLbaLI6mmtF1+erezh7qt8mdB3u7QT5juY2JI59dt/auMUrIuRkpRUlt+H4PWd+O19+Tt1D9w/rCnXiGvbztffk7dQ/cP6wp14hrmnkB7HqfxH+WB6D8oumx7q4sZvRMlb0TLqh8kCEIQI8y5dH8Rxu+t1ByrL6WouuP4ZjTrvLaaSpMElxldVQUsMLpACWR95UNc9zRxcLCAQSHCayaa3PUzFcIuGG6YYziEeQZTSWGjrbFmhrY2z1Ql7qKrpJqqpqadxEL38bu7HDG7zTxN2pjBs7vun+YT3ax+S1DauikoLlQXCmE9JcKWXbvIJoz4mO2aeRBDmtc0hzQRN6jW2+0tntVvwrG7DprR0GR0uRRsx6Oqe59wpmyMp5nPq553+YJZNmNcGeed2nltkTVtYmstK9dlK9W2qxiRlVlFttdfmVBjNdV5RgdRZTHJWPc2OppWyynyqEd2/fcxPB4A5jeMERv8ANFf6qKg02zd2YXaLOKPEbjFW2U26GOqrO/FPPDJ3shkgJpZuJzmxvbsPMIKhMurj484xzIrJp3h+L3a036nvRmtdDUjyyogfxsbIJKh/dxE77xQd0w8uXmt2+Ky6tZbjtFeW2SSmttZccrt+Siuiid31LWURqTAYt3FoZvVyEhzXE8LOY2PEeqGsum+dlqpsXzFX3S8ZPjWNT5VSY/dbrlWAVFnbTvqu87qrp2yy/umnBidxkmORgLSY/OCqes0oq8f0/ku+XVtVZ7iM3kxmK0U1uFRUzupm710rAZGbmF0lOxrOj3SkcTOE78Dlud0uU2oU9NgOLYjK+q8qq6qxUdQyWpk2cOffTSCJnnk93CI2E7bt81u00yTtB59k+sGnuc1LLXQX3DjDLbTR0ZEVRVRzd++sna9zu8nlk2dI4bB2w2DQAo9Uh3sfXqhobcNP8ASizZtBFlcFhrrk63OizHDJLBWNl7rvWOZGZpmSxuaH+e2TcFhBaNwTUgxa/HSt2bCh/tYbdRajW99HyqjEZhHwcXH4ATxcPD7N9+SnmX6vVuV6VS4ZTYZjeJWOW+tvU4s0VW6aWqEUkRc6WpqJnuaWyHzSdgQOHh3cDUah2vqFL90UobVkd0nsty02xC72mgY+45BluSVV4Y200LeEPe8UdfAxwB2bGwM45JHtYCSRtvvcWL3ag1a1M0ysdFhuHWu522027Hbhb23Vz4aoTu7/vat0roZOKh4jwlxAmcwPDQePgMW1iGN6CVWnNXptimU2KquouVZNcpLpBU1UrW8MbZX0dbAJGRgu4GOBDS9xHMkrRa9V47TPlFJRacYo3E79HTeW4xIblJQtlpy4xTskdWGpbIC+T/AH8tIkcC3Y7JrqwFg3PRiyRvzvKMwz/5mt9qoMfu1SLTicRfUvvdF5b3FPTMmiij7ou4A3iYwtaSO72DD8Fv0ijvekGMZTcstp7PhNNjlfeLhXMxyIVdLBHdfIY49o3h1XNLNJEGiSQBgdw8YYzdRLMNasozSjy6C5WyzUUWRR2ZlYy30b4Wwi1UppqcQt4y1gLDu8bEb7cIYOSxYtaMmsWLWKwttdnumP2+y1VnqbbX0skkF0pKmr8seyo2kDt2zBjmPjMbmmNpB3G5PVDWWJpDaMQ+ftbrfRZhPLib9NKiR14qLM6KpjZ5dQuc11MJHDvdxwhrZSwkt88AkiptQsIt+IfRK42O/S5JjOS2T50tVbU27yKoDG1M9LJHLCJJAx7ZaaQebI9pHCQeewxDqPW0d0zCaz45Y7DRZFYTZZ7fQ08wgpacywy7xF8rpDJxQN8+V8hO7t9+W3CX7LrlkWG4VY62CmipMYtUttoHwMcHyRSVlRWOMhLiC7vKmQAtDRwho23BJW6sIaL7i19xhlkdfKHyFt4tUV0tx75knfUspcI5PMceHcsd5rtnDbmByXY6twfErjodQSac4TZM94cTZW3i60+WyR5HQ1wp+OqJtxmANPDIH+CmeHRM4u9BdxDqi32q47FrHW4zaQ+xYNidsyltrkt0eUQUNQ2vZFJAYHuawT+TCR0bnNMvccZ4i7fiO6E0BL49IKW8ZS+K/wCaU1jttt0uocrmrKTGowe6e2nApu6iezvJdp9u+ceKRzQXkcRc3S7RGy8cWRMzqf8ABi7D/pNJfZLDw1zIfnB1t8n8jE5aZzVN4AO/4OE8fGBuFCJtXMkmbcQ6itoFZhFPiMu0MnKjgMBZIPxn8MfJ2buO7ebtmjltKsG1VrRU47jN8qset2LUWLVGOzx3q21dTQ19LLXyXENqxTOM4IqJOJssAD2GOPYeJxn1bkHz5BpRYbNnWl1JbsqvGW2LNLJ86U89lxbvbjCDVVNMIGUbqlollDqbzgJWgFzg0vDQ581qOzLXU+t2AY3XXm8YtZMroLhVU1dleJy2yuojRQSSytnozK88JDGEPjkeC2TcblpalzzW2itut+nl10+hs9xosTwt+OyCG21FNbK1lQ6rNRHFG97agRd3WuiEj3NmcWmQkOdumwLXqnh1o08qbvYsdwjFcRpb462U9qt9TNEJa2hkYGyiWSeSYOmbEN3lx2eQ48IHCy0bkM4G2aGWrKaawXrDM7NxwypmuMV6ul2shoprR830fltQ90DJZe8Yafd0Za/dzgWuDCvpsOhVkyvJ8FlxrUF8uF5JJdaY3m5WE01Rbqm3Unlc0c9MyaQcJjfC5r2Su815O27S0xqPXXJLfcsb+jWPY9iVms81XMLJbaOZ9FXPrIRT1RqRPLI+USwjui0vDWs3DAzfdYbrhkFLfcanseN4/jdmsNPcY7bY7fT1Bo2Pr6c09TO8yzvmklcwtAc6Ugd2wAcI4THqik7xLs6QZrhMmXY5cs1v2Hy3V1roqqy6cS3GrdPHHG+aSeCCpc2Cnb3zA15kdI/zuGLzXAUnkGA5DjnaDuumlRDHVZPRXt1n7uGQCOacS903hc/YBrjsQXbciN9lyWN6k1Nj0/8AopdcWsWb47HXvr6Kiv0VRtRVMjGMkkifTzQyDjbFEHMc4sd3bSW7hQSvrX3HIK64SQU9K+qnfM6GkgbDDGXOLuFjG8mNG+waOQGwSu1tRDyJ1iOKbdq/GMHyug/+22mtN4ou/wD/AMabDNHxxu/5Q4mO/nB6FXk3Qqltd/15rLxHjdZZbDj9yqbDTW3OqCuqqSaOsiZC51PTVb59mxuc0963YEgO87ZdY8cvlXjGoNiySgjhmrrTcYK6mjqGl0bpIpGyNDgCCWktG+xB29oUnoNR75b8o1Bu0NLQuqcxt1XQ3Nr4nlkUdTOyd5iAeC1wdGAOIuG2+4J5oTRCLEOh1vFM6wDNydT24j9JnY98znyXyfyL5w7jyzvd/KPJPxvB3PBv5vebr7ZNDse+b7fbabUOapzivwMZbS2n6PFtL3TaB1dLTPqe/wB2yiKOQt2ic12zd3MLthFjrjkpxB1J8xWEZI7Hfo87LPJJfnU27ufJ+44u97nfuPxPe913vd+bxrjItWsjh1CteStoraa6gxB+LwxmGTu3UrrbJbi9w7zfve6lc7cEN4wDw7eaRaIMn9v0Kx+eomsFx1Ffbs+gwibKqiztx8y0zYm211xiphU9+CZ3Q92XDugxgc7Zz3N4HcX2etNLZqtqRl+LV7qKCr+idTPaqy41r6ano6sTQMjme5pG4b3jvNIcDv4SdlY2M6vYzbNH7le7/csbu2aSYDV4vTCCw1zb7IJKN1DAyaZx8iEUUbmHvmfj3MibGeRIXWnFcxueIQ5Qy2wUs4v1hns1Z5SxzuCGZzHOczhcNngxt2J3HM8im9VNEFyXDT7C7nmuT4/boa/Csb0+tkk+WZLdqGaS63GXymKmAFCZWxxF080cccO7CGkukkJ6LSaGWapu1RXu1AMOCvwaTLbdezY3GeogirRRyU76YS/i5myiVuwkc0lrfO4XcTeApdeMr8jpY7zZ7HlEvzO6zXWpu1LM+a9UHFG+Kmq3slYZO5fFG6OVvDM3gaO8Ia0Dj7jrLklfUXZkdrs9ttVXif0YpbXR08raa20PlDKktgDpC/jMrXPL5HSFxkeTuSCD1SDnhovSVupeHUljy/yrDb/jFVkjL7X2o001HQ0ZqhVmWmbJJ+MjNFOAxkjg/wAzZw4uXB5vp9jdg0WxDOsVzKoym03663CgbBWWQUFRSOpGUzj3jRNK3id5UCA1xAaGni3cWsfFdUrzR5ppo2eqt1ooMYtdTZY6ia3yVUM9HVz1UtQyriDiZWP8tmjcGBp7sjYFw3Ms1lzfErtpBp3gmJGyTQ2KsuVfVy43b62mtzX1fk7WxRGuPlMpaKYudJL7ZA1vmsCj1bAdd0IQsTFYDqFsWsdQtilCgmb7UqZvtQ8iHkMsjxBYWR4gjYDHQhChCAhCEoDN6JkreiZNsE2mW9U6RvVOlB5gOoWxax1C2JmQCEISisE48ISJx4QgUysjxBYWR4ggB0IQpQGxCEKDGC2LWtiABCEIAyPEE6QeIJ0CMFsWtbEEAmb0Spm9EAMhCEEPIEDqEIHUIENitzBcFtkmMS5/n8sltwKjk4Yomcqi8zDfangG4JG4Ic8EdHAEbPfGYLgtskxiXP8AP5ZLbgVHJwxRM5VF5mG+1PANwSNwQ54I6OAI2e+ONZ1nVzzrJ4qmpijttoo4+4tNppuVPQQjYBjAAATsG7u2G+wAAaGtajbbsjS1atTFVHh8O7JapSWz92P729/d7R85zq55zk0NVUxR220UcfcWm003KnoIRsAxgAAJ2Dd3bDfYAANDWthKwOgWUySSsjaUqVOhTVOmrRWSGb0TJW9EykzAhCECMFsWtbEEAnHhCRWfjWJW22W6kyzUaKst2LOkb5Fb4o+GsvJIa7aFri3aENc1z5dwNiGtPE7dsXsivWrQoR0pfBLNvcl/ve9R8uD4VT5DNLd8iukeN4VRScNfc5nBpleGl/k8AO/eTFoJ4QDsOexJa12chzh9VjT8RxeKSx4LHI1zKJ3CZ617f9/qpAN3yOOxLQeBvCwAeYCuMzHMKvLr+yXyOns1lpeNlrs9CwMpqGNzuJwa1oALnHm5+wLj+YBrREm+1Ra+tlOFCdWSrYjPZHNR6+uXXsyW1tkIQmZsATN9qVM32qEAyEISAM3omSt6JlkEeYJm9EqszHsDgONSZLnFxkxXHWxiSkjdEPLbt4CW0sbiOIFr2/jdiwFzTzAcWo2kytWr06EdKb7Nrb3JZsj2KYdkGZ5JFbbDb5Klxka2epLSIKUO3IdK8Aho2a4j2nYhoJ2CnMl1xTTqGnjxWSkzDMjGRWXmpg72it0jXHbyNjgON4cGuEzuJuzAWjZ7mt4LKc6+cLVU4xilF9GcDFR3kVsjO8lQ4EnvaiQkue48vNLi1oYwDfgDjXiVpvMoqlWxT0q/qw936n/lWre5H21twr7pdpa651tRca6XbvKiqmdLI/YADdziSdgAP6AF8yRvVOp2GzsopJZAmb0Spm9FKIGQhCdkMB1C2LWOoWxKiECEISijjwhZWB4QrMx7TSuuONuyHJbnBhWMDwV1yjcJKneIyN7iLkZdwBtsRuCeHiIIUNpFetXpYeOlUdl+L7EtbfYVs32qzKHTWup7XFdM1ucGB2iTfu3XGNzqyfYlp7qlb+Mdwu4OLfh2a8OG4X0jPLHi+8Wm9g8gqx/5/vTWVNwP/IbsYoeTpIzwg8TSN9iFW9dX11zuktdcq2e4Vsm3eVFTM6SR+wAG7nEk7AAf0BRrZScsVX5q83He7OXwWtL4364ossZ3Y8XPdacWDyCqH/n+9NZU3A+3zG7GKHk6Rh4QeJpG+xCretr6653OWtuVZPcK2TbvKipmdJI/YADdziSdgAP6AviHiCdNZJmelh6VF6UV6zzb1t/F6/hktiBCEILQJm9EqZvRADLLeqwst6oEeY6B1CEDqEE7DYhCECghCEAM3omSt6JkCbTI8QTqX2bT3Nr6Y3W3Gq18T4BNHNPF3EUjDtsWyScLXb7ggAkkcxyBUlOD4hZ6KOpyXUW3zycbnCix+M1z5mNDSWiTk2N7tyBxt4fbueYC3RRqYzDQlo6V3uV5P5K9viVWuTt9rud3rXU1qt1Vc6hrC90VJTuleGggFxDQTtuQN/5wp59KMBs3m49gnzrVQ/7XuGRVhm7zfxd5TM2jOwLmt2Psa7qtFbqnmM9tkt9vrYMbtLtu7obNSspo4eYceBzRxt3du4+dzLj7Dsi73GLz2Kn9nTt1ydvwV38HbrsbYNKsqbRQ1d7NvxOglYDFVXq4RwMc4jcR7AlzXkbnhc0bcJ32I2W36OacWz8Zds9nvEsHm1NBZbW7ie/wkRTyHu3NDufERs5o5cyFW0881TWzVNTM+oqJXl8ssry573E7lxJ5kk8yStSLPeDo4mf2lW3dSXHSfysWd9KMBs3LHsE+daqH/a9wyGsM3eb+LvKZm0Z2Bc1ux9jXdVkat5bTbx2FlrxWjPN9JabVEyJ7/bIQ8OPEQGjrts0clWCZvtRooT0HDPnx0u83LjdfLVuOauGQ3+7UTaa63y4XOna8PbFV1skrA4AgOAcSN9iRv/OVxA8QWFkeIKdhejGMFaKsh0IQpQ5347X35O3UP3D+sKdeIa9vO19+Tt1D9w/rCnXiGuZ+QHsep/Ef5YHoHyi6bHurixm9EyVvRMuqHyQIQhAjzJLjt9tdlNX85YZZ8u77g7v52nro/J+Hffg8lqYd+Lcb8fF4Rttz3lH05xf9DWHfrt7/ANYqsh1C2KrPD06ktJuXwlJfgmkZY1ZRVlb5J/2LJ+nOL/oaw79dvf8ArFOM5xjYf7DWH/rt7/1iqzTjoFj9Epb5eOf1DeenuXhX6Fk/TnGP0NYf+u3v/WKcZzjG3obw/wDXb3/rFVomb0R6JS3y8c/qIdadsl4V+hZX05xj9DeH/rt7/wBYo+nOMfobw/8AXb3/AKxVboR6JS3y8c/qE89PcvCv0LI+nOMfobw/9dvf+sUwzjGNvQ5h/wCu3v8A1iq1TN6I9Epb5eOf1B56e5eFfoWT9OMY/Q5h/wCu3v8A1ij6cYx+hzD/ANdvf+sVXCEeiUt8vHP6g89PcvCv0LKGcYxw+hzEP129/wCsVn6cYz+hzEP129/6xVbjwhZR6JS3y8c/qE89PcvDH9CyW5xjPP8A2HcQ/Xb1/rFZ+m+M/odxD9dvX+sVW7famR6JS3y8c/qI89PcvDH9CxvpvjP6HcQ/Xb1/rFbPpvjP6HsQ/Xb1/rBVqtiPRKW+Xjn9QeenuXhj+hY303xn9D2Ifrt6/wBYI+m+M/oexD9dvX+sFXKEeiUt8vHP6hXXnuXhj+hY303xn9D2Ifrt6/1gmGb4zt6HsR/Xb1/rBVumb0R6JS3y8c/qF8/PcvDH9Cx/pvjP6H8R/Xb1/rBMM2xnf0P4j+u3r/WCrhZb1R6JS3y8c/qB152yXhj+hZH02xr9D+I/rt6/1gj6bY1+h/Ef129f6wVdIR6JS3y8c/qIVee5eGP6Fi/TbGv0P4j+u3r/AFgn+m2NfogxH9dvX+sFW62JVhKW+Xjn9QOvPcvDH9CxPptjX6IMR/Xb1/rBH02xr9EGI/rt6/1gq7Qm9Epb5eOf1C+fnuXhj+hY4zbGtvRBiX67ef8AWCz9Nca/RDiX67ef9YKuW9EyPRKW+Xjn9QefnuXhj+hYozXGuL0Q4l+u3n/WCb6a41+iHEv1y8/6wVcjxBOo9EpXzl45/UHn57l4Y/oWH9Nca/RDiX65ef8AWCPprjX6IcS/XLz/AKwVeIUPCUt8vHP6hXXnuXhj+hYgzXGtx/sQ4l+uXn/WCf6a43+iLEv1y8/6wVcDqFsUrCUt8vHP6hfPz3Lwx/QsP6a43+iLEv1y8/6wTNzTG+f+xFiX65ef9YKukzfah4SlbOXjn9RDrztkvDH9CxPppjf6I8T/AFy8/wCsFkZpjfF6I8T/AFy8/wCsFXiyPEEeiUrZy8c/qJ8/PcvDH9Cxfppjf6I8T/XLz/rBH00xv9EeJ/rl5/1gq9QoWEpb5eOf1GPz89y8Mf0LC+mmN/ojxP8AXLz/AKwR9NMb/RHif65ef9YKvUJfRKW+Xjn9QefnuXhj+hYgzTG9vRJif65efv6z9M8c/RJif65ePv6rxvRMm9EpWzl45/UL5+d8l4Y/oWGMzxzf0SYn+uXj7+m+meOfolxT9cvH39V23qnS+iUt8vHP6iHXnfJeGP6FgjM8c3H+xLin65ePv6f6Z45+ibFP1y8ff1XY6hbEzwlLfLxz+ojz89y8Mf0LA+meOfomxT9cvH39H0zxz9E2Kfrl4+/qv0JfRKW+Xjn9RDxFTcvDH9CwPpnjn6JsU/XLx9/TjMsc4fRNin65ePv6rxOPCEeiUt8vHP6hfSKm5eGP6Fg/TLHP0TYp+uXj7+sjMsc4vRNin65ePv6r5ZHiCPRKW+Xjn9QekVNy8Mf0LC+mWO/onxX9cvH39H0yx39E+K/rl4+/qAIU+iUt8vHP6g9Iqbl4Y/oWH9Msd/RRiv65ePv6Ppljv6KMV/XLx9/UAQo9Epb5eOf1GP0ipuXhj+hP/pljv6KMV/XLx9/T/THHf0UYr+uXf7+q9WxHolLfLxz+oPSKm5eGP6E++mOO/ooxX9cu/wB/R9Mcd/RRiv65d/v6gKEeiUt8vHP6g9Iqbl4Y/oT8ZjjvF6KMV/W7v9/T/THHf0U4t+t3f7+q+HiCdHolLfLxz+oV4ipuXhj+hPvpjjv6KcW/W7v9/T/TDHv0VYt+t3f78q+WxHolLfLxz+oX0ipuXhj+hPfphj36KsW/W7v9+TjMMe29FWLfrd3+/Kv0zeiPRKW+Xjn9QekVNy8Mf0J/9MMe/RVi363d/vyPphj36KsW/W7v9+UCQj0Slvl45/UQ8RUtkvDH9Ce/TDHv0VYt+t3f78rXwy34dV4TWZznenGP2HBqfiip301VdfK7pUbENipg6uIOxB3cRt5pHIB7o6jxTFKe52+ryPI6uSz4Vb5AysrI2gzVUpG7aWmaeT5nDn/esb57+QAd8eVZXUZNcqOKKkjs+P2+Mw2ez0ziYaKInc8zzfI4+c+R3nPdzPIABXhKb1Jy8c/qNTWxeIry8zRaVudLRjq6lq5z/Ba87Xn+V6wQZdcKQ3LTfG5LdQRmC10ZqbkxlJDv5rA2KrjZvsGguDG78LeQAAEU+mGPforxf9bu/wB+UDQmWEpLbLxz+ov06nmoKFOMUlsUY/oWAMvx7Yf7FmL/AK3dvvyPpfj/AOizF/1u7fflAh0Cyj0Slvl45/UZPSKm6Phj+hPhl+P7eizF/wBbu335Z+l+P/osxf8AW7t9+UCb0TI9Epb5eOf1B6RU3R8Mf0J39L8f/RZi/wCt3b78j6X4/wDosxf9bu335QRCPRKW+Xjn9QrxFTdHwx/Qnf0vx/8ARZi/63dvvy2fS7H/ANFuMfrd2+/KAK9bDT2HSm3nIMngjuuo4jZLZsclY4stvGCWVFUegkAAcIt+Nu7CQC4Ojh4WktsvHP6ijiOUJ0I6oqUnklGN3+GpLa3qRyNur8LxrE6HJ8w0tsBq6zgmsNjp624tmqYw8E1U3e1UjGQHYhrXMcZT0HACTGMi1Vbl2SOvGRaf45c7g6NsYkfU3RoaxvRrWtrQ1o6nYAcyT1JKra73e53/ACasvF4rJLhc6qTvJ55Tzceg5DkAAAA0bAAAAAABfAPCFCwdLNuXjn9QUpVVLztVRc+7HUty1Zb3tet7Ep39Lsf/AEXYx+t3b78mbl2P8/8AYuxj9bu335QNM32pvRKW+Xjn9RceIqWyj4Y/oTz6XWD9F+Mfrd2+/I+l1g/RfjH63dvvygqEeiUt8vHP6hPSam6Phj+hOvpdYP0X4x+t3b78mbltg5/7F+Mfrd2+/KBpm+1QsJS3y8c/qD0mpuj4Y/oTv6W2D9F+M/rd1+/I+ltg/RfjP63dfvygyEvolLfLxz+oPSam6Phj+hPBltg29GGM/rd1++rfT5LaKuvgpaXSnHamqmkEcMMVRdnPkc47BrQK3ckkgABcNi2H3zLq6qjtFPGKWjYJbhXVMzYaaji35ySSO5AABzthu4hriAdip3VZhY8FoK2zaYVElbVVtI2K45TVQujqXbhpdHStOxgZuDuXAvJPI/i2PUvC0sk5eOf1GtrcpVVU81SjGU+7Gy7z0dXUs3sWbJbdXYLp/QSQ5Tp7jtdnZjjnorVbay4S01AdmuArXSVbmvJ337poIIZzdwyNcITkGqTcsyN93yHAcduVeY2xiR9TdGhrW9Gta2sDWjqdgBzJPUkqp0zeihYOlfW5eOf1DUZVIPTqaMp79CC+C1alqyv2tk6+llg/RjjP61dfvqPpZYP0Y4z+tXX76oOhS8JS3y8c/qLnpNTdHwx/QnQyywb+jHGf1q6/fU30ssP6Mca/Wrr99UEb1TqPRKW+Xjn9QrxNTdHwx/QnH0ssP6Mca/Wrr99TDLLDt6Msa/Wrr99UFTN6I9Epb5eOf1C+k1N0fDH9Cc/Syw/oyxr9auv31H0ssP6Msa/Wrr99UIQn9Epb5eOf1B6TU3R8Mf0JwMssO4/2Msa/Wrr99T/Suw/ozxr9auv31QQdQuastivGRX2O22O2z3Otfse7gjLuEFwbxOPRrQXDdziAN+ZCVYWlvl45/UI8XKEXKWikv3Y/oSH6V2H9GeNfrV1++qY4zQsyihqrhTaa4fa7HSyCOru90ulzp6SBxHmtLzW7kklo2aDsXt32BBWllmwrTyooanKpPpllTNpX4/QzR+R0b2vLXRVU3ncTh14GjYOYWu4muBMIyTNsiyruobpXcFsg2FJbKVghpKZreIMayJvLzWuLQ47u4dgSVj9FpvJy8c/qNX/8hisRqw8YqPvOEf6Va77XZbVpFq1ed6dYhW0UuC4RZb3foZN5rtXU9aKTYEPYYIJqp72vB2HGSCCw7bh/KH3nUiHIr5Jcr5gtiuda/cd5PXXV3CC4u4Wjy3ZrQXHZrQAN+QCrIeELKn0Slvl45fqWqcnTek1GUvecIX+eivkrInDcrsXP/Y0xv9aun31N9KrF+jTG/wBaun31QdvtTJlhKW+Xjn9RneJqXyj4Y/oTcZVYuL0aY3+tXT76m+lVi/Rrjf61dPvqg48QToeEpXzl45/UR6TU3R8Mf0Jr9KrF+jXG/wBaun31H0qsX6Ncb/Wrp99UKQj0Slvl45/UHpNTdHwx/Qmv0qsX6Ncb/Wrp99TjKrFt6Ncc/Wrp99UHTN6I9Epb5eOf1B6TU3R8Mf0Jv9KrF+jXHP1q6ffFkZVYt/Rtjn61dPvihKy3qj0Slvl45/UI8VUvlHwx/Qm/0psf6Nsc/Wrp98WRlNj3H+xtjn61dPvihSB1CPRKW+Xjn9Q3pVS2UfDH9CcfSmx/o3xz9auf3xH0psf6N8c/Wrn98XE2DF8gym5upLBap7lK3+EdGAI49wSON7tms34XbcRG5Gw3KnBwjFccoo6jN8vY6uD3NlsdgDKmqYQGgsfKTwRPa5x4muBBDHcJJ6K8NRW2Xjn+pQqcqRpT0HouW5Qi38lHV2vUR36U2P8ARvjn61c/vinFmsV0vdEa2HSCwUFqaxkslxuNXcqanZE4E97xPrRxMDQXEsDth/SN+Jh1Cs2NzE4Hh9LbKsMdELvdZDV1h80sbKwHZkLyHOLmtDmkkDYgbGBXnIr7kVaKi+Xaqukge97BUTFzIi8gu4G+FgOw5NAHIcuQUei03tl45/UYfTeUKr9SEYLfKMW/klb+r4bC7hLpBYRw5JabHfqweZJRYu65PbGT5zXiolrAx7eHYEAbhztv4pXA0WrFqx65xT4fpjjtn4N3CWufU1tS15Ba4tmMrXNaW7DhHLxf3xVMN6JlPodLa5eOX6jLTd1WanffCFvko2+d31lr3zVeqyadzr7iVnuDC8PED625tha4N4Q5sTawMadt+YA6n85Uf+lFj/Rxjv6zc/vihI8QTqfRKS2y8cvqLUazpxUYRiluUIL/ACkz+lFj/Rxjv6zc/vif6UWT9HOO/rNz++KErYp9Epb5eOf1DelVd0fDH9CZfSiyfo5x39Zuf3xcbdbzbrjbmQUmJ2qxSNkDjUUM1Y57hsRwETTyN25g8gDyHPbcGPoTRw1OElJOXik/wbEniKko2aXhiuCBM32pUzfarZSGWR4gsLI8QQwHQhCEB347X35O3UP3D+sKdeIa9vO19+Tt1D9w/rCnXiGuZ+QHsep/Ef5YHoHyi6bHurixm9EyVvRMuqHyQIQhAjzAdQti7u9imwWeuzHOMgrLfFU3i1xUkVuqZAS6mE4nEpYOgc4RtHFtuBxAEBzgfQ9V51tGVrHMeWPLCPJWPlhFQ09G13pWzSeWi9jR4Jpx0C96ULH5/qNF/wDkD/tf6/8AQeC6ZvRe8yEef6iP/wAgf9r/AF/6DwbQveRCPP8AUR/x/wD9t/X/AKDwbTN6L3iQjz/UH/H/AP239f8AoPB9C94EI8/1B/x//wBt/X/oPCIeELK93EI8/wBQv/H3/bf1/wCg8JW+1MvdhCPP9Qf8ff8Abf1/6DwnWxe6iEef6g/49/7b+v8A0HhWhe6iEef6iH5e3/8A1v6/9B4Vpm9F7pIR5/qI/wCPP+2/r/0Hhest6r3PQjz/AFEf8ef9t/X/AKDwzQvcxCPP9QLy8t/+t/X/AKDwzWxe5CFCr22A/Ly//wCt/X/oPDdC9yEKfP8AUR/x3/239f8AoPDlvRMvcRdCO2HY7TRZbhl9pKCKnu1ziqo6+pjGzqgQ9wIy4dCWh7hxbb7cIJIa0B4VdKVrG75J8rI8p46OFdHQ0r2elfJN7lsTOmY8QTpB4gnVjadHBCEKGKwHULYtY6hbFKFBM32pUzfah5EPIZZHiCwsjxBGwGOhCFCEBCEJQGb0TJW9EybYJtMt6p0jeqdKDzAdQti1jqFsTMgEIQlFYJx4QkTjwhAplZHiCwsjxBADoQhSgNiEIUGMFsWtbEACEIQBkeIJ0g8QToEYLYta2IIBM3olTN6IAZWJp7hFPllwudyvd1jsGHWWNk97uLnDjYxxIZHG3mXSPLSG8jt+Zx4WO+PBMEumdZPLS0ssdttFHH393u9Typ6CAbkveSQCdg7Zu432JJDQ5zTK8rp7nb6THMcpJLPhVvkL6OjkcDNVSkbOqqlw5PmcOX96xvmM5Alyt31I1eIqzqyeHoStLVd+6n/mexbM3qsmZ3ldPk2TxQ2akktGIW2PyexWpzgRSxcuJx26ySOBe9xLnEnYudwgqDjqEIHUKUrFqlShRpqnDJf71729r2vWbEIQpMw46BZWB0CygBm9EyVvRMgAW6np6isuEFJSQSVVVPI2OGGFhe+R7js1rWjmSSQAAinp6isuEFJSQSVVVPI2OGGFhe+R7js1rWjmSSQAAr+/e/Q2wf8A0PdNX62n/wCLLDjsT2/9LXTuaf5wAf7z+GVuxrcVifM2hBaU5ZL+73JbX8FdtI4estNv0e8lqK2op71qc+nbLBQBjZKbH3O3IlkO5bNOGlpY3bhYd3niAjLqdqKioq7hPV1c8lVVTSOkmmmeXvke47uc5x5kkkkkrXUVFRWXCerq55KqqnkdJNNM8vfI9x3c5zjzJJJJJSqUrE4ehKktKo9Kbzf9ktiWxfF3bbBOPCEiceEKUXTKZvtSpm+1BDyGQhCGICZvtSpm+1QgGU/x3CH1WNty7J5ZLHg0cjmvrW8JnrXt/wB4poyd3vcdwHEcDeF5J8whcvacasWIUEd61Ot1ZLNURyC14wxzoKmo2Dm99UHcOgh4hwt/juO5ALWkOheSZVespurai6VP7ni82ioIAWUtDHs1ojgi32jaGsaNhzPCCSTzWK98jVurUxMtCg7R2y/tHe97yXW725/Ks0ZcoJbBilHJjGDRyOMFqimcTUkuDjLUuLiZXktbsHFwYGta3oXGBJW9EyypJFqlRp0IaEF+r629re1sEzeiVM3ojaZjsTgugv000steTfSv5t8s739zfNne8HBK+Pxd63ffg36Dqpb/AGLn/rz/ANy/+Mra0M9VnFvefipVbSpSnLSaucYx3LvKtHG1acKllGUktUck31HUwdl3Y/7uf+5v/GXFX/s5fMeC3q9fTLyr5voJqrufmng7zu2F/Dxd8dt9tt9jt+ZdyFE8+9BeafUNZ9g9QpyvmYKPL/K060Yyq6m192O/sPMdM3olTN6K4jtQyFJsVw/IMyyOO22GgkqXGRrZ6ktIgpg7ch0rwCGjZrj+c7bAE7BT352w7Tqj7rHBBmeaug4Zr1MwPobXO2TfelY9n41w23EpO3msc3k5zFLewoVsVGE/NU1pT3LZ1t7F+L2JnH2zTd9BZnX7UOskw6ytYZKelkY35xuJa8NdFDA4hzT/AMd42HEx2xaSQl91D/eu5Y9hFqgxDFKjiikZAzesrYt9wKiZxc53V+zQ7YNeWEuCgF1u1xvuSVd3u9XJX3Gqk4555Dzceg5DkAAAABsAAAAAAF8SRLXrMUMLKo1PEvSayX3V8NrW9/BIEIQpNgOPCFlYHhCygBm+1Mlb7UylCPMyPEE6QeIJ0PMgv7CdDfpjpjbMj+lHzd5X3n7n+be94OCV0fi70b78O/T2qVf2M/8A66/9z/8AjK1NE/Vkxn3j4mVWoqjnJNnIMby3ynSxlWnCpZRlJLVHJN9R1X/sZ/8A11/7n/8AGXF3zs9/MmEXm8fS7ynyChlqu5+auDvO7YX8O/enbfbbfYrt4o3mUE9VpBldNTQvqamaz1UcUUTC58jjC4BrQOZJJ2AChTlfMwUeXeVJVYqVXU2tkf0PNdZb1Vpfg4jx3906jXqDGYm+cy2UsjKq4VY6jgYwlrGu4XtEjzsHNAI2O63S59YcdnDdNsZZaKlsbWm+XUCprnENALmNcXRwk7yNdwghwcOTdgBZvuOovGKo7YeOn15R8W3+VSPis+mGQVnd1WQOgwmzd+In11+eKXd3IlrGP2c93CXOHRp4XDiBC+oV+muLnu7da59Qbo3zm3C4l1JRRvHnMLKcedI3ns9shAPBy5OVeXG63S8VrKm7XKqulS1gjbLV1DpXhoJIaC4k7bknb+cr4B1CLN5k+j1quuvPVuj6q+L5z+aXUTe/5/lOR2xturrj5PZ2ebDbKKJtPTRs3BbHwMA4mt4W8PGXEbcj1KhiEKUki1TpUqMdGnFJdQIQhSZhm9EyVvRMgTaZHiCdIPEE6AYLYta2IIL1w3RX6W6b23IfpL83+V95+5/m7vODgkczxd4N9+Hfp7VJ/wCxy/8AXL/un/xlZ2jfq3457x8TIrOVVzkmzkuM5Z5SpYupThUslJpao5JvqOsf9jl/65f90/8AjLjb1oJ8zYbd7v8ASvynyKilqe6+bOHvOBhdw796dt9tt9iu1yjOa+hrLfqWq+xcoU5XMFHlrlOdaMXU1NrZHf2HnisjxBYWR4grbOujoQhCA78dr78nbqH7h/WFOvENe3na+/J26h+4f1hTrxDXM/ID2PU/iP8ALA9A+UXTY91cWM3omSt6Jl1Q+SBCEIEeZ347D3/0z/8A6m//ADS78Lz/AOxBV0rLpqTQvqYmVs0VBLFTmQCSRjDUB72t6lrTJGCRyBe3fqF6ALW1ftGeYPK5NeUFf+X8kSZUkDGWSG3PMbTVROe/ikAcHHbg5b7np+ZfJQFklDTUImmt1Y17tnNZ5sp39v59ttlHTPM6obK6Z7pRts8vPENunNbBWVYY5oqpg1xJcBIdjv1XwMuRMS4zvUTc3pdkvW12ekmrNKzWUVk9Z9TDyvwEalK1BqNOPm0r63T9RpXi4ShLSi5aSbd5vNajmYad8mKy0zSHPdcQzcdN9gN19t0jZUWaeKLuz5E5vdcEjXEs2AO4B5c/z/mUWjqKiJgbFPJG0O4gGPIG/Tf+lK2WVheWSvYXgh5DiOIHqD+dZ5cj4l4pV1UXqy0lqeb0b317Yq23NlOHlRgI8nPCOhJ6dNU5O6yipuNtWu05KWy7jHsOctVL3GRW+TymCbj4jwxScTm+Yeo9i5GkfBUSsZPUCrlp5nTulO4DGgcm8Ttvbt/MojHJJFKJInujeOjmnYj/AKVlssrWSNbI5rX+MBx2d/T+dTjORq2MqyqSq+topJ2S2yv+ErKzV2tYvJXlXhuS8PChTw/qKcptNtp3jTstbtzqd22nZP1dZI62KOoulrrZ+Du5iGVHA8OaHA/nB25j/wCC1SzVgy7ydxe2nbVNAjA2YGh44eXQexcB3knk/dd47uuLi4OI8O/59lt8rqu7azymXgaQWt7w7DbomhyRVpxjBuMlGLik0/VTd01nrS1diWsSt5T4etUnUUZ05TnCpJxavOSjoyjLm3jJ3l1OUlo61aTNfwVGRv718Ozm+fGPOHM9OY/+K+Gmk7yzXx/fST7xx+fKNnHmevM//FcIZ5z3u8zz3n8J558/+n86VssjI3sZI5rH+NocQHf0/nUQ5FlGEk5K7dN5bIebvsvr0HttryJq+VdOpWptU3oxVdZvOq61tV9HV51Xdr6nZ21HPVsk9NTW1tA50cD4A7eMeN/t3/OenJcHAyKSqYyabuIj4pOAu4f+gLMdTUQxlkVRJE09Qx5AK0rbYPBzw1GVO6u7+suc7tu7umrq+266th8zypyrTx+Jp11F6Mbfs5N6CsorRjZpqLtrtotKyvdXOXsmwyylAO43dsfz+aV93lMT5qKnfP5ZVCvDhJsfMbv4dyASo7HJJFKJInujeOjmnYj/AKVgPc2UPa4h4O4cDzB/OquK5KWKxbryl91Jdq09b1ZetkrX26jZ8neUkuTuTI4OEL3qSlK97aMlT1JXtdaGck7X1WesldzPe2u6Br3VLo6kcQkHOEf8Xry/7P6Fsne05pPSSHaKqgEZ/mPDyP8A9n51E+/n4pT30m8g2kPGfP8A6fzodNM+oEr5XvlG2zy4lw26c1qaXIE4Q825qyjJJ21ptU7PdqlC6+F9d2/pMR5aUqtbz0aTu5wbTd04xlWvG+t+tCrou7drO1o2SlkFOIJaCik2a2nYaqpJIA4v4o36cl8F1fMDS3KGXupJY+7mMEu4Dh7N2n/7NlwbqmocZC6eRxkAEhLyeIDpv+dJ3knk/dd47uuLi4OI8O/59lnw/I1anio4ipNSe1W1NSu5bdsndasoxRVxvlXhK/J88FQpShHU4vSV4uGjGnktkItNprXObs7kxkmmOpEUJleYRzEZceEHuzz2Uar5u9n28rnqeFzuUw2Df6POP/6F83lFQarvzPJ3/wD904zxfm69US1NROGieeSYDpxvLtv+1Z8DyTLBVqU9T0acYPZrjpXeTzvvXXco8seUtPlXC16VpJ1K06iu21oz0LRdpJero7YyWvVbMlVBIGWaytdLIwPme3gY3cP848nc+n/QUlCzyGouFYWxMf5R3TGmQNbtxbu2J29n/wAFGmVdXFCI46qWOMdGtkIH/YtbpZXQtjdI50bSS1pcSAT15KjLkKtOVVOa0ajberNabnbVbfZ63qvZrI3FPyxwtKnhpRpSdShBKLutUlSjSvr0tzkrJWdrpvWSikiFBllxLAHRimfJH+Yg7Ef/AOlsfDHFbaB0B3p5bmySL+YEdP8AoO4/6FFfKajffv5N+Dg34z4f73+j+ZYE84iZGJpAxjuJjQ87NP5wPYUT5DxNSpGpKqr2innr0U1ftu7/ABZFLyu5PoUJ0IYdqLlOUdavHTnGVl+7ZWfWoveSi8B0dJUOoQDE+Uise0+fxewH8zf/ALP6fulljhuF4klZxxd1CHt/O07g/wDsKhQqKgPkcJ5A6T+EIed3/wBP50Oqah/ecc8juMAP3eTxbdN/zrB/w7UdGFGU01HN69J3lTlre9KDSe62pWLn/HNCOKqYqnSactajqcItQrQVluk6qlJPOWk7u5L/ACSCKssdNOWyxN73gJ6P5gt//QuGkFVU2avmnqpA6F7RJA9nmjd2w258v+xcO+aZ7I2vle9sY2YHOJDf6PzJ31VTLFwS1EsjP710hIV7D8kYqhKMnUUpXTbay/aSm9G6dtJSs8mmk09VjUY7yn5OxkKlONCUIOLSSk1f9jClHTaabVNw0o3umpSi467mhdHe2b/9Lf8A+qH/AMsu8S6Ldsuqpn3PT2iZUROrIoq2WWASAyMY8wBji3qA4seATyJY7boV9xS+0R875Kpvl6j/ADfkkdJR4gnSDxBOtjtPSQIQhQxWA6hbFrHULYpQoJm+1Kmb7UPIh5DLI8QWFkeII2Ax0IQoQgIQhKAzeiZK3omTbBNplvVOkb1TpQeYDqFsWsdQtiZkAhCEorBOPCEiceEIFMrI8QWFkeIIAdCEKUBsQhCgxgti1rYgAQhCAMjxBOkHiCdAjBbFrWxBAKUYhiV8zbNqWwWCl8orJfOe95Iip4xtxSyO2PC0bjn1JIABJAPFWazXTIMoorLZaKS4XSrk7unp4hzcepO55AAAkuJAABJIAJVp5Ncfwb49eNNMcr++uVVwNy2708+7Kl7Wn9xwAHzYo+NzXuOz3uL2uDWjgKt7Ea7E15xfmaNvOSyvkltk+pbFtere1w+TZbSU2EN0+wyqqPohDUGeurJQY5b1U7NBmezf8XEOBvBF7A1rn7v8NaoQpSsWKVGFCGjHtb2t7W+v/wBLUCB1CEDqFJlNiEIQA46BZWB0CygBm9F9FPT1FZcIKSkgkqqqeRscMMLC98j3HZrWtHMkkgABLS09RWV0FJSQSVVVPI2OGGFhe+R7js1rWjmSSQAAuwH736G2D/6Humr9bT/8WWHHYnt/6Wunc0/zgA/3n8MrdjX4nE+ZtCC0qksl/d7ktr+Cu2kRvy+LST9zWiWnrNTDyr7gGsnhsbf41NDuCx85G7ZZObWAmNu5LnKpaioqKy4T1dXPJVVU8jpJppnl75HuO7nOceZJJJJK0oUpWGpUI0m5PXN5vf1dSWxbOttti2LWtiktAnHhCROPCEIDKZvtSpm+1BDyGQhcjaLRcr9ktHZ7PRyV9yqpOCCCIc3HqeZ5AAAkk7AAEkgAlQ8jFKUYxcpOyR8lPT1FXXwUlJBJVVU0jY4YYmF75HuOwa0DmSSQAArkqrVQaQ+TT1tRT3nUx9O2SGhDGyU1gc7ciWQ7lss4aWljduFp3eeId2XYutwxrTawwWrDq6nv2eS07hcsopZi+GhbI0bw0ZB24uHkZgOIBzgCC4tjphvtSL1uw1S08dZ640t1tc/0j1Zy22Wp8nd7vcr9klZeLxWSV9yqpOOeeU83HoOQ5AAAAAbAAAAAABcchCDaxjGMVGKskM3omSt6JlkIeYJm9EqZvRRtIPRDQz1WcW95+KlVtKpdDPVZxb3n4qVW0tfLnM87cpe0a/fl+Zgonn3oLzT6hrPsHqWKPZdQ1V00oye2UMXf1tXaamCnj4g3je+JzWjckAbkjmTslWZUw7Ua8G8rrieXitWx4FbqLEqHK9Q7pJj+O1jJDb6OmbxXG4FrAWmNhaWsYd/G/l4ege16++WbDdNqZ7bTVwZtn7e6lp7rEA+22txYdzF5xE8jSdw5zeEHgOzXMc01ddLtcr7kVZd7vWSV9xqpOOeeQ83HoOQ5AAAAAbAAAAAABXdbO96dbFr9neEN9vWfdTyXW9e5ZMmeT6g1V5sRx6x22DEsPHdu+aKLY989jQO8ml4Q6Vx2HN3LzWEgubxGvUIWWyS1F2lRpUIaFNWX+9bebfW9YDqFsWsdQtihGZAhCEoo48IWVgeELKAGb7UyVvtTKUI8zI8QTpB4gvtoqCuudziorbRz3Ctk37unpoXSSP2BJ2a0EnYAn+gIeYraSuzvlon6smM+8fEyq1FANLrJc8c0LsdmvNN5Hcqfvu+h7xr+HinkeObSQeTgeR9qn6oS5zOAY+UZ46rKLunKXFgo3mU89LpBldTTTPpqmGz1UkUsTy18bhC4hzSOYII3BCkii2dehLMfqOr+xeoWZXw6TrwT3riecM889VXTVNTM+pqZnmSWWV5c+RxO5c4nmSSdyStbeqwst6q+ehLJakOgdQhA6hA2w2IQhAoIQhADN6JkreiZAm0yPEE6QeIJ0AwWxa1sQQd6tG/Vvxz3j4mRWcqx0b9W/HPePiZFZyoy5zOEcodPrd6XFgozmvoay36lqvsXKTLgsopvLdNMio/KIaTv7ZURd/UycEUXFG4cT3exo33J9gULMq0GlWi3vXE86FkeIK0ZsW08ssoN5z595miY01NBYqDjL3OaOUVQ492Q0nckgbhpGwdyGsXnS23HuKLC7nkcTvPNTdruaaVh6cAbAC0tGwO557uPsAV2+47YsYpq9OEpfC35tErVfdJa7nFYYLrLbqqO1zP4Iax8DhDI7n5rX7bE+a7kD7D+ZT78Kd6pfxlismP4tVnk+rtVoYyV7Pawl/EOEnY9N92jmopfMsyTJJXOvd5qq9heH9y+Thha4N4Q5sbdmNO2/MAdT+coVzJCeKlJaUFFdt38rW/H4Hdftffk7dQ/cP6wp14hr287X35O3UP3D+sKdeIa5r5Aex6n8R/lgejvKLpse6uLGb0TJW9Ey6ofJAhCECPM5C1XW6WS/U90styqrRc4d+5q6KodDNHxNLXcL2kEbtJB2PQkKY/hV1Q/SRlP7QVX+eq+HULYhpMrVMPQqvSqQTfWkye/hV1Q/SRlP7QVX+etg1V1Q2H+yRlP7QVP+eq+TjoFFluMXoeD/wAOPyX6E+/Crqh+kjKf2gqf89MNVNT9vSPlH7QVP+eoAmb0RZbiHg8Hb7OPyX6E+/Cpqf8ApHyj9oKn/PR+FTU/9I+UftBU/wCeoGhFluE9Dwn+HH5L9CefhU1P/SPlH7QVP+enGqmp+3pHyj9oKn/PUATN6Istweh4T/Dj8l+hPvwp6nfpHyj/AB/U/wCej8Kep36R8o/x/U/56gaEWW4PQ8J/hx+S/Qn41T1O4fSNlH+P6n/PR+FPU79I2Uf4/qf89QMeELKLLcJ6HhP8OPyX6E9bqlqbz/2Rso/x/U/56b8KWpv6Rcn/AMf1P+eoE32pkWW4j0PCf4cfkv0J3+FLU39IuT/4/qf89P8AhR1M/SLk/wDj+p/z1AVsUWQeh4T/AA4/JfoTr8KOpn6Rcn/x/U/56Pwo6mfpFyf/AB/U/wCeoKhTZbhXg8J/hx+S/QnX4UdTP0i5P/j+p/z041R1M29ImT/4/qf89QJM3oiy3C+h4T/Dj8kTz8KGpn6RMn/x9U/56yNUNTN/SJk/+Pqn/PUEWW9UWW4HhMJb7OPyRPPwoal/pEyb/H1T/no/ChqX+kTJv8fVP+eoMhFluIWEwn+HH5InP4UNS/0iZN/j6p/z1s/CfqX+kPJv8fVP+eoEtiVJA8JhP8OPyROfwn6l/pDyb/H1T/no/CfqX+kPJv8AH1T/AJ6gyE1luF9Ewn+HH5InY1P1K29IeTf4+qf89Ra5XS5Xm9TXK8XGputxm276qrJ3TSybNDRxPcSTsAANz0AC49vRMiyRkhQoUneEEn1JIyPEE6QeIJ0bSwCEIUMVgOoWxax1C2KUKCZvtSpm+1DyIeQyyPEFhZHiCNgMdCEKEICEISgM3omSt6Jk2wTaZb1TpG9U6UHmA6hbFrHULYmZAIQhKKwTjwhInHhCBTKyPEFhZHiCAHQhClAbEIQoMYLYta2IAEIQgDI8QTpB4gnQIwWxa1dGMQW/TzB3ZpkNH3mW19OHYZQPc0ug3Dh85SxuaQGNPCYuLfjcHEN2AkbDdiniK/mIXSvJ6kt7/RZt7Fdn2Xej/Azj1PQ09VTy6pXKnca+eGXjfjtO9o2iiI80VEjXHilB3Y3kwAPEjqRb0WypqaisuE9XVzyVVXPI6SaaZ5e+R7ju5znHmSSSST1WtvRCVhcNQdGN5vSm83v6luSyS4tttkIQpLjyBA6hCB1CBDYhCEAOOgWVgdArobZ36S4za8hvVFHLqBcozNZbfUhrhZoxsBVzxHmZiT+KY4cLS1znbubwNhuxUr140bRWuUtSW/8A8LNvZ1uyfKW6rt+jmERVgpe/1duVOSyKqjaW47A8ENcWc/x8jCHcLti1rgHBo3bLR1RUVFZcJ6urnkqqqeR0k00zy98j3HdznOPMkkkklYnqKisr56urnkqqqeR0k00zy98j3HdznOPMkkkknqtShKxjw+GVFyqSd5yzfBLdFbF8XdtsEIQmLjBbFrWxBAJx4QkTjwhCAymb7UqmGHYTes1u1ZBa/J6Sjoqd09fca6UxUtHGATxSP2O2+x2GxPIno1xENpGGrUp0abnUdktp8GO47csoyVtstjY2uEbpqmpqJO7gpIW83zSvPJjGjmSf5gNyQDYGVXzGsVtNTh2nknlTpKfya/5NxHvLnzJdDDzIjg35Hh/hA1oJc1vFJwWRZFbaTGnYbhrpG44JGvuNxkj7ue9zN6SSDqyFp37uH2eJ27zyr9La+tmtVKeKmqlW6iso79zl/aOzN68hM32pUzfamRtBkIQkAZvRMlb0TLII8wTN6JUzeijaQeiGhnqs4t7z8VKraVS6Geqzi3vPxUqtpa+XOZ525S9o1+/L8zBRPPvQXmn1DWfYPUsUTz70F5p9Q1n2D0qzKuG6RDtXE8x0zeiVM3otgj0eMhdhMH0H+mel1ryX6VfNvlnefub5s73g4JXR+LvW778G/QdVLP7F/wD9eP8Aub/xkrqQWq587V5c5LpVJU51LOLaeqWa+B1PHULYu1n9jBz/AN3H/c3/AIy4u/dnX5kwa9Xr6YeVeQUE1V3PzTwd53bC/h4u9O2+22+xUKcb5iQ5e5JlJRVXW/3ZfodZ0IQmPoRx4QsrA8IWUAM32plOcYwG636y1V8rZmY7itLGJKm8V8bhEW8fARCAN5n7hwDW9XANJBc0GQyZpYMOhgpNOLfHJdI4+Gqyi50gfUyyBxHFTxvLmwsc0uHMcRa4Bw3bxGL69RrKmKWm6dFaclnsS7Xs7Fd9R8tPp5BZaKC5ah3mPFqZ8YlhtUQE1zqmkcQDYhyiDgHtD5COF7dnNX0XDUnyDGHY7gFs+iVq8wTXBkn751vA5xDpZm7cO/ECWt34ebQ7hPCqzrK+uud1krrlWz3Ctk27yoqZnSSP2AA3c4knYAD+gL50NXesRYR1bSxL0mtdsop9m3td+qx380T9WTGfePiZVaiqvRP1ZMZ94+JlVqKlLnM4nyj7Qrd+XFgotnXoSzH6jq/sXqUqLZ16Esx+o6v7F6hZlbD9Ih2riebiy3qsLLeqvnoR5joHUK+8K0Q+mGmdtyL6T/N3lfefuf5u7zg4JHR+LvBvvw79PapT/Y18/wDdp/3R/wCMk04o0NTlvkylN051LNOz1SzXwOr6F2i/sbP/AF0/7o/8ZcXfOz/8zYVeLx9LfKfIaGWp7n5r4e87thdw796dt9tt9io04mOPLnJc5KKqa31S/Q64oQhZD6EZvRMlb0W+CCeqrYaamhfUVMrwyKKJhc97idg0AcySeQAQI2k7s1jxBOrDodLcplt0VfeBRYjbpN2xVN/rG0oe8Eju+E7vDiA4jdoBDSd+m/2d1pXYPPfV3TP6wefHHFEbdRuB83geXbyhzeb928j5o/vkt1sNfLGUW7U7zf7uv8cl8WitYIJqqthpqaF9RUSvDIoomFz3uJ2DQBzJJ5ABT636ZZdWUTq2uoWY1a43lk1dfJRRxRHYbcQf5+xJa0ENI3O3sO32fhVvdu/E4jbbXh1GPNLaChY+WdjeUYmkkDjI5o387YElzievKB3C6XO71ram63GqudQ1gY2WrqHSvDQSQ0FxJ23JO385R6zEvjamSUF1+s/krJfN/wBjvdppbPmbROy235worr3Pffuq3T99BJvM93mv2G+2+x5dQQp2qx0b9W/HPePiZFZypy5zOMY5NY2qm7vSlxYKM5r6Gst+par7FykyjOa+hrLfqWq+xcoWZgw/28O1cTzxWR4gsLI8QV9nfB0IQhAd+O19+Tt1D9w/rCnXiGvbztffk7dQ/cP6wp14hrmfkB7HqfxH+WB6B8oumx7q4sZvRMlb0TLqh8kCEIQI8wHULYtY6hbFJAJx0CROOgUAZTN6JUzeiCHkMhCECAmb0Spm9EAMhCEAOPCFlYHhCygxsZvtTJW+1MgAWxa1sQQCEIQQwTN6JUzeiBRllvVYWW9UEPIdCEIIQLYta2JUDBCEJhRm9EyVvRMgDI8QTpB4gnUbQBCEKGKwHULYtY6hbFKFBM32pUzfah5EPIZZHiCwsjxBGwGOhCFCEBCEJQGb0TJW9EybYJtMt6p0jeqdKDzAdQti1jqFsTMgEIQlFYJx4QkTjwhAplZHiCwsjxBADoQhSgNiEIUGMFsWtbEACEIQBkeIJ0g8QU8wPDKjL8oldMJKbGLXH5ZkFxaCBR0jN3SEENdvIWtdwNDXEkb7bBxEN2K1arChTdSbsl/v/wBHP6fYrbhj1dqRlU1OzFLHUcMFDK9pfeK1rRJHRhpa7ZjvN43Fp80nlsHuZEMuy6+ZvnFVf7/VeUVsvmsYwERU8YJ4Yo27nhYNzy6kkkkkknltQcxo8ryGhprFa/mDEbRT+SWW2B5Pdx8Rc6V43I72Qnd7hzOzQS8jiMEUJbWUMNSnOfpNZWm8l7sd3a85PfqySBM3olTN6JjaDIQhBDyBA6hCB1CBDYhCtbBrRZLFaPwgZ1bfLrDFxssVqfIGuvNW0jlwkHigj5948+bxcLfPPFGYbsVq9aNCnpNXeSSzb3L/AHqWt6kfRi9PT6d262Z9kEEdRfJYzNi9inYHGbcFra6oB5shaecYGz5HtBaWtbxGt7xeLnf8mrbzea2S4XOrk7yeeU83HoOQ5AAAANGwAAAAAAX2ZPklzy/PLlkd4fG641sgfIIY+BjAGhrWtH5mta1o3JPLmSdyeBUJbWYaFBqXnqv2jWvqXurqW/a9e5Jm9EyVvRMmL4IQhAjBbFrWxBAJx4QkUsxXFqjJK6qkkqo7RYaCMTXe71DSYaKInYchzfI4+ayNvnPdyHLciL2RiqVIUoOc3ZL/AH/6W034dh9Xl1/fF5ZT2ay0vA+6XiueGU1DG53C0uc4gFzjyazcFx/MA5wlebZxbJMaiwPA4pLdgtHJxSyv5T3iYbbzznYHbcAtaQOjSQNmMjjWU5TT3Kgpcex6lktGG0EhfR0cjgZqmUjZ1VUuHJ8zh/1WN8xvLcmGN9qW13dmuVCWIqKtXyWuMd3W98vwjsu9YyEITs2QJm+1Kmb7VCAZCEJAGb0TJW9EyyCPMFydntNyvuRUlotFHJX3Kqk4IIIxzcep5nkAACSTsAASSACV9+OYrecpurqe1037ni86tr5yWUtDHs5xkml6RtDWOO55nhIAJ5Kd3jKcfxS0x2PS+pqG1D4GNu2VbSQVVa4Hj7uEHYwRB224bsXcLQSQ3iel9dka+tiJKfmqK0p/hHrl/ZZvZqu13L0os1Vj2gVhs1dJTyV1N37agU0wlbG8zyOdGXDkXMJLHAbgOa4bnbdWIql0M9VnFvefipVbSoS5zOB8oKSx9ZSd3pS4sFE8+9BeafUNZ9g9SxRPPvQXmn1DWfYPULMr4bpEO1cTzHTN6JUzei2CPR56FaHeq5i/vPxUqthVPod6rmL+8/FSq2FRlzmeeuUvaNbvy4sFFM89BuZ/UVX9g9StRTPPQbmf1FV/YPULNFXDdIh2rieZyEK0qPTplqx2mv8AqHcpMStc0j201v8AJnOuVaY9i5rIiAIwRxASPOwdw7jZzSbraR6CrV6VBLTet5LNvsS1shePY5e8pyBlqsFvkuNeY3SGNjmtDWt6uc5xDWjoNyRzIHUgKwXU2BYJQxvq5aTUXLhI78RTVDjaaTYNdG9zg0GoO+27AeEgva7YtBdxN61Fq6rFBjWL22PC8W7x730VDUyPlqS9vC/v5nHilHiGxAHCQCDwt2rpRreZU83iMS71fUj7qet95rhF/wAzWokWQZVkWV3QVmQ3ae5ys/g2yENji3AB4GNAazfhbvwgbkbncrgUrfamTIvRhCnFQgrJbFqRkeIJ0g8QTqXmMd/NE/Vkxn3j4mVWoqr0T9WTGfePiZVaioS5zOA8o+0K3flxYKLZ16Esx+o6v7F6lKi2dehLMfqOr+xeoWZWw/SIdq4nm4st6rCy3qr56EeZ350W9WfGvePiZVaSq3Rb1Z8a94+JlVpKjLnM4Hyh0+t35cWCi+cehXMPqSr+xcpQuGyOO3zae36K7TvpbU+3TtrZohu+OIxuD3DkeYbuRyP9BULMq0Ho1ovrXE81FPbBprluQU7qtlv+aLSyDv5LndSaambGWF4fxOG7mkN6tBA3BOwO65T6bY3jn4nBsUgMrfObecgY2qrQ8c2SRsH4uFzHF22wIdwsJG4UHvORX3Iq0VF8u1VdJA972ComLmRF5BdwN8LAdhyaAOQ5cgrutnc9PF1l6kVBb5a34U7fN9q2E/gt2mGMyufeLxVZ5cGMc00NridT0bJWtILXzuIdIwuI4Xx+xpJBBAXzT6oXmmopqHFLfbsLt8jDE8WulHlE0e2zO9mdu5z2gnaQcJ3c49SNqyb0TIstovoVOUr1m5v97Lwq0fwv1n11ldW3K6SVtxrJ6+sk27yepldJI/YADdziSdgAP6AtCQeIJ0xsLJKyBbFrWxAHerRv1b8c94+JkVnKsdG/Vvxz3j4mRWcqMuczhHKHT63elxYKM5r6Gst+par7FykyjOa+hrLfqWq+xcoWZWw/28O1cTzxWR4gsLI8QV9nfB0IQhAd+O19+Tt1D9w/rCnXiGvbztffk7dQ/cP6wp14hrmfkB7HqfxH+WB6B8oumx7q4sZvRMlb0TLqh8kCEIQI8wHULYtY6hbFJB2Y7J/Zqvfao7WVPppa739FqCO2VFxu18NvNYKCCMBrXd13kfGXyvijA427cZPPh2PbjtUfJjXvs39kW5as2nVX8JFJa66niutAMWNudTU8ru78oD/KpuLhldE0t4RyeXb+bse9/wAk9pRa9MuxPW6uZTLT2u/al3tlFZXVbwx0lJTmRkMbOLnxSyiodsPE1kZ58l6l59hVk1H0Ry3Ackh8osWQ2mottc0AcQjmjLC5v5nN34gfYQD7FSlVanqyLEYJx1n4eUzeimGomDXvTLXfMNPcji7q+Y7d57bWbAhr3xSFnG387XABzT7QQfaoe3orhWZ6W6FdhXRrWbRbAr1V9tLDMNzvJmNa3B5aKjqLlT1DpXRsp+7NyjkfI7ZpDe6BPEAAfb2t/wDIp/8A8S3/APjz/wD6K8r+yN+VI7PP/OFafi41+yhU6kpwepmenGMlrR+dOp+TH0SotRanD6zt84PSZbT1BpqiyTWiiZXRTA7GN0Bu3G1+/wDFI3UryT5GHNaSyyyYdrrZL/XAExQ3fHJrdG/ly3fHNUEf/WleeXbY/Ky6/wD+GNV/+cF7LfJG645RqD2ac70uyu5z3h2C1FG+yVVVIZJWUVU2UCm4jzLYn07uHfo2QNHmtADSdSMdK4sVBytY8Ndbuz1q12eNR48a1UxSaxT1Ac6318bhNRXBjdt3QTt81+27d28nN4hxNbuFSq/Yv2utGrBrj2AdRcQvNDFUXGntE9ysFU5m76OvgidJBI13UAkcDturHvHtX46Fkpz00JOGiy3dCNIr1rv2s8H0osNR5DWZBcBDLXGAzCip2tMk9QWbt4u7iY9/DxN4i0Dcb7r0p1r+SWvelfZUznUfH9Zvp3cMctb7i6xjDjRGphiIdORKKyXYsiEjwOA8RZw8t9xPfkjNKrXZLPqR2kswkp7XbKctxuxVla8Rxsc90b6qTd3Ibl1NE1w9rpG/nC946mnp6y3z0lXCyppZ43RzQytDmSMcNi0g8iCCQQsNSpKM7IeFOLjdn4X2+1Mr+7UWjdRoL28dRtMzE9lqt9zdNZJH7nvaCYd7THf+MRG9rXH++a4exUCrad1cqNWdgXaLs79kLWztM3qX8H1gjpcZppu6rsnvEjqe207upYHhpdK8AjdkTXuG4LuEHdaOyL2e63tL9tvHNOxLNR45G11xyWuhHn01BCW95wn2Pe5zImnY7OkBIIBX65cRxHGcA0ys2H4fZqXHcYtFK2mt9BSM4I4I2/8AtJJ3JcSS4kkkkkrBUqaGpZmanT09byPEir+S00I0k0vblPaI7SlRY7eCGyT0UFNa4TIRv3UTpzM6Z3I7BrA47HzVTQ7PHyYmRXb5mxTtfZPZ7s93dx1F/oeGka787pJKCnj4f5+8A/nXUjtidoe+9oztsZTlFRcpZ8Nt1ZLQYjQd4e5pqFj+FsjW9A+bhErz1JcBvs1oHVZMozau2LKUE7JHq/qN8kxq5a8VZkejWe47rLYpoBPSRxvFuqqqNw4mui4nvp5AR/G75u/LYc15hZRiuR4RqFd8Ty6zVWPZJa6gwXC3VsRjmp3gA7OH9BBB6EEEcivXT5JjtF32169V/Z1yG5y1uLXujnr8YhnkLvIa2Fplmii38McsQlkLRyD4twAXvJ6TdvP8r3rr9fN+GiRFy03FizUNBSidRllvVYWW9VmK7yO4HZn7OWluuOK5VcNQu01iugdTaquGGjpMiZSl9xa9rnOkj76tpzs0tAOwd4hzC9A7d8jfb7vj9DdrT2oae6Wqtp2VFHWUmCNlhqIntDmSRvbcS1zXNIIcCQQQQvD9fs37PHqA6G/831m+AhVWrKUNaZboRhNWaPFPMPkuNKtPb3RWzPu2/imD3Ksi72kpMgsFLQS1DOLh42MmujS5u4I3AI35KRRfI+NvWHQXrDO0zacno6mIvo6lmJ7Us46AtmirZQRuOoBUW+WN9bvSX/A+X4uRQH5LHW7J8O7fVu0ifcp6jB82p6lj7dJITDTVsNO+ojqGN/iuc2F0TttuIPbvvwN2haehpJg1SVTQaOv3aI7Duu/Zutb77ldmpsjwgSBhyXHpXVFJCXEBona5rZISSQAXtDS47BxK6fL9wN5s1pyLEbnYL9bqe72W40r6WuoqqISRVET2lr2PaeRBBIIX45O0RptTaP8Abh1R01oXvktliyCentzpHFz/ACUnvIOInq7uns3PtO6elUc9TMdakqetZFNt6JkreicAlwAG5PQBWCqA8QVk6R6ZX/WTtKYdphjD4Yr1kNxbSwzVBPdQN2L5JX7c+FkbXvIHMhp25rkKXQPXWsxtl6pNFs8qrM9nGyvhxCufTub+cSCLhI/n3Xz6Wah5RoX2qMW1Cs1GIcmxa698aGvicwOI3jmglbyc3iY58buhHEehCRu+QyVmr5HtLkvyPOBN0QqI8R1UyGTUeKlLoai6w0/zXUzAbhphZH3sTXHlxd7IW777O22Pgzc7dW2fI7haLlA6luNDUyU1VC7beORji17Tt+Yghe8+S/LDYC7RGokxHSvIWajS0pbDTXWan+a6aYjYOMzJO9la08+Huoy7bbdu+48Gbnca28ZJcLvcp3VVxrqmSpqpnAbySPcXPcdvzkkrDDT+8Za/mtWgfCOoWxax1C2KwioCZvtSpm+1DyIeQyyPEFvpKSrr7jDR0NLNW1cruGKCCMve8/mDRzJ/oVtUHZ41/udG2qtuhuoNwpnDdstNhlfIwj8+7YiFF1YazeRUKFK8mwPOcKqGRZlhl9xKV52Yy9Wiejc4/mAla3dRRQjFkCuik7N3aIr7XTV1DoJqNWUVRE2WnqIMIuD45WOG7XtcIdnNIIII5EFUuv2h6Veq/pv/AILW/wCGjWGc3AtUKSqt3eR+N7JcUynCsvqMezLGrriV/ga109svVvlo6qIPaHNLopWtcAWkEbjmCCuBXfn5TL8sBqB9XWv4CFdBlli7xuVpx0ajW4y3qnSN6qzsd0X1iy+zx3HE9Jsyyi3yN4mVVoxisq4nD84dHGQR/wBKBLNvUVoOoWxSfJ8EzjB66KmzTDb7iFRIdo4r3aZ6J79uuwla0lRhMxcgQhCUVgnHhCROPCECmVkeILCyPEEAOhCFKA2IQhQYwWxa1sQAIQhAHKWWzXTIcqobLZaKS43Srk7unp4hzcdtydzyAABJcSAACSQASrPzy5WvGMXi0yxcyRupJP7b69ruV0rmbAxglrXGGB4eGA7NJPFwkgSO5EQfgi0w7ytoqig1Xv1P3lBJxcL7Jb3HhMnNvmVEvDKzzTxsaesbt2uo9JznfYaSP/O1lV/6cH6v7z97rS+713eyLBbFrWxObcEzeiVM3ogBkIQgh5AgdQhTjBMEumdZRLTUssdttFHH393u9Typ6CEbkveSQCdg7Zu432JJDQ5zYbSV2VqtWnQpupUdorNn04ZjNJWd5lOTu8jwa11DPL5XA8dfJ4hRQAOaXyvA57EBjSXuIAG/x5zmVXnGb/Os9HT2ujp6dlJbbfSxhsVHTMJ7uIbAb7cRO+w5k7Bo2aOSzfOn5Fb7VjlnikteEWaMRWugdwh8pA2NTPwANdM/dziQNhxO23Jc51eKEtrKVClOpU9Irq0skvdX1Pb8ltbcdAsrA6BZTGzGb0TJW9EyABCEIEYLYtanODYNc84yaWmppY7daaOPv7tdqnlBQQjcl7ySATsHbN3G+xJIaHObDaSuzBVq06FN1KjtFZs+TFsWqMluFVJJVR2iw2+MTXe71DSYaKInYchzfI4+ayNvnPdyHLcj7soymnuVupMex2kktGG0EhfR0cjgZqmUjZ1VUuHJ8zh/1WN8xvLcnm89zCyVdgosGwij8jwi2VHfNnmYPKbnU8JYaqUkAjcEhrdhyPMABrGVePCEq162UqEamIkq9ZW92L2db/ef9K1Z3vlM32pUzfanNk8hkIQhiAmb7UqZvtUIBkIQkAZvRTvE8Er8mtVyvVRW09gxa28JuN3rQ7u2bkbsjaBvJLs7cMG25LQSC5u/34tgcFZgtVmmXXGTHsOp5AyGRkQfU3OXi5w07SQCdg4cZ3aCOhDXlvCZNmFfkPc0ELPmfGKTZttsdNK409K1vFs4g/wkp43F0rvOcXO6DYBr31I1NStOvN0sO8naUti6lscvwW3c+XyPO/K8MbhmL0XzFhUNR3ghJ3qrg4Bu0tU8HZ7iW8XC0BrfNHMMYRXreiVM3ohJJlujRp0IaMF19be9va+s9ENDPVZxb3n4qVW0ql0M9VnFvefipVbSoS5zPPvKXtGv35fmYKJ596C80+oaz7B6liiefegvNPqGs+welWZVw3SIdq4nmOmb0Spm9FsEejz0K0O9VzF/efipVbCqfQ71XMX95+KlVsKjLnM89cpe0a3flxYKPZbQ1Vz0qya20MXf1tXaamCnj4g3je+JzWjckAbkjmTspCopnnoNzP6iq/sHpVmVMPfz8LZ3XE6YfO2Had0fdY4IMyzV0HDLepmB9Da52yb70rHM/GuG24lJ281jm8nOYqtu12uN8yKru12q5K641UnHPPIebj09nIAAAADYAAAAALj0K8lY9AUcNCjJzfrSebefZ1LqVl8Rx4QsrA8IWVJcGb7UyVvtTKUI8zI8QTpB4gnQ8yDv5on6smM+8fEyq1FVeifqyYz7x8TKrUVCXOZwHlH2hW78uLBRbOvQlmP1HV/YvUpUWzr0JZj9R1f2L1CzK2H6RDtXE83FlvVc9j+LZDlVzdSY/aZ7lK3+EdGAI4twSON7tms34XbcRG5Gw3KmotWn2Ine+XL6f3kf+brNUGKgZ/y6rbifu1wcO7HJzC1yvNo7xVxNOnPQXrS3LW/jsXa2l1nabRb1Z8a94+JlVpKA6YXT560Nsdz+bqG099337kttP3NPHwzvb5rNztvtuefUkqfKlLnM4bjm3jaras9KXFgovnHoVzD6kq/sXKUKL5x6Fcw+pKv7FyhZmHD9Ih2riecaEIV89BjN6JkreiZAm0yPEE6QeIJ0AwWxa1sQQd6tG/Vvxz3j4mRWcqx0b9W/HPePiZFZyoy5zOEcodPrd6XFgozmvoay36lqvsXKTKM5r6Gst+par7FyhZlbD/bw7VxPPFZHiCwsjxBX2d8HQhCEB347X35O3UP3D+sKdeIa9vO19+Tt1D9w/rCnXiGuZ+QHsep/Ef5YHoHyi6bHurixm9EyVvRMuqHyQIQhAjzAdQrB0t09vWrHaMwnTbHmk3fI7xBb4H8PEIRI8B0rh/esbxPd/wAVpVfDqF7NfI/6KOvuv+b683S3uqLfidEbVYfNH4yvqWbzOYSQOKOn8w7kD91BLOWjG5MVd2Ob+Up1sGj2pvZ37P8ApFWfNNHpTBQX7gjduIquBrY7fG/bbdzImPkd/fCpBXuRpVqHZtWezdhGpWPuBtOSWaC4Qs4uIwmRgL4nH++Y/iY7+dpX5wNZew1289ZO1RnuqF80Uc2vyO8zVohdmVld5PETtDAD5Z0jiDIx/MwL1v8Ak4dOu0Fo32R79pXrphEmK01pu5qsWqHXqhrWy09Tu+aACmnk4OCZrpPO238oO2+x2pTUdBWessRb0nqPN/5XzRL6LdqjFNbbRR8FpzOi8gvL2N5NuNKwNY5x9hkp+7AH/wCLvK8fG9F+wPts6Jfh7+Tg1BwujpPK8mo6X54xwBu7/LqUGRjGfzys7yDf80xX4/QCNweR3VilK8LbjDVVmdieyN+VI7PP/OFafi41+yhfjX7I35Ujs8/84Vp+LjX7KFhr5oejkz8ePbY/Ky6//wCGNV/+cF7M/JHaG5Rp72Zs61Qyy2T2d+dVNI2yUtVGWSvoaVspbUcJ5hsr6h3Dv1bGHDzXAmmtde3dolpV2+NSMerOxDg+W5bYchmp6jLpqyihrq+Zh51DnG2PeHk8+cjj/Ooxkvyz2a1dkliw3QqyY/XkERT3fIprjGzlyJZHDTk//XBPLTlBJIRaEZXbPWnte6zY/ob8n/qLlt4rooLnU2ie24/SueBJWV9RE6OFjW77uDSe8dt0Yx59i/HvbrfXXfIKC1WylkrrlW1DKekpoW8T5pXuDWMaPaSSAB/Orc1t7QerPaG1KjyfVTK579UwNcy30LGiGit7Hbbtggb5rN9m7u5udwjic4hdtvkvtE/wqfKS23K7nSeUYxp9Ti91Je3djqwngoo/5nCTimH/APTlNGPmoNsWUvOSSR2g7dt0pOzD8ktoV2QcZrWxX65U0dxymWlfsZGwSd9K8+3aaueXsPPYU5H5l6tdkTWhmvfyfGnWoU9S2e/y28UOQAHzm3Cn/FTkj2cZaJQP72Vq8dO2N2Ru2r2hvlBc61Ct+j8lRiwnbbcZ7zLLQza30+7InhrqsOZ3h45i1wBDpXAgdF28+TQ0V7TfZ8qtRcG1h08kxrA7u2K62qs+f7dWMgr2bRSx93T1EjwZYjGeIt4R5OBuCRvhko+bz1mSLl5zLUVj8sHon84ae4Dr5aKTiqrTL9H8hexu5NNK50lLI78wZKZWE+0zsHsXgYv2q606Y2rWbspZ7pfeeBtHkVnlpGTPbxCnm24oJgPaY5WxyD+dgX4wshsN1xbPb3jF9pH0F7tFfNQ3Clk8UM8LzHIw/wA4c0j/AKFloyvG24xVo2lfee53yMuJ0jMM1xzqSJr66att9pp5COccbGSzSAH8zjJET/yAvXDW28z452M9XMhpnmOpteF3StieDza6KjleD/2tXlB8jLkNLNo7rhineAVtJeaC48BPNzJoZY9x+fY0/P8ANuPzr1V17tk167DGtFmp2l9RX4Jd6aJoHMukoZWAf9pVep9qWKf2eo/FuhCFsTWMEzeiVM3ogUZZb1WFlvVBDyHX7N+zx6gOhv8AzfWb4CFfjIX7N+zx6gOhv/N9ZvgIVUr5IuYbNniZ8sb63ekv+B8vxcigfyWGiGT5h29rfq9JbZ6fB8Kp6lzrjJGRDVVs9O+njp2O/jOa2Z0rtt+EMbvtxt39Be3t2l9KtDdecFs+fdl7FNd7lX2J9XSXXIJKVstAwTuZ3LO+oqg8JILuTmjc9PausEXywjbLh0FmwzszWnGKSmi4KOmZlm9LAPYGwxUUQA39gIUR03TskTJU1V0pM91r3e7RjeH3TIL/AHKns9kt1K+qr66rlEcVPExpc973HkAACSV+XWg7dmcac/KRa5a4aY2OxXNmb10sMMOS0dRKI6JkwNOQ2GeItk4I4+LckdRsoR2iO3Brt2kra6x5beabHsJ70SfRnH4nU9JKWkFpmLnOknIIBAe4tDhuGtK6gJ6dLRXrGOrW0mtHYftJ0YzK6ai9kHSzUC9wUtLeclxG3XevhoWOZTxzVNLHM9sbXOc4MDnkAOc47bbk9V0s7T1XoZ2d+1NUdrLWC2jMssltNJYdPcahjZJKJ4DLLPVND/NaR3rB3p37sDlu6RoXafstfkzuz1/zbWP+r4V4g/K8ZJXXH5QjDMafM75rs+EQywQk+a2aoqqgyvH85bHCP+oFXhG87FupLRp3PR7sofKJYh2mtd6rTeswKr07yh9HLV2lsl3bcIK9kQ3kZxiKIskDd3hvCQWtd5wIAPSDTztiamaRfK4aiaCY3Y8YrsPzDtG1oudZc6Kpkr4vLbnHSS909lQyNu0cYLeKN2ztydxyXkHjOU5Nhea0eSYdkd0xPIqUPFLdLNXy0dVBxsLH8EsbmvbxNc5p2PMOIPIq4uz7dbpfflQtEL3e7lVXm81+qNmqa6vrqh09RVTPucLnySSPJc97nEkuJJJJJVjzcU2UvPSlZbT9iC/KLYu0fnHZg+VE12z3AbVYrveLhe71aJocgpp5oGwyXMTFzRDNE4P4qdgBLiNi7l0I/V0vxi65eutrB/hvdfjZVgpJO9zPiW46LR+ufRHVC260dkvAdULWI44MgtEdTPBG7dtPUDzKiHf/APBytkZ/1V5MfKwaw6rY6KDRips1gk0ly2hguVBdRRVAuTamlnBmgMnf90eF3dO/gvDK0b7jdch8kJrP5dg2f6EXWr4qm2y/SCwMe7cmCQtiqo2/mDJO5eB+eZ5Xaf5SjRn8K3ybN9vlupO/ybBZvn+iLG7vdTsaW1ke/wDe9yTKR7TA1RFKFWzHk3UoXWZ4IdlHW/UvQvtW0940lsFlyXM8loxjVLQXymnmhkNVVQOaGthmidxmSGNoJcRs53LoR7W9uXtx5x2Y8i08wTDbbiuR51crM6vyd10oql9LTsJEURgjjqGObxyMqDs97iGsb133XnX8l1pDBm/burdTL7ExuKac211yknn2EQrZQ6On4ieQ4Wiebf2GFq6ldpjV6fXTtzai6lOle+23K6Ojs7H7juqGECKmbt/FPdsa5w/vnOPtViUVKfYUVOVOjqeZ6ddj7tE6PdnH5F3Ks1lq8TrtYoLpVikx7y6mjvVyL5I46cSMB78wNLuMnbYMY4hdUKj5Tntf1GauukWdWqioTLxizw4xRGlaN9+AOfG6bb2fwu/8629lb5PTUntH4TT53dL3BpzpvPI5lHc6qkdU1dx4HcLzTwBzAWAhze8e9o3Hmh2x27Yak9gzsM6B2y2DW/tDZfYbjWxl9NT00tN387QdjI2miop5eDfccWxG4233Ufs03fWx/wBs4JrUl8D0V7KmuFp7XnYLjybLsXtclb5ZNZspsstOKigkqI2seS2OXi3jfHLE/hdvsXFu7uHc+KvyjPZWx7s96/4/lOn9Ibfp7mLJ3w20OLmWyshLTLCwnmInNkY9gJO34xo5NC9huwjjvZ0xrszZXRdmnPr9qFh0mTvluVdkFO+KaGsNNAHRtDqWmPD3YidvwHm4+d7B11+V+p4ndhfTaqLd5o87ZG135muoakkf9rG/9ixQdqllkWKsdLD3lraPIDs19qzUPss5LlV10+s2O3iov9LDT1jchpKiZrGxOc5pjEM8RBJed9yfZ0X6wMKvVVkejeJZDXRxRVt0s1LW1DIGkRtfLC17g0Ekhu7jtuSdvaV+KVftD0q9V/Tf/Ba3/DRqayWpmLCSbuth5Vdr/wCUN1p7P/bwyjS/DcYwm52C20lHLBUXq3VktU4zU0cruJ0VXG0gOeQNmjlt16rx1111ryrtB9o26an5nb7VbL/X08EE1PZYJYqZrYYxG0tbLJI7cho33cef5l2Z+Uy/LAagfV1r+AhXTjTqy0uSdoLBMdrgDRXTIaKiqNzy4JahjHf+xxWeEYqNynWnOVRxb1XPe3sEdhbDML0SxvWHVfHabJdRb5Sx3C12+5wCWnsdM8B8O0TgWmoc0te57huzcNaGlrnOinyhHbf1T0V7Rlk0p0culJjlXTWmK43y6yW6Crlc+Vzu7p2Mma9jWhjQ8nh4j3gALeE7+wzGMihZHGxscbGhrWtGwaB0AC8bO138nlrfr/29Mv1QxLKsJt2O3KnooqOmvNyrYqqMQ0kUL+JsdJI0bvY8jZ55Eb7HkKsZKU7yNlUhKFHRpZnb3sj6vUXbD+TrNw1Rxyz324w3CeyZPQT0LJKOsljYyRsvcv3DeKOaMkdA/i4dhsB4u9vrsnUfZt7QNtu+GRy/guysSy2iKWR0jrbUR7Gakc88y0B7XRuceItJB3LC4+yPYQ7M2oXZg0LzXFNQLzYLxU3a/NuFG7H6ueaJje4ZG4PM0MRDiWDoCNvao78p/itLkHyTuSXiaLjqMavluuVM7bm1z5xRu/6OGqd/7FKko1LLISpTc8PeXOR+ZZCEK4aJgnHhCROPCECmVkeILCyPEEAOhCFKA2IQhQYwWxa1sQAK4MCx+12TF5tTs7sslxxWmk7izUDjwi71/MtYQWkGFoZIXuOzd28IEmzozEsEwuszrOTaqetprVRU9M+sudxq5A2KipmEd5KdyN9uIADccyNy1u7h9uoWY0eV5DQ01itfzBiNopvJLLbA8nu4+IudK8bkd7ITu9w5nZoJeRxFHrdkajEyliKnotN22za2LYk9jl+Cu9TsRO8Xm6ZDlVber1WyXG6VcneVFRKebjtsBsOQAAADQAAAAAAAFx6QeIJ05slGMEoxVkgWxa1sQSCZvRKmb0QAyEIQQ8jmcesVwyfN7Xj9qj7yvr6hsMW7XFrNzze7hBIa0bucQDs0E+xT7ObvY7FaRp9gly8usMXA++3VkYa681bSefECeKCPl3bB5vFxO888Mh5+8Sv0g04rcLjpqOXPr/R/v/XsLZTbaOVuwoWncjvHAF73bAbPbtx7Me2iR1CRes7mkpXxtRVn9muavefvdi+74t1tiEITm4HHQLKwOgWUAM3omSt6JkACELkrPZ7nf8mo7NZqOS4XOrk7uCCIc3HqeZ5AAAkuOwABJIAJQY5yjBOUnZI+zHMbueU5My2WxkbXCN01TU1End09HC3m+aZ55MjaOZJ/mA3JAMtyXK6SmwpuA4dU1H0ShqDPW1coLJLzU7NBmczf8XEOBvBF7A0Ofu/w8rnF8xmxYT+DjBJPL6BlQya/ZAHFrrvOwEBjQDsYGEktB3BcARvsZJKjSrXrZqqSeLarVFaK1xT/ADPr3LZm9eQnHhCROPCEyNqZTN9qVM32oIeQyEIQxATN9qVM32qEAysu0YdT2XG6PMc9p5KbH5o+8tVrbMGVV6f7Gt286KEcnPlIHmubwbl7SORxWyY3itqpsw1Cj8qdJT+U2DGeE95cuYDZpuREcG/McX8IGuIDmt4XwXKsqvWZZnU32+1PlFZL5rGNBEcEYJ4Y427+a0bnl1JJJJJJOLPI1MqlXFVHTpaoLOW/qj/eWzJa9cXyLKr1lN0bUXSp/c8W7aKggBZS0MezWiOGLpG0NY0bDmeEEknmo8lb0TLNkX4whTioQVkgTN6JUzeijaOeiGhnqs4t7z8VKraVS6Geqzi3vPxUqtpa+XOZ525S9o1+/L8zBRPPvQXmn1DWfYPUsUTz70F5p9Q1n2D0qzKuG6RDtXE8x0zeiVSnF8QvmW1tVHaYIxTUjBLX11TM2Gmo49+ckj3cgAA52w3cQ1xAOxV+9j0XUqQpQc5uyW1nePQ71XMX95+KlVsKBaY0tjotC7BS45dJL1aI45BFWyQuiMzu9eZDwOALRx8YAPQAcz1M9VGXOZ57x8lPHVZLbKWep5vNbAUUzz0G5n9RVf2D1K1FM89BuZ/UVX9g9CzRgw3SIdq4nmchCFePRZ2EwfQr6ZaXWvJPpT82+Wd5+5/m3veDgldH4u9bvvw79B1Us/sY/wD13/7n/wDGVq6H+q9jHvPxUqtdVXOSbOPY3lzlSljKtOFSyjKSWqOSb6jqoOzJt/8Abt/3P/4y4u/dnj5kwe83n6X+U+QUM1V3PzVwd53bC/h3707b7bb7Fdv1Fc79CGZfUdX9g9QpyuV6PLvKs60Yyqam1sjv7DzWHiCdIPEE6uPM7Kd/NE/Vkxn3j4mVWoqr0T9WTGfePiZVaioS5zOA8o+0K3flxYLgMrmpafS7JZ62k+cKKO1VD6il70x9+wROLmcQ5t3G43HMb7rn1Fs69CWY/UdX9i9QsyrQV68F1ridEMgz3IchtjbY+SCz2Fn8HZ7VCKajbuQ4+Y3xbvbx+cXbOJI23UMb1WFlvVXkkjv9OlTox0aasuo786LerPjXvHxMqtJVbot6s+Ne8fEyq0lSlzmcJ5Q6fW78uLBRfOPQrmH1JV/YuUoUXzj0K5h9SVf2LlCzK+H6RDtXE840IQr56DL7wrRL6XaZ23IvpN83+V95+5/m7vODgkdH4u8G+/Dv09qlP9jd/wCuf/dH/jKz9F/Vpxr3j4mVWiqrnJNnIsZy1ylSxlSEKlkpNLVHJN9R1fHZu2P+7P8A7o/8Zcbe9AvmbC7vd/pZ5T5DRS1PdfNfD3ndsLuHfvTtvttvsV2yUYzf0MZf9S1X2LlCnK5ho8ucqTrRjKpqbWyO/sPOpbFrWxWzr53q0b9W/HPePiZFZyrHRv1b8c94+JkVnKjLnM4Ryh0+t3pcWCjOa+hrLfqWq+xcpMuCyjyL8GmRfOPffN/zZUeVeTbd73fdu4uDi5cW2+2/LdQsyrQdq0X1riedC++3Wu53audTWq3VVzqGsL3RUlO6VwaCAXENBO25A3/nCn306xu3/wC5/TWy03ef7Y+d5JLlxbeHg4y3g6u32335fmXw1+qWf3OkZT1OT1UcbX8YNI1lM7fYjm6JrSRz6E7dPzBXbvcdt87i582mo956/lHSX4o+yDSnMvI4a250lLj1rewPfXXWujhihDh5veDcvaSSG7Fu4JAO3NbfoVidD+Jvupdsp6s+cxtqo5bhEWdATIzYB24Pm7bgbH2quJ55qmsmqamZ9RUSvL5ZZHlznuJ3LiTzJJ5klakWe8jzOKnzqtu7FL82kd+O19+Tt1D9w/rCnXiGvbztffk7dQ/cP6wp14hrmvkB7HqfxH+WB6S8oumx7q4sZvRMlb0TLqh8kCEIQI8xmNc+VrGNLnuIDWgbkn8y92u0Le752HPkItGNFMOvlfhur+aVQuN9uNorX0ldTOHBU1pbNGQ9rmvfS0oII4o2uH5wvP8A7Iup3Y/0yfcb32jtKMo1CzGivdLX4rWWKTeCiEPnkSxOrqeOT8YGnheyRpAIPIkHvBrv21fk8O0Peo8h1L0P1QybK6Gzvt9nq5Zm0kVK3d72/iqe7sZ/CPJLiwuI2B3AAGCd3JK2oyRslmeX39lL2nP+EZqf+31y/wBOr27NHbT1qwft0aaX/UPWjNsrwNt4jpsgt1/yysraM0k4MMkropZXNJiEnetO3J0YXRJdiuzTkfZxxjXC7V/adwG/ai4JJYpIbfbseqHw1EVeZ4XMmcW1dMeARNnaRxnm9vmnq3I0rZCJu5+y0EOaHNIII3BHtX5IO35ol+A35TLOrPQUfkuK5DL9IcfDW7MbBVOc6SNo6ARztmjA/vWNPtXrXZ/leOyvYcStdjtmBapxW23UkdJSMlttBM9sUbAxgdJJcXPedgN3OJcepJPNUtrR27Pk8O0PX4/V6waE6l5dVWSOaO2TCKGifCyUtL2l1NdYy8EsaQH77c9tuI71KanCWRmm4yjmeWvZG/Kkdnn/AJwrT8XGv2UL8x3Z313+Ty0swjTXI8z0Kz+6a3Y3UMrqjIbXVudTOrIpzJDKyJ11jjIaBH5roQ0lp3B9vof/AOWL7Mv/AN42p/8AiW2/6wTVVKb1Iim4xWtnin22Pysuv/8AhjVf/nBdX29F7D5x2kfksdRtVshznMOzdqdeMrvdY+sudd5c+Hv5n+J/BFemsbv+ZrQP5l48N6KzBu1rFeS15jL3FwiSr7GH/wCzT3bO6WpmsGrertTH81VUEhhqqZlUwtpnRvbs5pjo2TVDHDm2SYcxyK80uzNlHZgxfUHJantQ6c5FqPjs1vYyy0uO1L4ZKepEgLnvLaym3aWbjxO5+z2r071c7d/ye2uuLYrY9UdD9Tsjs2Nte2yUULYqCGkD2sYdm0t2jDtmxsaOLfhAIbtud8c7tpW1Dwsle55SDtRdpnh9YrU79vbl/plKMK7YfaRxPWHFsnrNb9QMko7TdqesqLRdMzr6ilr445GvfBLG+Utcx7QWkEHkVQOVVGPVeqGSVeJUM9rxSa61ElloqpxdLT0jpXGGN5LnkubGWgnidzB849VO9DbvpDYe1DjN113xa6ZppVAKn56s1mldHV1PFTStg4HNngI4ZzE8/jW+a09fCcrStkYLu+Z+zPGMjtOYabY/ltgqRW2O9W2C4W+ob0lgmjbJG7/pa4Ffm5+VZ0T/AAd9vym1HtdJ3OOahUPljyxuzGXGANiqm/8AWaYJSfa6V/5l3WwL5UzsfaZ6QWHA8J011StGKWWn8ntlFJR0dUYIuIuDO8muT5HAFx24nHYbAbAACIax/KHdg7X/AAO24zq5oxqVl1mt9eK6ihNJTUj4ZuB0fEJKe6Rv2LXuBbxcJ5EgkAilCM4SvYtzlCcbX1nnJ2Ee0ZTdm7t42jIr/M+PA77TmzZMWgu7iCR7XMqeEde6kaxx2BPB3gHMr9Y9PU22+YzBV0lRT3az19MJIZ4ZGywVMMjdw5rhuHNc0ggjcEFfiZ1BrMNuOu2ZV+ndpqrDgNTe6qXHLbXPLqijoXTONPFITJIS9sZa0kyP5g+c7qe6HZX+UI1a7NlopsRrKePUfTCN+8VguVS6KagBO7vJKgBxjBPMxua9m++waXEnNUpuetZmKnUUdTyOu3aQ0YvWgXbLzfTS70ssNLQXB8llqJGnatt8ji6mnaejt2bB22+z2vaebSqNXv3n3bL+Tz7VmndvtuvGN5BjNyo2nyOurLPKau3ud4u4qaJ0jiwkA8L28LtgSzcDbrTFiPyRuMXkXl2qWo+okMbg/wCY30lVFFL7eDiFDTP29n8KP6U6m7a07mOUFfU1Y+D5Njsb4jr9c85z3WPEpb/ppboG220U766po21dwc5r5JGyU8kb3CGNoaRxcJM46lvLpn2qafR+39uzPLFoTYorFptZqsW2gEVxqKxtVLC0MqJxJPJI5zXTCThIdwljWkDmu6WvnyksV07Pf4E+y7gjtHdN20bqF1we2OKvNM7cOigiiJZT8e7uKTjfI7iJ3adyfKVvRTFSb0mJNwUVGPzGWW9VhZb1WUwPIdfs37PHqA6G/wDN9ZvgIV+YXsz5j2OcXxXKoe1BpRlWo12nq4XWGfHaySFlLCGuErZOCvptyXFpG4d0PML1qx35WLspYpgFixawaeam0Fis9vht9tpfmugk7mCGMRxs4n3Euds1rRu4knbmSVVqqUtSRcoOMNbZ1c+WN9bvSX/A+X4uReP69ttY+2v8ndr/AJfaL9q5oXqblt2tlGaShn4mUfdQl5eW8NPdo2u84k7kE/zrye1tu2k197TuT3XQ3GLnhulk5p/mSz3iV0lXTcNNE2bjc6ecninEzx+NdycOnhD07pWaMNazlpJlVIQuwnZuyPs6YzrPeK7tMYFfdQ8Jksr4rdb8fqHxTxVxmiLJXFtVTHgETZm7cZ5uHmnqMzdkV0rux+pnstfkzuz1/wA21j/q+FeDnysv5Uyj/wACKD7apXebFflWOydhemWPYdjOnWplsxyxW2C22qk+bKGXyengjbHFHxvuLnu4WNaOJzi47bkk81Q+rPa9+Tf1y1TZmuqWgmpmUZMyhjom1neik2hjLnMZwU93jZyL3c+HfnzPRUoKUZ3aNjUlCdPRTR4uDxBXf2aPyjnZ/wD+cix/1jAqQHiC77dk3Vvsa6VYnb79rhpPmGYau2fLG3ewXywVDhT0kUIgfTNMZuEDHPZPHK8h0TgQ4Alw80WpFCCvLM/Uyvxi65eutrB/hvdfjZV7zf8AlfOzX/8AeRqZ/ia2/f15V9qzVHsb6lYmLtoFpRl2E6mXDJ33LILvkFS50FXBKyZ0zWs8vqGNe6Z8b/NjaAGkAgeaa1OMovWi3iJQnFWeRTXZd1gm0K7d+nWpHfPjtVDc2wXpjNz3lBOO5qRt/GIje57R/fMafYv2ATRW+845LBMyG5Wqupix7TtJFURSN2I/M5rmn+ggr8QA6he5/Z2+VL0v0+7GGA4JqljWbXjMcftots1fZaCjnp6iCEllO7ilqo38QhEbXbt5uaTud01SDlrQmHqKN4yJLrZiNo7BHyLupGBY/c2VGYalZZW2+iq2OPeiime5jdyfO8ygiDXEcmzTnYnfc+CLfau8nbs7WVq7VGvWLXDEKC72fA8etLoLfRXuKKOodUyv4qiZzYpJGgODIWDZx5R78t9l0bb7Vlgmo682Vq0lKVo5I/aLpLa7TZOyzptZ7DHHHZaLF6CChbEPN7ptMwMI/pGx39q/N58ptTZDB8r7nUt7bOLdUWy2SWIyg8BpBRRNd3e/8XyhtRvt/G4l257HXymGFYZ2esd0r14huVA/H6RlDaMooaV1XFLSRjhijqI2/jGvjaAwOY14c1o3AI3d2C1h7f3YQveJwV11sdLrvdqFrnWy3VWDGQwyH80lwhY2IEgbubueXIO6KtFThPK5fnKnVpW0rG75JnF73Yvk5Mhu92oJaGjv+Z1FZanSsLfKadlNTwmVu/VpkjlaD+dhXA/K+eoPp3/h/F8BVqp9F/lXsOtNny9+r+H5DDNU3rixmz4fbaSWgs9sZTxRxUwdLUQuLw5kjnHh2PFy4RsxvI6v/KDdhvXrAbdi+rGkOpeV2KguAr6Wm7inpO7nEb4w/ip7nG4+bI8bEkc+m4CLS85pWF06ToaCkeE6/Z/pLKybsraZzROD45MUtzmOHtBpYyCvx1Z1V4nX63ZjXYFbKmyYLU3yrmxy3Vry6ekoHTvNNDIS+Ql7IixpJe/mD5zup9pOyP8AKY6aYn2X8S0y1tp7tZbpjdBHbaK/0NEaylqqWIcEPeMYe9ZI2MNYdmvDuHi3BOyyVYuSVivhpxhJqTOl/wApm1w+V+z4kbB1ttZH848hiH/6FRWaaDa5dnej0/1Iz7DG4zb7hXw1eP1El2o6nymSMNnbvHBM97Btwk8TW9duvJeomumpPyY2tvaBtmrmaah5LeMio6eGGqtFns1wgp7qyEksZO2WkHsPCSyWPcAAn2rov23+1xB2o9X8cjxmy1WO6dYvTyw2WlreBtTUSSlnezyNYS1m4jja1gc7hDSd/OIDRcrJWMVWMFKUr676rH6cMFzKyah6NYvnWN1Iq7FfrZDcKKQHc8ErA4NP5nDfhI6ggg8wvzj/ACo2L11i+VYvV6qIHso8jsFvr6SUt814jhFI4A/nDqc7jrzH5wuI7H/b3zLs0W04VfrS/O9K5ah0zLYKjuqu1yPO730z3Agtcd3GF2zS7mHMJcXd/dWe1L8nb2qtMLXbtXrtfcbraFz322rmsNXHcrc54HGGS0sc8ZDthux3GwloO24BGJRlTle2otTqQr0rXs+s8CYIJqmuhpqaF9RUSyBkUUbC573E7BoA5kk8gAu+Hai7E8HZg7NuB5fftVGX3L8kqY4BirceFMabaDval3f+Uv42xPMce4jHEZGnzeivDFs/+TY7OWbQZzp5R51rxm9vf31jF7hEVNRzjmyT8ZDTtaQejzFK5p2c0bgEdHO0b2i867S2v0ub5m6OipoIjTWWy0jiaa2U/ETwN35ueTzfIebj7AA1rc7cpPVqRQcacIO7u+rYUChCE5UYJx4QkTjwhAplZHiCwsjxBADoQhSgNiEIUGMF9VNTVFZcaejo6eSqq55GxwQQsL3yPcdmta0cySSAAOq+VXvhMMWnWks2qlwZxX+4d7QYXFFVs4o5CySOesfGQeJkfhAIILjs5oDmPEN2RSxWI9HpXiryeqK3t5L+73JN7D4stuEWC6XnS20TU1TX1vdVeY1jWMfIypaQW29r2gjggLQSQ9273O2LPPYaZW6pqaisuNRWVlRJVVc8jpJ55nl75HuO7nOceZJJJJPVaUJWJw1BUKdnrk9cnvbzf9luSS2GR4gnSDxBOpLLBbFrWxBAJm9EqZvRADK6caoKfTrThmf5HbJHZFc43NwinkaCI3hvnV8jHNLdo+OMxh2/ETuG7cMjeA0/xKkuPl2X5XS1A09sfn3WaElr6mQ7COmi2HnOe90YdsWhrXbl7N2kxrLcmq8tzequ1S3yam/grfQtI7qgpmkiKnjDWtaGsby5NG53JG5KR63Y09dvF1Xh48xc98Idrzl+67feuuAqamorLhPV1c8lVVzyOkmmmeXvke47uc5x5kkkkk9VpHUIQOoTmzSSVkbEIQgkcdAsrA6BZQAzeiZK3omQBup6eorLhBSUkElVVTyNjhhhYXvke47Na1o5kkkAAK5ssksmm+E1WCY7X/OOY1f4vK7zSuAjjj2PFb4iRxcPFsZCOEkt4Xb7mOM/e/SzTP8A+iItWrtT/wDFa/HaV5/6S2eWP/kyMbJ/EI/GUmk5z6jSdOqKf/Ti9X77W3up5e89eSVxbFrWxObcE48ISJx4QhAZTN9qVM32oIeQyEIQxAVm2e0W3Esao8ty2jjr6+qj73HsenHKqHsq6kdRTgjzWcjMR7GAk4tFotuI41R5bltHHX19VH3uPY9OOVUPZV1I6inBHms5GYj2MBJg11u9yv2S1t4vFZJX3Kqk4555Tzceg5DkAAAABsAAAAAAFjWs1spSxUnCDtBZvf1L+7+C13aa73e5X7JKy8Xiskr7lVScc88p5uPQchyAAAAA2AAAAAAC45CEGwjGMYqMVZIZvRMlb0TLIQ8wTN6JUzeijaQeiGhnqs4t7z8VKraVS6Geqzi3vPxUqtpa+XOZ525S9o1+/L8zBRPPvQXmn1DWfYPUsUey6alp9KMnqK6j+caKK01L6ik70x9+wROLmcY5t4huNxzG+6VZlTDu1eDz1riefOPYU+pxxuWZNLJZMIjkc19Y3h7+te3/AHimjJ3e9x3AcRwN4XknzCE2U5my4wS2HFqSTGcIjkcYLXFM4mpJcHGWocXEyPJa3YOLgwNa1vTiPD5Pl98y2vpZLtPGKWkjMVBQ00LYaajj35RxsbyAADW7ndxDWgk7BRpvRXktd2d/p0KlSaq4jNZJZL9ZdfyS139CtDvVcxf3n4qVWwqn0O9VzF/efipVbCpy5zOF8pe0a3flxYKKZ56Dcz+oqv7B6laimeeg3M/qKr+weoWaKuG6RDtXE8zkIQrx6LPQXQ/1XsY95+KlVrqqND/Vexj3n4qVWuqMuczz7yj7Qrd+XFgornfoQzL6jq/sHqVKP5ZQ1Vz0sya20MXf1tXaqiCnj4g3je+JzWjckAbkjmTsoWZVoNKvBveuJ5mDxBWFZsArqiyR37Jqr6H4o7YNudZTue6ZzmgsbDCCHy8QcDxAcPC15383Zc7I7BtPoHQQModRsv8Axb/KJWd5aKMOYeNgAf8Auh3PqQAN2nzXMc017f8AIr1lGQuut+uElxrjG2MSPAaGtb0a1rQGtHU7ADmSepJV5tt6juqq18T9l6sPea1vup8ZeFo7+aaSWGXRCwuxiCrprII5G07K4gzkiV4e5+xI3c8OdyO3PkAOQnSqvRP1ZMZ94+JlVqKlLNnEcdHQxtWN72lLPPNgotnXoSzH6jq/sXqUqLZ16Esx+o6v7F6hZmHD9Ih2riebiy3qsLLeqvnoR5nfnRb1Z8a94+JlVpKrdFvVnxr3j4mVWkqMuczgfKHT63flxYKL5x6Fcw+pKv7FylCi+cehXMPqSr+xcoWZXw/SIdq4nnGhCFfPQZ3z0X9WnGvePiZVaKq7Rf1aca94+JlVoqjLnM4Jyh0+t35cWCjGb+hjL/qWq+xcpOuBymq8i0yyOt8ngq/J7XUS9xUx8cUvDE48L2+1p22I9oJULMq0LqvC29cTz6s2PX3Ia009ktNVc5A9jHmCEuZEXnZvG7wsB2PNxA5H8xVh/gt+aKTv84yu14jvB3go+Pyus5ycDT3LDzadieJrnbbcx124O46nZfWUTaKhrmY1a43h8NDY4RRxRHY78JZ5+xJc4guIJO/sG0DV31mdu0cdVeuSgur1n83qXyfbv7+6aRWmDROywWOrnr7ZH3zIqmoi7t0xEzw94b/FaXcRaDzDSN+e6narHRv1b8c94+JkVnKnLnM4zjlo42qr3tKXFgozmvoay36lqvsXKTKM5r6Gst+par7FyhZmDD/bw7VxPPFZHiCwsjxBX2d8HQhCEB347X35O3UP3D+sKdeIa9vO19+Tt1D9w/rCnXiGuZ+QHsep/Ef5YHoHyi6bHurixm9EyVvRMuqHyQIQhAjzAdQti1jqFsUkAnHQJE46BQBlM3olTN6IIeQyEIQICZvRKmb0QAyEIQA48IWVgeELKDGxm+1Mlb7UyABbFrWxBAIQhBDBM3olTN6IFGWW9VhZb1QQ8h0IQghAti1rYlQMEIQmFGb0TJW9EyAMjxBOkHiCdRtAEIQoYrAdQti1jqFsUoUEzfalTN9qHkQ8hlkeILCyPEEbAY6EIUIQEIQlAZvRMlb0TJtgm0y3qnSN6p0oPMB1C2LWOoWxMyAQhCUVgnHhCROPCECmVkeILCyPEEAOhCFKA2IQt1NTVFZcaejo6eSrq55GxwQQsL3yPcdmta0cySSAAOZKgxNpK7J1p1hP0yzCc3GSpoMTtdM+tv8Ac4IePySnYxzzt/x3cJa0AOPV3C4NISaiZk/N9Sp7nHTx0NnpoxRWWjipmwilo43O7qPhaSAdiSeZAJIGzQAJhqDU0GD6f02k9jqKKtr2yNqsvu1C+Teqq2ufwUhJ5OjhBHLmC8A8Mbw8Glki1u5p8MniqvpcssoLq2y7ZbP3bbWwQhCc3JkeIJ0g8QToEYLYta2IIBSjEMSvmbZtS2CwUvlFZL5z3vJEVPGNuKWR2x4Wjcc+pJAAJIBi6vLKIYtLdMIcJpmdxn94pxNlNdBVsk8mpnlxZb2lo3bxDgfIARxcvOkY4cKt7Ea/FV509GlS+0nl1Wzk+pfi2ltI3qBk1jrPIcUwhtRSYNav4ETEB9xqeYfWyjhBLnDZreLwtHIMDiwVqhClKyM9GjDD0lTj83m3tb63tBA6hCB1CkymxCEIAcdAsrA6BZQAzeiuLE46TTi00ud5FQU9ffaqn7zFLNVNJdxEjhuEoBHDE3YiMHzpHHibwhokHC4Ni9pq8evWZZZN3OLWfZraUvfE+71Tml0dJHIGnbfhBeW7ua0g7AEvbHcsyy95rm1Vfr9VeUVkvmsY0ERwRgnhjjbueFo3PLqSSSSSSUevUamq3i6jw8eYue/x0V2rnPYtS1vVwNRUVFZcJ6urnkqqqeR0k00zy98j3HdznOPMkkkklaUITmzslqQLYta2IIBOPCEiceEIQGUzfalTN9qCHkMrRtVgpMPwu3Zvl9s8tlruI41ZKiM93WFoBNTUf/gG8TSI9+KUkdGbk7sItGO2TGpc/wA6o5Ky2xScFgs7gALzUN34t99z3MR4eM8JaS7bdxBjdC8qyq9ZnmlTfb7U+UVkvmsY0ERwRgnhjjbv5rRueXUkkkkkko9eo0051MVWdKGqC5z3v3Y/5nsyWu7XG3e73K/ZLWXi8VklfcqqTjnnlPNx6DkOQAAAAGwAAAAAAXwN9qVM32qVkbSMYxioxVkhkIQlGGb0TJW9EyyCPMEzeiVM3oo2kHohoZ6rOLe8/FSq2lUuhnqs4t7z8VKraWvlzmeduUvaNfvy/MwUTz70F5p9Q1n2D1LFE8+9BeafUNZ9g9KsyrhukQ7VxPMdM3olTN6LYI9HnoVod6rmL+8/FSq2FU+h3quYv7z8VKrYVGXOZ565S9o1u/LiwUUzz0G5n9RVf2D1K1FM89BuZ/UVX9g9Qs0VcN0iHauJ5nIQhXj0Weguh/qvYx7z8VKrXVUaH+q9jHvPxUqtdUZc5nn3lH2hW78uLBRXO/QhmX1HV/YPUqUVzv0IZl9R1f2D0LNFbD9Ih2rieaw8QTpB4gnV95noc7+aJ+rJjPvHxMqtRVXon6smM+8fEyq1FQlzmcB5R9oVu/LiwUWzr0JZj9R1f2L1KVFs69CWY/UdX9i9Qsyth+kQ7VxPNxZb1WFlvVXz0I8zvzot6s+Ne8fEyq0lVui3qz417x8TKrSVGXOZwPlDp9bvy4sFF849CuYfUlX9i5ShcDlVL5dphklF5RBR+UWuoi7+pk4IouKJw4nu9jRvuT7ACoWZWoNKvBveuJ5srnrBi+QZTc3UlgtU9ylb/COjAEce4JHG92zWb8LtuIjcjYblTicacYZWzNppH6kXqJ5ET5YzTWyEg8iWgl05DmcwD3b2P67jdRy/5/lOR2xturrj5PZ2ebDbKKJtPTRs3BbHwMA4mt4W8PGXEbcj1Ku3byO5efr1l+xjZb5XXyjm/jondTTG1/M2h9ktvzjQ3bue+/dVuqO+gk4p3u81+w3232PLqCFPVV2i/q0417x8TKrRVOXOZxTHJrG1U3d6UuLBRjN/Qxl/1LVfYuUnUYzf0MZf9S1X2LlCzMGH+3h2riedS2LWtivnoA71aN+rfjnvHxMis5Vjo36t+Oe8fEyKzlRlzmcI5Q6fW70uLBRnNfQ1lv1LVfYuUmUZzX0NZb9S1X2LlCzK2H+3h2rieeKyPEFhZHiCvs74OhCEIDvx2vvyduofuH9YU68Q17edr78nbqH7h/WFOvENcz8gPY9T+I/ywPQPlF02PdXFjN6JkreiZdUPkgQhCBHmWNpHbdNbx2kcRtmsGQXDFdM6it4Mgu1rjc+qpIOFx442timJPEGjlG/r09q9sNGfk7ewT2g8HuuSaQ6zan5dZbbXeQ1tR31PR91PwNk4OGptUbj5r2ncAjn13XgSOoX6NvkZ/Ue1U/w5/wDkoFgq3UbpmSFm7MhOsXycHYT0B0vo8z1b1h1PxPGqq5stsFZ5RTVnHUvjkkbHwU9rkeN2QyHiLeHzdt9yAaw097JHyYWrGYUmNYD2oc0rchrJBFRUVxuNLb5KmQ9GRtqrZEZHn2NaST7Au13yxP5MDD/+cqh/q+4L81UUkkU0csT3RSscHMew7FpHMEH2FJBSnG9yZNRlax7mar/I11NJitZctFtVpLtc4WF0NjyuiZF5Ttz4W1cOzWuPQB0XCSRu5o5rxRybGMgwvUO94llVpqLFklorJKO5UFUzhkp5mHhc0+zqOo3BGxBIO6/aXo1W5DcuyDpVccuMpyuqw+2T3oz7955W+kjdNxb/AMbvC7f+dfm7+VZprDB8rtfX2fuvL58atsl7Ee24qu6LRxf8buG05/oIRSnJyswqRSjdHm4hW5pDoRq3rzmdZYdJcJrcxuFGxj610D44YKRryQwyzSubHHxcLtuJw34Ttvsu9dn+SJ7VNztjJ626YFjspbuaa4X+ofI3+YmCmkb/ANjlncorNldRk8keXCZvReiWd/JbdrbCrBUXKixuyZ9BAzjljxi8iWbYdeGKdkT3n/isa5x9gK8+rhbbjZ77W2q70FTa7pSTOhq6OsgdFNBI07OY9jgHNcCCCCNwpUlLIhprM+RCvzRbswa59oa3ZBV6PYP9L6exyQx3R/zzQ0XcOmDzGNqmaMu3Eb/Dvttz23Cu/wD8ml22f0K/+99l++IcorNkqMnsOi48IWV3F0Z7B3aS1vqrs/GcQp7LZrbcJrfV3q/1zaai8ohkMcscTmh7p+F7XNLomvYC0ji3VtagfJX9qvBMFq79R0ON6gx0sRlmosVu0s1WGgbnhinhhMh2/is4nH2AlRpxTtcXQk9djzib7V+gPsDZx2du0nJNppdex5pzZrnh+I0b6zIqu0W+4zXiVnd075XsdQsLXPdvISZHnckEnqvAB8UsFVLBPG+GaN5ZJG9pa5jgdiCD0IPsXsT8jZ63Wrv+CEXxbElVepcak/XSO2Hyk2h2imC/JZ5HkOEaP4Th1/ivdujjudjxSioqpjHTgOaJYomuAI5Eb81+chfqI+VQ/JB5R9f2z4gL842kmjOpOuuqkmE6V439KcnZQyVzqL5wpqTaCNzWvfx1EkbORe3lxb8+Q6pKL9S7Jqr9pZFYLdTQ+UXCCn7xkXeyNZxyHZrdztuT7AF3i/8AJrdtb9C//vfZvviqLGOyb2gcy7TOY6O43gHzjqPisHf360fPlBF5IziY3fvnztifzlj5Me4+d/Mds+lHeYXGW4/SZhvYK7LWMdnSjwCu0msGVO8hbDcL/dKFsl0q5S3Z8wqv4WEuO5Aic0N5AAbL8xGvmnlu0n7amqGm9nr33K049kdTQ0VRK4GR0LHngDyOReGkNcQB5wPIdF7JYfcPle8M7PFJp7RaWWC6ijohR0GQ3W8Wie60sTW8LAH/ADgIpC0AAOlieTt5xcvE3VDGM8w3tCZfjuqEE9PqFTXJ7sgbU1sdXKamT8a9z5o3vZI5xfxFwcdyeu6wUk03d3MtVppWViBrLeq7n2D5PTtg5RgllyaxaQ+XWS70ENdb6n6VWiPvoJmCSN/C+rDm7tcDs4AjfmAVHdQuxB2pNKtP2ZRnOlM9ssz66CgifS3u3180tRO8RwxMhpqiSV7nvIaA1p5lZ9KO8ruE7ZHVVC9JsM+Sp7VWWYhT3a4QYrgj5oxIygyK9SCpAI3HE2mhmDD/AMVxBHQgHcLrvr/2P9c+zZFSV2o2NQvxuqm7imyCz1XlVA+XYkRufsHRuIBIEjW8Wx232O0KcW7JhoTSu0dYVsWtXXox2fNXe0BmtRY9KsNqsjkpQ019aXNgo6IO32M08hDGE7Ehu/E7Y8IOyE0sxLNuyKYQvTyt+SV7UtLislwguOC3KraziFspr9OKh528IMlM2Lf+mQD+dddMT7Dfaqza+5ZbMe0jq5rjjVzFuvVNW3egoZKacxtlaAKidhe1zHsc2RnExwcCHFCnB7SXTmth1Qb0TLvGPk2u2mB6GP8A3us33xdIJopIKuWCVvBLG8se3ffYg7EKU08mK4yjmhB4grG0ot2nN37ROKW3Vy/1+L6b1FZw3662yMvqaWDhceKNoilJPFwjlG7r0VcjxBOh5kLM929Hvk+uwrr7hN0yLSXWHUzLLNbq7yKsqO+go+6m4GycHDUWuNx817TuARz67r6dXvk7uw9oPpnSZjqtq7qZiuOVVyZboKvyinq+OofHJI1nBT2yR43bFIdyNvN67kbzT5Hr1KdUP8N//koFJ/ldvyZ2Jf8AOPRfAV6pNy85o3Nhow8zp2Vzrxpb2IPk+Nc7hU2zSTtEZpkN8hiMrqCa4UlPVcA6vFPPb4pHNG43c0bDcbkbhV/r18k/neDYNccp0cy46mUlHE6afH6yhFNcyxo3PcFrnMqHbDfg2jcejQ47A+Z+juV37Bu1Xp3luMVMtLfbZkNJNSuhcQ5571odGdurXtLmOb0LXEHkV+0RNKU6b1MSlGnWi7qzPw8ua5kjmPaWPadnNcNiD+ZDfau1HbfsFmxn5V/W+1WGKOG2/SDyoRwjZjJaiGOomAHs2llkG3s6LrXYrHeclyygsGO2msvt8rphDRW+30z56iokPRjI2AucT+YBW73jc10lZtHGrI8QXothnyW/aryywQXC42zG8EEzQ5lPkV7ImDSNwXMpo5i0/na7Zw9oBXDajfJo9qjTvGKm8w45atQKGmYZKgYlcnVM7Ggcy2CWOKWT+iNjj/Mk04ZXMjpVLXsdBULZLFLBUyQzRuhmjcWyRvaWua4HYgg9CD7EQwzVFXFT08T555XhkccbS5z3E7AADmSTy2TorGtC77adfJsdqrULG6e7y4nb8CoKhgfAcsuPkkzh/wAaCNsk0Z/mexp/mU+vHyT3aitlvdNRV+D5FIBuILffp2Pd/MDPTxt/7SsWnHeZlRqtXseZreiZXJq12e9ZdCrhR0+quBV+JsrJHR0dVI+OelqXNAJayeJz43EAg7B2+3sV22z5PPtg3nG7fd7bpD5Tbq6mjqaWX6VWhveRyNDmO2dVgjcEHYgFPpRtmYtCblZJnS9vVOu0Go3Yv7TGkmmzsvz/AEykstgFXDRieG+W+se6aZ4ZFG2KnqJJHFziANmnqr1wf5LztR5lhdNeq6kxrAu/jEkVDkt2ljquEjccUcEM3dn/AIry1w6EA8kulG17k+aqOVkmedQ6hbF3Tu/yfXafoNebtp1Z8QtuX5BbbRS3asdashpY4GU1TLPFC7iqnwklz6WYcIG44QTtuN/q/wDJydsz9Dn/AL2Wf72pco7yPNVfdfyOkSFOxpnm7u0r+CAWTfUX6RHHvmnyyH+6An8n7jvuPuv4XzePj4Pbxbc12i/8nJ2zP0Of+9ln+9qG0s2JoTlkmzpEuy3ZC0mx3W/5QvTrTjLJ3xY3cKiee4xxSmOSpjp6aWoMLXDmOPuuAkEENLiDuAoFq9obqloNnNtxrVfF/oreq+gFdSU3zlS1feQF7ow/ip5ZGjzmOGxIPLptsrb7PXZz7U+bQ2nWLQHFJ6v5kvJjor1T3630j4KuENe5vBUTsc4cMjdwWljg4g7jcIbWjmEIy07NXtsPc3tE9ivs6XzsS5rBYtNcfwO92SwVNdaL5ZreyknglghdI3vpGAGZh4eF4kLuRJBDgHD8wY8QXtxrPJ8qZqX2ZLzheVaW2LGsXkoHi/1thvFshqq+ma3eRkrjXybNcAeJsTWcQ3bzBLT5JaT6Paja36oyYbpfjv0nySOhkrX0fl9PS7Qsc1rn8c8jGci9o24t+fTqsdPUtbLWJtOa0YtfAvPFOwf2rc30zsGY4vpX8545e7fFX2yr+k1qi7+CVgfG/gkqmvbu0g7OAI9oC6/6k6aZtpDrDc8B1Esv0ey23sidWUHlkNT3YlibLGe8he9h3Y9p5OO2+x2O4X60+z/i99wjsN6RYdlFD82ZHZMQt9Bc6TvmS9xPFTsZIzjjc5jtnAjdpIPsJXj523Oxj2lNXvlI86z7TvTf6Q4lcKegbR1/0gttN3hioYYpB3c1Qx42exw5tG+243GxSwqXlZj1cKo01KN2zx4Vz4PQ0eHaXXHVG7mmNzd3lHh1DUREyS1gLQ6uYHNLHMgDiRuHNLxsSxwZv8UmjOZWntN3PSzMaaPEb/Z3OdkMlRPHUQ2uJkYlfLJJE50ZAaW7HjDS5zWlzd9xZNm021e7VGqnzXo9gt2u2JWKCOhtkM0zY6O0wNY1o72okIjbI8M4yHPc87BoLwwFZW76j5PExnia6wkMs59myP8ANrv+6nk2jrFU1NRWXGorKyokq6ueR0k88zy98j3HdznOPMkkkknmSlXpjTfJQdpiez+Uy3zAqObh38kmvdUZd/zbtpXM3/623866o61dlzW7s/ywzak4ZNQWWeXuqa90Uraugld7G97GSGOOx2ZIGuOxIGwQpReTN26NSnHXGyOviF91st1beMkt9ot0PlNwrqmOmpYuMN7yR7g1rd3EAbkgbkgLuX/5Ontk/od/97LP97TNpZiRhOfNVzpOPEE67I572P8AtH6Y1mLU+ZaY1VFV5Hc/m2x01Fc6O4TVtTwl3dtjpppHb8IJ3IA5dV2RsPyWPaevGKRXKunw7GKp8YcbZdL5K6pb/wAUmnglj3/66VyitpPmasnZRZ5urYp/qvphlGjPaAyLTTNGUrMlsr4m1goqjvoT3sLJ2Fr9huCyRh6DbfZaMDwyoy7KJXTCSmxm2R+WZBcWggUlKzd0hBDXbyFrXcDQ1xJG+2wcQ11a5SrVIYeEp1NSWf8Avfs7SZYBTUGE4BU6q3uCira5sjqXErTXMk3qqprmcdWNuTo4QTz5jjBHFG8MJp6epqKyvqKurnkqqueV0k00zy98j3HdznOPMkkkknqpTnWVfSzOPKaaHySx0FOy32OkLNnU1FESIWOPE4ufsd3Eud5xOx22Ah7eihLaylhaU05V6vPns91bI/DbvbeywyEITGxeQIHUIQOoQIbEIQgBx0CmOHYZcMvu1Z3UnzfZLdTuq7zdZInPjoYGguc4tbze4hruFg5uIPQBzhwNms9zv+S0Vms1FJcLnVyCOCCIc3HqeZ5AAAkuOwABJIAJVk51cbZjWMxaa4yZI3Ukn9ttc13K51zNgYwS1rjDC8PDAdmkni4SQHuVvYjXYmtPSVCi/Xlt91bW+Ed76kzg89y+kym/0VPZLZ8w4naafyWzW0PJ7uPiLnSvG5HeyE7uI5nZoJcRxGCJW9EylKyLVGlChTVOGS/38W9rBCEKTIwWxa1sQQCceEJE48IQgMq1MOwmkdhdZn2Y/uTD6PiFJTPlMUl6qQDw00RALg0uBDpADsA7bwvczjMKwd+Q0F0yK7yyWvCrPGZbnXt4Q+Ugbing4yGumfu1o3Ow4m77kta7icnymoySvpY46WO0WGgjMNotFO4mGiiJ3PM83yOPnPkd5z3czy2AV69SNVWqTxE3QoytbnPcty/ef4LXnY+XIsiuWUZK653N0bXCNsNNTU8fdwUkLeTIYmDkxjRyAH85O5JJ4JCFOwvQhGnFRirJAmb7UqZvtQhxkIQkAZvRMlb0TLII8wXJ2e03K+5FSWi0UclfcqqTgggjHNx6nmeQAAJJOwABJIAJS2m03K/ZJR2i0UclfcqqTgggjHNx6nmeQAAJJOwABJIAJU7ut2tuJY1WYnidZHX11VH3WQZBAeVSPbS0x6inBHnP5GUj2MABS+vUUq1aUZebp65v5Jb31blm3qW1rvFpfZ4LDoRj9qprvSX2OGOQmtoJA+CRzpXveGOBPEGucW78t+HmB0E+VS6Geqzi3vPxUqtpUJc5nn/HqUcdWUnd6Ute/W9YKJ596C80+oaz7B6liiefegvNPqGs+weoWZgw3SIdq4nmOmb0Spm9FsEejz0K0O9VzF/efipVbCqfQ71XMX95+KlVsKjLnM89cpe0a3flxYKKZ56Dcz+oqv7B6laimeeg3M/qKr+weoWaKuG6RDtXE8zlNsVweuyW13G81FZBYcYtuxuF2rA7u2bkbsjaBvJJsdwwbbktBILm7yGjw2z4nazdtTO/pquSBs9qxqnlDaquG7TvM4A9xGdy0g8L+T9tizZ0TyzMrxmN0pJrl3FLSUcDYKG30URipaRgAG0bNztvsNzuTyA6NaBcvfI7u69TEvRw/N2z2fy7315Lrasd9dMpLBLoZYHYvT1dNYxHI2nZXEGckSvD3P4SRu54c7kdufIAchPFVGh/qvYx7z8VKrXVOWbOH46Ohjqsb3tKWeebBRXO/QhmX1HV/YPUqUVzv0IZl9R1f2D0LNGDD9Ih2rieaw8QTpB4gnV95noc7+aJ+rJjPvHxMqtRVXon6smM+8fEyq1FQlzmcB5R9oVu/LiwUWzr0JZj9R1f2L1KVFs69CWY/UdX9i9Qsyth+kQ7VxPNxZb1WFK8bwzIcoMs1souC2wbmruVU4Q0lM1vCXufK7l5ocHFo3dw7kAq/kegKlSnSi5Tdl1nc/Rb1Z8a94+JlVpKA6YW+ltehtjt9JdILzFB3zXVdMD3T39+/jDCfE0O4mh3RwAcORU+VGXOZwXHSUsbVksnKXFgovnHoVzD6kq/sXKUKL5x6Fcw+pKv7FyhZmHD9Ih2riecaEIV89BnfPRf1aca94+JlVoqrtF/Vpxr3j4mVWiqMuczgnKHT63flxYKMZv6GMv+par7Fyk6jGb+hjL/AKlqvsXKFmVsP9vDtXE86lsWtbFfPQB3q0b9W/HPePiZFZyrHRv1b8c94+JkVnKjLnM4Ryh0+t3pcWCjOa+hrLfqWq+xcpMozmvoay36lqvsXKFmVsP9vDtXE88VkeILCyPEFfZ3wdCEIQHfjtffk7dQ/cP6wp14hr287X35O3UP3D+sKdeIa5n5Aex6n8R/lgegfKLpse6uLGb0TJW9Ey6ofJAhCECPMB1C/Rt8jP6j2qn+HP8A8lAvzkjqF+jb5Gf1HtVP8Of/AJKBYa32Zkp847WdvXHezrk/Y4sNv7Tee33TvAGZdTy0Vyx6nfLUSV4paoRwkNpak8BjdO4nuxzY3zh0PR3s36N/JVP1wskuIapy6l5VHVMdaaDP66SkiknBHAGwS0tLHO7fbaNweCf4pVv/ACxP5MDD/wDnKof6vuC/NQOQCw04uUMx5ytLI/ZB2g7r2qKHTm4js6YhhF5uvcuEdRkF9mbV7kf7zTGFkHGPYZKjh323aRuF+SzWCn1Sg7SuYHWmmu1NqdNcHzX4XuIsqXSu58RGwHARtwcHmcHDw+bsv1Q9gLUDItTPkldIsmyysmuV+ZSVNunrah5fJUtpKuamie5x5ucY4mBzjuS4EkkldJ/lkdOsdn7NGmWrDaOKHLKLJhj76prQJKiknpqioDHn+MGPpt2g9O9ft1KWnLRnohUWlG5549hLteYd2TqfWivyOw3q+3rJLRSxY9HbKeGSBtTT+UOb5SZJo3MjLpY9ywPdsHcuQ36aZtqZn2ouqddmua5ddMhyerqHTvrquse58bid9o+e0bR0axmzWgAAAABeuPyZvYi091S0urNd9YLLHldqF0kocZx6r3NHIYdu9qp2DlMOMmNsbvM8x5c127du5HbS7X1g7E1Fh2B6SaYY1JmN4on10dO+hFLbrbSNeYmOMVPwOeXva8BrXNAEZJPQLLpJTairsxaLcLt6jjvkotac31S7GWYY3nV8q8lrMPvcdNbrjcJ3TVHkk8PGyF8jiXP4HMk4S4khrg3o0BdVvlitIbBZs70y1ms1BFQ3a/eUWjIXxMDfK5IWMfTSu2HN/AZWFx5lrIx0au9fyffa01G7V2nmpV21EsuN2apx640lNRNxyjqIGSNljkc4yCaeUkgsG2xHt6qgfllfU60l/wAMpPg5FiV1W3GV2dI8RNE9TtSsB1hsFvwXULJsLoLrfaJt0prDfamhirQJg0CZsT2iQAPeBxA8nH85X7Rl+IHT/wBPGE/X9H9uxft+U180RRyZ+W3tX9tHW+t7dWdY/ptqLe9NtP8AEr9U2ewWfFq99upyylldE6aQQlvemR7HSbP3ADgANgv0Gdk7Um+au/JzaSah5NM2pyK7WNvznUNYGeUTwyPgkl4W7AF7oi4gAAF3IAcl+SPWEk9rfVMk7k5fc9z73Iv1KfJ5/kbNDvq2r+PqFNWKUFYSlJubueEvymOAWjAvlas0dZKWOhosjoKS/Pp4mcLGzTsLJ3AfnfLFJIf+M8rsf8jZ63Wrv+CEXxbFWnyt/wCVRt/+Alv+3qlZfyNnrdau/wCCEXxbE8vsRF9segPyqH5IPKPr+2fEBeXvYz7ON4wvAq3tcazZxkOimi1lo+8hkslzqbddMlje9obCx0DmytppJO7byPFKeEM2H4we4nazvGjGN9jW65Rr1apMgwCy3GlrzZ44jL85Vccm9NTlg2Dw6Th3a8hh2888PEDIdPsx0o7U3YhpLtaqOmv+neUWp1FcLNUsANNu3gmpJWN8EkZ5cumzXNOxa5V4ycYWM7gpVLn50O0h8oTrfrJrW+uwLMsk0hwK38UNltOP32eiqZY9/wCGrJYXtMsrtgeEksZ0bueJ7+pNs1h1bsmpt4zWzapZdaMyu0fd3W/UWSVcNfXN3aeGaobIJJBuxh2c4+EfmCuzth9lzIOy32pKrGpu/uOC3Uvq8SvUjf8AbVNxc4pCBt30RIa8DbfdrwAHgLqar0VHR1FCblfWfti0prKy49l7Ta4XCqmrq+qxa3zVNTUSmSWaR1LG5z3uO5c4kkknmSV+Vnt4/leddvr9vw8S/U9o76o+ln+CFt+EjX5Ye3j+V512+v2/DxKpR57LdfmI9B/kktTdSMw7QmoeN5bqDkuUY7aMOgbabVd77U1dLQBtRHG0QxSPLI9meaOEDZvLovT7tj6rTaJfJ6Z3qZbaOkrMmtLIWY8aynbM2nrp5m08U4a4EF0YldJ/Pwke1eRPyOHrcauf4IRfFsXoD8qWSPkiMo2O29/tm/6wFE0vO2Jg2qDZ5UdjXtfdoKs+U+02teYarZHmeO5TfG2u62m83OSppSKjdjXRxPJbCWSOY4d2G+Hh6Eg/oM1/wG06n9irVDBbzSx1VLdMcqmRd43i7qdsZfBK3/jMlax4/naF+VTsgflSuz//AId234hq/XdlHo0yL6sn+zcprJKSsLQblB3PxH26gq7rf6G10ELqiurKhlPTRN6ySPcGtaP6SQF+yXs/aLY1oB2UcT00xumhYLfSNddKyNmz7jWuaDPUvPUlz99t/C0NaOTQF+SHQyalp+2xo9UVxDaGLN7S+oLjsAwVsRduf6N1+0VFZvUiMOlrZ+b7t79sXW5vyieZYLp/qRfsDw/EKmO3U1Nj1ykoXVM7I2unlmfEQ6Q94XNDXEtDWN5blxPqr8nnrnf9fewS3Js0liuGd2a8S2K83QQsjluIhjjlgmk4QAXd3UNaT7XMcfaV+ePteslj+VH7QDZgQ853cnDf+9NQ8t/9hC9kfkd2yDsS6oPO/dHONm/m3FFBv/8AEJ5xSpISlOTrO7N/ysOpOounOl2jFRp7n2R4JUV11uDK2XHb5UW91S1sUJaJDC9peASSAd9tz+dfnhe98krpJHF73ElznHcknqSV71fLJ+iLQr64uX2MC8E1ko8ww1/tGZHiCdIPEE6zbSsfoY+R69SnVD/Df/5KBdpO3V2dM27TvZAsen+BXSx2i80WWU92lmv9TNDTmGOmqYnNDoYZXcfFOwgFoGwdz6A9W/kevUp1Q/w3/wDkoFKfldHOZ8mniD2OLHt1Ioi1zTsQfIK/mqEvtTaKyw+vcVb2Zfkrrlp32hce1D1pzOzZE3H6xldbrBjzJpYKipjcHRPmmmZGSxjgHd2I/OIG523a7sJ2nflGNOtCXXbErBjV/wAl1PZCfJqG6WOptVFTuO4bLK+pZHJJH7R3TXB+2we3fiHVb5LHtVXu65ZcezvqHkNRdzJTOrcJqrjUullZ3bd56EOcSS3gHesb0aGSjoWgegHbZ7N1u7RvYuvlqorbDNqLY4H3HEazgAlFQwbupeLrwTtHdkE8PEWOPgCHz7TIhbzN6Wo/K1luU33ONUMhzLJq51yyG93CavuNU8bGWaV5e87DkBuTsByA2A5BfoN+S07O1hw3sl0+ud5tsVVnWYOmFtqZo932+2xyOiaxm/hdK+N8jnDqwxj2Hf8AOrLFLBUyQzRuhmjcWyRvaWua4HYgg9CD7F+vHsdTUk/yWegb6IgwjCqFjuE7/jGxBsn/AOWHLPWdoWRVwyTqXZ5lfK+aoZHR5RpdpNbLtU2+wVFtnvN3paeYsbWvdL3MAkAPnNZ3UpAPLd+/UDa8vknNUMizTsa5rhmRXapvBxG+xstktXMZHwUlTFxNgBJ34GvilLR7OPYcgANnbvzPsV4z2lMSpu0vpBl2oWWzYy19sr8frZIoIaPymYCJwbcKYF4k7x2/AeTh53sFK6Ndu/sE9n+iyCm0i0Y1LxKG9vhfc28ENZ37oQ8Rn903STh2Ej/Dtvvz32G2LOlZIz3Ua7k5Ignyr/Z8s2I6iYvrxi1vjt1PlFW+25PFC0MjfXtjMkNQAP48sbJQ8+0wh3NznEyz5KDs6WG70GQ9ofK7bFcq2guTrTiMVRHxNppGRtfUVYB5F34xkbHfxeGX2kEQnto9vrQ/tI9iSs05xHFs0t2Ri80lwoqi92yijpmGJzg/d0VXI4Ese8DZp67cl3++TFno5fkh8KjpiDNDd7myr2O+0nlkjhv+bzHMQ3JUrMSKpyxN45ZnG/KW67ZTox2HLZbsGu89gynL7x82tuVJIY6ilpGROkndE8c2PJ7pnEOYEjiCCAV+crFtSM+wrVGlzXFcwu1lyqnqBOy509c8TPcDv55J/GNP8Zrtw4Egggle0vyx8cx050GlaD5O25XVrzty4jHS8P8A7A5eEiyUktAr4mT892Hrl2/NfcO14+T07NN/teU2GvzScvq8ksNtukM1Ta6h9LG2VssLXl8Te8Dw3jA3GysX5KTVDUvNe0TqLY8y1DybLbLbcThNut96v1TWU9IRUMYDFHK9zWbN83zQOXLovEpvRevnyP3rZas/4JRfFsUyio0mhadSU8Qmz2G7Tef2DSbsYZbqnfbNTX+XFGR3CzUdWCY3XIvENGSB+aaVh3HNu3ENi0Efm6t3bm7UVHr9S5/U6vX+4TMrm1E9llrSLTMzi3dD5GPxLWFu7fNaCN9wQQCvbn5T6R7Pkksqa1xDX3y2tePzjylp2/7QF+Y9Y6UU46zJi5yVRJM9Ae1n20rhqr2waLUPQPKs+0utbsSpLPc42XN1qqauWCqq5gXCkqHh7AKkcPE7cEv5Dqf05xEmliJO5LBuT/QvxFjqF+3OH/acX/IH/wAFFZKKSRmwk5TlJs/In2i7rdLF8qZrjerJcqqz3ig1PvFTQ19DUOhqKaVlxlcySORpDmPa4AhwIIIBC/Q98nzlWT5p8lbgGRZjkd0yzIKisuTai53m4S1lVKGV8zGh0sjnOcA0Bo3PIABfnS7UAI+Un7QG/L/ZGvXx8y/Qj8msxzfketNS4bB1ZdC3+cfONQP/AIgqanMRhwt/PtdvE83PlePXl03/AMBWfHVK63diDUnUWzdvzRrB7Pn2R2rCrhl0Lq/H6O+VENvqi/k8yU7XiN/EGtB4mncNG/RdkflePXl03/wFZ8dUrpz2MvypuhP+FlN/8Snj9mV5trFPtP1WZ96C80+oaz7B6/HFiWaZjgeUuveDZZecMvToHQOr7FdJqGoMTiC5hkic13CS1pI32Ow/Mv2O596C80+oaz7B6/F4PEFjo5MsY7U4/E/YD2abtdb98nroler5c6u83muwm21FdX11Q6eoqZX0zHPkkkeS57nEklxJJJ5rw8+UA1v1pwz5VPUTHcP1ezXFMfpqa2mntlnyqso6WEvt8D3lsUcjWt4nOc47DmST1K9s+yp+TP0D/wAAbV8JGvFbtq45R/8AlhNZ9QcntXl+GY1bLZNJFPGTBcKw22lbT0hI36vexzjwvaAAHjhelhZTZi5SxCwuCVR9Vks23qSXW3qR1/t9pzXJ8zxPSqTLq676warX2jbll0rqyeeso6WVrY4aeqdLu9zg2R8knNrw1pYQ5haT+mnTHTTENIdELDp9g1rjtWP2qnEcTWgd5O/bz5pXAefI87uc49SfzbBfmo7GOSTZF8tTpTkmRSiSquF+qZH7vdwskfSTtiY3iJIa1xY1rdzsA0exfqVUVLqyK/IuGdGhKdTXUk7yfX+iyXUkfkf1W161GyH5QLKdXaLLrlRZBTZJPNY6iGrePIKeOY9xBGN9hG1jWt4ejhvxb7nf9S8VFjWtXZOt0GVWanu2M5jjUE1db5m8THR1MDZNh7QW8QLXA7tIBBBAK8NLlql8lhDkVfFW9mrUh9Yype2dwuk+xeHEOP8Adke3dduLB8qf2XcXwWy41Y8A1JobJaaCGht9N82UMncwQsEcbOJ9wLnbNaBu4knbmSU805JWRdw8oU3LTmnc8WNbdN7poT20c408bWzsq8avRFurmv4JnQnhmpZ927cLzE+J/LoTy6L2s+Sx1E1A1C0e1cqs+zrIc4qaO80cdJLkF6qK99O10Mhc1hme4tBIBIG2+y8mu2PrVhHaA7bFx1MwK13e02mttVJTzw3umhhqHTwsMZdtFLI0t4QwA8W/LoNgvTX5IH0Ia0/XlD9hInn9nrK+GssVaL1azuB23dY4NA+yF+Eq222jrNQ21vzRh1TWQiVtBVVUbu9nDTy3bBFKRuOZ2afNc4Hw90b7dGu2C9qrH8wzfU7Kc0xB1xZ9JLJV1xq456RztphBBI4RxyBpLmcBjHE0AkNJXo58rq947KGlUYceB2WyOI/ORSSbf/E/9q8DFFOKcNZGMqzjXtF2sdie0/qfZdfflBs21Hwi13aG1ZHPRMt1DcaZja0ujo4KYtMcT5G7ufEeENcdwR7TsOEz+poMJwCm0qsk9FW1zZG1WW3ahfJvVVTXP4KQ78nRwgjlzHGAeGN4eCmCOp8A0sr9T62KQ5BUyS23D4xKGFspic2esLHN2kjjDgwEcTeMua4Alrm09U1NRWXCerq55KqrnkdJNNM8vfI9x3c5zjzJJJJJ6rIls2I+Tk5Y7FuT5lN+Kf6R/N3UaUzeiVM3oshthkIQgh5AgdQhA6hAhsQhW5gtgtllxiXUvOLNJcMXppO4s9C48Iu1dzLWEFpBhaGSF7js3dvCBJs5hhuxVxFeOHp6bV3kks29iX++t6jlRB+CbTESVtHUUOqd9p+Ogk4uF9loHHhL+bfMnl4ZWeaeNjT1jdu11JLkrveLnkGS1l5vNbJcLnVyd5PPKebj0HIcgAAAGjYAAAAAALjVCVjHhqEqUXKo7zlrb/supbPi82xm9EyVvRMmLwIQhAjBbFrWxBAKZYPh9XmuZ/NcFZT2yjgp31dxr6p4bHR0zCOOU7kb7bgbbjmRuWjdwj9otFzv+TUdns9HJcLnVSd3BBEObj1PM8gAASXHYAAkkAEqyc3u+O2TGYtP8ErJK22RScd/vDSGi9VDduHbbc9zEeLgHEWku32cQJHI3sRrsTVqaSoUefLbmore/wDKtr6k2uDzHJKSs4MYxlvkeE2yof5DE0njrpPCayckNLpXgctwAxpDGgAHeDN9qVM32pkrFqlShRpqEf8Ay97e9vaxkIQpY4Jm+1Kmb7VCAZCEJAGb0XJ2m03K/ZJR2i0UclfcqqTgggjHNx6nmeQAAJJOwABJIAJWLPablfsjo7RaKOSvuVVJwQQRjm49TzPIAAEknYAAkkAEqdXe7W3EsbrMTxOsjr66qj7rIMggPKpHtpaY9RTgjzn8jKR7GAAu3sRQrVpRl5unrm/klvfVuWbepbWi73a24ljdZieJ1kdfXVUfdZBkEB5VI9tLTHqKcEec/kZSPYwAGt29EqZvRQlZj0aMaUd7eb2t/wC8lklqR6IaGeqzi3vPxUqtpVLoZ6rOLe8/FSq2lQlzmefuUvaNfvy/MwUTz70F5p9Q1n2D1LFE8+9BeafUNZ9g9KsyrhukQ7VxPMdM3olTN6LYI9HnoVod6rmL+8/FSq2FU+h3quYv7z8VKrYVGXOZ565S9o1u/LiwUey2uqrZpVk1yoZe4raS01M9PJwh3A9kTnNOxBB2IHIjZSFRTPPQbmf1FV/YPSrMqYdKVeCeV1xPN67Xa43zIqu7XarkrrjVScc88h5uPT2cgAAAANgAAAAAuPQhXz0VGMYxUYqyR6C6H+q9jHvPxUqtdVRof6r2Me8/FSq11Rlzmef+UfaFbvy4sFFc79CGZfUdX9g9SpRXO/QhmX1HV/YPQs0VsP0iHauJ5rDxBOkHiCdX3mehzv5on6smM+8fEyq1FVeifqyYz7x8TKrUVCXOZwHlH2hW78uLBcBldFVXLS7JbdRRd/W1VqqIKePiDeN74nNaNyQBuSOZOy59RvMp56XSDK6mmmfTVMNnqpIpYnlr43CFxDmkcwQRuCFCzKlC/no6Od1xOl8OOYdhkxmzm4syO8MY4DG7RMSI5C0gCoqWkBha8Oa5jN3A8LvObuDHL/nuQ5DbW2x8kFnsLP4Oz2qEU1I3chx8xvi3c3j84u2cSRtuoUst6q7bed3jhY6fnKr05LK+S7Fku3PrO/Oi3qz417x8TKrSVW6LerPjXvHxMqtJU5c5nEuUOn1u/LiwUXzj0K5h9SVf2LlKFF849CuYfUlX9i5Qsyvh+kQ7VxPONCEK+egzvnov6tONe8fEyq0VV2i/q0417x8TKrRVGXOZwTlDp9bvy4sFGM39DGX/AFLVfYuUnUYzf0MZf9S1X2LlCzK2H+3h2riedS2LWtivnoA71aN+rfjnvHxMis5Vjo36t+Oe8fEyKzlRlzmcI5Q6fW70uLBRnNfQ1lv1LVfYuUmXBZRU+RaaZFWeTw1fcWyol7ipj44peGNx4Xt9rTtsR7QoWZVoXVaNt64nn3brJebx33zRaK269zt3vkdK+Xu999uLhB232O2/5ip/T6T32mroW5TcrThtO94DH3O5Rcczd/PMbWuIcWgjcEt8Q589xw9x1JzS49zGy+TWmjg3FNSWo+SRQsO20YEexLWgAN4iSAOvM7wYeIK76x2xxxtRa3GHYtJ/N2X4P+5ahtmklto421eTX3JKiR7jx2mgbTNiaANg5s43JJ4ubSenMDqdX05xy3/7n9NrNTd5/D/O8kly4tvDwcZbwdXb7b78vzKs0ItvD0OEvtJSl2uy+UbL8Dvx2vvyduofuH9YU68Q17edr78nbqH7h/WFOvENc18gPY9T+I/ywPSXlF02PdXFjN6JkreiZdUPkgQhCBHmS/AcDyvU7WGwYDg9q+fMsvVT5PbKHymKDv5OEu4e8lc1jeTTzc4Dkv00/Jm6BatdnzsrZ/jer2J/RG9XLK/LqKn+dKSs72DyWGPj4qaWRo85jhsSDy6bL8v9gyC/YrmNvyHF73cMbv8AQy95RXO11klLVUz9iOKOWMhzDsSNwQeauP8Aspe05/wjNT/2+uX+nWKpGU1ZDxko6z9Hfyk+h+qOv3YQxvDNJMY+lmS0ucUtyno/nKlo+CmZR1kbpOOokjYdnzRjhDuLzt9tgSPHzAvkpO1hk+XUlJltksumloMg8quFzvtNWOjZv5xZFSPlL3bb7NJaCerh1XUf+yl7Tn/CM1P/AG+uX+nWJO0/2lp4DHP2h9TJoyObX55cnA/9BmSRhOKsmS5Rbuz9bunWHae9mfsa4rhAv9Hj+E4pbBBJd73WR0sb3Euklnle8hjXSSOkkPMAFx25LwD+Ut7Y2KdoPOsZ010urXXbT3FquSrq7zwOZFda9ze7Dog4AmKJhe0PIHGZHkDhDXO8zchy7LMuuLazK8nu2T1bd+Ge7XKWqeN+vnSOJXAN6IhSUXdu7InO8bI/TZ8kxqRj+TfJot0/pqyFuS4de6uOvoS8d73FVK6phn268DjJKwH88Th+ZQf5SzsW6t9oPVXAtSNH7XS5PdLdZjZbrZ5rlBRyiNs75opo3zvZG4bzShwLgRs3YO3O35/8E1DznTDUOmyzTzK7nh2RQNLGV9qq3QyFh2JY7Y7PYdhuxwLTtzBXZe9/KDdsfIMXks9frnd4KR8fAX2230VBUbfzT08DJQf5w7dQ6clPSiGnFw0We5nycmgFR2dtC8+w/LMgtVw1VrbpTV+T2a1VjakWOJ0LhSU8r2+aZS1ssh2O2z27bjZzvi+Uw0B1b7QXZr07x/SHE/pdd7Zkz6yug+dKSj7qE0z2B3FUyxtd5zgNgSefRfnBxnWfWHCqu81GG6r5jiU93qfKbtJZcnq6N1fNz/GTGKRpkf5zvOdueZ/OpcO1H2mtvWK1O/b65f6ZHm5aelcPOR0dGxOez32XNdtWNcKmXAMG+f48JyWkhyc/PVDT+QvE5JH46ZnefwMnOPiHm/zjf9f6/ExiusGreC1d5qMI1Sy7DZ7vOJ7tJY8kq6J1fKC4iSYxSNMjgXv852584/nKmH9lH2mv+EVqd+31y/0ymdOU3mRCagi4dd+yV2g7F27I8cuun/kt51Jyu6SYVT/PlA/5za2fvCeJs5bD5s0Z/Glni/ODt+jvsbae5hpT8mjpVp9n1o+Ycvs9DUR3Gg8qhqO5c+smkaO8he+N27XtPmuPXbruvygXbW7WjIcwx7I7/q9mt8yGwyPksd0uGVVk9VbHv243U8r5C6Eu4W7lhG/CN+gUn/sou0z/AMIrU79vbl/pkThKcUhIzjCTZ6gfKk9m/WjMe1Jc9b8cwz5x0vsOD0zLtevneji8nMMs7pB3L5hM7YSMPmsO+/LfYqyvksezhrPpNqhleomoGG/MGHZXhlK+wXD52o6jytsksc7D3cMz5GbxkO89rduh2PJeMV57Q2v2TYncLBkeuWoGQWKuhMNdbrlmdfU01TGerJI3ylr2n8xBC+u39pLtE2mw0VqtWvmo1stlHTsp6OjpM3uEUNPExoayNjGzANa1oADQAAAAFOhJw0SNOOnpH6ae35pLqDrZ8nFfsC0xx/6TZZUXihqIaHy6npeKOKYOe7vJ5GMGw57F259m68ofk1bn2idLu3tn2ltowyoybFLdcTQak2Jl5omGyVEUzqby2IyTNZK+ORjmPEJf3kYO3ERGR5//ANlF2mP+ETqd+3ty/wBMojYNXNV8Uza/5Ni+p2WY3kl8ldNe7ra8jqqWruUjnmRz6iWOQPlcXuc4l5JLiT1KVU2ouJLqJz0kfri7SfZ9xHtKdlu86dZSxtLVPHlNju7Yw6W1VrWkRzt/OOZa9u44mOcNwSCPzaXP5O7tdW7VmLDG6XQ193qKWqrKE0+UWwR1dNTSwxSztL6lvC3iqYNmvDXkSeHk7amv7KHtMf8ACI1N/b25f6ZfG/tIdoeTIKe7Sa9aivusFPJTQVrs2uBmiikcx0kbX99xBrnRRFzQdiY2E+EbTCE4KyYtScJu7R+wPTa0XCwdnXAbDd6fyS623HKGkrYO8a/upY6djHt4mktOzmkbgkH2Er83/wAoX2cNZ8d7YOrmu14w3yPSq7ZFCy33z52o398ZIWMYO4bMZm7uY4edGOnP2LqR/ZQ9pj/hEam/t7cv9Mo5lWt2s+eYi6wZzq7muZ2J0zZXW2+5TWV1MXt8LzHLI5vENzsdtxuohTlCV7hOrGcbWPan5LTs46zaT6n5VqHn+G/MGH5VhtK+w3D52o6jytsksc7D3cMz5GbxkO89rduh2PJd1+3xpNqBrV8nNfcD0ysH0lyuou9DPDQ+XU9LxRxTBz3d5PIxg2HPYu3Ps3X5mrf2ke0RabFRWu1696jW22UdOyno6Olze4RQ08TGhrI2MbMA1rWgANAAAAAX2jtQdpff1iNTf28uX+mQ6cnLSuCqwUNGx2V7GHZl1vuvyiuL5FQYT39m001HpqPNqj54om/Nc1NUfjm8JmDpuHgdzhDwduRPJfp9v1NPW4PeaOmZ3lTPQzRRM3A4nOYQBueQ5n2r8ZWP62azYnX3yqxXVzNMZqr1XOrrxNasprKV9wqXEl085jkBlkJJJe/dx3PNSX+yg7S3/CH1N/by5f6ZE6cpu9yKVWMI2saNX9ANZezrlOPUmq2KOwy63ON9Vagy7UlW6RsTgHPDqaWQNIcW+Ig/mX6jOyV2kca7SvZMsWU0FwgGZ0VLFS5baQ8CairA3Zz+D2RSlrnxu6EHbxNcB+TvM9SNRNRq+hqtQs9yPO6qijdHRzZFe6i4Pp2uILmsMz3FoJAJA232XYyHRbX7QfsgafdrTEMyZj+P5FU+SUdVjN0qorlRcRlAFUBE1gjeYHN2D3tJLQRz2RKOkrPMiE9CTcVqO/Hbe+Tz1s1A7dGRan6M2Oiyyw5U+KprqJ12p6Ke3VQjbHKXCd7GvY8s7wFpLt3uBaNgT6IdhjRak7PfY/qtLK2/W+9agU92dc8zits3exUNZUwxmOn4thzbTxwb79d+LbZzd/AWt+UG7Ytfi0lnn1vuTKR7OAyU9qoIKgDbblPHA2UH+cO3Xsb8lJYslh+T/wAszjKpqysr8wzequEFbXyvlmrYmQwwunc95Lnl0zJwSSdy0ndY5qahaTMtOVOVW8UUx8sn6ItCvri5fYwLwTXtH8sRqHZ7lqjpFpjb6plRdrHR1l1u8bHh3ceVGFlOx23R3DDI7Y8+F7D0I38XFnpcxFau71WZHiCl+C4NlOperliwTCbX89ZVeajye20PlMUHfycJdw8crmsbyaebnAKIDxBczYr/AH3F8uoMgxm9V+O36ik7yiuVsrH01TTP2I4o5IyHMOxI3BHVZHmYFa+s/S/8m3oRqtoF2Xs8x3VrFfonebjlPltHT/OdLWd7D5LFHx8VPLI0ecxw2JB5dNlzvyjOimpuvHYax3DtKca+lWR0ua0txnpPnGmpOCnZSVcbn8dRJGw7OljGwO/ndNgdvzvf2TvaU/4Qupn7d3L/AEyP7J3tKf8ACF1M/bu5f6ZVnTlpaVy260NDQs7HGXK0ao9mTth0lJeaN2H6o4ZcqWu8nFXDUinl4I6mIF8L3xva5j2btDiCHFp9oX62dEdWLDrh2WMM1Qx0hlDfLe2Wam4+J1HUN3ZPTuP545GvZv7dgRyIX45MjybJMxzWsyTLsguWVZFWFhq7peK6SrqqjgYGN45ZHOe7ZjWtG5OwaB0AUyxLWbWDAcXfY8E1XzHCrK6d1Q632HJ6uhp3SuADpDHFI1vEQ1oLttyGj8yeVPTXWYaVbzTe49Ou3F2ANVaztgZjqforhkV9wG80r75eGx3ajpPmyr851UBHPKxz2uLTMOAHnI5uw2G93/JbdqfGqvRWn7OOZ3eG05PaquaTEH1UgYy5U0zzK+mY49ZmSOkcG9XMeA0eYV47VPaT7RdbbaijrNfdR6ujnidFPBNnFwfHKxw2c1zTNsQQSCDyIVMxPfHM2SN5jkaQWuadiCOhBUuDcLSI87GE9OCP0afKY9lXOtccLwnUHS+zuyPKMZjno7lZ4HtFRV0cpa9r4Q4gOdG9r92DznCXluW7HyO0p7CnaW1M1ctuPVOluQ4HaX1DW3G+ZPaZbfT0cO/nyATBrpiB0ZGCSdug3I4bD+292rsFsMFsx/Wy+uoYWhsMd1ZBdO7aBsGg1ccpAA5Ab7LRmfbV7U+oFhntWS61X51vnYWTwWvubY2Vp6td5IyPiaehB5EdVEY1IxsNOdGctJpnZ35RW8dn7F7phGhOiWF4nRXXFmh+WZFZbLSxVcs7Iu5ipZamJgfK8DjkmBcRxuZv5zSBMPkxe1djWlWT33RXUe7w2LFsjuDa+w3arkDKejryxsckUzzyYyVrIuFxIa10ex8e48lCSXEk7k9SVhToJx0WYPOtVNNH6ne332db92juxHFbMIiirM4x66Mu9mpnytjFc3u3xy04e48LS5rw5pJALo2gkAkrwQwrsRdqHNdWKPFGaO5JjRkqBHU3XILXLQ0FKzfZ0jp5Ghr2tG52jLnHbzQTsFFNO+1b2i9KLBBaME1dv9ns8DeGnt007aylgH5o4ahr2MH8zWhTPKO3b2tswx6a13jW28w0krCx/wA00tLbJCDyI7ylijf/AO1JGM4qyMtSpRqS0mnc7P8Ayhg0D0w05007O+lWI4p9Ocfgp5cwya12KlhuLu5pu5ihqKiNnG6WUudPK1zt9xGTvxLsp8mB2dtY9KtTcp1Bz3D/AJhxDKcOpn2Kv+daOo8rEksc7D3cMr5GbxkO89rduh58l4OyTS1FTLPPK+eeR5fJJI4uc9xO5JJ5kk+1XFQdoztB2qx0Vrteu2odttlHAynpKSlzW4RQ08TGhrI2MbMA1rWgANAAAAATOL0LIxRqxVXTa7LH6T+3hpTn2s/yeF8wXTWw/STKqi70M8ND5bBS8TI5g55453sYNhz2Ltz7F+ZTVLSbUDRbVibB9TLB9Gsoipo6mSi8up6raOQbsdxwSPZzAPLi3HtUoHaa7SO/rB6lft1cf9Mq1ynMMtznLH37Nspu+YX18TYn3G93KWtqXMbya0ySuc4gewb7BRCLjqCvUhVd0ncjg6hfsR7PWqtj1o7HOBagWStiq/LrVCy5RRvBdSVrGBtRA8exzZA4c+o4XDk4FfjuHUK2tL9cdW9Fr1U12l2e3XD5Kkg1UFJMHU1QR0MkDw6N5HsLmkjc7dU1SGmiKFbzMnfJno72mvk7u0Lmfyhee5Tp5YLbe8Lyq9yXSK6zXqnpm0Tqh3HK2aORwk82Rz+cbH7t2PUkD2C7L2JYrp/2G8HwHD8ipcrtuNxT22sutCd4KivjqJPLSw/3oqTMPb023Oy/Njm3ba7VGoWH1NgyfWS7yWmojMdRBbaemtvfMI2LHupYo3OaRyIJII5HdVRjWuGtOF4fTY7h2r+bYnj9O57qe2WbKqyjpYi9xe4tijka1pLiXHYcySVicJSVmzLGvSp1HKKes9fPlP8As8axak6zWnVHCsP+esExXAZX365/OtHB5I2CapqJT3UsrZH8MRDvMa7foNzyXTnsHdnjWHL+1XpZrRjuIfOGmlizBjLrePnWjj8ndEGukHcvlEzthIw+aw778t9iurVz7Q+v96xy4We8a5ag3a0V9NJTV1DWZnXzQVMMjSx8UjHSlr2OaS0tIIIJBXE4lrJq9gWLOsmDaqZhhlldO6d1BYsmq6GndK4AOkMcUjW8RDWgu23IA/MnUZKNjBKpTlV07M/YRl1DVXTSjJ7ZQxd/W1dpqYKePiDeN74nNaNyQBuSOZOy/Ihq9oLqxoLlNns2rGKfRS5XSldVUMPznS1fexNdwF29PLIG+dy2JBX3f2TPaQ/4QOpP7dXH/TKA5fqFn2oV1o67Ps4yDOK2kiMVLUZBeZ6+SBhO5Yx0z3FrSeew5bqIQcBq9eFZLU7o/U72K8ptWW/JaaKVtqqo6llDjUFrqmscCYp6QeTyMcPYd499j7CD0IXmt299BNc9XPlIbTYcC04vFfht2ZR1Et9o6F/kBqTEymklqZwe7b3UcLQDJwvALgNwWrojodqpqPoHonlGf41n1xxht2bJQ4/YYqh4ir6wcDX1xhe10MjYGkjdzHAuBYSwhvFy1x+UD7YF0tElDU60VkUL28JdSWS3U0oH80kVO14P84O6RQandFT0rC45aEov9lLPZpJNO3Ze3b1onfav0s087Gfbh0xg0Uye+3nKrKyDIK/6QVlPU+STsqA+mj2hhi24hG5zmu3Ja9vQHn+gLQnXXBO0FoJbM6we5RSiSJjbpa3Sg1NqqSN3QTNHMEHfZ22zhs5u4K/Ijer3eckyuvvuQ3asvl7rpjNWV9fUunnqHnq573kucf5yVzGHZ1mmnuYR5BguVXXEL2xvCK20V8lNKW+1pLCOJp9rTuD7QnlT0l1lilifNVG0vVew7t9qfsP634V2t8yuGD6cXzO8DvN2nr7LWY5bpK90Mc0hk7iWOIOex0ZdwbuaA4AEHmQL27HfY/bpzPkuvfa3xW1YvpxZLRKKOyZnRwzeUSv2BnmppQ7hDRu1kbm946R7eFvIcXU2m+UF7YNJaxRxaz1b4g0N4prFbZZP/r30xdv/AD7qidRtatWdXK6GbUrUG95g2F/HT09fWudTwO22Lo4RtGwke1rQVNptWYunh4z04pvqeRnVvKLJqR2sMwyTC8Ut+H47d7uRYrFbKGGjgpacbRwM7uMNjY4ta0v2Gxe5x9u697fk4dAtWtBdLNT7bqxif0UrbtdaSe3x/OlJV98xkT2uO9PLIG7Fw5OIK/OJHJJDURyxSOilY4OY9jtnNI5ggjoVdP8AZL9o7/hAakftzcf9MplFyVkLRqxp1NOSuz3k+UZ0J1V140B09smlOLfSq52zIZKqth+cqWk7qI07mB3FUSxg+cQNgSf5l4KUOjOU0Paeuum2a0seM3DHpXSZWJbjBtb6eItMzu9aXxkgOABBc3dwJ2aHEfQO0t2juL0/6kftzcf9MuX1Mut+xrE5sYv96qb7qDk/d3LPbjX3A1873NfxUtOZXOJD2jz3kguJczZ7mEBJFSitE1XKmJVRqnR1VJ6l1JZy+C/FpbSuNQssp8vz9tVbaSS3Y/QUUNustFM4OfT0kLeFjXO6kklzjuXEcW3E4AFQpa1sWZKysRSpQoUlThktX+/1BM3olTN6KTMMhCEEPIEDqELfTU1RWXGnpKSCSqqp5GxwwwsL3yPcdmta0cySSAAOqDG2krsl2DYbV5xm/wA1QVlPa6Onp31dyuFVIGxUdMwjvJTuRvtxAbbjmRuWjdw+zP8AMKTKcgoaax2z5hxO00/ktmtoeT3cfEXOleNyO9kJ3eRzOzQS4jiMry2uosH0ij0zs9VHVXmukbVZnP3EbjFM3gdHQslaTuInBxdsT5++zhxPYKXSLW7mpw6eKq+ky5q1QXVtl/Ns3Ry5zHHQLKwOgWU5txm9EyVvRMgAQhCBGC2LWrpxygp9PdOm55kVskdkNyjc3CqeRoIjeB51fIxzS3ZnHGYw7fiJ3DduGRsN2KeIrqhFWV5PUlvf/jNvYk2brt32keFXHFGeTz5vkFva2+Tju5W2qleHfuRhG572QHikJ2aG93whx2kFLjwhPUVFRV3Cerq55KqqmkdJNNM8vfI9x3c5zjzJJJJJSDwhQlZEYeg6MW5O85a5Pe/7JZJf3uzKZvtSpm+1MW3kMhCEMQEzfalTN9qhAMuRtFouV+ySjs9no5K+5VUnBBBEObj1PM8gAASSdgACSQASvkp6eoq6+ClpYJKmqmkbHDDEwvfI9x2DWgcySSAAFblVUVGkVBW2Wgnkj1Fr6NsV2rInkMtNPIGyCnhI5PmcOBzpRuGcgw77vGNspYitKFqdPXUlkv7vqW35LW0b8pfZdO8LqcHx6v8AnHL6v8XlN4pnARxs2PFQREjfh4tjIRsSW7O33McdNJW9EyyJWIoUPMRab0pPW29r/stiWxagTN6JUzeiNpaPRDQz1WcW95+KlVtKpdDPVZxb3n4qVW0tfLnM87cpe0a/fl+Zgonn3oLzT6hrPsHqWKJ596C80+oaz7B6VZlXDdIh2rieY6ZvRKrEwXBvpKK29Xqs+YsKtnnXW6PH9H4mLkeKR24AAB24hyJLWuv3seiK1anQpupUdkv92W9vYjuRod6rmL+8/FSq2FCNObjZrpozZqzHrV8y2Q99HR0ZILmMZM9gc4/3zuHidzJ3cdy4+cZuqMuczz7jpOeNqyas3KWrdreoFFM89BuZ/UVX9g9StRTPPQbmf1FV/YPQs0YcN0iHauJ5nIQhXj0Weguh/qvYx7z8VKrXVUaH+q9jHvPxUqtdUZc5nn3lH2hW78uLBRXO/QhmX1HV/YPUqUVzv0IZl9R1f2D0LNFbD9Ih2rieaw8QTpB4grCs2E7WSPIsvrPo3jY2fGyUcNbcmcIdtSROHn78UY4zswcYduQ1wF5ux6Bq1qdGN5vs3vqS2nb3RP1ZMZ94+JlVqKC6bVVlrNGLTUY7bJLPZHSVApKWWYyPY0VEg3c4kndxBcRuduLYEgbqdKjLnM4JjpOWNqyateUtTzWtgotnXoSzH6jq/sXqUqLZ16Esx+o6v7F6hZmHD9Ih2riebiy3qsLLeqvnoR5nfnRb1Z8a94+JlVpKrdFvVnxr3j4mVWkqMuczgfKHT63flxYKL5x6Fcw+pKv7FylCi+cehXMPqSr+xcoWZXw/SIdq4nnGhCFfPQZ3z0X9WnGvePiZVaKq7Rf1aca94+JlVoqjLnM4Jyh0+t35cWCjGb+hjL/qWq+xcpOuGyKrhoNPr7XVNGy409Nb5ppaSXbgna2Nziw7gjZwGx3B69CoWZVotqtFpX1rieetmx6+5DWmnslpqrnIHsY8wQlzIi87N43eFgOx5uIHI/mKn02n9nxyUDOsupbbVBjZTabXGaurPmh7onkbMheQ5oa5xc0kk7kDc8Hd9R8outlfaYamCxWJ24FstFO2lgaC0hzfN84tdxOLmucQS48um0IV3Wzt+hjKr9aSgty1v5tWXwT6md/dNPmX8Cdl+j3lvzP+O8n+ceDv/wCGfxcXB5vi4ttvZsp2qx0b9W/HPePiZFZypy5zOMY5aONqq97SlxYKM5r6Gst+par7FykyjOa+hrLfqWq+xcoWZgw/28O1cTzxWR4gsLI8QV9nfB0IQhAd+O19+Tt1D9w/rCnXiGvbztffk7dQ/cP6wp14hrmfkB7HqfxH+WB6B8oumx7q4sZvRMlb0TLqh8kCEIQI8wHULYtY6hbFJAJx0CROOgUAZTN6JUzeiCHkMhCECAmb0Spm9EAMhCEAOPCFlYHhCygxsZvtTJW+1MgAWxa1sQQCEIQQwTN6JUzeiBRllvVYWW9UEPIdCEIIQL1K0F+UbtunvY9s2gmqWh1r1J09oaJ9C4x1oY+eB0rpSJoJo5I5TxO5bFgGwPULy1WxY9FSzHUpQd0esdDr58ltDd23uXsnZky7h/eeTeUd/R8X5u6fcxGW/wA3d7fzKwdRPlcH0em7cU7P2kFLhFNT0opbdX3qSNzKCJo4WCGigaI28I8IL3MGw3aRyXi2hR5uLz1jedmstRIspyrI841EvOXZdearIMlutU6puFwrJOOWeR3Uk+wDkABsAAAAAAFwKVvRMspgMjxBOkHiCdRtAEIQoYrAdQti1jqFsUoUEzfalTN9qHkQ8hlkeILCyPEEbAY6EIUIQEIQlAZvRMlb0TJtgm0y3qnSN6p0oPMB1C2LWOoWxMyAQhCUVgnHhCROPCECmVIcTxm65lqHa8ZsrI33KukLIzNJwMYGtL3vcfzNa1zjsCSByBOwMeV4Y3U1GnHZsrswpaiSiyvLpH2yxzwvLX01FC9pqp2uG7d3SBkQDgx7SONhSt2Wo1+MrTo0rUufJ6Mb73tfUleT6kzgdVL/AG6451TY9jkvFiGNUwtlo4XNLZ+A/jqk8BMbnyycTjI0N42hhI3VYoQmStqLFCjHD0Y047Px3t9betmxCEIMgLYta2IAEIXM47YbjlGc2rHrVH3tfX1LYYt2uLWbnm93CCQxo3c4gHZrSfYgScowi5SdktbLH0toLXZ4brqfktJJVWfHJIvmylZUdwa+5OcDDG1xGzhGAZHhp4mgNPC9u7TWFyuFZdshr7rcJvKK+tqH1FTLwBvHI9xc52wAA3JJ2AAVk6m5FR8Vm0/xm6+X4bjdM2GOWCQmC4Vh3dUVYB36ve9rRxPaACWHheqpSrearCRlUlLFVFZzyW6OxW2N5vrdnkgWxa1sTG0BM3olTN6IAZCEIIeQK3cOpqfDNOZ9S7pBHUXGaSSgxOklYOIVQALrhs/zXxwdBs14MhAPAWhyieDYt9LM38mqZvJLJQU77he6sP2dTUURBme0cLi52x2aA13nEbjbcjOc5T9LM5FTTQ+SWSgp2W+yUhZs6mooiRCxx4nFztju4lzvOJ2O2wCvW7GoxDeIqejRyzl2e7/Nt6r70RepqaisuE9XVzyVVVPI6SaaZ5e+R7ju5znHmSSSST1WlCExs0klZDjoFlYHQLKCRm9EyVvRMgAQhSTE8Tvea5tS2Gw0vlFZL5z3uJEcEYI4pJHbHhaNxz6kkAAkgEyMNWcKUHObslmySYDidJcfLctymlqBp/ZPPuk0JLX1Mh2EdNFsPOc97ow7m0Na7cuZu0mP5XktXlea1N1qG+T0/wDBUFE0ju6GmaT3VPGGhrQ1jeXJo3O5I3JUgz7JbJWeRYrhLailwi1fwImID7jU8w+tlGwJc4bNbxeFo5BgcWCu0q162a7DwnVn6TVVm9UU/ux6/wB57fgtmsTjwhInHhCZGzMpm+1Kmb7UEPIZCEIYgJm+1Krkxi0P0+xG3anZBRxy1k0hbi9oqA3epkLCfLJWnzhDHuHN4fOc8xndgLXOS9kVMRXjQhfOT1Jb3u/V7FrY1snfpHQPuUzY36j11GWUdDLE14scMgB7+YOB2qHt5Nj5cLHEv34uA1HUVFRV189VVTyVNVNI6SaaV5e+R7juXOJ5kkkkkr67vd7lfskrLxeKySvuVVJxzzynm49ByHIAAAADYAAAAAALjkqQuHoOnepU11JZv+y6ls+b1tjN6JkreiZZS08wTN6JUzeijaQeiGhnqs4t7z8VKraVS6Geqzi3vPxUqtpa+XOZ525S9o1+/L8zBRPPvQXmn1DWfYPUsXB5PJbYdNshmvFPJV2hlsndXQRHZ8sIjcXtadxzLdwOY/pHVKsypQdq8Ha+tcTzpxjGILjQVV/v9VJacPoJAyrq2NBlqZCN201O08nzOH/VY3znctgfmyXJ58irqWOOljtNjoGGG1WqncTFRxk7nmeb3uPnPkPnPdzPLYBcnyefIq+ljjpY7TYqCMw2q1U7iYqOMnc8zze9x858h857uZ5bARpvRXlndnoKnTnOfnauexe7+r3v4LVdv0K0O9VzF/efipVbCqfQ71XMX95+KlVsKnLnM4Ryl7Rrd+XFgopnnoNzP6iq/sHqVqKZ56Dcz+oqv7B6hZoq4bpEO1cTzOQhCvHos9BdD/Vexj3n4qVWuqo0P9V7GPefipVa6oy5zPPvKPtCt35cWCjWaQT1Wj2WUtLDJU1M1mqo4oomFz5HGFwDWgcySTsAFJVGs0nnpdHssqqWaSmqYbNVSRSxPLXxuELiHNI5ggjcEKFmVaF/PwtvXE6YGyY9pqZvpfTQZNmboGS0VlikL6SgceFzXVbgRxu5n8U3iaWtO52ka4V7f8ivWUZC66364SXGuMbYxI8Boa1vRrWtAa0dTsAOZJ6klcEPEE6vW1ne6WHUJecqPSnv3dSWxcdrZ380T9WTGfePiZVaiqvRP1ZMZ94+JlVqKlLnM4dyj7Qrd+XFgotnXoSzH6jq/sXqUqLZ16Esx+o6v7F6hZlbD9Ih2riebiy3qsLLeqvnoR5nfnRb1Z8a94+JlVpKrdFvVnxr3j4mVWkqMuczgfKHT63flxYKL5x6Fcw+pKv7FylCi+cehXMPqSr+xcoWZXw/SIdq4nnGhWPYNOK24Y66/wCR3KDDcaHgrbjG4SVO8ZkHcRcjLuANtiNwTw8RBC++fNbFidbNS6b2hkU8by1uSXRgqKyUb8nRMc0MhBDnsPm7uYW7hrgrt9x3KWLUpunQWnJZ7Irtl/ZXfUdp9JKGttvZ8x+iuNHPQVkff95BUxOjkZvUSEbtcARuCD/QVY6rjSSurbl2fMfrbjWT19ZJ3/eT1MrpJH7VEgG7nEk7AAf0BWOqcuczieO0vTaulnpSv82CjGb+hjL/AKlqvsXKTqMZv6GMv+par7FyhZmDD/bw7VxPOpbFrWxXz0Ad6tG/Vvxz3j4mRWcqx0b9W/HPePiZFZyoy5zOEcodPrd6XFgozmvoay36lqvsXKTKM5r6Gst+par7FyhZlbD/AG8O1cTzxWR4gsLI8QV9nfB0IQhAd+O19+Tt1D9w/rCnXiGvbztffk7dQ/cP6wp14hrmfkB7HqfxH+WB6B8oumx7q4sZvRMlb0TLqh8kCEIQI8wHULYtY6hbFJAJx0CROOgUAZTN6JUzeiCHkMhCECAmb0Spm9EAMhCEAOPCFlYHhCygxsZvtTJW+1MgAWxa1sQQCEIQQwTN6JUzeiBRllvVYWW9UEPIdCEIIQLYta2JUDBCEJhRm9EyVvRMgDI8QTpB4gnUbQBCEKGKwHULYtY6hbFKFBM32pUzfah5EPIZZHiCwsjxBGwGOhCFCEBCEJQGb0TJW9EybYJtMt6p0jeqdKDzAdQti1jqFsTMgEIQlFYJx4QkTjwhApPNNcKqc/1ks+NxCRtJLJ3twnjBBgpmc5HcXC4NJHmtLhw8bmA9V9GpmU0eU6qyyWdvdYza6aO12GLcngo4AWxndzQ88R4n+fu4cfCSdlJv9wHZZ/8AuGW5z/1ZqS0Ru/6r2eUSf8qOSJv5wqXHiCRa3c01BPE4uWIb9WN4x/zS+a0V1J7x0IQsiNybEIQoMYLYta2IAFdmLtp9PtBqrPp5ZGZZkMdTbcVY2IEU8TS1lTWiRrg6ORu7o2EFrgeez2uJbBsAxT6Y6o2+0TzeRWlvFU3atc/gZSUkY4ppHPLXNZ5o2DnDh4nNB6rdqHllPl+oDaq2Uklux6goobdZKKZwc+npIW8LGud1JJLnHcuI4tuJwAKR63Y1GJvia6wq5q9afZsj/M1r/dTW1EHHiCdIPEE6c2jBbFrWxBAJm9EqZvRADIQrj02pbfjWK3XVa9N75lpqPI8epH07Zoqy5Oic5veDfdrYhwyb+ad9i13E3hdDdkVMTXWHoudrvJLe3kv95LXkj7M1mi080nh0toH8V+r+6rsykkpGcUchbHJBRskBPE2PxEgkFx3a4Bz2CkB1C3VNTUVlwnq6ueSqq55HSTTTPL3yPcd3Oc48ySSSSeq0jqEJWRiwtDzFO0neT1ye9vN/2W5JI2IQhSXBx0CysDoFlADN6JkreiZAArsyiKLTDTOHC6ZncZ5d6cS5PWwVTJPJ6ZxdwUDSBu3iHA+QAjflzkY4cPx4PRUmH4V+FS8GnmrIah8GLWeqjO1fUtADqg7t5xQ8fFu0jeRgHGwgcVS1FRUVlwnq6ueSqqp5HSTTTPL3yPcd3Oc48ySSSSUmbNNP/nMRo/8ATg9f70ls7I5vNOVl91mlbFrWxObUE48ISJx4QhAZTN9qVM32oIeQyEKXYhh1flt2rO6f5BZbdTuqrxdJInPjooGguc4hvN7iGu4WDm4g9AHEQ3ZFepUhRg5zdkjnsBxaxVlBcsvzWqko8NtMjGSQxNcJrpUOBc2lhPIb7Dd+xBDSPCCXtiWQ5FcsoyV9zubo2uEbYaamp4+7gpIW8mQxMHJjGjkAP5ydySTzeeZbSZPfqKnstt+Y8VtVP5LZ7cHk93HxFzpXjcjvXk7uI5nZoJcRxGDt9qWK2spYenUnN16uqTyWr1Vu7XnJ9iyQyEIUGyGb0TJW9EyyCPMEzeiVM3oo2kHohoZ6rOLe8/FSq2lUuhnqs4t7z8VKraWvlzmeduUvaNfvy/MwUTz70F5p9Q1n2D1LFE8+9BeafUNZ9g9KsyrhukQ7VxPMdM3olTN6LYI9HnoVod6rmL+8/FSq2FU+h3quYv7z8VKrYVGXOZ565S9o1u/LiwUUzz0G5n9RVf2D1K1FM89BuZ/UVX9g9Qs0VcN0iHauJ5nIQhXj0Weguh/qvYx7z8VKrXVW6LU89N2ZMWjqIZKeQxzSBsjC0lr55HNdsfYWkOB9oIPtVpKjLnM8+8otPlCs178uLBRXO/QhmX1HV/YPUqUVzv0IZl9R1f2D0LNFbD9Ih2rieaw8QTpB4gnV95noc7+aJ+rJjPvHxMqtRVXon6smM+8fEyq1FQlzmcB5R9oVu/LiwUWzr0JZj9R1f2L1KVFs69CWY/UdX9i9Qsyth+kQ7VxPNxZb1WFlvVXz0I8zvzot6s+Ne8fEyq0lVui3qz417x8TKrSVGXOZwPlDp9bvy4sFwOVVtTbdMMkuNFL3NZS2uongk4Q7geyJzmnYgg7EDkRsueUXzj0K5h9SVf2LlCzK1BJ14J71xPPe8Xu75Be5LjerhPcqx247yd+/CC4u4Wjo1oLjs1oAG/IBcWhCvnoKMYwioxVkjvnov6tONe8fEyq0VV2i/q0417x8TKrRVGXOZwblDp9bvy4sFGM39DGX/UtV9i5SdRjN/Qxl/wBS1X2LlCzK2H+3h2riedS2LWtivnoA71aN+rfjnvHxMis5Vjo36t+Oe8fEyKzlRlzmcI5Q6fW70uLBRnNfQ1lv1LVfYuUmUZzX0NZb9S1X2LlCzK2H+3h2rieeKyPEFhZHiCvs74OhC5y0YxkV+4DZ7JW3GJ0wh76GncYmvO3Jz9uFvUEkkAA7nko2CTnCnHSm7LrO7na+/J26h+4f1hTrxDXt52vvyduofuH9YU68Q1zTyA9j1P4j/LA9CeUXTY91cWM3omSt6Jl1Q+SBCEIEeZz2MYxkOZ53bcZxSzVd/v8AXy93R0FFCZJZXbEnYD2AAkk8gASdgCVcuf8AZa190v0/myrONNq6z49CGmor46qnqo4A5wa0ydxI8xgucBu7bmQPavm7OOq9q0f7REuRX2muMlluFkrLPW1Vme1twoGVMfB5TTF5De9YQCNyPbzVg3DSS13zSDUDI9D9eJtQqS12x1zyvGq+31VouRoWSNL5nsc58VU2N3A55D+WwO2/CDkSTiI27nUhOOgXqbpn2SLdR9mLT3J5+zvdu0HeMsssV3rK2PUCnx+jtEU/nQwxMMrZJZBGWucXjg3cAD1AgEXZnwDF/lVp9L8sobgcBqsNqr9FR1tVxVtsBoJZhG99PIGyvgljePNeWP4BuXAnefNyQaSPPJSu9YXk2N4VieQ3q2+RWfJaSWrslR5RG/yqKOV0L3cLXFzNnsc3Z4aTtuARzXaeaydnnVLssap1Omum1708y/A7VBdqe6V+SvuPz3TeUxwSioiLQyGTaQOAiG2/t2Gx3YzoBimeXzsi43b2Px+qzy1XCqye4xTySSTNpauoLnsa9zmMcIIC1oa0N32JB57xoshs6VoXfOx2Lsva5VWX6eaa6ZX7TnLaCx1txxnJanJZa4XV1JE6Ux1dPJ5kIkYx38GTsfb7DGcKx/QTFvk9cY1Y1JwG451klVmVdaoLXQ36a3x18bIIXt7+Vpd3bI+Jx/FsD3Okbudm7I0esW50yXaW09i3tM3rTy2ZTatMZK+x3Ggir6KeK+W8vmglYJGOEflHHuWuB4S3i57bb8l1tvdVba7MrvW2a1fMVoqK2WWhtvlLqjyOFzyWQ967zpOBpDeM8ztueq9V8i060hyvXTs1XHKO0DNpxm7dOsaZQ49TWCcS1AbCDG5lx42wwukcS0cXQgddwiMUwZ5tYppXqBmuu7dMsdxqeozwyzxOs9VLHRyxvgY58rHmdzGsLQx+4cQeW3XkuGrcLyi36yT6fVdnmizKG7/NL7Xu10nlfe913QIJaSX8gQSDuCCRzXfjAMiumU/L7ZhfLxjs2JXOX59imtU7mmSmMVpniAcW+aXEMDiWktJduCQQT9FDFS19dZO2vVMinp7Zgr5rkJAC2TLqXgttO1zfZ3jn09Z/1XE+1Topoi50W1F0zzfSXUd+Iag2T5gyJlNHUOpPLIKnaOTcsdxwveznseW+6+7TXSDUrWDJKu06b4jWZRV0rGvqnQFkUNOHbhveSyObGzfY7BzgTsdt9irp7Yk81V2hsGqamV89RLprYXyySO4nPcaQEkk9STz3Xw6P6mYNB2Vs60Uz2/33BbZkF5prpT5LYKMVfC+JhY6nqoONjpICOFwDXb8Q6KLLSsKVbqVovqjo9c6Gk1Jw6sxd9cH+RyTPjlhqODbjDJYnOY4jibuA7cbj86rFdpsh0LvdXZtMH4ZqpS6naX5NljMetFzhbU07LZcZjGHRTUc3OF7mFrvNJ4ms3324d+9A7FmJfS06fDs3ZP8AMBkNJ+FZ2otH5WD4fLPm0TcHdcXncHDx8H8Xi81SoNvUQeOK2LvB2edDsRr7zqjWan4tbb9aMYvLLQy55DnJxqxxztdKJWSVDGPmfIeCMtaxuwaXcRBLd/l7S+iunGC5ho/kWntRa5sXzN9RHU0Fiyd18t8EtNURRyCnrSxj5GkSgEOG7XNcN+my6DtcNp0pQvR/JdKOzzeu3rXdmbBMAudtv1XkHBPmdTkczm2mGJnlVRT01I7iEoEMb4hJM8u4yXdAAuveoGYdl25YHfbBp/o7kOOXinaBZMqqMqkqZKxzXjnU0jx3bGuZxH8WdwSP50ONtpDKMy3DMlwa/wBFa8ptvzXX1dtp7jTxeURy8dPURiSF+8bnAcTSDsTuOhAKjLei9L9U7z2d7ZrbplaNS9Nr1qDfbzg2PQ1lfBkMlvhssLqOONhhijG9RJtu93G4N5tA6Enozq/g9Ppr2o8+wOjqpK2hsd7npKWebbvJImvPdl+2w4uEt32AG+6HGwpXCZgJeABuT0AUrs9nxWt0rzG7XbMfmXJ7b5J8w2H5pln+e+8lLaj90NPBT9ywCTzwePfhHNcbjV5fjuolhyCOmjrX2y4wVjaebwSmKRrwx38x4dj/AEpSGX5B2P8AtKVOBRZLDpLdnWySESsYZoG1RaRuP3MZO+3/AJuDf+ZUrSYVk9dpfkOZ01rL8bsdZT0d1q3TxsNPNPx90wxucHu4u7fza0gbc9uS7mX2mwLtEdqCozPTnXu74TqhkdcHWrG8soKiAw1L9gylp7jTvexreLZkYLWnbhHXkqUoNOLdS9jTXK+ZRZns1AxXLrZao55KqTipDI+pZUxlrXcDyXRAbuBI4eRG53yOK2Ajrqti9AsmsvZU001MwDFMi0lvWWV+SYzZqu6VUGUVFJDaH1VOwvlhjBc6eRzi6RzXuawbta0DYqKWXRDTfCNa+0dd9Rorllmn+lNXFTwWijqvJqi7y1VUYaRkkrdixoAJe5mx35jpwlFBkM6UIXcjMrBoRlXYDyzVXTnALjguRUmW0FrlttbfZrhFRRvile4wyuLe8bJs3cSNLmujOx2cuyuCdm/QuTB8IxrUDFccxfK71bqPyqfItXnUOQiaeNm7qe2RwvhPE534uN7uIjhDtnbhMoNkWPKRvRMu4elekumtPqz2k7JqfT117suntsrHwVNumdDVOkpbgyAujAcGcUjQ5g7wOa3j4tjstOUY7onqX2OM41G0rwO5aWZBglZQNvFsqb9LdKa5UtZMadkjZJQHMlbIASAA3bfkd92xouxB1DHiCdd+r/i/Zd0j1ktGh+c6cX/MspbDRQ5LmtPkktK6hqaqKOU+TUrR3cjGCVu3Hz5EedtuflotGtIdNMQ7QlVqnaLhmTsBzOht1p+brg+jmuEUwm4YXuBLIw8CN73cLnNDHBhBO6NB3JsdD0L0K0T0MwzWCwZ/rDj+idyyTHaa9xWmwaa0GaNpmQuFMySeaouFQ5kjmAuaQG+dxSbbFo3EO7UmgFDpxpXhmoFv08uGkUt2uM1tuWJV2QxXlkD2MEkU8FTG9xcx7eMFryHAs6AEEw4PRuK0dJh1C2KU4NZ8Wv2qdqtOaZh9AcZnMnll++apbh5JwxOcz8REQ9/E8MZyPLj4jyBUWSLIQlV6wnJ8e0/xLKbxbPI7Dk8M81jqvKYn+VMgl7qU8LXFzOF/LZ4aT1G45pqrCcnoNILPntXbO6xO6181DQV3lER76eEAyM7sO427Bw5uaAd+RK7u3jDNJsq+Tv7MUmpWtH4KJ6a13htBD9Eaq7+Wtdcn8bt4HAR8JDRs7rxcuiXUDT7EqzsS9njT/TbUVuoFovWpNZQ09/fYprY1s1QYIi0wTOL9mFw577H2LK4aiWtR5+LI8QXoPT4p2Urv2pajs40WnuSUF7bdJbBT6huyKSSodcI3Oi43UWwh7oytI5bHY77N6is9NMC0ps3Zt1hy7VnHa7JLhh+VUNupae03KSmfVueZ2Pp+PfhZG50Yc6Qsc8NYQ3Yu3UaDCx1HQu3uaab6bahYformGkWOVWnEWZ5VJi1wsdbdJLjDSVQkgEc0c0mz3NLZ93A7dAABzJtjH8X7Jl37b1r0DZphkInoMgdapssmyaZzrrUQOcyWOalbwtjikcx7Q+JzXDdp2A3ChQd8xLHnUpVesJyfHtP8Sym8WzySxZNDPNY6ryiJ/lTIJe6lPC1xczhfy88N36jcc1xd/poKLOr1R0zO6poK+aKJm5PC1ryANzzPIe1eo2AWCx3HsHaDXu2W2hy3WeyYveqvAsXuz+GlrZW3Nxmna0jaeaFoD2QEjiO558O7VjHSuCVzzby7TvMcBpLC/MLP8xS3miFbQ0s9XCaowHwvkga8yQh3s7xrSdjtvsVC12p0zsdmzu4a0a16+y3rK6HEYqae7WyKpNPV3Suq6g08MT5OsUbXNcHBuxaA0DYDhO7PcY0gznsg3LVzSjELhprXY9fae2X7Haq8yXKmliqGOMU8M0g4+LiYWlp5bH+bnOjquhWtdzqi3qnXfnJLN2W9N9S8DxbINKbzlddkWNWirudVBk9RSw2l9TAwukhYC508jnF0hD3NYN2taBsVFbNorpzhWtHaIu2ocVxyvAdLauOnhtNJVeT1F2lqqkw0jJJW7FjQAS8t2O/MdOExoMhx1nTAdQti7e5fYdDco7B2Vapad4HcMIyCkyyhtkltrL5NXxUUb4pXuMMji3jbJs3cSNLmujOx2cuq9ipLXcM4s1Be7v8AR+y1NdDDX3TyV1T5DA54bJP3TPOk4Gku4G83bbDmUSVhWrHFK2dN9C9WdXKStqdPMKrMho6R/d1FWJYqeBj9t+DvZnsYXbEHhBJAI5cwq8v1Ha7fnN5oLHePpDZaaumht908ldTeXQNeWxz90/zo+NoDuB3Nu+x5hdlsSz7TrLuxlYdGs8zG96ZS2S9VNfSXW3Ws3CguDZ9jw1ULHsk42EENcOIBpP8AQoik3rIsm9ZRGeac5vpjmjcez3G6vGbu6ETRwVQaRLGSWh7HtJa9u7XDdpI3BHsTae4n9M9UbdZ55vIrS3iqbvWufwMpKSMcU0jnlrms80cIc4cPE5oO267E27Sqgs3as0RotRcmg1V0gzEuosfvVJcKqOF0T3up9gHFskDoaiVj3R+EHkd93BWTjWi1Dg3Yo1LsOR001v1lySnvDrDJE58crLfZZIn1UPDyIFQBPyHE2RjW/m2Q4N5FTERquk4UnaT1K+zr+Gzr3HUm+1V41g7SNPb8XtvHNcqyK14zaGuZTshhBEdPA0Of3cXLYkBwYHOcRsCofUYvkdJSXqqmslaaGz1oorpWR07pKeknJc1sb5W7sa5xY7Yb+dwnbddoG6W4JQdqrsy6aV9i7+rvNvtVTnAdWztfUy18xlEDtnjuuCnfE38XwHmSdzzVl4LfdKsQ7DmutBkOkP0xtlpz6lp6ym+lVVReXNdLUtpvOYCY+5axw5b8fH53QJlBWsZaNCFGmqcNSirL4I8+ULuFprkOgeRVtbb7h2Yoaunpqirr7jfqzUq401NaqB1S98QlDIzuIY3xQNI3fM5rdgXycKkmkukOneuvaH1VyjCdO7o/TrGKemfZ8Ior6Iqu5ySkxxiSqqZPxTXd1LK/z927hrSdgCKF7WZlUb5HR1C786/9nahxzstVepNNo/cNDrnarrT0tTZp8uivtLcYJt2iWOVr3PjkY8MBa7ZpD+W+x2iOsNr0A0xxq2Y9QaaXC/5tfcGoK75wkySenpLLU1FI0iVkXnGd5eTK5r3CPZzWtA2KhwazEcGszqzlGIZFhl3t9Bktu+bauutlPcqVnfxy95TTsEkUm7HOA4mkHhOzh7QCo8u+mSYLR6h9vPSiwXSw1WRWVmlloq7jTUtyZQBsUVtDg+WofyiiD+DjcAXcO4aC4gKycr7O+g930kumY49NimPMxKpgq7/S4lqDUZRHPQ7u71tQHRxyQPdw7NMZP8fYEgKXB2bWwxVmqNKdV5RTfXqV9R0uq20+nXZvhomSyDNs3ooqip/FAChtJe8sayVrt95y1pc3cgsBa5rS0F1Jrvpm910GtmA6Zao5/phcs4yrNrXUVVXbKfJJqCmhjiqpIY5XSMG75GxMjia1jWNIjLnbuduuCOhGnDO3JktFLUXVmkNnwf6dS0jJAa99D5LFMKUP/vuOUN368I67+ckVN26yphMNUp09Kpz5u8uptZdkVqXZfNnU2xYhkWR45k14s1v8st2P0La27zd/GzyaF0jYg/ZzgX+e9o2aCee+23NR5d9McvmjWS9k/tGXHTTAblptc6fFKeGqts98fc6arhdXQlszZJAHxyAt2czm0hw26FdC1MklYuTVrAti1rYkMYJm9EqZvRAEhxfGrpl+fW3G7MyN1xrZC2MzScDGANLnOcfzNa1zjsCeXIE7AzHVHJaK5ZPRYtj74zh2MRuoLQWRx7zkcImqHPj5PMr2cXENgRs7hBc7fmaV1Pp52c5a18UgzXNaOWnpt5QBRWovaHufE5u+85a4NdsQWAOa5paQ6lki1u5pqf8AzWJdZ82F1HreUpf5V/NsaBA6hCB1Cc2psQhCAHHQLKwOgWUAM3opxp/iD801FgtslRHRWmmjNZeKyWobCKajjI72TicCAdiAORG5BOzQSIbS09RWV0FJSQSVVVPI2OGGFhe+R7js1rWjmSSQAArozOWLT7SqHTCgfxX2v7quzGSSlZxMkLY5IKRkgJ3bH4iQSC47tcA57ArexGtxdWatQpP155dS2y+Gze2kQ/UDMvpflkAoI6ihxa2U7KOxW2eXj8lgYxrBv/xncIc4kuPRvE4NBUDQhSlZWLNKlToU1TgrJf7+e97WC2LWtikygnHhCROPCEIDKZvtSpm+1BDyOTtFouV+yWjs9no5K+5VUnBBBEObj1PM8gAASSdgACSQASrGze423G8ai04xsyRupZP7a65ruVzrWbAxglrXGGFweGA7Ak8XCSA93Jdz+CrTbvKykqKLU++U/HQycXC+zULjwl/NvmTy8MjOR42N9sbt2upZJztew0sP+crec/6cXq/efvdaX3eu72RYJm+1Kmb7UyNuMhCEgDN6JkreiZZBHmCZvRKpJimOVWU5jTWund5PT/wtdWuA7uip27d7PIXFoDWN58yNzsAdyEuTMU5wpwc5uyR3u0M9VnFvefipVbSg+m/0bGi9mZiPlDsej76Okkqt+8m4ZntfId+nG8OftsOTh5rfCJwtfLnM874+WnjqsrNXlJ2ea1vPrBRPPvQXmn1DWfYPUsUTz70F5p9Q1n2D1CzMGG6RDtXE8x0zeiVM3otgj0eehWh3quYv7z8VKrYVT6Heq5i/vPxUqthUZc5nnrlL2jW78uLBRTPPQbmf1FV/YPUrUUzz0G5n9RVf2D1CzRVw3SIdq4nmcrcbi1u0+x225DmccddklVGZrZis0fJo5cE9Yd9wwEOPc7AuIDSRtIG/LT08Gm1DDcbjDHU6gzRiS32+ZgcyytI3bUTtPI1BBBjiPg5PeN+Fqriur6653SWuuVbPcK2XbvKipmdJI/YADdziSdgAP6AFczO7t1MW7Qdqe17ZdS3R683sstb9CtJbtcb5oDY7tdquSuuNVJUvnnkPNx8plHs5AAAAAbAAAAABWOqo0P8AVexj3n4qVWuqcucziGPjGOPrRirJSlxYKK536EMy+o6v7B6lSiud+hDMvqOr+wehZor4fpEO1cTzWHiCdIPEE6vvM9DnfzRP1ZMZ94+JlVqKq9E/Vkxn3j4mVWoqEuczgPKPtCt35cWCi2dehLMfqOr+xepSuAyuiqrlpdktuoou/raq1VEFPHxBvG98TmtG5IA3JHMnZQsyrQaVeDe9cTzSVlWXAo48ajyXNbj9GsekgE9FGOB1bdBxAFkERcCNwR57hsONjti0kjk/7XtLr3/vGW6gUU/877VQODv+q+WZob/M1pf/AH0fOuLvfLvkN8kuN7uM9yrXbjvJ378ILi7haOjWguOzWgAb8gFd1vI7i6lbFfZerD3tr7qeXa/gtp340wltE2htjfYaSeitA75lNHVS95K4Nne0veRy4nkF5A5AuIHIBT5Vbot6s+Ne8fEyq0lTlzmcVx0dHG1Y7pS4sFF849CuYfUlX9i5ShRfOPQrmH1JV/YuULMw4fpEO1cTzjQhCvnoM756L+rTjXvHxMqtFVdov6tONe8fEyq0VRlzmcE5Q6fW78uLBRjN/Qxl/wBS1X2LlJ1GM39DGX/UtV9i5Qsyth/t4dq4nnUti1rYr56AO9Wjfq3457x8TIrOVY6N+rfjnvHxMis5UZc5nCOUOn1u9LiwUZzX0NZb9S1X2LlJlwWUVlTbtNMiuFHJ3NZS2yomgk4Q7ge2NzmnY7g7EDkeShZlWhfz8Lb1xOk9v0zy6sonVtdQsxu1xvLJq69yikiiOw24g/z9iS1oIaRudvz7feLDptaDveMyrcgnb+KmpLDQcHdye1zZpfMkjBBAIALt2kct1X9wulzu1a2putxqrnUNYGNlq6h0rw0EkNBcSdtyTt/OV8Q8QV2zO2+ZxNT7Spbqirfi7v5WLUOoVnttHHHimA2my1DXukFZWuNwnik2HA+J8gBYWkbgHiG+x267x275/md84xccjrXxPhMMkMMncRSMO+4cyPha7fcgkjcjl0CiCEJIaGDw0HpaN3vet/N3Z347X35O3UP3D+sKdeIa9vO19+Tt1D9w/rCnXiGua+QHsep/Ef5YHo/yi6bHurixm9EyVvRMuqHyQIQhAjzLB00zOy4NqQbvkWBWfUezzUj6Wps9642xlry095HIwh0cg4eTxvsCeXNX/d+0tg9p0dzHFtF9A7TpJWZXbH2u/Xp2Q1V3qpKOTbvYIjM0d01+wBA3G3s3DSOn46hbEyk0tQtjtRjHaGwybSbG8V1m0NtOsRxuj8hx+7Ov1TaK6mpQ5z2U8skAPfRsLncLSBsCR/OuDsOutoxvtV3PUaw6Y2vHrPPj9XZ6XGrRWvhhp2T0b6USmV7XukeOPjcSBxnfw77rrmnHQI0mFkWlp9qV9BNPtUrF8y/Ov0yxv5m7/wAs7nyL90RTd7w8Du8/guHh3b4t9+WxmdL2g7/ZhoJW4vbGWa+6YUs8NLWS1Pfx3EzVUk7uOPhbwNLZXROaHOJBJBG/Lr2mb0Rdoho7k3ftSYdR4pl0mlvZ/sOl2dZRb5qC8ZLTXmesLIZxtO2kp3tDKUvG43YTsDy57EUVctSvnDsfYvpR8y9z8z5LWXn508s4u+8ohij7ruuAcPD3W/Fxnfi22G25q1CHJsSwK3dWtUnapZDhFwbZDYHY7h1ux0NFb35qDRxlnf78DODj334OfD/fFVEmb0UXJO20Hajb/ZbYhrLX4IKzLKDE32bIXtvPdi+1BopKMVzj3B7p/A9nE3zw7uxsW7rrMzJcjj0/mxOPILlHistYK2WzNrpBRPqA0NExh34DJwgDjI32AG64RCltsixbWr2p/wCFbO8fvnzH8w/NmMW+y9z5Z5R3vkkIi73i4Gbce2/Dsdum56rmNLtTNPsQxW42PUHRGy6q2+pq/KYqme6VFtr6c8AaY21EO57vlvwkdSTvzVIDwhZRd3uIzsxqL2ihkeB4lhemWAW/RzCMcvgvtDb7bXSVtRJcQ3hZUy1EoDnua3k3cb7dSQGgTCt7SelN/uc+VZf2WsYyHUupeZ669tyCspqGsqDzdNLb2/i3FzvOcOLziT+ddOW+1Mp0pAdi9M9c8exXS3JMB1C0otuqGB3S9NvcFqddZ7W+grWxmLvIpoQXBpjPCWfmHXrvv1T1/p9SMU0nstDp9bsJtmCVVa6gorVVuNPJDPNFIyMNczia5oh86RznmRz3PPD0XW1bFGk8iNpeF+1yv9V28Lhr1i9E3Gb9LfTdaSjkn8qZCSNjE93CzvGubxNdybuHHopXqDrdpVl+CX2LH+zdj2F5peWjy3IIL3U1EcLi8Pe6mpHARwOcQRuN9g4hdZEI0mQy3dR9Vfwgaw4tlnzD80fM1ktdt8l8t77v/IoWR95x8DeHj4N+HY8O+27uq4fVbPPwn9o7MtQfmr5j+frk+s8g8p7/AMn4tvN7zhbxdOvCP6FXSZvRRdsUZcjZ69tryu23N1DTXNtHVRzmjrY+8gqAx4d3cjdxxMdtsRvzBK45Zb1UEPI7n2XtLaQYvkdJl2MdlTHLTqHRyCegursmrZqGmqBzbK2icOAFruY2cCNhsQQCqYfrHcq3Q/VfFrzbfnO751klJfK68eUiPupoXzySDugwh3eOnJ34m8O3Q78qaQm0mCLc1G1U+n+sGLZX8xfNPzNZLZbfJfLe+77yKFkfecfA3h4+Dfh2PDvtu7quxuleqeTam9uXVeqs2CWHIrLqJTSzXnBMhv7aaKvYyRj2Rw1bmsAqGOJcx3COXGQNwCOiy2KIyd7kM9Iu0gbfp12BY9M6nA8e0mvl6zCC40eFWi/fO9XSUsMEgkqqyqLnF73vfGxg32DWcuYcqzh7W2LvznHdQrroDYbvrDb3UflWWzXqo4arydrIxK2jLTEycxxgNlPFwO2cGnhAXSlCdzd9RFzvZodqQavOe11ql9HaKqjueN1l1msVyPlNNJHU3SJ8lNIdml7SyRzC4Bp9o2PSq8/16x286BVemul+ktt0ixe6V0NbkQprvPcqm6SQ7mJjppgHNia4lwZz2O2xHMHrS3omUaTtYg7m0PasxWtkx7Jc90CsGeasWSkggostqLxUU7ZzA0NhlqqRjSyd7Q1u7i4b7DbhAAFSXPW683/R7VPH8ht4ud7zjKKW/Vt4FT3bYJITMTG2HgO7Xd9y84cIaBsfZRw8QTpXKTYF46Way0uDYVe8KzDBLbqfpzdayOuqbDcamSlfBVRtLG1FPUR+dC8scWEgHdvLkuP1Q1CwPMLdaLbgGj1q0rtlFLJLIae6T3Gsq3PDQBJUTbEtbw8m7dST7VTyFDbtYVgOoWxax1C2KEKWrmmpv0v7P2kuC/Mnzd9CKOup/LvLO88u8qqe/wCLg4B3fD4duJ2/Xl0X3u1fro+zNp9gNstrrZcsTyaovtJfGVnE58svAWNEXB5pY6MHi4jv+YKm0zfapbYN6juw7tb41FltRqJbtAMbt+t88bnPzFt0nfTtqHsLXVTKAjuxKdy7i4ieI7nfnv19tup01H2ZM707qbW6vqMmvtFdZbu+s2dE6nEu7THwHjLzLvxcQ226HflVayPEFLk2gbLdZqvXUvZxwnBrXb3W65Y1lk+QUl6ZV8TjLIyJrGiLg80sdCHcXEd9+g25+oWKwz2vVi3a8Zzo1p/g0cMbrlf9T6LMW1sFxaYi5/kVAHbMqJieHicC7z3bEuIXjGhTCbTFTsfddK35yya43Hg7vyqqkm4N9+HjcXbf+1WpkOr9xuukOjGOWiinxy6aexVgpLxTXAmWoknqvKWyNAY0wlh2A2c7fruOip1CxXaFO4lP2rqaXI6m83vSq03uuyK0i26i08laYqHKQxwdDVdwyIGmqmkbmVjnAkk8DTsRBdS9cbPlGjVJptp1pnb9J8Cbchc66gpblLcKmvqgwsY+aolAc5rWk7M22BO+/Ibdd29EyfTk0Q5O5bWoWqP091exjKvmP5p+Z7LbLd5L5b33feRRMj7zi4G8PHwb7bHh323K7DaXaoZLqV23dVKqz4NYshs2oNPLNeMGyC/Np4q9jJGPZHDVOawCdjiXMdwjlxkDcAjpA3qnUKTTuF2mei/aKdb9POwhHptU4Lj+lN7vOXQ3Ckwy0Xz52q6WmhgkElVWVRcS973vjY0b7BrOXMOXnYtY6hbFM3pMhu7BX7gOqel9h03pMe1A0Bs2oslLLI+G6xXyptNa8PcXcMskO/eBpOw3A2aAFQSEibWQl2js9etRrjrzrrpRh1hxak0/w3Hpu4sVksdR51BC6QT1U/fS+OXhjL+It5lg80uJ4pfqZ2rJcr7euJ6o23G4vmDFmyUVPahWu7u6U75JhUSFzogYjURzOBBY7hG2/Fsd6csv9onZYu2Su8zIM272z2n293b43DyyX+M08b+GHhcGvbtxtO26pgeEIU5NtmsoValfEVKifqR9VdbXOfwfq9sXnqL3rtb6m5fKAU+utVYGudBkNPc4bI2t2DIacsbFTCbu+jY42M4uD2b8PsXKYFrlY8ek1LtOaaaU2oWE5nco7hV2WW9TUElNPFLJJE5lRE3i5d64HzRvsOnMHrqsjxBNpSNlpM7c2jXXQuh0oqMPuPZmN0tMt6qLk5keotbTcfHK808chjiDpRBC5sTC9x6PeA10j94dZdbcdxTWHLKvE9K7fR6W5JQw0d3wK63ae4QTMj4XB4qXgSCQStdIx+3mFxAB2C69IU6TDSZeuoepWmeR4C2w6f6GWrTUvqmT1NxN8qbpWP4Q4d2ySbbu2Eu3IA57D8yjGqWof4S86tF6+Z/mXyHHqC09z5X3/eeSwNh73i4G7cXDvw7Hbfbc9VWqErk2Y22zszSdo+ek19tGYfQukr7QzBafEL1Ya2udJFdKNlO2CXeRrGmMv4GuGwPCRtu5Wzq5qZhWHdkCs0pxLSCj09rM6oqS53Smhu9TU1FvENUyaETSVEXHMXCN7O73Z3Tg/wAXECerWllgt1xzmpyHIo+LEMapjc7txNaWz8B/E0w4wY3Plk4WiNxbxtDwDuofkV+uOUZzdchusne19fUuml2c4tZueTG8RJDGjZrQSdmtA9ijTk3Y1sq1WrjFTg7Rhrl1trVH4L1n/KTHNdQ/phpbpljXzR83fRCzzW/ynyrvfLO8qHz8fDwDu9uPh23d0339isePtHXWi7S1j1CtuM0gp6bFKbG7pY7hUeU011pI6ZtPKyQ8DdhIGh22x4SBvxAHfrchTpM2WkztbdO0ThcOjuf4NgGh9t0/s+V25kFZLBfpqyp75kzJGyOklYSY2hr2thbwAGQnc7ALqskHiCdDbeYkm29YLYta2JRAVgaaYzSZPqbFHd3d1jdsp5LnfZdieCkgAdINmuDzxHhZ5m7hx7gHZV+rsymd+BaE2vTunbHFfL5Gy65WXQtMsQJa6lpCSA+Msa0SPY5u4c/zXcLyCr3I1uMqT0VRpO056k9y2y+Cy62kQLNMrqMyz6ovMtJHbKQRsp6C3QOJhoaeNvDHDGOgAA3PCGguc4ho32UUQhSlYuQpwpU1TgrJakCB1CEDqFIxsQhCAHHQLKwOgUrwrEbnm+o1ux62RSF08gNTOyPjFLDuA+ZwJA2aD0JG52aObgEZGKpUhRpupN2S1tk/0+o2YdgNy1XvNojrBTSMpMWgrYndzVVznEmYEHpC1jzzHCXbhrmvYCKgqKiorLhPV1c8lVVTyOkmmmeXvke47uc5x5kkkkkqd6i5VQZFl8NBj9JHbcPssbqKx0sDpOAxB5JnIfse8lPnOJAcfNDuIguNfJVvZRwlOb0sRVVpT2e7FZR/u+tvZYEIQmNgwWxa1sQQCceEJE48IQgMq2cGsNts2NS6j5rZ5K/GaeTuLRQuPCLrW8y1hHCQYWhjy9x2G7eHZ+zmGH4bi1RmGd09ojqo7bSiN89fcJ2kw0VPG3ikleegAA2HEQC4tBI33XKZ3l1JlF/oqeyWz5ixS1U/ktntweT3cfEXOleNyO9eTu4jmdmglxHEVet2NViZSrz9Gg7X1ya2LYl1y/BJvU7EXu93uV+yWsvF4rJK+5VUnHPPKebj0HIcgAAAANgAAAAAAuOQhTsL8YxjFRirJAmb7UqZvtQhhkIQkAZvRMlb0TLII8zkbTablfsko7RaKOSvuVVJwQQRjm49TzPIAAEknYAAkkAEqzMnyOy2HTc6d4g2nqYZe7fkt7YRL85VLCHcELyB+IY8ea4Ab7cuRc6Tla99Xo3hktmoa+n/AAhXunHztLTuDpLJT7BzYI3gcpZOLic4O5BjSB4JDR7eixr1nc00LY6aqv7OLvH95r7z6k+bv53unohoZ6rOLe8/FSq2lUuhnqs4t7z8VKraVKXOZw7lL2jX78vzMFE8+9BeafUNZ9g9SxRPPvQXmn1DWfYPSrMq4bpEO1cTzHTN6JUzei2CPR56FaHeq5i/vPxUqthVPod6rmL+8/FSq2FRlzmeeuUvaNbvy4sFHstrqq2aVZNcqGXuK2ktNTPTycIdwPZE5zTsQQdiByI2UhUUzz0G5n9RVf2D0qzKmHSlXgnldcTzTqKieqrpqqqmkqamaQyTTSvLnyOJ3LnE8ySTuSVqQhXz0WkkrI9BdD/Vexj3n4qVWuqo0P8AVexj3n4qVWuqMuczz9yj7Qrd+XFgornfoQzL6jq/sHqVKK536EMy+o6v7B6Fmith+kQ7VxPNYeIJ0g8QTq+8z0Od/NE/Vkxn3j4mVWoqr0T9WTGfePiZVaioS5zOA8o+0K3flxYKLZ16Esx+o6v7F6lKi2dehLMfqOr+xeoWZWw/SIdq4nm4st6rCy3qr56EeZ350W9WfGvePiZVaSq3Rb1Z8a94+JlVpKjLnM4Hyh0+t35cWCi+cehXMPqSr+xcpQovnHoVzD6kq/sXKFmV8P0iHauJ5xoQhXz0Gd89F/Vpxr3j4mVWiqu0X9WnGvePiZVaKoy5zOCcodPrd+XFgoxm/oYy/wCpar7Fyk64HKfIvwZZH85d/wDN3zXUeVeTcPe933TuPg4uXFtvtvy3ULMq0HavB9a4nnNBBNVVsNNTQvqKiV4ZFFEwue9xOwaAOZJPIAKyINNa+hoobhmlzpcJtcjA+N1We9qpgR/vdOw8ZLSWcQPCWh2/sIST59DZ6Ka34BaGYzTvYYpbnKRNcqlpHCSZTyiDgGOLIwOF7d2uVfTzzVNbNU1Mz6ioleXyyyvLnvcTuXEnmSTzJKu62dwvi62X7NfOX0r+rsO/GmnzL+BOy/R7y35n/HeT/OPB3/8ADP4uLg83xcW23s2U7VY6N+rfjnvHxMis5U5c5nF8ctHG1Ve9pS4sFGc19DWW/UtV9i5SZRnNfQ1lv1LVfYuULMwYf7eHauJ54rI8QWFkeIK+zvg6EIQgO/Ha+/J26h+4f1hTrxDXt52vvyduofuH9YU68Q1zPyA9j1P4j/LA9A+UXTY91cWM3omSt6Jl1Q+SBCEIEeYDqFsWsdQtikgE46BInHQKAMpm9EqZvRBDyGQhCBATN6JUzeiAGQhCAHHhCysDwhZQY2M32pkrfamQALYta2IIBCEIIYJm9EqZvRAoyy3qsLLeqCHkOhCEEIFsWtbEqBghCEwozeiZK3omQBkeIJ0g8QTqNoAhCFDFYDqFsWsdQtilCgmb7UqZvtQ8iHkMsjxBYWR4gjYDHQhChCAhCEoDN6JkreiZNsE2mW9U6RvVOlB5gOoWxax1C2JmQC5rHLBccqzu047aYu9uFwqWwRbtcWs3PN7uEEhjRu5xAOzWk+xcKrx03dTYjohnupFVFI25Oj+YManjlDSyrqI3GaRjg0vjkii4Xh+7QQXtB3dyxt2RrsbWlQw7lBXk7KK627L4bX1JnCay5Lash1ldS4/FHHjVgoorLaHRv4xJBT7gO4+N3GC5z+F2/NnATz3VWDwhInHhClKysZMPQjhqEaUcoq3/AJfWzKyPEFhZHiCksjoQhSgNiEKzdIrBbr5rTST32PjxmzU0t3vLi1r2sp6dvH5zCD3jC/u2uY1pJa47D2hW7K5Tr1o4ejKrLKKb/wDC63kiT5vQy6e9nTE8I38lv+Q/v3kkRifHM2MebSU7iWt3Y38Y50TuItlYSCBtvR6keZ5RWZpqje8nrm91NX1Je2LcHuYwA2OPcNbxcLGtbxbAnh3PMlRxRFWWsrYKjUo0F53ny1y7Xs7FkupIEIQmNiZHiCdIPEE6BGC2LWtiCC0dMLNa33C+5nkdFHccZxeiFVUUkw3ZWVMhLKWndtuQHycy7hczzNnjZyhOQX64ZPm91yC6yd5X19S6aXZzi1m55MbxEkMaNmtBJ2aAPYrJ1G/tQ0+xrSuLza2j2u+Se3evnjHBF7R+KhLW8Ubyx/FuQCFTreiRa9ZqcIvPzli397VHurJ/zP1r7tFPIZCEJzavIEDqEIHUIENiEIQA46BXRVNp9PeztFRslkGaZpRxVFR+KAFFai9xY1krXb7zlrS5u5BYC1zWloLuG0uxuiuWS1mUX9kZw/GY2113D5I95yOIw07WP5PMr2cPCdgRuNwXN3h+UZJc8uz25ZHeHxuuFbIHSCGPgYwBoa1rR+ZrWtaNyTy5knclHrdjUVf+axKormws5dbzjH/M/wCXY2cG3omSt6Jk5twQhCBGC2LWtiCAX001PUVddBSUkElVVTSCOGGJhe+R7js1rWjmSSQAAvmVz4HT0OGYFUaoXqCjrK1sjqbFLXWsfvU1TXM4qobcnRwgnnzHGCOJjwwlW7Ip4mv5ilpJXk9SW9vJfq9iuzOYtp9PdOxp1QSyOyG5RwVWYvliBEbwGy09JGeIt2ZxlznN34iW+dtuxtOt9q2VFRUVdfPV1c8lVVTSOkmmleXvke47uc5x5kkkkkrW32qUrIjD0XQpWk7yeuT3v9NiWxJLYMhCFLLIJm+1Kmb7VCAZCEJAGb0V0YrS0mnOGU2oGS2Xy2+V3+4+hqd+7JaAX1krdvC3ij7vnxOJ3AA4ZGxzA8VpLgK3K8npqgYFZvPucsJLXVEh2EdNHt1c57mB3Noa125czdpMeyrI6vKczqbpUN8np/4Kgomkd3Q07Se6gjDQ0BrG8uTRudyRuSpet2NNX/5uq8PHmLnv/Lfe85fu6turg6ionq6+eqqp5KmqmkdJNNK8ufI5x3LnE8ySSSSVrb0Spm9FO02iSSsj0Q0M9VnFvefipVbSqXQz1WcW95+KlVtKhLnM878pe0a/fl+Zgonn3oLzT6hrPsHqWKJ596C80+oaz7B6VZlXDdIh2rieY6ZvRKmb0WwR6PPQrQ71XMX95+KlVsKrNFaeem7MWLR1EMlPIY5pA2RhaS19RI5jtj7HNcHA+0EH2q01QlzmeeeUWnyhWa9+XFgopnnoNzP6iq/sHqVqKZ56Dcz+oqv7B6FmithukQ7VxPM5CEK8eiz0F0P9V7GPefipVa6qjQ/1XsY95+KlVrqjLnM8+8o+0K3flxYKK536EMy+o6v7B6lSiud+hDMvqOr+wehZorYfpEO1cTzWHiC+iCCeqroaWlhkqamaQRxRRMLnyOJ2DWgcySTsAFyWP47esoyNlqsNvkuNcY3SGNhDQ1rernOcQ1o6DckcyB1ICsJ2UW7AceuWP4dJHXZFUxiG55TFJyaOfHBSDbcMBDR324LiC4AbRlt6T16jvdau4y83SWlPdfJb3uX4vZtt240us9VYNC7HaK2SCStpu+bUCnmErY3meRzoy4cuJhJY7bcBzXDc7bqfqq9E/Vkxn3j4mVWoqMuczhePUljqqk7vSlxYKLZ16Esx+o6v7F6lKi2dehLMfqOr+xeoWZgw/SIdq4nm4st6rCy3qr56EeZ350W9WfGvePiZVaSq3Rb1Z8a94+JlVpKjLnM4Hyh0+t35cWCi+cehXMPqSr+xcpQovnHoVzD6kq/sXKFmV8P0iHauJ5xoQpxYcFuF1x9t/uVbS43i/G5pulwk4RKW+JkMY86V+weQ0DYljm77jZXm7HfatWnRjpTdl/vLe+o7d6L+rTjXvHxMqtFQfTiOxQ6OWqLGZ6qqsbHztpZq0ASyATyAuOwHIu4iOQPDtuAd1OFSlmzhGOlp42rK1rylnnmwUYzf0MZf9S1X2LlJ1GM39DGX/UtV9i5QszBh/t4dq4nnUti1rYr56AO9Wjfq3457x8TIrOVY6N+rfjnvHxMis5UZc5nCOUOn1u9LiwUZzX0NZb9S1X2LlJlGc19DWW/UtV9i5Qsyth/t4dq4nnisjxBYWR4gr7O+DoQhCA78dr78nbqH7h/WFOvENe3na+/J26h+4f1hTrxDXM/ID2PU/iP8sD0D5RdNj3VxYzeiZK3omXVD5IEIQgR5gOoWxax1C2KSATjoEicdAoAymb0Spm9EEPIZCEIEBM3olTN6IAZCEIAceELKwPCFlBjYzfamSt9qZAAti1rYggEIQghgmb0Spm9ECjLLeqwst6oIeQ6EIQQgWxa1sSoGCEITCjN6JkreiZAGR4gnSDxBOo2gCEIUMVgOoWxax1C2KUKCZvtSpm+1DyIeQyyPEFhZHiCNgMdCEKEICEISgM3omSt6Jk2wTaZb1TpG9U6UHmA6hbFrHULYmZBvpqaprbjT0dHTyVdXPI2KCCFhe+V7js1rWjmSSQABzJVuawVNNbbjiunlvqI5qTErS2lrBTvEkLrjKe9rHxyHzyC8tBa7bhcxwDW7czRumprZlV51HutPHU2TDqI1j4ZWB4qKuXeKkh9pYTIeISBrgwxgnbcEVTcrjWXjI7hdrjN5RcK2pfU1UvAG95I9xc52zQANySdgAFizl2GmlfEcofu0l/XJcVH8JnxJx4QkTjwhObUysjxBYWR4ggB0IQpQGxXPef7Ruy7asbb5l/zTurvdfb3dvjcfI4v4zTxv4puJpa9u3A4bbKJab4zHlesVnt1YyP5khk8rvMtRI6OGGji8+Z0kjf4MFoLQ4kDic0bjfdaNQ8r+m+tOQ5Q2HyeGtqR5PGWcLhCxoji4hxO8/gY3i2JHFvty2WN63Y0lb/mMZCh92Hry7b+ovneXbFbyGLYta2JzbghCEAZHiCdIPEE6BGCvTRy1Udr+kGql+pPKLHitPx0kUjDwVde/zYYwe7cPNLgS4bFjnxO6bqkaamqKy4wUlJBJVVc8jY4YYWF75HuOzWtaOZJJAAHVXrq3JT4jh2L6RW50b3WiNtwyCaNo2qLhMzfxGNpcGMfs1253Y9jXc40kteo0mPbq6OEjnUz6oLnP46orrZSlxuFZdshr7rcJvKK+tqH1FTLwBvHI9xc52wAA3JJ2AAXyt6JUzeic3KSirLUkMhCEA8gQOoQgdQgQ2LdTU1RWXCCkpIJKqqnkbHDDCwvfI9x2a1rRzJJIAA6rSri00t8WP4/eNV7rDTzUFj4qey087mO8rujmjummMkFzYw/vXEFrhwhzd+FwEN2RUxNdYei55vJLe3qS+LH1FfSYphFk0stlwp7lJbqh9fkVVSuLopbi8FgjHENx3MYDN2kBxceJrXNIFPLdUVNRWV89XVzyVVVPIZJppnl75HuO7nOceZJJJJPVaUJWQYaj5iiot3ebe9vW3+m5WWwZvRMlb0TKS2CEIQIwWxa1sQQSrDcWqMwzuns8dVHbaURvnr7hO0mGip428Ukrz0AAGw4iAXFoJG+65TUDJaS/Zo6jsTfJMOtW9LYaKMnu44QdjKAQHcUrgZHF4LyXAOJ4Qpbe5JdNtDIsRpa/ustyTgrMjZA57JKKk7v8TRStcOTnd49z9uFwG7XBzHAmlx4QkWvWamhfFVniHzVqh/eXxyX7utc4ymb7UqZvtTm1eQyEIQxATN9qVM32qEAykWK4resyzOmsVipvKKyXznvcSI4IwRxSSO281o3HPqSQACSAY6riyKB+menrsOa6NmbXeNs1/q6WVrjSUjh5tvLgSd3ECSQt4QQWt/GNIKxtlHE1pQSp0+fLK/4t9S/F2W04TOsjstWKLF8LbUUuFWv+BExAfcKjmH1kg2BLnDZreLwtHIMBLBXiVvRMsiVkPSowoU1CP45t7W+t7QTN6JUzeiNpnPRDQz1WcW95+KlVtKpdDPVZxb3n4qVW0tfLnM87cpe0a/fl+Zgonn3oLzT6hrPsHqWKJ596C80+oaz7B6VZlXDdIh2rieY6tvFsds9h04GoeXOgqYZe8ZjdleBJ841DCW8czAR+IY8ecCRvtz5FrZOHwbHbNV+W5PmTp6XDLZ/CmEAOuFRyLKOM7glzhu53D4WjmWbh44DJ8iqsozCpulQ3yen/AIKho2kd3RU7f4OCMNDQGsby5Abnckbkq7m7He6sp4mo6FN2S5z/AMq63texdbuu/Gkl2uN97P8AY7vd6uSvuNVJUvnnkPNx8plA5DkAAAABsAAAAAAFZCqfQ71XMX95+KlVsKnLnM4ZyhGMcfWjFWSlLiwUUzz0G5n9RVf2D1K1FM89BuZ/UVX9g9CzRXw3SIdq4nmchCFePRZ6C6H+q9jHvPxUqtdVRof6r2Me8/FSq11RlzmefeUfaFbvy4sFH8spfLtLMmofKYKPyi1VEXlFVJwQxcUThxvd/FaN9yfYAVIFFc79CGZfUdX9g9QsyrQu68Lb1xOkFyzGls2I1+GYR+JstRwtuV5fGWVl1IBDt+f4uE77Nj68IPEd3vBrhIPEE6v2segaVGFFWjm9be1ve/8AfZqO/mifqyYz7x8TKrUVV6J+rJjPvHxMqtRUZc5nCOUfaFbvy4sFFs69CWY/UdX9i9SlRbOvQlmP1HV/YvULMrYfpEO1cTzcWW9VhZb1V89CPM786LerPjXvHxMqtJVbot6s+Ne8fEyq0lRlzmcD5Q6fW78uLBcDlVFU3LTDJLdRRd9WVVrqIII+IN43vic1o3JAG5I5k7LnlF849CuYfUlX9i5QsytQv5+Ft64nT6JmEYDTsmnfQ6h5b+MZ5PE/vLTSBzBwPJLPx7ufQEAbuHmuY1xgV/yjIMpubau/3We5St/g2yECOPcAHgY3ZrN+Fu/CBuRudyuBQryR3elhoU5+ck9Ke98FuXZ8bnfPRf1aca94+JlVoqrtF/Vpxr3j4mVWiqUucziPKHT63flxYKMZv6GMv+par7Fyk6jGb+hjL/qWq+xcoWZWw/28O1cTzqWxa1sV89AHerRv1b8c94+JkVnKsdG/Vvxz3j4mRWcqMuczhHKHT63elxYKM5r6Gst+par7FykyjOa+hrLfqWq+xcoWZWw/28O1cTzxWR4gsLI8QV9nfB0L6aOirLjco6O30k1dWSb93BTxGSR+wJOzQCTsAT/QFYdFpbeh5JNktxtmGUlRwuidd65kcsrDsXlke+/E0EbtcWHdwHLnst0itVxFCh9pJLq2/BZs7Wdr78nbqH7h/WFOvENe3na+/J26h+4f1hTrxDXNfID2PU/iP8sD0V5RdNj3VxYzeiZK3omXVD5IEIQgR5gOoWxax1C2KSATjoEicdAoAymb0Spm9EEPIZCEIEBM3olTN6IAZCEIAceELKwPCFlBjYzfamSt9qZAAti1rYggEIQghgmb0Spm9ECjLLeqwst6oIeQ6EIQQgWxa1sSoGCEITCjN6JkreiZAGR4gnSDxBOo2gCEIUMVgOoWxax1C2KUKCZvtSpm+1DyIeQyyPEFhZHiCNgMdCEKEICEISgM3omSt6Jk2wTaZb1TpG9U6UHmA6hbFrHUKwNMMYjzLX3FsdnZHLSVNaH1ccsjmCSCMGWVnEzzgXRseBttzI5jqJk7K5grVYUKMqs8opt9iVya5hFHhHZfwrE6OpjN1ymNuQ350QcHugIAooePhaHRgcbjG7i4ZWlwIBG9HKa6i5Z9OdbMiylsPk8FbUjyeMs4XCFjRHFxDicOPgY3i2JHFvty2UKSRVkUcFSnSw6dTny9aXa9dvhzV1JAnHhCROPCExsDKyPEFhZHiCAHQhc1jlguOU51asetMXe3CvqWwxbtcWs3PN7uEEhjRu5xAOzWk+xGQk5xhFyk7Ja2WvbXU+G9jS6XN8UkOSZtWuoLfOyUNLLfTuaZ3Nc1pID5N4nxuc3jHCdiGneklZurt/t181pq4LFJx4zZqaK0WZoc17WU9O3g814J7xhf3jmvc4ktcNz7BWSWOVzVYCEvNOtNWlUek+q+S+EUk+u72gti1rYmNoCEIQBkeIJ0g8QToEZb+kFNT23KLxqHdII6iy4jRGrdDKwOFRVybxUsPtLCZDxCQNcGGME7bgisLjcKy7ZDX3W4TeUV9bUPqKmXgDeOR7i5ztgABuSTsAArV1H/ALT9Pca0qi82to9rvkvt3uE8Y4Iue4/FQlreKN5Y/i3IBCp5Ites1GDSrTli397VHuLJ/wAzbl2NXyBM3olTN6JzbDIQhBDyBA6hCB1CBDkLdb6u7ZBQ2q3w+UV9ZUMp6aLiDeOR7g1rdyQBuSBuSArQ1UvDKS4W7Tay1skmM4rH5K4AuayrrgXGpqCx3MHvHvaGlzmt2dwHZ5W7Tv8AtR0/yTVKXzayj3tON+3evnjPHJ7R+KhLncMjCx/FsCCFTqTN9hqUlicY5Pm0tS7zWt/yp2XXKS2DjoFlYHQLKc2wzeiZK3omQAIQhAjBWvptj9J+++eZJbPLsQx2ndNJFPGe5rqs7NgpSRv1e9jnHhc0AAPHC9VpbqCrut/obXQReUV9ZUMp6aLiDeOR7g1rdyQBuSBuSArR1MrrZaILZprjtVJVWnHpJfnKqfB3Jrri5xEsjmg7ODABGwkcTQHDic3ZxV7jVYuUqjjhoOznm90dr6m8l1u6yK4u93ud/wAmrLxeKyS4XOqk7yeeU83HoOQ5AAAANGwAAAAAAXwDwhInHhClZGyjGMIqMVZIymb7UqZvtUkvIZCEIYgJm+1KpVhmL1GX51BaI6qO20ojfPXXCdpMNFTxtLpJXnoAANhuQC4tBI33Sp2RjqVIUqbnN2S1smGEU9PiWNy6l3iCOSemk7vFrfVsHd3Kq5tfLtzcWQbh24DQX8ID2uGxrS4V9XdL9XXOvl7+urKh89RLwhvHI9xc47AADcknYDZSnN8op8jySKGz0slpxS3R+T2S1ucNqaLlxOO3V8jgXvcS5xJ2LncIKhaxreU8NTk269VWnLZuWyP931t67WGb0TJW9EyzF15gmb0Spm9FG0g9ENDPVZxb3n4qVW0ql0M9VnFvefipVbS18uczztyl7Rr9+X5mC4PJ6OC46bZDb6qujtlLVWyeGasl24Kdro3NMjtyBs0Ek7kdOoXOKJ596C80+oaz7B6VZlSgm68EnbWuJ0EzvMoMnr7db7PbI7JidnjfDZqBrRxsa4gvkkdzLnvLQTzO353Hic6CN6JUzeivpWPRNGlChTVOC1L/AH829be1noVod6rmL+8/FSq2FU+h3quYv7z8VKrYVKXOZwHlL2jW78uLBRTPPQbmf1FV/YPUrUUzz0G5n9RVf2D1CzRVw3SIdq4nmchCFePRZ6C6H+q9jHvPxUqtdVRof6r2Me8/FSq11RlzmefeUfaFbvy4sFFc79CGZfUdX9g9SpRXO/QhmX1HV/YPQs0VsP0iHauJ5rDxBOkHiCdX3mehzv5on6smM+8fEyq1FVeifqyYz7x8TKrUVCXOZwHlH2hW78uLBRbOvQlmP1HV/YvUpUWzr0JZj9R1f2L1CzK2H6RDtXE83FlvVYUgx7Gbvkt0dBbaf8RF51ZWzeZTUbNi4yTSdGNAa48+Z4SACeSvnoGpOFOLlN2SO7Wi3qz417x8TKrSUH02prLR6J2Kmx+5PvFqjZII6ySExGZ3evMh4HAFo4+MAHoAOZ6mcKjLnM4JjpKeNqyW2Us9TzewFF849CuYfUlX9i5ShRfOPQrmH1JV/YuULMw4fpEO1cTzjQhCvnoM756L+rTjXvHxMqtFVdov6tONe8fEyq0VRlzmcE5Q6fW78uLBRjN/Qxl/1LVfYuUnUYzf0MZf9S1X2LlCzK2H+3h2riedS2LWtivnoA71aN+rfjnvHxMis5Vjo36t+Oe8fEyKzlRlzmcI5Q6fW70uLBR3L4JqnSfKKamhfUVEtpqWRRRsLnvcYnANAHMknkAFIlwWUVlTbtNMiuFHJ3NZS2yomgk4Q7ge2NzmnY7g7EDkeShZlWjfz0bZ3XE6V0emt+FtjumRuhw+xncvq7q8MkOxO7GQ/wAI6Tha5zWEDiDeR5jf6xLpbYTwMpbnntYPMfJLKbfRuB87jYG7yhzeTNncj5x/vVXdZW1txuUlZcKuavrJNu8nqJTJI/YADdxJJ2AA/oC+YeIK7Z7TtnmK1T7ao+yPqr5878V2Fi1mp2Ty22ShtHkWJ2+TYyU1ipG0oc8EHj4hu8OIDQdnAENA267wKeeaprJqmpmfUVEry+WWR5c57idy4k8ySeZJWpClJIs0qFGiv2cUv97Tvx2vvyduofuH9YU68Q17edr78nbqH7h/WFOvENc08gPY9T+I/wAsD0T5RdNj3VxYzeiZK3omXVD5IEIQgR5gOoWxax1C2KSATjoEicdAoAymb0Spm9EEPIZCEIEBM3olTN6IAZCEIAceELKwPCFlBjYzfamSt9qZAAti1rYggEIQghgmb0Spm9ECjLLeqwst6oIeQ6EIQQgWxa1sSoGCEITCjN6JkreiZAGR4gnSDxBOo2gCEIUMVgOoWxax1C2KUKCZvtSpm+1DyIeQyyPEFhZHiCNgMdCEKEICEISgM3omSt6Jk2wTaZb1TpG9U6UHmA6hXritNU4j2R84zWWnkp6vI5I8cs1SGEnunF0lYS13mGN7I+7D28Tg9jgOHYlUjS01TW3Ono6Onkq6ueVsUEELC98r3HZrWtHMkkgADmSrn1o/eK84npvD5kGJ2SKKrYzzon11QBUVMsb3ee5jy6Pk7bYggNaOsT1tI02NfnqtLDL7z0n3Y2f4y0V2NlKoQhSbZgnHhCROPCECmVkeILCyPEEAOru0xqJMI00y/VN7YxVxRmyY4XwtefL5mh75Wkh3AYogXec3heHlnEOYNIq7tXoo8Rt2LaVUNTHJFZKJtZezAHAT3KoHE9zjwtEgZGYxG4t4mseWkk7gK9eo0+OtWcML77192NnL56o/zFKoQhMbQFsWtbEACEIQBkeIK29HbfRt1Qfl96h4saxWnddK95eWbyMB8njY7cNMrpuAsY5zQ/gcOfQ1IPEFd2SOp8Q7J+KYrFFJT5Bk8gvt4eJQCaQFzKSMlrdnxuH40Mc4lj2uJALhsstxqOUJOVNUI51Ho9i+8/gr2e9oqe9XWovuZXa+VbI46u41stXMyEEMa+R5e4NBJIG5O25P9K+Ba1sTGxjFQioxyQJm9EqZvRAwyEIQQ8gX22231d2yGgtVvh8or6ypZT00XEG8cj3BrW7kgDckDckBfErj05/tR0/yTVOXzayj3tGN+3evnjPHJy3H4qEudwyM4H8WwIIUN2RQxVZ0KLlFXk9SW9vUvhfPcrvYfNqrcKSmyC04DZ5u+smI07qFsvCW+UVbncVXNs4cTeKXdvBxOaODdp2cqpQhCVlYfD0Vh6Kpp3tm97etvtbu32jjoFlYHQLKksjN6JkreiZAAhCkmIY1V5hqZZsaond3NXVAY6XYHuowC6STYkcXCxrncO4J22HMhGRhqzhSg5zdkldvqRYWDup8E0xrtS6yKQ3+oklt2IxiUMLZTE5s9YWObtJHGHBgI4m8Zc1wBIc2nVYmpt8t9wzansGPycWKY7Ti22rhc3hn4D+NqTwHgc6WTicZGgcbQwkbqu0q3muwcJNPETXrT19kfur4J3fW2CceEJE48ITI2ZlM32pUzfagh5DIQhDEBXVlcMWnWkLdPms2y289zW5TLHVMmjhjY57qekAA81w3bI4jY7kbOe1w4eM01orbaIbnqRkVLJU2nH5Ivm6mbP3Jrrg5wMUbXEbODADI8A8QAaeFzd2mtq6vq7rfq6518vf11ZUPnqJeEN45HuLnO2AAG5JOwACxrWzUyvisTofcptN9cs0v5dTfXbcz5UIQg2wzeiZK3omWQR5gmb0Spm9FG0g9ENDPVZxb3n4qVW0ql0M9VnFvefipVbS18uczztyl7Rr9+X5mCiefegvNPqGs+wepYonn3oLzT6hrPsHpVmVcN0iHauJ5jpm9EqZvRbBHo89CtDvVcxf3n4qVWwqn0O9VzF/efipVbCoy5zPPXKXtGt35cWCimeeg3M/qKr+wepWopnnoNzP6iq/sHqFmirhukQ7VxPM5SHF8XvGYZjTWSyU3f1cvnPe4kRwMBHFI938Vo3HPqSQACSAeOtNpuN8yKktNppJK641UnBBBGObj19vIAAEknYAAkkAKx8ir/oBY7pp9YK3va+p4G5RdIJt21Dw0/uWHY+bGzjc15Oz3uLgQ1o4Tcb2I77XrST81St5x5X2L3n1bltere13J0zo7VbtFbRb7JWyXO3UslRCysk4NqhzaiRskjeEkcDnhxZzPmlu5J3U8VUaH+q9jHvPxUqtdU5c5nCccnHHVU3e0pa9+tgornfoQzL6jq/sHqVKK536EMy+o6v7B6FmjBh+kQ7VxPNYeIJ0g8QTq+8z0Od/NE/Vkxn3j4mVWoqr0T9WTGfePiZVaioS5zOA8o+0K3flxYKLZ16Esx+o6v7F6lK4XJJLfDp3f5bvA+qtTLdO6thiOz5IhG4va3mOZbuBzH9IULMqUHatF561xOg2G4jBfZpbrfrkzH8Ro37VtxmcGmRwaX9xAD45S0E7AHYc9iS1rs33MX1Ngdi2ORPs2Fxva5lI7h7+se3/f6h4G73uOxLQeBvCwAeYCuOyvKqrKb2yTySC02im4m221UbAyno2OdxENaAAXOPNztgXH8wAAi7equ2vrZ3WNGdWaq189kc1Hr65dezZvffnRb1Z8a94+JlVpKrdFvVnxr3j4mVWkqcuczinKHT63flxYKL5x6Fcw+pKv7FylCi+cehXMPqSr+xcoWZXw/SIdq4nnGhCFfPQZ3z0X9WnGvePiZVaKq7Rf1aca94+JlVoqjLnM4Jyh0+t35cWCjGb+hjL/AKlqvsXKTqOZhBNVaS5TTU0L6ioltFSyKKJhc97jE4BoA5kk8gAoWZWoaq8O1cTzmXL2iy3a/wB6Zb7Nb57jWO2Pdws34QXBvE49Gt3cN3EgDfmVPY8OsWIxT1WoVcyS5Rs4qbGrdVB9RI8OB4aiRoc2FhaWnkeItcS07t4TxN3z+7VtmfZbNBBiuOHcfN1sHB3o4SzeaTxyuLCGuJOzuEEt3V298jt3pE62rDq695834bZfDV1ncPTS01Ni0TstqrZIH1lP3wnFPMJGxvMzy6MuHLiaSWu25BzSNztup2qx0b9W/HPePiZFZypy5zOMY5SWNqqTu9KXFgozmvoay36lqvsXKTKM5r6Gst+par7FyhZmDD/bw7VxPPFZHiCwsjxBX2d8HQhCEB347X35O3UP3D+sKdeIa9vO19+Tt1D9w/rCnXiGuZ+QHsep/Ef5YHoHyi6bHurixm9EyVvRMuqHyQIQhAjzAdQti1jqFsUkAnHQJE46BQBlM3olTN6IIeQyEIQICZvRKmb0QAyEIQA48IWVgeELKDGxm+1Mlb7UyABbFrWxBAIQhBDBM3olTN6IFGWW9VhZb1QQ8h0IQghAti1rYlQMEIQmFGb0TJW9EyAMjxBOkHiCdRtAEIQoYrAdQti1jqFsUoUEzfalTN9qHkQ8hlkeILCyPEEbAY6EIUIQEIQlAZvRMlb0TJtgm0y3qnSN6p0oPMt7RG3Uc+twyC6Q+U2jFrbUX+thY8iV7aZu7O72IBeJXRu4XODSGnc+w1lcrjWXjI7hdrjN5RcK2pfU1UvAG95I9xc52zQANySdgAFcJljxHsKwwCmjkuWfXdz3VAL3BlFQSNAYQXANk78kjZrgWPduQQ0CkVGbbNNhf22Jq4jZfQXZG938ZNr+VfAQhCk2zBOPCEiceEIFMrI8QWFkeIIAtfRy001brG2+V75G2vFqKXIa1lOR30rKXZ7WRgjhJMhj3BLQW8XnA7Kvr3dqm/Znd75WMjjq7jWy1c7IQQxr5Hl7g0EkgbuO25J29qtWf+1bsQ0McfmXDOL0+WWWLz2voaE8Iik4vA8VDuMFg5t6u/iql0sdbuajC/tsRUxGy+guyL1/OV18EbEIQmNmC2LWtiABCEIAnWm+NMyrWKz2+rZH8ywyeV3mWeR0cMNHF58zpJG/wYLQWhxIHE5o3G+6+XO8lfmGsGRZI58joq6tc6mE0bWPZAPNhY4N5btjaxp5np1J5me2Od+C9k+9Xotjbes4kdbLY4wtc+KghJFXIH7O5Pc4RGM8DuTXgnYbUskWt3NNRvXxc62yPqR/zPxer2xBbFrWxObUEzeiVM3ogBkIQgh5H2W631d2yCgtVvh8or6yoZT00XGG8cj3BrW7kgDckDckBWXqtcKSmyK04DZ5u+smIU7qBsvAW+UVbncVXNs4cTeKXdvBxOaODdp2cuS0llZidvyfVGupo5I7LRupLKJi4Ce4zjhY1o3aJA2MyGRvFxNY4OAJ2IpYdQkzl2GmX/MY1v7tLLvNa/DF2/mZsQhCc2w46BZWB0CygBm9EyVvRMgAVwWf+0rs0XTIXeZfcx7y02v293QRuHlcn8Zp43cMXC4Ne3biadt1A8QxqrzDUyzY1RO7uauqAx0uwPdRgF0kmxI4uFjXO4dwTtsOZC5jUfJaTJtTJX2lvdY5baeO2WOLcngpIRwxndwDzxHif5+7hx7EnZI9bsajE/t68cOsl60uxP1V/NJfFRktpA1sWtbE5swTjwhInHhCEBlM32pUzfagh5DLl7BY6/Jc0tlhtkfeV1dUNhi3a4tZueb3cIJDWjdzjsdmgn2LiFcePSswHQibMjTxvyjIpJqDHpnFwfQ07GllTVRuYeT+JwjG/C4bcQLmlwKydka/FVpUqXqa5y1RXW/7JXb6kziNSr7aKq8WzFMXEn0TxqOWkoZJZmTGqldIXT1PG0cxI4AgAluzQQG8XCK1b7UqZvtRFWRloUY0KSpx2fi3rbfW3rYyEISlgZvRMlb0TLII8wTN6JUzeijaQeiGhnqs4t7z8VKraUB0vx65YroRj9iu7Y47lTxyOnZG/jDDJK+QN3HIkB4B23G4OxI2Jny10uczznj5xqY6tOLunKTT6rsFE8+9BeafUNZ9g9SxRPPvQXmn1DWfYPULMwYbpEO1cTzHTN6JUzei2CPR56FaHeq5i/vPxUqthVPod6rmL+8/FSq2FRlzmeeuUvaNbvy4sFFM89BuZ/UVX9g9StcJk1yns2nGQXilZHJU0NtnqYWygljnRxucA4Ag7bjnsQlWZUoNqvBrW7ridGqyNmmGKUTKSojfqHdKTvKuXZzZbDTyMBbEwEDgqJGuPE87OY0ENA4g91RrbUVE9VXTVVVNJU1M0hkmmleXPkcTuXOJ5kknckrUryVj0FQoukm5O8nm/wC3Yti/u236C6H+q9jHvPxUqtdVRof6r2Me8/FSq11SlzmcH5R9oVu/LiwUVzv0IZl9R1f2D1KlFc79CGZfUdX9g9CzRWw/SIdq4nmsPEE6QeIJ1feZ6HO/mifqyYz7x8TKrUVV6J+rJjPvHxMqtRUJc5nAeUfaFbvy4sFFs69CWY/UdX9i9SlRbOvQlmP1HV/YvULMrYfpEO1cTzcWW9VhZb1V89CPM786LerPjXvHxMqtJVbot6s+Ne8fEyq0lRlzmcD5Q6fW78uLBRfOPQrmH1JV/YuUoUXzj0K5h9SVf2LlCzK+H6RDtXE840IQr56DO+ei/q0417x8TKrRVXaL+rTjXvHxMqtFUZc5nBOUOn1u/LiwUczCeal0lympppn09RFaKl8UsTy17HCJxDgRzBB5ghSNRjN/Qxl/1LVfYuULMrUNdeHauJ51LYta2K+egDvVo36t+Oe8fEyKzlWOjfq3457x8TIrOVGXOZwjlDp9bvS4sFGc19DWW/UtV9i5SZRnNfQ1lv1LVfYuULMrYf7eHauJ54rI8QWFkeIK+zvg6EIQgO/Ha+/J26h+4f1hTrxDXt52vvyduofuH9YU68Q1zPyA9j1P4j/LA9A+UXTY91cWM3omSt6Jl1Q+SBCEIEeYDqFsWsdQtikgE46BInHQKAMpm9EqZvRBDyGQhCBATN6JUzeiAGQhCAHHhCysDwhZQY2M32pkrfamQALYta2IIBCEIIYJm9EqZvRAoyy3qsLLeqCHkOhCEEIFsWtbEqBghCEwozeiZK3omQBkeIJ0g8QTqNoAhCFDFYDqFsWsdQtilCgmb7UqZvtQ8iHkMsjxBYWR4gjYDHQhChCAhCEoDN6JkreiZNsE2mW9VyFst1ZeMjt9pt0PlFwramOmpYuMN7yR7g1rd3EAbkgbkgLj29Vc+ilNTUeod2zm5U8c9qxG0zXQx1MYENRU8PBTQd47dscjpHcUZ2c7ij80E8wjdlcp4yu8Ph51UrtLUt72L4uyNOttxo59bvo/a5vKbRi1tp7BRTPYRK9tM3Z/ebgAvErpG8TWtaQ0bD2mpU9TU1Nbc56ysqJKurnldLPPNIXySvcd3Oc48ySSSSeZKRNaySDC0FhsPCle+ikr73tfxesEIQoLLBOPCEiceEIFMrlLHaam/ZraLHRvjjq7jWxUkD5iQxr5HhjS4gEgbuG+wJ29i4tXhoxLHjUOcanS00dY7F7SGUETi4kVtW7uIXloc0OjA7wP3duA7doJ22VuyKOMryw+GlUiryyS3ybtFfFtHD6z3amuGvdztluZJBZMfjjsdsp5QN4IqUd2W8W5Lh3gkcHOJcQ4b7dBVaEKUrajLh6Kw9CFJa9FJdvX8c2bEIQpMoLYta2IAF9ttt9Zd8hoLVb4fKK+tqWU9NFxhvHI9wa1u7iANyQNyQF8SubSH+1/6Xanv/G/RO3DySnHPvaur4qeHjby3iHE8v2c1w83bfmFDdkU8XWeHw8qkVd5Jb5N2ivi2kfHrDcKNuqTMQss3FjWKUzbVQMDCzeRgHlEj27BpldNxh72taH8DTz6mqUg8QToSsrBQorD0I0k72We97W+tvWwWxa1sUlgEzeiVM3ogBkIVr6P2+kbqc/Lr1DxY3i1O66Vzy8s3kYD5PGx24aZXS8BYxzmh3A4c+hhuyuVcTWWHoSqtXsst72Ltb1I5LVN1PjWHYZpnSRSUtXaKMV2QsMo2fcKljXlrw1oa8xs2a2QF3mPDd/NO9LDqF9lxuFXdsgr7rcJvKK+sqH1FTLwBvHI9xc52wAA3JJ2AAXxjqEJWRgwtB4egoSd3m3vbd2/m9XVqNiEIUl0cdAsrA6BZQAzeiZK3opNiGNVeYamWbGqJ3dzV1QGOl2B7qMAukk2JHFwsa53DuCdthzIRkY6k4UoOc3ZJXb6kTyz/wBpXZoumQu8y+5j3lptft7ugjcPK5P4zTxu4YuFwa9u3E07bqn1PNR8lpMm1MlfaW91jltp47ZY4tyeCkhHDGd3APPEeJ/n7uHHsSdlA0q3mvwkJqDq1FaU3drduXwVk+u72gti1rYmNgCceEJE48IQgMpm+1Kmb7UEPImGDYx9LdSaG1TTeSWtu9RdKxz+BlLSxjilkc8tIZ5o2DnDh4nNB6rdn2XPzLUOa4xwR0Vpp4xSWikip2wimpGE90zhaSAdiSeZG5IGzQAJrVvpMB7NlLbY4+7zbMKdtVVTtjIfTWpxPBE2Rr9vxpYHEAc2uc14BaxUskzdzTULYnESxDWqN4x/zS+L1LqV9oJm+1Kmb7UyNsMhCEgDN6JkreiZZBHmCtzTumoMdxi56nXhvettdR5JYaV0DZY6u4uic5veDfdrYhwyb+ad9i13E3hMFxLHKvLtSLPjlG7u5q6oDHSbA91GAXSSbEjfhYHO4dwTtsOZUl1ByigvV0ttix07YdYIPJbPxUzYpJtw3vZ5NgN3SPbxb7N5bEta4u3xvW7GpxTdeawsdqvJ7o7u2WXZpPNHdbRuuqrp2drJc66Xv66rqKyeok4Q3je+smc47AADcknYDZWeql0M9VnFvefipVbSoy5zOFcopR5QrJZacuLBRPPvQXmn1DWfYPUsUTz70F5p9Q1n2D1CzK2G6RDtXE8x0zeiVM3otgj0eehWh3quYv7z8VKrYVT6Heq5i/vPxUqthUZc5nnrlL2jW78uLBRTPPQbmf1FV/YPUrUUzz0G5n9RVf2D1CzRVw3SIdq4nmchCFePRZ6C6H+q9jHvPxUqtdVRof6r2Me8/FSq11RlzmefeUfaFbvy4sFFc79CGZfUdX9g9SpRXO/QhmX1HV/YPQs0VsP0iHauJ5rDxBOkHiCsLGbNQ2y2U+a5TH+8cM/7224taZLzMwgmNocCBC07d5IQRt5gBcdhebsega1WNKGk9b2La3uX++t6juFo1BPTdmnGI6iGSCQxzSBsjC0lr55HNdsfYWkEH2gg+1WeoLptf7jlGjFpv11dG6uq5Kh0giZwsaBUSNa1o/MGgAb7nlzJO5U6VGWbOCY5zeNquas9KV+27BRbOvQlmP1HV/YvUpUWzr0JZj9R1f2L1CzMOH6RDtXE83FlvVYWW9VfPQjzO/Oi3qz417x8TKrSVW6LerPjXvHxMqtJUZc5nA+UOn1u/LiwUXzj0K5h9SVf2LlKFF849CuYfUlX9i5Qsyvh+kQ7VxPONTPGMLrcitlwu89XBZMat+xr7rWB3ds3I3YxoG8kmx3DB1JaNwXN35m3YtZsds7rvqIKqlqXMMlsxyPeKqreF4BdMS0mGIkFu52c4Bxb4RxRvKcvu+XXOlmuPcU1LSQCCioKOPu6alYABtGzc7b7Dc7k8gOgaBdvfI7i61Su9GhqW2Wz+Xe+vJdb1HeTTeSxS6KWJ2NQVVPZQyRsDK0gzEiV4e5+xI3c8OdyO3PkAOQnCq7Rf1aca94+JlVoqnLNnFMdHQxtWN72lLPPNgoxm/oYy/6lqvsXKTqMZv6GMv8AqWq+xcoWZgw/28O1cTzqWxa1sV89AHerRv1b8c94+JkVnKsdG/Vvxz3j4mRWcqMuczhHKHT63elxYKM5r6Gst+par7FykyjOa+hrLfqWq+xcoWZWw/28O1cTzxWR4gsLI8QV9nfB0L7rfa7ndqx1NardVXOoawvdFSQOlcGggFxDQTtuQN/5wp9+DymtP+7TLrZjEvhdRRE11ZE882h8UXhaW+dxcRHNo6nkt0irVxFGi7Sevctb+Su/wO1na+/J26h+4f1hTrxDXt52vvyduofuH9YU68Q1zXyA9j1P4j/LA9F+UXTY91cWM3omSt6Jl1Q+SBCEIEeYDqFsWsdQtikgE46BInHQKAMpm9EqZvRBDyGQhCBATN6JUzeiAGQhCAHHhCysDwhZQY2M32pkrfamQALYta2IIBCEIIYJm9EqZvRAoyy3qsLLeqCHkOhCEEIFsWtbEqBghCEwozeiZK3omQBkeIJ0g8QTqNoAhCFDFYDqFsWsdQtilCgmb7UqZvtQ8iHkMsjxBYWR4gjYDHQhChCAhCEoDN6JkreiZNsE2mW9Vd0/9qvYboI4/MuGc3t8sssXntfQ0J4RFJxeB4qHcYLBzb1d/FVMUlNU1tzp6Ojp5KurnkbFBBDGXySvcdmta0cySSAAOZKufXO57alWfC6e4fONvw+yUtnZNHPxRTzRxt76URgkRv32jc3ckGEAnlsMT1tI0+LvVxVGhsu5vsjl/U4v4fKlB1C2LWOoWxZWbcEIQlFYJx4QkTjwhAplXVlv9rHZR0+w93m3C9VMuT3GGXznRNe3uKR0bm+aGPiDnFp4nBw58PhVbYnj1TlmplixulMjJbjWxwOligMxhY53ny8AI3DG8TzzA2adyBzUo1ZyGmyPX6/VFuEcdkopBb7VDTTiSnjpqcd0zueEBrY3cJkDWjhHGdt+pV62kaiv+2xtKlsjeb4RXxbb/l+ddIQhOjbmxCEKDGC2LWtiABXZnErMZ7MuneCR00Yq7nH9KLlUsLnCQzB8dMGku5ERAh7eHbdrSCfOJhmmeMszDXnF8enZHJSVNaH1ccsjmCSCMGWVnE3zgSxjgNtuZHMdRp1Dyv6b60ZBk7YfJ4a2p/c8ZZwuELGiOLiHE7z+BjeLYkcW+3LZI9crGorft8dClsgtN9rvGK/M+1L4Q0eIJ0g8QTpzaMFsWtbEEAmb0Spm9EAMrpvU78K7KdmxMNjZesukbermRC3jZQtIFLEX7HjD3MMo2c1zPOaW+cd4Dg2NPy/V7HsbayR0dbWNbUGGRrHsgHnTOaXct2xte4cj06E8j9uo2SsynV673CkfH8ywyeSWeKCN0cMNHF5kLY43fwYLQHFoAHE5x2G+yR63Y1GISr4qFHZH13wj+N32x7SDoHUIQOoTmzNiEIQA46BZWB0CygBm9Fd2F1suBdn7Kcz28mvt+/ebHpRI9kzY/FVTtAc3drfxYbI3iLZWgHYb707baCrut+obXQReUV1ZUMp6aLiDeOR7g1rdyQBuSBuSArQ1huNs/CLSYlYDI2wYrRi1wBzthJM0kzzFnC0CRzzwvcB55j4tyCNket2NRjEq9SGF2S9aXdi1q+LsutXKlQhCc2jBbFrWxBAJx4QkTjwhCAyp5pxjdJkupMbLq7usdttO+5XuXYngpIRxPGzSHni81nmbuHHuAdlA1cF1/tL7Nlsx9vm3zL+7utz9vd0LHHySP+M08buKXiaWvG3C4bbJXuRrsZOapqlTdpTdl1b38FdrrstpBsuySry/Um8ZJWt7uauqC9sW4PdRgBsce4A4uFga3i2BO255kqOIQpyRZhCFKChBWSVl2IEzfalTN9qEZBkIQkAZvRMlb0VjabYfDlOZ1FTdX+TYtZac3C9zuikc3uIzxGIFnMOeA7bYg8LXkbluxduyuVa9aGHpyqTyX+/nuOdgnfgHZ2dJG2OPKczjewiSJrpKW1AFp5OAcwzuJ2PnNcxoIIc0EVA3opNmOV3LNNQrhf7lLIXTSEU0D5OIUsO5LImkADZoPUAbndx5klRlvRLFa9ZWwtKdODnU58nd/wBl2Javx2nohoZ6rOLe8/FSq2lUuhnqs4t7z8VKraVGXOZwXlL2jX78vzMFE8+9BeafUNZ9g9SxRPPvQXmn1DWfYPSrMq4bpEO1cTzHTN6JUzei2CPR56FaHeq5i/vPxUqthVPod6rmL+8/FSq2FRlzmeeuUvaNbvy4sFFM89BuZ/UVX9g9StRTPPQbmf1FV/YPULNFXDdIh2rieZyEIV49FnoLof6r2Me8/FSq11VGh/qvYx7z8VKrXVGXOZ595R9oVu/LiwUVzv0IZl9R1f2D1KlwmS0cFx06v9vqq2O201TbZ4ZauXbgp2ujc0yO3IGzQdzuR06hQsypQajWi3sa4nn5iWPUtWX5HkTvJMOt07fLZHA8Va/xCkhAILpHjrsQGNJc4jlumZZlccyyGKoqIo6C2Usfc2y2U/KCihGwDGgADfYDd2w32HIANaPoy7M336jtlgtUUltw+0xiO20TuEPkIGxqJuEBrpX7knbkOJ23Muc6EK9m7s7zRpSqTVesrS2L3V+r2/Jbb9/NE/Vkxn3j4mVWoqr0T9WTGfePiZVaipS5zOI8o+0K3flxYKLZ16Esx+o6v7F6lKi2dehLMfqOr+xeoWZWw/SIdq4nm4st6rCy3qr56EeZ350W9WfGvePiZVaSq3Rb1Z8a94+JlVpKjLnM4Hyh0+t35cWC4bI7jPZ9Pb9dqZrH1NFbp6iJsoJYXMjc4AgEHbcc9iFzKi+cehXMPqSr+xcoWZVoRUq0U8m1xPPK6XS4XrIKu63WrfW3CpfxzTSHm49P6AANgAOQAAAAC+BCFfPQcYqKSSskd89F/Vpxr3j4mVWiqu0X9WnGvePiZVaKoy5zODcodPrd+XFgoxm/oYy/6lqvsXKTqMZv6GMv+par7FyhZlbD/bw7VxPOpbFrWxXz0Ad6tG/Vvxz3j4mRWcqx0b9W/HPePiZFZyoy5zOEcodPrd6XFgozmvoay36lqvsXKTLgsoqfItNMirPJ4avuLZUS9xUx8cUvDG48L2+1p22I9oULMq0LqtG29cTodj+IX7Je9lt1HwW+Hc1VxqXCKlp2t2LnPkdy80ODiBu7bnsVLfItM8apI3V1fVZ5e2Pc2WjoHupaBpADS0ylvG8Al7mvj5O4RuADziWQZffsl7qK41nBb4dhS26maIqWna3cNayNvLzQ4tBO7tuW5UaHiCu2bzO2eaxFbXVlordH+8s/lolg3DUjJKmjbSWp1LiVAHiR1Nj8HkbXybEF7i08RJGwI4tvNby3G6gKEKUki1So0qKtTikd+O19+Tt1D9w/rCnXiGvbztffk7dQ/cP6wp14hrmnkB7HqfxH+WB6I8oumx7q4sZvRMlb0TLqh8kCEIQI8wHULYtY6hbFJAJx0CROOgUAZTN6JUzeiCHkMhCECAmb0Spm9EAMhCEAOPCFlYHhCygxsZvtTJW+1MgAWxa1sQQCEIQQwTN6JUzeiBRllvVYWW9UEPIdCEIIQLYta2JUDBCEJhRm9EyVvRMgDI8QTpB4gnUbQBCEKGKwHULYtY6hbFKFBM32pUzfah5EPIZZHiCwsjxBGwGOhCFCEBCEJQGb0TJW9EybYJtLm0HtNvru0BT3m8vjjseNUM18uDpDJu1lOAWvaIwS4tkdG/h6ENI5+E1Vc7jWXjI7hdrjN5RcK2pkqaqXgDe8ke4uc7ZoAG5JOwACtzG/7XexRm+SU/nXDIL3BjrJY/xctJCyPymbaQblzJRtG6PzQQ0El3RUssS1ts0+H/a42tW2K0F8Fd/Nys9+iuoB1C2LWOoWxZWbcEIQlFYJx4QkTjwhApdWkX7w2fUDUjpPjdl7q2vj86WCurCYIJQw+Y5jR3nEHb8nAhrj0pceIK6Mv/tY7J+n2Hu824Xqplye4wy+c6Jr29xSOjc3zQx8Qc4tPE4OHPh8KpceIJVruzUYL9rOriPedl3Y6l8G9KS7fiOhCE6NubEIQoMYLYta2IAubBf7WuztqTmkvmTXCmbjNrEnnRTuqNn1TS1vnNeyFrXNcSG7kjzjyVMq89W4YsTwbAdNKZnk1Tb7d85X9jKtjy6vqAOJkrYxwl8TW7McST3cjQDtzdRiSOvWajk9+djPE/4juu6tUfmlpfEyPEE6QeIJ05tGC2LWtiCATN6JUzeiALrwmJmNdmnULOZKmMVdyj+jFtp3hzg8zBklQXADkREAWO4tt2uBB80Gllcern7wfRPTJv436K24+Vznn3tXV8NRNwO5bxDiYGbta4edvvyKpxJHfvNRgf2lOWIf/Ud13co/NLS7WwQOoQgdQnNmbEIQgBx0CysDoFlAFxaXf2t49lupFT+5/mq3vorHOfG65VDeCMxtdsyXgYXue07kNcHcJ9lQq5dR534vpzielTGxsq7bGLlkBZC1pdXTtLmxuIB4jFE8M42vLXBw6cAAppJHXrNTgr1XPEv771d1ao/PXJd4EIQnNmwWxa1sQQCceEJE48IQgJ5pzjdJkupUTLs7usdttPJcr3LsTwUkI4pBs0h54vNZ5m7hx7gHZcTluSVeX6lXnJK1vdzV1QXti3B7qMANjj3AHFwsDW8WwJ23PMlWL5bLg3ZM+bmDyTIs1qO+mLZHtljtkXms4m8TeHvHmThIa5r43v3PQCl2+1ItbuaiheviJ13kvVj2J+s/jLV2RQyEITs2YJm+1Kmb7VCAZCEJAGb0Vu5X/aZozZcFi/E3y58F2yXbzXx7j9zUj/C4cDfxjopGnZ7muadivi0uoKSnvl0zm7Rd9ZsUgbWuj4i3v6tzuGlh3aeJvFJ53FwuaODZw2KhF+vdfkmZ3O+3OTvK6uqHTSbOcWs3PJjeIkhrRs1o3OzQB7FObNPO+Ixah92nrfe2L4J6XxicQmb0Spm9E202h6IaGeqzi3vPxUqtpVLoZ6rOLe8/FSq2lr5c5nnblL2jX78vzMFE8+9BeafUNZ9g9SxRPPvQXmn1DWfYPSrMq4bpEO1cTzHUpw7FbjmWfUFhtschdNIDUzsj4hTQ7gPlcCQNmg9NxudmjmQFFlc1zjk050QgsUlD5JmeUQOmucsrXx1FDQcYEcA2O340scXjcHbdj2khpF5vcegMVVnCKp0+fPUure31Ja+2y2ncfTmos1TozZjj0PdWSHvqejcQA6ZkUz4hM7zW+dJwd47zQd3nfnzU3VT6Heq5i/vPxUqthUpapM4LjoKnjasFslJfiwUUzz0G5n9RVf2D1K1FM89BuZ/UVX9g9CzRhw3SIdq4nmchCFePRZ6C6H+q9jHvPxUqtdVRof6r2Me8/FSq11RlzmefeUfaFbvy4sFFc79CGZfUdX9g9SpRXO/QhmX1HV/YPQs0VsP0iHauJ5rDxBOkHiCdX3mehzv5on6smM+8fEyq1FVeifqyYz7x8TKrUVCXOZwHlH2hW78uLBRbOvQlmP1HV/YvUpUWzr0JZj9R1f2L1CzK2H6RDtXE83FlvVYXI2m13C95FS2q1Uj664VL+CGGMc3Hr/QAACSTyABJIAV89BSkoptuyR3p0W9WfGvePiZVaSgOmFvpbXobY7fSXSC8xQd811XTA909/fv4wwnxNDuJod0cAHDkVPlRlzmcDx0lLG1ZLJylxYKL5x6Fcw+pKv7FylCi+cehXMPqSr+xcoWZhw/SIdq4nnGhCFfPQZ3z0X9WnGvePiZVaKq7Rf1aca94+JlVoqjLnM4Jyh0+t35cWCjGb+hjL/qWq+xcpOoxm/oYy/6lqvsXKFmVsP8Abw7VxPOpbFrVh41hLK+wR5Pk1yZjmHMqmwvq5GuM1Uee7YGBpLzuNi7bYecdncDgLzdjvNWtToQ0pv8AVvclm31I7V6N+rfjnvHxMis5QTTSW0zaJ2V9jpJ6O0jvmU8dTLxykNme0veRy4nEF5A5Au2HIBTtUpc5nDcc9LG1Xa15S4sFGc19DWW/UtV9i5SZRnNfQ1lv1LVfYuULMwYf7eHauJ54rI8QWFkeIK+zvg6EIQgO/Ha+/J26h+4f1hTrxDXt52vvyduofuH9YU68Q1zPyA9j1P4j/LA9A+UXTY91cWM3omSt6Jl1Q+SBCEIEeYDqFsWsdQtikgE46BInHQKAMpm9EqZvRBDyGQhCBATN6JUzeiAGQhCAHHhCysDwhZQY2M32pkrfamQALYta2IIBCEIIYJm9EqZvRAoyy3qsLLeqCHkOhCEEIFsWtbEqBghCEwozeiZK3omQBkeIJ0g8QTqNoAhCFDFYDqFsWsdQtilCgmb7UqZvtQ8iHkMsjxBYWR4gjYDHQhChCAhCEoDN6JkreinGm+OfSzXjE8ffR/OFLVXKPyyn73u+OnYeOfztwRtE155Hfly57KcoletVhRpyqzyim32LWTfVr95cO0swRnm/M+NtrayGf/bVNWVrzNPDKOXBw7MLWFocA7mXbgqllOtTsojzPtA5VkcD4paOprSykkijewSQRgRQv4X+cC6NjCd9uZPIdBBUkcilgKc6WDgpq0mrvvS9Z/i2A6hbFrHULYsjNiCEISisFy9itNTf8ys9io3xx1dxrYqSB8xIY18jwxpcQCQN3DfYE7excQrs0N/ejUe757Uebb8TstTXvEnmRVMz43QxUxlPKN8hkPDycSWEBp9kN2RQxlZ4fCzqR1tLUt7yS+LsjjNaLtTXDXy52y3MkgsmPRx2O2U8oG8EVKO7LeLclw7wSODnEuIcN9ugqseILCyPEEJWVjJh6Kw9CFJa9FJdvX8c2OhCEyLJsQhCgxgrK0jx+nyftIYlZ6wxmkfW9/PHNAJWTMhY6Z0bmk7EPEZYd/77fY9DWqurBf7WuztqTmkvmTXCmbjNrEnnRTuqNn1TS1vnNeyFrXNcSG7kjzjySyyNZyhOUcJKMHaUvVXbLUn8L37EQbO8mfmOsORZK58joq6tc+mE0bWPZAPNhY4N5btjaxp5np1J5mJIQpWpF6nThRpxpwVlFJLsRkeIJ0g8QTqRmC2LWtiCAVp6OWqnr9dLbcrg+SCy2CN96uVRERvBFTDvA7bYlw7wRgtaC4hx226irFdlBUVGHdjGvqIZ5KS55vdfJo28Z2kt9KCJHsLPCTLIYnNefOYTs3bdyWWVjV8oSl6P5qHOqPRXxzfwjd/Aqq9XWovuY3a91bI46u4VktVMyEEMa+R5e4NBJIG5O25P9K4xCExsVFQioxyQIHUIQOoQQbEIQgBx0CsrSixW+9ax0s97j48cs9PLdrw4ta9rYIG8fnMIPG0v7trmBpJa47fnFajoFdDYmYr2KZZjURyXDOLo1rYCHODKOie4lwOwDZO+IB3LgWObsN+IhZZWNZjpyVHzcHaVRqK6r5v4Ru/gVnf77cMmzW6X+6Sd5X11Q6aXZzi1m/RjeIkhrRs1o3OzQB7FxCVvRMmNhCMYRUYqyWpAhCEAwWxa1sQQClmD44/LdWMfx1rZHR1tY1tQYpGse2EedK5pdy3bG17hyPToeiiauHGv7VOzTluSz/ua6ZHtZLK7/fHwcXFWv4Hea6ItDY+8aHFrxt5vVK3ZFDGVZU6Noc6Vorteq/wzfUmR3UnJKTKdYLpcLW3ubHDwUlpgaSI4qaJoYzu2EN7trti/g2HCXkddyYM32pUzfapSsrFilShQoxpQyikl8BkIQpY4Jm+1Kmb7VCAZCFaGl9BSU9+umdXaLvrNilO2tdFxFvf1bncNLDu08TeKTzuLhc0cGzhsVjbsitiKyoUXUavbJb29SXa3ZI+7P/7VMDx7TKLzayk2uuQ+3eumjHDH7R+KhLW8THcD+LfYEKpV9VdX1d0vtdc6+Xv66sqHz1EvCG8cj3FzjsAANySdgNl8qyJWRiw9F0KSjJ3k9be9vW/hfLcrIEzeiVM3ojaWj0Q0M9VnFvefipVbSqXQz1WcW95+KlVtLXy5zPO3KXtGv35fmYKJ596C80+oaz7B6lijGbU89Xozl1LSwSVNVNZaqOGGJhc+RzoXANaBzJJIAASrMq4dpYiDe9cToVpxY7TVXe5ZTkxk+iuORxVdcyOFkpqZHSBsNPwOPMSOBBJHDsCCW8XEIhfL1X5HmFyvtzk7ytrah0smznFrN+jG8RJDWjZrRudgAPYrA1CqaDHcZtumNnd3rbXP5Xfqps7ZY6q4uia13dnbdrYhxR7ead9w5vE3iNUN6K7HW7ne8KnWk8TL72qPVH/U9fZZbD0K0O9VzF/efipVbCqfQ71XMX95+KlVsKpLnM4dyl7Rrd+XFgopnnoNzP6iq/sHqVqKZ56Dcz+oqv7B6hZoq4bpEO1cTzOQhCvHos9BdD/Vexj3n4qVWuqo0P8AVexj3n4qVWuqMuczz7yj7Qrd+XFgornfoQzL6jq/sHqVKK536EMy+o6v7B6Fmith+kQ7VxPNYeIJ0g8QTq+8z0Od/NE/Vkxn3j4mVWoqr0T9WTGfePiZVaioS5zOA8o+0K3flxYKLZ16Esx+o6v7F6lKi2dehLMfqOr+xeoWZWw/SIdq4nnDBBPVV0NNTQvqamZ4jiiiYXPkcTsGtA5kknYAK5Ky8UOmeJS45jcneZ1WQBmQXdrml1v32LqOBzSQHNPJz2k8x14gBF8f7h030+/3+PU65wf8VrrFTuP/AEls0sf9D2tf/EI8+o29Vd5x29pY6V39mn4mtvdWz3nrytfvzot6s+Ne8fEyq0lVui3qz417x8TKrSVOXOZxjlDp9bvy4sFF849CuYfUlX9i5ShRfOPQrmH1JV/YuULMr4fpEO1cTzjQhCvnoM756L+rTjXvHxMqtFVdov6tONe8fEyq0VRlzmcE5Q6fW78uLBRzMIJqrSXKaamhfUVEtoqWRRRMLnvcYnANAHMknkAFI1HMwnmpdJcpqaaZ9PURWipfFLE8texwicQ4EcwQeYIULMq0L+fhbeuJ0/dZrBp1330spoMjzB0DJKOzxyF9LQuPC4GqcCON3M/im8TS0Hc7Pa4QK+5BeMlv7rnfK99wrSxrA94DQ1o6Na1oDWjqdgBzJPUkrg1sV5I7rSw+hLTm9Ke/+yWxcdrZ3q0b9W/HPePiZFZyrHRv1b8c94+JkVnKlLnM4pyh0+t3pcWCjOa+hrLfqWq+xcpMozmvoay36lqvsXKFmVsP9vDtXE88VkeILCyPEFfZ3wdCEIQHfjtffk7dQ/cP6wp14hr287X35O3UP3D+sKdeIa5n5Aex6n8R/lgegfKLpse6uLGb0TJW9Ey6ofJAhCECPMB1C2LWOoWxSQCcdAkTjoFAGUzeiVM3ogh5DIQhAgJm9EqZvRADIQhADjwhZWB4QsoMbGb7UyVvtTIAFsWtbEEAhCEEMEzeiVM3ogUZZb1WFlvVBDyHQhCCEC2LWtiVAwQhCYUZvRMlb0TIAyPEE6QeIJ1G0AQhChisB1C2LWOoWxShQTN9qVM32oeRDyGWR4gsLI8QRsBjoQhQhAQhCUBm9Fd2jP7y/T7UCT9zfRzG5vm6v8Xk1xqfxFL+L58fFvK3zmuYOrtuRVIt6K7v9zXYO/8AQrnmWSf8vy23UTf+kR8FS7/ivdv7WqJc2xpeUvXoqj/iSjH4N3l/Spb+vVcpRvVOkb1TqTbvMB1C2LWOoWxMyAQhCUVgrsp/7Vuw7XSSeZcM4vTIoopfPa+hoTxGWPh8DxUO4CHnm3o3+MqTV2axfvKMCwGP9zfRzHIfnGg8Xk1wqfx1T+M58fFvE7zXFg6N25hK9bSNPi/2lajQ3y0n2Q1r+vQ/92KXWR4gsLI8QTG2HQhClAbEIQoMYK8NSG09g0G0mxCklkMs1qdf7g5kQiiqH1ZBiLgHHjkja18fE4eHbbYEtFbYXYPpRq3jePOjqZYa+4xQ1Hkjd5WQl47145HbhZxOJIIAaSeQK53VS/fSXtE5fd2yU08L7i+GnlpHcUUsMO0MTwdzvxMjaSQdiSSNhsEj1yRqK37XH0qeyCc3282PGT+Hyr9CEJzbmR4gnSDxBOgRgti1rYgg3U1NUVlwgpKSCSqq55GxwwwsL3yPcdmta0cySSAAOqtrWKpp6TPbXhVunjntmKWqG2h9M8CGeo4eOon7tvKORz3cLxuTxR+cSeQXRC1UFbrtT3i7vjjsuOUU16r3PMm7WQAFrmhgJcWyOjfw+0NI5+E1hcLhWXa/191uE3lFfW1L6ipl4A3jke4uc7YAAbkk7AAJM5dhqW/Pco22U43/AJpZfJJ+L5fIhCE5tXkCB1CEDqECGxCEIA5C22+ru1/oLXb4vKK+sqGU9NFxBvHI9wa1u5IA3JA3JAVk6x3Ckm1j+YrbL5RasZt8FjpJnNIke2nbs/vNwAXCR0jd2gNIaNh7T9ej/wC8t1yjUKXzIcXs0ktK93nRurZwYKeKRg89zXlz+bdtiAS4DrUtRUVFZcJ6urnkqqqeR0k00zy98j3HdznOPMkkkknqkzl2GpV63KDeymrfzSs38opeI1t6JkreiZObYEIQgRgti1rYgg+y30FXdb/Q2ugi7+urKhlPTRcQbxyPcGtbuSANyQNyQFaGrF2pxklowe2SRyWfEaMW5skVOIRUVQ28qm4eEFpdI3YglwJYXAniJKaU09Pb7hk2eV0EctLi1rdU0hnYJITXyHu6Rj2DziC8uILduFzGkubtzq+eoqKuunq6ueSqqppHSTTTPL3yPcd3Oc48ySSSSUi1vsNVZV8dfZSX9Ul/aP5jUmb7UqZvtTm0eQyEIQxATN9qVM32qEAyufMq2TEtA8Y03iHkt0q/34yRjJHhwkk/gIJGlwLXNjDC+NzAA5sbhvzJjullkoLzq9SzXqPjx2008t0u7i1rmtggbxecwg8bS/ga5oBJa4/0iI3+91+SZnc79c5O8rq6odNLs5xazc8mN4iSGtGzWjc7NAHsWLNmqqJYjGRpvKnaT7XdRXw1vws4pvRMlb0TLMbJ5gmb0Spm9FG0g9ENDPVZxb3n4qVW0ql0M9VnFvefipVbS18uczztyl7Rr9+X5mC4PJ7nPZdNshvFKyOSqoLZPUwtlBLHOjjc8BwBB23A32IXOKJ596C80+oaz7B6VZlShFSrwi8m1xPM2oqJ6uvnqqqeSpqppDJNNK8ufI5x3LnE8ySSSSVrb0Spm9FfR6PSSVkehWh3quYv7z8VKrYVT6Heq5i/vPxUqthUpc5nnvlL2jW78uLBRTPPQbmf1FV/YPUrUUzz0G5n9RVf2D1CzRVw3SIdq4nmchCtLTe20VBNWahX18bLLj8gfS08pew3Gu4XOhgjc0dQ4Ne7rsOHdpaSRdbsj0FXrKhSc2r7lvexLteo7k6VWWux/s/Y1a7lH3NayB8skRa5ro+9kdKGODgCHAPAcNuRBHPqrBVcaS3a43zQGx3a7VcldcaqSpfPPIebj5TKPZyAAAAA2AAAAACsdUnmzgWN0/TaunztKV7ZXu7gornfoQzL6jq/sHqVKK536EMy+o6v7B6FmjFh+kQ7VxPNYeIJ0g8QTq+8z0Od/NE/Vkxn3j4mVWoqr0T9WTGfePiZVaioS5zOA8o+0K3flxYLhckuM9n07v8Ad6ZjJKmht09TE2UEsLmRucA4Ag7bjnsQuaUWzr0JZj9R1f2L1CzKlCKlWink2uJ5zV1bVXK91lxrZe/raqd89RJwhvG97i5x2AAG5J5AbL5m9VhZb1V89C2S1I786LerPjXvHxMqtJVbot6s+Ne8fEyq0lRlzmcE5Q6fW78uLBRfOPQrmH1JV/YuUoUXzj0K5h9SVf2LlCzK+H6RDtXE840IQr56DO+ei/q0417x8TKrRVXaL+rTjXvHxMqtFUZc5nBOUOn1u/LiwUYzf0MZf9S1X2LlJ1GM39DGX/UtV9i5Qsyth/t4dq4nnUti1rYr56AO9Wjfq3457x8TIrOVY6N+rfjnvHxMis5UZc5nCOUOn1u9LiwUZzX0NZb9S1X2LlJlGc19DWW/UtV9i5Qsyth/t4dq4nnisjxBYWR4gr7O+DoQpzaMCutZZmXm8TQ4tjp2Pzhczwd6Ng/aGPxyuLCXNAGzuEgO3UXSRhqVadGN5u3+9m/4Hb/tffk7dQ/cP6wp14hr287X35O3UP3D+sKdeIa5p5Aex6n8R/lgeh/KLpse6uLGb0TJW9Ey6ofJAhCECPMB1C2LWOoWxSQCcdAkTjoFAGUzeiVM3ogh5DIQhAgJm9EqZvRADIQhADjwhZWB4QsoMbGb7UyVvtTIAFsWtbEEAhCEEMEzeiVM3ogUZZb1WFlvVBDyHQhCCEC2LWtiVAwQhCYUZvRMlb0TIAyPEE6QeIJ1G0AQhChisB1C2LWOoWxShQTN9qVM32oeRDyGWR4gsLI8QRsBjoQhQhAQhCUBm9Fd2s37y/QHT+P9zfRzG4fnGg8Xk1xqfx9V+M58fFvE7zXOYOjduYUB09skeR64YjY56GW5UdZd4I6uniD93Qd4DMd2ecAIw8lwI2AJ3G26+/VG9yZD2is0uzq6K5RSXeaOmqYSwxyQRuMcJaW8nDu2MAd7QNySTuozZpav7TlKnDZCLl8XaK/DS/ttIG3qnSN6p1Jt3mA6hbFrHULYmZAIQhKKywtJ7B9J+0fh1ndFTTwPuTJ6iGrbxRSww7zSscNiHcTI3NAI2JIB2G5XEZrf/pVq5kuRNlqZYLhcpp6fyt28rIS890x3MgcLOFoAJADQByAU/wBJf3lw7VHOn+b80Y46io5oP9tU1ZWvEME0R5cHDs8OeHBwDuQO5CpgeEJVrkael+15Qqz2QSj8X6z/AAcTKyPEFhZHiCY2w6EIUoDYhCFBjLn0e/eb6d57J+5vo7js3zfXeLya4VH4mm/F8+Pi3kb5zSwdXbciqcVx139r/YZsdL/BVuWZFNW97Tcu9pKRoh7mc8idpnd41nnNHN24dyVOJVm2anCftK1avvlorshq/Npf7vcQhCY2xkeIJ0g8QToEYLYta2IILksv9q3ZBya9n8TdcquMdooCfxM7KSH8bUSxu8UkT3cML2t2buBxE+FU63ori1Z/eO0YFp30mxyzd7cWSedLDW1ZE88RePMcxo7vhLd+TiC5x6U63oljlc1OA9enKv8A4km/hlH+lJ/EZCEJjavIEDqEIHUIENiELkrLaqi+ZhabJSPjjqrhWRUsL5iQxr5HhjS4gEgbkb7A/wBCBZSUYuTyRaV4/tX7IuNWUfibrlNwku1cB+JmbSQ/iqeORvikie7imY47N3B4QfEqfVn6v3Snrtc7jbbeySCzWGNllttPKBvBFTDuy3fclw7wSEOcS4hw326CsEscrmuwEX6Mqks53k/jrS+CsvgM3omSt6JkxswQhCBGC2LWpdhGOPy7VrH8da2R0dbWNbUGGRrHthHnSuaXct2xte4cj06HoTIxVKkaVOVSbskm32IneTVFRi3Zaw3D455IKq/ySX+7U5eSe6cRHSgFvmmN7I+MsdxOD2NJ4dgFTo8IU41LyuXM9ar7evKfKqE1DobcWh4YKZhLY+Frzu3iHnkcvOe47DfZQceEJYqyKWBpyp4dOatKV5Pteu3wy7EZTN9qVM32pjYPIZCEIYgJm+1KpJiGN1eXak2jHKJ3dzV1QGOl2B7qMAukk2JG/CwOdw7gnbYcylWpGOc4UoOc3ZJXfYieVf8Aap2UKW2v/c18y+vbWzxjm826DcQiRrubOKYmRjmjZ7QfO2HCqjU/1Myqny3VisrLdHHBYqONtDZ4YowxkdLFuGcI4WkBxLnhpG7ePh6NCgCxrIpYKE40dOorSm9JrdfJfBWXwGb0TJW9EyzF55gmb0Spm9FG0g9ENDPVZxb3n4qVW0ql0M9VnFvefipVbS18uczztyl7Rr9+X5mCiefegvNPqGs+wepYonn3oLzT6hrPsHpVmVcN0iHauJ5jpm9EqZvRbBHo89CtDvVcxf3n4qVWwqn0O9VzF/efipVbCoy5zPPXKXtGt35cWCimeeg3M/qKr+wepWopnnoNzP6iq/sHqFmirhukQ7VxPNmgoaq532ittDF39bVzsgp4+IN43vcGtG5IA3JHMnZWPqRcqKgmo9PbEyNllx+QsqqiIPYbjXcLWzTyNceocHMb12HFs4tIA+rDpn4NpZc9QOGNl+rZDbcaE0TX8B61FUGvA3DW/i2vaXAOc5rmkFVGrmbO7x/5jE6T5tPUuuW1/wAq1LrctyPQXQ/1XsY95+KlVrqqND/Vexj3n4qVWuqcucziPKPtCt35cWCiud+hDMvqOr+wepUornfoQzL6jq/sHoWaK2H6RDtXE81h4gnSDxBOr7zPQ5380T9WTGfePiZVaiqvRP1ZMZ94+JlVqKhLnM4Dyj7Qrd+XFgotnXoSzH6jq/sXqUqLZ16Esx+o6v7F6hZlbD9Ih2riebiy3qsLLeqvnoR5nfnRb1Z8a94+JlVpKrdFvVnxr3j4mVWkqMuczgfKHT63flxYKL5x6Fcw+pKv7FylCi+cehXMPqSr+xcoWZXw/SIdq4nnGpdjmOQXCiqb7fal9rxSieG1VUxoMtRIRuKaAHk+Vw/6rG+c7lsD9WE4lBklbX192uLLNi9qY2a7VznDjY1xIbHG3mS95BA5H+gnha7j8qyL59vbIaKLyHHKHihs1va3hbTw8W4JG53kdyc95JLne3YAC7e7sjuk6sqtR0aTs1znu6l+8/wWt7E+7+mNfTXPQ+yVlFbILNRu75sFFTklsTGzvY0Fx5ucQ0Fzjzc4k8t1PVV2i/q0417x8TKrRVOXOZxHHRUMbVislKXFgoxm/oYy/wCpar7Fyk6jGb+hjL/qWq+xcoWZgw/28O1cTzqWxa1sV89AHerRv1b8c94+JkVnKsdG/Vvxz3j4mRWcqMuczhHKHT63elxYKM5r6Gst+par7Fyky4LKKOpuOmmRW+jj76sqrZUQwR8QbxvdG5rRudgNyRzPJQsyrQaVeDe9cTzoU2xrBbxkEcdwm4LJjbXtFTea9wip42lxbu0uI7w8QLdm/wAYgEt33XOR0OI4PFOb6GZXmEbNm2ljT5Fb5w4HaeQOAmIBALG7t3a9juocIXfcjuuR3Rs9xqPxEXKko4fMpqRmwAjij6MaA1o5czwjck81du3kdr87VxGqjqXvNflW3terddEy+kmK4r+Lw60/PF3Zy+f7zGHcDh/Hp6fws2c1r2Pfu8blpBUGu95ut+vL7heK+a41btx3kz9+EEl3C0dGt3J2aNgN+QXGIQkkWKeHp0paWct71v8A8disuo78dr78nbqH7h/WFOvENe3na+/J26h+4f1hTrxDXNfID2PU/iP8sD0X5RdNj3VxYzeiZK3omXVD5IEIQgR5gOoWxax1C2KSATjoEicdAoAymb0Spm9EEPIZCEIEBM3olTN6IAZCEIAceELKwPCFlBjYzfamSt9qZAAti1rYggEIQghgmb0Spm9ECjLLeqwst6oIeQ6EIQQgWxa1sSoGCEITCjN6JkreiZAGR4gnSDxBOo2gCEIUMVgOoWxax1C2KUKCZvtSpm+1DyIeQyyPEFhZHiCNgMdCEKEICEISgXdoP+4dSsmyqLzrhjGJXG70Eb+cUkzIhGGyDqWbSu5NLTuBz/PSquqw/vL2Dc7uf+2fpHklFZ+78Pk3kzDV97vz4+Lfg4dm7ddz0VKqFtZpcL+0xder1qK7Iq/5pSX47TLeqdI3qnUm3eYDqFsWsdQtiZkAhCEorLxrIo8f7ANnYamOC5ZXlElU1tOHB9TRUrDEY5nBoBDJ9ntYSRu8OHPi2pEeEK59ZP3l+gWAR/ub6OY5D840Hi8muFT+PqfxnPj4t4nea4sHRu3MKmB4Qkjlc03JvrYd1v8AElKXwb9X+lL+zsZWR4gsLI8QTm3HQhClAbEIVj6Q2movPabwijpXxxyx3WKrcZSQOCA9+8cgeZbG4D2bkbkDmlbsrlOvVVChOrLKKb+SuSDWv96swxjB2fivovjtLRVkUPKldVvZ3000Q5b953jC55a1zi3mOQKpxSPNL/8ASjVvJMhbJUyw19xlmp/K3byshLz3TDzO3CzhaACQA0AcgFHFEVZGDBUpUcJCEudbX2vW/wAbghCExfMjxBOkHiCdAjBWFpZYfpL2h8RtDo6eeF9xZNURVbeKKWKHeaRhGx34mRuABGxJAOw3Kr1XRph+8unWqGdRefX2izR0NCGeZLBLWydyKmOXqx8YDug3IeRxN9qyyNbj5yhhJ6POfqrtk9Ffi0QfOslfmGr+Q5I58jo62tc6mE0bWPZAPNha4N5btjaxp5np1J5mKt6JUzeilakXKdOFKnGnBWUUkuxDIQhSZHkCB1CEDqECGxXRoi6ntOe37OK6KR1LjFiqK2I96IoZah7e6igfIWkAyB8gaOpcBtvsQaXV0SxMxrsPUz2VMcVzzK+lz2MDnmaho+JvC7ccLC2o2d5pDiHjmQCAksrbzU8o+vQVD/Eaj8Hrl/SmU0OgWVgdAspzbDN6JkreiZAAhCECMFcenX9r2mmf57J+KqKa3i02Z7vxTzVVR4XSQS9RLDGC4tYOIteebRzNOK482/td7P8Ap3h8XmTV9O7I7mY/OjndPuymIc7zmuZE1zXNADdyD5x5pJa9Rqcb+0UKHvtX7q1v5paPxKgTjwhInHhCdG1Mpm+1Kmb7UEPIZCEIYgK5NPzBi+j2bZ/UxSNr3R/MmPzMlDSyqmY4yyMIaXRvjj4XB27QQXNB3PKm1b+pf9rlhxTTmn/c/wA129lbe4R4zcahvHIJHN2ZJwMLGscNyGuLeI+zHnqNVjF51ww/vvX3Y6383aL7SpEIQg2ozeiZK3omWQR5gmb0Spm9FG0g9ENDPVZxb3n4qVW0ql0M9VnFvefipVbS18uczztyl7Rr9+X5mCiefegvNPqGs+wepYonn3oLzT6hrPsHpVmVcN0iHauJ5jpm9EqZvRbBHo89CtDvVcxf3n4qVWwqn0O9VzF/efipVbCoy5zPPXKXtGt35cWC4m/Wv57wa9WXv/JfL6Cal77g4+77xhZxcO4323323C5ZRnNaiel0by2qpZpKaphs1VJDNE8tfG4QuIc0jmCCNwQlWZToqTrRUXZ3XE6FajXqhrsxgsdik4sYsEAt9s4XN4ZuE/jag8B4HOkfu4vaBxAMJG6r5CFeSsj0NRpRo0lTjs/He+15s9BdD/Vexj3n4qVWuqo0P9V7GPefipVa6pS5zOCco+0K3flxYKK536EMy+o6v7B6lSiud+hDMvqOr+wehZorYfpEO1cTzWHiCdIPEFzFjs1dkOX26yW2PvK2snbFHu1xa3fq93CCQ1o3c47HYAn2K+z0LKUYRcpOyR3n0T9WTGfePiZVaiiGBw2Gm0st1JjBkkslNJPBTyySiQzFk72Pl4gSCHva54I2GzhsAOQl6oPNnn/GzVTGVZpWvKT155sFFs69CWY/UdX9i9SlRbOvQlmP1HV/YvULMxYfpEO1cTzcWW9VhZb1V89CPM786LerPjXvHxMqtJVbot6s+Ne8fEyq0lRlzmcD5Q6fW78uLBcNkdJBcNPb9QVNYy3U1Tbp4ZauXbgga6NzTIdyBs0Hc7kdOoXMqL5x6Fcw+pKv7FyhZlWgm60UnbWuJ0Wyq/01VwY7j7fJcQt87vI42k8VY/wmrmJALpHjpuAGNIaAOe8MQhXkrHf6VONKCjH/AN9b63tO+ei/q0417x8TKrRVXaL+rTjXvHxMqtFUpc5nCuUOn1u/LiwUYzf0MZf9S1X2LlJ1GM39DGX/AFLVfYuULMrYf7eHauJ51LYta2K+egDvVo36t+Oe8fEyKzlWOjfq3457x8TIrOVGXOZwjlDp9bvS4sFGc19DWW/UtV9i5SZRnNfQ1lv1LVfYuULMrYf7eHauJ54rI8QWFkeIK+zvg6EIQgO/Ha+/J26h+4f1hTrxDXt52vvyduofuH9YU68Q1zPyA9j1P4j/ACwPQPlF02PdXFjN6JkreiZdUPkgQhCBHmA6hbFrHULYpIBOOgSJx0CgDKZvRKmb0QQ8hkIQgQEzeiVM3ogBkIQgBx4QsrA8IWUGNjN9qZK32pkAC2LWtiCAQhCCGCZvRKmb0QKMst6rCy3qgh5DoQhBCBbFrWxKgYIQhMKM3omSt6JkAZHiCdIPEE6jaAIQhQxWA6hbFrHULYpQoJm+1Kmb7UPIh5DLI8QWFkeII2Ax0IQoQgIQhKBd+e/vL2XdH8Yd+4bhUU1Xe7jRxcmztqJdqSokLfNe8xNc0bkva3zTw77KlFdev37h19ZisXnW/GLJQ2igkfzlkhZTtkDpD0L95Xc2ho2A5e00oojzDS8metgoVPfvPxty/v8ADIy3qnSN6p1Jt3mA6hbFrHULYmZAKUYTYPpVq9jWOuiqZYLhcoYKjyRu8rIS8d68ciBws4nEkEANJPIFRdXVoP8AuHWK6ZZ/C/RbHK+8eS9PK+CExd1x/wATfvd+LZ3h2257jHJ2RrsfVlQwdSpHnJO3bs/GxF9WL/8ASftH5jeGy008D7k+CnmpHcUUsMO0MTwdyHcTI2uJB2JJI2GwUAHhCROPCFKVlYzUKUaFGNKOUUkvhqMrI8QWFkeIKTOOhCFKA2K59J/3mw/U/OH+b80Y66io5Yf9tU1XWvEMM0R5cHDs8OeHBwDuQO5CphXPP+8nYPoYZP3DcMlyt9REYuTq+hpoe7Ikc3qxlQdwx58R4gPakllY0vKHrUY0fflFfC95f0p8SmFsWtbExtgQhCAMjxBOkHiCdAjBXRe/3n7EGE27/bH0hyGsu/eeHybydope6258fFvx8W426bHqqXV0a4/uHVy2Yr/C/RjHqG0eVdPKuCISd7w/xN+924d3eHffnyV5pGoxP7TFUaXW5PsirfmlF/DdcptM3olTN6JjbDIQhBDyBA6hCB1CBDYri1p/erUS04NB5tBi1mpqFhj8yKolfGJpakRDlG6QyDi5kksBLj7ON0ZsFRkPaUxWCEyRx0dY2vnlZAZBGyA94OLYjhDnNbHxE8i8dTsDB8iu3z/qBfb75P5J843Car7jj4+67yRz+Hi2G+3FtvsN/wAwSZyNTJqryio7Kcb/ABk7L8Iy+fYcUOgWVgdAspzbDN6JkreiZAAhCECMlWD42/LtXMfxxrJHR1tY1tQYZGse2EedK5pdy3bG17hyPToTyP36jZGzLdcMlv8AC6OSlqKwtpZIo3MEkMYEcTtncwSxjSd9uZPIdBLdJZ349YtQ8+a2MyWSx+T0UnctkmgrKqQRwSsDxw7N4Xhx334XEbOBIVOpFrkamnerj5z2QSiu1+tL8NAE48ISJx4QnRtTKZvtSpm+1BDyGQhCGIWNpVjceS60W1la6nistt3uV2lqwwwspoSHODw8gFrjwsPXYPJIIBUYyW+1GT6h3rIKkSNkr6x84jlmMpiYSeCPiIG4Y3haOQ5NGwHRWfjTH4p2P8xygxyRXDI6yOx2+U0TSWwgF85EjurJGiSM8I5PiHtG7aTb7VjjrbZqMO/PYurV2R9RfDXL8Wl/L82QhCDbjN6JkreiZZBHmCZvRKmb0UbSD0Q0M9VnFvefipVbSqXQz1WcW95+KlVtLXy5zPO3KXtGv35fmYKJ596C80+oaz7B6liiefegvNPqGs+welWZVw3SIdq4nmOmb0Spm9FsEejz0K0O9VzF/efipVbCqfQ71XMX95+KlVsKjLnM89cpe0a3flxYKKZ56Dcz+oqv7B6laimeeg3M/qKr+weoWaKuG6RDtXE8zkIQrx6LPQXQ/wBV7GPefipVa6qjQ/1XsY95+KlVrqjLnM8+8o+0K3flxYKK536EMy+o6v7B6lSiud+hDMvqOr+wehZorYfpEO1cTzWHiCuG0+XafaHVWR/j7bk2TfuOzvHFHJDRN4XzTtPMeeTG1u4a4DZ7DsVCMKxz6U6iUVsml8ltrd57lVl3A2mpoxxSyF5BDOQ2DnDh4nNB6p80yP6U6hVtzhi8ltrdoLbSBvA2mpoxwxRhgJDOQ3LWnh4nOI6q7LW7HdK69IrKh91a5fPUvi1d9SttO6WifqyYz7x8TKrUVV6J+rJjPvHxMqtRUpc5nFOUfaFbvy4sFFs69CWY/UdX9i9SlRbOvQlmP1HV/YvULMrYfpEO1cTzcWW9VhZb1V89CPM786LerPjXvHxMqtJVbot6s+Ne8fEyq0lRlzmcD5Q6fW78uLBRfOPQrmH1JV/YuUoUXzj0K5h9SVf2LlCzK+H6RDtXE840IQr56DO+ei/q0417x8TKrRVXaL+rTjXvHxMqtFUZc5nBOUOn1u/LiwUYzf0MZf8AUtV9i5SdRjN/Qxl/1LVfYuULMrYf7eHauJ51LYtas2CCHT2ihr6+FlRnUrBJQ0MrA5lnaRu2eZp5GcjYsjPg5OcN+FqvNneKtVU7JK8nkv8AeSW1/wB7J9sNLbZX2fQbH7fc6V9FWsZK98Eo2ewPme9u49h4XDcHmOh2IIU/VbaRTzVPZ8sVTUzPqKiV9S+WWV5c97jUykuJPMknmSVZKpS5zOHY7S9Nq6WelLiwUZzX0NZb9S1X2LlJlGc19DWW/UtV9i5QszBh/t4dq4nnisjxBYWR4gr7O+DoQhCA78dr78nbqH7h/WFOvENe3na+/J26h+4f1hTrxDXM/ID2PU/iP8sD0D5RdNj3VxYzeiZK3omXVD5IEIQgR5klx3FLpk5q/m2qs9N5Nwd587ZFQ23i4t9uDyqaPvPCd+DfblvtuN5R+CnKP5Uw7/KJZPvarIdQtiqzjiXL1JRS64t/jpLgZYulb1k79v8A4ZZP4Kco/lTDv8olk+9pxpVk+w/fTD/8odk+9qs046BY9DGe/Hwv6xr0PdfzX0lk/gqyf+VMP/yh2T72nGlWT7f3Uw//ACh2T72q0TN6I0MZ78fC/rIboW5r+a+ksr8FWT/yph/+UOyfe0fgqyf+VMP/AModk+9qt0I0MZ78fC/rEvQ91/NfSWR+CrJ/5Uw//KHZPvaYaV5Pt/dTD/8AKFZPvarVM3ojQxnvx8L+sL0PdfzX0lk/gryf+VMP/wAoVk+9o/BXk/8AKmH/AOUKyfe1XCEaGM9+Phf1heh7r+a+ksoaV5Pw/wB1MQ/yhWT72s/gryb+VMQ/yhWT72q3HhCyjQxnvx8L+sTSoe6/mvpLJbpZk3P99MQ/yg2X72s/gsyb+U8Q/wAoNl+9qt2+1MjQxnvx8L+sjSoe6/mvpLG/BZk38p4h/lBsv3tbPwW5N/KeIf5QbL97VarYjQxnvx8L+sNKh7r+a+ksb8FuTfyniH+UGy/e0fgtyb+U8Q/yg2X72q5QjQxnvx8L+sVyoe6/mvpLG/Bbk38p4h/lBsv3tMNLcm2/uniP+UCy/e1W6ZvRGhjPfj4X9YulQ91/NfSWP+C3Jv5TxH/KBZfvaYaW5Nv/AHTxH/KBZfvarhZb1RoYz34+F/WDlh7c1/NfSWR+C7Jf5TxH/KBZfvaPwXZL/KeI/wCUCy/e1XSEaGM9+Phf1kKWH91/NfSWL+C7Jf5TxH/KBZfvaf8ABdkv8p4j+39l+9qt1sSqGM9+Phf1g5Yf3X819JYn4Lsl/lPEf2/sv3tH4Lsl/lPEf2/sv3tV2hNoYz34+F/WLpYf3X819JY40vyXb+6eJft/Zvvaz+C/Jf5TxL9v7N97Vct6JkaGM9+Phf1hpYf3X819JYo0vyXi/uniX7f2b72m/Bhkv8p4l+31m+9quR4gnUaGMvz4+F/WGlh/dfzX0lh/gwyX+U8S/b6zfe0fgwyX+U8S/b6zfe1XiFDhjPfj4X9Yrlh/dfzX0liDTDJdx++eJft9Zvvaf8GGSfyniX7fWb72q4HULYpUMZ78fC/rF0sP7r8S+ksP8GGSfyniX7fWb72mbphknP8AfLEv2+s33pV0mb7UOGMtz4+F/WQ5Ye3NfiX0lifgxyT+UsT/AG+s33pZGmOScX90sT/b2zfelXiyPEEaGMtz4+F/WTpYf3X4l9JYv4Mck/lLE/29s33pH4Mck/lLE/29s33pV6hQoYz34+F/WY9LD+6/EvpLC/Bjkn8pYn+3tm+9Kbaa6YZT/ZCYTLFUY5WeT3umqZYqPM7VUS93FK2SRzY46kudwsa5xDQTsCqHV26EfuHUzJsqi864YxiVxu9BG/nFJMyMRhsg6lm0ruTS07gc/Ycco4xLnx8L+s13KFXD08FUloN6n95ZvUvu7wzfA7veNaswu9uvGJ1Nvrr5V1NLL9OrQ3vI3zOc12zqoEbgg7EAqL/gyyP+UsT/AG9s/wB6VeN6Jk6hjEufHwv6y1TjhqUIwUZWSS5y2fylhjTLI9/7pYn+3ln+9JvwZ5H/AClin7eWf70q7b1TqNDGe/Hwv6zI5Ye/NfiX0lgjTPI9x++WKft5Z/vSf8GeR/ylin7eWf70q7HULYmcMZ78fC/rI0sP7r8S+ksD8GeR/wApYp+3ln+9K3cPwO+WXsxap1UtdjtFcLr5DbbVcI8vtnDL+NMlVTCobUcLOKLhLo3OHG0Dkdl1iV1ZH+8/Yd03t1N58GQXu4XatdLzdHNTltKxse2wDCw7kEE8XMEDkscoYzUtOPhf1mpx8sLJUqTjL15x+8vu+v7v7vxyIr+DPI/5SxT9vLP96TjTTI+H+6WKft3Z/vSrxOPCE2hjPfj4X9Zs9LD+6/EvpLB/Bpkf8pYp+3dn+9LI00yPi/ulin7d2f70q+WR4gjQxnvx8L+sNLDe6/EvpLC/BpkX8pYr+3dn+9I/BpkX8pYr+3dn+9KAIU6GM9+Phf1hpYb3X4l9JYf4Nci/lHFf26s/3pW1qjgl7is+n2IUVdj1FDYsdi8ut9Xl1sglpbhOTLVbiWoDzxHu3DqzYjh2BVAY3aPpBqHYbB5R5J85XGCj7/u+Puu9kazi4dxvtxb7bjfbqFM9Zrv899qLNa3yfyXu7i6j4O849/J2in4t9h4u64tvZvtudtyjhjNJevHwv6zTVZYWePpw0JeqpS5yz1RX3dzl2fE+H8GuRfyjiv7dWf70n/BrkX8o4r+3Vo+9KvVsTaGM9+Phf1m10sN7r8S+kn34Nci/lHFf26tH3pH4Nci/lHFf26tH3pQFCNDGe/Hwv6w0sN7r8S+kn402yLi/ujiv7dWj70n/AAbZF/KOLftzaPvSr4eIJ0aGM9+Phf1iuWG91+JfSX7pXpde6jtEYgam7Y9FDTXFlW40mVW2sld3G8waIoqkvPEY+EkA8IJcRsCo5keG5Df9Qb7fvKcWpPnK4z1fcfTy0P7rvJHP4eLykb7cW2+w3/MF9elP7z4hqdm7/N+acdNHSSw/7ZpquseIYZojy4OHZ4c8ODgHcgdyFTyVQxjk/Xj4X9ZqaUsLUx1SehL1VGPOWfOf3dzj/wCNs9/BvkP8o4t+3No+9JxpvkO390cW/bm0felX6ZvRNoYz34+F/WbTSw3uvxL6Sf8A4N8h/lHFv24tH3pH4N8h/lHFv24tH3pQJCNDGe/Hwv6yHLDW5r8S+knv4N8h/lHFv24tH3pA03yHcfvji37cWj70oEgdQjQxnvx8L+sTSw3uy8S+k7LYPg16xzRvUe/y1uPsr7hb22K2Oky22upJ+/cDUtMjajhbKyJrXtBeOp5O6KqfwcZD/KOL/txaPvSk2Q/vT2LtPLfTefDfrzX3WsdJzcyWAimY1m22zSw7kHc8XQgclTqWMMZrenHwv6zWYOWFnKrV0JetJrnL7vq+7vT+ZYA04yHYfvji/wC3Fp+8o/BxkH8o4v8AtvafvKgQ6BZTaGM9+Phf1mz0sN7svEvpJ8NOcg2/uhi/7b2n7ys/g5yD+UMX/be0/eVAm9EyNDGe/Hwv6w0sN7svEvpJ3+DnIP5Qxf8Abe0/eUfg5yD+UMX/AG3tP3lQRbqenqKy4QUlJBJVVU8jY4YYWF75HuOzWtaOZJJAACNDGe/Hwv6xZTwq1uL8S+k7E3nB71aOyrjeJSVuP/OlyvEl+nZUZZbYPJ4u67iHhL5+GZsjd3iRh2G3Dseqq/8AB1kH8oYx+29p+8rm9aainbrSMeoZ46q2Y3a6Wz0czXh73sijBd3jhyMge97XbBu3DtsCCqpSxhjLX04+F/WavASwssMquhL1/W5y+9rX3d1lxu9ZO/wdZB/KGMftvafvKcadZBw/3Qxj9trT95UBTjwhNoYz34+F/WbPSw3uy8S+knf4Osg/lDGP22tP3lM3TrIOf74Yx+21p+8qBpm+1GhjPfj4X9ZDlhrc2XiX0k8/B3f/AOUMY/ba0/eUfg7v/wDKGMfttafvKgqsDSuxU+SdoTFrTVmM0rqzv5mSwiVkrIWumMbmk7EPEZad/wC+32PQw44xK+nHwv6yrWr4OhRlVlGVopt+stiv7pZeomEXmmxTAcMp62wRfMdoMtdFW5XboKmCsqn97PE4Pnbu0eYWkN6O8TuqrBund/5/vhjH7a2n7yuAye+1GT6h3rIKkSNkr6x84jlmMpiYT5kfEQNwxvC0chyaNgOi4RvtURhjEufHwv6zFhYYajh4xcJXzfrLNu7+7vbJ3+Du/wD8oYz+2tq+8o/B3f8A+UMZ/bW1feVBkKNDGe/Hwv6y5pYX3ZeJfSTwaeX/AG/uhjP7a2r7ys/g8v8A/KGM/travvKgjeiZPoYz34+F/WI5YW/Ml4l9JOfweX/+UMZ/bW1feV9FNprk1XXQ0tLU47U1U0gjhhizG1vfI5x2DWgVO5JJAACr5WvpHTwUub3PMK+COa24xbZriWVDAIp5+Hggh7w8o3ue7iYdieJnIE8wrjjFr04+F/WVMTiMLQoSqaEm0tS0lrexc3a9R3/xPHaax6cWiyW6qoKqnt9OKV81NPCxsksZLJXFrXkBxkDy4bkh3Fud91IvIZv7+n/W4/8AOVP6J1E9X2Z8dqqqeSpqppKqSaaV5c+RzquUlzieZJJJJKtRUJQxab9ePhf1HBMY+T6eLqQlTm2pNN6cddm9f2Z9nkM39/T/AK3H/nKMZta6mp0Zy6mjlpGyS2WqY0y3CGNgJhcBxPc8NaPzkkAdSVzaiefegvNPqGs+weoUcXfnx8L+ox4epyb6RC1Kea+/Hf8Awzz/APwe37/0/Gv20tX3lMNPb9t/t/Gv20tX3lQVM3or+hjPfj4X9Z6F0sL7kvEvpPSDRyy1lu7OOOUdRNQSTR+UcTqa609RGd6iQ8pI5HNd19hOx3B5gqzvIZv7+n/W4/8AOVN6Heq5i/vPxUqthUpRxek/Xj4X9ZwPlGpyd/8AIVr05305ffjvf/1n2eQzf39P+tx/5yjGa2upqdG8tp45aRsktmqmNMtwhjYCYXAcTnPDWj85JAHUlc2opnnoNzP6iq/sHqFHF358fC/rK2Hqcm+kQtSnmvvx3/wzoL+D6/f+n41+2dq+8o/B9fv/AE/Gv2ztX3lQhCvaGM9+Phf1noLSwvuS8S+k9G9HbLWW/s5Y7R1E1BJLH5RxOprrT1EZ3qJDyfHI5ruvsJ2O4PMFWb5DN/f0/wCtx/5ypzQ/1XsY95+KlVrqjKOL0n68fC/rOC8oVOTvT616c76Uvvx3v/6z7PIZv7+n/W4/85RnNLXU1Oj2WU8ctI2SWzVTGmW4QxsBMLgOJznhrR+ckgDqSuaXFX6loa7B7zQ3Op8jttRQzRVdR3jWd1E5hD38TuTdmknc8htzUKOLvz4+F/WVKNXkyNWMvNT1Nffj/wD8zqDBhl3xLQ6rpGVligynJeDvHSZRb4jBbRzHA907d++eOfAXscxux2IVb/QC+/8Ap+N/tja/vC+HM8k+lOotbc4YvJba3aC2UgbwNpqaMcMUYYCQzzRuWtPDxOcR1UYV7Qxnvx8L+s7rhlhow05QkpS1v1lnu5mxaj0S0hstZb+zvj1JPNQSSx9/xOprpTzxneokPJ8b3NPX2E7Hl1BVleQzf39P+tx/5yp/RP1ZMZ94+JlVqKlKOL0n68fC/rOK8oVOTvT616c+dL78d7/+s+zyGb+/p/1uP/OUazK11NTpBldPHLSNkls9Uxplr4Y2AmFwHE5zw1o/OSQB7SuZUWzr0JZj9R1f2L1Cji78+Phf1FbD1OTfPwtSnmvvx3/wzoj9Ab7/AOn45+2Nr+8LIwG+7/7fxz9sbX94UJWW9Vf0MZ78fC/rO+OWEvzJeJfSeh+kdlrKDs9Y/STzUEksff8AE6mulPPGd6iQ8nxvc09fYTseXUKyPIZv7+n/AFuP/OVV6RUVVQdnPF4KuLupXQPna3iB3ZLK+Rh5H2te07dRvsdirIVGUcXpP14+F/WcKx1Xk142q/NzfrS+/He//rPs8hm/v6f9bj/zlG8xtdTUaRZVTxy0jZJbPUsaZa+GNgJicBu5zw1o/OSQB7SuYUXzj0K5h9SVf2LlCji78+Phf1GDD1OTfPwtSnmvvx3/AMM6L/QK+f8Ap2OfthbPvCPoFfP/AE7HP2wtn3hQtCv6GM9+Phf1ne9LCe5LxL6T0J0ks1ZQdnzH6Seahklj7/idTXSnnjO9RIeT43uaevsJ2PLqFY/kM39/T/rcf+cqi0X9WnGvePiZVaKoyji9J+vHwv6zhmPqcnenVr0586X3473/APWfZ5DN/f0/63H/AJyjmYWypqNJcpp45aRsktoqWNMtfDGwExOA3c54a0fnJIA9q5dcNkVxmtGn19u1M1j6iit81RE2UEsLmRucAQCDtuOexChRxd+fHwv6irRqcnKtHRpTvdf9SO/+GdVKLAbtgVtjudf8yHOJd3W6jrshoI47YwEgVLhJMBLISD3YG7GkFziXANECnwrIqmtmqam6WGoqJXl8ssuY21z3uJ3LiTUbkk8ySondLpcL1f6q6XSqfW19S/jmmkPNx6f0AAbAAcgAANgF8iuqGM9+Phf1ncKMcLD15wk5PP1l8l6mS2fN62d/9J7NWUGgNgpJ5qF8rO/4nU90p54zvPIeT43uaevsPI8uoVgS08kMYc90RBO3mTsef+wEqqtG/Vvxz3j4mRWcq2jiVP1pJrutf5mcV5SngXi6yjTkpaUtbmms3s0FxBRnNfQ1lv1LVfYuUmUZzX0NZb9S1X2LlZWZpsP9vDtXE88VkeILCyPEFfZ3wdCEIQHfjtffk7dQ/cP6wp14hr287X35O3UP3D+sKdeIa5n5Aex6n8R/lgegfKLpse6uLGb0TJW9Ey6ofJAhCECPMB1C2LWOoWxSQCcdAkTjoFAGUzeiVM3ogh5DIQvtttvrLvkNBarfD5RX1tSynpouMN45HuDWt3cQBuSBuSAobUVd5CpNuyPiTN6Lmslxq9YfnVyxrI6L5uvdvl7qrpu+ZJ3btgduJhLTyI6ErhW9EsJxqRU4O6etNZNEtOLaas0MhCE4o48IWVgeELKDGxm+1Mp1dtPL1ZNB8Q1DqqqiksuR1FTBQwRSPNRG6neWPMjSwNAJHLZx5ddlBVhp1adZNwd0m18U7NfBqxknCdN2krak/g9aBbFrWxZjECEIQQwTN6JUzeiBRllvVYWW9UEPIdCEIIQLYta2JUDBCEJhRm9EyVvRMgDI8QTpB4gnUbQBCEKGKwHULYtY6hbFKFBM32pUzfah5EPIZZHiCwsjxBGwGOhCFCEBXbg372dkTWS8n976qq+brZb64/i3z8c5fU00UnIu3iDXSRtPNgBcNlSSvS6RR2j5PDGKWqqYjWX7Mp7pQQRh5PcQQGlkLjw8IIkDeW53DwR/GAxSNPyi9KFOn704/g9N/hHX1XKNb0TJW9Eyy7Da7TLeqdI3qnSg8wHULYtY6hbEzIBXVrV+9l5wXD/9qT4/idHT3K3R8oqWukBlnIA8xz3h0bnPbvxHbckjlV+NWf6Q6i2CweUeR/Odygo+/wC74+672RrOLh3G+3FvtuN9uoU11pvHz52p83rfJ/Je7uTqPg7zj38naKfi32Hi7ri29m+2523ON85GmrevyjSjsjGUvj6sV+Dl/vOsE48ISJx4QmNqZWR4gsLI8QQA6EIUoC5dCqanPaIoL1caeOWyWGiqrrc5JWB4p4ooXbS8PMuLZHRkcILgdiBy3FSVNTUVlxqKysqJKurnkdJPPM8vfI9x3c5zjzJJJJJ5kq59L3U9p0P1oyl0UlTVwWGK0xwiUMZwV0pic8+aSSwsY4DkCOIe0EUksa5zNJQ9fH15+7ox+S0v86/DcC2LWtic24IQhAGR4gnSDxBOgRlywfvJ2FK6aP8AcNfkmVMglEnJ1dRU0PGCxrurGTnYvYPEeEn2KnlcOpn71aRaPYr/AA/k+Ovu/lXh4vL5jJ3XDz24ODbi387ffZu2yp5LHK5qOT/WpTq+/KT+F9Ff0pdmWwEzeiVM3omNsMhCEEPIEDqEKxNJbVUXjtK4VSUr445I7rHVOMpIHBAe/eOQPMtjcB/ORuQOahuyuVa9VUKMqryim/krki1v/cWrdsxb+F+jOPUNp8q6eVcEQk7zh/ib97tw7u8O+/PlTq5/K7rT3zVDJL3SMkjpbhdKiqhZMAHtZJK57Q4AkA7Eb7E/0rgFEVZGDB0nRwlOEs0lft2/iOOgWVgdAspi8M3omSt6JkACs7R2109z7RGPS1z5Ke2W2R1yrKppDWUzKdpla+RxBDI+NrGuJ28W24JBVYq4MC/eTQfVLLD+KqZbfFY6HyjlDUeVP/dDW9C+VkbGvAB80HdwISyyNVyjJrCSjHOVortk9H8L3KxvN0qL5l91vVWyOOquFZLVTMhBDGvkeXuDQSSBuTtuT/SvhWtbExfjFRiorJAnHhCROPCEIYymb7UqZvtQQ8hlbuCfvLoXqhlR/FVEtvisdD5RyhqPKn/uhrehdKyNjXgA+aDuQQqiVu5h+8XZs05xhv7lrLj39+udN4+87x3d0k3FzA3hDhwNI2/jDfZJLKxqMb66p0ffkvkvWfwdrfFFRJm+1Kmb7UyNoMhCEgDN6JkreiZZBHmCt2T+1vse0bGebXZhd3yySR+c19HRnhEb+LwOE7uMFg5t6u/iqqKennq6+ClpYJKmqmkEcMMTC58jnHYNaBzJJIAAVr6wXDbPrXicFb5dQ4taae1MmZNvHNKyMd7IGAkRu32Y5u5O8QBPLYY3rlY1WJvUxFKjsu5Psjl/U4v4fLtroZ6rOLe8/FSq2lUuhnqs4t7z8VKraVKXOZwrlL2jX78vzMFE8+9BeafUNZ9g9SxRPPvQXmn1DWfYPSrMq4bpEO1cTzHTN6JUzei2CPR56FaHeq5i/vPxUqthVPod6rmL+8/FSq2FRlzmeeuUvaNbvy4sFFM89BuZ/UVX9g9StRTPPQbmf1FV/YPULNFXDdIh2rieZyFPsZ0yzDLsVde7JS2423y/yBktffqKhM1TwB/cxsqJmOkdwuB2YD1UOuNur7RkFdarpSS0Fyo53wVVNOwtkhkYS1zHA9CCCCFfsz0a00rtHfjQ/wBV7GPefipVa6rPR+mho+ztYKWnuFPdYI31LWVdK2RsUw8pl85okYx+3/KaD/MrMVCXOZ585R9oVu/LiwUVzv0IZl9R1f2D1NDRVIsrLiYv3G6cwNk4hzeGhxG2+/Rw57bc1C879CGZfUdX9g9CzRXoRlHEQura1xPNYeIJ1LcWwTJMxt93rbJFQNobWIjX1VyvVJboYe9JbGC+pljaS4tIABJ5Ljsixq94nk77Pf6E0Fe2Jkob3jJGSRvaHMkZIwlkjHNIIc0kEdCtg08z0O4yte2o7waJ+rJjPvHxMqtRVXon6smM+8fEyq6LbbfnGnusnfdz5FQuqduDi49nsbw9Rt499+fRUGm5OxwPHQlU5SrRjnpS4s4tRbOvQlmP1HV/YvUuijZI2UvnZAWM4mh4ce8O480bA8+e/PYcjz6KI516Esx+o6v7F6VZlPDr9vDtXE83FP8ATvHbZe8vnrcjl8lxK0wGqu1Q5zmNLd9mRBzQfOe4gBo2c4B3CeLZQBX1HiF+l0+o9O8cgpvn+aiOQ5W+ruNPQspYW8IhhllnfGGBgeHujk6Pe1zTsVed3qR3XFOckqNN2lPVqzS2v4LLraOz+n2QVWU6UW+/1be7lrJ6l7Y9we7YKiRrGbgDfhaGt32BO255lTNQXTKxVuPaB45b6+e31E4bO4vtl3pq+LY1Eh/haeR7Cf5uLcKdKlJWk0cQx1NUcbVppWSk0l1X1AovnHoVzD6kq/sXKUKL5x6Fcw+pKv7FyhZmDD9Ih2riecaFy1LYrrW4hdr9TUveWm2SwRVs/eNHdOm4+6HCTxHfu39Adtue24XyVlNDTSQNhr4LgJIGSPdTtkAic4bmN3GxvnNPIlu7d+jnDmr56EszvRov6tONe8fEyq0VV2i/q0417x8TKrRVGXOZwPlDp9bvy4sFGM39DGX/AFLVfYuVhVuO3e3UL6ispmRNjAMsYqY3SxA7AccYcXs5kDzgOoVe5v6GMv8AqWq+xcizT1mOnSqUsTCNSLTus1baedS2LWtivHez0N0SoOPsY2efut5TJPIx3F/FbUyAnr7N3/8A2bKVrOjtzo67skYvV01uho4YLc+GWmjILXvic9j3nYDnIWmQ8urzuT1OFzzkLFYrE4rGqtGyjVduFs9iSy1a9RoP/wDQeTsDglgKmGkm50vWSVvvOWlks3KS16/V19Yozmvoay36lqvsXKTKM5r6Gst+par7Fy+0WZx7D/bw7VxPPFZHiCwuexvHLrlWWU9ns9P31TJze93KOFg6yPPsaNx/OSQACSAbzyO8znGnFyk7JHFQQTVNZDTU0L6ioleGRRRsLnPcTsGgDmSTyACtB1nsOnve/SumhyLLnQsko7RHIXUtC48LgapwI4ncz+LbxNIB3Oz2uGupyGgwWK5WLCKtlxr52Ohr8l7vhkcOIfi6UBxDGADYv3Jc47ggNYVVyXWzX2q4rW7xh8nL+8V1ZvbbJ9+O19+Tt1D9w/rCnXiGvbztffk7dQ/cP6wp14hrm3kB7HqfxH+WB6U8oumx7q4sZvRMlb0TLqh8kCEIQI8zsj2Z7/hFg1QyqbLJ6egutRjdTBjdfVVDKdlNWu24S2d8cjKeQjcNmcxwbz3B32Npvzd9y7RujcttvFiwrJrI6dl4yq6ZzSXeSro92nhraiKKKGZ3B3jGta9z3cWx4eTj0bHULYvnMRyPRxGKliHLXJW160vVccr2as7tNNX1mypY2dOkqaWpO/4p9t9WatqPSasz/Rqo1/0ivdDebHBopRz17G445jI5Lbc3OlLayopSS90byWlkhbws5eH211kme4ZPdNPqDUK30OQ01uzOOsqb1Pm1LkdbJQni72JwpaWNopt+BwjeQ8eEMI3DejycdAqFLydw9OSenJ2Vk72a1yd7prW9J3bTvZbbt2Z8p1ZJrRWt36tmrXs1aksjuTkV2vd37euG1cmcWfJ8Om1FoZcao7bdYakUtKapvdtZCwk0zWsLWOY4M4nbHZ+3ELQ1Qv1op5e0jaM/y6011or7lTxYnaY6uOeqoqsPPeTMpmnvIODfeRxDe82Oxdxbnz3tF1r7Fldsvlqn8luluq46ujm4Gv7uWN4ex3C4Fp2cAdiCD7Qvrv8AkF3yrNbpkd+q/L7zcah09ZUd0yPvJHdXcLAGj+gABEuQtKtS9ZKMIpakk7qUZJrYr6Ot9b1a9ULlC1OerXJt63q1pr++pHfu9V2BwaFaw4vcdVZNQqP6NxT45W5FnNLcHVdU1nGPJaXg7yle1/mlhkLnDbzduag2Y6tOszuzJT43nfkdpt+M2tuSMstz2cwsfH3kNT3TuI8LWn8U/pu7lzK6TITUfJ+hTknUm5a27NK13DQbtknt1ar5JLUY58pVJK0Y22Z9d/8Ax2HpDHqBFTdunVXIrrqRZ7niNThdzGJunyqmrKVj3+SnuWRGVwic9zP4JzWl/AeTgFVlxzTCb1pN2W71n13osnuNvu1YzK2yTsqq1lK2sHdNqWAl5YGAENcObd9gd+fTFM3oil5P0Kbi1NpxSV0knZQlD8dK7/eVyZcpVJX1Z3evXnJS/tbsZ6MX7UfFHanNpa2a0XiwzZ3bK+w3qrz2jrBaYY66JxNLSxUzX0kXc7h8cz2taGnznO5vq286tVEfylN0vgutsyzFbfeKt1oo627iG1njiLBJDK0OiikdyImI2Lubne0dO0KaHk9hKKave8XHbtsm1runZa7NZt6hanKdapbZZp/K+rLXntudrtWbNjGY5xpxSWjUamF9usNSLx9J8oprjBZSCDGJblA0h7XgO2BLy07dOLZfTh91obT2OMixXB8wsuM6qQZaXXK4uu0VC65W5rCwCmq5SwOj4+F3AHAkB3I8Wx6ljwhZVz/4q+GhQdS8YtNXStdNvWtq12s3fUndvWVvTLVpVFGzerPqS1bnqv8AG1rHfXHNSqSxaPdm62U+c2mCrizurOTmkroou7pZLg4vdM3zTFA9j3O2cGtLeE7cht1R1bfZpO0/n8uPS0k1jkv1U+ikoHtdTujMri0xlnmlvPlty26Kum+1MsmD5KpYLESrQlrlpX1Jc6Tl+F7LqEr4yeIpKnJZW/CKX42uC2LWti35rAQhCCGCZvRKmb0QKMst6rCy3qgh5DoQhBCBbFrWxKgYIQhMKM3omSt6JkAZHiCdIPEE6jaAIQhQxWA6hbFrHULYpQoJm+1Kmb7UPIh5DLI8QWFkeII2Ax0IQoQgK7dUv3p0a0WxH/bHk+NvvPlfh4vnCYy91wc9u77vbi387ffZu2ypJXbr/wDuHX5mKxedb8YslDaKCR/OWSFkDZA6Q9C/eV3NoaNgOXtON85GnxHr4+hDdpy+SUf8/wCPUUo3omSt6Jlk2G12mW9U6RvVOlB5gOoWxax1C2JmQW7oPbqO6drbDKauh7+BlTLUtbxlu0kMEk0btwQeT2NO3Q7bHcbhVfcrjWXjI7hdrjN5RcK2pfU1UvAG95I9xc52zQANySdgAFbujP7h/CXkT/3H82YVW+R3M+Z5HWS8McHBL/vcr93tZsQ47uA35qlVjXOZpqfr8o1Ze7GEfj60n8018l1AnHhCROPCExtTKyPEFhZHiCAHQhClAXX/AHM7Av8AJ9bes0//AJclwpIab/oMsUcx/na159jlTCufUj97NCNGcXqPPuEFlqLs+SPnEYa6fvImgnY8YDDxDbYHbYuVMJI5XNLyf61KdT3pyfwUml80kwWxa1sTG2BCEIAyPEFyFtt9ZdshoLVb4fKK+tqGU9NFxhvHI9wa1u5IA3JA3JAXHjxBWfo3aPnvtP4XR+UeTd3cW1fH3fHv5O0z8O248Xd8O/s332O2xhuyuU8VVVDDzqv7qb+SufZrfcKOu7S2QwWybitNt7q3UcDGFkVK2CJsb4Y2EAMY2QScmgN3JI333NVrlcju/wBINQr9fvJ/JPnK4z1fcd5x913kjn8PFsN9uLbfYb/mC4pCVlYx4Sk6GFp0n92KXyQJm9EqZvRSXBkIQgh5Arj0c/e68Zrlp/cs1hxarnt1wk5RU1bIBFACT5jnPDpGtY7fiO+wJHKnFcdk/efsR5rcf9sfSHIaO0934fJvJ2mq73fnx8W/Bw7DbrueiWWRp+UfWw3m/fcY/BtX/pv25FQIQhMbUcdAsrA6BZQAzeiZK3omQAK5r86ntPYiwO2wxSSSX6+Vl1nmfKNon0/7lDGtDejmuadyeRaeoI4aZVwa0/uPUPHcal86vx3F6C11sjf4OSVkZkLoz1LdpW8yAdweX50etpGnxS85iqNPrcvhFW4yT+HWU+ti1rYnNoCceEJE48IQgMpm+1Kmb7UEPI+630FXdb9Q2ygi7+urKhkFPFxBvHI9wa1u5IA3JA3JAVi6x19JU66V9stkvHZbHTw2m3xcJHcRwMDXR7uHE7hk70cTiSfzkbI0ZoKSt7RVhnuMXFa7d3twq53OLI6YQxOeyWR4IDWtkEfNx4d9geuxrq4V9Xdb9XXOvl7+urKh89RLwhvHI9xc52wAA3JJ2AASPnGo+05Q7kfxk+KUfx6z40zfalTN9qZG0GQhCQBm9EyVvRMsgjzLK0ltkFdrZbrjXvkhtFjjfeLjPGRvDFTjjDttiXDvO7Ba0FxDjtt1EJu1znvWV3S81TI46qvrJaqZsQIY10jy8hoJJ23J23JVj4j+8XZv1EyZ37lq7h3FitlT4+87w95Vw8PMDeENPE4Db+Kd91UzeiRc5mqoftMXVqe7aK+C0n+MrPsts1+iGhnqs4t7z8VKraVS6Geqzi3vPxUqtpUZc5nCuUvaNfvy/MwUTz70F5p9Q1n2D1LFE8+9BeafUNZ9g9KsyrhukQ7VxPMdM3olTN6LYI9HnoVod6rmL+8/FSq2FVmitPPTdmLFo6iGSnkMc0gbIwtJa+okcx2x9jmuDgfaCD7VaaoS5zPPPKLT5QrNe/LiwUUzz0G5n9RVf2D1K1FM89BuZ/UVX9g9CzRWw3SIdq4nUzGsgwO39jOGhyu21GSVrM6fVQ2mgyCKglDPI4295K0wSvdESC3zeDnvs7dcvq1rDf8AMdJsQdBf46F96F0q8itdqqeBvHLc5pGQztaeIsDeFzGSb9eIc3bnrUhbLTdrHpHzktHRPZTErtjWRWqvmnu9FV2qgvtXc6KeOqY+OthM0newxuBIcXOZFsBv1d/Ouexi5GXv7tWX+eOequrpK+jbeo6OENPCe8eyRru+Dt3Dha0nZv8AOF1S0P8AVexj3n4qVWuqjqtTvY4rjOU50+Uaj0dcZz17Xr1X7FqWrK+3WWbV3CQYRebVaL0IaCmvdS59Iy5tibLSOAADGlwEjTs7zW79enNcLrHdrZP2b9S2UZbU2qexVItsT73C9lOAwlpipWxB8Tg0EHiIGxduXHYmGKK536EMy+o6v7B6FVeRXw/KtXziglzrL4a1ZXTsrPLek7o6t6N1Fvdovqraaikxi8XCtdbHUlqynIG2unqRHNKXubIaqmJLAQdhJ7RuCrEqbhZaztIU1wtmoBxa50OB0sIocWy6C10zaqN7IjbKa5yExNibFtMXvdJxOa5vE92zl02HiCdXNO2o7gqtopWy/wDJ7B4re7YzDYLra7xBU1U+JcMtV87w3CR9WKgNeHVEccbJphwHd7WAkgu87xGTUF5tUraW4X6dtyklxt8dwb5SBNO8Vp4WOO+5f3bWnY8y0DmOq6paJ+rJjPvHxMqtRVHVekzi2N5Uq0+UKqUVZSlq2X0s7ZX/AFZYb6sC65LJU3ekrIJ7G5lA+F7WM4O9jLYmx7/iyAD+L6jYnn1PC6r34XLSjWyjnucVTbRjdS+3Rd60x960sHFEOnEWGTct5kcRO6iyi2dehLMfqOr+xekVR5FTD8p1fOqCWqT163t0l8edt3I4DTa4VtVdJ73acgttXozZ9MpjW42yrhfJDUttLmVLHUZPE2d84qHmZwDZGFw4yDwqgdJMkbd9X9SrpkL7LVV15xStjipL/d/IKKqlfJCWU/fPniLW8LdmgStIa0AHkvnyPLL9iPZgxbCaK6wxz5Bb/LbxJBSMbUPonHempjUCNr3RbF5MbnO2cCAQ0gGgm9Vd002mdlpV4V5qulldK+69nbPU2rrqtqPVHSJkVp0+sstdbcaxy0toagV9tx6+i50tTGaiTeNknlVQXSOJb/vnmEcWw4Vb8F0tvzneX01e0TzspzZ3Ut0ioHwUgD94BI9rxG5pLOJp2LiCdzv53UjRb1Z8a94+JlVpKp5xxbsjkmJ5Tnh8bVjCOpTk+vXdbrbbrVnr1lqyXOKevyE2WrpbLf5HUvBUG4xjvWNjcJg2o4WMD3P4HOI2DtnbEjrXuTQvuugWqVldc7eLrV0RkZNU1sVNBLwRTtee9kLWDnIDuSNxuea4xRfOPQrmH1JV/YuS+cbauU6XKE6mJpuS2vbq9Zu+rK/rPX1LVvra65dcYaHUPF8F1NpKGvfZMWNFU0WVst1NVeTWuOCsEcz5I2cW/A1zCQ88GxG7dhCo8gsNw1JsuK1l7oGY/kem1usldWSVbPJ6GsZTMkp3yu34WGKpiiDy4gtaX77c11hQr2mzubrN7D100zumMU2lMdkxyubJDaIY7Zaq+ju0VGKtlPJMypmiqHsc0CWfil/i8QcNjy2Pw5RVQVmb1E9PHHCCyMSGKpE4c8MaHPL2saHEkEktbtvvtv1VGaL+rTjXvHxMqtFUqlRy9U4jytj6tatUoSyjOX5pW2X22zyS1Fj3QUdwsd3uN9daPnN0Qkpa6213FNVzF7QeOEOIAI4iSWMIP/Yvjze8WdnZsygQNFRaBh1TFNQvvsMMffeSODyabuTIZO83cHgnnseIDkIIoxm/oYy/6lqvsXIVVp3SDDcqTjiVKMUm7JvVd6763bXe+vVd2V2VrQ1OORdm27WW6agVGSWiXBnS2+G6Z1SyU0FeIGytpoLU6N08EkUoMbXmRgdwnbcPDTxMOolKdVdO7NV5RSx4xSYLSxUzHSiS30t3Fscynnqo27tc+GodHuXglgaN+Tdl1KWxXdNna/PvVZZHqTpbd8gg0QjkyzKqe+ZJHQVElPcIrzFcONxqHsa3v2Pe15DHbtDXEt4fZw7Dl8jrhcrbjdZNVNrLk+2ubWymQOkL21Eob3h68XBwdee2yonRv1b8c94+JkVnLTwpU6Mqmgrab0n26lf5JHHeWeV8XjK0qFV3jC8I3eSU3JfFXa7HYFGc19DWW/UtV9i5SZcFlFN5bppkVH5RDSd/bKiLv6mTgii4o3Die72NG+5PsCyLM+WoNKtFveuJ0TxHEa/Lb9JBBIyhttMzvrlcp+UNHENyXOJIG+wOzdxvseYAc4fXe75QU1idiuKue2xB4dXVz2cE12lb0e8dWxNPgi9nidu48vpyLKYWYfT4VjMzxjNK8vqKp0Qilus2+5lkA5hgOwYw7kBrS4kgBsBHiCua3rZ2ynCpWn5yrqj92P8Ad9e5bO3J0IQnRsTvx2vvyduofuH9YU68Q17edr78nbqH7h/WFOvENcz8gPY9T+I/ywPQPlF02PdXFjN6JkreiZdUPkgQhCBHmA6hbFrHULYpIBOOgSJx0CgDKZvRKmb0QQ8hkIQgQEzeiVM3ogBkIQgBx4QsrA8IWUGNjN9qZK32pkAC2LWtiCAQhCCGCZvRKmb0QKMst6rCy3qgh5DoQhBCBbFrWxKgYIQhMKM3omSt6JkAZHiCdIPEE6jaAIQhQxWA6hbFrHULYpQoJm+1Kmb7UPIh5DLI8QWFkeII2Ax0IQoQhIsQtFNkGrOL2GsfLFR3K701JO+EgSNZJK1ji0kEA7OO24I39hUp1ku9Te+1LnVZVMijlju8tI0RAgcFOe4YeZPMtjaT7NydgByH3aF2imvfazwijqnyxxR1xq2mIgHjp43zsHMHkXRtB9uxOxB5iur5d6nIM2vF+rGRRVlyrpaudkIIja+R5e4NBJIG7jtuSdvaVj+8adevyq/3Ifmk+Ohr7Eca3omSt6Jlk2G12mW9U6RvVOlB5gOoWxax1C2JmQXVh37l7GOss9T+54K2ptNNRSS+a2omZUOkfHGTye9rPPLRuQ3meSpVXVXfvb8n9YqKt/E1N5zWa421ni76nhphTyP3G4btKQ3Z2xPUAjmqVWOO002C9adap703/Sow/wAuvrugTjwhInHhCY2plZHiCwsjxBADoQpBiVppr9qrjNjrHyR0lxu1NSTvhID2sklaxxaSCAdnHbcEb+xGQk5qnBzlktZZeuv7h1fteKfwv0Xx2gtHlXTyvghEne8H8TfvduHd3h3357CmFY+r12qLz2m83rKpkccsd1lpGiIEDggPcMPMnmWxtJ9m5OwA5KuEseajV8nQcMBSUs9FX7Wrv8QWxa1sTGzBCEIAyPEFdGin7ly/NL9B5l2seGXG4Wufr3FQ1jWB/CfNd5sjxs4Ec+nIKlx4groxD9zdjvWCep/c8NbUWqmo5JPNbUTMqHSPjYT4ntZ5xaNyG8zySyyNPynrwrh7zjH4Skk+3U3dbUU0ti1rYmNoCZvRKmb0QAyEIQQ8gVx5n+93ZX0jtI/cNTVfOFxrqIfi3zcUwbT1EjORdvGHBkjhzaCGnZU4rj1s/ceo2OYzL51fjmLUFqrpG/wUkrIzIXRnqW7St5kNO4PL86vNGnxPr4uhDc5S+UdHjJfGxUCEITG1HHQLKwOgWUAM3omSt6JkASrBrOy/6y4tZpqOS4UtXdII6qCIO3dDxgy828wAwOJcNtgCdxtuvs1IvD79r3l1zdWR3COS6Sx09RCWlj4Y3d3FwlvIju2sAd7dt9yTupVol+4tWbllH8L9Gsfrrt5N08q4IjH3fF/E373fi2d4enPlT6T7xqF6/KMn7kUvjJtv8FHt+ALYta2JzZgnHhCROPCEIDKZvtSpm+1BDyLf0+/e3RTVzJIPProLRT2xkcnOMxVk3dyuIGx4gGDhO+wO+4KqJW7c/wB6uxPjNBUefNfMnqLnSGPm1kUEQpntfvts4vO4A3HD1IPJVEkW1mowfrzq1d8mvhFKPFP5gmb7UqZvtTI2gyEISAM3omSt6L7bfQVd0v1FbKCLv66rqGQU8fEG8cj3BrRuSANyQNydlkMcmo3byLbzp3zF2b9McTZNTtqKunlvlxhgh27zvj+5pHPLQS4RmRhAPLh2O4DCqbb0VnawV9JUa5V9stkvHZrHTw2m3x8JHcRwMDXR7uHE7hk7wcTiSfzkbKsW9Fjiavk+LWEjJ5zvJ/zPS19l7dVrHohoZ6rOLe8/FSq2lUuhnqs4t7z8VKraVKXOZwrlL2jX78vzMFE8+9BeafUNZ9g9SxRPPvQXmn1DWfYPSrMq4bpEO1cTzHXJ2a2z3rKrZZ6V8cdTXVcdNC6UkMa6RwaC4gE7bkb7ArjFaujtPA3V436thjqbdj1tqbtVwuYHPe2KMhvdg8i8Pexw3I24d9wQFebsrnoTFVXQw86izSdu3Z+J35sfzWzFqWksvK2UPFQws878X5O4wOZu7meF0Zbud99t9zvuuWVWaLVE9X2a8eqqqaSpqZpKqSaaV5c+RzqqUlzieZJJJJKtNUWrOx59xVN0cVUpt30ZNX32dgUUzz0G5n9RVf2D1K1FM89BuZ/UVX9g9Ss0LhukQ7VxPM5CEK8eiz0F0P8AVexj3n4qVWuqo0P9V7GPefipVa6oy5zPPvKPtCt35cWCiud+hDMvqOr+wepUornfoQzL6jq/sHoWaK2H6RDtXE81h4gnSDxBOr7zPQ5380T9WTGfePiZVaiqvRP1ZMZ94+JlVqKhLnM4Dyj7Qrd+XFguPu0NvqcWuVPdyxtqlpZGVpll7tgiLSH8Ttxwjh33O42/OuQUWzr0JZj9R1f2L1CzKdGLlVjFO12joBmF/flGp98vznPdHV1TnQCVjWvbEPNia4N5bhgaD16dT1Ucb1WFlvVX8j0HCEaUFCOSVl8Dvzot6s+Ne8fEyq0lVui3qz417x8TKrSVGXOZwflDp9bvy4sFF849CuYfUlX9i5ShRfOPQrmH1JV/YuULMr4fpEO1cTzjW2CCeqrYaamhfUVMzxHFFEwufI4nYNAHMknkAFqVmafwQWaivGoFxhZJTWVnd2uKdgLKmvkG0TQHbB4jG8jg1we3Zrgrzdkd6r1fM0nNK72Le3qS+Z3KwSyQY5pPZ7HDVsrXUjHx1EsUokZ3/eOMzQQBybIXtAI3G2x5gqXKs9Hp56rs7WCpqZn1FTM+pkllleXPkcaqUlxJ5kk8ySrMVJ5s4TjIyji6ik7tSd3v1sFGM39DGX/UtV9i5SdRjN/Qxl/1LVfYuULMxYf7eHauJ51LYta2K+egDvVo36t+Oe8fEyKzlWOjfq3457x8TIrOVGXOZwjlDp9bvS4sFGc19DWW/UtV9i5SZRnNfQ1lv1LVfYuULMrYf7eHauJ54rI8QWFkeIK+zvg6EIQgO/Ha+/J26h+4f1hTrxDXt52vvyduofuH9YU68Q1zPyA9j1P4j/LA9A+UXTY91cWM3omSt6Jl1Q+SBCEIEeYDqFsWsdQtikgE46BInHQKAMpm9EqZvRBDyGQhCBATN6JUzeiAGQhCAHHhCysDwhZQY2M32pkrfamQALYta2IIBCEIIYJm9EqZvRAoyy3qsLLeqCHkOhCEEIFsWtbEqBghCEwozeiZK3omQBkeIJ0g8QTqNoAhCFDFYDqFsWsdQtilCgmb7UqZvtQ8iHkMsjxBYWR4gjYDHQhChCF26EfuHUzJsqi864YxiVxu9BG/nFJMyMRhsg6lm0ruTS07gc/YaSV26TfvVpnrLlVR59vp8SfaHxx85TNXyNjhcAdhwAsPEd9wNtg7oqSWNc5mnw/rY6vLdox+S0rf1X+IzeiZK3omWTYbXaZb1TpG9U6UHmA6hbFrHULYmZBdWffufsqaH26o/EXBlNdKl9LJ5srYZqproZC08wx4BLXbbOAJG6pVXVrR/wDSn/5uLX/+tVKrHHI03JuvBqXvOb8U5P8AuCceEJE48ITG1MrI8QWFkeIIAdW3oTbqO6drLDaauh7+BlTJUNbxlu0kMEksbtwR0exp26HbY7jcKpFdGiP7lzDNb/B+Lu1jwu43G1T9fJ6hrGsa/hPmu2bI8bOBHPpyCWXNZquU21yfVUdTcWl2vUvxZVFyuNZd8ir7tcZvKLhW1L6ipl4A3jke4uc7ZoAG5JOwAC+JCExsElFWWpIFsWtbEEghCEAZHiCuit/e7sFWSjrPxNTd8zmuFuZ4u+p4aYQSP3G4btIQ3Z2xPUAjmqXHiCujUH9wdnPRiw1f4q7Q26uuEkHXanqqgPgfxDzfOa1x233G3MBK80afG+tWoQ3zv8FGT4pJ9vWU0ti1rYmNoCZvRKmb0QAyEIQQ8jn8UtVPfdUcbslW+SOkuF1p6WZ8JAe1kkrWOLSQQDsTtuD/AEKTatXWovHaXzWrqmRxyR3WSlaIgQOCA9ww8yeZbG0n+cnYAclyWh9vpLn2qsPpq2Hv4WVElQ1vGW7SQwvljduCOj2NO3Q7bHcbhVrcLhV3bIq663CbyivrKl9RUy8AbxyPcXOdsAANySdgAEv3jTr1+Un+7Bf1Sf0a/gfMhCExtRx0CysDoFlADN6JkreiZAFwYD+4ez1rFfKX8VdIrfRUEc/XaCqqCydnCfN85rWjfbcbciFT6uCt/e/sL2WjrPxNTdswmr7ezxd9BDTCCR+43DdpCG7O2J6gEc1T6VbTUYT1qlapvm14Uo8U+xtoFsWtbExswTjwhInHhCEBlM32pVydltlRe8utdmpHxx1VfWRUsLpSQxr5HhjS4gEgbkb7AoEnJRi5PJFnaqfvbadO8Vi/c0NsxiGepoHfwlLWVJMlQJAfPa53mO4HeEEbAAqolZmsdzp7v2mcvq6ZkjI46wUpEoAPHBG2F55E8i6NxH8xG+3RVmkjzTWcnxawVNyzau+2Wt/iwTN9qVM32pkbIZCEJAGb0VpaNWT597SGMwvjqHU9JUGtmfA3fu+5BkYXHYgNMgjad+vFsCCQqtb0Vu6a/vdgGqmRz+fQwYy62PYznIZayRscTgDsOEFh4jvuBtsCmlzTVcoyksHNRdnJaK7ZequJWt4uc96y26XmqZHHVV9XJVTNiBDGukeXkNBJO25O25K+BvRKmb0Qsy/GKjFRWSLnxTXHLMPwGgxy2W+0T0NJx92+qgldIeOR0h3LZQOrj7OmykX9kvnf8k2H9Vn/ANMuvCEjhHcaefJPJtSo5zpJt632nYgdpbOyf7k2H9Vn/wBMvgu/aCzO9YndLPVWyyx0tfSSU0zoqeYPa2RhYS0mUjfYnbcFUO3qnUaEdwi5H5MhJSjSV0CtrG/3l7K2c3w+ZUXivprLRTwcpouH8fO1zuREb49mkAniI2I25qpVbeZfvV2e9Mcfd+5K2aCpu1dTR8mzNmk2pp3lvmucY2uA3Jc0cjt0UvNIzYz13Tpe9JfKN5fK6S+J9mK635XiGBUGO2232meipOPu31MErpDxyOkO5bIB1cfZ02Uh/sk86/kqxfqs/wDpl17QpcI7jDU5J5OqTc50k29b7WdhP7JPOd/7lWL9Vn/0y+G76/5lecUudnqrZZo6aupJKaZ0VPMHtbIwtJaTKRvseW4KokdQtihQjfISHJHJkWpKkroEIQpNwXJimtmVYjgVBj1tt9pnoqTj7t9TBK6Q8cjnnctkA6uPs6bK18r1syrHMXw3a32mW9XS0i5Vu8Epp2xSuPcNj/GBwdwtPGDuN9tiQurlgtfz3m1ls3f+S+X10NL33Bx933jwzi23G+2++24Uy1Zvc997QWSzzCRkdLVuooInzF4Y2E935u+3CHOa5/COheevU43GLkfL1+TcDVx0U6a16UpdexfNtv4E8HaPzg/+arF+rT/6ZfDdtfcxvOK3O0VVts0dNXUklNK6KnmD2tkaWktJlI32PLcFUa32pkyjG+RbXJPJsZXVJXRkeIJ0g8QTp3mbkt7F9aspxLBaHHrbQWqeipOPu31MErpDxvc87lsgHVx9nRSD+yNzf+S7H+rT/wCmVAoWPRjuNPPkrk6pNzlSTb1vtZ2Dg7QufVVdDS0tks1TUzSCOKKKjnc+RxOwa0CXckk7ABSHVPV26UN5u+FW5tuuFMbcaK61ZgcN53sLZe64ZSGgBwHC7ctcHA77c6k0moqWo1poblcYuO0WaCW6V8nER3DIWFzZNmnidtJ3fmtBJ/MRuoRdLlPeMoud3qmRx1NdVyVMrYgQxrnuLiGgknbc8tyUujHSNdHkzAPHWjTSUFf4t6vkk38UfCst6rCy3qsp9M8y38Y1nyjE8Gocft1BapqOl4+7fUwSukPG9zzuWyAdXH2dFz/9kTm2/wDcuyfq03+lVCIHUJNGO41M+SuT6knOVJNvW+1l+/2RGa/yXZP1ab/Sr4Lrrvl14xe5Wmpt1nZTVtLJTyuip5Q8Ne0tJBMpG+x5bgqlUI0Y7jHHknk6LTVJXQK1tSo2Y3RY/p7STsfHaqUVN1MQcO9rphxOLjs0PDWcAY7h3DXbE9QPg0xoqYagOyW6xcVhx2B1wrHlxbu9o/ERsO4BkdJwlrHOAdwkc+hgVdW1NyvdZca2XvqyqnfPPJwhvG97i5x2AAG5J5AbKc2Z5ftsYlspq/8AM8vkr+JFp4vrLk+KYNQ2C3UFrmo6Xj7t9TBK6Q8b3PO5bIB1cfZ0XP8A9kNmn8l2T9Wm/wBKqFb0TKNGO4wT5L5PqVHOVNNt3fxL5HaGzQn+5lk/Vpv9KviuuumW3fGLjaam3WhlPW0slPK6KnlDw17S0kEykb7HluCqUHiCdGjHcKuSuToyTVJXQLYta2JzblsYzrFk2K4TRWG30Nrmo6Xj7t9RDK6Q8T3PO5bIB1cfZ0Vp4zq9kldjN6yTIKe0UNhtzO7jbHBMyWvqXNJjgicXuaDyBcdnFoIJGxLm9Y7ZbK+83+ltdrpX1tfUv4IYYxzcev8AQABuSTyABJ2AU61DubKatosFtdU99hx5nk7gC5rKirBJnmLXcweNz2gbuA2PCdnLG4xbPmMXyfgq1ZU1BaUtbe1K+t9repfF7CWf2QeZ/wAmWX9Xm/0q+K565ZZd8ZuNqqbdaGU9ZSyU8rooJQ8Ne0tJBMpG+x5bgql0zfap0Y7i4uS+T4tNUldDLI8QWFkeIJ2bcdCEIQHfjtffk7dQ/cP6wp14hoQuZ+QHsep/Ef5YHoHyi6bHurixm9EyELqh8kCEIQI8wHULYhCkgE46BCFAGUzeiEIIeQyEIQICZvRCEAMhCEAOPCFlCEGNjN9qZCEAC2IQggEIQghgmb0QhAoyy3qhCCHkOhCEEIFsQhKgYIQhMKM3omQhAGR4gnQhRtAEIQoYrAdQtiEKUKCZvtQhDyIeQyyPEEIRsBjoQhQhC7cF9TXXb/6i/GPVJIQsazZp8H0nE99f/wA6YzeiZCFk2G12mW9U6EJQeYDqFsQhMyC6u0R64mYe6fBwqlUIWOPNRpuS/ZeH7kPyoE48IQhMbUysjxBCEAOro02/evQfWfKKfz7hBZaa0sjk5xGGun7uVxA2PGAwcJ32B33DkISyyNRyl0ZLfOmvg6kU/wACm0IQmNmC2IQgAQhCAMjxBXRrH/8ASr/5vLZ/+sQhK+cjT4np1D+bgU0tiEJjaAmb0QhADIQhBDyLp0SnfQZPnd5pWxtudrwm4VlvqHwtkNPOzgDZGhwIB2Lh/OHEHkSFSw6hCEi5zNNQS9Orvu8H+psQhCc2w46BZQhADN6JkIQBeWpFrqLP2YdEqSpfG+SSjr6oGIkjgnkinYOYHMNkaD/ODsSOao1CEkcjR8mNywl371T/APpIFsQhObgE48IQhCAyrO0btlPd+0ziNJUvkZHHWGqBiIB44I3TMHMHkXRtB/mJ226oQllzWazlKTjyfWks1CXBkGvFzqL3l11vNWyOOqr6yWqmbECGNfI8vIaCSQNydtyVxyEKdhdjFRiorJAmb7UIQhhkIQkAZvRW7R/uDsR3mrpPxVRdcuhoK9/XvoIqczxs2PJu0hLt27E9CSOSEJpGox3/AE1+/H9eOsqRM3ohCnabMZCEKGQZb1ToQoIYK4dbpGRa6SWKmp46a3WO20tvoGMLiRC2ISNDi4kkgyEb/mA9u5IhJ95Gpqa+UKV/dm/xgv7sqJCELMzZsB1C2IQlRCBCEJRS2dHP3HqdcMk/hPo9Yqy5+T9PKeGIx93xfxN+834tj06c+VVIQlWbNZR14yq3uivhrfFsZvtTIQnRsHmZHiCdCEPMgEIQoAtSyfvJ2V8rvkPnVt5usNlbIzzJKaJrO/k2eObmyDZjmcgQAST0VWt6IQlW01uE1yqyebk/wSS/BDLLeqEJi+8x0DqEIQTsNiEIQKWtUiDHuyZbW08jzcMtuL5apwjHB5PSPLRESSefeFrw5oBO5BOwG9UoQliarANyhUk83Of4Oy+SSXwGb0TIQmNltMjxBOhCAYLYhCCCzsV/tb0hyHN2c7nPP8y2l7fFTSSM45pt+RY4R8mPa7fcuBGxVYoQlWbNZh9dWrJ56Vvgoq3Fgmb7UITF8ZZHiCEIYDoQhCA//9k=')
+sync_assets(BASE, ASSETS, ASSETS_DIR)
+print_summary(STATUSES)
 
 print("\nDone. Now run:")
 print("  npx next build")
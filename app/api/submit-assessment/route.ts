@@ -98,7 +98,9 @@ export async function POST(req: NextRequest) {
         const tokensPath = path.join(process.cwd(), "data/assessment-tokens.json");
         if (fs.existsSync(tokensPath)) {
           const tokens = JSON.parse(fs.readFileSync(tokensPath, "utf-8"));
-          if (tokens[token]) tokenValid = true;
+          const entry = tokens[token];
+          // expiresAt is set by ep_tools.tokens; older entries have none
+          if (entry && !(entry.expiresAt && Date.parse(entry.expiresAt) < Date.now())) tokenValid = true;
         }
       }
       if (!tokenValid) {
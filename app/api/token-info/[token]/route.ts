@@ -59,6 +59,10 @@ export async function GET(
       const tokens = JSON.parse(fs.readFileSync(tokensPath, "utf-8"));
       const entry = tokens[params.token];
       if (entry) {
+        // expiresAt is set by ep_tools.tokens; older entries have none
+        if (entry.expiresAt && Date.parse(entry.expiresAt) < Date.now()) {
+          return NextResponse.json({ error: "Expired token" }, { status: 410 });
+        }
         return NextResponse.json({
           candidateName: entry.candidateName || "",
           institution: entry.institution || "",
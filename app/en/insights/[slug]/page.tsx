@@ -5,7 +5,8 @@ import Link from "next/link";
 import { notFound } from "next/navigation";
 import { INSIGHTS, type PillarCode, type Pillar1SubTheme } from "../articles";
 import { marketLabel } from "@/lib/markets/marketLabel";
-import { getRelatedInsights, getInsightsBySubTheme } from "@/lib/insights/related";
+import { getRelatedInsights, getInsightsBySubTheme, getRelatedLinks } from "@/lib/insights/related";
+import { jobsBySlug } from "@/data/jobs";
 
 type Props = { params: { slug: string } };
 
@@ -162,6 +163,11 @@ export default function InsightDetailPage({ params }: Props) {
     })
     .slice(0, 4);
 
+  // Mandates whose text is closest to this article (data/related.json); the market list below is the fallback.
+  const relatedJobs = getRelatedLinks(`/en/insights/${article.slug}`)
+    .jobs.map((path) => ({ path, job: jobsBySlug[path.slice("/en/jobs/".length)] }))
+    .filter((r) => r.job);
+
   const pageUrl = `${SITE}/en/insights/${article.slug}`;
 
   const breadcrumbsJsonLd = {
@@ -578,49 +584,59 @@ export default function InsightDetailPage({ params }: Props) {
           Confidential. Senior-level only. Apply in 90 seconds.
         </p>
         <div className="mt-4 flex flex-wrap gap-3">
-          {article.markets.includes("CH") ? (
-            <>
-              <Link href="/en/jobs/senior-relationship-manager-brazil-ch" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
-                Senior RM — LATAM / Switzerland →
-              </Link>
-              <Link href="/en/jobs/senior-relationship-manager-ch-onshore-geneva" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
-                Senior RM — Swiss Onshore →
+          {relatedJobs.length ? (
+            relatedJobs.map(({ path, job }) => (
+              <Link key={path} href={path} className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
+                {job.title} →
               </Link>
-              <Link href="/en/jobs/ia-cis-cee-geneva" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
-                Investment Advisor — CIS/CEE Geneva →
-              </Link>
-            </>
-          ) : null}
-          {article.markets.includes("UAE") ? (
-            <Link href="/en/jobs/senior-relationship-manager-mea-dubai" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
-              Senior RM — MEA / Dubai →
-            </Link>
-          ) : null}
-          {article.markets.includes("ASIA") ? (
-            <>
-              <Link href="/en/jobs/rm-hong-kong" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
-                Senior RM — Hong Kong →
-              </Link>
-              <Link href="/en/jobs/rm-singapore" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
-                Senior RM — Singapore →
-              </Link>
-            </>
-          ) : null}
-          {article.markets.includes("UK") ? (
-            <Link href="/en/jobs/rm-uk-geneva" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
-              Senior RM — UK Market / Geneva →
-            </Link>
-          ) : null}
-          {(article.markets.includes("EU") || article.markets.includes("CH")) ? (
+            ))
+          ) : (
             <>
-              <Link href="/en/jobs/rm-italy-ch" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
-                Senior RM — Italian Market (Switzerland) →
-              </Link>
-              <Link href="/en/jobs/rm-italy-milan" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
-                Senior RM — Italian Market (Milan) →
-              </Link>
+              {article.markets.includes("CH") ? (
+                <>
+                  <Link href="/en/jobs/senior-relationship-manager-brazil-ch" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
+                    Senior RM — LATAM / Switzerland →
+                  </Link>
+                  <Link href="/en/jobs/senior-relationship-manager-ch-onshore-geneva" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
+                    Senior RM — Swiss Onshore →
+                  </Link>
+                  <Link href="/en/jobs/ia-cis-cee-geneva" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
+                    Investment Advisor — CIS/CEE Geneva →
+                  </Link>
+                </>
+              ) : null}
+              {article.markets.includes("UAE") ? (
+                <Link href="/en/jobs/senior-relationship-manager-mea-dubai" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
+                  Senior RM — MEA / Dubai →
+                </Link>
+              ) : null}
+              {article.markets.includes("ASIA") ? (
+                <>
+                  <Link href="/en/jobs/rm-hong-kong" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
+                    Senior RM — Hong Kong →
+                  </Link>
+                  <Link href="/en/jobs/rm-singapore" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
+                    Senior RM — Singapore →
+                  </Link>
+                </>
+              ) : null}
+              {article.markets.includes("UK") ? (
+                <Link href="/en/jobs/rm-uk-geneva" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
+                  Senior RM — UK Market / Geneva →
+                </Link>
+              ) : null}
+              {(article.markets.includes("EU") || article.markets.includes("CH")) ? (
+                <>
+                  <Link href="/en/jobs/rm-italy-ch" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
+                    Senior RM — Italian Market (Switzerland) →
+                  </Link>
+                  <Link href="/en/jobs/rm-italy-milan" className="rounded-xl border border-white/10 bg-white/5 px-4 py-2 text-xs font-semibold text-white/80 hover:bg-white/10 hover:text-white transition">
+                    Senior RM — Italian Market (Milan) →
+                  </Link>
+                </>
+              ) : null}
             </>
-          ) : null}
+          )}
           <Link href="/en/jobs" className="rounded-xl border border-[#C9A14A]/30 bg-[#C9A14A]/10 px-4 py-2 text-xs font-semibold text-[#C9A14A] hover:bg-[#C9A14A]/20 transition">
             All active mandates →
           </Link>
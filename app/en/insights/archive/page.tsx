@@ -2,9 +2,14 @@
 "use client";
 
 import Link from "next/link";
-import { useMemo, useState } from "react";
+import { useEffect, useMemo, useState } from "react";
 import { INSIGHTS } from "../articles";
 import { marketLabel } from "@/lib/markets/marketLabel";
+import {
+  loadInsightSearchIndex,
+  searchInsights,
+  type InsightSearchIndex,
+} from "@/lib/insights/search";
 
 function formatDate(iso: string) {
   try {
@@ -40,9 +45,22 @@ export default function InsightsArchivePage() {
   const [market, setMarket] = useState<(typeof MARKET_FILTERS)[number]["code"]>(
     "ALL"
   );
+  const [index, setIndex] = useState<InsightSearchIndex | null>(null);
+
+  // Full-text index (public/search/insights.json), fetched on the first search.
+  useEffect(() => {
+    if (!q.trim() || index) return;
+    loadInsightSearchIndex()
+      .then(setIndex)
+      .catch(() => {}); // title/summary matching below still works
+  }, [q, index]);
 
   const { years, byYear } = useMemo(() => {
     const query = q.trim().toLowerCase();
+    const bodyHits =
+      query && index
+        ? new Set(searchInsights(index, query, index.docs.length).map((h) => h.slug))
+        : null;
 
     // ✅ Archive only = NOT featured
     const archived = INSIGHTS.filter((a) => a.featured !== true);
@@ -52,7 +70,9 @@ export default function InsightsArchivePage() {
         market === "ALL" ? true : a.markets.includes(market as any);
 
       const haystack = `${a.title} ${a.summary}`.toLowerCase();
-      const matchesQuery = query ? haystack.includes(query) : true;
+      const matchesQuery = query
+        ? haystack.includes(query) || !!bodyHits?.has(a.slug)
+        : true;
 
       return matchesMarket && matchesQuery;
     });
@@ -73,7 +93,7 @@ export default function InsightsArchivePage() {
       .sort((a, b) => b - a);
 
     return { years: y, byYear: map };
-  }, [q, market]);
+  }, [q, market, index]);
 
   return (
     <main className="mx-auto w-full max-w-6xl px-4 py-14">
@@ -85,7 +105,7 @@ export default function InsightsArchivePage() {
           <h1 className="mt-2 text-3xl font-semibold text-white">Archive</h1>
           <p className="mt-2 max-w-2xl text-white/70">
             Older Private Wealth Pulse articles, grouped by year. Filter by
-            market and search titles/summaries.
+            market and search the full text.
           </p>
 
           <div className="mt-3">
@@ -103,7 +123,7 @@ export default function InsightsArchivePage() {
           <input
             value={q}
             onChange={(e) => setQ(e.target.value)}
-            placeholder="Search (title + summary)…"
+            placeholder="Search articles…"
             className="w-full rounded-2xl border border-white/10 bg-white/5 px-4 py-2.5 text-sm text-white placeholder:text-white/40 outline-none focus:border-white/20"
           />
 
@@ -1,4467 +1,181 @@
-// app/en/insights/articles.ts
-
-export type MarketCode =
-  | "CH"
-  | "UK"
-  | "US"
-  | "UAE"
-  | "ASIA"
-  | "EU"
-  | "MEA"
-  | "LATAM"
-  | "CIS"
-  | "CEE";
-
-/**
- * Content strategy taxonomy
- */
-export type PillarCode = "P1" | "P2" | "P3" | "P4";
-
-/**
- * Pillar I — Private Banking Strategy & Power Structures
- * Sub-themes:
- * - Positioning: who is winning/losing & why (banks, competitive moves)
- * - ScaleVsBoutique: economics of scale vs boutique models
- * - ROAPlatform: ROA pressure, platform dependency, cost of compliance
- * - M&ARestructuring: M&A, integration failures, silent restructurings
- */
-export type Pillar1SubTheme =
-  | "Positioning"
-  | "ScaleVsBoutique"
-  | "ROAPlatform"
-  | "M&ARestructuring";
-
-/**
- * ✅ Extensible subTheme union
- */
-export type InsightSubTheme = Pillar1SubTheme;
-
-export type InsightArticle = {
-  slug: string;
-  title: string;
-  date: string; // ISO: YYYY-MM-DD
-  markets: readonly MarketCode[];
-  summary: string;
-  linkedinUrl: string;
-  body?: string;
-
-  /**
-   * Display logic
-   */
-  featured?: boolean; // Homepage / Insights landing
-  engagementScore?: number; // Used for "Popular Insights"
-
-  /**
-   * ✅ Content taxonomy (optional but recommended)
-   */
-  pillar?: PillarCode;
-  subTheme?: InsightSubTheme;
-  keywords?: readonly string[];
-  ogImage?: string;
-
-  /**
-   * 🔍 SEO overrides — use when article title is literary/abstract
-   * seoTitle: replaces article.title in <title> and OG tags (max 60 chars)
-   * seoDescription: replaces article.summary in meta description (max 155 chars)
-   */
-  seoTitle?: string;
-  seoDescription?: string;
-  speakable?: boolean; // Adds SpeakableSpecification schema — use on definitional/reference articles
-};
+// GENERATED by ep_tools.articles from data/insights/*.json. Do not edit by hand:
+// change the records, then run `python3 -m ep_tools.articles build`.
+
+import type { InsightArticle } from "./types";
+import a_ex_credit_suisse_banker_not_the_loyal_one from "@/data/insights/ex-credit-suisse-banker-not-the-loyal-one.json";
+import a_switzerland_third_private_banking_competitiveness from "@/data/insights/switzerland-third-private-banking-competitiveness.json";
+import a_the_sandbox_talent_map from "@/data/insights/the-sandbox-talent-map.json";
+import a_the_platform_illusion from "@/data/insights/the-platform-illusion.json";
+import a_zurich_private_banking_market_2026 from "@/data/insights/zurich-private-banking-market-2026.json";
+import a_private_banking_business_plan_switzerland from "@/data/insights/private-banking-business-plan-switzerland.json";
+import a_is_your_aum_portable from "@/data/insights/is-your-aum-portable.json";
+import a_the_geneva_paradox from "@/data/insights/the-geneva-paradox.json";
+import a_compliance_golden_handcuff from "@/data/insights/compliance-golden-handcuff.json";
+import a_the_alpine_exit from "@/data/insights/the-alpine-exit.json";
+import a_what_is_a_relationship_manager_worth from "@/data/insights/what-is-a-relationship-manager-worth.json";
+import a_private_banker_business_plan from "@/data/insights/private-banker-business-plan.json";
+import a_how_to_calculate_aum_portability from "@/data/insights/how-to-calculate-aum-portability.json";
+import a_the_emotional_strategist from "@/data/insights/the-emotional-strategist.json";
+import a_the_last_wave from "@/data/insights/the-last-wave.json";
+import a_switzerland_running_out_banks from "@/data/insights/switzerland-running-out-banks.json";
+import a_wall_street_7000_pump_5 from "@/data/insights/wall-street-7000-pump-5.json";
+import a_americans_already_here from "@/data/insights/americans-already-here.json";
+import a_smoke_difc_dubai_private_banking_2026 from "@/data/insights/smoke-difc-dubai-private-banking-2026.json";
+import a_bern_holds_line_ubs_swiss_capital_rules from "@/data/insights/bern-holds-line-ubs-swiss-capital-rules.json";
+import a_10_billion_myth_swiss_private_banking_consolidation from "@/data/insights/10-billion-myth-swiss-private-banking-consolidation.json";
+import a_ubs_ceo_succession_private_banking_2026 from "@/data/insights/ubs-ceo-succession-private-banking-2026.json";
+import a_private_banking_compensation_revenue_grid from "@/data/insights/private-banking-compensation-revenue-grid.json";
+import a_dubai_private_banking_iran_conflict_2026 from "@/data/insights/dubai-private-banking-iran-conflict-2026.json";
+import a_zurich_private_banking_talent_market_2026 from "@/data/insights/zurich-private-banking-talent-market-2026.json";
+import a_ai_trap_private_banking_portability from "@/data/insights/ai-trap-private-banking-portability.json";
+import a_when_goliath_moves_bahnhofstrasse from "@/data/insights/when-goliath-moves-bahnhofstrasse.json";
+import a_35000_jobs_one_question_nobody_asking from "@/data/insights/35000-jobs-one-question-nobody-asking.json";
+import a_when_safe_haven_isnt_safe_anymore from "@/data/insights/when-safe-haven-isnt-safe-anymore.json";
+import a_julius_baer_cut_jobs_strong_2024 from "@/data/insights/julius-baer-cut-jobs-strong-2024.json";
+import a_why_senior_rms_going_independent from "@/data/insights/why-senior-rms-going-independent.json";
+import a_ubs_integration_career_problem from "@/data/insights/ubs-integration-career-problem.json";
+import a_storm_warning_tariffs_zero_rates_crypto from "@/data/insights/storm-warning-tariffs-zero-rates-crypto.json";
+import a_alternative_investment_tipping_point from "@/data/insights/alternative-investment-tipping-point.json";
+import a_ubs_crossroads_succession_integration from "@/data/insights/ubs-crossroads-succession-integration.json";
+import a_billionaire_ambitions_2025_ubs_report from "@/data/insights/billionaire-ambitions-2025-ubs-report.json";
+import a_week_impacted_wealth_management_december_2025 from "@/data/insights/week-impacted-wealth-management-december-2025.json";
+import a_final_chapter_2025_ubs_crossroads from "@/data/insights/final-chapter-2025-ubs-crossroads.json";
+import a_swiss_banking_pivotal_week_ubs_17_year_high from "@/data/insights/swiss-banking-pivotal-week-ubs-17-year-high.json";
+import a_this_week_changed_everything_december_2025 from "@/data/insights/this-week-changed-everything-december-2025.json";
+import a_2025_bonus_outlook_senior_rms from "@/data/insights/2025-bonus-outlook-senior-rms.json";
+import a_ubs_vs_switzerland_24_billion_question from "@/data/insights/ubs-vs-switzerland-24-billion-question.json";
+import a_swiss_banking_earthquake_credit_suisse from "@/data/insights/swiss-banking-earthquake-credit-suisse.json";
+import a_great_ubs_paradox_us_footprint from "@/data/insights/great-ubs-paradox-us-footprint.json";
+import a_power_shift_private_banking_talent from "@/data/insights/power-shift-private-banking-talent.json";
+import a_unlock_career_move_senior_rms_2025 from "@/data/insights/unlock-career-move-senior-rms-2025.json";
+import a_ubs_potential_us_relocation from "@/data/insights/ubs-potential-us-relocation.json";
+import a_what_netflix_knows_wealth_firms from "@/data/insights/what-netflix-knows-wealth-firms.json";
+import a_swiss_private_banking_thriving_against_odds from "@/data/insights/swiss-private-banking-thriving-against-odds.json";
+import a_la_dolce_vita_italy_wealth_management from "@/data/insights/la-dolce-vita-italy-wealth-management.json";
+import a_investment_advisor_replacing_rm from "@/data/insights/investment-advisor-replacing-rm.json";
+import a_family_office_revolution from "@/data/insights/family-office-revolution.json";
+import a_ubs_unbeatable from "@/data/insights/ubs-unbeatable.json";
+import a_from_zurich_hong_kong_navigating_wealth_multipolar_world from "@/data/insights/from-zurich-hong-kong-navigating-wealth-multipolar-world.json";
+import a_global_markets_outlook_2025_strategic_insights_private_bankers from "@/data/insights/global-markets-outlook-2025-strategic-insights-private-bankers.json";
+import a_turbulent_time_crisis_resilience_market_leadership_times from "@/data/insights/turbulent-time-crisis-resilience-market-leadership-times.json";
+import a_ubss_silent_earthquake_10000_more_jobs_set_disappear_2027 from "@/data/insights/ubss-silent-earthquake-10000-more-jobs-set-disappear-2027.json";
+import a_transforming_wealth_management_global_trends from "@/data/insights/transforming-wealth-management-global-trends.json";
+import a_exodus_ultra_high_net_worth_individuals_from_uk from "@/data/insights/exodus-ultra-high-net-worth-individuals-from-uk.json";
+import a_swiss_european_banks_tighten_grip_cis_clients from "@/data/insights/swiss-european-banks-tighten-grip-cis-clients.json";
+import a_swiss_financial_market_developments from "@/data/insights/swiss-financial-market-developments.json";
+import a_should_private_banks_embrace_bitcoin_clients from "@/data/insights/should-private-banks-embrace-bitcoin-clients.json";
+import a_latam_private_banking_navigating_challenges from "@/data/insights/latam-private-banking-navigating-challenges.json";
+import a_latest_news_swiss_financial_market_focus_banks from "@/data/insights/latest-news-swiss-financial-market-focus-banks.json";
+import a_unlocking_growth_cee_region_untapped_potential from "@/data/insights/unlocking-growth-cee-region-untapped-potential.json";
+import a_why_apac_ultimate_private_banking_hotspot_2025 from "@/data/insights/why-apac-ultimate-private-banking-hotspot-2025.json";
+import a_rise_pigs_europes_economic_underdogs from "@/data/insights/rise-pigs-europes-economic-underdogs.json";
+import a_saudi_arabias_economic_landscape_opportunities from "@/data/insights/saudi-arabias-economic-landscape-opportunities.json";
+import a_battle_gulf_giants_saudi_arabias_vision_2030 from "@/data/insights/battle-gulf-giants-saudi-arabias-vision-2030.json";
+import a_swiss_private_banking_shake_up_mega_mergers from "@/data/insights/swiss-private-banking-shake-up-mega-mergers.json";
+import a_traditional_private_banks_vs_family_offices from "@/data/insights/traditional-private-banks-vs-family-offices.json";
+import a_how_global_economic_shifts_reshape_high_net_worth from "@/data/insights/how-global-economic-shifts-reshape-high-net-worth.json";
+import a_changing_face_swiss_private_banking from "@/data/insights/changing-face-swiss-private-banking.json";
+import a_ultimate_guide_interview_preparation_recruiters from "@/data/insights/ultimate-guide-interview-preparation-recruiters.json";
+import a_whale_vs_retail_investor_behavior_decoding_market from "@/data/insights/whale-vs-retail-investor-behavior-decoding-market.json";
+import a_navigating_trumps_economic_storm_private_banks from "@/data/insights/navigating-trumps-economic-storm-private-banks.json";
+import a_ubs_switzerlands_banking_giant_transformation from "@/data/insights/ubs-switzerlands-banking-giant-transformation.json";
+import a_how_build_billion_dollar_client_portfolio_banking from "@/data/insights/how-build-billion-dollar-client-portfolio-banking.json";
+import a_efg_bank_switzerland_pioneering_private_banking from "@/data/insights/efg-bank-switzerland-pioneering-private-banking.json";
+import a_hong_kong_switzerland_offshore_wealth_crown from "@/data/insights/hong-kong-switzerland-offshore-wealth-crown.json";
+import a_what_is_aum_portability_private_banking from "@/data/insights/what-is-aum-portability-private-banking.json";
+import a_private_banking_salary_switzerland_2026 from "@/data/insights/private-banking-salary-switzerland-2026.json";
+import a_isa_licence_private_banking_switzerland from "@/data/insights/isa-licence-private-banking-switzerland.json";
+
+export * from "./types";
+
+// JSON imports type their strings as string, hence the cast below; the build checks
+// markets, pillar and subTheme against the unions in types.ts instead.
 
 /**
  * 🔹 Insights single source of truth
  */
 export const INSIGHTS: readonly InsightArticle[] = [
-  {
-    slug: "ex-credit-suisse-banker-not-the-loyal-one",
-    title: "The Ex-Credit Suisse Banker Who Hasn't Moved Yet Is Not the Loyal One",
-    seoTitle: "Why the Ex-Credit Suisse Banker Hasn't Left UBS Yet",
-    seoDescription: "Three years after the rescue, UBS attrition is running below its historic norm. The real reasons ex-Credit Suisse bankers haven't moved, and why the window to move is better now than it was in 2023.",
-    linkedinUrl: "",
-    date: "2026-07-02",
-    summary: "UBS's voluntary attrition rate has fallen below its historic norm even as thousands of ex-Credit Suisse bankers absorbed a takeover their own chairman said would run through a culture filter. The real reasons they haven't moved, and why the window to move is better now than in 2023.",
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    markets: ["CH"],
-    keywords: ["UBS Credit Suisse integration", "ex-Credit Suisse bankers UBS", "private banking talent Switzerland", "Swiss private banker mobility", "UBS attrition 2026", "AUM portability"],
-    body: `Three years after the rescue, the ex-Credit Suisse banker still sitting at UBS is usually not the one who made peace with the merger. He is the one who never tested whether he could leave.
-
-That distinction matters, because it inverts the story most people tell about this integration. The obvious narrative is culture clash: stricter compliance, a different mentality, colleagues who resent the takeover. All of that is real. But the data tells a stranger story. UBS's own voluntary attrition rate, historically close to seven percent a year, fell below that norm even as thousands of Credit Suisse staff absorbed the shock of losing their bank overnight. People are not leaving less because they are happier. They are leaving less because three years of integration turmoil has a way of freezing decision-making rather than forcing it.
-
-I sit across from these bankers regularly, and the pattern is consistent. It is rarely one grievance. It is three, layered on top of each other, and each one reinforces the other two.
-
-The mentality gap is not folklore, UBS built it on purpose. Credit Suisse and UBS were never culturally interchangeable, whatever the merger press releases implied, and UBS never pretended otherwise. Chairman Colm Kelleher said openly, before the deal even closed, that Credit Suisse staff would be run through what he called a culture filter, to make sure UBS did not import something into its ecosystem that caused issues. That was not integration marketing softened for public consumption. It described a deliberate, structural choice to impose UBS's more conservative approach on the acquired side rather than blend the two. Two years into the integration, Ermotti reaffirmed the same commitment in an open letter to staff, promising the bank would never compromise on UBS's strong culture, conservative risk approach or quality service. Academic analysis of the deal's terms confirms what that meant in practice for former CS bankers on the ground, explicit restrictions on acquiring new clients from high-risk jurisdictions and on offering certain complex financial products, categories that CS relationship managers had operated in freely before the takeover.
-
-None of that makes UBS wrong to have done it. A tighter risk culture is exactly what a bank absorbing a scandal-prone rival should build. But it does mean the mentality gap ex-CS bankers describe, less autonomy, slower approval chains, a felt sense of being watched more closely than colleagues on the UBS side, is not folklore or wounded pride. It was designed in, on the record, from the first week.
-
-UBS has been transparent that role reductions would happen gradually through natural attrition, early retirement, and internal reallocation rather than a single sharp cut. That is sound crisis management. It is also, for the individual banker, a slow-motion uncertainty that never quite resolves. The most recent wave, several hundred roles eliminated across Europe, the Middle East and Africa in May, still touched client-facing bankers alongside support functions. Nobody currently inside the machine has a clean signal of whether they are safe, and safety is not the same thing as belonging.
-
-The compensation story is quieter, and more corrosive. Nobody at UBS is being paid badly in absolute terms. That is not the complaint. The complaint, when ex-CS bankers speak candidly, is relative: two-thirds of open positions in Switzerland were filled internally last year, which sounds like loyalty being rewarded until you notice what it actually does to a compensation structure. Internal promotion at scale suppresses the market-testing that normally forces a bank to pay up for external competition. A banker who was competitive on a CS grid in 2022 is not automatically competitive on a UBS grid in 2026, and there has been limited external pressure inside the institution to force that reconciliation. Swiss bank salary surveys for the period point to modest, inflation-adjusted increases across the sector, nothing close to the kind of retention premium that would offset three years of integration fatigue.
-
-There is also a governance backdrop that lands badly with rank-and-file staff even when it does not touch their own paycheck directly. Executive pay at the major Swiss banks reached record levels in 2025, prompting an unusually public rebuke from the Ethos Foundation, the pension-fund-backed governance body that flagged UBS's own CEO compensation as roughly 147 percent above the median of comparable European bank chiefs. A banker does not need to begrudge his CEO's package to notice the contrast between headline executive pay and a flat internal grid. The optics compound the arithmetic.
-
-The bankers who benchmark themselves against the outside market, rather than against their own prior comp, are the ones who come to me. The ones who don't benchmark are the ones still inside, assuming their package is fine because nobody told them otherwise.
-
-The hardest blues to treat are the ones tied to decades of sunk identity. A banker who spent eighteen or twenty years building a book, a reputation, and an identity inside Credit Suisse does not experience a change of employer the way a five-year associate does. The institution was not just where they worked, it was the frame their clients, their family, and often their own sense of professional worth were built around. Watching it disappear, and then being asked to rebuild that same sense of belonging inside the acquirer whose chairman said publicly he was filtering out their culture, is a different kind of loss than a bad bonus year.
-
-That is why the hesitation is not irrational. It is loss aversion operating exactly as behavioural economics predicts, weighted heavily toward the status quo even when the status quo is demonstrably worse than the alternative. The banker stays not because staying is optimal, but because leaving requires actively pricing an uncertain future against a known, if uncomfortable, present. Nobody does that pricing exercise alone very well, and most compliance-trained private bankers are, by training and temperament, more comfortable managing other people's risk than their own.
-
-It is worth being precise about what happened last time, because it is easy to overstate. In the year following the rescue, competitor Swiss private banks moved aggressively on CS talent. EFG International hired roughly 130 client relationship officers in the first ten months of 2023 alone, with about a third of that intake coming from Credit Suisse, and full-year 2023 numbers ultimately reached around 156 new hires. Julius Baer, Lombard Odier and UBP all pulled entire teams out of Credit Suisse's European operations in the same window. That was a genuine, well-documented first wave, and it happened almost entirely in 2023.
-
-It would be dishonest to claim competitor banks are still hiring at that same visible pace three years on. The loudest and most reported departures were front-loaded into the first twelve to eighteen months after the deal closed, and the market has since moved to a quieter, less headline-driven pattern of individual and small-team moves. What that 2023 wave does prove, durably, is that the market has the appetite and the onboarding capability to absorb this exact profile of banker at scale, without the transition failing. That capability has not gone away. If anything, the banks that built out CS-specific onboarding playbooks in 2023 are better at it now, not worse, because they have three years of practice integrating exactly this kind of hire.
-
-Here is the part most of these bankers get wrong. They assume the moment to move was 2023, when the deal closed and the visible hiring wave was underway, and that the window is now shut because the wave has passed. That reasoning conflates two different things, how visible the market is, and how favourable the conditions for an individual move actually are.
-
-The operational case for waiting has largely expired. Client migration onto UBS systems only completed for Swiss clients at the end of March this year, and the bank itself describes the broader integration as still running through the end of 2026. That means the disruption that made 2023 and 2024 a genuinely awkward time to try to port a book, half-migrated systems, unclear client ownership, frozen internal transfers, is now largely resolved. A banker moving today is moving a book that sits on stable infrastructure, not one caught mid-migration. The retention packages that made staying financially rational in year one have mostly run their course by year three. And the institutional excuse for staying, let's see how the integration settles, has run out of runway. It has settled. That is the finding, and it holds regardless of whether this month's hiring headlines are as loud as 2023's.
-
-This is where most recruiter commentary stops, with a diagnosis and no mechanism. We built our internal tools specifically because diagnosis was never the hard part for this population, quantifying the decision was. The EP Portability Score exists because the first question every hesitant CS-legacy banker asks is not will I be happier elsewhere, it is how much of my book actually survives the move. That is a mechanical, answerable question, not an emotional one, and running it removes the single biggest source of paralysis before any conversation about culture or comp even starts.
-
-The EP AUM Portability and Business Case Assessment goes one step further and builds the actual economics, what a realistic transition scenario looks like in revenue terms over the first eighteen months, modelled against staying inside a compensation structure that internal promotion has quietly flattened. And for the bankers who are further along and want to see how a specific business plan holds up under scrutiny before they present it to a hiring bank, the BP Simulator stress-tests exactly that, the same rigour a hiring committee will apply, run privately first.
-
-All three tools run before any bank name is on the table, precisely because the bankers who need them most are the ones who cannot yet admit to themselves that they are considering a move. Turning the decision into a spreadsheet, before it becomes a conversation, is usually what breaks the paralysis.
-
-The blues are real. Three separate ones, in fact, stacked on top of each other. But the two that get talked about, culture and comp, are not actually what is keeping most of these bankers in place. The third one, decades of identity built around an institution that no longer exists, is doing most of the work. And that one only gets resolved by turning an emotional decision into a mechanical one long enough to see it clearly.`,
-  },
-
-  {
-    slug: "switzerland-third-private-banking-competitiveness",
-    title: "Switzerland Is Still First in Governance. Private Banking Cannot Bank on That.",
-    seoTitle: "Switzerland Drops to Third in IMD 2026 Rankings: What It Means for Private Banking",
-    seoDescription: "Switzerland fell from first to third in the 2026 IMD World Competitiveness Ranking as Singapore and Hong Kong pull ahead. For Swiss private banking, the governance score is not the problem. Assuming it is sufficient is.",
-    linkedinUrl: "",
-    date: "2026-06-25",
-    summary: "Switzerland dropped to third in the 2026 IMD World Competitiveness Ranking. Its governance and infrastructure scores remain first globally. But BCG data shows Hong Kong has overtaken Switzerland in cross-border wealth bookings, and Asian hubs are projected to grow at 9% annually versus 6% for Switzerland through 2030. The issue is not the ranking. It is what the ranking is measuring.",
-    pillar: "P1",
-    subTheme: "Positioning",
-    markets: ["CH", "ASIA"],
-    keywords: ["IMD competitiveness ranking", "Swiss private banking", "Singapore wealth management", "Hong Kong offshore wealth", "Geneva financial centre", "cross-border wealth", "BCG global wealth report 2026"],
-    body: `Switzerland did not lose its number one competitiveness ranking because it became weaker. It lost it because Singapore became faster.
-
-The 2026 IMD World Competitiveness Ranking, released last week by the Lausanne-based business school that has measured this for 38 years, placed Singapore first, Hong Kong second, and Switzerland third. The headline number moved two places. The implications for private banking moved considerably further.
-
-The macro commentary arriving in most inboxes this week focuses on the drop itself, the swing from first to third in a single year, and reaches for reassurance. Switzerland still leads the world in government efficiency. It still leads in infrastructure. The rule of law is intact. Public finances carry a budget surplus. Nobel prizes per capita: still first. These things matter. But for a senior relationship manager sitting in Geneva or Zurich, managing a book of international clients and watching where the next generation of wealth is actually being created, the rankings table is not the story. The direction of travel is.
-
-**What the IMD numbers actually say**
-
-Switzerland's Economic Performance sub-factor dropped 24 places to 37th in 2026. IMD's own analysis attributes a meaningful portion of this to one-off effects, specifically swings in direct investment flows tied to valuation and repatriation timing, compounded by the US tariff shock that hit small, non-bloc economies disproportionately hard. Singapore and Hong Kong absorbed less of that damage, partly because their trade exposure profiles differ, and partly because their economic structures allow faster adjustment when external conditions shift.
-
-IMD's research director Arturo Bris was pointed on this: geopolitical conditions are worsening, global fragmentation is increasing, and in that environment, economies with their own credible institutions gain an advantage precisely because businesses can carry on as usual when international systems stop serving national needs. Switzerland scores on that measure. Where it does not score is on the agility question, and that is where the private banking read-across gets uncomfortable.
-
-The same consensus-driven governance that produces exceptional institutional stability also slows decision-making when speed matters. It is not a design flaw. It is an explicit feature of how Switzerland governs, and for most of the last century it served the financial center extremely well. The concern is not that this changes overnight. The concern is that the world around it is changing much faster.
-
-**The BCG number that matters more**
-
-The IMD ranking is a macro lens. The BCG 2026 Global Wealth Report provides something sharper: in cross-border wealth bookings, Hong Kong has overtaken Switzerland for the first time. The gap is narrow, $2.95 trillion booked offshore in Hong Kong against $2.94 trillion in Switzerland, but the direction has been clear for several years. Boston Consulting Group projects Hong Kong and Singapore will continue growing their cross-border books at roughly 9% annually through 2030. Switzerland's projected rate is 6%.
-
-That 3-percentage-point gap compounds. At those growth rates, by the end of the decade, Asian hubs are not competing with Geneva on the same field. They are operating in a different weight class.
-
-The drivers are structural. Chinese and South Asian wealth creation is accelerating at a rate that simply favors proximity. The UHNW client base is younger, more geographically dispersed, and considerably less attached to the historical logic of booking assets in Switzerland because that is where private banking lives. IPO proceeds from Hong Kong-listed companies, family office formation in Singapore, the intergenerational transfer of wealth across Southeast Asia: these flows do not naturally gravitate toward a time zone that is seven hours behind Singapore and a regulatory structure built for a different era of cross-border mobility.
-
-Meanwhile, Swiss private bank net new money fell more than 14% year-on-year in 2025, according to a ZHAW study covering 69 Swiss institutions. Fresh entrepreneurial wealth is increasingly booked in Singapore, Dubai, and New York. This is not a headline event. It is a slow migration that does not announce itself in any single quarter but reshapes the market over a decade.
-
-**What private banking is actually competing on**
-
-The traditional Swiss private banking proposition rests on three pillars: stability, confidentiality, and neutrality. All three remain intact as legal and regulatory realities. The question is whether they still function as competitive differentiators, or whether they have become baseline expectations that clients simply assume before they ask the next question.
-
-A senior private banker relocating from Zurich to Singapore is not abandoning stability. Singapore's rule of law ranking is credible. Its regulatory framework through MAS is rigorous, transparent, and in several areas more efficient to operate within than the Swiss equivalent. A UHNW family booking assets in Singapore is not choosing instability. They are choosing proximity to where their business interests, their children, and their next investment are located.
-
-This is the shift that IMD's competitiveness data captures imperfectly but Boston Consulting Group's AUM flow data captures precisely. The competition is no longer between a stable incumbent and a riskier challenger. It is between two credible, well-regulated financial centers, one of which is adding 9% in cross-border wealth per year and one of which is adding 6%.
-
-**The talent signal**
-
-From a recruitment perspective, the pattern is visible in candidate conversations. Senior relationship managers covering Asian client books, UHNW families with business interests spread across Singapore, Hong Kong, Dubai, and Geneva, are increasingly being asked by their employers to consider regional relocation packages. Swiss private banks with significant Asia exposure have been expanding headcount in Singapore and Hong Kong for several years, not pulling back from Geneva, but not assuming Geneva is where the book needs to be managed from.
-
-The IMD ranking, taken in isolation, changes none of this. The composite picture, IMD's competitiveness drop, BCG's AUM flow projections, the 14% decline in Swiss net new money, and the accelerating pace of wealth creation in markets that sit physically closer to Singapore than to Geneva, suggests that the private banking community in Switzerland is facing a structural question it has been slow to formulate clearly.
-
-The question is not whether Switzerland remains competitive. By most institutional measures, it does. The question is whether the forms of competitiveness that Switzerland leads on, governance efficiency, infrastructure quality, institutional stability, are the forms of competitiveness that determine where the next $3 trillion in cross-border wealth flows over the next decade.
-
-**The response that would matter**
-
-IMD's Arturo Bris has noted publicly that Switzerland's consensus-driven politics is a double-edged instrument. It produces exceptional long-term outcomes. It struggles with fast-moving crises. The tariff shock of 2025-2026 was exactly the kind of rapid external disruption where smaller, more agile economies can absorb and redirect faster than a political system built on multi-stakeholder consensus.
-
-Swiss private banks are not waiting for policy reform to act. The institutions that are competing well in 2026 are the ones that have built genuine dual-hub capabilities, running client coverage from both Switzerland and Asia simultaneously, investing in relationship managers who can navigate both regulatory environments, and treating proximity to the client as a cost-of-business reality rather than a geographic choice. The ones that are not competing as well are the ones that continue to treat Geneva's institutional pedigree as the product, when what the client is increasingly buying is the relationship manager's judgment, network, and ability to be physically present when it matters.
-
-A third-place finish in a competitiveness ranking is not a crisis. A 14% drop in net new money, a narrowing of the cross-border wealth gap to $10 billion, and a projected growth differential of 3 percentage points annually: these are the numbers worth running. Switzerland's governance ranking is not the problem. Assuming it is sufficient is.
-
-If you are a senior private banker trying to model what your book looks like in five years, and where the next generation of your clients will want that book managed, the EP Portability Score tool at execpartners.ch gives you a starting point for the numbers. The strategic questions behind the numbers are worth having earlier rather than later.
-
-*Private Wealth Pulse is published weekly by Executive Partners, Geneva. Subscribe at execpartners.ch/subscribe.*`,
-  },
-
-  {
-    slug: "the-sandbox-talent-map",
-    ogImage: "/og-articles/og-the-sandbox-talent-map.jpg",
-    title: "The Sandbox Talent Map",
-    seoTitle: "Private Banking in Saudi Arabia and Dubai 2026: The Sandbox Talent Map",
-    seoDescription: "Is the money leaving the Gulf? Wrong question. Inside the Saudization rules, the Dubai hiring bar, and the Swiss bank moves reshaping private banking careers in Saudi Arabia and Dubai in 2026.",
-    date: "2026-06-13",
-    summary: "Everyone is asking if the money is leaving the Gulf. The better question is which bankers are positioned to keep it, win it, or lose it. Inside the Saudization rules, the Dubai hiring bar, and what Swiss banks are doing on both sides of the border.",
-    linkedinUrl: "",
-    pillar: "P1",
-    subTheme: "Positioning",
-    markets: ["UAE", "MEA", "CH"],
-    keywords: ["private banking Saudi Arabia", "private banking Dubai 2026", "Saudization private banking", "UBP Dubai", "Gulf wealth management hiring", "DIFC private banking"],
-    body: `Everyone in private banking is asking the same question right now: is the money leaving the Gulf? Wrong question. The right one is: which bankers are actually positioned to keep it, win it, or lose it, depending on which side of this conversation they sit on.
-
-Here's the backdrop most of you already feel but haven't seen quantified. The US-Israel-Iran conflict and the disruption to the Strait of Hormuz triggered one of the most severe energy supply shocks in recent history. S&P Global has floated a scenario in which Gulf banks could face domestic deposit outflows of up to $307 billion, and a 50% rise in distressed loans across the region's 45 largest banks could wipe out more than half their annual net income. That is not background noise. That is the conversation happening in every risk committee from Riyadh to DIFC.
-
-And yet, in the same breath: net FDI inflows into Saudi Arabia rose 34.5% year on year in Q3 2025. The UAE absorbed the largest millionaire inflow in the world last year, just under 9,800 new arrivals, while Saudi Arabia ranked fifth globally with 2,400. Gulf sovereign wealth funds, sitting on more than $5 trillion combined, are not retreating, they are recalibrating, shifting from being the world's LP toward shoring up their own economies first. IMF projections from April still show positive growth for Saudi Arabia and the UAE this year.
-
-So both things are true at once. Headline risk is real and immediate. Structural pull is real and durable. The bankers who win in this environment are the ones who can hold both truths in their head at the same time, and explain them calmly to a client who is reading the same headlines you are.
-
-Saudi Arabia: the gate is narrower, and it's mostly local
-
-If you're building a career in Saudi private banking right now, understand the rules of the game first. Saudization is not a talking point, it is the operating system. Senior private banking roles, particularly anything titled Director or above, are increasingly reserved for Saudi nationals. International candidates without a Saudi passport are not competing on merit alone anymore, they are competing against a quota.
-
-This is reshaping who gets hired and why. Saudi Awwal Bank's private banking division grew deposits 14% in the first nine months of last year, with almost 80% of clients investing through its in-house platform, evidence that local infrastructure and local relationship managers are now driving the growth, not expat hires parachuted in from London or Geneva.
-
-What does the local money actually want? Three things, consistently. First, Shariah-compliant structures are no longer a niche request, they are a baseline expectation for a large share of the client base. Second, succession and family business continuity dominate the conversation, this is a market where a huge share of HNW wealth sits inside operating family businesses, and the banker who can speak intelligently about governance, succession, and generational transfer earns trust faster than the one pitching structured notes. Third, alignment with Vision 2030 matters more than people in Geneva realize, clients want to know their banker understands where the Kingdom is going, not just where the oil price is today.
-
-The banker who struggles here is the one who treats Saudi the way they'd treat Geneva twenty years ago: relationship first, product second, compliance as an afterthought. That model is dead on arrival in a market where the regulator, the client, and the hiring quota are all watching the same thing, your nationality and your local credibility.
-
-Dubai: still the open door, and still the booking center that matters
-
-Dubai remains a different animal entirely, and this is precisely why it continues to anchor UHNW and HNW coverage across the GCC, Levant, Africa, and India. It is the booking and advisory hub for MEA, full stop, and nothing about the current conflict has changed that geography.
-
-Swiss banks aren't pulling out, and that itself is a signal worth reading. Even as Iran's rhetoric escalated in March, UBS, Pictet, EFG, Lombard Odier, Julius Baer, and UBP all kept their regional operations running, the response was remote work precautions, not evacuations. UBP is a useful case study in how the two markets actually relate to each other. Its Dubai office has been the bank's MEA platform for over two decades, but the current growth push is freshly led, Arfat Qayyum, a former Credit Suisse Qatar CEO, took over as Senior Executive Officer in August 2025 and has since built out the team running more than 40 professionals managing over CHF15 billion in regional assets, including a February 2026 hire of Fahd Iqbal, UBS's former CIO Middle East, as head of investment services. In late 2025, UBP also opened a separate Riyadh office, and tellingly, put a Saudi national, Mishal Alhawas, in as CEO and Head of Advising, explicitly framed around Vision 2030 alignment. Same bank, same MEA leadership, two different staffing logics. Dubai is where you build an international, multilingual team. Riyadh is where the person running the show needs to be Saudi. Lombard Odier has made a comparable bet from the Dubai side, securing a DIFC license and committing to double its UAE headcount within three years. For RMs reading the market, the message is consistent: Swiss private banks are not retreating mid-crisis, they're expanding, and they're doing so with very different hiring rules depending on which side of the Saudi-UAE border the office sits.
-
-What has changed is the bar. Mandates we're seeing prioritize relationship managers and team heads who bring portable books with proven revenue and a genuinely strong compliance culture, not just a Rolodex. Banks and EAMs are calibrating hard on booking options, credit appetite, and product shelf, particularly Lombard lending, private markets, and real estate financing, because business plans built on optimism rather than realistic wallet share don't survive a market where deposit stability is suddenly a board-level topic.
-
-Language remains the differentiator that nobody outside the region fully appreciates. Arabic and English are table stakes. French, Hindi, and Urdu, depending on the desk, are what separate a banker who can cover the GCC, Levant, Africa, and India corridor from one who can only cover the easy half of it. If you're a senior RM with a portable book and you speak three of those languages, you are, right now, one of the more sought-after profiles in the market, conflict or no conflict.
-
-The profile that wins, and the one that doesn't
-
-Put the two markets side by side and a pattern emerges. The banker who thrives in 2026 is credible under pressure, can sit across from a client who just read about $307 billion in potential deposit outflows and explain, calmly and accurately, why their bank and their structure are sound. They have local language, local relationships, and in Saudi's case increasingly local nationality. They understand that compliance is not friction, it is the product, especially when capital is moving and everyone is asking harder questions about where it's going and why.
-
-The banker who struggles is the pure product pusher, the one whose pitch was built for a calmer market and hasn't been updated. No Arabic, no Hindi, no Urdu, no real GCC network beyond a handful of expat contacts. No fluency in Shariah-compliant structures or succession planning. And critically, no answer ready for the client who asks, directly, "is my money safe here right now." If your business plan doesn't address that question, it isn't a business plan anymore, it's a wish list.
-
-The longer game
-
-Here's the uncomfortable truth for anyone hiring or being hired into the region right now. This conflict will pass, conflicts in this region always do, but the banks, the regulators, and the clients who lived through it will remember who showed up with answers and who showed up with a pitch deck from 2023. Saudi Arabia is going to keep localizing senior roles. Dubai is going to keep rewarding portability and language depth. Both trends were true before the war, and both are now accelerating because of it.
-
-If you're a senior RM sitting on a portable book with the right language mix, the right compliance instincts, and the patience to navigate a market that is more selective than it was eighteen months ago, this is, counterintuitively, one of the better moments to be having that conversation. The gate is narrower. The people who get through it matter more.`,
-  },
-
-  {
-    slug: "the-platform-illusion",
-    title: "The Platform Illusion",
-    seoTitle: "The Platform Illusion: Why the Pitch That Wins Mandates Never Transfers AUM",
-    seoDescription: "Banks sell platform quality. Clients follow the banker. The most common and most costly mistake senior private bankers make when building their case for a move.",
-    date: "2026-06-10",
-    summary: "Banks sell platform quality. Clients follow the banker. The most common and costly mistake senior private bankers make when building their case for a move.",
-    linkedinUrl: "https://www.linkedin.com/pulse/platform-illusion-gil-m-chalem--xq5ge/",
-    pillar: "P1",
-    subTheme: "Positioning",
-    markets: ["CH", "UK", "US", "ASIA"],
-    keywords: ["AUM portability", "private banking platform", "senior RM move", "AUM transfer rate", "private banking recruitment"],
-    body: `There is a conversation that happens in almost every senior private banking recruitment process. The hiring institution, somewhere between the second meeting and the offer discussion, makes a version of the same argument: our platform is superior. Better research. Stronger credit capabilities. More sophisticated structured products. Broader custody infrastructure. The implicit promise is that the platform will do part of the work, that clients who are indifferent between institutions will be nudged toward the move by the quality of what is on offer at the new house.
-
-This argument is almost always wrong. Not because the platform claims are false, but because they are irrelevant to the decision that actually matters.
-
-The Capgemini World Wealth Report 2025, which surveyed 6,472 high-net-worth investors, identifies loyalty to the relationship manager as one of the six defining characteristics of next-generation HNWI behaviour. Not loyalty to the institution. Not preference for a specific custody platform. Loyalty to the person.
-
-This is not a new finding. It is a structural feature of private banking that has been documented consistently for two decades and has, if anything, hardened since the 2008 financial crisis. The relationship is the product. The platform is infrastructure.
-
-What this means in practice: when a client decides whether to follow their banker to a new institution, they are not evaluating the research portal or the structured product shelf. They are asking one question: do I trust this person enough to go through the disruption of moving my assets?
-
-The platform enters the conversation only after that question is already answered, and usually only as a reassurance mechanism, not a decision driver.
-
-The platform illusion is not random. It is actively reinforced by the institutions doing the hiring. Hiring managers need to believe that their platform provides competitive advantage, because if it does not, the rationale for paying a guaranteed package collapses. If a CHF 300M book transfers at the same rate regardless of where it lands, then the platform premium disappears, and the conversation becomes purely about the banker and their relationships.
-
-Banks also have a structural interest in promoting platform quality during the recruitment process because it shifts the implicit risk of a low-transfer outcome back onto the platform narrative. If the client did not follow, it was because the offering was not compelling enough, not because the relationship was shallower than the banker claimed.
-
-Bankers, for their part, are susceptible to this argument because it is flattering. A superior platform implies that their clients will make a rational, informed decision to move, which is a more comfortable story than acknowledging that the transfer rate depends almost entirely on relationship depth and client inertia.
-
-In our placement experience, the variables that consistently predict high transfer rates have nothing to do with platform quality. They are:
-
-Relationship tenure. Clients who have worked with the same banker for more than ten years and who have been through at least one significant market event together transfer at substantially higher rates than newer relationships. The 2008 crisis, 2020, and the 2022 rate shock are all useful calibration points. If a client stayed through one of those events, they are staying because of the banker, not the institution.
-
-Wallet concentration. A client whose primary banking relationship is with the departing banker, meaning 40% or more of liquid assets, has a much stronger incentive to follow than a client who is one of four banking relationships. PwC's Private Banking Market Update 2025, covering 74 Swiss and Liechtenstein private banks, attributes the outperformance of certain institutions specifically to successful lift-outs of clients from major banks and effective client engagement, not platform differentiation.
-
-Direct advisory dependency. Clients who invest based on the banker's specific recommendations, not on institutional research or standardised mandates, transfer well. Clients in standardised discretionary mandates transfer poorly, because the product they are buying is institutional, not personal.
-
-Compliance readiness. This is the variable that has changed most significantly in the last three years. A client relationship that cannot be onboarded cleanly at the new institution is not portable regardless of how strong the personal connection is. KYC and AML standards at hiring institutions have hardened materially since 2023, and cross-border relationships with incomplete documentation do not transfer regardless of banker loyalty.
-
-There is a specific scenario where the platform illusion causes active damage to a placement process, and we observe it regularly. A banker who has internalised the platform pitch often uses it with clients during the transition conversation. They describe the new institution's capabilities in terms of research quality, product access, and technology. Some clients find this reassuring. But sophisticated HNW clients, particularly UHNW clients managing complex multi-jurisdictional wealth, tend to hear something different. They hear that they are being asked to accept disruption, change their banking relationship, go through full KYC again, and potentially restructure their custody arrangements, in exchange for access to a slightly different product shelf.
-
-That is not a compelling proposition. The client already has product access through their existing relationships. What they are evaluating is whether the disruption is worth the relationship continuity. The platform pitch does not answer that question. It avoids it.
-
-The bankers who transfer the highest proportion of their book in the shortest time are the ones who lead with the relationship, not the platform. The conversation with the client is direct: I am moving because this institution is a better fit for how I want to serve you. I am asking you to make this transition with me because our relationship is the constant, not the infrastructure around it.
-
-For bankers preparing for a move, the platform illusion creates a specific trap. If the hiring institution's pitch is heavily weighted toward platform superiority, and the banker absorbs that pitch without questioning it, they will build a business plan that overestimates the pull factor of the new platform on their existing clients.
-
-The business plan that a hiring committee actually believes is not the one that describes platform advantages. It is the one that describes the relationship architecture of the book: the tenure, the wallet concentration, the advisory dependency, and the compliance status of each significant relationship. Those are the variables a committee can evaluate. Platform quality is not.
-
-The platform matters at the margin, for undecided clients, for specific product requirements, and for the operational experience once assets have transferred. It does not drive the transfer decision. Confusing the two is the most common and most costly mistake senior bankers make when building their case for a move.`,
-  },
-  {
-    slug: "zurich-private-banking-market-2026",
-    title: "The Zurich Talent Paradox: Why the Biggest Market Is the Hardest Move",
-    seoTitle: "Zurich Private Banking Recruiter 2026 | Talent Paradox & Hiring Trends",
-    seoDescription: "Zurich manages CHF 3.2 trillion in private banking assets but is quietly running out of the senior talent that runs it. What senior RMs need to know before making a move in 2026.",
-    date: "2026-06-09",
-    summary: "Zurich manages more private banking assets than any other city in Europe. It is also the hardest market to move in. Three structural forces explain why, and what senior bankers need to do differently.",
-    pillar: "P1",
-    subTheme: "Positioning",
-    markets: ["CH", "UK", "UAE"],
-    keywords: ["Zurich private banking 2026", "private banking recruiter Zurich", "Zurich wealth management hiring", "senior RM Zurich", "UBS talent market"],
-    linkedinUrl: "",
-    body: `Zurich's wealth management sector entered 2026 managing CHF 3.2 trillion in assets from a single canton, representing 41% of all Swiss banking assets under management. It places Zurich ahead of Geneva in institutional density, ahead of Singapore in absolute AUM concentration, and ahead of every other European financial centre in private banking employment. The city is not merely a participant in global wealth management. It is the gravitational centre.
-
-And yet the market that should be attracting senior talent at scale is instead losing a quiet, persistent war for the people who run it.
-
-Senior relationship manager searches that closed in four months before the pandemic now take eight to eleven months in Zurich. Time-to-fill for executive roles has stretched from 68 days to 94 days in a single year.
-
-This is not a demand problem. Hiring intent across Zurich's private banking platforms is strong. Swiss private banks saw solid double-digit AUM growth in 2024, boosted by rising global equity markets and positive net new money flows. Banks are growing. They need people. The problem is supply.
-
-Three structural forces are compressing the available talent pool simultaneously.
-
-The UBS-Credit Suisse integration, completed in 2023, entered what UBS itself described as a talent retention phase through 2024 and into 2025. UBS reported 1,800 net new hires in wealth management globally during 2024, primarily to backfill departures created by the integration itself. In Zurich, UBS maintained approximately 12,000 headquarters staff while consolidating former Credit Suisse private banking operations. The merger did not release talent into the market. It consumed talent to stabilise.
-
-The conventional assumption was that the acquisition would flood the Zurich market with displaced senior bankers. The opposite happened. UBS retained the revenue generators it needed and managed the rest through long notice periods and structured exits that kept the best profiles off the market for 12 to 18 months longer than expected.
-
-PwC anticipates a gradual decline in the count of Swiss private banking institutions to fewer than 60 in the coming years. KPMG Switzerland projects that 15 to 20% of Swiss private banks, primarily boutiques managing less than CHF 5 billion, will seek merger partners or exit strategies by the end of 2026, with Zurich alone expected to see three to five acquisition transactions involving local boutiques.
-
-Each of those transactions displaces some staff. But it rarely displaces the senior relationship managers the market actually wants. Acquirers absorb the book and integrate the client relationships. The RM either follows the book under new ownership or enters a garden leave period that again removes them from the available market for months.
-
-EFG International, whose growth model deliberately recruits senior bankers from larger institutions going through restructuring, reported a record CHF 185 billion in AUM and CHF 11.3 billion in net new assets in 2025. The banks that understand the consolidation dynamic are using it aggressively. The ones that wait for talent to become freely available are consistently too late.
-
-The adoption of EU Sustainable Finance Disclosure Regulation equivalence standards created new compliance obligations through 2025 and into 2026. Combined with the tightening of FINMA KYC and AML expectations following a series of enforcement actions that resulted in fines exceeding CHF 100 million imposed on Swiss financial institutions in 2025 alone, the practical effect is that senior RMs with complex cross-border books require significantly more documentation discipline than five years ago.
-
-The specific failure mode we observe in Zurich processes is this: a banker with a CHF 400 million cross-border book presents to a hiring committee. The committee is interested. Internal compliance runs a pre-approval review on the top twenty relationships. Six come back with open documentation questions, incomplete source of wealth files, or unresolved CRS exposure. The effective portable book drops to CHF 280 million. The offer terms reflect that number, not the CHF 400 million the banker entered the process with.
-
-This is not a theoretical risk. It is the most common reason Zurich processes stall or reprice in 2026. The bankers who avoid it are not the ones with cleaner books. They are the ones who audited their own files before the first recruiter call, identified the documentation gaps, and either resolved them or built a realistic transfer timeline around them. That preparation takes three to four weeks. Most bankers do not do it. That is the compliance advantage in the current Zurich market.
-
-The profile that moves efficiently through a Zurich process in 2026 combines four characteristics. Swiss onshore relevance: a book that is either primarily Swiss-domiciled or clearly bookable in Switzerland under a clean cross-border framework. Balance sheet utilisation: Lombard lending, mortgage exposure on Swiss property, and credit facility usage are now core to the Zurich value proposition. German-language client coverage: the DACH market remains the primary organic growth engine for Zurich platforms. Documented compliance history: the ability to produce organised, current client documentation at short notice is now a competitive differentiator, because it compresses the bank's internal approval timeline.
-
-The window for a structured Zurich move in 2026 is narrower than it looks. The compression of available candidates and the lengthening of search timelines means that bankers who approach the market reactively are consistently outpositioned by those who have done the preparation in advance.
-
-The preparation takes three to four weeks to do properly: the portability picture, the compliance review, the contractual position, and the business plan framework. Bankers who have completed it before the first recruiter call are in a structurally better negotiating position than bankers who are building it in real time during the process.
-
-If you are a senior RM based in Zurich and considering whether 2026 is the right moment, the honest answer is: the market is active, the demand is real, and the window is open. But it closes faster than the headline AUM numbers suggest.`,
-  },
-  {
-    slug: "private-banking-business-plan-switzerland",
-    title: "The Private Banking Business Plan: What a Hiring Committee Actually Looks For",
-    seoTitle: "Private Banking Business Plan Switzerland | What Banks Evaluate",
-    seoDescription: "A private banking business plan in Switzerland is not a revenue projection. It is a stress test. Here is exactly what hiring committees evaluate, built on 200+ EP placements.",
-    date: "2026-06-06",
-    markets: ["CH"] as const,
-    featured: true,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: ["private banking business plan", "private banker business plan Switzerland", "relationship manager break-even timeline", "AUM portability business case", "private banking business plan template"],
-    summary: "A private banking business plan in Switzerland is not a revenue projection. It is a stress test. Here is exactly what hiring committees evaluate before they make an offer.",
-    linkedinUrl: "https://www.linkedin.com/in/gilchalem/",
-    body: `The business plan does not get you the job. It gets you past the committee member who has already decided to say no.
-
-Every hiring committee in Swiss private banking contains at least one person whose role, consciously or not, is to find the number that does not hold up. The ROA assumption that is too optimistic. The portability percentage that assumes clients will follow without friction. The break-even timeline that only works if year one goes perfectly. Their job is to protect the institution from an expensive mistake. Your business plan's job is to give them nothing to find.
-
-That is a different document from the one most bankers write. Most bankers write a revenue projection dressed up as a strategic argument. They lead with total AUM, state a portability assumption without justifying it, model three years of growth on a straight line, and close with a paragraph about why the new platform is the right fit for their clients. Hiring committees have read that document four hundred times. It does not move them.
-
-What moves them is a document that has already stress-tested itself.
-
-What the document is actually evaluating
-
-The hiring committee is not reading your business plan to understand your ambitions. They are reading it to stress-test four specific variables.
-
-The first is portable AUM. Not total AUM. Not AUM under management. Portable AUM: the fraction of your book that is personal to you rather than institutional, that sits in accounts where you have direct client relationships, and where no non-solicit clause, KYC transfer barrier or booking centre constraint prevents a move. Swiss private banks have become expert at identifying inflated portability claims. A CHF 400 million book that is 60% institutional mandates, 20% family relationships managed by a colleague, and 20% clients who have never responded to a personal call is a CHF 80 million book in practice.
-
-The second is revenue quality. A book generating 45 basis points of average ROA across discretionary and advisory mandates is worth more to a hiring committee than a book generating 18 basis points across execution-only accounts, even if the second book is three times larger in AUM. Banks model revenue, not assets. The business plan must speak in revenue terms, not AUM terms, to be taken seriously.
-
-The third is the break-even timeline. Every hire carries a cost: the recruitment fee, the sign-on, the transition period during which the banker is present but not yet revenue-generating, and the compliance overhead of onboarding a new book. A hiring bank in Geneva or Zurich typically models a 14 to 22 month break-even on a senior RM hire. Your business plan must demonstrate, with credible assumptions, that the revenue ramp reaches that break-even within that window. Plans that show hockey-stick growth in year three without explaining year one are rejected.
-
-The fourth variable is compliance risk, and it has become the most underestimated factor in Swiss private banking hiring since 2023.
-
-The forced integration of Credit Suisse into UBS produced something that did not make the front pages: a forensic re-examination of how both institutions had managed client onboarding over the previous decade. What that examination surfaced was significant. Accounts with incomplete KYC documentation. Relationships with PEPs or PEP-adjacent family members that had been grandfathered rather than reviewed. Booking centre structures that had been designed around tax efficiency rather than substance. The remediation cost ran into the hundreds of millions across the combined entity.
-
-Every private bank in Geneva and Zurich watched that process. The response has been a quiet but systematic tightening of onboarding standards for incoming bankers and their books. A candidate who brings CHF 200 million in portable AUM but whose top ten clients include three accounts with elevated jurisdiction risk, two PEP relationships, and one account with a dormant beneficial ownership structure will face a compliance pre-screening that can take six to ten weeks and may result in a conditional offer: we will hire you, but we will not onboard those five accounts.
-
-That conditional offer changes the economics of your business plan entirely. If 30% of your portable AUM is subject to enhanced due diligence that may result in rejection, your year-one revenue assumption needs to reflect that. Most business plans do not. They present the gross portable number and leave the compliance haircut for the onboarding team to discover after the offer is signed. Hiring committees who have been through this once do not make that mistake twice. They screen for it in the document.
-
-The business plan should address compliance proactively. Identify the accounts in your portable book that will require enhanced due diligence. State the jurisdiction, the relationship type, and why you believe the account is onboardable at the new institution. This transparency is not a weakness. It is the signal that you have done the work and that the number you are presenting is real.
-
-The structure that works
-
-After reviewing and producing business plans across 200 placements in Geneva and Zurich, the structure that consistently advances candidates to the final stage follows this sequence.
-
-Open with a one-page executive summary that states portable AUM, expected year-one revenue, projected break-even month, and the three or four client segments that constitute your core franchise. This page is what gets read before the committee decides whether to read the rest.
-
-The second section covers client segmentation. Break your portable book into tranches by AUM size, relationship type, booking centre, and revenue profile. Do not present a single aggregate number. Show the committee how your book is composed, which clients you have spoken to informally about a potential move, and which segments have the highest and lowest portability risk.
-
-The third section is the revenue model. Build a three-year P&L that shows AUM ramp assumptions by year, ROA assumptions by mandate type, gross revenue, and estimated cost-to-serve. Use conservative assumptions and state them explicitly. A plan that assumes 80% portability in year one will be challenged. A plan that assumes 55% portability in year one and explains why will be respected.
-
-The fourth section addresses transition risk. Which clients present onboarding complexity? What is the estimated timeline from hire to first client transfer? Are there non-solicit or non-compete obligations that affect timing? Banks want to see that you have thought through the obstacles, not that you have ignored them.
-
-The fifth section closes with platform rationale. Why this institution specifically? What does the platform offer your clients that your current employer does not? This section is often written as generic flattery. Write it as a specific argument: your UHNW French entrepreneur clients need a platform with a Luxembourg booking centre and a strong credit offering, and this institution provides both. Specificity signals that you have done real analysis, not that you have sent the same plan to five banks simultaneously.
-
-The numbers that matter in 2025 and 2026
-
-Swiss private banks are currently hiring selectively. The post-UBS-Credit Suisse consolidation has reduced the number of active platforms, which means fewer open mandates but higher quality requirements for those that exist.
-
-The minimum threshold for a serious conversation at most Geneva and Zurich private banks is CHF 75 million in genuinely portable AUM. The typical mid-tier hire brings CHF 150 to 300 million. Senior hires with UHNW franchises of CHF 500 million or more trigger retention packages and counteroffers at the current employer before the move is concluded.
-
-ROA benchmarks vary by segment. Execution-only books average 12 to 18 basis points. Advisory books average 35 to 55 basis points. Discretionary books with structured product penetration can reach 70 to 90 basis points on the right platform. A business plan that does not state the current ROA profile of the portable book is leaving the most important number out of the document.
-
-Break-even modelling for a CHF 200 million portable book at 45 basis points ROA produces approximately CHF 900,000 in gross revenue in year one, assuming 70% portability in the first twelve months. Against a total hire cost of CHF 600,000 to CHF 800,000, that produces a break-even in months 10 to 11. That is a fundable hire. A book generating 18 basis points at the same AUM level produces CHF 360,000 in year-one revenue against the same cost base. That hire does not break even until year two or later, and will face significant scrutiny.
-
-Before you write the plan
-
-The business plan should not be the first time you assess your own portability. It should be the document that captures an assessment you have already done.
-
-The questions to answer before writing are the same questions the hiring committee will ask. How many of your clients know you personally rather than knowing the institution? How many have you spoken to outside of the bank context in the last twelve months? What is your non-solicit obligation and how long does it run? What fraction of your AUM is in accounts where you are the sole relationship contact? What is the booking centre of your top twenty clients and does that booking centre follow you to the new platform?
-
-The Executive Partners Portability Score runs through these questions with a structured 30-point framework before any introduction to a client institution is made. That assessment is available anonymously. What comes out of it is a realistic picture of the portable fraction, which is the only number that matters when a hiring committee opens your business plan.`,
-  },
-  {
-    slug: "is-your-aum-portable",
-    title: "Is Your AUM Actually Portable? The Six Questions Every Private Banker Gets Wrong",
-    seoTitle: "Is Your AUM Portable? The Six Questions Every Private Banker Gets Wrong",
-    seoDescription: "Most private bankers overestimate how much of their book will follow them. Here is the honest framework for testing AUM portability before you move, used by Executive Partners across 200+ placements in Geneva and Zurich.",
-    date: "2026-06-09",
-    summary: "Most private bankers overestimate how much of their book will follow them. Here is the honest framework for testing portability before you move.",
-    linkedinUrl: "",
-    pillar: "P2",
-    subTheme: "Positioning",
-    featured: true,
-    engagementScore: 95,
-    markets: ["CH"],
-    keywords: ["AUM portability private banking", "portable book Geneva", "private banker move Switzerland", "wallet share private banking", "non-solicit clause Switzerland", "NFCI margin private banking"],
-    body: `Banks already know how much of your book will transfer. Most bankers do not.
-
-Every private banker who has ever considered a move has done the same mental calculation. They look at their book, add up the AUM, multiply by a transfer assumption, and arrive at a number that feels comfortable. Comfortable enough to have a conversation. Comfortable enough to accept a meeting.
-
-That number is almost always wrong. Not slightly wrong, materially wrong. Across 200+ placements in Geneva and Zurich, the gap between what a banker believes is portable and what actually transfers is the single most consistent source of friction in a placement process. It delays offers, collapses business cases, and occasionally ends careers.
-
-This article is not about discouraging moves. The Geneva and Zurich markets are active, and the right banker on the right mandate will transfer more than they expect, because the platform does most of the work. It is about the six questions that separate bankers who understand their portability from bankers who are guessing.
-
-## 1. Are your clients loyal to you, or loyal to your institution?
-
-This sounds obvious. Every banker says their clients are loyal to them personally. The question is how you test it, not how you feel about it.
-
-The honest test: have you ever changed institutions before? If yes, what transferred? If a banker moved from Credit Suisse to Julius Baer five years ago and brought CHF 180M of a CHF 280M book, they have a real data point. They know which clients followed and, more importantly, why some did not.
-
-If this is the first potential move, the test is different. Ask yourself which of your clients would give you a new banking mandate today, right now, without a move, if you called and proposed it. Not clients who would take the call warmly. Clients who would actually move assets on the basis of that call. That is the population that transfers. The rest is institutional AUM dressed in relationship clothing.
-
-Banks understand this distinction better than bankers do. The first question any serious hiring institution will ask, not in the formal process but in the actual calibration conversation, is not what is your AUM. It is: tell me about the five clients at the top of your book. Walk me through the relationship. How long have you known them? Have they ever invested their own money based on your advice specifically? Would they bank you personally if you were independent?
-
-## 2. What is your wallet share, and do you know the real number?
-
-Wallet share is the proportion of a client's total investable wealth that sits with you. A CHF 50M relationship where the client has CHF 400M in total, spread across four institutions, is not a CHF 50M portable relationship. It is, at best, a CHF 30M opportunity, and realistically less once the friction of a move disrupts the convenience logic that kept them at your platform.
-
-The portability assumption most bankers apply is too generous because they know their own AUM but rarely know the client's total picture. Swiss private banking culture makes this harder, clients do not advertise their other banking relationships, and a relationship manager who asks directly can be perceived as intrusive.
-
-The practical approach: for your top twenty clients, estimate total wealth based on everything you know, property, businesses, lifestyle signals, other platform references, family context. Then apply your AUM as a fraction. In our experience at EP, bankers whose top clients are concentrated above 40% of total estimated wealth in their book tend to transfer well. Bankers where the fraction is below 20% across most of their top clients should plan on a slower, lower transfer curve, not because their relationships are weak, but because a meaningful portion of that AUM is sticky to the institution.
-
-This is EP's framework built from placement experience, not an industry standard. Every book is different. But the exercise forces an honest conversation with yourself before you have it with a bank.
-
-## 3. Do you have a non-solicit clause, and have you read it recently?
-
-This question has a comfortable answer and a correct answer. The comfortable answer is that non-solicit clauses are common, banks enforce them selectively, and everyone moves anyway. The correct answer is more nuanced.
-
-Non-solicit clauses in Swiss employment contracts are governed by the Swiss Code of Obligations (OR). Whether they are enforceable in practice depends significantly on how they are drafted, what they define as solicitation, and how Swiss courts interpret the specific clause. Swiss courts have been inconsistent on this. A broadly worded clause is harder to enforce than a precisely drafted one, but the uncertainty itself creates risk.
-
-The practical advice: read the clause yourself, not via a colleague's interpretation. If there is ambiguity about what constitutes solicitation, and there usually is, get a thirty-minute opinion from a Swiss employment lawyer before any conversation with a recruiter or a bank. This is not paranoia. It is due diligence. A CHF 300M book is worth more than a half-hour of legal advice.
-
-The banks you are considering know this too. Any institution making a serious offer will price the non-solicit into the transition package, either through garden leave coverage, NPC buyout, or a structured ramp assumption that does not require year-one transfer of your full book. The existence of a non-solicit is not a blocker. Not understanding its precise terms is.
-
-## 4. How much of your book is cross-border, and what is the compliance status of those relationships?
-
-This is the question that has caused more friction in placement processes over the last three years than any other. Cross-border private banking relationships, clients domiciled outside Switzerland banking in Geneva or Zurich, are only transferable if they are currently, documentably compliant. Not historically compliant. Ready to be onboarded at a new bank today.
-
-The KYC and AML standards that a hiring institution will apply to incoming clients have hardened substantially. FINMA enforcement actions resulted in fines totalling more than CHF 100 million imposed on Swiss financial institutions in 2025 alone. The new UBO register introduced via the revised Code of Obligations and AMLA covers more than 600,000 legal entities. Any bank taking on a senior RM with a cross-border book will conduct a pre-approval review of proposed client relationships. That review flags undocumented source of wealth, incomplete beneficial ownership structures, and any CRS or FATCA exposure that has not been properly declared.
-
-The practical consequence: a CHF 400M cross-border book where 30% of clients have open documentation questions is not a CHF 400M book for portability purposes. It is a CHF 280M book with a compliance tail that will complicate the approval process and potentially the offer terms.
-
-Bankers who have proactively managed their client files, who can say with confidence that every relationship in their book is clean, documented, and onboardable, have a real advantage in the current market. This is not a compliance observation. It is a portability observation.
-
-## 5. What is your real revenue margin, and how does it compare to market benchmarks?
-
-The metric that matters here is net fee and commission income (NFCI) as a proportion of AUM, what hiring institutions use to calculate payback period and three-year P&L contribution. According to PwC's Private Banking Market Update 2025, which covers 74 Swiss and Liechtenstein private banks, NFCI margins have remained broadly stable at 58 to 65 basis points across large banks and 58 to 64 basis points for smaller institutions, despite significant pressure from declining interest income.
-
-Total operating income is higher, 65 bps for large banks, up to 96 to 122 bps for smaller ones, but that figure includes interest income which has been contracting sharply since SNB rates began declining in March 2024 and is not a reliable benchmark for assessing a portable book.
-
-What this means practically: a banker presenting a book generating 45 to 50 bps in fee and commission income will face questions, not because the book is weak, but because the hiring bank's internal model will show a longer payback period. A CHF 500M book at 50 bps is still CHF 2.5M in annual NFCI, which justifies a strong offer at most platforms. But walking into that conversation without knowing your own number, or with a number that does not match the bank's calculation, costs credibility at a moment when credibility matters most.
-
-The more important point: if your revenue mix is heavily weighted toward discretionary mandates grandfathered at old fee structures, or toward Lombard lending that suppresses advisory revenue, you may be generating solid total income but a weak NFCI margin. Banks model NFCI, not total income.
-
-## 6. What is your actual timeline, and are you in control of it?
-
-Most moves take longer than the banker expects and shorter than the institution would prefer. The realistic timeline from first conversation to day one at a new platform in Geneva is four to seven months for a senior RM mandate: six to eight weeks of process, one to three months of notice or garden leave, and four to eight weeks of onboarding and client notification logistics.
-
-The question is whether the banker is driving that timeline or reacting to it. Bankers who approach the market with a vague sense that they might move within the next year are often slower to act when the right opportunity appears, and faster to accept suboptimal terms when the timeline accelerates for personal or institutional reasons outside their control.
-
-The control variable is preparation. Knowing your portability picture, having your client documentation in order, understanding your contractual position, and having a clear view of which platforms are genuinely strategic for your book, this preparation takes two to four weeks to do properly. Bankers who have done it before the first recruiter call are in a structurally better negotiating position than bankers who are discovering their own situation in real time during the process.
-
-## What this means in practice
-
-The purpose of this framework is not to discourage moves. The Geneva and Zurich markets are more active than the macro commentary suggests. PwC's 2025 data confirms that competition for talent is intensifying, personnel costs reached record levels across all bank clusters in 2024, and hiring of relationship managers continued to accelerate. Banks are paying well for bankers who arrive with clarity about their book, their compliance status, their constraints, and their timeline.
-
-The bankers who get the best outcomes are not necessarily the ones with the largest books. They are the ones who understand their own situation better than the bank does. That advantage is built before the first call, not during it.
-
-If you want to work through this framework in the context of your own book, the [EP Portability Score tool](/en/portability) runs the calculation in under ten minutes. Or speak with us directly, confidential, no obligation, and no CV required at this stage.`,
-  },
-
-  {
-    slug: "the-geneva-paradox",
-    title: "The Geneva Paradox",
-    seoTitle: "The Geneva Paradox: Why Geneva's Best Bankers Are the Most Frustrated",
-    seoDescription: "Geneva has more private banking talent per square kilometre than any city in the world, and some of the most frustrated senior bankers. The AUM is there. What is missing is the conversation.",
-    linkedinUrl: "",
-    date: "2026-06-11",
-    summary: "Geneva has the talent, the AUM and the infrastructure. What it lacks is the conversation senior RMs actually need, and banks keep substituting compliance reviews for it.",
-    pillar: "P1",
-    subTheme: "Positioning",
-    markets: ["CH"],
-    keywords: ["Geneva private banking talent", "private banking retention Switzerland", "senior RM career conversation", "AUM portability Geneva", "compliance review private banking"],
-    body: `Geneva has more private banking talent per square kilometre than any city in the world. It also has some of the most frustrated senior bankers in the world. Sit down with enough relationship managers across the lake's institutions and a pattern emerges that has nothing to do with compensation, bonus pools, or the usual grievances. It has to do with a conversation that almost never happens.
-
-The AUM is there. The clients are there. The infrastructure, the booking centres, the compliance frameworks, the Lombard lending desks, all of it is there. What is missing is the conversation where a senior RM sits across from someone, whether a manager, an HR partner, or a board member, who actually understands their book, their market, and what they are worth.
-
-Most of them have never had that conversation. What they have had instead are compliance reviews dressed up as career discussions.
-
-Walk into almost any annual review at a Geneva private bank and the structure is recognisable. There is a KYC refresh embedded somewhere in the conversation, even if nobody calls it that. There is a discussion of targets, usually framed around net new money and revenue, with little acknowledgment of how that revenue was actually generated or what it would take to defend it. There is a compliance attestation, sometimes literal, sometimes implicit in the tone, reminding the RM that their book belongs to the institution and that any deviation from policy carries consequences.
-
-What there rarely is, is a conversation about the RM as a professional with a portable set of relationships, a market position, and options. Banks have become very good at managing risk and very bad at managing people, and in private banking these are not separable functions, because the asset walking out the door every evening is the relationship itself.
-
-This is not a new observation. What is less discussed is why the substitution happens, and why it is getting worse rather than better.
-
-Three forces are converging. The first is regulatory. Since the post-2008 wave of cross-border enforcement actions, and accelerating through FATCA, AEOI, and the various national tax amnesty programmes, banks in Geneva and Zurich have built enormous compliance infrastructures. Every client relationship now carries documentation requirements that did not exist fifteen years ago. The annual review cycle has absorbed much of this, because it is the one moment in the year when a manager and an RM are guaranteed to sit down together. The agenda fills with regulatory checkboxes because that is what the institution can measure and defend.
-
-The second is managerial. Team heads and market heads at most Geneva institutions are themselves senior bankers who were promoted into management without much preparation for it. They are good at client relationships and often uncomfortable having direct conversations about career trajectory, compensation expectations, or the uncomfortable truth that a given RM's book may be more portable than the bank would like to admit. It is far easier to default to the templated review, tick the boxes, and move on.
-
-The third is structural. HR functions in private banking have become risk functions almost as much as people functions. Performance conversations are increasingly documented with an eye toward potential disputes, departures, or litigation, rather than toward genuinely developing the person sitting across the table. The paper trail matters more than the conversation.
-
-None of this is malicious. It is the rational output of an institutional environment optimised for defensibility. But the effect on the RM is corrosive.
-
-When a senior banker with twenty years of relationships and several hundred million in AUM walks out of a review that consisted mainly of compliance attestations and target setting, what they hear is not that they are valued. What they hear is that they are managed.
-
-This matters because senior RMs in Geneva are, almost without exception, aware of their market value. They know roughly what their book would be worth to an EAM, to a competing institution, or as the seed of an independent practice. They do not need a headhunter to tell them this, although headhunters certainly do. What they often lack is a structured, honest assessment of what would actually transfer, what would not, and what the realistic economics of a move would look like once legal constraints, client consent requirements, and transition costs are factored in.
-
-In the absence of that conversation internally, RMs increasingly seek it externally. This is one of the quieter drivers of the talent movement that has reshaped Geneva over the past several years. It is rarely a single triggering event, a bad bonus, a reorganisation, a difficult manager. More often it is the cumulative weight of years of reviews that addressed everything except the one question the RM actually wanted answered, whether they are better off staying, and whether anyone at the institution actually knows what they are worth.
-
-Banks that rely on compensation alone to retain senior talent are running what amounts to a holding pattern rather than a retention strategy. Deferred compensation, retention bonuses tied to multi year vesting, and competitive base adjustments all have their place, but they address the symptom rather than the cause. They keep someone in their seat for another cycle without changing the underlying calculation the RM is making about their long term position.
-
-A genuine retention strategy would involve the conversation that is currently missing. It would mean a manager or a dedicated function within the bank being able to say, with credibility, here is what your book looks like from a portability and concentration perspective, here is where you are exposed, here is where you are strong, and here is what we are prepared to do about it. That conversation requires the bank to be honest about things it is often institutionally reluctant to discuss, including the degree to which a given RM's relationships are personal rather than institutional.
-
-It is uncomfortable. It is also exactly the conversation that competing institutions, EAMs, and independent platforms are increasingly willing to have, because for them it is a sales conversation. The bank that will not have an honest conversation about portability with its own senior bankers is effectively ceding that conversation to whoever will.
-
-The shift does not need to be dramatic. It does not require banks to abandon compliance reviews or pretend regulatory obligations do not exist. It requires separating the two conversations.
-
-The compliance and target setting discussion can remain exactly as it is, because it serves a real function and cannot be removed. What is needed alongside it is a separate, genuinely strategic conversation, ideally not led by the RM's direct line manager alone, that addresses the RM's market position honestly. This might involve an external perspective, precisely because an external view is harder to dismiss as either a sales pitch or a management exercise. It might involve a structured assessment of the book's composition, its concentration risk, its portability under realistic constraints, and its likely value under different scenarios.
-
-The point is not to give the RM ammunition to leave. The point is that RMs who have had this conversation tend to make more rational decisions, and rational decisions, when the institution has genuinely strong points to make, often favour staying. The RMs who leave anyway tend to be the ones for whom the institutional case was always weak, and arguably the bank is better positioned dealing with that reality directly than discovering it via a resignation letter.
-
-Geneva's concentration of talent and AUM is not going anywhere. The infrastructure advantages, the client base, the regulatory stability of the Swiss booking centre model, these remain real and durable. What is not durable is the assumption that this concentration alone will hold senior bankers in place indefinitely, particularly as portability becomes easier, as EAMs become more sophisticated, and as the next generation of RMs enters a market where mobility is normalised rather than exceptional.
-
-The paradox is not that Geneva lacks what it needs to retain its best people. It is that the conversation required to do so keeps getting replaced by the conversation that is easier to have. Until that changes, the holding pattern continues, and every senior RM who walks out of another review having heard everything except what they actually wanted to know becomes a little more receptive to the call that eventually comes.
-
-If you want to work through this for your own book, the [EP Portability Score tool](/en/portability) runs the assessment in under ten minutes. Or speak with us directly, confidential, no obligation, and no CV required at this stage.`,
-  },
-
-  {
-    slug: "compliance-golden-handcuff",
-    title: "Compliance Is the New Golden Handcuff",
-    seoTitle: "Why Compliance Has Become the Real Retention Tool in Swiss Private Banking",
-    seoDescription: "The most effective retention tool in Swiss private banking is not a deferred bonus. It is the KYC file. How regulatory complexity quietly became a barrier to banker mobility.",
-    date: "2026-06-02",
-    summary: "How regulatory complexity became the retention weapon no one admits to using, and why the compliance audit now matters as much as the compensation negotiation.",
-    linkedinUrl: "https://www.linkedin.com/pulse/compliance-new-golden-handcuff-gil-m-chalem--aoh0e/",
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    markets: ["CH"],
-    keywords: ["compliance retention private banking", "KYC portability", "FinSA non-solicitation", "Swiss private banking talent", "banker mobility Switzerland"],
-    body: `The most effective retention tool in Swiss private banking is not a deferred bonus. It is not an equity stake, a title, or a counter-offer. It is a KYC file.
-
-Senior bankers are leaving large institutions and discovering, often mid-negotiation, that the relationship they spent twelve years building does not travel the way they assumed. The clients will follow them. The documentation will not. And without the documentation, re-onboarding a CHF 300 million book at a new institution under current FinSA obligations takes months the banker did not price into their decision. The banks knew this. They built it that way. Nobody said so out loud.
-
-The scale of compliance investment in private banking is not incidental. A 2024 LexisNexis Risk Solutions study found that the cost of financial crime compliance has increased for 99% of financial institutions in the US and Canada, reaching 61 billion dollars annually. In Europe, the picture is comparable. In the UK alone, banks and fintechs spend an estimated 21,400 pounds per hour fighting financial crime and fraud, with the annual compliance bill reaching 38.3 billion pounds. Deloitte estimates compliance operating costs have increased by over 60% for retail and corporate banks compared to pre-financial crisis levels.
-
-For Swiss private banks specifically, the regulatory stack has become dense. FinSA, FinIA, FINMA Circular 2025/02, Basel III Endgame, evolving AML obligations, and a proposed federal transparency register for beneficial ownership due in 2026. In June 2025, the Federal Council detailed legislative measures including the introduction of a Senior Managers Regime, new FINMA powers to issue administrative fines, and enhanced early intervention measures. Each layer requires documentation, systems, and institutional infrastructure that individual bankers cannot replicate or carry.
-
-Banking executives now spend 42% of their time on compliance matters, up 75% from 2016, while boards dedicate 43% of their time, up 63% from the same period. The cost is real. But the structural consequence is what the industry does not discuss: all that compliance infrastructure creates an asymmetry between the banker and the bank that grows harder to cross every year.
-
-When a relationship manager leaves, the suitability assessments, KYC files, risk classifications, and signed advisory agreements stay. Legally, they belong to the institution. The banker walks out with their relationships and their reputation. The bank keeps the paper trail the next institution needs to onboard those same clients.
-
-Here is the scenario that plays out more often than the industry acknowledges. A banker with CHF 400 million, solid client loyalty, a credible offer on the table. The move makes sense on paper. Then their lawyer maps the non-solicitation exposure, the documentation the new bank will require to satisfy FinSA suitability obligations from scratch, and the realistic timeline to make the book whole again. Eighteen months of rebuild, conservatively. The banker recalculates. Some move anyway. Many do not. The bank never made a counter-offer. It did not need to.
-
-Under Swiss case law, non-solicitation clauses may even apply to clients who were already clients of the employee before they joined the employer, because those clients legally become clients of the institution. The sole exception applies where a client relationship is driven entirely by the personal attributes of the individual. In practice, proving that exception requires litigation that most departing bankers cannot afford to initiate. The result is a friction cost on mobility that has nothing to do with compensation. It is structural. And it compounds.
-
-The banks that understood this earliest are not the ones with the most aggressive non-solicitation clauses. They are the ones that built the deepest client documentation systems, the most thorough KYC refresh cycles, the most integrated advisory platforms. Every client interaction logged inside a CRM is a data point the bank owns. Every suitability profile updated through the bank's portal is a file the banker cannot replicate at the next institution. Every co-signed investment proposal that lives inside the bank's document management system is a piece of the relationship the bank is retaining, not the banker. This is not cynicism. It is architecture. And the most sophisticated institutions have built it deliberately.
-
-The KPMG 2025 study on Swiss private banking noted that the growing regulatory burden makes it increasingly difficult for even a successful bank to operate, contributing to ongoing consolidation. What the same report does not say is that for the largest surviving institutions, that burden is a competitive advantage. The compliance overhead that kills smaller banks protects larger ones, not just from regulators, but from talent mobility.
-
-The talent market in Swiss private banking is already under pressure. Private banks lost high-performing relationship managers in 2024 to IAMs and boutiques, further exacerbating the talent shortage for traditional institutions. The bankers who do move are increasingly moving to smaller, less bureaucratically complex environments where the documentation burden is lower and the relationship with the client more portable. The irony is sharp. The regulatory architecture that the large banks built to protect client assets is also protecting the banks from their own talent leaving. And the side effect is a market where the most senior, most experienced bankers face the highest exit costs, regardless of whether their compensation reflects that reality.
-
-The golden handcuff used to be a deferred bonus with a three-year cliff. It was transparent, negotiable, and eventually paid out. The new handcuff is invisible. It is built into every client file, every suitability form, every KYC refresh cycle. It does not expire. It accumulates. And the longer a banker stays, the deeper the documentation runs, and the higher the exit cost becomes. Loyalty and tenure, once rewarded with seniority, now also function as a trap.
-
-For any banker considering a move, the compliance audit is now as important as the compensation negotiation. What documentation does your current employer hold on your clients? What can be replicated independently? What client consent is required for transfer? What is the realistic cost, in time and revenue, of rebuilding a book from scratch under current regulatory obligations at a new institution? These are commercial questions, not legal ones. Get answers before you sign anything. If you want a structured read on how much of your book would actually survive a move, the [Portability Readiness Score](/en/portability) maps exactly these constraints, documentation, wallet share, legal exposure, before you open a conversation with anyone.
-
-For the institutions, the calculus is different but equally clear. The banks that built the deepest client documentation systems, the most integrated advisory platforms, the most thorough KYC refresh cycles, built them for compliance reasons. The retention effect was a consequence. Or so they will tell you.
-
-The most effective retention tool in private banking today is paperwork. The institutions that understood that first are not talking about it. That, more than anything, tells you how well it works.`,
-  },
-  {
-    slug: "the-alpine-exit",
-    title: "The Alpine Exit",
-    seoTitle: "What Happens to Swiss Private Banking if UBS Moves HQ Abroad",
-    seoDescription: "If UBS relocates its headquarters out of Switzerland, the consequences for Geneva, Zurich and the Swiss private banking talent market go far beyond one bank.",
-    date: "2026-05-26",
-    summary: "What happens to private banking if UBS leaves Switzerland — the structural, human, and competitive consequences that capital markets commentary has missed.",
-    linkedinUrl: "https://www.linkedin.com/pulse/alpine-exit-gil-m-chalem--5dz5e/",
-    pillar: "P1",
-    subTheme: "Positioning",
-    markets: ["CH", "UK", "US"],
-    keywords: ["UBS redomiciliation", "Swiss private banking", "UBS headquarters", "private banking Switzerland 2026"],
-    body: `Picture the lobby of UBS's Bahnhofstrasse headquarters on a Tuesday morning in 2027. The Zurich address remains. The legal domicile does not. The building is still there, but the institution that built it is, on paper, American. That scenario is no longer the subject of financial fiction. It is the subject of board-level contingency planning, preliminary meetings in Washington, and some of the most consequential regulatory brinkmanship that Swiss banking has seen since the forced marriage of UBS and Credit Suisse in 2023.
-
-The trigger is well documented by now. In June 2025, the Swiss Federal Department of Finance proposed that UBS fully capitalise its foreign subsidiaries, up from the current 60% threshold, at a cost of up to 26 billion dollars in additional Common Equity Tier 1 capital. Combined with existing requirements, the bank calculated the total additional CET1 demand at roughly 42 billion dollars. UBS called the proposals neither proportionate nor internationally aligned. That is diplomatic language for: we will not accept this, and if you insist, we will leave.
-
-By September 2025, reports confirmed that UBS Chairman Colm Kelleher and CEO Sergio Ermotti had held meetings with officials from the Trump administration to explore the conditions for a potential headquarters transfer, possibly structured around an acquisition of a mid-sized American bank. PNC Financial, valued at approximately 79 billion dollars, and Bank of New York, at around 74 billion, were cited as potential targets. Neither UBS nor the White House confirmed the discussions. Neither denied them. The Swiss President, when pressed, noted that the threat of departure was, in her words, not new. That observation may be accurate. What is new is that the conditions for acting on the threat have never been more plausible.
-
-This article is not primarily about the regulatory dispute. That debate belongs to capital markets analysts and banking lawyers. What interests practitioners in private banking, and what the industry press has largely missed, is the structural, human, and competitive consequence of a genuine UBS redomiciliation. The geography of private banking would not simply shift. It would fracture.
-
-The [Geneva](/en/markets/geneva) private banking market entered 2026 in a condition that practitioners understand, but that the macro commentary has consistently misread. Headlines from the 2022 to 2024 period described contraction. The reality was more complex. The UBS-Credit Suisse integration shed more than 5,000 roles across Switzerland, and approximately 200 senior Geneva-based bankers relocated to Singapore alone in that period. The total headcount of the sector fell by roughly 15% over two years. What those numbers did not capture is that the roles eliminated were not the roles the market most needed, and the specialists who stayed became harder to recruit than at any point in the previous decade. A market that shrunk also tightened, acutely, in compliance, sustainable finance structuring, and senior cross-border planning. The paradox of private banking talent in 2026 is that supply contracted and demand intensified simultaneously.
-
-Into this context, a UBS headquarters relocation does not arrive as an abstract event. It arrives as a second structural shock to a workforce that has not finished processing the first one. The cantonal government of [Zurich](/en/markets/zurich) offered the most direct public quantification: in 2024, banks in the canton generated 13 billion Swiss francs in gross value added, approximately 8% of the canton's total economic output. UBS alone employs roughly 25,000 people in Switzerland, many of them internationally mobile senior professionals whose compensation arrangements include lump-sum taxation structures available in cantons such as Zug. A change of legal domicile would not move all of those people immediately, but it would begin a renegotiation of secondment contracts, remuneration packages, and career trajectories that would, over a cycle of three to five years, thin the talent layer at the top of the Swiss market considerably.
-
-The broader institutional consequence is harder to quantify but no less real. Switzerland's position in global private banking has never rested purely on its regulatory framework or its tax environment. It has rested on the perception that the largest private banking institution in the world chose, generation after generation, to be Swiss. The country's political neutrality, its discretion culture, its geographic position between Western Europe and the rest of the world's wealth: all of this has been anchored, in the minds of private clients and relationship managers alike, by the fact that UBS sat in Zurich. Remove that anchor, and the positioning of Switzerland as the world's premier booking centre becomes, for the first time in modern history, an argument rather than an assumption.
-
-The instinct of most financial commentators is to frame a UBS redomiciliation as a gain for the United States. That framing is correct in the narrow regulatory sense and misleading in almost every other sense. What would actually arrive in New York or Washington would not be a bank looking for a quieter life. It would be the world's largest private banking institution, managing over 7 trillion dollars in client assets and counting approximately half of the global billionaire population among its relationships, entering the domestic US wealth management market with structural advantages that no American competitor can match.
-
-Consider the competitive arithmetic. Morgan Stanley, Merrill Lynch, and JPMorgan Wealth Management are the dominant players in the US ultra-high-net-worth segment. They operate within the constraints of the domestic deposit cap rule, which prevents any American bank from acquiring more than 10% of total US deposits through a single transaction. UBS, as a foreign institution, is not subject to that constraint. A UBS that acquires PNC or Bank of New York does not simply add a domestic distribution network. It bypasses a limitation that has prevented American consolidation at the top of the market for years, and it does so while bringing a client base, a booking infrastructure, and an international platform that no US-built competitor can replicate organically.
-
-For relationship managers and private bankers working in the United States today, the implications are more personal. UBS Financial Services already manages a significant portion of its global AUM through the US business. A formal headquarters move, accompanied by a domestic acquisition, would elevate that operation from a strategically important division to the institutional centre of gravity. For advisors currently at Merrill, Morgan Stanley, or Raymond James, a fully domiciled UBS becomes a materially different career destination: global platform, European client access, the institutional credibility of 160 years of private banking heritage, and the scale that comes from absorbing a mid-sized American institution.
-
-There is a dimension to this story that capital markets commentary is constitutionally ill-equipped to address. It is the question of institutional identity, and specifically, what the identity of UBS means to the clients and relationship managers whose decisions are built around it.
-
-Private banking relationships are not pure product relationships. A senior relationship manager in Geneva managing a portfolio of French, Francophone African, or Middle Eastern clients did not choose UBS in isolation from the fact that UBS was Swiss. The Swiss identity of the institution was part of the value proposition: the neutrality, the physical distance from the client's home jurisdiction, the perception of permanence and discretion that being headquartered in Zurich carried. Some of that identity survives a redomiciliation. Some of it does not. The conversation between a Geneva-based banker and a Moroccan family office, or a Paris-based entrepreneur, or a Gulf-state patriarch, shifts in a way that no amount of branding continuity can prevent when the answer to where is your bank headquartered becomes, in a meaningful legal sense, New York.
-
-This is not a sentimental observation. It is a retention risk calculation. For the cohort of relationship managers whose books are anchored in clients who specifically chose Swiss domiciliation, a redomiciliation is not neutral. It reopens conversations that have been closed for years. It creates a window, perhaps narrow but real, for competitors in Luxembourg, Liechtenstein, [Singapore](/en/markets/singapore), and the cantonal banks to approach those clients with an argument that did not exist before. That window closes over time as the new reality normalises. But the transition period, which in private banking typically runs three to five years, is long enough to matter.
-
-The Swiss Federal Council is not unaware of this dynamic. The most likely outcome remains what it has always been in these standoffs: a negotiated middle ground. The capital requirements will be adjusted, the transition period will be extended, and UBS will remain legally Swiss while accelerating its operational centre of gravity toward the US. That outcome is already underway regardless of where the headquarters sits. But the credible threat of departure has changed the conversation permanently, and practitioners in both markets should be building their own contingency thinking now, not after the resolution is announced.
-
-The alpine view from Bahnhofstrasse is still there. Whether the institution behind it remains defined by it is the question that the private banking world is only beginning to ask seriously.`,
-  },
-  {
-    slug: "what-is-a-relationship-manager-worth",
-    title: "What Is a Relationship Manager Actually Worth? The Revenue Grid Nobody Shows You Before You Sign",
-    date: "2026-05-21",
-    summary: "There is an internal revenue model the bank built around your candidacy before they made you an offer. It contains their real assumptions about your portable AUM, their ROA projection, and the payback period on your guarantee. This is how to read it.",
-    pillar: "P2",
-    linkedinUrl: "",
-    markets: ["CH", "UK", "UAE", "ASIA"],
-    featured: true,
-    keywords: ["relationship manager salary private banking", "private banker compensation Geneva", "RM package Switzerland", "private banking guarantee negotiation", "what is a relationship manager worth", "private banker salary Zurich Dubai Singapore"],
-    body: `What Is a Relationship Manager Actually Worth? The Revenue Grid Nobody Shows You Before You Sign
-
-There is a document that exists in every private bank's hiring process that you will never be shown. It is not confidential in any formal sense. Nobody has decided to withhold it from you as a matter of policy. It simply never makes it across the table, because sharing it would shift the negotiating dynamic in a direction that does not favour the institution.
-
-It is the internal revenue model the bank built around your candidacy before they made you an offer.
-
-It contains their assumptions about your portable AUM, their own ROA projection applied to that AUM, the payback period on your guaranteed compensation, and the net present value of the hire over a three to five year horizon. It is, in short, a precise calculation of what you are worth to them. And the gap between that number and the package they put on the table is the margin they expect to capture.
-
-This article is about closing that gap. Not through confrontation, but through understanding the grid well enough to negotiate from the same set of numbers the bank is using.
-
-## How Banks Value a Lateral Hire
-
-The starting point for any bank's internal valuation of a senior RM hire is simple: what revenue will this person generate, net of their total cost, over the period of the guarantee and beyond?
-
-The calculation has four inputs. The first is the portable AUM the bank believes will actually transfer, which is almost always lower than the number in the business plan and reflects their own due diligence on the candidate's book. The second is the ROA they apply to that AUM, based on the bank's internal benchmarks for the market and client segment in question. The third is the ramp timeline, which reflects the legal situation and the bank's experience with similar hires. The fourth is the total cost of the hire: base salary, bonus target, sign-on, guarantee, and the internal cost of onboarding.
-
-The output is a break-even point. The moment at which the cumulative revenue generated by the hire exceeds the cumulative cost. In Swiss private banking, for a senior lateral hire with a credible portable book, that break-even typically falls somewhere between eighteen and thirty-six months. Below eighteen months, the bank considers the hire low-risk. Above thirty-six months, the hire requires either a stronger conviction on the upside or a more conservative compensation structure.
-
-Understanding this framework matters because it explains almost every decision the bank makes during the negotiation. The length of the guarantee is a direct function of the break-even timeline. The size of the sign-on reflects the bank's confidence in the portability case. The structure of the bonus, whether it is discretionary or formula-driven, reflects their view of the revenue risk. None of these decisions are arbitrary. They all trace back to the same internal model.
-
-## What You Are Actually Worth: The Market Benchmarks
-
-The question of what a relationship manager is worth in the open market is one that the industry treats with a peculiar mix of opacity and open secret. Everyone in the business has a rough sense of the numbers. Almost nobody states them clearly.
-
-The benchmarks that follow are drawn from active mandates and completed placements across the markets where Executive Partners operates. They are indicative rather than precise, because compensation in private banking is genuinely variable and depends on factors that no benchmark can fully capture. But they are close enough to reality to be useful as a starting point.
-
-In [Geneva](/en/markets/geneva), a senior relationship manager managing a CHF 300 to 500 million book with a credible portable AUM of sixty percent or above and a clean legal situation can typically expect a total first-year package in the range of CHF 350,000 to CHF 550,000, inclusive of base, bonus target, and guarantee. The base salary for a profile at this level sits between CHF 180,000 and CHF 260,000. The guarantee, where offered, is typically structured over twelve to twenty-four months.
-
-In [Zurich](/en/markets/zurich), the benchmarks are broadly comparable, with a slight compression at the upper end reflecting the different client mix and the dominance of domestic Swiss business in many of the larger institutions.
-
-In [Dubai](/en/markets/dubai), the structure is different but the economics are comparable when adjusted for the tax-free environment. A senior RM managing a USD 300 to 500 million book can expect a total package in the range of USD 300,000 to USD 500,000, with a higher proportion typically paid as base salary reflecting the cost of living and the absence of a bonus tax advantage.
-
-In [Singapore](/en/markets/singapore) and Hong Kong, the range is wider, reflecting the greater diversity of client segments and booking centre models. A senior Asian market RM with a strong portable book and language capabilities that match the desk's target market can command packages that comfortably exceed the Geneva benchmarks, particularly at the upper end of the AUM range.
-
-[London](/en/markets/london) occupies a specific position in the market. The tax environment is less favourable than Dubai or Switzerland, but the pool of international private banking talent is deep and the client base is genuinely global. Packages at the senior level reflect both the cost of London living and the competitive pressure from the investment banking and asset management sectors for the same talent.
-
-## The Compensation Variables That Matter Most
-
-Knowing the benchmark range is the starting point. Understanding the variables that move a candidate toward the upper or lower end of that range is what allows for a genuinely informed negotiation.
-
-The single most important variable is portable AUM credibility. A candidate whose business plan has been stress-tested and holds up under scrutiny, whose portability case is specific and honest, and whose legal situation is clean, will consistently command packages at or above the midpoint of the market range. A candidate whose business plan is vague, whose AUM figures are approximate, and whose legal situation is complicated will consistently land below it. The market is not irrational about this. It prices risk accurately.
-
-The second variable is market specificity. A relationship manager who serves a specific, named market, Turkish, Italian, CIS, LATAM, South African, and who has demonstrable relationships in that market, is a scarcer resource than a generalist, and is priced accordingly. Scarcity drives compensation in private banking at least as reliably as it does in any other professional market.
-
-The third variable is revenue quality. Two candidates with identical AUM can have very different revenue profiles, and the one with the higher ROA, the more active client base, the greater proportion of discretionary mandates, will command a meaningfully higher package. Banks are not buying AUM. They are buying revenue, and they pay for revenue quality.
-
-The fourth variable is competitive tension. A candidate who is in process with two or more institutions simultaneously, and who is transparent about that process, will almost always achieve a better outcome than one who is negotiating exclusively with a single bank. This is not a negotiating tactic in any cynical sense. It is simply the natural result of a market functioning correctly. Banks price talent more accurately when they know the talent has options.
-
-## The Guarantee Negotiation
-
-The guarantee is the most consequential element of a senior RM's compensation negotiation, and it is the one that is most frequently mishandled.
-
-The common mistake is to treat the guarantee as a fixed component of the offer, to be accepted or rejected as presented, rather than as a negotiable variable that reflects the bank's internal risk assessment of the hire. The guarantee is, in effect, the bank's bet on the business plan. If they believe the portable AUM will transfer at the levels projected, they will guarantee the compensation for the period it takes to get there. If they are uncertain, they will shorten the guarantee or structure it with clawback provisions that transfer the risk back to the RM.
-
-The most effective approach to the guarantee negotiation is to connect it explicitly to the business plan assumptions. If the bank accepts the portability case at the level presented, the guarantee should reflect the time it takes to realise that case given the legal constraints. A six-month garden leave plus a twelve-month ramp to first wave client transfers implies a minimum eighteen-month guarantee for the hire to make economic sense for either party. A bank that offers twelve months against that profile is either discounting the portability case or pricing the risk asymmetrically. Both of those positions are negotiable.
-
-The RM who understands this dynamic, who can articulate the connection between the portability timeline and the guarantee structure, will consistently negotiate better outcomes than the one who treats the guarantee as a line item to be pushed up by force of will.
-
-## Reading the Offer Correctly
-
-When a private bank puts an offer on the table, it contains more information than the numbers it states. The structure of the offer reveals the bank's actual view of the hire.
-
-A high base relative to bonus target suggests the bank is uncertain about the revenue upside and is pricing the hire conservatively. A long guarantee with modest sign-on suggests they believe the portability case but want time to verify it. A short guarantee with a generous sign-on suggests they are confident about year one but uncertain about the longer term. A formula-driven bonus rather than a discretionary one suggests they have done the revenue modelling carefully and are prepared to share the upside but not underwrite the risk.
-
-None of these structures are inherently good or bad. They are signals. And reading them correctly, understanding what the bank is really saying about their view of the hire, is the precondition for negotiating effectively.
-
-The RM who can read the offer in these terms, who understands that they are looking at a financial model expressed as a compensation structure, is in a fundamentally stronger position than the one who reads it as a number to be negotiated up. The goal is not to extract the maximum from the bank. The goal is to reach an agreement that accurately reflects what both parties believe the hire is worth. That agreement, when reached on those terms, tends to be the foundation for a relationship that actually works.
-
-If you would like to understand where your profile sits within these benchmarks before your next conversation, the Executive Partners [Portability Score](/en/portability) and [Business Plan Simulator](/en/bp-simulator) will give you a structured view of your own position in the market.`,
-  },
-  {
-    slug: "private-banker-business-plan",
-    title: "The Private Banker's Business Plan: What Your New Bank Actually Wants to See",
-    seoTitle: "Private Banker Business Plan: What Hiring Committees Actually Want to See",
-    seoDescription: "Most private banker business plans answer the wrong question. This is the AUM portability framework and revenue structure that Swiss and international private banks actually expect.",
-    date: "2026-05-21",
-    summary: "Most business plans in private banking answer the wrong question. This is the structure that sophisticated hiring committees actually believe — and the logic that earns the guarantee.",
-    pillar: "P2",
-    linkedinUrl: "",
-    markets: ["CH", "UK", "UAE", "ASIA"],
-    featured: true,
-    keywords: ["private banker business plan", "RM business plan private banking", "AUM portability", "relationship manager lateral move", "private banking guarantee", "RM ramp timeline"],
-    body: `The Private Banker's Business Plan: What Your New Bank Actually Wants to See
-
-Every senior relationship manager who has been through a serious lateral move in private banking has written a business plan. Most of them have written a bad one. Not bad in the sense of poorly formatted or carelessly researched, but bad in the sense that it answered the wrong question. It told the hiring bank what the RM wanted them to believe, rather than what they actually needed to know.
-
-The business plan is the most misunderstood document in private banking recruitment. RMs treat it as a sales pitch. Banks treat it as a due diligence exercise. The gap between those two framings is where most lateral moves go wrong before they even begin.
-
-After placing over two hundred senior bankers across [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), [London](/en/markets/london), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore), and Hong Kong, I have read enough business plans to know what separates the ones that close at the number the RM wanted from the ones that get quietly discounted before the offer is made. The difference is almost never the quality of the writing. It is the quality of the thinking behind it.
-
-This article is a guide to building a business plan that a sophisticated hiring committee will actually believe.
-
-## What the Bank Is Really Asking
-
-Before writing a single line, it is worth understanding what a private bank's hiring committee is actually trying to establish when they read a business plan. They are not looking for ambition. They already know the RM is ambitious, or they would not be sitting across the table. They are not looking for a polished narrative about client relationships and market expertise. They have heard that narrative from every candidate who has sat in that chair.
-
-What they are looking for is three things, and only three things.
-
-First, they want to know whether the revenue projection is credible. Not optimistic, not aspirational, credible. There is a very specific range within which a business plan needs to land to be taken seriously, and it is narrower than most RMs think.
-
-Second, they want to understand the legal situation clearly enough to model the ramp timeline with some confidence. Garden leave, non-solicitation, non-compete: the hiring committee needs to know what they are underwriting before they can structure an offer.
-
-Third, they want to see evidence that the RM understands their own book well enough to have an honest conversation. The candidate who walks in knowing their average wallet share per client, their return on assets, and their realistic portable percentage in year one is a fundamentally different proposition from the one who states a headline AUM and expects the room to do the rest of the work.
-
-Everything else in the business plan is context. Useful context, sometimes important context, but context nonetheless.
-
-## The Structure That Works
-
-A business plan that lands well in a private banking hiring committee follows a specific sequence. It moves from the current reality to the credible projection, with the supporting logic made explicit at each step. It does not lead with the number. It earns the number.
-
-The opening section establishes the current book clearly and honestly. Total AUM under management, the number of active client relationships, the average ticket size, the market or markets served, and the approximate revenue generated in the last full year. These figures should be as precise as confidentiality constraints allow. Round numbers are a red flag. A candidate who manages exactly CHF 400 million from exactly fifty clients generating exactly CHF 2 million in revenue has clearly approximated. A candidate who manages CHF 387 million from forty-three active relationships generating CHF 1.9 million has clearly counted.
-
-The second section addresses composition. What proportion of the book is discretionary versus advisory versus execution-only? What is the breakdown by client domicile and booking centre? Are there EAM relationships in the book, and if so, how are they structured? This section exists because a CHF 400 million book composed primarily of discretionary mandates from long-standing direct relationships is worth dramatically more to a hiring bank than a CHF 400 million book split across EAM relationships, custody-only clients, and recent introductions. The number is the same. The value is not.
-
-## The Portability Case
-
-The portability section is where most business plans collapse under scrutiny, and it is the section that matters most.
-
-The standard approach is to apply a transfer percentage to the total AUM and present the result as the year one figure. Seventy percent of CHF 400 million equals CHF 280 million. The committee nods. The offer is structured around CHF 280 million. And then the actual transfer comes in at CHF 140 million and everyone spends the next two years managing the gap.
-
-A credible portability case does not work that way. It works client by client, or at least segment by segment, and it is honest about the variables that will determine the actual outcome.
-
-The factors that drive portability have been covered in detail in the [AUM portability framework](/en/insights/how-to-calculate-aum-portability) published separately on this site. In the context of the business plan, what matters is demonstrating that the RM has applied that kind of thinking to their own book, rather than simply stating a percentage and hoping the committee accepts it.
-
-A strong portability section identifies the anchor clients, the two or three relationships that represent a disproportionate share of the AUM, and makes a specific case for why each of them will move. It identifies the clients who are genuinely uncertain, where the relationship is strong but the institutional dependency is real, and presents them as the upside scenario rather than the base case. And it identifies the clients who are unlikely to move at all, because the relationship is too institution-dependent, too EAM-driven, or too recently established, and excludes them from the projection entirely.
-
-That level of honesty is counterintuitive. Most RMs are afraid that excluding clients from the business plan will reduce the offer. In practice, it almost always increases credibility, and credibility is what drives the guarantee.
-
-## The Ramp Timeline
-
-Private banks do not underwrite a business plan as a single number. They model it as a cash flow, quarter by quarter, from the date of hire through to the point at which the RM's book is generating enough revenue to cover their total cost. That break-even point, sometimes called the payback period, is the internal metric that determines how much risk the institution is prepared to take on the hire.
-
-The ramp timeline in a business plan needs to reflect the legal reality first and the client migration reality second. If there is a six-month garden leave, the revenue line starts at zero for the first two quarters regardless of any other assumptions. That is not a weakness in the plan. It is a fact, and presenting it clearly signals that the RM understands how banks think about this hire.
-
-After the garden leave period, the typical ramp in Swiss private banking follows a specific pattern. The first wave of client transfers, those from the anchor relationships who were briefed before departure and have been waiting, arrives in months seven through nine. The second wave, from relationships that needed more time to process the move, arrives in months twelve through eighteen. The third wave, from clients who needed to see the RM established at the new institution before committing, arrives in year two or later.
-
-A business plan that shows a smooth linear ramp from zero to full AUM over thirty-six months is almost certainly wrong. A business plan that shows a step-function ramp, front-loaded with anchor clients and followed by two subsequent waves with specific timing rationale, is almost certainly right and is far more likely to be believed.
-
-## Revenue Projections
-
-The revenue projection is where the business plan connects the AUM timeline to the P&L, and it is where the ROA assumption matters enormously.
-
-The hiring committee will apply their own ROA assumption to whatever AUM figure they accept. If the RM's stated ROA is materially higher than the bank's internal benchmark, the committee will discount it. If it is materially lower, they will wonder whether the RM's client base is the right fit for the platform. The target is a revenue projection that lands within a credible range of what the institution can verify through its own experience with similar books.
-
-In Swiss private banking, the standard ROA range for a managed book is forty to seventy basis points on AUM. Anything above seventy basis points requires explanation, usually in the form of a concentrated book of active traders or structured product buyers. Anything below forty requires a different explanation, usually in the form of a predominantly cash or custody book that will need to be repositioned over time.
-
-The business plan should state the ROA assumption explicitly and explain it. A candidate who says "I am projecting sixty basis points because my clients are predominantly discretionary with an average equity allocation of sixty-five percent" is making a specific, verifiable claim. A candidate who says "I expect to generate approximately two percent of AUM in revenue" is making a claim that no sophisticated committee will accept at face value.
-
-## Compensation Framework
-
-The final section of the business plan is the one that most RMs treat as the starting point rather than the conclusion. The compensation ask.
-
-A well-structured business plan earns the compensation ask by building the logic that supports it. The committee has seen the current book, accepted the portability case, agreed on the ramp timeline, and worked through the revenue projection. By the time the compensation framework appears, it should feel like the natural conclusion of a shared analysis rather than an opening position in a negotiation.
-
-The elements of a private banking compensation package are well understood: base salary, performance bonus, long-term incentive, sign-on, and guarantee. The guarantee is the most sensitive element and the one that most directly reflects the institution's confidence in the business plan. A bank that believes the portability case will offer a meaningful guarantee. A bank that does not will offer a short one, or none at all.
-
-The RM who understands this dynamic will present a compensation framework that is explicitly linked to the business plan assumptions. If the portability scenario delivers at the base case, the target compensation is X. If it delivers at the upside, it is Y. That kind of conditional structure signals financial sophistication and tends to produce better outcomes than a fixed ask.
-
-## The Document That Builds Trust
-
-The business plan is not a sales pitch. It is a trust-building exercise. The RM who walks into a hiring committee with a document that is honest about what will move, clear about the timeline, explicit about the assumptions, and realistic about the risks is the RM that institutions want to hire. Not because they are the most optimistic candidate in the room, but because they are the one the bank can actually plan around.
-
-If you would like to build your business plan using the same framework that Executive Partners applies to every candidate placement, the [Business Plan Simulator](/en/bp-simulator) will walk you through each section and generate a structured output you can take directly into your next conversation.`,
-  },
-  {
-    slug: "how-to-calculate-aum-portability",
-    title: "How to Calculate Your AUM Portability: The Framework Private Banks Don't Share With You",
-    date: "2026-05-21",
-    summary: "Most business plans in private banking are built backwards. This is the six-block framework that reveals what will actually move — and what won't.",
-    pillar: "P2",
-    linkedinUrl: "",
-    markets: ["CH", "UK", "UAE", "ASIA"],
-    featured: true,
-    keywords: ["AUM portability", "private banker business plan", "relationship manager lateral move", "how to calculate AUM portability", "RM break-even timeline", "portable book private banking"],
-    body: `How to Calculate Your AUM Portability: The Framework Private Banks Don't Share With You
-
-There is a conversation that happens in every serious lateral move in private banking, and it almost never happens honestly. A relationship manager sits across from a hiring committee, states a number: CHF 400 million, CHF 600 million, sometimes more. The room nods. Nobody challenges it directly. Nobody asks the questions that would actually reveal whether those assets will follow. And then twelve months later, when the ramp is tracking at thirty percent of the business plan, everyone acts surprised.
-
-The number is not the problem. The framework behind the number is.
-
-After more than two decades placing senior relationship managers across [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), [London](/en/markets/london), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore), and Hong Kong, I have seen the same pattern repeat itself with remarkable consistency. Banks underwrite portability on optimistic assumptions. RMs overstate what will move because they believe their own narrative. And the gap between what was promised and what arrives becomes the defining fact of a relationship that was supposed to be transformative.
-
-This article is an attempt to give relationship managers, and the institutions considering them, a more honest framework for thinking about portability before anyone sits down at a negotiating table.
-
-## Why the Standard Business Plan Fails
-
-The conventional business plan in private banking is structured backwards. It starts with a target. Usually whatever number the hiring bank needs to justify the package. Then it works down to a justification. AUM is stated. A transfer percentage is applied. A revenue figure is projected. The document is formatted, the assumptions are buried, and the deal gets done.
-
-The problem is that portability is not a percentage. It is an outcome shaped by at least six distinct variables, each of which can independently collapse the number. Treating it as a single figure. Seventy percent of CHF 500 million. That is not analysis. It is a rounding error dressed up as a forecast.
-
-The framework that Executive Partners uses to assess portability breaks the question into six blocks. Each block addresses a different dimension of the risk. Together, they produce a score that reflects not just what an RM claims to manage, but what they can credibly expect to move, and when.
-
-## Block One: AUM Composition and Wallet Share
-
-The first question is not how much the RM manages. It is how much of each client's total wealth they manage.
-
-An RM with CHF 400 million in AUM and an average wallet share of sixty percent has a very different portability profile from one with CHF 400 million and an average wallet share of fifteen percent. In the first case, the RM is the primary banking relationship. The client's financial life runs through them. In the second, they are one of several institutions the client uses, and the relationship is transactional rather than structural.
-
-Wallet share is the single most predictive variable in portability analysis, and it is almost never disclosed in a standard business plan. When assessing your own book, the honest question is not what you manage, but what proportion of each client's investable assets sits with your current institution. For most RMs, the answer is lower than they think.
-
-The second dimension within this block is concentration. A book of CHF 400 million spread across eighty clients transfers very differently from the same AUM concentrated in twelve relationships. Concentration creates fragility. The loss of two or three anchor clients can destroy the business case entirely. But it also means that securing those relationships before departure is both possible and decisive.
-
-## Block Two: Revenue Quality
-
-AUM is a stock. Revenue is a flow. And it is the flow that banks actually underwrite.
-
-A relationship manager with a high-AUM, low-revenue book, typical of clients who hold predominantly cash, fiduciaries, or conservative fixed income, will generate a very different return on assets than one whose clients actively trade, hold structured products, or delegate discretionary mandates. The difference can be a factor of three or four on identical AUM figures.
-
-Revenue quality also determines how quickly a book becomes self-sustaining at a new institution. A discretionary book, once transferred, begins generating revenue almost immediately. A more transactional book requires the client to actively re-engage. To take positions, accept ideas, rebuild trust with a new product shelf. That process takes time before it contributes meaningfully to the P&L.
-
-When building an honest portability assessment, the starting point is your current revenue per AUM, sometimes called return on assets or ROA. The industry average in Swiss private banking sits between forty and sixty basis points on managed assets. Anything materially above or below that benchmark deserves explanation.
-
-## Block Three: Relationship Depth and Past Portability
-
-The most reliable predictor of whether clients will follow an RM is whether they have done it before.
-
-An RM who has made a previous lateral move and retained seventy percent of their book is demonstrating something that no business plan projection can replicate: revealed preference. Their clients chose them over the institution. That is the strongest signal available.
-
-Conversely, an RM who has never moved, or who joined their current bank as a graduate and built their book from within the institution's infrastructure, faces a genuinely unknown variable. The clients may have been introduced by the bank, may rely on the bank's brand for their own counterparty relationships, or may simply have no loyalty to the individual beyond the convenience of inertia.
-
-Relationship depth is assessed through several proxies: the tenure of client relationships, the frequency of direct contact, whether clients know the RM's personal contact details, and whether the RM has ever referred clients to other institutions for products their current bank could not provide. The last point is particularly telling. An RM who has occasionally said to a client "we cannot do this here, let me introduce you to someone who can" has demonstrated that their relationship is not captive to the institution. That kind of generosity is, counterintuitively, one of the strongest portability indicators available.
-
-## Block Four: EAM Exposure
-
-External asset managers represent a specific and underappreciated portability risk.
-
-When a portion of an RM's book is sourced through or managed in conjunction with an EAM, the beneficial ownership of that relationship becomes genuinely ambiguous. The EAM may have introduced the client. The EAM may hold the client's primary advisory relationship. The EAM may have contractual arrangements with the current booking institution that restrict transfer. In some cases, the EAM will simply direct the assets to whichever institution offers the most favourable terms. Terms that have nothing to do with the RM.
-
-In practice, EAM-sourced AUM should be treated as non-portable in a base case and potentially portable in an upside scenario. Presenting it as fully transferable without a clear account of the EAM's incentives and existing contractual relationships is the fastest way to destroy credibility with a sophisticated hiring committee.
-
-## Block Five: Legal Constraints
-
-Non-compete clauses, non-solicitation agreements, and garden leave provisions are the most underestimated element of any lateral move in private banking.
-
-Swiss law is more permissive than most jurisdictions in this area. Non-compete clauses are enforceable only under specific conditions and for limited periods. But the practical effect of a six-month garden leave combined with a formal non-solicitation undertaking can reduce first-year portability by forty percent or more. Clients do not wait indefinitely. Relationships cool. New RMs are assigned. Inertia, which was working in your favour before departure, begins working against you.
-
-Any honest portability assessment must account for the legal situation explicitly. What does the employment contract say? What is the notice period? Is there a garden leave provision, and has the employer historically enforced it? Has the employer initiated legal action against former employees who moved to competitors?
-
-These are not hypothetical questions. They are the variables that determine whether a business plan is executable.
-
-## Block Six: Motivation and Timing
-
-The final block is the one that banks most consistently neglect, because it is the hardest to quantify. But it is often the most decisive.
-
-An RM who is moving because they have lost confidence in their current institution's strategy, because a key client has asked them to move, or because a specific platform capability is unavailable at their current bank, has a fundamentally different portability profile from one who is moving primarily for compensation. In the first set of cases, the RM has a narrative. One they can share with clients, one that positions the move as rational and even client-driven. In the second case, they have a problem. Clients are sophisticated. They understand when a move is about money, and it colours their willingness to follow.
-
-Timing matters equally. An RM who initiates a move at the beginning of a client lifecycle, when relationships are deepening, when assets are growing, when trust is being built, will retain more than one who moves at the end of a cycle, when clients are consolidating, reducing risk, or considering inter-generational transfer to family members who have no relationship with the RM at all.
-
-## What a Credible Portability Number Looks Like
-
-Applying these six blocks honestly to a CHF 500 million book typically produces a number between CHF 150 million and CHF 320 million in year one, depending on the composition of the book and the legal situation. That range is not pessimism. It is realism. And it is the range that sophisticated private banks model internally, regardless of what appears in the business plan they receive.
-
-The RMs who survive and thrive in lateral moves are not the ones who overstated their book and spent three years trying to close the gap. They are the ones who understood their own portability clearly enough to have an honest conversation before the offer was made, and who chose a platform that gave their clients a credible reason to follow.
-
-If you would like to apply this framework to your own book before your next conversation, the Executive Partners [Portability Score](/en/portability) walks through each of these six dimensions and produces a structured assessment you can use as the basis for a business plan that will withstand scrutiny.`,
-  },
-  {
-    slug: "the-emotional-strategist",
-    ogImage: "/og-articles/og-the-emotional-strategist.jpg",
-    title: "The Emotional Strategist",
-    date: "2026-05-18",
-    summary: "When AI handles the analysis, the relationship manager is left with the only thing that ever actually mattered. The conversation the machine cannot have.",
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    linkedinUrl: "https://www.linkedin.com/pulse/emotional-strategist-gil-m-chalem",
-    markets: ["CH", "UK", "UAE", "ASIA"],
-    body: `There is a scene playing out in private banking boardrooms across [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), and [Singapore](/en/markets/singapore) right now that tells you everything you need to know about where this industry is heading. A bank's leadership team gathers to review the deployment of its new AI advisory stack. The system is impressive: it monitors live portfolios, surfaces next-best-action recommendations in real time, flags compliance anomalies before they become problems, and prepares a meeting agenda for each client interaction in about half the time a senior analyst used to spend doing the same job. The room is pleased. And then someone asks the question that nobody has a clean answer to: if the machine does all of that, what exactly is the relationship manager there to do?
-
-The answer, it turns out, is the only thing that has ever actually mattered. And it is the one thing the machine cannot do at all.
-
-The shift that is redefining private banking in 2026 is not the one the technology vendors are selling. The story they tell is one of efficiency gains, of agentic AI systems that can execute complex multi-step workflows autonomously, of advisor desktops that eliminate friction and surface insight on demand. Nearly 70 percent of banking firms now deploy agentic AI models to support their advisory functions, delivering real-time recommendations and continuously monitoring for compliance risks across client portfolios. A purpose-built AI assistant for a top-ten investment management firm, designed to review advisor profiles and meeting notes and generate personalised agendas, cut meeting preparation time by up to 50 percent, saving an estimated 20,000 hours a year across the organisation. These are not marginal improvements. They represent a genuine restructuring of how advisory work gets done.
-
-But the more interesting story, the one worth paying attention to if you are an RM trying to understand what your career looks like in five years, is what that restructuring exposes. When you remove the data aggregation, the research synthesis, the portfolio monitoring, the compliance preparation, and the administrative overhead from the relationship manager's working day, you are left with a residue. And that residue is the whole job.
-
-Oliver Wyman describes this as the rise of the Unified Client Brain: a consolidated intelligence layer that integrates a client's relationships, global assets, lifestyle preferences, and risk appetite into a single real-time picture accessible to the advisor before any conversation begins. The practical effect is that the RM walks into every client meeting already knowing the technical picture. Which means the meeting itself is no longer about the technical picture. It is about everything else. The family succession conversation that has been deferred for three years because the patriarch finds it uncomfortable. The son who has different values from his father and is being handed a portfolio structured around assets he does not believe in. The client who is considering moving a significant portion of their book to [Dubai](/en/markets/dubai) and has not yet told their banker in Geneva. These are not analytical problems. They are human ones. And they require a set of skills that no model, however capable, is currently equipped to develop.
-
-The private banking industry has spent the better part of the last decade trying to convince itself that the relationship manager role is primarily a technical one dressed up in soft skills. The logic was understandable: you could measure a portfolio's performance, you could benchmark a banker's AUM growth, you could count the number of products cross-sold. What you could not easily measure was whether a client trusted their banker with the conversations that mattered most. So the industry defaulted to measuring what it could, and it hired, trained, and promoted accordingly.
-
-The result is a cohort of senior private bankers who are genuinely excellent at managing portfolios and genuinely uncomfortable with the conversations that now constitute their entire value proposition. This is not a criticism. It is a structural problem that the industry created by treating relationship management as a sales function rather than a counselling one. And it matters now because AI is about to expose it at scale.
-
-UBS has been among the most candid about what this transition actually looks like in practice. The bank's Operating Head for Southeast Asia described the firm's approach at a wealth management forum in Singapore earlier this year: the focus is not on replacing relationship managers, but on augmenting their capabilities to the point where every interaction carries more substance. What is implicit in that framing is that augmentation only works if the underlying human capability is there to be augmented. If the RM's primary contribution was always research and data synthesis, then giving them an AI that does that faster does not augment them. It replaces them, quietly, while leaving their job title intact.
-
-This is the uncomfortable reality sitting beneath the industry's enthusiasm for its own technological transformation. The banks that are investing most heavily in AI infrastructure are simultaneously raising the bar for what it means to be a relationship manager. They are not reducing headcount in the client-facing function, at least not yet. They are changing what they need from those people. And many of the bankers currently in those seats were never hired, trained, or developed for what is now being asked of them.
-
-The profile of a client who actually needs an emotional strategist is not difficult to sketch. It is, in practice, the majority of the UHNW client base. The global ultra-high-net-worth population is projected to grow to around 587,650 people and control approximately 68 trillion dollars by 2028. Baby Boomers currently hold 44.5 percent of that wealth share. By 2040, that cohort will largely have handed the stewardship of those assets to the next generation of inheritors. That transition is not primarily a financial event. It is a human one.
-
-In Europe's high-net-worth segment alone, nearly 3.2 trillion euros will transfer from one generation to the next in the coming years. Globally, the scale of this intergenerational movement of capital runs into tens of trillions over the next two decades. Research consistently shows that inadequate succession planning is one of the principal causes of intergenerational wealth erosion, not poor investment performance, not adverse market conditions, but the failure to manage the human complexity of passing something of enormous value from one generation to the next.
-
-The conversation that needs to happen around that transfer is not about asset allocation. It is about values, about family governance, about who gets a seat at the table and who does not, about what the wealth is for. And the banker who sits across from that family and has spent their career becoming expert at portfolio construction and product knowledge is, in the most polite possible framing, underprepared.
-
-None of this is an argument that technical competence no longer matters. A relationship manager who cannot read a structured product term sheet or explain the mechanics of a Lombard facility or have an intelligent conversation about alternatives allocation is not going to survive in this business regardless of how empathetic they are. The point is sequencing. Technical credibility is the entry ticket. It gets you through the door. But it stopped being the differentiator years ago, and the clients who matter most have known this for some time.
-
-What UHNW clients in the Middle East have described to their bankers is instructive: these clients seek senior-level advice, clarity of execution, and institutional capability. But what they are actually weighing when they decide whether to deepen or end a relationship is something more elemental. They want to feel that their banker understands not just their portfolio, but their situation. That is a different thing entirely. A portfolio is a set of numbers. A situation involves a family, a history, a set of pressures and ambitions that no algorithm has been trained to hold.
-
-The banks that will win the talent war over the next five years, and the individual bankers who will build practices worth building, are those who understand this not as a soft observation about client service, but as a structural shift in what private banking is fundamentally for. The machine will handle the analysis. It will do it faster, more accurately, and with fewer errors than any human team. That is not a threat to the profession. It is a clarification of it.
-
-The relationship manager who thrives in this environment is not the one who knows the most. It is the one who listens best. Who can hold a difficult conversation without flinching. Who can sit with a client at the moment of genuine uncertainty, a death, a divorce, a business exit gone wrong, a child who is not who the parent hoped they would be, and be genuinely useful rather than merely present. That is the job now. And it turns out it always was.
-
-The firms deploying AI most aggressively are not reducing their need for exceptional relationship managers. They are raising the standard for what exceptional looks like.
-
-Gil M. Chalem, Managing Partner, Executive Partners`,
-  },
-
-  {
-    slug: "the-last-wave",
-    ogImage: "/og-articles/og-the-last-wave.jpg",
-    title: "The Last Wave",
-    seoTitle: "UBS Integration Final Phase: Why Senior Private Bankers Are Leaving Now",
-    seoDescription: "UBS says the Credit Suisse integration is complete. The senior private bankers still inside know the final redundancy phase is just beginning — and the exit window is narrowing.",
-    date: "2026-05-12",
-    summary: "UBS has declared the Credit Suisse integration a success. For the private bankers still inside as H2 2026 begins, the most consequential chapter is the one starting now.",
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    linkedinUrl: "https://www.linkedin.com/pulse/last-wave-gil-m-chalem",
-    markets: ["CH", "UK", "US"],
-    body: `In March 2026, UBS completed the migration of former Credit Suisse Swiss-booked clients onto its platforms and declared the milestone a success. The press release was clean. The numbers were solid. A net profit of three billion dollars in the first quarter alone.
-
-If you work in Swiss private banking, you were forgiven for reading all of this and feeling that the story was, finally, over.
-
-It is not over. In fact, for the people who matter most to this industry, the relationship managers, the market heads, the senior bankers sitting on books built across fifteen or twenty years, the most consequential chapter is the one beginning now.
-
-Here is the arithmetic that the press releases do not lead with. When UBS absorbed Credit Suisse in March 2023, it absorbed approximately 45,000 employees overnight. The combined headcount peaked at just under 120,000. Three years later, the bank has reduced its workforce by around 15,000 people. The internal target, never publicly confirmed but reported consistently by Bloomberg and the Financial Times, was always 35,000. That means UBS needs to remove roughly 20,000 more positions to reach the headcount the integration was always designed to achieve. Ermotti himself told reporters in February that the majority of Swiss job reductions would land in the second half of 2026. That is now.
-
-The clients have been migrated. The systems are being switched off. The people are next.
-
-To understand why this matters specifically for private banking, you need to understand what the last three years actually looked like from the inside. Not from the investor presentations, but from the desk.
-
-When UBS took over Credit Suisse in 2023, the immediate assumption in the market was that a wave of senior banker departures would follow almost immediately. Citi analysts predicted that Credit Suisse could lose roughly a fifth of its wealth management assets in the transition, with worst-case scenarios pointing toward a third. Competitors sharpened their pencils. Julius Baer, Pictet, Lombard Odier, EFG, Vontobel: every serious private bank in [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich) anticipated an extraordinary recruiting window.
-
-What actually happened was more complicated. Some bankers moved. Some assets followed. But the wave that everyone anticipated never arrived at the scale or speed that the market expected. The reasons were structural and, in retrospect, predictable.
-
-UBS moved quickly to implement retention packages for front-office talent it wanted to keep. The uncertainty of the integration paradoxically suppressed natural attrition: bankers who might have tested the market in a normal year chose to wait for clarity on their role, their team, their client book classification. People were staying put not out of loyalty, but out of paralysis. When your institution is being reassembled around you, the rational move is often to wait and see whether you are inside or outside the new structure.
-
-The result is three years of suspended animation for thousands of private bankers in Switzerland. Three years of client conversations that began with reassurance and continued with uncertainty. Three years of competitors who wanted these bankers but could not pry them loose from a bank that had not yet decided what to do with them.
-
-That period is ending.
-
-The timing matters in a way that is specific to private banking and rarely discussed in the coverage of this integration. The UHNW client migration, the most senior, most relationship-sensitive, most portable tier of the former Credit Suisse wealth book, was the last to be completed. Reuters reported in late 2025 that UBS had delayed the transfer of some ultra-high-net-worth clients after earlier transfers of less affluent segments revealed operational issues. The delay was prudent. These are the clients where one bad conversation, one system error, one week of not knowing who to call, can cost the bank the relationship permanently.
-
-But consider the sequence from the perspective of a senior Credit Suisse private banker who survived the integration, kept their book broadly intact through the transition, and has spent three years telling clients that the platform migration will be smooth and that everything will be fine. That banker's clients have just, finally, landed on the new system. The relationship is at its most sensitive. The client is watching to see whether the reassurances were warranted.
-
-And now comes H2 2026. The job cuts. The restructuring. The moment that UBS reaches for the headcount reduction it has been deferring since 2023.
-
-What happens to the client relationship when the banker who nursed them through three years of uncertainty disappears in a restructuring wave six weeks after the platform migration? What does "better than expected retention" look like when measured not against Q1 2026 but against Q4 2026, once the cuts have landed and the banker is gone?
-
-I have been asked this question, in various forms, by senior bankers across Geneva and Zurich throughout this integration. The honest answer is that nobody knows yet. The client migration data that UBS is reporting with quiet satisfaction today is a snapshot taken before the most disruptive personnel changes have occurred. The real retention test has not started.
-
-For the market around UBS, the question now is whether what did not happen in 2023 happens instead in 2026, and on what terms.
-
-The dynamics are different. In 2023, a banker leaving UBS in the immediate aftermath of the rescue carried a story: involuntary redundancy, merger disruption, no fault attached. The market understood and the conversations were straightforward. In 2026, a banker leaving UBS three years into the integration carries a more complicated narrative. Were they pushed? Did they choose to go? What does it say about their performance over the integration period that they are only now exiting? These are the questions that a sophisticated hiring team at a competitor will ask, and they require honest answers.
-
-For candidates, the non-compete and non-solicitation landscape has also evolved since 2023. Swiss banking employment agreements have not gotten looser in three years. A banker who signed a retention package in 2023 or 2024 may now be unwinding deferred compensation structures at the same moment they are trying to negotiate a move. The mathematics of leaving are more complex than they were.
-
-And for clients, the experience of a third disruption, first the Credit Suisse crisis, then the UBS takeover, now a restructuring exit by the banker they kept faith with, is genuinely different from the disruption of 2023. Some will absorb it. Others will use it as the moment to diversify custody, restructure their banking relationships, or move to an EAM structure they have been contemplating for years. The client movement that the Swiss private banking market has been anticipating since March 2023 may finally arrive, three years delayed, and concentrated into a much shorter window.
-
-The beneficiaries are likely to be the same institutions that were watching in 2023: the mid-sized Swiss private banks with genuine UHNW capability, the EAM sector, and the international platforms that have been building out their Swiss offerings precisely in anticipation of this moment. What changes is the urgency on both sides. Bankers who spent three years waiting now have a deadline. Competitors who spent three years waiting now have a window that will not stay open indefinitely.
-
-There is a phrase that has appeared in nearly every UBS communication about the Credit Suisse integration since 2023: better than expected. Client retention: better than expected. Cost savings: on track, better than expected. It is the language of a bank that has been managing investor confidence through an extraordinarily complex and public three-year process, and that management has largely worked.
-
-What it has also done is create a gap between the official narrative and the private banking reality on the ground. In twenty years of placing senior bankers across Geneva, Zurich, [London](/en/markets/london), [Dubai](/en/markets/dubai) and [Singapore](/en/markets/singapore), I cannot recall a period in which so many excellent professionals have spent so long in professional suspension, unable to move freely, telling their clients one thing and privately thinking another.
-
-The integration is nearly complete. The systems are aligned. The client accounts have moved. UBS is reporting strong profits and will substantially finish this process by year end. All of this is true.
-
-But for the private bankers still inside the institution as H2 2026 begins, and for the clients they have been managing through three years of disruption, the last wave of this integration is the one that will actually determine what the story meant. Not for the shareholders. For the people.
-
-That part has not been written yet.
-
-Gil M. Chalem, Managing Partner, Executive Partners`,
-  },
-
-  {
-    slug: "switzerland-running-out-banks",
-    title: "Switzerland Is Running Out of Banks",
-    seoTitle: "Switzerland Is Running Out of Private Banks — What the Consolidation Means",
-    seoDescription: "Swiss private banks are consolidating faster than at any point since 2008. The count is shrinking, the platforms are merging, and the talent implications are significant.",
-    date: "2026-05-05",
-    markets: ["CH", "UK", "UAE", "ASIA"],
-    summary: "Why that should worry the people who run them and not the people who own them. Swiss private banking is consolidating at a pace not seen since the 1970s — and the franchise walks out of the building every evening at six.",
-    linkedinUrl: "https://www.linkedin.com/pulse/switzerland-running-out-banks-gil-m-chalem--5lyse/",
-    featured: true,
-    engagementScore: 95,
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    keywords: ["Swiss private banking consolidation", "FINMA licence", "private bank M&A 2026", "Swiss banking talent shortage"],
-    body: `Three hundred and twenty-six. That was the number of licensed banks in Switzerland in 1987. Today, the figure stands at roughly two hundred and thirty-seven across the entire banking system, of which approximately ninety-five are FINMA-authorised private banks. KPMG, in its most recent industry outlook, projects the Swiss private banking population will fall to fifty institutions or fewer within the decade. Fifteen to twenty percent of remaining boutiques those managing less than five billion francs are expected to seek a merger partner or an exit by the end of 2026 alone.
-
-This is the story everyone in the industry is half-aware of and almost nobody is willing to talk about with the candour it deserves. The Swiss private banking landscape is consolidating at a pace not seen since the 1970s. The conventional reading is that this is a slow-motion tragedy for the smaller institutions and a long-running tailwind for the larger ones. That reading is partially correct and almost entirely beside the point.
-
-The point, the one I make to candidates and clients in equal measure, is this: consolidation does not redistribute talent. It concentrates it. And in private banking, the people who own the banks are not the people who own the franchise. The franchise is the senior relationship manager, and the relationship manager has never been more valuable, more scarce, or more carefully fought over than today.
-
-## The arithmetic of the squeeze
-
-To understand why Switzerland is shedding banks at this pace, follow the cost stack. The OECD Pillar Two global minimum tax, in force since January 2024, has compressed net margins for Swiss private banks by between two and three hundred basis points. The revised Banking Act, implementing the Basel III finalisation provisions, requires mid-sized Zurich private banks to hold an additional two to three billion francs in Tier 1 capital. UBS alone has been required to lock up an extra fifteen billion francs in loss-absorbing capacity by the end of 2026. The combined effect of these regulatory layers, on top of the standing pressure from the global minimum tax, is to grind margins on every franc of assets under management lower than at any point in the modern history of Swiss private banking.
-
-Then there is technology. Swiss private banks collectively allocated roughly four point eight billion francs to technology investment in 2024, with Zurich institutions absorbing about sixty percent of that spending. A boutique with three billion francs of assets under management, generating perhaps thirty million in annual revenue, simply cannot fund the platform investment, the cybersecurity remediation, the compliance technology stack, and the AI-driven advisor tooling that the larger institutions now deploy as a matter of course. The cost of running a credible private bank has moved structurally above the revenue capacity of the small ones. That gap is what is driving the consolidation, and it is not closing.
-
-Julius Baer's quiet decision in December 2025 to issue notices to clients below its minimum relationship threshold top up or exit was the visible end of a much deeper repositioning across the industry. Below CHF 500,000 of investable assets, the fee income from custody, management, and transactions does not cover the cost of a relationship manager. Below CHF 1 million, it does not justify a senior one. The consolidation we are watching is not just bank-on-bank. It is the simultaneous shedding of every client whose economics no longer work. The industry is concentrating at both ends at once.
-
-## The deals that are happening
-
-The transactions of the last eighteen months map this dynamic with unusual precision.
-
-In mid-2025, Gonet completed its acquisition of ONE Swiss Bank, creating a consolidated [Geneva](/en/markets/geneva)-[Zurich private banking](/en/markets/zurich) group operating under the Gonet brand. Two months later, in July 2025, Group Banque Richelieu owned by the Beirut-based Société Générale de Banque au Liban completed the acquisition of Kaleido Private Bank in Zurich, previously controlled by the Baltic group Citadele, and rebranded it Banque Richelieu Switzerland. The transaction brought Richelieu's group AUM to roughly ten billion euros.
-
-Most strikingly, in 2025 EFG International acquired the share capital of Cité Gestion SA, the Geneva-based independent private bank, in what KPMG called the largest Swiss private-banking deal in more than a decade. The strategic rationale, in the words of Christophe Utelli, then-CEO of Cité Gestion, was to expand international reach, client segments, product offering, and technology capabilities exactly the four cost stacks a sub-five-billion boutique cannot fund alone. EFG, for its part, ended 2025 with record assets under management of one hundred and eighty-five billion francs, net new assets of eleven point three billion at a six point eight percent annualised growth rate, and a record IFRS net profit of three hundred and twenty-five million francs. The acquirer is not buying because it is desperate. It is buying because it can.
-
-The cautionary counterpoint is MBaer Merchant Bank. FINMA revoked the bank's licence on 6 February 2026, with the liquidation order becoming legally binding on 27 February. Three weeks later, on 26 February, the US Treasury's FinCEN proposed naming MBaer a primary money laundering concern under Section 311 of the USA PATRIOT Act, alleging that the bank had funnelled over one hundred million dollars through the US financial system on behalf of actors linked to Iran, Russia, and Venezuela. MBaer held four point nine billion francs in client assets and roughly seven hundred client relationships at the moment its licence was revoked. In the consolidation cycle that has just begun, there are buyers, there are sellers, and there are institutions that simply disappear. Investors and clients should be clear-eyed about which category their counterparty sits in.
-
-## The talent paradox no one expected
-
-The intuitive expectation, when an industry consolidates this aggressively, is that it should release talent into the market. Bankers leave their absorbed institutions. Compensation falls as supply outstrips demand. Hiring becomes easier. The recruiter's life becomes simpler.
-
-The opposite is true. Senior relationship manager searches that I and my peers used to close in four months before the pandemic now routinely take eight to eleven. Time-to-fill for executive private banking roles in Zurich has stretched from sixty-eight days to ninety-four days in a single year. Compensation for senior bankers in Zurich and Geneva has continued to rise, with signing bonuses for [portable book](/en/portability)s in the order of forty percent of base salary now well within the normal range even as institution-level profitability across the industry has compressed.
-
-The mechanism is straightforward once you sit with it. The UBS-Credit Suisse integration, far from disgorging talent, consumed it. UBS retained roughly twelve thousand headquarters staff in Zurich and absorbed the former Credit Suisse private banking operations across Paradeplatz and Oerlikon, principally to prevent client attrition during the integration. The professionals who do leave consolidating institutions tend to be operations staff, generalists, and junior advisors. The senior relationship managers with established UHNW client books the only people who actually move the franchise economics are precisely the people the acquiring institutions move heaven and earth to retain.
-
-The numbers underwrite this logic. A relationship manager with a CHF 2 billion client book represents, depending on margin assumptions, somewhere between fifteen and twenty-five million francs of recurring annual revenue. The cost of losing that book to a competitor, factoring in client attrition during the transition, dwarfs the cost of a forty percent signing bonus or a multi-year retention package. Institution-level economics may be deteriorating. Individual senior banker economics, particularly for those with portable AUM, are improving on every dimension that matters: scarcity, leverage, optionality, and price.
-
-This is the paradox: the more banks disappear, the more valuable each remaining senior banker becomes. Consolidation does not solve the talent shortage. It deepens it.
-
-## Where Geneva and Zurich now sit
-
-There is a final dimension to the current moment that deserves attention, because it cuts across the consolidation story in a way most analysts have not yet fully appreciated.
-
-For three years, the dominant talent corridor in private banking ran from Geneva and Zurich to Dubai. Switzerland lost roughly forty-five experienced private banking professionals to the UAE in 2023 and 2024 alone, drawn by zero personal income tax, faster onboarding, and proximity to the new wave of UHNW migration out of Russia, the UK, [Hong Kong](/en/markets/hong-kong), and parts of South Asia. Swiss banks responded by accelerating their [DIFC](/en/markets/dubai) and ADGM presences. The narrative was that the Gulf was the new Geneva. For a moment, it was not entirely wrong.
-
-That corridor is now reversing. The US-Israeli air campaign against Iran, the partial closure of the Strait of Hormuz, and the missile and drone attacks on UAE, Bahraini, Qatari, Kuwaiti, and Jordanian targets have done in three months what no marketing campaign by Swiss banks could have done in three years. Bloomberg has reported a wave of Asian families actively reducing their UAE exposure and exploring Hong Kong and [Singapore](/en/markets/singapore) as alternatives. Wall Street firms Goldman Sachs, Morgan Stanley, Citigroup have offered Gulf-based staff the option to relocate temporarily. The hedge fund Millennium is evaluating Jersey and other low-tax jurisdictions for transfers out of Dubai. The premium that Swiss private banking has always charged for neutrality, regulatory stability, and physical distance from any active theatre of war has not been this commercially valuable since 2022.
-
-What this means for the consolidation cycle is straightforward. The institutions that survive the next eighteen months will be the ones positioned to absorb a returning wave of UHNW relationship books Asian, Russian-CIS, Levantine, Israeli that were until very recently being booked in Dubai. That capacity exists at the consolidating mid-tier: EFG post-Cité Gestion, UBP, Mirabaud, Edmond de Rothschild, J. Safra Sarasin, Bergos. It does not exist at the boutiques sub-five-billion. It exists at UBS, but at a scale that makes UHNW relationship attention a structural problem rather than a structural opportunity. The middle, in other words, is winning.
-
-## What this means for the people who run banks
-
-Three implications matter for the practitioners reading this newsletter.
-
-First, for relationship managers sitting in boutiques below five billion francs of assets, the next eighteen months are asymmetric. There are essentially two outcomes. Either your institution becomes a target, in which case the acquirer will move to retain you with a package designed to keep your book in place and the leverage you have at that moment is the highest it will ever be. Or your institution slowly contracts, sheds clients quietly, and at some point in 2027 or 2028 the difficult conversation arrives. The decision worth making today, calmly and on your own timing rather than under duress, is which of those two scenarios you are in. Boutique RMs who wait passively for the merger to find them will negotiate from a worse position than those who have explored the market in advance.
-
-Second, for senior bank leadership, the strategic question is no longer whether to participate in the consolidation. The question is which side you are on. Acquirers are extending their distribution, market coverage, and technology platforms by buying. Targets are recognising they cannot fund the cost stack and are preserving optionality by negotiating from strength rather than from compliance with FINMA. The institutions that will fare worst over the next thirty-six months are those that have decided to do neither to neither acquire nor be acquired, but to grind through organic growth in a market where organic growth at sub-scale is mathematically a losing proposition. That posture is not a strategy. It is a stay of execution.
-
-Third, and this is where my professional bias is most explicit, the institutions that will win the talent war over the next eighteen months are the ones that go after individuals proactively rather than waiting for CVs to arrive. The senior relationship manager with a portable book of one billion francs and above is not on the open market. They will not respond to a job posting. They are not visible to a generalist HR function. They are reachable only through targeted, confidential, peer-level outreach and they are now being approached, simultaneously, by acquiring banks with retention packages, by mid-tier institutions with growth ambitions, by single- and multi-family offices building out, and by EAM platforms with FINMA licences in hand. The people who matter have never had more options. The institutions that compete for them have to compete on substance: brand, platform, governance, succession path for the book, and the quality of the conversation about what private banking will look like in five years. The signing bonus is the floor. It is no longer the ceiling.
-
-## The number that matters
-
-Three hundred and twenty-six in 1987. Roughly ninety-five today. Possibly fifty by 2030.
-
-The simplest reading of those numbers is that Swiss private banking is shrinking. The more accurate reading is that it is concentrating, and that concentration is widening sharply the gap between the institutions that matter and the institutions that are gradually being managed out of existence. That gap, more than any other factor, is what determines where the careers, the AUM, and the next decade of franchise value will sit.
-
-The senior relationship manager who reads this and concludes that scarcity is on their side is correct. The institution that reads this and concludes it must move now, decisively, on both its M&A posture and its talent strategy is also correct. The boutique owner who reads this and waits another year to have the conversation will discover, when they finally have it, that the buyers have moved on, the bankers have moved on, and the option to be part of the consolidation rather than collateral damage from it has quietly closed.
-
-In private banking, the people who own the banks are not the people who own the franchise. The franchise walks out of the building every evening at six. Where it walks back in tomorrow morning is the only question that actually matters.`,
-  },
-  {
-    slug: "wall-street-7000-pump-5",
-    ogImage: "/og-articles/og-wall-street-7000-pump-5.jpg",
-    title: "When Wall Street Hits 7,000 and the Pump Hits $5",
-    date: "2026-05-04",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "The two wars your clients are living through and why the decoupling will not last. The S&P at 7,000 is the loudest financial narrative in the world right now. The pump at five dollars is the quietest. They are both telling the truth about the same war.",
-    linkedinUrl: "https://www.linkedin.com/pulse/when-wall-street-hits-7000-pump-5-gil-m-chalem--ssque/",
-    featured: true,
-    engagementScore: 94,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: ["geopolitical risk private banking", "oil price wealth management", "Iran Hormuz private banking", "S&P 7000 client portfolio"],
-    body: `On the morning of 16 April 2026, the S&P 500 closed above 7,000 for the first time in history. Eleven percent above its end-of-March nadir. The Nasdaq punched through 24,000.
-
-That same morning, the average price of a gallon of gasoline in California crossed five dollars. Brent crude was trading north of one hundred and ten dollars a barrel. Iran's blockade of the Strait of Hormuz, through which roughly twenty percent of the world's seaborne oil passes, was still in force.
-
-Two screens. Two stories. Same war.
-
-This is the most important fact about the financial markets in 2026, and almost nobody in private banking is sitting their clients down to explain it. The equity indices and the real economy have decoupled to a degree we have not seen since the early stages of the pandemic. One of those stories is wrong. Eventually, they reconcile. The job of any serious wealth manager between now and that reconciliation is to make sure their clients are not standing on the wrong side of it when it happens.
-
-## What the market is pricing
-
-Operation Epic Fury, the joint US-Israeli air campaign against Iran, began on 28 February 2026. Within days Iran had retaliated against US bases across the Gulf, struck Saudi and Qatari energy infrastructure, and shut down tanker traffic through Hormuz. The World Bank now describes the resulting disruption as the largest oil supply shock on record, with an initial reduction in global supply of around ten million barrels per day.
-
-The S&P 500 fell nine percent in March. By 16 April it had not only recovered, it had set new all-time highs. Three forces are propping up the indices, and all three are fragile.
-
-The first is concentration. Technology and AI-related names now account for roughly half of the S&P 500's total market capitalisation, and as Mark Zandi put it bluntly to CNBC, those stocks run on their own dynamic independent of anything, including the war in Iran. When fifty percent of an index is essentially a bet on AI capex, the index becomes a bet on AI capex. The second is earnings. Roughly nine out of every ten S&P 500 companies that have reported first-quarter results have beaten estimates, with aggregate EPS tracking thirteen percent above the year-ago quarter. The third, and the most dangerous, is what traders have named the TACO trade. Trump Always Chickens Out. The thesis is that if oil stays elevated long enough to threaten US gasoline at the pump, the President will pivot, declare victory, and accept whatever ceasefire is on offer. Markets are not pricing the war. They are pricing its ending.
-
-That narrative may prove right. But it is a narrative that a great deal of capital is now standing on, and the moment it cracks, the move down will be sharp.
-
-## What the pump is pricing
-
-Now look at the other screen. The World Bank's April Commodity Markets Outlook forecasts a twenty-four percent surge in energy prices in 2026, the largest annual increase since Russia's invasion of Ukraine. Brent is now expected to average eighty-six dollars a barrel for the year, with a stress scenario of one hundred and fifteen if Hormuz disruptions extend. The IMF cut its 2026 global growth forecast to 3.1 percent, lifted headline inflation to 4.4 percent, and cut the eurozone forecast from 1.4 to 1.1 percent. Its severe scenario has global growth falling to two percent.
-
-The geopolitical multiplier matters here. The same World Bank report finds that during conflict periods, oil price volatility roughly doubles, and a one percent decline in global oil production driven by geopolitical risk pushes prices up an average of eleven and a half percent. Precious metals are forecast to rise forty-two percent in 2026 as safe-haven demand surges. None of these are the price signals of a market that believes the war is nearly over.
-
-Sovereign credit tells the same story. The yield on the ten-year US Treasury has moved from 3.97 percent in late February to 4.25 percent today. Three Gulf states are reviewing how they deploy the roughly five trillion dollars sitting in their sovereign wealth funds. JPMorgan has cut its 2026 non-oil growth forecast for the GCC by 1.2 percentage points, with the UAE taking a 2.3 point downgrade the steepest in the region.
-
-## The ripple no chart shows
-
-This is where the abstraction becomes personal. The S&P at 7,000 is a number on a screen. The pump price is a number on a billboard, paid in cash, every week, by every household, every small business, every logistics operator, every airline, every farm.
-
-UK headline inflation has jumped to 3.3 percent on surging fuel prices. Germany's government has stepped in to stop service stations raising pump prices more than once a day. Inflation in developing economies is now projected at 5.1 percent for 2026, a full percentage point higher than was expected before the war. The geographic asymmetry is sharp: China, India, Japan, and South Korea together account for roughly seventy-five percent of the oil and fifty-nine percent of the LNG that flows through Hormuz. Asia is paying most of this bill.
-
-At the household level, the arithmetic is brutal. The kind of family our industry serves at the upper-mass-affluent end was already contending with a cumulative twenty-five percent rise in CPI since 2020. Add four percent inflation in 2026, with food and energy doing most of the work, and the gap between nominal portfolio gains and real purchasing power widens to a degree most clients have not consciously processed. Their statements show green numbers. Their lives feel poorer. That tension will surface in conversations with their bankers all year.
-
-## What this means for our clients, and our industry
-
-Three observations matter. First, the client base is splitting along an uncomfortable line. Tech wealth founders, partners at venture funds, executives sitting on stock comp at Alphabet or Nvidia is having one of its strongest years on record, and is essentially insulated from the war's mechanics. Energy-importing wealth European entrepreneurs, Asian industrialists, anyone whose underlying business has fuel, freight, or fertiliser as a meaningful input is not. The first cohort wants more growth exposure. The second is asking for capital preservation, hedges, gold, short-duration. The relationship managers who can read which client they have in front of them, and resist the temptation to give every client the same model portfolio because the index is at a high, will outperform their peers materially.
-
-Second, the Gulf wealth corridor is cooling fast. Bloomberg has reported a wave of Asian families actively reducing UAE exposure and exploring [Hong Kong](/en/markets/hong-kong) and [Singapore](/en/markets/singapore) as alternatives. Goldman, Morgan Stanley, and Citigroup have given Gulf-based staff the option to relocate temporarily. Millennium is evaluating Jersey for transfers out of Dubai. For Swiss banks who have invested heavily in their [DIFC](/en/markets/dubai) franchises over the past three years, this is a moment to look hard at booking centre strategy. For [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich), it may be a moment of opportunity. The Swiss private banking proposition neutrality, regulatory stability, distance from any active theatre of war has not been this commercially valuable since 2022.
-
-Third, this is the kind of macro environment in which the truly senior relationship manager earns the seven-figure compensation that the rest of the industry resents. Anyone can manage a client book in a bull market with an obvious narrative. The clients with two-, three-, five-hundred million in investable assets are not asking their bankers for a market view in late April 2026. They are asking whether the person sitting across the desk has thought hard about the divergence between the indices and the real economy, has a position on which side wins, and can articulate a portfolio that reflects that conviction.
-
-## How it ends
-
-Eventually the two stories reconcile. Either the equity market is right a ceasefire holds, Hormuz reopens, oil falls back below seventy by autumn, the indices grind higher into year-end or the oil market is right, the conflict drags into the second half, energy prices stay elevated, the IMF's severe scenario activates, and the corporate earnings underwriting this rally start being revised down quarter by quarter. In that second scenario, the indices give back not nine percent but twenty-five or thirty.
-
-I do not know which wins. I am not paid to. I am paid to remind the people who run this industry that both are live, that current pricing favours the first by a margin that does not reflect the genuine probability of the second, and that the role of a serious private banker in late April 2026 is to look every client in the eye and ask: if the second story turns out to be the right one, can your portfolio absorb it?
-
-The S&P at 7,000 is the loudest financial narrative in the world right now. The pump at five dollars is the quietest. They are both telling the truth about the same war. Only one of them can be telling the whole truth.`,
-  },
-  {
-    slug: "americans-already-here",
-    ogImage: "/og-articles/og-americans-already-here.jpg",
-    title: "The Americans Are Already Here",
-    date: "2026-04-28",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "What the UBS headlines are obscuring: the US wealth playbook has become the dominant model in Swiss private banking, arriving through three different doors — JP Morgan, Goldman Sachs, and Julius Baer's new CEO.",
-    linkedinUrl: "https://www.linkedin.com/pulse/americans-already-here-gil-m-chalem--ts3we/",
-    featured: true,
-    engagementScore: 93,
-    pillar: "P1",
-    subTheme: "Positioning",
-    keywords: ["US banks Switzerland private banking", "JP Morgan Swiss private banking", "Goldman Sachs Switzerland", "Julius Baer Bollinger strategy"],
-    body: `The Swiss financial press has spent most of the past eighteen months writing about UBS. The capital buffer debate, the CEO succession, the unwinding of Credit Suisse legacy positions: these are real stories, and they matter. They also absorb almost all the oxygen in the room. Meanwhile, in quieter corners of [Zurich](/en/markets/zurich) and [Geneva](/en/markets/geneva), a structural shift has been taking place that will matter more to Swiss private banking over the next five years than the final shape of UBS's capital ratio.
-
-The American wealth model has arrived. Not as a distant threat, not as a future scenario, but as a present reality operating through three distinct channels. And for anyone running a Swiss private bank below the UBS scale, or sitting across from a Relationship Manager with a [portable book](/en/portability) of entrepreneurs, the implications are already measurable.
-
-## The first door: JP Morgan
-
-The first door is the most visible. JP Morgan's Swiss private banking business reached USD 55.6 billion in assets under management at the end of 2024, and grew close to twenty percent in 2025 alone, with roughly half of that coming from net new money rather than market appreciation. The bank has doubled its Swiss AUM between 2020 and 2024, expanded its Zurich and Geneva headcount by thirty percent in 2025, and stated publicly through Matteo Gianini, its head of Swiss private banking, that it intends to double the business again by 2030 and more than double its headcount in the process. This is not a boutique experiment. It is an institutional build, funded and measured, with clarity about what it wants: the ultra-high-net-worth segment in Switzerland, with a strong tilt toward domestic Swiss clients and entrepreneurial wealth linked to the investment bank's global coverage.
-
-## The second door: Goldman Sachs
-
-The second door is narrower but arguably more strategic. Goldman Sachs restarted its Swiss private banking presence in 2019 after a three-year retreat, and in the years since has executed a deliberate UHNW-only strategy targeting clients with at least thirty million dollars of bankable assets. Under Stefan Bollinger, then co-head of Goldman's European wealth business and its Swiss country coordinator, the bank poached Dominique Wohnlich from Lombard Odier, Alain Krueger and Marc Mandosse from UBS, respectively the head and deputy of UBS's ultra-high-net-worth and family office business in French-speaking Switzerland, and Gabriel Aractingi from UBS's Middle East and North Africa desk in Geneva. Bollinger's stated ambition was to hire as many as thirty private bankers in Switzerland, underwritten by a hard-edged thesis: serve entrepreneurs and business owners in the window immediately after liquidity events, such as private equity disposals or initial public offerings, with an advisory proposition tightly integrated with Goldman's investment banking platform. In January 2026, Goldman reorganised its global wealth management leadership under new co-heads Nishi Somaiya and John Mallory, signalling that the build is now a structural commitment rather than an experimental tilt.
-
-## The third door: the playbook from within
-
-The third door is the one most people miss, and in some ways the most consequential. In January 2025, Bollinger left Goldman to become CEO of Julius Baer. What this means in practice is that the American playbook has not only walked into Switzerland through two US-headquartered firms, it has also walked into one of the Swiss pure-play houses from the inside. Within twenty weeks of taking over, Bollinger had restructured Julius Baer's executive board, cut hundreds of jobs, established a new Global Wealth Management Committee and a Global Products and Solutions unit, created a dedicated UHNW Competence Center, exited the Brazil onshore market, entered Italy onshore, and set out a 2026 to 2028 strategic cycle with targets of four to five percent net new money growth, an adjusted cost-to-income ratio below sixty-seven percent, and at least thirty percent adjusted return on CET1 capital. The financial metrics are conventional. The strategic lens is not. It is the lens Bollinger spent twenty years building at Goldman: segment the book ruthlessly, concentrate on UHNW where advisory depth is paid for, cut what does not scale, and wire the platform to whatever investment banking or alternatives engine sits next door.
-
-## Three doors, one playbook
-
-Three doors, one playbook. The playbook is recognisable once you name it. It prioritises clients with bankable assets above fifty million Swiss francs, or total wealth above 250 million, as Julius Baer's new UHNW definition makes explicit. It ties the advisory offering to deal flow that a pure wealth manager cannot replicate on its own: private equity co-investments, pre-IPO access, structured financing against concentrated positions, and the kind of family-office-adjacent advisory that entrepreneurs now expect. It enforces cost discipline at the back and middle office while reallocating budget to front-line advisory capacity and technology. And it accepts, without sentimentality, that the traditional Swiss model of serving every segment with the same relationship architecture no longer clears the cost of capital on either end of the book.
-
-Which raises a question that the Swiss mid-tier has not fully answered yet. What happens to a bank that is neither UBS nor a US global, neither a pure UHNW boutique nor a family-office offering, and whose comparative advantage has historically been a version of discretion, continuity and relationship depth that the new playbook treats as a given rather than a differentiator?
-
-The candid answer, based on the conversations I have with senior bankers and HR heads across Geneva, Zurich and Lugano every week, is that the squeeze is already visible in three places.
-
-It is visible in the revenue mix. Bankers who used to generate a blended return of ninety to one hundred and ten basis points on a mixed HNW and UHNW book are watching the UHNW portion of that book become more demanding and less margin-generous at exactly the moment when their institution needs the UHNW tier to subsidise the rest. The US-model firms are happy to price advisory at a premium for genuine complexity, and to decline the rest of the client's wallet if it does not fit.
-
-It is visible in recruitment economics. The deals being written for UHNW-facing senior bankers with genuinely portable entrepreneurial books have moved in the last twenty-four months. Multi-year guaranteed packages linked to gross revenue rather than a percentage of AUM, enhanced cash at signing, and structured retention vehicles that back-load payment to year three or four are now the norm at the top of the market. For the Swiss mid-tier, this is not a story they can match one for one, and it is not always desirable to try. But it is a story they have to price into their retention plans, because the bankers most targeted are also the ones most difficult to replace.
-
-It is visible in client segmentation discipline. The US-model firms are comfortable saying no to sub-UHNW relationships that used to feel like a natural part of the Swiss book. Every banker who has moved from a traditional Swiss employer to one of the US houses in the past two years describes the same experience: learning to let go of clients below the threshold, and learning that the economics actually improve when they do. The mid-tier Swiss houses, by contrast, are still carrying long tails of historical relationships that made sense twenty years ago, when booking centre fees and retrocessions disguised the true cost to serve.
-
-## What is not going away
-
-None of this is an argument that the Swiss model is finished. It is not. The independence, the booking centre neutrality, the multi-generational continuity, the ability to serve a Greek shipping family and an Italian industrial family from the same chair without conflict, these things continue to matter and will continue to command a premium. Lombard Odier, Pictet, UBP, Bordier and the other leading Geneva houses have genuine edge in segments the US banks cannot fully reach: CIS and CEE offshore, LATAM booked out of Switzerland, certain MENA structures, and the family-office-adjacent advisory for families that specifically do not want a US-licensed counterparty. The mid-cap Zurich and Basel houses have their own defensible books in German-speaking Europe and Israel. None of that is going away.
-
-What is going away is the assumption that competition comes principally from other Swiss banks of similar size. The competitive set has changed. The benchmark for what an UHNW client expects has been rewritten by firms that think about wealth management as a scalable, platform-intensive, investment-banking-linked business rather than as a trade that begins and ends with the Relationship Manager.
-
-For senior bankers thinking about where they spend the next five years, the question is no longer simply which Swiss house fits my book best. It is which platform matches the kind of client I actually want to build the rest of my career with. The answers are divergent. Some will rightly conclude that an independent Swiss boutique with a clear segment specialisation gives them more autonomy and more upside than a US global, where they would be one of fifty Managing-Director-grade bankers. Others, particularly those with entrepreneurial books tied to Swiss industry or to post-liquidity-event wealth, will find that the US model is exactly sized for what they do.
-
-For the Swiss banks themselves, the strategic clarity required is uncomfortable but necessary. Pick a segment and staff it properly. Decide whether the bank is a UHNW house, an HNW house, or a niche market specialist, and align everything behind that choice, from hiring to technology spend to retention architecture. The middle position, the one that tried to be everything to everyone below the scale of a full-service global, is the position most exposed to the playbook imported through three doors over the last five years.
-
-The headlines will keep being about UBS. That is understandable. UBS is the largest wealth manager in Europe, its capital debate is politically consequential and its leadership transitions are genuinely newsworthy. But for anyone actually running a private bank, sitting across from a senior banker considering a move, or trying to retain a UHNW book in 2026, the story worth watching is quieter and further down the league table. The Americans are already here. They came in through three different doors. And the playbook they brought with them has already become the default.`,
-  },
-
-  {
-    slug: "smoke-difc-dubai-private-banking-2026",
-    ogImage: "/og-articles/og-smoke-difc-dubai-private-banking-2026.jpg",
-    title: "Smoke Over the DIFC",
-    date: "2026-04-27",
-    summary: "Eight weeks in. A ceasefire that held for less than eight hours. And 537 intercepted ballistic missiles later — here is what we actually know about Dubai's future as a private banking hub.",
-    pillar: "P1",
-    subTheme: "Positioning",
-    linkedinUrl: "https://www.linkedin.com/pulse/smoke-over-difc-gil-m-chalem--d0lbe/",
-    markets: ["UAE", "ASIA", "CH"],
-    body: `Eight weeks in. A ceasefire that held for less than eight hours. And 537 intercepted ballistic missiles later — here is what we actually know about Dubai's future as a private banking hub.
-
-I wrote the first version of this article on the morning of April 17th, two weeks after a plume of black smoke rose over the Dubai International Financial Centre. At the time, the question was whether a single dramatic shock would change the calculus for the wealth management industry. Eight weeks later, the question has become something harder to dismiss: not what the first shock meant, but what sustained conflict has done to the assumptions on which an entire industry built itself.
-
-The Scale of What Has Happened
-
-When I wrote first about the March 13 drone strike on the [DIFC](/en/markets/dubai), I described it as the morning the narrative changed. What I did not know then was that it was also the beginning of a campaign whose scale would dwarf anything we had seen in modern Gulf history.
-
-As of April 9th, the UAE Ministry of Defence reported that its air defences had intercepted 537 ballistic missiles, 2,256 drones, and 26 cruise missiles launched from Iran since February 28th. Thirteen people have been killed and 224 injured — the majority foreign nationals and migrant workers. The Jebel Ali port, which accounts for approximately 36 percent of Dubai's GDP, has had operations repeatedly disrupted. The Fairmont The Palm on Palm Jumeirah took a direct Shahed drone strike. An Oracle cloud data centre in Dubai — home to banking infrastructure serving the entire region — was targeted by the IRGC on April 2nd. A Kuwaiti oil tanker carrying two million barrels of crude was set ablaze by an Iranian drone at Dubai Port, making headlines across the world.
-
-For anyone working in private banking who was still telling themselves this was containable tail risk, that list deserves to sit on the page for a moment.
-
-The Response Nobody Talks About
-
-The DIFC has maintained its official posture of business as usual, and to be fair to its leadership, that posture is not entirely without substance. January 2026 showed 30 percent year-on-year registration growth before the conflict began. The DIFC's institutional infrastructure is real, its client base is deep, and its governor has been consistent in messaging resilience.
-
-But two things happened in early April that tell a more honest story. First, the Dubai Financial Services Authority introduced time-limited relief measures covering licensing requirements, governance and staffing arrangements, regulatory reporting, and supervisory processes. The DFSA chief executive described these as "a bridge to the resumption of normal trading." Second, Dubai's broader government approved a AED 1 billion support package for its business sector, effective April 1st.
-
-Regulatory relief packages and emergency stimulus do not get introduced in markets where everything is functioning normally. They get introduced when the regulator needs to acknowledge, on the record, that something exceptional is happening. The DIFC is not collapsing. But the DFSA just told you, in formal regulatory language, that it is not operating as usual.
-
-The Ceasefire That Wasn't
-
-On April 8th, the United States and Iran agreed to a two-week ceasefire, mediated by Pakistan. Within hours, Iran had launched 35 drone attacks on the UAE alone. The ceasefire was violated before most bankers had booked their flights home.
-
-Bloomberg reported that hours after the announcement, an executive from an Abu Dhabi fund booked the first available return flight. A private banker and a hedge fund trader told reporters they were waiting the two weeks out before committing. A Dubai-based finance professional said they were heading back regardless — not because the situation had resolved, but because they had concluded it was unlikely to resolve any time soon, and staying away indefinitely was not a career strategy.
-
-That last response is the one I find most revealing. The question for the industry is no longer whether Dubai is dangerous. It clearly carries risk it did not carry eighteen months ago. The question is whether the people who built their careers and their client books there have any real alternative. For most of them, the answer is no. Which means the talent pool in Dubai right now is not running on conviction. It is running on inertia, residual commitment, and the absence of a clean exit.
-
-What the Information Crackdown Tells You
-
-There is one development from the past eight weeks that has received far less attention in financial media than it deserves. The UAE government has aggressively restricted independent documentation of the conflict. Dubai Police issued warnings that sharing content contradicting official announcements could lead to imprisonment of at least two years and fines of no less than 200,000 dirhams. Three survivors of a drone strike on a residential tower in Creek Harbour were arrested after sending photos of their damaged home in private messages to reassure relatives they were safe.
-
-I am not making a geopolitical argument here. I am making a business one. Dubai's entire value proposition for international wealth management rests on three things: legal predictability, operational transparency, and the confidence of foreign capital. When a government begins arresting people for private messages, and when the financial media cannot independently verify the extent of infrastructure damage because showing the damage is a criminal act, you have introduced a variable that no due diligence framework was built to handle.
-
-The Capital and the Talent
-
-The capital flight signals have deepened and confirmed. Asian wealth lawyers in [Singapore](/en/markets/singapore) report continued enquiries, with several large transfers completed. Ryan Lin, a Singapore-based private wealth lawyer, confirmed that six or seven of his twenty Dubai-based clients contacted him about asset transfers, with three actively planning moves to Singapore.
-
-On the talent side, hotel occupancy in Dubai has fallen 70 to 80 percent. More than 30,000 flights have been cancelled across the region since the conflict began. Around 250,000 short-term rental bookings were cancelled in March alone. The CNBC estimate of infrastructure and economic damage already stands at close to USD 60 billion.
-
-This is not a story of Dubai failing. It is a story of Dubai absorbing a shock whose full cost has not yet been tallied.
-
-What I Am Telling Candidates and Clients Right Now
-
-I place senior private bankers. That is my job. And right now, every conversation I have about Dubai has a section that did not exist before February 28th.
-
-For candidates considering a Dubai relocation: the opportunity remains real. The client base is not gone. The AUM has not evaporated. But the risk premium on that posting has changed, and any candidate who does not factor that into their negotiation — in terms of compensation structure, institutional backing, contract exit provisions, and the [portability](/en/portability) of their book if the situation deteriorates further — is not thinking clearly. I am advising candidates to treat Dubai today the way senior bankers treated Singapore in 2020: as a genuinely attractive market that requires a more explicit risk conversation than it did before.
-
-For hiring managers in Dubai: the war for talent in the DIFC has structurally shifted. You are no longer competing only with [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), and Singapore for the same pool of qualified RMs. You are now competing with a perception problem that will take years to fade regardless of how the conflict resolves. Packages need to reflect that.
-
-The smoke over the DIFC will clear. The question is whether the capital and the bankers come back with it.`,
-  },
-  {
-    slug: "bern-holds-line-ubs-swiss-capital-rules",
-    ogImage: "/og-articles/og-bern-holds-line-ubs-swiss-capital-rules.jpg",
-    title: "Bern Holds the Line",
-    date: "2026-04-23",
-    summary: "Inside yesterday's UBS capital rules verdict, and what every senior private banker watching from the inside should already be doing about it.",
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    linkedinUrl: "https://www.linkedin.com/pulse/bern-holds-line-gil-m-chalem--nudte/",
-    markets: ["CH", "UK"],
-    body: `Yesterday afternoon in Bern, Karin Keller-Sutter ended her press conference the way a politician ends one when she knows she has won. A journalist asked her when she planned to step down as Finance Minister. She answered that she liked to work. Then she walked off the stage.
-
-She did not say the rules would not change. She did not say parliament would not push back. She did not say UBS would not fight. She said the rules are staying.
-
-Staying. Not negotiable. Not revisited. Staying.
-
-If you are a senior private banker at UBS right now, that is the word that should be sitting on your desk this morning.
-
-What Actually Happened
-
-The Federal Council did two things on Wednesday. It enacted its final Capital Adequacy Ordinance, which it had the unilateral power to impose without parliament. And it submitted the draft amendment to the Banking Act — which governs the far larger question of capital treatment for UBS's foreign subsidiaries — to parliament for debate. The first document is now law. The second is the fight that remains.
-
-On the ordinance, Bern gave way on the details. Capitalised software will now amortise over no more than three years for regulatory capital purposes. On deferred tax assets, the Federal Council walked the original proposal back entirely and kept the treatment aligned with international standards. UBS's own statement put the net CET1 impact at approximately USD 4 billion. Below what the market was pricing. Well below the USD 10.8 billion hit analysts had feared.
-
-If you read that as a retreat, you are reading it wrong.
-
-Here is what I see from my seat in [Geneva](/en/markets/geneva). Keller-Sutter conceded on the file she controlled alone, precisely so she could harden the file she needs parliament to pass. The Banking Act amendment requires UBS to fully back its foreign participations with Common Equity Tier 1 capital, up from the roughly 60 percent threshold in force today. UBS has publicly estimated the capital gap at approximately USD 22 billion. On that question, the government has not moved one centimetre.
-
-Keller-Sutter's words at the podium were plain. Switzerland must prevent any situation in which UBS has to be wound down. She declined to call any of this a Swiss Finish. She rejected the compromise proposal tabled by a cross-party group of parliamentarians, which would have allowed Additional Tier 1 instruments to cover up to half of the foreign subsidiaries requirement. The answer is on the public record. The answer is no.
-
-The Choreography
-
-This is textbook Bern. A government that intends to hold firm on a politically sensitive measure first clears away the easier complaints so it can isolate the core one. By giving UBS a win on the technicalities, the Federal Council has disarmed the bank's cleanest argument against the ordinance. What remains on the table is the question the state was never going to negotiate.
-
-UBS issued its formal response within hours. The word "extreme" appears. Substantive commentary is deferred to the first-quarter results on 29 April, which will be Sergio Ermotti's to deliver. Between now and then, UBS will do what it has done for two years: lobby, model, remind everyone who will listen that the balance sheet is twice the size of Swiss GDP.
-
-Parliament begins its first closed-door debate on 4 May. Full debate follows in June. The legislative calendar is unlikely to close before the end of 2026. In that window, UBS will push hard for the AT1 compromise, for phased implementation, for anything that converts the 100 percent CET1 requirement into something less capital-expensive. Parliament will almost certainly dilute something. The question is what, and by how much, and whether any of it touches the principle.
-
-What This Means for You
-
-If you are a senior UBS banker watching this unfold, the second-order consequences are already in your compensation file, whether or not you have opened it.
-
-Colm Kelleher used his Basel AGM last week to do one thing unambiguously. He tied future share buybacks to the outcome of the capital rules fight. The USD 3 billion buyback planned for 2026 is now explicitly contingent on regulatory clarity. Share buybacks are the mechanism by which UBS delivers a meaningful fraction of senior compensation through equity grants. If buybacks shrink, the deferred portion of your pay shrinks with them.
-
-And succession is still frozen. Ermotti could now stay into the second half of 2027. Iqbal Khan runs Asia. Rob Karofsky runs the Americas. None of them has been anointed. The board is increasingly willing to look outside. The organisational chart that should be telling an ambitious senior banker where their career goes in 2028 is still not drawn.
-
-I have spent the last two years watching senior bankers at UBS tell me the same thing in different words. They are not unhappy. They are not angry. They are waiting. They are waiting for the capital rules to settle. They are waiting for succession to clarify.
-
-The problem with waiting is that the rest of the market is not waiting.
-
-Lombard Odier is recruiting. Pictet is recruiting. Julius Baer is recruiting. The EAMs are recruiting. The boutiques are recruiting. Morgan Stanley, JP Morgan Private Bank, Goldman Sachs Private Wealth Management — all of them are calling senior UBS bankers this week, using yesterday's news as the opening line. I know this because my phone has already rung.
-
-Bern did not compromise yesterday. Bern sequenced. The Swiss state gave a narrow concession on the file it controlled alone in order to protect the wide principle it needs parliament to pass. The ones who are modelling are also taking calls. The ones who are not are still trusting that someone, somewhere, will eventually turn the lights on.
-
-In my experience, that is not how this works.`,
-  },
-  {
-    slug: "10-billion-myth-swiss-private-banking-consolidation",
-    title: "The 10 Billion Myth",
-    date: "2026-04-21",
-    summary: "Why size is the wrong lens on Swiss private banking consolidation — and why the number that has taken on almost mythological status in the market is causing good bankers to make bad career decisions.",
-    pillar: "P1",
-    subTheme: "ScaleVsBoutique",
-    linkedinUrl: "https://www.linkedin.com/pulse/10-billion-myth-why-size-wrong-lens-swiss-private-gil-m-chalem--myq8e/",
-    markets: ["CH"],
-    body: `Every few weeks I have the same conversation with a senior banker who is thinking about moving. The question comes in different forms, but it is always fundamentally the same. Is my bank going to survive? Is the 3 billion franc house I joined six years ago going to be swallowed by a tier-two competitor? Is the 8 billion boutique I am looking at a real opportunity or a slow-motion liquidation?
-
-Underneath all these questions sits a single number that has taken on almost mythological status in the Swiss market. Ten billion francs of assets under management. The line below which, according to industry consensus, a private bank cannot reasonably expect to be independent a decade from now.
-
-The consensus is wrong. Not completely wrong. But wrong in a way that matters, because it is causing good bankers to make bad career decisions and good boards to reach for the wrong solutions.
-
-The Consolidation Numbers Are Real. The Interpretation Is Not.
-
-The headline figures are accurate. Switzerland had roughly 160 private banking institutions in 2010. By the start of 2024, the KPMG and University of St. Gallen annual study counted 85. By the end of 2025 the number is expected to fall below 80. The recent deal flow backs this up: J. Safra Sarasin acquired Saxo Bank in the largest Swiss private banking transaction in more than a decade. Union Bancaire Privée absorbed Société Générale Private Banking Switzerland. Gonet and ONE swiss bank completed their merger.
-
-So far, so expected. The industry is shrinking. The narrative writes itself. Small banks are disappearing, therefore small banks cannot survive, therefore any institution below ten billion is a future casualty.
-
-This is where the analysis stops for most observers, and where it should actually begin. Because the same KPMG study reached a conclusion that received almost no attention in the subsequent press coverage. After analysing geographic and product diversification across Swiss private banks over the 2015 to 2024 period, the researchers identified two distinct business models that delivered higher and sustainable profitability. Not one. Two.
-
-The first model was the large bank with a significant international presence and comprehensive service offering. The second model — which is the one almost nobody is discussing publicly — was the smaller bank based only in Switzerland with a very focused service offering. Not a big bank. Not a national champion. A focused, semi-local, specialised boutique. Under 10 billion in many cases. And delivering sustainable profitability while the middle of the market consolidates around them.
-
-The HSG finding is not an opinion piece or a sell-side research note. It is a ten-year dataset. And it confirms what anyone spending time inside these institutions already knows. Size is not the binding constraint. Clarity is.
-
-What Actually Kills a Private Bank Under 10 Billion
-
-In my day-to-day work placing senior bankers, I see three failure patterns, and they appear together more often than separately.
-
-The first is a cost-to-income ratio stuck above 80 percent. Only 31 percent of Swiss private banks achieved a return on equity above their cost of equity in 2024. Almost two-thirds of banks reported a worse cost-income ratio last year than the year before. A 3 billion franc boutique running at 65 percent cost-income is in a stronger position than a 15 billion franc institution running at 88 percent. The market has just not caught up with that observation yet.
-
-The second pattern is positional ambiguity. When I read the public-facing materials of a private bank and cannot articulate in one sentence who their target client is, their next five years are going to be difficult. Half the mid-sized Swiss banks still describe themselves as providers of global wealth management to successful individuals and their families. This phrase means nothing. The boutiques that are thriving all pass the one-sentence test. Bergos is a German-speaking European family house. Reichmuth is a Swiss entrepreneur and family-office specialist with a partnership structure and no external shareholders. These institutions picked a lane and committed to it. Their size is not the point. Their identity is.
-
-The third pattern is the inability to attract or retain genuinely senior bankers. A bank that cannot offer a clear platform proposition, cannot pay competitively because of a stretched cost base, and cannot articulate its next five years to a prospective Managing Director will lose its best people. Every bank I work with that has lost its senior bench over the past three years is, without exception, a bank with one or both of the first two problems.
-
-The Implication for Senior Bankers
-
-If you are a senior relationship manager inside an institution that does not demonstrate clarity of positioning, cost discipline, and a credible ability to attract and retain senior talent, the consolidation question is not academic. It is personal. The banks that score badly on all three attributes are the ones that will be sold, restructured, or quietly wound down over the next five years.
-
-The useful question is not whether your employer will be independent in 2030. The useful question is whether your employer deserves to be. If the honest answer is no, the further question is whether you move now — on your own terms, with your book intact and your optionality at its peak — or whether you wait until the decision is made for you by a board you did not select.
-
-Swiss private banks under 10 billion francs of AUM will not disappear as a category. The undifferentiated ones will. The specialised, well-run and well-capitalised ones will perform better than the current consensus expects. Size is a weak predictor of survival. Clarity of positioning, cost discipline, and the ability to attract and retain genuinely senior bankers are the variables that actually determine the next five years.
-
-The 10 billion myth is comforting because it is simple. The truth is more useful, and more demanding.`,
-  },
-  {
-    slug: "ubs-ceo-succession-private-banking-2026",
-    title: "The Bank That Can't Choose a CEO",
-    date: "2026-04-20",
-    summary: "UBS has just completed its best financial year since acquiring Credit Suisse. And yet it cannot name a successor to its own CEO. Here is what the leadership paralysis means for every senior private banker watching from the inside.",
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    linkedinUrl: "https://www.linkedin.com/pulse/bank-cant-choose-ceo-gil-m-chalem--g9qje/",
-    markets: ["CH", "UK", "US"],
-    body: `Two days ago, Colm Kelleher stood in front of shareholders at the St. Jakobshalle in Basel and said something remarkable. The Chairman of UBS, the world's largest wealth manager, told the Annual General Meeting that "key business decisions may soon become unavoidable." He described the Swiss government's proposed capital rules as a serious risk to the bank's business model. He ruled out shrinking the bank. He reaffirmed growth ambitions in Asia and the United States. And then he added, almost as an afterthought, that UBS wants to remain headquartered in Switzerland.
-
-Wants to. Not will. Not intends to. Wants to.
-
-If you are a senior private banker at UBS right now, you probably noticed the verb. The financial press ran the headline and moved on. But inside the machine, that choice of word is doing a lot of work.
-
-The Succession Problem
-
-The day before Kelleher's speech, Reuters reported that CEO Sergio Ermotti could remain in his post well into the second half of 2027. The reason is twofold. First, the board wants regulatory clarity before installing a new chief executive. Second, and this is the part that should concern you, no obvious internal successor has emerged. The board is increasingly open to hiring externally.
-
-Think about what that means for a moment. UBS has just completed its best financial year since acquiring Credit Suisse. Net profit of $7.8 billion. Assets under management crossing $7 trillion for the first time. A 22% dividend increase. And yet the bank cannot name a successor to its own CEO. Not because the results are bad. Because the regulatory ground beneath the institution is shifting so fundamentally that the identity of the next leader depends on where UBS will even be headquartered when that person takes the job.
-
-The Capital Rules Standoff
-
-The Swiss Federal Council has proposed requiring UBS to fully back its foreign subsidiaries with Common Equity Tier 1 capital. UBS has estimated this would require an additional $22 billion in capital, potentially pushing its CET1 minimum requirement to 17–19%, roughly 50% higher than what comparable banks face in the EU or the US. The bank has called the proposals extreme.
-
-And then there is the relocation question. Last November, the Financial Times reported that Kelleher had held private talks with US Treasury Secretary Scott Bessent about what a move to the United States would look like for UBS. Whether or not UBS ever actually moves its headquarters is beside the point. The fact that the conversation is happening at all tells you something about the institutional uncertainty at the very top.
-
-What the Paralysis Actually Means on the Ground
-
-When the CEO succession is frozen, everything below it freezes too. Not officially. Not in any memo. But in practice. Regional heads cannot commit to multi-year growth mandates because they do not know whether the next CEO will share the same strategic priorities. Hiring committees defer decisions on senior appointments because the reporting lines might change. Promotion tracks that were promised as part of the post-integration settlement get quietly pushed back.
-
-I hear this from UBS private bankers every week. Not all of them. Not even most of them. But the senior ones — the ones managing CHF 500 million or more, the ones who have options, the ones whose phones ring when competitors come calling. Those bankers are not panicking. They are doing something worse: they are waiting. And in this market, waiting is the most expensive thing a senior RM can do.
-
-Because while UBS is paralysed at the top, the rest of the Swiss private banking market is moving. Lombard Odier has been systematically recruiting senior bankers across Asia, the UK, and Europe. Pictet continues to recruit selectively. Julius Baer has been expanding its RM headcount. The boutiques, the multi-family offices, the EAMs building under new FINMA licences: all of them are actively hiring. All of them are having the conversations that UBS is too distracted to have.
-
-If UBS has to hold $22 billion in additional capital, that capital has a cost. The cost gets absorbed somewhere. It gets absorbed in smaller bonus pools, in reduced investment in technology and platform, in tighter hiring budgets. The $3 billion buyback planned for 2026 is already explicitly contingent on regulatory clarity. If that clarity does not come, the buyback gets cut, the share price suffers, and the equity portion of your deferred compensation loses value.
-
-I have placed over 200 senior private bankers in my career. I can tell you that the single most common reason a high-performing RM leaves a platform is not compensation. It is not a bad quarter. It is the feeling that the institution has stopped moving forward. That the energy has gone out of the room. That the decisions that matter are being deferred, and nobody is willing to say so out loud.
-
-That is the atmosphere inside parts of UBS right now.
-
-The talent window that opened with the Credit Suisse integration is not closing. It is widening. And the reason it is widening is no longer just about integration fatigue or cultural friction. It is about a bank whose leadership is frozen because the institution itself does not yet know what it will look like in three years.
-
-The ones who realise that are already having conversations. The ones who do not are trusting that someone, somewhere, will eventually turn the lights on.
-
-In my experience, that is not how this works.`,
-  },
-  {
-    slug: "private-banking-compensation-revenue-grid",
-    title: "The Revenue Grid Nobody Shows You Before You Sign",
-    date: "2026-04-14",
-    summary: "Two bankers. Same AUM. Identical titles. One takes home forty percent more than the other. Here is why — and what you should be negotiating for right now.",
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    linkedinUrl: "https://www.linkedin.com/pulse/revenue-grid-nobody-shows-you-before-sign-gil-m-chalem--w2cwe/",
-    markets: ["CH", "UK", "ASIA"],
-    body: `I want to tell you about a conversation I had recently with two senior relationship managers — both in [Geneva](/en/markets/geneva), both at large private banking institutions, both managing books in the CHF 600 to 700 million range, both with strong client follow rates and clean compliance records. On paper, these are near-identical profiles.
-
-Their total compensation last year differed by almost CHF 200,000.
-
-Neither of them fully understood why.
-
-That gap — invisible, unwritten, almost never discussed in the hiring process — is what I want to talk about today. Because after decades of placements across Swiss and international markets, I have come to believe that the compensation structure a private banker accepts when joining an institution matters almost as much as the headline salary they negotiate. And almost nobody in this industry explains the structure honestly before the contract is signed.
-
-The Number Almost Nobody Talks About
-
-Start with a fact from Oliver Wyman that should be displayed on the wall of every HR department in private banking: research from the firm found that between 25 and 45 percent of all relationship managers at private banks are not profitable to the institution — and that RM payout is not correlated with RM profitability. Read that again. Up to nearly half of all relationship managers cost their bank more than they generate, and the bonus they receive bears no consistent mathematical relationship to the revenue they actually produce.
-
-The two dominant models in private banking are what I call the formula model and the discretionary model. Understanding which side of that balance you are sitting on, and at what thresholds, is one of the most important pieces of due diligence any senior banker can do before accepting an offer.
-
-The Discretionary Model
-
-The discretionary bonus model is the historic default of Swiss and European private banking. You generate revenue. The bank pools that revenue against total costs. A compensation committee — typically at the end of the fourth quarter — decides your bonus. The result is announced. You either accept it or you do not.
-
-JP Morgan Private Bank's own published disclosure puts it with admirable candour: investment professionals receive a salary and are eligible for a discretionary bonus, and there is no prescribed relationship between scorecards and compensation. At one of the largest private banking institutions on the planet, there is formally no formula binding your scorecard to your pay.
-
-The argument against — particularly for the high-performing revenue generator — is that it creates chronic uncertainty, structural opacity, and a power asymmetry that almost always favours the institution over the individual. Industry insiders have begun to say openly that the pure discretionary model is old-fashioned: if people add value, they are entitled to a defined share of business profits, not a figure decided behind closed doors and announced in January.
-
-The Formula Model
-
-The formula-based model works on a revenue grid. The banker generates a certain amount of fee income for the institution, and receives a defined percentage of that revenue as variable compensation, usually in graduated bands. Generate CHF 1 million, receive 20 percent. Generate CHF 2 million, receive 25 percent on the marginal revenue above the threshold. The exact numbers vary considerably by institution, market, and seniority level, but the principle is consistent: your pay is a deterministic function of your output, visible in advance and calculable in real time.
-
-EFG Bank has long been associated with this model in the European private banking market, and it has been a meaningful differentiator in their ability to attract entrepreneurial senior relationship managers who want to know, when they move their book, what they will actually earn on it.
-
-The Hidden Variables Nobody Negotiates
-
-Even within institutions that use formula-based grids, there are structural details that can shift total compensation by tens of thousands of francs without the banker ever being aware they were negotiable.
-
-The first is the revenue recognition methodology. Does the bank credit the RM for gross revenue from their book, or for net revenue after product costs, platform costs, and internal charges? At some institutions, an RM managing CHF 500 million of client assets generating a gross margin of 80 basis points sees that figure reduced by 15 to 25 percent in internal allocations before the grid is applied.
-
-The second is the deferred compensation structure. A meaningful portion of the variable pay at many institutions is deferred over one, two, or three years, subject to continued employment and conduct conditions. A banker accepting an offer with 40 percent deferral and a two-year cliff vest is making a fundamentally different economic bet than a banker with an immediate cash bonus. Most candidates read the headline number, sign, and discover the deferral mechanics later.
-
-The third is the treatment of new money versus existing book revenue. Some institutions grid only on net new revenue generated by the RM, discounting the revenue from a transferred book that the bank regards as already priced into the hiring package. For a banker moving a CHF 800 million book generating CHF 6 million in annual fees, the difference between those two methodologies can represent several hundred thousand francs in year-one compensation.
-
-The EAM Model: A Different Equation Entirely
-
-No discussion of private banking compensation is complete without addressing the external asset manager model, which is increasingly the destination of choice for senior relationship managers who have exhausted their patience with both the discretionary and the formula structures.
-
-The EAM operates on a triangular model: the client entrusts their assets to a custodian bank, but the investment management mandate is held by the EAM. For the relationship manager who joins or founds an EAM, there is no HR committee, no year-end announcement. The revenue the RM generates flows directly into the EAM's P&L, and their take-home pay is a defined share — typically between 25 and 40 percent of the revenue the firm attributes to their book, net of operational costs. For a senior RM managing CHF 500 million at a blended margin of 70 basis points generating CHF 3.5 million in annual fees, that can translate into total personal compensation of CHF 800,000 to CHF 1.2 million or more. No equivalent trajectory exists inside most private banks at that AUM level.
-
-This is why I increasingly tell the senior relationship managers I work with that the compensation negotiation is not the salary discussion. The salary is the baseline. The real negotiation is about the structure. Those conversations are uncomfortable to have. Banks do not naturally volunteer this information. But they are negotiable — particularly for a banker with a clean, portable, revenue-generating book.`,
-  },
-  {
-    slug: "dubai-private-banking-iran-conflict-2026",
-    title: "Dubai's Illusion Is Gone. Where Does That Leave You?",
-    date: "2026-03-09",
-    summary: "The Iran conflict has shattered the Gulf's reputation as a stable home for private banking talent. For senior bankers caught in the middle — and for those watching from Switzerland — the career implications are real and immediate.",
-    pillar: "P1",
-    subTheme: "Positioning",
-    linkedinUrl: "https://www.linkedin.com/pulse/dubais-illusion-gone-where-does-leave-you-gil-m-chalem--mrdye/",
-    markets: ["UAE", "CH", "ASIA"],
-    body: `Something broke on the morning of February 28th. Not just infrastructure — the idea. [Dubai](/en/markets/dubai)'s entire value proposition as a global financial hub was built on one promise: that it was a safe, neutral, prosperous island in a difficult neighbourhood. When Iranian missiles struck Dubai International Airport, the Burj Al Arab and Jebel Ali Port in the same weekend, that promise was visibly, publicly, undeniably broken.
-
-I want to be clear about what this is not. This is not a prediction that Dubai is finished, or that every private banker there should be calling a [Geneva](/en/markets/geneva) recruiter this afternoon. What it is, is a moment that forces honest thinking about risk — the kind of thinking that our industry rarely does until it is forced to.
-
-What Actually Happened
-
-Between February 28th and early March, Iran launched 189 ballistic missiles, over 941 drones, and cruise missiles at UAE targets. Dubai International Airport was struck. The Fairmont on Palm Jumeirah was hit by drone debris. The Burj Al Arab sustained damage. Jebel Ali Port caught fire.
-
-The UAE's air defences performed well — the vast majority of projectiles were intercepted — but intercepted missiles still produce shrapnel, debris, and fires. Four people were killed. Over 100 were injured. Tens of thousands of passengers were stranded as regional airspace shut down. Emirates suspended operations. Dubai's stock market closed for two days and fell 4.7% on reopening — its worst single session since May 2022.
-
-Family offices and international wealth managers began quietly reviewing their Middle East exposure. Security firms reported corporate clients requesting evacuation plans for between 1,000 and 3,000 staff.
-
-The Structural Problem for Private Banking in the Gulf
-
-Dubai was never a traditional private banking centre in the Swiss sense. It was a distribution hub — a place where banks placed relationship managers to serve clients from Russia, India, the broader Middle East, and East Africa, who preferred booking their assets in Switzerland or Luxembourg but wanted face time with a banker who understood their world and was nearby.
-
-That model worked because the equation was simple: the personal risk of being based in Dubai was low, and the commercial upside was high. What the past two weeks have done is change one side of that equation. The personal risk is no longer theoretical.
-
-For senior bankers managing significant books — CHF 200M, 400M, 600M and above — the question is not only whether they feel safe today. It is whether their clients feel safe. High-net-worth and ultra-high-net-worth clients are not going to park assets in a booking centre they associate with instability, regardless of how sophisticated the bank's product offering is.
-
-Switzerland Does Not Win Automatically
-
-There will be capital flows towards Switzerland. There already are. But I want to push back on the assumption that this is a simple, clean gain for Swiss private banking. The clients who were in Dubai were there for reasons: proximity, tax efficiency, the feel of a dynamic city, and in many cases, the access to a banker who spoke their language, understood their business culture, and operated in their time zone. Those needs do not disappear because the security situation has deteriorated.
-
-Switzerland offers something different: neutrality, political stability, institutional depth, a proven regulatory framework, and 200 years of experience managing wealth through European wars, currency crises, and geopolitical shocks. That is a compelling offer. But Swiss banks will need to do real work to absorb the talent and the clients coming out of the Gulf — not simply assume the business will arrive on its own.
-
-What This Means for Private Bankers on the Ground
-
-If you are a senior RM based in Dubai right now, you are managing several things simultaneously: your own personal calculus about where you want to live and work, your clients' anxiety, and your bank's institutional position — which may not yet be clear even to your own management.
-
-For bankers thinking about their own next move, this is a moment to assess your book's [portability](/en/portability) with clear eyes. Where are your clients actually booked? What proportion of your AUM is tied to clients who would follow you to a European platform? What contractual obligations do you have to your current employer? These questions are worth answering now, before you are reacting to events rather than ahead of them.
-
-And for bankers based in Switzerland who cover Middle Eastern or Gulf-market clients, this is a moment of significant opportunity — provided you approach it correctly. Clients who are reassessing will not want to feel sold to. They will want to feel understood. The bankers who will win new mandates from this disruption are the ones who pick up the phone this week not with a pitch, but with a genuine check-in.
-
-Either way, we are in a period of genuine uncertainty for private bankers in the Gulf — and a period of genuine opportunity for those positioned to serve that uncertainty well.`,
-  },
-  {
-    slug: "zurich-private-banking-talent-market-2026",
-    title: "Zurich 2026: Why the Private Banking Talent Market Is Turning",
-    date: "2026-02-20",
-    summary: "Record headcount, UBS integration, regulatory tightening — and a competition for senior relationship managers unlike anything Zurich has seen before.",
-    pillar: "P1",
-    subTheme: "Positioning",
-    linkedinUrl: "https://www.linkedin.com/pulse/z%C3%BCrich-2026-warum-der-talentmarkt-im-private-banking-gil-m-chalem--wcq4e/",
-    markets: ["CH"],
-    body: `The latest KPMG study on Swiss Private Banking delivers a finding that should give every senior banker in [Zurich](/en/markets/zurich) pause. Swiss private banks employed more full-time staff in 2024 than at any point in recorded history — 40,464 full-time equivalents in total. At the same time, the number of private banking institutions has fallen by roughly half since 2010.
-
-UBS is excluded from this count for methodological reasons. But the direction is clear: fewer institutions, more headcount per bank, higher concentration of talent inside the remaining houses.
-
-What does that mean on the ground in Zurich?
-
-UBS: 3,000 Swiss Roles and a Paradox
-
-CEO Sergio Ermotti confirmed in early February 2026 that the majority of Swiss headcount reductions will take place in the second half of the year — approximately 3,000 roles, primarily following completion of the Credit Suisse IT migration to UBS systems.
-
-At the end of December 2025, UBS employed 103,200 full-time staff globally — 1,250 fewer than at end of September. Since the acquisition peaked at around 119,000 FTE in mid-2023, roughly 16,000 roles have been eliminated. The internal target of 85,000 FTE by end of 2026 appears unlikely to be met, according to the Financial Times.
-
-The paradox: while UBS is cutting, other Zurich institutions are hiring selectively and deliberately.
-
-Three Clear Trends
-
-From my conversations with desk heads and HR leads in Zurich over recent months, three patterns are consistent.
-
-Targeted acquisition hires at the private banks. Julius Baer, Vontobel, EFG, and UBP are not hiring broadly — they are hiring with precision. The profile they want is specific: relationship managers with an entrepreneurial approach, access to high-growth client segments (entrepreneur families, next-generation clients, international markets), and demonstrable [portability](/en/portability).
-
-The EAM gap. The external asset manager sector continues to grow, and with it the demand for experienced client advisers who are comfortable in a regulated environment. Industry sources project a shortfall of up to 1,000 client advisers in the Swiss EAM segment over the coming years.
-
-Former Credit Suisse bankers as a sought-after asset. Bankers who maintained intact client books — whether by remaining inside UBS through the integration or by waiting out the transition period — are now facing a decision. The completion of the IT migration will release many non-compete clauses. In my experience, the strongest candidates move quietly and early.
-
-What I Am Seeing in the Mandate Market
-
-Compensation is stable but shifting in structure. Fixed salaries for senior RMs at Director and ED level of CHF 200–350K remain market-standard. The variable component is increasingly tied to sustainable revenue streams — DPM mandate income, lending revenue, recurring fees — rather than pure AUM accumulation.
-
-German is mandatory, but no longer sufficient. Swiss-German and standard German are prerequisites for CH-onshore mandates in German-speaking Switzerland. Banks increasingly also require solid English and, ideally, a second language for cross-border segments. The combination of German plus Italian or German plus Russian is being actively sought.
-
-Portability is being scrutinised more rigorously. The era of AUM promises as the primary hiring signal is over. Zurich banks consistently require: a credible wallet-share analysis, a retention history, clean compliance documentation, and a realistic assessment of what proportion of the book is actually transferable within six to twelve months. [Business plan](/en/bp-simulator)s are no longer a formality. They are the filter.
-
-What This Means for You
-
-If you are a relationship manager in Zurich considering a move, the next twelve months represent a window that rarely exists. The combination of the UBS restructuring, targeted hiring initiatives at the private banks, and the growing EAM segment is creating optionality that does not exist in a normal market cycle.
-
-If you are a desk head or HR lead looking for senior profiles, be aware that the pool of available, qualified candidates will grow in H2 2026 — but the strongest profiles are being approached early and moving discreetly. A structured approach with a realistic business plan and a clear platform proposition is what separates successful hires from those that stall in committee.
-
-The talent market in Zurich is not tightening. It is turning. The direction of that turn, and who benefits from it, will be determined in the next six to twelve months.`,
-  },
-  {
-    slug: "ai-trap-private-banking-portability",
-    ogImage: "/og-articles/og-ai-trap-private-banking-portability.jpg",
-    title: "The AI Trap Nobody in Private Banking Is Talking About",
-    date: "2026-04-07",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "When the bank's technology gets smarter about your clients, what exactly are you taking with you when you leave?",
-    linkedinUrl: "https://www.linkedin.com/pulse/ai-trap-nobody-private-banking-talking-gil-m-chalem--lcvae/",
-    featured: true,
-    engagementScore: 95,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: ["private banking portability", "AI private banking", "banker portability Switzerland", "relationship manager career move", "AUM portability 2026"],
-    body: `When the bank's technology gets smarter about your clients, what exactly are you taking with you when you leave?
-
-Let me tell you about a press release I read last week.
-
-On March 26th, Bank of America announced the full-scale rollout of something they are calling AI-Powered Meeting Journey. It is, by their own description, an integrated solution that searches and consolidates client relationship insights and recent activity into ready-to-use prep materials before every client meeting, then generates summaries and actionable next steps afterwards. The stated purpose is to help advisors redirect meaningful time toward strategic planning and deeper client engagement.
-
-On the surface this reads as a productivity story. Advisors get more time. Clients get better service. Everyone wins. But I have been in executive search in private banking for long enough to read what is underneath that kind of language and what I see there is a question that the industry is almost entirely failing to ask.
-
-If the bank's AI now knows your clients better than you do, their history, their preferences, their recent concerns, the last three conversations you had with them, who exactly owns that relationship when you walk out the door?
-
-## [Portability](/en/portability) has always been the private banker's ultimate asset
-
-This is not a new observation, but it bears repeating because it is the foundation of everything. The private banker's value, what makes the best ones virtually impossible to replace and extraordinarily expensive to lose, is not their investment knowledge, their compliance expertise, or even their personality. It is the fact that their clients trust them personally. Not the institution. Them. The phone number the client uses when something goes wrong at 11pm is the banker's mobile. Not the bank's switchboard.
-
-That personal trust is what translates into portability. When a senior relationship manager at a major Swiss private bank decides to move to a competitor, to a boutique, to an EAM, a meaningful portion of their book tends to follow. Industry surveys have consistently shown client follow rates of 40 to 70 percent for senior bankers with established books, depending on the market segment, the nature of the relationships, and the legal constraints in place. It is the single most important number in any private banking hire, and it is the number that hiring committees in [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), [London](/en/markets/london), and [Dubai](/en/markets/dubai) ask about first.
-
-This is why, in my practice, I spend so much time understanding portability before anything else. Not the AUM headline figure, any banker can claim a number, but the real texture of the relationships underneath it. How long? How personal? Who has the primary contact? Does the client know the bank's brand or the banker's face?
-
-Now, for the first time in decades, that calculus is being quietly disrupted by something that has nothing to do with regulation, nothing to do with non-solicitation clauses, and nothing to do with market cycles. It is being disrupted by artificial intelligence.
-
-## The technology is not neutral
-
-Here is the dynamic playing out right now across the major private banking institutions. Banks are deploying AI at an extraordinary pace. According to data from Selby Jennings, around half of Swiss financial institutions are already using AI, with a further quarter planning to adopt it within three years. McKinsey has estimated that generative AI could add between $200 billion and $340 billion annually to the global banking sector, primarily through productivity gains. And AI is expected to boost front-office productivity by 27 to 35 percent by 2026.
-
-The front-office applications being prioritised are not abstract. They are meeting preparation tools, relationship intelligence platforms, next-best-action engines, and CRM systems that build increasingly detailed maps of every client interaction. Every call, every preference, every concern, every product conversation, all of it is being encoded into proprietary platforms that the bank owns and controls. The AI gets better the longer the relationship runs and the more data it processes. It becomes, in effect, an institutional memory for the client relationship.
-
-This is where the asymmetry begins. The banker brings the trust. The bank builds the data. And when the banker leaves, the trust is portable, it travels with the banker in the form of a phone number that clients will still answer. But the data does not. The meeting prep system stays. The relationship intelligence dashboard stays. The complete interaction history that the AI has been trained on stays. The new banker hired to replace the departing RM gets the benefit of that institutional memory from day one.
-
-In other words: the more deeply a bank's AI learns a banker's client relationships, the more the bank, not the banker, becomes the repository of relationship intelligence. And the harder it becomes, psychologically and practically, for a client to fully follow their banker elsewhere.
-
-## The banks know this. They just are not saying it.
-
-The public messaging around these tools is carefully constructed around the advisor's benefit. Bank of America's own press release states that the role of the advisor will always remain central to the client relationship and that AI enhances efficiency but cannot replace the valuable judgment, empathy, understanding and personal connection advisors bring to clients. This is almost certainly true in any individual client interaction. A client going through a divorce, planning a business sale, or navigating a generational wealth transfer needs a human. The AI is not going to handle that conversation.
-
-But the structural effect of these tools on the banker's longer-term leverage is a different question entirely, and it is one that the institutions have no commercial incentive to raise. Every layer of AI that encodes a client relationship into a bank's proprietary platform is a layer that makes that relationship marginally more institutional and marginally less personal. Not dramatically, not overnight, but consistently, over months and years.
-
-What concerns me is not that this technology is being deployed. It is that the banking talent market is not yet pricing in its implications.
-
-## What this means for hiring, now
-
-According to the KPMG Clarity on Swiss Private Banking study published last year, Swiss private banks now employ more people than at any point in recorded history, over 40,000 full-time equivalents, even as the total number of private banks has roughly halved since 2010. The remaining institutions are larger, better resourced, and increasingly AI-equipped. And the talent profile they are hiring for is shifting.
-
-Selby Jennings noted earlier this year that private banks are now explicitly prioritising relationship managers with what they describe as clean client portability, meaning RMs whose books are not encumbered by EAM conflicts, non-solicitation clauses, or complex institutional entanglements. That emphasis is not new. What is new is that AI integration is beginning to function as a form of soft entanglement that does not show up in any employment contract.
-
-From where I sit running searches across Geneva, Zurich, London, Dubai, [Singapore](/en/markets/singapore), and [Hong Kong](/en/markets/hong-kong), I am already beginning to see the leading indicators of this dynamic. Candidates who have spent five or more years inside heavily digitised private banking environments are sometimes finding that their clients, while personally loyal, have also become comfortable with the bank's digital service layer in ways that create friction when they attempt to move. It is subtle. It does not break a placement. But it is a variable that did not exist in the same form even three years ago.
-
-The institutions least affected by this dynamic, at least for now, are the boutiques, the partnerships, and the EAM ecosystem, precisely because their relationship model is structurally human-centric and their technology stack is lighter. A banker at Lombard Odier or Pictet still operates in an environment where the platform serves the relationship rather than partially substituting for it. That is a meaningful competitive distinction in a world where the AI arms race is accelerating at the bulge bracket.
-
-## The question every senior banker should be asking right now
-
-If you are a senior relationship manager at a major private banking institution, and you are watching your bank roll out AI meeting tools, relationship intelligence dashboards, and next-best-action platforms, ask yourself this honestly: are these tools serving my relationship with my clients, or are they gradually embedding that relationship more deeply into the bank's institutional infrastructure?
-
-The answer is probably both. The technology genuinely does make you more effective in the short term. It is not a trap in any conspiratorial sense. Nobody at the bank is sitting in a room designing systems specifically to reduce your mobility. They are designing systems to retain clients and increase productivity. But the side effect of that, the gradual encoding of relationship intelligence into proprietary platforms, is real, and its long-term implications for banker portability have not yet been seriously examined.
-
-The most portable bankers I place are consistently the ones whose client relationships exist most completely in the human domain, in trust built over years of personal interaction, in shared history that the client remembers because the banker made it memorable, in a dynamic where the client's first call is always to the banker's mobile and only secondarily to anything the bank provides. That kind of relationship is still very much achievable. But it requires a conscious effort to maintain it in an environment where every bank is now incentivised to make itself the primary interface.
-
-The technology is not going away. The productivity gains are real. The competitive pressure to adopt these tools is genuine, and any banker who ignores them entirely will find themselves at a disadvantage in client servicing within a few years. But there is a difference between using AI as a tool and allowing it to become the relationship. The best private bankers have always understood that distinction intuitively. In 2026, for the first time, they need to understand it strategically.`,
-  },
-
-  {
-    slug: "when-goliath-moves-bahnhofstrasse",
-    ogImage: "/og-articles/og-when-goliath-moves-bahnhofstrasse.jpg",
-    body: `Last November, something happened at the Zunfthaus zur Meisen in [Zurich](/en/markets/zurich) that would have been unthinkable five years ago. At the annual Wealth Management Summit the Swiss private banking industry's most intimate gathering of board members and C-level executives, Goldman Sachs was crowned the best private bank in Switzerland. Not the best American bank operating in Switzerland. The best private bank. Period. Beating Julius Baer. Beating Pictet. Beating Lombard Odier. On their own turf, measured by their own metrics.
-
-The Fin21 study, now in its fourth edition and based on the published financials of 69 Swiss banks, evaluated performance across four criteria: growth, capital strength, efficiency, and prosperity. Goldman Sachs swept the Strongest Growing category among large banks. Its newly appointed General Manager for Switzerland, Pascal Meinherz, reminded the room that out of the firm's $1.8 trillion in wealth management assets, a significant portion is invested in private markets exactly the kind of product that UHNW clients now demand and that most Swiss boutiques still struggle to deliver at scale.
-
-And Goldman is not alone. J.P. Morgan's Private Bank ended 2024 with $1.27 trillion in assets under management, a 27% year-on-year jump and $2.97 trillion in total client assets. They added 260 new client advisors in a single year, bringing their bench strength to 3,775. Their Global Finance Best Private Bank award is now in its fifth consecutive year. Goldman Sachs Private Wealth Management, meanwhile, posted $1.6 trillion in total client assets as of early 2025, with an average account size exceeding $75 million. The average Goldman private banking client has more assets than many Swiss boutique bankers manage across their entire book.
-
-So the Americans are winning. Story over, right? Not quite. For a very specific category of senior private banker the kind of professional I spend my days placing the rise of US mega-banks on Swiss soil is the best thing that could have happened.
-
-## The paradox nobody is talking about
-
-The same Fin21 study that crowned Goldman also surfaced a far less comfortable finding. Across the 69 Swiss banks evaluated, median net new money as a percentage of assets under management was 1.5%. Chris Kunzle, the study's author and Fin21 founder, was blunt about it on stage: that is stagnation. Not decline, not crisis but for an industry that prides itself on client acquisition, 1.5% is treading water while the rest of the world sprints.
-
-The KPMG/University of St. Gallen annual study confirmed the pattern. Swiss private banks reached a record CHF 3.4 trillion in assets under management by end of 2024 but most of that growth came from markets, not clients. Net new money was CHF 72 billion industry-wide, which sounds impressive until you realise it represents barely 2% of the base. Twenty-seven banks reported outflows. And the relationship managers hired from UBS and Credit Suisse in recent years have had, in KPMG's own carefully chosen words, only a limited impact on new money inflows.
-
-Meanwhile, the consolidation machine keeps grinding. From 160 private banks fifteen years ago, the count has dropped to approximately 80. KPMG expects it to fall below that threshold by end of 2025. The message is unmistakable: scale or die.
-
-So you have a sector sitting on record assets, generating modest organic growth, watching its ranks thin year after year and now facing American institutions that bring a level of global product capability, capital markets access, and institutional firepower that no Swiss bank, however prestigious, can match pound for pound. The natural conclusion would be despair. But the natural conclusion would be wrong.
-
-## What the Americans cannot replicate
-
-I have spent decades placing senior private bankers across [Geneva](/en/markets/geneva), Zurich, [London](/en/markets/london), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore), [Hong Kong](/en/markets/hong-kong), [Milan](/en/markets/milan), and Lisbon. And there is one question I ask every senior candidate who tells me they are considering a move from a Swiss boutique to a US house: what happens to your client relationships when your desk head changes for the third time in four years?
-
-The silence is usually the answer.
-
-US banks operate on a fundamentally different logic. They are public companies. They report quarterly. They have shareholders who expect double-digit earnings growth. When the CEO of J.P. Morgan's private bank talks about goals-based planning and OneGS integration, what that translates to at the relationship manager level is a structured hierarchy, a nationally managed book, and an expectation that you will market what you are told to market. The career path is clear, the training is excellent, and the product shelf is vast but the banker's autonomy over the client relationship is a fraction of what it would be at a Pictet, a Lombard Odier, or a UBP.
-
-This is not a criticism. It is a structural reality that flows directly from the ownership model. And it creates a window of opportunity that Swiss boutiques are only beginning to understand.
-
-Consider the ownership structures. Pictet has operated as a partnership for 220 years. Only 47 individuals have ever served as managing partners. The current partners have unlimited personal liability their own wealth is on the line alongside their clients'. There is no board of external shareholders demanding quarterly optimisation. There is no investment banking division whose interests might occasionally collide with those of the wealth management client. When Pictet's website says our independence allows us to set our own business strategy without pressure from external shareholders or creditors, that is not marketing copy. That is a legal fact, enforceable by Swiss law.
-
-Lombard Odier, founded in 1796 making it Geneva's oldest bank, just moved into a new headquarters in Bellevue designed by Herzog and de Meuron, connected to GeniLac, Geneva's renewable thermal energy network. The building is a physical statement: we are not going anywhere. Meanwhile, their seven-year GX digital transformation programme has made them one of only two banks worldwide selected as a pilot for MongoDB's AI modernisation project, processing the technology infrastructure for ten other banking groups through their BPO platform.
-
-UBP tells a different story: entrepreneurial, acquisitive, capitalised like a fortress. Their Tier 1 ratio of 28.9% is among the highest in Swiss banking. They have absorbed Coutts International, Danske Bank's Luxembourg wealth management, and Societe Generale's Swiss and Kleinwort Hambros operations. They just opened in Riyadh. Their culture rewards bankers who build and keeps them.
-
-These are not banks clinging to the past. These are institutions that have survived Napoleonic wars, two world wars, the end of banking secrecy, the financial crisis, and the Credit Suisse collapse and emerged stronger each time.
-
-## The talent calculus that the numbers do not show
-
-Here is what I see on the ground, every single week, that no study captures.
-
-When a UHNW banker at UBS, senior with a CHF 800 million book and Middle Eastern clients and fifteen years in the business, looks at his options, he is doing a very specific calculation. At UBS, he is inside a $4 trillion wealth management machine that is simultaneously trying to complete the most complex banking integration in European history, cutting 35,000 jobs, migrating IT systems, and navigating a Swiss regulatory debate about capital requirements that could reshape the bank's ability to return capital to shareholders for years.
-
-At J.P. Morgan or Goldman, he gets global reach, extraordinary product, and a famous business card. But he also gets quarterly revenue targets set in New York, a structured hierarchy where decisions happen far above his pay grade, and the constant awareness that his client relationships are ultimately the bank's relationships, not his own. If he leaves, the book stays behind.
-
-At a Pictet or a UBP, he gets something neither of those environments can offer: the ability to run his business within a business. Open architecture, genuine open architecture, not the version where the proprietary product just happens to be best in class every quarter. A partnership culture where the CEO might be two doors down the corridor and actually knows his name. A client relationship that, if he ever decides to move again, he has a realistic chance of taking with him. And compensation that, while perhaps lower in absolute terms than a Goldman signing package, is structured in a way that rewards long-term client retention rather than annual production targets.
-
-The Swiss franc does not hurt either. With inflation at 0.2% and the SNB policy rate at 0%, the purchasing power stability of a Geneva or Zurich salary remains extraordinary compared to what a Manhattan or London paycheck actually delivers after tax and cost of living.
-
-## The generational shift that changes everything
-
-There is a number buried in recent wealth transfer research that should be on every Swiss private bank's strategy deck: 81% of younger HNWIs plan to switch their wealth management firm when they inherit. The $62 trillion intergenerational wealth transfer underway, representing half of the nearly $100 trillion moving from Baby Boomers through 2048, is not a gentle handover. It is a mass disruption event.
-
-And this is precisely where the Swiss boutiques have an edge that the American giants will find nearly impossible to replicate.
-
-At J.P. Morgan, a next-generation client will be onboarded into a system. They will get a goals-based planning module, an AI-powered engagement tool, a beautifully designed mobile app, and a quarterly review with someone who manages 100 or more relationships. At Pictet, they will sit with a private banker who knows their family because their father or grandfather sat in the same chair twenty years ago, in a building that has been there since Napoleon was reshaping Europe. They will get access to ESG mandates built by a firm that has been investing sustainably since before ESG was an acronym. They will get private equity and alternatives structured by a team that does not have to worry about whether Goldman's proprietary fund is being pushed this quarter.
-
-The digitally fluent heir who wants both cutting-edge technology and a genuine human relationship, who wants a banking partner and not a platform, is the Swiss boutique's ideal client. And they are about to inherit the earth.
-
-## What this means for your career
-
-If you are a senior private banker reading this from your desk at a US bank in Geneva or Zurich, I am not telling you to leave tomorrow. The American houses offer real advantages: global product access, capital markets capabilities, structured lending at scale, and brand power that opens doors in every market on the planet.
-
-But I am telling you to think about what you are optimising for. If it is short-term compensation and brand prestige, the US banks win that contest most quarters. If it is long-term career autonomy, client relationship ownership, and the ability to build something that survives the next restructuring cycle, which in this industry is never more than three years away, then the Swiss boutiques offer something that no amount of Goldman signing bonus can replicate.
-
-The Fin21 study's own data tells the story from the other side. While Goldman won the growth category, the Most Prosperous award went to Mirabaud, a Geneva partnership that has never recorded a loss in 206 years. Most Efficient went to Scobag, a Basel private bank managing 749 million francs per full-time employee. These are not banks that will ever grace the front page of Bloomberg. But they are banks where a senior private banker can build a career, not just hold a job.
-
-The Americans moved to Bahnhofstrasse because Swiss private banking still matters. The question for the industry and for every professional in it is not whether the Swiss model can survive the arrival of Goliath. It is whether the Swiss boutiques will be bold enough to turn Goliath's presence into their greatest recruitment pitch.
-
-Goldman proved that global scale and Swiss-quality service can coexist. Now Pictet, Lombard Odier, UBP, and their peers need to prove that independence, partnership, and generational thinking are not relics. They are the future that $62 trillion in transferring wealth is actively looking for.
-
-The talent war in Swiss private banking has never been more interesting. And if you are one of the people caught in the middle of it, I would be happy to discuss what I am seeing on the ground.`,
-    title: "When Goliath Moves to Bahnhofstrasse",
-    date: "2026-03-31",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "Goldman Sachs was crowned the best private bank in Switzerland at the annual Wealth Management Summit. The Americans are winning on Swiss turf — but for senior private bankers, this is the best thing that could have happened.",
-    linkedinUrl: "https://www.linkedin.com/pulse/when-goliath-moves-bahnhofstrasse-gil-m-chalem--urvie/",
-    featured: true,
-    engagementScore: 88,
-    pillar: "P1",
-    subTheme: "Positioning",
-    keywords: ["Goldman Sachs Switzerland", "Swiss private banking competition", "US banks Geneva", "private banking career strategy"],
-  },
-  {
-    slug: "35000-jobs-one-question-nobody-asking",
-    ogImage: "/og-articles/og-35000-jobs-one-question-nobody-asking.jpg",
-    seoTitle: "35,000 UBS-Credit Suisse Jobs: The Question Private Bankers Are Not Asking",
-    seoDescription: "120,000 employees. Three years of integration. UBS is entering the final redundancy phase. Here is the question senior private bankers inside UBS are not asking — but should be.",
-    body: `The numbers have been reported enough times that they no longer feel extraordinary. UBS absorbed Credit Suisse in March 2023, in an emergency transaction brokered by the Swiss federal government over a single weekend. Overnight, the combined institution swelled to just under 120,000 employees. It became, by some distance, the world's largest wealth manager, a $7 trillion AUM colossus that now counts roughly half of the world's billionaires among its private banking clients.
-
-Three years on, the integration is entering its final phase. The legacy Credit Suisse IT systems are being decommissioned. Around 85% of Swiss client accounts have been migrated. CEO Sergio Ermotti confirmed in January that a fresh round of layoffs would begin as soon as the decommissioning is complete.
-
-The math is well-documented. Approximately 15,000 positions have already been eliminated since the acquisition, less than half of the internally reported target of 35,000, a figure UBS has never publicly confirmed but has never credibly denied. Internal planning documents reported by multiple outlets suggest the bank is targeting a post-integration headcount of around 85,000, compared to 105,000 today. A further 3,000 Swiss positions are expected to go once client migration is finalised. A second wave will follow later in 2026 when the remaining inherited computer platforms are permanently shut down. On current trajectory, this restructuring will be the largest workforce reduction in the history of Swiss finance.
-
-The industry has spent three years tracking that number, who is going, which divisions are being cut, which markets are being rationalised. What it has almost entirely failed to examine is the question on the other side of the ledger.
-
-What happens to the careers of the people who survived?
-
-## Surviving was the rational choice
-
-Let me be clear about that before I say anything else. For most private bankers and Investment Advisors at UBS or the former Credit Suisse, the decision to stay through the integration disruption was professionally sound. Clients needed continuity. The talent market, though active, was not predictable enough in 2023 and early 2024 to justify a move driven primarily by anxiety. And the banks bidding for former Credit Suisse talent, and there were many, were often offering packages contingent on [portability](/en/portability) evidence that was difficult to demonstrate in the middle of an institutional earthquake. Staying close to clients, protecting relationships, and waiting for the dust to settle was the right call.
-
-But 2026 is not 2023. And I am increasingly concerned that a generation of talented private bankers is treating survival as an outcome rather than what it actually was: a holding pattern. The dust has settled. The integration is concluding. And the question that should now be on every surviving UBS banker's desk, not at their performance review but in their own honest reckoning, is this: what does my trajectory actually look like from here?
-
-## The structural reality of post-merger institutions
-
-There is a structural reality about post-merger institutions that people who have only ever worked inside them rarely see clearly. When two large organisations are combined, the hierarchy does not simply add together. It compresses. The Credit Suisse RM who was a senior figure in his market team, well-known to management, with clear line-of-sight to director-level progression, now operates inside a UBS structure that was already deep before the merger and has absorbed thousands of people at equivalent seniority. The visibility he had before does not transfer. The sponsorship has to be rebuilt, in an organisation that is twice the size and still navigating its own cultural identity.
-
-The cultural dimension matters more than it is usually acknowledged. UBS and Credit Suisse were not simply two versions of the same institution. They had genuinely different DNA. UBS built its modern private banking around a disciplined, process-driven model oriented toward scale and institutional credibility. Credit Suisse, at its private banking core, operated with more entrepreneurial latitude, closer to the partnership ethos that characterised the [Geneva](/en/markets/geneva) boutique sector, with more decentralised decision-making and a different relationship between senior bankers and the institution. That cultural gap has not been bridged by the legal merger. It is still actively playing out in how decisions get made, how talent gets recognised, and how the merged entity defines what a successful private banker looks like.
-
-What this creates, in practice, is a particular kind of friction that is hard to name but easy to feel. The banker who thrived in the Credit Suisse model because of his autonomy, his proximity to clients and to the investment team, and his ability to act quickly now finds those same instincts constrained by a machine designed for a different kind of excellence. He is not failing. He is just not fully deployed. And there is a meaningful difference between those two things when you are in your mid-career peak.
-
-## The attrition paradox
-
-The attrition data adds another layer. According to reporting by the Financial Times and Finews, UBS's voluntary attrition rate, historically around 7% per year, fell below that average at the start of 2025. People were staying, partly out of genuine loyalty, partly out of caution, partly because the non-solicit and retention arrangements embedded in many integration era contracts made moving costly. That drop in attrition is one of the reasons UBS is behind its internal headcount target. The bank had counted on a certain level of natural attrition to help manage the numbers. It did not materialise at the expected rate.
-
-The consequence for the remaining workforce is a hierarchy that is more congested than it would normally be. Promotion tracks that might have cleared through organic turnover have not cleared. Teams that might have rationalised themselves through voluntary exits are still carrying more layers than they need. For the banker who was expecting to move up within the next two to three years, the queue is longer than the org chart suggests, and it is not getting shorter quickly.
-
-I want to address the counterargument directly, because it is a legitimate one. UBS's private banking performance in 2025 was strong. The bank's Global Wealth Management division delivered pre-tax profit of $3.94 billion, up nearly 14% on the prior year. Total invested assets reached $7 trillion for the first time. Net new money was positive. By the standard measures of a wealth management franchise, UBS is not a troubled institution. It is, by most metrics, the most successful private bank in the world.
-
-That is not in dispute. The question is not whether UBS is a good bank. It is whether it is the right bank for every talented private banker currently working inside it. Those are different questions. And the honest answer to the second one, for a significant number of people, is increasingly no.
-
-## The profiles I am concerned about
-
-The profiles I am talking about are specific. Not the banker whose value proposition is the UBS brand itself, the one whose clients chose the institution before they chose the individual, and whose book requires global booking capability, complex cross-border structuring, and the full product breadth of a $7 trillion platform. For that profile, UBS in 2026 remains an extraordinarily compelling place to be. The platform advantages are real, and they are difficult to replicate elsewhere.
-
-The profiles I am concerned about are the ones whose competitive advantage is personal. The RM whose relationships are with families, entrepreneurs, and individuals who chose their banker first and the bank second. The Investment Advisor who was hired for his intellectual independence and market conviction, and who has watched that discretion gradually get replaced by house view compliance and model portfolio mandates. The senior banker who was a known figure inside Credit Suisse and has spent three years being quietly invisible inside something four times the size.
-
-For those profiles, the integration has created a mismatch that is unlikely to resolve itself from within.
-
-## The market outside UBS in 2026
-
-The market outside UBS in 2026 is more interesting than it has been in a decade. That is not a recruitment pitch, it is a factual observation about supply and demand in the private banking talent pool.
-
-The Swiss boutique and mid-size sector has not stood still while UBS integrated. Julius Baer grew AUM to CHF 497 billion in 2024, a 16.4% increase. Pictet reached CHF 757 billion in total AUM at year-end 2025, recording CHF 19 billion in net new money. EFG International grew at the same 16.4% rate as Julius Baer, reaching CHF 165.5 billion. UBP, Lombard Odier, Mirabaud, Banque Syz, virtually every significant independent institution in Switzerland has been growing its asset base while simultaneously watching UBS create an unprecedented supply of senior talent, directly or indirectly, through three years of structural disruption. The mandates I am currently working confirm this. Demand for portable, senior, relationship-driven profiles at non-UBS institutions is at a level I have not seen in this market since the post-financial crisis period.
-
-The window will not stay open indefinitely. As UBS completes its integration and the narrative stabilises, the talent supply that has been loosened will tighten again. The bankers who move in the next 12 to 18 months do so when the market is actively bidding for them, from a position of strength, with their client relationships intact and their track record clearly legible. The ones who wait for the third wave of cuts to make the decision for them will be moving from a more defensive position, in a market that reads defensive moves differently than proactive ones.
-
-## The question worth asking
-
-The question I would put to any senior private banker currently at UBS is not should I leave. It is more precise than that. Ask yourself whether the trajectory you are on today, not the one you joined for but the one that actually exists in this merged institution, reflects what you are capable of. If the honest answer is yes, stay and build. The platform is extraordinary. If the honest answer is no, or even uncertain, the market right now is in a better position to answer that question than your next annual review will be.
-
-Survival was the right answer in 2023. In 2026, the right answer is something more ambitious.`,
-    title: "35,000 Jobs. One Question Nobody Is Asking.",
-    date: "2026-03-30",
-    markets: ["CH", "UK", "US", "ASIA"],
-    summary: "UBS absorbed Credit Suisse in March 2023. Three years on, 35,000 jobs are being eliminated. The industry has tracked who is leaving — but almost entirely failed to examine what happens to the careers of the people who survived.",
-    linkedinUrl: "https://www.linkedin.com/pulse/35000-jobs-one-question-nobody-asking-gil-m-chalem--0gdze/",
-    featured: true,
-    engagementScore: 90,
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    keywords: ["UBS Credit Suisse integration", "private banking career", "Swiss banking jobs", "relationship manager career move"],
-  },
-  {
-    slug: "when-safe-haven-isnt-safe-anymore",
-    ogImage: "/og-articles/og-when-safe-haven-isnt-safe-anymore.jpg",
-    body: `There is a sentence that has circulated quietly in wealth management circles for the past twenty years. Dubai is different. It was the answer to every question about regional instability, every concern about proximity to conflict, every client who asked whether it was really wise to base oneself or one's assets in the middle of the Gulf. Dubai is different because it had transformed itself into something that the surrounding geography could not touch: a city built on the confidence of foreigners, running on their capital, their talent and their willingness to believe that the rules of the neighbourhood did not apply here.
-
-Since late February 2026, that sentence has become harder to say with a straight face.
-
-What has unfolded in the UAE over the past three weeks is not a rumour, not a geopolitical simulation and not a tail risk buried in a risk report. It is documented fact. Iran, retaliating against the US-Israeli bombing campaign, has fired over 314 ballistic missiles, 15 cruise missiles and more than 1,600 drones at the UAE since February 28th. Most were intercepted. But debris falls where it falls. The forecourt of the Fairmont The Palm on Palm Jumeirah caught a Shahed drone strike. The Dubai International Financial Centre took a direct impact. The world's busiest international airport sustained damage and was temporarily evacuated. An Amazon Web Services data centre, home to cloud infrastructure serving the regional banking system, was struck by shrapnel, knocking out phone banking services across the country. The Jebel Ali port, which accounts for 36 percent of Dubai's GDP, suspended operations after a berth fire caused by intercepted missile debris.
-
-The human toll, as of March 17th, stands at eight dead and 157 injured, largely migrant workers and foreign nationals. Iran's military command has gone further, explicitly threatening to begin targeting banks and financial institutions across the Gulf. For anyone working in private banking, that sentence deserves to sit on the page for a moment.
-
-## The exodus and what it actually means
-
-The images from the first days of the conflict told a particular story. Private jet brokers reported over 100 client inquiries in a single night. Charter demand reached levels not seen since the pandemic, with a single flight from Riyadh to Europe quoted at up to $350,000. Long queues formed at the UAE-Oman border, people driving hours to reach Muscat airport as an alternative exit point. And in a detail that says more about the kind of people who had built their lives in Dubai than almost anything else: veterinarians and pet hospitals reported being overwhelmed with animals abandoned by fleeing expatriates.
-
-At the institutional level, the Abu Dhabi and Dubai stock exchanges suspended trading on March 2nd and 3rd, the first wartime closure in UAE market history. When they reopened, the DFM index dropped 5.2 percent in the first session, with banking and real estate stocks leading the selling.
-
-S&P Global has estimated that Gulf banks could face domestic deposit outflows of $307 billion if the conflict deepens significantly, though as of mid-March no major capital flight from the banking system had materialised. The UAE Central Bank moved quickly, launching a resilience package backed by $1.47 trillion in sector assets to signal stability.
-
-What the exit data does not yet capture is the slower, quieter reallocation that happens in private banking: the client who does not move their assets this week but asks their RM to prepare a scenario. The family office that begins exploring a [Singapore](/en/markets/singapore) entity structure. The UHNW individual who calls [Geneva](/en/markets/geneva) not to transfer funds but to ask a question they have never asked before. These are the signals that experienced practitioners read long before they show up in deposit flow data.
-
-## $63 billion in play
-
-To understand what is at stake, it helps to put a number on what Dubai has built. In 2025 alone, Dubai attracted $63 billion in new private wealth inflows, cementing its position as one of the fastest-growing wealth management destinations in the world. The [DIFC](/en/markets/dubai) is home to over 600 financial institutions. Total commercial bank deposits across the GCC reached $2.3 trillion last year, comparable to total deposits in Italy, but with a critical difference: a significant proportion of those deposits are held by non-residents. In the UAE, roughly one in ten dollars on deposit belongs to someone who lives elsewhere.
-
-That non-resident concentration is Dubai's greatest asset in normal times and its greatest vulnerability in a crisis. The wealth that arrived quickly can leave quickly. It has no generational anchor, no real estate mortgage, no school-age children binding it to a postcode. It came for the proposition, the tax efficiency, the connectivity, the safety, and it will re-evaluate that proposition with unsentimental clarity.
-
-The institutions with the most direct exposure in the DIFC and wider UAE market include Julius Baer, which has built one of its most significant growth engines in the Gulf over the past decade, alongside HSBC Private Banking, UBS, Pictet, EFG International, UBP and a range of smaller Swiss and European private banks that followed their clients east. None of these institutions will be issuing public statements about contingency planning. But every one of them is running the numbers.
-
-## The compliance time bomb
-
-There is a dimension to this story that the mainstream financial press has covered only partially, and which matters enormously to practitioners in private banking: the regulatory and compliance reckoning that the conflict may force upon Dubai's financial architecture.
-
-For years, Dubai has functioned as a crucial financial corridor for Iranian businesses and individuals seeking to navigate Western sanctions. Shell companies registered across Dubai's sprawling free zones have masked the origin of Iranian oil and commodities. Informal currency exchange houses have moved funds across borders outside conventional banking oversight. The US Treasury has sanctioned UAE-based entities repeatedly, and American officials have long stated that enforcement within the UAE has fallen short of the country's stated commitments.
-
-The Wall Street Journal reported in early March that Emirati authorities are now considering a sweeping response: targeted freezes on Iranian-linked shell company assets and a crackdown on the local currency exchanges that sit at the centre of Iran's financial plumbing in the region. These are not small adjustments. They would represent a structural transformation of how parts of Dubai's financial system operate, and they would land on the compliance and KYC functions of every international private bank operating in the DIFC at exactly the moment those functions are already stretched by client uncertainty and operational disruption.
-
-For the relationship manager on the ground, this creates a compounding problem. The client asking about asset reallocation may also be a client whose source-of-wealth documentation has always relied on the opacity that Dubai's free-zone structure provided. The private banker who has spent years navigating that ambiguity now faces a regulatory environment that may close several of the doors that made certain client relationships manageable. Add to this the reputational scrutiny that any institution with Gulf exposure will face from its home regulator in [Zurich](/en/markets/zurich), Geneva or [London](/en/markets/london), and the compliance calculus shifts considerably.
-
-## The career calculation
-
-I want to speak directly to the practitioners reading this, because the public narrative tends to focus on billionaires and real estate valuations. The private banker on the ground is navigating something more personal and more professionally consequential.
-
-If you are a relationship manager based in Dubai, and Executive Partners has placed a meaningful number of them across the DIFC and adjacent hubs over the past several years, you are now facing a situation your employment contract did not anticipate. Your clients are calling you, not just their lawyers. Your AUM, a portion of which you have worked years to accumulate and port, is being stress-tested for jurisdictional risk in real time. Some clients are not asking whether to move assets. They are asking which flight to take, and whether their banker is on it.
-
-The harder question is the professional one. Do you stay? Does staying signal loyalty to your institution, or does it signal a lack of options? If you are an RM with a [portable book](/en/portability), strong relationships across the Gulf's HNW community and a genuine network built over a decade of proximity to client life in Dubai, this crisis has clarified something that was always latent in your career: the portability of your clients and the portability of yourself are two entirely separate calculations. And for the first time in many of their careers, private bankers in the Gulf are running both simultaneously.
-
-The talent market consequence will not be immediate. Banks do not start advertising roles in Geneva for Dubai-based RMs while missiles are still being intercepted overhead. But the conversations are already happening. Several institutions in Switzerland and Singapore have quietly indicated that they are in listening mode, open to approaches from bankers who have built Gulf-facing books and are reassessing their medium-term geography. The candidates who move proactively, with their relationships intact and their documentation in order, will be far better positioned than those who wait for their institution to make the decision for them.
-
-There is also a generation of younger private bankers in the Gulf, five to ten years into their careers, who chose Dubai over Geneva or Zurich precisely because it felt like the future. The energy, the growth, the client quality, the compensation. Those bankers are now doing a calculation they did not expect to be doing at this stage of their careers. Where do I want the next decade to be built? The answer may still be Dubai. But for the first time, it is genuinely a question rather than an assumption.
-
-## Where the money goes
-
-The geography of private wealth reallocation under geopolitical stress is rarely as dramatic as the headlines suggest. Wealthy families do not move everything overnight. They probe, they diversify, they ask their bankers questions that sound like curiosity but are actually instruction. And the institutions that benefit are not always the loudest in the room.
-
-Switzerland remains the default destination, and for good reason. Geneva and Zurich have spent the past forty years building precisely the kind of institutional credibility and political neutrality that becomes acutely valuable when a region's safety premium evaporates overnight. The wealth management infrastructure here, the legal framework, the talent density, the discretion, the track record of staying open for business regardless of what is happening elsewhere in the world, does not need to advertise itself in moments like this. It simply receives.
-
-Singapore is the other major beneficiary. Asian HNW families who diversified into Dubai over the past decade, particularly from India, China and Southeast Asia, are now being reminded why Singapore's stability commands a premium. Reuters has reported that wealthy Asian clients are actively exploring moving Dubai assets closer to home. The flow is not a flood yet, but the direction is clear.
-
-What is less discussed is the opportunity this creates for mid-tier Swiss and European private banks that have always struggled to compete with Dubai's growth narrative. The argument for concentration, for building your wealth management life entirely around one jurisdiction's momentum, has just been complicated in ways that even the most optimistic Dubai bulls are finding difficult to dismiss.
-
-## The long view
-
-Dubai has absorbed shocks before that commentators predicted would be fatal, and it has emerged intact. The 2009 property crisis. The pandemic. Periodic regional tensions that rattled confidence without breaking it. The city's leadership understands at a very deep level that its only real product is confidence.
-
-But there is something categorically different about a conflict that strikes the DIFC, the airport, and the data infrastructure of the banking system. Henley and Partners, who advise wealthy families on residence and citizenship strategies, said publicly that situations like this reinforce the value of what they call global optionality. Internationally mobile families that have diversified their residence and assets across multiple jurisdictions are better positioned than those who concentrated everything in a single location whose safety they took for granted.
-
-That is the real lesson for the private banking industry, and it is one that practitioners in Geneva and Zurich have always understood intellectually but perhaps struggled to articulate to clients who were enjoying Dubai's sunshine, its zero-tax environment and its sense of forward momentum. Jurisdictional diversification is not a product you sell when markets are calm. It is the product you wish you had sold when they are not.
-
-The conflict's resolution will determine whether what we are witnessing is a correction or a turning point. A swift ceasefire and Dubai will recover, markets will stabilise, the HNW community will return, and the city will rebuild its narrative with characteristic speed. If the conflict extends, the damage to Dubai's core proposition will be structural in ways that take years to repair and that reshape the careers of everyone who built their professional life around Gulf private banking.
-
-For now, the phones are ringing in Geneva. And the private bankers picking them up understand, better than most, that the question on the other end of the line is never really about missiles.
-
-It is always about trust.`,
-    title: "When the Safe Haven Isn't Safe Anymore",
-    date: "2026-03-24",
-    markets: ["UAE", "CH", "ASIA"],
-    summary: "Dubai's entire value proposition as a global financial hub was built on one promise: that it was a safe, neutral, prosperous island in a difficult neighbourhood. Since late February 2026, that promise has become harder to say with a straight face.",
-    linkedinUrl: "https://www.linkedin.com/pulse/when-safe-haven-isnt-anymore-gil-m-chalem--hiuqe/",
-    featured: true,
-    engagementScore: 87,
-    pillar: "P1",
-    subTheme: "Positioning",
-    keywords: ["Dubai private banking risk", "Middle East wealth management", "private banker Dubai career", "geopolitical risk banking"],
-  },
-  {
-    slug: "julius-baer-cut-jobs-strong-2024",
-    ogImage: "/og-articles/og-julius-baer-cut-jobs-strong-2024.jpg",
-    body: `I had a conversation a few weeks ago with a senior relationship manager at Julius Baer. Good MEA banker. Solid UHNW book, CHF 650 million, with clients he had built over fourteen years. He was not worried. His AUM was up. His client retention was strong. The bank had just posted a 125% jump in net profit. He felt, reasonably enough, that he was on the right side of things.
-
-I did not tell him he was wrong. But I did tell him that the question he should be asking himself had nothing to do with his own performance.
-
-That is a harder thing to hear than it sounds.
-
-## What actually happened at Julius Baer
-
-To understand the career lesson here, you have to understand the mechanics of what has been happening at the bank over the last eighteen months, because most of the coverage has focused on the headlines and missed the structure underneath.
-
-Stefan Bollinger arrived as CEO in January 2025 after a period that had been, to put it charitably, difficult. In 2023, Julius Baer took CHF 606 million in write-downs on loans extended to Rene Benko's Signa real estate empire, which collapsed and dragged the bank's profit down by roughly half. It was not just the financial loss that damaged Julius Baer. It was what the Signa exposure revealed about risk governance: a pure-play wealth manager, a bank whose entire identity rests on the quality of its judgment, had concentrated significant credit exposure in a single counterparty in a sector it had no particular expertise managing. FINMA opened an investigation. The reputational damage was real, and it has not fully resolved.
-
-2024 was the recovery year, one of the bank's strongest in recent memory. Net profit rebounded to CHF 1.02 billion. AuM grew 16% to CHF 497 billion. Net new money came in at CHF 14.2 billion. Operating income rose 19% to CHF 3.86 billion.
-
-And then, within weeks of his arrival, Bollinger announced 400 job cuts, slashed the executive board from 15 members to 5, and set a CHF 110 million cost-reduction target. Shares fell more than 8% on the day.
-
-If your first reaction to that sequence is confusion, you are not alone.
-
-The explanation is the cost/income ratio. At 70.9% for 2024, Julius Baer was running one of the least efficient cost structures of any major Swiss private bank, against a target of 64% that Bollinger himself publicly described as still unsatisfactory and far removed from where it needed to be. The bank was growing revenue, growing AuM, attracting net new assets and still could not bring its cost base into alignment with what the business actually generated. That is a categorically different problem from a merger, a market collapse, or a rogue credit exposure. It is a structural problem. And structural problems require structural solutions, not a good quarter.
-
-There is another number worth noting. The Swiss Bank Employees' Association pointed out in their public response to the cuts that Julius Baer had added 170 employees the previous year, before eliminating 400 the next. The job cuts were announced before Bollinger had published any strategic plan. You hire, you restructure, you cut. Then you explain the strategy.
-
-## A pattern that goes deeper than one cycle
-
-What makes Julius Baer particularly instructive as a case study is that this is not the first time. The Swiss Bank Employees' Association made a point of noting this in their statement. Julius Baer had already carried out significant layoff rounds in 2020, 2021, and 2024. Three restructuring cycles in five years, and now a fourth. Each time, the logic was similar: cost base too high, headcount not aligned with revenue generation, need to reset.
-
-This is not a criticism of the bank's management. In each of those years there were specific external catalysts, COVID, market volatility, the Signa fallout. Bollinger's version is arguably the most structurally coherent of the four, because he is attempting to address the cost/income ratio as a strategic target rather than as a crisis response. The 64% goal, the board reduction from 15 to 5, the decision to have the CEO directly oversee all revenue-generating divisions, these are architectural changes, not cost theater.
-
-But the pattern should be noticed by anyone thinking about career risk in private banking, because Julius Baer is not an outlier. It is a signal.
-
-The Swiss wealth management industry is under sustained pressure on margins. The number of Swiss banks has declined steadily for years, from 186 institutions in 2006 to around 100 by the end of the last decade. The consolidation continues. And the pressure on cost/income ratios is not unique to Julius Baer. When a leading franchise, posting record net new money, still has to restructure because its operating model is too expensive, it tells you something about where the pressure is going across the industry.
-
-## The merger risk and the structural risk are not the same thing
-
-In the piece I wrote recently about the UBS-Credit Suisse integration, I talked about redundancy risk as something that is relatively legible. Two banks become one, two teams become one, someone goes. You can see the shape of it, even if the timing is uncertain.
-
-What Julius Baer represents is different, and in some ways harder to navigate, because the risk does not come from overlap. There is no merger logic to trace. There is no duplicated desk to point at. The bank is structurally profitable, growing its asset base, doing the things a wealth manager is supposed to do and still concluding that it employs too many people relative to what those people generate.
-
-In that environment, the usual defensive instincts fail. You cannot protect yourself by being good at your job, at least not in the way most bankers mean when they say that. You cannot point to a strong 2024. You cannot argue that your book is up. The exposure comes from a different direction entirely: from a management that has decided that the cost structure, not the revenue line, is the problem to solve. And cost structures are solved by looking at headcount ratios and function-by-function economics, not by looking at individual performance reviews.
-
-## What competing banks are doing right now
-
-Something worth saying explicitly: the talent coming out of Julius Baer during this restructuring is attracting real interest. A bank with CHF 521 billion in assets and a consistent net new money track record has well-trained people, and the UHNW segment that Julius Baer serves, European family wealth, Middle Eastern capital, sophisticated mandates, is exactly what a number of expanding private banks are looking to absorb.
-
-From what I see in my own practice, the banks most actively interested in Julius Baer profiles right now are those in the mid-tier Swiss space that have capacity for experienced UHNW relationship managers and are prepared to offer the kind of guarantees that make a move viable. Some international players expanding their [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich) presences are in the same conversation. They are not waiting for the restructuring to conclude before identifying the people they want. In executive search, the strongest mandates move before the candidate pool has fully formed. By the time a restructuring is publicly complete, the best placements have usually already happened.
-
-If you are a Julius Baer relationship manager reading this and you are not in active conversation with anyone externally, not a headhunter, not a competing bank, not even an informal coffee, you are behind the curve. Not because you need to leave. But because you do not yet know what your options are, and you should.
-
-## The question that most private bankers cannot answer
-
-I want to come back to the banker I mentioned at the start, because his situation illustrates something I see constantly in this market.
-
-He was not complacent in any meaningful sense. He was doing his job well. His clients were happy. His AUM was growing. By every internal metric his bank uses to evaluate relationship managers, he was performing. The problem was that he had never been forced to think about his career the way a bank thinks about a cost/income ratio, with genuine precision, from the outside in.
-
-When I asked him what percentage of his CHF 650 million would realistically follow him to a new institution, he paused for a long time. Then he said something like 70%, maybe 80%. When we worked through it together, client by client, relationship by relationship, looking at how each account originated, who held the decision-making power in each family, which clients had multi-bank relationships versus exclusive arrangements, which ones had credit facilities or structured products lodged with Julius Baer that would make a transition complicated, the portable number was closer to 40%.
-
-That is not a bad number. CHF 260 million of genuinely portable, self-originated relationship capital is a real asset. But it is a very different conversation than CHF 650 million. And the difference between those two numbers is what a hiring committee actually underwrites when they make you an offer.
-
-## The metrics that actually travel
-
-Because this keeps coming up in conversations I have at Executive Partners, let me be direct about what a hiring committee at a serious private bank actually evaluates when they look at a senior RM from Julius Baer or anywhere else.
-
-The first thing is [portability](/en/portability), not your headline AUM but the portion of it that is genuinely yours. Relationships you originated. Clients who chose you personally. Capital that is not institutionally anchored to a platform, a custody arrangement, or a credit facility the client is unwilling to restructure.
-
-The second is revenue quality. A CHF 650 million book generating 40 basis points of annual revenue is a different business proposition from a CHF 650 million book generating 70 basis points, even if the AUM headline is identical. Hiring committees want to understand your return on assets, the mix between discretionary mandates and advisory and execution-only, and your trajectory on net new asset generation.
-
-The third is client concentration. If your top three clients represent the majority of your assets, you are a concentrated risk, not a diversified revenue stream. The strongest private banking profiles I place carry a book distributed across 30 to 60 relationships, with no single client representing more than 10 to 15% of total AUM.
-
-The fourth, and the one that separates the candidates who receive the strongest offers, is the [business plan](/en/bp-simulator). At Executive Partners, we do not present a senior RM to a bank without a credible three-year plan that specifies where the net new assets will come from, what the pipeline looks like, which relationships are already in progress, and what the development strategy for existing clients is. A banker who can articulate this clearly, with specifics not generalities, has done something that most of their peers have not done in years, if ever.
-
-## What this moment actually requires
-
-Julius Baer will likely complete its restructuring broadly on the timeline Bollinger outlined. The cost/income improvement is real. The bank is exiting private debt, cleaning up its remaining real-estate loan exposures, and refocusing on pure wealth management. The strategic direction is clearer now than it was twelve months ago.
-
-But for anyone inside the institution, or at any Swiss private bank navigating the same kind of structural pressure, the useful response is not to wait and see. It is not to assume that your performance insulates you. It is not to take comfort from the fact that your segment has not been touched yet.
-
-The useful response is to treat this moment as a forcing function for a conversation you should probably have been having anyway. What is your book actually worth on the open market? What is your portability score? What would a three-year business plan look like if you had to write it today? And who, outside your current institution, knows who you are and what you bring?
-
-The bankers who emerge from restructuring moments in the strongest position are never the ones who were most secure the week before the announcement. They are the ones who had already done that work, who had a current view of their own value, who had kept their external relationships alive, and who had options before options became urgent.
-
-Julius Baer reported CHF 14.4 billion in net new money in 2025 while simultaneously managing its fourth restructuring cycle in five years and reporting a 25% drop in annual profit. That combination, resilient asset gathering, persistent cost pressure, regulatory overhang, is the condition that defines this moment in Swiss private banking more broadly. It is not unique to one bank, and it will not resolve in one cycle.
-
-It is a reminder that in this business, the question has never really been whether you are doing a good job today. It is whether you have built a career that holds its value when the context changes.`,
-    title: "Julius Baer Cut Jobs Even After a Strong 2024. Every Private Banker Should Pay Attention.",
-    date: "2026-03-23",
-    markets: ["CH", "UK", "UAE", "ASIA"],
-    summary: "Julius Baer posted a 125% jump in net profit. Then cut 400 jobs and set a CHF 110 million cost-reduction target. The question every private banker should be asking has nothing to do with their own performance.",
-    linkedinUrl: "https://www.linkedin.com/pulse/julius-baer-cut-jobs-even-after-strong-2024-every-pay-gil-m-chalem--nb7be/",
-    featured: true,
-    engagementScore: 89,
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    keywords: ["Julius Baer restructuring", "Swiss private banking jobs", "private banker career risk", "banking cost reduction"],
-  },
-  {
-    slug: "why-senior-rms-going-independent",
-    ogImage: "/og-articles/og-why-senior-rms-going-independent.jpg",
-    body: `Last month I had three separate conversations with senior private bankers who asked me some version of the same question. Not can you help me move to another bank. The question was different. It was: should I just go independent?
-
-One was at a major Swiss private bank navigating its third restructuring in four years. One had spent fifteen years at an institution he genuinely liked but was watching his client base age without any real platform to develop the next generation of relationships. The third had just lost a significant client to an independent wealth manager who, in his words, had no platform, no brand, and no research department and still won the mandate because the client trusted him personally.
-
-Three different situations. Three different frustrations. One recurring question.
-
-The EAM model, external asset managers or independent wealth managers working outside the bank structure, is not a new concept in Switzerland. What is new is how often the question comes up in conversations that used to be purely about lateral moves within the banking system. Something has shifted, and I think it is worth being direct about what that shift is, who it actually makes sense for, and what the real costs are that most bankers do not see until it is too late.
-
-## The landscape these bankers are looking at
-
-The Swiss EAM sector is genuinely substantial. FINMA, which has required all portfolio managers and trustees to hold a formal licence since the Financial Institutions Act came into force in January 2020, had approved a total of 1,532 licences as of February 2025, out of 1,864 applications submitted since the requirement was introduced. That gives you a sense of the scale of the regulated independent wealth management sector in Switzerland, over a thousand institutions, ranging from one-person advisory boutiques to multi-manager platforms overseeing several billion francs.
-
-The assets under management across this sector are significant. Industry estimates have consistently placed the collective AuM of Swiss EAMs in the range of CHF 300 to 400 billion. What is clear is that custody banks take this segment seriously as a revenue source. UBP, one of the most active EAM custodian banks in [Geneva](/en/markets/geneva), had CHF 23 billion of its total CHF 171.7 billion in AuM attributed to EAM clients as of early 2026. Lombard Odier has been servicing EAMs since 1987. Pictet, J.Safra Sarasin, Mirabaud, Bordier, Banque Syz all run dedicated EAM desks. The infrastructure to support an independent manager is well-developed and genuinely competitive.
-
-On the M&A side, PwC reported nine publicly disclosed EAM transactions in the first half of 2025 alone, driven by rising regulatory costs, succession planning, and growing private equity interest in consolidating the sector. The consolidation is real, but so is the new formation: many new EAM entrants in 2025 were spin-offs from larger EAM platforms or bank teams, operating with lean structures and focused client rosters.
-
-What is accelerating the interest among bank-employed RMs is also structural. In some Swiss financial institutions, up to 60% of results now stem from the EAM department rather than traditional private banking. Banks that used to tolerate EAMs as a minor adjacent business are increasingly dependent on them. That dynamic has not been lost on experienced relationship managers who look at their client book and ask themselves which side of that equation they want to be on.
-
-## What the three people who called me actually had in common
-
-Before I get into the framework I use to think about this, I want to say something about those three bankers I mentioned at the start, because they illustrate the range of motivations better than any generalisation can.
-
-The first was genuinely portable. He had built his book himself over a decade, mostly UHNW clients from a specific geographic market where he had personal relationships going back years. His clients knew him, not his bank. When we worked through the portability analysis together, looking at the source of each relationship, the existence of credit facilities or structured products that would anchor clients to the current institution, the concentration of decision-making, the number that emerged was solid. Around 65% of his book had genuine portability. That is a meaningful base to build on as an independent.
-
-The second banker was a different story. His book was large on paper, CHF 900 million, but the majority of it had come through referrals from the bank's private equity network, or from clients introduced through the bank's family office platform. The relationships were real and warm. But they were warm to the institution as much as to him personally. His portable number, when we went through it honestly, was closer to 25%. Going independent on 25% of CHF 900 million is a different calculation entirely.
-
-The third was somewhere in between, but the platform frustration was genuine and I took it seriously. He had watched a client move CHF 80 million to an independent who offered nothing his bank did not offer, except one thing: the client felt ownership of the relationship. He felt like a client of the manager, not a client of the bank. That is a competitive dynamic that matters and that is not going away.
-
-## The real question is not can I go independent — it is what am I actually selling
-
-Here is the thing I tell every banker who asks me about the EAM route. The question you need to answer before anything else is not about the regulatory requirements, the minimum capital, the custody bank selection, or the fee structure. Those are all solvable problems. The question is: what is the asset you are actually selling?
-
-In a bank, you are selling access to a platform, to a research department, to a credit offering, to a brand that certain clients find reassuring. Your value proposition is partially institutional. The bank lends you credibility, especially with new clients who do not know you personally.
-
-As an EAM, you are selling yourself. Your judgment, your relationships, your independence. The open architecture custody model means you can genuinely offer multi-bank solutions and product neutrality that an employed relationship manager cannot. That is a real advantage for certain clients. But it only works if the client is choosing you, not just following you out of inertia.
-
-This is why portability, and not headline AUM, is the single most critical variable in the decision. A banker with CHF 400 million of genuinely portable, self-originated, personally trusted relationships is a better candidate for the EAM model than a banker with CHF 1.2 billion sitting on a book where 70% of the relationships are institutionally anchored. The first person has an asset. The second person has a reporting line.
-
-## What actually going independent costs
-
-I have seen enough of these transitions to be direct about the parts that do not get discussed honestly.
-
-The compliance infrastructure is more expensive and more time-consuming than most bankers expect. Under the FinIA framework, a FINMA portfolio manager licence requires a defined governance structure, qualified personnel at the management level, minimum equity capital of CHF 100,000, and affiliation with one of five FINMA authorised supervisory organisations. The FINMA licensing process itself can take anywhere from several months to well over a year. FINMA's own data shows that in more than 40% of the applications it received in the most recent cohort, it had to request amendments at least five times. This is not a paperwork formality. It is a substantive compliance exercise, and it requires either significant personal bandwidth or the cost of external legal and regulatory counsel to navigate properly.
-
-Then there is the custody bank negotiation. A new EAM with CHF 200 to 300 million does not walk into Pictet or Lombard Odier and receive the same service terms as an established EAM with CHF 2 billion. Minimum asset thresholds for access to certain custody platforms have risen, and banks have become more selective about which new EAMs they onboard. The senior RM who leaves a top-tier private bank and assumes he will have seamless access to the same platforms on day one as an independent is usually in for a recalibration.
-
-Finally, there is the operational reality of running a business. A managing partner of an EAM is not doing pure relationship management. He or she is handling HR, technology decisions, compliance reporting, custody bank relationships, and a hundred other things that the bank absorbed silently in the background. Some bankers discover that they love this. Many discover, somewhat painfully, that they do not.
-
-## The profile that works and the one that does not
-
-Based on the transitions I have observed and the ones I have advised on over the years, there is a reasonably clear profile on both sides of this decision.
-
-Going independent tends to work well when three things are present simultaneously: a genuinely [portable book](/en/portability) with a high proportion of self-originated, personally trusting relationships; an entrepreneurial disposition that finds the operational complexity of running a business energising rather than distracting; and a client base that is sophisticated enough to understand and value what the independent model offers, multi-custody access, product neutrality, genuine advisory independence. UHNW clients with complex cross-border situations and multiple bank relationships are often well-served by an EAM model. Clients who want the reassurance of a large institutional brand, or whose relationship with the bank is partly driven by credit or structured product access, are not good portability candidates regardless of how warm the personal relationship feels.
-
-Going independent tends to fail when the book is more institutional than personal, when the motivation is primarily reactive, frustration with a restructuring, irritation with a management decision, a bad performance review year, rather than genuinely strategic, or when the regulatory and operational complexity is underestimated as an administrative nuisance rather than treated as a serious business investment.
-
-The honest version of this conversation is not should you go independent. It is: are you the kind of asset that generates its own gravity, or are you the kind of asset that performs well within a structure? Both can be excellent. They are not the same thing.
-
-## What I told the three bankers
-
-The first one, the one with the genuinely portable book and the long personal relationships, I encouraged to take the EAM route seriously. Not immediately. But to spend the next six months building the [business case](/en/bp-simulator) properly: mapping the portability client by client, selecting a custody bank partner, understanding the regulatory requirements, and being honest about the operational dimension. For him, the model fits.
-
-The second, the one with CHF 900 million on paper and 25% portability, I told him plainly that the EAM route was not the answer to his problem. His problem was that his book was more institutional than personal. The solution to that problem is not to leave the institution. It is to spend the next three years deliberately changing the composition of the book, strengthening personal ties with the clients he genuinely owns, and developing the pipeline that makes him genuinely portable when the time comes. Going independent on 25% of a large book is not freedom. It is a significant step down with a compliance burden on top.
-
-The third, the one who was losing clients to independents, I told something different. His frustration was real and the competitive dynamic he described was real. But the answer for him was not necessarily to become an EAM. It was to understand more clearly what his clients actually valued about him, and whether the bank's platform was genuinely inhibiting that value or whether he was rationalising a structural problem that belonged to him, not to the institution.
-
-That distinction, whether the constraint is external or internal, is the most important question in this conversation. And in my experience, bankers who are honest enough to sit with it for a while usually find the answer they need.
-
-The EAM model in Switzerland is robust, well-regulated, and genuinely competitive with the bank model for the right kind of client and the right kind of advisor. But it is not an escape hatch. It is a business. And like any business, it rewards the people who treat it that way from the start.`,
-    title: "Why More Senior RMs Are Asking Me About Going Independent. And What I Tell Them.",
-    date: "2026-03-17",
-    markets: ["CH", "UK", "UAE", "ASIA"],
-    summary: "Last month I had three separate conversations with senior private bankers who asked some version of the same question: should I just go independent? The EAM model is not a new concept. What is new is how often the question comes up.",
-    linkedinUrl: "https://www.linkedin.com/pulse/why-more-senior-rms-asking-me-going-independent-what-i-gil-m-chalem--kglqe/",
-    featured: true,
-    engagementScore: 84,
-    pillar: "P1",
-    subTheme: "ScaleVsBoutique",
-    keywords: ["EAM Switzerland", "independent wealth manager", "private banker going independent", "FINMA portfolio manager licence"],
-  },
-  {
-    slug: "ubs-integration-career-problem",
-    ogImage: "/og-articles/og-ubs-integration-career-problem.jpg",
-    body: `Let me tell you about two phone calls I had last week.
-
-The first was from a senior RM at UBS in [Zurich](/en/markets/zurich). Twelve years in the business, CHF 800 million book, mostly UHNW clients inherited from the Credit Suisse side. He is watching colleagues get restructured out. He is watching the IT migration disrupt client relationships he spent years building. He wants to explore his options. Fair enough.
-
-The second call was from a head of desk at a mid-sized [Geneva](/en/markets/geneva) bank. She is trying to hire exactly the kind of profile that first guy represents. She has been looking for months. Cannot find the right person.
-
-Here is the problem: when I looked at that first RM's CV, I understood why he would struggle. His profile read like a LinkedIn summary from 2018. CHF 800 million AUM front and centre, a list of employer names, some vague language about delivering bespoke wealth solutions. Nothing that would make a hiring committee sit up.
-
-This is a pattern I see constantly, and the UBS-Credit Suisse integration is making it worse. Thousands of highly competent bankers are about to enter a job market they have not navigated in years, armed with CVs that fundamentally misunderstand what hiring decisions are actually based on.
-
-## The numbers at UBS
-
-Full-year 2025 net profit came in at $7.8 billion, up 53%. Group invested assets crossed $7 trillion for the first time. About 85% of Swiss-booked Credit Suisse accounts have been migrated onto UBS systems. On paper, this is a success story.
-
-But underneath those headline numbers, the human reality is more complicated. The merger swelled UBS's workforce to nearly 120,000 overnight. Roughly 15,000 positions have been eliminated so far, which is less than half the internal target of 35,000 that Bloomberg reported. CEO Sergio Ermotti confirmed in January 2026 that fresh layoffs were coming, and in February he told reporters that the majority of Swiss job reductions would land in the second half of 2026.
-
-The UHNW client migration has been particularly messy. UBS delayed the transfer of ultra-high-net-worth Credit Suisse clients from September 2025 to Q1 2026, spreading them across January, February and March waves. Integration teams were overworked, and some glitches emerged in earlier migration waves. Sources close to the process said UBS was concerned that outflows from former Credit Suisse clients could exceed expected levels during the transition.
-
-What does all this mean in practical terms? It means the talent market in Swiss private banking is about to get significantly more active. Not just because of layoffs, but because of uncertainty. Relationship managers who have spent two years navigating integration fatigue are reassessing. Some will be pushed. Many more will jump.
-
-## The AUM problem
-
-I have placed senior bankers across Geneva, Zurich, [London](/en/markets/london), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore) and other financial centres. I can tell you with confidence that the single most overrated metric in private banking hiring is AUM.
-
-Every RM leads with it. Every CV opens with it. And every hiring committee knows that a headline AUM number, on its own, tells them almost nothing useful about whether this person will generate revenue at their bank.
-
-Here is why. AUM is not a measure of skill. It is a measure of circumstance. Did you build that book yourself, or did you inherit it from a retiring colleague? Are those clients genuinely yours, or are they institutionally loyal to the platform you happen to sit on? Will they follow you, or will they stay where their custody agreements, lending facilities and structured products are housed?
-
-These are the questions hiring managers actually ask. And when your CV does not answer them, you are leaving it to the hiring committee to guess. They will not guess in your favour.
-
-## What actually matters
-
-What actually matters breaks down into a handful of dimensions that most CVs completely ignore.
-
-The first is [portability](/en/portability). Not your total AUM, but what percentage of it would realistically follow you to a new institution. This depends on how you acquired those clients. Self-originated relationships with personal trust are portable. Inherited book clients who have never met you outside of a quarterly review are not. At Executive Partners, we have developed a Portability Score methodology precisely because this distinction is so critical and so poorly understood.
-
-The second is revenue quality. A CHF 1 billion book generating 30 basis points of revenue is fundamentally different from a CHF 400 million book generating 80 basis points. Hiring managers care about net new asset generation, return on assets, and the mix between discretionary mandates, advisory and execution-only. A banker who brings CHF 50 million in genuine net new money per year is more valuable than one sitting on a CHF 2 billion static book that has not grown in five years.
-
-The third is client concentration. If your top three clients represent 60% of your AUM, you are a concentrated risk, not a diversified asset. Banks know that one client departure can destroy your economics. The strongest profiles show a well-distributed book across 30 to 60 relationships, with no single client exceeding 10 to 15% of total assets.
-
-The fourth, and this is the one that separates the serious candidates from the also-rans, is the [business plan](/en/bp-simulator). When I present a candidate to a bank, the first thing they want to see after the CV is a credible three-year business plan. Where will the net new assets come from? What is your pipeline? Which prospects are realistic and which are aspirational? What is your development strategy for existing clients? A banker who can articulate this clearly has done something most of their peers have not: they have thought about their career as a business, not just a job.
-
-## Why this moment is urgent
-
-The talent coming out of this integration is, on average, very good. Credit Suisse had a strong franchise in certain segments, particularly CIS/CEE, Latin America, and Middle Eastern UHNW. Many of the RMs who served those clients are skilled, well-connected, and carry genuine portable relationships. The market knows this. Competing banks, from Julius Baer to EFG to Lombard Odier to Vontobel to UBP to the international players expanding in the region, are actively building capacity to absorb this talent.
-
-But there is a window, and it is not unlimited. The most strategic hiring has already begun. Banks that were waiting for the dust to settle are now moving. The second half of 2026, when the bulk of remaining Swiss job cuts will land, will bring the biggest wave of talent movement. If you are an RM at UBS thinking about your next step, you do not want to be one of 500 people entering the market simultaneously. You want to be positioned before the wave hits.
-
-That means getting your story right now. Not your AUM number. Your story.
-
-What did you actually do during the integration? Did you retain clients through the migration? What was the attrition rate on your book versus the broader portfolio? Did you bring in net new assets despite the turmoil? These are the data points that will differentiate you. The integration, for all its pain, is actually a career asset if you know how to frame it. Anyone who held their book together through the most complex bank merger in history has a resilience narrative that is genuinely compelling.
-
-I also want to address something I hear regularly from senior bankers who say they are not actively looking. In this market, passive is not a strategy. The best roles in private banking are never publicly advertised. They are filled through networks, through headhunters, through referrals. By the time a job appears on LinkedIn, the shortlist has usually been finalised weeks ago.
-
-If you are a senior RM with a genuine book and real client relationships, you owe it to yourself to understand your market value, even if you have no intention of moving tomorrow. Know your Portability Score. Have a current business plan. Keep your CV updated with the metrics that actually matter. Build relationships with the recruiters who specialise in your segment.
-
-Because in this market, the window opens fast and closes faster.
-
-The UBS integration will be substantially complete by the end of 2026. The remaining cuts will be concentrated in the second half of this year, particularly after the IT migration is finalised. Wealth management employees have been relatively protected so far, but as the operational infrastructure consolidates, some client-facing roles will become redundant too.
-
-For competing institutions, this is a generational hiring opportunity. For RMs inside UBS, it is a moment to be honest about whether the post-integration platform serves your clients and your career. And for every senior banker in the market, regardless of where you sit, it is a reminder that your CV is not a historical document. It is a sales pitch. And right now, most of them are pitching the wrong thing.
-
-Stop leading with your AUM. Start leading with what makes you portable, productive, and strategic. That is what gets you hired.`,
-    title: "The UBS Integration Is Exposing a Career Problem Most Senior Bankers Don't Know They Have",
-    date: "2026-03-10",
-    markets: ["CH", "UK", "UAE", "ASIA"],
-    summary: "The single most overrated metric in private banking hiring is AUM. Every RM leads with it. Every hiring committee knows a headline AUM number tells them almost nothing useful about whether this person will generate revenue at their bank.",
-    linkedinUrl: "https://www.linkedin.com/pulse/ubs-integration-exposing-career-problem-most-senior-dont-m-chalem--e8iac/",
-    featured: true,
-    engagementScore: 91,
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    keywords: ["UBS integration", "private banking CV", "AUM portability", "relationship manager hiring"],
-  },
-  {
-    slug: "storm-warning-tariffs-zero-rates-crypto",
-    ogImage: "/og-articles/og-storm-warning-tariffs-zero-rates-crypto.jpg",
-    body: `I need to talk about what just happened. Because if you are a senior RM and you are not connecting the dots between what went down in late February and your own career, you are sleepwalking.
-
-In the space of ten days, three things hit at once.
-
-The US Supreme Court struck down Trump's tariffs 6 to 3, no ambiguity. The IEEPA, the legal basis for the broadest trade levies, was ruled unconstitutional for tariff purposes. Gone. That is $160 billion in duties invalidated, and a refund pile that Reuters and Penn-Wharton estimate at over $175 billion, with zero clarity on how or when anyone gets paid back. And before the ink was dry, Trump announced a replacement 15% global tariff under different legal authority and warned that any country trying to exploit the ruling would get hit harder. So the court said no, and the White House said watch me. Markets did not know whether to rally or panic. They did both.
-
-Same day: US core PCE, the Fed's favourite inflation gauge, printed at 3%. Highest since late 2023. Stagflation is no longer a hypothetical dinner party topic. It is showing up in the data.
-
-And meanwhile, Bitcoin is sitting in the $60,000 to $70,000 range after peaking last year, with spot ETFs bleeding roughly $4 to $4.5 billion over five straight weeks of outflows. The institutional money that poured in during 2024 and 2025 is pulling back.
-
-Now. You might be reading this from your desk in [Geneva](/en/markets/geneva) or [Zurich](/en/markets/zurich) or [Singapore](/en/markets/singapore) thinking, okay, interesting macro stuff, but I have clients to call. That is exactly the problem. This is not background noise. This is the new operating environment for private banking. And it is going to change your job, your product shelf, your comp, and potentially your next career move.
-
-## Your clients are feeling the tariff chaos even if they do not say it
-
-The Supreme Court ruling was supposed to settle things. It did not. The legal basis shifted, the tariffs morphed, and the uncertainty stayed. Nobody knows what the trade landscape looks like in six months.
-
-If you have entrepreneurial clients with manufacturing, supply chains, or export exposure, and most of us do, they are staring at a planning horizon that will not stop moving. The IMF's January 2026 update puts global growth at 3.3%, which sounds okay until you read the fine print: risks tilted firmly to the downside. UNCTAD is more blunt, they say 2.6%. The US should grow around 2.4% but with so much policy noise baked in that the number almost does not matter. Europe is limping at 1.3%.
-
-Clients are asking tougher questions. They want to know what tariff exposure looks like inside their equity allocations. They are worried about the dollar. Rabobank projects EUR/USD at 1.18 within twelve months, and the greenback has been weak. They are hearing about the EU's ReArm Europe defence spending push and asking whether that is a real investment theme or just politics. These are not easy conversations, and the bankers who can navigate them are going to stand out.
-
-For those of us based in Switzerland, there is an extra layer. The SNB cut to 0% in June 2025 and has not budged since. Inflation forecast for 2026: 0.3%. GDP growth: about 1%. According to the EY Banking Barometer 2026, 46% of Swiss banks expect their operating results to decline this year, the worst short-term sentiment in fifteen years. The interest margin windfall from 2022 to 2023 is gone. Commission income keeps sliding. There is no rate hike coming to save anyone, most economists do not expect one until 2027 at the earliest.
-
-So if you are an RM in this market, the question is simple and uncomfortable: how do you justify your seat?
-
-## Crypto just became your problem
-
-I know. Half of you just rolled your eyes. Stay with me.
-
-In January 2026, Bloomberg reported that UBS, the world's biggest wealth manager with over $6 trillion in client assets, is preparing to offer direct Bitcoin and Ethereum trading to select private banking clients. Starting in Switzerland. With plans to expand to Asia and the US.
-
-This is not a fintech startup. This is UBS.
-
-They are not the only ones. Morgan Stanley opened crypto fund access to all wealth management clients in late 2025, not just the high-risk-tolerant ones. BofA and Wells Fargo rolled out spot Bitcoin ETF access for qualified clients. Julius Baer has had digital asset services through AMINA Bank since 2020.
-
-The regulatory picture is what has changed. The US passed the GENIUS Act, creating a federal framework for stablecoins. The CLARITY Act is moving through Congress. The SEC and CFTC launched a joint initiative to harmonise oversight. Goldman Sachs survey data shows 35% of institutions say regulatory uncertainty is the biggest barrier to adoption, and 32% say clarity is the biggest catalyst. That clarity is arriving now.
-
-The numbers are hard to ignore. Spot Bitcoin ETF assets peaked near $115 billion before the recent pullback. Ether ETFs crossed $20 billion. Fair-value accounting rules removed the balance-sheet penalty that used to scare off treasurers.
-
-Within the next year or so, a real share of your UHNW clients will bring this up if they have not already. Not because they are speculating. Because their family office peers in Singapore are quietly allocating 2 to 3% through regulated ETFs. Because their corporate treasury is looking at tokenized bonds. Because their kids think Bitcoin is as obvious as equities. The next generation is not asking permission.
-
-You do not need to become a crypto evangelist. But you do need to be able to hold a credible conversation about it. The difference between direct custody and ETF exposure. What MiCA means for European clients. How tokenization of real-world assets actually works. If you cannot, someone else will have that conversation with your client. And they will not send them back.
-
-## Zero rates and what they mean for your pay
-
-I will be direct. The return to 0% in Switzerland has changed the economics of private banking in ways that are going to hit relationship managers personally.
-
-Swiss bank aggregate net income dropped from CHF 72.3 billion in 2023 to CHF 69.7 billion in 2024. That interest income from SNB sight deposits, CHF 0.8 billion in 2022, then CHF 7.4 billion in 2023, is gone. Commission income is still falling. And with the SNB forecasting 0.3% inflation and most economists seeing no rate hike before 2027, this is the new normal. Not a dip. A reset.
-
-Banks are responding the way banks always respond: cost pressure, revenue scrutiny, and a microscope on RM productivity. Adding relationship managers does not automatically add revenue. Banks have internalized that. They are measuring revenue per RM now, and they are making decisions based on it.
-
-What I am seeing in my placements: banks want candidates who can show active revenue generation, NNA growth, mandate penetration, lending cross-sell. Not just a big AUM number. They are asking about product breadth, structured products, alternatives, private markets, digital assets. And compensation structures are shifting. The guaranteed 18 to 24 month package is getting harder to negotiate. Variable components tied to revenue milestones are becoming the norm, even for senior hires. If you have been in the market recently, you have probably felt this already.
-
-## Where the opportunities actually are
-
-The talent market across the major hubs is uneven right now, and understanding the landscape matters if you are thinking about a move.
-
-Geneva and Zurich are cautious. The UBS-Credit Suisse integration is still displacing people, and zero rates are squeezing every institution's margins. But the flip side is that mid-sized banks, Lombard Odier, Pictet, Julius Baer, Vontobel, EFG, UBP and others, are actively picking up experienced RMs with [portable book](/en/portability)s. The independent asset management sector is also growing and attracting bankers who want more control over their practice.
-
-[Dubai](/en/markets/dubai) is the most active hiring market I see right now. No income tax, a growing UHNW client base, and banks expanding aggressively into Middle Eastern and South Asian wealth. The momentum is undeniable, though the geopolitical situation has introduced variables that did not exist six months ago.
-
-Singapore is hungry but picky. Bank of Singapore is expanding hard, Standard Chartered committed $1.5 billion to affluent banking in Asia. But employment pass rules have tightened, and the talent bottleneck means banks will only move on the most portable, immediately productive candidates. If you cannot demonstrate revenue from day one, Singapore is a tough sell.
-
-[London](/en/markets/london) still works for bankers with strong European and Middle Eastern networks. But it is not a growth story anymore. Post-Brexit complexity and competition from Swiss and Asian hubs have cooled things down.
-
-## What you should actually do with all of this
-
-I will wrap up with three things you can do this week and five things that will determine whether you get hired in this market.
-
-The three conversations: pick up the phone and ask your entrepreneurial clients whether they have stress-tested their business against a permanent 15% global tariff. Most have not, and the banker who raises it first wins the trust. Sit down with your dollar-heavy clients and reframe FX away from direction and toward their actual spending and liability profile. And when crypto comes up, have a sixty-second answer ready: three routes to exposure, ETFs, direct custody, structured notes, each with different risk, tax, and reporting implications. Not a pitch. An informed answer.
-
-The five things banks are screening for: consistent net new asset generation over the past three to five years, new money not inherited growth. Lending penetration, Lombard, mortgages, structured lending. Product breadth beyond vanilla advisory, alternatives, structured products, private markets. Digital asset literacy, can you talk about crypto without either dismissing it or overselling it. And compensation realism, are you flexible on structure, or stuck on the old guaranteed model.
-
-I am in these hiring conversations every week across Geneva, Zurich, Dubai, Singapore, and London. The bar has gone up. The bankers who have kept pace are in the strongest position they have been in for a decade. The ones who have not need to move now before the market decides for them.`,
-    title: "Storm Warning: Tariffs, Zero Rates, and Crypto Are Rewriting the Rules for Private Bankers",
-    date: "2026-03-03",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "In the space of ten days, three things hit at once: the US Supreme Court struck down Trump tariffs, core PCE printed at 3%, and Bitcoin bled $4 billion in ETF outflows. This is not background noise. This is the new operating environment for private banking.",
-    linkedinUrl: "https://www.linkedin.com/pulse/storm-warning-tariffs-zero-rates-crypto-rewriting-rules-m-chalem--uzzfe/",
-    featured: true,
-    engagementScore: 82,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: ["private banking macro", "tariffs wealth management", "crypto private banking", "SNB zero rates"],
-  },
-  {
-    slug: "alternative-investment-tipping-point",
-    ogImage: "/og-articles/og-alternative-investment-tipping-point.jpg",
-    body: `Here is something that should keep private bankers alert: individual investors hold roughly 50% of global capital, but only 16% of alternative investment assets. That 34-percentage-point gap represents the addressable market that the entire wealth management industry is now racing to capture.
-
-This is not just growth. It is a fundamental restructuring of who gets access to institutional-quality investments.
-
-The walls are coming down. Fast.
-
-And if you are a relationship manager still operating on the old playbook where your value comes from exclusive access to private markets, you need to understand what is happening right now.
-
-## The exclusive club just opened its doors
-
-For decades, alternative investments, private equity, private credit, real estate funds, were the playground of the ultra-wealthy. Minimum checks of $5 to $10 million. Complex legal docs. Opaque fee structures. It was designed to keep people out.
-
-The logic was simple: alternatives are complex, illiquid, and require sophisticated understanding. Only accredited investors with substantial capital and financial expertise should participate.
-
-2026 is flipping the script.
-
-Three forces are colliding simultaneously, and their combined impact is reshaping the entire wealth management landscape.
-
-Product innovation is breaking down barriers. Financial institutions are building products that bring private assets into retail portfolios now: target-date funds with built-in PE allocations, interval funds allowing periodic redemptions while maintaining capital for illiquid investments, managed accounts that pool smaller investors to reach institutional minimums, tokenised LP shares, and feeder funds that aggregate retail capital to meet minimum thresholds. The minimums tell the story: traditional private equity at $5 to $10 million minimum, EU ELTIF funds with no minimum whatsoever in many structures, new fintech platforms with fractional positions accessible to retail investors. From $10 million to accessible retail entry points. That is not incremental change. That is disruption.
-
-Regulatory green lights are opening the floodgates. The Trump administration's Executive Order is directing regulators to revisit prior guidance and consider pathways for private assets in defined-contribution plans. The potential scale is staggering: approximately $9 trillion in 401(k) assets could become eligible for alternatives allocation. If even 5% of that capital migrates to alternatives over the next several years, it will fundamentally reshape the industry's asset base. Meanwhile in Europe, ELTIF 2.0 activated January 2024, dramatically lowering barriers and removing minimum investment requirements in many contexts. This is not tentative exploration. Multiple regulatory jurisdictions are moving in lockstep toward the same conclusion.
-
-Technology platforms are providing distribution at scale. Fintech platforms are the distribution infrastructure making democratization real: account opening in minutes via web or mobile, fractional investing breaking down traditional share structures, multiple liquidity options, self-directed execution without broker friction. The result: that 34-percentage-point gap between individuals' share of global capital and their share of alternatives represents the massive addressable market that democratization is designed to capture.
-
-## The numbers that tell the real story
-
-PwC projects private market revenues will hit $432.2 billion by 2030 and account for more than half of total global asset management industry revenues.
-
-But here is the paradox: 68% of every dollar in the industry is consumed by expenses. Fee pressure is acute: cost is now a primary driver of manager selection and replacement decisions across institutional allocators.
-
-This collision between massive revenue growth and relentless fee pressure is forcing the entire industry to choose: scale through democratisation or defend high-margin exclusivity with dwindling addressable markets. Most firms are choosing scale.
-
-## What this means for your business
-
-Your clients now expect what was impossible 18 months ago: direct access to the same PE funds, credit opportunities, and real estate projects that only the ultra-wealthy could reach. This is not aspirational. It is becoming a baseline service expectation.
-
-I am seeing this firsthand in recruitment conversations. In my recent searches across [Geneva](/en/markets/geneva), [Dubai](/en/markets/dubai), and [Singapore](/en/markets/singapore), the compensation discussions increasingly hinge on whether the candidate can articulate how they will deliver private market access to the HNW segment, not just UHNW. That skill set is commanding 20 to 30% premiums over traditional wealth managers.
-
-Oliver Wyman's 2026 Wealth Management Outlook identifies a critical trend: firms are tiering service propositions. The HNW tier with $1 to $10 million in investable assets is becoming digital-first, high-access, largely execution-only services with curated private markets access. The UHNW tier above $10 million remains white-glove service, deeper planning, bespoke structuring, and relationship-driven advice.
-
-This bifurcation is existential. If you cannot deliver private market access to HNW clients through transparent, user-friendly digital interfaces, they will migrate to platforms that can. Your UHNW clients are not going anywhere yet. But your HNW book? That is vulnerable.
-
-## The skills gap nobody saw coming
-
-Deloitte's 2026 investment management outlook is blunt about the talent shift. Demand is rising for product specialisation in alternatives, fundraising expertise, digital fluency and technical integration, and process optimisation. Demand is flat or declining for traditional portfolio construction expertise and passive product knowledge.
-
-Here is what that looks like in practice. The old RM profile: I have relationships with top PE funds and can get my UHNW clients allocated to oversubscribed vehicles. The new RM profile: I can explain to a $2 million client why they should allocate 15% to private credit, which interval funds fit their risk and liquidity profile, how those investments integrate with their taxable accounts, and what the realistic exit scenarios look like over 5 to 7 years. One is relationship leverage. The other is subject matter expertise combined with client education. The latter is what is getting hired in 2026.
-
-## Fee compression is baked into the model
-
-Here is the paradox nobody wants to talk about: democratisation grows total AUM but shrinks profit per AUM. When private market access shifts from exclusive relationship-based sales to scalable digital channels, the friction that justified high advisory fees vanishes. Firms that compensate for margin compression through volume will survive. Those clinging to legacy, high-touch advisory models without demonstrable alpha generation are at risk.
-
-## Private credit: the poster child for democratisation and its risks
-
-Private credit is the best case study for understanding both the opportunity and the danger of democratisation. The sector has exploded: estimates place private credit AUM around $3 trillion at the start of 2025, with projections toward $5 trillion by 2029.
-
-Historically, private credit was purely institutional: large pension funds, insurance companies, and family offices pursuing direct lending strategies that delivered 8 to 12% yields with lower volatility than public markets. Today, retail versions are proliferating: credit interval funds with monthly redemption windows, evergreen structures for continuous retail inflows, 401(k)-eligible private credit funds, BDC structures that trade daily on public exchanges.
-
-For clients, private credit offers higher yields than investment-grade bonds, lower correlation to public equity markets, and exposure to middle-market lending historically inaccessible. For relationship managers, private credit is a portfolio diversifier that actually makes sense for clients in the $1 to $10 million range who need income but can tolerate some illiquidity.
-
-But the risks are amplifying. Valuation opacity is a concern: private credit ratings are issued by firms hired and paid by the issuers themselves. Illiquidity mismatches exist: retail-facing funds promise monthly redemptions, but underlying private loans may not be saleable on the same timeline. If redemption requests exceed available liquidity, funds face forced asset sales at depressed prices or gates that suspend withdrawals entirely. The Boston Federal Reserve has explicitly warned about contagion risk between traditional banks and private credit firms.
-
-Your value as a relationship manager is helping clients distinguish between well-structured interval funds with experienced managers and transparent reporting, versus yield-chasing products with opaque portfolios and liquidity mismatches waiting to blow up. Clients can access private credit through robo-advisors. They cannot get that judgment from algorithms.
-
-## Three questions to ask your clients this quarter
-
-If you are not already having these conversations, start now.
-
-First: how much of your portfolio is allocated to private markets, and how does that compare to your risk tolerance and liquidity needs? Most clients have no idea. They might have BDC exposure buried in a target-date fund. Map it out explicitly.
-
-Second: are you comfortable with the liquidity terms of your existing alternative investments? This is where blow-ups happen. Clients assume they can redeem monthly because the fund offers monthly windows, until redemptions are gated and they realise they are locked in. Walk through realistic liquidity scenarios.
-
-Third: do you want access to private credit, private equity, or real estate, and if so, what outcome are you trying to achieve? This forces clients to articulate why they want alternatives, not just follow the herd. Are they seeking yield? Diversification? Tax efficiency? Capital appreciation? The answer determines the product.
-
-## The bottom line: your moat is shifting
-
-The democratisation milestone marks the moment the industry stopped defending exclusive access and started building scaled, transparent mechanisms for mass participation. Your value proposition is fundamentally shifting.
-
-The old model: keeper of institutional secrets, gatekeeper to exclusive funds. The new model: guide through the alternative investment maze, expert evaluator of democratized products.
-
-Exclusive access is commoditising. Your moat is not restricting client access to private markets. It is helping clients navigate alternatives wisely.
-
-The 2026 relationship manager does not differentiate by gatekeeping. They differentiate by expertise: evaluating which democratised products fit each client's risk profile, time horizon, and liquidity needs. Understanding which private credit managers have robust underwriting processes. Knowing which evergreen structures offer realistic liquidity. Recognising which platforms deliver genuine value versus expensive noise.
-
-Fintech platforms can deliver access. Robo-advisors can allocate capital. But neither can deliver judgment. Judgment requires understanding credit cycles, manager selection, portfolio construction, tax implications, estate planning integration, and behavioral coaching when markets get volatile. That is not scalable. That is not automatable. That is where you come in.
-
-The question is not whether democratisation will reshape private wealth. It is whether you will lead the transition or be disrupted by it.`,
-    title: "The Alternative Investment Tipping Point: Private Wealth is Going Mainstream",
-    date: "2026-02-24",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "Individual investors hold roughly 50% of global capital but only 16% of alternative investment assets. That 34-percentage-point gap represents the addressable market the entire wealth management industry is now racing to capture.",
-    linkedinUrl: "https://www.linkedin.com/pulse/alternative-investment-tipping-point-private-wealth-going-m-chalem--rzfye/",
-    featured: true,
-    engagementScore: 83,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: ["alternatives private banking", "private equity wealth management", "ELTIF private wealth", "alternative investments HNW"],
-  },
-  {
-    slug: "ubs-crossroads-succession-integration",
-    ogImage: "/og-articles/og-ubs-crossroads-succession-integration.jpg",
-    seoTitle: "UBS CEO Succession 2027: What Private Bankers Need to Know Now",
-    seoDescription: "Ermotti exits by 2027. His successor inherits a $7 trillion UBS mid-integration, under FINMA capital pressure and facing US bank competition on Swiss soil. What this means for private banking talent.",
-    body: `The most consequential leadership transition in global private banking is now underway. Sergio Ermotti, the man who was called back from Swiss Re to steer the emergency acquisition of Credit Suisse, has indicated he expects to step down as CEO of UBS by early 2027. In an interview with Swiss newspaper Tages-Anzeiger published in January 2026, Ermotti stated: I will complete the integration of Credit Suisse and remain CEO at least until the end of 2026 or spring 2027. The Financial Times subsequently reported that his departure is expected around April 2027, shortly after the bank's annual general meeting.
-
-What comes next will shape the trajectory of the world's largest wealth manager and with it, the careers and fortunes of thousands of private bankers across every major financial hub.
-
-## The Ermotti legacy: mission nearly accomplished
-
-Love him or not, Ermotti's second stint as CEO has been remarkable. When he returned in April 2023, he inherited a bank that had just absorbed a failing competitor under extraordinary government pressure. The task was clear: integrate Credit Suisse without destroying UBS.
-
-By most measures, he has delivered. UBS shares have surged nearly 30% over the past year. UBS now manages over $6.6 trillion in invested assets, making it the world's largest private wealth manager by a significant margin. In its Q4 2025 earnings report, UBS disclosed that approximately 85% of Swiss-booked Credit Suisse client accounts had been migrated. Cumulative gross cost savings reached $10.7 billion by year-end 2025, with a revised annualized exit-rate target of approximately $13.5 billion by end of 2026.
-
-And the feared capital rule overhaul, which could have required UBS to hold an additional $24 billion in equity, appears to be moving toward a parliamentary compromise. Switzerland's largest political party backed a proposal in January 2026 that would allow UBS to use convertible bonds to meet part of the new capital requirement, sending the stock to a 17-year high.
-
-But Ermotti himself has been careful to distinguish between what has been achieved and what remains. The final and most complex phase of the IT integration, decommissioning Credit Suisse's remaining legacy systems, is happening right now. The bank still needs to fully shut down all remaining Credit Suisse applications by December 2026. This is the phase where things can still go wrong.
-
-## The succession race: who is in the running
-
-Ermotti has stated publicly that he wants to dramatically improve the chances of an internal successor, while the board led by Chairman Colm Kelleher is also evaluating external candidates.
-
-According to multiple reports from Reuters, the Financial Times, and Bloomberg, four internal executives have been most frequently cited as potential successors.
-
-Iqbal Khan is probably the most well-known candidate outside UBS. A former Credit Suisse executive who joined UBS in 2019, he is now Co-President of Global Wealth Management and President of UBS Asia Pacific, based in [Hong Kong](/en/markets/hong-kong). His career trajectory has been meteoric. Khan is widely recognized as a brilliant networker and an aggressive grower who understands the UHNW client segment deeply. His relocation to Asia in 2024 mirrors historical patterns at UBS where international assignments have served as proving grounds for future CEOs. The question mark: his client-facing brilliance has not yet been tested across the full operational complexity of running a universal bank.
-
-Robert Karofsky holds the mirror role to Khan: Co-President of Global Wealth Management and President of UBS Americas. Before wealth management, he led UBS's Investment Bank for years, giving him cross-divisional experience that few candidates can match. He is currently managing through perhaps the most difficult challenge any UBS executive faces: the US wealth management profitability gap. The Americas wealth management pre-tax profit margin rose to approximately 13%, an improvement, but still far below the roughly 30% pre-tax margins reported by competitors such as Morgan Stanley and Merrill Lynch.
-
-Aleksandar Ivanovic is perhaps the most surprising name on the list. The head of Asset Management who joined the Group Executive Board only in March 2024, he began his career as an apprentice at UBS in 1992 and has worked across every division of the bank. His asset management unit has recently outperformed every other division at UBS, a fact that has reportedly impressed the board. He is Swiss, deeply embedded in UBS's culture, and represents a generational shift.
-
-Beatriz Martin became Group COO in January 2026 after leading the non-core and legacy wind-down, the division responsible for dismantling unwanted Credit Suisse assets. She also serves as President of UBS EMEA. Her operational credibility is formidable. However, her career path has been primarily operational, which could be a consideration in a bank where revenue generation is often seen as the ultimate qualification.
-
-## The capital conundrum: Switzerland versus its only global bank
-
-The succession story cannot be understood without grasping the regulatory backdrop. In June 2025, the Swiss Federal Council proposed what UBS publicly called extreme new capital requirements. According to UBS's own statement, the proposals would require the bank to fully deduct investments in foreign subsidiaries from its CET1 capital. UBS estimated this would require approximately $24 billion in additional CET1 capital on top of roughly $18 billion already earmarked due to existing progressive requirements.
-
-UBS has fought this publicly and fiercely. Ermotti warned that such rules would jeopardise the bank's ability to operate from Switzerland. Major shareholder Cevian Capital told the Financial Times that if the reforms passed in their original form, UBS would have no other realistic option than to leave the country.
-
-The mood has shifted, however. A cross-party parliamentary compromise has gained traction, with the key concession being that up to 50% of the capital requirement for foreign subsidiaries could potentially be met with subordinated debt instruments rather than hard equity. The full parliamentary debate is expected later this year, and most observers now expect a workable outcome, though final clarity may not arrive until after Ermotti has departed.
-
-For the next CEO, this is existential. The capital framework will determine how much UBS can invest in growth, how aggressively it can return capital to shareholders, and ultimately whether it can justify its global footprint from a Swiss home base.
-
-## The US wealth problem: pain now, gain later
-
-No analysis of UBS today is complete without addressing what is happening in its Americas wealth management business. According to UBS's Q4 2025 earnings, clients withdrew a net $14.1 billion in the quarter, accelerating from $8.6 billion the previous quarter. For the full year, Americas net new assets were negative, even as Global Wealth Management generated $101 billion in net new assets worldwide.
-
-The advisor departures have been well documented. UBS's voluntary attrition rate historically around 7% per year fell below that average at the start of 2025. People were staying, partly out of genuine loyalty, partly out of caution, partly because the non-solicit and retention arrangements embedded in many integration era contracts made moving costly.
-
-The root cause of the US problem: a deliberate decision by Swiss leadership to restructure US advisor compensation, including eliminating certain team grid arrangements and cutting payout rates for advisors producing between $1 million and $3 million. Ermotti was candid about the trade-off: the bank sacrificed net new money for quality of growth and was willing to lose popularity with advisors who were never growing their business.
-
-UBS has since recalibrated for 2026, reversing some grid cuts and introducing what industry sources describe as the highest top-end payout in the wirehouse business for individual advisors producing $20 million or more. Management expects Americas net new assets to turn positive in the second half of 2026.
-
-But the structural tension remains: Swiss banking culture, where relationship managers are salaried employees, clashes fundamentally with the US wirehouse model, where advisors view themselves as revenue-generating entrepreneurs. The next CEO will need to decide whether UBS truly wants to compete for US wallet share at American cost levels, or will accept a permanently lower margin in exchange for global scale.
-
-## What this all means for private banking talent
-
-Talent is in motion and the window is open. The combination of Credit Suisse integration, US advisor attrition, and leadership uncertainty has created the most fluid talent market in Swiss and international private banking in a decade. Senior RMs with [portable book](/en/portability)s and strong UHNW relationships have extraordinary leverage right now.
-
-The next CEO's profile will signal strategic direction. If Khan gets the job, expect an aggressive push into Asia-Pacific wealth and UHNW growth. If Karofsky prevails, the Americas business will likely get more investment and patience. If Ivanovic surprises, look for a return to UBS's asset management and institutional roots. Each scenario creates different hiring priorities and different opportunities for candidates.
-
-UBS is simultaneously cutting and recruiting. The bank plans to add roles in India while reducing positions in Switzerland, a global rebalancing that will reshape mid-level operations and compliance functions. Meanwhile, client-facing senior bankers remain protected. If you are a revenue generator with a strong book, you have never been more valuable to UBS or to its competitors looking to recruit you.
-
-Regulatory outcomes will determine compensation budgets. If the capital compromise holds, UBS will have significantly more flexibility to invest in talent and pay competitively. If a harder-line proposal resurfaces, expect belt-tightening that could push more bankers toward boutiques and independent wealth managers.
-
-## The bottom line
-
-UBS stands at a genuine inflection point. It has survived what Ermotti himself has called the most complex bank merger in history, doubled its share price, and positioned itself as the undisputed global leader in private wealth. But the next twelve months will determine whether this colossus can transition smoothly to new leadership, complete its technical integration without mishap, resolve its regulatory standoff, and fix its US profitability problem, all at the same time.
-
-For those of us who operate in this ecosystem every day, advising senior bankers on their next move, helping institutions find their future leaders, this is the most consequential period in private banking in a generation. The decisions being made right now at Bahnhofstrasse 45 will ripple through [Geneva](/en/markets/geneva), [Singapore](/en/markets/singapore), [Dubai](/en/markets/dubai), [London](/en/markets/london), and every other financial center for years to come.`,
-    title: "UBS at the Crossroads: Succession, Integration, and the Fight for Its Future",
-    date: "2026-02-17",
-    markets: ["CH", "UK", "US", "ASIA"],
-    summary: "Sergio Ermotti has indicated he expects to step down as CEO of UBS by early 2027. What comes next will shape the trajectory of the world largest wealth manager and with it, the careers of thousands of private bankers across every major financial hub.",
-    linkedinUrl: "https://www.linkedin.com/pulse/ubs-crossroads-succession-integration-fight-its-gil-m-chalem--blsve/",
-    featured: true,
-    engagementScore: 86,
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    keywords: ["UBS CEO succession", "UBS 2026 strategy", "Swiss banking leadership", "private banking talent UBS"],
-  },
-  {
-    slug: "billionaire-ambitions-2025-ubs-report",
-    body: `In December 2025, UBS released its 11th Billionaire Ambitions Report. Global billionaire wealth has reached an all-time high of $15.8 trillion, with 196 new self-made billionaires contributing $386.5 billion. These UHNW individuals are increasingly mobile, strategic, and selective about where they establish their fortunes.
-
-## The new era of billionaire wealth
-
-The 196 new billionaires who emerged in 2025 injected $386.5 billion into the global economy, the second-highest annual increase ever recorded by UBS. Technology sector billionaires saw wealth surge by 23.8%, while industrial wealth recorded the fastest sectoral rise at 27.1%.
-
-Women now comprise 374 billionaires, 12.4% of the total, and their average wealth grew 8.4% to $5.2 billion in 2025, more than doubling the growth rate of men at 3.2%. The next generation of UHNW decision-makers will increasingly include women who have independently built or inherited substantial fortunes.
-
-## The acceleration of generational wealth transfer
-
-In 2025 alone, 91 heirs inherited a record $297.8 billion, 36% more than in 2024, despite fewer people actually inheriting. More than eight in ten billionaires with children express a desire for their heirs to succeed independently. For relationship managers, the advisory conversation must evolve from how do we preserve your wealth to how do we empower your heirs to build their own legacies.
-
-Approximately 860 multigenerational billionaires now oversee $4.7 trillion in combined assets. Second-generation billionaires are growing at 4.6% annually, third-generation at 12.3%, and fourth-generation and beyond at 10%.
-
-## Billionaire mobility: the competitive threat
-
-36% of billionaires have already relocated at least once, and 9% are actively considering doing so. The top three drivers are virtually equal: better quality of life at 36%, major geopolitical concerns at 36%, and tax efficiency at 35%.
-
-The UAE has emerged as the world's leading wealth magnet, projected to attract a record 9,800 millionaires in 2025. Switzerland is still projected to attract 3,000 millionaires and remain the leading private banking center globally, but the differential growth rates signal a troubling long-term trend.
-
-The UK has suffered a historic reversal, experiencing a net outflow of 16,500 millionaires in 2025. This serves as a cautionary tale for Switzerland: even a prestigious financial center cannot take its position for granted if policy frameworks become hostile to wealth accumulation.
-
-## Portfolio transformation
-
-42% of billionaires plan to increase their exposure to emerging markets equities over the next 12 months. Swiss wealth managers anticipate private markets will comprise 18% of UHNWI portfolios by 2027. 66% of billionaires cite tariffs as their top concern for 2026, followed by geopolitical conflict at 63% and policy uncertainty at 59%.
-
-## What this means for Swiss private banking
-
-Swiss private banks must attract relationship managers with expertise in geopolitical risk management, emerging markets strategy, private markets underwriting, and cross-border tax optimization. The era of the generalist relationship manager is ending. With 81% of next-generation inheritors planning to switch banks immediately after inheritance, the current generation of relationship managers has limited time to establish deep enough relationships with heirs to survive succession.
-`,
-    title: "Billionaire Ambitions 2025: What UBS New Report Reveals About UHNW Migration and Portfolio Strategy",
-    date: "2025-12-30",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "UBS released its 11th Billionaire Ambitions Report. Global billionaire wealth has reached an all-time high of $15.8 trillion. These UHNW individuals are increasingly mobile, strategic, and selective about where they establish their fortunes.",
-    linkedinUrl: "https://www.linkedin.com/pulse/billionaire-ambitions-2025-what-ubss-new-report-reveals-m-chalem/",
-    featured: false,
-    engagementScore: 78,
-    pillar: "P1",
-    subTheme: "Positioning",
-    keywords: ["billionaire wealth migration", "UHNW relocation", "UBS billionaire report", "private wealth strategy"],
-  },
-  {
-    slug: "week-impacted-wealth-management-december-2025",
-    body: `Four major developments converged in early December 2025 that fundamentally reshape how we think about wealth management, client expectations, and market positioning.
-
-## Bank of America mainstreamed cryptocurrency
-
-On December 4, Bank of America announced that starting January 5, 2026, all wealth advisors at Merrill, Bank of America Private Bank, and Merrill Edge can now recommend cryptocurrency allocations to any client with no asset minimums. Over 15,000 wealth advisors can now proactively pitch crypto exposure across 70 million customers. The guidance: 1 to 4% allocation depending on risk tolerance.
-
-Until now, crypto was a request-based product reserved for ultra-high-net-worth clients. That restriction evaporated. Morgan Stanley advised 2 to 4% earlier this year. BlackRock recommended 1 to 2%. Fidelity suggested 2 to 5%. The institutions that spent years dismissing digital assets are now scrambling to offer them.
-
-## The billionaire inheritance explosion
-
-UBS released the Billionaire Ambitions Report 2025 the same week. In 2025, 91 individuals inherited their way to billionaire status, collectively acquiring a record $297.8 billion, 36% more than 2024 despite fewer people inheriting. At least 860 multi-generational billionaires now oversee $4.7 trillion in assets. $5.9 trillion will be inherited by billionaire children over the next 15 years.
-
-More than 80% of billionaires with children want them to succeed independently. Yet 43% still want their children to carry on the family business. That tension creates extraordinary opportunity for advisors who can navigate the psychology of succession.
-
-## Consolidation accelerated
-
-Three major M&A announcements in one week: Associated Banc-Corp acquiring American National Corporation for $604 million. Three Danish banks merging to form AL Sydbank. Fairstone Bank acquiring Laurentian Bank for $1.9 billion. Leadership transitions, talent integrations, and organizational restructuring create significant recruitment flux.
-
-## The macro backdrop shifted
-
-The Federal Reserve signaled a more hawkish stance than markets expected, revising down 2025 rate cut projections. Bond markets repriced sharply upward, equity volatility increased, and client conversations about cash positioning became urgent.
-
-## What this week means for your business
-
-Crypto literacy is now table stakes. Your clients will compare your framework against Bank of America's. If you cannot answer, they will wonder what else you are behind on. Multi-generational advisory becomes premium work. The $5.9 trillion inheritance wave is happening now. Advisors who can navigate succession and generational transition will command premium compensation.`,
-    title: "The Week That Impacted Wealth Management: December 2025",
-    date: "2025-12-23",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "Goldman Sachs dropped $2 billion on an acquisition, Blackstone aggressively expanded across Europe, and Switzerland finally got serious about post-Credit Suisse reform. December 2025 is shaping up to be a moment you will reference for years.",
-    linkedinUrl: "https://www.linkedin.com/pulse/week-impacted-wealth-management-december-2025-gil-m-chalem/",
-    featured: false,
-    engagementScore: 75,
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    keywords: ["wealth management December 2025", "Goldman Sachs acquisition", "Blackstone Europe", "Swiss banking reform"],
-  },
-  {
-    slug: "final-chapter-2025-ubs-crossroads",
-    body: `The final weeks of 2025 delivered crucial signals about Switzerland's financial sector, with UBS navigating critical leadership transitions while the banking industry confronted uncomfortable truths about performance.
-
-## The technology leadership shift
-
-UBS announced a significant restructuring. Mike Dargan, the architect of the bank's technology strategy and AI pivot as Group Chief Operations and Technology Officer, stepped down to join Berlin's N26 as CEO. His successor arrangement underscores UBS's priorities: the Group Technology function now reports directly to Beatriz Martin as Group COO from January 1, 2026. This elevation signals that Ermotti's leadership has reframed technology not as an operational detail, but as a strategic imperative.
-
-## The hidden struggle: Credit Suisse integration friction
-
-This technology reshuffle sits atop an uncomfortable reality. UBS is behind schedule on integrating Credit Suisse's ultra-high-net-worth clients. Transfers of certain high-net-worth portfolios were postponed by several months, now scheduled for Q1 2026, originally planned for September 2025. UBS has committed to $13 billion in cost reductions from the merger. If client migrations cannot be delivered smoothly by the March 31 deadline for Swiss accounts, confidence in the broader integration timeline erodes rapidly.
-
-## The capital rules showdown
-
-Swiss lawmakers unveiled a compromise capital regulation proposal on December 12 that immediately propelled UBS shares to a 17-year high: 35.17 CHF, up 4.5%, effectively doubling the stock's value since the 2023 Credit Suisse takeover. The proposal suggests 100% capitalisation of international subsidiaries, with flexibility allowing up to 50% of that requirement to be met through AT1 debt rather than pure equity. UBS estimates the regulatory requirement would demand approximately $8 billion in additional capital.
-
-## Sector-wide reckoning
-
-Eurogroup Consulting delivered a stark verdict: UBS faces structural cost challenges despite strong market conditions. UBS's cost-to-income ratio stands at 81%, among the industry's highest. Leaders like Goldman Sachs, Deutsche Bank, and Barclays maintain ratios near or below 60%.
-
-## The wealth transfer imperative
-
-An estimated $19.4 trillion in wealth is set to transfer to the next generation over the coming decade. UBS's wealth management division is critical to capturing this wave, but only if the Credit Suisse integration enables seamless, personalised client experiences. Platform migration delays create competitive vulnerability: clients unhappy with service transitions may shift assets to Julius Baer, Pictet, or cross-border competitors.`,
-    title: "The Final Chapter of 2025: UBS at the Crossroads as Swiss Banking Faces Its Moment of Truth",
-    date: "2025-12-22",
-    markets: ["CH", "UK", "US"],
-    summary: "UBS announced a significant restructuring as Group COO Beatriz Martin takes over technology on January 1, 2026. The Credit Suisse integration is entering its most complex phase, with ultra-high-net-worth client migrations delayed to Q1 2026.",
-    linkedinUrl: "https://www.linkedin.com/pulse/final-chapter-2025-ubs-crossroads-swiss-banking-faces-gil-m-chalem/",
-    featured: false,
-    engagementScore: 76,
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    keywords: ["UBS 2025 results", "UBS COO", "Swiss banking 2025", "Credit Suisse integration delay"],
-  },
-  {
-    slug: "swiss-banking-pivotal-week-ubs-17-year-high",
-    body: `What a week for Swiss private banking. Between UBS shares hitting their highest level since the 2008 financial crisis, the Federal Reserve's latest rate decision, and accelerating consolidation, we are witnessing fundamental shifts that will define wealth management for years.
-
-## UBS gets regulatory relief
-
-On December 12, UBS stock soared over 4.5% to its highest point since February 2008, a 17-year peak. Swiss lawmakers unveiled a capital compromise that significantly softens the regulatory burden. The original government proposal would have required UBS to hold 100% capital backing for foreign subsidiaries, up from 60%, demanding roughly $24 billion in additional equity. The compromise allows use of AT1 bonds instead of pure equity for these subsidiaries, representing substantial cost savings.
-
-## Global rate divergence
-
-The Federal Reserve delivered its third consecutive rate cut of 2025 on December 10, bringing rates to 3.5 to 3.75%. But officials signaled a sharp slowdown ahead, projecting just one rate cut for all of 2026. Meanwhile, the SNB held steady at 0% with Swiss inflation at 0.0% and GDP growth expected around 1% for 2026. For wealth managers, this divergence creates interesting positioning opportunities but also signals slowing global growth that HNWI clients with equity allocations need to consider.
-
-## The uncomfortable truth: 10,000 more jobs
-
-Behind the celebratory headlines lies a harsher reality. UBS is planning to cut an additional 10,000 jobs by 2027, roughly 9% of its current workforce. UBS has already trimmed approximately 15,000 positions since acquiring Credit Suisse. The bank says cuts will be minimised through natural attrition, early retirement, and internal mobility. But a 10,000-person reduction would bring headcount to roughly 95,000, a 14% decline from the post-merger peak.
-
-## The consolidation wave accelerates
-
-The number of Swiss private banks fell from 85 at the start of 2024 to fewer than 80 by year-end. PwC projects this number will fall below 60 within a few years. Recent major deals: Gonet and ONE swiss bank completing their [Geneva](/en/markets/geneva) merger; UBP acquiring Societe Generale Private Banking in a CHF 15.1 billion deal; J. Safra Sarasin completing a majority-stake acquisition of Saxo Bank, the largest Swiss private banking deal in over a decade.
-
-## Performance scorecard
-
-AUM growth leaders: UBS Global Wealth Management over USD 4 trillion. Pictet reached CHF 724 billion, up 14%. Julius Baer hit CHF 497.4 billion, up 16.4%. EFG International reached CHF 165.5 billion, also up 16.4%. Almost all major competitors posted double-digit AUM growth. Bankers who can demonstrate [portable book](/en/portability)s and cross-border expertise remain in high demand.`,
-    title: "Swiss Banking Pivotal Week: UBS Hits 17-Year High While Industry Reshapes",
-    date: "2025-12-15",
-    markets: ["CH", "UK", "US"],
-    summary: "UBS stock soared over 4.5% to its highest point since February 2008 after Swiss lawmakers unveiled a capital compromise. Meanwhile the bank plans to cut 10,000 more jobs by 2027. The consolidation wave is accelerating.",
-    linkedinUrl: "https://www.linkedin.com/pulse/swiss-bankings-pivotal-week-ubs-hits-17-year-high-industry-m-chalem/",
-    featured: false,
-    engagementScore: 77,
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    keywords: ["UBS share price", "Swiss banking consolidation", "UBS capital rules", "private banking M&A 2025"],
-  },
-  {
-    slug: "this-week-changed-everything-december-2025",
-    body: `Four major developments converged in early December 2025 that fundamentally reshape wealth management. If you work in this space, you need to understand what happened.
-
-## Bank of America mainstreamed cryptocurrency
-
-Bank of America announced that starting January 5, 2026, all wealth advisors at Merrill, Bank of America Private Bank, and Merrill Edge can now recommend cryptocurrency to any client with no asset minimums. Over 15,000 advisors can now proactively pitch crypto exposure. The guidance: 1 to 4% allocation depending on risk tolerance.
-
-Until now, crypto was request-based, reserved for ultra-high-net-worth clients. That restriction evaporated. Morgan Stanley advised 2 to 4% earlier this year. BlackRock recommended 1 to 2%. Vanguard announced it is opening crypto ETF access to all clients. Your clients will ask about crypto. Having a clear framework is not optional anymore.
-
-## The billionaire inheritance explosion
-
-UBS released the Billionaire Ambitions Report 2025. In 2025, 91 individuals inherited their way to billionaire status, collectively acquiring a record $297.8 billion, 36% more than 2024. At least 860 multi-generational billionaires now oversee $4.7 trillion in assets. $5.9 trillion will be inherited by billionaire children over the next 15 years.
-
-More than 80% of billionaires with children want them to succeed independently. Yet 43% still want them to carry on the family business. That tension creates extraordinary opportunity for advisors who navigate the psychology of succession.
-
-## Three major M&A deals in one week
-
-Associated Banc-Corp acquiring American National Corporation for $604 million. Three Danish banks merging to form AL Sydbank. Fairstone Bank acquiring Laurentian Bank for $1.9 billion. Leadership transitions and talent integrations create significant recruitment opportunities across all three.
-
-## The macro backdrop shifted
-
-The Federal Reserve signaled a more hawkish stance than markets expected, revising down 2025 rate cut projections to just 2 cuts. Bond markets repriced sharply upward. Equity volatility increased particularly in tech and AI stocks. Client conversations about cash positioning and bond allocations became urgent.
-
-## The velocity of change
-
-What strikes me most is not any single announcement. It is the velocity of change. The firms that adapted fast, those that built crypto capabilities, family office expertise, and digital-first operating models, are now clearing their competition. The window is open. The question is whether you are positioned to act.`,
-    title: "This Week Changed Everything: Four Events Reshaping Wealth Management",
-    date: "2025-12-09",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "Bank of America announced all 15,000 wealth advisors can now recommend cryptocurrency to any client. UBS released the Billionaire Ambitions Report showing $297.8 billion inherited in 2025. Three major M&A deals announced in one week.",
-    linkedinUrl: "https://www.linkedin.com/pulse/this-week-changed-everything-four-events-reshaping-wealth-m-chalem/",
-    featured: false,
-    engagementScore: 79,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: ["Bank of America crypto", "wealth management crypto", "billionaire inheritance 2025", "banking M&A December 2025"],
-  },
-  {
-    slug: "2025-bonus-outlook-senior-rms",
-    ogImage: "/og-articles/og-2025-bonus-outlook-senior-rms.jpg",
-    body: `In 2025, bonus expectations across private banking remain moderate but stable, with a clear trend toward rewarding measurable performance: [portable book](/en/portability)s, AUM retention, return on assets, and net new money. Regional variances reflect local dynamics, but the need for top talent with proven client loyalty is universal.
-
-## Switzerland: multipliers in the 1.8x to 2.3x range
-
-Swiss banks continue to reward top senior RMs with bonus multipliers between 1.8x and 2.3x base salary, particularly those managing UHNW clients with portfolios from CHF 120 million to CHF 250 million. The emphasis is on sustained AUM retention and cross-border advisory skills, with additional signing bonuses up to 20 to 25% linked to trailing revenues.
-
-## [Dubai](/en/markets/dubai): wider range and higher acceleration
-
-Dubai leads the GCC with bonus accelerations beyond Swiss levels for RMs demonstrating strong portable books and deep GCC and NRI client relations. Bonus multipliers range from 2.0x to upwards of 3.0x base salary. Recruitment is aggressive, reflecting rapid regional wealth growth.
-
-## [London](/en/markets/london): selective increases for platform switches
-
-London's private banking bonuses are cautiously positive, with stable multipliers from 1.7x to 2.2x base salary. Switchers to Tier 1 platforms frequently secure signing bonuses representing 15 to 30% of base.
-
-## New York: premium multipliers for client revenue growth
-
-New York places a strong premium on revenue growth and portable book size, rewarding senior RMs with multipliers from 2.0x to 2.8x. Performance benchmarks emphasize new asset inflows and high ROA, with discretionary bonuses up to 40% for exceptional contributors.
-
-## [Hong Kong](/en/markets/hong-kong): demand spurs higher bonus potential
-
-Hong Kong's competitive market sees multipliers in the 2.0x to 2.7x range for senior RMs with strong client books, particularly those navigating Greater Bay Area opportunities.
-
-## Key takeaways
-
-Swiss and Dubai markets offer the most aggressive multiplier potential for portable books. Asia-Pacific hubs reward multi-jurisdictional and sustainable wealth expertise. London and New York provide premium signing bonuses for top talent.
-
-Your bonus will increasingly depend on AUM retention, NNM, ROA, and relationship quality. The guaranteed 18 to 24 month package is getting harder to negotiate. Variable components tied to revenue milestones are becoming the norm. Maximum leverage exists after bonus visibility but before payment. Banks price lateral hires based on expected revenue transfer, not speculation. Those who understand the structure, timing, and portability dynamics negotiate from strength.`,
-    title: "2025 Bonus Outlook: What Senior RMs Should Expect",
-    date: "2025-11-27",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "In 2025, bonus expectations across private banking remain moderate but stable, with a clear trend toward rewarding measurable performance metrics such as portable books, AUM retention, return on assets, and net new money.",
-    linkedinUrl: "https://www.linkedin.com/pulse/2025-bonus-outlook-what-senior-rms-should-expect-gil-m-chalem/",
-    featured: false,
-    engagementScore: 81,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: ["private banking bonus 2025", "relationship manager compensation", "Swiss private banking salary", "private banker bonus Dubai"],
-  },
-  {
-    slug: "ubs-vs-switzerland-24-billion-question",
-    ogImage: "/og-articles/og-ubs-vs-switzerland-24-billion-question.jpg",
-    body: `On November 16, 2025, the Financial Times reported that UBS Chairman Colm Kelleher had held private discussions with US Treasury Secretary Scott Bessent about potentially relocating UBS's headquarters from [Zurich](/en/markets/zurich) to the United States.
-
-Within hours, UBS issued a formal statement reaffirming its commitment to Switzerland.
-
-The stock barely moved. Investors were not shocked. They were vindicated. The market had been pricing in this possibility for months.
-
-But here is what most commentators missed: this is not about the US wanting to steal a Swiss bank. It is about Switzerland potentially pricing UBS out of its own home.
-
-## The headline that shook global finance
-
-When news broke that UBS's chairman was discussing a headquarters relocation with the US Treasury, the initial reaction was predictable: the Americans are raiding Swiss banking. Wrong narrative.
-
-The real story is far more nuanced and infinitely more consequential. This is about capital adequacy rules, regulatory leverage, and the price of staying Swiss. It is about whether a global mega-bank can afford to be domiciled in a country that is increasingly expensive to operate from.
-
-Switzerland reaffirmed its commitment to keeping UBS headquartered in Zurich. Good theater, necessary politics. But the underlying tension remains unresolved.
-
-## The regulatory squeeze: how Switzerland created this problem
-
-To understand why UBS's chairman would even have this conversation with the US Treasury, you need to understand Switzerland's regulatory architecture and the capital requirements crushing the bank's profitability.
-
-Switzerland does not just regulate banks, it over-regulates them. This is by design. After the 2008 financial crisis and the near-collapse of UBS itself in 2009, Swiss regulators implemented some of the world's most stringent capital requirements.
-
-The Swiss Financial Market Supervisory Authority and the Swiss National Bank implemented requirements that treat systemically important banks, particularly UBS, with exceptional severity. UBS is subject to a leverage ratio of 3.2%, higher than most global banks, capital buffer requirements that exceed Basel III minimums, liquidity coverage ratios that demand extraordinary cash reserves, and stress testing frameworks designed for worst-case scenarios.
-
-The math is brutal. These requirements force UBS to hold capital that could otherwise be deployed for revenue-generating activities. In a competitive global market, this is a competitive disadvantage, one that costs billions annually in foregone returns and constrained growth.
-
-## The $24 billion question
-
-Here is where it gets serious: Switzerland's regulatory framework potentially costs UBS approximately $24 billion in capital that could be deployed elsewhere under different jurisdictions' rules.
-
-This is not speculation. Global banking analysts have modelled what UBS's capital requirements would be under various regulatory regimes. Under Swiss rules: substantially elevated requirements. Under US Federal Reserve rules: moderately stringent but with more flexibility. Under UK PRA rules: comparable to US but with different stress scenarios. Under [Singapore](/en/markets/singapore)'s MAS rules: lighter touch for certain portfolios.
-
-That $24 billion differential represents real economic pressure. It is the difference between deploying capital for client services, technology investment, and shareholder returns versus holding it in non-yielding regulatory compliance buffers.
-
-For decades, UBS accepted these costs as the price of being Swiss. Switzerland's stability, regulatory reputation, and political neutrality were worth the capital burden. But in 2025, three forces converged to change this calculation.
-
-First, the post-Credit Suisse integration added complexity and regulatory oversight. FINMA's conditions for approving the merger included even more stringent capital requirements for the combined entity. Second, newer wealth management platforms operating from less-regulated jurisdictions are taking market share. They can deploy capital more freely, creating pricing pressure on traditional models. Third, the administration transition in the US created an opening. Treasury Secretary Scott Bessent signalled openness to discussing regulatory frameworks that would make headquarters relocation attractive, potentially with capital relief as an incentive.
-
-## Why UBS's chairman had this conversation
-
-Colm Kelleher did not wake up one morning and decide to betray Switzerland. The conversation happened because the regulatory math no longer works.
-
-UBS manages USD 4.7 trillion in invested assets globally. To remain competitive against Morgan Stanley, Goldman Sachs, JPMorgan, and emerging wealth platforms, the bank needs capital flexibility. Under current Swiss rules, profitability is constrained by capital requirements, growth is limited by regulatory buffers, competitive positioning deteriorates annually against less-regulated rivals, and shareholder returns are below market expectations. This is not a hypothetical concern. It is a quarterly earnings reality.
-
-When Bessent and Kelleher met, they likely discussed regulatory arbitrage: could the US offer a framework where UBS's capital requirements decline by 15 to 20%, freeing billions in deployable capital? They also discussed systemic bank status: would UBS receive globally systemically important bank designation under US rules, potentially with different capital treatment than Swiss jurisdiction provides? And tax and legal benefits: what incentives could the federal government offer beyond regulatory relief?
-
-The conversation was not about relocation happening tomorrow. It was about creating leverage for renegotiating Switzerland's capital rules.
-
-## Why Switzerland did not panic — but should be worried
-
-When UBS's formal statement reaffirmed commitment to Switzerland, the Swiss government likely knew this conversation was coming. The stock barely moved because investors had already priced in the possibility.
-
-But here is what is unsettling for Switzerland: the conversation happening at all represents a fundamental shift.
-
-For 150 years, Swiss banking was synonymous with stability, neutrality, and regulatory excellence. UBS relocated to Switzerland in 1912. It has been headquartered in Zurich ever since, through both world wars, through the 1980s Latin American debt crisis, through 2008 to 2009.
-
-The fact that the chairman would discuss relocation suggests that regulatory stability and political neutrality are no longer sufficient compensation for being locked into expensive capital requirements.
-
-## The larger implications for global banking
-
-This is not really about UBS leaving Switzerland. It is about three deeper shifts reshaping global banking architecture.
-
-Capital requirements are becoming competitive weapons. Regulators globally now understand that capital requirements directly impact competitiveness. The era of viewing capital requirements purely as safety measures is over. They are now strategic tools for attracting or repelling financial institutions.
-
-Regulatory arbitrage is legitimate strategy. The conversation between UBS and Treasury signals that major financial institutions will increasingly shop for optimal regulatory jurisdictions. The traditional model, you are Swiss so you operate under Swiss rules, is dissolving.
-
-Switzerland's regulatory premium is eroding. For decades, being Swiss meant paying a regulatory premium but gaining credibility. That premium is no longer automatically worth the cost. UBS's willingness to discuss relocation proves that regulatory reputation alone cannot overcome competitive disadvantage.
-
-## What happens next
-
-UBS will not relocate, at least not immediately. The political costs are too high, and Switzerland will likely make regulatory concessions to keep its flagship bank.
-
-But watch for regulatory negotiations: expect Switzerland to announce capital relief measures for UBS, demonstrating that Swiss regulation can be competitive while maintaining safety standards. Watch for structural changes: UBS may spin off certain divisions to lower-cost jurisdictions, Singapore, [Dubai](/en/markets/dubai), or potentially the US, without full relocation. A middle path that achieves capital efficiency without political upheaval. And watch for precedent setting: other major financial institutions will watch closely. If Switzerland grants UBS concessions, the negotiation playbook changes for everyone.
-
-## The bottom line: a system under pressure
-
-Switzerland built the world's most trusted banking system through regulatory excellence and political neutrality. That system is now being tested by economic forces that those tools alone cannot manage.
-
-UBS's chairman discussing relocation with the US Treasury is not a threat to Switzerland. It is a warning. It means that regulatory reputation and political stability, while valuable, have become table stakes rather than competitive advantages.
-
-The real question is not whether UBS will leave Switzerland. It is whether Switzerland can evolve its regulatory framework fast enough to keep global finance institutions competitive while domiciled there.
-
-That is the conversation happening behind closed doors in Bern right now. And the market is watching very carefully.`,
-    title: "UBS vs. Switzerland: The $24 Billion Question That Could Redraw Global Banking Map",
-    date: "2025-11-25",
-    markets: ["CH", "UK", "US"],
-    summary: "UBS Chairman Colm Kelleher held private discussions with US Treasury Secretary Scott Bessent about potentially relocating UBS headquarters from Zurich to the United States. This is about Switzerland potentially pricing UBS out of its own home.",
-    linkedinUrl: "https://www.linkedin.com/pulse/ubs-vs-switzerland-24-billion-question-could-redraw-global-m-chalem/",
-    featured: false,
-    engagementScore: 84,
-    pillar: "P1",
-    subTheme: "Positioning",
-    keywords: ["UBS headquarters relocation", "UBS Switzerland capital rules", "Swiss banking regulation", "UBS US relocation"],
-  },
-  {
-    slug: "swiss-banking-earthquake-credit-suisse",
-    body: `When UBS acquired Credit Suisse in March 2023, few understood the magnitude of what was actually happening.
-
-It was not just a bank rescue. It was the beginning of a complete restructuring of Swiss private banking that will define careers, determine winners and losers, and create wealth building opportunities for those positioned correctly.
-
-Nearly three years later, the seismic waves are still reverberating and the real story is just beginning.
-
-## The scale of what is happening
-
-In July 2024, Credit Suisse was officially dissolved from the Swiss commercial register. That legal milestone represented something far more consequential: the beginning of the largest client migration in modern banking history.
-
-Approximately 1.5 million Credit Suisse customer accounts are being transferred to UBS systems throughout 2025. To put that in perspective: this is the biggest operational challenge any bank has undertaken, combined with the greatest market opportunity for competitors in over a decade.
-
-But here is what most observers are missing: the integration is failing in ways that create unprecedented opportunities for everyone else.
-
-## The UBS paradox: dominance masking dysfunction
-
-UBS now manages over $4.2 trillion in Global Wealth Management invested assets, an unprecedented concentration of wealth management power in Switzerland. It should be unstoppable. It is not.
-
-Since the acquisition, approximately 500 client advisors managing roughly $20 billion in assets have departed UBS. CEO Sergio Ermotti has acknowledged that further outflows are inevitable. Translation: the bank knows talent is bleeding out and cannot stop it.
-
-More alarming: UBS recently delayed the migration of ultra-high-net-worth clients to Q1 2026 due to technical glitches, system outages, and concerns about higher-than-expected client attrition rates. The bank is struggling with the very thing it should be best at: moving sophisticated wealth relationships.
-
-## The cultural clash that is breaking the merger
-
-This is not just a technology problem. It is cultural civil war.
-
-Credit Suisse's culture was built on risk-taking that appealed to Southeast Asian tycoons and Chinese tech entrepreneurs. UBS's culture, shaped by the trauma of 2008, is risk-averse and conservative. You cannot merge those cultures overnight, especially when one is absorbing the other under emergency conditions.
-
-Relationship managers are anxious. Clients are uncertain. And the longer the merger drags on, the more both groups look at alternatives. That is when competitors strike.
-
-## The consolidation tsunami: from 160 banks to fewer than 80
-
-Here is the staggering reality of what is happening to Swiss private banking.
-
-In 2010, Switzerland had 160 private banking institutions. Today, just 85 at the start of 2024, with projections indicating fewer than 80 will remain by the end of 2025. This represents the most active consolidation period since the 2008 financial crisis. Nine major deals were announced in just ten months between late 2024 and early 2025. Industry experts predict the number could fall to 50 or fewer by 2030.
-
-The largest transaction of the past decade exemplifies this trend: Safra Sarasin's acquisition of Saxo Bank with CHF 88 billion in client assets. Then Union Bancaire Privee acquired Societe Generale Private Banking with CHF 15 billion in AUM.
-
-Translation: mid-sized institutions are consolidating frantically because they understand the math. Stay independent and get crushed. Merge strategically and survive.
-
-But here is the paradox: while consolidation accelerates, certain boutique banks are thriving by doing the opposite.
-
-## The boutique advantage: why smaller can win
-
-This is where the opportunity becomes crystal clear.
-
-Smaller private banks achieved comparable assets under management and net new money growth rates to their largest counterparts in 2023. Why? Former Credit Suisse clients were actively seeking smaller, more specialized institutions as their preferred wealth management partners. This represents a dramatic shift from historical patterns where scale and brand recognition dominated client decision making.
-
-Swiss private banks collectively employed a record 40,464 full-time equivalents in 2024 despite the reduction in the number of institutions. That means surviving banks are investing aggressively in relationship managers to capture displaced assets. On average, Swiss private banks now employ more staff per institution than at any point in the past decade.
-
-Piguet Galland won Best Private Bank Switzerland 2025 not because of size but because of intimate client relationships and specialized expertise. That recognition signals what clients actually want: personalized service over pure scale.
-
-## The talent exodus: where opportunity actually lives
-
-Here is the uncomfortable truth UBS will not admit: retention bonuses are not working.
-
-Despite offering retention bonuses averaging CHF 100,000 in cash plus equivalent amounts in locked UBS shares, experienced Credit Suisse private bankers continue switching to competitors. Teams of relationship managers have moved to Vontobel, Reichmuth and Co, and other mid-sized Swiss private banks, taking valuable client relationships with them.
-
-This exodus demonstrates a critical insight: financial incentives alone cannot overcome concerns about cultural fit, operational stability, and career prospects.
-
-Julius Baer recruited approximately 190 former Credit Suisse relationship managers in the first year following the acquisition. EFG International, Vontobel, and others similarly invested heavily in recruiting that talent. Why? Because experienced relationship managers are the most efficient path to capturing net new assets. One senior advisor brings $500 million in client relationships. That is worth far more than generic hiring or organic growth.
-
-93% of Swiss private banks plan to hire Client Relationship Managers over the next three years. Yet only 25% of surveyed institutions are satisfied that relationship managers actually achieve their stated asset transfer objectives. Translation: the war for talent is intensifying, but most institutions are losing it.
-
-## What top talent is actually looking for
-
-The recruitment landscape has fundamentally shifted. Younger professionals are not choosing banks based on compensation alone anymore.
-
-Flexibility, work-life balance, and meaningful impact have emerged as critical factors. Banks aligned with sustainability, ethics, and innovation while offering clear career progression demonstrate significant advantages in talent attraction.
-
-The shortage of qualified relationship managers capable of serving UHNW clients with complex, multi-jurisdictional requirements has created a seller's market for top talent.
-
-## The winners and losers emerge
-
-In 2024, Swiss private banks demonstrated remarkable resilience with record assets under management and strong financial performance. But the distribution of success was not equal.
-
-Julius Baer and EFG International both achieved impressive 16.4% year-over-year assets under management growth. Julius Baer positioned itself to capture significant market share from displaced advisors and their client portfolios. EFG International's strategic expansion in Asia delivered consistent client inflows.
-
-Pictet Group recorded 14% growth reaching CHF 724 billion in assets under management. J. Safra Sarasin distinguished itself with a cost-income ratio under 50%, demonstrating remarkable capital efficiency.
-
-These performance metrics reveal that Swiss wealth management excellence transcends pure scale. Profitability, operational discipline, and client satisfaction remain decisive competitive advantages.
-
-## For mid-sized Swiss banks: a once-in-a-generation window
-
-EFG International, Lombard Odier, Union Bancaire Privee, Edmond de Rothschild, and other mid-sized Swiss private banks face a defining moment.
-
-The Credit Suisse collapse has shaken confidence in mega-bank models, giving these institutions the opportunity to position themselves as attractive alternatives offering stability, continuity, and personalized attention.
-
-Success requires demonstrating not merely that they are different from UBS, but that their business models, risk management, and client service philosophies offer superior long-term value.
-
-Geographic expansion combined with product diversification has proven essential. Banks that expanded into Middle Eastern markets, strengthened Asian presence, and developed specialized capabilities in sustainable finance, family office services, and digital assets have achieved superior risk-adjusted returns and client retention.
-
-## For relationship managers: the seller's market
-
-The current environment presents unprecedented career opportunities for relationship managers with strong client relationships, multi-jurisdictional expertise, and proven track records in HNW and UHNW segments.
-
-Professionals considering career moves should evaluate employers based on institutional stability, cultural alignment, technology infrastructure, compensation structure, and long-term strategic positioning, not immediate financial incentives alone.
-
-Investment in continuous professional development, particularly in digital literacy, sustainable finance, alternative investments, and regulatory compliance, enhances career prospects and client service capabilities.
-
-The most successful relationship managers combine traditional private banking expertise with modern technological fluency and deep understanding of evolving client needs across generations.
-
-## For international players: Goldman Sachs just proved it works
-
-Foreign banks capitalizing on uncertainty are surprising everyone. Goldman Sachs has topped traditional Swiss private banking rivals in recent performance rankings, shaking up industry perceptions about the dominance of heritage Swiss institutions.
-
-Standard Chartered, Deutsche Bank, HSBC, and other international banks with Swiss operations are strategically positioning themselves to attract relationship managers and clients seeking alternatives to UBS.
-
-## The bottom line
-
-The UBS-Credit Suisse integration represents far more than the combination of two banking institutions. It marks a fundamental restructuring of Swiss private banking that will define competitive dynamics, talent flows, and client behavior for the next decade.
-
-The delayed client migrations, ongoing talent exodus, and persistent integration challenges demonstrate that even well-capitalized institutions with sophisticated management teams face extraordinary complexity when merging operations of this magnitude.
-
-For competing institutions, the structural changes create a once-in-a-generation opportunity to capture market share, attract top relationship management talent, and establish differentiated positioning based on stability, personalized service, and specialized expertise.
-
-Success requires bold strategic vision, disciplined execution, and sustained investment in three pillars of competitive advantage: exceptional talent, superior client service, and operational excellence.
-
-The Swiss private banking sector will emerge from this transformation period more consolidated, technologically advanced, and globally competitive, but success will not be evenly distributed.
-
-Institutions that recognize the magnitude of the opportunity, act decisively to capture displaced talent and assets, and maintain unwavering focus on client needs will thrive in the post-Credit Suisse era. Those that hesitate, maintain outdated business models, or fail to invest adequately in talent and technology risk becoming the next consolidation targets in an industry where scale, specialization, and service excellence increasingly determine survival.
-
-The opportunity is now. The window is closing. The question is: are you positioned to capitalize on it?`,
-    title: "The Swiss Banking Earthquake: How the Credit Suisse Collapse Is Creating the Biggest Opportunity in Private Banking",
-    date: "2025-11-23",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "When UBS acquired Credit Suisse in March 2023, few understood the magnitude of what was actually happening. It was the beginning of a complete restructuring of Swiss private banking that will define careers for a decade.",
-    linkedinUrl: "https://www.linkedin.com/pulse/swiss-banking-earthquake-credit-suisse-collapse-creating-m-chalem/",
-    featured: false,
-    engagementScore: 83,
-    pillar: "P1",
-    subTheme: "M&ARestructuring",
-    keywords: ["Credit Suisse UBS merger", "Swiss private banking opportunity", "private banking talent market", "Swiss banking consolidation"],
-  },
-  {
-    slug: "great-ubs-paradox-us-footprint",
-    body: `UBS just reported $38 billion in global net new assets for Q3 2025 but lost $8.6 billion in the Americas alone. What is really happening?
-
-## The numbers tell a fascinating story
-
-On October 28, 2025, UBS announced record profitability and successful Credit Suisse integration. The headlines were bullish. But buried in the details was a paradox revealing exactly where the world's largest wealth manager, managing USD 4.7 trillion in invested assets, is actually betting its future.
-
-The geographic divergence was stark. Asia-Pacific delivered plus $9.4 billion in net new assets, up 17% year-over-year. EMEA contributed plus $7.3 billion, up 9%. Switzerland added plus $3.2 billion. And the Americas lost $8.6 billion in absolute outflow.
-
-This is not a rounding error or temporary blip. This is a strategic reorientation, and it is happening faster than most observers realize.
-
-## The Americas crisis: more than just integration challenges
-
-Let us be direct: UBS's US wealth management division is hemorrhaging.
-
-In Q3 2025 alone, advisors' assets under management fell by $9 billion as experienced wealth professionals departed. This reflects a deeper structural crisis that goes beyond typical post-merger turbulence.
-
-The smoking gun is the cost-to-income ratio. In the Americas, it hit an alarming 88%, compared to 72% in EMEA and 75% in Asia-Pacific. For context, a healthy ratio sits between 60 and 70%. UBS's US operation is not just inefficient. It is profitability-destroying.
-
-What is driving the exodus? Integration fatigue is a major factor. Credit Suisse advisors who survived the merger face a brutal reality: UBS's rigid compliance frameworks, different compensation models, and centralized technology platforms are suffocating autonomy. Career advisors are not leaving because they lost their jobs. They are leaving because they lost their independence.
-
-Market share is also bleeding. Morgan Stanley and Goldman Sachs are stealing market share in pure US domestic wealth management. In November 2025, an entire team managing $3.7 billion in assets left UBS for Morgan Stanley, a direct, public statement about where talent sees opportunity.
-
-And there is a compensation crisis. UBS announced a new tiered pay system effective January 1, 2026, but it is too little, too late. The bank hired Morgan Stanley veteran Ben Firestein to lead a recruiting surge specifically targeting advisors earning $1 to $3 million annually. Translation: UBS knows it is bleeding talent and is desperate to stop the bleeding.
-
-The uncomfortable truth: UBS has lost confidence it can compete on equal footing in the US domestic market. So it is choosing strategic retreat, doubling down on where it can win, pulling back where it cannot.
-
-## The offshore pivot: where UBS is actually winning
-
-While the US bleeds, UBS is making calculated, aggressive moves everywhere else.
-
-The Middle East is capturing fleeing wealth. UBS opened a new Abu Dhabi branch in 2025, complementing its existing [Dubai](/en/markets/dubai) International Financial Centre operations. The timing is anything but coincidental. UK Prime Minister Keir Starmer's Labour government implemented aggressive capital gains taxes and wealth taxes, sending waves of British and European ultra-wealthy fleeing to lower-tax jurisdictions. Dubai became the destination of choice. Beatriz Martin Jimenez, UBS's EMEA President, stated it plainly: the Middle East is definitely a winner for individuals who have moved away from high-tax systems.
-
-Dubai is not just attracting wealthy individuals anymore. It is becoming the global offshore booking center for wealth that would have previously anchored in Switzerland or [London](/en/markets/london). UBS is positioning itself at the center of that migration.
-
-Asia-Pacific is the real growth story. The $9.4 billion in Q3 net new assets flowed primarily from [Hong Kong](/en/markets/hong-kong), where a recovering IPO market and robust family office activity are generating substantial wealth. UBS won Asia's Best International Private Bank 2025 from Euromoney, recognition driven by consistent execution in a region where other banks are struggling.
-
-But here is the strategic masterstroke that matters most: UBS's exclusive partnership with India's 360 ONE Asset Management, announced April 2025. Rather than building its own India onshore business, which would be complicated, capital-intensive, and a regulatory nightmare, UBS acquired a 4.95% stake in 360 ONE with exclusive rights to manage India's onshore wealth. Simultaneously, UBS retained control of 360 ONE's [Singapore](/en/markets/singapore)-booked offshore clients. Indian clients use 360 ONE for rupee-based investments and UBS for USD and offshore structures. It is elegant architecture that maximizes efficiency while avoiding regulatory complications that would cripple a direct approach.
-
-Singapore remains UBS's critical hub for Non-Resident Indian wealth management, one of the fastest-growing wealth categories globally. In August 2025, UBS reshuffled its NRI team across Singapore and Dubai, signalling aggressive expansion in this high-margin segment.
-
-## The booking center revolution: what this means for private bankers
-
-UBS's geographic pivot reflects a profound structural shift in private banking architecture, one that is reshaping where the actual expertise and compensation lives.
-
-The old model was simple: local onshore advisor, local onshore booking, regulatory complexity handled locally. The new UBS model is different: local onshore advisor connected to offshore booking center in Switzerland, Singapore, or Dubai, with simplified cross-border structuring.
-
-Why does this matter? Everything.
-
-Career trajectory is increasingly geographic. If you are advising clients with cross-border complexity, the real expertise is migrating to offshore booking centers. Singapore, Dubai, and [Zurich](/en/markets/zurich) are where sophisticated advisors are accumulating. The US is increasingly becoming a transaction-focused, client-acquisition role, valuable, but not where strategy is made.
-
-Compensation follows complexity. Advisors managing cross-border relationships, navigating tax treaties, structuring family offices, optimizing international wealth flows, command dramatically higher compensation than pure domestic US advisors. UBS's compensation crisis partly stems from this reality: they are trying to retain experienced advisors in a geography where the work is increasingly commoditized.
-
-Recruitment is flowing offshore. UBS is actively recruiting in Singapore, Dubai, and Hong Kong. The growth is not in New York or Los Angeles. It is in the financial hubs where offshore wealth concentrates. If you are considering your next move as a wealth management professional, geography is destiny right now.
-
-Client intelligence becomes currency. If you advise ultra-high-net-worth clients with international exposure, understanding which booking centers offer optimal tax efficiency, regulatory flexibility, and privacy is now mission-critical. UBS's strategy reveals which jurisdictions the world's largest bank trusts most for sophisticated wealth management.
-
-## The larger implication: too big in the US, right size offshore
-
-UBS's paradox reveals a fundamental truth most banks will not admit: the mega-bank model does not work uniformly across geographies.
-
-In the United States, UBS is trapped between impossible positions. Too large to abandon the market, it manages USD 2.28 trillion in invested assets domestically. Too bureaucratic to compete against nimble regional rivals and specialized boutiques.
-
-The result: selective, strategic retreat. UBS is accepting slower US growth to focus on ultra-high-net-worth relationships and institutional wealth rather than pursuing broad retail expansion it cannot win.
-
-Offshore, UBS has discovered its zone of genius: managing complex, globally mobile wealth for ultra-high-net-worth individuals who demand a true one-stop shop combining tax optimization, regulatory expertise, and sophisticated asset management across multiple jurisdictions.
-
-The bottom line: UBS is not failing in the US. It is reallocating. The bank is consciously accepting slower domestic growth to invest heavily in offshore expansion where profit margins are higher, competitive positioning is stronger, and the future of global wealth actually lives.
-
-## What this means for you
-
-If you are a relationship manager or advisor in the Americas, your skills are valuable, but potentially in the wrong geography. Before you commit to your next five years, honestly assess whether staying in the US market aligns with where UBS and the entire wealth management industry is investing.
-
-If you are based in Asia or EMEA, the resources, compensation, and career acceleration are flowing in your direction. This is your moment to accelerate aggressively. The next five years will determine whether you are positioned at the center of growth or still managing a shrinking pool of legacy relationships.
-
-UBS just told you exactly where they believe the future is. The question is: are you listening?`,
-    title: "The Great UBS Paradox: Why the World Largest Wealth Manager Is Shrinking Its US Footprint While Expanding Everywhere Else",
-    date: "2025-11-19",
-    markets: ["CH", "UK", "US", "ASIA", "UAE"],
-    summary: "UBS just reported $38 billion in global net new assets for Q3 2025 but lost $8.6 billion in the Americas alone. This is a strategic reorientation happening faster than most observers realize.",
-    linkedinUrl: "https://www.linkedin.com/pulse/great-ubs-paradox-why-worlds-largest-wealth-manager-shrinking-m-chalem/",
-    featured: false,
-    engagementScore: 80,
-    pillar: "P1",
-    subTheme: "Positioning",
-    keywords: ["UBS Americas strategy", "UBS Asia expansion", "UBS wealth management", "private banking geographic strategy"],
-  },
-  {
-    slug: "power-shift-private-banking-talent",
-    body: `Something interesting is happening across the global wealth management landscape, a quiet power rebalancing between elite private bankers and the institutions that employ them.
-
-For years, banks made the rules. They defined pay structures, mobility terms, and KPIs. Even the most accomplished relationship managers operated within these limits and accepted them as part of the industry's rhythm.
-
-That mindset is changing. The shift is not dramatic or absolute, but it is noticeable. Across [Geneva](/en/markets/geneva), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore), [London](/en/markets/london), and New York, senior relationship managers with strong, [portable book](/en/portability)s are negotiating from greater strength and doing it with data, not ego.
-
-## What is driving the change
-
-According to the UBS Global Wealth Report 2025, global private wealth grew about 4.6% in 2024, following 4.2% in 2023. The United States added hundreds of thousands of new millionaires that year, now accounting for roughly 40% of global wealth holders.
-
-Switzerland remains exceptional, with average adult wealth around USD 687,000 in 2024, among the highest levels worldwide. Though growth has slowed slightly, the country's role as a global wealth hub remains as relevant as ever.
-
-As wealth pools globalize, the demand for bankers who understand cross-border complexity keeps rising. Those with portable client relationships, jurisdictional know-how, and exposure to alternative investments have become increasingly valuable and increasingly rare.
-
-Private banks remain powerful players, but they now need top performers as much as top performers need them.
-
-## What senior RMs are negotiating today
-
-The traditional 12-month book-transfer model is evolving. Many institutions now recognize that sophisticated, cross-border books require 18 to 24 months for full migration. Especially in regulated centers like Dubai, Singapore, or [Zurich](/en/markets/zurich), staged transition targets help align expectations. This protects client relationships and minimizes compliance risk, benefiting both bank and banker.
-
-European institutions are slowly adapting their pay models to stay competitive. Relocation or market-differentiation allowances, performance metrics built around net new money, and margins rather than pure AUM are becoming standard. US compensation levels remain higher, typically between USD 230,000 and 320,000 for senior RMs at major platforms. But the gap is narrowing as mobility and transparency make market intelligence more accessible.
-
-Top performers are increasingly asking for more than just pay. They want product access: private-market investments, co-investment opportunities, and family-office services. Julius Baer, UBS, and other major players have been expanding their private-market capabilities to meet this demand. Even so, institutions are balancing empowerment with control, ensuring risk management and compliance stay firmly in place.
-
-Client ownership remains a sensitive issue in private banking mobility. Banks are now more deliberate about contractual clarity, specifying who gets credit for origination, booked assets, and future pipeline across desks and geographies. This transparency not only keeps relationships intact but also prevents costly disagreements and client disruption.
-
-## How different markets are evolving
-
-Switzerland's large institutions remain headquartered here, maintaining a dominant market share and wealth density unmatched globally. Senior RMs with strongly portable cross-border books, especially covering the EU, Middle East, or Latin America, retain high strategic value, though onboarding and regulatory scrutiny remain strict.
-
-Dubai has moved firmly into the top tier of wealth hubs over the past few years. Its tax framework, geographic accessibility, and financial regulations make it attractive to both clients and bankers. Competition is heating up for professionals with GCC, India, and Southeast Asia client connectivity, but institutions remain selective on compliance and book validation.
-
-London platforms are doubling down on experienced hires. Firms like UBS, HSBC, Coutts, and J.P. Morgan are focusing on bankers with proven international relationships and immediate client portability. Senior RMs relocating from Latin America, the Middle East, or Africa are often fast-tracked into senior compensation bands.
-
-The United States remains the most competitive private banking market. Firms like Citi, JPMorgan, and boutique platforms increasingly use long-term incentives or equity components to attract mobile global bankers. That said, licensing and compliance requirements keep most banks firmly in control of structure and timing.
-
-Asia's private wealth segment continues steady growth. The strongest demand is for bankers who link ASEAN, China, and GCC wealth flows, particularly those with strong product placement capabilities in private markets.
-
-## The new balance of power
-
-The current environment is not about banks losing control. It is about smarter balance. Institutions are adapting, not surrendering.
-
-Compliance, regulatory, and structural realities still shape final offers, but the conversation has become more mutual. Banks that price talent based on genuine portability and reward long-term relationship quality are winning the talent game.
-
-The private banking world is in motion. Wealth is rising, regulation is tightening, and clients are diversifying beyond borders. That creates a marketplace where both institutions and relationship managers have real influence, but in different ways.
-
-Top RMs now understand their market worth more deeply than ever. Banks know they must evolve their structures to stay competitive, whether through smarter compensation models, longer ramp-up timelines, or genuine platform empowerment.
-
-If you are a senior private banker in Switzerland, Dubai, London, New York, Singapore, or [Hong Kong](/en/markets/hong-kong) with a portable book and want to assess your true market value, the conversation starts with an honest look at what you actually own versus what the institution owns.
-
-The power has shifted. Make sure you are leveraging it.`,
-    title: "The Power Shift: How Private Banking Talent Dynamics Are Evolving",
-    date: "2025-11-18",
-    markets: ["CH", "UK", "UAE", "ASIA"],
-    summary: "Something interesting is happening across the global wealth management landscape — a quiet power rebalancing between elite private bankers and the institutions that employ them. Senior relationship managers with strong portable books are negotiating from greater strength.",
-    linkedinUrl: "https://www.linkedin.com/pulse/power-shift-how-private-banking-talent-dynamics-evolving-m-chalem/",
-    featured: false,
-    engagementScore: 79,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: ["private banking talent", "relationship manager leverage", "private banker negotiation", "wealth management hiring"],
-  },
-  {
-    slug: "unlock-career-move-senior-rms-2025",
-    body: `The private banking recruitment landscape in 2025 is redefining success. Across [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore), and [London](/en/markets/london), the demand for seasoned Senior Relationship Managers who bring proven, portable UHNW and HNW client portfolios has never been stronger.
-
-## The market moment
-
-This is not a typical hiring cycle. It is the confluence of three major structural forces that rarely align simultaneously.
-
-The UBS-Credit Suisse integration continues to displace talent and create client uncertainty at a scale the market has not seen before. Mid-tier Swiss institutions and international banks expanding in key hubs are actively building capacity to absorb both the talent and the clients in motion.
-
-Zero interest rates and compressed margins are forcing every Swiss private bank to scrutinise its revenue per relationship manager ratio more carefully. Banks want proven revenue generators, not development projects.
-
-And the geographic rebalancing of private wealth, with meaningful flows from the UK, from parts of Asia, and from markets affected by geopolitical disruption, is creating client demand that the existing workforce cannot fully serve.
-
-## What the market is paying for
-
-The compensation premium is clearly concentrated around specific capabilities. [Portable book](/en/portability)s with a genuine, documented track record of client follow through transitions. Cross-border advisory competence, particularly for clients navigating multi-jurisdictional complexity. Alternatives expertise, as private markets continue to command a growing share of UHNW portfolio allocation. Language and cultural capability for high-growth client segments. The banker who can demonstrate all four is operating in a market where leverage is genuinely exceptional.
-
-## The preparation that makes the difference
-
-The practitioners who move successfully are those who have prepared with precision. They have done the portability analysis: a clear, client-by-client assessment of what would follow them and what would not. They have developed a [business plan](/en/bp-simulator): a specific, credible projection of net new assets over three years grounded in their actual pipeline. They have reviewed their legal position: notice period, garden leave, non-solicitation provisions. And they have assessed the institutional landscape with genuine rigor: which institutions are growing in their client segment, which are stable, and which are managing their own challenges.
-
-The private banking career move that creates sustainable value is the one that reflects genuine strategic analysis of where your specific skills and client relationships create the most value over a five to ten year horizon. The window is open. The market is paying for the right profiles. The practitioners who move with precision and preparation will find themselves at the beginning of the best chapter of their careers.`,
-    title: "Unlock Your Next Career Move: Senior RMs with Portable Books in the Spotlight",
-    date: "2025-11-18",
-    markets: ["CH", "UAE", "ASIA"],
-    summary: "The private banking recruitment landscape in 2025 is redefining success. Across Geneva, Zurich, Dubai, and Singapore, the demand for seasoned Senior Relationship Managers who bring proven, portable UHNW and HNW client portfolios has never been stronger.",
-    linkedinUrl: "https://www.linkedin.com/pulse/unlock-your-next-career-move-senior-rms-portable-books-m-chalem/",
-    featured: false,
-    engagementScore: 74,
-    keywords: ["private banking jobs Geneva", "senior RM opportunities", "Dubai private banking jobs", "Singapore wealth management careers"],
-  },
-  {
-    slug: "ubs-potential-us-relocation",
-    body: `Picture this: a 162-year-old Swiss banking institution, one with deep roots in [Zurich](/en/markets/zurich) and a name synonymous with Swiss financial tradition, quietly submits an application for a US national bank charter. This is no longer speculation. It is happening now.
-
-UBS's strategic pivot toward the United States represents one of the most consequential shifts in global banking since the 2008 financial crisis.
-
-## The regulatory crossroads
-
-Swiss regulators proposed capital requirements that would force UBS to bolster its loss-absorbing capital by approximately $26 billion, nearly double what global peers like JPMorgan and HSBC must hold. UBS views these requirements as competitively crippling. Senior UBS executives have made their position clear: stay and absorb punishing capital costs, or relocate to a jurisdiction where too-big-to-fail banks operate under more favorable conditions. The Trump administration has already signaled its enthusiasm, with Treasury officials confirming this is what we want.
-
-## More than a headquarters question
-
-In late October 2025, UBS formally applied for a US national bank charter, making it the first Swiss bank to attempt this. A national bank charter would enable UBS Bank USA to accept deposits directly from clients, provide checking and savings accounts, and extend lending capabilities. This represents a fundamental shift from pure wealth advisory to full-service banking, exactly what is needed to compete with domestic US competitors for the mass-affluent segment.
-
-## The competitive urgency
-
-UBS's US wealth division has struggled against Morgan Stanley, Bank of America, and JPMorgan Chase. Pre-tax margins for US wealth operations hover around 4 dollars of profit per 100 dollars of revenue, compared to 25 to 35 dollars for leading competitors.
-
-## The political masterclass
-
-By discussing potential US relocation with the Trump administration, UBS signals to Swiss regulators that it possesses credible alternatives if capital regulation becomes prohibitively stringent. The conversation was not about relocation happening tomorrow. It was about creating leverage for renegotiating Switzerland's capital rules. Switzerland will likely make regulatory concessions to keep its flagship bank.
-
-The question is no longer whether UBS could relocate. It is whether and under what conditions it will.`,
-    title: "Why UBS Potential US Relocation Could Reshape Global Wealth Management",
-    date: "2025-11-11",
-    markets: ["CH", "US"],
-    summary: "UBS formally applied for a US national bank charter the first Swiss bank to attempt this. This is not merely about moving executive offices. It is a comprehensive reimagining of how UBS serves the world most lucrative wealth management market.",
-    linkedinUrl: "https://www.linkedin.com/pulse/why-ubss-potential-us-relocation-could-reshape-global-wealth-m-chalem/",
-    featured: false,
-    engagementScore: 78,
-    pillar: "P1",
-    subTheme: "Positioning",
-    keywords: ["UBS US bank charter", "UBS national bank", "Swiss bank US relocation", "UBS strategy 2025"],
-  },
-  {
-    slug: "what-netflix-knows-wealth-firms",
-    body: `Something fundamental just shifted in wealth management and most firms are missing it. For decades, clients with similar net worths got similar portfolios. Risk questionnaires divided humanity into five boxes. Investment strategies were copy-pasted across thousands of accounts. Not anymore.
-
-Global assets under management hit $159 trillion in 2024, projected to reach $178 trillion by 2029. But 60% of high-net-worth clients now expect personalized portfolios, while 68% demand digital experiences matching Amazon and Netflix. The gap between expectation and delivery is where fortunes will be made and lost.
-
-## The new reality
-
-Millennials and Gen Z are inheriting $83.5 trillion in coming decades. They do not tolerate clunky portals. They demand ESG alignment, crypto exposure, and instant access. When your platform feels like 2005, you are not behind. You are irrelevant.
-
-True hyper-personalization is finally possible. Morgan Stanley's AI Assistant functions as a research analyst, economist, and strategist combined. DBS Private Bank analyzes 15,000 customer data points to generate personalized nudges, product recommendations, and proactive guidance during life transitions. Imagine: your platform detects a promotion via LinkedIn. Within hours, your advisor reaches out with specific recommendations for tax strategy, contribution adjustments, and portfolio rebalancing. That is happening now at leading firms.
-
-## The psychology advantage
-
-AI combined with behavioral finance creates something powerful. When systems detect emotional decision-making, excessive trading during volatility or reluctance to rebalance, advisors intervene with contextual guidance precisely when needed. Not quarterly check-ins that come too late. Real-time support during moments that matter.
-
-## Values meet portfolios
-
-ESG investing will grow from $39.08 trillion in 2025 to $125.17 trillion by 2032. Generic ESG funds fall short. Hyper-personalization delivers granular alignment with individual values. When clients see reports showing tons of carbon avoided, investing becomes values-aligned partnership. That creates advocates, not just clients.
-
-## The hybrid model wins
-
-28% of clients favor digital-only, 35% prefer advisors, 37% want both. Vanguard's Personal Advisor Services grew to $220 billion by combining automated allocation with human guidance. The augmented relationship manager equipped with AI tools delivers strategic recommendations while strengthening human connections.
-
-## The loyalty multiplier
-
-Clients receiving personalized services show significantly higher loyalty: reduced attrition during volatility, higher AUM through referrals, greater wallet share as they consolidate accounts. The digital transformation is not coming. It is here. The question is not whether to personalize. It is how quickly you can implement.`,
-    title: "What Netflix Knows That Your Wealth Firm Doesn't",
-    date: "2025-11-01",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary: "Individual investors hold 50% of global capital but only 16% of alternative assets. Millennials and Gen Z are inheriting $83.5 trillion. The gap between expectation and delivery is where fortunes will be made and lost in wealth management.",
-    linkedinUrl: "https://www.linkedin.com/pulse/what-netflix-knows-your-wealth-firm-doesnt-gil-m-chalem/",
-    featured: false,
-    engagementScore: 76,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: ["wealth management personalization", "AI private banking", "digital wealth management", "next gen wealth"],
-  },
-  {
-    slug: "swiss-private-banking-thriving-against-odds",
-    body: `The Swiss banking world is doing something remarkable. Despite facing the most challenging global environment in years, aggressive US tariffs, currency chaos, and regulatory pressures, Switzerland's private banks are not just surviving. They are thriving.
-
-## The numbers tell a story of resilience
-
-Swiss banks are managing CHF 9.21 trillion in assets under management as of H1 2025. What is truly impressive is not just the size but how these institutions are navigating unprecedented headwinds. President Trump's 39% levy on Swiss exports, the highest in the developed world, is hammering manufacturers and watchmakers. Yet private banks are posting record profits. The Swiss franc has surged 13% against the dollar this year, which should be crushing international earnings. Instead, leading banks are turning these challenges into opportunities.
-
-## The winners are separating from the pack
-
-UBS reported CHF 1,365 million in net profit for H1 2025 and attracted CHF 25.2 billion in net new money. Julius Baer saw underlying net profit jump 11% to CHF 295 million with CHF 7.9 billion in fresh client assets. EFG International posted their best results ever: CHF 221.2 million in profit, up 36%, with CHF 5.4 billion in net new assets. UBP delivered CHF 120.7 million in profit with a rock-solid Tier 1 capital ratio of 21.3%.
-
-## The survival of the fittest
-
-Fewer than 60 pure private banks will likely survive to year-end. Smaller players cannot absorb the compliance costs and technology investments needed to compete. We are already seeing deals like Banque Thaler's sale to Credit Agricole and Kaleido Privatbank's acquisition by Banque Richelieu France.
-
-The survivors are investing heavily in AI, digital wealth platforms, and alternative assets. They are offering sophisticated ESG mandates and crypto solutions to UHNW clients. When chaos creates opportunity, market volatility is actually boosting bank revenues. Higher trading volumes mean more fees.
-
-## The digital arms race
-
-What separates winners from losers is not just investment performance. It is technology. The leading banks are deploying AI to personalize client experiences, automate compliance, and offer 24/7 digital access while maintaining the legendary Swiss personal touch. This is not optional. Client expectations have fundamentally shifted.
-
-## The bottom line
-
-Swiss private banking is not just weathering the storm. It is being forged stronger by it. The combination of capital strength, digital innovation, and centuries of wealth management expertise is proving difficult to replicate. The weak are consolidating out. The strong are pulling away. And the ultra-wealthy are voting with their wallets.`,
-    title: "Swiss Private Banking: Thriving Against the Odds",
-    date: "2025-10-27",
-    markets: ["CH"],
-    summary: "Swiss banks are managing CHF 9.21 trillion in assets under management as of H1 2025. Despite aggressive US tariffs, currency chaos, and regulatory pressures, Switzerland private banks are not just surviving — they are thriving.",
-    linkedinUrl: "https://www.linkedin.com/pulse/swiss-private-banking-thriving-against-odds-gil-m-chalem/",
-    featured: false,
-    engagementScore: 77,
-    pillar: "P1",
-    subTheme: "Positioning",
-    keywords: ["Swiss private banking 2025", "Swiss AUM record", "UBS Julius Baer EFG results", "Swiss banking resilience"],
-  },
-  {
-    slug: "la-dolce-vita-italy-wealth-management",
-    title: "La Dolce Vita Returns: Why Italy Has Become Europe Hottest Destination for Wealthy Individuals and Bankers",
-    date: "2025-10-19",
-    markets: ["EU", "UK", "CH"],
-    summary: "Italy is eating everyone lunch. While Britain was busy dismantling its non-dom regime, Milan quietly became the most attractive destination for mobile wealth in Europe. Goldman Sachs vice chairmen, billionaire industrialists, the kind of money that moves markets.",
-    linkedinUrl: "https://www.linkedin.com/pulse/la-dolce-vita-returns-why-italy-become-europes-hottest-m-chalem/",
-    featured: false,
-    engagementScore: 79,
-    pillar: "P1",
-    subTheme: "Positioning",
-    keywords: ["Italy wealth management", "Milan private banking", "Italy flat tax regime", "UHNW migration Italy"],
-    body: `Something remarkable is happening in European wealth management. Italy is eating everyone's lunch.
-
-While Britain was busy dismantling its non-dom regime and patting itself on the back for fiscal responsibility, [Milan](/en/markets/milan) quietly became the most attractive destination for mobile wealth in Europe. We are not talking about retirees looking for sun. We are talking about Goldman Sachs vice chairmen, billionaire industrialists, and the kind of money that moves markets.
-
-## The tax play that actually worked
-
-In 2017, Italy's government made a bet. They introduced a flat tax regime: a fixed annual payment on all foreign income, regardless of how much you actually earn. No wealth tax. No inheritance tax on offshore assets. No complex reporting requirements.
-
-The pitch was simple and brutal in its effectiveness: pay us a fixed fee, and we will leave the rest alone for 15 years.
-
-Fast forward to 2025, and nearly 1,500 individuals are using the regime. The government clearly knows they are onto something good. They have raised the rate twice, first to EUR 200,000 in 2024, now to EUR 300,000 for new applicants in 2026. Existing participants stay grandfathered at their original rates.
-
-Here is the math that matters: if you are earning EUR 5 million annually in foreign income, paying EUR 200,000 represents a 4% effective rate. Compare that to 40 to 50% in most developed markets. The value proposition is absurd.
-
-Italy ranks third globally for millionaire migration in 2025, attracting an estimated 3,600 HNWIs and $21 billion in private capital.
-
-Critics warn that frequent increases could undermine confidence in the regime's stability, potentially making it appear unpredictable and therefore less appealing to foreign individuals who value long-term certainty. Yet proponents argue that Italy remains attractive compared to other jurisdictions. [Dubai](/en/markets/dubai) may offer zero tax, but Italy offers lifestyle, legal certainty and proximity to core markets. For wealth managers, the key consideration is whether the tax savings justify the annual payment. Advisers say the regime becomes compelling for clients with at least EUR 5 to 10 million in offshore assets, particularly those exiting less predictable tax systems.
-
-## The United Kingdom exodus: Britain's loss, Italy's gain
-
-Rachel Reeves' decision to scrap the UK's 200-year-old non-dom regime in April 2025 triggered the fastest wealth exodus from Britain in modern history.
-
-UBS projects a 17% decline in UK millionaires by 2028. An estimated 16,500 millionaires left Britain in 2024, taking $92 billion with them. [London](/en/markets/london) has lost 30,000 millionaires over the past decade.
-
-Then came the Richard Gnodde moment. Goldman's vice chairman, the person who built their international operations from a few dozen London employees into a global powerhouse, relocated to Milan in April 2025. Others followed: Nassef Sawiris, Lakshmi Mittal, Yoel Zaoui. These are not passive wealth holders. They are operators.
-
-The pattern is self-reinforcing. Wealthy clients move to Milan. Their bankers follow to service them. More financial infrastructure appears.
-
-## Milan: Europe's new financial powerhouse
-
-Milan's transformation from regional financial center to genuine European powerhouse represents one of the most remarkable urban economic stories of the 2020s. By end-2023, Italy's economy was 4.3% larger than pre-pandemic levels, stronger than Britain, Germany, or France.
-
-Italian private banking AUM hit EUR 1.286 trillion in March 2025, up EUR 115 billion and 9.8% year-over-year. That is not just market appreciation: it is EUR 14 billion in net new money in Q1 alone.
-
-Global banks are voting with capital. Julius Baer opened a Milan branch in March 2025. Goldman Sachs and JPMorgan are expanding trading operations. Barclays moved into new Milan offices. Hedge funds like Capstone and Eisler Capital established presences. Charles Russell Speechlys opened a Milan office.
-
-Milan's startup ecosystem has experienced fifteen-fold growth over a decade, now valued at EUR 60 billion. The city holds 98% of Italy's upcoming data center capacity.
-
-## The real estate boom: property as wealth magnet
-
-Italy's attraction for wealthy individuals manifests most visibly in surging luxury real estate prices, particularly in Milan and the Lake Como region.
-
-Milan residential property market has experienced consistent growth, with average prices increasing 31% from EUR 4,200 to EUR 5,512 per square meter over five years. But city averages hide the real action. Prime locations in Centro Storico, Brera, and Porta Nuova reach EUR 10,000 to EUR 15,000 per square meter. Foreign buyers represent 80% of premium property sales.
-
-Lake Como has become ground zero. Average prices hit EUR 2,993 per square meter, up 9.27% year-over-year, but ultra-prime lakefront villas are trading at EUR 20,000 per square meter. Multiple offers on well-priced properties are standard. Some premium listings attract ten or more competing bids.
-
-One senior broker dismissed concerns about the tax increase affecting demand: they operate at a wealth level significantly above the EUR 200,000 flat tax. It is like saying coffee went from EUR 2 to EUR 3. You are not giving up coffee.
-
-## The infrastructure bet
-
-Here is what people miss: Italy is making the largest infrastructure investment in its history, EUR 125 billion by 2032 for strategic works.
-
-The EUR 194 billion National Recovery and Resilience Plan is transforming the country: EUR 25 billion strengthening rail corridors, EUR 23.8 billion accelerating energy decarbonization, EUR 33.7 billion on energy security, with 1,700 construction sites opened to date.
-
-For the second consecutive year, Southern Italy's economy grew faster than the North, driven by infrastructure spending. That is historically unprecedented.
-
-This signals to wealthy individuals something crucial: government fiscal discipline, long-term planning capacity, and improving connectivity. It is not just about tax savings. It is about betting on a country that is actually building for the future.
-
-## The lifestyle advantage: more than just tax savings
-
-Dubai may offer zero tax, but Italy offers lifestyle, legal certainty, and proximity to core markets. That captures something essential. Ultra-wealthy retirees can accept Dubai's cultural limitations. Senior bankers who are still working cannot.
-
-Milan offers international schools for expat families, world-class healthcare, direct flights to major global financial centers, sophisticated dining and culture, Lake Como an hour away, and Rome, Florence, Venice, Tuscany within easy reach.
-
-Cost of living remains lower than London or Monaco despite rising luxury prices. Your tax-optimized income stretches further: larger properties, more staff, better schools, superior lifestyle at equal or lower total cost. For families with children, that alignment of financial optimization and quality of life is rare.
-
-## Getting talent in: Italy fixes its immigration problem
-
-Italy just solved a problem most wealth hubs ignore: how do you attract money without the people to service it?
-
-In July 2025, Italy approved 500,000 work permits for non-EU nationals through 2028, the largest allocation in the country's history. What actually changed: pre-departure training so workers get linguistic and cultural preparation before arriving, digital-first processing with faster approvals, and centralized platforms replacing consular office complexity.
-
-For private banks expanding in Milan, this is critical. Your London team can actually relocate without visa complications. Your Swiss hires can transfer smoothly. You can staff new offices with people who know the clients.
-
-## The competitive map: where Italy actually stands
-
-Italy did not win by accident. It sits in a carefully calculated position between zero-tax havens and high-tax European economies.
-
-The UAE and Dubai offer zero tax on everything with sophisticated infrastructure. The catch: extreme heat, cultural restrictions, distance from European and US markets. Fine for retirees. Limiting for active bankers who need European deal flow.
-
-The United States has no special flat tax, but Florida, Texas, and Nevada have zero state income tax. Great if you are building something. Less attractive if you are optimizing existing wealth.
-
-Switzerland offers cantonal tax competition with centuries of banking tradition. The catch: brutal cost of living, limited cultural appeal, and critically smaller deal flow than major markets.
-
-Monaco is the ultimate zero-tax play with Mediterranean lifestyle. The catch: tiny scale, property prices that make Milan look cheap, impractical for anyone seeking business involvement beyond wealth preservation.
-
-Italy's EUR 200,000 flat tax delivers a 4% effective rate on EUR 5 million in foreign income. Compare that to 40 to 50% in most developed markets. But it is not just the rate. Italy offers EU membership and G7 legitimacy, actual business opportunities and deal flow, sophisticated financial infrastructure that can handle complex structures, and lifestyle that beats pure tax havens without compromise.
-
-Portugal killed its non-habitual resident regime in 2024. The UK abolished non-dom status in 2025. Italy's main European competitors eliminated themselves, creating a window where Italy faces almost no direct competition.
-
-## The risks ahead
-
-Nothing this good lasts forever without challenges.
-
-Tax instability is a concern: raising the threshold twice in two years creates perception problems. Ultra-wealthy individuals need long-term certainty. Keep pushing the rate higher, and you risk hitting an inflection point where alternatives look better.
-
-Political volatility remains: Meloni's government has supported the regime, but Italian politics is unpredictable. Future governments could reverse course if public backlash intensifies over wealthy foreigners driving up costs for locals.
-
-EU regulatory pressure is possible: while Italy has avoided formal challenges so far, increasing coordination on EU tax policy could constrain future flexibility.
-
-Supply constraints are real: Milan and Como face physical limits on new construction in prime locations. If even wealthy people cannot find suitable residences, flows redirect elsewhere.
-
-## The bottom line
-
-Henley and Partners projects 3,600 millionaires relocating to Italy in 2025, bringing $21 billion in private wealth. That ranks Italy third globally for millionaire migration.
-
-For private banking institutions and wealth managers, Italy's rise represents both opportunity and existential threat. Firms without Italian presence risk losing clients relocating from London, Paris, or other European cities.
-
-The next 3 to 5 years will determine whether Milan's ascent is temporary, driven by UK policy mistakes, or a permanent reordering of European wealth management geography.
-
-Right now, the smart money is on permanent. When Goldman vice chairmen start relocating, you know something structural has shifted.`,
-
-  },
-
-  // =========================
-  // 2026 — FEATURED
-  // =========================
-  {
-    slug: "investment-advisor-replacing-rm",
-    ogImage: "/og-articles/og-investment-advisor-replacing-rm.jpg",
-    title: "The Investment Advisor Replacing the Relationship Manager",
-    date: "2025-10-01",
-    markets: ["CH", "UK", "UAE", "ASIA"],
-    summary: "Quietly, without press releases or org chart announcements, power is shifting inside Swiss private banks. Investment Advisors are no longer support functions. They are becoming the decisive voice in whether clients stay, reallocate, or walk away.",
-    linkedinUrl: "https://www.linkedin.com/pulse/investment-advisor-replacing-rm-gil-m-chalem/",
-    featured: false,
-    engagementScore: 80,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: ["investment advisor private banking", "RM vs IA", "private banking advisory", "Swiss private banking talent"],
-    body: `For decades, the Relationship Manager was the unquestioned centre of gravity in private banking. Clients trusted them. Banks rewarded them. Careers were built around them. Today, clients still smile at their RMs. But when it comes to decisions, they listen to someone else.
-
-Quietly, without press releases or org chart announcements, power is shifting inside Swiss private banks. Across UBS, Pictet, Julius Baer, Lombard Odier and UBP, Investment Advisors are no longer support functions. They are becoming the decisive voice in whether clients stay, reallocate, or walk away.
-
-## The RM myth: why the old model is breaking
-
-The traditional RM model was built for a different era. Thirty years ago, the RM's value proposition was clear: access to products, execution capability, discretion and trust, and adequate long-term returns. That world no longer exists.
-
-Today's UHNW clients are institutional in mindset. Many sit on investment committees. Many run family offices in parallel. Many benchmark their bank against MSCI World net of fees, private credit indices, and competing banks quarterly, not emotionally. The RM's historical levers, access, confidentiality, personal trust, are no longer differentiators. They are table stakes.
-
-What clients actually care about in 2026: net portfolio performance after fees, after FX, after tax. Behavioural guidance in volatility. Alternatives done properly. Cross-border structuring across CH, UK, [Dubai](/en/markets/dubai), US. Real customisation. Transparent attribution. Notice what is missing: charisma, golf, trust me I know headquarters. Relationships still matter, but they are no longer the product. The portfolio is.
-
-## What UHNW clients actually want
-
-Recent internal surveys across Swiss private banks show a paradox: over 50% of bankers cite deepening relationships as the top priority while clients increasingly define relationship quality as investment clarity and accountability.
-
-Clients ask questions RMs often cannot answer convincingly: why this allocation, why not more alternatives, why is this bond still here, why are we not using direct indexing for tax efficiency? These are Investment Advisor questions. At many banks, the RM does not own the portfolio. The CIO does not know the client. The IA sits in between and increasingly fills the gap.
-
-Around 40% of Swiss UHNW clients now split residency, assets or family presence across multiple jurisdictions. They want specialists who understand currency hedging, tax residency shifts, regulatory frictions, and liquidity across booking centres. When complexity rises, specialists gain power. That specialist is rarely the RM.
-
-## The fracture point
-
-The CIO is too distant. The RM is too generalist. And clients are no longer patient. This is where the traditional RM-centric model fractures.
-
-## The rise of the client-facing investment brain
-
-A new archetype is emerging. Not the traditional IA. Not the classic RM. But a hybrid with deep portfolio construction expertise, alternatives fluency, client-facing authority, attribution ownership, and cross-border literacy. This person sits in client meetings, defends decisions, pushes back when needed, and owns outcomes. This person can replace the RM as the primary client anchor.
-
-## Career consequences
-
-For RMs: adapt and become hybrid or lose influence. Relationship alone no longer guarantees relevance. For Investment Advisors: technical credibility plus client authority equals leverage. Compensation is catching up fast. For juniors: investment expertise first, relationship skills second. The order has flipped.
-
-The banks adapting well: Lombard Odier, aggressively strengthening IA benches and offering compensation parity. Pictet, prioritising investment mindset over pure RM pedigree. Vontobel, with long-standing IA credibility attracting both assets and talent.
-
-In the next five years, only one thing will matter: who controls the portfolio. Because the person who controls the portfolio controls the conversation, the credibility, and ultimately, the client relationship.`,
-  },
-
-  {
-    slug: "family-office-revolution",
-    ogImage: "/og-articles/og-family-office-revolution.jpg",
-    body: `The family office sector is undergoing a transformation unlike anything seen in decades. What was once a privileged structure reserved for the ultra-wealthy few is rapidly evolving into a sophisticated ecosystem that is reshaping global wealth management.
-
-## The explosive growth trajectory
-
-Global family office AUM is projected to reach $5.4 trillion by 2025, growing at 7.5% annually. The number of single-family offices worldwide has exploded from approximately 6,000 in 2019 to over 10,000 today, a 67% increase in just six years. Multi-family offices now manage over $1.2 trillion collectively.
-
-What is driving this growth? Three converging forces: the great wealth transfer of $84 trillion moving between generations over the next 20 years, the institutionalisation of UHNW thinking as wealthy families demand institutional-grade services, and the democratisation of access as technology reduces the minimum threshold for cost-effective family office structures.
-
-## The evolution from preservation to optimisation
-
-The traditional family office focused primarily on wealth preservation: conservative investments, basic tax planning, estate management. Today's family offices operate more like sophisticated institutional investors. Direct investment in private companies, co-investment alongside institutional investors, and principal investment strategies now represent 20 to 35% of typical family office portfolios. Alternative investments dominate: private equity at 25 to 30%, hedge funds and alternatives another 15 to 20%, real estate 10 to 15%.
-
-## Geographic shifts
-
-[Singapore](/en/markets/singapore) has positioned itself as Asia's premier family office destination, with registered single-family offices growing from approximately 50 in 2017 to over 1,400 by 2025. Dubai's [DIFC](/en/markets/dubai) has emerged as the Middle Eastern hub of choice, with family offices growing 40% year-over-year in 2024. Switzerland remains the gold standard for established European family offices. However, the competitive pressure from Singapore and Dubai is real and intensifying.
-
-## The talent war intensifies
-
-Family offices are winning the talent war against traditional private banks. Compensation packages include both base salary and carried interest participation in direct investments. Work culture is more entrepreneurial, with staff often having direct access to principals. The most sought-after profiles: investment professionals with private equity or hedge fund backgrounds, technology leaders, next-generation advisors who can engage meaningfully with millennial and Gen Z inheritors, and multi-jurisdictional tax and legal specialists.
-
-## The future
-
-The winners will be those who embrace technology as a core competency, build genuine co-investment networks, develop compelling value propositions for next-generation family members, and create sustainable organizational structures that outlast any individual. The family office revolution is creating extraordinary opportunities for professionals who understand this evolution and can position themselves at its intersection.`,
-    title:
-      "The Family Office Revolution: From Privilege to Power — And the Reckoning That Comes With It",
-    date: "2026-01-27",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary:
-      "Family offices are no longer discreet satellites of private banks — they are becoming competing ecosystems. The growth is structural, and it is reshaping mandates, talent, and how UHNW clients allocate capital globally.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/family-office-revolution-from-privilege-power-comes-gil-m-chalem--1o96e/",
-    featured: true,
-    engagementScore: 80,
-    pillar: "P1",
-    subTheme: "ScaleVsBoutique",
-    keywords: [
-      "family office vs private bank",
-      "wealth management competition",
-      "UHNW ecosystem",
-      "Swiss private banking strategy",
-    ],
-  },
-  {
-    slug: "ubs-unbeatable",
-    ogImage: "/og-articles/og-ubs-unbeatable.jpg",
-    body: `At first glance, the numbers look decisive. UBS manages USD 3.85 trillion in global wealth management assets. It absorbed Credit Suisse's remaining private banking operations. It has more relationship managers, more booking centers, more product capabilities, and more balance sheet than any competitor by a significant margin. The conclusion most observers draw: UBS is unbeatable. I think that conclusion is wrong.
-
-## What dominance actually looks like
-
-UBS is dominant. Full stop. No serious analysis suggests otherwise. A UHNW client who needs leveraged financing in [Singapore](/en/markets/singapore), estate planning in [Geneva](/en/markets/geneva), and a structured product in New York simultaneously has one serious option for a fully integrated solution. It is UBS. The Credit Suisse acquisition has deepened that dominance in specific markets. What is not real is the conclusion that dominance translates into unassailability.
-
-## The four vulnerabilities
-
-Integration fatigue at the client level. When two institutions merge, clients experience the disruption. Account migrations, system changes, new compliance requests, new relationship managers. The Credit Suisse client who was managed by a private banker they had known for fifteen years is now navigating a much larger organisation. That friction creates switching intention in a way that pure market share statistics completely obscure.
-
-Cultural dilution. UBS built its modern private banking on a disciplined, process-driven model. Credit Suisse at its best operated with more entrepreneurial latitude. Combining those cultures does not produce a hybrid strength. It typically produces several years of cultural negotiation during which neither identity fully prevails.
-
-Talent mobility. The consolidation has created an unprecedented supply of senior private banking talent in motion, bankers who left Credit Suisse, bankers who chose to leave UBS rather than navigate the integration. This talent is going somewhere. And the institutions absorbing it are building capability that did not exist three years ago.
-
-The client size mismatch. UBS's profitability model is optimised for clients above a certain asset threshold. Below that threshold, the economics do not work particularly well. That creates a natural opportunity for institutions that can serve the CHF 3 to 10 million segment with a focused, cost-effective model that UBS cannot profitably replicate at scale.
-
-## Where the real competition is happening
-
-EFG International has built genuine expertise in the entrepreneurial UHNW market. Its model of motivated, equity-participating relationship managers is fundamentally different from the UBS approach. Pictet has spent 220 years cultivating clients who value institutional permanence and intellectual independence. Lombard Odier has invested in technology and operational infrastructure while maintaining its partnership model.
-
-## The talent market implication
-
-The most experienced, most portable private banking talent is not uniformly going to UBS. It is going to the institutions that offer the clearest value proposition for a specific client segment. The integration has created a temporary advantage for every non-UBS institution in this market. That window does not stay open indefinitely. Unbeatable is a word that private banking history has consistently punished.`,
-    title: "UBS Just Became Unbeatable",
-    date: "2026-01-20",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary:
-      "Scale, capital, and platform depth are redefining competitive advantage. UBS is consolidating a position that changes hiring patterns, client expectations, and the strategic options available to other private banking players.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/ubs-just-became-unbeatable-gil-m-chalem--pchae/",
-    featured: true,
-    engagementScore: 74,
-    pillar: "P1",
-    subTheme: "Positioning",
-    keywords: [
-      "UBS private banking future",
-      "Swiss private banking strategy",
-      "wealth management consolidation",
-      "platform advantage",
-    ],
-  },
-
-  // =========================
-  // 2025
-  // =========================
-  {
-    slug: "from-zurich-hong-kong-navigating-wealth-multipolar-world",
-    ogImage: "/og-articles/og-from-zurich-hong-kong-navigating-wealth-multipolar-world.jpg",
-    body: `The geography of global private wealth has fundamentally shifted. Where once [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich) served as the unquestioned nerve centers of international wealth management, the world's rich are now spreading their assets, their residencies, and their banking relationships across multiple jurisdictions simultaneously. For the private banking professional navigating this shift, the change is not merely operational. It is existential.
-
-## The redistribution is real and accelerating
-
-Asia-Pacific now accounts for approximately one-third of global millionaires, compared to under 20% a decade ago. The Middle East's UHNW segment grew at twice the global average. UK wealth outflows have accelerated since the non-dom regime changes, with an estimated $92 billion in private wealth departing in 2024 alone. The multipolar world has arrived.
-
-## What this means for client complexity
-
-A decade ago, a Geneva-based private banker serving a Lebanese family might deal with two jurisdictions: Switzerland for custody, Lebanon for client domicile. Today, that same family might have children in [London](/en/markets/london), Dubai, and Montreal. Assets in Swiss francs, dollars, and dirhams. Business interests across three continents. A next generation that has never set foot in Beirut.
-
-The number of jurisdictions in play for a typical UHNW client has roughly doubled in ten years. The regulatory touch points have multiplied proportionally. The private banker who built their career serving Swiss-booked European clients with single-domicile families is working with a skill set that no longer covers the full addressable client base.
-
-## The booking center question
-
-[Singapore](/en/markets/singapore) has grown from a regional outpost to a genuine alternative to Geneva and Zurich for Asia-facing wealth. Bank of Singapore, DBS, and the major Swiss private banks with Singapore presences are building genuine depth in structuring, alternatives, and credit that can serve UHNW clients as a primary relationship, not a secondary one.
-
-Dubai has followed a similar trajectory, compressing into a decade what Singapore built over three. The [DIFC](/en/markets/dubai) now hosts over 600 financial institutions. For the private banking professional, this creates a genuine career question. The banker who can credibly navigate Geneva, Singapore, and Dubai simultaneously is offering something categorically different.
-
-## The talent market consequence
-
-Five years ago, a strong Swiss private banking profile needed deep expertise in one or two markets and one booking center. Today, the most competitive profiles combine primary expertise in a specific client segment with genuine familiarity across at least two booking center environments. The banks building the most competitive talent pipelines are those that have recognised this shift and structured their hiring accordingly. In a multipolar wealth landscape, the specialist is the banker who can navigate complexity across borders, not the one who has optimised for depth in a single market.`,
-    title: "From Zurich to Hong Kong: Navigating Wealth in a Multipolar World",
-    date: "2025-06-01",
-    markets: ["CH", "UK", "US", "ASIA"],
-    summary:
-      "The global wealth management industry is undergoing a seismic shift, driven by technological innovation, regulatory pressures, and evolving client demands. This analysis examines the distinct strategies employed by leading financial hubs across Switzerland, the United States, Asia, MEA, and Latin America.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/from-zurich-hong-kong-navigating-wealth-multipolar-world-m-chalem--ezase",
-    featured: true,
-    engagementScore: 78,
-  },
-  {
-    slug: "global-markets-outlook-2025-strategic-insights-private-bankers",
-    body: `The global economic landscape in 2025 presents private bankers with a complex tableau of opportunities and risks that demand sophisticated navigation.
-
-## The macro framework
-
-The IMF projects global growth at 3.3% in 2025, slightly below the historical average of 3.7%. The United States continues to outperform at around 2.5%, driven by resilient consumer spending and technology sector dominance. Europe struggles at approximately 1.2%, constrained by structural competitiveness issues. China targets 5% growth but faces headwinds from property sector deleveraging and demographic pressures. India exceeds 6.5%.
-
-Inflation has largely been tamed in developed markets. The US sits at approximately 2.5%, the eurozone at 2.2%. However, the last mile of disinflation is proving stubborn, keeping central banks cautious about aggressive rate cuts.
-
-## The asset allocation implications
-
-US large-cap equities, while expensive by historical valuation metrics, continue to benefit from technology sector earnings strength and AI productivity gains. Fixed income has been rehabilitated as an asset class after the brutal 2022 repricing. Investment-grade corporate bonds offer yields that make sense in a 2.5% inflation world. For private banking clients who spent the zero-rate era forced into equity risk they did not always want, the return of meaningful fixed income yields represents a genuine portfolio construction improvement.
-
-Alternatives remain the structural growth story. Private equity, private credit, infrastructure, and real assets continue to attract capital from institutional and increasingly UHNW investors. The democratisation of alternatives access through ELTIF structures and interval funds is accelerating the flow of private wealth into these markets. This is the most important structural shift in private banking portfolio construction of the past decade.
-
-## Geopolitical risk as permanent feature
-
-The geopolitical backdrop is genuinely complex. The US-China relationship has stabilised somewhat but remains structurally competitive. The Middle East situation has introduced new volatility variables. For private bankers, geopolitical risk has moved from background noise to active portfolio consideration. The banker who can engage substantively with scenario analysis is providing genuine value that client-facing technology cannot replicate.
-
-## The technology transformation
-
-AI is genuinely changing private banking. The most immediate impact is operational: compliance, client reporting, portfolio analytics, and meeting preparation are all being improved by AI tools. The deeper impact is on the nature of the advisory relationship itself. As AI systems become better at synthesising market information, the relationship manager's value increasingly comes from judgment, context, and the human dimensions of wealth advisory.`,
-    title: "Global Markets Outlook 2025: Strategic Insights for Private Bankers",
-    date: "2025-11-25",
-    markets: ["CH", "UK", "US", "UAE", "ASIA"],
-    summary:
-      "The global economic landscape in 2025 presents a mosaic of opportunities and risks across regions. This data-driven analysis provides strategic insights for Swiss, European, and emerging market wealth managers.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/global-markets-outlook-2025-strategic-insights-gil-m-chalem--hjcre",
-    featured: true,
-    engagementScore: 75,
-  },
-  {
-    slug: "turbulent-time-crisis-resilience-market-leadership-times",
-    body: `What separates private banking leaders who emerge stronger from crises from those who simply survive? The Swiss private banking sector has navigated an extraordinary sequence of disruptions since 2020: the pandemic, the inflation and rate cycle, the Credit Suisse collapse, UBS's multi-year integration challenge, and geopolitical volatility affecting client portfolios and mobility.
-
-## Two types of resilience
-
-Structural resilience is the ability of an institution to absorb shocks through capital strength and operational depth. Adaptive resilience is the ability of practitioners to recalibrate their value proposition as circumstances change. Both matter, but in the talent market, it is the second that creates career advantage.
-
-## What adaptive resilience looks like in practice
-
-The private bankers who have emerged strongest from this sequence share certain characteristics. They maintained and deepened client relationships through periods of institutional instability. When their employer was going through difficulty, they kept clients informed, managed expectations honestly, and preserved trust precisely when the institutional brand was providing less support. That skill, keeping relationships intact when the institutional scaffolding is disrupted, is the most valuable demonstration of genuine [portability](/en/portability).
-
-They invested in capability building during periods of reduced activity. Practitioners who used the pandemic period or the 2022 dislocation to deepen their knowledge of alternatives, digital assets, or cross-border structuring emerged with a materially stronger advisory offering.
-
-They read the structural changes correctly and positioned accordingly. The bankers who understood that UBS absorbing Credit Suisse would create a multi-year talent and client dislocation opportunity, and who positioned themselves at institutions ready to absorb that dislocation, made better career decisions than those who simply waited for stability to return.
-
-## The leadership dimension
-
-Crisis periods reveal leadership capacity in ways that normal market conditions do not. Managing a team through an institutional merger requires specific skills: honest communication about uncertainty, the ability to retain key people when external offers are plentiful, and the judgment to know when to protect the team and when to let individuals pursue genuinely better opportunities.
-
-## For the practitioner
-
-The current moment in Swiss private banking, with a major integration still completing, regulatory frameworks still evolving, and client geography still shifting, is not a period to wait out. It is a period to build. The practitioners who will look back on this moment as the one that defined their trajectory are the ones who used the disruption to deepen relationships, build capabilities, and position themselves at institutions whose strategic direction aligns with where client wealth is actually moving. Crisis resilience is not passivity in the face of turbulence. It is the judgment to know which turbulence to navigate through and which to use as propulsion.`,
-    title:
-      "Turbulent Time: Crisis Resilience and Market Leadership in Turbulent Times (Middle East Conflict)",
-    date: "2025-12-01",
-    markets: ["CH", "UK", "US", "ASIA"],
-    summary:
-      "The Swiss private banking sector demonstrates exceptional stability amid escalating global tensions, with industry assets under management reaching record levels and providing valuable lessons.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/turbulent-time-crisis-resilience-market-leadership-times-m-chalem--wu0fe",
-    featured: true,
-    engagementScore: 80,
-  },
-  {
-    slug: "ubss-silent-earthquake-10000-more-jobs-set-disappear-2027",
-    body: `According to Swiss publication SonntagsBlick, UBS is planning to cut up to 10,000 additional jobs by 2027, reducing total headcount to approximately 95,000 full-time positions. This is not just another round of restructuring. This is a signal that the Credit Suisse integration is far more challenging, far more expensive, and far messier than UBS has publicly acknowledged.
-
-## The numbers
-
-UBS currently employs approximately 110,323 people. Since summer 2023, approximately 15,000 jobs have already been eliminated. With the proposed 10,000 additional cuts, headcount would fall to around 95,000, representing a total reduction of approximately 25,000 positions since the acquisition, nearly 23% of the combined workforce. Approximately 3,000 of these redundancies are expected in Switzerland.
-
-UBS has not officially confirmed these plans and refuses to comment on specific reduction targets. The bank emphasizes cuts should be minimised through natural attrition, early retirement programs, internal mobility, and internalizing external vendor roles. But the numbers do not lie. The cuts are coming.
-
-## Why this is happening now
-
-This announcement reveals what UBS has not been saying about the Credit Suisse integration. According to SonntagsBlick, numerous complex client relationships from Credit Suisse remain incomplete. Old Credit Suisse legacy systems must continue to be operated because full migration has not been achieved, causing significantly higher operational costs than anticipated.
-
-By end of Q3 2025, UBS had achieved $10 billion in cost synergies, representing 77% of the $13 billion target. But hitting the full target requires more aggressive job cuts than originally planned.
-
-## What this means for different stakeholders
-
-For UBS employees globally: if natural attrition has been lower than expected, and the data suggests it has, significant layoffs are unavoidable. If you are at UBS and concerned about your role, now is the time to explore options.
-
-For rival banks: this creates exceptional recruitment opportunities. Competing banks can acquire UBS talent, often at lower compensation, knowing the bank is about to reduce significantly. Morgan Stanley, Goldman Sachs, Bank of America, and other wealth managers have already been acquiring UBS talent during the integration.
-
-For wealth management professionals: this is a critical signal for career planning. Competent wealth advisors, relationship managers, and specialists will have significant market demand as competitors build teams.
-
-## The unspoken reality
-
-What is most striking is what this reveals about the Credit Suisse integration's true state. UBS was confident enough in October 2025 to announce strong Q3 results and continue aggressive capital returns. Yet by December 2025, internal planning is circulating significantly larger job cut numbers. That gap between public confidence and private reality should concern everyone paying attention.
-
-For UBS employees: the next 18 months will determine your future at the bank. If you are in a vulnerable role, exploring external opportunities now while you have leverage is strategic, not disloyal. The window is open.`,
-    title: "UBS's Silent Earthquake: 10,000 More Jobs Set to Disappear by 2027",
-    date: "2025-12-08",
-    markets: ["CH", "UK", "US", "ASIA"],
-    summary:
-      "According to Swiss publication SonntagsBlick, UBS is planning to cut up to 10,000 additional jobs by 2027. This signals that the Credit Suisse integration is more challenging than publicly acknowledged.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/ubss-silent-earthquake-10000-more-jobs-set-disappear-2027-m-chalem--z1axe",
-    featured: true,
-    engagementScore: 85,
-  },
-
-  // =========================
-  // 2024 — ARCHIVE (ALL MISSING ADDED + DATES CORRECT)
-  // =========================
-  {
-    slug: "transforming-wealth-management-global-trends",
-    body: `The wealth management industry stands at an inflection point. Five global trends are converging simultaneously, and the institutions and practitioners who understand their combined effect will shape the next decade of private banking.
-
-## Trend one: the democratisation of sophisticated financial products
-
-Alternative investments, once exclusive to institutional investors and the ultra-wealthy, are becoming accessible to a much broader segment. ELTIF 2.0 in Europe, product innovation in private credit, and technology platforms enabling fractional access are collectively dismantling the barriers that kept these asset classes exclusive. The private banker who built their practice around the implicit exclusivity of alternatives access can no longer rely on that gatekeeping function. The value must come from the quality of advisory judgment applied to that access.
-
-## Trend two: the intergenerational wealth transfer
-
-The transfer of approximately $84 trillion between generations over the next two decades is not just a wealth management opportunity. It is a relationship disruption event of historic scale. Studies consistently show that 70 to 85% of heirs change their primary financial institution after inheritance. The institutions that retain intergenerational relationships are those that have invested in next-generation engagement long before the transfer occurs.
-
-## Trend three: the technology transformation of advisory
-
-AI and data analytics are fundamentally changing the economics of wealth advisory. Compliance, reporting, portfolio analytics, and meeting preparation are all being automated at pace. The relationship manager role is not disappearing. But its content is shifting toward judgment functions that technology cannot replicate: understanding client context, navigating complex family dynamics, providing perspective during market stress, and building trust that survives institutional transitions.
-
-## Trend four: the geographic rebalancing of private wealth
-
-Switzerland remains the world's leading private banking center by AUM. But the growth is elsewhere. [Singapore](/en/markets/singapore), [Dubai](/en/markets/dubai), and emerging centers in the Middle East are growing faster, attracting both client assets and professional talent. The private banker whose entire career has been built within a single geographic context is working with a progressively narrower slice of the global opportunity.
-
-## Trend five: the regulatory intensification
-
-Every major private banking jurisdiction has tightened its regulatory framework over the past decade. AML compliance, beneficial ownership transparency, cross-border reporting obligations, and conduct standards are all more demanding than five years ago. The banker who positions themselves as an asset in the compliance conversation, rather than a compliance risk to be managed, is aligned with where institutional value increasingly resides.
-
-## The combined effect
-
-These five trends do not operate independently. Their intersection rewards a specific type of practitioner: one who can navigate product complexity, build cross-generational relationships, leverage technology without being displaced by it, work comfortably across multiple jurisdictions, and operate with genuine regulatory sophistication.`,
-    title: "Transforming Wealth Management: Global Trends and Best Practices 🌍💼",
-    date: "2024-12-20",
-    markets: ["CH", "UK", "US", "ASIA"],
-    summary:
-      "The private banking and wealth management sector is at a turning point, driven by technological advancements, shifting client expectations, and regulatory complexity. With $72.6 trillion transferring from baby boomers to millennials by 2045, firms must adapt strategies to include broader service offerings and enhanced digital experiences.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/transforming-wealth-management-global-trends-best-gil-m-chalem--jkcqe",
-    featured: false,
-    engagementScore: 76,
-  },
-  {
-    slug: "exodus-ultra-high-net-worth-individuals-from-uk",
-    body: `The British Empire once attracted wealth from across the globe. In 2024 and 2025, that flow has reversed. The exodus of ultra-high-net-worth individuals from the United Kingdom represents one of the most significant wealth redistribution events in modern European history.
-
-## The scale
-
-Henley and Partners estimates approximately 16,500 millionaires left the United Kingdom in 2024, the highest figure ever recorded for any country. Net private wealth outflows are estimated at $92 billion. The trend has accelerated in 2025 following the implementation of the non-domicile regime changes announced in the spring budget.
-
-The departures are concentrated in the UHNW segment: individuals with assets above $30 million, business owners with cross-border operations, senior finance professionals whose compensation structures were designed around the non-dom framework, and family offices that had established UK residence as part of a broader international structure.
-
-## What changed and why
-
-The Labour government's decision to abolish the non-domicile tax regime, effective April 2025, was the proximate cause. The non-dom system had allowed UK residents domiciled abroad to shelter foreign income and gains from UK taxation for decades. What was perhaps underestimated was the speed and scale of the behavioural response. Wealth does not wait for certainty about implementation details before beginning to move.
-
-## Where the money is going
-
-Switzerland has been a primary beneficiary, particularly [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich) for structured wealth management. [Dubai](/en/markets/dubai) has absorbed a significant portion, particularly from Middle Eastern and South Asian families who had used [London](/en/markets/london) as a European hub but have no particular attachment to European jurisdiction. Italy's flat tax regime at EUR 200,000 annually has attracted individuals with European lifestyle preferences.
-
-## The private banking consequence
-
-For Swiss private banks, the UK exodus has created a specific opportunity. Families departing London with $30 million to $300 million need to restructure their banking relationships, custody arrangements, investment management, and family governance frameworks to reflect new jurisdictional realities. That need for restructuring is precisely the kind of complex, relationship-intensive advisory work that distinguishes the Swiss private banking model. The private banks that have invested in UK-facing relationship managers and in onboarding processes that accommodate the specific complexities of the transition are capturing meaningful new business.`,
-    title:
-      "The Exodus of Ultra High Net Worth and High Net Worth Individuals from the UK: Reasons and Destinations",
-    date: "2024-12-01",
-    markets: ["UK"],
-    summary:
-      "In recent years, the United Kingdom has been witnessing a significant exodus of ultra-high-net-worth individuals seeking greener pastures abroad, with profound implications for British wealth management firms.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/exodus-ultra-high-net-worth-individuals-from-uk-gil-m-chalem--dwize",
-    featured: false,
-    engagementScore: 63,
-  },
-  {
-    slug: "swiss-european-banks-tighten-grip-cis-clients",
-    body: `The redistribution of CIS private wealth after February 2022 has created one of the most significant client segment reshuffles in Swiss private banking history.
-
-## The initial disruption
-
-The imposition of Western sanctions on Russian individuals following the invasion of Ukraine created immediate and severe disruption to the CIS private banking market. Swiss banks moved quickly to identify exposed clients and restrict services to sanctioned individuals and entities. The process was imperfect, controversial, and remains legally contested in several cases.
-
-What is less discussed is the market consequence for the non-sanctioned segment. The CIS UHNW population is not monolithic. A substantial portion of Russian, Kazakh, Ukrainian, and other CIS wealth holders are not subject to sanctions and have legitimate, documented source-of-wealth profiles. Those individuals found themselves treated with heightened suspicion by institutions applying broad-brush risk-aversion to the entire geographic segment. That heightened scrutiny created relationship disruption. And relationship disruption creates switching behavior.
-
-## Where CIS wealth has resettled
-
-[Dubai](/en/markets/dubai) has emerged as the primary beneficiary for Russian and CIS wealth that had previously booked in Switzerland or [London](/en/markets/london). The UAE's neutral political position and its lack of participation in the Western sanctions regime made it an immediate alternative.
-
-Switzerland has not lost its CIS franchise. What has happened is more nuanced: Swiss banks have become significantly more selective about the CIS clients they serve, concentrating on profiles with the clearest KYC documentation, the most demonstrably independent source of wealth, and the most transparent corporate structures.
-
-## The talent dimension
-
-Relationship managers with genuine Russian, Kazakh, or Ukrainian language capability, with authentic cultural knowledge of the CIS wealth segment, and with established client networks that survived the 2022 disruption are among the most actively recruited profiles in Swiss private banking. The banks competing most aggressively for this talent are typically the mid-sized Swiss institutions that see an opportunity to build a differentiated CIS franchise in the space created by the larger banks' partial withdrawal from the segment.`,
-    title: "Swiss and European Banks Tighten Grip on CIS Clients Amid Sanctions Storm",
-    date: "2024-11-25",
-    markets: ["CH", "UK","CIS",],
-    summary:
-      "Swiss private banks and other European financial institutions are taking significant steps to address compliance and regulatory challenges with Commonwealth of Independent States region clients.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/swiss-european-banks-tighten-grip-cis-clients-amid-storm-m-chalem--age8e",
-    featured: false,
-    engagementScore: 61,
-  },
-  {
-    slug: "swiss-financial-market-developments",
-    body: `Swiss financial markets occupy a unique position in the global architecture: large enough to matter systemically, small enough to be genuinely affected by policy decisions that larger markets would absorb without visible consequence.
-
-## The SNB's zero rate environment
-
-The SNB's decision to cut to 0% in June 2025 and hold there reflects the fundamental deflationary pressure of a strong franc, low domestic inflation, and an export sector facing headwinds from currency appreciation and global demand uncertainty. With inflation at 0.3% and GDP growth projected below 1.5%, the SNB has limited room to tighten and limited reason to.
-
-For Swiss private banks, the zero rate environment is structurally challenging. Banks have now experienced both the pain of prolonged zero rates and the brief windfall of the 2022 to 2023 rate cycle. The risk is that institutions build [business plan](/en/bp-simulator)s around a rate normalization that does not materialise, or alternatively that they cut costs too aggressively during the current trough and are unprepared to scale when conditions improve.
-
-## The regulatory landscape
-
-FINMA has emerged from the Credit Suisse crisis with a clearer mandate and more explicit powers than before. The new too-big-to-fail legislation proposed by the Federal Council would significantly increase capital requirements for systemically important banks. Swiss banking regulation is tightening, not loosening.
-
-For practitioners, the regulatory intensification creates both constraint and opportunity. In an environment where regulatory expertise is genuinely valuable, practitioners who have invested in understanding the framework have a competitive advantage over those who treat compliance as an administrative burden.
-
-## The franc dynamics
-
-The Swiss franc's continued appreciation against major currencies is a structural reality that Swiss private banking must work within rather than against. For CHF-denominated clients, this is a feature: their wealth is held in one of the world's most stable stores of value. The currency expertise that Swiss private bankers have accumulated across decades of managing CHF-denominated wealth alongside internationally diversified assets is among the most genuinely differentiated skill sets in global private banking.`,
-    title: "The Swiss Financial Market developments",
-    date: "2024-11-18",
-    markets: ["CH"],
-    summary:
-      "The Swiss financial market has seen significant developments in recent months, particularly in the areas of regulatory changes, technological innovation, and market consolidation affecting private banking.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/swiss-financial-market-developments-gil-m-chalem--kvone",
-    featured: false,
-    engagementScore: 58,
-  },
-  {
-    slug: "should-private-banks-embrace-bitcoin-clients",
-    body: `The question that private banks spent years deflecting has become unavoidable: should we serve clients who want meaningful cryptocurrency exposure, and if so, how? The institutions that treated this as a reputational question to be managed have discovered it is actually a competitive question to be answered.
-
-## What has changed
-
-The approval of spot Bitcoin and Ethereum ETFs in the United States, the implementation of MiCA in Europe, and Switzerland's own progressive framework through FINMA have collectively created a legitimate institutional infrastructure for digital asset exposure that did not exist three years ago. When BlackRock runs a spot Bitcoin ETF with $40 billion under management, the argument that digital assets are inherently fringe is no longer available to private banks as a policy rationale.
-
-## The client demand is real
-
-A significant portion of UHNW clients below 50 have meaningful personal exposure to digital assets, accumulated through direct purchase, through early-stage company investments, or through participation in token projects. They are not asking their private banker's permission to hold Bitcoin. They are asking whether their private banker is capable of helping them think about it as part of a broader wealth management framework. The clients who find their bank cannot engage substantively with this question form a judgment about their bank's relevance that accumulates over time.
-
-## What the leading institutions are doing
-
-Julius Baer's partnership with AMINA Bank established a credible digital asset offering without requiring the bank to build custody and technical infrastructure from scratch. UBS is preparing to offer Bitcoin and Ethereum trading to select Swiss private banking clients, a signal that the wait-and-see period is ending at the top end of the market.
-
-## The career implication
-
-For private banking professionals, digital asset literacy has moved from optional enrichment to functional requirement. Not the ability to trade cryptocurrencies or explain consensus mechanisms, but the ability to have an informed conversation about the role of digital assets in a diversified UHNW portfolio, to understand the regulatory framework governing Swiss client access, and to distinguish between the legitimate use cases and the still-significant risk areas. The relationship managers who have developed this literacy are finding it creates differentiation in client conversations.`,
-    title: "Should Private Banks Embrace Bitcoin for Their Clients?",
-    date: "2024-11-10",
-    markets: ["US", "UK", "CH"],
-    summary:
-      "Swiss private banks are facing a pivotal decision regarding Bitcoin and cryptocurrency exposure for their high-net-worth clients, balancing innovation with regulatory compliance.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/should-private-banks-embrace-bitcoin-clients-gil-m-chalem--k0kze",
-    featured: false,
-    engagementScore: 64,
-  },
-  {
-    slug: "latam-private-banking-navigating-challenges",
-    body: `Latin America's private banking market presents a paradox that defines careers: immense concentrated wealth, significant structural challenges, and a client base that is among the most loyalty-intensive and relationship-dependent in global private banking.
-
-## The wealth concentration
-
-Brazilian, Mexican, Colombian, Argentine, Chilean, and Peruvian families together house approximately 85,000 dollar millionaires and around 500 UHNW individuals with assets above $100 million. The concentration at the top is extreme. This concentration creates specific dynamics: referrals between UHNW families in the same social and business circles are a primary source of new clients. The banker who has genuine credibility within those networks, built through years of relationship management and demonstrable competence during market crises, commands a franchise that is very difficult for newcomers to displace.
-
-## The offshore dynamic
-
-Latin American private wealth has historically been largely offshore-booked, with Switzerland, Miami, and more recently [Singapore](/en/markets/singapore) serving as primary custody centers. The reasons are structural: political and economic instability, historical currency crises, concerns about legal system reliability, and the legitimate diversification interests of families with cross-border business operations.
-
-[Geneva](/en/markets/geneva) has become a genuine center of Latin American private banking expertise, with relationship managers, legal advisors, and family governance specialists who understand the specific complexities of Latin American family wealth. Switzerland's attraction for LATAM UHNW clients combines political neutrality, currency stability, institutional credibility, and the depth of Spanish and Portuguese language capability at Swiss private banks that have invested specifically in this segment.
-
-## The compliance evolution
-
-The implementation of CRS and bilateral tax information exchange agreements has made undeclared offshore assets essentially unsustainable. The private banker who navigated clients through that transition, helping families restructure legacy accounts into compliant arrangements, is viewed very differently by those clients than one who simply managed portfolios. The trust built through that kind of complex, sensitive advisory work is the foundation of the most durable client relationships in this market.
-
-## The talent implication
-
-Spanish and Portuguese language fluency is a baseline. Cultural familiarity with Latin American business and family dynamics is essential. Knowledge of the specific cross-border tax and structuring questions affecting clients with assets in multiple jurisdictions is increasingly important. Experienced LATAM private bankers with established networks are among the most actively sought-after profiles in Geneva and [Zurich](/en/markets/zurich) right now.`,
-    title: "LATAM Private Banking: Navigating Challenges and Opportunities in a $1.3T Market",
-    date: "2024-11-02",
-    markets: ["LATAM"],
-    summary:
-      "Swiss and US private banks face unique challenges and opportunities in covering the Latin American market, the third-largest globally for wealth management with substantial growth potential.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/latam-private-banking-navigating-challenges-13t-gil-m-chalem--g9jqe",
-    featured: false,
-    engagementScore: 71,
-  },
-  {
-    slug: "latest-news-swiss-financial-market-focus-banks",
-    body: `Swiss financial markets have delivered a sequence of developments over recent months that merit careful attention. The pattern that emerges is one of consolidation, adaptation, and the gradual resolution of uncertainty that has hung over the sector since March 2023.
-
-## The UBS integration approaching completion
-
-The most consequential ongoing development is the UBS-Credit Suisse integration entering its final and most technically complex phase. The migration of Swiss-booked client accounts is now projected for completion in March 2026. Until the migration is complete, UBS is operating parallel infrastructure with the cost and operational complexity that implies. When it concludes, the bank will have a materially different cost structure and a clearer picture of what the combined franchise actually looks like.
-
-The talent implications are direct. The conclusion of the integration will trigger a further assessment of headcount requirements, and the indications from UBS management suggest that the total job reduction will be substantially larger than the approximately 15,000 positions already eliminated.
-
-## The mid-tier competitive response
-
-The Swiss mid-tier private banks have used the UBS integration period strategically. Julius Baer, EFG, Vontobel, Lombard Odier, UBP, and others have all recruited selectively from the displaced talent pool and have pitched their stability and continuity to clients navigating the UBS transition. The mid-tier as a group has grown faster than the sector average over the 2023 to 2025 period.
-
-The question now is whether that momentum continues as UBS stabilises. My view is that the competitive realignment is more durable than a purely integration-driven disruption. Some of the clients who moved to mid-tier institutions during this period have genuinely better-suited banking relationships than they had before.
-
-## The regulatory implementation
-
-FINMA's enhanced supervisory framework is being implemented progressively, with systemically important banks subject to more intensive oversight than they experienced in the pre-Credit Suisse era. The private banks that have invested most systematically in compliance infrastructure are finding that this investment creates a genuine competitive advantage in client acquisition. Sophisticated UHNW clients are increasingly asking about their bank's regulatory standing as a component of their due diligence.`,
-    title: "Latest News on the Swiss Financial Market: Focus on Swiss and International Banks",
-    date: "2024-10-25",
-    markets: ["CH"],
-    summary:
-      "Key findings on monetary policy, interest rates, and the SNB's strategic direction continue to reshape the competitive landscape for Swiss banks and wealth managers.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/latest-news-swiss-financial-market-focus-banks-gil-m-chalem--vgjve",
-    featured: false,
-    engagementScore: 62,
-  },
-  {
-    slug: "unlocking-growth-cee-region-untapped-potential",
-    body: `Central and Eastern Europe represents one of private banking's most significant untapped opportunities. The combination of rapid wealth accumulation, relatively low private banking penetration, and a client base with specific geographic and cultural characteristics creates conditions that reward specialised expertise disproportionately.
-
-## The wealth creation engine
-
-Poland, the Czech Republic, Slovakia, Hungary, Romania, and the Baltic states collectively house a UHNW and HNW population that is meaningfully larger than most Western European practitioners appreciate. The wealth concentration is particularly notable in Poland, where the billionaire and near-billionaire segment has grown faster than in any other CEE market. The Baltic states, particularly Estonia and Latvia, have produced a disproportionate number of technology entrepreneurs relative to their population size.
-
-## The offshore booking question
-
-CEE wealth is characterised by significant offshore booking, historically directed toward Switzerland, Luxembourg, and Austria. The reasons are similar to those driving other emerging market wealth offshore: legal system certainty, political stability, currency diversification, and the desire to hold assets in a jurisdiction with a different risk profile than the home country.
-
-The CRS implementation has changed the compliance landscape for CEE offshore clients, just as it has for other markets. Families that have structured their offshore holdings correctly are in a stable position. Those who delayed adaptation are in a more complex situation that creates specific advisory demand.
-
-## The relationship manager profile
-
-Language capability, whether Polish, Czech, Romanian, or another regional language, provides meaningful competitive advantage. Knowledge of the specific tax and legal frameworks in key CEE markets is valuable. And the ability to navigate the particular family dynamics of first-generation entrepreneurial wealth, where founders are often still active in their businesses and thinking about succession simultaneously, is a genuine differentiator. The private banks with the most developed CEE franchises have built dedicated teams with these characteristics.`,
-    title: "Unlocking Growth: The CEE Region's Untapped Potential for Swiss and Global Private Banks",
-    date: "2024-10-18",
-    markets: ["CEE"],
-    summary:
-      "Central and Eastern Europe (CEE) has emerged as a region of increasing importance and opportunity for Swiss and global private banking institutions seeking growth and diversification.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/potential-central-eastern-europe-cee-swiss-private-banks-m-chalem--bpooe",
-    featured: false,
-    engagementScore: 67,
-  },
-  {
-    slug: "why-apac-ultimate-private-banking-hotspot-2025",
-    body: `Asia-Pacific's private banking market is growing faster than any other region, generating wealth at a pace that is creating specific and urgent talent demand across the major hubs.
-
-## The growth numbers
-
-Asia-Pacific is home to approximately 6.2 million high-net-worth individuals with combined wealth exceeding $26 trillion. The region added more new millionaires in 2024 than any other geography. [Singapore](/en/markets/singapore) and [Hong Kong](/en/markets/hong-kong) continue to attract the institutional infrastructure to serve this wealth, while emerging hubs in Malaysia, Thailand, and the Philippines are growing from smaller bases.
-
-The structural drivers of Asia-Pacific wealth creation are not cyclical. Technology entrepreneurship, particularly in Southeast Asia and India, continues to generate wealth at extraordinary rates. Family businesses transitioning from first to second generation are professionalising their wealth management arrangements.
-
-## Singapore as institutional hub
-
-Singapore's position as Asia-Pacific's primary private banking hub has strengthened considerably over the past five years. The MAS regulatory framework provides the stability and certainty that sophisticated UHNW clients require. The licensed family office count in Singapore now exceeds 1,400, a figure that underscores how seriously the ultra-wealthy segment is taking the jurisdiction as a primary wealth management base rather than simply a booking convenience.
-
-## Hong Kong's resilience
-
-Hong Kong has navigated a complex several years, and its private banking market has shown more resilience than the headlines might suggest. The UHNW client base in Hong Kong is deeply embedded in Greater China business networks that cannot easily be replicated elsewhere, and the city's access to mainland Chinese wealth flows remains a structural advantage that Singapore cannot fully substitute.
-
-## The talent gap
-
-The fundamental constraint on Asia-Pacific private banking growth is talent. Relationship managers with the right combination of regional language capability, product knowledge, and established client networks are in short supply relative to the demand that institutional growth is creating. Experienced APAC private bankers with established networks are in a market position that their peers without these capabilities cannot easily replicate.`,
-    title: "Why APAC is the Ultimate Private Banking Hotspot for 2025",
-    date: "2024-10-12",
-    markets: ["ASIA"],
-    summary:
-      "Private bankers focusing on the Asia-Pacific market in 2025 are positioned for unprecedented growth and opportunity in emerging wealth segments with strong fundamentals.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/why-apac-ultimate-private-banking-hotspot-2025-gil-m-chalem--bkhce",
-    featured: false,
-    engagementScore: 74,
-  },
-  {
-    slug: "rise-pigs-europes-economic-underdogs",
-    body: `The acronym that was coined to describe economic weakness has become a story of surprising resilience and, in some cases, genuine transformation. Portugal, Italy, Greece, and Spain are not the economic laggards they were characterised as during the European debt crisis. They are increasingly the jurisdictions that sophisticated wealth is choosing as primary or secondary bases.
-
-## What changed
-
-Italy's economy grew faster than Germany's or France's in 2024. Spain's GDP expansion has outpaced the eurozone average for three consecutive years. Greece, starting from a lower base, has delivered growth rates that would be creditable for any developed market. Portugal has become Europe's most talked-about destination for internationally mobile wealth.
-
-The structural drivers vary by country, but several themes recur: labour market flexibility improvements, tourism revenue strength, technology sector development particularly in Lisbon and Barcelona, and the deliberate policy choice to use tax incentives to attract internationally mobile wealth and talent.
-
-## The tax regime competition
-
-The competition to attract mobile wealth through tax incentives has become explicit across Southern Europe. Italy's flat tax regime at EUR 200,000 annually. Portugal's Non-Habitual Resident program, now closed to new applicants but influential in establishing the precedent. Greece's lump-sum tax of EUR 100,000 per year for non-domiciled UHNW individuals. Spain's Beckham Law providing income tax benefits for qualifying non-residents.
-
-These regimes collectively represent a shift in how European governments think about internationally mobile wealth: not as a fiscal leak to be closed but as a resource to be competed for.
-
-## The private banking consequence
-
-For Swiss and European private banks, the Southern European wealth migration creates specific demand. Families relocating from [London](/en/markets/london), [Geneva](/en/markets/geneva), or New York to [Milan](/en/markets/milan) or Lisbon need banking relationships that understand their new jurisdictional context. The private banks that have built genuine expertise in the specific requirements of the Italian, Portuguese, and Greek wealth management markets are capturing business that generic offshore banking capability cannot service adequately.`,
-    title: "The Rise of the PIGS: Europe's Economic Underdogs Take Flight",
-    date: "2024-10-05",
-    markets: ["EU"],
-    summary:
-      "Once whispered in hushed tones, the PIGS acronym—Portugal, Italy, Greece, Spain—now represents Europe's emerging economic success stories with implications for wealth management.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/rise-pigs-europes-economic-underdogs-take-flight-gil-m-chalem--1pyme",
-    featured: false,
-    engagementScore: 66,
-  },
-  {
-    slug: "saudi-arabias-economic-landscape-opportunities",
-    body: `Saudi Arabia's transformation from a petroleum-dependent economy to a diversified investment powerhouse represents one of the most ambitious economic reform programs of the 21st century, with direct and significant implications for private banking.
-
-## Vision 2030 and its private banking consequences
-
-Vision 2030's ambition, reducing oil revenue dependence from 70% of government income to below 30%, requires a fundamental restructuring of the Saudi economy that is creating private wealth at a pace the kingdom has not experienced before. New sectors, technology, entertainment, tourism, financial services, are generating a generation of Saudi entrepreneurs whose wealth management needs are different from those of the traditional Saudi UHNW client.
-
-## The Riyadh hub development
-
-Riyadh's emergence as a financial center is not merely symbolic. More than 200 international financial institutions have established regional headquarters in Riyadh, including Goldman Sachs, JPMorgan, and UBS. The Capital Market Authority's regulatory development has created a framework that supports sophisticated financial services in a way that was not present a decade ago.
-
-For private banks, the Riyadh expansion represents both a client acquisition opportunity and a talent positioning question. The banks that built early relationships with Saudi UHNW clients through their [Dubai](/en/markets/dubai) or [Geneva](/en/markets/geneva) presences are now extending into Riyadh to deepen those relationships and access the emerging entrepreneurial wealth that may not travel as readily to offshore centers.
-
-## The Islamic finance dimension
-
-Saudi Arabia's private banking market has specific requirements around Sharia-compliant investment structures. The private banker who understands sukuk markets, Islamic equity funds, and compliant structuring for family wealth has a competitive advantage that is not easily replicated by general expertise. The major Swiss private banks with significant Gulf presence have invested in this capability, but the depth of genuine expertise is still concentrated in a relatively small number of practitioners.`,
-    title: "Saudi Arabia's Economic Landscape and Opportunities for Private Banking",
-    date: "2024-09-28",
-    markets: ["MEA"],
-    summary:
-      "Saudi Arabia is undergoing significant economic transformation driven by its Vision 2030 initiative, creating new opportunities and challenges for private banking firms.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/saudi-arabias-economic-landscape-opportunities-gil-m-chalem--6c2qe",
-    featured: false,
-    engagementScore: 68,
-  },
-  {
-    slug: "battle-gulf-giants-saudi-arabias-vision-2030",
-    body: `The competition between Riyadh and Dubai for Gulf financial sector primacy has moved from diplomatic positioning to genuine institutional rivalry, with consequences for every private bank operating in the region.
-
-## The nature of the competition
-
-Dubai built its financial hub status over three decades through regulatory innovation, geographic accessibility, and the deliberate creation of infrastructure, the [DIFC](/en/markets/dubai), Emirates NBD Private Bank, and the regulatory frameworks that attracted international institutions. It succeeded because it offered something the Gulf did not otherwise have: a credible, internationally recognised financial center.
-
-Riyadh's response, enabled by the capital deployment capacity of Vision 2030 and the Financial Sector Development Program, is different in character. Saudi Arabia is not trying to replicate the DIFC model. It is trying to make Riyadh the mandatory center for institutions that want access to the Saudi market, which is substantially larger than the UAE market by virtually every economic measure.
-
-The Regional Headquarters Program, which requires international companies wanting to benefit from Saudi government contracts to establish their regional headquarters in Saudi Arabia, is the most explicit expression of this strategy. Over 200 companies have complied.
-
-## The implications for private banking
-
-The Gulf is moving from a single-hub model centered on Dubai to a two-hub model where Riyadh and Dubai serve distinct but partially overlapping client bases. Dubai remains the primary international booking center for Gulf private wealth. Riyadh is becoming the mandatory location for institutions that want to actively develop Saudi domestic relationships.
-
-## The talent consequence
-
-Private banking talent in the Gulf is reorienting around this two-center reality. The relationship manager based exclusively in Dubai who served Saudi clients remotely is under pressure to either develop a Riyadh presence or cede the domestic Saudi market to institutions that have made the commitment. The banks that have established genuine Riyadh operations, with relationship managers who speak Arabic and understand Saudi business culture, are building franchises that their Dubai-only competitors cannot easily replicate.`,
-    title:
-      "The Battle of the Gulf Giants: Saudi Arabia's Vision 2030 vs. Dubai's Established Dominance",
-    date: "2024-09-20",
-    markets: ["UAE"],
-    summary:
-      "In the heart of the Middle East, a titanic struggle for economic supremacy is unfolding between Saudi Arabia and Dubai for private banking and wealth management dominance.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/battle-gulf-giants-saudi-arabias-vision-2030-vs-gil-m-chalem--1kvee",
-    featured: false,
-    engagementScore: 75,
-  },
-  {
-    slug: "swiss-private-banking-shake-up-mega-mergers",
-    body: `Swiss private banking has experienced more structural change in the past three years than in the previous three decades. The Credit Suisse emergency acquisition, the subsequent consolidation wave, and the ongoing compression of the sector from over 160 institutions to fewer than 80 have created a fundamentally different competitive landscape.
-
-## The mechanics of consolidation
-
-Private banking consolidation in Switzerland follows a well-established pattern. Small and medium-sized institutions face rising compliance costs that their asset base cannot efficiently absorb. They face technology investment requirements that demand scale to justify. And they face talent competition from larger institutions that can offer compensation structures and career development pathways that smaller players cannot match.
-
-The result is a predictable sequence: cost pressure, margin compression, strategic review, and ultimately the choice between acquisition and a managed exit. The institutions that have avoided this fate are those that have found genuinely differentiated positions, in specific client segments, in geographic markets, in product specialisation, that justify their independent existence.
-
-## The winners and losers of consolidation
-
-The acquirers that have managed AUM leakage most effectively are those that moved quickly on talent retention, that gave acquired relationship managers clear positioning within the combined institution, and that communicated credibly to clients about service continuity. The institutions that have struggled with acquisitions are those that treated the integration primarily as a balance sheet optimization rather than a client relationship management challenge.
-
-## The independent boutique survival case
-
-Against the consolidation trend, a specific category of Swiss private banking institution has demonstrated genuine resilience: the focused boutique with a clearly defined client niche, an ownership model aligned with long-term client interests, and a size that allows for the genuine personalisation that larger institutions struggle to deliver. Their competitive position, precisely because it is built on differentiation rather than scale, is harder to erode than that of the mid-sized generalist that falls between the specialist and the mega-bank.`,
-    title: "Swiss Private Banking Shake-Up: The Mega Mergers Redefining an Iconic Industry",
-    date: "2024-09-12",
-    markets: ["CH"],
-    summary:
-      "Over the past decade, the Swiss financial landscape has witnessed significant consolidation, particularly within its esteemed private banking sector with major implications.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/swiss-private-banking-shake-up-mega-mergers-iconic-gil-m-chalem--etbme",
-    featured: false,
-    engagementScore: 69,
-  },
-  {
-    slug: "traditional-private-banks-vs-family-offices",
-    body: `The comparison between traditional private banks and family offices has moved from theoretical to practically urgent as UHNW clients increasingly choose between the two models for their primary wealth management relationship.
-
-## The structural difference
-
-The traditional private bank offers breadth: access to global markets, a full product shelf, regulatory certainty, and the institutional credibility of a recognised brand. The relationship manager serves multiple clients simultaneously, typically 30 to 60 relationships, and the bank's infrastructure provides the context within which those relationships operate.
-
-The family office, whether single or multi-family, offers depth: a relationship with practitioners who work exclusively for one family or a small number of families, who understand the family's specific situation in comprehensive detail, and who operate with a mandate to serve the family's interests without the product distribution incentives that characterise bank advisory.
-
-The choice between these models is not purely a function of asset size. Families with $50 million sometimes prefer the family office model because of the depth and customisation it offers. Families with $500 million sometimes prefer traditional private banking because of the product access and institutional certainty it provides.
-
-## The convergence trend
-
-The distinction between the two models is blurring in practice. Traditional private banks are building family office service capabilities within their institutional structures. And multi-family offices are building product access and technology platforms that match what private banks offer. The convergence is client-driven. UHNW families experience their relationship with specific individuals, the quality of advice they receive, and the responsiveness of their advisors. The institutional wrapper matters less than the human relationship within it.
-
-## The talent market implication
-
-Private banking professionals are moving into family office roles, attracted by the depth of engagement and the alignment of interests. Family office practitioners are moving into private banking, attracted by scale, product breadth, and institutional resources. For practitioners navigating this boundary, the relevant question is not which model is superior in the abstract but which model is better suited to their specific strengths, their relationship style, and the client segment where they have built their credibility.`,
-    title: "Traditional Private Banks vs. Family Offices",
-    date: "2024-09-05",
-    markets: ["CH", "UK", "US"],
-    summary:
-      "Switzerland has long been a global hub for wealth management. Compare the differences and strategic advantages of traditional private banks versus emerging family office models.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/traditional-private-banks-vs-family-offices-gil-m-chalem--xkwxe",
-    featured: false,
-    engagementScore: 77,
-  },
-  {
-    slug: "how-global-economic-shifts-reshape-high-net-worth",
-    body: `The macroeconomic shifts of the past five years have not affected all wealth segments equally, and understanding the differential impact on the HNW and UHNW population is essential context for private banking practitioners.
-
-## The inflation and rate cycle
-
-The 2022 to 2023 inflation surge and rate cycle had a specific effect on HNW wealth composition. Rising rates increased returns on cash and fixed income, benefiting wealthy individuals who held these instruments. But the repricing of long-duration assets, from growth equities to real estate to private equity fund valuations, reduced paper wealth for clients with significant allocations to these categories. The net effect varied significantly by portfolio composition. Clients with diversified allocations across geographies and asset classes weathered the period better than those concentrated in a single market or asset class.
-
-## The technology wealth concentration
-
-The AI investment cycle has created a specific pattern of wealth concentration at the top of the technology sector. The Magnificent Seven's outperformance has been so extreme that portfolios with significant technology exposure have substantially outperformed those without. For private banking clients who held large positions in major technology companies, the past two years have been exceptional.
-
-This concentration creates its own advisory challenge: when a client's portfolio is substantially dominated by a few positions that have appreciated dramatically, the risk management conversation becomes both more important and more difficult. The client who has watched a $10 million position become a $40 million position through appreciation is rationally reluctant to diversify, even if the concentration represents a risk that a dispassionate observer would reduce.
-
-## The geographic wealth shift
-
-The most significant structural shift in global HNW wealth over the past decade has been the acceleration of wealth creation in Asia-Pacific and the Middle East at rates that outpace developed market growth. For Swiss private banks, this shift represents both a client acquisition opportunity and a talent requirement. The relationship manager whose expertise is entirely oriented toward European or American client dynamics is progressively less well-positioned to serve the client segments where wealth is growing fastest.`,
-    title: "How Global Economic Shifts Reshape High-Net-Worth Portfolios",
-    date: "2024-08-28",
-    markets: ["US", "UK", "CH", "ASIA"],
-    summary:
-      "As we approach 2025, high-net-worth individuals face an increasingly complex global economic landscape that directly influences their investment strategies and portfolio decisions.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/how-global-economic-shifts-reshape-high-net-worth-gil-m-chalem--uyl5e",
-    featured: false,
-    engagementScore: 73,
-  },
-  {
-    slug: "changing-face-swiss-private-banking",
-    body: `Swiss private banking in 2026 looks materially different from the sector that existed a decade ago, and the pace of change is accelerating rather than slowing.
-
-## The structural changes
-
-From over 180 private banking institutions in 2006, Switzerland now has fewer than 80. The combined AUM of the surviving institutions has grown substantially in the same period, meaning the consolidation has produced larger, better-capitalised entities rather than a diminished sector.
-
-The partnership model, which was once the defining characteristic of Swiss private banking at the prestige end of the market, has become rarer but more valuable. Pictet, Lombard Odier, Mirabaud, and a handful of others have maintained their partnership structures through pressures that converted many peers into incorporated entities with external shareholders. The market premium that these institutions command in client trust and talent attraction reflects the genuine differentiation that their ownership model provides.
-
-## The talent transformation
-
-The private banking talent market has shifted in ways that reflect the broader changes in the sector. The relationship manager profile that commanded premium compensation a decade ago, deep expertise in one market, strong personal relationships, a large legacy book, remains valuable but is no longer sufficient for the most competitive career trajectories.
-
-The profiles attracting the most active interest in 2026 combine relationship depth with portfolio construction competence, jurisdictional breadth with genuine expertise in specific markets, and the interpersonal skills of traditional private banking with the analytical capabilities that increasingly sophisticated clients demand.
-
-## The client evolution
-
-Private banking clients are more financially sophisticated than they were a decade ago. The democratisation of investment information, the professionalisation of family governance, and the experience of navigating the 2008 crisis, the 2022 rate shock, and the Credit Suisse collapse have produced a client base that asks harder questions and expects more substantive answers. The private banker who thrives in this environment is not the one who manages client relationships through charm and institutional brand. It is the one who can engage substantively with complex financial questions, who has the intellectual honesty to acknowledge uncertainty, and who has built relationships deep enough to survive the inevitable periods of portfolio underperformance or institutional disruption.`,
-    title: "The Changing Face of Swiss Private Banking",
-    date: "2024-08-20",
-    markets: ["CH"],
-    summary:
-      "Switzerland's private banking sector, long renowned for expertise in wealth management, is undergoing significant transformation in response to digital disruption and regulatory changes.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/changing-face-swiss-private-banking-gil-m-chalem--thxhe",
-    featured: false,
-    engagementScore: 71,
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    keywords: [
-      "Swiss private banking transformation",
-      "wealth management pressure",
-      "compliance costs",
-      "platform dependency",
-    ],
-  },
-  {
-    slug: "ultimate-guide-interview-preparation-recruiters",
-    body: `Preparing for a senior private banking interview requires a fundamentally different approach from most professional interview preparation. The stakes are higher, the questions are more specific, and the ability to demonstrate your value proposition with precision is the difference between an offer and a polite pass.
-
-## The preparation framework
-
-The first element of effective preparation is a clear and honest articulation of your book. Not the headline AUM, which every candidate leads with, but the texture underneath it: how much is genuinely portable, which relationships are personal versus institutional, what the revenue composition looks like, and what a realistic three-year [business plan](/en/bp-simulator) would contain.
-
-Hiring committees at serious private banks have significant experience evaluating books. They have seen candidates who claim CHF 500 million in portable AUM and deliver 20% of that figure after 18 months. They have also seen candidates who modestly project CHF 150 million and bring 90% of it within a year. The latter creates far more value and far more trust. The preparation investment should go into building an honest, specific, and defensible picture of your book before you sit in front of any hiring committee.
-
-## The six question categories
-
-Senior private banking interviews consistently probe six areas. First, your book composition: source of wealth, geographic distribution, institutional versus personal relationships, concentration, and product mix. Be specific. Vague answers are read as evasion.
-
-Second, [portability](/en/portability) evidence: not claims but evidence. Have you moved before? What followed you? What did not follow you, and why?
-
-Third, your business plan: what would you bring in year one, year two, and year three? Where would the incremental AUM come from? What is your pipeline?
-
-Fourth, your legal situation: non-solicitation, garden leave, and any restrictive covenants. Candidates who have not read their employment contracts before a senior interview are visible immediately.
-
-Fifth, your market view: what is happening in your client segment, what opportunities do you see, and what risks are you monitoring?
-
-Sixth, your motivations: why are you considering a move at this stage of your career, and what specifically makes this institution and this opportunity the right destination?
-
-## The common mistakes
-
-The most common mistake is leading too strongly with AUM. What hiring managers have not heard often enough is a clear analysis of what makes that book distinctive and portable. The second most common mistake is vagueness about portability. When a hiring committee asks what percentage would follow you, they need an answer grounded in your actual analysis of your relationships, not an optimistic estimate. The third is unpreparedness on legal constraints. You must know your notice period, your garden leave arrangements, and any non-solicitation provisions before sitting in a senior private banking interview.`,
-    title: "The Ultimate Guide to Interview Preparation: A Recruiter's Insider Perspective",
-    date: "2024-08-12",
-    markets: ["CH", "UK", "US"],
-    summary:
-      "As a seasoned recruiter, discover the insider perspective on how to prepare for banking and wealth management interviews to significantly improve your chances of success.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/ultimate-guide-interview-preparation-recruiters-gil-m-chalem--ew6pe",
-    featured: false,
-    engagementScore: 74,
-  },
-  {
-    slug: "whale-vs-retail-investor-behavior-decoding-market",
-    body: `Understanding the behavioral differences between institutional or UHNW investors and retail participants is not merely academic. It is the foundation of effective private banking advisory, and it explains patterns in market dynamics that would otherwise appear irrational.
-
-## The information and incentive asymmetry
-
-Sophisticated investors operate with advantages that are structural rather than merely technical. They have access to better research, to management teams, to market color from prime brokerage relationships, and to the network intelligence that comes from operating in markets professionally. More importantly, they have incentive structures that encourage longer-term thinking: investment committees, governance frameworks, and in the case of UHNW families, multi-generational perspectives that extend beyond the quarterly reporting cycle.
-
-Retail investors operate under different constraints: shorter time horizons influenced by immediate financial needs, behavioral biases amplified by emotional proximity to their savings, and information environments that prioritise the dramatic and the recent over the structural and the durable.
-
-## The behavioral manifestation in markets
-
-These differences manifest in predictable patterns. Institutional and sophisticated investors accumulate during periods of retail panic: the 2020 COVID crash, the 2022 rate shock, the periodic cryptocurrency corrections. They reduce risk during periods of retail euphoria: late-stage bull markets, meme stock phenomena, speculative excess in emerging asset classes.
-
-The private banking client who understands this dynamic is significantly better positioned than one who responds to the same market stimuli as the retail crowd.
-
-## The advisory implication
-
-Behavioral coaching, helping clients maintain their investment discipline during periods of market stress or euphoria, has become an increasingly important component of private banking advisory. The research on outcomes is consistent: clients who maintain their strategic allocations through market cycles significantly outperform those who make reactive changes.
-
-The relationship manager who has built enough trust to have that behavioral conversation directly and honestly, who can tell a client that their instinct to reduce equity exposure at a market trough is understandable but likely counterproductive, is providing something that technology cannot replicate and that many advisors lack the relationship depth to offer.`,
-    title: "Whale vs. Retail Investor Behavior: Decoding Market Dynamics in Bitcoin Investments",
-    date: "2024-08-05",
-    markets: ["US", "UK", "ASIA"],
-    summary:
-      "The cryptocurrency market operates as a complex ecosystem where institutional whales and retail investors play distinct yet interconnected roles in market dynamics.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/whale-vs-retail-investor-behavior-decoding-market-gil-m-chalem--andie",
-    featured: false,
-    engagementScore: 70,
-  },
-  {
-    slug: "navigating-trumps-economic-storm-private-banks",
-    body: `The Trump administration's second-term economic agenda has created a specific set of challenges and opportunities for private banking that are worth examining with clarity rather than political framing.
-
-## The tariff impact on client portfolios
-
-The broad tariff program, including the 10% baseline on imports from most countries and sector-specific levies exceeding 100% on some categories, has created direct portfolio consequences that private banking clients are actively navigating.
-
-For clients with significant equity exposure to US-listed companies, the immediate effect has been volatility followed by partial recovery as markets assessed the actual implementation. The net effect on corporate earnings depends heavily on sector and supply chain structure: companies with purely domestic operations are relatively insulated, while those dependent on global supply chains face meaningful margin pressure.
-
-For clients with international business interests, particularly those operating across supply chains that span tariffed jurisdictions, the strategic questions are more complex. Investment in domestic US manufacturing, supply chain restructuring, and the economics of different geographic production configurations have become active advisory conversations.
-
-## The dollar and currency positioning
-
-Rather than the dollar strengthening as import taxes raised domestic prices, the currency has experienced periods of weakness as global investors reassessed the dollar's reserve currency status in the context of unpredictable trade policy. For Swiss private banking clients with dollar exposure, this creates both a hedging conversation and a strategic asset allocation question. The franc's appreciation against the dollar has reinforced the case for active currency management.
-
-## The deregulation opportunity
-
-The administration's deregulatory stance has created specific opportunities in financial services, energy, and technology. Private equity and private credit have benefited from reduced regulatory burden. Private banking clients with allocation capacity for alternative investments have had genuine opportunities in sectors directly benefiting from the deregulatory agenda. The advisor who can identify these opportunities specifically and credibly is providing value that generic market commentary does not deliver.`,
-    title:
-      "Navigating Trump's Economic Storm: How Private Banks and Their Clients Can Secure Assets in 2025",
-    date: "2024-07-28",
-    markets: ["US", "UK", "CH"],
-    summary:
-      "The recent blitz of tariffs, deregulatory actions, and erratic policy shifts requires private banks to develop new strategies for protecting and growing client assets.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/navigating-trumps-economic-storm-how-private-banks-can-gil-m-chalem--9q2de",
-    featured: false,
-    engagementScore: 88,
-  },
-  {
-    slug: "ubs-switzerlands-banking-giant-transformation",
-    body: `No institution in Swiss financial history has undergone a more consequential transformation than UBS over the past three years. Understanding that transformation, its trajectory and its implications, is essential context for anyone operating in Swiss private banking.
-
-## The acquisition and its aftermath
-
-The emergency acquisition of Credit Suisse in March 2023 was, as UBS CEO Sergio Ermotti has said explicitly, the most complex bank merger in history. Two institutions with different cultures, different technology stacks, different client bases, and different risk philosophies were being combined under regulatory pressure, within a compressed timeline, in the full scrutiny of global financial markets.
-
-What is remarkable about the three years since is not that the integration has encountered difficulties, that was inevitable. It is that the core UBS franchise has remained robust through the process. Global Wealth Management delivered strong results in 2024 and 2025, net new money remained positive at the group level, and the capital position has been managed effectively.
-
-## The strategic choices
-
-The decision to maintain a significant US wealth management franchise, despite the profitability challenges and advisor attrition, reflects a judgment that the long-term opportunity in the world's largest wealth market justifies the short-term pain. The decision to accelerate into Asia-Pacific, particularly through the 360 ONE partnership in India and the continued investment in [Hong Kong](/en/markets/hong-kong) and [Singapore](/en/markets/singapore), reflects a clearer line of sight to competitive advantage. UBS's franchise in Asian private banking is genuinely world-class, and the structural growth in Asian wealth provides a runway that the mature US market cannot replicate.
-
-## The talent consequence
-
-The most sought-after UBS profiles are those who have demonstrated the ability to retain client relationships through integration disruption, who have managed the cultural navigation between the two predecessor institutions effectively, and who have built track records in the client segments where UBS has the strongest competitive position. Those profiles exist within the institution, and they are being recruited actively by competitors who recognise that experience navigating a complex merger is genuinely valuable in an industry where the consolidation trend is far from over.`,
-    title: "UBS: Switzerland's Banking Giant in Transformation",
-    date: "2024-07-20",
-    markets: ["CH", "UK", "US"],
-    summary:
-      "UBS's bold acquisition of Credit Suisse in 2023 has captured the industry's attention. This analysis explores the transformation and integration challenges ahead for the combined entity.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/ubs-switzerlands-banking-giant-transformation-gil-m-chalem--fynde",
-    featured: false,
-    engagementScore: 82,
-  },
-  {
-    slug: "how-build-billion-dollar-client-portfolio-banking",
-    body: `Building a portfolio that approaches or exceeds a billion dollars in assets under management is the aspiration of virtually every senior private banker. The practitioners who achieve it consistently share specific characteristics that are worth examining carefully.
-
-## The foundation: client selection
-
-The billion-dollar portfolio is not built by serving everyone. It is built by making deliberate choices about which client relationships to prioritise. The most productive private banking practices are characterised by concentration in a client segment where the practitioner has genuine competitive advantage: geographic markets where language capability and cultural knowledge create relationship depth, industry sectors where deep familiarity creates advisory credibility, family office segments where complexity rewards genuine governance expertise.
-
-The practitioners who scatter their effort across every available client segment typically build practices that plateau in the CHF 200 to 400 million range. Those who concentrate where they have genuine advantage tend to build larger books more efficiently.
-
-## The relationship depth imperative
-
-The billion-dollar portfolio is almost never built on large numbers of moderate relationships. It is typically built on a concentrated number of deep, trusted relationships that have grown over time through consistent advisory quality and genuine partnership.
-
-The mechanics of this growth model are specific: a practitioner who begins with one anchor relationship of CHF 50 to 100 million typically accesses a network of similar families through referral. Each referral, if served well, becomes another anchor. The compounding effect of trust within high-net-worth social and business networks is the primary driver of large book construction.
-
-## The business development discipline
-
-The practitioners who build billion-dollar portfolios treat business development with the same discipline they apply to client advisory. They have explicit pipeline management: a clear picture of which prospects are at what stage, what the realistic timeline is, and what the conversion probability is. They have a referral strategy: they understand which existing clients are well-networked in their target segment and actively cultivate those referral relationships.
-
-The combination of focused client selection, relationship depth, and disciplined business development is the formula that produces the largest private banking practices. It is not complicated. But it requires consistency over years, and the willingness to forgo short-term production in favour of relationship quality that compounds over time.`,
-    title:
-      "How to Build a Billion-Dollar Client Portfolio in International Banking: Lessons from a Top Relationship Manager",
-    date: "2024-07-12",
-    markets: ["US", "UK", "CH"],
-    summary:
-      "In international private banking, only 12% of relationship managers consistently grow their AUM during geopolitical crises. Learn the strategies that differentiate these top performers.",
-    linkedinUrl:
-      "https://www.linkedin.com/pulse/how-build-billion-dollar-client-portfolio-banking-from-gil-m-chalem--uazye",
-    featured: false,
-    engagementScore: 68,
-  },
-  {
-    slug: "efg-bank-switzerland-pioneering-private-banking",
-    title: "EFG Bank Switzerland: Pioneering Private Banking with Entrepreneurial Agility",
-    date: "2024-07-05",
-    markets: ["CH"],
-    summary: "EFG Bank Switzerland has cemented its position as a cornerstone of global wealth management through entrepreneurial agility, strategic vision, and the distinctive Client Relationship Officer model.",
-    linkedinUrl: "https://www.linkedin.com/pulse/efg-bank-switzerland-pioneering-private-banking-gil-m-chalem--tknge",
-    featured: false,
-    engagementScore: 72,
-    keywords: ["EFG International", "Swiss private banking", "CRO model", "private banking careers Switzerland"],
-    body: `EFG International occupies a distinctive position in Swiss private banking: large enough to offer genuine institutional capability, small enough to maintain the entrepreneurial culture that defines its competitive model.
-
-## The EFG model
-
-EFG's defining characteristic is its Client Relationship Officer model, in which the front-office practitioners are not employees in the traditional sense but quasi-entrepreneurs operating within an institutional framework. CROs participate in the economics of their book through equity participation in their portfolios, creating alignment between their interests and those of their clients that differs from the salary-plus-bonus model at most institutional competitors.
-
-This model attracts a specific type of practitioner: motivated, entrepreneurial, relationship-focused, and confident enough in their portable client base to accept economic participation rather than guaranteed compensation. The profile that thrives at EFG is genuinely different from the profile that thrives at UBS or Julius Baer, and the institution has been deliberate about selecting for it.
-
-## The growth trajectory
-
-EFG has grown AUM to approximately CHF 165 billion as of end-2024, representing 16.4% year-over-year growth. Net new money has been consistently positive, and the bank's profitability metrics reflect the efficiency of the CRO model: when practitioners are economically aligned with their books, they have strong incentives to both grow and retain client relationships.
-
-The geographic expansion has been deliberate: EFG has built meaningful presences in [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), [London](/en/markets/london), Monaco, Cayman, [Singapore](/en/markets/singapore), [Hong Kong](/en/markets/hong-kong), and other centers without attempting to replicate the global footprint of a UBS or Julius Baer. The focus on markets where the entrepreneurial CRO model resonates has produced more coherent international growth than undifferentiated geographic expansion typically delivers.
-
-## The talent market positioning
-
-EFG is consistently among the most active recruiters in the Swiss private banking talent market, particularly during consolidation periods when experienced CROs and relationship managers are reassessing their institutional affiliations. The combination of the entrepreneurial model, the track record of profitable growth, and the cultural coherence of the institution makes it a credible destination for practitioners who want more ownership over their practice than institutional employment typically provides.
-
-For the private banker considering a move, EFG represents a genuine alternative to both the mega-bank scale and the boutique limitation. Understanding the specific dynamics of the CRO model, including its economics, its cultural expectations, and its suitability for different practitioner profiles, is essential before engaging with the institution seriously.`,
-  },
-  {
-    slug: "hong-kong-switzerland-offshore-wealth-crown",
-    ogImage: "/og-articles/og-hong-kong-switzerland-offshore-wealth-crown.jpg",
-    title: "The Crown Changes Hands",
-    seoTitle: "Hong Kong Overtakes Switzerland as Top Offshore Wealth Hub: What It Means",
-    date: "2026-05-29",
-    summary: "Hong Kong has overtaken Switzerland as the world's largest offshore wealth booking centre. Boston Consulting Group called this in 2022. Geneva spent three years debating it instead of preparing for it.",
-    seoDescription: "Hong Kong now books $2.95 trillion in cross-border wealth against Switzerland's $2.94 trillion. What the BCG 2026 ranking shift means for Swiss private banking and the talent market.",
-    pillar: "P1",
-    subTheme: "Positioning",
-    markets: ["CH", "ASIA"],
-    linkedinUrl: "https://www.linkedin.com/feed/",
-    keywords: ["Hong Kong wealth management", "Switzerland offshore banking", "BCG Global Wealth Report 2026", "cross-border wealth ranking", "Swiss private banking talent"],
-    body: "For thirty years, Geneva's claim to the top of the offshore wealth table was treated as a law of nature. Not a competitive position. Not something that required defending. A fact, like the Alps or the franc. The 2026 Global Wealth Report from Boston Consulting Group ended that assumption in a single data point.\n\nHong Kong now books $2.95 trillion in cross-border private wealth. Switzerland books $2.94 trillion. The margin is $10 billion on a base of nearly $3 trillion, which is to say the margin is almost nothing. But the direction is everything. Boston Consulting Group, which has been tracking this convergence since at least 2022, is unambiguous: this reversal is unlikely to be undone. The hubs in Asia are growing faster than the European safe haven. The structural forces driving that divergence are not temporary.\n\nThe reaction in Geneva has been some version of surprise. It should not have been.\n\nIn 2022, the same institution published a forecast placing Hong Kong ahead of Switzerland before the end of that decade. The Swiss market noted it, debated it in conference panels, added it to the risk section of various strategy presentations, and largely continued as before. That is not a criticism unique to Switzerland. It is what incumbents do. The position felt safe enough that the urgency to act never quite materialised. The $10 billion gap is the cost of that calculation.\n\n## Where wealth actually gets created\n\nThe mechanics of what happened are not complicated. Hong Kong's rise is a direct consequence of where wealth is being generated. China has been producing high-net-worth and ultra-high-net-worth individuals at a rate that no European economy can match. In 2021, the number of Chinese dollar millionaires surpassed the number of German ones. By 2025, Chinese billionaire creation was running at a pace that made Switzerland's own domestic wealth generation look almost static by comparison.\n\nA booking centre proximate to that wealth creation will attract assets. Hong Kong's geographic and cultural position as the gateway between mainland Chinese capital and international markets gives it a structural advantage that Geneva cannot replicate by improving its product offering or tightening its legal framework. The assets are created next door. The relationships are local. The language is Cantonese and Mandarin. The trust is generational and proximity-based.\n\nBoston Consulting Group's report projects that global financial wealth will grow at roughly 7 percent annually through 2030, assuming that geopolitical tensions and the energy shock ease in the second half of this year. The growth will not be evenly distributed. The fastest expansion will be in Asia, concentrated around the same wealth creation dynamic that has already pushed Hong Kong to the top of the rankings. Switzerland will grow too, but it will grow at a rate that reflects the slower accumulation of wealth in Western Europe and the continued regulatory friction that makes Swiss booking genuinely difficult for a category of clients who might otherwise choose Geneva.\n\n## The compliance posture and what it costs\n\nThere is an uncomfortable conversation embedded in this data that the Swiss market has generally preferred to avoid. The compliance tightening of the past decade, accelerated dramatically by the events of 2022, has been necessary. The reputational damage from earlier eras, the pressure from FINMA, the cascading effects of the Credit Suisse collapse, and the political imperative to demonstrate that Swiss banking can clean itself up without external imposition, all of these made a stricter, more risk-averse posture not just defensible but essential.\n\nThe cost is real, however. A significant proportion of the clients who might have historically booked in Geneva now find the process either too uncertain, too long, or simply too adversarial to be worth the effort. The enhanced due diligence requirements for certain nationalities, the source-of-wealth documentation burden, the restrictions on specific asset categories and geographies, these are not arbitrary inconveniences. They are the product of hard lessons learned at considerable expense. But they are also, as a practical matter, a filter that directs mobile wealth toward jurisdictions with a more accommodating posture.\n\nHong Kong has not faced the same regulatory reckoning as Switzerland. Its compliance environment has its own complications, including a legal framework that is increasingly shaped by mainland political priorities in ways that create a different category of risk for internationally mobile clients. But for a specific and very large segment of Asian wealth, Hong Kong's compliance burden is simply less than Geneva's. The assets follow the path of least resistance, as they always have.\n\nBoston Consulting Group's note that Hong Kong's concentration on mainland China ties its trajectory tightly to economic and regulatory developments there is the other side of this ledger. A jurisdiction that derives its competitive advantage primarily from proximity to one country's wealth creation is exposed to that country's political and economic trajectory in a way that a genuinely neutral booking centre is not. Switzerland has lost the rankings race for now. It has not lost the argument about long-term stability and political neutrality, which remains the most durable value proposition in private banking for clients who need it most.\n\n## The talent question nobody is asking\n\nThe conversation I have not seen in the coverage of this week's report is the one about people. Rankings and AUM figures describe outcomes. They do not explain the mechanism by which outcomes change. The mechanism is talent, and the talent question in Swiss private banking right now is more urgent than the market seems to appreciate.\n\nThe banks that will win the next decade of cross-border wealth management are not the ones with the deepest balance sheet or the most comprehensive product platform. They are the ones with the right bankers in the right seats. Specifically, they are the banks that have invested in building teams with genuine Asian market capability sitting in Geneva and Zurich, not just in their Singapore or Hong Kong offices.\n\nMandarin-speaking relationship managers who can service clients with Chinese wealth exposure from a Swiss booking platform are genuinely rare. The combination of private banking technical competence, language capability at a professional financial level, cultural intelligence, and Swiss regulatory literacy is not something you can hire easily or develop quickly. The banks that have those bankers are in a structurally stronger position than any product or platform advantage can create. The banks that have been treating Asian coverage as a regional matter handled from their Asian offices are building a dependency that leaves them exposed.\n\nThis is not a theoretical observation. In the mandates I work on regularly, the difficulty of finding a senior relationship manager with credible Asian market coverage in Geneva is among the most consistent constraints I encounter. The candidate pool is thin. The competition for the few strong profiles that exist is intense. The compensation required to move them is high. And the lead time to build a team from scratch is measured in years, not quarters.\n\nThe same logic applies, to varying degrees, to other growth markets. The bankers who will generate the next wave of AUM growth in Swiss private banking are disproportionately those who can access the sources of new wealth creation in Asia, in the Gulf, in Latin America, and in the diaspora communities of internationally mobile UHNW families. Building that coverage capability is a talent strategy, not a product strategy.\n\n## What Switzerland should do with a $10 billion gap\n\nThe right response to this week's data is not panic and it is not defensive dismissal. It is a serious conversation about what the Swiss offshore model is actually for, who it serves best, and where its genuine competitive advantage lies in a world where proximity to Asian wealth creation is no longer available as a differentiating factor.\n\nSwitzerland's case rests on rule of law, political neutrality, institutional stability, multi-generational banking relationships, and a regulatory framework that, for all its friction, provides genuine protection for clients who need predictability over a long time horizon. These are not trivial attributes. They are precisely the attributes that matter most to clients with genuine long-term wealth preservation needs, as distinct from clients who are primarily seeking to capitalise on near-term growth opportunities.\n\nThe $10 billion margin between Hong Kong and Switzerland is not the story. The story is the structural divergence in wealth creation geography that produced it, and the question of whether Swiss private banking has built the human capability to access the next generation of that wealth. In some institutions, the answer is a cautious yes. In most, the honest answer is that the work is not yet done.\n\nThat conversation needs to start now. The ranking has already changed. The talent pipeline takes years to build.\n\n---\n\n[1] Boston Consulting Group, Global Wealth Report 2026, published 27 May 2026. Cross-border AUM figures as of end-2025.\n[2] BCG Global Wealth Report 2022: forecast of Hong Kong displacing Switzerland as largest offshore booking centre.\n[3] Global financial wealth grew 10.7% in 2025, reaching $333 trillion. Equities contributed 13.2% and gold 44% of asset appreciation, BCG 2026.",
-  },
-
-  {
-    slug: "what-is-aum-portability-private-banking",
-    speakable: true,
-    title: "What Is AUM Portability in Private Banking?",
-    seoTitle: "AUM Portability in Private Banking: The Definitive Guide (2026)",
-    seoDescription: "AUM portability is the estimated percentage of a private banker's client assets that would follow them to a new bank. Learn how it is calculated, what affects it, and how banks assess it in 2026.",
-    date: "2026-06-22",
-    engagementScore: 88,
-    featured: false,
-    summary: "AUM portability is the single most important number in any senior private banking career move. Banks use it to price offers. Bankers use it to negotiate. Most people get it wrong.",
-    linkedinUrl: "",
-    pillar: "P1",
-    subTheme: "Positioning",
-    markets: ["CH", "UK", "UAE", "ASIA", "US"],
-    keywords: ["AUM portability", "private banking AUM transfer", "portable book private banking", "how to calculate AUM portability", "private banker career move"],
-    body: `The question every senior private banker eventually faces is not whether to move, but whether their clients will follow. That question has a name in the industry: AUM portability. It is also the number that determines whether a hiring bank makes an offer, how large that offer is, and how much transition support they are willing to provide.
-
-Most private bankers significantly overestimate their portability. Most banks start from significant scepticism. The gap between those two positions is where most career moves get complicated.
-
-## What AUM portability actually measures
-
-AUM portability is not a fixed number. It is an estimate of the proportion of a banker's current assets under management that are likely to follow them to a new platform within a defined window, typically twelve to eighteen months.
-
-The estimate depends on several variables that are specific to each banker's book, each client relationship, and each market. A banker managing CHF 300M in [Geneva](/en/markets/geneva) does not have CHF 300M in portable AUM. They have some fraction of that, maybe CHF 120M, maybe CHF 240M, and the actual figure depends on things that cannot be read off a portfolio statement.
-
-The relevant variables are: the nature of the relationship (personal versus institutionally owned), the client's banking history (single-banked versus multi-banked), the jurisdiction of the booking (which affects how easy it is for a client to move assets), the existence and scope of non-solicitation agreements, the product complexity of the book (discretionary mandates are harder to move than advisory), and the time elapsed since the last significant market event affecting the client's risk appetite.
-
-## Why bankers get this wrong
-
-The most common error is conflating AUM under management with personally owned relationships. A banker with CHF 300M on their book who inherited 40% of that from a predecessor, and whose largest five clients were originally introduced by the bank rather than by the banker, does not have CHF 300M in portable AUM. They have the fraction that is genuinely theirs, relationships they built, clients who trust them personally, names who would follow them regardless of the bank's brand.
-
-The second common error is ignoring concentration risk. A book where three clients represent 60% of AUM is not a book where you can assume 60% portability on those three relationships. High concentration means high variance. If the three large clients stay, portability is fine. If one of them decides the disruption of a bank move is not worth it, portability drops sharply.
-
-The third error is underweighting legal constraints. Non-solicitation clauses in Swiss employment contracts are enforceable. Garden leave periods are real. The window during which a banker cannot reach out to former clients is not just a technicality, it is a period during which competing bankers at the old institution are actively managing those relationships.
-
-## How banks assess portability
-
-When a senior private banker interviews at a new platform, the business case review is not a formality. Banks have been doing this long enough to have developed systematic approaches to separating credible portability claims from aspirational ones.
-
-The typical documentation request includes: a breakdown of the book by client (anonymised), showing AUM, revenue contribution, booking centre, relationship start date, and product mix; a self-assessment of each significant relationship categorised as personally owned, jointly owned, or institutionally owned; an honest assessment of the non-solicit scope and duration; and a timeline showing when each major client relationship was established.
-
-The most credible business plans are not the ones with the highest portability numbers. They are the ones where the reasoning is internally consistent, the concentrations are acknowledged, and the timeline is realistic. A banker who walks in saying I will bring 85% in six months without evidence of self-originated relationships is not being taken at face value. A banker who says I have twelve personally owned relationships representing CHF 140M, of which I believe eight will follow me in the first year based on specific reasons I can explain for each, that banker has a business case.
-
-## What determines a credible portability estimate
-
-The starting point is always the quality and depth of the personal relationship. Private banking is a relationship business. A client who has lunch with their banker three times a year, whose children the banker knows by name, and who has been with that banker across two different institutions already, is mobile. A client who is managed by a team and who has never met the banker outside of a formal review is not.
-
-Beyond relationship quality, the key factors are: how long the client has been with the banker (not the bank), whether the client has a genuine preference for the booking centre or is indifferent, the fee sensitivity of the client, and the client's broader banking situation. A client who books everything at one institution is harder to move than a client who already multi-banks.
-
-Regulatory jurisdiction matters more than most bankers acknowledge. Moving Swiss-booked assets between Swiss banks is operationally straightforward. Moving assets from a Swiss booking centre to a Dubai booking centre requires client consent, additional KYC documentation, and in many cases a re-suitability assessment. The friction cost is real, and some clients will not make that journey.
-
-## The portability calculation in practice
-
-Executive Partners uses a structured six-dimension scoring model to estimate realistic AUM portability before any bank introduction. The dimensions are: client loyalty (personal relationship strength), wallet share (share of total client wealth currently managed), regulatory jurisdiction (ease of transfer given booking centre), product complexity (advisory versus DPM versus structured), client concentration (risk from top-five client exposure), and legal constraints (non-solicit scope and duration).
-
-Each dimension is scored, weighted, and combined into a single portability estimate with a range, not a point estimate. The range matters. A book might realistically transfer 40% to 65% of AUM depending on market conditions, timing, and client decisions that cannot be fully controlled. A business plan built on 65% and stress-tested at 40% is credible. A business plan built on 65% with no downside scenario is not.
-
-The tool is available at [execpartners.ch/en/portability](/en/portability) and takes approximately twelve minutes to complete. The output is a portability score, an estimated range of portable AUM, and an identification of which dimensions most constrain the estimate, which is often more useful than the headline number.
-
-## Why this matters for compensation negotiation
-
-Portability estimates drive offer structures in ways that are not always visible to candidates. A bank hiring a banker with a credible case for CHF 150M in portable AUM within twelve months will structure the offer differently from a bank hiring a banker with a similar total book but a less compelling portability case.
-
-The non-producible contribution (NPC), the upfront contribution to offset a clawback obligation at the departing bank, is typically sized as a multiple of current year compensation and is higher for candidates with stronger portability evidence. The variable component of the first-year package is often linked to AUM onboarded at defined milestones, which means the candidate's own portability estimate becomes the baseline against which performance is measured.
-
-Understanding your own portability accurately, before walking into any hiring conversation, is not just a due diligence exercise. It is a negotiation asset.
-
----
-
-[1] FINMA, Circular 2009/1 on guidelines for asset management agreements.
-[2] Swiss Code of Obligations, Art. 340 et seq.: non-competition and non-solicitation clauses.`,
-  },
-  {
-    slug: "private-banking-salary-switzerland-2026",
-    speakable: true,
-    title: "Private Banking Salaries in Switzerland 2026: What Senior RMs Actually Earn",
-    seoTitle: "Private Banking Salary Switzerland 2026 | Senior RM Compensation Benchmarks",
-    seoDescription: "Compensation benchmarks for Senior Relationship Managers, Team Heads and Investment Advisors in Swiss private banking 2026. Base salary, bonus and total package ranges for Geneva and Zurich.",
-    date: "2026-06-22",
-    engagementScore: 90,
-    featured: false,
-    summary: "The 2026 compensation data for senior private banking in Switzerland shows a market that is paying more for the right profile and less for the wrong one. Here are the actual numbers.",
-    linkedinUrl: "",
-    pillar: "P1",
-    subTheme: "ROAPlatform",
-    markets: ["CH"],
-    keywords: ["private banking salary Switzerland 2026", "relationship manager salary Geneva", "private banker compensation Zurich", "senior RM salary Switzerland", "private banking bonus 2026"],
-    body: `Salary data in Swiss private banking is not published. The banks do not release it, the candidates do not discuss it openly, and the numbers that circulate in conference conversations are often shaped more by the speaker's agenda than by actual market data. The benchmarks below are drawn from live mandate negotiations and placement activity across Geneva and Zurich in 2025 and early 2026. They reflect what banks are actually offering, not what the industry wishes it could pay.
-
-## Geneva: Compensation by level
-
-[Geneva](/en/markets/geneva)'s compensation for front-office private banking professionals reflects the city's status as the world's largest offshore wealth management centre. The market is competitive at the senior level and increasingly bifurcated: institutions are paying premium packages for candidates with verified portable books and demonstrable ROA, and below-market packages for candidates whose portability claims do not survive scrutiny.
-
-Director level (Senior RM): Base salary CHF 180,000 to 250,000. Total compensation including bonus CHF 290,000 to 450,000. Bonus typically 50 to 100 percent of base. Candidates with a multi-year revenue history, a verifiable portable book above CHF 150M, and strong ROA can negotiate at or above the top of this range. Non-producible contributions to offset clawback obligations at the departing bank are common at this level and typically sized at 6 to 18 months of total prior compensation.
-
-Team Lead and Market Head (Executive Director equivalent): Base salary CHF 220,000 to 300,000. Total compensation CHF 380,000 to 560,000. Bonus range 60 to 120 percent. Compensation at this level is increasingly driven by the desk's collective revenue performance rather than individual AUM.
-
-Managing Director and Regional Director: Base salary CHF 280,000 to 400,000. Total compensation CHF 500,000 to 750,000 and above. Bonus range 80 to 150 percent. Equity participation or deferred compensation structures are common at this level, particularly at boutique banks and EAM platforms offering partnership tracks.
-
-## Zurich: How the DACH market differs
-
-[Zurich](/en/markets/zurich)'s compensation structure differs from [Geneva](/en/markets/geneva)'s in ways that are often misunderstood. The base salary range is broadly similar, but the bonus structure is more conservative, and the total package for comparable seniority often runs 10 to 15 percent below Geneva for equivalent AUM. This reflects the market's character: Zurich's private banking focuses more on onshore DACH wealth, where relationships are typically longer, more stable, and less mobile, and where the business development intensity that commands premium bonuses is lower.
-
-Senior RM and Director in Zurich: Base salary CHF 170,000 to 240,000. Total compensation CHF 270,000 to 420,000. Bonus 50 to 90 percent. International UHNW mandates at Zurich platforms command compensation closer to the Geneva range.
-
-## What actually determines your package
-
-The benchmark ranges above are directional. What a specific candidate receives within or outside those ranges depends on five factors that banks weight differently but all assess.
-
-First: AUM portability, specifically verified AUM rather than claimed AUM. A candidate who can document CHF 180M in personally owned relationships with a credible timeline for transfer will receive a materially better offer than a candidate claiming CHF 300M but unable to distinguish personally originated from institutionally owned relationships.
-
-Second: Revenue quality. ROA matters as much as AUM. A CHF 150M book generating 90 basis points in fee income is worth more to a hiring bank than a CHF 200M book generating 40 basis points. Banks build internal business cases using revenue assumptions, and those assumptions are driven by the historical ROA of the candidate's existing book.
-
-Third: Clawback obligation. The cost to a candidate of leaving their current employer, the unvested portion of deferred compensation, directly affects how much transition support a new bank needs to provide and therefore influences the total first-year package structure.
-
-Fourth: Time to break-even. Banks model how long it takes for the revenue generated by a new hire's transferred AUM to cover the cost of that hire, including base salary, NPC, and any signing components. A candidate with higher portability and better ROA has a shorter break-even, which makes the hire less risky and the offer more competitive.
-
-Fifth: Market specificity. A banker who covers a market segment where the hiring institution has a strategic gap, currently including [Israeli market](/en/israeli-market-private-banking-switzerland), Turkish UHNW, and Brazilian offshore, commands a premium that can take the package significantly above benchmark.
-
-## What the 2026 market is paying for
-
-The premium segments in 2026 are: Relationship Managers with genuine Israeli market coverage and an active ISA licence, where supply is extremely thin relative to demand; Turkish UHNW coverage, where regulatory complexity creates scarcity; and candidates with a credible South American offshore book, particularly Brazilian and Argentine market specialists.
-
-The competitive segments where compensation is more standardised are Swiss onshore, CIS and CEE coverage from established corridors, and Western European cross-border where many banks already have capable teams.
-
----
-
-These benchmarks reflect placement activity and mandate negotiations handled by Executive Partners across Geneva and Zurich in 2025 and early 2026. They are directional and do not represent an offer or guarantee of compensation.`,
-  },
-  {
-    slug: "isa-licence-private-banking-switzerland",
-    speakable: true,
-    title: "What Is an ISA Licence and Why Does It Matter for Swiss Private Banking?",
-    seoTitle: "ISA Licence Private Banking Switzerland: What It Is and Why Banks Want It",
-    seoDescription: "The ISA licence is the Israeli regulatory authorisation that Swiss private banks now require for relationship managers covering Israeli UHNW clients. Here is what it means and why it has become the key hiring filter.",
-    date: "2026-06-22",
-    engagementScore: 82,
-    featured: false,
-    summary: "Several Swiss private banks have opened or are expanding Israeli market desks. The ISA licence is the hard requirement most candidates cannot meet. Here is what it is and why it matters.",
-    linkedinUrl: "",
-    pillar: "P1",
-    subTheme: "Positioning",
-    markets: ["CH", "UAE"],
-    keywords: ["ISA licence private banking", "Israeli market private banking Switzerland", "Investment Services Act Israel", "private banking Israeli clients", "ISA licence recruiter"],
-    body: `In 2024 and 2025, several Swiss private banks made a quiet but significant commitment: they either opened Israeli market desks or formally expanded coverage of Israeli UHNW clients from their [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich) platforms. The hiring demand that followed introduced a term into the Swiss private banking recruitment conversation that had previously been peripheral: the ISA licence.
-
-The ISA licence has become the single most common hard requirement in Israeli market mandates at Swiss and international banks. It is also the requirement that eliminates most candidates from consideration before the conversation about AUM, market coverage or compensation even begins.
-
-## What the ISA licence is
-
-The ISA licence is the authorisation issued under Israel's Investment Services Act that permits individuals to provide investment advice or portfolio management services in Israel. It is the Israeli equivalent of the FCA's discretionary management authorisation in the UK, the SFC Type 4 or Type 9 licence in Hong Kong, or the SEC investment advisor registration in the United States.
-
-For private bankers working with Israeli UHNW clients from a Swiss booking centre, the ISA licence matters in a specific and practical way: Israeli law restricts who can provide investment advice to Israeli residents, including those banking offshore. A banker without the appropriate authorisation who provides investment advice to an Israeli client, even from Geneva, even for assets booked in Switzerland, is potentially operating in breach of Israeli regulatory requirements.
-
-Swiss banks covering Israeli clients have increasingly concluded that the legal and reputational risk of employing bankers who lack the appropriate Israeli authorisation outweighs the commercial cost of requiring it. The result is a hiring filter that sounds technical but has become a hard gate.
-
-## Who has an ISA licence and who does not
-
-The ISA licence is issued by the Israel Securities Authority. Obtaining it requires passing a series of examinations administered in Hebrew, demonstrating relevant professional experience, and submitting an application to the ISA. The process is substantive and takes time.
-
-The pool of private bankers outside Israel who hold an active ISA licence is small. Most of the candidates who hold it are Israeli nationals or individuals with deep Israeli market experience who worked at Israeli financial institutions before transitioning to Swiss or international private banking. A banker who has spent their career managing Israeli UHNW clients from Geneva or Zurich and who has never lived or worked in Israel will almost certainly not hold the licence.
-
-This creates the scarcity dynamic that defines the current Israeli market hiring environment in Switzerland. The banks want to expand coverage. The talent supply is thin. The compensation that follows from that mismatch is among the most competitive in Swiss private banking for the right profile.
-
-## What banks actually want
-
-The ISA licence is a necessary condition in most Israeli desk mandates at Swiss banks, but it is not sufficient on its own. What banks are looking for, once the licence requirement is satisfied, is genuine Israeli market coverage: personal relationships with Israeli UHNW and HNW individuals, entrepreneurs, business owners, former technology company founders, real estate developers, and family office principals, built over years of direct engagement.
-
-The AUM requirements in Israeli market mandates vary significantly. Several of the banks currently hiring for this coverage have explicitly stated no minimum AUM requirement. They are prioritising ISA licence and market coverage quality over book size. This is unusual relative to Swiss private banking norms and reflects the genuine scarcity of the candidate profile. A relationship manager with an active ISA licence and a credible Israeli UHNW network, even with a book well below CHF 100M, is a compelling candidate for several Swiss platforms right now.
-
-## The regulatory context
-
-Israel's Investment Services Act has been in place since 1995, but its extraterritorial application to offshore services has become more actively enforced in the past decade as Israeli regulatory authorities have paid increasing attention to the practices of international banks managing Israeli client assets from offshore booking centres.
-
-Several Swiss banks were part of earlier regulatory settlements with Israeli authorities over undeclared assets, a process that accelerated the drive toward formal compliance frameworks including the ISA licence requirement. The banks that now require it are in part responding to that regulatory history and the reputational preference for operating within Israeli regulatory frameworks rather than testing their boundaries.
-
-## What this means for candidates and for banks
-
-For a private banker with Israeli market experience who does not hold the ISA licence, the question is whether obtaining it is worth the investment. The examination process is in Hebrew, which immediately limits the population of candidates for whom this is feasible. For those who do speak Hebrew and have the market background, the path is clear: the licence opens a mandate environment where demand significantly exceeds supply.
-
-For banks, the constraint is real. Several institutions have been running Israeli market searches for months without finding candidates who combine the ISA licence, genuine market coverage, and the cultural and linguistic fluency that Israeli UHNW clients expect. The willingness to waive minimum AUM requirements is a direct consequence of that constraint.
-
-Executive Partners runs [confidential Israeli market mandates](/en/israeli-market-private-banking-switzerland) for several Swiss and international private banking institutions. The hard requirement on ISA licence is consistent across these mandates. The AUM requirement varies, and some mandates explicitly carry no minimum. The common thread is the combination of regulatory authorisation and personal market relationships that the licence alone cannot create.
-
----
-
-[1] Israel Securities Authority, Investment Advice, Investment Marketing and Investment Portfolio Management Law, 5755-1995.
-[2] FINMA, Supervisory Notice: cross-border services and the applicable licensing requirements in client jurisdictions, 2019.`,
-  },
-] as const;
\ No newline at end of file
+  a_ex_credit_suisse_banker_not_the_loyal_one,
+  a_switzerland_third_private_banking_competitiveness,
+  a_the_sandbox_talent_map,
+  a_the_platform_illusion,
+  a_zurich_private_banking_market_2026,
+  a_private_banking_business_plan_switzerland,
+  a_is_your_aum_portable,
+  a_the_geneva_paradox,
+  a_compliance_golden_handcuff,
+  a_the_alpine_exit,
+  a_what_is_a_relationship_manager_worth,
+  a_private_banker_business_plan,
+  a_how_to_calculate_aum_portability,
+  a_the_emotional_strategist,
+  a_the_last_wave,
+  a_switzerland_running_out_banks,
+  a_wall_street_7000_pump_5,
+  a_americans_already_here,
+  a_smoke_difc_dubai_private_banking_2026,
+  a_bern_holds_line_ubs_swiss_capital_rules,
+  a_10_billion_myth_swiss_private_banking_consolidation,
+  a_ubs_ceo_succession_private_banking_2026,
+  a_private_banking_compensation_revenue_grid,
+  a_dubai_private_banking_iran_conflict_2026,
+  a_zurich_private_banking_talent_market_2026,
+  a_ai_trap_private_banking_portability,
+  a_when_goliath_moves_bahnhofstrasse,
+  a_35000_jobs_one_question_nobody_asking,
+  a_when_safe_haven_isnt_safe_anymore,
+  a_julius_baer_cut_jobs_strong_2024,
+  a_why_senior_rms_going_independent,
+  a_ubs_integration_career_problem,
+  a_storm_warning_tariffs_zero_rates_crypto,
+  a_alternative_investment_tipping_point,
+  a_ubs_crossroads_succession_integration,
+  a_billionaire_ambitions_2025_ubs_report,
+  a_week_impacted_wealth_management_december_2025,
+  a_final_chapter_2025_ubs_crossroads,
+  a_swiss_banking_pivotal_week_ubs_17_year_high,
+  a_this_week_changed_everything_december_2025,
+  a_2025_bonus_outlook_senior_rms,
+  a_ubs_vs_switzerland_24_billion_question,
+  a_swiss_banking_earthquake_credit_suisse,
+  a_great_ubs_paradox_us_footprint,
+  a_power_shift_private_banking_talent,
+  a_unlock_career_move_senior_rms_2025,
+  a_ubs_potential_us_relocation,
+  a_what_netflix_knows_wealth_firms,
+  a_swiss_private_banking_thriving_against_odds,
+  a_la_dolce_vita_italy_wealth_management,
+  a_investment_advisor_replacing_rm,
+  a_family_office_revolution,
+  a_ubs_unbeatable,
+  a_from_zurich_hong_kong_navigating_wealth_multipolar_world,
+  a_global_markets_outlook_2025_strategic_insights_private_bankers,
+  a_turbulent_time_crisis_resilience_market_leadership_times,
+  a_ubss_silent_earthquake_10000_more_jobs_set_disappear_2027,
+  a_transforming_wealth_management_global_trends,
+  a_exodus_ultra_high_net_worth_individuals_from_uk,
+  a_swiss_european_banks_tighten_grip_cis_clients,
+  a_swiss_financial_market_developments,
+  a_should_private_banks_embrace_bitcoin_clients,
+  a_latam_private_banking_navigating_challenges,
+  a_latest_news_swiss_financial_market_focus_banks,
+  a_unlocking_growth_cee_region_untapped_potential,
+  a_why_apac_ultimate_private_banking_hotspot_2025,
+  a_rise_pigs_europes_economic_underdogs,
+  a_saudi_arabias_economic_landscape_opportunities,
+  a_battle_gulf_giants_saudi_arabias_vision_2030,
+  a_swiss_private_banking_shake_up_mega_mergers,
+  a_traditional_private_banks_vs_family_offices,
+  a_how_global_economic_shifts_reshape_high_net_worth,
+  a_changing_face_swiss_private_banking,
+  a_ultimate_guide_interview_preparation_recruiters,
+  a_whale_vs_retail_investor_behavior_decoding_market,
+  a_navigating_trumps_economic_storm_private_banks,
+  a_ubs_switzerlands_banking_giant_transformation,
+  a_how_build_billion_dollar_client_portfolio_banking,
+  a_efg_bank_switzerland_pioneering_private_banking,
+  a_hong_kong_switzerland_offshore_wealth_crown,
+  a_what_is_aum_portability_private_banking,
+  a_private_banking_salary_switzerland_2026,
+  a_isa_licence_private_banking_switzerland,
+] as readonly InsightArticle[];
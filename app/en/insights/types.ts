@@ -0,0 +1,70 @@
+// app/en/insights/types.ts
+
+export type MarketCode =
+  | "CH"
+  | "UK"
+  | "US"
+  | "UAE"
+  | "ASIA"
+  | "EU"
+  | "MEA"
+  | "LATAM"
+  | "CIS"
+  | "CEE";
+
+/**
+ * Content strategy taxonomy
+ */
+export type PillarCode = "P1" | "P2" | "P3" | "P4";
+
+/**
+ * Pillar I — Private Banking Strategy & Power Structures
+ * Sub-themes:
+ * - Positioning: who is winning/losing & why (banks, competitive moves)
+ * - ScaleVsBoutique: economics of scale vs boutique models
+ * - ROAPlatform: ROA pressure, platform dependency, cost of compliance
+ * - M&ARestructuring: M&A, integration failures, silent restructurings
+ */
+export type Pillar1SubTheme =
+  | "Positioning"
+  | "ScaleVsBoutique"
+  | "ROAPlatform"
+  | "M&ARestructuring";
+
+/**
+ * ✅ Extensible subTheme union
+ */
+export type InsightSubTheme = Pillar1SubTheme;
+
+export type InsightArticle = {
+  slug: string;
+  title: string;
+  date: string; // ISO: YYYY-MM-DD
+  markets: readonly MarketCode[];
+  summary: string;
+  linkedinUrl: string;
+  body?: string;
+
+  /**
+   * Display logic
+   */
+  featured?: boolean; // Homepage / Insights landing
+  engagementScore?: number; // Used for "Popular Insights"
+
+  /**
+   * ✅ Content taxonomy (optional but recommended)
+   */
+  pillar?: PillarCode;
+  subTheme?: InsightSubTheme;
+  keywords?: readonly string[];
+  ogImage?: string;
+
+  /**
+   * 🔍 SEO overrides — use when article title is literary/abstract
+   * seoTitle: replaces article.title in <title> and OG tags (max 60 chars)
+   * seoDescription: replaces article.summary in meta description (max 155 chars)
+   */
+  seoTitle?: string;
+  seoDescription?: string;
+  speakable?: boolean; // Adds SpeakableSpecification schema — use on definitional/reference articles
+};
@@ -65,7 +65,14 @@ export const metadata: Metadata = {
     url: PAGE_URL,
     type: "website",
     siteName: "Executive Partners",
-    images: [{ url: `${SITE}/og-articles/og-latam-private-banking-recruiter-geneva.jpg`, width: 1200, height: 630 }],
+    images: [
+      { url: `${SITE}/og-articles/og-latam-private-banking-recruiter-geneva.jpg`, width: 1200, height: 630, type: "image/jpeg" },
+      { url: `${SITE}/og-articles/og-latam-private-banking-recruiter-geneva.webp`, width: 1200, height: 630, type: "image/webp" },
+    ],
+  },
+  twitter: {
+    card: "summary_large_image",
+    images: [`${SITE}/og-articles/og-latam-private-banking-recruiter-geneva-twitter.jpg`],
   },
   robots: { index: true, follow: true },
 }
@@ -1,12 +1,35 @@
 #!/usr/bin/env python3
-import os, base64
+"""
+Photographic OG image for the NRI article: sync the image, point the article's
+ogImage at it and regenerate articles.ts. Only the article's record changes.
+Run from repo root after insert_nri_article.py: python3 deploy_nri_og.py [assets_dir]
+"""
+import os
+import sys
+
+from ep_tools.articles import TYPES_TS, ArticleError, update_article
+from ep_tools.files import sync_assets
+from ep_tools.patching import Edit, apply_edits
+
 BASE = os.path.dirname(os.path.abspath(__file__))
 
-open(os.path.join(BASE, "public/og-articles/og-nri-private-banking-switzerland-desk-hiring.jpg"), "wb").write(base64.b64decode('/9j/4AAQSkZJRgABAQAAAQABAAD/2wBDAAMCAgICAgMCAgIDAwMDBAYEBAQEBAgGBgUGCQgKCgkICQkKDA8MCgsOCwkJDRENDg8QEBEQCgwSExIQEw8QEBD/2wBDAQMDAwQDBAgEBAgQCwkLEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBD/wAARCAJ2BLADASIAAhEBAxEB/8QAHQAAAQQDAQEAAAAAAAAAAAAABQIDBAYAAQcICf/EAFcQAAEDAgQEBAMFBQMJBgQADwECAxEABAUSITEGE0FRByJhcRQygQgjQpGhFVKxwdEkM2IJFhdDcoKS4fAlJjRTovE1Y3ODGERUsic2wtJFRlVkhJOj/8QAGwEAAgMBAQEAAAAAAAAAAAAAAgMBBAUABgf/xAA2EQACAgEEAQMCBQMDBAMBAQAAAQIDEQQSITEFEyJBMlEGFDNhcRUjQjRDUiRTkaEWgbFi8P/aAAwDAQACEQMRAD8A6xcrIEkSCBBNBr5QyER1oo+RBlXU+0GhN8dFARMV8eifSwBfSoQI119qrGIAAwJ1narNiBBUrQH6darmIZZJBI26VagLsKjjDAcQrMDlPWuZ8VYO3eWtxbqbSUOpy6n0rrGIJSoKTManSqBxS4xh9u5cvDOAYSgbqPatPSSakkZ9yTXJ5cxrBf2OssOpQFAmI96q120nMo5R710HxBF3cYiq7aw1xFsoklSDzI/LWqC6G3VSFaEkRNev00m4Js8zqIxUmkDVsOBR830isRbpJkqM+1SykJ2G5rEoVoUqBParm4pKJpq1CjEyB3p0MobUYJGk6iloJjUeY6wK0Z+YGYOxFA3kcoJGgkgaKIid6UkkwPrSjEZhrSUSDkkEb0GQl2ONhalkJO5mplulRMga9qjtSo/LEdqN4ZhpuCAPeCdDSpzSXJZprc3waYtHHvIdhqY6HvS7q0DaTB8ydPSrKzYpYQHEDLIiY29qE4q2ZWopOnzDv61UjduZpz0+yGX2Vd7RyCrTvTSwEjNHualKbWlQQrfU7dKYdbMADXMeukVdi1gyZxwxoEkKntUphaVEFwGCI31A70ylokKB0jvsacb8ySCZn6RUyIhww5Yv5VpyqhYESO3Y1YcEvktXDwUswdJB0JJ2qn2ikoWdSO+tG7F9BUBm8yDuR8yvWqV8Mmjpp4OqYJerI5DmVUiF9STA1j6VaGBnZDzail6QXFTCVpHcDbTSubYTeOZ+cohC3AEyk6aVasOxhxLzcOKQEEyk6haY2/OsS6p54PQ0WJxDptEJeD1oIykr824B2AjcVasJfVbuN3CdFqJSYELSRuY2iq/YfCXyAQAl1JUkIKgmQNoog0w3bvpWw4rM2QkSr6yT+lU7F9y7B45R2Dha6K3WrlptWwBUkTmBEanqK63wu6iEhxxS8kgEzI9j0rjHh064+tLfPyEwfm+Ubx2/Or5dY+jBlpklHmJzFeVM7mT7bVmyTz7S8msFg8SeGMH4ow17Dru3Q9nQpJStMg6da8w8KeB3DWC8a4gu7sRfWItwthl9JLSXCrU9JiK7s3xvaY1jAtWLlC2A2lWYrlSSTqkxud/yrWOYdYti3xC0vUvLfWW3QlQJECRIGxr034Vju8hCqz6X8HmPxZJ1+Mstg8SRR/8ARzwHJWOD8JCif/ycD+Bola4Xh2EtFvC8Pt7RonzJYaCJP0opkzIzTrIpC24k6a9N6+zR09Nct0YpM+IWajUWx2zm2v5I7TgiNBGlPJkQCJPeKbWxOoG28d6QHFtq8wIG1PyVk2uyQVQchAMb9q0QdCY3gEGYrAUKlaQPY0sIGsnrUZGrDEhOWY6a70kST5gZJmnckJykgmaUUk6JGg2qGGlkZ5ZkJPTrW+Wk7kyTM9hTuWBqCda2UScoOo0kihbD2jBQdMqiANuwreXulW8TG9PFEa6AVihoIkzuR0qMhqAyproRsdFHpWggzoQSJJp8I11MxqR3pTTC3ilCElSlmAlI1JnahckllkxrbeCIWzsII9enrScp2gT7a10xrwC8SrnDU4paYGhbakhYbFwgOR/smufYph19g1y7h+JWrltcMqyrQ4IUmf40mnVU3ScYy5Q63R3ULdOPBCS2VEHf1OlNvth1JSUz0BPepCUFQ6+hrS05VCZg+lWd2Cq4buAFcMllwgAQBSkgKGk6b0UuLZt5CgrQdIoa4ksOZSCAYJmnRmnwU51OLyUPxtBHA7ucTqNq8n8WZjgzgKiBI0FesfG8g8EuEQIUOleT+LQP2K77jWPWvGfiBf8AVx/g9h4L/Ssd4fkYTbZDHk3mj6SP2Q6AI8h3oBw9phNvP7lH0QcJdg/gNUfGr++y95Jf2YnR/soEjD8UMbPK/iK9EISInUe1eePsof8Aw7ExP+uVsPUV6LQAACQDI7V7bSfoxPI3rN0jSUiD1IArEolO5GvWloTAOUGSZpxJAOo3Ap2SMDSWyBEAdhSi2AZ0AA6mnEoTM7E671oCPNoYnehYaQiIG0E/9RWsvQE6GNKeCUrEpIGmxpIA3VPmMjrFRkLAhSU5QkTr1pKkkpIKySIgxtT60juTrMR1rOkQMw39ahyYSQ0kKJiTJOpjanQ3myZtTqaxKZ2HTrTgKZCdACdKh88hxMDajGVJAnrTpSCdNwN60lJGgkad6dSBBIOg6RvSZMfDkRkMDQCDJNbKRkBJ+gNPJQDpB/Kt5ECJ1J39PekllRWCLEawBEyBTTgT+ICd5qWtOWYI1BAio7smTA229aJESXACxK8ctyREj360mxxB55wJUr5dprWNJBX2JGxprCm0h2BrIHrV1JenlmRvkr9vwWEIBTJ6dK2lGmg3FLy5UySB/hG9LAIEE7bSYqlI14pDSkGMwSBA602pAIJjXcH0qQpMxB29dKSTpJ7zQ5YzBDWnTQZQNCD1phSAdT+tSyQM2hOuk1HcQCdToIoosrzREdSAokiCNwaYUgCYII1gdqlPBKfICM3WaYiCYRJ7jpT08iWsDRbP4QDqDM9a1yzrAPWnFpGYkqJ6eXaklMggKAjSTRAjSkgiSFSnvrSFJIUqSJJFPKWiDmWJPTrSFCJkggSCK4hoaUB8x11/Wm8qUJOYiSYk708W5HlE6CAOlNkJB0k5jqPSuyAxpSFbTGsH1ptSDBQAQOw2p9SNSCrbYk0haD1O477RU5BaIT6TomfTWvOuNIjxku9J8nSvR1zmCAT7DSvOGJSfGC7MSQ2T760nUvMUiKY4myPxxH7UQlOhKFda55jo/wC2LPTYp6zXRON1/wDaaMyRok9K55jWUYzaSeo2rxGq/wBXI9hRxp0XPhkpPENgogj70V6ba0Q2ZEBIjttXmXhgg8Q2OVcDmivR7tyQhCEQdADpvW/+HlmqX8mN5uSjOP8ABq7uSSEJWSQdYOhqJlM5iNRpTh1WQdIMma022VmBsB1PWvS/SeaeZvgQGlOqCRsowI1NEra0Fv5jGYnURS2LQMgbKUCdRS1ytQKVA699qTOTZaqp28sStWVe+kbbmskp/eI20FYcqT5k6b1oqjaQBtJ3pT5LJsHMBm1O01tYCtUn0psuCY2B6R1rWYQQnXU1HIWR0EJMKAJOwI2NO89aUkczf6GoilQqcqgPm1NILhI1nXcxQOG5YZKnh5Hbh4qnOSRGogEn3qOpzdSldNJ29qQshIUo5gQIjNvUd0qHmBPfvTIV4WEBOz5Y646lPfNGgio6nlCToNB0ph1/LmBVodJNQnbqF5UDMdiJ0qxGtlWdyRKfuUticydfWoDr7lwfuyQD6ViWXXTmdAienSpjLCUnQaelHhREZlaNMWiUeZUFW8mpYZg5YBE6DtTyEKgQgEDc1sI80BIlOpkbiluWR9dSj2Rlo0RlImCc1NqQASRpPapDkSAAMoBGgplYSBoQZ1gb1CeSZIZIggkmSmksrdZuGrpp0odaWlaFTqFAgj9QD9KWsaqgknf2polKk9I216Gja3LD6FZcWpLsqfizacZcbcQOcRNn4lT0F1KFAEK6wOxNczxPw94uunS/iVrfqaQmUtITon8jXdhJVqkGAIiscVlTuJOpgxEV56f4a07m3W8Hp4fizVqKVqyeZrHh3EcQxZGH4RbuC4UvIgJlKpmNa9Z/Zw+zviOH47b8YcaPNuXVsYtLeZDR2zH1pXhR4f2N7jd3xEm1QlxTk5yich01H516Mw/FMPwZhpFvcMmBKgRl26kn1Br5r5rUSoslpl2uD6h4Sv1qY6lvh8l7xNBscLZaC1BARGVJ3gVxrje9cFs4u2dYQnLKUhYErB0ietdFvuM27jCUPvupQlRytlJEknrE61QuMsPFzbm7uEI5YRBWQSnKekdTXlkluyek3No45f4ibfMLdSCQVJzFWw6kd4qlY+F3V4k81w6TmX8wEdOm9GuKXXG75IPKS064TlWCCpMDyn+n60Avm3bxRAukJbCYUkHTL2JNa1Ece4zrZZ4ZVsQtk8x11DyHAgxzFK8s9RUK4C+U00UJhKArJmjTuY61PxgWqllLawtnNlSE6Zo3gfu1Xrm8CpLbnzHMcogEDSBWlWnIy7XGLGL+5uVBQQxkCQUjKmNt6rb7kIK3PmSghKSYj3qXe3a1BxPNMJ0gmZ9art1dJgsoPlj5prRpqZkam9ckZ98KTlQokDoTUB1w5wTsQYinLpwKCVSBHQVGcMBIJEgR3rQisIxbJ7mJB039dKXmJOVJ23poLTPyiliCABvG4ogE2hUHr+VYRB2inLdKXFhJIPvU1+2HLB002EVDaXAxQcllENCvME6CRue1LHmI3giKQpsBUHprS8xAgEaidqk4j3FslXk0J1GlCXLfLmEK3o8GgoAqOp603c2XNQTmj2o42beBNlW7lFdWAkaUkAZYG9EHbEIBUCdO5plNttMkmrCsWCq4NPBGQ0TEAyafYQlD3NdA+71AJ69KM4dhLrw+6anNuo7Co67BSrn4dKTmKoGxn/nQO5PgJVS4Z0rw4sOVgxvVHz3KiqOsCrckBKdCQJkjeZ6UPwGzNhhFrZqUAptqCAO9FEAASPmy/WsayWZNmzVHEEh5tKRAGYAGYipLaVTAgjsajtmfKNJO9S28qtAQI1JiaXkae+HVDNB1jShF4oFJzqjuKIvlMyqB1oVdqABBggivBxPVMC3p+bza1X71adcx2I9Jnf8AnR69WZzHWTrXOvE7jfDuAeFb3iPEXAeSClloiC8+ZCED66k9ADV2iuVslCPbEX2KuG6TOf8Ait438KeHF2jC7ph/EMRU2FrtmFAcpB6rUdAew3qiX3ijgXHjDFxh7bls2lEFh1QKkrO5JH6GvNvEeO4jxDjN3jmKPqdur11Tzqz1Uf4Dp7VEw/Eb3CrhN1ZPKbWD02Poa91T4Wuutf8AI8fZ5acrH/xPQL6kOSAQPT/2qp8QcIYdied9hIt3ySeahMJUf8Q/mKgcPcdM4mjkXZDNzAEdFR2/pVjF0HflgpOuh61yrnS8BOyu9ZRzHEcKxDCXSm/toROjqdUK+tRUpSdEj+VdWW02+hbD7QW2owpKkyP+vWqpjXArzXMusEOdI1NsoyR/snr7U+FqlwxLqceUVlKYQemtaUR8qpFakty04C2pKoKSIINKyyrVQNMBX7mgACZkCsSnXQeXvTgQSNRBPbpUhm2VEgz9OtRnHIUYZJFhaBxac2x0BjQH1q24ZbISpBKD5RoYOlBMPaKFctae2YaRHrVns2w0Uc1QKVSlKoGnYH0rP1E89GxoqsLIVLY5OVwQhQB1FAcat0pgBJ5h0BPWrImSzMaJ+bKOv9KEYoEuDKEAz/HvVKqWJGlfDMGUt1stKJXHlGkH1qMsIjPmKgAZIojcIRnWDBI6TQ11pPMKQTCo0rXg8o8/bHA3yUlBKjGgIE9afQynJoATHem0suJTIUFnNEe1PspzyoJnXr0NG5YFqPJpCVI+8UjTY+tEbNxBRC94iO9NhttSQVgEgQQT8tOMoSAVoc1BnbakyakPgnAP4RdOJKUpUMiUydOvarAw8XlhbbiApAzJMmR71TmLgIjNKUfNHajWF3jZaC1ACVQmFamqF1fOTV09vGDo2D4k3mPmStflWAD8x2JFWVd82WAA6VADIobKUB61z7CVspaQ6Ug5ZgyfKSdQRRa3xMFkBLjiVkKnqkjv3FZllWWaldnB2jgDHrVl5tltSfu0pPm3WAdvU0d8TeDfFXjvh8L8OXsNaKnMjyr54tKU3+EN+UgdjNcy4HQ5cYlbJXdIbWFSSdE9Nuxr0thXEVr+w3LRsISQ3A9Y7DaazJP8vapYyaNbdkMZPKl14B/aR4awd7GU4N8Wy1KHhhOJIfdQnupAgwN5ExXS/CHh7iPAcCX/AJzPPG8unQrluuZlNIAgT2Udz20otYePznCeMpsn3zcsMXQhKjEJ/Ek+kTVo+IsLy6du8ObSLW4cU8ykdEL8w/jFfQ/wjXXqLnbOOHHo8D+N7rNPpo01yzGb5HQ2MuYyDSSlIJ8pEiZqQEgiFDX+XWkqAKvKlJCtBprX0Lc/k+YSRHKCAco3FNrQlSoOpAj2NSi3GqSD1jbSk5JzQCBoancC4ZB6m1t+YEEQNI60424lUBW8aadafLZJOnrNNKYg5hIPcUeRLWB1CsxAB670sKAMSJBM1FbWttWVZ0G1OpcE67Aan+tQxkZ/A6iNI10g0qVCMxGpnTvSEqkA9T1rYKSdtTrQjlMXAPtWDJsYECJpJCpiRHpuKzzIMiN5oWhm8VOaVAjfSRW2nS26FgwoEEEdCNqSVgEDbrA7dTSTOhIEmY1oWk1hkqzDyjr2C/aS4ww3Cm8Lfw7D7sNICEuKzIMDvGhP0rmnFvEN5xdjD2M4iltLrxEpbmAB2mheh2B0J0rOmxCeuulVqdFRRNzrXLLN2uuvio2M1oUBKBBTSFyQBlIH4taUQOiiRSFaad6tFRsQUp6Gf6VDvWErQSPm21qaoApK4MbCKbcMphWnqdalcMBpSWDlnjYD/mU6lcfOK8ocWpy4K7ppI1+teufHNmOCHnEiBnHrNeSeLZ/YThgDUV5L8QSzqo4PTeEjt0zQvh2f2RblB/D1o9JOFOyQTkOk0E4cBVg1sfKfKKOqSE4S+IGiCapeM/XZc8n+hE6R9k9EYXiaoOrygB9RXottCijy6BI1mvO32Tv/AIPiWk/fq+nmr0W3mKYEEDaK9tpv0onkrf1ZCEAyAnr6U9J1BgCT1mkGUEEkHtSgkKEbg/xpzBNjyklM7zttWisbgzrqTvSk+T8UA7T2rADMqywdNBv2ocMLcJJAEr01kd6wEKGpIP7o6+9aVupJ1BA36VkAfMnppFcjtxsbiSTH6Vv5SB1M61rMMpKUxEb1orVGgAjXUaa1zD3Ic1gEDXc+1bCSBChodxTXMI8s6bDXpS0uEryKOp1EUDCUx5CoJUJGgA9aeSqcuafTWoRWYJI0J2FOJdESZ8v8RQSiMjZglpWCBBn+WtbUsq0UdCZ+tR86iZSrMlQ0MaitB0xM77T0pTgWFch5R0kGNe1NuOHXKfXamg+CR2SdZOtNqdBIHUCpjB4OlbwCMYQpLswQFJBM9dabwsK+JSEgxrp3ojdBt1ABgq2mt24bQoFCRMbzVnd7MGf6e63cTUZSiB10I7U5IB1jSIqMXAgyAIB261nOB8kRGutVdjZoqyK+SUpeXQp6z6UytYVsZzQaa5sSZI7UhThhRQZg9N/au2MJ2pC1qEHUyd/Qd6jLWkGJ0M/lSXFkDyr9jPSmioHzfujrUxgJlamJeI3CgY9KQSdIkCO9Ypc6xB0Ed6aBSCZSO2lOUcCnMUIIyjWO9JKiCU5SSd4rSlQrLqCR1rMxMHUCTt/CpB35EZwAEmTIiKSTrJk6RW1EGCUmf0rWdKhCUgn16Vx2RspJBASQZEa1olJJEETSsxACoPqaSpKgYjLGuvauIYkoChkhMjWDTboA66iKcUROYQZGmlJyqWYVlAIj1rjiHejKAUj8685YiD/pguwf/KNej72VhOoj9a84X6grxfvI/cI/Wkan6UDV9bI3G0nFEj/Cek1zzGgk43aJAiSmYNdB41k4qnWPIaoGMAnG7MHaU14nVf6qR7Cn/TxLnwykDH7LWIdG5r0U3JbSoqGgrzxw6SOILEE/60V6JYt1uoQAjcDevQfhx4qn/Jh+fi5WRSEJbU6ShHUwe4oixbhsEqTJO5p9m2SwkDL5idZNbAzaRqdK9BKeTHrp28iFpI1Srrt11pvLrKklIJ3p8pgknUHYn0qx4N4b8ccQW6bzB+FsTumVgFLiLYlB9jFVbdRXSszeC7VTZe8VrJVVAlJUU7jpSCNScqgPzFWDHuE8e4Yf+Hx3CLqwcUPKl9spzD0oI6PLII/Peuruhat0HkiymdUts1gjZDm01gnf9KQsJSII6QT0p8oUJAECabcQYISATv70zKF4I6zrl1ECKSpe8EiQKU4TB0MSCSd5qO+ttB0OkbE6zRpZAk9vIl5e5T5lbCaiP3LbeuaFdulMv3C1KgCNJ261puzKzKliRqZpyWOynObk8RGFrduVSPKEa6DpTrVqhEKkEnb1qSlKR8g1A7/nSgkEBKQDGvtUuS+AY185YhCCDA0kwRTzYhST02md/WsbSSqQnUbjv604kSQqZ3M9aCRYhEWGwVTCZGwBpYRGokFW9bTJBKkgDQa7zTuQAQpMQJpLeCzGOSEtMjbXWQd6jLmMqdx2qc62omUkDSoa99SKKMhUyKtABGWd5BNaKoME+beKcypiPXTWmsx3gT33p0SrPgbJVnzZddOtNvAhucuijpHX86eKTOZWs6Uw/OTdQIGs9vSjXPAqXWTomDeKXCfhpwDhtpfMuPX2Kh91TiSPJ58oB9omuc8WeOHDmIsE4dfXCVrUJC1QB396Ep4Gf8Q8dw3hi0tXLi8urkM2yEu5dVGTPQDSSewruFr9j/wC4btsvFOK3ONXbZzXTybpTbAXGrbTY1IGvmO++lfKPxF4ynRaqVl8suTyfa/wt5V+R0UaqYYUEco8P/tFWP7StMCx24tlNpuAm3fUSQlR0E9hsK7/AMV4sy9hjguH8qQCfu9oI3/pRHgHwm8JWLhtWAcCYTasMjM2t22SpagDoSpQPWqx4w2v7Obu02Kj8MuVFKDCJn5QeleKvdNtqVCa/k9ZUrKove8nDOJ7pK7sPrWE5ykDmkqhAnRKetCblxCrVCwgLC1EKOXSIkneh2IP3FxcErWDkVAJSokDrrNKLzTVmlD7UEyE6aCese2taldeyJn2WbpMrePXqMyyp1SElMGNAAOgAqt3V6oIdUVEQnRJOvpRbGXUKuEtjmLMFQhP4e5qn310VgglZCoIBG1aunhuXBi6u3a+Ri8vIZU1zJVGsCN9xQJ9xQSkQQnapFwsrcJBJBnrUcpJgKSCQNTNakI7UYNtm9jYSY303+layJIlBkEb9qcy6GFDeB61pKEZYB6yYoxIylGsEiY6UsIIEQPpSuXBCjsRJ70ttlTpBQnQnSa7rkmMdzJOG25C0laNDrrRZ9KEpzrOVIHT9KXh1oU5SsDNGh9BT920rKXFAH9wH8R7kdqqzszI0q6dsGV+6aShwHLqsSR+7TK1yQJJFS7hqCVEAyf1qIUKSJBMJOoirEXwUpxwx1CkJ0KjHrT61BadAPU1GCilZlJ01/pWl3IAMqAIERGpP9fSo7OTSQl1CAggyZOhpNlh7+J3CLXDrVx90mAlImPc7CrJgHAmKYwUXeJBdpaQFBJH3jg9B+Gul4Jg+GYO38JY26GUjU5d1e53NBZeq1x2RGh2PkBcJeFNzcJbfxu9gRHIY0T9VdatXEfhngHDyLXGcMskpUVcp2VFUORKVCe+1EFY9a4YxmUpPdUnSK5P4ieLt5jlu7w9grmW0KhznhuuDsn09d6p0xv1Vvt6LdkqNNXiXZeW0FUZpGs+/wBafCMvmIM9B3rj/BHF1xhOIoYvrpxyyeOVwLJOToFCe1djbGZKVJhaSAoEHQij1FEqJYF6e+N64HEJUiBEJB2qSyc0QQQDtFMoMmSjTefSptqhRVoOms6aUjOCwj3I/l1InTp3mhF0ogK8sQN+1ELhxOYjVIIkzQu6VkBUtSRl8xzGMoHWdhHc14WGX0epbS7APEGJWWE2FxiWJXLdta2jZdfddVlQhCdyf+v418/vHXxkvfFLHii1LjeBWC1JsmFbrnRTq/8AEeg6DSrn9p7x7XxtibvBPCt1HD9g5leeQdL55Jif/ppOgHXevPK1wkyT9d6994PxS08PVt+o8Z5jyXrz9KrpDalkqM6nv3pBPalAA76TSuWDoK9K+eTC4EIUpCgtClJIMgjcGrvwxxeXCjD8TUErURlc2B96pJQZhIrSQoHqKXZUrFhjK5uDyjt9q+lxMggaRBmpjDLxy8sKAE1zrg/iaXW8NxB+STDTqz/6TXVMKJt4UUgD8QI2rJuqlWzUou9Qh3vAltxM0DcpNvdAeS4SNfQKHVPpVD4h4I4h4Sum2cYs8rbxli5bEsvj/Cr/APZOtehMCuLS9ytFtJJEaCJirfb4Xh9/ZrwvGcLtsSw64jm2ryJSodwRqk+oIPYiqy1Mq+JF2OnhYeP02ity3+VOoYKDBGYADKSda7j4k+At1glq/wAT8Gl3E8GbGa4YOt1Yp65gPnbH74HTzDrXHVM8teZCwUxIIHTqfUUcb1Z0E9PsF2jaW1AKVqdfY+tWbDXgGy0tACCYKT36fXtVdtUg5VZwEkwlUTr2PpRuzbSjLAOWIPXL6+1V7WXtOsBgBxvRwykjyqCdFdqjXVustytKQo6T/Oplv52ggrBOsKI2/wDetO5i04kJGYDLCdfyqsnhl5rcilXDC1vrS6hKZMQP41CdaQy4oCY2JI3Hejd+kFcBIU4JAB7VAUkn+9bTKxokiavVzaRj218sGFGXPA1JiRqCKfaaBaU4owCJ22qQllAQUIGwkxpSuS46UJLeZBTsdKP1M8CI18kRCVcuYJyx1iakLSFkApOon5u9SEMISqWzGU6Dr70pFuCmQsnUqOkR6VDkEoMTbJzJCFaSI179qlWtybbKMpGkRl/WmNMwK0yZkAGlt5iogaoAhPf86W0pLkZDjlFowu/GRLswUnbbT2q64TaW90oJcblagB5TCtddPSuSt4gtKikLKY2A30q08LcUPNXiPiFknmJGY6wPaqd1DayjQp1K+lno7hDhC4ubdwi3KnWGw4yT+NJ16dRVhb/buFoxJKrV1+LdawEJkaTCUjvTPgxxjzWF23JSv5Dm5iQfMSCMsV6NwdWDOBDjjTRk5AI30MidprDbxYoz6ybKk4VNw7weTuBvCGzD3+dXGrSb3E7lYuGrdchq2B1GYfiVt7V1FkQpMJygado9KI4/h37Nxe7sWyChDp5at5SdR/H9KiNg5goa/wBK+5eL09Gn0sHSu0j4P5bV6nU6ya1D5TJeWJJkaaVpTUKzazToSQAYMncGsKSSImrbK7Iykpg6abwawpggpGsU4ptRnXbTasy7J1965C8MZCFKkn0pCmzJIGhqSlJKkjcemlIWkjyiZ0B1o9xziQltZlFITBidajlDjQOcEg9Noom4mUTE6yaYW0lSSI2qc5FOIwh7WEkDp7UsOawDPem3GNNJB2EfzpOeCErBIHXbX1qSN2CTnMJA37VuVdZ00gCmhpsJSe2+9OTlCi4TvGlcMUzaimddNOgrcbaTSfUL16GJFZIgDOde4OlcduMBVsrUEkTWzBOeIikg6aq39OlKUoyUhI3oTtwgqO8gkmdNawEkHzRrtG9bMxsABvWlRHtsQelETkQsgAzpHQUznBJkxI009KeBRMyFR0702oCVDTfbtUPolPk5543pH+Yz0Gde3pXkXi0D9ivGRunSvXfjeR/mK/rqVCIHSvI3FoBwN6YBlP1rx3nf9VE9V4f/AEzHOHZODMabo1ijS5OFPJAIGQ6HrQbh0D9kW0D8Ao0sf9mPp65FVU8Z+uy15L/TxOl/ZQbnBsRXrq8uf+KvQlu9lHLUg5enevPv2Tx/2FiMEAh5QOv+Ku9lWZWbOQPeK9xpeaYni9VLbcwglJCSo9NN5pPWSCBE+1It1EpGgBHWKeUmdFGnNYOjPchIG6gNu9akSFK1IrJUB279a1mJ8xO+lQSpYMUdT5f0rPMpRHWd6wZN1bHTfWtaHTXWuOcjUkb6ZhMxO1aVABUU7wdKwqVOp17elJJKfOPffauBcsGzKScqiQT2pJWMwIkidK2VAGAmeo160hRSggnT2qMHKY4VSBIjatBwhUAkH11mmis7ZgZ9KQSQYB3E120ZGwmc1WQAjWY3pJdUAQEmRpvUdKlAAZj9KwrIBAAB3I6VG0P1R1TigNdZ3pvnqMEqgbjSmgozI0HWkk6Tm02E120j1hVw6Vgg9xrW0OHJA0iZ9BTK8xRJEyda0lSsglQjaR1rtoKsyyTzSSYQYjadqzmrQSJH51HKo8p2TvWitQSQPNBnXpXbQ/VJXNJIBSBPSa0tyYKyYywQNNaiIUuY0Ek7mlFwpB0J0n61G0n1Ra3AdB5uk02XSBsNQZ+lNKWDJkx6d6QVqjXbt/Kp2keoYVpQj5pB1HpWsxgqUdSNopvMEqIAgx3rDqCSdYnQRtXHbx0kRBBHQGk6p8wMnaaQRGmvQ6VilRmUnc9J0oWduFSSBmJGU/nWlygR8wHbrNN54EBeqdwa0CkaZiDNRglSFJJyjyklOkTSSuJB1A8u/wCVIWuEwoHLP1pvVwyoAAHcde1cTuHBmcUkr0J/Let/IOmk9KTOsSIVqTPakOvBtMyRB61OCXLHY3dGVahOm3evN14c3jFfEDTJ/OvRCnQ44SCfLtFed35Pi/iJy/g/nSdVHakDp5bpsj8bf/FAdD5TvXPsVE49ZzMymuh8aojFUDLPl7+tUDFUxj9lqT8teF1H+oke0p/QiXXhVJVxHZA/+aK9MWmRDTaUtyrKJJNeauFEq/zksBBP3o2r0qlaUISSUghI1ivQ+A/Rl/Jj+Yf91fwSAYEHrpWFaFHRMDN33qKu7zqIGkanXoKwLSkeYGZ6VutZMhTySUqSkpUBtvPvXpfgf7W2GcNYBb4VecHuuKt0JRmt7lKUkegI0ry6q4ggpMekfrTark6nNBGoqlrPHU66Kjci7pPIWaNtw+TrvjZ43K8VHWEN4GjD2LZRI+8zrV+VclWsKJ8qfUd6jrugQFKk6ztTKno3HWRIpml0cNND06+hOq1s9RPfZ2SlukA6wNoplTwSk5TIT9ahvXcTJkjUa6RUFy5dfVCFFIFW1Ul2UpahLomP34SSkGY0qJlduZGuU0u3tUznWSeunepyWspA0g7flR5jFcAJSs7Igtg2mIBA113NLLZOhPoKlZEgfKFCNZ33pCmwkrjQA9TQb8sZ6eCMAc0hEaafTeta6gbHURTq06EQZB010pEhBGYQCYJnrU5ySkKyZp02MzS0BKIkg9Ziab7IC9zIHWn0zlMAgE1DCiPNIzJMHfqe1PllUHLJ7E1phBWcu57TRq3whTzefKoaZhp1qnbaoPkvU0ytK262d8pAHSetQHQQQBpGoIGlWLEcPLXmAJA6nSq/cnKSoK2MH0p1NimhF9Tq4ZEc+YkJISowQBMetNq1E7HYDYT0NLIJUQdfY1iwSRm/2delWUZ8xoEkAgb7+k0l4kgAAQdNTWEqEkbxtTbxUQNRA026Ucc5ETXHJO4F4uf4J4gXjtokKuvhHmGFK/AtxMFX5EipdnxfxTxrj1mzcBSWeYpIQleuh/F2Heqi4YcAUQP6TXdfsyeHjHGj2MYvflQaw0sMtgnRS3MxP1GX+HevF/jXxSnV+ei+Vwe8/AXm5V2/0+a4fJb3sXxHAsHYZYlNy6A2kp+adjHpB0qpcYJubzDScQugmU5FqcTIKvqNR6d67pjnCFhhNkoLRzHSMqeg06iN9Na4j4oX2DYZYO21xclUIKADmlKN/lH6CvlFdb3cn1y21beDzxjuEWbV4t1tan2lr0UkgQnqTp5ZoetxDNs4CtKSoCVET5Dt9Ke4n4oU5cIUpxRbA5qW0tpbSQO86/nVHxji5x/+7KkAEyM2bUbVuVUykjCu1MIZeQfj962m4WUKIIUURECqfdOF1SgpMzpUq7vX3nHHl65j5iTOveoYbC1EkE6TpW1RXsSMDUWu2TaIq0bLI2BB06d6YBKQFBEgjvUt5OaI1nQ6GmyyEo0EDpVlPJnyTyRnHFZsjaInWsyklSwI0p3lgFJBgjvW0pKgYQE6xM0RCWRIGchsblI1iiuHWawUrCYkg+/pUZhiCkmAQImrJYWzaLcLAzGYPpVe+zYsIvaWlTlyLtW9JygBPzaT/u/WmrsF2VQBG2uw7UQcQhpvK2mTsr2ofcFvVBOVKZC1R07e9VFLLNGS2xAd0iSqDlRvJ1j0FQyDmB5cA+m8VOuyHSEp1SNADV08NPCLiLxKu3HLJKLLC7VQF7idwDyW/wDCn/zHCNkD6xVreoR9xmyh6j4KRg/DuNcVYk1g3D+HO3l68Tlbb2AG6lK2SkdSa6pgvhPY8JlFxiTqMRxSNVIT9wyezc6kj94/QV2bBeGuHOEMOVw9wVZqbaWf7VeO6v3ih+JxQG3ZI0H61FxdmzsWpdSlZHTQR6VXnqpS9sRkNMorLOduIbQ2pRBA1JG5270Dv8VGHsqdD4SlCZVmOw7zRzHrvyLWMjSQCokkAJA6/wBa4PxpxcrGn12Vi6v4NBkk6F1Xf2HSmafTO/6itfqFSsI3xbxxd40tVhaPFNmlWqhoXP6J9KrKT1ge1NJSQdacG+m1btdcao7YmNbOVjyx9lzLrArqvhzxom5QjAMVehcBNs5+9/gVXJ0kCCdqkMPLYIUlRSRqCDB9KC+pXQaZNF0qJ5R6VAAWCdI6f8qJWTRmTBPoKoPh1xmnH2E4beKi+YAyrJ1dA6/7VdKw9owFNhUHTy/pXnLq5UyxI9HRZG5b4nsC6UltKlqcypSkqUomAAOs7AeteavF37X3A/DfxXD3CNijiW9KVsPOqVls0SCCnMNXdyDlgetcW8ePtT8TeKaHuHeG2ncF4bUSFNBQ+IvB3eUnp/hH1JrgvJQZlc9dqX4v8PJJW6nv7A+Q85n+3p+vuJvLr4i5cdDSGEuLUoIQISgEzA6wNhPQU2EA6nWni02oiIUCIM0lbKkiUpiOk161RwsI8y5bufkbKdRIpYSBr2FJSoKMR5huKeSMw8o0jtRpANtDJTOoGtJcSRqNBUgIhWu46VhQdZO9S4nZIyekydZrp/h9xgm8KMDxdxKXgALZ5RjP/gUe/Y1zRTZGo0pTTq0rSQYIIM0m6pWRwOrtdclJHpi0eftF8xsqhBgdDPar7wtxKlIKXXEEep1Fch8LeMGeJrdWD4opKsTYbBSTpz2xpmn94dfz71eHLI2TpWlIOYwY0+tYGoq2y2yPQae3dHfE7bguJrtXG7jD3ynNM5TvI2j89Doap3iL9n3BeOi9j3A6bbCMcVmcfwxWVu0vFHcoOzLh10+Qn93qK4dx95hAbecIIVHt2iuq4BijVy2hxD4SuIJggH3rPmpQeYmlXNWfUeK8TwHEuHsRucMxaxubS7tl5H7a4QULbUNPMD6devSaIWGRQLbapKU9CJTPp+IGvZfG3htwz4v4Ym1xZaMPxy0b5dhiyUypIjRt4DVxr0+ZMyD0ryvxZ4e8TeHmNuYLxJhS7S5ZMtrTBbdR0caXstJ09ZOsGRUu7cuSxVXzwQ2WglIUiNR5xNLfbTBCjlKEwCNNf6U6y824ElxlOoGoTv6ehrHyVNZtZQJBnb0NITZbxhFVvi2hzlpSFK79ZND1EHKnKApKTMnWp2IqSq4DijEGT2oYQ44oKRlUjUJkwYq9XloybfqYpMKdSoEAAEGeo7080ylLYSogqO8bCoraglQChEGI9O1bcLrT4WkyF6KMU3GRK5ZOWlJQkKAgbHrSeUSIMRHm836082wp0gKUlOXUR19qd+DdSEmCQfNGXp0BoNzD28ZYMXzWzmQApI8wqOHHUDVYknQ/rRtVokAhSNcsanSmRZJTKshMjYJmjUsfAtx+wMWorQQpRjWIgfnWWjzlupC21gebTXr39qmu2TebMSnyp1A600m3aUUEpKSOk6CjTT4FuMkzp/hv4iuYO8yz8S62tCgFKHUHp+W1eleEvFJlBFr8U6UPyttJEgebc66afnXiW1bLa0uNg6+utdU8H8A4n4sxsNWbjiLBkpN3eKJyIQNkpPVRHQfWKoz8W9ZYo1rlmjHyi0dTld0j1xiF6nFOXeDLDjYiOkbfpUZlCc8ExB016UlS2Wm0tI8qGxkQn0EDettLCnkxvqdNq+r6Kl6bTQqfwj45rbVqtXO5fLCgQABJ82uh/Smy2DEjXrSg4AmE/NvrTSnQoyRB96Y5h7BQSkplcaHTWtBsA+VImN+tJU4kkakSdAP51tTg2PaDUbztgpSBOhMxtSS0JPQjcDpWkugKAkj9a1zMoifWf5V29nbBtSdFZQZAkGm1JTAKpIPXua248hTgBVAAMU3zgJMyAYNMjJC3A0pKpJBhJIgHpTa283SBGs96Up9CUkFQMjvTLl02CoZpGk6daYmJcBsskQBOneltKBkDvA9vWm13SIgqgdCKZN6jNBUOwiiA2tExQIUAIAPptWJWQInYnpUVN23MqWdBFKNyzpLkxuAa4gkqyxAUZ3FKUfmk6zUH4lsGMxgnalIuGQYCtYIrieSTmImASR1pKlmCEnUaTEfnSUuoWkgLTO412rZcRCp9NajJ2RpedSfl1y7jeklCyJhSZ6GnVOJBk9DIpovJUo+cnyn86hvg5MoHjZJ4HeBnRSfqCa8lcYtgYG8ANQU7GvWvjf8A/qO+T++ARXkvi4RgTqdZlP8AGvH+c/1MT13hP9MxXDmT9i2ygfwCe8UXcSFYY9lM+U6GhXDYKsEtpgeQUXUmcOejU5SaqeM/XZc8mv7ETqH2TBOBYjBP/iFg6+td4ghWo09RNcI+yWAMDxI7ffr/APzq9AFKHEgyAQJr22kf9qJ4vWRzbJjKVZZIIIToYFSUL5iJEidqj6nzAATvPQ0tCwgk5Sfc1ZkVYS2j2usd9+1aIkgkzGlKmAoiDGu1ZKB5UnQ67UI3ORKdFkExHWtZpMGkkeYgA5fcVn7qpGpkD+VccYBrAEieppKwMygNCd+wpSsvVR33jpTeYapzae1ccaUROsCdfc0lUg5tiRrGtK8qgNdj23rQiToRJ2rjhBhIkb0kKUYA2I1qIq/QbsW+YQelTDEiSCQP+vrXHGhG2aO3rWnEzJUAD3rZIgE7bAelaIChqYFcjssbVqdYmY0rSzE5hsZj0rZMpnKJnvWlaA7SdYqWyORK4UnLode1IQolCdIjSaUZg6iBrSUkxqkR2qDuTSlSFKIAJ19DSFuaGdZIHtS1HXKelMqWhQiDPeK4nLFpJUdzAOxrS1BKYExMRNa8sjUeb0pK1AQDAAOum9cFliVEQcvsYpObUawd/asPfdR+kRWiIBBOXtNcRlmgojNmO+uvetlaQJUYk9DSQUpSQIPXUTWSAJ8pkVxOWazgCd+0mKwSRGYTOlJCkqGZMR0pCnN1kgE+m1ckduYpRyx17g9qyQNVKmBEzTZUJkazvPQdqSpZyQAT9K7bkjczHFqKjJ02PWKUISkgkSrbXamkExmSgEjQSJitOOBsEKUdfTrXbTt7XI6t2EyQCPXcVAuLkqBEmKU88MqukGBrUYDMYGo3maNRwBOxz4HGDKydROutcBd83i9iUGPIK9AMtlKiSjf16VwDVXi5iahGiOtVNa+EWNCvexnjX/4qmExCdTO9c/xXTiCySROo1roPGaUnFgSSJQZqgYqJ4hsQEwNDFeC1H+pZ7qnjTxLrwqf+8dkCQDzBr3r0TzhlSSsxAETXnbhgxxDZKMaLmK70XSoCCdY3r0v4cjupl/JgfiCWyyK/Yl50hSVE9prRdVMcyDEzPWoCrg9VkxrpTK38qZzagbV6RVo8072giXwSSCTmOw3pBeBkpMEbwd/SharggAA79jWlXCwBlUTpU7ER+YZPcdBJBIMaUw5cZyUpnT1qCVuLy5yRO5FTmmUhIA1jvrNC4pdHK2UxDbLjqgXCddu1SUNZE6kER2rG0AgqII1gzTqRKSRpJ3npS5SH1wXyLaQmcpMe3WpKECJiR1kdKbRMiYTqNaklJg6RBmkykX4Q4GFAlXyD26RTDvy6xCSdRUhzLqkgjqY1plxP+ETMf9ChTOksDGuXUwOpn8qRPmB6ppZSIg6T09abE6pyxGx3pgsWklB21OhhU043oPmMa6AdabT80lY1NPsILjiQkHftINDJ4i2HWt0sFg4dw1Vy6gkEg7iui2eBJDAHLjKnrQvgnCAcpDYMRHmiums4aUMfIBKa8l5LWyVm1HtPGaFelmRyfiLBQEkcsmZmNq5viFulh5QWMoPb0rvfEOHEJJUkACuQcUWXKfW4EBJ301mr/itVuWGZ/l9IoLcimryhQg6k6600uFJBk6Tv0NOupKSohJBmJjb1ppRggqIMGQBXo10eSlHBrMFbzpuffaozq1BRBSIHU1IUojr36d6jXUJ8oVPTUa0yPYifQIdJ5gIcTvqd69meAt3hfBXhBhS1ZefiQXiN2rQElZOWfZASK8aJSC8gEz6da6ff+I7eFeHmDNfFOJVbsi0dSNxkJHfYgia8p+N1a9FBV9Z5PV/gD0Vr5ys7S4O2caeJlo+2q6fuUNNJLaWAlwhRCpGvvGteVPFbxLRcKfQ3iC1OIKkK83z+xqq8VeKrtzbvtsXEcxZy6zA6AT0HSuQ4xit3iThdW8pRMkg9+9fO9H45uW6Z9M13k4wjtrJuNcRuXb3MW/zFKkzmJIPr3oEbp5biVagZjOvSkpt1L0yEwQQe9PqsljKEEEGZ1rejXGtYPNzsna8sSXkBxQ+YKVAinM6RMDWY0rSLEtoKCuMvmEb0+LVCwAZBA3nc1LaXRKTI5YzeYzCd9dKYeZJgAbbEa1NuGkoUIGmkidDTJU2tUSBpI0kVG5nOKZBWjacpjUyaWhnOpS5CUq7HrTrzBKwUrgHvpSEpQhWUahOwnejzwKjDEidZ2i1eWPKRE+tWjDGghBWo5so2I+WgeHMBwJAWBOo12q0WaUjlhBAUY3G3vWfdPLNnSVIh3reSWypIToVrmI7fnQO8W04OQzIQlRMbT6yfr+VH8RbHmbQZQASpZOnfau3eC/2dbcW9vx54n4epVotIuMNwZ3Rd0Nw9cDcNbEI0KtzpAIwsjHlh31vOPgoHg/4B3XGTbfFvGBewzhhJBSpPkuMTj8LM6pQdi4dBsmTqPQdww0bBjBsHw9nDMHsk5La0YTlQ0nqe5JgEk6k1YcXuVXKvisRWhttACG20JCUpSNglI0AjYRAqjcQcWIbSbWyy6ggkb0uVkrn+wjbGoj4viVnhTfwtspK3QNwrWqNfPO37pccUoidPeiItnr9ZcuFlRWZJOkCuXeNnHrOBWi+E8GuYxC4RN46jQsNEaIHZSv4H1q1p6PVkkU9Rd6a3Mo3inx2nErl3h/B3z8K2opuXkGOcofhB/dH61zcgGtrlR1EenasSlR6V6KqqNa2xPP2WOctzEie5pWwinUtEAetaUkA6GmbQMoSk9zTiFjqvUelMj1pSSVeVP1mgZDCWH371jdM3Vvcll1CwULH4T30r1Nwzj2A4tb26rTHLO5cUlObK4EqKo18p1FeTmkFPyiT3qQ2VIIUoBJ71V1WiWqXPBb0urlpuuRKgToSSO1JQ0ZCcse9SFpWcsFIgR019aRlXMbmtDBn5EBnWAJg9KcS3Kcy0wPXY1tDYSMxTp3rYVmWJQQgSKnBDaIr1uXDLSSlQ1k6GttKK5bVCVJ1UJ/hRJlIXAzaEaTTN5YKyi4ZV96nUdZqXHHISnnhjHJVE7+sfzpPLVB1iKftHkXKOiV7FJMRFOutHKZSYjcDSpSyA8p4BykTsPemigjWp6mQASlQ/hTC2wRoY9D1qGsEpjmEYjdYVfW+JWL6mbi3cDiFpJEKFepOAuLrDjfAm75DaW7lsBu6YnVt2J/4VbpPae1eVUogeu1W3w84xuuCcfaxNqXLVYyXjI15jU6gf4huk+4qhrNN69eV2X9Fqvy9mH0z02zh4b87UkEH5dM3efarHgi7m1SlKHMySQRMjNUbCFWWKWDOIYfdJet7psOtrTssEaH17EdCDRextFghEBXQEzoRvEV5qaw9sj0sMSSki4YZizpDZUVZkagkbGrBibXDPiFgR4Y4ztOczJVbXCQA9aOR/eNKPXun5T1qs4fZ8xIUFkRqkjUEe1FG7R0z58iwOhqrMuQk0jzl4keG+O+G2NCzxEouLK7zKsb5oQ1cN9vRYG6Tr201qouvKK4ywkpny7E17CvLPD8ewl/hfieyF3h9yNQTBQrotCt0KTvmHsRE15n8SfDrFeAMXFo44q6sLkFVhfBEJdR2VGyxspP1GlDF4fJcjPcjll61nuVSg5s0AdI+lMsWLiV5UpypkwIom+0eclwIIk6k+/wDGpCmYQXEHUbJTvrVxS44KjpUm2wUiyBnMgkgxsNDTgskLVA1IPliBRNLYAUdUxpM6g1oNoRL7xAaabKlkx8o10qVJt4REqowW74B1xdt2zybJtIDuUrVr8g/rQ1t99OJEB5UbxJqHh90u/wAXfulAy75teielScpTisBMbwda1qqYw4Z5zU6mVjeHwWHCFG7xFlp450LVqlWxFdRf4J4bUyl1vDltLKZlDqgJjtXMMARkxa3Kkn5xvXb7w/2ZopIgtiQPpWnoqK7M7omdqtRbXhxkckvsGsWuKMOwdKVqt7q5S2slUKg7we9egH/sv+HzrKHLe6xtkOJDhCbhK/MfdOlcSxcFHHWCOK0HxiN69sNpSbK3UnKfu0/wrS0miom5bomZrvIamKTjI5Dg/wBnjw4wh1LruGXWJOJMxe3JUn/hTFX6yw1jDrZNnh1k1a27ICW2mEBCUj2H/XejymwuYME70jlJ1yhOURNatVFNP0RSMS7U3aj9SbYGVbOglJSdRqZ3pbCX0nyoUY0gHvRVbAiQoACdt6W00AuEk766U/fkRCOGRlNvpAntJHamlKe3H61YF26FISYCYFRjatzqkmNTFI3F5oC53jMyP51sB0x5jOsz0oqbRvTQ6dulb+DTAIJiK7cRgGJaWqQSSOhHWtlh2JhRG/tR6yw5T5yhRk7wIipr+DjlzObTc0mVyi8FqunMclKetnU9SO1RS3cAkazAAqzP2gSvKpOx6Corlsk6kka7inxn9ipJYZXnGXSZBO/WmE2zoI8xgdTVjctEHaZ2+tNG1QQD6Qe809WfcS45AoZVGuiSaQbQqMyAZmAKNKtEyCCT0ANNptFBwJnSaJTAksFdura7SqRMEE7aVGLV6JIWRtVpubcJUfxQNCKaVboVO4IAMdDTFJCXwVxLd0V+bN2mn0W9wYlRJOn1o3yElWXJI2ikBkkA5SAfNFduI3g9DL4E80kA6T+tPysCMx070/ydSAiDBmkqZUUgZdxBqMnPAxzlmUqMkj9awOhJIBAiN/4UssqJ0MTrTK2FjUyQNx29a5nJFJ8aV5+CXzCozgkzXlDjD/4E8ZJ1T/GvV3jI2pPBbqSonziZivKnGCVHh98SCPL/ACryHnH/ANUj13hV/wBKzfDSf+xLVXTKNPzoypOXDXiUxKD1oTw0QcEtT1yR+po4pknDXST+A6VS8a8XsveR5oidI+yYopwPE+pD641281d+S83BGhUBOvevPn2UkLGB4rGn9oX0/wAVdwLjg+YT7fzr2mkf9pHjtVHNjQQU8gmQQrvSea2BCs3b0AqCVLJPlIH8a0pbifN0A2FWslNx4CYeSAUlQkjSlh0KUVCBp/70JDqs2QJMgx7UsXEQTtqINdkjGEEgsZtCJitBSUiAn8U/SoQfBVEgGBBrOcTss5uvqPSuyEiXnTv0HWklWYGTIqOX+o3OorXO6FUT+X1qTiSVwkAmBFaOqZAAI9d6jc+SBGu2+prC8nKTCYOsTUMgp17iZs8eQlasqSevU1cWXkPNBwdRMjv3rlXGd2W8SS8iJGvtFXDhXGkX2HIMeYDb2rkHJJItCgICUmQes71pWXKddeonamEXCFoBA21gdKwvAqJMdtakDKHU5Snc0g5QeulJLojQbVrOFKBTIB7VxwpJSoqyiQBudj6U2ZBjLJI2mnbcBbmVSgAdxNNugIcKUkHKdIrk8k4ElcLiQSRI9R3pudQnJ101pSnNBr6idqQXABmSduorgco35gdfYikrAKspUJAA9vWkqXrMTPWkBQUYy6kbd647IokKUYVGkq9u1IJRsJj1rRV33BkR3pJcSAQoGDXHbkbhInrqdO4pJKdj2j60nMFaET2Ea1hKlFJPuROtTgjcjJAOYDQbikKIMjp2PatqXEgGRvNMl4QVBR81SkRkdKoOiZn+FILhSCkmKQt0TpMTlpHO1ykkRrUkOQ4XAgCDvrpUVxwFQzE6a6661txc/nWZm1EgbzrFcgXIbS3O3XoadQhCJzAAwI1GtZoNeu2taU4Nwg9470RCFqUZgDpA9q8+tJnxbxUFIEJiu+jMpRkagflXA8PSXPFrGJzaD86oa54SL+g5kxrjJMYprMZd/rXPsVKRxJZnYSJJFdF42Rlxcb6oIArnuKpniWzEbAAgnrXg7/8AUSZ7mpf2Ily4bBGP2hCSRmmRXblE5RoQI9a4pw8n/ty03Hm6e9dqUrIEydFADynQGvU/hr9CX8nl/wATNq2P8GiVECE76+1IcmCCdOsinUjN+LXYTTKyCmZUFHzAzpXpTyzbGSASCITI013rRgpzduw60o5ZIG4396UnYiQZAJj+dcQk2NoGkEHRUHWiTQSWwQgyUk1AAKl77GfeiKJKUk7xl/Oly4LVC5HPOCMw1G9OAeUJOqeg9KS0PNJMACFfypaCmcyUggb+1IkaEI8khhIVIAGu+lTssxKD9NqYtWlOLASkkbQNzVkawR4sgqG4BFUbrYwfLNLT0ysXtRV7lswo5SCdJ2qK6VCJ3OxnfvRPEmXbdS0wdDoBGpntQx4pIgEnpr3o65KSyhdsNrwxknUZtxrtuKTmICssyaXMEDNMdO1ICjqo7GrCKzNpT5suUanSdpotglqq4uEAAHUSADQxuVAFQIjee9XPgyxz3CF69oqrq7PTrbLuhq9S1I6nwhhvKQkwPLEAfrV1U2Es6dtfSgOBNhCQIiKsLsBoCdvX+dfPNZY53ZPpGlr9OrBVMdbBQSQTodK5VxZZpVmKUTCTp1rq+OJhClFw+XcDrXN+I0ZwpIA/LXWtXxc3FpmV5KtSizk16goWqAdDBHpUAiNUo8oNHMZZLTyp6kgQetBjJKk/vdO1e3oluijwOqjtm0MqBMkjy9BOtMvpX5swGnWpJzJkFR6RG4qPcDQnJOs7VZi+ShYuGCZHNACQQDUbHLE4lhi7FLhQoiW1EEgK9R/GpGmfoSdfWnFnMiAIPSKPUaevVV+nYsoqafU26O31anycYxThrHrBS03dg6tKT5XGhnQfYihC2HR5XGlggRJSofyrvUCRlJSI3O000pKFHKsQesgGvOT/AA1X/hLB6ev8V2YxZHLOI2tsHCDPmCpIHapnwKUmUNiJmut3ODYTdibjD7ZwkHUoAJ+tUnjCzs8Numm7C3Syk7hGtZGu8Ddpo+puyjb8d+IqNXL03HkrRskp8qdCkQCe1a+CWgKUpqUzIgb1ZWbOzXbB1TZzEGTn/lWJwrmNuLYcUCkEhBGtZFmkurju+Dcr1lE3jopr1u6VZinQakHqKhqtkuFUHLAkDvVmvbZWRXMCtBpprQp62SlsrzK0G46iqkbX0y3KldoEuJlUSkwY9qTyiXU5YIjU9pqe40haSttIAzamNq0ww2FqSgFWskqp2/KEbHkI4bkSUygZTpI61YbWEmAhS1uEJKQkkz0gDcnb3igtm2lGVRbgK1Hf0H516p8C/CVvhO3Y8QOMLcKxlaeZhtk6nSzSRo+4D/rTMhO6R/iNZ1zw8mvS3XEd8JfAmx4YZtuM/EWxbfxTyvYfg7qQpFp1DtwNlODQhHypiVSdK6NjGNF95d7euFx1SypRKtSe8/wpGKYybh4kqJWdRrof+v8ArWq/fJW/nlOpA/FH5ClRSfYM5Nlc4nxZ++uC0zKUJ0B6T7UDYwRx5SS42P8AEY1k1YnLDPcla1KKUqzR/L3rd4/bWTSlLcQhAbU4pajCUIAkknoAJJ9qes5wio0kss574n8YWHh1ww5iWVC754lixZOoccHU/wCFI1J7kCvHt9fXeIXL19e3Cnri4Wp111ZlS1KMlR96uXizx2/x9xS9iCMycPts1vYtH8LQOqj6qPm9iB0qjgTMHrJ0r0mj03ow57Z5vWaj1p4XSEpQTpH5dKfbbASDEafrW0IUnUCnAJA0kDoKu4KLeRMJEbkimlp/GqB0NTAjcq0EVGQ0LpwkHK2Dp6moaIX3GEtrXqE+Tv3p4oQnYRUr4daQSmCIqOpJme29RtJchEHdP5+tOtrWnVKiT2pKUneDp/GtjMPmQY6V3QS5LEnCApQPMGvaZpLuEKbRlWUFP4VTT77/AMMnMpWZSttKgG4ceXnfUSfYQPpVjArJHuG4KmmgSnqqKYSladEkCd59KMKJXslOmm29bTayCpxERtUbSM5IDGYE+QSRoe1EW0c5OUCJBietYmwCswSvVOoB60620ppQJOhFcR0V/FLR3DroXrOfIowokdamslLzaXUHyL0AnY9aOXFii/YUFpC0AbxtVXs1O4TiC8OuCAhRhKidB60HMX+w3G9EtbKTKgnU9TTCmBBBBlXWiht1QpSRp7VGWjMJJ2mYpjQoHchMRER1pSW1oIUmDFSlNAgQoaU2URv1NRjBx2HwF4/Xh92OCsSeUWLlwrsFK1CHT8zfsrcdj716NsbxJAJGsmQNCK8KsOusOtvtOLbWhQUhSDBSQZBHqDXqbw347c4w4cYxMpSq+tlC3vkJ6OgTnj91QMj1zV57yul2y9SKPReK1e5enM7jg0klBggp1JPSrCykKXCiOh9YqkcK4wguoS6ZOfSeh9f1rojQaeQHAkSrXToK87NNM9DFpoeThDd2zIImeu9DuIeFcI4lwO44ex5rmWr/AMpToplwfKtCtwpP67GjmFONBZaVunXUdPejC7Vu4aMgEnUbUt/uGm0+DwZx3wfiXBvET2A4okKKcrrLwHkfZM5HB2mNuhmgLTcuQdR+8dtq9d+MPhy1xlgJQw0lOKWQU7ZOkRKo8zZ9FAD2IHSvJyLe4duU2SLZZdW7yQzEq5k5QmPfpTq3lYQ/cu2RH2kLQUhZSEjzRp5e81V+J8YPwBwuxWSyuFPK/fI6e3rS+NLrE2cRcwB5t21FncqYuWnAUuB1JIUFdRBERQrE2ghpAO2XYCtfTadRanI89r9c5JwrMwBB+IgE6gdaKZSMWCo6dqHYEpsXSREQKKLUUYqmV6qmtGf18GRH6A3hUjFLfMYOcRArt135rJg5gohuuJYaXP2owAZClpia7i+gHC7dQBB5YmK0PHv6iprF0c1x0qHF2CLja9bGvvXte1SThtorMCnkp1j0rxTxMlI4hwVUnS/b1+te18PAGE2emgZQfpFa2keGzH1qzGJpTc6yQRsaSEgnQTOu3XtUhxKk7Rr07Cm4VMDUAkGDV7JlbRET0/xRSm0650nTsaUtIy5dYCdJ71tCSVFOk+grskxjySQ6oo1MD9KTII0OhOsU8WByE9z1qM40pk/MD10NJ3FtpmwmdwNf5U4hBnLv79KYDhB86RAPQVLtFBwxm0O9Q5cEwW6WA3g9qCkEnT9fejNxaJU2BppqIpnDGUkJPWNZ2NGHUJLYBQNO1Yt93vwei01X9vk59i1qGXSlI3OtCViDJ0jbSrZxFa6KKRMjSqspJbEkggR7CtbTW74GLqq9k2R8oMSCDNIKRtCpiOlSC2kwSPUU2puNJ1J6bVb3FFojhMQIB9NhWkoGadCZ70+kATMR3ApISApS56aCpUgWiPcIIUYjY69vamOXO5EnuKlv+VY1IJH0plQImNe470amKkhlTYJGu5JJ/rW47ZR12pYBiVQO1amVRI/LembkL2DSk5hASNOo61otJCVKzFRPXY+1PpgkIO0zp0pMGQMwkzU7kRsGS0CRmIkDbamVtgAQZOuumxqUoFQlQgHem3ApJnPI07/Wucydpz3xqbA4JfUnQZ015N4yCjgL/aO3rXrfxqCVcDvACYUCCK8lcYmOHrjWNBXkPNvOqiet8MsaVm+G0j9i2oiYRPtrVwssLcuMGdeA0KCaqPDIJwW2UVgkoANdy4L4ZOIcDKuigq+7UdqytNaqbXJmrfV6tKQ19lCxIwTFSdFC7dA0/wAVdrNsAsnLJG/vVC+y7gqmsBxkwAoXjomOmaulOtIS4pEGEq09K9roLlOpYPH+QpddgO5DczAmNBNJU3GpT/u0RDew0O/SsDIUDIBkTV/cZyiwUpmSSASY7bflSHGFmRMGBBA2ozyW42A1mkclOpBBA1ii3I5rAE5DqVEJOkVssuaAnWdNdqMlmQYAg9Dpr1rRbGpSdRpttXZAwBw24DBrSkLEgDToOlFlMJ1jQe3X+lJ5Xf5fauyRgGFtR1B2/KaS7bLDR1BjYzRLlQoGOtbcYQLckiSQdK5smMeTiPGTb67wiehp/gC7dbcNsp0jzdTS+MBlvliIMHT3qu4TduWWIJXsCdOtAp84LLrUoHZWlLOVIkgazFPBs5pkiTvQnCb8vtplXQba60ctyVKlKtTtI2prkI9M3y1gQFJkHQAzWw35oSAPNE0pwhtScih3il24W4sJiQfXrQuaiskqtt4GDZrKwpMJUeoVWFhaXPMZSdYnpXu/wW8HPDTFPDfBcSv+F7K7ubm3DjzrzedSlHff1qP43eCnh3aeHeMYnhvDdpaXdnbKeadYbyqSUgnUjesb+sR37dvya78PLZu3fB4ZU1ChCkk7QaaLf4lGCekbVJcBCpEAx/GmspyyCZPXvWwpprKMh17exhSFSJP0HX3ppSM0JmOkGnlLI3Cj6xSQTlkCVEwDRbsAbBHKUqQUTH6U2EEnQROhjfSnFEqPUCe/StQoACdOgip3A7EMclfQjb61otLgjMe4608FEiAqYG0UgFQX2HTWu3YI9MYKCmEqOopotqVMa08+VFz6U0tQCf8AEOx6UalkU44YkNqKRB1iSYP5UlTZSqZ0I61tK5UdVEDSKQp4ZpJ80b12SGjRT5hPpSYVBkmI6itKfjzSoq207VrOqdSBrE12TsG15m5IVB6GYpBLkEgxO2m9bzOFJManuN6QTPmB3gAfxotxOCRZIU84UpjQdK4tgOH8zxfx0bhAArvvCdib69cQMphPbrXPuEeGVPeMvEiC3ohKdAKxfJamMOGb/itK5rcl2c68RLUM44E7koNc1xNJ/wA6LPU7CuzeMeHix4qDKfLCNQR61x3E0xxRZgHUgV4uU99smet27a1H7FtwAE45awJ83auzKGoI6gAzoK5Bw8gfty1BXIzV2XlpEDOBIETXrPw0/wCxL+Tyf4lW62IlKTAcmQCR9KaUZGk99algJKQASYGsHrTK0JUqU5t4ielel3Hl3AiKUSdsx/Q1srIAVEz17U7kgE65RWihITKd5kiuyTGDEIkKGpNEW8xSCdyIynp7VACU5pB0On1ok0BlGpII3pU2XKY4FoBzSRtpqBT7YJMADQCRTIUAMpmJMRvTjTmoJJP+LrVeTwi9XHJZuFcP+Ku0TIE/l6V1hvAGkWqSQYyjbWqd4c4dzFoeO3WutPMNot8qUyAnftXjvKapq3EWe48RpV6OWjhHGeG/DuuEHQ6+tU1zyq9exGorqvH1mhSFqTAKQda5LfvIZUQXCQa3PG2epUmYPlavTtZipQSAZj6nWmivLJJ110ND3sVcUQlhBM70iLu4MlSsp301rWj+5iOeegk3dISrKqDBgbV0Tgy9RbIbUvUqIIka1SMBwdD7zalnPG9X82TVo0xykZfbvWV5CyLWw3PFVST3s69gakuNoXOh1o44ryQCBpr61X+Ggo2bMjWP5UdcUAnTWvA6jiw+gU/p5K1jZEKEiuf40mSokgntV8xsjX3qh4wRrBM9dBWroHwZWu5RzvHWkqK9RMzAqsOiCZ0J6AxVvxhLaiUgRrqSaqd1ywtSi53IjtXs9JNOKPD66vEmyNlSk/PPp00qPcmJlW4ETrUgKSdFkCNZ7mol04Up3JnatCDxIx7F7WDTq7JMe3T1rFJOsDbcjc+tMlZ5gAIyRoCetOPOEgJSMp6x1FWzLYlZAMye/wCdI0za6wImK0twT010Mik5lGNQD/OuzgHCY8FBcDVIned6oPHOU4gyE6ARrrBq9J1IBWIIqg8ZSrFWwAOlZHmcegbvgf8AUNkhpMWqVASIgmYFP2IIZcKYOh/FNNZUizQI1I71ItBDDvl3G4NedeFE9VzuBBbF0HAogutyd9xQu5tFEBKFgAjQDWn3lrQ+FsqOZKioa9fWlKuW7kLcagLQApSP3SevtXmtTS4zconp9FqFKKhN8gZbHJARlJk9qftbJE8xMaEHUmpamyokhsKnfNsk10XwV8NRxzjqsRxdg/sLC1JVcgyBcOH5GQRuDuvrl0G9VHN4L6glLJefAfwitGmbbxE4stAsFXNwezcT5VxtcOJO/wDgSeok6RXcloucRzXD5UATJncnufrU+zsF3sPLQEtphKEZYAA0AHpGgHTaiztqlCEpUIAIgDSqknuYzJUXMKASVEwZjNM70OubdDaciViQYzDX6VacSQhtsgKBkVTsVvG2ElObvtG1FHLAnhEB1SW1FQTOUfu/r71wn7SXHysGwdrgzDH8t1iyObeFJMotp0QD0zqB+grqvEXEVngWE3eNYjccu0smC84qYJA2SPUnQV4m4r4lv+LuIb7iLE1S/eOlwJnRtGyWx6JED6Vs+N0++e59GL5PU+nDYuwIsFRM7TOn/XtWNCTEUsDttvUhtoEyEwdq9AjzjbGUpJOWQQNdakNMyoTMK09KWhgAwSDpW7t8WzGZEZiQEJ6z3ogVlsi3OZ5wWLIHdxQO46CpjNslpISBqB1pWHYeppsvOAla9V1MWgESIAjqKlL5GN/CInL06iD0pp6zQ4SpI83fvU0NqUSAM2mmlKDKyAMg1qcAARaC2SFJg+lI+YkgmR0ijjli04nI8mFdIqA+wbdQSE+XfNFLcQ1wKVcm5dU4tWmsCNKkMqb0cURB6GgibnqVVIZuEnU7D1o1ZkBxaLC3kJBCgZHSpgbSoAGOmg61X2bpEgAEfXU0Zsr1tUJnp13mjUkwUTBbqAOkHuNvanUseUZwIn61ItltrnLvM69qms25MAZSVaxA2qRiWSM2yUJMggEGRG4oNxPw/wDGW4dbI5rSJTHX0q2pYdcCVBIJToR2HrTdw15oUgzG4FRJZWBmMclCwK7+NaU26sh9gQrMfw9z61NcYKFKSQFSJTHaovE+G3OD337ZsAoIWRzgdgo+nY0iy4hs7xAZvEhp2D5p8poYyS9sgJQz7kOKbVOUkRE67U1y5A0maJFCXEJyEEDQGN6Sq1KgCUAQehpi5F4BLyC0krMyBp71c/BzjNPB3FjK8QdKcLxAi3xDsEk+Vz3ST+RNVa8bzu+URytNtzUVvMlZSodyT6f9a/SkXVq2Dgw6bHVNSR9AMMw5DTyQ04kDQpIMhQ6Ee4q/2IcS0QBAyDc6VwL7N3Hn+dfCiMJvn1KxHAMlu4VkZnLY6NOfSCk+oHevQ1khZYhEKEAzG9eH1VcqbHCR7nS2RtrU4jTdwpp4JSdtQelWfCbvngIUQTHQ1Wn7dSlFeQaRoDFT8NdetnAMu5iaqvktIP4jhqX0RlCtND2PevO/G/h0/wAP+KdjxTh1iF2+IKS4QEABq6CkhRj1BCu+p7V6aw55Ny15oI21HWvMn2tPH/DeCcZwngThy2tsRxK3cF5iaCswwgg8ppRH4yCVegjuKZpqZ3S2wE33w08d02ca+1rw6jBfGzG7hloBvF1W2MDSJL7QLn//AES5XJ8YIDKdj1gCureLfiFb+N/B2GcfqtmbDG+GyjBsTtG3M6VWqlE2z4P+1zEKGsFQrleKhXw4B1EHpW/VCUcRn2jzd7jJtx+SNgwULtEDpRO5JGKNApBPrUDCAfiW+giJoleCMSZXGoPQVan9QmtZgF8NSTiDPm/GnSu7lvPhDOUj5BXC8OTN6yop3UmfzrvVulKsCZER913irugly0VdZHo5jxagoxjB3Qnyi+b/AI17Xw0D9j2ZykkMo076V4v4oRnxHDEwJ+Nb2/2q9pYWM2D2UnXkIGvtWrp3yzH1S9qbHSjQSkCdTP8ACm0p7Hynp2p5QBgEhIpCUKIkgSDoO/rVtTKDihC0ladDoaUhJH4gSdq2pCvMg9CTWITmSQQNtNYrnI5R5JoWAykQAY1gUwShStvQkxTiEkMgEDbvtTLiRBMH0pZZaeDXKQoDQdzSkWjiVZkExSEZs4zaDeelELJxJJQTB6UE5YDqh8hnh95axkc0KSBB61ZFJIRBVB9DQHA0gLUNwSJEVYlNpKQEpy1iap+49FpVisr+OMoWggJJ9Z29apbraUuKA079j/zroGJN+VQB0PpVJxNkodUQmBAiKvaGzjBm+QrzyDlo0JHbSab9SCTvp0p1wCOxBmm4CSFRPStRSMbA3HMgGZmsEZkhSQIOwpaQRJA6yNKxgguefqSKLcRtGLhEqyGJV0qMoGOifWp9ylGaQIjv1qGpKSdYO/XrUqQEoDOUDTXedTt6VhzCB1HWnEoEmBIGsnr6VsJQpQGWOlHkXsGhoZ61ikqUdSABvFOgJ1MAb/pWont0P1qcnbBgpVIPfp3ptYVsATOvtUgkKSQR5fXvTLsCAVDauydtKB4zoKeCXyozCk6dd68l8YJSOHrgHsK9beNOvBFwd9RqN68m8YGOH7kAHbrXlvMv/qYnqPEL/pmK4XSf2NazBlFer/CWxS74X5lhJ+7VNeUuEROC2pmJRXrXwjfSnwvKAo/3at9689e8T4PQ6ZJrAR+zXaNJ4dxw5B/4176earBd5E3Togxniq99m25Svh/HglW188D/AMVHrtU3ToKSPOY/OvY+Gk3UeV81Fb8ms7cyIM9aSVACB0NayJOumm1IVonUnStrJg7RwqnKAkTrTcghJg1ihBA3jUEdaQqSkqCfmqVIBxNlRyE6lU0hTmpG3cU2cwPyr/OkLbUYkn0NFvwDsHeflT540/6imjcAmSf6U2ttyZBnvTK2lGRlhRBmiUzthI+IGaQYjqacuHU8kqBEHQT7VBIWFiBECt3YIs1KI1ynyzUOQcYHHeLn5xN1PlB11iqwp/K6mFgwZozxWsru16kKBI0qsuqWlSVaiO5oM/JZS4wdK4bxEJbHnPy661brC9UqAF5tZn0rlXD164VgE7joa6NhErSgnSNabuyhHzgN8/MvKFfSiGHkFYJjcDWhJz5yoDTap+HuFKgJ2IJpU37WMjFZTPoh9my9F14RYKCpJLKFtEj0URRfxkyr8NuIUjb4J0f+k1Svsm3ouvCxpsk/cXTyD6eaf4Grv4tJz+HePpn/APEXfr5TXkJcTx+56qPMM/sfON3locOeJ212qE86gaBQ0601dXa85ABJIn+NCrp5xRICVGI2r11cvajy1kVuYR+JChGYTPtSVvjWBOm42oK4+7IhJiKYcuXkdSdKfuyJ2B9TqBqpQiCNaS5cNhXlMxEDNVdN65mzFSgaQq4eVG4JmpygdgfU80owlQmYpvmg6kfkKCoXcBQJMQP1pxu5ezZSkqGo1qMg7CbcXBDmYLg/xFNc9J0zCYmJoNc3bjbwOUwkmti9C0hIG+p9KdHorzg8hnmIOspBJ7RNYpYCpVA6UGF0sSRI1nQ1oYg6JBB+tc2cqwuXBMA6jcA7VgeHyzGkk+tBvjVkEhJn9awXileUSIPXrUZC9PAYU8gpUQrQetIS8gHyf+xoUp5yITJB3PasBcg+U9Ou/euyzvTOleFyUP3z+xECI9jQrgOzaV4z8VLCQIQkajrRHwiWRiF0CSNAAfpUPgJ8Hxg4tUSIyoGnWvG+bk/UZ7jwUEqYnK/tFMoY43SQmZa/CPWuBYoB/nXaJymIB2rv32iHEuccJUlOiWtR9a4JiKf+91qlQA0FYFHLNPUrngt/DxIxu2PlhKtZrr67hMpPliK5DgKZxlgf4tga6e6l4HRP617H8Nv+xL+TyP4hjm2P8BFN03rqJO1NP3KJEkZQJEd6jsNLjzeoimrltQIEAaRXpMnndg8p8ElJIOYjQGsVcJyxmygad6hhKpIAgGPrS1eQAJB6zXZJUB8XAUZBBMSCKItPJCQZEj9ZoMyYUmBGsxRFkGd5670qxliqJP5uoMEH2p+zUVvBCZOZUVCTnMJUSD+7G9E8BY5l63KZ1HSqVs9sWzQohumonauAmENW6CEa+tdBuCAyFARG4+lU3hK2DbLST2HSrfe6W8jQxXz7XWSne2fSdBBQqwcF8UOIrk4g7h9o0oyIkbVzVy0edcC39CenaujcbctGMXDriYhOnYa1z68ugXVZFFQAmva+OxGmKR4byycrpNsxphppJyoGmmo1panWmiFEwe28UP8AiXQsFWYdPSmHXM7kFRKpg1qOTwY2ElwWOwxpTDrTbCJJX0PWujrdcct7dbkBRjMD3rmPD1sFXLagn5TFdMdADDAMmI6Vi+Qwnwei8Vlrk6vw7/4JuClOgOtGnlFKJJBmgPD3ls2wROg39qMuwWvmgRXh7+bGe5qaVaK3jbgAiDMxJqhYu5qokz0gVesZ02KYOkxNULGUfeKkbnea19AuDK1vyU7FolQ0M9Kql6EmdAE6mDrVsxMEKJzbGqniDZKlHXNqPSK9PpXjB5LWRznIOzADMFZZ7VDujmEjQAVIdaWTrEb6GolwpfLhR061sQeWYdsUog0KSpRGbrOvatuwTGYg9JO9IyyTMHQAR1rbqAYSTsNKuKRjSXIlSshkdBBB11pAIKcyFTpqT3pRiT0mBSFpVIUACAqTUsWOIInMdhVF4qUpWLpBy7/lV6QpQ8w19f4mqFxHKsXSD3jSsbzTXopG/wCAj/ekwikf2ZuUzpuKl2xHw6ylPQ1DyAWiU61MYJTbrCBACTNYEvpPVf5cFZfQkuGB3096VwNgCuJfEnhvhjOtKMWxa0snShUHlOOpC4PfLmrbqgXSSDtVx+zhh7mIfaC4FYZQo8rGEXKp6JaQtaj/AOn+FY7+mRfivfBknxE8NF8O+J17wJw4HbhDt8WMPLwhSkq2zEb5e/YGvS/APBlnwrgtnw7hzZUxaJlbgiXnjqtw+pV+QgVbrvw6YxzxFvOLgELRZtrtrYyFKS65q4THUJ0HbPVmt8CYw9Ib6AjUj+deelY3wz1PDSwRLS0bbYBKAI1g1FvnAlZkpIidOlE765QygoQJjp3quOOl24VGu/zDalJnMg4rLiVKbaJ0ge3WqZcYc488pbuVPYnoPWuh3aAllRgSQIITrNUHjviSw4N4axPiXEFy1hzKn8i9eY4dEIjupRSIqxUnJqK7Yu1qMXJ9I8xfai4w5d7beH2HPQGQi9xIA/6xQ+7aPoBCo7lPavP4SSoAQZolj2L4jxBjN9jOLO827vrhVw+onUrVvHoNgOwqIhEahIEV7HS0+jWonitVc77WzfLGaAEidh7U4ACCkEAjr61vkhxQmafZYWsSEwNCNd6s4K7EttFKSoqkDtUG1aOKXyrgmGWdEz1NP406phtFi0ZddOUEHWKL4XhqbO1QyhJKoBVJkzQ43PgNLauTQa0IQBpptTqbIZQpwCSZy0QRbJQZCRBMyelYq2LoKkn8+tNxwDhkJTaAfKkQBtTRQBKZAMTU5drBKHDtBEUy4yAudNtR6VGDiLkCRJVMdY1ppxppYyrCVDrmMU6rykNZiZ2gSaQ42+rQNobHVTih/CoZ2Sl++9YlRSdCa2fWtACdKrRH99jqLlSFBRB0ojZ4iEqSVJkgzvFCykHrW9RqaYngFwi+i64biiCtIIHarRZv21wMzejiYlM9e/8AyrltreKbWIJ0qyYRjDgMhwhSSDqabGW4X9LOh2xBChss7iIp1yzU4iEAByOp60MwrFGrzIon7wTqfxCjDT2VUuHMoHMoURYj7lgCXlk1dpNu80CFDKQoSCa51xBwm5ZPLcspWmZ5XVIrsLtsl5AUuNBI95oHimEpcbU6U+ZEnKkb+9BKCkQ4uHRyqwxi8w9QaWCtAPyL3HtVpw3FrK8bWppwpUkfIqMwrMUwa2uGhzmpgaHYj69aAYJhzTmJuoJUttgHKqY12oY7oPDFy2sNPsEA+cwDKtepqC4hPmMFQGmp0NEnEKaCmVjMRse/rUTIuSlRSIA0pogs/hLx1/o+45sMfcKlWal/DYgifntlkBX1Toseqa+i+APIumAtp1LiVoCkOJM50kSFfUEV8uwnIvKdQDBjrXtr7JXHrvE3CQ4cu7kLxHh0ItwDuu0I+7X/ALplBPTy157zOlbSuieh8NqcN0s74u1JClJBkAbDenbS335iIEQD3ipDSXUr5j3ygeaO/f2rzd9pP7VTHAluvhTw+dZucbeCmnr9MLYso3CYMLc9Nk9ZOledpplqJbIdm9ffHTx3Mtf2h/tO4N4OYa5gGAKZxDiu4aPw7CTLdoFDR52PzSncx23+fF3jmI43id1i+MXjt3eXrqrh951WZTq1GSSeuv5bUOxHFL7F71/EsSu3bu7uXC6++8sqW4s7qUTuTTCHSkylUHY16zR6SGkXHZ5TWaqerfu6LzhTji7R5Fs4W+akJcAnzJmYjsCJovibahbJka5RvVSwS9XKWwE9JlW+tW+6POsEuFJCkiDrpTNVDhSFaeWU0IwlsF9kkgEjXSiOIpKLtiI1ioGExzWs3tPeiOLKSX2CkJGo96rWdlmH0BWzIQ+2og6KBma7vaIH7AYKDqW+81we3nOgjbMN67xZKH+b9uYBIQNvarOhlhsRqotpMoPESf8AtPDFBPy3rWp/2q9k4WCcJszOnJT/AArxzxOnK/aPzOS7bMf71excBcDvD+HPQCCwj+Fa1MvczK1EMokqJIInQbaUlGsK37U4sJKtD/zpKYO4nbSrKkUdmDS+ZBO3WsZKRmiQe1aUcu8GNJjSlMnzzpJrnImMOSVlJaTEmBr60yoDKd46ipKFJ5YToDsBv9DTC5CPrGlK9TnBY2LA0NCIG2mveptmgBcz+lQUHKr5j33FTbVf3hMbCgnLIVcSw4ClReV79qspOVMSSR6b1WcCc++UDqAdqsgUFIBgbVjamXvN/TR9gNxCcsqmTNU/F0lKiT+cVcr8pybRVRxdxtMyqFevUU/SS5KushlAFaYJhQpCgQrffpFKddbJUkKBynUk01nRGkGdK2lIxHWbEpA1Mxr7VtltanEg6x6UgKBhRUT6Gl2b33wk6Cp3cAKHJl4laCStB9+lQ5gAyOsVNxRwuEEQRHYa0LUVTmKT6elFGQNkeRwLTuFCBrFYTAlWpze2lNpzRogHfXpFKzLO4kDt1o9wrabOQiE6kGVa7U2vJp19acI0A+SBtSS3m1kTE7b124jaJcMp80SBTKgkjMpMwe4HtTykmQpSAUx5tdaSpsnpvqB6V247ac/8Zsx4JfKdCFA6e9eTeM0LGA3JJgQOnrXrbxnbjgi5hOgOnXrXkvi8Z+HbkgbJEz715ny7zqUek8UsadmcKkjArSDEI69da9DeHnEKbPgE2xciEK1nWa8+cK5U4FaSM33e31NdDwXFF2/DzrQIACFSO1ZUavWtwbCt9Gvcde+y1iyHcCx8rIzLvnidf8VdAcyrccMjVROtcV+yZdKdwHFyU/NeO6d/PXbMqColR1KtxsfSvW6CHowPK+Rt9WQ3lEAp2Mz6VmRMBRVMjqKfShBhQ6aR1Pc1imxurVIO1aO4zdowoAmRAPfvScoCdp1p/KDplywIPoaSsEHSI10+lSpEbRkxpAMimjJMBBFSyAAFFI1AEU2USYyk6zIrtwLiRTJAUJPrTS2s249TpU1Ub5Y1kikkbASDOhNTuO2sgKYObcEHSYpV5arNitQUJjepXkMgIg9QT196duwE4auEj5Sa5y6JjE88cTNH493zSqdNPzoMbQOpgqHppvVg4gIcxF3yxCjQy4BaRnBJB31FMCN4MnlvFJIHm1rp2BhQQkI1B1muU2LnKfC07TJrpOAXYW2kGBAG1EwWiylEqEnQmNakW85vIUyfSNaYUtKRKt477Vls6nN1V2zUD5OTwejPs/8Aj/hPhng93w/j1jcPMuPl9txhOYyRqCJq5+Iv2r+Esc4UxLA8Iwu/NzeWy2Ul1sJCQoETv615Qt3kHTWT9JrS1ffRrBJnXas2fj6ZWb2zQj5CyNewZUwA4FkSRG3aKYdskTuPc96IhaRqfKCOlIcI1J27xrV5NJYRny5eWCzhqBoJ9e1Mrwtte3tMUUXr5lJI0EkUggqKjp6AUakQDf2UzMJ1MjpT6cMt8hAAmQIipZUROhEERHtT8hRBGkCPU+tC5kxjkFqw9idAQN9B1pdvhjB+VG86kVLVMxAjv2p9lScoAk6129hbCq4jhLZf1EDWQKiN4S0ep16baVYMTSFPHQCZGmlD+UNAConberMJ8FaUeSCMLZBEjSI+tYcLaO41g9KncvNJA2809KTlVGw3iRr+YqZSIUSCnDWkEKUJ07daUmxtxvAOwEbGpqyEyDEelIiIkQd6HewtrGBaMJmNj6Vr4doKkJKgZO1P5N5UT5TSCCmCNo2FRvYSRavDxYtb15RHQRVR4Lxpq28YeK05hCgiNfSjXDtyLd51SCQQJPr7Vx7h3FnB4s8SLLivNkrz/k9P6r3HofF6r04bPsP+Nl4m74yU4g6cuuL4lJ4xthOyRFdO4/fNzxCtalKPlMTXMr5H/fW1k7pGh9q8zCO2xxN2yW5Jl14ebJxy2KgZKq6w4wqAYFcs4cSRjdocoOvaurumdAAIIr1f4e/07/k8v+If1Y/wbaZ8mUwSQANKj3LKVbGZ6EazUtAlJzHSAdSOtNPrXmBgEZfzr0KPPfBB+HEAJEnQ1s27RIUmQJMz1pxRTonKTB/XpSioBMgA9NjoetECmR2mWtBIAGuvaiDLCEiQRIEHbeoTSiVhMA6xvRJpRSkkiYjbpSrCzSbDSJ0Ttse1WXhKySu55qUyUxFAUKJOoidJ7RVy4Ra0BygiBv0rO1cttZr+PjutTOtcNohDYg9Ksl6kFgjKrQVX+GpCUzOgo/fK+5VOum4NeF1DzafQdN+mefvEFCv2hcEaabH3rnHIUmVAyTXSePjN9dK2OmprnTgG6ST1r2/j/wBJHgfLP++xvlpIJg6iNdpqPyzzwkEGI2FSlrhMzorcevrTFsSVgnKDPQVprox38Fl4ebhxsmAc1X64EtMSBEiqRgUB5sBI3q8PLBFunQ67E71g+Q+s9R4xew6fgSotGco0j+VFXXRk0mRvQbBFBVo0ZGv9KJOrITmnfSeleOtjmxnsKn7EA8VgpVlMEz7VRcXSsrWdyBMRV2xVyTESAD3qk4zCsxB0g71qaPgz9b8lPxJtZnTrrpFVu+a8ylKSoJgyetWW/UNRKRpMHrQC7yrBUCE/hjtXpNM+EeW1YDdQtJUQIT+Eb0NvgQg+wJopcNySEn21FCbwZkHpp1rYplyjA1D4YMCFA6AEafnW3lQpJG0aViIGoAJnekOknXy+WDttrVzOWZLEqEyM0a6mJmkjzKAMbdKzzAiQIk6g96Sk65Z212oxQ8gmYBIgR7VQccK1YyAP3tdKvSVZSE++s1RMTM4xqfLn6bmsPzb/ALcT0P4fj/ckwstMW6ZCthvTzEC1cmSSnetEBLafMDplAH86daTFk5rP9awpP2npV9RWVjzqk69KK8BcfI8N38e4lw+45XEC8POHYS5kzfDqeUA++DsClsZQd5X6UMfTlCl5djOoNU7E7toZ3FpB1OmuoE6fzqlp6Vc3KXRZ1FrglhnpL7Mf2r8L8P7m84J8SLsjDMWvVXjeMKUXDbXLghXO/EpCjBzAeUzIjWvaCsQsMXtWcRw66auLe5Ql1hxpwLQ8gjRSVDQj2r42Yjc85YAPUzl2FdL8F/tHeIfg1cJt8LuxiWBKUS9hF4sqZ1Oqmzu2r1Tp3BqnrfGxse6nstaLyUq1i58H0wvmlFWQjKuoYtA3KlFJKpO1U/wk+0Z4YeMdom3wrEk4fjWUczCb9YS8D/8AKVs4PVOvcCujP2hSMjCioBJkH5h6GsCdU6ntl2ehrujasx6K/iCE8halpMj5a8jfa745AVh3h/bLggjEb+DGsZWUHv8AiV9RXrPifErTCMLu8Qv1JbtrJpdw+SRISgZj/CvmlxrxPfcYcU4nxPiGYv4jcKeyknyN7IR/upAH0rW8Np/Ut9R9Iy/M3+nV6a7YCeaSFtuKIy/KoyNexpxpgKAlWaZ07080yHmyyE6lEex6VIs7ZS2UuRI1B9xXqdp5XLI7VupawgA6/pU2GmGyARJJJJ0A9aTc3Vvh1sXXHACN4P6AVXg/iPEV18JaylsnU7QnuewqHLaHGDlyTcFtXMWxh6/dGZDBhAHU9KuLdsWyCAc4136U3guDs2Fqm2aT8vzE7lXejKGeWnMUo2ypA3nvUxW0Y1u5B/L8p8p27bmkuIKIGpBP5Cp5TGUGCdp13pD55KSkp8y9z0FESlhA1aUpURqT1O/tUS4Q3apzXDifOdEppV9i1vbBZbjMPxTqTVTxDF3n1k5x3iobwKfIRvMaCRDZyg+XQa0HfxDOsqMwPwkzQ9b6iSCSCaaKyTqTSZTJjBiFEa61tJ10rRQobitQUmlYaHDwUe8VsJmYnams0xTidRNEn9yMYNpgHtUm3fLZBSoabioedY0/lSkXGXcUWcAuOS14TjamnIzkajXqKv8AhOKIxFnK2tIdCd5+bWuPMXACwoGNasOEYqptzyuEe5psZ7uBabrkdWauVSttTZUT5TA2rbrCedzVEqStJB9KHWF4rELMPpVlcAhQBmU94ohavJuPKUeZXywnWKJLDLSe4qfFbAsMPfu20RkRIJnrpQHhPDlN4aLswVXKisiBoB61fuIMNZxPD7jD3jAcTCVq2SrpXNOH71/BMTXgOJkpyO5EEjQq6fQ71DeGLlEOPsFz7vYakEVDLKhBAGbsI196sj9uFNDJHlBKyDEGhbyFeYtncAyetEIlEDuNiR5tAZFXTwZ8Q7jw146w/iJKlfDFRt71sbLt1mF6dSNFD1FVd1hOacuUTt61FUCCpQA1OqQOlLtrV0HB9MKqbqmpr4PfnjBivHF9wCviHD2hh2APZW1voe+/cQ4PIsRsgyBMg614K4nwx7EcDYU0fNbX62FKUdBn1BJ+le3fsx8R23jL4I4z4Q43epTc2dqvD23VHMpLSpVbux3SsQT6etebXfDPHsN4l4k8N+IrJdrifJccCFp+Z9kZxk9FpmCNCCK8tp4/lbJQ+x6TUyeohGS+Tz07bv2lw7a3DZbcZWW3ArcKBgj9KSPLpV14j4eusUwdfE1mwpb2GhFviiQDmCdEtvn30Qr1Ce9UpRB0kaVvV2KSyYdkXF4YQw97lrSQQCf01muitvfEYUpzKdQF6dPzrmVsSVJyxqYmug4A625hC2g6kKKdE59T9KO3EoPIFTxPBNwxSy4gdB7daI4u05maWUxqKi4UylJScpkGNaJYwnyNEzII0M1myfKL8OEyWyk5mlEnRSa7XYX2XArdJUYyCuKtZvulggHQ79a6thqi5grUnOnKOm1O0vbBu5iivcXXKFNJUD8jyFHT1r1JwvxOP82sOJknkJA/KvI/F6lN2rhUSPMFbz1rvHB9xcvcM4e9nMG3SQPpW1p8OTRkahYOnniZCvKARFLbx1KjqY21mqc0pSdFzJHbc09zgEKk7ROverTikUssuqMXCxAV6wTT7VzmJIUmMpiOornpxBbJlLhBAGnrU2y4hcBKQomUwBQShxlEwab5L+0+Q1IUPaml3QTqSNT+VVVviJwNeYyBHXatHiJtcjMAAaRtkWW1gtDd4c8BYBHl1E1MtXCog5u+1VNnFGlnVYjeZoxh+Ityn73QHUTQTTSCrXJeMBKi6rMuBAOlWcn7pJ0IA77VSMDxBsvKSFwkEEga1aBdqKAWzt/CsXUv3HodLHMBjFgpKSYAqh4685CwkyI71d75SnUlR1PWqji1rzEqCjAIpmlnhidXVlFJexB1pxSS5101p9nGOq1Akjp+VRcZw+HCoEwTFDcPsnTdeZOnQHtW5GeUYEo4ZZmLnmN9DNT7LIXsxVMCRpNDVDIyEISdO50pVjcrbdUk6SYAHWpcgdvIVxEjPljMAOu1QDy8xMJI0isxB4le5gayKHuPvcsa7bfzoosCceSYA0SVJUI32paFNlQA016bVWbvHLph/Im3VG2YDepzWIktpW5KVHpNMwxW0M5tNDpM6D1rSlTMgR6UFXjKEAAqII01NMKx0HVMEiRpREOIfKgNMx8vU0hSyJIAJ21g70HGLlStAZJjasN8+swkmT6VDOjHJXPGWFcFXBSSSTM9xNeTOMQn/Ny6JOuUaV6n8XXnFcGPJdzEkgbdJryvxicvDd1mSNEiK855V51CPQeMWKGZwmkHAbPzEeTp71YjcqRh7yCqPIrQdf8AlQHhVLZwCy/2NdOs0Ru1gWjwSVDyn0qtoVm8tax4pTOrfZDI/YGKHvdOdP8AFXfIQVFMkCddN689fZDV/wBg4oCTPxDn/wCdXoIEDcTpNemoeI4POXLLyOoISAcs77/wpMlKoCdh5TO1Jz6eQe5PSklWUlY1VT8lfYxzyiIMk6zO9NrVIlX8K0FoJUYB9J3pCso1jcwJO1EpEODNlQSf7uSY670lRM/KO1IWs6lKiI6EdetJC0oIGUgFXTrUpg7RalkTm7jQUhShAiIJJOlNFwgeYCBPXakZ06qmZM6/z9aLOANo4ogQQY0kxSsRUr9mO5SSQk0wFgkdZMU5fq/7McJG4PWub5RKWEzg2LE/tN1w7zFDbwEgGiWLIz3TpGkLP8aHFCQmNSQdZp66F4B60qZcDmpgzA61d+G75amEkrGh1A2Iqn3TYKAZAVRjhp1QhvNsdYEVK6J+TpCbgqaSQevTpT1o+rUKOg3UNxQ1tYFuDNLtHClR8xII7VDZLLDbLIjU66a1gcJeOupJ26VFs3AfMoH1rQdPPKdYB0gdaSzgkV5TImCNSBTS1KmAE9wKbWtR6Tod+9NF1Y0KZO21cngnDHi4BIzKAiTprSVE99BrBqMXSoxlIOtL5hJzAmDqO1TuZ20dKh5UjLExpTzS1BJE++lQ5UU7QZJ+lSGyVNZZlMdTFCEkLUo9OtO25nYa+o6VGM6gmVdqfZMDzTA20qHLg5IFYmAh/wAqpE1EzpSfMJEdD1p/ElJL0EaiZg1E0AGbQCnxl7SvNYZtKiNUiJ100/KlBYgqnUdAnSmpkmJg76b1rOFJhSdBvEzUuQKFEhUyTJ0y1iVZEmVASdKQslQASCD0mtJXl+UkSN/WuyFtHCo6AQNd6QpXlylIInSetI18qQAJB67msUonLBIiakLaSrNZSXBG4rhuAuR4pcQGIgjeu3WyoQ4dYjYGuD4EufEziAgbqHWs/W9F7Sdkzi0h3GHFFR26iueXif8AvtbSmPKIroXEKCvElqgap96oF2P+/FuR+4Nz6V42X60j1P8AtRL1w4Ixy2BPXpXU3YIAJOm0iuX8OAnGrdMT5q6e8CFDKk969R+HX/Yf8nm/Ppu2P8D6CCiD080dKi3BMqlIHtT6R5QkAwRG29Rn1CCEAnLrG016HODz7ixkqgkQQBrMVtavu5yp96SQpIAMwNgTrW1DyHQ6jSKPJCjwNtQlQ80kd6KNohI0EDUUMaTncBIJM6zRRpCS2Encbik2SLFUR1hClKEgTO87gd/Wr3ww2Etp8pOoA327+9Uu0QVOxlO+nY96vvD6SlIABChFZGvliGDf8ZD3ZZ0zACnlpMkRHWjl+59xKlEGJ0oFgZhlI67nSiWIPDlSBHljaa8Xav7p7erio4hxyom8uUoVqZ6b+lc3vCrKmO+1dD40XmubrJInT61QbhqGwswANJmK9toHitHg/JLNrI2YkKzKM+m9bsTBlJg9u9RXVrzlAggz12qThpQCZ1IGwFajl7TISzItGCqzXTQOmU6HvV3uFqz2x7qG5iqBgbpN4iZMKj0FXm4Ukqtt9wawtdzI9P4/6ODp2DqJtGhmg9hRJ52E7agfn70GwhYRatFA9T9anOuAiU66V5Gz62etr4igXia0anUHbvNUvFVZlOIOYD2q2Ym4MpCZMydtqp2JKjMSSDvqK0tGUNY8lXvyZJSeu9Ab1S0pKSIkHfrR+/J8xSTOp26VXL5RynLIJ/WvQ0Pg8zqewbcQUEHZOsUIvJS2khRPoRH60VfUQlQgkbCDQW9cWoZZzZevatah8oxNRH2sGZoJzJj1n1rbjm8EaDrWgNzGsnWkOEmQmAY8x3rQRiyWBOY66Zp1mtZhIK2wVRIB3jvWikScqSYgiKSNHClZkHVX/vUix1KgSCDGkmdfaqPegnGSqN1aVdhokmASB3qmPgqxkZlT5uk1h+c+mJ6LwC90gyZDYA0MDanPMmycEyAPzrS05G1QOog+lbzKFo4ZiBWFPiB6WPZWL4FNu4U6diRpr3rm/EF6oktBYynMND6j+ldDxlakWrjuWEyZVm2MaVyfFHeY6FCZOpmu069OpMXqJZnggLJUoqPXWlEgJBJk0kDWYqXhmE3mM3KrSybKi20t91XRttCZUpR6AD+Iqc45ASJXCt8myxZm8U4W1NnyrSSFJPQgjWQY2r2F4X/ac4swy0asuJyvG8P0QHVry3LSANfNsvb8WvrXlnw58P8AF+N8dbsMKYzAKBU7HlQnua94eCX2X8FabYxjidpS8Lw8hSGXNPinRrKv8A3isXXyrnw+zY8erFyuim/aW8beHMd8NLfBuGb8LuMde5dylaSl22t0AKUlQ7qVlGkgia8dOI5itEpPaK6Z9oDi7CeLvEzHL/h6zYtcKZfNpZN26AlvlN+XMP8AaIUZ9a5/YWyn1GEiASTFa/j9MqKFFfJneQ1Dvu74QuxtyHEJzZQkSdN6i4ji7OGOOtkzCsyR1IOw02FGblBSEWjKJUsDbUigPGmDN2j2HifIoZHVA6kzr9auzzFcFSCT5YHZtsR4mvJBKGUmJPyo/qavuCYLaYUwltptJGbUn5lnvTmD4db29shm0aCEQNMu/r796OBKUjyNwoQET2oYxxyxief4Gm7dIcnII1AFOKSSSCAARKSOncUsqPyNHcH306U28sNo1mQP/ejCY2+5kQlYg5d9BH1qtY1jzbIUltwZh26VviDEwk5EOwE6D1PrVKvbhx95ZUZ3G9DJ4FOWRV3ibz7ilFU0PcVm07U4UKMnvTa0R1pLZMcIbO1aPy6aVvXoKwyBO9Cxg6kt9vzpQZQsgSJqJKvWtpWpJkE0OSNj+B9dqdCnY+tYGikRqROsVpFwsROwqQm8aUk5kgdvWi4YL3CeQMsRpE1o2UmAKlNlpWpUNoqShIEdZOsdKNRB3MEG2cRHc9KcbUtlQJmAaMm0bcJ8sgR0qK9h6AJGojU9qLa+0dvyuSw8MY8bd5CS5Edzp7VfmrxhxsXluo+YdFGEVx5q2caWCyrX+FXLhrF3rZxLbyypBOWNNqOLz2dCW14L2l/nMk5SUK07T9Peqbxzw25i1ucQtWiL60GgQJLiNyB3I6VaGHihwgRlXso9qUtSGnOYQE5tUkQZH56VzjksZKTwnj/7Utja3bo+IaAChGq0jr9OtWBy2StMBMJ6Ab1VOMcGfwHEk8SYQ2UsqV98lJ+VXX6GrNguMNYrZt3jMQU6gwSD1BroP4YtxyadtC6QAAVDsOlC7uyS2JUgDedNI70fWnyygZcx/DpUd9olsLATAMa7ijIcUWz7O3iC74Y+J2GYs48W8OvVCyvjuOS4oDN/uqCT6a19APF3wrsOO8Jw/j3CbZv/ADj4cKbu3cSkFVywmS7bmPmBGYp7HbQxXzAWnlOAjNB007elfTH7H/iYOP8Awqsre+eLmJ4J/YLsqIlZRohf+8gg/nXnfMUbJK6Js+LuU4uqR4jvuH8Pwfxm4y4WeaUcIxbCcSDjYEENuW6nkaf4VgEdiK8tNN5yVhJIABI7V9EvEbwtbR9pDjJLZCLZXB11iFslWilJcZW3KO+UyPyr59YFy136GHQCHE5YOkmNKboJb08lbWrY8obtAwV/fNEjpBO9dB4Ss+HlWjq7awCL5tOdLi1qzJBIBAB0VofSqi5h6WnXEgRlO3/vVr4JaUV3TQK0hTajoTlJ036frWnOPsZnwlmaLFhnlWQoaJI29am4shRZSonXTembJJGZQI0P0ipeKmbNGYASKyZ9mrFe3JtBAbbCSJgb11vBEJVw8yokSEiY61yRslTTRBnTaK6/w/f27PD6EKWZyxBFMpbUuAbI+0pXGNuPg34gzr7V3zw5sy7wRhrigFDlD+FcO4pdbcsbgIIHlP1rsfhXxEwng+ztXXyMqQI00EVrafdu4My9xS5LM8y6gmGjG2g/hQ+5avM0JR5eunXvVmtr2wuVJl9BOh3og1b4Usf3iVenarnqyh2imqIz5TOfKs7xSgPNm2npT1rYXoWSMxj+NdDNnhKCCVCnWW8KbkgpMg79KF6rjGAo6PDy2UtnDr8oEoO1Nrwq7BMg6J11jWavRu8JaQfvGwRGhNNruMOKOaVo1nbtSfzEn8FhaaP3KW3hd5mA5hGvej+FYVdIWnmOHUgipPxthmguJEba0Uwu4tS4CHGwDqfNNBZZJx6GV0xTxkLcPWribhQKpmP41cW/u0jYqifagOFO2xfORYIPajqVsgJGaYFYOom3Lk3tNBKJEvn+W35AQlM7VVsSxDVRUJ9Iq3XSWnEGVJ1EEHpVbxO0twDJBOg0otO+ReojnopmJ3YUowNztG1RWVpBGWJJHvRm9w5knN80CZ2qAbRAWIAPUmtuuxYMSyl5yNc5SgQUny9AJjWnbR5CXtQdfSIpxLTaQDMCNvSnbFtsXiE5RE/nTHLgV6fJvE1ggKQkgZTMUM5hH4QRI0NGsYS2hQ8oA9poM4UgkiAJooTbWUDZXhiOW2pJUUySOorFW6FTmHTSlpLceU/+9OAjcEEk6UfqMVs/YhnDGVDMpJJisGF2pkBB0E66VMWoKEBMk76bVpawoSTJGgPei9RkemkNJtWGxm5W/wClODInQJT3mK1KFKmQNJ9zWLSNfPrXKwlR/YpPjGU/5lvExOYDTpXlXjLKeG7oBQPkG1eqfF1Ofg14KgCQZ715Z4wEcN3cpAGQe9YHk/8AUI19DHFDNcJLH7AtCdQETp71NxFYNs+Sv8B0+lROFIHD1rHVFOYkczb6Y2Qdvak6D/UMbrf0EdO+yVc5MExNM7XDhmP8Vd/Re5tFhQ7EV56+yQgHCMVUoj/xCxGv71ehEBE7Rp0716WpraYdkcs2bownzQd9qUm6zKAKR7jtSC0jLA1230963kQCc2WBPTYdKduQGwwuzuAYpJdAgFX0rYQ2rzQE6aiNj2rWRCjAiInWuyC4ZEF7KuComRr61hcB/ERB012reVMgkAAaz09qZLR1ITJrs4BdYrOEAQqTM0hdwgfinuKxTaRI22ymkLZQEySmDG29TuI9LJsPIChlXAOvvW8ReQMLeIKR5TM02hkOKyoTttTmL2breGvZ248ugHXSu3rKycqW08I4Xf3U3bqEAEZjNRW4WopIMTqdqk3lqW71ZVqCrb60py3bSoFOpO9XV0U2sPANuG+W0QFA7madwK6Ld5oZ20pd02lKTlP9ajYWMl2FKB1MT6VyeUQdKYXzGEBKBJH1qXaIVkKgonXc0LsrtJbQlJJUAAIo1bKSUwNCenSlyeB0YJhCzzhClEfrTlulRWvXVJ1kb0m3UrIsZdIpyyUeaSreY0G9Ic8cjlUmPwpSgCyADrOakKSQQMs+u0VKypgpSRB702U6zI0pStyN9HBFU0tZkoPaa2+wUtlURO09KkfiBWoJ11isuF/dnf3Nd6vwQ6kgeEHXRMKOh6in0qQBBQAEgRFIcX5UqJUNSIFKBTGqugNM3MW68dGElZJX1H1NPsAhBKdPLOvao6VgKkKEzuelPNOZQQtcx3Nc2RswB8TH36ilQAHrrUJapE5VEHUD6/xqbiLg+IKkiRrEiai5x5NBprHrViL4KtkORsgjqQAZ17VpBUBruSAKW4pCj80kdIpAUQNso31ogFAU4SSoZonQelaKFJ0B06elaKz82nvSZg7n1rgtphlRCVEEiT20rSiiJRp019K0SoApUY/jSVLGUyQZ0ANRkLaSbfyJc08pBIrg2CLB8SsfMn54rutuoQ4rNsk9PSuC4Fp4lcQLJMZ9zVDWPhFvSLnITx0k4iuFAaTM1QrpQPHLAJBAQNqv+NAm/Xv03PeqFcpKuO2cx3bG1ePb/uyPVY/tRL5w2AMdYBXsqa6c4oZ9VEyIgVzPhwj9tMTIg9OtdGdXLmpI0navTeAf9l/yef8AOLNsf4JiXDCUlQOmulQblUqAWlQ7Gpe6ATlMfLUF1RBEkJ0reTMJxyJREk5jE9d6WpSQgmTp3qKFnmQNNdZ1pxSlHQkTFFuBUUY2sKcAEz0O1FkJISBmg9T3oK0pReAXO80TaCgkGZ01mlTbG1rkL4c2nMCJgevQ1eMFJTlBiQRJqkYYZXGY6GrrgpAAgDMNvSsjXPKPQePg8nScGUEso271NxN2GCU6j+FC8Hc+6TMafrUrEXPuVSCPUbV5Sf6h6+C/tYOLcXrSu6uSFE6ae9c/u33grIIInrtV74qdC7i5GZJGugE1SL3RIygbRqK9loXitHh/Ip72wc5BJJmRIqZhwQhMrXB/jUBbgBg6EyYNJbK3nsjalBPWK0n0ZEJYfJZ8Md/tbRbJPm3Gv/tV/dczKt1TGoEHWudYMQ28yOpPWr8pXmtgVE6iYFYuufJ6Tx30nTMLVmtUCSDHQ1NdWQJBgRA96GYa7NqgJJIA1npUtThyghWsV5OSTkz1sX7UgdiToAUJGvWaqGJKgrPN30jerNiThhSio6g6HQD61UMSUFKVOxA1FaOlM7VdFdxBwkqMRB3HX3oNdqCU6bHX0ondqTmUCojczFCLkwN/zE1v05SPPahZZAfyqbmCB33oHinLQUgQJGpijLxBBMeugoHiSyoKGqSOgE/rWnp3yY2q+kFoUlSQrMDrtGta8kGIBOtJQSfOCcxGpIpDkjQyPXvWkjDkjSyoHQGDvBpIzZvKqDtrW0iBCiTOvtSVgACfm7CiSEtDylDIondWpI7iqklAOLba5pg1aM0NkgkyntVYbn9olSydzsKwPOPO1Hpfw/H6mGnUlSRoIP1pFy2G7RxQEhQin0gBEFR20FBeLcZGG2KLS1813d+RpM6gmsfbvWD0GdvuKXxPc4m8+q3sMNbeaZyy5z0hUnXKUntXPb1Nyg/f2y0GIkwfrpVvxxq5sQbEONqKFFTp3UVn6TptvQC2wt+9WCsgIbTmUVGCkA67mnKvbFJCHPdLLAQUNjINdrw/hNXDfhJg9ra2+fiTxLu0IbTHmbw5CwEJHYOLGY9xlFcVu1cy4dWkDLrEeleyuBcCav8Ax08OMOu0hVvw9whZXAQdkrLQUkge6v4Vn6qbhEuaeClLB6M8CPs64H4dcL2Vm/bIfxS4CHb64gEqcicg/wAI2oj9qvxFa8M/Cu4w/CnUs4hiSf2fZhJghawSpWn7qMx94rtmEotmcO+JUPKhsLM6EkjT9a+dv2yfEQ8XeJbuC29wV2eAo+HJSdFXC4U4fp5U/wC7WNoqpanUpPlGzqbI6bTNrhnnV1Djj3lUAkq0CtZ96KMW6WGVSkZgMxj+XakWbQUSUgkAiBRZmycuiGDmCd1Ebgdq9csLo8vt3Mbwi3HmxB0BRVogK1NQuM7dq7wcpJS2ttXOHSY316VZHvhbZrmOKCUNpyBPf19659xBdXOP44jBbJanApQ5xB0AG49gP1rpjFHCwi4cLrTdYJbPrJlaBqe9GCnkkE6mdCnpWsNsmrezbt2mghttIR6CNj9aW8cxASE6mCRpXfCQSWBn5gVOEnqZ60A4hxkWyVJaWJGgA60VxO9Th9pkUBmUkkR0rn2IXbt04FAyIO2sVDeAJywD724cunS4s9ai8o7gdO9SiiBJ1FNrUhOk6djS++xZH5eglQ26GmykEGelbdfaBhPQUwX8w1NBLASixwNIVrMUlQQBE01mJE5opKiSNaXkNRbNqSTSchnpS0+tbATB1qdoS4GoO1ZBGvanglJI9aUtgH5etTjB27kaQ4qYBNPN3TiJTmJHamCggVmorss7hhi0xTIAhapkdaKtGzvWFpKglUQO1VJLikkelSmbxSPlVBo1MXKD+Ay9hV2lK3LdyRPTrTDK7y1WCokQd+1Ls8aebEBY+uoognELO+SWrlpOY/iSYpnb4AfCLbw1jTNyxyXVAODVJnUjtRsBTwlMHWdTtVBw5TNpcJAdJA21q7YZfC4Ty1tpmdwYkRRoZB/ccuEW90yu2uE8xDh5a0KGhn/reqAlp/gbHQyslzDbz+7WegmNfUbGr9dKQDzCVJO3cEUOxPDrfH8PcsLlSYV5mnE+bIvp/wAx2molHKyFuJzeVxpOUgojNm7+3pUe4KiklAhKh32qu8J4nd2z7nD2LEi4tJDaVSZQOg9Ov19KszyUOD7shOneIPTSujyiWsoDXTaTCnEK01MHXXau7fY28Sl8FeKTeBXT2Sz4gQLUhS4Sh9Grf5+ZP1rh7pUuDCjlJCvNNJw/ELrDMStsRsoaurR5D7ShuHEKCkn8wKRqqVqKZQYWmu9G1M95/a5uH+DOJOCPFqxbJacZxLhjEDMBTVzbKUzJ9HEmJ618uLR1TV0w8gxlUk6dIivq74utWvjz9j/FcewlIcuThTeO2qEDzN3Fsc7iB6gpdT9fWvlKUJTrsJ/9qyfG8QcX2jQ8hLE8/DLpcWqnUpdElJhW5MJOvfvRfh23uTbXVzatkXKGpQ5yzlBEeVRzSJGmx3odZOJvMHtX1oSk5VNrVIGg26GjfDrM/FBtYJDZkhSN9Oo8wrdS3LBjp+7IZw+/t8RtBesJy82MyCRKFdQal4ijNYBSNQBud6rFncDB8aVauEi3xAl1Eicruyk/X5qttyAvDJ6HQGsXVVuqz9jW081OA3bp/sqFdqv2FOK/Y7ZylWnSqHZhJtEAmfKNB1rq/DuDNO4Aw6Va9p2pdU9suRrg5wKNji1uWzwIOytIoxwsq+awRkNpdykDVM0/xNhrbds8Ug6JVt3iu2eCPCeE4lwDaXFywFqIGYjsR/WtfSayFEtzRlanQy1UdkXg5Pa4rxDbrzMlyB6USa434gsnEpUhQ66j9K7zc+HuDEeW3QkwdKB3Hhphb5KUsgwd5rUXlKJ9ozf6Lqq/pkcruvE7GUlKSz5oqMjxGxy4UUJWUSDoK6a94SYepY8g9j0rdv4QYQpagpKgrKdql63S46I/putzhyOZs8U4u8gqVcuKPafzp9fFOOqSUjmKSdE6V1G28JcKaEySQRrT6fDexaSBqdJ1iTSH5DT54SLUfGalfLOP/wCcWJuL8rrmY7g9KN4Ri2PPLSA+uDoRJ710hrw0wbNKmBm70Xw7gbCbJ1KmmiepBpFvkqGsRQ+nxV0XmTAPCuJ44i6KStxYjSe9dCt8UxRSAS0YCdfelYZg1m1dZm2BB7TNWJq1YQMqGoE9dK87q9Qpyzg9DpdO4Rxkrpv8WdIJTA3INQrx66dRKVws7Airg/aMlKsqIPftQC8tW288qIMa6VFNql0HbThFc5l4pag7lVHY7e1aWhKQqN5ka1vEb1Vu7y+UVdjWkvB5vMZScuorUhLgy5wWRlcic0AGOtO4flVeoWpWg9aQpI0IgmBM6mnrFoOXaUpATr23pjnhClBZ5JGPpTzMzegIjfrQJZSUmN6MY+2UKSMxKtwJ3oA+62BCnAk96Kmft4Bugkx5EiIWAQZ2pRjUJJJmNqgJu7Zsnm3CEiJ1VqfSnWry1WPLcJMab1YWX8FbaiX5tANgNNaVlyjSB11pgOpICkqSSaXnC/KNZ29PWpy/lHbMm/KjRWxE1uJ029e/ateU6mdaSCJME6Ea9q7KJUMclO8WwDwbc5TJBGk+vavK3Gp/7u3QCiDkGkV6q8WyRwbcagkFNeV+MFTw1dqP/lisTXy3XpmjpltqaE8IT/m9aDQ+Sf1pzEyUh6NJQZ/KkcHAK4etI3ynWsxgkrfg7o2+lBoX/fZGt/QR0/7Ik/sjFQNzcOdf8VegwDPQk6x0rzz9kRQThWKk6RcLj869CFTmaAQSTtEaVtwlhYKHppxyLSkIEBRHsK3oZMjXQkikc0FMbes9q1nUEyYKfQ03cBsFyQYka+lJVKBAGo1GlaUqDBGkTTRcBTlBnNpJqdzIdaHFrGUDQSdNNPekKUmZnTvTalhKNcvrTZcAUN/Y96NSAdaFTGvTUmm1qMhPfetcwqUkEQB61IU2koBBGbtFS7EiY1ZeEKsEn4pAVqmauV3a295g7jbrYJKd412qp2TIDhKV+b+FEb+8v2rJxKM0BB29qpXzc2tppaWChF7kcR4vsG7G/U22nSSRNC27cutBeUHKYohxLiDt3eFt9EKKjBO9as0htsBeun0rXpk1Wsnn9TGMrntK/cNKzqCkBIFQkDlPhQ0jaj2LNJBzZUwewoG4hIdKs0dY7elWIvJUnHDLRhlwSEkGROsaVZbB0QUrPv3mqVhN0CAZjpFWrD3AtYEzpoTQ2LCH08ssLLhSCNBpFO2LqQryq2Mmoqf7rKCkqgzGlLw8ozr8wkVTm+C7GOOCa/cSnKglPUe1RxcKzEEk0l7yoKtwNImms2oI2M9aHCwQ85CPMTIEwTSrnRnaExprURtScyS4I331pV26AhOubTWKV/kFjjkjOKUQkidNqcSuAkggBI1B7elRHLhBKEkgg+lKnbX3qymRhkllC33Q22CSowIFF0cOXQbTzVAGJobgl2zbXyHXFSExoasd1xNZ8womAe1VL7bIvEC7paKpRbmU3HrE4e/CidJ60JU6BqVaADUbzRbiJ9V2+XUqkAn5u1A8pQFAEyNde1X6ZNw57MvUwUZ4iuBwuEZiSZnZNaDg0zEk+/Soxe1Kh3B1NaLwkqVoVf8AWgpucFbCJalgExqI2pJezFSTIEQdKZQ6TAKfrtSC8SrNnGnTpXZOwSOamZnXeTSOYAs5wRp2pnmrzACJgiDrSS6uIKtSNNa47BOYKeW4sgAlPauEYCVf6RcfUYP3kExXcLRZLbpJmRFcL4ec/wC//EB3+9qjq+S3plhBzFyo3ayT7etUN8ZuPWvRA0nbSr9iqQq7cV7VQnwn/P8ASJ1DQFePl+rI9Ov0ol+4cM4zbkxM/pV/dIU9ISNwIPWqBw/5cUZVkAgztV3cuSpc5RI6+9el8D+i/wCTz3m/1UED5kTm+XaagPrA0VqBpTgdVl80kHr+76VDuHAVqUojXtpH0rdyYovmBJMGQNvQUpWaCQowahl0z3GgnvTi1koKhECpQKQq3WEvDQzP5UXblUJUJB67a0CYcIdGkUabK1jYg9p3pdjH0x5D2GjLBMlRPSrlga4UlaSASdTVLwwqCBGpmZ7CrdgjkZFECCeu1Y+s5R6LQrDR0PC3AG0+Y7dak4m4QwpRUmQO9C8OdIb8wEjTSncQePIVA6V5qX1np4vFZyDiV0puLlxWok6g1TLlwqTmjSJ1O9WvihYU5caATJmqZeGG0hJzAiPavX6PiCPFa/G9kB8EqCSrvBjanLVDjAUUrPSkOKSmMytfWpDjzbaM+hA1gVomPj5CWE3ClXjSVDZXeuhKeBLAMDUbiuY4C5nxJuCfmGk10Rbikv26FHSdqydfjJu+MlmOUdOw1wJt06RoPbapK3p9P60LsF/cJ0OqR1qSt2UkDzGdRO1eVkveexh9JCv3ZTIWSBI1/pVWxJZ8wCoAG3SrBfOmIB1M+lVfFFwFAExHer2mWDN1T4K/fLJSoyBrJ9aC3JInzEDXQUUvFb/KoHoFUJuV7yOhNb1XRgXPkgu6KKkkkn9KBYkvKICjB/KjjoUZSE7iZnf0oFiJBBBOnXStGjsxtWvaDGhoIGsbUlZVniBMGKcAAgamB8w6+lNOKKlLQRAOxB1rRTyYslwIKgtOZOqToe9JklwK7b61qQPlk9xtWk5RAT5o/X0pqYkUpZKCCrWDtQG2E4iqNpMzRwmAeszQmxSDfrWcu/avOeafuij1PgI+yTCbikobLy9G0iSQJMetUSyeVxFxM/irxBZtDymwds59PQfxo3xxiS7LCuQwk8248qUg6qJ2EVEwSzGGWTVmjKVIBLiiN1nUn89Ko1LjJrzeeCpYyw9cX90s8xSEvkLJ5hEZtPSmMYdbwvAXsspXcLLSACNjEkjenyGX8SdJyCHVhWbJqZ03nb2oTxxdhy6tsJZgi3TKiI8yjqTt60cnhCFywPwnw/ccUcT4RwzapKnsWvWLRAA6uOBP8DXt63t04V9plDNsEhv9msWTBnXK3CB+iR+dedfsm4KnGftCcJgolrD3nsRXCZyhllawfzCa9ZeF2Anjf7V7wUz/AGLhrDxeXqgrMAonyJUe6lFIj0NYWvniW39jY0Ud0VL7s9H+LPGVr4deHOIYxdLAVY2i7hSZgqVEIQPVSyB9a+UOL4teY3iV1iN6tTz9y6u4dUYJLilSo/mTXsb7eviOsN4fwDaPjPeqOIXiQYhpBKWU/VWZX0HavGNqiVnyDU5dRMetP8RTsg7H2wfLW5kq4/BLw8ZUqWpByp6BOpM0cwhp5HNcfWCpRChk2CT0NMWdvokZckiIPX/3rLx44JbXVw88G0mUsiflSB5j/Stl8GXFYYJ43x5rD7YMoUFvK0bSBpPelcBcPKw+yOKXiP7TdedRUJKU9B9arWA2znGfEourtMWdv5inoAPlT7k11e3bCknMEoiPoAIiKXFuTyxpgCG0ABOqpJClbfSojrjLKVOFISlIzHXc9qk3r6WW1HKjQfON6q2OYg6ts2rRyJ+Zc9Cen0/nTEDKWALj2IqvXFISshIBnWq6+pSAPNGnQxT94820VJQ7m7zQa5vFKMabUqbEpOTHXroJTlAP51CduFLO5ptayqtJSVGAKRubHKCXLNVuNoqQ3aOKA8pmnk2RnVJqVFkucSGErMACnhaqMSdDU1LLLCM64kdDUV66hRyEelS4YB3OXRHg9YreUdq3SgkxvUk5EBUH0p9lzNCQRp3ppSI9RWkHKZFcQ0miYUZhofyFILGcHTbettrnZUTTyUaaAnNvUpC+YkJdqsapgjvTBQpskEH3o61btuaGBJ3mmLmzGZWVMjbeulH7Bxm+mDG3in5em9TmbyCCpIgdahrYyySCIpIOUxULKJklLos1s828AUKhQ0o5h9y5bhDylSArzAzp7VSLS6W0oFJOtH7LElElpwZwpMb7etOhLInmJ0Ntw3dvzlgZ50A3iN6hJeKX9W0oEfMB6UO4fxfmpDC1DMNCnrUvEwtrO+k5QrTU6/8AOmZD+ANxXYvOpRjmHqi8swCpST8yO3rH8Jotw/ijeM2SLkLTnUghQJ1Sobj/AK6VFbfGUt/MkHUHXSq9Zqb4c4iNu6MlleEFCp0QJn+OlLa2sOLysFudYW2cwKknp7VGeRC5yZUzMneiD6kOsohZUVzGvSaiPoStGcKBKSe+go/4AfHR7N+wd4g299heOeFuKOcxtv8At9shR0VbugIfbHpmyq/3q8I+M3BTvhz4n8VcEL+XB8Uft2j3ZzS0f+Aj9a6d4Lcer8N/EzAeJy4pFszcBm7EwF27nkcn2SZ+lWX/ACifCjWFeMeHcaWiEm24rwhp1TidlvsHlLP1Rylf7wrGcHp9XJPqRqTfraZP5icJ4PuA/hr1upSyppQWkJ9dI3q38N/dqfbWpY+6KQpTIk7fimRXO+CXv7e4yQIdbKRoDPprpV7wtLTTzqyhCeWkpSMrQMGOxzflWtW8mVJbZEbHrRy4YW1bkh+2POaOxCh/XarBw5iIxXAVHOSpIBIJ6GdPzBodiyiy+l2AUKTvpJ+gqLw1cfs/EnrQJhh+Sj0zRI+h/jSdZVvr47HaexwmXOzaT8ChQPTtXWuFL9lHDjbYM5dwd65NY62SQskwCBrV64ZURhy0ZiBE6ViQj7uTZUsRF8S3jSmHk5z5gTA6DWuueAnFuGYf4fNMXlwEKaVse0aVwfHVqClyZjUE9KZ4IurkYY6gPKASrpO01r6PSR1M1BsydVrZaWLsij1df+J+DW5UA7mA2IjftQxvxWwkuKSCAk7mQJrz84p7WXFEaZROxpoF2ASFTtqK3Y+HqxjJhz/EN+eEek0+JOCqaK84mdACJrdv4kYGpwHmgGO43rzcl51EjMdu9SLcvrcSJUCr9aCXh6sdkx/EF0mlg9KNcfYQtPldE7xSnOM8NgrzROpVNcHw+wvnB5FK101VRFzDMQbTC3FwRG/WqU/FUxljJq1+WvksuJ2lji/CHVBAuAPSaPWeKWT4K23RqBoDNefmcDvlKDiXlBW8z0q6YHeLw5ttq6e1A1M1U1Hj4xj7Jcl7Ta6yb/uI6zZ4s23egkEAnSir+PYeyn5zMa+9c1suJWH7/IkQEae9E7tbVwUKC94n0rJs0uJLca1d+5ZiWi64vsW0ryrJEg1WsS45sEFQcER1mKF3Fs1lID2vT0qr4xagpOZU1Z0+krzhlXUaqyKC1/x9hgVKkJV2mg914l2jRytIJ/lVPvrElwyNAZFQW2LQPBT23WtyvRVJZwYNutubwmWZzxPeU6VIR5dYqRhfiXdXF+y0huCSDM1Wn0YI42oMoAOwMUPssMaGIN5LjLKv0qwtNU4vgqPU3xkvcdC4w4+vrRsOIUlRPr+lc1xDj/F7hajzlAnfWjHEVjaIbAduc31qnu4Zhzr8c9ER3pulppiuitr7rnPsdXxPiLvnVdOE7jXrTbPFeLMKPLfWZPVVEcO4fwTPL1ygiNYPSjqMO4RtI5hSpQEzNWJWQjxgr16e6fu3gFvjriBCQUuk9NZpxvj7iFtZUVq/WrPbng/KlSg3sZ1pefhNaNA2B3kUp2w62FlaexL9Uro8RcbkZlqqTbeJOKJXmcBWkdqNHC+E3kA+USZ3FRkYLwq07n5iSAdNdqj1KmvoOVGpi8q3ghcb8doxfhZy0KFBaiJ00FcE4vXPDl2nsiB3iu18dnA28CUjD0jOViCBXFuK2f8Au5eKUBo3v9a8r5WKjqFhYPSaGUpUNyeWL4MSTw5azKdDGlaxk8tbwKlTk2Ip3gkj/N21gbpNMY6VB1/MBOXeekVV0H67G63/AE6Ok/ZLeSMPxVIMEPrPpuK9AoeIUQVAiRqd682fZYxS3s7bFkPOQeaoj8671+3bQiUqScw011mtyFU2s4Klc4bcNhj4mIKimdQP+vWs56TqSdRGlBziAcTIeBJ2FJXeR5c3tRqD+QsxfQYL4y6npAppdwZlIT3meooWq/bJ0VInaelJ+ObUPL5Z0ialRf2Ak10ElPSNVBUmTG9IVcGAI1B3HWhar7LpzQI7mk/GpmQ4kAjvFGoMW5RCgfMnXUdqmpugpOXWY70FtHA6CUuD6GnHXFIHzFBGxNDKDGVz28h1i4KHZCjvrRW9vR+zXFuKg5Zj6VS2cTbQo5Vde9TbzHkqw51JIOVBGopUqW5JFqN0VF5OZcSXFs/cEsJIXnJBBFMMPKQ0lRJ0AOoO9DMRui/dqWjcnRI0qbaK5jPmSDvG+lbEIbYJM8zOzfY2hOIOrWJme2tBXj5lZjqN46UbvGkqZlMJ0j29KEKSADmEH+NHEXZyKw58hz5gRM1ccNeCSmE6ER71R2zy3PKYmrXhLxITKtY19K63lBUvEi0c8FMDUETTlg+lLijI0Og70MLsIUEknTQ96csX4cUASokkCB1qlPrBpRfuDa3EKBUsqnr602opEzABG1M/EAKAnWddtKQ7cZgJI/Kq+X0NY6bsoUmDIiBPSsvHyWyoeUFP5VEDoBJP00mmbp9RbzAz3B0ooxyyJYSNOXKgB547HvUlu6lCUgSCN/WhQeMAggRv1ipDLqcu866EaVYSFLkL4YQu4HM0AGtGmWLS4WXBHWqlbvKDyRmgncUWYu02ycpJE1Vui88F7TyiliQ1jXLS6tCB5Y1IoQtSQ3nBI0j1qRil0H3ysKJB3qAQ6tBSFeXqBVirO3kqXyi5P7EJbyASnMDlOh7+9aDgmQomevUelR31KS4UkkyqBtWi6ETrIA1FWu0ZslyyYFgolKiTER6UnmpGpBJnYVHDwUka6xvSS8lUkqiCalEEgOZUyJkEESYg0hb5UkQZk+gpgOkADTXXWm1PZ9QRmGkCuOCVo6FNOSSISdK4fw65HHePqSdS8r8q7PZPAtu+oP5xvXEeGjPGWPqMGHyKo6lZZa07LZdiXlKKtTrrVGdBPiAmRqGhV6dOdxSozSNu1Ud0/wD6QgkAf3Q/hXj5/qzPTRea4l5wMZcTaM96tbiwXt9jVUwkf25soJPWJqyKKi4BoBp0r0vgv0H/ACYHmlm1BFTgLYBSUmdp3qA6sTpMHYzUgqIbHbUgzUJx5sL0mZ0rdSMR8GZ9TEab+lSAqGZCiZFDlvqUVLJG2wp0PJ5AUDqNTXZwckS7VKVEEidYoy0SYH4tiKAWL4LiUlR+u9GWXDnRKjB9KRaWqFksNiVZQrpoIA2NWzB1GRMAyNBVPsXEgRmO86aVacJKxBEGD3rK1Tysm9o1hovVg6oMp3M9PSnMRdPIUnNuNqi2K5aCgdBpPpScQKzbLMkz+ledcc2Hoov2HIOLrssIuSlUeY7azVIViTqgCUqg6RXRMUs2bt+4ZcQPmoNcYNZsgFNuIO0mvVaS+MIpM8hrdLO2bcSoOPKcAKUKP0rEs37xKENKE9as4trdJGVoaVLtWsyjlRE+lW5apJcIoR0MpPEmBeHMOxJq+Q6+0YEECKvfMi6tkhRnMNDUWztVqWkBMn+FLdaU3ftBz5grQzvWXqbvWfJt6TTrTxwjpdi6UspUewnrT61yklRmNI7Ghtk6UspTI1ipK3QAIEEp3HU156S956SH0EW+dVpmEEHWarOJu5isBQ22Hej14tQJ3PrVZxFyVEFI0PTerunKGp5AN2SN82/eKG3C4OaUnWCDuKnXZUFK8s9RrQy4UYIV3mRFbdXKRg3dkV8jKDOhmZJoDiYlJTOhn+NHHlJU2sZttRNAsUVKVLKNTsSdK0NO/cZOqXtIIXIEiDv9aZeUc2UI16U4hUgqCusA00tWVxRJ+oNaKMWceBgSdZ0zazWFag4DBA1ishO49yZ602XEpWCXAD69abkRgkZdD6ih+HoHxKtQd9+lTkupcbUMw0SY1mo+HZULed0ASkn615rzPNsUer8EttMmVbFirFOI3HVA8mwOVI6FYGn6a1IZzIzO6qOUqg/ypDjaUleXKlS1KWtU7qJrb5W3YvOhROVpWWEzrHprSoLg0WvkqVm+Q4q4UXBkKlz94ApJJJnygVSLi7XfYm/dLUVaqIk7SatN8XbLCrh1aVhQQQJQrZUxuqqXbSlpxQOp0Aml2PnAuMeGz0t9iW0ZtOLuK+NLlwJbwbA/hWyT/rrp0IEeuRC/zr2p9mHhZvh/gfiDxKvg2L/jvFHbpDh0y2TZLbA16GFrP+0K8cfZyYNp4VjDLNorxXj3ilGFWiUCFqDbSUDXsFOrVPTLXsn7TnF1l4SeDD2AYG4lgps2sBw5I0jMjIVD1CErVPqa85q27NRsXbN/RRUKVJ/B4T8b+NF+IviXj3EecqtnrksW2sAWzQyNgdpAKj6qNUzD7cJXmUobHcaj+tNxzHoOqSIj/r6UVsmAnKpKQhQI13n0r01Naqgo/YwrbHba5/cn2YgqUtHkESY6Dt71z/j3HnMQuU4WwoysgKQBsJ8o96uvEWIDCcJccSpKEhOYnrPQD61SeBMHcxnFHcfvgFNMLJTmGi3P+VdY8vCDgi58JYCnAMJbtXAn4h453SSNVdh6VZQAy0tKTIV5j/SoTSgtY+7CydNehpGL4gLJsJTHnEa6ZaJHNpEHEL0u3BY0hola4MCO38qpWOYqhvmEDMtStddv+tKl4jijjGHG4KoduiVb/hEgVRrm5duFlbijJMmgnLb0KxuYm4uVLmT+dRoJOnWnILgkCi+F4E/dlKi2cs0lRcmMWIoGWtku4XCQfpRu1wdKAguCAogk6Ucbw61wtqXSMx2G00Jvr1IWQ3Cco3FNUFHsXKTZp1Ntbk6SevpQ+6ukNRkQJ6mmXbpxxUrUYNQHVkkzQykdGGexblwpf4jTKjNYATqKXlpLeRqwjcxsNKcTMz0jamhoYpxJ70WSGuBWhOulaKU6wa2EzqBNbCe/U0QCeBIKk96fadghSlHSm0gyUjYVpRgwRFTk58hS0fROYkHfTvRNgMrT5hGnTvVbSpQ21FTbW8cQUoLkCdIo4v7gOISvcGW6lRabBPU0AuLRTKiFoKSDGtWrD79QORSoSOhNSL/CmL5oOIUjMfMINTKOejotoo2XJGpqXbPqQsKTJpV/hz9moBxGmtQgpSVA5jpSUnF8h43lhtMQFtfg5ikOQZnSru1cN3VitbbmZSQSY7VzJ9wJQy4jMSkkagVaeGMXBCWifmVBA3p9ck+AMYJz6zmSknfWZ61Ax2zN/hZlWZ5rzJ0/OieIsISo8qYUqT2+lQA+pLQTGYExJ7dBTGso5PDyP8IYz8bbJZfWkvW45ZzDYdDRl7LKwIOXcjQTXPmrlWBY3z0yGVnzjplJ/lV9ZcS61lABTE/7U0EHxtYx/dEF4hClNnUFOpJ6HtXePH+5Pih9j7gLj9S0vYjwjiisFv1/iSFIySfcoZP1rhV835UpQmQEkBRG1dO8LsSVxD4P+KvhI9mX8dgw4jw1sna6sVJW4AO5a1/3Kp66rLjYvhljS2YUq38nnPh1zkYswToFLykkDr710+0baaaulC4RAZWjLnZBKokbCfyg1yezXy7tp3YBQM9ta69YO/EtuJRcmXbRwSl1UapOhCUb7bmrFHXIixe41iYS/hqbkKAU3qEgZdPWgrbyklK1aFBzCNaJ2bzLlmlp2Sh1GU9xpQXmuIUW8wjUGnyWUKXDOk4bkcsUqBAkdvSrlgDyGrLKo/Xb86oPDDpuMFaXqTl+tXHDBNtGYjY696wYQ/uuLNpSxWpDWPLaWtRbE9JnbT9aY4GeZtrR5L6gPOTr11pvE8xJIINVtt+4bUsIWpIzGQDW74yH99IwPK2uOnlLB0t162IC0rSZOkGpDbtu4gypOw6da5eL+6QCA+vuNdqm2WP3NtCVLCwJ616yWnfweLjrvujpCLazzZ1OJk/hinWl2zT7akgEAyRVGZ4qClEuHQjXWpTPETC1p+8gneKTKiSRYhq4ZWC/MYihCsza8gqcMXKhlL2YATPeqRZ4ii5lCVTpUlx9bWpidvpVSdMW+TVr1U8ZXReGMXAEF3fX/lU9jEbZ2FKdM6Tr0rm6MRWTlS4BHrUy3vLhSxlXIJgmq9mmS5LVWuc/azpuE3CRfZgqZVpBq2pu/KAViRGveqXgISlpt/LK+sUf5xSnYkkSJrC1S3TPT6R4ryEHH1KQs5ojp3quYpcKySYE9KIu3QUNJECgOK3IyqAXHoaGqOGgdQwNfvwY0giKEXb25mDT168UrgkRvprQm4eziFaEAwK26VwedvfuIbzy0urTmKfSaTbXDpxBpsPZQVASJ1pp9RJgpiB1GtNWDihiTCikHKsGB1q3JLY2Z6k/URYOMGnGLVDiXs2k+9Un4lc7apIn67VcuMrtTlq3bhpaRFUdaVNwpYJiYn1rtJzEnyPE+CR8W6nzJdI3p5N2okFTsjoJockQUpCiJ0PoacTnWQIACuvp/WrmEjM3yxhMIc9Z/HE6x2pQunCkkLEjTU1EbC0gEpJn+FOBpRIhIJIJE0OESnP4HRevgxzT606i6dWID/SmPhXjISmKWmwulDKlrfWoagM23Po1ityXLPKSTqPrVK4wTPDV7pH3Zq6YhYXLFnzXJCZk6bVS+MAk8O3usnlmvGeea/NRwez8IpflXuG+DTHDtpJAGU9fWh/EboTdupAA8m9EOCiDw3azAGUn9aC8ULKb90AZQUVnaD/UM0Nav+nQS8ELtxs4kUKI85gz610sYndIJUh8iD1VsK5V4JqynETO6jt/1pXSVLStfnEGYkCZr3GhSdSyeN1zlGx4YateJr1nQOkqH71SzxfdrTCQQVEamq6hCFRMfWptqzbEkurBA3PerEq4Y6EQutfG4I/5y4l5iJI6QK2eJr/MJKhEdNKxm5w63A8kx3pt3EbLJDbAIHSOtLxH/iWHuSy5ml4/dvGS6qCadN+tKQV3Cj5dqhrxCzSJ5Gu2gpheIsyQhEaztTFFP4FSm4/5B7C8W+FeS9zlkAglM6EVeufb49h5fsSQoDzQetcpbxFCz5QQBuYq1cFcS2+F3pZuSOU5Op2qrqqm1uiuS/o9Sk1CT4Y7c4qbF5bb6VBSek1HvcfaNqoJWZUn96tca31pdXnMtF5kgakRrVT5yXRlET6611VW5KUkBqNVsk4xY2HPvipQJ170ZsHEhHzjUx7UGWgoBJkAAampTN22hvMT5idu1OlEq0zWeQlcupLW879KGKOm4PvvTpuWlIKQsk9KajOqR13NLihk55fBGylLgUASCdZ6Ufwu4DaSD5gNpoEohrUpkzFS7W7ayZc2Uada6aygq5JPLLMm6TKtQZgVtq+CVK3M9RpEVXf2owBqqNYmnG8UaK8vNERrB6Uh1ZLUbVnKZZf2gkg6kT6Vs4iF9gAOtAG762ICg8Ntpp1u5aUoBTon0O3tQOnBYjan8hv45JiVRNM3V4laIAjXrQ9V00DOYZp77007ftgFKlZh/ChjDDClOP3Ja3lJ9AdyDIqQ1cFLY21nY0GN82BIg6bRT7d40tHYijaaFxmvuFE3UKB3IgjWnzfLWkRBI03oILtpKswIEU63esAZs8yZI9OtA4ZGK1L5ClvbXGIXQQ2lUSJNJ4hu2cJR8Kyvz+1FLDiLCrTCnLhCxzQmAa5ximIv4jdLuFKzGdB0ipprnOXPQvV2wpglF5bJH7RKoK1ElQ79aV8VKgAuJ3PagcrBAMzNLQopMFUydjV914RjxvfyHFPFAAzz0pC7xAnWQRt600haVDQeaAKD4vjdhhJJurhKYO00r55Lbawmg78aFJVlXttpvWKeBGqdYiQY0qj3PiHw9bZQi5zA7xUZ3xQwdphS2VFStYoXKJGWdLslSl1WbQJ2rjHDLpVxdjpGgL5mi+GeLjLqHkKayykga1WeBbwXuM4vda/eOlQ11qlqWm+GWqG3+x0MJJBg6b6VSFInxGygGeUOnpV5YBWyN05hVMbQXPEdcqMckCT0rx0/1pHqYr+3AuOHgM3iVKUkhI69KMc9WfMHNO+9U/jB56wwG4urdeRxA01qiYb4l4rZW6WVw5Eazqa9D4GyKpaf3MLzMJeqsHc1vqUnQjTWoL7yyo6gaQK4274qYypZymEztNR3vE3HXCAhzKOomt5XQXyYzqsfwdkzKJOb9DTqnVBmMw161xU+JGOuIyJdyipLfifizbIaV51DqaF2w+5yqn8o7PYPHmBRJMaaGKsVusApKunrNcIwzxXuEuIDluCZAmrRdeJr/wAOBbNBJO3eKRddDHZZohLPR2ixWkFI8pnXerXgywACSIPpXnvAfEvEAiXm59jVpw7xExS7WgNmB2nWsXV6mCieg0dMm0eirS6baYSVrSIEdprMSvmRaKIWmCJNccY4sxG4Z5a3VJk96lO8Q3S7cNquTtAknzelecnrYxlnB6OGlk44ROuuJMGsXHfinQVyYExVcxPjjBVTkcRpoAevt3qh+Jt+tFmlbZCSpUlXWe1csfv7stqUHlgqOsV6LR6iqytTPN66NtU3BHdnOMrUq8rqY/WtI4zCcqm3gJJIM15/GNXzRI5y/wA6UnHcRUqQ8dRWmr6jHULs8HoG38QnGno5ux11qzYXxGjFr23cWtKSf3oNeVv2vfrXnW8oGY3irNwjxJibeL2zaLhSwDBBO1VtRdUotpF3T+tvUZHte1gNJWlY0TG1OqURuvr1E1ySx42xFttsrUYAHmkz7UZtuO3yYfBAPU9K8x68G8nrI1yUS43TgcVqcpImq/fKS4VEKABO/Wq5jPGb6XSttRg6GelVu+40cWVAO6nrNX9NdBvGTP1Nc0We8KBmKlAd5oNcXLDZyqeTHQ7VScU4ufGvxGhMb0FPEpuFBLzqiPQ7/St2myGOzAvUt3R0C4xG15ZTzkDXeq1i+M2TSSS6CknTXaq7d4mkMmH1CBvO9VfEMTQtWUvZgdRr0rT07hnsxta5pcIvD3ElgkEhxJO460EveKyVkNAEe1VpNwwsghwAHem3HLca8wSa0vYucmLiUnhhpziW8XolUUOfxm7fVKnVCO1ArzEeWCEdOoqEzi688KSctKlqIReCzDRyksl4wLEbpeINtF5RSQSQTNWd66FpavE5SXSECKofC94h3FG8h1g1Z8YugFIaBOUCT6TWD5Jq3URweh8VD0dPJMimFvnKQoFUbxTuNcq3wZ4SnVMHNljfXfSoeHkruQsJzIbGvqelKx55XIbbRnC83MygL0jp5NaFfYtt5Rz/AIlUhrDUtIW2cyyfIlEQdhKR0quNgIs807kn1P8A1rR3i5S0OIZWtekqheeddfxEmg9ulS7ZtkmeYQgR6mKrz7bOi8I94/Yh4P8AjuKeFnrxgi24G4bcxlU9L/EHF8r6hoKV+VAPtx8erxzj6y4NYfzMYNbl+4yq0+Je119Ut5B/vGu6/ZIbw/AfBPifxTxMJZZxm/edSs6ZbCxaSy3B7HIr614Q424mveMuLcW4ovvO7it45cKzaZQokpH0TlH0rH0lTv1bm1wjXvmqtKortgqxaUt4JCswIirJZlAZlSSnJuk70Ew23UH0qbkpPlmND60/xRijGE4WuV+YJ0nqe2lei6WWY6TyVHjC8uccxpvArElZU7ETME9D7b1eLGzt8Js7fCrVALbSQCZ1Wr8R/OqtwHhK2WXeJ75MuXOZNvmPT8SvrsKtNoC/doUtqVSVHWd6TBZ9zDctvAasm+UguqcGsmCIqicXYu5cXXwjTmcuK5aBGxOkVa+JcRRh1hykGHCJIVpFcsbvXLrHW3Jzcsqc09AY/Wjk9oEuXhCeI7hHxHIbXmQz92mOw0/iKDtNKfUEoBM1NRZXeI3ORttRUswOv51dcG4Wt8NZF5iKQkiND1pW1zZyfAKwDhNbqBc3KciAJAVRe+vbfDGksWoSFxrKdj703jHE7YQtlCkhKdk6belVd7EzcHzKzSYiaZ7YrALHbu8euFZlhRgkCVbUOdUUhQJkzUlU5MwRAUSaiLQTuRrpSm2RxnkirJgx1pkBSulSVpQnQkzTanUJ0GtLY1P7GktlIlW1bzIAppThO1aClHSgJw32LiCZmsn3pxKgvrW1NdhNGiNwlt3KaWXCdxvTeRQMBMUrKY1oiOB1KkzuNqfUylwBSQB0iaHkKB0NLauHGz3rkztnyiVyFZoIMnvSSypBOh0MfWlt3hV829SW30ZSnKFRuTRLkDLXYlh1xIAEkdZ0o9h14V+RQ2giTQIuslUlITO57Cn2n0gnzZjEaUcXjgjvksV/YIvrdXyZtkjUmqXiFkuzeLbkwNjG9WazvggQTJT6UrE7RvEmAE5QtOoI3VRTjuiSngqTq0m1CQNUqmpWDXRYeB6nr2qLdILKFNqTBkfpTLCsqgZqsnskMa3R4OkOOG7w5FxJzJ3jY0LUnIrItcK0MR16VrAboPtG2WpUOAgRrr0rV43kWrMRmByyk6VcTysiXyCMdt+Y0HkrClN67b96L8IYmh61FstILjPlJ/w9DUR1nnNLGWNIk9TQfCbz9j4slayeXOVz/ZNJl7J5Gwe6ODoz4bUEpA+YSJPSjfhjxAxwnx5hWL3KSbZL5tbzXRVs8ktOg9/I4ox6UCSpTjInKSoan1P/AEKhOKU2pS0mSCDAPUU6UVZFoCMtryULELROH4rc2SFhxNs+4yCNQoJUQD+VdZ4UCroWbaWnVIcbHlDbyhJETvHWuW8Q24tsWdyzldUHEz2NX7gl9KrWxWW0nlrBzKbCgIP+JYTSKvblBzecMZwp5K7ctFJUpEpInsYqK+kN3K8g2USQDNOWiA1iV/bBQKW7lzUkawo9a1iDa+a29ljPoRI1I0qwuYiWy58ErLuFPthR+7eUInTUA1e8ICTbErOg2rnHh66pD1/ZKUSMqXEiNjJBrpWEJ/sqkxvPSsSz23s2KnupRAxNvzrKQIiRFVV4KSV6j5yNqt+LZlJBSqCNAI6etVC+UUlwqHXoK1/HT26mJjeThnTTRHLhGn0pSFkydgDoDURT6RqqdKxLycwg17fdk+e+nwT9+ulP26W+alwn+tQUPEpgr023pbDv3yOmsDWglLgmqv3oumCpBdlMpHarAbQuiSoEEZde9VrAXwHgC5r+dWZD6EjQzBmaw9TbiR67S1RcORn9hLU5nZcyiKJWuBuIIh0yIPtSrd4ny9U7a0TtnyrUET11qlZqpo0KdHU+UWPCXjbsoSVT2NGkXiIGb6elVS2uADlJnrU9FwgpkKJO+vSsmyzdJs3aobY4XQVuL1gpgD6A70Cv7thYycyCep2Fafu0xIkEmq/iL5yq82YgD/3ptUuRF64N3jjS1aLB1oY4xzIKVg79fWh19cOpJKVHzK77ULcxW5Suc6h6Gtep5MG5JPkPOWbhUSpQ7CDT+BsMoxu2S7lIza61VHsducxAcgdxTFnxDcsYow4Fmc4FWWnKDwU90IzR2TxMtbcWTSmUIBy6R3/pXJnrd5YJAJijfGvF1+vDWpJMJiubPcU4ihEBY36mo0UZKPJ3kra3bz9izKs3gdMp61rlOISTroZPvVYb4rv4lSgr6VJTxTcKUM7Y1rQ2SMhzqTLK0XJSQDrtRe2DQAznUiIGpmqjb8XtJhTzWs6COlP/AOdrCySUFJntFLlXJ8Fmu2qCznJdA8wkFUjoZpQukFacpgRVH/zubnQab6CpTHEdu4mVOxP6RS3TJdlmGtr6RZsbuA5hykkBRkRrXOuMUgcOXsbFo1Y38Wbu2uShwElUxO9Vri7zcO3pg6NmvHecjt1KPVeJsVmnkxjgjKrhyzHTKdfrQLi8n9pLExKIij3AzZPDtoZ1ynT60D4zSoYqdRqg6VnaLjUMu6z9Bf8A0SfBUp5l+JjzGe1dGduEN65ZMwTHWubeDJLbmIEkDzGQfeugP31und1KTPWvc6H9JHi9e8WExF4CkFCAmDFOovRASUgACZoOnFcOSnIblA1PSknGMNDZ/tCSBqdKvbTNVmA0Xw5qVZY0it83InN5TVbHEuFqOj6fyinU8Q4a5oLoAnpUNIP1Uwyb5GoKPUik88q1yADtQNzFbJS5TdA/WljG8PbIKrkCTrU9EKab5DIVyzOVXcRS0vrOVwSI+poUzxFhi/luE6+lPIxuxSsJ5iQSTAO1C2/gbFxT5DbinLliVOEKTqqRUa1YUh9CFAQfXU1HHEWGoanmjQax1p3C8dw64vEModClHQUG5jWoSfAQu0gGDqAIM1FDROskRoR3qbiJS26orOnXSh67+1R+OaCTOUR1LZRpEgCD5talNkAaiAdyTQt7G7RqQsxJ00qRZ4qy/lSjUTB9aEb8D7yM/XVOxP8ACooahJTOU7fWpzjgIKQJkmKGOurQ8Gkxr3rjkIcQqQkHYTFbtSkPKQTp003qBeY1b2jvJWvKraoDvEbLBK0gg9DQsLco9liVygvVYHTep7AblJQoTvM1zDEOOmy6CkEEbjvWj4h8lsctKtdaF4+QlZjo62cpGuhHfqaQ4oZdSATptXKv9Jj5QCAQU9xNRLzxKxJ9JYtEHMdKS3FMcnlZOtuLTAUIPrOlONupgypII7qrijXHPEq8ttBUtWgFQbziripl7I+8prNrHpUSsREVKR2+5xzDWVqS5co8u/moO3xtgq7tdqt8AJ0JBril1e4m+8VuXi5V2qG4t5mXi4sq75opXq4fA3YzruP+JthZvG3t1FSQenWg114qWYZIZbOeO8VzRS/iiCtZnrJpm5Q0gaGTTo3yihPoRk+S3u+JGJqWpTajE0w94hYutwLSqI6T+tU8vAaD9KUF5gABUfmZPgJaWtc4LefEHiN11OVzXoDQzF7vGcQfDuJLUM4HtQ9kPZkZd5BFH8YafetmQ6pKAAJNDub7J9kOAK7hqkiQ4Fn0NMm2UgQpX61ta126sgdkbzU1pFgpku3T0LOyR1oHzwT7kRrJMuKS0dkmasPho8Q9fKCoOaJoXh6rJlLpSNVAx6US8OkELvyDoV9qrW5yWaWmmdbsnAbUEqEnUwKqFvA8SnDJIDQ6elWqx1s0QjSNyKplq4f9JT09GxXkpfqzPUL9OAf42aDvD102VkSnWuMXVmlltJCwSZ612Tjh1P8AmzdxqYFcVUVLI5ijFa/h/wBF/wAmT5aWLUMEzqD71vMlJ+TUU6gMpUCoTIramkurARoDua1sP4Mxy+4zzM2sRUm2teajOtYAqQrDGGmipTwJiRUZbrYSEpMEaVKjt7BbUuggxY2xdbS0vMskQAJq1W2DPgIW+0tCVH5lAgRVUwK8TaXjVwtGYJIP67V1LFOO7bF8LbsmMNDKm06mquqlL/FFvSQi09zItlYMpWlppS1HqAKt2E4V8LCknJpsar3CGN2uHOly8teaknaetWpePJxN8ONMhtP7qaw9bJrhI9Doop8sOWklIBkfSpr6clupSo2kaxUK0uGuUmEyob6Uu7xEOILZSY2+WsOzs3oP2lO4uwh/GGA20cp96o13wrcNZWw5Mb9a6ddLUlJyjU9aBvILlxCyEyZrT0upnXHajJ1mmhY9zKG3wi+tZDjg0/WnEcGuh2A7IHarbiSEMqBt1HQQRHWo1u6TIk7bGrr1E8ZKEdJWQ8O4EtlkLfVpHerHhXBuH2dw3cNylbftrS7N2UJEHbpRm3dObXLBI2FZt2ptbw3wadOlqi8pch23bQUAZo0gilOr5QEbGh7a8qfKrWd6cNwpSFBe42NUjSXRCv3swkyQJ3qt4hlUJzBKY6UbvHQqSkQdYnt1qvX5SVHUkR7VboeGUr+UAr2AklehGoHehDrqQoHKAr8OtEsRQArNJMmY7UJcCBrIn13rXrnwYtseRt64yJVmzKEbTvVcxB1QTnSFb9TRq5X90rpPWq5fuEwiTvFaWnteezL1UFjkxFzcZcwVoPWkLvnAYJPrTPMUkRPSKadIka7CtH1pLjJmRri3nBNXfNqbyhE1DLkHakahJy03mMxrXOyT5HRrRaeBVZ8dbHSNqteNXClXbqoIGfKQNgBtVW8Ok5+IBp+A0culuP3eRGYqUtWn10qs3ut3FutbasBLCGVIY5hAh1RMk9BQXGH03WJLShGcMJ1lBUI67KH61aVNGzsyopzBtGUdIMVRGYvHbu5MOKS6ERCCEiNZJBIFE+Ap8LBVeJHEG8LaUhICRolMDXXaTScHShd0ypW1uhb6tP3ElQ/UAfWo+NqC75wJ2CoH/Qq0eGHDbvFvFVjw6ykleLXlnhaAB1ffQlX5ISo/Sqdtm3LGQjnCPevi7jCPCX7GnBXh2yrl4nj2F2lotKTqErSLi4V+awn/AHjXihSA6+CkSB83qa7z9tPjlHEHi7/mtYvD9n8J2reGNtoMpS6QFOaegKR9IrhlkFOuZ1DLGnpAqPHVbIbn8jdbPdNQ+wTtG02yfiCFJTknT+FUbF8/FXEVvg1vKGwc769fKkbk+38TVq4nxVGH4eolUEJzKT39PrQnhGyOHYS5jV2Qm7xOVJUr8Lc6fmZP5Vcny9pXjxyHbt1m2bTbNtgMtJCW0CNAKm4JlUtV082ciQVK7elV5Ti334ykz3qwXLownAlKzBKnExAVtU9cArl5Knx1jKbi4cCUwkCAJ1+tVHh5ebE1rJn7lfT2reOXTj7srme4prAVKTdOKGwb1pMpZkTHpyLlhj2H4Qz8UoBTm4mgmPcVu361oSoxMJPb0oTiV+t1ZQCYFDgFL3MzUysxwiIxzyOqccfUBuontVqwbhdTLH7RxY8llIlIO6vanOG8FtcMtRj2MgHTMy0RufWhPEXEdzi7sFeVCNEpToIqEtvMiHy8GYvilu65ybVIS2kwI6ihbtyD8qYiopUSQPWsUSKCUshKCMW6pRJmkgSJrEDWTTgB2FLzkP6eBASDvSwgqEIAMU81bLc3GnvSnCi3EQJo8A7skKSNtKeauVtkFJptSSTtSYM60KYeM9k9u4YdVLiY7kU8bULBW2sK6AdaFggGnkurRqlRHpRp5FuH2HHLdaTJmmFg5oiKmtYgl37u4SNOtPLtGrpGdlaRGm+pqcYIUpReGDUkAgnWpls6kLBCsuvWor1uttUR1imwpYNdyg2t3QXcsy550OSVdhvUVbT9uohaVJM9RWra9cQQCoCNNaLWmLMqAZvG0uNkwcw29ZoliQt5iDWrtxs/PqaJWuKqASkLMxvFIxnBUNNfHYe4HLU/mk0EQ+ptcEwa7dKDOS3cok4wouOFZM5lTQ9v5hUq9WHG0a69TUVMgikyeZDI/TgOYLdLZclKtBr+VWG/bKgHPwKAVp3NU+zdyLBO06+1W+3WLmwCUgeQTvVup8YYmfZBeQmBmSQOhB1k9aB41b8tzmjY9e9HXSQTlMGBIO1QMSaFwwqCCRtH4aiyPB1bxINcK4qX7IIdX94192oncjofy0og8EpJUVKMTp396ouA3psMRQlZhCyEKPYd6vqiFNghO8zI1qa5bo8hWLHJVeKmAtpi7jUKyH26VYeBXEmwbUVISQolM5Ac4GgkpJ27VDxKz+Iw+5t1JJVlKk+6df4VI8POYq2VlWtCkueUoLglfTRA19pFD9M8/c5cwwP35UzxViSFhSlKfK5JJ3EyZAP1gVvERzGkrzgqbWPeCI9qa4jzW/F902BkzhpXmBESgdySPqTUpwpWxBKYKdDO57ijh0LxyE+CLktY3ykSUvslB6ajWa6xhIdUxCCYOu29cDtscGA41Z3z39y25DmX906E16H4NdYubMqR5kK1SR2IkH8qzNVDF25GlpZ/22gXibJBMp21J10qoYlaXN4hbVmklSVTE10XHmUHMA2rQRQXg1gKxZ0KaKgEkxlqzpHi+JV1sVKiSZz/APYONGTyFH2ms/zfxsafDq1ExrXdCyyZzWxAjWExrSfh2lb2+vTSvXK94PFunHBxJnA8czJCrdcaaQakt8O44VIIYVEyN/0rsgtW0rA5MaxonpTxsUpKQljrHeKGV7JhRlo59gWAYwm4CSyrbqDVpbwLFURLSYHQ/wAateHNH4kAW57bUbS05HmZMDTUVjambcj0WlrSgkUNjBcUSojIY9ZiiVtg2IjKFN6jprtVwbQpJlTJAJkCNqIsNuTmDKtB2k1Rsk2adMYlQbwrESYKYG8x+lSv2RiZSAANN9KuTLT0TySB6ipSWnSMvKUI0+Ws99mlXLCOeO4NieVcJk9IoRe4JiigpGQwIIrrKrZwgkoVlOhEUJxMt2zRXcBKRskkU+Etom2OUcYxOwuWiUuvJBFVm/Wi3WoLfSqNTJrsGIYKi+XzQgLB2IFVy94JYuVFS7ZUmelatNuDEvr5OTv4vbtuFIcT5RMChbnEDKMQZQh2RnFdZX4c4ctWdVmddNU7Uzb+FuEC+afNnMKmMu1WJWtp4KPpZmipcXY6HMLQ2mYKdY3rmlzjDh616e4p8NsLdwpGW1IUEwTFcjv/AAiSt1Smi4Ek6CNqDSznjsLXUw3LKyc1OOLACQs1sY+4d1HSr9/occVoHFE9IFOseC7xUApTmvpV5WWfcpelV/xOfox5yfmNbOPr1hVdOR4III1eWD1mKc/0HW6h5nlz02ovUn9wfRq/4nKDj722c1s8RXYRlS4oV1VPgWxAKnF+bbUUy54GgQA6uPcUt2WfcNVVL/EovCmM3l3jbTDri1IUCINW/jAhHDt9BP8AdkR0iiDHhKeHHU4rzS4WjG0RI61C4wRPD1/Kf9WeleU8w3+Zi5HqvEJLTSwRvD9ZVw5Z9hP5UE42SU4uNCZbovwEcvDVocukH+NB+M1JTi8R+CZn3rP0X+pZd1n+nRVOGsWvMOcuvhXMmYkHSnn+I8QfBbU+rfU60V8N+DHeLXb3I4oBpZ2q0ueC1yFFQuP0r1+llL0+GeT1Kj6jckc1Xil+o6vr7b1oYlehOr7ke9dGc8Hb/XK4oiY2FNq8GcSKhkeERsRFWMz+4pOv/ic3Xe3CpIWr8zSE4ldo2dWPrXQnfCHFELy6kTExpSVeEGJfhOnc96Bqfww99SXRQf2pex/4hf51hxK7VCOcs/Wr414R4gXcji8oO50pV14T3dspJbc5k9hEVMVZ8s71KsZwUVN9etHOHV6etOpxO+dXIuFSf8UVbVeGeLhWUNn60z/o8xMOZEtqze1Goz+4p21P4K4L/EU+Qur95o74fM4hf8WWjLb5SJkknen/APR/jxWPuVKHtRrg7g7G8O4mtX+W42EqhRA3oZKfHIUJV56Oj44ss3LjCt06E1U7q+S0/qNSfoBVm4itLoYgsJBJUATJ9KqV/h9wVhxaCdJHenLOBb7B+I3TrlyPOcumg6VYOHXSpQSDOX+FAbvBsQW2h0NmDqfWi/Dts/byHGSk/pQphFlQ66t/InYdxQ3Fm3ACRmTGvtRfCGQtxTqmwdIFLxOxHLUko1yzRORzycuxFxaLhTilkq0MkzUVx59YSQM3pG9HrnBV3eI5C2oNpI6VrEsIVakJaTMCaDeuhXoyfvZScdw59pz4lSAErEx2oS6tQQEwNKsePKul2xStBGUHpVXGo3k+9Im2WFiWMGc5QntTrN45Z/fZZEaelRm2XHCpUEp9Nay+dUy3yQkj1VVdzwy2oZRLtcacavk3ickg7HanMXxd7E7lt5QCR2AoGnmIhSkrCVbEpgE+lTGm+cpMyJ3pblkYo7eBxm4Wt+FGRO9JvHVKcWiJFTEYewhsvJWJEmoYeSVKKkiPWjrW5gTbj0QVIUlEg9aQW3nR8pMdakXEOGW49qW046y3l70zCzhkb8LJEKWm28pbIX3qdhjFqtClPkAgaCoVy4tRjKKZbUsEgK+hNCpYYxpzRPeuQ2qGjBG0GluX9zcpCXnVQNtagIQc8mscWQdDpQuzIHppcIlJykkGTPemlrXOWRFNJWuNJilNpKnATMdaHdlhKOOwrhNup5Cyo9DVj8PGBmvjuEroPhdotbC+XnJy7AVYvDVCYvkKQokOQZoZhU/UdHsU5bNsa6iYqkWiS54lXJAjK1XQbVtCGEhQ2FUWxCVeJF5lBBDW9eSl+rNnp/8AbgEOMv8A9Xn0mACNa5Td27SGUuhwTGorp/iDmTwxcqCCCCADXGvvljzOGK2PEzxTyZHk6916CLDNopnmqWZBiKYLraVkIBjoaZYBUMpUI3rTqUpXp+da+7gy9vOBxV0oymTFMqWJmKTC8xJQYntWwhSgSAYFLzkbs2j9u8oOJykDWrTYvOKIETI1NVe0YSXE6DerTbpSEhKQBG9IueCxp0shu0fCUoAMAd6tmDOJIRlgmY0PSqhYgKjynfqKtmDg6BMT0rD1TbTN/RvDyXG1KwkaGCJBpazmEkDTQ0nD7lYbDe/TUU4/mB2CZrFnHJsxlwQLpoqbzJAEawBVdxBwtqUlJgTl9aPXr6m21+dMe9VjElnNMb/xqzp0lgrajoHruXFLCs2aZHWn7ZzK6VrEQBJioyWHHSSlMgEydhRmwwF99kvyAk67davtZRQj2PWjwTtMqEaUXss2YAq031307UMtrJ+3cUVJKgDqQOlT/ikiEoP+L8qz748mhU+Cw2xbbSFLCe5pp95DiMiT6kgUPZdURmMmelOhu4uFhphJUpasoSkaqNVc84Lu5JZZDuwEBWVUwd6r2IOKKvKrTcTVx4h4Xx3AkoexOxWy29og7gmNveqdeW61aBMmdu1W6E0ULpKSygHiDhUkmNdtKDvBQhUGQqaK3yFJSoJTEkzQh0rIkKnpoK1IGVZ2RLkEtLBiI06VXcR1WnbXYUevSeSvvEz0o7wr4LcceITDd3gdrbqbJ05ruUkdSNNq09Kt0sIzNTzE5zI2mKQ4kk+VU11PiPwrXwbdJw7iFtLNyQIyqzJMjoapd/hFtZ3BShQUk1qKrdyjIdqg+SvQqIJ1puPPBPWjD1gtohfKOU7aU0jDnrrzNNSJonTJBxvj2G/DxXLxpRnQNKJ+lWLCW1v4gXSqQnzHMevShXCmGm0ccfOjgbWDr6Uf4etSlkOrIJeMpJ7Cqzjtmy7RLfFNEjii9NnhfKWTBTqI6n+NUPAw2u3ubhYSVLdUdYkgDb50n9DRfj++WkFvMCJyxNBMLuUW+AA8wJUc6yAqDMmPwH+NcibOyo38Lu1FIEKWSCK759jizs7TxFb4zxYTYcIWl9xLcyBB+GYKGh7lx4R6iuBXBzXAzHpJMfrXbvDe4PD3g3xI+0ooueKLyzwZHf4Vqbp/6KVyUkVQsjvTiizU9rTAGOYxf8Q41fY/iyyu7xS4dvX1d3HFlSvYSdB6VJs0qZbU6XRoJ7j0qIloOPAkKSMwma3j90mws5VqkJknqAKv1pVwSEP3SbYAxVT3EGO22ApX90pYcfI6Aan9NPrVgxm5bhFu20Mjafu09ExsPag3BNq86zeY8+qXblRQgkxCBv8Ar/CnFLXcXik5gUzA7AUMeeSZPasBnArZT7yQqEo3UDvTHHmJJabFs2sGBGm3vRzCUfA4d8StKMy5SJPWue8Y3i3bgiUkDsZqZS2rJHSx9ysXjqnVklRJpWFvlhbuU6qb0P1qM7OaZrGFKbVIPQg1Ub9w1R9uBa18xWpmTrVk4WwFDoGLYg3Nq38iNi6e3tQvh3BXcbxFLM5WW/O6vsnt9atuL3haZ+Fs0BppkQE9ABTa4Z5Ak9qwBuJMYcvnClBIbBiIj9KrqgVKiKl3BlZ80zTJBjaSa5vIEeBkJ12pKt6ecEAJAOtbZtFukQk6mKFrPAal8sZbQpRECpzFofmcgCJNTGrZq1PnKSofpUS8fcfORBAGxqdiiA5bmIuL5tCS3boj1oetxaySoSfWpSLZCj946kAUsjD2juXCdKFpsZHC6GVtEHrTUKOp/KlouVDRQpWZte0io4J5j2MEQadaUk+VQpSmZEyIpqCk6CpX3I+pCnWSnVMxWIfcbMpMVJaKXEZTvTDzJSdtKlkKWeGSmsQQsZX0gneYpx20ZdhbBBnoDQyFJ3pbTymz5FRUbl0znDHKFqZU2SCkiOkbVtLpBiams3zD8NXTYGnzzSXLEqAWwUrGu1TtzzEhc9kzDMX+HC2nRnbWnKoESI9qH4paIt3yWNWVjMg/y96QhpYPm0n0qU6pp60NuSc0yJ0hVHy1yQuHwDHFGAKbOlYfmgzI0rN6QPSQ+wohe01aMFuoyoKfKvykA1U0KKYINGsNdCMsZiqRlFWK5Y7E2INXTTiSQcsggxGtRXkq5asrQIKoOkSaJ3KQ6gLSCcw1BHX0qA6lTaQlQ21Tpv6058oT0Va+Z5NwVBO+oq7YFiCsQsUuZpcAAXP7wqtYtbhwZkgyBmnpS+F7tLd0q1dJhfmBHcf8qrxe2eB31wLctCm3CVKBncfpUbg9tVm9eMcnMG3yT5VnQdDCgI96l3BWBKFSNNSN6YsUMtXbqghCgspUMxSSVREeYHf2p8kAmR+MFJRxKFAJAdtbcjKEpHyx+Ge3f3qQy4FhlRRoNPpUPjVaU41aLSolKrJKQQqdlqEaAAfQVliQu3GslETO1RDl8HSXOQDjqlquxbJhSkqKYGsqnavR/gd8S5wkwm4cU4pKlthXokwPy2rgF4w2xf3DygC+4s5T0aT6f4j+gr0B4KOpt+ELRMgZi6ZnrnNVdTHGGy1p32kWfHk5MwCtxrptQ/w8LH+cNwh4pIKOtE8dhbZUCI66HbvVa4WWpniRsQAlYOu1Bppf3osHVJ+lI6/y7HqBBH6U2lOGaApoViGNYVhzRXeXKEAbiYNQ8Jx/CcaKjYuBeQnYg16fGeDyXqfOA443Y8zmoCYBp1LlmmPl89DFlCdCog9o0pHLSQIe61zisEqfKLbh67D4hJITNGD8IYUANSRHpVQslpadRmUCQJFGk3jO2aO9Z19eZG3ppraFEBgbBOo/KprDzH4UjXTXpQND6Fq+b1FTWUpkeZIB3neqkoFyueA/b3DIISoJIqUl5ggSlMka6UFbbIBhaVa6ADWpAUEEFRESCJ71VlDkvV2JIIreYIiE1XuIsGscZQltx7lpTrv1qTcrUhSQhQETp60GxBbgBIWQTpodqKNeeyJ2YQ41Y2NgwllKwSOsTUd5FtMwnU70JuX7gaB0kp09qgPPvkfOY2q/XVwZttnPIaWm3BywnSo6XrNt9HyzIJBFAHX3/lCyT11poOKLqE5lEAjY09V8Mqb+VgvWN3LC7DIYjL+7VEuHbZMkR9aPY0snCgQpUZdRNUG4S6UqUt4gDUmi0lfDYGtnymGQ9aJiVgTS27i2AjMnTWaqRftlr5KbzMuNIV+dSW2HoMqUkEzJq7syZvqMtqX7ZUAOJBH60rO1MFSTsdOlVHO405o4SIin036kpla1bZQNK51nK1lqK2EZoCfm661gUyT8wEamKpt/jC22PK4QSoTHQd/WnmMXcLfnMK/dIMzrQuvHBPqt9hnictHB3MqgDtoN65JxYEnh2+zCZaNX3GcS5tkpsqJ1HWqHxUUK4evAJP3Rry3m1t1MT1Ph5Z00gXwGJ4YtdepH60F4x/8AiaiTpy52o3wIpJ4atgIABV+c0I4raBxMg9W4M/Ws3Sf6hmjq+dOg99nNz73E5J1Wa7QltoqJKgkeorgnge47bP4lylnRZOldROL3ebVWx6mvZaODdZ5HWWKM8FrLLUyoR3jatFNqkZQQCdzQOwxnnkhbk99e1OO3ySuM0GNY7VZ2NPBSU01lBYMsPEJbAJ9KSnC1HygAH1G9QrG+bYXzSonWdaM/tZpwBZKZGtKmpRLNW2a/cA3NqzaXHKeIH9aTktl6lY96VxA2p+LptYIPfehDbs6Z1HTLEde1PhHdHJXtlsltQWyW4V5inT9K0U2qlBUp9iKGLJBEL6daU2w46hSuYMx6Ufpi92WFWW2Y8yUelSbJCV4o0hCEQvYjoaB5XwkjmARpUjAiq2xRt9x0nLvSZx/cdXP3clkdwVsvPO3CgdNo1qt3+EtMukZAoetWW4xFtwrVnM951oK8i8uXCGmVuJPVIpSk4v3dF6yMZR9iywQu1QVBOVMDYRUlmxbCQfLKt9KL2PBeO4n52rYJTMeY1Y7XwxxwsFTrrKQ2JiZJrpaipcZFw0tz52law3DWWEqVpt1FSXLO1dCluqCUBJmmL9T2GPqtH9FN75f41AeuHLtSWmnD59N/5UajnkFzw8fJGfwyzN4A06AmZ1p68wzDFoAhJI0JimrrBL5twZVrJidOtC3rO8YXlcccB9SajZFyymFKcoxw0N3/AAzhd6hSeWAVmdtqAL8O8KkJGX+tWZpu4V8pUdIpDtvdEaE+tTKCYuM0uivW/AWHspUGskn0qJiXh3bXaClYExEg/wAatAtrpOmZXZIFPfsnHH05WrRxQOmY7UmVUF9THVzss4gslQXwagWCLPkMr5cEK9htQMcD31zeqUm25aEiEwP1rtGHeH+OXVgX1kJUnXKe9A7zCeI7Ja0otFrUDlCgKXCNMnjcNtWprWXA51ecGu2dsTCQsDaN6qlzw5euZyi3gA9q7xhHhzjOO27+I4jeclKBmyTOlVZ9TVnfPYcoIVkUQD3FWaY1yzGBQ1DurxOXByQ8OYgiCbdX5Vt3BL3KAbdQI9K6Zd31q2Mq20iNtKgOXjLgzNAEjTQVYjpoMqT1k0+DnDuD3esskfSmFYJdiJYUJ2JFdIedagFSUhO0lNRrhbKoKIMbaaVL0cSV5GyK5RRGsCuJhSSKeteG7i5vEsJQo5utWYLuH3wkNemgq2cO2bzLi1m2zOBMjTpVPUUxrjwXdLqJ3TxIpaOC7Bm1Uu4Kubr10BqtMYWPiyguQgE6E11BN25DguWV/MrQpnrtQI4ey7el/wCHWhM7FMzVX8vJLJf9aLeEL4Kw1r4t5KwVJDZj8qkeH7afjMVyggc86R60dwexFoHXWgZKDIMaadYoD4eOL+JxQkj/AMQf40uxYSDq4Z0RBCWgAVSRqaouFwfEe9UFf6sdPSry2QpmDrsaomEn/wDSLiBjQImvIy+uzB6d/RAMeILTbvDNwnOQTBgCuJu260JEg6+lds4zWsYE+CkTG1cuU3cvoS6bdUdIrZ8PBvTsx/Kyir8MPYp4O8VcP8E2fHV+LX4G6DZLaHZeaDglBUn19NpFU6zZaN2kOKBSDNXTEeK+NcT4ZteGsSxa6cwm0UlTVssDKAnYExJAkwDtNCeIb5jEU2yMPw9TKmRCjkAjT5fXvViqdyThb2BZXS/fV0QsRurRpRbaaBEdKFG9QfIlnfttSLlL0qzjWp9hgLjlkL5xQTP4VaUyuLcsFe2zbEasLdT76W06lR0q+WPDTqWkKc0J3FAsHw20t7xL7lxJEEAEVcXr551xKWFEgECPSiuSXZOlblyFMJ4aYmHAFT0mrZY4JZsJKAjYfrVMtXrxCkaqCVelXzDcTsE2YLgl3asvUKOMmxp8p4Ihz2TxEHKNd96mW94bsHOiExExtT1hc4ffOldwEhInSKnvowlScjAyjasb0syybisxHBXruxtXV5ObBIjeguL4Ips5mxmHSdaMYxZBpvmslcg6QaEO3mIlMKZUQKfXWkytZLKBTQuLZHISxqTvGk0QtbrFUAMcopSTEin7G4cdUr4lgpP4TS3FuJuoCRp6VZl0V4dkxCbnlwpIOYSfSpFph7TgBWIgjQ1EtnLxzMlQUNIGhq1teHnHH7JGPJwO6VYwHM+WYT3iqNsHLlFuFkYfUwVdYcGWw+me0DpUzB8RRhrrdw02C6gpWCROoNEf2ZfjD+Y9Y3KUkEhSm1D+VVxF2hCyhcadfTvSHXh5aLMbIzWEy+cR8dM8Z2jdliNvb26GlZoaEZlfvH1qj3+HYa2hZzJIM1BucqXS4lzyDcz1qDf34LZbSrMfWr1L+6KFsFH6UCsUw6zcUvlLGhnfegdlhrDl0OaRlSrzTRRy3D6C8pwJUSSQdKcw+yZvUFlpXnUPLr1rShHjozpyyROIOGMJbw8vsupzASR3pHB3jFxf4fobsMDurYMpOnOZCiB2mncR4G4kKVFTpLatRvFVG/4NxG2dUl19BCd61NHDEssydbNqPAZ4+4yxPji9RiuLXTZcQBlS2ISn2FVzDVWtxibfxK5SD+LaoiMLuVvm3knLoSOgp8YcxbLLi39Ua1prCRjS55L5xXg2GKwht+0SkAoEn6Vy5vEHrFSkNJBAParAeJXLiyVYuvFSEyBrvVacT5zlHlmheQ4qLfKLTwfcXN+7cBSRJQQn0JFWstNWrOWSA2iAI2jtQLgO3Q1bP3ik6RkTsJPeiGOYi0EZCZOXc7ev5VSs+ts1tOlGrKOc8ZXhduykHQE9alvPOWvDrbaVrQn4cAgF0AmAdiqOvYiq/jajc35SDJUuBPXWrFxCtDOGKYBMwlJyhXQCBosjp2FKXywnzgpSz9/rGka/lXVrG7uUcPYdh5ICGea8hI6KdIzH/hSgfSuXYdbG+xNi0Tu86E/1/nXUyloqASFBDWiBPQaCgqim8sZJ7cIcaQlKc6yRlO42J71T+M8QXePt4c2hXNuFpA1/DMDT1NWy/uba1sDzXCkFJKpIEa1UOF0DHOKHsUdBLNsC4JE+iNOnem2vlRREVzllqdYRhmG2+GMj+6bCCIjWNT+dCsLaK7kjIfmgDfU1Jxi6W44UoWZT5gk7mp3DFutLyrp1MttgqJ7UWAJPLCWN3XwzKWGgByUBJ00k1ynHXs9yon5p1161csXxH4rO+p5OXmwkzAJ7e9UC+WVvKUTJJNLtfAX1SIqt5msEH1rSq2wtKHUKUNAQTVV/UPRdMFftMKtE2CVS69Cn4GuboPYU1ij6FlSRIMkxO9CcJUVXTt+4RymJJKup6D/rtSLjEUO+YySdfarG7CK802xXJaCCpW/tMUkC1BlR/DUJdypZOUkViCVb7UOfk7b9yUVsFYOXNGlOKv22EQjL7RQ9bwEoG/emSoyaFywFGvJIevnHVE5t6jreUrZdJpTTDj6sjTZUeyaBylIbtjE0FEjUmlNW776srSFKPYVOFjbWgDt68M0aNp1P17U07iK8pbtUBlHUDf8AOuxxyRn7EP1rAqDI3qQXmFmVsD/d0rAi0XqHFoPaKFLBOc9jaXVDWN6WVhQEjWlpsgv+7ebPvoaSqxum9S2T/s60SyRwbaJCkk6CpLiQvLtFQCXEHzAj3FPIuVZelGn9xcovtDjtuIzZSAe9RlslOwqYl9JhJ6Usht7yle20CuwmQpOINUlY1ipDF0to7n0p82aigneohaWnUiKhJx6D3KSwFUXjNx5XED3FaU2huVJUSDqZFDUFQqdbuIdb5LgM/ho92QJLb0DbsRcLy7HWm07607dCHVDtpTKYnWq77Hp5ih1JE1PslFKonpOpih4JHrUq3chWvamweBVnRcsPc51v82aNx0pu5QUkoJBUNielQsJuBlyZ4Kj37UQdJeahITOYyJkmri5Qhg51KVJKIEKB3NVnMuyvQ4mJbUD7+lWpRWVhPLiddRpQHGrYtvBeuvalWrCyhlT5wXO2fRcWSVEkpgZMvUd63hzi23lALiBI86kwenyiaDcJ3q3WDbqVOTykHt0ozZL5GIod2zTMqP8AKjj7lkiS2vAO48JN9hziwuOQoSeZr5zsXNT9NK3hTmVlSIBJAMTWeIC0qew5YhUIcEpB/eHUyT+dRsGehIGbp1oK5YkdZwkOX6kuXOdKI8oPt0rtfhc24eDLJR3CnYKdozmuKXcuOtsgJzqGUx110rsXg7xHhl3ZOcMOqDdzZFam52dSdSfcGaRrE9nA/RPE3kuV9dkthE6bTVUdxhjCcUReOkJSkTJ2irPijeR08vzJBJk1QeMLcuWFwob5FHQTVbTP3odqsOEkNeI+OtYnZoes75SwvUpBgUQ8G8S+CtnVLYdWkTmISSB9a5am3zpAU8o/yq7cI8YI4dsHMP8A2absKIWgoJSpB/gZr0s3Ne6KPK1RqeYzZ2NXGODOucv4sBQ0IkfN1Bp5XEWE5cwvka6kSNK4lhovcZxO9xF7D1IUshbTeoQO/wBaC4s1iyMReZtDcqZSqEEg696ZG/PEkBLT7fdF8Hpmxx3DlKbc+MRHXUbUfTi+HFIJum4JjfpXmvBDjCGEc7nT0mulWyMOTwr8VcrUm4S0VEhas+eYAjtFZWs1myWEjc0GmU4ZbO4WPD6LvhlfEzeJslCULcDRSdUJME5uh9KgMXbCtU3jatp12riOF8VYkzaHD0Xlwm0dMuMBZCJ/2amtY9fl/l2yHVoGoIH6VmQ1di3b/k1p01yxsO5NOrgLDyf9rNSsyspPxCYJkEHrXI7fGeIiklu3f8p0EUQVxJxLasKWqzcgJ61L1SfwHGjCLrjWLYhaXTKLeFJUQCaeev7ZxP8AaHESoawa5ieLuJ7puRh69NtRrUW6xDi+5bKm7NYB0IJ1qYXrPQE6uC4cUcRWuD25fSc/8qqTHiLZ3qFEMEBOvaqzjDPGTrZD1uko/dmh1qccZzpXhYlQ1IG1XoWy+DMthHPIVvvFMJxBNuwwTKo0Eg1eMKxRV4w06pkDNCojrXGH8Pxly5KmcOOYmc0UXtE+IoSgWjICdImrUJvDbKcoJSWDuuKXIGEgqRqU667Vy3ji8u2MBddsUkmDtrS713xJVhBbcbbByjYGqNip4/TYLFylKkHQ5Zo9Nbw0L10GsFDssa4gRiiXOY4Vhc5TtXdMJxZ97CGV3Yyryia4im3x928JSweYeydKveH8J8dXFqlXxqm0nTL6RV2nMV7jNteXwXl7EbciU5TEa1DXiNuqJMEK6Hr61VzwJxmrReKGN9+lLR4fcTQS5iqhI/e3pu9ZF7W/gO3GJ2lvc2r62y62y+lxaUq1IB1gdam45jLeP4ui4sVHKGEoMJiSCdfy0qo3Ph9xIhKHE4i4qD0NHsL4HxiwYS69dFRckmT1pbcd6kMgpuDRIfZcS1mWokTJBqt8VH/u7fEAAco61arvCbi1tC468VEEbVTOKHVjAb6dRylV5jzr3aqLR6jwi26aSIvh+pA4ats4KgVHaovFaCcQJOstgz+etSfDlQVwvbka6n6VH4qTlxACN2z/ADrJ0n+paNPVPGmQ14OJWi4xMAAyo1fbhl7OVknXb0qg+D7oReYgATmkzrXQnrpQUUlI3Fe60LXpI8Rr3/cGLS0uWXs/P7yD61IuXbsKUrmJ7TUNLwcuMrjmWZ0BqY8m1ylKnSetWnnOSlBcYNtXNwZBWnep1zfBnDlqduAnToqgSLVJdJQ6frT1zhtteWamFXO8T3pV3PRa0zUXlhBjGrFWHFK71BUCTqaDOcU4aFFJukyNKgMcDWBCluXzoTJlIWagveHGEOKPLungT/ioISlCOA7UrZZDTvF2GwMt03rtrSE8Z2YUAl9BPvQP/RRanX9oOgAyJVrWK8KrUxGKPa+tc75fYJaV/cs7fEbL4OW4QO0qongF5+0MRLKbltKW05lH5usbe9Ulrw1dYSsNYm4UpSd1VWL66xPh6+Um0xNxLiBlzJXrFUNZq51x9qL2l0MZSzPlHcYeduHUJfQVIVkMKke9WfDMct7C0TbuKYKgdTOtcP4Wxa6xC3ym/UXDqVTrNEizeB0pcu1Qo5fmNBGb1Fa3FlL8tZ7ejtbfGiWJS1ftonpW2+NrwlfLxQKEEVyFmwbcHnvlaep00qR+zUttjLekkjoqhVEfsOeos+5asVf/AGjeqecuCSowTOhqK7ZlhXPRcCE9jQy3YUBlS6dtyZqQpCkMkuuSQK0oPETLnFbtz7C2H48WllDrgUI1kRQvH8bacczIgkakp/hQF9xalLOU+hBqG1ehx7lrSQZOhqo5OEsouNq2tRkWXCGrm7tF3y3EIQiSBFWnBeFrfE7L4p3F2mSoyQY1rkmKcRrsXBaokI6gKMTWYdxWhTgZNw42T0CzFVbNXZLhDq9FVHk67e8J2FstJGNIJB2TEEVu/wAUTg9mjk4kyodgBrXKcTxFLsA3zqlaBPnND+TcXSpDy1Db5qruyc+JMt1RjRzWjq6+JcXUyl+2xFpKc2YjUyKViPGK0MISpbalzqRqTXPWQ8MPS2l5xKgcphVB7y4u2XQp65XBBB1PSig4xeWhltlkl2G+JvEK9StTVteOISRBSg5areFYonEHVOhpa3idT/Wg11xNgyb1fxozDqSKncPYvhDJdfs30pBkpBNXtPrK4cRRg6vR33y3SYRxHELZlOW5Qka9dqmcDowfHsU+AW6ltOp1MT9a5pxXxFeXd6rI6Mmu3SovDXEN1h12Hm1KCjpIqz+dUuCk9BKtbmdK4zt/2RijlvaLC2W9zM0CZxMXC0tpBMRMChGPcTXrrkqVOYeaetQsI4mdwq4D3JS4I2I70f5rasZFR0m/3NHTmLOyRZN3RgEESDpSzjhsr8cpMhSNgKozeM4jjb6shUlrMDkBirGrFba2KUuISVobjzCaTKzf2XIQUX7R1ePpeDqlo1k9BFSeGsGxziFNxd2mE315a2vnuHLdhTgaRuSogHLpOpNUu4xhy4eWw0xos6mvYn2XftTcLeDPhfi3CuNcKPXz9xcLumXLZaEB5RbCeU8Fbp0GonSdKqeQ1NldGaY5bLOhphO7+88IkeMr32cW/C/CVeGDdinGAhGdLCVh8IyfefEZjvMRvrXkjw7WldxiZAHmuVRrFGsV4vVf3GIXTVqllLzjroQj5U5iTA9BNVvw2WvLfOkQVvqJrO0+lelhtlJtv7mpqNTHVT3RSX8HS2gopkJGWO9UXACF+IOIqV+4Ok6Vem1JDAMySNgaouAwfEDE4B+X8qwXzOZtP6IFo4iAXhzrawVaQZqooVbssobCE7+YntVg4vect8IU6gmJAk6TVbshbXFslbzwECYr0vgmo6do835qLlqEyXimJYZymmENpzDWZpuwcwpxpan2gIBg0BxZLanZaUFjuOtPYarNhbyUjMqTGtTap7mzq7I7VEG4n+znMQUGiMpO0VHxi7R8M3bW6yAPmT3qE3bXLd6XHk5UyTM01epLl2IEzEVMcqQqWGuyVhbDrlw2srURI02rpWA2y3HUjKVR2FUixtb63Qh4Wqi30VV04Vxpu2ulvPAwgbRS7ouPZZ0rTXBbAlOyrc+mlWTB7G2eZCHG4znvVNb4mtLq5GoTBMa1b8EvmbpSUtOIgKFZ97Tjg1dPncE38Cs7RoLQkajad6YcsAtrmsJ+XpNWNdpd3jKmrG3+IKRmMED21NC3G7y3Sq2etuW4IzA/9a1mxXJqSaXBWbtnFHHQhuddxvUgW19ZoCrhsEnWIom078LiLKrlMJBqbjLzWIuIQ1mSkkqKo+WnQ4YizLXBUnro80LDKE69B/Gl27zKr5CnG9TvA3qZc4My4+GzcQAJPrQrKLS+5YXnyn+NMkxcItclwYfsQ2mLcaEGSP8ArtXpLBvtDcFW/AqbG5sEpuWrcNrY5fzECNOn1rzFYqTmBSdEiADTTl0psuZkJIB6VXlKUeh3oxuxu+D0A99oHhPEMHcw5XDDiVrQUglKSK8+43aW2JYs9d27QbS6sqDY7GpGGXGdc5B11I2moiVLTix5hAHpoPyFInNzWJDoUqrmJHdtUJJSlroCe+mlBLm0BuoUjQjarDfYlasvEyJjXSg68RZu7xSWxEg7aU+jDFXJ4KniqjavQhRyq1gDaollevWziHWFlBBnYa1Mxu0eF2YAM/4pmiGAeH+P8Q4ha4dhjHOurlQS00DBJ7+w9a1ovCyZMk8irziLE7iyDZuoO1Vx60vru7UXLpRATp3roPGPhtjvh66nCeJrRNu+trnNqC86FoJ3Bqo/EWanVqc1IAFXtJN2cxeUZ2tWI8lFfXdWV862gZ1KO53NR3bA3ilLWVIWdSJ0qw3zlum+KmsqgdpqJcNvvFTiEpEawN60cNGS5LHAGGCBhQU8o5Y9hRa3wbC30IUlxJJUE6K0q3YHgmD4pw+p7ElhK0pJHmiglph9ow99wqENrz7TttUb9vYyNbsaaJaLdGF2rdhbgFKZ1nXMaAY/elLaipJEDQjuKMG4W5mUSD6n1qo8U3ICDDxBBgg9aqyZqtKMEkVazJu8ct0ZScz6ZA3ImY69qNcTPAtctOqlLGYnUzv1Sk0FwKHMbZUrKMpUrzRGgPeimPuqU02ECUp3IMiMuseYj8opKfDZz7SG+AbQv4u9eEAi2bJSCPxq0H6SfpXQmWEJb5hhIG4J0iq/wNYm2whDykQq7cLqj1yjRI9tJozjuKNWFq4lZCVZSpSoBEf9aUyv2wyw29zKjxxi7ZQbNlzNztT6IH9T+gojwfY/s/ADdGA5dLz67hIqjlTuNYsMqcpecCQkfhT2q/YljFvh1qzhtu38Q60jIUJMJR/tHr7UqD3ScjpPasEe4eBWbg5UsJPmdXpPt3rX+dIRbKsMPtPulf3jzhIKx6JoOtNzdLFxeS5PypAhKPQDp/Om5SwlSRCUk6U1sSRcTxB27eabUv7ttfkShMJT9O9Cbo+cwTualvlJWhQMwrWodzqon1NV5vI2HYzNaSFLWEp1USAPesJVUjDE5sQYBEjON6VjMh3QQvii1tmsOZM5BmcMQSs7/lQ9ts9iaO3OFl1xbrqzJO+XamPh2bdKlKUSR0inuIjeDeQR5lTr60l5zIMiD7mpGW4vHwxbMrecJgJSMxqQcHbtdcWuksQdW0Qtw/loKBpkxb+QNrNTWMJvHk8xaA03HzunKP8AnUo4rZ2JAwuzQlQ/1zvnX9Og/KoFzfXN2ouPPLWSepoHhdjOfhEhTWF2n+uXdr/wjIif5007iTpGRkIZSdClAiomp1NZUb/sTt+5sqnrWHbXT1rR2rOmtC22EkYAI1NZt13rK1Mb1JPBsOLECaebunm9UuEUxvW6lNgPARbxZYTkdQ24kjULRNS27jBLn+/seUf3mlR+lA6Wg5elGpfcBr7B79hYbcDNY4tk/wAL6NPzFIPC+NoBdtGW7tA6sLCj/wAO9C2lKJMbUQtL27YUFtOqGkkJMa0xYYLbXDNNuPWbnLvWHGlJMFK0lJ/WpC7exuhLSwg670Rb4pv+Vy75KLlB0KHkBY/WlE8L3qgpVs9hzk/NbqlP1Sf5Gj2/YDjsBOYY63siR0O80wELaUIIBqzO4DehouWF6xfpOvkOVwDtlO59qBXhdbXynW1NrQYUFpgj3oXDBybYLvfM+o9fSmQCDTj5JdVCp1pAiPWqz+osriIpG9OtK80CmkjWadbAmmRQD5Ctk4UqARuNTRho80FSNx2Ma0AtVZFBQ0AmSKN2rqSlKo2Gp7GrEGVpLApa8pGqgR6mh+Lt/EMKKQSEjSaIOgqWmcsagn9ajOwoEa5TIiiksomLwCeHn1MYgEAxzUxoauK3CHW3lAhWYH2E67GqCVG2u86TBQqRV4ac+Js8+87/AJUqh9obZ2mRvEMJS/Yk6EpWo6QYJTBIKlHXuYmhmEOKC0wBB0qTxs6XGMKVBEsqI8iUjcTtqZjrQvCFjOnMrTtULiYNibjkPXXLZPPg5/kRp8vcmpXC+JuYFxBY4wkkJSqXUg7p60NxGAgOJzSDBmoxU4lSXASZGRHv3pkoprkCMmnlHqW4+GubVu6t3Q428hLrZGoIImZqvLw1rEL9uwdAyOyk+01B8K8TdveGXMKuFku2CpbH/wApUkD6GRRJx1TOKW62yJza1Qri4WpfuX7WrKm/2J134QYKUAtHLOvapWDeG2D2C1eQEjarIbt5baQlEaCm0XVwhSipSddd69UnlHjJJKTySbXBcOtTCLVI03Ea0xdYNhYWXBZNhXUlNKTfPnUdqS9cXJQSFGBXdPghyzhD1rhFkSkN2rZSD2qwXGC2btgWTatRliSkfpQC1vLnIkgnTQ6UaN5crYBWSRtPaqOoqTeTZ0tjjHCINnwXhAXmW0k9tI1o/YYRglikFFqhQ66Aa0J5juxJ9amMleVIJIKpOlUpVQ+xfhZL7hlt2xbORFo0B0BExScTurZVkpBYaKR3TUdl1KAM0k9zTOIpWqzeAATp196XKKRbhOT+ReHrsjaEotmonUhP9a3c3CcuVDSAO4EVDwhZFiQTOuwOm9OOqSQqJBrq4/KAtk+skC+IAUtxKYO2lClJYWc2RMdZTvRK9IcQQM0n5RQz4V0DKoeaZjpVyEofL5M+yE2+BCG7Rsym3bJM9KeTerQUBKEgaRtUd4JaTq4ARvUV2+QmOWkqVOmldLVU1p5IhorptPGC5YpeqRhIUpIgp12qgX92zcNqRKSD+HvS77E8UurdTTzmVuPlmq7cFNujmoJKpggdqo1+RhVL6eC9Z4uVseZdEXGTbYdaKvGm0SnUneKrbfjMq0ty0lBJExFV/wASeJb+zcOHgKS08mZiAa5ihxTmbMojWtOesUknAxI6GWWp/B6FwnxasbtDabvQqMamrvbYrbXDKX0lJCxKRXkk3SmClTapykV2jgTHrrE8JbzI1QCJp+nuVraEX0ypSfwdPcvEHyJVIH9aexS/ShhsqWAB1mKrFu85mSSTBgEGofiVdON4ATaO5FARoafKKXImq3jAVvMasr60ctre5StUQUhVUPicf9g3oH/knT6VSuD7/El44hlT61IcnNNXvilIGB3iQDIZUP0ryXlpqd8Weq8VBwokDfDZUcLsIj8RimOLXsuIJyHXJSvDZUcNspJkZzANQuMnQnE0mROSTFUdKv8AqWy7qudOZ4Ruxjl2lagEkmTsDrXXHbNt7ztFKgdBAmvNOC4tcWF/c8hxSSpR1BrtPhxxUw7hS/2neoStHVSt69foLoxhtZ5HXUtzTSC79lbNPhL5ShROgJisXa2hdLPOTI6ZhrXLePeNLm5x1f7PfhDR8uU1WhxTjj13z03CyoRsasz1sVLaivDQ2Sjk705ZC1QXX1ZURJVOgqjXOPtYbjgaF8l1laiSc21Q77xFcueExh9yo/ERvtXOm333rkPPqKvftVXU6nGNpb0mnWHuOx3PF+DISQq6I0nQj8qRhHElvi7qxZOap6GuM3KFc4nP5T2NP4di11g7ue2dIJ0oYax8KaCno+G4vk7hcXGLOIMqGXYQelD/AIvFh92l5U+9VvBPExhFoWcQbzrAgH1pGE8dpu8aSwsQy4uB1q4r6yhKi/OX8BvE8Zxy1sXVh3RAOYmuVYpjN0++ta3PMVa10HxIv7ixYDDIhtwCdN65aE88lX1NUNdKMpKKNLx8ZqLm2WHhbHbxq7S206ZXAG9XZ3Fca/EFdgQDXM8BK0Yq0EGDmAEV2JTR5CFPLQDGxPWnePinDkT5KyVc00wJ+2cXAIWpfeINYjiTFmjKVk/yooq1cCZlsx0qG/YrUk6JAUNxWh6UUZv5mb4yIb4wxlHlL2kdqdRxnioT5nCrodKHrssuytKXbWagoTIAOsip24O9aXyyaeLMUXOVgOR3FJd4gvGG1Xdw0EGPKY61p5abC3XdkZkp2kdapmOcWu4gFMwMmsAdKr3zrrXPY/T+tc/b0JxPii+un1OFQmTUBGPXyV8wK8woehJuFwDvTbrbjaikzpWM+XnBvQbS2thtXFl+rRTxJG0URwPjXELN/wC+cUpCjEHpVPSVdE04HHANUE1EWs7sEyi8bcnXFceItrXMWpURO/WqnjfGl/iCyEI5aR61VufeLQNCRFIDz5JSUn10p85xn0hMY2LuQu85ijz3BqvWZpNp8SEw0VJB7GpT6H37VA5XyjemW1XTYCUtnSlKtphRnmIlTNypRJBIJp61Qtp9BUgkAgkd/Skl27H4SJpWe4SoKXMg0W1Z6BcpYPXOE4X9nPEeG8IvLlmzN403LoUpSCBl1zTpOaa51eOeDl1iivhLRsNNKUCQYkT61yFjH7tdmuyUZCv196Ht2uIqzOtsrUkbqSJimKqMPc2DGU5+3C4Ok8QP8Mqv1p4WyMJUrXLsBpVYxZL6bjmG5CtOiqEsWF+pguMpUD196HLcvGXSh5atNd6KbUQYLc2H8Ou0C6SFKGvc0avsVNvaqDTmhmRVFw9z4i6Ql1flTOvanr+6VnLTDuZEzqaD1Mchuos1livMs3s2pIVRPw1CVWl0siZdNVDD1ratnEq0SUTVo8OHVN2FyoH/AFtInLI6qKTwdOb/APDpIgGNKovDSlnj7FVHYD86vFurPatqnWKo3DIA44xUgaAamvMr6pno31BBjxBuC1w84QQPMBrXI1Yk+B5XVADsa6f4ihTvDqkpXrnB1rkr7IZZBUoyROla/jJONPBk+TjuvHxij6vKXCZ9aJ2+K3dlZAgHIo6mq80lO5UTRpm/YGGqtlIBUZjSa0dzZQdaTHziNpiLZbdXkMbjSohftbYhIKln941Bw+zcubsMJSTmOwqyXHBGLPqbRaWmYkDSYJoXJzkkiNihFv4JGE41dqQi1XkU0e6dYo98VaIB5bQSo6GDQVrgjifC4ubzD1ttJO5NOuKCVidDVS/cpYkXtPsccxC9shDjoKGyZiANzNW3DsQdwtxLXKLS06kKEGgfCnENtguM2eJP2YeRbrCyjv8A86t/EvF+E8W41+0G7H4dCGQ2MwErPcxpWRqJyzhI29NCKjuzyF8I43xnCHPirdTbiVRKHE5kkCn+IePV4m+3c27KUOlPnhMCe1Um1vVNpy6lJmBWC4Da+YoGAZVVV5fJaTXJNxLiPEHVIcJIygb9+1GLPjHFkW4myUoRvPSoWB21pjlyi0yJMKzLPYdKvrmC2wgWqEiBl0EzVitzSyIlBWcFMueNmHoD1qpKhpqP50KRizD14X8wBSZ96vF1w1aXHku7BKj3SIoO/wCHuHuOZ2nnWVHpEimNykssFVKHAwzjRaPMSonrAqOvF37pwpZQok66UTtuCnGir+1JcQBoQY/OnjgarF0ltgQoSSntVeUZN8lmDUVwRMNxC7t1pDzcAk6jcUziN6FvnlL12MHWpdzZ3C0FaGFCdPl370HusOuC9maOWRoDpNJcHnCDc12yLdQCZVr0kzQa6cuWllTLkK96MPYVeKVJ796GYhh902ogJ29adVCS6K1s0A37+9D4U5cn5999Kt/A/iRfcEca4JxKi4Km7G4CnEkApUiIVI9iap9zYPqUQTr0ntUVdi/OpSYEa9K0oRcobWZk8JnUPtKeNTniTxBZ4hh61NWtpZC2QlCSlMlSiqOvUVwr9p3zy1JVcEFI1ijWI2p+HSVLTAP72se9AV29uHFDPCiAN61tBUqoqMejF181JkN2+uW3ZU6VR3M07b4peFRUFmDoYpNxh4SueaDOuhq1cE2fDbzTyMaUJExr1itFZTKDcdvRIwbHbJvDUN3Tpyp+YA761aOJMRwO8t7ReBZMhbPMWhMZj0Fc8xiyw/mvfAOAISdNe1HbK3TZ4fbWgUmcoUcvc6mlXrplnRTWWh11RaYUFJ8oBy+/rXPOJroquFNyIzEiKvOMPclhQLmw6HpXMsYfC7tSh+tVZvCNB8vBO4SZU5ibj6CQphoqETuTHQE9e1SsdQu5eZtkEKU5CE6pUYKoGoCfXpWcIskWV5cwEqcdbZQojUQlStNR2HWiuEWpvOIWn3CoM2rZeOaYB2Agk9Z60EFuWAZcSLNbpRhzCGEKhLLYQkTvAiqBxjjDr7v7PS5mghbpBnXon6datHFWLJw20cIcGdKQlAB1KiP5b1zEqW44VKUSpRlRPUnrXXWf4oOtZ5ZcOF8DDdqjEVEl9f8Ad/8Ayk/vf7VEri0aadWG05VR239an4WgN8P2gWkSlAA11Ou/rUNTS1uQtB1B1BpkYqMUkLny8gu4CgnJKvKAQAdfWoL7hbQtIA8x1JE60Uum+WCpS/KNPMQIoRc3JyKLbZUgn5laD6d66XCBQNeUJAETNRbgEK9aeWtwn5gQDsBTDhzKk9arSY6KwNkGNal4SknEGQraf5VGVtA61Z+FOGnblwYnelTNvB5cDzuH07D1qIJylwHJ+0KFl+8PLt2y4saCB8vuenvUa5w3CMPzOYneG5dSPMxbnyz2Kjv9Kl47jBsbc21ilLKIjK35SfU96pDty64SpxRJPerE5KPDK8Ytha94kuFIVa4c23Z2x0yMpgq/2jufqaBuuuOKJWcxI3JrR1M1kE1WlJtliKUTVZSsiv3TWBtR0g/lUYb+Atwmsp1LDk6p1rFNLGwNRsZG5DVbJ9KdFss6nSs+HI3IH1rtjO3IaCZG9bydKWPKYia2N6OKyRkQEkdKwg9qcKd9PalhudelTghvAxB7VrruKkcoZp1KaV8MTsAfpU4RG9IZQrKYBNS7d1MjNprTCmVA6JraW1ghR7xU9Ay2y5LJaN29wEIVHXpS7zCeQkO5Z70Et31srSrMQAQNKs9lepvGS1nBKhqDTYtPgU0gM27yIWlxSTO/Wpj18MSZDOJNJdybOj+9SPQ9vehuKMuW7kLGT00qE3dqQZC9e9dKQUYszFcHespuW1B23UYDiREE9COhobt0qyMXTd1bqYUArOCINVxacqig7pMH6UiyKTyh0JblgyTpTifeKQANKUdxQpnMlMqKdlHTY0TtnVjUpkTJ1iaEoJEbRUplxY0SrT1HSnQeBMlyHQtBRmKzlHXeTG9RnVtiU+U7QZphDq1A50iRpI2ranVo1MAiCNKdkBoD4mjLcqUCSDsYirHw+6H7BM5ZGhJP0oHjDfyukarM71J4ZuChxbIIEkETr9KRB7LCwuYEri0oFtYRl8nNSYSB1B96F4booaSRRPi1JDTBOqSpRn3H/KhOGqAWCdal8WcAy5gWK6SlVpOaTIExWYbaG5umnFAlDSdexpHl+AWnKcyYI16TT+DvK5AaEgqJ6zApwmPJ07w1vUM8SLskyE3No4mB1UgpUP4mrTiWX9o264AHMGw9dq5lwXi1vhXFdhc3qylpfMYKx+DOkgH866liIJuWiPMCtJBB0NU78xtTL9furcToKW0i3QUtiMo6elRHbqzD3KU6kLjYmphUlvDG7hxaUw2Jk+lcSxHjJbPGhY+IlgkjQ9Zr0aklFZPHTi5TaR2RCG1EKB20pF1e2VhbF65dSMx0FJw1wX9kl1pC1SJkDT86qvHnBnGHEjaLXClIZQIJW4uAKXbqaalmUkWKdHddLEIsv+EPWV1bpcaKYXvVhatLZLSTt3J7VS+D8AuMBwtqyxC7577aQFFO01ZXnFOMqOZSEgRHcVhazzGnj9Lyel0XhtT/AJrBMVZNLUeWQZ2A1qYiwXkgaCI2qstPFohTMg/va6f1onZ8SqLoZuXUJSOuok0nS+ShquMYLOo8fLTcrkLt2CgSlYBGgJmk37HLsngEgAjeZp61vmLojlOJJmDB3pq/H9jemUgpNWn7vkRFY7BeBFCrJwLUAAo6RrNQ+Ib04ZYOXTLBccTKW09So7aUMwp9TLqg+9CCvQE7ipnEDasTw51lh1KHiM7TnRKhtSpSfptQ7GbVvTl0ULh/iu9s8Zurbjht+0yt8xlEa7/wq83+IYe23bOWbnNtLlvO271nqDXCOM+IPEHEcbRh2N2oXcFJtm7jdKkf4T0q3+G+IXF/wuLK7Vnds1qCQTtBhVeXu9XTy3ybN7TyqtWyKLfeobzSkhZOvpQxbivOgQkRpApi6xNDSdSR/A0Pexq2BjMTO2+pq7XZuWRTr2tokPuKIIKiIO29B7l5BKwqEjSCetOLfu7yUWtovUzmIgCmV4MtYCsQuJJM5W94piYD+xRPEyx/aeEJu2E5l2x8x9K5QU5UnWvRN7aWT9q7YpaGVYyietcExqwXhmI3Ni6ghTayB6iZmtPSWqUcMxtfVtnvXyCgc+h712zwpvLE4XyXFoSsCNq4qUkCQIorheK3dqEtWJWHDEAHc1f09vpSyZmor9WOD0hiak2dsborSlKddq5/xrjwxG0DNo+pz0ApGAcQcQYktvBMbtHENuDyqUNDQHjq1dwHEm7O3cSc6SrtFW561bthShoHsdn2InBofax5rM3oqZmuicVIT+xL0gyeUrT6VzLhd26TjtupS9M2tdH4jcU5gd51+6JP5V5zyXN0cnofG8USQF8OD/3dZBEStWvtUDjfXEUx0bqf4coCuHW4BELVUPjUA4g2NUkoI23iq2l/1Ja1K/6c57ZNLXd3GWNCaxpeJOO/DMPLQFGICopdm4W724SdJJrQcyu81Cikg/rXoIR4yYU/qYZPBeLrZ+ICwpShJJMmh2GYZdWuJm3uk6DumpDXEOIthKeeox60Yw9wX9wm7QqXAmDoZmnRri5ZRVssnGLT6ZWMSIFytAWYBplC/LqoaaUrGm3v2i6FCDm7RUZtpY3NJs3NlqCWxchbCcH/AGvcpTzglIBJJpvEsOaRcKYaUAUGCalYCQy1cuFceTT3qCvO44XJJJOprqoPPuInNfHYNeQu3XlO9atLtdrcpfSdUmaLJw5F2k+fzAbE0GetnWXSkpJ1iunCUHlDK5wsWGXHEsdcx7BIuvnZ0BPUVVWAE5vNS2Ocloo0SDvNYlkIGpnXpRTbsw2LhCNeYroI8OpYZxNl+4XlQF6mKvfEfEmGrdt27S4JTIk1WLTDrRGA/GOjzZtNaFIbYefbBURKh1q1TKVMcIpXVxvlllvxni9k8lm1JA0zUSTi1s7bJyvCVDWqFjDbFstIbGbTeahpvXSAlDigB0mmx1Ti+Rb0MZxW06U7c2aEFSnQDl6CoFvjVrupySlUVSnLm6KQXFKg+tNi4ywoKOh2pktXzjAuOgx8lz4sXiCbVJbTLTgGWO9Ua4wq9Z+/cb0OtWm84wN5hjNiUwUCJ61BViy7i25LqdBB96qXL1uS5RnTrCRN4TwC2xTBr28KAF240J7xQNbCHGlD8QNX3w+Qz/m7iyeWo6E76jSufP3ZZeWlMfNsahpRikw+ZSzETa2TqHEqdaVlnqKsmI4dhjWHJuWQjmRqKgOYyh7C0JUykLSdx1FXpjhDDsbwG2dU/wAlboEQN6OuMYxaXIi5ylJN8I5hb3ZL+QoTknXSpd67YJKeS2Enqat2M+F9zgVr8a3cB1rU6iqwrBmXFZnFhJ7dq6MJpchO2tywQ1Ymnk8lI0A3p2ycQoFS3BoNqkpwNlSSUOSBTSMNtUrKPiBO1EoWJ+4hTqaaiRXXOcohCwI11FMreyCFmYolcYSwyAtTwSD17001hVtcSEvBVDKuYyFte3JAauUhZVtNWng/GAjEv2feFCmHUmFHoaCjCLTNkDompVlhTKLtOVaisajSlyqnJYYcb4RluRKxY3VnfXFtb3AAzFQg96rFwtwuq5jmZWxNWJ1qyZxIi9fIUDrNY9g+GuMqvgTyzrNLw5e1sY5pPdgrzIKWylsgKrSMJvHTmbIPsaOWdlhL6w2h6VKO0VKNvZYfchtx8gp3AqfSj/kwfWl/igJaIfbC2lmClPWrZwC8pOHXAy683Whd38Oph64tEyIhRFSOB3VfAvx/5nQ1Wuio9DqG5vLOsWzpTatyJATVL4VVzONMWkERVttj/ZGlJzE5RVQ4QH/fDF1KCtd5Nebfcz0fOIBXxBtHncAVypzEjQVyleC4moD7lR967viGHDGbdFqp7l5lTPtT3iL4cs8LcIW+PWd+l4ltJUDGs71c0Gspqiqp9tlPXaW+2TtguEcAbwDE0kQwSDUpGE4ig62/5Gu2+Cfhw94nOvpcvA0GgYCI1qi+KdlfcBcV3GAc5LgaJgka6GtWOt03rOhPkzrNFqfRVzXAF4bwjEHMWaIYHlPpVq4pc4qwe/ZctcqPLIESKpmDcTYkxetvJcRE7V3J/gS44m4HRxS/iYS+lnOlEiPal3aurTWRm+ugqNJZfVKtdnPP85ON8ZZ+BvXWuUdPlAJqOeFcWeczZE7adZprAlXt1xLbYW5dJS2tyFHsK75iPhrbWWBpvmL5JcyZoCtT70jXa2iE1uyWNBorZwe34OP2HBWLOlICQTFWOx8OcdUjmBtO2goUniDEbK4Wyw9ImBBoxZ8dY/avIQHzGbvWfddUzVoqsQMv8Lu8Le5N2koX6Co5W0pCgV66DbeifEuI3GL3aXXtTl6UnD8CYu8iQVFRI2FVF73wWfp7LJwOxa4daG4ccKXrg7lOyaujCmnUhxCwdeh61Ct7LDjZt2qmkw22EgncViMGetlKXh13puEqGlW2tscAR55DLQ0JVIPTWtPpOUylCwR8vehBxHGrUgP2fMHdBrbWOW/MBdlDg01FRF/cJhAMIKiACIPTr6VIRatEHM6SlI7VEaxO1VKg6gE9qddu2lpDTayJIkyNutBfZGuDZNcHOWCZa3+B2qhb4hctW7jqVFgLEyRskDuap91au3DeKJxC0esbtlvn26uX5VJ7E96q3HGJX13xILzCyHBhjedQGugoc54lcR4+4i3dYdtrRJ5jgWTK/T2rHqrnbL1Mlu22MFswI/aGKKcCci9VQfLS8RU8pIzEzl10ok1xZbMFKnLZBHtU/AsRa4oxxiybtEZFKzO6aBI3n3rdrxGOWzKlGUnjBT2OH+JsWSVWOE3LqImUpgfnQzGMIxrBkqbxOxuWD3UjT2mvU1u83bsN2rKA002AEoAEUi9t7G/b5N9atvpUDKVoChVJeV2Txjguy8TuhlS5PF+IYgTbls7TA11oI+oF4mTXrLHvBzgXGkEqsF2jh1zMeXX2qi4t9msLWp3BsdSoDQIeT19xW9pPLadrDeDz2r8PqYvdFZOCFzzZZOvSth7lknMpM9q6TinglxlhdzLmGi4bA0WyZBHtVKxjhrE7B1xF5YvskHTMg61tQ1FU1mMkzGnp7K374NEWzWbhxDSVHzKA/WrfcX6W3CdMrYyiarWCWpaPMCoWmSEn2p9y4WtCguTm360Ns93AzTRSbaGsavwtpZLuhhJHYVRrpaVOkhRIneKseMvAMKBQMx0BmqwrzuyOpqla30Xa/uXjAGQ3wi2qSnm3j61qSNkgISOhG4O/c0WwBhu2srm+WEoKzkSYEQnQpEADf0oPhKkP8O2Fo20C4nmAkgknM4SDoQR+RFS+KcUbwnChaMKHOc+7TrOp+Y/T+dHX7Y7iZLdPgqHE+KjEMRUhlRLTROX1J3/p9KGWrfMuG25HmUBTXzampuENld635CqCIjvVVNzmNa2xOm2+VvCGLfNsjfL1FDVPPPqWixbS6QnVc+RHurb6VNNs0u3R+0lc0ASLdtWVH++r8XsIAqHeXgW3y20pS2jRLaBCU1fawituyDLnktJJecF2/M5iIbT7DrVevXnXnjzV5/WdvajTqkLCsoO2utBbvRw5Rp0pMyF2RVhI1phUAinFkxTC6TIfEIYLatXeINouAVNJJWsdwOldAub1tq1bUryqWiMo/COgFUbhpBcunExopEKVtAnU0RxTG+bckJ+RMJT10HWm1YjHIuzLeDV6w9duqypkHQT1pKOHAuQVJB96jKxtTapSdhpFJTjz6SQjyiKnMX2BFSCI4XSkZllPt6VgwFhE51JA6SdRUH9vXbw8zytREGmH7+4WCc8R612Yronl8BBdjZNFQU4jQ6mory7BB1V+QoSu4fWZUo9qaUpc6zQOa+wxVv5Cjt7bgnIk7RMVFXeE/KI+lRRI6TWZSrYQRS3N/CCUEhxdwtehNJKlKHpSSCNTWjIToDQNsLahckDymsnvWHXasjvRxIFByNNacS77U1E6A1mU+hqUQ1kk85MQQKcbeTEz1qHlPetonvUg7QszyVjMRqelLVZJKQZmdNNjQ1pxUjrU9u5UlAQVKAHc6UYtrAk28SFbjbWlWtyq3WBrodJ71i3goKMny66daj5k7ARHeuT2vJBZXLdnF7Iqkc5EkHefSqlcMlteRQylJ1kGjGGYiu1dSrNAGs9KnYthTd21+0bcylXz+h70xrdEmMtpVrd5TLk5tQZ1pF2P7QpYMhfmHpNKuWiy4oAGAaQ6czaD71WY6P3QgaCa2J960lJ3ilJJJqESOhRiY2p5KyPm071GAM1IRBHlFMQE1klpWrQHUaapHWn1LlzKuDAg6zp71CUqPLmjTelIWrLGp9ZpqeBTRmI/eW2YgSkxpUXB7jkXzZgEK8pn1qc4gu2ykJInfU0HbUpp0K2yqnSk2cSTHV8xaLNxNDmHodkSlY116zQCzUpK4jrpR/EkuPYKuUE5QlUz61X7aQqR3op/WgV9BYgoKsnJACoG2pp/Ck/drckiJQJMa0xZklOQg+YRIp62dDbIaBEAnXvT10hOSX92u9t2jHlnMJiZGtdp8O8PvuOLNWF294wi7w5KFkuGFLZJhJA9NvyrhDBcfvUqCVQD610Hw94pd4P4tw3F1qUm2DnJucp1Uyvyq/Kc3+7SNTGUq3KPaLOkmvUSl0z0U1wAF2oaxfGXXgPKUtbGmbPwu4Hw65+OawBLz8n715WZU/Wrc5coy5hBkaHeR3oe6+4CQZncR1rz9nkdRPiUuj0VXitLD3Qj2aW0hhos26UNJBgJRpFMOFMrzr6azSS6pxYKjGk70yooPypBI3M1QtvnLt5L9dEYL2rBty5IEtokDSo637lYMZMpH5Vta8ugBVIphb6GkGD5ie1VG5MeOKcAakrHlME+tVri964Xhxes3Ch5pU/7SetErjEfLy28ylFWwTUM4deXQWHEFpsiNdzO9O01jqlkramCtjggeG/F10m6LeKvSEGc3cetdDxDjnh8WzjfPBUUmvPWIC6wPFLi0zrSULJT6pO1MquFuklSiY1mtta2UI4MWWkjnJa+IeKrh64LeGOQNTI6UKTxzxHZpnnpJP7w7VBwxxm2ukqdKSAfxCam4pbWlzK2D80bmlQusb3DZVxUdo25x3e4qVMX9s0pQiFxBFZwViAwjjG9wu4fSpu6KXUKSdCHB/Wq9dWrls6sJnX0qXiWA4lg1lg3GJuVw678K6haYUidUqPoajWRd1eZA6RquzCOoXOC2SX1qdWskKIA700GMOtpDNqJ6ZjUy1Wm+sbe+SrRxAkx+IUOxJwMpUoak7k1n6S7PsNXUQ/yNP3x5cAhIjSNKEXNyVaQST17+1RrnFW0oKlKBkzFB3sUducyLNhx1ZI+Uafn0rQUimS7m+S0oHr71zXxIsk/GNYq0PK8nIqO4rpLHDWI3hRcYmoMtROUGag8YYFh95gbtqy2S40krQe5qxp57Zopauv1a3+xxFll24dS02CSdgKl2y3sIvm31NAraUFQRvScKvTht4l0oBU2Y26g0XxBbWLurvHkhtShqBoK3IRTjlHnLJyjLD6L9wxxi/xnj9jbfDoZ5CfNlETFDvGlvk41akAaoPmHUVG8H1Cz4tQppvPmTGvSj3jdhl3fY1h6LVhbjq0EBCEyZqnO5y1SgaFdSWilM57wzcLON2oUNJOk+ldNx0p/Y92kQmWT19KicHeDmMsoTj2OA2zbYKm2vxH3qTjKQhh5GoTBTHcUnycJepFsb4/HpywD/DpaRw8hJCQrmHU1C4zM3zRiZbOm9SOHSGrVbTYyJzzpUm+aDqkqcSCr1jSqOnxG7cXbobqVE5na2VzcX9wGbVbhE/KgmKUrB8UVthtxHflGuz+HbVujEnEqYa13JSDXWreyssoK7VgCN8gNekpW+JhWV7WeQBgmJQD8Bca//KNHOF8KvWsVtxd2Vy1brWAtwNE5U9a9UotLJRSPhGCR/gGo7bVtbVo3qi1aGpEBI/pTti+BW1vs8y8e8OWDeLIcwO1uHmnGgpwQXAlc7BUa6VVzgV6r/wDh1yD/APTV/SvXK2rNaiSw0J2OQUybezWkE2rRKf8ACP6UxRWOQHXJvhnk9GEYmy0pKMPuIVueWa3aYNfpYcUvD7jfT7o16rNpaagWbOnXIKdRZWiRJs2tv/LEflU4ijvSk+MnkNvC8YD8pw+5Ak/6s/0p5eFYhnzqw98//aP9K9cJs7IRkt2iE7S2IPvWG0tQCsWzQHWECKhbWg/SbaPHr2G4kFkpw24A/wDpH+lNqsMTAg4dcR/9I/0r165ZWi1AGza0MyUCml2VoApItGSTJJCBSnDL4DVeDzNfW19+wLa3TZPBRMn7syKi4Tg1wu4bL9pcETM5D/SvSjlowon+zNJ6SUCsbs2AR/Z2kjqSgfrUgOiUlg86Y1g5TdAC3eII6INQhgq0yfgrmDtDav6V6kZt2FqGa0a8x0lA0FFbeytSMvwrJA/wCudsYhV6STWNx5GXhrygMthdR6NK/pS28EeWM37MuzHTkqP8q9nWOD2KlDPh7ME9UCrRh2AYYXB/2fbQOvKT/SkS1kYvrJZj41tfUeEkcN3UEowa903+4Vr+lPpwG+Qkf9iXune3V/SvoTb4DhoQAbG3kH/yU/0p9eA2ChIsLdJAkw2NfXalf1OPSiS/Dyl/keEOG1XNphd9ZnCLpBcSSCplQzfpXO7rDMUFwsHDLoeYx9yr+lfRu94bsQlU4cxlM6csVWr3hyxQolOHsD/7QqHq1Z8Bx8c6umeEGrG+NvkVh1zp1LKv6V0zCL24tMIs0LsnSEESMh2ivRFzgdknNFiyCn/5Q1oc5Z2zYhds2Bt8oAT+lWqrlF5RVu0En8nMccu/juH3G2W1yU6DKZriuIYdixuyEWtxBJA8hr1e/a2ikSG0E/7I/hUB+3YbiW2jOvy6irMrvUjgRDROD3Nnmm0t79i1cS4w9mIj5T/Sq6q2xQXOY2tzlzfuGK9ZCys1ahhnXoEjX9KS5hNqvT4VsJ6eQUmct2BtWlcG39zzLi1vfvWbSEWjug6INK4ew+/Rn5tq8CQYzIIr0gcNtkD+6aP7vkFMli3Qk/2dtJO5yiii05qTAlpX6brPOTVjiKL/ADm1eyZv3DFWLCbN5zF0LVaLSmJ1BANdp5NsSQWGgAP3BWK+FQYQw2JInygflRephPAp6Zywzz5xXYXZxtxabF4gmRlbJFTnkPr4UUwiycDgMRkM13jl2zuvw7ZJ0PkGtZ8JZhBSbZvKf8Iqq6NzyXEnFYPMOD2eJtXrSzZP5QobtmKn4wxiT2IqWLF4pIAgNmvRfwVoYyW7czp5BpSF2loFkKYazeqRoK56fMcEZxLccLwhi5/Y9wh6zcBUNlIipHBtks2T0tqSS7tHrXab1i1RaORbNiURogVUMHtmEF8ISgSs6CkXr0Y4G01b5ZQWtUpbtWxoITB71T+EyBxZiyl7K0BUIqxvlbbgIWQE9JoJZKCr+5dREk7g15vOHL9zfdfESbxniV1huHNv2jhQoLEkVWMT8ROIMRwAYNd3DbjISUZjqYq7M2DOIj4a8AWhY1k1W+J/C111HxOAOwoDVhR0Psa09Fo4zrVmMtGfrbrK5uKeEDfDXxQx/wAM79d1hORYeEKBO00F424gxHj3H3cbxJQS66ehoVd4Xi2FvhnEbVbS/UafSoTvPSTlUrWrMdPVCz1NvJTlqbZV+nu4CWGtpsr5lKilSQrXqa6FifEl4jDWsPsMWcSzAzNzXNcKKnbuHMyvrW8WuX2rtaELUAI0Bqw6q7OZxK3rThxCRb8HS2MTauxcELzTM7V0q/4mxhLCGTiqjbrSAROpHWuCYdibzLqVOLUfMOtXg4om5YZSt2cxgpKqr6iuE1naW9JbKv2uRcDZ4XdNh1pxKVnrGxppjBXTcpWblBTM0HbStDYLZ0UAZmp9kXW+W4XjAI0rItUWzZpnJIs91w4+4lKw5+HNPpWYY2MKXncdCo6k9a1fY6pLSGWiSSANDNHcNwi1vMOQm+SS4vUnqKGFa7Qbm5cMk2WKt3BAzgHvNFbe8WFHI4T1iarNxwRfWznxGEXZKfmyE9ajnEccwZQTidk6AN3AJH50zP3IWS+N3uYBOUHTXXrS1C0uYDjCYOkdRVRtOKrV4AlQB9dDRRnFmlqgKzCd6H2sYgqvB8KWgEMhEdUmot3b4dY2dxeF1bYaSSkKOm1PC7SGzBKgRFVDxNxpOG4B8Mx/ePbdN9P51m62eWq4/LLmnWIuTK5Z4mg4fdvQC5evlM9m0/8AM1BcShSkjNrO1S7TAPh7G3bSoBTTYkAyQSNaaew9YcSlDkxvNWK6diwVrLFOWSHcMqWNAlI2rpXhLhHwdk/izwGa4Vkbn90DWqExYv3F0i0Qj7xxYSnU9etdkssIxHC7Fi1ZazttIHynX1/WptnsjgmiO6e4NodKsxypHtTgXEKUs7E6bUJZxAZgh1JbWTlIVpUv4lBT8hJJg9YrKcMPg1Yz3Ili4JOVXcfrSw6hc55SZ6d6j5UkSlX6foaWRkTooEkCJFHGJzeTYbWvZwgmQZIio7+H2l0C1dWLL4jKcyQZpzOtKQCkqPzT69qxtw5oKVZlDXppToSlH6WInCMl7kcf8a8A4f4fw2wucMwhpm8u7hSVOAbIQmTAHckVxRaFKSSpUHrJG9dh+0LiinMZw3Cc6Sm1tS8sT8qnDGv+6K49cqCLYlJkEaCK9boN3oKUuzyWt2K5qHSKxjzpzBo6hIknqaDJMEk7VNxN7mPFSo0gVBCQNabYIh9JeOE2ybe3UvVDKC6Se8mIkfwNVbiLFF4riS3pPLQeW2PQdfzo/cXH7H4SbSPK/eeRKdRCY1O9U2SY0/Ohsn7UkHBc5Nk70T4fEXYXmAjbX1oZRfhsBV5EkdaXX9R0ui7OqW5kJ2KQPLr+dQnWlFKkxMk+b07CpsFUHmEAJ6fw9qZcyNN5UnKnfXrV5lf4A76QhEqKpICaCXeqycmlHLxeYKECBrO2nSgF6EEnSfrSpnR7Ii1SJiNaaVH504QBKhH0qRhlsLm7SHAOW2C4uf3R/WlNFhcckxJ/ZGF8vNFxeJC1jqlH4R9d6F81a1bVIxF567uFOqJJOg9B2p/CsFfv1gNiU12G+ECmsbmQci1mcvppTqbJ9RHlOtXa24btLJrPckT361Hv73DrcKRbsggCAojU+tMVQDsfwVUWymxJkVtZSEBMSDvT1xcqeWVqRv33qK5vMGhfBCbfY6i2ZUE+taXZgHy6/SmA4ts7xBqS2+Y203qCeURyypJgoNIKSDtFTFrSc07nWkZYOpInYgVx2cEQg9q2E6dKeU1J16UlaQmSBBqMBpjAERNKkHYisImkEkdKGLCHkEnTSnEpHRIqOFGnUFUdKMCQ4WxsNzWktbmNJraSB11pYGYyZj3rsZBzgW015hmkCd46Vi3AgZQQSO9bKw2kgLE1GWsqO4rs46IXPZin1apJMHpSC6qdBFaKVbxvWojeoyHwOIdWnWaOYJi3LzWtwslpwZSmf1qvExW0OFJHpXKbiQ4Z6DGPWJZc5yFSFagjbLQVyeWkHuaOWV03f2qrJ9Qn8B6g9vag92gtLLSkkFKiCD0orFxuR0G/pYzJisSkq61tI7mtxBJmkp4GGxI01pxCyNB2ptJMiBNKB9NYmjTBZMhKiFJjaCKQSCqBr6VtCklG0GtqCRqSTHSmZFjrJTtlidNDQy4TkfUk94qe3KJAjXWoV/Iek/iGagt5SwMr7Ddg5zsHfaUoE8o79YoLbHWifDy86HGVHQyIneRQtvyuZdwDU5ykR94lgs3MpTO2WmLq8FukITAIGvvW7YpIgJ1nT0odftOPXjpabMTtTJNpcCYxUnyELLFm2lhRmetEHMdbcQUJMA9zNVlNncj/AFSh9Km22GXLokNnTQQDrQxk3ww9qjyjvXhz9oNy3Ta4BxXy1WiG027d4gQtkAQOZ++NvWu4oum3m0usrSttxIUFJVIIIkGfavEtvwtiNwnmBlUQTtqY6V6R8G7ziLG+C27RLBddwt02aiowQkCUZvoY+grC8tpVGPqQR6DxWtlKXpzOhuXIAmADGhmoFzijTUFx4Ce3epbPC2JurCsQvUtJInK2PNHvT7OBYPYqClMqfWk6qWZrCTybvS4Aqby+vVRaWrihPzawKm22BXLqA7ePJQM2w3os9dobENJCANITppUBy7zrgLVAnSuJxk2GLDD0xbs5lH8Staiu3BWcqhB2+lIecMAFUTtNQn71LRKCZI7HepWELaKL4k4elCmcVbQdyhZ/hVLtn3VCEie/tXUMftkYrhlwxA86SUjrpXPbBDTK1BxIUqfNA2NaNT3wM21KMiKXnB5nBGtbGIKAVBUdgBvUu4abe+WBPSoq1WdokqfcSNIg6Uay+ELk0uxh7EVKcS46knJuCNDSX+JuIeJTe4feoSuzLAQygHRtSflIoDjXEtmAWbeDBiQKF4Vj9wjFmUpJCHFhJFXvQnKrkzpamEbVtZ3Lw7xdOIcNlhyStjWJk9jT+IWGM4kofBM5G51WoaRVM8OsWVgfGD1g6gNs3C86Eq2KFAbfX+FdcuXFthTecpAOgnSvP7fQtwehi/Wp5KU3wUy3LmK3pcg/Kkz+lTYw3DkFNnaoRJjN1p/FbgJUfOAKrGIYglIIzx/CtWDRRktpOxDFFE5ismdtOnegd7ibK1FtRmTlMnpQfEsbKFFtBWpREAJEn6VBtsPxXEHUuvzboP72hNOh+xXsnnhFNxvBhb4tcBCgGyorHYTUdFq+W9FKUToAOtdOb8NsY4qvrdGCMqU3EOvuCEiuu8F+D/DHCzSLm9SnEb6NXHBKUn0FbenhOcUYNsVvaOUeDfhzxOvF0Y3eWq7S0SNFOCCqu+owLDG7lF6phLryAQhxQkp9qIktpAShMJTslIGw9KZcdVuCCFCB6Vbjp64y3tckb5qHp54B2OJU5ZuJA00JHrXHcbtNHkLHl10rrmJKcUwoKkA965zjlsIWkKAKiayvJzeUzU8dX7GmVXCbNLaFS2QknSnbu1UXApSMqU/nUu1AQVhCdE6E707eJzkFakmRoJ9KyapPfk051JVjvBLZTiS1tiSdSJ2rqbClKTBMj0HSua8JtIRdwEAk7ETpXQmHFxlKSnWK9NpZ4iYd9SyEPIBo4EjXStqKUjOQkx/GmENmEoAG+561NZYOfzjbcCrW5FRVMiDmSoqSkEHp1pfJzHbXsBU9VmGwlbwAJOlYpISryCSdz0FA7PsMjVjsgtWgSskJBSR31mkOtlUgGIMb9Kl5CuChRAHU/rSEMqeck6ITqKF2sN1fYgLQlLiQhaxp1O5pxbWa3znNBMQDSloDz+QJUROhA2qYm3T8MtA0CdJPWudmCI0N8kG2QlS4Usq30jam3EoALaU5tYqUlASrMVKia0+1mJWkAAAxQOzISowgI82kLPkMaSImKrGIcRXDN6tm0SgoToM2s1b7plam1IbUlC1pUnP1GmlUFnw74vdcUr9v24SCSMzf/Kl3XOK4QdVG5k5vijE8+dKGoEwSKJ23GWIpSCGmT6xQ628POMTCU4vZBMR5mpmi9r4ccYZQDjOHJO5m3mqE9TP7F6GmwuwnbeIeLIVCbZjbcpoix4r45bpzN4fbqCeutDmPDfi5xIAx/DzOhAtxRW18IONXmoRxDhyZ72wJFV56j7pj4aZ/DJ7HjPjxBWcMYCTsdaUrxx4gBj9k2+8HU0q08C+O3cn/AHnwxIHmn4UfrUtXgPx+qZ4pwrbf4MAmqbvjnpjvQn9wa940Y48kqGG2wHXehtz4q4u7OaytgI9d6MOeDPHFsMjvEWGgiTHww1oW/wCF/F7RV/3iw7UzHww0P5U6N+OkwHp89sD3XiLiq8sW7EnqAdDQa641xR0ElloAmCYNGr/w740SZGO2CgRuLdI0oTceG3GK21BWOWagegYANWq75d4YmzTr7gs8X4kpQSUNAR2NH7O7GIWouE5RmiRGx7VX3/DbitpAbGL2u+/JG1G+EeGcSwS3eaxS+RdKW5KDlACav03zk8NcFOdKj8hJlooQF66aU+wTKgvUCSJFJuGSyqEK9xSylSWylRAUBJImDT3IVXWIDCXUrkAAJ00oTd2hUcum2hOkGrBaNAuIRKSFCYFRb218xVMgHalq3DwOlQnECtWyTDYOpEE+tZ8IUQHfk2migaBYVy24U2cxA3IpTKELa84lCtdehpnqCPy4MNsMv3RJSnaOtJWwhUaKnciiCmDbSpvzIO8dK0pKXQE5QlRP5USswc9NwDAhSAMvzDY9qyZEgSrQa1O5DiTMggbiKZdS2tOUEBe8U1WZEujHYIxXmBhWpg9B2qr4anluOKykDMTVyxNg/CrBAkJmqxYIyOqbUASTOu0TWbrZou6WpoRdELJOU6wKE2NkWbt9YgpVt70fuGUKEHQz0qFb2yM6jJgnWa85KXuZtqvKQTwlgE5ikwO9Gy06khKjKdgI6VAwq2UgghYyxrRoMpUkhYOqdK9D42x+lgx9fVmeQZf4Jh2MtBq8t0Op/eKRPtXO+KPCi4abdvMFUHWoJLSpke1dWLTrJILZSmNxTrbMpCmoVpmIJgitGW1/Bnegec8IshbYgG7tpTahplIIP60jiC0tziighUJI/WvQF/w9g2LArvrRIdIOVwJAIqg8T+HamAu4s0G4QoR/iFCmoLOBE9NJ8o5aLdpGXYgmKlY04pltg28pKdlA1ZMPwixU4LZ1gpcSYII1Bp/iLAbfKhtsA9gBQSvg48oWtNbFqWSs2HFV5bpDbxzJgaxVuwziO1xBKGkkpUYAnSgJ4WhtDqUxpsawWTtkgqSgoI2UCaqWaSFqymXIayyl7cHTWLHOlp0uIKEwo5TAq04fiCSYziAABrVa8PcMbxfBFOX76gpRhJnUVMxHhPH8OCrzDXfikDUInzRWXKDpeDWjJ2x3IvFniQT2I2g0UFxZ3bYRcIQqU7GK5Fb8WO2rvw2INOMOj99PWrJZcQtOoSeaDpvNRww4TfTLFfcF4BflTrKAyvcKbME/Tag6uDsWsHAqxvEuJOoSoa0Rs8VzHMHdPQ0at7ouDMVAnelSXyWYtSeEALX463lu8t3EEDU9K5pxzi68W4oYs2itbFsrmKESSE6x9TXV8dxBdtZ3DzjgACa5hwNh7eM313ir5MOXHKbJ6pGpI9JrOq/u3fwWb26q8IrnCl5xDcY/c3l6zctW7mYqDg0I/DAq2JccC1OhUz1jej+KYK+9cqdbykZdo0NCFWN3bZlOs+Qb9hWxOpmXCaxywv4d4cu/xs4g+gcu0GYCfxzXXWrlSUA5qoHB71vhuEoBSErfVzF99dqs7OINqT82h39qzrll4Zp0LbHKDy02l6gt3tq24D5hOn60Nc4aaTLuGX7jKzJyOGU+1YHkEQkwAkUvmlJBC1GBAqtKr5TLKnjsgvftnDwFXdrnQD8zetbGO2ylhLqyhcR5hBmirF+4JEmTAM9aVcW+FYgmLyzbUY3Gh/Shw12TnjgiJu0OIBQ4lROkSZqr+IfHY4I4dViKEpXcOrDDGZWgUep9gJqw3XClq+C9hl29bzsM0ia4v9oSyuVYBbYG9iLLt0m456EtqlSYSQQrtvVnSV+rcotCNXb6VLZzbFMbveIHl4xit0bp9/XmKMzroB6CgOM3gDUI8pA2FabbWzaW7S0q+7bSDl2zRr9aH4osZSJMgama9dxGKSPHyk5PLA76ipYCtaSlpbjiGm4KlqCR7kxWlnMompuE8tl9y/cBKbNtTo7FZ8qB/wARFJY1cjvE94ly+TYNKHJsEBlMdVfiP1VNBhqNKUvzFSlKzEkme9ISIpUnkYsIUB+lHOGkEPzIE0EAnpVl4fYhYURAA+tNpXORVjRZEuZkqZ0gGCO9RMSeDCEtFYMD8vanXAVPFIKhkIAJ2NCMbfKXFDykpI2q23gS+SM8+VSkkkR+dCLtYMwAB71L5mqtdkzQ10yo+bSarylkKC5EgiIonhiQmxuXPxLytgjcDc0Lj1qy8P4a5c2jcI0W4pXvFRD3SDnwuBzBOHHMTfQtc5QfMBVvdassAZS1bpSlcHUxNLT8Pg9oGW0o50a6nWqzf3T907K0qO/WrGFETlkPFsXfuHDBIy6b70HVzFySSZMfSj7WBrf86m1BJE/ntRBjhtsf3zchI3NC4tnFXYsHnRJ661NGCqdQmASIO9WxDGG4e0XChKsg06VAucbs2My0qRtCYG/cV2xLshor54cc3UIEBU+lQ37NNsSlatehqbfcSKWFBkjUR9KBP3j1wSVLNBJx+A1FsWp1ANJN126VGPqawdqU5DFWh1VysiJge1IzqUIzUgjXasJA2oJSfwGooeCSaUEaHNvWTFYFwIImetMwByYlqTS8ihsK0lwDcGt84RAqQeWbEDethSSfmNMlyNCawKA2VXHbWEGLJdwCGxJOkUtOEPndv6imrDEHbYlSSNtZqy2WN2bmRDjSNhvtRRSYGGgMnClRGSY3rQwk5SSkgjpGpqzl1h0BIGm2nr2rFWqCAthRM7g7zTVFEZZTrnDHEDNy/LMbVBct1IMEQJiuhJs0OJUh06ncETUO9wNtSJbRPbQfnQOASk0UplRbXmCgCDM1MxJHxjCb9tQKkwHR696Xf4a9buKCkbT0pu2c5JyqEpIAUI3FA+sMLPOQbt9KVMjSlXDQYfLZ2G3qKTOoIpL4GfGTeWFCB9a2nf6VkkVoKIVMaUS5IJTatgNT7U5qUnMQBP1qOhStZUI6Cl594ijFOLyOeUkeaai4iQp1KuuWnwrudRvTF9CihUdDUSeEHXwx7BXuVfIBgZtIpl5JbvHW+qXCP1pm2c5Vy2sjRKgalYiT+0nVRGdQV+YBoU8rAxrDCFqpJgLVAOm52qWOLHMPJtUWVsvlEjMpoEkCoNrBA6HQA1AumXHb10gTKpOm9Nk2liIqtL5DK+O8RJlFraCDoeSKlWniFiqClLrFuRto0AaD2OBOvqGduAdj/WiV3b4Rh7JbKQt0jorY1Ed3yzpSj0g2eOL9QCipAEQBAFG+FfF7GOD71V5hd2kJfy/EMqHkeAkgEfXfeuZLeW+TyyENjSTtRHDbawaHxF8wp3OIabIOZw94GwopL1l6clwRCU6pb08HtXhHjG3414atuI8OaUhNxKXGzu24nRSfz/jU14FRJOs6xXm7gXxWxTw6wJeB4bhVo+H7hVxluXFEt5gAQSDA2FdFwfx3w3FbdCr7Ari3emHCw4laEj94Ewa8rqfGXwsk4Lg9XpvI0zhGM3yX64IMnNEaREVEublhnUrmB1oZe8W4a4ym7t7hK2lgFJz6wfz19KG29txJxM5lwiycSxmym4dBSgf1rP2STw1yaHqQksxeSZf43btoOZ4AJ2g/zoOi7v8AFnSnD7V14qIEgaAe9WjDfDeytFfE4/fLvngdGwYbH061YkfC2bYasGW220iMqREVDaRCjKXZWMP4WvUNJcxN4JnZCegrmnGjNlwzilwHnShKyVoBO4Pau0XN3lQfvPYTXG/HPCf2hhLWLteZdssJWB0Sev51Z0UlKahLplXXx21b49o57ivG6IUmySY6GKql5jl3eE891RzdJ2ptu1eekhtRHtUxrA7p4wGvrFemhVCrpHlZW2XdgYvKWokJOqqk2yHhcNvJbJKFBUajY0ZTw5cI8ykDeYHSpCcIuW1AL9jRzmpRcSIVuMlJnRvEK2asFcJcRWL7aw9aoDqmtCnXY+oroJxEXGD298VAlbYCif3h0rh2J4ndLsLOyfWFNJbW2kR8qhqD9QDXTOBbtvHuHPg1PZVtQoyZ0GhFeX1VMqkm/uen0tynJpfYCY5xEpKwhuVrWqAhOpqFaYHjGLkPXzhtbdR/FqSKt9xhOE4WgvMsh1+dHFnWfb+lItsKxHFFffOhhHbMAo/SrlLjJLDE2VST5IFlgeGWp5Fham6uSIKiJFXPAfDpNy4i/wAceBSPMllOgFO4Fg1vhxCGmZIPzHc+tXOxS4+43asBTi3FhCUJTKiTsABWxpaIw98+jPvlJvZDsVbt2tk2Le2aS02AQnKAKk4bZ3mM4gzhmHMFx98hKRsB3JPQAak1e+G/BHijHlpdv1WuFMk+bnupU9HYNgzPvFdh4Q8JuH+DkFy1C3bhYAduniCsjoABokegpWv/ABDptJBwqacizoPw/fqZqdyxEq/Dv2f+GcbtDY3GMXjN4WVLN5mHLQoDQ8qJUmdN5NcQ4iwK+4cxm7wLEAlVxZuqbU42ZSobhSfQjUV6sxvGLLhy0ebbCUqKcwUlEiBsn26xXm/i1y84q4vu3sMtX725eCElLLalkqCY2SPTvWJ4LzV910oXS4//AA2/NeEpr06sphj4wii4mh34ecuWCZEb1z7HWeVbqcIhZkxFd4X4PeKeJ2vNs+Db9YKQpPMKG5/4lDWuLcaYNi+EYjc4Pjlhc2N7bKKVsXDZQtGukg/xGhrR1uqrvliEkzP0mjsog98cFSwhKnELE/KevWpVxa81QJAQdd9KVY2qWSdNDqYI3py7Q46AG0k5TqZqtU/fkdKPtwyTw3ahm7Clr7CDqK6BbstEBZWoCI+X8jVGwRlYuEL5ZOu861frJjPBfGUASEzrW7p5+0yrofsPW7SndGzKe8UQRboSCVH3JESKXbIDaMziAlIEhI/FTVw8laR5SB+76U/exWxJDT8E5vwjUEnoK0EkAE+VveO9L5PNSHVg5QISJ3rTiYaKnHAFdt4rt+CFWhpTiXyW8pOw0006U7eRbMpZRAcUfMYmpGH26G2VXTqkneNN6gkfEXJIEkq2zbUMZ5fIyVaSNWdoorEEwd4qbesIaaS0jU7mRU21YShhxS0gAaA1GaQhxxRWnMqRBmluzLHRpUI4ITiEoSAFAz0ioSWVLJhISPmgzRB9wrdKHGoUNJJ2HpSeWlSciSVJolPCFutNkD4QqUQkAzEQdqmW1mEqOdSRlGg70pDRbMgbdKWA7mlFuZmJNDKzPZypUSbbshMrQlKQBrImpbCFKcgqzA9q1YsuPpT5CNdAe1TS0WHuQ2fMd9KrOWWPUMLJItEhKwhIJIiTHWrThgGY+XzAjY9KBYRbLSkEpgEnUiZqwWbcEHKSoj2mq100NrgWvDGmygKBGu/rUwNpCVzr5dN6jWDS0NJQhME1PUVBaRkOUjUdzWbKzDLyrTRWsWyKMlWqhrVOxS3CSqYiZ33NXXG7daFhSBAIj2NVi6Y5qyCJCjtV2meVyVbK0nhFTunASEE6EASB1oY40CohLiyBvrRrFGE27zjRGu6ARQ9bGdsPMqE5YPvV2M0hHp7uGB3UJWpSViCnod6hv2aCZkidRppU69eBgOtlCh+IDrUJYedRmC0nTQAVYjY0uCvKlZ5I93ZpbT5DmUTvG4qMhsrVkWsnN9I9KmpC0qCFeUnSZ2NM3CkoSFIaJXMjWp3ywQq0hDiPh3UvAqyp3MdKVcW4eQbi280pkjr706hBftQXm5MHSYp3CLYqeW0CAY8oJpbsS5GxrzwBEKW26BmAKRI9axxCW1FwAlCh0O5NTMStlNXElHmSqDpWNMtvNrt9EyND2NMjamsi5VNSwyKh1CR90oaCFTtWLtG3EF5mEkalM60m3bKHVNrREeU+tOqS+CV26gsp/CR0pjmAoY7IqW0rBEgrnQT0pm5scxzFOsfNtRd6yNwym6tvmAhSIgzSWVltMPgKHylKhUetxwF6Kl2Vu8Q6wwfLnkdtqB2zNu46SthTWu42Jmr1jGEg2y7i0dzpCfM2fmA9O9VFtguFRSuJ3kRBrO1Vu5cFqija+RL2D/dlYXmESIoSjDbht1XLbzg7ydqO87k75gUjUd6Ta3CluKCSAJOlYE5Syayri0kPYOwlDgStcEDUEUeNql1IgnuDG/pTOGsWt0gyMixsRU0oftmiknvqK2tBa1ApaylNkZDwSFMPJBQowP6025h8JLtk6JA1BNOIYDjMr1CjI9KUlhTQPJc0jXStX1TN9D9iD947CHtweulMO2biDmEwDNHE2Td2nSEuJGk9ajFD7SiFpJCdCFdqYr0BKjHwVbEOHcNxIh0tJauEahadJ9+9Crnhm/acDpabdQkSFTFX8WlvczyRy170hLa2VFL6Mw2AI0IpVmyzs5U7Vwc+AtFQypxgEaK2n2ilXODsCy5ymUrQuYKYP8KtuIcF8PYvmdFt8O6TJUgxJqiY/wAMYrw6+l6xduDaKVuJKCapSunW2pdES0rxlBDCcYbw9pDDSglKe/SrPh/FAEQ8DptNczvcKx1I+MtkpuEHzHlmmrLGFsKLd2FNLBGhkVVcs8oOPt4wdgdRgGNtpbvrRqSTrloDiPh2W5uMBvIT0bOtA7DH1A5pCkjbzVYcM4iUFA5iINQkM4aAAusZwZ4N4laOpCTGdIJSfrVvwPG0PI8ik+2aaIs3tpftw+0lwf4hSGeGsLDvNYUWirVQSNKRqZba2yxpoZnwVnxNxrkYMphAlbwgR3NA+CbW5t7YIZEotWwDr+M6mh/Hl429xH8KpzOxa/eKMwPLtt61e/D9qzt+HEuXK0826PNXJ2B1peiq2Q3P5O1Vm+e1fAzZcQLefcafbjINZO1TLd+1xV1Ni0oZnDlI796Rh+EW13d3bqFgBRgHvUnhPAFW2KXV+4SUtjIjsSa0ZXyjHJRjSnNYDd1wfcrQFYXepJQkANr2MdJqv3iscwd1TeI4e82N86BKf0q72jxQopBgDQ0UDiHm8joC0EZYIBBrInLLyzahWscFDwvim3dQklxJIH72v1FH7PFmXl5Uu7CakYhwBgGLLK22VWjxHzsaH8qpfFGFu8DNm4dx+yfbAzBkupS8R/sgyaCCc3iKCnitZky9oeS8fIoGek7RQ/ifi3B+DMN/aWJuElw5GWUfO4v/AA+nrXNP9L1phiEptLdy5dgkZvKlJ7HqapPEHEF/xdc/G4tc8xxoZWh8qUA9EitXSeOnbLM+EZmp8hCqOIdl7xX7QOLoXGB4BbC3yEH4hZLgWeuhAgb1wvE8cxq9unXTfOXfNWVPNO/3iVE6meopbz1zZ3amnVZ0k7HaPWsubJOIOs3Fus8xC0iANQnqK26tJVS/7aMK3WWXfUN3anUPLbQSnWSJ6xvVdxF5biyT13irBiKihbi1KBPtFVa7clRgRTbOOBMFljNSHXeThybcb3DnMV/sp0SPzKj9ajJzKhITKiYHrSr1xLlwUoBCWwG0yOgEf1qs3gfFDP0rK0YHvW6WghTQlwCauGCpSgJcB9Ij0qqWiZdETM1arMoaSAtSojWN5q1SsIRb2EFO5niohKtANaBYhy1uOladTsaJ5+X5sxE6T60JvNHzmbUAfWmyfACB6tEZkyfLrUM671JWU5SkGCDEelR4GtV2MiIJ8u3pXW8DslWmEWdu22MwZClkjYkSf41ydKRt3MV2G2faLKGluRAG4IEx3plGG8ksh3Vg684Apw5EiTrv7VlvgjaVEPqAyaid9etTV3LYQSlQynywPNJ/lQnFMcLCVctKgqND6VYeBeEELy8w3D2g2lxCiddDtVbxDiwgqbanrl7RVZvsRfuHi44smRMVAU4tQgzFJlY1wjkmwjeY7eXEy6UydQDpQ1y4WvVSjMzvSYJpQQTE7GaU22GsIZVKjWBBp9LZA10rFADrQ4J3ZGMhrMpFOSDIpJVGgGtQ0TkSAeorZkjatgqOka1kKqME8m8wOk0qTI1prMQYrM/cCp3EDhQSNTSiwRSmXAkjNqO1TEctzToelHkByaBxaIOorWXtRM2yToRH1ptVipXyifrUMlWL5IMxp3pxt5SNidKeVZLBCVJidaQu3KQfSuWSNyYQtMTW2Qc06fkaLW+NrMKy1WW2ykQTE1JbcUkZQaNSwA+yyHGSYUVQTU6zx5mA2+RHy61UVKdWkZTNKZRchQySBPamKWSC5XdoxiKFFuNdTpJqu3mCOMlQSYganXWp+E3FyhQDiQI/U0Xulhxn70AEztvRYUuyc8FBxK3XkQ6pMFPl96HE7AmKPY1lKFhJJHza70DSREzVaxYYyDyjDA1kkVutSNdaUCOtBF4DFZwIE1orjqD1pOUkkjQVtCCToaYQxTZJ367Vq8mUAn8NPISImBp60xeGVjbQdKGfR0eWRxPf9Km3hzrafj52kn8tP5VD/DUlRUq3ZPVBKP1n+ZpcWHL7k63gJzidO1TEv2ybkpU0TprrUNgkI101+lRbxa03C0iPpVjOEVksvASvMbUhs29mAnoVDtQ1q2ffcSFKJUo6J7j1pCHGxoElTh6npUxu8VYtfdxzViJIqF7uwuY8IN27WBYLbpexBPxD8+VH7vsKjrxp51wnDrNLEmCsiVEdp6UJCCVc+5XmcXqAdh70StLhNukvOCVTomNKapfYFhaywh26Iev1ymcyQdEn3owpaWUJZZdypEaJTt6DtVaRjF5cJUkE8saHKaUm5vVHKJVl0Ou9GmRu29F64ex64wK+Zvba8Cy0QotXCA62s/4k/wAxXdOHfGrhnFLJtnFHU4XdJABSU/dLO0pI2HvXmC2ddbgLSMyxoCaMWjC5S9dPobSNk5xFU9RoKdSvcsF7TeRto6Z6pRiljftc+wvGrlA1C2lhQ/SoT7xTm3kGT0NedWeIWMPcm3xNTbmbRTbhTPvFW7B/FNbOVi+f+JQdi55VA+43+tYWp8JbBZq5NujzFdjxZwdFvr9KE582kbGgmKC1xTDriwWEqRcNlJkT6/yoE9x3gd6+lv8AaKWRJzLWhWRA9YBkUas+IuAbdCSnF3MTeA3aYUG59JArOq0eprn9Jbs1NFsGtxxN1CbV5duUJSW1FKvzp1m9yECDIMSBtU7jXC3LjiC6vsGs1qsn1cxIToUntG9A+VcNpAdZcRG4UkivT4nKKbR5niDaQYRdtKMzl71GvL9lMwoE+1QFh5tueUuB6UW4b4H4j4rcy2tsptgEZnnJAA9O9C048yDWbPbFcgS7u3Lq2Ww2Dnbh1IAkmNx+RNdP8KOGMWtcSQcauhhmEXawTcLAKwFCfKn8Suw2/hVq4a8LMD4aQl9bQv787OqBgK2EDpVO8XOKF2XE9rg1k6lSMJSFP5VeU3ChqNNPKmB75qy9XKN0XCJuaHSvTzVlp7o8PLjwp4Kw9l7h/ArFNytIC7t9Kbi6dUdpWqSkn91IAq3Y/wAQcA4tYrs+McLwq8KwUlhbKFKSD15ghST/ALJmvBPh94t/frXimJpt1WrDi7PMTAeywiSNgN/pQOx8S+I8QUn4i9UVZpV5zKlTXlvymqhJy3co9pTbpL0o7eD2ViXhR4WYjh9wnhfEr6wvsqlMF67DzPohQKZidJB061rw58Mb/D7ZON4upy3feSShCFBC207QSQdTvp0rznwbj3GWPY9ZYRYvPu3F4+i3QM5gknv+v0r3db4a/Y2jTQfSUoaS3mUAdgAZB9txSr/JayFT085cMc/FaOuyN9ceSqqtWsNcK14nfpiCnM8y4Ega6Sik4v4rYXg2HPO3F7zVNgRJTmzdNBpVe8T8YXg1m/cfFNIXlJVG8Qek149498S30quWrZ/OXSUtpzk6k6fnp9KztLRO+WI/JeuddcVOw9P2niD/AKQnLvmXos8LtTku7hJErXE8pBOgUep2SNas3g3jljjlzfJwCwbtcNtrg27LbXzOlJErWonMTJ3OleMcO4qxDCmLfhTClPOuOIbCEAwXrhwySfdR/ICvdvgNwJZ8B8E2lk6rmXP9/eXJHzvK1VHoJgDrFHdpJUNrcw3fXbX7UdqtEpt8LUrIkrIjvXEPHrhLCuN+ELwYjboRieF27lzh12QMzZbSVFoq6oWARB2JkVeMT48tbV5WHi4SQkwQSAKr14zh3HWMWnCt0hx+2v0uG7DThbX8OEebzjVMyBI71ELnVNSizNdCnGW9HhSzw43CSpIKU6FPr136inLi3WlMqAA2mK+gZ8BfAXBMPS3/AKN8OcEBIUt91xwjuVFUkjpXAPGTwT4RDN3jHhgbti4skLdfwh9wuhTKRK1srUcwUkAnIZnWD0PotP5KrcoyfJiT0FkouUV0cHwVhQukrz5UjZIir1ZsNrTzrhSsm4SOtUnAnlu3aVEFLCfPIMz2FXVi4cfh9wFAVskJ0A716rTz4MG6sklaUnMtQgDQTBilMNJdV8Qoy0nSCdTUdQVePJQ2TCd9IFT8zAENKMN7CNFGrW8qxry2MOPlJMAAnQRtSFMuXLoOUhI1MDSKkM2odcCZJcdOaI2qXchm2b+Ct0ydnCBvQOz4DjXwDlrzjkoT5EiAR1mpdrh6kbAJUpPmV2qQxZtsoCUpJWoyIqdftotMPKAoBxwaCNfWlSt5wh1dOVuYNvLhBQLK2iAPMqJ1qKEoQOWiCobmkEKDSsoOZaoip1tZpQylB8p7xtXbtpON4NVblZUp1Wvp0pTTBUqAoBWUwT/OpS0pU+oFIOX5fbtT7Fu4VQyygNjck9al2Y7BVXJAQypSjEaDXuaftm1POgBQCUaq71Pcw5zLm5oBAJIG0U1htq6tL2eQScoIGpFKdyayMjVh4JhuWLZgurT5U6DSt4e5mCrpQ1XqPaot8hQdasUJOXQkxUxtpCFAIGbMQmO1AnhZClGT4LBYNKFq2ZCQTmirBhrRLiNDMj8qGoSnI00E5MsAQN6sWE2qC62jcE71SsnkdGGCz29r8pKQCRA0qU/auA5UgSQKk2LDZQcgkgwalXVuQpIy6KTqTuPas6U+S0lwUrGmFcnKswUmZqn3yVNqBSoCD2q/461La29IInbWqFiEJzkmBV2ieVgq2LDAWM2p+KS6YIO1V9TqrZ9TZP3a+nrVpxJQcw9JRPkMg9JquYjZqcanLJy50lPfrV+uSfAmcMPKI11aofTqE7HegLbDqHQ2gnRRBn0qwYYv4lstJI2/6+lNvsqF4lCGT50mVHYUcbdrwc6t/uAVzbqYdKo0VqT3HWmnLYaQogdParBdWd22gqW2h0DTTUxQ10pCZS0SRuI2piu4wLdGHlEVlC0t7BSUk7GK0EqQRcslQUNIFTbdtm4ZMNFCk/h71Hu7Z63caebUChRyrST071G5SfIWzbyjd4prEm+ahIDqPnTHzUKes3LdfMTMJ3FEmiLS8zgjlkzm9KIX1stYNw0jMysZgQRQ7/Tlgn0vVW75K6GU3yQpH9+gbD8XrWJtlODKklK07J796kLJsnw+AcqgFDtT10La4T8Vb+VQ1UDuD0pvqClBfJGtnHWHeYokKSfMk1rEbKUqvLVcnQkDpUghL5Dp0dA1H71NFxVuoTGRwAAULlzkONaa5B3xK+TmbJStGih0oRd2QuEm5tkFLkytI/jU/GUrtbkup0Q6nT1qHhlwQnyKjLoJqjq2orMS3p45eGRTa89AXlJJ0IPWoLFstt1ahoRvFWDEmkW6E3aUqQl35470NdVcWxAKAtKtQodqxnZl8l/00ifhTa1Zwkx/OjKrVbjWVSgpJ0qJhlsyAhzMdQDtRxgNLVlJOm1aWls2xKt9W5gtNq402pp5suM7JUBBTWMIFvKGylaF7g0WvWnmIUyQ42roR1qNmaUVBdikgGSpCoNaStzyU9mOAY82EvZULKNiCDtrtUxltu9SUXQ+9mM3epD2GMXDKl2q1pKdQlWlDmFhtzl3CkpcB1BNGpZXHYtra/cKucMurJPODeZJ/EJ0pTLtutAS6ARO6tKJsXzaVBpxehGoUJSR/Kk3mEW9wgXNmQkAg5dNT6UHq4+oYqk+YA65sQocxhUAa6UwhJT92+gOJVoQqCCKdQ+/ZukLMakEKEiKUBa3igWfuXRuCdFVzsysPknZzkA4jwew7N1gbxt3wM3LiUKPY1TsVs2nVqsuJcL5C9g+lMfqK6WC5buqQ6iCQRm3EVHxUWl43yrthDiSMuokikuOXmIFtSxk5LccFYtbj4rArw3TW/LV84HpTdpiD1u4GL9l1l0eXKrTXvV1cw1/ClF3CXiEA/3RVuPf+VRsQfwXFmi1jNqhl4D+9kIio9yeGUZRS5QjBsVStQSlwxAkzoTVqdvkW2Fv3RcIypOk7aVyhxdtgmIINpjLFwzOqUkkpFE8X4+s7rC1YdaNPlShBdUQlP8AzqvdpLruIodTq6quZPkpF/dKxK4v75ZP9pfDY9EjerxhOLWT9k0xbvqAQiMpO/rVEcWyG0tthSkpSQTIBOus0zbXK7JYXaulARoNTIrTXj5uCi+DM/OKM3I6pa4r+zU5lXrbQVOrio6VceHuIMIuLNu2tMQYffOq8i5Vm9q88YliirpBQp4qXtqJn/nUXBb9+2uwlKikj5VZiCPyrn4vMcbgo+T2zzg9R3mOYbg1uq8xG65bc6A6qWR0AoA1428IIzpU3iCFoJyoLA83aNdK5O9xDdohy6ulXISnIOYSSkR0J6UNub/B8QJ56uU4QIJ2muq8RVj+7yMs8vNP+2Xnibxj4qxnmMYY8rC7VQgIZI5ih/iXvPoKoDlwu5zO3LjinCokrUSTPudZpbCgnMwVJUlRISsHrTD/ADgQttSQk6FNadVFVKxBGbbqbbnmUiI44tlWVDgyj5RpJp5h+0dV5kltaeoVoaiPuIWDoQRuKZbCRKisJ1ka707JV3cjmLs80A5wop2X3obZOkvpUHShSJmdjUx68dR9y6kGRoaFW6yjEQOWVCCZNDwnwd2ZiNwpefYzVedJUrWZonfvBS1ELOWeulCirUxrSbGNgsDjByqz/wDlpUv6gaVHExuaeGYMrMaKIT/OmBpSGx0TDPUUqtaHWtxJoTiXYJPNCk/TWrOzkMDzKJEQRVcsBldB21qxsqKQAATH61cq6K83mWR54hLYQUAaTBNArxzzlSSZHSaMXJUppJRBBOgk0Ev8wcyqP6RRTBRAcJ5itdTrSdhJFYvzKkEnvWiRO9V3yPRJwy1XeX9vao3cdSPpOv6Vfr66NvcEoOpnQDpVb4KYbXiD12vQW7Wiuyj/ANfrVhv7IPguDSTGqelPqjiORc2MKxOCkJPXrUd8m6E5jqCNTt7VGuWXW9QYKfSord06kQFgbiT3ot33FZNOYRzpKBJOgHtUR3DC2O3Ueoozb3yCYcUVyBmEx+tSuVbPDyKSofh6EVDimSpYKkq3yeaCQdKSciEyoEirNc4S0QQDE7E/xoe9gDh/u1gmOtA4MlPPYEceH7hplS1K1iiTmEXQIBSDWDCXuu1DtkGpRQLAUZ0ilpbUqiYw0IjOQNa06y02Y00qHH7kuxPohJZUlOYxpSFCFEelPOupEhMVFU4e5oWSssQdTWgd4rJgTWutKyNFAnvTzb6kEGdqYmsmiTwQ4phS3xDzQoCiTV0wtSZVAAgxVZBI6063cOt/Ko0xSwLlWi4t21o/lIWJnUTTpwBpYzgCD61U2MTfbM5qK2nEzrCpOWP4U1SQvY0T3eHYzZSNdhTA4beKxE66iRRK24iYcy5ymTJBjY0Sbvra4BCHUDyj6GjSTOwgSzgDLQ5jmsH6UQt7RkmOUTrGoipKHG24Etq99RTF1iKLfOoaT5hpUrghrBIcs2WEl1xSRlG4oDfYmUuK5apT0PeoF/jtxcbKA9BQwPKdOaT6ydJqN66QLTFYk9IJOmYH60NRB+YVZrLh5eM4a+4m6S24zBRI8qj1B7dNaAXVlc2DxYu2lNrHQj9fak2ReR9fWCPHm02pXWelZB3pQTO+lLwF0YETrNOtpIA8sxW2kAjMQYFOKTkjTUiRRgN5M0TtpUO61dPsKlhUqGgBnXSodwordWqOpoZ9EwG4pxOrRT+6oGmjMUtowFDuAaVFjmuAiwTlBGveo2IEKu1lJkaRTzBBTBJMCdN6YvBFws5iYiCd9qfLoRFciWChs5lHXtTxIEOK1J2qO2EznWdaVzMxk9ahBSWR1boT5lHU1IYdWqXFxl6+lQFkKVHQU+VAJA3nepzgFxwib8WkkNsryjcmYqY3iiWpCFk99aBZyO31E0pLhByhI3nSiVmOGBs4DaLh11U5sytwAKkBFw4QSo5e5NDbK6DC8wWFJA8wV09qkXfEGZrl2zbTY79aLeAochZqxZtxz7l1KArcKOv5VKavmFEJs2QQN1LAJHt2qot4g6tYW8VrA6jWijmJWzNn/ZiVrWNYGoolNYC2tC8QxdbtwLdLpASrUDY0bw7FcjCQVlKU7AKgzVI5kKKglSTvJohbX7BADiiCKhS5O5XRchxOptZCRClbqBNF7XihlxsC8Q26NvMelc8XdIcBUhWh9aSm8U2AVajb60Tl9zt7Or2OK4CzcNXbVlauqR5gh1Odv6irvY+KbVutq0fwi0ObRDdpKVKPTKgAz9KoHgJ4TcU+OXGDfDGAufB2bCQ7iWJupKmrJifmj8SzslPU+k19TvBrwf8ACnwVwhu24MwG3OIBAF3i90lLl9cqjzkuH5EzslMATrO9ZWu11NfsxlmtoNPfL+4uDwfxbxJjOEcC3vECeFeJMNhKW2Lq7wp9lhLqyACHVoCZ3jXWvNl5dm5Ut5xZWtwklRMlRJOpmvcH22ftKW/iTwPiXAPCtobzBLXEbRVxiy3TFw+24TkYTspAIMrM6jbavB1wpailtCSVyEgJGpJ2A7ms2tK33JYNidk/plyJXfG382ummnWpFhxFidupK7a3JjVKjpV74a8Fcbvmm7nFwWlugKDYElA7H1rsvh14B8PNXaLnEWBdFChlS8CQknrEfrVXU+Q01EcSWWaGi8frLZJxeESPsh8I8TY9xWxxtiybkWmHJVyPLCVLIiEj89a9uPN41ctSxh18FJEBaEpP1gnUVQ+E8OsuHcOasrHKyhkT5BEzvoB/CrrZ4wUoChMgeUE9I968TqtQtVa5dI9pTXKmtQ7Z5j8euF/GvE8XVa4LwFjN+24ggP2bIU0v1mdO0GuG8L/Zg8eON8TU9dcFXGDMJcI52LuJtkpI65TKz7hMetfRk4ypwJazEyJJ1GY7zI0n0FQLu7dLZcGaQc0gwPaJq1R5B6SpxhH/AOxF+mepmnY8Y+DynafZ1HhJxJw/xZxnxhhuJ3D90pliztLdzltLCJ5inFnpqIA3Ir0XxdY3isESu04qVYILIXa2lqgFKjlEKdWdT7DavNP2rvEcs8U4NggcU2bEF/MpZjMraR20qZwf4u4hjfDblliK1PXNi1mbJgAo6CesUco3XRjfNHJ1puuLxgmNceX9rfv22PXCUv2SylRVqCrvPY10Pwb8QXrlONcZOLQFPFFhYyfMWU6qI/2lQfpXlXEb97iviNzCrO5Cy85nvHkKOT/6aT1A6101PEacDwpnCMPTkabASVgAZj1JodRp8YUe2Mqs3pp9HqrAuKLvHm1LF2ZCp82oHpVb42xhjBHWb2zQFXC3UhTW4UqdPp3HauSeGHGvE/FuLDh7hQpZYRAvb9+VIZJmAEjVbpGqUDSNSRXqbhnwX4GvcPQ9j9jd4lcpRPxl1dKS5JGpSlBCUTroBVGMHC1RY2yUaY7vujxW9YWVtit8zbIysfEuqSkHRKc5iP4VKabfcUBqEn5YO/fSu3+LfgNgnC1o7jnAd5dKYYly4sLhfNUlvYrbXuY3IPSe1cqs7J5q25/wqpUPIAgmP6V9B0GohOpbWeI1dU1P3LghuJbtEclmCpfzmOlO2ltmAypIQjQRvTjFo7cFTjiQ2M2qlkJI9dakXeP8O4BbqVdYxh6HAT8902I/Wrkr4rjJTjXlty6N5W8OClAlVwUzO+VNN2r3mC1J8qjJnciqjfeK/hzZuKVecYYeSqSoNu8wz/uig7/2hPC60Kl/tp58p/CzbqMjsJiuc1jg5ygny0dpsEBQ5xCcqEkgxFA8QdVdXC3lHQmBr0rjuK/ax4Q5KrbCsFxV6NisJbBHbcmq1cfaofUAmx4RaTAkfEXOn5UqClHlo6zUVdKSweg7CweU4p9wiAdBmj660/dlxtORCRrMqrzDffac48uAU2T2FYciIhsBUfUzVeu/FnjTHv8A4nx1dgK/Cwg/kMornObeWgY31JYietG8jRnOkR8xURr3p9OKWLag2u+s20q6KeQP514uucWXcIld9xFdqWdcpcE1W7zCeI33ObZYXjykkz9604f1o8O3vgW9UquVHJ7/AFXzLyMrDrLiU7lC0qP6GnrRa0kqKdEdJj86+fba+O+Hlt3jzuMYY2o+R1zmIST2nau8eGH2h7hhCcG48cLjZ8icQQJKf9vv9KXZW619xtOthZLDWD0MlS3lruToCrK2ZmaL4RbNv3bYKdE6wP3qHYIuzxy1trnBX03tqUBYWxCgZ9tj71cMHw64ZCVKsHUp1gqTBJpcrElgtKMm8pcC2WCu4TmByIOozdatGDoTzAoaRvrVfZsr8vEfBvQZVomKPYczcoQEm3UCpQiRH0NU52LA1QeS84DkU2Ak6qkjWp16opWgkQnIdZ2oXgCks5EuZUkJg6Hc60au22IyqXOaSNKypWe4s7OCn482kqCjrmHQ9KoOKWqM60mQk6anauk8QWi7gJ+HZUoQdknQ1SMUwfEXnFZbN3YHatDTTSYi2GUV2yZQ805ZylRKToaB3jUpWylSSUKylMxVmtsMxBu7IVZuZFDQBOk9aA4zhOKC8d+HsHiFwQoJ0q5Ga3di3D2AO1S3ZX6mnSASBG2oqW+ULUFtkEpkTSb/AALFXXWXhhz5WpOUjLqNalt4HiuQJ/ZtwZA1yECmTnDvJ1cX0gFe3ZQ7C1wRpodJpPNaW3Dikk/lS3eHcdVevBzCrlSSryHlmDS2OGsWJJXhV0BBiWzRKUEuyEpSeMA6U2rvMJkHSQdKnpZt75nMAlaepnrSF4JijJh6wfyq7oIArVla3ts8poWTvKJ1hJ0NTJ5WUyYx2+1g25s/hny263LZUI1ojhLrIWvDSv7tXmRP6iplxZO3SMjto4kqhSSBGlAzYXLNynKlZyGQodRNdu9SPPZ0oOqSaJF7ZtkrZca2kbbCgaXBa3OqT+6Uxoaua3Wr1vI6jI6B8xjWhGIYA+4C/bWylwCdBua6u7DxMi2rPMUQnsOZW0b2wUFJVGZB3E9KFJZU+tbC1kCfKSNj2ophiMQw64I+FWpC5S4gkbdx609i+FoQhN7aoXC9SDpBo3Ys/sAqW1kCvW6V2zllckApH3a+3pVctLdLNypsylQJ361d12SMRtUuOAtODcERQdeDOqXkuEwqZbWCPMO1UNRcsYLdVLzlDPOtLhv4G7TmSRAnYetRf2d8MpVqpedCj92fWpL+FvhMRK09JGn1p61s371n4e5YWhaNUEnesSU8S4NHZuXInD0KtXEsPeTMJlR3FH0WAZUl5AUoL1FB2cPxB1JYurYtqT8rioP60ewe7uWUCzuglRGk5hWnp5+zgp2we7DEvLYCSk9O9DLFtL7i80hObYmKOXFoy7Cc6RKiR5t/+vpVh4T8D+LOK2TidnfWWHWYXlS9clWZw9SlA1I9TE9KurU1Vw9zKz01k5e1ZKkLBQTmYcII3CtqgXNva3CstwwAqYzARXY3/APiO1QUt8S4ZdFO4KHGp9OtQUeB3Fz6ygu4U0k6Zl3cifYCaVHyen+JjZeOuf8AickNohpuAQUnrO1O2l2WfuFSpskQIrrTn2duLyOWm9wlSDqT8QoR9CmmV/Z34rZlZxHCzOwDq9P/AE0UvJab5kQtFfF8ROa3Vsi6TnUJEyIG1CXbBSHM7JJTvtr+VdrsfAPiBJCn8dw5udDlStc/TSiH/wCD1bLdQ5dcRkpCklaW7WAoTqASdJHWq0vMaavtjv6dfPpFD4F8OX+IML/b3FGO2PDvD4WpKL69SVuXKhuLdpOrkbFWiQdJ3q6YLwD9kG9v2cMx/wAZeILV59YbQp5hqzt1uTsF+cJk/vEVYeJ/B7CeLrpLmLY5ijdpbsi3tbG0cSw0w0kQlKSBmMd+pJJ1NAb37KXhLiTSmryyxF0rSAXFX6/L61mvzkN/D4Hz8LKcOXyd0wz7E32eWst29hmM4026kKT8VjLhbWCNCAzkBB9zU9X2N/suoSSrwawN0q/E8p9w/mtw1S/s74pjXhLjTXhDjWNXGK8MX6Fr4au7lWZ6yeT5l2biuqCkFSPVKkxFd4uceQkKK1AZa1I69WQU0zz12inTPZJHmHxp/wAnp4RcR4NcXnhSyeDsdbSVsNC4cdsHyBORaFkqbk/jSqB1Br5ncX4RjXBWP4hwvxNhLuH4vhb6ra5tnkwptadxOx7gjQggivtq9xAy8uC9qdgTvXjz7ffgKxx9wkvxY4YtQriHh1j+3oZQM19YJ1JMbra3H+DMOgq9oPKbbNk3wUdZ49yhuiuT50HFVKMA7mmnLxxUqIIPb1qMylJBK4AA3kb0ldy2lMlWb1Gtel3Z5POtMkIuFZwoqjt3NOfFONrzEgkGhovgU+RtR9YpCrpxS5SyBG+ZVduIxzkszd8663kcy6aHXrTLtrmIDispVoBNBOdeqSHELa01Inem3sWfeKc7uSOiUxU5z2T2FXhd4aqEvmDuJ3onZ4q081ys4ASNNetVO4xDmplWZah1Uajt3akk5QBPQVG5Jk4ZaMQebZMqcSOo829QVYiCoZUKMDyyAAPShSrrmA7A76DWaZWVkysnfqZioc/sRt+4Sub513QFAI2I1NM2LqFXJXcFawEnQGKg80JO8etSMPeyPqcSCqEExQ7jtrSGsRUlSlKQPKTI9qgaD61Iu3Cpap76io5Pl1oJvkdDocWSm1QkH5lFX8qaETuKW98raeyJ/U0hP0pTGdGzEfNP0raUk61rfYU4kQNa5LJDeCTZkBwTRxhcKCoI7ga1XELKFAjeaNWTyXPxbiJ21qzW/gRJfJNecTlCUkz19KEXqsywcxIIip9ypszkXPrNC31lWhiNKOTyQiKtIHpUzCsIfxe5DaTymU6uOkSEj+ZpWD4W7jGINWLBUM5lShrlQNzVlvGFYctFvaN8u3aPlSNTHc+poIQy8hue0Jrw5rCrFm3smglmAVEkZ1+ppCbgOLBdUcg0hJ1oqlpOKYUlE+dtM7CTVZvybFAK21IJOitaf10A3kexMoCdHt+kVXbkKZUrKT9KkuXTtwQFDMk041gtzdRlbIHVShApUnuBxgBLuHJkKO8TS2L55JkOH0qzscIFULdfaSnc6yanM8MYTbthxxYUIlR7Vyg2Fw0Vq0xS8UoBaisTGtEk4ioKAchKN4jX86m3LuA2DIWltBWkHQnX0qs4hjSbhz7oBKI0A6VLxFcsjY30GXMSQAD22G9RXcWZR5SnU6yDpQBy9cIhKqYL7i9VKNLdoaqYXfxULWSAIihr1ypwyTqajlROpJrKU7MjFWoiis0kkVg1rR1FC5ZDSMPQVnWtxWV2DjKysrNO1dgnODUeprdbyk6CK3k7qrgW8ietKEjXasymtRG9TkgWl0p0BqZb4k+0SeYrXaoEA7Uog6elFGbRGEHbfHXE/wB6onpvRNjFLS5Ult8+WIk71UE6GnkurHy01TYuVafJd/8AMpOJo+JsbhCirXKND+VNMcFXzTvnQMnUmd6A4bj+I2C8zD6hPrsKuFhxy++ylNwEqgxJFMi1I7GOGEE4amxw1Fs0hJWreBuah3eBjEMNXa4ggJypPJUf9Wrpr29KIpx+1uBmLWo1Osa1BxXGWUWpbCvOqRE0x89kPjo5o62tl5bLgGdBKT70ttAMnQx3NKxJzPclZEZtT70wHFDYmqj4Yf1IfkAxsT2rCTrEzTAcUTqK2laiM0gE9KkHaPoIAJJ1jTWoa95jfvU1sL5ZUoDQQNaiOAkTNQwo8DKt4raDBIPatHfWsGqhSemNJ1sTllJ1imLxRVcrURB02p1ktgAuFQ9qjPKzPL1nWnSeIgRQmdNTNLEDr0ppW1Kk0vcE19hbYEyTSipM70zWbmpyyNuR3TcEUtvKgSs01PSsJJOtSpEYHFPqc8oPlG1NgToka1sd62CG5UNzRdnJYHm0JaAccME7JmsVdL1ykiajlebWsAV3rkzsCy44TmzE0tLrgmTP0psaaVvNA1qTsIdS+RALQ96n4XbXGK39vh1i047c3LqWWm06qWpRAA+pNCQRvXQfAnEWcH8RbDGrllDow5C7hCVbZwkhJ+hINKvsdcHIZVCM5pM+ingfwRhXgf4a2nDdqGziTyRdYtcDRVxdFMEA9kghIGwg9STVN+1X4+YjwdwJbcGcOXZ/a3EqVtqU0TzWrNOjhBGoznyg9BNUtnxqViqkWby1JSXUyJ1J9K4j478R45xf4xXbeCvLcXhDVvYtJQQ2UAISpZ3EgqWZ9q8vTRK25ysPSXWxppUYAvF8SS7wHZOXpc+OxDEFqbaUrKli3ZREBGnzOLInrk9BXUPBHwQKWmeM+J7OH3k5sPtlpktpIkOrHRSvwg7bnegngf4VL4jvVcfcR/2myt7lSbC3WmUXToWczhSdEoSrp1VPbX0Xa4o8i6NpbNLecUJcUDKZnXWszy3kPRzTS/5N7w/jd6V1y/gHO4IyyvI03OUEJJTIOv6frR3h63eYdyqQ0jKPKVab7ij+F2Ny4HEuW6JACmwkRlHXWlP4Q8hRXkbE7EIJJ0102rzTu3HqVDaF8JuApkB51wKCoyp0n116VY7Q2zKcpu0BAIGYkSTGxM1zh5vEoykqaCREpkkp6ET1qKo33905cvOKOpUgkJzesjQ0KTwSdWW9ZrbC13rICVASjSPy6/SoF/do5KjaXLayokGSNPX61zh1XkSLq8QSokELVEkHSPaqhxPizUOM4a6/zUEpK2lSnN6mmV1OTFyk4nCftQMYlc8crvrtOjraSJEzGkfSa5hhDWJBoWjd++htQIKEuEAg9K6hx3ZY7iqh8a6u4KZUC4Zy1G8OeA3MQvjcXLcot1AlExH9RXqar406ba/g83bTO3VZj8hbw14evkONs2jJUtyM8D5fSrX428M4jwb4fniMMTnfbZKwNApex/Ou/eFfBeA21vzVIQVxCjpooetdK4i4Y4M4r4fueFOIMPsr3C/IL1T5IaTlhQggyFAgbbd6wlrc6hWS6R6L0XVT6cezlX2VOF7PCuEsOukNF7nI5gcUiM6larWJHmJPXsAK9PO43b4fachLuUlOqTpr6dvauWXPHfA3DFkm0wS4tVclASwGgEthIHypHQCqIvxhaxi+Ww64UrjOnXekSUpzlP7nTh6kYp/B0viXHbRSuXcOFSFyHJ2CSDmB+k18w8UwXxSu8Qumbbii8ctEPuNsKcvlypsLISd+oivfHxuA8QKNjxLdPptMRt3milhzlulJTBWlXQpzDXvGkTXmHiXhl7g/iG/4dcuBcpsn8rVwBCXmyMyFjtKSJHQyJr0f4ecFuhLs8356lyUXDODkieB79DaXOMeKsSaznV9kl5hPosnVJ9SI9aKs+CvDdy0m4OO3t02sZg4hSClfsQNavtuhLo08w2II3/rUBzhQ27huuF8ROE3CzK2QnPaun/G2fl90wa9M4OLyjzm1NYZUD4G8KJVBcvlncffgSPoK2jwd4SbT57R5cE5s9yv+VWn/ADpTh74suLLI4U6vyougSuzdn/5m6D6K70dDSnEJezAtLjKtJlKh6KGhpqknwxbqi+kURjwn4RZgfsRlZ7uOKV/E1Ot/D/he2JDPDmHTESpvN/GrW5aKKVFpBlRjU00WV5tQkRr7ijdeV2EoxXwDbXhXBkI+4wjD0I20t0GP0opbYV8KEm2YYQEyBlZSP5UhKFogtkgHf86fS/dhICTA79zQOlDIyS+CezZ4w42SlDy05fw9KafwXEbolZDpTGxOUSfrSmX8QZBULlxqQNlfxilrXdK1W8pQHczS/SQbsId5gaEsFjEWEOpcGVSVEKSR7a1zbiXwTYuXVXfCtwLJXVhUqanuDun21rqiWVqHzEHfSnUNNJPmzmT0NQ4Y6YMttnZ5+w/ijxP8HMRU/bPXVkgqhSm/vLd4fw/nXd+APthcN4vls+OrR3Dn1Qn4q2UXGvcp3FTLmwtrppTd2yHEkHyqAUCPUEa1z7iLwD4bxnPe4SpzC7g6y0BkKv8A6Z2+hFInVXJe9f8Ag6Cuq5qeV9meueHuJ8D4oYZxLhzGLfEWdClbLuaPcbirfYKzXMKO43J/X3r5yjgjxX8L7s4pgbl062wc/wARhy1aDupvQx9DXWPDz7aGPYU+m041wZnFmWwEqcZ+5uE+pB0JqlZp/mPJar1vxasP/wBH0M4YLISqCCEAeUiSaMXSmlrWjT5QQD3119tK4Z4Zfam8F+LUNsM8TIwu+UAn4bEk8kgxtmPl/WuvO3zbjvxbDjbyVM5krSsFKxOsQfWsK2EoTy0atbVkcxeQBilwC84kFKSoZtDtXPOInlIeS6lSoV5Va9qvHE0sXAuc3kX50gbetUzGW0OhTOUFLxlJPTtV7TNZyDZBuPBVHLkNqC+atKkkEAGPeoeNt3DyDdWriioJBCZ3FOXNqXJKzK2pSRG9RGbi4tZaUOYmJykajvrWmopPKKe7KcWAnL9Ttw24lxRUgj8R0AqwMcR3DKW0OStsDQ6gio99glvfNl+1GRakylSdABQjnXNo6LS8yhYnI5EJWPTtT5RhagIynWw29jSyea06oKTIjNtUZGKXbqlDMtIT6nWhbl8wXlIurYHs62YrFqcUn+w3maeixSnSsDVc8hO4S+6ysuBxadYCSe29AzetWz4LTTjjogZf60s/tByVXd84oJ2QkwKYfbuUOIcEeYRAG9HCEVwRJ55Hbq7unbPmP2/LVOVGvSoFtZwlKC2c6lzA6etFLZlVwrlEggGRPQelOrDbN4yjdSlaa1G9R6C2N8shXKWrZ5IIVGYAwelWHBStkLZV/dL1Gs6UDxK3Wq7yFMTJkKkVNwy5DS0tOFQjSSaVYt0cjKpbZYEYtaNN35DYMHzSfWmbValF2xfRmQ6mW571YMStEvtN3GhIgb6xVcvW3GlIuG/9WskCfzpVclJcjZRw8kb4hIadslgF1nQZuo9KhN8i4ZVburIW2ZQoiB7VPxa1U9y8TtEgkCFjuDQpxgf36TmSkawN6qXrd0Nqk0JuW03CyzcjlvAAIWNAqoSFLtnQ04VZk6Ak6TU1xxFyj4e6X0HLcjfsCeh6VdeEfB/j/jIthOBLt7Rza/uhym49j5lfQfWsuaSeGXI5aygDhT7F5brs73VBHza6Gi3DvhNxHxTfItsAbK2AsZ7tchpsdSpXcfuiSfSu68HeAPBfDGX9sXS8fxEESlacjCCOyQdfqa6IbrDMJtRb2zLDLSAYaaAShPsAIFdHWqhYiE9M7XmRVeAfCzA+BbBAaZbvb+P7Re3LYK1nslJ/u0jsNasF1iLNiyXcycqUyAIEHvFAsd44tcPYc5r4SYMa6GuWXmL+I/GwW5whwzfXtrORVxKWminuFuEBX+7NZ9l07pZyaVOnUFyXnFOM7a6ecaZuEpETmnQf0oHa8bNfEupYu8+WM4316R3NcwxLgzxywy1ubm84IeeSdctrdsvKyz+6lUk+gBritp4scQ4FiN5hWJ2V1h7zLisrFwwW3knvCoqIaWVv0lmU64Ls9wYdxggtj4hQDk/Lm1HvU1zi+yWFErSD1B1ivHnD3jDdIsXsRffUsMmAY1Kz3ozhfifxFxA61huD2jt0/wD3j7qU+RlJPX+m9RLTTSzIX/bl0z0yriaSVW7sq1kK/jUljiFLlvnfU2hMEE1ybB38dUwHbq2LYIEle9T7jiPltpslAa6elVJ15eUGlgvtxxHaqzcnEWvL5SJ1AoUvjJVun/xKV5pAIMgj1rn1wgXKA5qFrOsK0y1XcUxJ7CrR15p0JSjVQmTptFHCpy4Im1HkuGN+JDtlfW92u481jcNXbSh8yVoWCDHaJE9ie9dzu+NrV9xTzd0Sy4yh5KgdMqhI/Q18+eL/ABD+K5za35cUjLMfUiuq4d4g3n7EwZJuQkO4Na5wPwnKB/AA1tabTzrhyef19lds8x7PTKuNLN2HGH0lQOmtMXvGQcHw72Vxl5shaFGQtJEFJ9I/SvO9hxuy2OX8RK1GVR2FPXviESTyVAkAiZ6dKuQjh8GZJLHJ4m8a+FLbgTxO4h4YtWgi0t7xTtoI2Yc87YB9AY+lUT4hWbzORXVvtO3oxLxAaxYNwq5sW0qjqUKUP4RXIFLHUGvb6exyqi2eH1Ve26SRKLoJEqkGsCUkZ0nr1qJmgyKUHVAydqdkr7SSh9aFeVUU4AzdzrDkGPWoSlBQ/WklxQPlMRU7jlE26hSCUmRFN5qlC4S8jI7oRsaYWNdBXcPkNCUrKTIMRTqXcwyk0wRO9YNKhvBO3I4qArWactVlJcIcjyHeo5WDuSaWx5i5rENk1G45oS6cyiSetNkzoOlLUQR1nrTYAG1C3kJLCFuxDffIJ/M0kaUp3XlwPwfzNaQJGtDLsIUlJ3pY1NaGmk0pIMxRxSAMIEVMsHPmSTECoqgUjQ609aGHUhcGTGhg0yPAMksEh5cajvFR3VA6iZ9amqSVeWJPQRP8KjXDZTOZChMQIijl0KRb/Dlhllm8vXEAuLUlhGvQan+VWq8wu0ulZASSd+knt71ymxxS9s+WzaZiUrKglIkmY7e1W7DuMHHJt71OR07Apg+9FCSSwFL9w2xhV7ZEuN3baBukK2Ird7bN3IAvmbc5gCFJXvUVeKc1Q5bp1GhAnWg+LXbuYqDhISYkbzTW0BlBl5eBWSAvlIJAMgEA0IueMbNtUNNFSIiCRvVVxG5eWopJP50LKlKMHWkSta6DjHcWO84uuXFZmU8qDoUxQq5xm+uQrmXSyCZiagEr2rUKg6RSJWyfY1QWBTjylmVrUonuaSoyP1rFCIrKBtyCxgwabCtddd63WdKDGDjXSK2Aetaj1mtgRRpInJrQbVnQ1s671uBBqGkQarK2D9Kyd6lHGATWwmtJpQMVIIqBWZZrIHTrSkjSBRpZOEgGNB+dbydacCQTE1hHngDpU4BYgIJBgClcvTUU4hKCkmNtxTzbQMdZ1rsAuWCKlrNO3anmrRaz5QTFTGmE5iVDfpRG2bbHlS1JijUcguZFt8KK0jMYjSPeitnhSGoIIkKAPatskpQSuEpGpJofinEXLJYtVyQImOtGsQRCTfQQv8RtrFJShaM3YigFxf3140u4Sy4WkHVzLoPrRDh/h9WLOi9xVaywT5WwYUr/AJUVxW2t763u3Gbj4Sww5BbbS2P7xzoI6+p3rnuksoLEV2Ud55Tqgs7ARNJmRpR/g20s7rF0MXVkh9MKUc8lKY9BR3EuC7HELdd7hpbtHUmCgzy1/wD7tKVcpLIe6KeChgqnpWwozqBU28wfEMPWUXlm82EnQlJyn1CtiKiKyJMiJHrQ4a7Jym+CUlSVMFJkHpUYp1OpPvTzboyZNjNIKkidRrvRAJ4Iq9FGe9JSYNOvI2Uk6bEjpTSR5h70h9jlyiXbqWI0BG+oqKTKlHuZqUhKg2ohUwNQKihCh5jNHLLwgYfJkelZWyRESJrQBVIAJjtQ4wEZWVkHtS22nHVhtDalKPQDWuIYmSRoK1VkwbhFzEnUtXWIM20kApA5ih+Wgq1O+GWC2jXMXc3tyEiVQpKP0g01QkyMnM0nKK1qrSrx+xOD2neW/aX6SD1uBr/6aPYbwdwNexybd5ZnUOPEx7xGlF6cmdvRyoJSP+Zp1CHHP7ttav8AZST/AAruNlw/w/ZpyWuEYelQ0zloLPrqoUSbaZKYbaaCSMoCEJA/QUXpHfUcJtsAxy81tsHvHAezKqJM+H3F72+DLbB1HNWhP8TXZFulAzhLi40Kc0CK0taUg+aAoaA7zRKtfJO05ba+FnETpT8S5ZWySCZU7nP5JBq7eFXhLjGI8YsYHa47gNu/iSOTbv4jeizZ5hIhKluCAT0HU0VS682oBI1kSfWkvuIWlZygqIgg7RO0fy9KXbQrI7UMrkq5KTPXHBf+Tc46+PbxDjPxHwnDm0kL5GGWzl076SteRIHqJqN4hf5LvGcT4pueLeE/FdN0m6uTcXNne4dyX8hieS4lRSVRsFACQKOfYv8AtW3WHX1n4MeJOKOXFg+oMYBiVwuTauH5bVxR15atmyokpPl2Ij3TzhKk5NZgg15i/wBXTTcM4NuLjYlPGTw8jw8e4Wwlng/DsNXhzNggWQacgLbyaGR6mSVddTU7B+EWsJKUNytxWilzMn+Yr074k8DMcWWBvrJgHF7REtQcvxCRuhUbnsfSOtedlcRWyEpSgpKM+VYOhCh0PXN0rw2vospsbk85PoXjNVXqqlFcNE9NmtA8qEgJQSCFkZe4jrUcsiSBCykSQuBl7mDqD6dabRxJYttFoXSAZOhEnaddJ+lC73iC1TcZrdCXlBIzBC/MROhE7x2qlGJfch+5sXQsk25VuAYI07wdIoZcWTFqjNcBRUEk/MFJI7n+lLc4hbfDmVKc4Gm2VQHUGdDVexDiHDn3lpGIqKgCOWmSlQ31G1PimLBWKpub99VqlxICjKZQMxT201oTiXDZtGgtx9KwuYg7dh6noalXuNLtVL5ORKQQo/dgKPaDMj6UBuOKWiy6hxK1KJUc2edT671brjJ9CptFUv8ADFrvS3mSkkEb+VJ7z1FWPhTD7Ox87ryUNtglRn5tv+jVUv8AG21FbTXmAEEncGhV/ieJhuGXFaABIB0I9KvuqViwVY2Qre47PiHi3hvDdotFpcILx1QCrQk6AfSrPwTxlw9xtwzc2uL3Tq27Vcu2qHS2l71cI1UDroPrXjfHHL5VwHLpxahmB1mJrpXhRiTVtdE3GIWzDLyC04t54JSlO4UdZkGhnoFVFSjyyxVrqr24SeDpHHmD4QtK7/h7Dv2fyVJaLTCl5FBWkEEnze1K4c4dbwixRjWOrUAtBNu1u48Z+UA7CNCTt0qjcd/aG4L4afGD8N2ieIL62czJWP8Aw/MAjMs/jI6JHl7mq5gfjRx7jd63ff5tM3SyQAXFkSNtB0HoBTXpbtm6Swv34Kz19Dn6cXn+DtXD1hjWJ4timPX7aygsJYt20mENtzolPfvPXeuXeMGFPXPGDd1bYi/YYnbWDDTj7ZzBUZiEOIPlWII0MQK7M14q3PCnBKrziXhHDsEuMraebiF8U26Sucq1QkqVsYQNyNx14Ji/HfAF1iF1iuN+JOH3V3cuqdect7d94uLI6AIAA0AA6Vp+E0+Ju6wxPO6xutUV9gVPEOK4CAOKcMliCP2jh6S4z6Fxo+Zv3EgVaMMxa0vbdF7Y3TFw0o6OtOZkn0kbH0NV5zxH8PmyDa3+PX6yfN8NgyxCf99QmkHiPBsTsjacKeF3HDF0VqcYvrWzbt4dUDC3QEq5iTAOVR0A0r0U5xh7oPg85CcpcT7Lmr4e6YWzdNNvNrBStCk5kqHqDvQn/M6+wpDjvBF+bEKVmVhtxLlk4ewHzNn1Tt1o1wJa4vfYY0zxHwrj4xNGVD6hb8hpCiJPzDX/AHavrWF2duy4UcOOABQCXn7g5RA26az61Unra1w0XYaaUuc4OXYLjbeJX5wbE7F3B8TaSVqZu3UpaWnqtt0kJUn31opcOcPWRjEOKcDtwU/63EWtPyJrvXh3iv2dMHsblHjZ4bYLjV024ly0feUzcltBTBbUlx0JTHcTObXar1b/AGi/sc8MAjBvCvhi15RyJKbfCWo/9aqFa2T+kCcNrx2eQ04twWteRniu0ulKEj4S1uLke33aCKnWds1fQMK4c4xxHWB8HwvdKCvYqAr1s5/lAPAfBG1owfCcBty3ASkYjatyP/tNmKCYh/lPuAWERaDBgRpl/aF45+iGAKn8za/v/wCAMP4wcAw/w88TcSM4R4GeJd3mGUKVgyGE+8rXRiz8CPH68ym3+z3xMyDrN9itowB6n2roOI/5TezuCv8AZuF2L5B8nKwm+fJ+qlJFAbv/ACinHbygMH4LxV0HWWeFSnX0LjyqW77n8MlL74I1l9mH7SVyvTwnwazSr8V5xYyrKfUN1YLD7Hv2iLnLzcO8PLAHfnYtdP8A/wCYg1WHvt0/aIxIZ8M8O+Isq9inDrNj/wDOQukM/aj+2hjhCcI8N+IyAY8t4yjX/wC0yDQ77f8A/NA5/df+GdQw/wCxD4yP6XvHHh7ahUasYbd3Ch6EqKRFWWz+wnx0kA3fjHZNT+Gy4STE9wVumuPMcb/5QXiWDa+HuMIC9PvsXvEge8FIqWjw5/yiHECcr/D2H2wWf/xvHHzHqfv5rnKT4x/7CUv/AOztTP2HblsK+N8a8fQqIzNYFZtgK7wpJ/jNefvHr7CXF1jhtzi2J+J+CcR4Za/eqeZsLWyxJhPUqTMuD1Son/DFWmz+yp9tnGl58Y4z8P8ACSsQS449cqT6R5qteC/YZ8d1rQviD7R+BWgjUYbwqhxc+inQmg22LmPZLsrfE5ZR87uKPAXxD4YUbvA7hrHbVIzJDQyvZf8A6Z3/AN0mrp4EfaN8QvD3F28BUp19hmUu4PfEhB/eCM3mbXH0mK+kXDv2IsCtS4/xr4ucWcSuuRmCbW0sECO2VC1frR//APAl+zU7iFvi+L+HSMZu7WeU9iN687E7ykKSlXsRRy3XR23xT/cX6kKJb9PJr9jlfD3GeA+JHClrxHgDwcYeSQUL+dlYHmaWOigQQR9ahJQ1fNPMN5XHGFbAbTrXpQeAXhVaYOvB+F+D8K4cClcxLuF2qWlBcRmWBAX6g147+0Knxi+zXeXnFDnAiMb4P5Rt0X1ohTqC5mzfEXKkea33CQlQy/4tYqlHTTg8RWTSXkK5rM+GSsStQy8Xir+9lKpEa9IoMu05yVIGilAKBO2YbiuR8P8A2wcD4kaKeKeHF2CFkZbmzWXUJM/iSe3euq4XxLgfEdgMT4ZxS2v2iA59ysFSAeik7j61ai5QXuRMZwt5g8j9llSv4RQhLhkR0PUUPxrDCqApEkDMFK7dKlKvS0tT3KK1AhwDqO9EsRAvLJFw2gyIIHpGtQ7JQkWI17o8lAJaczWbyIcQJSDupND0OPWFypARmSrYzRXH2uS4xiYRl5Soc/2e1JvLVt5vmskqCoUkg7VejNYX7lKUOeBTV4yGgp2EqOup3qK4p+4cK0wkdPWstWcyFsvfPGk/yorYW4UnIAMyR22pbxDlBRzPsYw4qTcpRkEwRMVKxLLboZvRblQQuCkakDqaSi3DVyh1MmDqetTbwl23WUufJqdKqyn7i5X0RbssXDAeSoDWQSNdaHNup+bL8hg69aJ4awi5zJIzDLmoddspsrwJKUjmAfTXeui8toCS+SwYZeBaQw6JCtBrNMYlhqWXFuCVJcASU9Qe9DLR95ICylXMZUTOmo71YwtOI2gcSvzpgEDf/rvVexumWUWa36iwVG3uE4bemwvBlt7lZRJ/1a+h9jSP2ZcfHmws2XXzcaMobQVqJPRKRvVkRwhiPF103g+FWan7pw8taZgIT++pX4UjfMa9LcEeH/D/AIb4O2sEXl6llKbvEHEDmPKGpCZ+RHQAanczOlTVamMFksU0zb2o514d+BeHcPWLWNcV2bb2ISHkofOZqzPRKUnRSx1Uepirg7xObi5XYYQ4ta2QOacwGnqarPiR4qOLUcIwtDrjjiwhlloSsqPQAb0Z4Q4IuLDBEpvEuO3t19/dqJISpZ/CCfwp0Hrv1rz1s52yyujdqrhTD39j13xHfYc08oqt0pH4sxcWo/ugDT6mhybXi3iNpD1uwiyYVOa5u15Eke3zKHsKsCcBtbFfxd7kWtJkSkKCPYfzphzFmi8OYtJCR5eaoqn/AHR0pW37jG017ARbeFOGXim3MWv7nGHELzFpscq3J7fvEDsTrXRsPWbdpu3cQ3DQCQhEBKQNAABoB6VWGuLrO2CWrm4QtRJhLaN/yola4nhl0ouMofQo7iDBNGpL4Ez3Ncha4RbOo+8CgVdU1VuLPDPg/ju1NlxXgWHYxb7BNyzK0/7KwQpOvY1ac7LjafNMiT6RTSV5FEMOtrTuUqOv50UZSTzEr7tqwcSx37H/AIUXdiLHCGcTwIiVzZXZdQVdylydP+poxwX4N4B4e4R+yLRIvWEAOLWkZXLp3qtwzvOyRoK6u5csLzIebUSRqQZINRbq3bWIaXmUBEHSistlJYkdU9rOHeJPEbWBZGXLT4dpUhIKP0nrXOMLxVKrld/cvAkgltJMZUjuK9J4thNpibamb23bfbOikuICxHSARXNOJvBDhzFFPv4Xe3mFOvJUSm3UFIJnohUx+YpMJQXEi7Ke5cHLcW49ZSkItzlASTlCtfX6VW7TC+PvFq/dwXw+4XxPHbptJDybNH3bE7FxxRCEfVQNdF4L+xhxPxdxlbWL/GzQ4dZcS7ib6Lct3Ia3yNiSnOqCAZ039D744Q4V4Z4D4cteFuEsFYwvCrRGRFuyiP8AfWd1rPVSiTJrc0mkrlFTyeb8h5OVLdcez5f4r9gn7UBtV3LXCmFPuLCjym8dti6nuIKon0B+tI4+4P4w8IcKwxvxD4bvcBR8O3a26rgJl9SEJCgiFEq67CPWvon4+eOHDngP4e3fGeLMt3l8sm0wjDiuFXl0RKUzuEIjMtXQepTXye45454v8UuKrvjbjnFXMTxW7MqcIKUNtjZtpGzbaRoEpj8yTXo9L456pLLwkeYu8nKjPGWwpacfYW6VHJcNpB0Upr+h61Je42suSSh3XNA0I/OaoraUphRQlJ2GUdZ0ra8jjpDqjCfmTOh960/6JQumU15i/HKKt4mWPEPE2Ls3dtZquENtnKpK0xqdoqlq4O4pBy/sS5J9AP612BB5IUMgBOsq1y0ovtI0TlhWoHWa0K9PCuKijLsk7ZOcu2cWXwxxA3/eYLeD/wC3P86YcwXGU74VefVlVdtbLTi1FxCco8ytYM9qGXOOrQ6GbYBCQrKTPXvR+kgM7Tj6sOxJEhzDrpPuyoVHUhaVELSpB7EEV2xi+uUZXHDzAZKjMAn0rWLYTYYlbm5dt2yCk5krQDr771zqOzg4ntGtLS70J07VbbzDOG2V5F2LyHAqCEvkJ/KncLwHC794MW+DpUDHmW6swPoaFVMF2RZTTB8wFIKug0/Wu1scD8N4Y38RdYbajUEZ/PrHqTQjiOxwdeHuXSMNssqY+VoA/SK51PAXRykqmlsalYH7pqU+7YKcUG7RCQCdlqFKZet0pcbShaQ6AkkKnr00pKXPJzl9yCZMn1pMH1o1b4BcXic1o3cLPbkkj86lDgLiRYSr4EAK2KnEj/nROuTOjIrzhPLbJ6AitoTG4qztcBYoQlFxc27SkkjKklRn6UVtfDXmgl6/cSmAVENgAH0neijXLJGSikainGm1uaNpKj2Ak1drvhrh3BwVK5t2sCQXFHLPsKg27d9ibotLdtLaQZKWkhMflRemwJSxwivjDrtwiGVJ7kqAq4YLwCn4VN5jDziVKhQZZO6eknpRTDuGbLDGfir4Bx4K+U6gH1NE275x8lpIzJBnTt2pkYYOWZdjVhgWHWRm3w9KVq8pWrzH6E6fpQXjXDGG7cvIaWVTqR0NWDEMYtsKbCnJ5gEAA9ar1ziyMbaXarGqkmNd6JvKwDLhcFXwDDbq4U9esXnILXlGUSpR6xRizRZYthysPxMl28aUQHgMriR6nqPSnOEnUoYuMPdISpp1RVpqZprFrdIfF9h/943qtI6jrQqGCHJpg1b2IYIsNXMrt1H7t1IgH+lSjd29wyrlkSrXTcVIN1b4pZctbEoVJUn9329arNw2/hbwymWyZSZ296hvbydhT67Jt5YZ0gpmT60Ncs1pnyRPWiTGI86OZtFKdWlUENzPWh4kQnKIHNuSJBpotFI3og/MkwBJqKowSTS5RGRm2MZdNRWBObSKWVJnbSskJFA1gPLEZD+7WsvdP60sq0OtNnX61BKyzDHStVnrWba1ASNjTXesMhNaBIrYKo0H51JxqNJrKydIrKHDOyZMVkmsrCIqVk7s3mNKS4dhSK2N6lNkY+44HVdD+dKC9QTP0ppHzRSwR/0anLAaH24UdDqTUpBI0jT0qI1oZJ9qfSVQBP1NHEVLlkpBT0V5h+lO/GIYSSpQJP00qAt9LaYmD7VDKnbl0Np69e1E5begoQz2TL3FHXk8tKylA2E1vC8LXcqD76YbB0H71KZw9lteVbyVdzGxos06FFLbUeXQQKlRbfJ0pqKxEIt3fwdmstkoWRkbjuag3WLrs723wxtoON28FSVDRTh3JHWttEXOIIZzy1ajOrsSKEIdVdY4XYnM4TJNNzjgGKz2X3CLW3tGHnmWG23X/MuBBP8ASpeHBxFu/wA3RtRkGRqahpeS00GgoExvGop0LbatFErhS1ddSZG1HwiUsrJOsbp1EtOrlAJB6b9KU/heD3ILlzhlovSDLSdfWhVqpxQzK1SQZE7mp7F0kKgpnKIPm3rsJkr9ySxhOGW8C0t2WgQCQhlJH604cJsXUhLtnavJCgPMynU9p3pltaYJXrA7/pTzTqCnICmSdxXcIakmDbzg/h24a1wxDZ/CppSkq/Qx+lCf8weHgqS5etyNElwH+VW5S/u82cJ3MR196QpJdSAADGumnuaXsiRhrpgW14N4dt0pLlst+VR964SD9KmOcM8OOIEYHay3uUIMH+tPJ+6KM5VlHmB3EfyqcjIskA5FK82itKLETkvgFucM4YtpS7HDbHTUBbAk1WMTZtrIFGI8N2mUTqlrKT9RV8SR5Q2AoqJkzGv86RcsW91blq8QhYMggnUSKhxiyHFr5OZM4RwxjLobtbt7DnjEJcPMbP13FF18BYky0PhbptTZ2LQ+Ye+9V/ibB14LiH3BIaUQpJB29KtfCWIXa2Ay48qEAEHtpQKKzyRl9D3DnD99YOZnWFAgyoqA1qw3V4EuJShZ0UNDt7Vi715tkuqUvMrrvQk3K7i5LZcA83zE6mmLg6TUURuK8IQE/G2vqSO1CcBv1svJSFqSoRKo6VZcaUHbAl0b7CZG1U3DXSLsQCIVA1rn2K6eUdHtLgrQoqEFI0gfypS8QQ192lSgpeojQSNzQy2dDdvnMgLlMzt61GucSaUsJSuJH7uo/wDeuQ9SSWfkNLxRkgkq6Amdge9Z+0WHgkohWYa/Squ+/wA5wKDhbiIEaGtsENlRBI/EdZyjrXEbyyOXa1EkqTAGuU7dq0m7UlOZJAJEEEagetCWLl1SZDggiQcuv0qQl/YlA8uk959K4lvJIeeWlRezLCpjymCdZmRtrr3HSvpt9jrx8V4u+HYwjHr1LnFHDCUWt+omV3bEZWrqN5IGRZ/eTP4q+ZDdyiSkhUzACk7VePBHxWxDwX8Q8L41wsuPM26+TfW0/wDirNRhxr10gjspKazPI6T8xW2uy9o7/SntfR9gFuhA5i1q3iNta8z/AGj+EXOGMbTxbg4CLHiGUu5UzyrxPmUY2AWPNp1zd679hPEuEcQYNZY/gl8i7w7E7Zu7tLhJ0daWkKSr9dexBHSqr4oWX+eHAuM8ONMpXdKY+Is9f9e1KkwekwU/71eJ1lcbI7Jdo9X4+6dFylHpnje+xp25YXcIWcyzmCsp8qgNxGo101qvX3F160GnEkhaVQFnST1E1Jv7zPZG6RKnArzNmQRp361UMVvGELHKWVlYhSFJkHTUVkU1JvGD1llrXKDQxx+4Wpp+9zEnOE8wwqdoG00yjFxbtlVmgpcQCJUkQR9OtVhGJNc0ZswAMpIEZR2NTWrhLgKnSXCPKVJVuD/GrLqUfgVCxy+STjGL4xeo5DpWQggJI1PtQ44DjzgKnW1IS5KgZ6d6tlqltphK2mg4RqPUetKxDGVuMpYBKWyArId46610JtPEUTKOe2UhnBL7MUup1UM6SBHm7etNX1mmyQXLp0JykSNj9KsDr7rhcWwIQ2ryd5oLjeHLu2lFwuLWSNJ3q1CUn9RVlHang5Jx3jrjLiTbAkZtxPm7aelVBxOLYyqEgst7Eq0/SulN4NbXuP8AKvmpZBEpjUDrH5VfMM8MML4kQHrZSrO1S5kytAFZIjefetaOrhTBLHJkPxtmok5bmjkXCPAzz9whaGFvlKoWSK9ReCvAts3ft3uKWyShn5UK8oBHUd6Xg/AaeHFsWlrK2lMpdQ84nUjUEK7kGuncI4Fe3Dzfw9mtWcoQ2hI8zizsB7kDT1rH1esnqpbTX02jr0cHLBWPtQcTXeGYXglhgnBmHcSXd48S5a3pPJbZbEpcMKGuYwJ00OlcLseIvGx7lDB/C7w+w7eA3hzayD9Fmvq5wr4YcHYRhtgnE+FcFv8AFGrdKX7u6smnnFr3UApYPlBkCOlXOztrCwSBY2VpaZU6fD27bUf8IFbOjq9OpLCz/wDZ5XW6j1rnL4PkdZYX9sXGgWsKtWGecYmwwQqkdp5ZijFr9nX7cWNOF1zEOK2OYMpUzhXIERsCQkde9fWBWIOpWpK7t0lKCtSeYrRI6x1rSXEPIS6mFpWM2aAZB2M1b3NdY/8ABSlOT4f/AOnypa+wh9rDHSFYpxFxQJXMP4ww10iYL8g/SjeF/wCTA8UsRA/b/EjaQTP9px7NH0Q2r1619N3HGmyhBQRzJykAaq/dnuelMoxBpWVwIWhvZxStC0eyx09652y+/wD6RH8L/wDT5+YT/ko7AHPi/FeGTMH7y5f/AIZJq9YL/kv/AAtsy2cRxq3dI0Ibw5apP/3HTXslV26hWUNJSokFoqV5Hknok9FehpYvhzTzEeQKgriC0eiVjdJ/Sodkn/kS248pI84YR/k9fAbDQCu3cdiNU4faon80qIq44b9jzwJwpAS1w9dOJT3eaQD/AMDSa6y/cXVuEh1zImSUvZZQofurA296fRcG5PK81u+iFgbpjv2UkzXbl8kZk+SlYf4AeD+GJ5dvwPbLgR99cPLj6ZgP0o1beGfhxZwm34D4fzKGmexQ4SB6rzUUcLjZDa0ZDMoQlRif8Cjp/umnU3Tb6eVcSMu7oGUoV/iG6VfpUZz0RmQm3wjALAH4LBcMtggBUM2bSCB7JTU5CvIlbS4QsfgMA/lWlW7bzaUuLJWNnPlIPcEdf0qI41cWSi8gFSDMuJBI/wB9I2901OERuZJfeWwAtSHFp6qGuX6b0ttTS0haMqkAaEGR/wC9NW94h0DN90tWo82itY0PWlptmkO85KcqiTmCTAUe5G01KxngjP3Ho0kQNj70oTmkmSDpG1aSSAITtvFZMiZ9DRkCyoSRO571nlmCYnaaSkqMAAaCo14p5akhq9LKt8pjKR6npXHE0KSD0Nad5LrK7d5lDjTqC24hxIUlaTulQMgg9QahHFUtOBm8aXb5lQhSoyq9ZprEMVcsi2tOGXN00rdbACin/d3rlLHJzjk8q+P/APk5fCbxNTeY/wCGBRwBxNcEuEWzZVhd0vrntx/ck92oA/dr53+J3g19oL7M2MczjPhXEcJY5uW3xvDXC9YP69HkeUTvlcyq7ivt+zdi6aS6htxAX+FxJSRHQg0xfWFpidk9h2I2bFzaXSOW+w82lxt5PULQoFKh6EEUSsT+pAqLg/a8Hxc4L+03i9uW2eKLZOKsgQu4aIbeQidSU/KqvQHh/wCIPC3F9iU4JizVwUf6lSsrqR1lB137TXZvHb/Jp+EfiI3c454WqHAfEasy0NsBS8LeXv5mRKmpn5m9B+6a+f3if4FeOP2csYQnxF4VvLO2z5bbHLBZds34OhRcI0k/uqg+lLtojYvYy9pvIToeLOUepcUs1LcdYcQFJXI1oRhqcrarFxUra0SOsetcM4S+0lj1olFhxC2MWtUAJClQi6A99lfpXX+F/ELgrim/bewfFWQ+oFC7W4+6dB/2Tv8AQ0EJOEcSL/rV3e6DCoSltxSVwFEaHescK2Uh9pSkzAkDc1Mxtj4ZKLowEhcEDQR/L60008yQUqhSVRp2mi3ZWTksSwJavAtZRniSDr/1vUy1u8ilpdIAzdq01hNglQfbQsKyyApWgNM37YbEhMSOmkUiTUnwW4VySyOPKXbPF60UAgGR6T0NaxOz/aFvzW0hKgZnqazCX2nn+RcBCVKTCV/vehow1ZKaXySkzBUkFX6UEpem+RqhuRUbG7ckJdIDjZykbGJ3rpHAvAPEGM3jeJO27llgy4U9cvDIFDoGwdVKPQjQVVrYjCcbtcQssIsrt+4fS038YMzDCjutadtBsSDFd5w/j9VvaLZdWcdx8Zgost/dNjaWkjQJnTMr9NqzdfrlH2JdmlovHOUFYWHDrLhvhC1Uq2YbsWAnN5lS46f8Sjr9NvQVU8QxvibxEfUxw+W7PCmwUv376yGUgb5QP7xQHQadzQu9t8Y4qu2zjVut9SUyMPYWCP8A7y9kp/wj6mp92mxeQjCcfvA3bFuE21krlthtP4Sr93TUACsJzlOWZGt6UK17ewhb3fh74fWil4e83d3SyS7eOwXVnqc3RJ/dTVRxrx0CHVBlxsNqVlEHoNtulWBzHPDrA7ZItsKwxKwCG0coOQPUqmiOHeIvBr1qVj4BshMBPw7Xlj6VzS+BKwnlooOD+LWK49eM4exhrl248qEhDaiI7k7D61dcQw5LRQ/cOtNkgAgKmD6RRY8UM4kypdldsKSBCm2ylIjtpvQK+xrFmlBNlbW4KRMuKggUG3I2M/sF7DC2m2g8yhhYAnVsgk9dTTxxq6tAUN4Ows/MJJEVU3MX4lK0jMFyOhmO9Ntq4sVy1PtlAjUq10mp24Acs8MuY4sKEqC8CeaWkeYh3yn2mpTeLodbRiBsVKCACjI4J16GqBd4hjtoyVKd5mY7HQCgmD8ZX2HXTjN4VJZzkhJV/CaBzAVSZ1tPEbarkJTaPJAJVJGxppfEeHEgLacT+8cskfWqza4m7iiFKtlk9ZEmadNreNHyrWoKOYaRAFLc2w/SLIi8wu4By4g2CcuVKvKQJ2pty1DrqnGltrUqAhKVDzKJ0Aqst4W/eqC3HUAJUZJIEjtVn4JwW1uOJbVarhCkWR+MdjUeU6D/AIo/KjpirZqLQi9umDl9jtPDOB23DODNYa2Ul6C7cObFbh3/AC2HtTuKYpa4ZaP32IXrdvbWzarh+4dPkabQkqUpXoAJoQ7i3MVnC/mlRg9zXkz7evjmrBOFWPCDAL4JxDHkB/GChXmasQZQySNlOqAMfup10New0tW9xqieH1Fr91s/k8u/ac8eb/x48SLjHmnHmuHsLCrPA7YmQhgHzPEfvukBRP7uUdNeX/ELaQmdSQBEkVHbaKyr7xKSomQfwj/rSn3FJhJyghKYiYEg17amlU1qETy9trtk5McDz6ylwrSkJ3JPSs5gSEqVCuYPlJ3A60PddWoJKCY18vekLW4QSRl8vuAO1MF5CaLlCWyQ6oBeo0OnpTb16keUBTk6iRtH86CoddKQgmZ80a6Vtq6M5VGAsdDtXHZJl7iC1slOUJ/xd/T0oQbtPOSkg5jqRM6/+1T7tY+FKkycvbeaCNPg3QaUMpIy5vrvNcKk+SxXqgzZtqS5Gkg9j7VLwXFE3TRti5uIhXQ9fzoRi7xNokNgHyzIO9VVnEbmzui40tQI31ruiXLDJXEDDzOKqad6mavfCtozg2FftG5y+ZIUkKMAmg7V3hmPIafuEq57J8+g8wFQOL+K1P2qbG1bLbaUxlI2+tdnHJ0cLkVjWNXWLuvXPxRWls6JGiU/SlNOrv8AArhkCSESJGugqvYQ5Ni+srkq01HSiOAX7QvDbPOwFpKBmGldncgMyUuSo2OGvYjiKLNpMqWqJ7Cd66zgnBnD2EBtbrHxFwkZipRkTHaqHhSTh3FAQtAAKyjtvV5cxJdvcFku65iEgilwgkPU18h7ms2zeVhKWs2qUtjTWoSXXXSlZQoJUQJVvM0KGMuapBTmG5PT2p1nEkFgJDuo1OY7/Smpk7kF5tMMSp90oLvUHrQ66xldw4DmUB0AGnvQS/vnX1kuXEpzCBSnHEtMoUdCrcTtUZB3E3FrFq+tE5F5nADI9aRgLXwRcDraUrCSZmPpQROKOMPFKXSdIk9fWpqcR56cyPMomCB/GuT5FZy8kjFr1ajDcpBmU96dtHU2zDj63sq0oAEmJ/rURhAd1ejrvue1Q8dv0ltSEOJyjsNu/wCtc8rklSaAmM4g7c3SlBwqGbrUNu7dtnkOFZlB6GoynOY9mKtCZ9q1cpOXOmDO9KySlkLfGi0xH4xtUN3KIVHenjiAJTCiZ+bXegNs/wA1s2q/dM9DU21bNwgoywtvf1qVLPAMotDi7k2lzz21ZWnT5kjpWrlbLzZSo5kq1E9KQpEoLKh+tRkrUAUKB8pjeubzwcv27IjiV2rkgnKaks3hX06aUl/KpOUmR0qGlRQqNh3pWXHobhTj+5OdcB11+tRFLmZpaXZ0JrFpHTr6Vze4hLAwoxrtrWFRNbUmBprrSSk0L4DNFRrJjWsINYN6EJYN9KTG+tbjrWULJM+tbVIEDesB2ga96w6ie1ScaOhrK2dda1UgmVhM1lZXEoys2NZmgx+tb99ZrjmjaQJ1pYAJGlaT+dOBOX5hvUoFsWNDIFJU+EgjuKSXN40jvTJlZj1qXLHREUn2YVKXT7IABAVCjvSEgCBSyTvNSv3Cf7DyFlJI3qYi5DDClaSU1BQZPlUPWkPOhxaUbDY0eRbjzgN2j/wmEuOHRy4/hUDBUlzE0r0EHNrRC5tQ5YpdBGRCd82tDrBSLRKlr0cVRN8ohcJlifxFK3zzFygRtvRB69S+zmSYKIj1FVVxwpROYq12PWplheoAU25rm70W7ICzgMMXZQkSrLp0HWprF8h1fTpr1JoAp3QBOgIPWl292ltYJXJEelFnB3JZPilwVBIIB19q2i+SUhsqAB0Aj+dBE3xglZnvrvWviikFSl5o6jpU5JUmmWVN4MsKdTKRAANJavUpnKTrtr1oE1iAIhTgGfYKGgjefWnjdEALCiJ/d/WuCyyxG8S41maXkJMgRIjtSGXnCoLCpWg5oHWgLN+IDXOEgxHf/lTvxW5Ck6qkTqIFcTuDb1+QUEKSdZMitLxIZVJKApJ828df096EG/bCYICSST5Vb00m4UFhSFFaRoUqj8z6VxDkyFxshKkJWCdgSCIp7hSEt5yCk9IE0P4luOeENNzuAAalWT6MPsoDhzEbR+dQ+8g5DOI3xEpWogETEiNajWVwhKpyEqKgD0AHpQB7EDcObJ217Gi2GkqWlaEazrUkN5CWNXI+HKACCRt2qsWLRVcpdWiBOp9aJYtcF5QaCSoAkE7mmLZZZaUVK0G4PtXNc5OZPvr5aGg0lSo2hJoSLt1xaSogmDTdzecyMqgqSAD2rLVpRUnMZg66j6VxwVaWHEZSkFShlHvTrDqwpJIGnlOm9M26UtuHIkLKVeVUxU1LTaZIKQN5J0HrXBMfYJUfulgb/Meo7VNQp1uZQSpZ82ugoMq5bZCQQmdon9aeRiraBK1Aj+FcTGWOwspwpSIKjIAJptx8NoWWoEdY+UdaGLxq3kBMZQAQCdj3pn9stZJK5AmZPWo47C3/ACj2V9jL7QV5Y2Fx4P47dLLbZXe4MpapKEkZnreO3+sT7rHSvSV3x+78da8pQIU4mQN/m0j20r5Q4XxhecNY9ZY/hTwF3h77dyz5oAWkzBjodQfevoBwXxZYcW22CY/Ywm3xNDF02CrVJXBy/Q6fSvHeb0apsVkOmer8NqfWhtfaOZX4u7PG8SsrmzcU2i6fI1kkZ1AUIxrA2r1zNbIypUkKDa/KoFI1/L+dWHiDFLX9u3jq7pTTwunlon5VDmKMAjb61XLriV9wlBUQlpUjQAie1eVjGW7KPcOSUVkrT+FKbUBcHy5zAURIM0St2LKzcC3HELSCUwnVJ9+xoTjt/Z3zgQ0lzmEkmUwCaTZPouEglHmO6I0VPar6hvXuKXqYeEWoYkldspq0bCQnfXYVFQhS/OopWoQBJ3FKs7cIs1BQGqhlUDP5iptraJ5UnKrcpA0j3oYxUeBqk2iMyM5bKQcoMkjYHtS7rDnXkZ23AgqiEgVMt20sg5RkQsTA1jtWru6ICktpJWIT6a0EpJdDoRyuiur4ITcO/G2DIcuGlELST8ydjA7iujcFOcK8LYEXsYxG0ceeeLqGVPpQUgxqvsJGwk1VLjiG14W4dxLGb9TYeQwpq2RnAUt1YKUBI6md+wrmXhnwHcXt0i+u2FOJCuY6ToASZ37a0xw31ucmH6uyShFd9nurwg8OkeMTeJ4zYYowGMOcbYzu26wyoqBVkbG5AiZO816F4H8I8K4PdTfvPi+xFpJDLxbCGmDG6EyTJGknXtG9c6+zhimG8E+GVtZuvNG6xO6cu1JBAOQQhHvokn6iuvWXFjN84GUJ8x6Vc01NUUpfJ5rX6vUTnKC+kn3Vk4kqdyl1DiQXmwo6Efjb7H0qQy+Fo5F0pLjbmiHdgr0PY0+hawJMwRpUe4aUQ46y2FqVGdo7Oeg7K9a0c46MV8jqGHAQ28CtKCS0/MLR6EdR270yld1bXEJhJUSooH92/wCqTshXptTTWIpZQpbilFhHlVKTnZP7qhuR61OC27hrLoWlpBBGxHcdqhSyQ1geQ7bXrC0oOZuChbagAUnqCNwfX8qQ/YhzK4woNPoTlSv5pTEZVD8QPrUF5ldqoOpccKgY54SFLSOgWPxj1qWxiKHFBt4JQ6oSFD5F+qVdfajygOSMlC2lG1UyhJWNbZavu1a/M2rof8J7Vt9m5t3eYsrdQnRLm7raeyhs4me+oqc820+nkupSpJ1P/L1qKhdxYSp5S32JkLiVoHqBuPXeu7CTTE2TyW8qVOtobcBgBUtKP+FR+U90n6VILLtt57ApCNyyonL/ALpOqT6bU05Zt3SDcWbqAHdVAgFtz3Hf1G1MtXD9o6WIUraW1qlQH/y1H5x6dKg5k5FwxdJ5JRK9yyv5gfUbfUUw7aOpIU0orCdE6/eJA6a/OPRVOTbX6A42T5dEqTotB/l7Ug3D9mQm6SXGt+chPy/7Y/mKJA4Es3b1utwoUjLMEKUchJ2nq2f0oixdJuPKUqS6NSgkZoncdI9RUV+3buEhxKylREhaIMjsf3h6GojramyC/wAtCJ0WAeWofTVs/pXbiOAg/ZMrlbQSlR11HlJ/2e/qNaYD91bL5bozJ0hKjOnXIvr7K1rVtfLDvIWM5yylCtFpT77LHqNamIeaebCmlJU3OWNx+R2qUDjHZjNwzcDM2okpElJ0UPcH+NOKczGZBBGkVBesQpQcbc1RqMytUj0V0+sim2759KiH2lFQElOSFpHtsr3TU5wTjISS6JiQKxULGVQBB6EVGS+h1OdpQWkeuorfMdGij+VTkE2GGsi2vMptQjIoyn/lUdVtc2iVOYc4ZMEtuEqT7A7j6U8HEq8oUDGsA6j6UrOY+Y/wqCW8Mas7td0kly3cZWBqFDy796k7EnrNNqdCgNdaSVkKAn1qTux4KmCYmm7li1vrR2yv7Ri7t3hDjD7SXG3E9lIUCD9RTZVrt/70lTh1E9IrsqPR2M9nlTx4/wAnP4KeJzdzjXh+BwDxAvM5msGs+HvLOv3tvP3eu5bI9q+dfjV9m/x4+zzcL/z14UVcYMg5WsZsQbixWJ0PMAlonTRYSfevt0XSNFKMdpqNeW9rfW7tndtNPsPpKHGnUBaHEncKSZCgex0NSrnHiSO9JvmPDPhRw948cXYOgWP7WdesyAPhrtRebj0k50/Q10nh37QWBPEDG8MuLNcBHNtl85E9ynRQ/WvaPjr/AJNHwo8THLnHvDZw8D426VOKaYZLmHPq9WRBa92yf9k14M8X/sh+PXgGV3nF3Bz9zg6HITitgDcWpTrBKwPuyeygDTmqZrjgmF+pqfu5O/8AC/H3DfENuG8IxqzuyROVLmV1J9UK1/SrYi0bdtSFyVnzCev/ACr59M4gtK86HS04CPMVFJT/AL41q/8ACvjL4gcLOMIssWXfW4UQli5+/THYEHNVW3TSXMTV0/lIy9s0eq7zKwspS0AtMEelWHDMSN9Y5VKC32zoTv6VQeE+Nk8eYay3iGHLwfGVIU+bJ1UqUhJAKwDqEkkbj86sFmXLRYdYCgFylWvyq7fy+tKlHfHD7L8JrdlPgtWJeFPF3HXDasQwm8bwJhbqFt4jckhMgwciBq4J06SYE10Gww3g7w54UawFjEXQ02jNcOJc+9u3jqtbqzqJP4RonYd6oOIeMmI463Y+GfDF4zimM3J8rbP3TVkhtAJzqPy5EyVHXWQNTBZxTwC4hvGA7jXi7YtuTzFotbFx5CEncJUpaZ/Ie1eZ1M5TliXB6jS1uNeFIM4h43YLZsKtsPaSwylJCEoEfUnqfeuI8ceLuOYnilzy7htiwXqsoHmUO0jYV1Rr7Ofhyq2IxXjriFbqQMzyHGGkqJ7Iyn8pp9jwf8BuFFIdfs3scuSYQ5it6p5HM6fdDKmfcEUqt0w75Dmpp4R5tufE/E7lxRbeccKYT90FLEDppPpWrXj7FQ6AmzxJwkyQi2cVP5CvY2F+JXDvD1g3apRaWKZP3DDLbKUawISgAAHSpSfGnD3HlMpxIAjQlLhhPqO9N/MU/EBTrs+5wHww4mxTGMSYtf2Xj7S3VfisHkoPuopgV3+U2rSVvBx5xO4k9elQ8T8Trl5kJbuw8zlPmLpkH1E6iqNjPHXEluoO4fbthtWiEAAwToCe2tVptWSzBYHRjhYZ0weIqcJcatEYCkSnOpSk/KOhrFeIt7cpWU2LSAvTKreK483xFjKyq7xm8bQ6oBU7yfWpNpxOy+8VFeZLfzknUD32mocJdAbY55OpHF7vEnFC6w215Zj8RTMUxeYNhi0fEvWXmBzyFyBOn0qit8VtLdCQ84kA/MTMil3HHgZY5LaWysoMqUo7RoSJ19vrSPTkHxjgtFxijuGtFvDnUIlWRBjUmNd/pSLO8xO4y/G4utSDokpVAUes9hXKsW4xumk8xvlrebOYIKicvt+hqr/5+cQP4ml28SlNu2oS2idj27+/SmR0zlyLdmD0Le4phuEthtNw4taxsCTqatfAGKqsbDEcWQ2tvnLatm5OqxBWr+VcTwnivCLhj4txYlCZhf8AGjlt4lsv4XbjDXjkTeuzEaEJTI1p+kqatKnkJYp4+TtXEHiXh3BvDuI8U8QXIRZYVaOXVwrqUpElPudEj1UK+XnHniViHiLxhjHHXED/APbcVulPLQNQ2k6IaB7ISEp+legftacdXmIeDmIWNk6YXe2fPgwS2Fkwe4zZa8OtYq6POVHXWK974WqMIOx9nzry9slJVo6TbYs0UEqSlSlfOSdxvr9daccxBgJOcphZ1n+Vc5TjTw1SoJ0iEztTpxbmwVqJjqa31ZkwsyRfXry1BSS5ogAaHeaYReW60uJU5AVoNdPQ1SxiZRokjbqacbxZQIAEaQJqVNMHL+S5v3KSowRAASJP60JuX8vLlaZP50IbxV1QAKjqNdd6TcX8nMUz1FduIyWGyuitlTRcAVrJ7Chz1uWroK+YZpA9KEN4stp3MBp1FH2LsYkhLiSM4EHUAkelcpJndk14quLGAAkoBH0qnYgFNunQhWhiat9q8EBVuSYKpA0Mf1oPjdjlWpeYnck1MujiFgmJKtXDnX5dopziRpJi4bSIXrvQQvctRjSi5d/aOHZVKBWiIk6/lQZysEtDGG3OS0dStIUCNBNREXRYezIIgKkQa3Yqy8xpX4hpUR8lDigRqOtQ8pcE4yyx3aTfMtYrbn7xnRwg6mOtFxeDEbEXYALzQAWP3uxqq4PiRtXeWpWZC9CPSjHNXZ3Yet9WlakDaKKMk0A1giu4k8FKC9CSTA6UtjEyp0cxen8RUzE2be8Z+ItkwvqIqtvLW0vt0rmzkslsbfQ+oQR5j9RTiyUIKUEkxIE7+lVq0xFbZkqO287UYt7xpQEoBVuDOkn+lFFpkka/OUwJkfpUJrEF26/KR661NxBQUlWiQYiR3oI6kSTI7UMnh8ErDLRb4y04nQ6lMb0CxC6LiiBp0jpUBFyWyTnOlY67nGad6FzydteTG9V6j8qmOOAoCQkEdRUJpQAlVK5p1BA07UHxgJpoYebW05mGk61Ms8QykE/N/EVGdWCn6VGlSToajOGGllclpHwt1bl1AGYaxNV+5e++KgfQ00l1cEyRTatZMT9a5zOjHDJKlhSYAqO4QdDNYhR7itq11nSobySlhjaVkU8lzNvNMHQ6UpBIgzQZwE1nodUSNq1ArCetaVoJBos/cHIk9a1tBrCoGtVDwwsG/wANarK2QImgaJRqt+YjQVqt/KmalHGbGO9Z3FKUfSk96kFGqz23rJmsocBGe1b/AMPetR0pxIEaj61ODmKSAINYtem9IUuDptSFqzbGpYKXJoqnSnEIAEmkoRImlEkb1C7ySzYUBpNbGu1Ng6yaWnUgjSpyQOjKhJV1pgEqX1pTq4IikoIJ31qcnJY5JBffUgNcwwOlKZmQTOn8qaTvTgXl1FH3yC1wSVKnSTHqa2iQc8HuKh88E/KTS0PQfMSfSp6F7Wgil85fOTMbGki4WVGRMRUMPAnalF0GY70TkRhk9FyJGZJA96X8UlYEp6d6gByREp+tYHl/jVoPSu3EYJ4uAjQCJPaanIukrSEk5QBoJoGXyTISIp5Fxl8p6bHrXbmQE1PkOaKy6dqcTeJ8rapg6TFCTczuZps3RBhJOuwqd5yywqu7KgrXQ6a6bU9ZvFQ3CTEz3HrQNL7riwCmYPWiK7xLDBTELKQNBRKRHKMce+IvS4RCW9jl3qNiV/BSyhW0yO1NKuSw1mmZOlQ2m3Lx7MRJJnWhc/sHH9yZhyXnl8vUgnvVsZy2bKVHdUDXSKi4RhzLLJK0HMoT7Uq/cISApyUgj8qNcLkhjDrvOzLVE5tSnpQ7EL1aEqbRtt70l+8CUkNkgSZnvQ9Sy+4MyttTQymQP24cPmBOU+aDRRlZSggqiY6VCbGRPmIAGmvamFXmXypJOpM/yqNxKQVcveWoZXBpppp70wvFXGySVT/vUDcuXComTvtWkvqIEnbeo3oPGUEnMTfJKUnTeT0plV+6oZlKOutQVOlaiZ3pOaJ3JqHLJG37kpV0snyrJ16mtC4eIAMmNJqONfm/SlhRI10JqMk7Uh1LpCgFFR1Gk717l+zvfqa4B4US68RyrPOoqGmUKUf0ivCwT5tjPvXpzgji3/N/wZt75LpQ4xhrjDWb/wAxalIAH/EfyrF82nOlRXybng5xrucpD+McVrBC0vyovEmU6Cdf51BY4nRceRSpCZ0B71yy84gLo+9fUQOgMT60y1xVZ2xClOFPeDWLXoX9j0dnlYKWMnURdrdvFqKyrN1I2ophzuRYTBKZBma5XYceWjjgbN1A0ETrHSrdh3GmEWiQ65cCUnQz/wA6GzTWQWNoynW1Tedx1phJabAyjzCdB0NSHlot29RpEkdSe1U1Pixwgxh7Y/ajeZP4QsEnv6mgd34g4vjhUzwpw7e3ZcnK4WyANeh3P5VTWmtb5WDT/N0wjnOf4L3c8RWNs2VOO5QNYKYn09vWqPxZ4tYdgzBW0rmumQlE6lXT6VFb8FPtE8eL5jGBXVo04Ny0ppEf7Sop3E/sT+KdjZftLGH233Trym3C459BWjTo6I4dsv8A6MrUeVvkttMQDgN3ecT3zOIY/cKeUP7tv/V24/wp7+vWu14hxHw7wraWVngqG+e/aMFQAzFbhSc0elc94W+zd4wlxNpb2rgbGhz2pBHvmIH516B8PPsa8UXD6L3iTFm2HFkFxSZddy9gdAkegFI1NcHNbXwW6NbJVe5cld8P/EjGeHb1i6fQu4I0bY5hhJPYV7U8Dxj3EVkOJMbsl2iHUyyys+bL0JoJwD9nHgnhTlPpsfiblJ/vrjzq/Wu44fbtYfbot7dOVKBAAArqo5eTP1epjJbY9kzNBydhFYFJiCAfLTalgK8p1O5NYlRiJq6ZeGNXdoHVB5t1TT6QQFpO8jZQ2KfSozK3rO4Uw0kJJmLdWiV+rZ/PSpgekmCZ6aU0+y1cMlq4QFA7T09QdxUYRCfwyQxfNXLfMZUQB5YUMpHuDsaZeswBNuhJSZKmFGELPp+6r1qELS5Spx4XKUupgIeAgrHZY2+oqY065kTzEozAQUoMpHse1F0d10aYvXGAU3ClPJTqrMAHWh6gbp9RRFLza0BxDiVBWoKevsaHPNM3OUqMLGiXEwFJ9j/Kk27bdq4opdWS5BcEwFK/ey9DUqQOCa6w6DzrB4NrA1QpEtufzB9azn291FvdNht3flLOoPdKuvuKSlxw7IWR0IB1pF1f4fZJD1/e2lvkGYKuHUIy+xJFTui/k5Rl9hDtu+wtdwh1SssEOAfeADor94frT1veuryNvNkEiUOIScq/b932NVbFvGPwowUrGLeJfDNqUaFKsUZJH0SSap+Kfa1+z/hU5/ES3ulo3TZWb7xP1CI/WhbX3C2T+UdeQw204X25SD8yc3lJ7+hp7mkjNmPrXmjFft7eB+HqPwiOIL4hMhSbNplJ/wB5xwH9KqWJf5RjglOmGcC4g+QcqTcYoykf+hKjUp5O9JnrldiBCGVctsGS2flHWU/un1pabdYUYuDm2bciFD0V0XXiC/8A8ovjawTg/hxhaEqnKt5+8eMeuVtI/Wqriv8AlCvFlxKvgsM4ew8QSCcMUuIE7uvJ7jpUrf8AY7YksNn0RQogBK1hShuQI+oHQVtaG7hBbWgKHTfQ/TWvl1i329fGq4BS94iWOHGDAt2bBkAf8LhFVHGPtoeJV8CL/wAbsVIJJ+4xBxI6QIZaR69aPbPHRG2Hyz65CyQAl3kuqUn8esn/AGu9Q77FMOwxBViWI2dolMkl+5baA+qiK+MuLfaRxHFgsX3HfEGJFU5s1xduzvsVvfyquXHiza3DmZjCcWuyokfeNoTpGn4VGZ9a5xn8ILFb+T7MYj4veEmFK/7S8SuFmFp2CsVZUR/wkmqviP2rfs84USh7xUwp5QOqbVp54n08qIr4/u+ImNJINlwoW1CAlTqhvGv4R71DuPEHxGcAbYAtgiCkJeVIgzqAdalVzfyC5QR9brz7angNbmbTFMfxAHb4XA3lAj3UBVdxT7fXhLYhSbXhjiy6UkT94yzbD83HK+TD+Oce3MheLOAEzAJVJ3GuvppQt1rim5IW/iNyVKAiDE6z/GiWnk+5Au1fET6lYr/lIuFGAThvh44YGcG9xlpO3+FpCj+tUvF/8pbiJlOHYJwvYdlKF1dke8FsfrXzkXw7jb4BcN0uBuokj21pB4QxfQC0cUZiCJIO350SorXcwPWsXVZ7kxn/ACj/ABs+Fhriu3tYEhNlgFunX0LziyfrVHxj/KC+I76iUeIXExSo/wCo+GtgE+zbZIP1rywng3HSYRhzhGskoI296dHAfECgFfAqAPUwKlU6ddyO9fVP6YHbsT+2/wCI14MrvFnFN0kpUFBzG3kgk7aJCaq919q3i945nLdV2opyLN9dv3AXrMlK3CmfWK50rw3x9zZpsRtKusa7dhTjfhZxMoAm3jUiIMxGh9qYq9KC7tZjrBNxvxTVxBdfG3fCPDof0PMFikEx3AGX9KiK8SeJghTdneMYegpKSi0tkMiP90Ck/wCjPHmwC+6wzIn71YR/Gmk8JYTaL/7V4ns2gAY5Cw6o6dkzTV6LWBD/ADEuzofgBx1hWB8a3V3xJePKcvbX4dt9yXCFlYOvXWBrXqe3xC1xO3WWVgZPMrylJCwdDBgivFOB45wDwjcNYjYW1/iOIsKStp1yG22z+KAZn0JFdr8IeOuNuOuILjGMSBawO3t3WW0EgJW4pQKQJ1VGpJiKqaiqTe6tcGt4/URhiuySb/YvvEWGWHCtzc8bWGfDMSUlQevGAS4WlaOAgbk6H6UBxP7SlqbJGG4PeSpDeVbinMylq6qIPeuouYYzidui1Wny6qSpRn20qncZ+B/C2LD4m/wC3WoiS8hORZ9ZSBXlbHRXa3qU8fB7aE75V40+MnL7zxrxm7QlIvVtobEpQlyAf8XuaG4h4lY7fISti9WlwHMFFUkad6l8TfZ4wpgpfwu8vbNpRyypzOEK9Z6VSMW8GONMLdWnD8ZQ+lIn5yCR/CtCh+Ouxsml/KMrU6jyVLzKGf4DLXG/ERWp66vnXFLPmzKk9qca44xhCgS8sqCo3I0rlt9gvG+FPQ7a3Wf96CoGoK8c4jtBlfbcQR1W2ZFaS8dXP6GmZE/N3QeLIs7tbcf4qtHLFwuNvmP/AA0WtfEDEgxL18sjWBm29a862nGmKW64uIcEz2IqwWXGdpdApecUgn940qzxLjykOp89CS5eDsv+et9iTgbXcuFKdAQrU/SjVljN+UKSp51sKI0n5fX1rjdhjLKHC4zcQY0lWkVYEcYXWVsocEJ08xiqdmkceMF6vyEZ8uR1i1xS6WVEO8uDrrOapT2KFxohxxKUAEISmZzVyNXHN6icmiZ3nSnG+ObkAocWcp7fyqu9HJ9FqOvg+Ml+ucWvG2fI4pUJiQNQO1B7ri5TDmR1BSEkeUneqtc8eFLJRbpUo9CdDQK8xtVyfibl0FajsB+VPq0j+UIt10V0y733Ganhy23FNDQEAxI9RVi4J4mVdYQ/atrVmtrsrI/wrSAP1RXElX7rjpcKhrvM/Sj3BPEgwTGkC8di0u0Bh+TASCfKo+xP602Wk2wzHsrPW+q9si/eK10/jXAOM2hWpQTb84D/AGFBX8q8rBOmtetMUVbOpetH4Ul9Km1jpqnL/A15Uv7RVjeXFk6ohbDq2j/umK1/DW7oSh9jznnKXCUZ/ci5SK2lUVtQgR3rRBiK2smCKS7lMlMmnOf1pitSDU5ZDSZLTcnTWIpw3WaRmFQRPStpWRsRU72DsRIUSYhWoqXY3ztoZTGWh4cBEkbetaKyNjpRKWOTtpcLa7DoSsGCBA13NTy18UwEvL0ER1jvVLs8ScYUJMwdKPW3EjKkIS42fm36inRmn2Lax2QcVwZ1gc5KDB1Ijah9jcKt3s350bxHGEXCFNgHU9TvVfeICypKSOtLfZMeeCZcIyO85AMEg7RTWIsaJfTqlWvtWMvpfTlXJgaa08opeaUwT5k6p9a5dEJtMFgwZB1ovh+ISgMvEFJI0oOpJSopggg1iVlBCp2oU8MbKKa4LfbrLJDiVeVRnKelQcXsQ6PiWRoRJEaUPtcSWPIpxUHQiijV2FgCJRtlPWmZUhOHEAL00FOMXa2xE1JxCyKCXWkDKdfahswaB8DIpSDHxJfbAUdKiuNhRKgIkzUVu4yxJ0FPB9CwSVn0Fc3kFxa6Glt5VHX6UjNHT6UtwyZCtNd6b313oHwMWWuRYV0+laJUNzWgvTYViiTpUZJwbKj12ppSZ1pVaJEGuycJToN6Ssb1vpNZmNQSYkEGYNLnMDJpIIjVVYCO9ccaWkQIpABmnSR3P1pHWhkiUxQNLIkfSmgRNOBRFTEiSG6ylLBnURSdjXNBIyt9KyR2rUTXYONgGaz8NKnpTalV3R2RwiZpG1OE5vMNqTlk1IIgCK3WykjetUPyF8G9zNLnKJNaSIEnakqVJo+EgTSj1rSa0T0radN6Dth9IWSBoK1JI2rN6ySNJogUjUUtJhNJBjfWa3smuIEzJM1tI1kQKTtJpbcEVC5CfA7oK1PStmADTalaaUecAigIMSK2BNNpJkVvmdIqG2yGhwgjr+VazE6QKxK6zc7V2WR0LCikTFbLkESZntST71sADqaJMgc5gTAnUzWcxRMzpTehGtJkjYiuyRgdLojUfSkAlStCTPSm5UpUbTUi3RAzkaiiwThJEy3ltOZYn1OkUy47MqCpFafe8oMknbU1Fcc0jY1OeMAbdzNuLXcOBsExRzC2bdlIUtJzadaDWyChOaBJqQq5cSDrr3FQuCZ9YRYH79CGy224QQSQVHp2oRd4iXdFKmKHOXC1K1JNMlR1kmpcyFElLdzmM2+1OtIyIKiAQBrUFC1IVJ6VKRfgJggAdRQ5XZO3Bi31KJEDTvTCllJmYHpSH1oUuUAie9JzAp1qMhKOBbg/EIptJUdqxKgPxSK0d5FQ2HgXAkA1vKTtTMlJpwOEioyQxSZnU0oQDIO1NBWu1KBM6125kYH0rlc6b1eMc4nW14c8P8O2rgC1F65uI6AOKCB+pNUJO+h9akLX90lCidE9/wCH60m6tWYcvgdTZKvOBtd3cu5wHSJMj+lRnFKIhR1G80twpkEb09ZWRxO5SwlaUL9evtXYjFZOW6TwFeCxY3eMM4RiAQm2vVcpbhGrZOgWPaZj0qHi+A4phGM3OCXLa1P2jymVBJOpSfmB9dCPemb7D7rBL5KFKKVoyuJUND7/AJ1c1cf4TjptXuIrNxu+tmE2/wAUyqeY2gQhKk9coEA7xSZylF7o8ot1QUlsk8M9M/Yjwnwp4oYuMLueG7S44wsQHbjCL1KXP2hbje4tFL1S6kfM3OVXYb17y4Z4W4R+CZv+HrCzat3U6LZYSggDQpVoFAg6EHUHSvkjhGOYbhuJ2HFHCXGLWEY9hjqbiyuIU2W3E6hJOog6gjYyQdDXuHhb7avASeDbPji+xFiz4rcytY9w8gH4e9dEJFyy6AUtqVIIVrIBQrUBVY2rqnZL1I/+Dc09kIQ2N8nrRnArYJH3egGo6g1r/N2ycVmcaJA9Na8j3X+UewBtMWvA9mmNi/i6iBrGyG++9Dbn/KQuBQDWB8O2wVprz3yPMU66p7T7VV/LzfcQ/Ww/qPadvw7YtlJQxBmdpP1osxZsNAkBM+1fPTF/8pRxGls/ArskKyyOThiEgkp0EuOKOhidKpON/wCUa8UrhKk2GJXLUyAUclqdtIQ179aOOksfUQLNRD/KR9UWciSEhMmNhuKeU4pAClhSE9SsZQPqa+NWN/bo8cMVlI4rv0BQUCPi3jEiOiwPXauf439onxU4gWr4/ie9cKgRo4esT37VZr0dv2wVZaqhfOT7kXfFHDeGpz4lxHhVqB1fvmUfxV7VX7/xt8IMKn9p+J3DbUdPjgo/+ma+Gz/HvGmIqLlxi10sqUVaqPUyYHTWmP2pxJcHzXj8DUSuD67038rJdsWtZX8I+0+J/ay8AMKkO+IlvcFIJi2tXnP/ANmOlUvFvt++A2GpULR7Gb9QAPkYbZEHaS44I2P5V8kE2mOXRKnb9zSNZJ36/wDXYVITwviVwfvX7lzSZAMK9QTXPTxXcgvXcvpgfTXF/wDKV+HNqD+yuEHXlbJNzi7Tc7fuJX3qjYx/lN7lYnCOEuHbdMTL9zc3B6dAEAnX9DXhK34BunMpdZulAkCc+nXWB/LWi9j4WqfjJhbriiqAAlSiPePSgcKI/wCQyLvl9MMHqHGf8ph4jvBabHEMBw+Tp8PgxcMSRILij2qi4v8A5QDxexMqH+kvF2knQJsbRlgb+iR0rndl4H4o8nK3w87BPL5xtyE5j8okjr0NE2/BrF7dQadwtq2zKSlKlrbTIOgJBVIoXPTL9wlXqX8ITif2pvEHHlH47izjS9zKBUFYk6gKGnRKh6+npVUu/FDHb7zuYDiV2Y+a5uXV9/3leo19K6bhngdjdyhSkMIKEJlxDS+ZHTQICtZIHuRVptvs93DDJucTdcbbACSHLVxCUK2+ZYbA33mJBnYUPr0rqIS01z7kkcDTxxxY7lFvwtbt7HzLUQf/AFf9QKbXjnHFx5fhMNaka/chZ6951r0Srwe8O8PUgYzxhhlutDmRRu8VsEAGNQsF4qIGmoG8VDcwz7POEIUL/wARcCSQlXl/apfUI6QwyoEK7z0qPzCf0w/9DFo3n3Wf+zgShx7c6nGWGs2wat0gxp1gdutNjBuMbon4jizECJOjZIkz79d/pXe18bfZbwlYUeJRerIGdNlh928ncSEkhvWJmd4qO/4+/Z5w1IRYcP49fFKSkKThzTQKv3wXXj0MQR0oldqH9NZD09C7sOGOeHuIPJUq8xXEHSgEqzvA9Om+81NsvCI3joScOv7hSoJ1JEaanKP0rqmIfat8PbZtxvAfC69zSUtKfxK3Y5acsAQ00qR13oBiX2wb6FN4Z4a8PMp8qk/E3l1cZSN/lWgGTqRRp6yfGMANaSHcgJZ+CNy4Wk/5rXAKo+dCjOkzqe0k1YcN8D7sqbbVhmHsOOCQVraTOk6SZOgmqjiH2s/EV8FNlh/ClglWYKSxgra5BjfnFcxAI7UAxD7S/jFeOKc/z0dtitQJNnZsW0wMo+RA2BIqfy2rn8gfm9FH4bO3WHgi+4hK0XloQtPk+HTnkCdfKk9B1ox/oJbaUn4i9eAWpMA27oCioSDmKQBI/LY15Zv/ABj8TsUn43j7iJ8EzCsRcGsQNj2oYrGOJ8XVlW5il8tXlGd510n8yetQ/H3JZnYGvI0dQqbPU73hvwbZJzX2KWsttlyX7thiQM0DzLkaj5Y+tDLm08IMMU4l/iDh2UAhMYnn2A/C2CZ1PvFedbThLjbEF8u24Tv1qJ62ihr9RVgw3wd8WMSbDltwzcIbJ0UqEAa0mWlqr5su/wDaHR1dtixXR/6Oo3nFXg3au5GsTslBCl/3NncOJXGqTJAig73ih4Y2KgLWxu7lCco8mHIQdCdJU52gbVXWPs6eJTriWr1Fta5pjO9mKiNxp1oxw/8AZc4gxtYTecR27A5YdPkUrSdahz0FazK3IShr7XiNWCFceNXDTYIseFXlEAAFx5pHWT8qCR+dD3/G93ziz4csmQoZTmuXFdfSNfWj6/syptFvovOIFqUy8WQEt5QfXU0fwn7NfCZZS7dXN3cKUIAC4BPXUDaoeu8ZWs5yRHQeTseMYOWXXi/jj6Chu0w1oSYyslZSJmAVE6afxoa94rcWLKsl602DsG7VCQBOwkaCda75gPgLwQ3dLbucMbfQlZErWpe3TerAnwj4Lw9xaWcFtUJCQBLQzem9Il5zx9bxGOR8PB+QnzKeDy0vxB42vpbTit+4CqSGxlkxEwnqetZzuPMU1yYw9nhOqnII7dtK9R4ZwRgzd2ptthtKdB8oEGT2FaxnBLPDAUtJzhCpMdp60p/iChyxVXyNX4euxmy08wjgPjy+AcOCvkE+UuqH8zW3PCzjJp1Lb7DbRWYEuTr9K9YYMxYLKk/CpRGxKdDtEa0N4paLFupttoBbbqVSEdM0SaX/APIrd+yMEhr/AA3Vs3ObZ52w/wAF+IX3ALq/ZYTHzJSTFdp8HfD5vhe/U85fP3LuVUFww2Jj8P0q28P4QxdpU6+mVHWR8v0q22tsxbCAEpzJ3gVdr1mq1D9/CFx8bpdNzBchrCrppLfw5yFxAOgOtWFu4+IZSgqQoRqFa1QHXxavhSTDbnlS4FQUL/50XYxMlSkiW1BICiRpVTX6f1Eaei1Gx4Ct9glrdsrcaShxpei0n8NUXEbAsksHOVsAlkwJW3O30roOHKQZUkwFbAyfrQjG7FS1puAySUEqITvHUD6V5mdTrkbimprg5njfDjOIWXxSWw8qDsnUKHvUbDeDuHeI7AJu8Ltua6OWsZYhQG9dFXgyWyp5s5mHUgjXY9CfUbUOd4Yu7F9N7ZJBCDLgTqMvt1g0K1dkVhSaYp6eE3lo4tjXgpggvjZv2iEAyttxAKQoVVr3wGMrFi4UQJAJBINemsTwd7GsPykZX2PM2EayPSqy7hFwlOdoqLuywdJHU+hq9pfN6lR+oo6jwulseduDzm74K8VNqdTh7qluNQCmKAPcM8cWCS6bdbiRIOh0joexr1OlNzh1x8Y00susqICAfnT19xTWLWCWVrxK3tS9a3jYW8kAK0O6vcda0a/xBaniyKZn2fh2h/RJo8muYtxDZrU3cWK9D+6aSeLrtIyXFuoEbyK9TXvCOEXWd02tupKRoQkTkOpPqRvQW48OeHMUWq2dwlpLpGZpaUQHB/WrsPP6Z8TgUZ/h7Ux/SsPOg4qaMCCn+NJ/ziQohRkfSu3Yh4IYIpsqYtglzcISN/Sen9aA3PgtharcPWTbjhyklIkFOvX+Hv6Vbh5fQz64Kc/D+Qh28nNE8QMEfMJiZnakLx9C4OYEj1q4HwkafKmEOlt6QUDNoodvQ0OuPB/FmgVMr0iYUDPt71ajrNHJ43FOek18F9JI4V4qxzElfs1Vwh1hhuUFwnMgbAT11NVXjRhbXEF0txtKVvkPEJ7nf9RUW9w7FuHrooUHm1oO4kGo+JYpe4mGnb53mLRLYJ0OWZGvXertFcIz9St8Mz9RbbOHp2rlEIwRrWpNJUrvvWs42rQM5IWdBOlJmNTWEzWDL+Ike1RknAoEETWpg60nLAJmQK2BIlNdlHYFFM6xSiD32pAUk96wqiYO9T2RhipUOlYlahsD9aTKhua2Vetcc+RYWZMnatlwqG1MzptWAab1OSMIcCsqpBg1OQ8FwvMQRpQ6Ok70426WzptFTFkNZJN2kKhYif1qFvpU9CkOpmBrUR9otrj+FFI6L+GNJVFS7W65axmWRrr61EIjQVhOvagTwS0mHRc85vlZxB9aHXLJSoqTIA6U03cFuDFPB7nAZjMUedwCi4kUpiZg1pI+lOutASR1pkiOtCw08jk1pQI1BgU2T61sqJEGhydjBuT3rM0mkVg0rskpZHNf3qSQTuZrUyd62TG2tcd0YQSKSdK2ROtZlNcTg1Gk1g31rKyoZODZM6VqIrKwnYVCfwdgT2pQMmQa0Rp7VoV3RI6e51pJJmsB0rNzREI1WwYrAJrCIrt2DjJEGkkSJrZrR2oW8koUhUaGtq2zUgjzGlpgjXYVKBaNSawCawjsI96UgQKkjJtUpTvTZ1iaW6ZMTSKFko1pvFKVBg0lOp1rZ0qAjKysma0Y71OSDfWtnURSdO5rdTk40AZ2mlpB2Aik1tJg1yIbHM0DoaQZVsKw67VrUdakgwb1uB2pNKIFSjjY0pSVCJpszpWQT0rmQOkyJrAdKbUQUgVrTqajJ2BwkCk5yelaEHSnG05T5tKlHDjaIAUVTG+lLLoAGUERvSFuICY0pkuZiZJNHkH6hbjoUZAIj1pAIUrMaxWUCYpISQDQN88BLgf58RpSVOk00BFbJ1G+1cpHYRsKINaKpNZWoHUxU9nGz0NanUmRWFQAgGTS1W74aQ8ppSW3JyrKTBjsajOAtuRKtRWACNVCtsJS84htboaSowpZBISO9OXVuwy6pFtdi4SDAUEKRm9YOtDuJ2jMCNdKU02XlpbCkpk7k6D1NPm7cRaJskobCUrKyrlgLJI2Kt4HQUwMwbCk9VQYoXJnYNvtBlxSA4hwAxnQSUn2psntS+YSgk60kajWiRDN+1YCfrWaTsa0dakgdRMgxtrVkusPfxrD8KFglP8AZrPlPEjKM3MWdT1MEVV84Aj867x4bcPJveCbHEVtJXnU7mJGphZ69OlZ3kdV+Uq9Q0vF6T85d6Zyaz4Nv7pwJJJkwMo3rMbwF/hssvhZ1MKk6hXeu+/sixsbVV68hKVpEogQD6R0Jqq4rwyjGmbpt1oILyIJAlLKJkfX0rJq8z6s8SXtNu7wbqhmH1HNsZePEOFNYhbjO7aJyuiPMAT/AA9arBaVJB/Wjb9pivBmLllwLQpBzIWUmFp7gHcUVHGuGXFuprEeGcPfUrdxKVN99fKd9R+VbUJOMV6azEw7K1OT9T2yKk0hSVSkiT6x/CpKGWshU/dttgA+WZJ71Yv84eDC429/muppaQEkNvBSVAAgylQ3JIM07heJ+GbbpOIcNYqtokAht9sqOgmCtJA11n6UW9/MRaqj8SKc6toEhpSlA6SQACKQFK0ynfTeuiKx3wjQ1pwfjC341JubdCdz0yGlo4y8MrVRLPh7erAXKUuYo0mE9iQzM/Wu3v4id6MfmSOfNIedVlZQtROnlE+21FrLhPiDEdbPCn1BWxDajJ/KrmPFnAbVMWHh5YJJCgS/idyuR00bKNR+tR1+NuNNx+zeH+GLIBWZMYdzyn0zPKWaBytf0rAxVUR5lLJDw/wqx2489yGGUxu48gQfqrXbt6VaLPwSvHFISHlOEjZtKnD8s7ISf/aqs742+Iaswa4jVbIKs0WtkyyAfTKkRQu78TOOb8lV1xjjjp6j45xIOkbAgbaUp1aifckh8Z6SPUWdes/Ax+31vLa8ShKSsqVaOIBEDYryjWd6mDw74NwhSBivEGFWiySFpusRtG8sfNoXFE9DoOtefnrzFcUcK7gXN4s6AuLW6f1mlt4LjyyOTg9wJ0BDBE/nS3pn/nMNapL9Ks9GIuvBfBFJTfcZYEpWVJUWLm4uhoDpDTETMCJqSz4neAVhKTdXt2SCT8HgjigZEwFPPI6x+HWvPTPAHG13l5eCvAEaZgE6fU0StvCHji4WUqtWmso1K3RoKVLT6SP12f8AsfDU6t/RWdvP2j/DmxWRh3BGM3aNI5jtnbE+XUnK2ojWOtCr37V6GwThfh5ZtFIGRd1jFy5BE+YoayJJ1Iqip8BuIWkheI4xZNFYScqSpapPSrfh32Wxc26HrriJ1a1pkpbtvlPvNVZ6jxtH1SLMKfKX/THAKuvtT8aOZvgsA4RsQWuVIwpVwrLM7vLVr60NuPtReMr6iq342XhwKgoJwzD7W0AIECC22Dt610Kx+yjgriodvMSdASCVABKSe1EF/Zo4TtG1uM4LfvkAAZ3DE9+lLXmPGReI8v8AgJ+H8rLlvBwjFfGXxSxhsMYh4i8VXTQ05bmLv5BrPyhcVUrzFMQv3Cu8ffunDJKnnVLJJMkySda9dYV4AcOWmHfHXPDDAIBUeZJ0HUz/AAqfw94S4cu7IawbD20o2HKGmm5kVH9f00Pogwl4DVS+uw8as2+J3B/s+HuOH/CyVH+FErXhjjK6y/DYDenMdIYIHevcCPDMWzhTFuyNgW0gTPSl3XA9k0oj40BCEGUp6GIj/wBqW/xGpfRWOj+HP+dh4xtPC/xDvESjB3kAjN944lOn50Yw/wACeN724DT7lpbqJglbsx+VepnuFMFtG0lt5xbkJg7DL19qO4BgWBruwpFqtxZ82/lKjtP0pM/O6rG6MUh9fgdLn3ybPLFv9nLFVu2ybjiFhQfMfdtlURvuaPL+zNh1mhpVxjl09zHAk5GwEiTE+leprjD7JnFrUWmFNBLLRKfLM67mpL7N29aoQxZtNy4Co5RqZnSqn9W8hbjD/wDRbXiPHwzmP/s4dw/9lPgO5tPiLm2xS4UVKSAp4p2PoKdY+zdwkxmKOFQpKtAXVqJTrpOvaa9MYPYYkcHZQXAjMklStBqTNCrnAHy0r4m/cSC5K0tmSAkGqkNT5GyT3Tf/AJLT0uggliC/8HKuHPBHAre3aXbcMYW2eStXMW0kk+aATI7TXSOHuCcMtWELYbs2wEJAUhCQkn6UVwfhVhFnlXdXLgFslCoOgzEmP1EUfwbA2G7dGRt1tIglO89P41U1On1Vj90n/wCSxTLTwXEUUS9wOyRjRbKV5lLUhRCRoAOnrJqRhVrYot+Uhk5WlaaaEzI+n86N4thoZukJXbISuFOLAVOpXEJPtvScNZbD7rGX5FBII0O2ivYbVP8ATZSissbHVwi8JFQx1hKH0LcaOdLqgmP3TQvhxtdriDKlNywWVpSkmTGYyKunEFkhRbcSlMNrHftFV+xtFJcb5WWUZkpBH4p1j6Vap8UvTw2Knr/fwBeK7Nb+J3rfKSpJSlaUkDtvNZb2z/wyEQPu0QnywE6UV4qaUL1t5sIBeYEkE/hOsz6VGYefSgoIzeU5jGw6fWrUfFx9MrvXPfyQ8Fwh9i8u3yIGcFMDTWt4pYlLzhdCvLBEAijOCYg02+W3UxzUg957T61l8tL1w62pIzNqgD+dKfjI7x0da2uCr2GGJShwLW2DmnPlJ1nf1jrTOPYC9cW7yUIQvynIqNJnej1itCHnbV0DMggiRuk705fALQ4htsKTBy6nWdqOPj4Jgy1ksEPB+En2m0LLYWsNwdJ1O+1QOKcFYUlSHilCXIyEo1gHUfnVwwLHEPMI+7AURl1PXsRUfF2Q8sFzKuDzAYI17e9RHRqNuWHK/dX7Sh4c0q2IS02pDaUxl6z/AEogzcF05HFytAnbcipV8wG3C6QBzO26agBbaJkFK2/LMbmvQVpKPBiTm93JIbYTfKcYKk5FJkBQ696278SyUqcJKWgIUnQkdqy3vLVhOucOqEJKdR7RTvxSXCWXU6ASI7+3Wl2ZYcA1g77K8jzS1HOmSAaMPOlaSw6EIdI9TPYiqXaXdxYvEpksuKkgb+4qwPPm8tUXFq+PutJPzD0rB11GHuNrS37lgxhsWy1W9zHIfPlVsGz1HtU5AuEP/CPgcsgoSsDQimTZm+sCFqAUoaaSf/ek2N5dtti2eWhxbJOSRqpPQH1rFsqUuUaEJY7H02/wrpLaSlOTM3Gs90+lQcWwJxdwLtppHJcAK0pEq9SKNsPs3rJShoNuJVmUCJyq7+1TbC7DYUxdo5iTGgTBQev0qpKtxeUP3ZRSv2RCxaOhJSrzMLKdY/dPamU4W1bNLtUtpQM0gEaIP9DVxxjBUIhTRWplSifKIynsKiuYQ4pCXm3StQGx1JHY0SlnkDCOffsheGXBtVtnItzMwroJ1yHtJ2rLrDEtMAWwATnKklQ8zDnUH0nrV/Rg9vetKt3sywoeUxJy/wBQahrwW3ZWU3CFL5ejsJ/vG+hHqOtTKTZCSyUu4t3LmzL4QlCgnlvtjXKT19jQX4B5m5WtaF6EBzSAoxuPUiPyFdJf4eFirmW33qVJPlP+saPr3FDHcOVbtqQ2UPtE/NHmynfTqRtURta6OlHJzLFcJS0PibZaS5qvypkOpO89lDqKRguLfFNfs++t085IlKzoVjsPX+NXy5wNK0LDToKM+c6QRP4k9461S8Z4bube4U7bqAyAL8o/9ae/t6Vcrsjatr7K1kJQeV0BuL/DvCcYSX0pSH1CArYpV2UK41xJwDcWlvcMi0Sl3WIAMH0I716Dt8VFw422+oIu4+fLCHx1HpSMcwS0vmx/ZlHLJ6BSJGxA3Fami8pdpJKMnlGTrPGU6tOSXJ44ds7plRQ8wtJSYMimSmFEREd69JY5wDhrTAVcMaunyOASKpmOeGzKFBy0+9QrU+WTFero85TauTyd/gL6nwcgIjrWaVdX+Ck8zyNqMEhSRvUVfAzzpJtlKHoRrNX466mXyZktDdH4KqDFaG80ZuOGL62Eq9jp1qKvBcRbTnFsVDuNafG+uXUhEqLIdohaDYe9a8u6QRTjlrcNxmYWOslNMmJ2j3pqkmKw12LcDYV90olI796TWidNzWlHXU1KZGBUzpSojY0gKHQ1sKQN5mpzgnaKJkzIrOsdKTmH4dawKE7124HaLQtST5dqk8xDySlW9RJifXatyQdKJSBcRSwUkg60jTrS+ZOhpszOtcyUbJO00oEpGhpuRW5I0JqFwEPJezJg79KSoA03WwqO9dnJCjg0aytkzWq4kysIMbVlbkjY1B3RoAATWVlb6GpONSZisKorD09qyuOMrKysNccZWR17VofSsO4qOjhWXTekwRtFbrKhvJwoCKSd611pXQ12TjUmtEkVuknepZKN5p3FYdJB7SKxNbOu+tCEJ61tKsp2mtEGazrXEMd3EwK2I3pANK6RFM+BZpRmk1s7VqoJRrXvW57Vla23EVBJvb61knoK0RtW67GTjNe1ZWxprWutdtOMAMbVlK0B2pJ3rs4OMrKyOtb9DXJ5OZknT0rZOlJPpWztFdnBCWTArTWtqM0gA96UDBruzmsGq2BNbjMdqUlJB2qSDbYynNG1KUsJ1G5pKlwNKTvqaLLONrVmgj61oRuelantWFRiNqE40qSZrY2rAZrJGvpXHG610rWY9K1Jrs4OwbBiszRvWaR60kiaFvLCSFICdVHXWlKWucxV026UhJCRqDWKIUY6VBLHApQa8p+b5vWkJ0WB+tYlakjKI83eltMXDyglphSiewrm0uzsP4EuICTosGe1Lt3WUmH21LQOiTBqcxw7iTxBUgJJMRNE7bgl8gOXNxkQP3RqJ96RLUVR7Y6Gmss+CtuKC1lSElKTsCZgVgVplPSr3Y8BWzgDrlu9k3lZOv0q44B4Ws3CRc/BtIaBkFaP11qrZ5aipF2nw99rxg4s2hxxUNtLUeyUk1Nt8DxZ8jl2LwB1EiJrvTfD+EsIFvhrQWtJhToTCR+lF8O4UtEOlfKDpXBkD7xxXYD92s+38QxjlxiaVf4bnJ4lI4pg3hTxTjKgfh021voFPLMgE7bbz6V6I4Z4SY4J4Qs8NxO7Wv4RJUQUj5lEqKYHqYHWiq38P4abZuLhsKfRAbZaiGieie6j3p22aOKMIv7tUuIlCQdUNdwP3l96835HzGo1qUZcRPS+N8RRoZZh9RU1W9xid0pbzSbcIBUERIZT+8ruqi9jw/aG1D5tVrtlKlttRguHqo9h3o61grToD7zSOSgjlMA5eYf31HtUTErpy5UGUZkoJIWtOhUI1Sn0rN9dze2JqKtRe6RzXj3hW34tULdKCpVuohLiB5wDtl/w+lc0xDwY4gtnSm3uGXEhOYZpEJ9TtXpy0t2MOSm5DCYWiECCVKPc+lIurlDiQ0llBIJVcSPnUdkj2rU0vm9RpV6ceUZer8JRrJepPs8pHwx4rQ4Gjbt5lCR95Gn5VMs/Cbiy8EhNugbSp319q9INYRaPK+IW0k3F0vlgBBOQVZLXCrC0OT4ZGSyTvk0UruZ7VZs/FFy4UVkpw/Cunk8t8HlU+CnEabtu0cu7PmOTASVK0+go1Z/Z6xN8/fYvoInlsHT8675hr1rd4m5fi2hKj92nJ8rQ1A+pqyXDy2rYvNMplRyiB+lVrvxPq17Y4LFX4a0n1Pk89p+zxhtvyTc4jfuh1UAhtKQQN/UUS/0A8PJeYbt7W+eC1hJUtyAfbQV025x+4cxMtMIHLtUBsn8OZWp/pTScbxJ7FWre3BQEDMVQdzoI+lKfmNfNZ3YHx8RoYP6ADb+AnC9hbLul8OtOJQkwp1ZOvtNEOHvCXBm7UqGB2IUBJ+7Hc7VcbrFL523atFoOZ8wUgmYG5qfZFeQNrUqTvAO4FULPJatxe6Zdj4/TR+iBSsM4HGHuFDduwgSVJCUASdoojd8EOvuNoW6hIBEJAEVY8RwN563bfDxbUjzkCRUGxs8TNwpanSpsJ8pIplVt13uyDKmqv24B9nwU22qEr3kKkgkUVs+AMLcSlLj7hUozKT5d+4o3ZMvhoFZkkwPu4NE2Es2rZdcSS4BBjQCOlS69RLjJ0fSQNw7gnhwXKFKtebyvMorUVaz2q5295huHI+HtLVPnJEoT0+tVpm8dnOU5M/y9ZFPpduElK3BGm2Ync7wa6XjLre2d+aqhwgtcYs1YsLSygJUokDPGpO8kdqDIxF/F7kWg0YZ1MGcyqEcV43aYDYLxTEvlQsNNpSJU4tRgJA2mue4v4yqwC3uDa2Fu0xbIBeXcAqIUdcoCSBG1ami/DkreuzO1nnatP28HXMbxJ8WykstpyrBSgTppp/Gh+FsYmprKhzkpWrZOknv7VyW28Z8axy3LLNxYMXjhCmQltpSC2BMHUqzTHpQ9vxg41OMrwV3F2w9bpCluMNNuNpB1jOBuO1egh+FrIRxweel+LdNKfyegxhyUFDaVFSgCVFW23ehzuGKu7lToGiTkAOgmqhwLxiMQuXk8YcdYnZsJQFNrssJTc7mCpUAlIHtQ/iTxEcwjFhbcJceHHMPX8rl1hiWSFzGUp0KhGpiKXX4WUZuCjyh1nn6pVqeeGW+6wRDznwxUUlRAPXarJw3h4buVqSkEJ8kFPygVzbB+OsWxa0+PWWm1pcUypKGgRI0kekUVt+N+ILRC0W92hE+aeSkn9amzR4WzAdfkYy9yfB0RTabq+UvmBaWmSCUjYnXQ1ORashNuhCiVJBWT3EGuVM8ZcRNAuN3zcLIk8lOv6U6eOeJnCZvmyQDMMJFJ/JyXEUOXka0ucncMMbFrYssb5WwmT7T1qLduBaHXjCQpBRqNe2n51yhvxK4ybSALu3WlI0m3SdKeb8SeJHH0LfRZutggqTyMuaDtIOm1KjorIvLGS8jTJYOxYYwyhl3NITqCAIHlHajGFWrbTFuE6JQgaATM1TPD/jrB+LnL3BUM/DYphrKH32FGQttwmHEE7iQQZ20irzZrSzctNsrhIZKQmPxyI/Sao6hOEsMu0zjbFSiB+KrD79TZSFKUMySIB70EtbVlSyW2ikFKVkzvvAq08SsK5zTqSNdFR+9VaTzGQypQkhIGUK1IBOs9RRxeYcHfTIH8S4eoWincpVAS4kJO8dDVebtUpzfgyOFwebcH1/nWuMPEy1Y4lZ4GsW2zdlhLl2/AJaC5yIA7mJPYUOXiF4Eqb5pgypQyAgnsDV6mixRzL5KV2urU2l2ghilr8dg7qeUCu2BygKk5SKrjb6UoQoToIPeaJsYneozpF0oJIIKcg/ptUIW1sCnMheh081PhBxjtZWnrIuWUQXbl61fQtASrKAQQNF/0o0kh+2LrcZ9FCDqe9RORbEhBSqUmAc1aZLTCiUOOJKjtmkfqK6de9cE162EfgTfWyH/7S2ktO7+21SktC6SoKSEqA3NMvOpXKUvLVAiJ0mkFeUBIdcGmpBpbok1yMevrfwD1tP4S6by3QVn8SR09aN2+Js4rZhXkzqGsK2NDi87mMOLynp6VHS3bMkvMtqSc0Eg6k1MtO5IiPkIRfRNXZJLqmXgMihlOpn1ND7vhpwgPWlwtOUmEqI1H86x2+VnJDjgUJjWhH+dt5ZY8xw/fhC7fEElth4DKQ5vlV3B/lXenbWsp8Ex1lFksNBJq2LToQtrNpAAAgnrRFpmwtTnDQMiCkiSDTQXeuKUlKEhwnQLByx3ozY4eW05l/euKPnzDpVW65/JoVVrPAObtbF1PObQtMyACggxO9R7bn26129q0Usqk5joT6QfWrYuySllSVhQ8sJHRPt60H+EUiAXFKcBMf86zLLcrDL8K9vKJOFpaP3jg0EGAZk+lQ7R23ucRW+iTLqpme+gpLpctULeT5R1M9etAcGvHFOBa1QUrVlMbkmqfpbluLLs24TLwy20jE0oddjOnUgUXet7JaW7lKSHEHllxOkpPQ9xVDvMS5GIMKJUCEmZ/5UdXiVyLBaxmUkAOJyH1GlVp6Z9jY3LpFyw6xzWqm5kIPmkfrFCn7Z63xLkKtnVMXCT50DypUD1g6abVKwnE1KQtAEpcQHEqncbxUe/xS6aSLhsAifNOxqkq2pNDt/BHQHGXEuahAXCh1E7GPenMUUp1orbSlS2wdNvefcVFu7t9fMUlvKl1sq0VsoU21dLuUNKcbSOYMi+sEdfrTFVnkDfk3bqK7blggIySj0Hahb1olx3kIWUh9wraJ1CXANU+yv41rm3NneLtBCVKJdaCjpI3A70zcXC3yUhJ5ZEpymMihXSpa5QUZ54Bj9v8EtVs5LZaJKc2hIPTsQKiDCkXCFIWAGzJU2PmbV+8k7UTu7g3mW5UQSPI6VDzZvb1pbKEBZsEqAWBKEzvP7vf2qNj+AXJFG4p4eVbpENoSpwBzM380JE8xB6EdRQ6wxZu/Zaw/FFtt36FFTN00rKFjfX07jpV3xxpD9mm3u0D5gq3eKf7tY2Pt6Vz7G8IWEOOrYSytslTiUgyhX76PQ7xViC9RbZFectjyhGKW1wjMl5gZ1KnJnzJVH4k9KbYRYPq5eKMZBvmAg+xrLC/ShlOHYrkcDgHKWRCV69D0VTuL2LziUgLU4hsShfyls+sbijeU9vQvh8jN7wHh19bqurB1JGpzbKHuOtUy84Vesbgt5UtLWnc/wB2sdz/AFqyW+LX2EXCJQsJ1JT6fvJoooMY9bqumUhxYVJUn50E9x/Gm13XU8SeUInTTb0uSktYBYvups37ctOLGgMFJHcHr7VCv/Dlto81gHJJlxOoT/tCrJfYPdYc24taQ5bJUPvUAkA9JH4TS7DHHcPWlq9AebElLpTJSD+93HrVuOqsXurfBWekqlxNFBuODWWRzLu2SpKtlo8yR79hQe98OrJ8c5ttOUwSpB/513FzDbXFG0PWRaBcJJajyrEfoaCmwbbdUgpFu6xCS2oQr1kdRT6vLWRfDE2+IokstHB77w+fYWvLzEJnQ0JueD8QazFJCkgV6MNtarXy7thAKtzPSm1cNYTfgpahLgBAMRNX4efnD6jPs8BVLmJ5ouMAxK3ErYP5VDXa3CB5mljWIIr0Xd+H7snkscxMnNm3Hrr0oHiHAIUypbDXmG2ZG5q/V56qa9xn2/h+yPMThpQrqY961lWRIrp7vCFtIafaSCdYyEVBxHgS2Eqts0RrA2q/DydEuzOn4y9HPRmmlZomrG/wbctkoSVZgYCSkyahPcMYizqW0kd9qtrU1S6ZUlp7Y9xBGeNKzSdqmLwXEUgqNo5A60wqzumj95brT7imq2L6Yt1tfA3WVspUn5kke4pMjeaIHBusrARvWSOlcCKnSKTEVrf2re1dkkytgAda1Wba1xBh3rXU1uQaw6dalM411rN9K2PzrBr0qGca2GutZlB1Kq3Wu+lEcbmdaw7bVoe1bBEHSaE411+lK99RWvpFZXHGUlW9bPpWAA/NvXHG60qsnX0rFbbVxKNTGwM1hPc1g00rYANcEYdtNa0IGtb2EjStEVy5BFfWlCY1pNbBMbUz4BZtW1J6xSo6mkkazUHIysrR7VugJMrOs1lZXHG4kCtVmuwNZRLJxsHvWjWtfStioZxkwDWGsV8tZXI5mVg3rYA71ob1OSEjZJM1oCa3B1rWlRnkkUk6+1YZPWkkpFakHrU5ydjIskba1o6daROu9YTO1RknaKkd63mEzNIj1/Ssyxua7J21Cir1rUydKdZsbi4/uWVKHeNKmIwG9gkpCf6UDtjHthqqT6QO1J0rZn2qwWvCj7xzKUT6dvejFpwQg6qRI7bzVaesqh2x9ejun0ikttrWfKkq9hUpjCcRuCOVarg9SIrpWGcIsqWlKLcFI1JA0A7k1Z7ThD7lKWEEpBggJiR1NULvMwr4ijSo8JZZ9RyG34Ov3I560oJ2A1NGrLw85jYcecdKCRBiK6vb8MsMtlb0DL0SJmsvVN2yR92MqNv6VnWeZsseIGjX4SqvmfJQ2eArO1yqLSAD/vGpjHDTangzb2/NWnQIGyRO5NWi1sLzFXUBlsoa6qIiKOM29lhTSLXD9XFn7xavm9daqWeRtSxnLNCrx1Kf08FQRw/bWepa5r/zFQGifQUUwzhtN2/Nw0lSlHyISNvU0dtcIVdXSWbY5VqVC3YnKO8+varIhnDsCtCMwCkDzOHVSldvc1n3a6bW1PkvV6KC5a4ILPD2HWCA5dFJLY+QnTaol/iXxaBbtI5Fv8q1pGqgNgBUe6vFXr4eunFBkj7tobrqZYWAUoLLHNUvRKT+E9gO9V8tLdNlpKL4ih3C7UJaShQVlWPum0jUj1oziGJYbwxac51Tbl86nKQJUU/4Uimru8t+HrQ3NwQ5dKAAO5T/AIUjvVfFre3V2q+vmyq9fHkbnS3QTIKvWKVGLuluk+BsmoRwuxhDF1fXYxF51HMWZyyYt0Hef8RFdJw02ww5gpaCbVsQwz1dPc/XWap1lZ27y0hKiLVhQzn/AM9Q3E/zq4vXjztu2xZpQHnRvP8ActxoPSg1D3+1BUx25YNxC/vcQcVZIVmdIPMUgwEjonsBS7SwbS4pN0tCmmwCsIMZuoSn67mkfBIJytqdXbt/OGxJcV79qmWAU4/zW2U29qyIVmVoB+6KTNKMeBkcvsnPWa2bJTzxz3DwhhMyEJ+nehLFqLi4LaAQ1bk5nCNCrqrvtU3ErpTgU+ASpcJQAPl6SPpWsOZ5ZTh1osLdkIdUfwjXT16GaSspZH4TeAngFnaOqXiGRKQglu3B0zf4j9al8TstM2QsbeA45q+oq+VJ+Y/yqfa27DKg0ysJbtxrOxVGsVX+IbkKZuXQ+ogAAaRqo6D+tV68zsyxk0oRwRcCwxLquYgIyrVlSJ/DGlF8RYCbdXmTkZQcuvWNTUfAVq+FCQnzFISnKdhT/EBUzbotVukOLKUr7EDUj+FTLLtISSr4KpYYUi1cTzVpJnMuTIVOsnvrU3ALYX+IO3ZyJzLKWztoDHamX7pacyglIiUgTsdqm2LzuE2ReTDikpkSIq492CukshZ63YN+tTYCuWnlpUTEEb/rU/Dxz3kpbJ2nQR7zNAba7W822or1MKkazrr9asmGAhsqkqJ/EE6+1LlDbjI1NNZRNuWi5AK5EQMp2NLscISlZ+UNpBV21P8AGiFtaqWhLbuYaST2p9eRBCSttCEAnN1itbR4wUdQ3nIlu3aNuFEA5lAHuNY/51yjGeOMSQq9xhm7f+FffVb4bbtwWlpRoCokT5jJJ9u9XPxCxxeF8Pvs28fF3p+Dtgk6lxzQnT91OZX0rj3Eb9s3f2ODNFZbw+3EkGQpwxJA6dNK9Do6Iz9zRh63UOPC4CVrxFxZcNIW7jVw2oqlcAan0EaCin7a4heyr/bN0AIEJIEiN/zobYlSGg2EJScm5MAenrUxDjahnS6kJCoITr9ZrV9OC4wZHrWctsqnE+IY3iuP4Zg99iL903ZNLxBYWZTn+RH8SarGPYXxEtx1lGAO3rJXzEraUk5h2Uk7/WrNgTwxfGsZxpUqacuBasKj8DYj+M1ZkpaG4EKGumo+tWqbnp37EZGpq/N5U2cxwvCVXOF3X7S4XxVvEc6DaBrDGVMuoI1LiyQpKgREAbVLseGeLlXAbZ4bdZs0J8qMqG1ZiDMAEAD11NdGRy0nNmBA1/8Aeng+EEEKzHfMOgq1/U7olT+k0y4Ktwijxo4LuXrjgriLF8NXeDlP/eMKQpEkgKCtDB70vFuEuPbzG38d4jxFnEr67Ubp24W40nO7AAJynyD0A1irMbgGEhIUFGDppTjZEg5U51aKgCDSn5C3OUOj42rpsjYLh5wnCmsNdeTcuoUpx1YSUpKlGdPQURQGxpEEmQfWttpbEKSJkkEHrT6QlRSVa6SNNqz5ScnlmjGCitq6GSycvlPl3AHelJt3FjVCknuetTAltBGmUA9BtS8ufTeATUZZO0iIYAmCT79afQ2EmNIGkTAp3IomYAIHrrSFIUlMSpWx1qDgBgHEGK4L4w3K8Hv1W7lxw+ELISFBSQ6DBBEdjXU2uPuNWSFftcSEAA8hH57bmuK276keNbbWaAvBlJjb1rpaHEtpIelKzpBEj6UvU1wk8yRY0VkowaTLC/4icWX3LL+J5CBE/Do/PbrQ1zjHiJS1TixSEqEJLKITrMbbGhzj7bkpSkTMhOxjtUVwlaVhQykCcw2P/W1JVUMcItu2zvJzA4/cveN+Lu3FzzFrVaFStNAGwIgeldszpKgBrr7SK83YqVWHjliEqUkPi3eSSOhSmvSSUh5pK53SDMamrl6UYRaMiqTds0zQ3Mggjt1rS0GQMxkzP9KXy1CAkFUdzS0wDlVMzoIqvkfhEckIic3uKxcpQCgCTpvM1IU35p1gneNKbLeXsCf412SduCMtAhX4Rpr2pBEqABEET9KfWyNJM6xvWikIQSEiZ+tQ2Q1kYVCcqY310PWoy0L2MbknWpDoHy/MCrttTJCgVZiSNYmiUgSGtJz5VpT71V+N8Lcu8LFxbEoubVYeaUn5krGoIP0q2vAlJUUCCBsaiOoS6yttZzIVKVJidDTIS5Bazz9ip4Xj2MXlmxiaMVuFKUAoEnVKtlJ9dQaTe49xIzbLTa45ctKWoqMOakg6j0ofgVuqwxXEcDuEhIaWbhjN1SfmA+sfmam3gMHMlKZUARMGO1dKuvPKLkL7HHdkK4LxhibbVtxG9e3LptHE298CSpLzChuATEjUyB+GrxiOIXKMrzIHLACgrcqB1/hXJMLu2rTGPgrhKDbXqS0tStSnN+IexH5TVz4Zv3rnCVYS8ZvMIUGFFW6m/wDVn10hP0rH1+mS90UbOg1Tl7Wwjd4jevIWyowFajpUTD31lCjOqeia3cMvrBCykhJBCQdprdoptLhQtJSFGFKSNj29qoqKxhF/c3LkkYrcJSWnkhQSFZlGZIBGtGMLu1loJWsLTEwenpQe6CVMLSCBl2AGh9a3YPy2kkp84JgnYihde6Ie9qRbcGxVTaw00UFdosTru2dBp70Xukh5l4BaShYztEdD2qlNuuW2I2zqJQy+lSSUnQmJg+hO1WW0uFLtuWyAt5AzBJOgPaqVlG15RZhZlYGkPlyzKozFAhzTQA0zY3aGlO2S1DmKOdkx8wpq2eLTi15yEuyCgjY7EGoeIL+HUhbQAU0oKSoHbuDXRqRzkS8YezhF5b5QpBSoKUJ8wO1MNArKcjjfIcBW0r93uk0RfS24FsJKS24OYkAjTTSgGGOKLt5htxmCgrO0jpmAkkfSu9LKwdv2hJtjmOyBKVeR0f4u9PvWeZRswG0v26QtpU6q/nUMJceWh0lSI8q1oO/aRViRLwQUIBuGJUhWnnHXSkyhtZzlwVnGAq5tFIdbl38TY/F/iA7+lUp62fuUlhTg5iJ5Suiv8KvWrzxC440eaU5UvGUOEwUr7adapt1luBzWkpS6klThT+Ej8Q7+tNVSayhKmUnE2Q2wslKy2lcPICvMwqfmT6VMwjF3A6myvnQtSx9y8nUOo7e9Fb1K8UcNzaoV8a2j75ECH2u47mq3iDCLNMvWylYa4oF4CQu2X++OwpqgrFtYuTcHlB2/wG3u2XH7VSpBByq3R6pPagqWbjD3JKwCRlKuij/ij+NEsEvXLUpsrl5K5EtPk+VSf/ap97aMlvmJSrKkHnNgSUj94dxVfEq3tl0OwprcgXh+MtOLVZXaeW85IJUJSr0PT61mKYKGEfEYcvOhoDOwqFKQPQfiBqHc2AazLQQ5bK1acBkJ9+sfwpOHYrctL+FuRy1iEpWDv7Gj2Y90Bbln2yBtpiWIYdcKLQWhCtkqGkek7H0o+jErPG2UB9JKtUhSTCkL7TuKl3WG2mKW5bRHNAlWbZUdR61VVsPWdzzLZxSXUnKQoRm9/WiSjcvsznuh/AWfYftWw2pHOZzSFx8p9f61pVq26nmYc6oLEFbe4nvNKscZbuUcgkNvD5kqET7UhxCU3BfYSppyNcuyx7UrEl2Emu0OsX97aJhSCtuZMnzAdxRK0xHDMTQplxSUPmcqnB5SY/Q0PbvW7hSbe7QGXQcqTOhHcUm7wth92G1pDmohY0UOtLdazl9h7sLIvGeGLW5YccDJK0JSSJlQ7EHqKrCcKbQ6WroiRqkjWD61Yra+xG2UbR4+VEBBOhA9D/Gm8VtStYuGVErIzJSob0+qc6+GxM64SWcAF3h+2ukZAjKSmUqjNB7jrUNHDgdWq1u2pKNgEeVXqKKIxHkoKnGlBMnQbj2mpqL+0u2gULSkgCFEGUntHSrHrXR6Yj0KpPoqt5wi1bJzO261NEzm2ye4oJc4HYXCHGyxlBV83Udo9K6hbPMXbC0OCVJHynqKrWK4YWrg3Fm2h1JEloK8wHcVY0+tsbxJiNRo62spI59ccHtuqP3eZUDMFJmB3FC7/gNAUFMIMdY1T+ddLNkbpALRTMZgCuCmP+tqkW+HfEJyutgFJIKxpPv6Gr68lbX8mdLxlVnwcTc4PuEyQFDt2FQXeHL5sEqSTFd8HDXMQtLaGw4N0k+U+1Q3eFUrCyLbMlOi2zuk+h6/SrFfm3/kVp+BXcWcFOFXif8AVfQb0yqyuknzsOAbbV1zEuE3LRQcRJZKtFBM/Q0L/Y7rbyQWU5TPlOxNaNflFJZM6fiZQl2cyU24jcKH0pMV088PMPpWVWiSB8wjzJ+lCb/hFbR5rNuHG1fu9qsR8hCfDET8dZFZ7KNG+u1ZMjarIvhuUZmm8yTuRMpPY1H/AM3ZBRBSe+4qwtTB/JUemsXwBBMaVkHaiz/D14zoPMegA3qCuxeRJKCYo1bGXTFyrlHtEeFTW5inFWzo83LO06U2pCtiNe0UeUBhmZqTMitgAakajpSxlOuUCpRD4EAyK3Gk0pQA1ke1JJ8sCj28ZOXJrfWtjbWsrKFkmGs6VlaJg+lQQZrGlaJhJrfSZrCNK4LJusPrWj0rcRuCZqUsEGa0pNJ20rYMVKfwC0L+b3pJSR61gVrtW1a7GKkgbO4revStwPSskbxQ4x2EamtDvNZmEHStJI/dqCcCpnpWla1kpO81qdanJ2DY9a3MUkq12rNTpEfWpZ2BWh0mtKMda1lGxpxNs6sQhsn6ULaXZKWRsk9KwKPan/gbgqy5DPUVIRhT69NNaB2RXbCUW+kQQpQOlakncfkaNWnDjt0qBmgneNKNWfB7TaiX0kgHTSSaTPV1w7Y+Glsn0imJbKtgT7UtNq8oSG16b6V0ljha3YQHH0H5fKmPN7VLRw9bttfFvoSmYUhqJmqsvJwXRcj4ux8s5inDbspzchQB0BVpT7WCXzg8qMv0rpbXDhuTznEeWRGVPy/SirfDrVuglYOuoUdvakT8vHOEWK/DyfLOYMcKXCk5nVkA6j1qxYPwMhRQ682CTqAddKtNpg/xt82gEIQ1EJ0n9atTOHGQGFBJ3Uo/hHpWfqvK2LhM0NL4ivPJUmOF2WZbaZIAEDTSpbfCduVkONScsaCYE1dbWyt2khttuJkZl9fU04toIQGkDmaSSkiP61kT19sn2bNfj6l0irp4dbt8pS2M50KR6fyqdacPWzscxZDMkn/Ee3tRm1wty5cyhoFIUnXLt6URuGG7dKW7dnmFIMR5UpPUH+lVpaqUuGyzHSxjzgi2uE2qmpyBITpJVlzDtT79w200GmQD+HMO3YVAeuHS4kPAQBJA0SO0CoT18u4Uli2WpxYOVxxOyT2FLUJTeZMZvjDhIy8xHnEs2gzuyNAYDY7qpdvhdogi5xBKlZwDzDrr7VKtGrbDbdWdn7xUlWczPcq7VDuLx2+zJQkcjaOqv5gU1SfUehfDfuJFziKXlC0w1rKhOilpMTS8Pwl91ahzCOq1A6pHT0qThGEhYzgFlkDzuxE+lF3W2mWgsqDLDYlAjVdJnbt4h2OhXxlibd23wqzCeYlu3G6lAlS1fzNDLu7YxB4PPpKGkEBtomVKV3NRry8XeXGRGVa5KkoV8rY7mn7JltgoCG1vOLPlKhKlk/iPYelQqtnvfbIdm57UPscplBQGAq5cHmETlk6D2qc643gdom9ecUp8iBlIlPYD3rbaW8KQ5cOrTzD85VtmOxHoKDuvrvbhFzcokDS2Qv8AGqfnUO3apUfUe74CzsWENtm6urxF7cOZn1KJbQrUMJPX3otZ2irlSra1c0P989miB1it2VnzXE2TakFxYKnVnt1J9Kl4k9bWjRZsgEsNQXCkjznt3rp+72xRMfasshYlcMsBpi2RKWvJbtf+YeqjVrwmzdt8OQi4Wty5d1WvN+ntVQwlKWirE75IW44cyQB8qeg9K6Ng9jnskvjMlSkzJHyp6R6mguiooKqTzkYuLVaLJNrZJUtS5CEz8p6mmvg1Jy4Ygy0x94+6ep7VYLhteH2Cn3o5rwytdQgUKatFpQbUApCoU6tUd9AKoyluLcECeRdOvl55stoTolAOpnaPej2HYf8AsxlV66j71YylGkoMaJH6Uq2sviLwKSoFu1+Uj8Sup+lTS029cc51cMs+ZRO5V0GnpSZy/wAUNivlkK/vGcNsoeKpUZOmY5jqABVauy5iK2rFpRVKuYpGkz/yo3ihTf3BWsBCWR5htHaouH2RbUXlqlajKDm112p9cYwjliptzeETsGtVoU3bKSUtsCFKBgE9qYvm3r3ElrMpYYTy0jcFW51+kVPuynBsOUFkKc1WpIEEqOkD1oFeG8bscja8jjg1Gm++lJhHdLI2TUVgaVa29zcltKU5Wj5lJHlKvejFzh7LeHcxSkuLKcqdBAmhWAWqwlDZEKSSSDOp670RxG5Tq5lAQhOQJPf1p/O5IXwo5IWAW+dpAKiUhUTlg+9W20Qy2pAaUSifLJiq1hyFNlKSpY5m8bVZrJOUlTgB5YkE/r+dNnHMgYvCCqbvZtJXAGZZCtuwNMF03TgIVv5lSJhKeo+vSoZdJcS2NFvGSlPQdJntU26vrfA8KucWv1JLdsyp5Sp0CE9fqf41paSOGUtRJYbOdca4oi44wDDjk2/D1qp95IOWblwAn8kQO/mNc7w9xV5fPYi42S488XFDeEnb8gYohj1/cqwPnXTak3nEFwq9uFHRQBUYSZ1AiPeKbwK2aQ394pQQBBymvW6aG2B5HVWOcgsxJ8pGYJG8aT0pjH8WGD4De3xSlDjLSgiE/iIgfqamlKEgZAtWYSZV071WuNnTcMWGAlCUrxC7RmgHRpHmO/sKsrllSftgSuFbEYdgNnbOSVlsLck6lSvN+dF4USMpO8R3ptBhCUpToIEg61MbAESkqJ8wPpUyfJWh0NtpWPwqAIMyIp7lKUglI0iAPSttSolQCoBiAelPAQDl0A1E6xQsNGmm1IAzKgJEz0H0oC94g4HbvFplm5eCVHzJSAkR2nU1Z0qUn5UKEnbt60Gu+CeG764XcLtFtLWZytuZUknrEU6iVKeLROojc0nUDHPEe15rarVhbbMysuNhSo/wgEVd8MdGJWaLtDLrKXE7OAA5ehquDgHhpQTDL6YMn77f01FWTDGbHCbVFlZtENJ6FRUa7VS07jirsjSrUKWbeieLUFZTzZzA6dyKWm2gykSVbTtUcXzRVzMo0201p1u8Czlgn0Bis/LLucjqSCqEoMAQTSVp6AmJ605IEknUjemyZy+add40qUztpzh9xDfjvYhSJzYUvTvoa6gysKYTzBCgTMHauU37Tr/jthqkLWkNYW4sn0j/AJ11a3yA5SBsNgdaLUPDQWk4ixELKgMgW4ExvtSH+chCQhsxI8u81NSljmFIaI7kKMim3QgjI2SkjqTMVXyWnI4L4isKsvFmzu50uLJoEz1Rp/KvR2FOC4wy1dBzFbKSPyrgXjWybTjDhu8cypS4y6gnfZXWu38I3ibnhmxcSBAaSNKuWJumLM2GFqJIKZDmMj9fzpKeZMFKVaxI3palLSCdTOm/etgkJ1KVDv296ptlrgbUFIMJR5h1B0pABTJIAnaafM/NI00GtNuAgeYaHTaoOAgx5Tlw6xaYVcOBheVTqlJQJnpO9bGO26L5qyv7dy1euCQ1mIWlZ7SDRC7w2zvAU3DCVydCNFfnNM22FYdZrzs2qULGgWZUr6E01SjgU92eB1xqZSSSR2qO6gag+eT0qUopAkSr8OtNKQTolET+7UfwHh/JBUIUUrGp39KjrTIMmdZG1S3GCQog/U71GcGXUkADzD1olwRgpfGLCsLvbPiNtEC2XDwnds6K943pdyu1um5UpKgRI22O1GuILJOIYdcWi1pOdBE+42iqPwu/zbFVjckF2xcLKxGpTug/lP5UxLcskVS2y2sYxe2SvRIOZudCYJB31othGMpsr2xxhKQhp5CbC9TqJTpldM/Qz70xidupKA62EKSr5Sj8PvQ7AnENXlxhd1zF296gtxAO/wAsdd9B70NsFZDDLdMnVPKOqvwl35QCpRSSB+XvWm2Hm3EFKCUk+Yd/eonCd05imCi3ulI+Mw9ZtbmZBJSBkV6ykD9aI81bjamwuSo7gapIrzU1sk4o9LX74qQziJcQkEaJI1HehwuV2ryHFFIadIQroUqOxHpRR1C30JLgQQBlEjXegWKPBhSErSAnOAoGdjTqllYBseOQ25cF1iCrNkVpm3SRtFGsNxZt5TTwMpIEqGhkdKrVhdNuKbUlbeVEJUD+Id6mJm2vjbZlJCvMnLtr1rrK0+CYWY5LBdlpsuupRv5wDrr3pt15i6BSlIOdAJST1jU01b3nxNsVFtKy1IUCCVKQf6VGb5Nm4i68imEq+b0Ox/lVZQ5H7skjDL5tsJtHUlJtyQlW8idKTitsHLlOJNeRSwUqIVqF96bunm7a7ZuoSUqlO2kVNQpvn+YnkvgIWANu1Q47XlEZ4IFpcoWErcMOMkpdTvmB2VVgtn3kNJbbypyEFtZ6iqnfoXg98h1qXrdcpzEagHoe8UbauWvJZkBAIBbIJkg7CaGyCa3EqXBL4hQh+yXcAJXaveVzSC0r98ddDXNX7p+0vfhyAheX7tR2Pf8AMVfnL/K+VPLUG5LdwgCfQLA7d6qvE+Dp5iLdu4K0gFbJ7dwD2k0VCS4kKnnHALUw3c5cQs1kpbMLQn5mld/anLq1GKWblwlgB4goebGzqT1ioFvd3GHRcEZXGzyXhPzD1FT2g4lYvbB0mFQmdBB3SR/OmzpcXkCNqlwyquYWGrb4YuKDSSSy5GrJn5VT0/lRPD8TddSmxu1hi6aADakyUn67ZTR26wxl63XfMtrU2987cSoEbz/Kq1e2TlqpprOlSDrbOq6ehodit9pzbreUF38NZdTmZa5TioLrUeQjr+dBbrAkpCXmEKLBJUURLjfqn0HaieFY0/ecyyu2+U60ZBGqkkHc9x3ou7b5rU3FuwEupOYJ3Cz3FVPSlS8FhTjaslew15+zdDV2hKkrjlkD9aIY7h1tiCG3ktJCiNFgQVH1qE+lLran2kLgkl1ASZnqoeo7Vuyu1Fr4O4uFFpfyPEwUjv710qmnvj2QrF9DK1d4Qkq++lDqCQhYED6/1qXauvcpKHYLrXkVOh+h7RVpxTDW71tKc4DmUZHANFRsaqd7g96hcPNrSltWaZ8w7kUX6iwwWnX0S/hA8hSWIWg6AEQR7U2y5cYefh79gra1idVJHeo9viC2XwxcK1CoS9shY6A9j60fbetb9oN3SVpWiYP4k+sdR6VXnGUexsGnyRVCxuG08pQT1Cx0qO6i5S1zVJCsvWf5U3fYc7aXCnGdRHXRJH9TTrWIqKOVcNq5YVlkp1R6EdR/ioNrXQTfwyE7hlvdKStTUKUiBGhj+tR/2ClLilBSlHrG496s7DDCm+ZbL5unlQUiVD01pFwlKUJUDBOx6+09KH15J4Rzpi+yshi7aSoN5VLB0MzHpUW7tCpklQU2opJJ6pq3qspTy1tISVn5pkK6zO1QMRw9xCC8pAkCNYMim13e4CVHGCiJYvbJ8uuPKdBkqkUTtbmxvCUsXDTD0wEqVBBHdJohiOFtOs81tYC1JiCNo7a1XWLNu4dLN0yhLzZ+fuOh9KvwauWWU5xdTwg6xdZszZeQ1cNKyqUkSAe09qX8Q6t5u2WORdD+7WkeRQ9/5UDcw67ZWXrfNkVqFz09aLWF81dtC3uhqmAnN0V70udaXQcZvOGTZ56S1fsNhaiUKVHlWPWgeKcOt2+RVulSmgcxHVHt3FGX21snK64tQI+7XP6E/wA6kC4KrcN3qFBtQhK0aqQex70uM51vgNwhNclPXhraEJfStRjZ5I39CKW3YtuqyNJSFnVTZHkX6jsaN3OD3Daee0AszII2X2kdDQ51QzOJKVtuJIzInb1q1G5vp8leVSh2gbd8Ml4F2zSlpUEKBTse3r70CfwgB0pU2ltw6ZVA5Vj0PerjbYspAAuM61JVAd2gdld6krs7PFEKbfBzLBUNdNNiKdDU2Vv3FeenrsXBRE4Y1kLSkFQSDKQIWio9zwyxcozpy5QJzo0j0UKst1aOWFwG7xDjjSDlS8ic4H86XlZbyvMvBIVKQsdfRQqzHUyXMWVXpIS4kjndzgi7dwNraSmdAtB0Ipg4S1/rkACYzAfxrpq8OYuBkIRDnmUhXyn27VBueFzaOA2oUsKP9050/wBk9atQ8h/yKtnjVnKXBz1zhufvGkApIkFIn8+1Dn8FcbmWpjQkGr+uwUy4UNMlDhJlC/LPsa2m2YuUlq4akzqopgg+oqxHXyXJVl46HWOTm6sIlBKM2m/pUF+wureCpAKTspOtdMueF1o+9aaCkd0jWhzuEqQk8xoAHt09xVqvyK+5Us8bL4Rz7lmdVJFZlSB89WvEOEg6C/ZjIo7AzkPuelVy7tX7F3lXNuptQ7jQ+orSqurt6Zm20zq7RG8o3JIrRyk6DSlGTrOlJNMaFGjpoK1OlKpJ3qDjc9eprBmB3retZR8HGyTOsGszRoUjX0rUTSgdP+VTwQYC2dDp7UrK2rQLIpbTLj5htGZM6kjQVORgzhTMQfrSpWRj2HGuUugWpACjC5A9KSQSaJqw5tBypVmPWlIworGdf3YHelu+P3D9OS+AUEH3reUEaUdawEuJzJQQI+Y7/QUUt+GW2m0uvZUpIBPM3V7ClS1UIj4aWyb4RUUMOLkJQTTqcOuFDVIB7Vdhg7SJ5iQ03umfmVS/2fbNlADRUpegbTqv69qQ9cvgetDL5Ka1hDy/OCcu0x1ohYcNvXqsrTOk/MT0q94Zwm6+RcXaUoaSJCSP+pogthiySpLbfKaGgUoak1St8nl4iXafF590+intcL29usNeRaxvEaU8MKYGlugFSdC4TomrF8Gbwj7sNIO0fMo1NRgSW2ktqZOUq8qAdSarT1kly2W4aGHwips8OKMrIJG5WoRFGsP4TVcQ5AbQlMZ9yo+gq4WeANgJ+MlQBkNg7e5qY822MqEnltJ3UNIT0Aqjb5GUntiX6fG1wWWivJwRi2GS1tE83QFOkJ9+5p1NiptxNrbsFy5kFSjs37/0ooyht5Rt8KSUpTop46iOsevrUnLZ4OzAWQo/MpRlRPr3NVXfJvDfJaVEY8pcAy7as8HYNy4Dc3avI0hJ1Urv6Cotow9d3KH71CVr3hI0A7AVJQy7il5znWnAkDyJ6k+1Ere35UJKSET5iDMV05qMcfJ0YOcs/BIYt7VhJcU2dBsQAkCoF6rM+nlgOF5WVLYGkURyqdUi0ZRzNZ3n86IWeGi3k50qdUBnWRr7DsKqOar5fZbUN/CBVrhCbbMHjnedMrUVbUUbtAlAUtMpOsg7x6VLNs0yvmPJk9RAk1HLxzqS2gCJI6QKrSslZyWY1qIpfnUCryISAcgGiqW02wV5F8xX/wBMHMsdvSsSjOBkJUoRCtxNLbUtmVvNwo7gGAfc7/QUISTT4DTTTKWUrbGSEnyjWfT3oLiF8pThQ3GshUdKh4ljLiZZtjlKdFKGiQKitJ+JaK1OFCCBKts/ejrocfdIGdufaiI4i4xF8WlkrI2kEur7/wCEegqRmtsIZCGeWQkQpajrNJdu2rNRatQltKU9en1qKm1dxpYM5Wp7RJFW0srL4RUf7diXri6xMZMigkkkqGpUO3tR7BMPa5IceQEpB313/dreFYPGdV0oBlIla9gY2Aqc68hTfMUOW3sADO3YUm2xP2xHVVtPMh+4uEts53Ehu3aMoQnZR9hVbxC8vsRuEM8zkpJltGqjH7x9fSn8RvHnlAPLCUlUIRpqKesbJCV80vpcuFACQJgV1cIwW59hTk7XiJq0wxFugpbUS8v51FUkn1qxW9h8CyHHUkvLGsjVA7UvBsMtkAXdwkpSlRy6/Mobn2oVjmL/ABNw5h1msjq8sK+QH170r3WyxHoPEa489ga7xAYpeuN5ii0aOZ1zooj8I96JIDeVFwpEuOCGxMkDtEaCmGbS3dyISB8M1rl0lxXSjuH4Q8yTit+QnKByWxoqf6VbntitsRNeW8sZZbu7BhTCAC7cHO44o6hP7o9KGuc29vA22D8MwdikHOvvvtU7Fb1S3Ph2lkPP6qI1yJp60w58LaZQP75QDen5qPpRQhtW6RMpZe1ErCLQ3jqTKSEHLkjy5u1dJwNiAlPMBZYErWRIKh0oHgmGOuFttpKQ0QQkp/APxGe5o7dFJtk2NmsNWzM5jESPf1qnc93A6vgi39+bxxVy9/dokNIiZPpUOX3AlhWcXN3ogz8ifxH6DSnyjm5XVoUltoQgTvRSxtG20G/uAS+oZSCdgNgKoz9iLVeWLbZTZMtYcyQFnRSiBMe9R7lr4SUpcUpYXmKiP/VUtx5i0Qq5cEqInXeewoGX3XAUF0LeuFZlpGoSOgFV4wbeWPlJDYsEPO8oEwo53lgbntRLD7ZouqdS2ClvRPYHuKctw3bspty0XHXtDpon3oy+prDMPICGyUIkadT0rpza4IhFdlaxtdvcOJQgpWi3ErUY1UentVYvmlO3CG5W5+JSuiR0AohfXjzDSi8lvMuVqEdDQi2durm4nQBShlE6EetWqqmo5FWTyw+hKGbZByTO6o2EUMvkG4umrcZgpRkp7DvSrrEy03KlmGvmga+kU1gQfuivEnVeZw+XTt0p9dTT3MXOz/FFgw5htErSArl6ap2NGLdtkskJAdPU+p70Pw8XDTIU2gEuKKiT2o1at8tgF2BMmdpNDj3BbuBtgpW7zS2EuuTEjUHrVH8WL92+ThvBtqSpeKPBx4JIkWzYkgj1MadYq7HM07z3VwUJOWR1/wCjXGcbxx2/v8a4ybuQUJP7OsNYPLRupMdzJ+tbvjK3KSbMjyVyhDau2VvGb65xfHXDCS1bQw2EiMoSIHX+GlHsMbSW8r4ABEmdN6rGEKKiVKJUpwySepnerEwp5SwkKmBoex716dLETyzlukFylGUgEERISNTVQU8jF+OXFBIDeDWwYSFH8ajKj+QFWQvpt2XHnSoBsZlqgRpr/WqvwMyu5trvHHhK8SuluzEHJMJ/QUUF8idQ+ootKcqlBSlDXSdfen2SMxB0PzEEzHpUcApBJggCII2pYOmmw0I2mpbFImAoSQmFDSfenkOaBWYJnfzVAzrjc+b9SNqeQVKOSIVpp2oWEn8E5GoEEETrrTyABJSQeulRELIHnGp2gb08l5DaAAvKTQt5C65H1FRAgDv261sBbhBzicx602h8K1SqVTBPcU8lzKJidJ/OgJFNWpKkqUsjTpoKmoCElUJzFPQdagi6yzlJJG1OJWpSQoEoJ1igbCJYcWuCSVEd96cUnKMqdBOneozbnlUqcxie2s70srUVGCT6mhJzko6MifG5grVlnBnABGqjIrpwQnIAQoHaUp2rmiUg+NdkJEHB3YJ710tJXCW21wk/vda69+5B6b6WLSnKiSttZTOkeakqS0FKzW6Vex1msW3cLlalNqBHygRrTSVLYWpQt05tiTrvSUyxg4z9oEhpzh2+KlkNXTjUkSBMGP4/lVw4W8U+FuHOG7Oyxe5eFwElQShkrlO0GNtarX2irZx3hC1u20lCmb9BEdJSRP8ACuO2uJZcLw79o3cOhLzeZxUZiFAx+tbWg09epjts6MDyOos0tm6vs9MK8duBEmAq9Pc/Dnal/wCnPgaVee86f6jT6VxnDvDjG8WsmMSs8V4fDNykLSHMZYQvKROqSZHtXUPCY2XAdveWmO8GeH3Eq7xcofvcfYDjQAjKJzCNJ0A3q3dotHWva8sq0a7WWtblgLJ8ceBhp/byoaD+z04fGzgYkCL8wf8AyI/nXNuMOD73HuI7zGrJfBmDW9w7zEWdpjjJbaERpKtz1oa14fYmhZK+IOFoHX9uMf8A71dDRaJpNsmWt1sZYSOsnxq4NKflvt5/uOv51Fv/ABw4Lsmw443fELMCGBP8a5qrge6QJXxLwtmAnTG2I/jQHiPhgpt0o/zj4fLqFBUIxNpQj3BqXodC3wwXr9Zj6TrQ+0FwPum1xM+oZ/50lXj/AMEiYssT01H3Q1/WuGsYQ1aqQ7cYzgDiUySg4kj+RqBiC7VThcZxHB2UH8KbxJirX9O8f9yp/Utfn6TvLv2geDVKzJsMTJGolpMfxqG5498JrMqw3EtNP7tJ/nXAi9aoXK8Ww1QSdhcg0URj+BIw1Vo4xhK7lzyi4+KIKf8AdGlQ/H6FdMJeR1z+DsCvHXhNQ0wzEtT+6n+tDMGx3CMZxT9t4StxNpduG1fZWAFNufgKvSf41yBu4w5SS4rFrCQZyh0k/TSiPCnEuG4JitxZvXzfwd+lP3qCSGnB8p9Kq6vRUQr/ALXZb0XkL5WpWrg7fiNusJCUpWFJ0AFVq4cczpdjIts5StM+UA6HTrVpwTEk4xg1tiAcQsLTldWgyCob/wAqG4pbWpcJQ0ohWpnQCsWLx7WekbT96LFgOLfD4zZ4urMm1xwfD3MbJuknyn8yf+Krq+lorVbn51DMIMQr2rlGBq/aFpd8PvXJ8yeZbCYyuJ109x+oroPC2NLx7BmLl2BdNFTDx7Op3PsdCKxdfTsnvRuaDUKUdrJqkLU3mc+ZByqHf1mgGNpC0ONuEQoCQDJP/Kj60PpYK1OHIBO1QMStBcsBSQAuO3zDtSaXyWruYkLDktpSnKoAAAJI/F6fSpb79ypCVlWYsnNodfaheG820fNspYyhZykpBoouEuF3OFgHKsAkfwqxJc5K8W3EOYe/DiXyQkKAIAMT30qbeINqgpABYfGgO4J7VX8LueU+u1uFgDNmSFdR0AqwWt4xfBeHrV94gSDuUiqtkWnlFmEsrBFQy26htpYzKRrqJ8lM20s5mEPKzBXkC9QU9QKdvGXrdaFWy85YOoB0INM3aUqR8S1KlNqB0Gx7VOMhZJ6+ViTKmVZcySIQD1G5odbLUha8OKlZmjLLnYdvpUi2cRdoTctKUhaDCkEajuDTt7YNXMXTLmQGZAMEHuaV1wE3no0jEm30l8MBbiPI8mJBPr6VHVbNON/A3Z+5JKrRwGFJPYn07dqSw0HlLumhmWgFDyE6Z4/nWfEMvJNu+4CT8s7nt+VQ4/YhvBWsdsc6+YpxJvmCAUhRCXm/URTLV4m1CFNLKWHU+YKEADtRy+w66vUF9KEqetSVkBPzp6UFbt7VtRXcOH4dwlRTvy1j+VXINSjhleSxLIbs3C0yHpHLWPMgbKHcUOxvC7dTJUXFKZeGYQdQeiv5Gsw24TaPG1bdSWvmaJ136UctRZlkocbHIVOZMfIrrH9KQ4+nLIxf3FgoL1jcsuoPNi5QJRBgFPb1FHcFxdp1KUISELSYU0dSk9h6U7imHtsuKYVCVEyyv17UAcdXa3KX2gOeicwA+YVYcFdHPyJUnVIs2J4bz1KvrFIKkj71OwA9IoDe2acget0BcpGZuen73vVowbEGLxhLrCwtcQUjqK1iWFNtE3tsjKyPnb3yK/e9QapqLi9sixLEluRWrB9KWQw+/wDdJJCJ/D9aIhlN41ylhBWgeRcalNQr+zLZ+It2QWXZzo7HvUdtxxqGX0ryAfdrSYKffvUz0+eYgxuxxIgY1hTTJKZCQ5vOqaDoefsnBmUtaCYA6p7EelX60dbf/s14G1ZvKJTM6afWgmJ4M4pK08nKtAPLUkQIHT3pWEvbIlvPMTMPvG8Ra+HccSUhUpUOh9aYxDD1tnyJBMwgzuP6UGZtnrO5zplBjMQTvVkwvEmbtrkhYgqgpI1B7iq1tLre6PQ6uzeuewdh90bZREKygytskyn1HpRW4aFyyHEQouamBv2qFiWGONhN00QopkZo0PpUfD7paSUtqBG6m+x9O1IlWpLdEdGTjwzZun7PPbvhSmyoDXUfSk/GLCQys50lJAB3RrU26T8VlUtHmOwnX60IuW3ELDTajnBlKlEnTsa6Cj0+zm2Ort0LzhDswJMjYiguKYM44oOIzJeEqTB+YUQBfaUDmHmI8vQ96kKcNx5QNZOZJ+Yeopik63lCpQU1yVxnmLUWHFLZdywUkxmpD7ZQjmlKUzqYGhHeO9FMQwYvtpfyqUW9eYndJ9aHN3jjTyGLn7tQ0S50IqzGaksoRKOOGJs71SQpD7hctzpJUVEDsakwtkB1i4Upo6ZFGSB6Hp7U46wyUOLCAlKh0EfU+tB1c1ghKDECUlWqVe471KSl0L3uJYbXEMrZ+HIdSISpE6x7Vu6w23xYpWvM28kQlY08v7pHX3oGhxD6g7aOcq5RAIO5Pp3FErTE/wC0Jtb5PIuQNF9D6UqVbjzEOM1PiREurE2r3KeagdFAQkmmYXZIC2fMCJWzGh9j0NWgfD3rZt7gJUAmTG59jQS7w1+0dKUy6yOoTDiR/Oihbu4kTKpLlC7K6sr1Hw7xVlGpCxLjZ9e/vQzFuHl22e7w2FNK8xG4V6R/OsWpvPzysBxIIDqBqR2VT9vjbDLiWXyWQUjKsag+hpiUoPMQHtlxIDW77sFhQKHCMpYWZzf7KqJW942llVrcN8wAjRROZHsaI3WE4fjLSkvZWX9kKR8ivX0NBbmzvMMWGb9ty4bHyPoP3ifQ9xTFKNq57FtSr66Hry0t7prluNl5oapcTotFDnrK6tgovAPs780fMB2IqWH3rf8AtSXc7c/3jeuUHooUQbfS7kQ4lMHylQVKFVO+VfAvbGx/uV1t523Ql1Ciu31AE6ie39KlFu0xBAJynQjMDEe9T7nh58KUq0SGFqBJQR5FjvQ95mFhDrZs7hIEKjyLHrTFOMlx2A4SXfQLu8GXaLU7bqhIE6GU/lQ+6w+zxFrk37CIgxnmCe4PSrOi5etlhq9SESMubLKVCk3eG290krt8qArTlwYJ/lVivUSrfZXnp42Lo5bi3A94wDcYUlVw2NVNz50+3cVV1IWlRSsEKBggiCDXZ3GF2bpbXzREZm4hSfY9RQnFuH8Jx8KW7lZuJgOoEKHoobEVs6fyXSs6+5i6nxfcqjlRSRuKUNqM43wvimBnmPtZ2VGEuo1SfftQeCeh3rXhKNizFmNOuVbxJGq0e1bCgNxP1orhfDt7iKg4QWmhupQ1PsK6U41xzJnV1zseIoGMtrdWG0IKlKMAAa0fwzhZ177y7EHo3O3vVow7h21w1oJQ3BMGSJWqpr1sywMqDp+6N5rLu8jl7azWo8dxusAqLG3tAJaClAREaCt/DrfXy22ys99qLm3SlOe5byjbJpmNPsYYu9KcoDLG5MdP41Teo+Wy4tL8IAIsm215W0cx1Q1gSBU60wF26dKEsKddBgwPIkepq02uB4ZbqS04vNmE7eZR767VJfWi3QbS3aKExAQ1opX1qrPXZe2JZr0GFmQDZwxizOVQDjyBv+FPpSF4c48oPBSU5d1K2FE3lKSVNuIlUQlhA1+pqfh2CP36BcYnKG0RDYECKRLUbeZMsxo3cRQDssMcuVE2SS4rYuET/wAIqw2mBWeDsi4WObdHZGXzE1OefZsURZhLLLYguKEH2FB3sSddVltitOcQp1XzKPp2pDtsufHCLKqrqXPLJdw+qVc4pVcRIaQICR60JDD11dkql1Z1ygeRB7U+zYuq+6KlSegMqUDViw3hp1TYaWvlMmCpCD5jHc0HqRpznsJVytwCsNw5b10eQpK4EKcI8iT2HtR5FmxZpHLdC3FbuEfw7VLW8y038PaJEAeYkQPpQh29SglFkhTz0RPQVWlY7nz0WY1qtDty+i0TzHlxl/CFf9TTbSV4o4lDiVoZ3Gm47U9YYAq4T8bjBK4IUUkaJpV9ftWqlW9sCVn+7QE7D1oW0vbHs7nGXwh5y7scJYS0kBQUCEx39PWhzGHv4lcm9u8qBu2lZ1A7kVu1s3HHjc3jmdY6nZA9u9SF4hatqLGVTk6wNSv1HX6VKjjrs7O7gdbYWnMWnwlMeZQHmKaYtw/iDxTakFpJEqIhI9u9PW1nc3RK708tCjKWwenqRRJtLdsgIS2lLY6DaglPb/IcYbv4Ns2jNm3y7cHOvUuKGqpp9y5NqhJdGdyYEGaY+LbaClsiFT88aD2qIG3b93IkaHUrGwH9aRt3vLH/AE9D7ann3Q6XczgMGR8p6TS3Hk5uSHc7idYGwNNuJUlfw1qCECJV3PelWrKUZ/KQVGVE7VzwkcngJWScyDlaAVJmdp71BvrtlpCi6QQgwozp9KbvsYXbNrbQrlpSIKx+I9hUCws3cSAur0cphBzJaI+f1ooVf5SOnbuWIjFukYo9zXhyrYHyAj56cvrlxK+S0pAQ2NuwqRiBbVp/doR8pihWVN2paGioMNxncGuY9h6etWorLy+irJtLHyRLdx/EHj90pbKDMqPzKq24Xhi1ISpbgSyRrGk+npS8F4fDzXxK0KaYQZCSnUjvU64fZOaDy7RBygdXPb0pd1u/2xDoqcPdIxZZKPvl/ct/3aBoCfUdaHXVyFpLrp22QkbDuBW727aWsONgwgaBVQGXEXz0LuUBoqkknUntpXV0/wCTJlZztJlpbF9w3t5bnKI5VF7GybNxmcA5QAK1ITET+Gm7Sxdv1hLRhKCAFHoIp/FMTaw5hFtapJXtlTqVHufSulF2PbEZFqC3MZxjF3hNrZMgLgga+VCOlDMOskvuhspKWk+Z1Z3UfWpLAW4lLDIz3CyVElI39fQUQs2A6lVmk8sJJDi4B96sRrVUcIRKW95MsmmXLhd88yluza8qE9SfQVKxDGE2jBuFNl25WMrKOgHTSpT93aW9uHUsKDbQgGAJPoKFW7Tl/d/EPJHNdkIGhypHU9qKund7mdOzHERGEWqXbhTlyJWoS8cux/dq72NqWUBa2UKdeUEpSBICew9O9QMJw9IQhRTlZZ1WuP7xc6JEdaPJfcs+Wt8BNw+AhlpI0QOpqLueEHUsLLCdu41hqDaoQFOqT5oEZQKZeaU/yrcO5iuC5pqoHpTD7qUhNulWdUypZ2UaSrnlwWlqtQedOZ0oOqQeg9aqOvCyx8ZZeB+0snb+6QorAtrQlKSfxq7+oornDkPlY5LZOh9Kx1H7NtEYe35nFgZj211oRiCkFfwDLign8ahsB/U1QnX6rLcXtN39+1dJLuUhCSUozHQxrJprCW/iFfEthAk6R1HeoLlp8Y4LVMhpISDpoRO1G2rZIy2yEZMyYBGnlonBQiQm2OYe67dO5yYQhSg2SNVR1/OlcSXoWz8MlaZTC3fr0pb7icMtufoCPKjuTVWxO7UywXFgFS/Ms/4jrSa6HOWQ3ZtiCb26fdvUsoKVNJGZY6x0FT7W3AYWQhIW4ITpqBUTCrb4hWdSSVOKKlJj5fQ0WuSzYNJdUklSwQlGo23q7OG32oTB5e5gzELcvvN4e0RqMzhE6k/0ou1ZKtgm2QlIywNDoD7VFw63UxnvniorWZTpRGyC0tB0jOpZkmNfSok/bg5YbyErYJzhrMkJQnLMaClFy4ec+8CSynZI6xsai5TkJQDJVJE702LktFSRoj94nT1oa47mdJ4BfiFjj2EcK3C2Flu6vCLW3y/MVuaGPYSfpXJOMFs2TWGcN2k5bZkKdSnSFHee/wBasnGGNIxvi60siQbXBmi++Qd3lDy6+g/jVATcqxfGbrEnEEc1RyjeE7RNew8ZRsgm/k8p5K/1LH+wfwhgJTqgkwNJ2o3blAQAAEq1OtC8MkIJDZg65jpRVoBbuhAVHWtKTMuK+ABxziZwzhG/vOakcwBgR0KjB/QmpvCVxhr+C2beGvtuIbZQkAGSIHaqv41kt8DOpQUgm5bJg6nU1wnDeIsYwdYXhuIvsxqAlRFOqrc4cFHU3endhnrUyJAWJGsRpSVKRAIWCAfXWvODHjHxywgIGKJcHdxsKqWPHDjgA/2i0JOpPIFQ9PP4IWqg+z0I2cskL67EbU+y4kZSVzM6xrXnYeOvHAIPMstDP9wKc/088ddV2Q//AMYV35exk/ma/ueikr1AzamADBpeVJlJMnaYNedP9PvHgIUlyx0MwLcCa2nx/wCPUACbEx/8gVH5awn81UekEFCAAFxIiBSi42qE54ggSDXnAfaG8QEyM2H9N7YaUtP2i/EEEf8Aw3T/APthQ/lrPsF+aq+56QS622CUEHee9aFwFLJK9TG8jSvOw+0j4hjYYbtH/hU1tX2k/ENQgowrpr8GmhemsfwT+aq+56JF2uYzApVpEain2LhQBMiBupUhP59K8/2H2rvE/DLZy3s2sDSpyfvVYcha0+07VSOIPFPjjigqcxjHbl0qJkJVkTHaEwIqFpZvtEPVwXXJ6DwriDC8b8cLVnDLtt4WuGutLUnVJIGsRXULZPObhxyQDPlPrXlL7Nr7rviiy44taj8I+SZ9BXqxAaKdlJyiCnvSNVDbPBc0ct9eST8GhaCUvqSZkSfxVjqEpQZB8kSJgkmst3HkpKU5RCsoT3pPPX5kuKHnUEiPQVWLiRzjxyAvPDu+dUCk277LgTuDlVv+tUDw98H+DuO24xO+uV3zo5jbZeytmRqkdthXUvE20bxfgHH7ZISFfCOKT3lOu30rx5hnFePYSpKsPxB5nLqMqtjWjpVKVbUWZOu2wuUpLKPV6/slcMAAos3FbD/xX1nesb+yXw4mf+zVnXrc/wDOvN7Xi5x6ga8Q3J91Glf6XuPiZPENz/xmi9DU/cT6+nfwelUfZT4ZSPNhSu0fEb/rTg+yvwqSQcIPr/aN/wBa8yq8XOPFb8Q3R1n+8Na/0ucezP8AnFdf/wCw/wBaj8tqPuT+Y0/2PSy/sscLpI/7Gmdvv9v1ph37L/DIUQcIA0/8/b9a83Hxa49P/wDMN0f/ALh/rSFeKfHKwZ4iuwT/APMNStPqPuQ9RR9j0ar7MPDCAD+yEAz/APlH8da0fsycLJ0/ZTR6/wDiP+decT4ocbkkniG6M/8AzDWv9JfGn/8AX7k6/wDmGp9DUL5Ad9H2PRp+zRwtA/7Ia0E/+J/502fs3cLJ2wpkQf8A8o/5150/0lcZED/t65EH9802fEXi/rj1z/xmiVOo+5yvo+x6Q/8Awe+EmQpSsKtx6G4/nNQcQ8FeDLJlTjuH2oQ2JUU3E/zrz2vj7ipwSrG7k/75qO5xjxE4ghzFbhQO8rOtR6FueWc7qfiJ6E4HxXCMHxJ7hXDnQGSOawgLmCPmie9Wi9hxpYzpVuCSa81+GV5iN7x9hZS+pSgtRXmV+AJMivSbrLTjCgoKAToADrHelW1+nLJoaSx21tFZubheH3qLllEqbKVCD1Gwq48NXYseKNHMtjjrQKTGibgCRtt1H5VUMVtAlK0y4oaHKRJHY0QwG4Tf4G9hrJS3dYcsXNsQfMYMq+oIB/Oqmph6kWi9pZuEzsT7BWlSc6RA1HQe1Drm1cZCmlZlNqALXv2p7AcWRj+F2mJJQQp1AS4P3XAPMD+VTLsLcRyUGVIOZIrzkc1ywz0v1x3Ipt7bKSQ+2kJUjee43qbZvNXC0OqAQl0ZVE7T/wC2tSr5qIK0Egk6iCJ/50AZX8DevMONKLaz5Ukajsf5Vpwe9cFN+yWQvd2ZSpp5S0qctzoTsRNSrd9wFq6tkEtgkkifqKbBDyElZJTKc0dBTTc2V6bMvEpd8yFEeUdYoe8ph/S8osZLriEXjAKkhOVc7qB6e9NhCUNhxErYdELT2NM4a8tLi2nFHI6nMCf3qlLQm3LiUhRbdiR+6rvVaXteB31LghtqeZWLmVJaUShYOsdjTra1W7uYuFbLiRzI1kdxSgWwtVs86G86YEnRQ6CojJctH1Wi150nyonXXtQtbuiVx2PXlm9hN6cRtCpTDqfOkbKHcdjTC3EtOoeYSkoWnmCRsamWV1B+AdQMiyVAk/Io6UKvy7gT6WLhk8h5YCXCfk9/Soh9mTL7hkOLvbcLtyEXTYzJBGh7pPcVVsasrg53RbqSHdH0DZPeKLZ3bNartLsKAB02I7+1KevHLpKnygiVBKwB8wPWjg3XLPwBKKmij2TXIWbVx3O2olVudyk9jVswl9TwyPpUlaU+ZM6K/wAQ7+tAr/DSy6VIWtDTiiWnB+BXao9tdXjbgYfVy7hlUiDAX/ijsauyirUVY5qlll3eYtrm3+CdaCs6cyXOs+h6VVMRwh1EJ5GV1oFQzdR6VZ8DvLfErNZeKc4OiCYUlQ7Uu8S3dK+8b++bSQB+9VSM5VTwyzKKsjkoNjiK8KuC2sAoehSY6VcWLpa20vhYUhQgeUSB29qA4nhTN2VEMlPL1cTMH0UKRg+KDDHjh1550PSppZGhHarc4q1bkirGTreH0EMRw9+2fU+lRVbOagnUChDqEMLSl5UtOEwsdKtrq0Jt0pUSWXETlO9AbvDuU4EqSXLZ0eRXRPYGgr6wyZrHKEpLYUi2clOcZkOpGyqKMD4lAsbxaVLSAmNs471X1ISwpFo+4qCryk/hPaixKVhIUoyBooaEChtpCrmQcWwlIWtt9OdtI8rg0M9vWqvd293h9zz2FKRCjmTPzD0q9sqST8Fc+dKxLS1dD196gYqwykBAbBE5FSNiKr7Nrw+hzeVldgjCL9V+yGg4II8yD+H1qLiOHu2z3xdihJUn5kA/Onr9aQuxuMGcGI2yStpU8xCd00eYcZv2eZogkA5hrFVLatj3LofCe9YfZCwu4t7tkKSg5Tpruk9vpS7+1bb15JKd6bucPewq7VeNMEtrPnQNZ/x/1qfa3TbrKkXK0rbXBCh09faqNsed0SxF54ZXH2OWSUwEuQCknr/KmwUtk8zKoA+X94TRu8wxhRUqPu1gdZigF1hxt1HKpehzA5pmdqKElPsCSwTGX2nvlcAXHUbfSoeJYSh9tT4CQViCBsT3HY1ECn7d0uIKSkzJnY9qJWtwXQW3JBRoQTtRYdbzEDifDK0y8/bP8m4cIT8pBkCOmvennWGuUpRUVJBnL1FGr/D2LtADqQCVaOHp70EcQbFfKukEpVpPYVajNTWUIlBxfJFdtgVc5kiW4Obb6U6Lq3uQlq6KWl/hWNxUzmWKgkhMf4hoD70PxGxSSFtokamRrNGpZ4YElt5RNFw5ZICbxK3UKPlcT2omxdIuEBT6w82NULB1T/WqxaYk7Zt5HYeZnTPump4K1Rc4I6gpnzNE+VXf2NLnSFG1IK32F2twyq7CuW6RqpKfKv8A2u1Vq+tQlIaUjJmJk7p0ozY4vzVlOXlOJnM2vUT7dRUl63YuUpY+HAU50RoQe9BCUq3hk2JW9FdsLx/DAAoB9k+blBXmT7UWtcYt7tISfvGhMoIkpPaod7gDiJWoLcUjzAg6ihTlspJKkuKbWnXmJ39iKsbYW/S+Su5Tr4a4LHcYKNb7CX/mTKkiIHoRQpt+2KyhlvlPkkLaUfIo9x2pOH41d2jwTdENKUBlcTqhwevai19aYfjISq4a+FuFfKtKvIT3EUOJV8T5Ge2azEYtLxQhHzFsSW1bpHp3qY43aYswEol4J+cgedH07UGvMLvMOJauFqeQdEPJPmR/WsZfebWFhwOZdS80cpHuP5V0q93MTt+OJC72yuMPaW40n4y028uqkn+RoeFkS7YOlZmeWT5hR+3xNJKnHlIbURHNRqlXopPf1qLeYba3Q57SBbvK1DqD5Fflt9aKFjXE0BOvPMGQ7e5t7yUXCkCPKoZcqkn2qBf4IpQ+KtdQD/eJ9O4p9+3La4xFgpckQ83t9e9baNxZErS8HEEyDrB96bFuPMWKkt3EkCCpSEqZubYLSoRmiQfcUBvOCbFxZubK0aXm1UyqUg/7KgdK6CUWOInKpKUOdY2JoRd4TcWbnNQopSesSmrOn1cqungq36SFnayUHAuDcig/cJS65tqPu0enqatbVoiwQFOokxBUR27Vu4vuQA3bthRGhSn+NYlpSoXfOFSzBDaRIg94q3bqLLuZ9FejT10cVjQU9cr+4hOUwVq61tpaVOFm0QX3leXMoaJ9qK2uCO3aOfcKLLMwlI3PbSjLGF4ZhbXOWlCIGiQZWTVKeohXxEtRplPmQKs8BC1BdxKlH5lL2FFlM2jKOTZpQ64CMzxToke1MPYoha9EqAOzSevqajvP5lJSU8xZM8ts6D1Jqq3ZY8votRVcFiPZIVKkqeS+jKn53ln9I600HnbpRawu0Uok6vrGpHpUqywRd2pLuJKKUCcoO0fyiiLl2zaoLFuEtNCJWr+VLdiTxEZGLlzIassJtMOJduFBx46qB1P1qFe4rKlNn7w/gbSIj3NLfdFwmWiWmtlOqMqX7CobnKbSW7Zs5laZZzKM9Sa6Ky90yZNLiJEuVPPkLvjKBolKdAD705Z2NzdqSWWSgHUuK/lRO0wzkpSb1OdwnyoG3vR9tNtbIShaAtaU+VsbD1qbdQo+2BENO5czB9hhXwLReUUoJ1JVqTUh+6LbReeSWWVASJ86/am7vFEtLS1l5r6z5UJ2SKWxhdxfXPxF7CoGiOgFVXmXumWI4XESKWLvGShpgKtWANYHmUPWiTdpYYOyC4sIjoR5jSri+tMLRlQQtaZASBtpQRS38TulLdVBSnaYAmuSlZ1wiW4x/kk4rirj55dqQpStEJnQdyaitW1tbA3l88CsiSoqkk9gK2zboJLdnldd1BXvH9al2uDpS6lwrL74HmUsSB7CnLZBYQrEpvkiFGIXurf9nZ7q+ZQ7xU7DMMSwQpPnXP8AeK0MURaw990gqUmSIzdqUtpuxSpd06I2In5gKTK7d7Yjo0tcsdQ1ats5i5EGRI39qg3Fwu4H9nSVIAhZO/0pTCLnFyFIbIbRsOwqV8KbcFljIUjVShqfakcRfPY7vhEVu3N0lLCjCRGVIH8aIM2CGGiFEgATlAjTpWmlC0ElAK5+bcgGlXOKspGUCVq8uvfrUOUpBpRjHkQ1b/EpLdujIkiSVb1Gu3BaTbNqbK0dd9Ip5N0ptvMpwtZhCG+9Q22WHHFOvkrcXuB8vtpU1xw8sCb44ImG4eb579oXKyhgElDcTr3NFbl1tDReMBsCIjrUd195ggJQEo18gECKF3l0u+Ui2ZA5YOZcbH0Bq3GLseX0V3JV8LsacVcYu6UglNuJOuk+1WPCcHbW2HLltPJQIT/SlcPYY2Gee6kclrZMRP8Ayoza5n15QUpbRIyRtQW2f4xDrrw90hLrqbhIny2zQCTGkigN5eN3VwptCAoI2T0T60YxZSOWpCNUxASn8NV64bDQyW4+8cMHufSm6bT5e5g32pcIYVZrvnhbC4Vk1zQI/KjWG4baNLbt7VCVxESmVTW7Gz5IQyhKDcOaKUBIA7UdGHoskfdrS2vLCiR061cnHjCEw73MZxG6t8HtOWkEKGhJO5qushLjir15QSpQypkzM9IopcqYunVqcOdlkxrMlXp6Uixsbe6e+IUmGmTOdQPmPamVUquOfkC212Sx8C8Nw5xoFtpwm6utCQBlSKOqsWbK3btWPO4rzLURJ9aZsP7My7iRaB1hCDpFRMQu38mRbg+Jf/EBohFT6e9kOxQiNuoexe8PKCjb26cqREAnvRjB7BtbgaygSZdIMH2qNgLBKVW7DiklQgKI+YVasIsGFoWnmZEMD71wiJPaots2Lagqo73uNqR8MhLwaIt2/wC6T0V9O9bceTbJOJXcF5wEJB6T0Ap22PxLyrq6VLDIhtG2lV/Gr128u/JlWsHI0EDRNIrq3vI+ctvQ+nFktuBhCC5cOGQgHRP1qx4PaLw9tL7yj8S75iYmJ60L4awRq0SH7tKVKCsyyqZKqO3GJ2gDinElKEp8ukTS9Q03tiOoWPdIj3l82yha1uKVcuJhIM6T1oUlaGLbUKLrxiSTOYnetv3AfWq/uVBDY8wgfh7U5h1scRcF48soQVbAxp0FVvRUYjXZufARsmgy2HIJygamN6L4dZuBAfeWCvUyqNKhMthy8UErCrdnywB8yu/0p/E8QLSE4Y0k/EvCVnoE9aqzg58RHRkQcbfRcLSAJQkw1r8x6k+lVZ5KcQvA2lEtsmCe6uv5UXxlxWUBBSUqhloxt3NOIRb2do2EJC3SAEkDQE9asxh6ceBUpKTwxu3szbsuOMJE7pVMSaFPF2/vkhwSUaaK0AHWpuJYi6wypptAhCghP+JyP4UMaQtu3zFfmVIBmCR6USreNzBlNdIJMhDjwQCeVMaHtRFa9EhrQI+VVDbRLqEAJbGYjU0WtwhbLZcQEqGgGb5qrzXI6DWDYLLoS2XtQJUZiPSh2MYpa21o7fu+S2tElZkEDQE695MVPKmmW1QElw7mNPaqD4k4u0q2tOHFrKE37ocuFJH+pSZP60/RVeraoidVb6VTmUK+u3G8CuL1xA+Mx59TrgnVCSdNN9qHYHacsJOVUyCRE+lFuImG8Qv0/AFC7e0aSZSND7UwyssWrV0c4QohAhOsz1r2dTjCJ4u33Syw9bJK2xMgg6kfpU23twVQ4cxjzdPyqCh4sOotFK+8dTmgDtUltWdz4dNylTiRJA6UUpIiKOc+OjF+9hVszagqt0KC1hOsmuElLidVIUO8ivXVzhuH47artHFIUlPzx0I9apJ8McFv233EXTQDRJKsp0FNhq41rDKVvj52y3JnnjzE7H3itx3BrviPCXA+Q3dPXbQbcVkSYOpqcrwcwFFwzZ/GM810fLBqXr4C14y086abgGs6HQ16VtfB/he55iG7y2JbnOTOkUhvwb4dLC7xeI2RYCsoOu/ao/qFZP8AS7Tzd8qpArJI/AK9ODwOwEPtMuXtklT4BRCtSKlMeBnDdzcv27F5ZKXbeZwFW3pQvyNR39LtPLA1OqTWQTsDXqxrwJ4Ydt3LkYpYJbaVCiTt+lPo8BOE027N0vGrBLb5hvU+aKj+p1hf0q08mFJ7GsAIOoP0mvXavs+8KIuk2wxrDy45ohEneN6ea+zzweQ8l/G7BvkGFKKuvWu/qdZ39KtPIBJ3hR/On7e1ubpWRhhxZJAAANeubfwD4LQOcccsClSsqSTufyqxYT4PcC4Q+lD+L4bzfmy5v+VRLyleOAo+Is/yOPfZw4AxWw4ie4jxBlbKBbqZQCN829eilNrbjMsazpH5UZwfhrArVCbe1xu0bZIJ8vy/nFT28EwK4bKv84bIwvIPOfz2rNs1atluZrUaT0YbUVNBUFhTicoAmRrr296w2qX1ohZamSnSrieEcKN1lTxDYhHzE5z/AErbfCeCSEq4jtCRGUBR3O06Uv14jfSkUHGMDYvcHxC0aXmcuLdxqToASgjevDmOcK4vgl0u2urFzyEpCkgkGK+kVzwzw7ZJWpziSzATpuT5uvSqtjPhjwRiqDev4tZKGXMVEaGfpVijXqh/yU9VoXqMYPnkqyutjbuD/dNa+DuToLdyfY17tufB3w7SpI/atmYgkhJ2j2rS/Bfw/Z5ZexazAflSSE7D8qtf1ev7FL+kT/5HhM2V4RIt3IH+E1oWd0d7d0n/AGTXug+DHhzzlpTjtvATJCUHT12rE+D/AIarQ281jNrLnlAU2dT+Vd/VofYn+kz/AOR4X+AuhvbOf8JrBY3PRhz/AITXuo+DvAbGRLmLWkKJSCG51/KoyfCfw7l0C/t1comQGzrr7V39Wh9jv6RP/keHvg7nbkOR/smtjD7siRbO/RJr23/op4Act1Pt3bISPmTy1SI67Vs+F3ATTSbgXaFJUNIaXP8ACu/qsH8HLxMv+R4jGHXqtE2rv/Ca3+zb0f8A4q7/AMBr2ynwu4GD6GOcQojNm5KtQfpTSfDTgZzmKzrVyTBi2V7dq7+qR/4k/wBJl/yPFgw6+Onwzn/DW04Xfq0Fo8f9017Rc8OuA2bcXJdgqOn9mVpGm0VjfAXBjbybchclBUmbZQB76xXf1SP/ABB/pMv+R5Y4D4dx4cQWOIWrK2TbupXmKY0HT8q9OqaUlAdJMFOun6VMbwfhnDLcXbKHA2VloH4ZWpogu2w4vW9oVOhT4BRmZUAB9dqTZq3by0XNPpfy6xkpuJWvNSuEkr0jpQDDr39i44i8eblKFw5P7p0V7mK6HcYUwp24tg47mZTPyaH61RMRw5u6YVdtcwctahGWDNHGSnHkKSdcsxL1wliLeE47dYLm/smIJ+LtFE/i6j6p/Wrw6FqQlaSEqJ3Haa46863Z4Th14m7HxlisOM8yAcoMhJ/6611XCMSZxnD7bEbJSVNPpzAk9fxD86xdbSoS3o3NBe5pwfwPPWawmHCCTAUAI/Kq/i1jJKwhUxvrVtWw6tKXdCUaKBP6iopbS465br8wIzJ02pFNziy3bWpormDuF5r4Z7KHEKhQiZFLxK0Km/Ik5mVZkT26Um5SrCcUU/u0r50gRptU5ZF0jnoWFACP93pVqT53IrJfDMsbsusB5IAU0QVDv9KNNvfFMQpWZEHX1qsNq+CuA5ohtYhfrVgs7tNnCXEhbKiCDuRNKtXyhtTxwaFqm+bVaKVy1CVJVGog0Mfs7lbnwt0QVFMIcGgUR/A0YvXW7Mi5RmJmT7GlXbbeIWwXOi/OkjdNIhNrsa4qXKBdk4XUKYeJ5yDAHp3qaS1jNmcPvHE89IKUqI3FD7lm5kPNqS3cNABKgfnTTba3H0t3dsFJfbJK4P6fWjazygd2OGYy0u2bXhd8sEo0bXMyP3dakMvAIPLHLU2Mq0n+VbxFpGKW/NtpDzYBKY1BHU1Dt37p5IU/yS82Mih1UjvU53InG0IP2qEIS6sJNu4PMD+E96rWMYYhADqE53GpUy6NiP3SaseGPhK12dwvmWzglAVsB1FQ8Rtjh6lWyVLctlmWir8PpRVS2ywLujujkr2D3qeYm+bUpMKyutzqB396s5uHHXgl3LzE6hQOnvVXetF2985eIlKp+9bA0V30qTaXBDiUg/dr/u9qtWwU/civVNx9rLBiFut1CH2kpTcN6KA/EmqlxBZOPZbhvZC9UjTKroR6VaGXm1ryO5sw+Y9qiYlhwt3U3DBJacMg7AekUNM9suQ7YblkjYFjib20+EuChDzSSkpOuvcelEwy5y12z4AQ4BlV+E1UcUtVYbcJxK18w2Udhl6ii9jei8t0rC1csiUwr5abOP8AlHoVCaftkbvbREm3egrVqhRHzdvrUe1vEFXwrxKXkSJOy/ajDjSLxkMXSilZIKFp3Se9V/FrR8fdXaeU+0ZQ4nZf9KmL3rDOlmPKDCUW92kLcTqkwTOxG1LcCFtm2XGYp9/rNA8KxN8pKVpmDlUhXSOtEi/zXMgMLBltwiRPak2RcXhjITUlkiqZ+FUpt5PMbWZCuivQ0MfD+HXKbi2TntSCpxAH93/UVYEKt71BtlylWykdR/i9qg3IXYrLa0qUg7KOx96rSUcYYzc+0SLO7tsSt20B7IhQgKGoJ9ewoXd2L+GOL+GyLSoyQNUken9KGXIcwu5L7JJt1/MgD5Sd49KLW2Lc1pCHFZ2ynfrWfZS4crotQt38DthcoVAKjkc3BTrA3+tZdWSWV5CZZd18okih77dyw8XrWVoP+rnUj+R7UTtMZQ40cqcxIAyqOo71UnDHuiPg19MgdcYAW2w62sLaUIykax2oW5bP27xbVAyxlkfMmrm3FwzzGlAJSJCU7g1FxC2D6EBbckfu7/WlxvaeGMdccZQFbS5ywAgltwazUK7smbhsNrbKYT5VHYjtRwNclC8qyoAbHpUdbSHkgKhMiB6etTGzHKAlHgpF7Y3VhBt0/LqUqEg+01HZxBK/7PcJCNCY6E1frnDi4gpcy3CO41Iqv3vDDLoOUARoEmNKvVamEsKXZSspmugBc2YU0HGFjU6ojpFMWzrtm6HGkAgHVtR39qkKs7uxWppwKeSmAkkwqPQ1EfWASHsyT0zdPersXuWPgqOLi8vsPsqsMSty/kCbpJEGYIjpFR0Ytc2Dx+JbUplWgWndHvQlorSoPJcKVjQKSd/eiyMStbhAYvm8oIgLGoJ96TKvb/AyMs/yGbbE7coHNWh5tZgOJGo96Yv8HtrpCnbYgZ5OcbH3FCzhrtivn2alcpXmKFHyL9qfs8QWteS2cDatltK1HuKRsw91Y71E1iYIetXrdeQKSjYqaKZQr2rA49aIC2SSwkyplQOZPsasbzbN6OW6jVIy5dyfaar+I22IYY4othT7AB8oHmH/ALVYhYrfbITKPp+5Ey0xJSgkPOC4YIy5FDzImj3Bfh6zxvxrheEYe6rLcPJXcJRI+5QZcJjbQEfXSqMw4m5dSplbiXlEJAGsqO2nU+lewPs/+FtxwXhK+IeIGOXjeKoSA2RrbMbhB/xqIBPskdDVmrTt2JrorXahKtp9nnbxa4Nb4E8RMSwGzYNlZuLFzZBZKml26x5UyZJKVZkST+CTvVat7ly0dLaSkZhCmViUq/2a9i+OXhg34lYAl23bAxrDQpdssAffIIlTJ9Tun1ivG2JWF/hLy7S7YXDKlJKFSFNkbgzqDXampKTTB01rcU12F8lvfMpat1gKBGZlyJ9k0OewZ9gLNvKBGZSFJka0OS5cPtlbBKwkZsw0WnWi9rjLycrd46HG4H3seb2NVXCdfKLalGzsDOJ5ajypbeSdULEBXsamYfiahDNwmQTGVfSp9/hqb5s3CYW2oaLR+E+tVx+2uLUy4nO30Uk6p+tMrcbVh9irE63wNs4cXXA3bJCJ0Ws9KM4ZhVrbgOo84bErdV8s02/bItMpeUVr6MjSPemHb15+GGvOoaZEnyJ+lHKU7eiIxhW+Qlc37LYhk5YGrqh/AULWUNJWrMoBySpxe59hUdK3XLhTTSU3D3WT5E/1o3hfDrTo+LxR8LCRMbJpbUaFmXISc7uF0DcPsri+PKsWlIaO7p3VVgtcLscGRnW2HnVDygCnHcRZt0m3tkJZZSIzChV9iqCOVbKISD5lHc0mUrLnxwhqjCpfdhC4fC1J+MdKiNUMp0A7SaH3T7D7oW4vMpGyR8qKhJDigpbhhCdfcU1b2l3i1xDDeW3EZ17aUyNKjzIF2ylwh34l591SGhm9dgKN4NhK22y84kDP5lHtFTLXDLTD7YFSRlG2uprawlllV1ibqm2ECW2hoV+hpM7t/tiNrq2e6THg8lMot4A3VcEQB6CaEXV+p9Rs8MUtSz/ePH+VY5cXeOuJbbRyLVJ0Qnc0VYRZYOwla053VGNB/KlpKHfYzLs64Qzh+HW9i18ReQCsT5u3Wabu8fdWeRhsNtjrt+RqPfXTl2oqWsJbH4O9R1PNWzYKiFFOiU6aijjW5PMuxbnt9q6IzynEJcecUVGM2aZzUm0Vd4ijlpSppskBSo1M9qftMOuMTWpboPJEkISdqOMWCEJ1JbSnymmWWxgsC4Vyk8/A5Y4a200hDIKEidQIJnvRe3sra3QoqMqIzHMKShCbdtIU4slQnLEwKi3V+VaeYpiB6f1rOlKVksF+CjCISD1rbSGymCoAjeR6VFcsv2g+m5uVAtpnIhW31oc06pELUZUn+Pp6VPti68ku36UtsbpQN1ULrdfKD3KawTUI+5LVoOUlIlUDX2rLbDy2qUmEgSST1p5K1OBtZGVoCIFbKm3wVKcAQPwfvUnLY3CwY7Z2yE8wHQ7xQHE2UIUhxbkJGqQNp9aKXa15w5ASkDyCdjQPEnmypLeUFR1ifzqxQnnIi2SxgHofuLq9hxzyA7H8FE0A26S4hoqCthG1abZatWCpWknNlO5rarsplxYIJ0Qke1W3mfCERzH6iPdqztlsJJW7pAG3qaKYFgCCZdSWmkCSqNyPWo2F4RcF0uuwC5qpROgE1aT5WQhBOVOmVImaidm32xDhXu9zIdy/5uRatGU+UJGwHelOrFoxBIzKgdiTRK1tkMAvLGV9Q9oFQMReSkF1baEpSPJ79/rTKKlN4IslsjkF3zqW28oJDi1f9Cl2mHrQ3zG5U+v8X7gppptTrvxFy2co1SmrHYtIbSi4WIESAf51rbVXHgz1Jzlkfs7C1w5kXHLzOFOmmo9aBYniqX7pNo044tbioVl3AiiOKXjwYIZP9peOVIB+UdDQy3w/4BJ5qSu4UZJmDr1NFVX/AJSItslnbE06y8+EWdk2VZdz6etFkpDrTNqwyW0txzFHYqptlK7Vabe0Qo3DmiykaposhDNuwG3UqCAM6z3VUz5eERDrLI2IqSAhxxWVpv5Qn8Sh6dqEWGHXWM4gRcpIYTq4qY8vYU88+q/vE81HmKsrSAdAnvp1qx29siyabYt9UiNtVE9zUyfpR/cmK9V/sO2VhL3LYTroM3RKRU10/F3CbC3IRbsiVr7n+dNXd2GLddsws/EuJ86ugPQ0HxTEU4PhybdDpK1kZo3Kj2qnGt2PktOagsEjE8fRn/ZtgsuOJ8qilOiR60rBcJK3C+flbGZSoih/DVu2mVONnmLGZaiNvejblw4D8LaAEnSQTrR2exbYkQxL3SD9ny7hsPKQpttOoB/FQHGLr464VZNBXLSczpjp0TTl9ij7NqhlopLgTlTB/OhaCpLSbaSp64V51A96TCpp5YydvwjbTgv1C1b8qG1AmKOM27rTKXNQtRyJA6etMtWttapTbtlM9VetELFxbil3biRDYhoT+tLte7hDa+uRbl3a4TbhCt8oAA3KjQx28zPF66cKVr859B+77VHxRari5ClLiPMke9A726XfpVbwfKsFSx19KmqjK3Miy5x4QXF29iF0Xjo23ohI2p4PJbS5cuKUFkZUJGwqHblFvbBsKjTqd6j4leItm1NJUc5G24FOVSfCQp2beSLf37lzdNsTzEpUNup9+lT3ypbqdQAgQJ2NBMJYcuH1XLgGVHyjbWjWWE5gmCN5NDdFQ9qOqk58sL2CSy0EOjOhSiUncjtUlLqlPglUAHyx1FQ7F8EBRJVOontTyrpCiG2GoWTuRWZZ2XoSwh3lJZbSeYrWVDqQZryl9oPiHE0eIDjWHXFw2m2tkMqKJAJ3O3vXqpkOuOckLBUQZTHSqfxjwpguJXZun8PacKiM6ijVVXfHauOlt3yWSh5PSz1lWyMsHj1vijilAytYnepGwAJinjxVxgUZf2te5RqASdK9OW3A2Bcyf2S1ywJ/uwZqbf8AB/D7VkUDCbfMrT5BpW2vNQk/bWeefgbIrmw8rp4z41ScycZvQR1npS0+IHHjaipOOXmZWk9xXpNjgnC3WgRh1uSpUqhoaDpT9r4f4C5dpt14eyVkSSGhT/6nFc+mLXh5t8WHmlHiRx8gkoxy6BJkwn/lW0+JXH6AoIxq5SF/NCYn9K9ZL8MOHXCUM4WycoE/dAVEe8OuHXHUMt4U1BXBPLExSZeYqXdY5eEux+oeXE+JniGAAMYuiAZAKJAI+lPr8W/EsuJdXjFxnB0VyxI/SvWSvDvhxDrNqnBmlFZmeUKlXfh5woVFs4MxKfmJbAiky87Qnj0hi8FfjPqHkZPjD4lJWhQxd0FAIADI699NaeZ8ZvEtloMjFnCgEmFMJ3PU6V6jR4d8JLW48nB2ABB/uxOlLa8O+FlsvOrwhmTrGQHSiXmKHz6QK8NqF/unmBPjd4n89u4/aRW42nKlSrZJgflUpnx48V2nFutYgnOvRShZo199K9TYZ4bcKptM7mDtZjsOWNfSrDY+GPBabdLj2CMpzmchbAmlS8zp1/tBrwt7/wB08ejx/wDFfl8kXbOXXT4JOvvpSVeP/iuptlv4pvKwrO3/AGRIg/lXr5vw24JcffWMIbCUiI5Yik2PhtwQouBzBmiFAJACAdJ3ol5ah/7Z39IvX+6zyGftC+LhdS6rEUlwCEn4NEx+W9Yn7Q3i8hn4f9oIUmTqqzQSTPeK9n2PhRwI/iWV3BGPlzA5B222oq54PcAuJSkYIylMnXlia7+radf7Ry8Pf/3WeJP/AMJnxlSlDasQt8qB5QqwR+e1Nq+0l4wqygX7EpSUj+wIkj3ivat/4LcAFwOHCEDliNAAP4UpHgl4fG6T/wBjgaBz5QZ02o15SjGfSQL8Vev91njA/ad8bOULf9rMhKYIixb0j6U+39qLxxQjIrFWiD5v/AI/pXtS38EvD11BUMKSEA7ZBp36VPT4J+Hbtkp1eFJgCB5Eyn02oX5On/tELxd3zazxMj7V/joghSMYbkAhMWKD/Kmz9qrx3U6Xk42EqXClRZI1I+le1bHwJ8PUu8w4WF8waEoTrWO+CHALSi2rC0hbkBKlNCofk6V/tE/0298eqzw879pfxxKs4xlQVJVIs0dfpSE/aT8cUSU447BTlM2aI3n92vfA8DvD/lAnBklTcDNkTrUJ3wV4BnInBUhCSSpOROutd/Vaf+0T/Sb/APvM8KK+0p46rJ/7eeAI6WaNv+Gkr+0b44vpyLxt0gjLHwif08te5HPB7gFvEFNLwxAbS0DlyiKjq8JOCbUrJwltYBGTyJmPSo/q1P8A2Qv6Rd/3WeI1faJ8dAko/blwkZeXIs0yB+VY39oTx0bTkRjNwlO4Bs0nb6V7cvPDTggtpUnCEFWYfhTpUnE/Dvg1thp0YOychCVfdjrS35mlf7QUfDXNfqnhv/8ACG8dEIyHG7hI13tEnf8A3aY/0+eOCmSz/nBeZFAjS3T3ntXtXGOBeFWkjl4GwnKRryxO1Cl8IcLpCCnBmQkan7sQaJeYq79IF+Hu6drPHavHXxtdzAcRX0qGUxbpBj8qQrxp8b1JI/zjxNQI1hkD+Veub/hXhu3eZcRhDCUfL/djr3opbcNcMqYJ/Y7JPbINK6Xmalz6SJXhrH/us8Uq8WPGlQJPEWMQeuU9PpUX/Sn4vEqKeJMX11VBO/5V7YZ4f4dbUWDhLJQown7saUHveC+HG7hxKMPZQpY6NjWhj52p/wC0iZeBs/7rPHn+kzxcgtDH8XMmSnXf8qZuPEPxUeby3OP4zkV1M/xr2UeEcCSAtuwbBG/kFDLvAMDNsvPhbJQnclI60xedr3fpAPwVu39VnjpXF3iG+MisaxhQHmy8xUflSV8QeINxGfFcZX01cXXrSy4YwFy9W38AzCkAaI2NFrThnBStTfwLHMAOU5KdLzcI9VoXHwU5d2s8ZHE+PFb32MEjTVa60hXGSpKV4mdddVb17WVw1hiAtK7NEwIUGx+lIGB2BXlFq0lUakoGtKf4g+1SGf8Ax5vuxnixVnxY6RzWcQVr1CjXrvwPDivDbDbZ5Drb1tmQ4lyZUqTrrtRpWBWYUgfCIyTqoIFHLOzRZAJZbAQk9BE1U1XlHq47HHBd0HjPyVu/fkIB9lQDBJk/lNQbpDzThTpmSNDUvK0txCgDGpPp71q8U6EoUopUkdaoRbizUkslcxhpy5Q44mM+XzT7UNwPEFKtFMqVC2FfL3FWK9bbSrMApQOuuu9Vq+sGbG/5i0kJcMSnpV6qe9bWVLIuMsoJvMi7CwtuSoSkx+lKw11SZtnUlZa8sq6pPX6UplIValttUqAzgkyYqMslvl3C4zjSZ/jU9rDJ65LKltFwyWHVIC0CO8p6U1arRZpcYWRp8mu47VDZUkpFx8wA0M6GnD/bgoqCcyBmTHUdqrSTjwWIyyMXK+WlTKwRlOdPqKFG5csHk31uFlpRhxEb0bDLd4yNIKTEqmUmh/Jbt1rtnUgpWYSonb1o4SxwLkuRQuw3cpu7cSHEjMB196h4wxch1OJWipCVSANo6gikpz2jqrR50Ag5m1d56VOtn0cgWrxKUuGE6dfWixt5OzngisXzZb5jQypXqUnUpV1p1y5ViDBshOZIzN66z3oS6xc4ffgKjKuT8w0T3oj8SlLSls+ZaDKVJ7Ue35Az8EdT794yu2db5d2xusQMwHWhCkfd5iktpOqhP92voR6Gjd6hdxbpxS3UkKSPPljUdZqI6lV9ZKcMFLnlUI/WnwngVKOSZZXPxrOdxsJuGAAROi01Mtr1DCBb3CCbd0xJHymq5h14Wl8lzMhbflmIzxtRlhab5laikK11n8JoLOOgoyzwxu+smxmt7tILDwJTB0/96rKbR/Arg+YuWitYn5e1WpX/AGnavWTqcr7IKkE6bUEUpb6F277cOoAGUjb+tNptaWGLtgm8oKWbib9nKVhUjylPQ96c5TV+wqxuRneGiFetVpq4ewdxJJIRmkAbCrGl03qBesOZXAmSkH5/X3qZrbyugYyUuH2An7D4d/nNiHECFjqqpWH3qDCSUiToOxHSp15bi+Qm6ZQUr/GD+OOv0oHdZLZ4u8tQSTLiQmJV3qFJT4J2uLyg3dNcwJesVJFwgylXQj901GF61fISw82WnWyQpveT3pmzulShxp7MyoTM7U5etFQTcWyAXk+af3hVaxf4sfFpkG+aLSMjupJ0nb2oIpxzBLgLQgqZUZWjsO49KtKby0vbVTaykr6iIyq70Jum2yOS8cwX5QoCq+7/ABkNcedy7Hbe5buEc9iFSYJncdqjX9usOpftlQs7zoD71EGbDgVsyUDfrB70StVt37aErVCiPIQdFD1qnOO15+BsZOUeRNjjJTmDUtvgHMgnb0otbYg1fJPOSpDh3INVTFrV+2dzpjOgEyn8Se1OYfjSbtsAwlSYB6H2pNlCnHdAONri8SLLeWfw5SrnEoX8q5/lTC8PuAkulxK09Y6Cmmbh55stOGUEwkzUla3bZBcylbQAAMdKqPMByafImyCWllCV6E6hVLdsOcrOmFaGYVNJeS3dJFzZqlRIzdlelQjfBlRSoltSDqkCKhRlJ5XYbxjkausFbdJbcbzIyxppQTEsDZI84C0kjKRuO1W5F4LxsBtwcxIn/aqFfWa3SFNDVO47VYqunB4YiyqMlwc7ubR6yQQ798wSRI6Uwm4TboKkiWjAImctW7EMNQs5Q1MyCOhJqq4hYO2KytKcyIgjLtWtRarFhmZbVKDyidaYwVDlOuhbJMAncaVp2wbfWh1hZQ7uFJMadAaGcsTz2IUY8yANSactrx9sZUkwJ3HymjdeHmIG/K9wYtbhSim3xFkoWgAIeSTqavnh/wAAYt4j3L2G2d5hltySnmOXNxlWoKn5Gx5lbaxtpJE1z5vEwpHJuUJIHU0tDz1lmdtiXmQQTBIWg9x6+tIcFuzIcpNxwj1vwN9nnhHgS4TjpP7WxloT8U+gJSye7bYkIPqZPr0q/pC4LYUQDuD/AC7V5o8NvtC49w4piz4kffxnBRAJWrNdWo7pP4h3SfoRtXpuxvcM4gwy3xnB7pFxaXbYWy6jZQP8DMiO4NbemvhKOI8GHqaJwlmXP7mAuITlTCh/i6CqP4i+D/C3iIF3j6TYYqRHxjCQVLgaJdTsuP8AiHeNKt19eM4TaP3+IvoZtLVCnXnlqhKEJEkk9o1rzD4ofaQxriFbuH+H907hmGyUC6SIubiOoI/u09o19RTNQ61HE+QKI2Sl7OCp+JPhBivh1ctOv4vhz5fVkR8O+OadCZU0rzpEDfUTpNUAvpzEPthp35eYPlP0pZxZ25fUu/cWbhRBU+skqUT1JO59aeW5b3SC3dCQdAsDrWRJ+7rg2YttfuKYvrtlvlpUIGgExNSGl2d8othwNPR1Gn5UK+Cuml5ULLrSv/SaW2pBMFOYp+YHQihcE+YnKeOJER3muklxSkp+bU70uzsbm9UUNILTMawdTU+0whTo5t2s7DSIiiyUtM2wbgNJQdaieowtsUTCjL3SZGsbK1sP9VnWdgBJmsv79AELEuK+VtJ0B9ah3mLr1bsjkSmQp09faoDK+eSphSjEZ1GgVbn75jHYoLbAdWp111K7gy4o6ISdBpS+S3aAlcu3CtAiJApAfUl1TVm3mWd1kaAUYwrDyykv3a0ozbrV835Uc57ELhDcRWcKvblaQ8tMkDQbAetWFhq1w9kssBBeIAgDSkNJeuiSzDduBKlnTN7UOxHFUod+EwtClkjzOdBVSUpWvBaUY1rIq8xgWYOchd1skJTomolvbXV+Tc4g4ddcpOnvFOW9mzbJVeYgFLdVrCh/CozmIO3TiksdPl0gkelOUUliPwKbbeWExiLNgCm2b8wESdiaHP4g4+s5Qpbkwew9adyMtNh27VPUI6moxWtwqTat8pP6mojFZ3MmTbWDAtLZUkFVw8Roeg9Kk4dhGfzXKyXN9elTcJw1tlrPcgFatQB07TRMW7rogwAdp6ihnclxEOuvPLEMJDQKWgEdZA39KktANq5j4BQnWVdZ9KUhhtpsKStOZRhVC8Vvy2gBLpUUyU5dZ+lUop2SLLexE5+8bbPMJEmQkzuO0UNXcLWvMHPWJ0oK25fPLUp4GdwJ0E0/aW1+7c8h1Wh2SKuqmMFlld3OXCD9kWjq4OYskFKR/OiiGkqAW9mU4NkpGntTuHYTbWjIWsEOqgCpbnLtms5P3hHlEa+9Z07U3hF6ENscsSHFhbQUOWNyAdKZxC8ZSkNhQLh+WBtUS7vQhJSlfmUJGmxqAp1aZW6tOcfMfSprpy+SJW44E4hiCrdBK1SJ01obatKW4L+4JGeeWnrFOBn4pwXLxJaSSQn9409cqWVBYKYO/oKvxSgtqKjTk8swOJYzXNysq3CdJk1Pwiyfv7hNzlzLWNAdkj1odZWl5i9wlLKcrSTIGp171dmbD9nW4ZbcCn1fNAiBQW2RgsIOqvc9z6Hy2x8MLNsTkguKSNTSFuotvvHSAlPyDqanIS1bsSSJAmepNDLu4aLvPXGb5QCKRVHe8liz2Lg1eYilkBKnRzFb9/8AlQtxJxBwKVCW2tY/emm7q4RcPyIKtlkagelP2hD4DLBJTImBvW7VWq45Zl2Tc3gJYXhwvFKfdWMjRgJ2qTiTzFuC4tzIykEQdCaUb5mzRyG1BWQSrMKBP3C8Yugt1akWzPyj989/ajhFyll9AtqKwOWzzy1m/dIUpQhtKhsKnWixn+JfAzA+QEbmm2WzcgvAFDadfNpNFMMwpDzovrgwhB8iZ0PrT5SUUJjFslYY0bR3O+oC4fGYmNhUfG7sPOFhgylnVeXWVdAKXil8LZJFv/eueSCNR61vBrFkJBWpRCZVmI6mlZx72N2/4oZwmyQyDe3KDz1GUgbgdqMtujCW1XOIIQHFCGUAyr0NJsnVJW7eqIDDR8kjRXfWmXuU+6b99KSoCUj09P8ArpSZSc3gfCChHINuMTLJXcXHzk58xHShjS/2/eIedXMGEgDQetM4xeIxa4NqwAptuQ4pI0V6CjXD2GIwtr4ophxaYhWgA6VY4rjx2IWbJfsElWjVhapYaXmdVoognzUsAYTZOu3DmZ5aZ9h6U3YzdXK7p4nkt6Ij8SqGYtfKvrkW7S/u0mFE9xuKqxTnPksyxGOCO1iNw+5z3UarHkA6DpRqyt4QHC2QoiJ9e9DrXDwSl1YygKjy/pRu+LdlbJaCjzFDL5SNPSKOxpcIGCz2N2zbj6srTkoCoJnc96k4hdu2im7RtvMCND60/hvJt8N5ylJBSOvWhLt4VqcvnijKn5Krx90hr9sSLfPItkhbijzHTKRuZ7elM2iVuuHffzCOlNocVid4q5SfIiUogAz3NEWuTbNl56QoGTVriCwIzuF3jTbTSXHSkISM2Wd6qvNuMSu1lQUApUAA6Zal4lfP4i8ti3K1tZj56m4bYZAHihQygaEbmjjiEcsXL3ywiSzbotmUNpEDRR8u1TFNJVagJBzrUNNwKS2pbukCCfLPX0oxh7JCwhxsQnceprOus+S9VD4RCtLdTCuTC8xM1NbALqln8O4OsURLAWFvvpH3eiY6mKFvkIbJQo5lKJMdKoynv5LShgXaoDPMulEKSkGJ3mg16+bpSgWnFlZgE0Vcuy41yWVgkQFGh10hKXZaWkx1nc11ceckT6GW7V1nLlSUpSdZ7xUPEW0qacCHAQn11mia3wLcBxWX26mgd8pwIeIIIPVIkxWppY5ecGfqZYjhCrVK2LNIWsFStZqXhlzy7xwFUnKIEbGoVk4tTAClCE6D1p9hkOLBVnknT+taL6KcG8ltZacWyltDnmy6mDTFsyEXqU8wnKCqTsPSn7d/kYetwpVmyyKbwW5SXFPhUrUNQaoSSabLe5hS3YL1+l0qjKiJjUVHxNCW7hIJMqBj196J2TilO524KjpAG1DMXcW/eK1UdOWYFVVBSY1yaREUlthpThBOZWkU/aIadb5CCoLWob9t6ZfSoWrbSNUqXIJG/pRK3ytBCG0kFRAMCn7UkIy2xbbXLeS0hR1VrHSrSpLJs0ZvMoJy9yB/KhNjbNruQ4rNlbJIMaTRK4JLRUmZIkA9aROCb4Hwk0iKi2QlhQEfeSdKjWLJbUStSYiBHQTUwnLbIC1iSNQkxTVshrNOWIMx69qZGKFSk8hPBmlm6fWQSAkJE/xFG3EckpghSpEgdqh4W5ncW2oidBp0qYtrI83rIUqCDNKcE5cBqbUeTa0N3DilFMQRIohDTbgUMpKkaCKjttZC88pMZRtGkVI+HUu9tnUoPL5ZMxTVwhTkIQtC7V10JX5V7Ab/AEogyys4YrMlWeDpTdlmVcOsJJmQRpBjvRu3a5tutpe6VQRG/vUTBTBtnaoU8lxRyqDcJTOgpSm0XzeReZKkGI2M96dZC28UNs2oeVAImtXYcZfbaEQ8ooJ2g1zw0SjH1uMlvygpV5dDJJio8LXcrQswAgQfWiAsgzboQpecpEpUOtD7hy4TevIW3CW4I13ml4WRiznIPxG3S3cBZSCFoyjT86DXNpcIuCq3dKmQJUDE+wq2YrbPKbaW2pJjSgMJQpSHUkBYiB1o44wC+wLilqldsm4Q4ptaDMd+tPXLjl3hgW0khRhXppTl6GvgsqgoFWmlP4chteHcpeaEyB6+9BOKfKCrbRXcTU+uyU66hSiE7iNB1oMh/wC6CAlShodSNu1WbEERhzjSUCMxSYHSqk0BapKVleVC91Aa+lFBLGGRJ4ZJv2Gvh1IUApSkZh3BpixSZQpecqiCJ0qW40u6ZZuUokjyqmmWXQm6ct1KSnL5hpqa6UFjGDoyaYxesqZdLqUkj5j6UPx/mBNtfISUJzZVQNqsN6425ZqJQF5fxRpUEspfwtxnKVpKddKrRSTLLyyDYlFzbB0AmNxNQL62tll1lbflV6frT2HOhh4JX5Z01HbvTl8sJcS8EZ0TB7x39qJxxLJKeY4ZT7dIscRcbWVCPl9RRAvOfENvsKISRChFNY2EoxdlcANrTofU1Kt1HmKQpxKoOwGpFWZYccsrxbUtoRS4XUwqZTsPelJsiFJWtQ3Oop9stut5cqQcszHatFpHLKkLKswkR0qphZLSeRlVvyEFKnSRAIO5HYVNZaCUJW66IjvNCXblwLCVDWCBmNSbNxZc5C3ElKhIHY0za8ZAysksIFxIlSHE+UCYkUwu3uIUw4jMoCe+lSQ2FIDjZ2Mz1py7LjKk3LJ2AJJoc4YeMgpLai0plwKUpB0ExpUG+YbvGTan5kCQT3onfJK1KWFEAagj1ofdtkKRcJCsuhGn50+ueBU0mitsYjd4ddpYukq00zd09qMuAuIPIZSpCoIIOsUzjFq1coC20hTu4JFQLa/dtVIQ9AEgH6mrn6kcrsq52PDC1o85blbS5yGCkHaKl2l3kdDYbAKfMnTpUZRQ82sInOJKCdiO1M2twHXFCUh5Aj0pD5LCeEGXpt1F1IUUL1IA6+lCrom8T8RkIyKy69AetFVPKW22l0DIQNPWoeRpp5y3UshKjCJ2P1pO5BYyDcVaDoatkuAuJTmQqO3rTDYU7bhKyoL0zGYykHeiF1ZqCkPlWZLRg9JFMX7SWkpumJyKMmPxelOU08IBxwQrxBdysvKlQBKSOv8AzqHYXy7JwWdw3CwryHv2BoislxlLgyFB8w11qFiLDV9aKW2gi4QJzDcjuadF/AuS+ULDird5a0ElJPmSqIPenLZ5eHXR8g+GuRIkaA1Ft3W37ZtbyYKICgd4HWiNt/amnMNuEgifuXO9FLhAx5ZrEbWEF5FuFKSM2YdqhWWKoF0H286SPK4iYHoYolaX4Ze/Zt20UuSQlShINQsWwsouFYhZhK1gw43tm03FDCWXiRMo45iF3mmQBeNqSokZhOpJpi9tWMQZTiLBKrlEBwJHSmMKv0PISy4oTBBI39qdcW7hF0m5aQTbqHmSN/rSuYyDWJLLA93Yi6Q4pGaDp5ulC7K8fsb1FmoqgHyqOgq04slxsDFLFKVWqh5k9Un1qv45ZjE7YXVsMr6RKYO1XKp71hlayGHlB03S2zzG2pO6svbuKaxFm3uUfFNgIcTqtCZ19aB4Xixdt+S6uHmtdTqTRm1uFvjOCgKR/eoJ19TQTThLKCi1JYBCGl2rhSwsclzyqB1g96m27wWpTPmyxuDsR2reJ2AZbN7aQWl6qSPwmhrbzaHQ4M0CNJ29qXPElkJe18j+K2ZbcTeMg7eYDtTIdadaSkGQkjUVLcuFJQpaneYlW2nShAcQy+pxtAKV7pO3v71UkWFyP3CChpTjZkkTlPpvNCmn1WbyVgEtkwCNknqfajZLTyDE+dMED+FCrhhy3dVbPty24AEkDp2pKaxtYT46CiVovrfIooJIhBjWart/hbjKi+yVIdBnLsCaebeuMKukJcjkqMJzbpNGXWmr+2UpEKeA96D9F/sS0rEC8IxF9DIuSDzEkhaKtVpfs37BaK0p029aoCri4sLhbiimAYIo5h12xAdYWJOsCg1FOfciabMe1h5TfwpAby77J/jUDEmEX4zCQsaTMTTjV4h95KX1xO5H4acdQObCSkeUZFHY+lU0nB5LDe9YKZdP4lhSyUFSgOtP4bxW7myOGBOubWrBiGFJv2SypKUuEEEdKpeIcOv2zykBxLcnyz1NaFLrujtl2UrfUqfBdRdNPtB5KUx2AoZf4ci9Cn7VUwPOnt9KDYbiT9g6La8KQANCNjVjBcMXNsRmKRokb0uVcqH7RikrFyVPEcKdtyHG8w9dooZneYcKbhKyCZChsavry7S5SW7totKmJGooTf4UkqOdKFpjykdKs06nK2sr2adLlAhLXNb86/KrfXUUyzdvWLuVxZKZ8iu1Kew64tll1ClOIAByDemUrbeScpkiRkUNRVhJSEyTig3bPsJcTdWzmR4arSAIVXbvs2+I7Vpj6+B7x0ssYmVOWqFHyouAJIT2zgbd47mvOZ59qsrbkACTIo1gePrsr+0xW1hu7snW32FRPnSZG3/WtRBOuamjpNWwcGjvf2oONxdXDfh5ZXHJQ0E3GIFBjmkiW2yewEKI/wBnoIrzK9au2asqkqj5gasvEfEeOcRY/fY7jCG3XMQeU8vIIS3OwSNSABAGpMAa00ttN0wISFgCAoCTPaus1EnNy+GDXTGMNq7K2spdQEupGpmnG3F2yVKahSYghQ/hT91YOsasgrA+bpBqGq5URy1gAJ0IpixNcANbHySbW7acQQ0pRynzA71IVaIuTmacyuCIOxAochm2cSBbK5byEzqdKdYvChQafUULGmYbULh9iYz+4cvXhZs81RKpJgUEdu3718l1UNTORNZWUuqKUcjrW3LAhXK5Sc6JT0A70/agOozwEiQQlP8AOsrKbP6RVS5CjVolqHSBBOqRtUvlhBQ/eLU6k7IGwrKyqMnl8lxLC4Gb2+dv3E2jYDTUZSBpNY2hmwSUIRJbGmlZWUUVjoXJ5YEeefxW5KSvIgHaTUtCf2ektjzKWIzdqysqyuFgW+XkdtLZT55j7mcbgdqMs2jTcEakpzbVlZVS946LNKRKVkQhQAgGJgU/aDIgBKiSOp1rKyqsuYjlwCMVxB5pRZbga61AbSA3zlqUVelZWVdrSUUV5ybbF27zj7qLZsJSFH8qtWHYM0gBUy4B801lZVXWScVwWdNFPsJut8sqQDITpPXahd3dOoGc6kCAOlZWVTpWXllifRFYbWpK3HV5iUzr/CoGJXecoZAILpCT2rKyr9XZTsfBjQJWkhUISISO1bdm4eQwkxJjU9BWVlOfWTo/BbsJt2cNYzNpkkaGi9tYpYQbxbinFL1g9KysrJm3uZfj9IKev/iVucxJytnygelDbu8U8048AUkaJ9KysrV0ySawUbW2iFb26wUoUoSSASOs9aszVinDmfiGiCopyj0msrK0ZN5RVilhgxwKedDKlkrUfvFToR2FSWLVNw8i1SAkAxJPasrKtLhCH3kmpZcv8QRhjRS2xb/N3WKJ376bYqDSIaYQAlI3J71lZSG90kmNj9LYFsQ9f4gFOPfMdRH4e1WmwtxdOFhuG0M6KjrWVlRe2uCaknyRLxZvsR+BaPKtrdUZBuo+tQMfdeYJsm1+Y/i6BNZWUNQdnWBvA8It3HNdG2oJA3UrpNGrofEOJYbhB3Ue4rKyom/cFWltBGIX67ZPwTEpSNKiWls4q7RZsKSkHzLUdzWVlOftjwKXM8MOhCWbgslMlvczvTttZIun1POaqBgGaysqm22WIJIjYzdOILVjb+RJOVQO0VExK4C20WbYKQogHt6xWVlPrSwKm+SZhjbVox5ECSAKFY9dOuKaYScqnZmNorKyjr5lyDNewftGWmWgeXOXTfc0VtQAzlI0VtHSsrKTc3lja0sIktWhYAdC5SNQO1E7dYJW4kfhgE9fesrKzrWy7WkIuXngpLSlApIB9qH3r+ZwgghIGsaGsrKWugn2OKLDVqtbaCFETNQENm6IfVASBqnvWVlHEGXRExN7koDg0bVMpA1nagl0+pSG0bAqrKytbRmXqWEm0NpaBSmAd6ct3OZeoaQI5Y0JNZWVZl0KXaDty85yA1MBMRUzC7JKLQrUZUoSCOlZWVVs4iWI/UGMOfcYt1rzmddQNaAm/Uq8UQnzSZPpWVlKp6ZNr6JjqEXC2W0gp8ubU9alMIU0+06Fk6xB6VlZRSAQVw64ccuMogJz6jvRi++7aK0pGXYg1lZVZ9ofDoRdKSm0bUGkaxOmtaYYSVCB2InvWVlOj0Jl2HcEtG+Y++tMqkDeiD+UqbIGqVSKyspa7C/xJztsnIcxkKGZXrU2x5K7ZD2QzqnWsrKMWx23KQ/zC2mCknTTapWDpKW37t1RVzVFQAOwHSsrKGXRCFtIbfvEvJTlcKCCaULYKShLhCjzJmKysrmT8kh2z2TzCB6VEdtkG5QpzUqnXrWVlB8hojYg2Q0gSIzGgoYbdcWXkklpcAg96ysol0c+wQ/atlzIoeUKPWnLBkIYcbCiDmnTasrKh9Ew7GU2jb77zK0AIJB3nWq3imGsJvn7cplCkhQ1rKypiRIjWjWWyUykwG1SNagApXiIWEwMhB1rKymfBD7QQWU/DOHKIy7VEtXA4x5U5fL+dZWVTfZa+AFdpCnxl8p12rV8VN24dBBgdd6yspzXQKfZXcbcQ+zbrykLGs07YpzXaVTIUkb7zWVlOkvaIj+oGQstDXUE7CtMfeZQFKABOk1lZVORciC8WWVoUkk5wJBqBb37iFBWsj+dZWVerinAp2NqQUaxR/4pIR8q/wAJ6UeS+bpHKSMoB61lZVW5JPgfU2+yIpBYbLRhQzAH2mo62/wFRKZMA1lZQQY2ZETlbdDOUFC0mO4NAsfseUV+faCIPWsrKu0PEuCtcsofwq6dNs2CqVag6b1iw40RfNqAyORl6EVlZRT+oiHMSwNoK0JhWkda1dMouGMiRBE6k1lZVCX1FxJbSC2pdyzylqMpGX/r6VpDYSlyzPmSmFIzdBWVlMQLQGFuqxxPKF5m3D8vaamvMttw4EzJKY9BWVlWE+BEuyHiFkWuXdNqCUqBBRSQ9JSEylaUwlQ6aVlZRp5XItk5bZxC15xIS80kHNHancNuvjGFfENjmNnISNie9ZWUEuhi4YNvUjDbsXLIAbcJBSBrNGrNxFywnmJzhfQisrK6XKyRD6sCA23bPmzUCpt8Hy9Ae9B025tr5y1UUls/KQNQaysqK20jpJZA2P4UixdRiFsUpJIkdxTrLxWwhxPlVOp7isrKu5coLJUwlPgmWz5UvlPedC0+YRvQ7EbVFm793sogj2msrKq/I9/SKs3dVW7qcydVAjcU08wi2dCkpCkL0INZWUi0bAxtCW3SgqUR0ECpK2271hSgjKtBOUzO1ZWVSkPRXzdKeW7Z3SQsJEzG5pVpeu4RcBonmNuwU9wO1ZWU/GY8gdSCF/Y2d6wVlkJK5j0qsWbrmG3vwebOhJ0EdJ2rKyhpe5NMCxYeUWNakrTnblOoB9amMPBaClxPyDSDWVlV7Emx8BdheFbvLUDlny9xUXEm2XUhCm8wSZk7zWVlV4+2fA2SzDkqt3bw4EOEEKmCBqKcw/En7O4TbKUVtq/MVlZWm/dDkz48S4CywClKwowo7EUlybdJWFFSd8prKyq+OSyuhSSy+0W+SATBmgOIWLaHHFpgLOxAisrKZTJp4Qi6KaywWb1wAtvgKGu1JfYUlCbi1dLZB2NZWVeiUpD+GYwp5RYuG9Zg5e1TSXLZv4q3cIE6pOxrKyl2RWQ65MkIUi8QXEpyOESdNDUC6w9l5S0p8piJisrKTCTUuB7SkuQM9bKtHS24sKBOhFOMOZlFLqQsEiNIisrKu9lJpZP/2Q=='))
-print("  \u2713 NRI OG image (1200x630)")
+SLUG = "nri-private-banking-switzerland-desk-hiring"
+
+# OG image is referenced by path + sha256; source comes from deploy_assets/ (or argv[1]).
+ASSETS_DIR = sys.argv[1] if len(sys.argv) > 1 else os.path.join(BASE, "deploy_assets")
+ASSETS = [
+    ("public/og-articles/og-nri-private-banking-switzerland-desk-hiring.jpg",
+     "feecb3421728589a8efadf0621cf0e8c20bdef116b7ac0fce870bfcee0efafb9"),
+]
+
+sync_assets(BASE, ASSETS, ASSETS_DIR)
+
+apply_edits(BASE, [Edit(TYPES_TS, '  | "CEE";', '  | "CEE"\n  | "SA";')])
 
-open(os.path.join(BASE, "app/en/insights/articles.ts"), "w", encoding="utf-8").write('// app/en/insights/articles.ts\n\nexport type MarketCode =\n  | "CH"\n  | "UK"\n  | "US"\n  | "UAE"\n  | "ASIA"\n  | "EU"\n  | "MEA"\n  | "LATAM"\n  | "CIS"\n  | "CEE"\n  | "SA";\n\n/**\n * Content strategy taxonomy\n */\nexport type PillarCode = "P1" | "P2" | "P3" | "P4";\n\n/**\n * Pillar I — Private Banking Strategy & Power Structures\n * Sub-themes:\n * - Positioning: who is winning/losing & why (banks, competitive moves)\n * - ScaleVsBoutique: economics of scale vs boutique models\n * - ROAPlatform: ROA pressure, platform dependency, cost of compliance\n * - M&ARestructuring: M&A, integration failures, silent restructurings\n */\nexport type Pillar1SubTheme =\n  | "Positioning"\n  | "ScaleVsBoutique"\n  | "ROAPlatform"\n  | "M&ARestructuring";\n\n/**\n * ✅ Extensible subTheme union\n */\nexport type InsightSubTheme = Pillar1SubTheme;\n\nexport type InsightArticle = {\n  slug: string;\n  title: string;\n  date: string; // ISO: YYYY-MM-DD\n  markets: readonly MarketCode[];\n  summary: string;\n  linkedinUrl: string;\n  body?: string;\n\n  /**\n   * Display logic\n   */\n  featured?: boolean; // Homepage / Insights landing\n  engagementScore?: number; // Used for "Popular Insights"\n\n  /**\n   * ✅ Content taxonomy (optional but recommended)\n   */\n  pillar?: PillarCode;\n  subTheme?: InsightSubTheme;\n  keywords?: readonly string[];\n  ogImage?: string;\n\n  /**\n   * 🔍 SEO overrides — use when article title is literary/abstract\n   * seoTitle: replaces article.title in <title> and OG tags (max 60 chars)\n   * seoDescription: replaces article.summary in meta description (max 155 chars)\n   */\n  seoTitle?: string;\n  seoDescription?: string;\n};\n\n/**\n * 🔹 Insights single source of truth\n */\nexport const INSIGHTS: readonly InsightArticle[] = [\n  {\n    slug: "nri-private-banking-switzerland-desk-hiring",\n    title: "The NRI Desk Problem in Swiss Private Banking",\n    seoTitle: "NRI Private Banking Switzerland | How to Actually Build the Desk",\n    seoDescription: "Every Swiss bank wants an NRI desk. Most are hiring the wrong profile. A recruiter\'s view of what genuine NRI private banking coverage requires.",\n    linkedinUrl: "",\n    date: "2026-06-22",\n    summary: "Swiss private banks are adding NRI to their strategic plans but hiring the wrong profile. A recruiter\'s view of what genuine Non-Resident Indian private banking coverage actually requires, why South Asian is not the same as NRI, and where the real pipeline sits.",\n    pillar: "P2",\n    markets: ["CH", "UK", "UAE", "SG"],\n    keywords: ["NRI private banking", "non-resident Indian wealth management", "NRI private banker Switzerland", "NRI private banking Geneva", "NRI private banking recruiter"],\n    ogImage: "/og-articles/og-nri-private-banking-switzerland-desk-hiring.jpg",\n    featured: false,\n    body: `\nSwitzerland\'s private banks are not short of ambition when it comes to the NRI market. Non-Resident Indian clients appear on almost every strategic plan in Geneva and Zurich. The segment is listed in pitch decks, referenced in RFPs, and cited during banker interviews as a growth priority. What those plans rarely contain is an honest description of what a genuine NRI Relationship Manager looks like, and why the profile most banks are currently hiring is not the one that builds the franchise they are describing.\n\nThis is not a niche observation. Over the last two years, Executive Partners has been approached by multiple Swiss and international private banks looking to hire for NRI client coverage. In almost every case, the briefing described an outcome, not a profile. The bank wanted to grow NRI AUM. What it had not worked out was which specific NRI community it was targeting, from which geography, and with which banking needs. Without that specificity, the hiring process defaults to a shortcut that does not work: finding a senior banker of South Asian origin and assuming the client franchise will follow.\n\nIt will not. And understanding why requires a short but important distinction.\n\nNRI is a specific legal category under Indian law. A Non-Resident Indian is an Indian citizen or Person of Indian Origin resident outside India, holding assets that are governed by the Foreign Exchange Management Act and subject to specific rules around repatriation, NRE and NRO account structures, and DTAA treatment across jurisdictions. This is not interchangeable with "South Asian" as a descriptor. A banker of Sri Lankan, Pakistani or Bangladeshi origin may have similar cultural fluency in some contexts, but they do not hold an NRI client franchise in any meaningful sense. The clients, the regulatory frameworks, and the relationship structures are different.\n\nMore importantly, NRI is not a monolith. The Indian diaspora in Switzerland and in the booking centres that feed Swiss private banks, primarily the United Kingdom, Dubai, Singapore and increasingly Canada and the United States, is segmented along community, industry, generational and geographic lines that determine almost everything about how wealth is held, how relationships are built, and how a banker actually transfers a book.\n\nThe United Kingdom-India corridor is the single most important feeder market for NRI private banking in Geneva. The UK is home to one of the largest and wealthiest Indian diaspora communities in the world. First-generation entrepreneurs from Gujarat and Punjab built significant business wealth in British manufacturing, retail and services across the 1970s and 1980s. Their children and grandchildren represent second and third-generation family wealth that has since diversified into finance, technology, real estate and professional services. The banking relationships for this wealth were established decades ago, primarily through HSBC Private Bank, Standard Chartered Private Bank, Barclays Wealth and Coutts, and they are fiercely sticky. Moving an NRI client from one of those institutions to a Swiss platform requires the banker to have a personal relationship that predates the professional one, not the other way around.\n\nThis is the first point that banks consistently underestimate when designing an NRI hiring brief. They assume that a senior banker with strong credentials and good presentation will be able to open NRI relationships. In mature markets with established client-banker dynamics, that is not how it works. The NRI client base the UK corridor produces is relationship-first and institution-second. The banker who built that relationship at HSBC Private Bank over fifteen years does not carry it on a CV. They carry it in a phone and in a family trust that has been doing business with them for a generation.\n\nThe South Indian tech wealth segment is structurally different, and more portable. Technology-generated liquidity from founders and senior executives with roots in Tamil Nadu, Karnataka and Andhra Pradesh has accelerated significantly over the last decade, driven by UK and US technology exits, secondary transactions and RSU accumulation. This population is younger, more financially sophisticated, more likely to have worked with multiple banks simultaneously, and more open to moving a relationship based on product quality, platform capability and professional credibility. The challenge here is not relationship access. It is that this client base expects a banker who can speak the language of equity compensation, offshore structures and cross-border estate planning, not just portfolio performance.\n\nThe Gujarati business family segment sits somewhere between these two. Family businesses with manufacturing or trading origins typically hold multi-banked relationships across Geneva, Dubai and Singapore simultaneously. Portability is higher than the UK corridor but lower than the tech segment. The client evaluates the banker across a longer window, and the introduction usually comes through a trusted professional network rather than a cold approach.\n\nMost banks hiring for NRI coverage in Switzerland have not made these distinctions. The brief says NRI. The actual conversation is about South Asian outreach generally. The result is a placement that looks correct on paper and underperforms against AUM targets within eighteen months, because the banker hired does not have the specific community relationships, the regulatory fluency, or the platform context to build the franchise that was promised.\n\nAUM portability for NRI books in Switzerland requires its own honest assessment before any move is made. FEMA governs repatriation rules for NRI assets, and a banker advising NRI clients across the NRE and NRO account structures needs to be able to work within those frameworks, or work alongside a specialist who can. The multi-banked nature of most NRI relationships means that moving to a new platform does not necessarily mean moving the full AUM relationship. The client may consolidate discretionary management on the new platform while keeping custody relationships elsewhere. Booking patterns are also influenced by the client\'s domicile, tax treaty position and estate planning structure in ways that require more detailed portability analysis than a standard AUM transfer.\n\nThe pipeline of genuinely qualified NRI bankers at the senior level is smaller than the demand for them would suggest. The strongest profiles in Europe are concentrated in London, specifically at the major private banks and at several boutique wealth managers with established South Asian client bases. A smaller number of profiles sit in Dubai, primarily covering Indian business families in the UAE, and in Singapore, where Bank of Singapore and DBS Private Bank have historically run strong NRI desks covering the Southeast Asian corridor. Zurich holds a handful of profiles, largely from the Julius Baer and Credit Suisse legacy networks, with varying depth of NRI-specific franchise.\n\nWhat a real NRI RM franchise looks like, at the senior level, is a banker with between CHF 150M and CHF 600M in client relationships that are predominantly NRI-originated, a proven track record of client portability across at least one prior institution move, language capability aligned with their specific client community rather than South Asian generalism, fluency in FEMA and DTAA structures, and a network that extends into professional services, specifically chartered accountants and family offices in London or Dubai who act as trusted introducers.\n\nThat profile exists. It is not common. And it is not going to respond to a job posting. It requires a direct, calibrated approach by someone who understands the market and can articulate why a specific platform represents a meaningful upgrade in terms of booking flexibility, product depth or relationship economics.\n\nIf your bank is building an NRI strategy and you are still in the process of defining the hiring profile rather than executing on it, the first productive step is an honest segmentation of which NRI community and which geographic corridor you are actually targeting. The second is a portability assessment of what the realistic AUM transfer looks like for that segment, before you build a business case around it.\n\nExecutive Partners\' NRI practice covers NRI private banking recruitment in Geneva and Zurich, and advises on NRI book portability assessments for bankers considering a platform move. If you are an NRI Relationship Manager with an established client franchise and you are evaluating your options, use the EP Portability Score to benchmark your transfer potential before any conversation with a new institution.\n`,\n  },\n\n  {\n    slug: "singapore-hongkong-talent-war-2026",\n    title: "Singapore Won the Asia Talent War. Hong Kong Didn\'t Get the Memo.",\n    seoTitle: "Singapore vs Hong Kong Private Banking Talent War 2026",\n    seoDescription: "Everyone assumed Singapore had won the Asia private banking talent war. Counter-offer data, salary premiums, and hiring numbers from Hong Kong say otherwise.",\n    linkedinUrl: "",\n    date: "2026-06-22",\n    summary: "Everyone assumed Singapore had won the Asia talent war. The counter-offer data from Hong Kong says otherwise.",\n    pillar: "P1",\n    subTheme: "Positioning",\n    markets: ["ASIA"],\n    keywords: ["Singapore private banking", "Hong Kong private banking", "Asia wealth management talent", "relationship manager Asia", "private banking hiring 2026"],\n    body: `Singapore Won the Asia Talent War. Hong Kong Didn\'t Get the Memo.\n\nThe consensus hardened somewhere around 2022. Singapore had won. The talent, the family offices, the UHNW relocations, the institutional momentum. Hong Kong was geopolitically compromised, post-pandemic depleted, and structurally disadvantaged for any banker whose clients valued optionality. The narrative was clean, it was comfortable, and most of the industry stopped questioning it.\n\nFrom the desk of a search firm placing senior relationship managers across both markets, what we see today bears little resemblance to that settled conclusion.\n\nThe signal most people are missing\n\nBefore the headline hiring numbers, the most telling indicator is counter-offer behaviour. When a [Hong Kong](/en/markets/hong-kong)-based senior RM enters a process with a [Singapore](/en/markets/singapore) institution, the retention effort from their current Hong Kong employer has become substantially more aggressive than it was eighteen months ago. Banks that were previously willing to let senior talent relocate are now making compelling economic arguments to stay, restructured packages, expanded mandates, accelerated reviews. That shift in employer behaviour is a leading indicator that the market consensus has not yet caught up with.\n\nThe parallel signal in Singapore is the Employment Pass processing timeline, which has extended for certain profiles and is now a factor in offer acceptance decisions in a way it simply was not two years ago. When candidates factor immigration timelines into their evaluation of a firm\'s offer, operational friction has become talent friction. Singapore\'s institutions are aware of this and working around it, but it is real and it is costing them candidates.\n\nThese are recruiter observations, not market report summaries. They matter because they move before the published data does.\n\nWhat Hong Kong actually looks like right now\n\nUBS, the largest private bank in Asia, is hiring around 50 private bankers in [Hong Kong](/en/markets/hong-kong) this year alone. Greater China generates 70% of the bank\'s Asia-Pacific transaction revenue, a concentration that makes any retrenchment from Hong Kong strategically unthinkable. BNP Paribas Hong Kong is targeting a 10 to 20% net increase in Greater China relationship managers, with its wealth management head describing the competition as extremely fierce.(1) DBS grew its Hong Kong private banking RM headcount by 41% in the last reported period, against 24% in Singapore.(2) These are not marginal adjustments.\n\nThe supply side is where pressure becomes acute. Specialist recruitment firm Elpis Search estimates that demand for experienced relationship managers in Hong Kong currently exceeds supply by at least 20%, with candidates in active processes receiving salary adjustments of up to 25%.(1) For a senior RM evaluating a move, those figures compress the financial case for Singapore considerably, particularly when cost-of-living differentials are factored in.\n\nThe structural driver is not difficult to identify. Hong Kong\'s IPO market raised over HK$100 billion in the first half of 2025, making the city the top IPO venue globally for that period.(3) Each cycle of that kind creates a fresh cohort of liquid wealth, and that wealth typically stays close to the market where it was generated. Mainland Chinese clients with new liquidity events are not routing their assets through Singapore by default. They are booking locally, and the private banks serving them are staffing accordingly.\n\nThe broader private banking headcount in Hong Kong grew by nearly 400 professionals across major institutions over two years, a 12% increase, while total AUM at those institutions rose 14% in the first half of 2025 alone.(3) Bloomberg Intelligence projects that Hong Kong could surpass Switzerland to become the world\'s largest cross-border wealth hub, managing USD 2.9 trillion in assets, with cross-border wealth across both hubs forecast to grow at 12% annually over the next five years.(2)\n\nWhat Singapore actually looks like right now\n\nNone of this means [Singapore](/en/markets/singapore) has lost what it built. The family office infrastructure is substantial and still expanding. Singapore crossed 2,000 single-family offices in 2025, with combined AUM reaching USD 66.8 billion, a 43% year-on-year increase.(4) The MAS regulatory framework, incentives extended through 2029, and the Variable Capital Company structure have created an institutionalised ecosystem that Hong Kong is actively attempting to replicate but has not yet matched. Approximately 59% of Asia\'s family offices are located in Singapore.(5)\n\nSingapore\'s comparative strength is structural rather than cyclical. Regulatory predictability, English-language governance, proximity to Southeast Asian growth markets, and a quality of life that senior international talent finds genuinely liveable: these advantages do not disappear because Hong Kong is hiring aggressively. For Swiss, British, or European bankers relocating to Asia for the first time, Singapore remains the lower-friction entry point into the region.\n\nThe challenge is that structural advantage does not prevent talent competition from tightening. The talent pipeline is under strain in ways that were not publicly acknowledged twelve months ago. Singapore does not have enough qualified investment professionals to staff the family offices it has attracted, with 43% of Asia-Pacific single-family offices planning to hire more professional non-family staff, a proportion significantly above the global average of 29%.(5) For the private banks trying to recruit from that same constrained pool, the competition is not only with other banks. It is with the family office sector, with EAMs, and increasingly with Dubai. A wealth management leader at a recent Hubbis forum put it plainly: Singapore, Hong Kong, and Dubai are all fishing in the same pool.(6)\n\nThat pool has not grown proportionally to demand in either city.\n\nWhat this means for a senior RM making the choice\n\nThe conversations we have with relationship managers considering Asia have changed materially over the past eighteen months. In 2022 and 2023, the question was almost always the same: which Singapore bank is the right platform? Hong Kong rarely came up unless the banker was already there or had deep Mainland Chinese client relationships. Today the question is genuinely open, and the economic case for Hong Kong is more frequently made by candidates themselves, not just the hiring banks.\n\nA senior RM with a predominantly Greater China book, Mandarin-speaking clients, and a track record anchored in North Asian markets is looking at the best [Hong Kong](/en/markets/hong-kong) hiring environment in years. The salary premiums are real, the institutional commitment from the major banks is unambiguous, and the wealth creation cycle driven by IPO liquidity is at a peak. Client proximity and compensation are pointing in the same direction.\n\nA senior RM with a Southeast Asian, Indian subcontinent, or internationally diversified book is still almost certainly better served by [Singapore](/en/markets/singapore). The family office density creates mandate diversity that Hong Kong cannot yet replicate at scale. The regulatory environment creates long-term stability. And the international talent community in Singapore is more established, which matters when you are building a life, not just a book.\n\nThe error, which practitioners and market commentators are both making, is to treat the 2022 verdict as the permanent one. The verdict was correct for 2022. It reflected a specific set of conditions that have since shifted. What the current data describes is not a Singapore decline. It is a Hong Kong resurgence running alongside continued Singapore growth, with neither city holding a clean lead across all client segments and banker profiles.\n\nWhat the practitioner should actually ask\n\nThe question worth asking is not which city is winning but which city is right for this book, this client profile, and this risk tolerance. That calculation has become more genuinely complex than the consensus allows for. A recruiter who tells a senior RM that Singapore is the obvious answer in 2026 is not giving them advice. They are giving them 2022\'s answer.\n\nExecutive Partners currently has active mandates in both [Hong Kong](/en/jobs/rm-hong-kong) and [Singapore](/en/jobs/rm-singapore). If you want to understand what your AUM profile, your client concentration, and your career stage actually imply for an Asia mandate, the [EP Portability Score](/en/portability) is a starting point. The calculation is more specific than the consensus, and in a market moving this fast, specificity is the only thing that holds.\n\n---\n\n(1) Elpis Search, via Futunn, March 2026\n(2) Bloomberg Intelligence, via Global Finance Magazine, December 2025\n(3) Hong Kong Monetary Authority, via Hubbis, first half 2025\n(4) Empaxis, December 2025\n(5) Deloitte Private / Empaxis, 2025\n(6) Hubbis Investment Forum, Singapore, February 2025\n`,\n  },\n\n  {\n    slug: "private-banking-recruitment-company-2026",\n    title: "The Private Banking Recruitment Company Test Most Banks Never Run",\n    seoTitle: "What to Look for in a Private Banking Recruitment Company | Private Wealth Pulse",\n    seoDescription: "Most banks ask the wrong question when briefing a private banking recruitment company. Here is what to ask instead, and what the answer tells you.",\n    linkedinUrl: "",\n    date: "2026-06-20",\n    summary: "Most banks open a recruitment briefing with a headline AUM number and assume the recruitment company will do the rest. That assumption is the problem.",\n    pillar: "P2",\n    subTheme: "Positioning",\n    markets: ["CH", "UK", "UAE", "ASIA", "US"],\n    keywords: ["private banking recruitment company", "private banking recruiter", "AUM portability"],\n    body: `The worst briefing call a private banking recruitment company can receive opens with a number. "We need someone with a CHF 300 million book." The hiring manager says it with confidence, as if the figure resolves the question. It does not. What it reveals is that the bank has not yet thought about the right problem.\n\nAUM is an outcome, not a specification. A private banker sitting on CHF 300 million today might transfer CHF 80 million in twelve months, or CHF 240 million, or nothing, depending on factors that have nothing to do with the size of the book and everything to do with how it was built. The recruitment company that takes that briefing at face value, screens for headline AUM, and presents three candidates who all look the same on paper has done administrative work, not search work. The bill arrives regardless.\n\nThis piece is about how to tell the difference before the invoice lands.\n\n## The database question\n\nEvery private banking recruitment company will tell you they have proprietary access to the market. Some do. Most have a LinkedIn Recruiter licence and a CRM they bought off the shelf. The database itself is rarely the differentiator because, at the senior end of private banking, the universe of genuinely portable, commercially relevant candidates in any given market is smaller than most banks assume. In Swiss private banking, the pool of Senior RMs with validated portability, clean compliance records, and a realistic transfer timeline in the twelve-month window is measured in dozens per market segment, not hundreds.\n\nThe question worth asking any private banking recruitment company before you brief them is simple: how do you validate portability before presenting a candidate? If the answer involves client count, tenure at the bank, or AUM figure alone, keep asking. Those are inputs. Portability is an output derived from wallet share concentration, non-solicit clause specifics, the nature of the client relationship, the client own wealth complexity, and booking-centre dependencies the bank may not have considered.\n\nA recruitment company that can do this work before the first meeting saves you from the single most expensive error in private banking hiring: the candidate who interviews well, resigns, and transfers thirty percent of what was projected.\n\n## What the shortlist should tell you\n\nA well-constructed shortlist from a competent private banking recruitment company does not just name candidates. It tells you why each person is on it, what the realistic transfer scenario looks like, where the compliance exposure sits, and what the first-year revenue case is under conservative assumptions. If you receive a longlist of eight people with a one-paragraph summary each, you are receiving a search engine result, not a recommendation.\n\nThe shortlist length itself is diagnostic. Senior private banking mandates at the Director or Managing Director level should produce one to three candidates, not eight. More than that means one of two things: the recruitment company cast wide because it could not qualify narrow, or it is showing you volume to justify its process. Either way, the evaluation burden has been transferred to you.\n\nThe right structure is a shortlist where every name requires a conversation, not a filter. By the time a candidate appears on paper, the recruitment company should already know how the book is structured, what the client concentration looks like, whether there are departure dependencies at the current institution, and what the candidate realistic financial position is relative to the move. A senior RM who is mid-way through a deferred compensation cycle is a different risk profile than one who vested last quarter.\n\n## The geography trap\n\nMost private banking recruitment companies organise themselves around geography. They have a Swiss desk, a London desk, a Middle East practice. That structure makes internal sense for them. It rarely reflects how private banking actually works.\n\nThe market for a French-speaking UHNW relationship manager serving North African families is not a Geneva story or a London story. It is a specific profile that sits across both, draws from Paris as well, and may equally be filled by someone currently based in Geneva who built the book in a previous role in Monaco. A recruitment company with a rigid geographic model will present you with candidates from its nearest office. A specialist will map the actual candidate universe regardless of where it sits.\n\nThis is worth testing directly in the briefing call. Describe the profile you need, including the client origin, language requirements, and booking-centre preference, and then ask the recruitment company where it expects to find candidates. If the answer starts with a city rather than a profile characteristic, that tells you something important about how the firm thinks.\n\n## Red flags that are easy to miss\n\nThe clearest warning sign in a private banking recruitment process is a candidate presented within four days of the briefing call. It sounds like responsiveness. It is usually the opposite. The candidate who is available that fast is almost always already circulating. By the time you see the CV, two other banks have had the first conversation, one has moved to second interview, and the offer will land before your process reaches the reference stage. You will have spent three weeks evaluating someone who was never really available to you.\n\nSpeed is a selling point for commodity recruitment. In senior private banking search, the candidates worth finding are not on the market. They are in seat, performing, and not returning messages from people they do not know. Getting to them takes time, a prior relationship, or both. A recruitment company that leads with turnaround time is telling you something about the quality of the candidates it intends to show you.\n\nThe second flag is a firm that can tell you about its candidates but not about the market. Any competent private banking recruitment company running an active mandate should be able to tell you, without prompting, what compensation is doing for that profile right now, which platforms are offering sign-on and which have pulled back, and whether the candidate you are considering is fielding competing interest. That is not sensitive information. It is what an adviser knows and a database vendor does not.\n\nThe third, and most decisive, is a firm that schedules the first interview before it has walked you through the portability case. The meeting should exist to evaluate fit, alignment, and cultural chemistry. By that point, the commercial case should already be on paper. If the recruitment company is asking you to do the portability discovery yourself in a live conversation with the candidate, it has outsourced the most important part of its job to you.\n\n## What good actually looks like\n\nThe private banking recruitment companies worth working with share a few characteristics that are easy to identify once you know what to look for.\n\nThey run a smaller number of mandates than generalist competitors. Not because they lack capacity, but because they take search quality seriously enough to limit throughput. A firm running fifty mandates simultaneously in private banking is, by definition, not doing the deep candidate qualification work that the market requires.\n\nThey have a view on the market independent of the candidates they are currently working with. They can tell you what is happening in Italian desk hiring in Geneva right now, not in a marketing newsletter but in a specific, current, sourced way. That knowledge comes from sustained relationships with both sides of the market over time, not from a recent search campaign.\n\nThey are transparent about what they do not know. A candidate with a CHF 250 million book who has been at the same institution for twelve years is a different portability proposition than one with the same AUM who changed banks twice in that period. A good recruitment company tells you that difference explicitly, rather than presenting the headline figure and letting you find the complexity in due diligence.\n\n## The test\n\nBefore you engage any private banking recruitment company on a senior mandate, ask one question: can you show me how you validate AUM portability before presenting a candidate?\n\nThe answer, and how it is delivered, will tell you most of what you need to know. A firm that can walk you through wallet share concentration, non-solicit exposure, and booking-centre transfer complexity in plain language before the first CV lands is operating at the level the mandate requires.\n\nThe fee is the same either way. The outcomes are not.\n\nIf you are a private banker considering a move and want to understand your own transfer position before any conversation with a bank, the [AUM Portability Score tool](https://www.execpartners.ch/en/portability) runs the calculation in minutes, confidentially, with no obligation. If you are a bank evaluating how we work as a [private banking recruitment company](https://www.execpartners.ch/en/private-banking-recruitment-company), the full picture is here.`,\n  },\n\n  {\n    slug: "the-acquisition-trap",\n    ogImage: "/og-articles/og-the-acquisition-trap.jpg",\n    title: "The Acquisition Trap",\n    seoTitle: "Why Buying AUM Is Not the Same as Keeping It | Private Banking M&A",\n    seoDescription: "Inorganic AUM growth creates a 12-18 month window of RM attrition that acquirers consistently underprice. What senior private bankers need to understand before the window closes.",\n    date: "2026-06-15",\n    engagementScore: 88,\n    featured: true,\n    summary: "Several Swiss private banks posted double-digit AUM growth in 2025. Most of it was acquired, not earned. The gap between the headline figure and the organic rate is where the real story of an acquisition lives. It rarely gets written.",\n    linkedinUrl: "",\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    markets: ["CH", "UK", "UAE"],\n    keywords: ["private banking M&A", "AUM portability", "bank acquisition integration", "relationship manager retention", "Swiss private banking consolidation", "organic growth private banking"],\n    body: `The headline numbers from Swiss private banking in 2025 were extraordinary. Julius Baer reported average monthly AUM of CHF 520 billion in early 2026, with its CEO calling it the strongest start to a year in the bank\'s history. Several mid-tier institutions posted double-digit AUM growth. Capital ratios across the sector are well above regulatory minimums.\n\nThe Swiss private banking industry is, by every published measure, thriving.\n\nBut strip away the press releases and look at where the growth actually came from, and a more complicated picture emerges. One that has direct consequences for every senior relationship manager sitting inside a platform that just acquired a competitor, or that was itself just acquired.\n\n## The arithmetic of inorganic growth\n\nThe private banking sector\'s 2025 AUM numbers were shaped by a wave of disposals and acquisitions that had been building for several years. French universal banks, having invested heavily in international private banking during the expansion years, progressively reduced their wealth management footprints outside France. Each disposal transferred AUM from one balance sheet to another.\n\nThe mechanics of these transfers matter. When a private bank acquires another institution\'s private banking book, it purchases the assets under management as a figure, the relationship managers as employees, and the clients as account holders. What it does not purchase is the relationship itself. That is an intangible that exists in a conversation, in a history of well-placed advice, in the trust built over years of being reached at midnight when markets move. It sits between the banker and the client, not between the institution and the client.\n\nSeveral of the acquisitions completed in 2025 delivered headline AUM growth of 15 to 20 percent.[1] The organic growth rates embedded in those same numbers were, in most cases, a fraction of the headline figure. The gap between the two is not a failure of execution. It is a structural feature of how private banking AUM actually works.\n\n## What actually happens in the twelve months after a deal closes\n\nThe private banking industry talks about AUM as though it were a fixed quantity, a number on a page that transfers from one balance sheet to another when the legal documentation is signed. Clients and their assets are treated, in the acquisition model, as durable goods. The reality is different.\n\nAUM in private banking is relational. It sits where the client wants it to sit, and the client\'s preference is shaped primarily by their relationship with their banker. Not with the institution. Not with the platform. With the person who calls them when markets move, who knows the family structure, who understands the tax situation, who has earned the trust that takes years to build and minutes to lose.\n\nGeneva\'s private banking sector shed more than 5,000 roles across Switzerland during the UBS-Credit Suisse integration.[2] The headlines described a market contracting. Hiring managers in London, Singapore, and Zurich read those headlines and assumed Geneva\'s talent pool had loosened. They were wrong. The roles that disappeared were operational and support functions. The senior relationship managers, the ones with personally owned books, became harder to recruit than at any point in the past decade, precisely because they had more options and more leverage than they had ever had before.\n\nThat is the paradox that acquisition models consistently underestimate. The transaction creates dislocation. Dislocation creates optionality. Optionality belongs to the relationship manager. And the relationship manager, unlike the assets on the balance sheet, is free to leave.\n\n## The integration window\n\nThere is a period of approximately twelve to eighteen months after any significant private banking acquisition during which the acquired institution\'s relationship managers are structurally more recruitable than at any other point in their careers. The reasons are not complicated.\n\nIntegration creates uncertainty. Job titles change or disappear. Reporting lines are restructured. Product shelves are rationalised. Compliance frameworks are merged, and merging two institutions\' compliance architectures under heightened regulatory scrutiny is not a process that happens quietly or quickly.\n\nDuring this period, clients notice. Not because they receive a letter telling them their bank has been acquired, though they receive that letter too. They notice because the cadence of the relationship shifts. Because the banker they trusted is now dealing with internal processes that consume hours of the week that were previously spent on client contact. Because the brand on the letterhead is different, and the client does not yet know what that means for them.\n\nIntegration costs are consistently underestimated at the point of deal announcement.[3] The people, the technology, the compliance infrastructure, the legal work: these are not costs that can be absorbed without affecting the core activity of a private bank, which is managing relationships. Every hour spent on integration is an hour not spent on clients.\n\nCompetitors know this. The twelve-month window after a deal closes is the period during which approaches to the acquired institution\'s senior bankers are most likely to succeed. This is not a cynical observation. It is a structural feature of how talent markets respond to consolidation.\n\n## What the acquirer consistently gets wrong about retention\n\nThe retention problem in acquisition-driven private banking growth is not new. Every deal team knows, at the point of signing, that the relationship managers who come with the acquired institution are the single most important variable in whether the deal creates value or destroys it.\n\nAnd yet the industry continues to manage this risk primarily through retention packages: fixed-term financial incentives designed to keep relationship managers in place long enough for the integration to complete. The logic is that if you can hold the bankers for eighteen months, the clients will have transferred to the new platform\'s systems and developed enough familiarity with the new brand that the banker\'s departure becomes less disruptive.\n\nThis logic is partially correct and structurally incomplete. A retention package addresses the financial incentive to leave. It does not address the relationship manager\'s assessment of their long-term career at the combined institution. It does not address the quality of the product shelf, the culture of the acquiring institution, the compatibility of the compliance framework with how the banker has managed their book, or whether their clients will receive a better or worse service under the new structure.\n\nThose are the factors that determine whether the relationship manager stays beyond the retention period. A banker who stays through the retention window and then leaves in month twenty takes their book just as effectively as one who left in month six. The deal economics do not distinguish between these two outcomes at the point of announcement. The three-year post-acquisition review does.\n\nThe banks that retain talent most effectively after acquisitions are those that address the career question, not just the financial question.[4] They give relationship managers a genuine understanding of what the combined platform offers that the acquired institution could not. They identify early which bankers are critical to the book and engage them substantively, not just with a retention letter. And they accept that some attrition is inevitable, building their integration assumptions around realistic rather than optimistic portability rates.\n\n## The organic growth comparison\n\nConsider the institutions that grew AUM in 2025 primarily through organic means. EFG International\'s growth was approximately 11.8 percent, largely organic.[5] That number generates less coverage than a 20 percent headline driven by an acquisition. It does not produce the same announcements, the same commentary about scale and ambition.\n\nBut consider what 11.8 percent organic growth means for the stability of that institution\'s relationship manager base. No integration roadmap. No rebranding exercise. No rationalised product shelf. No merger of compliance frameworks. The bankers who generated that growth did so without the distraction that integration imposes, and the clients who drove those inflows did so because their relationships remained undisturbed.\n\nThe same pattern holds across the boutique end of the Swiss market. Institutions built on the partnership model have accumulated AUM through long-cycle relationship development rather than acquisition. The pace is slower. The headline numbers attract less attention. The retention of both clients and bankers is materially higher, and the organic growth rate in the years after a deal closes tells the real story of whether the acquisition created or destroyed value.\n\nThe private banking industry tends to celebrate the deal. Less attention is paid to what happens in the thirty-six months that follow. The bankers who left acquired institutions during 2024 and 2025 did not all take their clients with them. Some did. Most partially did. A banker who moves from an acquired institution to a competitor takes the relationships they personally cultivated. The institutionally embedded relationships tend to stay. The distinction between those two categories is one of the most important things a senior banker can understand about their own book before they decide whether or when to move.\n\n## What this means for relationship managers inside acquired platforms\n\nIf you are currently employed by an institution that has recently completed a significant acquisition, or that has itself been acquired, the period you are in now is likely the highest-leverage moment you will have in your career. Your optionality is at its peak. Competitors are watching. The question is not whether you are being approached. The question is whether the approaches you are receiving are from the right platforms for the right reasons, or whether they are opportunistic calls from banks whose interest in you is primarily about the short-term disruption of a competitor\'s integration.\n\nYour book is also not as portable as the headline AUM figure suggests, and not as trapped as the retention package implies. The truth sits between those two positions. A serious assessment of portability, meaning a genuine analysis of which relationships are personal and which are institutional, which clients would follow you and under what conditions, and what the legal constraints on your transition actually look like in practice, is worth more than any informal estimate you can form during a dinner conversation.\n\nAnd the window closes. Twelve to eighteen months after a deal, the dislocation resolves one way or another. Either the combined entity stabilises and the uncertainty that made you recruitable dissipates, or the integration fails to deliver and a different kind of disruption begins. Neither outcome is better if you have spent the window waiting passively rather than understanding your own position clearly.\n\n## The question every senior banker should be asking\n\nEvery senior relationship manager in private banking is, at any given moment, either inside an institution that has recently acquired or been acquired, or inside one that is about to be. The consolidation of the Swiss private banking sector has been documented extensively: the number of licensed banks in Switzerland has declined by more than a third over the past two decades, and that process has not stopped.\n\nThe KPMG and University of St. Gallen annual banking study has tracked this consistently.[6] Two viable models are emerging from it: large-scale integrated platforms and true specialist boutiques. Everything in the middle is under pressure, and the pressure expresses itself through exactly the kind of consolidation this article has been describing.\n\nThe question for a senior relationship manager is not whether consolidation will affect them. It is whether they understand their own position clearly enough to act on their own terms rather than react to someone else\'s integration timeline.\n\nThe acquisition trap is not the trap of working for an institution that grows through acquisition. It is the trap of being an asset on someone else\'s balance sheet without knowing it.\n\n---\n\n[1] Swiss private banking AUM rankings 2025. easyglobalbanking.com / finews.ch, various, 2026.\n[2] KPMG Switzerland, Clarity on Performance of Swiss Banks, 2024 edition; supported by KiTalent, Geneva Private Banking Talent Paradox, April 2026.\n[3] KPMG Switzerland, Clarity on Performance of Swiss Banks, 2024/2025 editions.\n[4] Based on Executive Partners placement experience across 200+ senior private banking transitions, 2018-2026.\n[5] EFG International AUM analysis, Top 10 Swiss Private Banks by AUM 2026. easyglobalbanking.com\n[6] KPMG / University of St. Gallen, Clarity on Performance of Swiss Banks, annual study.`,\n  },\n  {\n    slug: "the-sandbox-talent-map",\n    ogImage: "/og-articles/og-the-sandbox-talent-map.jpg",\n    title: "The Sandbox Talent Map",\n    seoTitle: "Private Banking in Saudi Arabia and Dubai 2026: The Sandbox Talent Map",\n    seoDescription: "Is the money leaving the Gulf? Wrong question. Inside the Saudization rules, the Dubai hiring bar, and the Swiss bank moves reshaping private banking careers in Saudi Arabia and Dubai in 2026.",\n    date: "2026-06-13",\n    engagementScore: 91,\n    summary: "Everyone is asking if the money is leaving the Gulf. The better question is which bankers are positioned to keep it, win it, or lose it. Inside the Saudization rules, the Dubai hiring bar, and what Swiss banks are doing on both sides of the border.",\n    linkedinUrl: "",\n    pillar: "P1",\n    subTheme: "Positioning",\n    markets: ["UAE", "MEA", "SA", "CH"],\n    keywords: ["private banking Saudi Arabia", "private banking Dubai 2026", "Saudization private banking", "UBP Dubai", "Gulf wealth management hiring", "DIFC private banking"],\n    body: `Everyone in private banking is asking the same question right now: is the money leaving the Gulf? Wrong question. The right one is: which bankers are actually positioned to keep it, win it, or lose it, depending on which side of this conversation they sit on.\n\nHere\'s the backdrop most of you already feel but haven\'t seen quantified. The US-Israel-Iran conflict and the disruption to the Strait of Hormuz triggered one of the most severe energy supply shocks in recent history. S&P Global has floated a scenario in which Gulf banks could face domestic deposit outflows of up to $307 billion, and a 50% rise in distressed loans across the region\'s 45 largest banks could wipe out more than half their annual net income. That is not background noise. That is the conversation happening in every risk committee from Riyadh to DIFC.\n\nAnd yet, in the same breath: net FDI inflows into Saudi Arabia rose 34.5% year on year in Q3 2025. The UAE absorbed the largest millionaire inflow in the world last year, just under 9,800 new arrivals, while Saudi Arabia ranked fifth globally with 2,400. Gulf sovereign wealth funds, sitting on more than $5 trillion combined, are not retreating, they are recalibrating, shifting from being the world\'s LP toward shoring up their own economies first. IMF projections from April still show positive growth for Saudi Arabia and the UAE this year.\n\nSo both things are true at once. Headline risk is real and immediate. Structural pull is real and durable. The bankers who win in this environment are the ones who can hold both truths in their head at the same time, and explain them calmly to a client who is reading the same headlines you are.\n\nSaudi Arabia: the gate is narrower, and it\'s mostly local\n\nIf you\'re building a career in Saudi private banking right now, understand the rules of the game first. Saudization is not a talking point, it is the operating system. Senior private banking roles, particularly anything titled Director or above, are increasingly reserved for Saudi nationals. International candidates without a Saudi passport are not competing on merit alone anymore, they are competing against a quota.\n\nThis is reshaping who gets hired and why. Saudi Awwal Bank\'s private banking division grew deposits 14% in the first nine months of last year, with almost 80% of clients investing through its in-house platform, evidence that local infrastructure and local relationship managers are now driving the growth, not expat hires parachuted in from London or Geneva.\n\nWhat does the local money actually want? Three things, consistently. First, Shariah-compliant structures are no longer a niche request, they are a baseline expectation for a large share of the client base. Second, succession and family business continuity dominate the conversation, this is a market where a huge share of HNW wealth sits inside operating family businesses, and the banker who can speak intelligently about governance, succession, and generational transfer earns trust faster than the one pitching structured notes. Third, alignment with Vision 2030 matters more than people in Geneva realize, clients want to know their banker understands where the Kingdom is going, not just where the oil price is today.\n\nThe banker who struggles here is the one who treats Saudi the way they\'d treat Geneva twenty years ago: relationship first, product second, compliance as an afterthought. That model is dead on arrival in a market where the regulator, the client, and the hiring quota are all watching the same thing, your nationality and your local credibility.\n\nDubai: still the open door, and still the booking center that matters\n\n[Dubai](/en/markets/dubai) remains a different animal entirely, and this is precisely why it continues to anchor UHNW and HNW coverage across the GCC, Levant, Africa, and India. It is the booking and advisory hub for MEA, full stop, and nothing about the current conflict has changed that geography.\n\nSwiss banks aren\'t pulling out, and that itself is a signal worth reading. Even as Iran\'s rhetoric escalated in March, UBS, Pictet, EFG, Lombard Odier, Julius Baer, and UBP all kept their regional operations running, the response was remote work precautions, not evacuations. UBP is a useful case study in how the two markets actually relate to each other. Its Dubai office has been the bank\'s MEA platform for over two decades, but the current growth push is freshly led, Arfat Qayyum, a former Credit Suisse Qatar CEO, took over as Senior Executive Officer in August 2025 and has since built out the team running more than 40 professionals managing over CHF15 billion in regional assets, including a February 2026 hire of Fahd Iqbal, UBS\'s former CIO Middle East, as head of investment services. In late 2025, UBP also opened a separate [Riyadh](/en/markets/riyadh) office, and tellingly, put a Saudi national, Mishal Alhawas, in as CEO and Head of Advising, explicitly framed around Vision 2030 alignment. Same bank, same MEA leadership, two different staffing logics. Dubai is where you build an international, multilingual team. Riyadh is where the person running the show needs to be Saudi. Lombard Odier has made a comparable bet from the Dubai side, securing a DIFC license and committing to double its UAE headcount within three years. For RMs reading the market, the message is consistent: Swiss private banks are not retreating mid-crisis, they\'re expanding, and they\'re doing so with very different hiring rules depending on which side of the Saudi-UAE border the office sits.\n\nWhat has changed is the bar. Mandates we\'re seeing prioritize relationship managers and team heads who bring portable books with proven revenue and a genuinely strong compliance culture, not just a Rolodex. Banks and EAMs are calibrating hard on booking options, credit appetite, and product shelf, particularly Lombard lending, private markets, and real estate financing, because business plans built on optimism rather than realistic wallet share don\'t survive a market where deposit stability is suddenly a board-level topic.\n\nLanguage remains the differentiator that nobody outside the region fully appreciates. Arabic and English are table stakes. French, Hindi, and Urdu, depending on the desk, are what separate a banker who can cover the GCC, Levant, Africa, and India corridor from one who can only cover the easy half of it. If you\'re a senior RM with a portable book and you speak three of those languages, you are, right now, one of the more sought-after profiles in the market, conflict or no conflict.\n\nThe profile that wins, and the one that doesn\'t\n\nPut the two markets side by side and a pattern emerges. The banker who thrives in 2026 is credible under pressure, can sit across from a client who just read about $307 billion in potential deposit outflows and explain, calmly and accurately, why their bank and their structure are sound. They have local language, local relationships, and in Saudi\'s case increasingly local nationality. They understand that compliance is not friction, it is the product, especially when capital is moving and everyone is asking harder questions about where it\'s going and why.\n\nThe banker who struggles is the pure product pusher, the one whose pitch was built for a calmer market and hasn\'t been updated. No Arabic, no Hindi, no Urdu, no real GCC network beyond a handful of expat contacts. No fluency in Shariah-compliant structures or succession planning. And critically, no answer ready for the client who asks, directly, "is my money safe here right now." If your business plan doesn\'t address that question, it isn\'t a business plan anymore, it\'s a wish list.\n\nThe longer game\n\nHere\'s the uncomfortable truth for anyone hiring or being hired into the region right now. This conflict will pass, conflicts in this region always do, but the banks, the regulators, and the clients who lived through it will remember who showed up with answers and who showed up with a pitch deck from 2023. Saudi Arabia is going to keep localizing senior roles. Dubai is going to keep rewarding portability and language depth. Both trends were true before the war, and both are now accelerating because of it.\n\nIf you\'re a senior RM sitting on a portable book with the right language mix, the right compliance instincts, and the patience to navigate a market that is more selective than it was eighteen months ago, this is, counterintuitively, one of the better moments to be having that conversation. The gate is narrower. The people who get through it matter more. We are currently running a confidential mandate for a [Senior Relationship Manager covering Saudi/GCC clients](/en/jobs/rm-saudi-riyadh-geneva), based in Riyadh or Geneva. If that describes your situation, you can [share your profile confidentially](/en/candidates) for this or other upcoming Gulf-linked mandates.`,\n  },\n\n  {\n    slug: "the-platform-illusion",\n    ogImage: "/og-articles/og-the-platform-illusion.jpg",\n    title: "The Platform Illusion",\n    seoTitle: "The Platform Illusion: Why the Pitch That Wins Mandates Never Transfers AUM",\n    seoDescription: "Banks sell platform quality. Clients follow the banker. The most common and most costly mistake senior private bankers make when building their case for a move.",\n    date: "2026-06-10",\n    engagementScore: 88,\n    summary: "Banks sell platform quality. Clients follow the banker. The most common and costly mistake senior private bankers make when building their case for a move.",\n    linkedinUrl: "https://www.linkedin.com/pulse/platform-illusion-gil-m-chalem--xq5ge/",\n    pillar: "P1",\n    subTheme: "Positioning",\n    markets: ["CH", "UK", "US", "ASIA"],\n    keywords: ["AUM portability", "private banking platform", "senior RM move", "AUM transfer rate", "private banking recruitment"],\n    body: `There is a conversation that happens in almost every senior private banking recruitment process. The hiring institution, somewhere between the second meeting and the offer discussion, makes a version of the same argument: our platform is superior. Better research. Stronger credit capabilities. More sophisticated structured products. Broader custody infrastructure. The implicit promise is that the platform will do part of the work, that clients who are indifferent between institutions will be nudged toward the move by the quality of what is on offer at the new house.\n\nThis argument is almost always wrong. Not because the platform claims are false, but because they are irrelevant to the decision that actually matters.\n\nThe Capgemini World Wealth Report 2025, which surveyed 6,472 high-net-worth investors, identifies loyalty to the relationship manager as one of the six defining characteristics of next-generation HNWI behaviour. Not loyalty to the institution. Not preference for a specific custody platform. Loyalty to the person.\n\nThis is not a new finding. It is a structural feature of private banking that has been documented consistently for two decades and has, if anything, hardened since the 2008 financial crisis. The relationship is the product. The platform is infrastructure.\n\nWhat this means in practice: when a client decides whether to follow their banker to a new institution, they are not evaluating the research portal or the structured product shelf. They are asking one question: do I trust this person enough to go through the disruption of moving my assets?\n\nThe platform enters the conversation only after that question is already answered, and usually only as a reassurance mechanism, not a decision driver.\n\nThe platform illusion is not random. It is actively reinforced by the institutions doing the hiring. Hiring managers need to believe that their platform provides competitive advantage, because if it does not, the rationale for paying a guaranteed package collapses. If a CHF 300M book transfers at the same rate regardless of where it lands, then the platform premium disappears, and the conversation becomes purely about the banker and their relationships.\n\nBanks also have a structural interest in promoting platform quality during the recruitment process because it shifts the implicit risk of a low-transfer outcome back onto the platform narrative. If the client did not follow, it was because the offering was not compelling enough, not because the relationship was shallower than the banker claimed.\n\nBankers, for their part, are susceptible to this argument because it is flattering. A superior platform implies that their clients will make a rational, informed decision to move, which is a more comfortable story than acknowledging that the transfer rate depends almost entirely on relationship depth and client inertia.\n\nIn our placement experience, the variables that consistently predict high transfer rates have nothing to do with platform quality. They are:\n\nRelationship tenure. Clients who have worked with the same banker for more than ten years and who have been through at least one significant market event together transfer at substantially higher rates than newer relationships. The 2008 crisis, 2020, and the 2022 rate shock are all useful calibration points. If a client stayed through one of those events, they are staying because of the banker, not the institution.\n\nWallet concentration. A client whose primary banking relationship is with the departing banker, meaning 40% or more of liquid assets, has a much stronger incentive to follow than a client who is one of four banking relationships. PwC\'s Private Banking Market Update 2025, covering 74 Swiss and Liechtenstein private banks, attributes the outperformance of certain institutions specifically to successful lift-outs of clients from major banks and effective client engagement, not platform differentiation.\n\nDirect advisory dependency. Clients who invest based on the banker\'s specific recommendations, not on institutional research or standardised mandates, transfer well. Clients in standardised discretionary mandates transfer poorly, because the product they are buying is institutional, not personal.\n\nCompliance readiness. This is the variable that has changed most significantly in the last three years. A client relationship that cannot be onboarded cleanly at the new institution is not portable regardless of how strong the personal connection is. KYC and AML standards at hiring institutions have hardened materially since 2023, and cross-border relationships with incomplete documentation do not transfer regardless of banker loyalty.\n\nThere is a specific scenario where the platform illusion causes active damage to a placement process, and we observe it regularly. A banker who has internalised the platform pitch often uses it with clients during the transition conversation. They describe the new institution\'s capabilities in terms of research quality, product access, and technology. Some clients find this reassuring. But sophisticated HNW clients, particularly UHNW clients managing complex multi-jurisdictional wealth, tend to hear something different. They hear that they are being asked to accept disruption, change their banking relationship, go through full KYC again, and potentially restructure their custody arrangements, in exchange for access to a slightly different product shelf.\n\nThat is not a compelling proposition. The client already has product access through their existing relationships. What they are evaluating is whether the disruption is worth the relationship continuity. The platform pitch does not answer that question. It avoids it.\n\nThe bankers who transfer the highest proportion of their book in the shortest time are the ones who lead with the relationship, not the platform. The conversation with the client is direct: I am moving because this institution is a better fit for how I want to serve you. I am asking you to make this transition with me because our relationship is the constant, not the infrastructure around it.\n\nFor bankers preparing for a move, the platform illusion creates a specific trap. If the hiring institution\'s pitch is heavily weighted toward platform superiority, and the banker absorbs that pitch without questioning it, they will build a business plan that overestimates the pull factor of the new platform on their existing clients.\n\nThe business plan that a hiring committee actually believes is not the one that describes platform advantages. It is the one that describes the relationship architecture of the book: the tenure, the wallet concentration, the advisory dependency, and the compliance status of each significant relationship. Those are the variables a committee can evaluate. Platform quality is not.\n\nThe platform matters at the margin, for undecided clients, for specific product requirements, and for the operational experience once assets have transferred. It does not drive the transfer decision. Confusing the two is the most common and most costly mistake senior bankers make when building their case for a move.`,\n  },\n  {\n    slug: "zurich-private-banking-market-2026",\n    ogImage: "/og-articles/og-zurich-talent-paradox.jpg",\n    title: "The Zurich Talent Paradox: Why the Biggest Market Is the Hardest Move",\n    seoTitle: "Zurich Private Banking Recruiter 2026 | Talent Paradox & Hiring Trends",\n    seoDescription: "Zurich manages CHF 3.2 trillion in private banking assets but is quietly running out of the senior talent that runs it. What senior RMs need to know before making a move in 2026.",\n    date: "2026-06-09",\n    engagementScore: 86,\n    summary: "Zurich manages more private banking assets than any other city in Europe. It is also the hardest market to move in. Three structural forces explain why, and what senior bankers need to do differently.",\n    pillar: "P1",\n    subTheme: "Positioning",\n    markets: ["CH", "UK", "UAE"],\n    keywords: ["Zurich private banking 2026", "private banking recruiter Zurich", "Zurich wealth management hiring", "senior RM Zurich", "UBS talent market"],\n    linkedinUrl: "",\n    body: `Zurich\'s wealth management sector entered 2026 managing CHF 3.2 trillion in assets from a single canton, representing 41% of all Swiss banking assets under management. It places Zurich ahead of Geneva in institutional density, ahead of Singapore in absolute AUM concentration, and ahead of every other European financial centre in private banking employment. The city is not merely a participant in global wealth management. It is the gravitational centre.\n\nAnd yet the market that should be attracting senior talent at scale is instead losing a quiet, persistent war for the people who run it.\n\nSenior relationship manager searches that closed in four months before the pandemic now take eight to eleven months in Zurich. Time-to-fill for executive roles has stretched from 68 days to 94 days in a single year.\n\nThis is not a demand problem. Hiring intent across Zurich\'s private banking platforms is strong. Swiss private banks saw solid double-digit AUM growth in 2024, boosted by rising global equity markets and positive net new money flows. Banks are growing. They need people. The problem is supply.\n\nThree structural forces are compressing the available talent pool simultaneously.\n\nThe UBS-Credit Suisse integration, completed in 2023, entered what UBS itself described as a talent retention phase through 2024 and into 2025. UBS reported 1,800 net new hires in wealth management globally during 2024, primarily to backfill departures created by the integration itself. In Zurich, UBS maintained approximately 12,000 headquarters staff while consolidating former Credit Suisse private banking operations. The merger did not release talent into the market. It consumed talent to stabilise.\n\nThe conventional assumption was that the acquisition would flood the Zurich market with displaced senior bankers. The opposite happened. UBS retained the revenue generators it needed and managed the rest through long notice periods and structured exits that kept the best profiles off the market for 12 to 18 months longer than expected.\n\nPwC anticipates a gradual decline in the count of Swiss private banking institutions to fewer than 60 in the coming years. KPMG Switzerland projects that 15 to 20% of Swiss private banks, primarily boutiques managing less than CHF 5 billion, will seek merger partners or exit strategies by the end of 2026, with Zurich alone expected to see three to five acquisition transactions involving local boutiques.\n\nEach of those transactions displaces some staff. But it rarely displaces the senior relationship managers the market actually wants. Acquirers absorb the book and integrate the client relationships. The RM either follows the book under new ownership or enters a garden leave period that again removes them from the available market for months.\n\nEFG International, whose growth model deliberately recruits senior bankers from larger institutions going through restructuring, reported a record CHF 185 billion in AUM and CHF 11.3 billion in net new assets in 2025. The banks that understand the consolidation dynamic are using it aggressively. The ones that wait for talent to become freely available are consistently too late.\n\nThe adoption of EU Sustainable Finance Disclosure Regulation equivalence standards created new compliance obligations through 2025 and into 2026. Combined with the tightening of FINMA KYC and AML expectations following a series of enforcement actions that resulted in fines exceeding CHF 100 million imposed on Swiss financial institutions in 2025 alone, the practical effect is that senior RMs with complex cross-border books require significantly more documentation discipline than five years ago.\n\nThe specific failure mode we observe in Zurich processes is this: a banker with a CHF 400 million cross-border book presents to a hiring committee. The committee is interested. Internal compliance runs a pre-approval review on the top twenty relationships. Six come back with open documentation questions, incomplete source of wealth files, or unresolved CRS exposure. The effective portable book drops to CHF 280 million. The offer terms reflect that number, not the CHF 400 million the banker entered the process with.\n\nThis is not a theoretical risk. It is the most common reason Zurich processes stall or reprice in 2026. The bankers who avoid it are not the ones with cleaner books. They are the ones who audited their own files before the first recruiter call, identified the documentation gaps, and either resolved them or built a realistic transfer timeline around them. That preparation takes three to four weeks. Most bankers do not do it. That is the compliance advantage in the current Zurich market.\n\nThe profile that moves efficiently through a Zurich process in 2026 combines four characteristics. Swiss onshore relevance: a book that is either primarily Swiss-domiciled or clearly bookable in Switzerland under a clean cross-border framework. Balance sheet utilisation: Lombard lending, mortgage exposure on Swiss property, and credit facility usage are now core to the Zurich value proposition. German-language client coverage: the DACH market remains the primary organic growth engine for Zurich platforms. Documented compliance history: the ability to produce organised, current client documentation at short notice is now a competitive differentiator, because it compresses the bank\'s internal approval timeline.\n\nThe window for a structured Zurich move in 2026 is narrower than it looks. The compression of available candidates and the lengthening of search timelines means that bankers who approach the market reactively are consistently outpositioned by those who have done the preparation in advance.\n\nThe preparation takes three to four weeks to do properly: the portability picture, the compliance review, the contractual position, and the business plan framework. Bankers who have completed it before the first recruiter call are in a structurally better negotiating position than bankers who are building it in real time during the process.\n\nIf you are a senior RM based in Zurich and considering whether 2026 is the right moment, the honest answer is: the market is active, the demand is real, and the window is open. But it closes faster than the headline AUM numbers suggest.`,\n  },\n  {\n    slug: "private-banking-business-plan-switzerland",\n    ogImage: "/og-articles/og-private-banking-business-plan.jpg",\n    title: "The Private Banking Business Plan: What a Hiring Committee Actually Looks For",\n    seoTitle: "Private Banking Business Plan Switzerland | What Banks Evaluate",\n    seoDescription: "A private banking business plan in Switzerland is not a revenue projection. It is a stress test. Here is exactly what hiring committees evaluate, built on 200+ EP placements.",\n    date: "2026-06-06",\n    engagementScore: 89,\n    markets: ["CH"] as const,\n    featured: true,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: ["private banking business plan", "private banker business plan Switzerland", "relationship manager break-even timeline", "AUM portability business case", "private banking business plan template"],\n    summary: "A private banking business plan in Switzerland is not a revenue projection. It is a stress test. Here is exactly what hiring committees evaluate before they make an offer.",\n    linkedinUrl: "https://www.linkedin.com/in/gilchalem/",\n    body: `The business plan does not get you the job. It gets you past the committee member who has already decided to say no.\n\nEvery hiring committee in Swiss private banking contains at least one person whose role, consciously or not, is to find the number that does not hold up. The ROA assumption that is too optimistic. The portability percentage that assumes clients will follow without friction. The break-even timeline that only works if year one goes perfectly. Their job is to protect the institution from an expensive mistake. Your business plan\'s job is to give them nothing to find.\n\nThat is a different document from the one most bankers write. Most bankers write a revenue projection dressed up as a strategic argument. They lead with total AUM, state a portability assumption without justifying it, model three years of growth on a straight line, and close with a paragraph about why the new platform is the right fit for their clients. Hiring committees have read that document four hundred times. It does not move them.\n\nWhat moves them is a document that has already stress-tested itself.\n\nWhat the document is actually evaluating\n\nThe hiring committee is not reading your business plan to understand your ambitions. They are reading it to stress-test four specific variables.\n\nThe first is portable AUM. Not total AUM. Not AUM under management. Portable AUM: the fraction of your book that is personal to you rather than institutional, that sits in accounts where you have direct client relationships, and where no non-solicit clause, KYC transfer barrier or booking centre constraint prevents a move. Swiss private banks have become expert at identifying inflated portability claims. A CHF 400 million book that is 60% institutional mandates, 20% family relationships managed by a colleague, and 20% clients who have never responded to a personal call is a CHF 80 million book in practice.\n\nThe second is revenue quality. A book generating 45 basis points of average ROA across discretionary and advisory mandates is worth more to a hiring committee than a book generating 18 basis points across execution-only accounts, even if the second book is three times larger in AUM. Banks model revenue, not assets. The business plan must speak in revenue terms, not AUM terms, to be taken seriously.\n\nThe third is the break-even timeline. Every hire carries a cost: the recruitment fee, the sign-on, the transition period during which the banker is present but not yet revenue-generating, and the compliance overhead of onboarding a new book. A hiring bank in Geneva or Zurich typically models a 14 to 22 month break-even on a senior RM hire. Your business plan must demonstrate, with credible assumptions, that the revenue ramp reaches that break-even within that window. Plans that show hockey-stick growth in year three without explaining year one are rejected.\n\nThe fourth variable is compliance risk, and it has become the most underestimated factor in Swiss private banking hiring since 2023.\n\nThe forced integration of Credit Suisse into UBS produced something that did not make the front pages: a forensic re-examination of how both institutions had managed client onboarding over the previous decade. What that examination surfaced was significant. Accounts with incomplete KYC documentation. Relationships with PEPs or PEP-adjacent family members that had been grandfathered rather than reviewed. Booking centre structures that had been designed around tax efficiency rather than substance. The remediation cost ran into the hundreds of millions across the combined entity.\n\nEvery private bank in Geneva and Zurich watched that process. The response has been a quiet but systematic tightening of onboarding standards for incoming bankers and their books. A candidate who brings CHF 200 million in portable AUM but whose top ten clients include three accounts with elevated jurisdiction risk, two PEP relationships, and one account with a dormant beneficial ownership structure will face a compliance pre-screening that can take six to ten weeks and may result in a conditional offer: we will hire you, but we will not onboard those five accounts.\n\nThat conditional offer changes the economics of your business plan entirely. If 30% of your portable AUM is subject to enhanced due diligence that may result in rejection, your year-one revenue assumption needs to reflect that. Most business plans do not. They present the gross portable number and leave the compliance haircut for the onboarding team to discover after the offer is signed. Hiring committees who have been through this once do not make that mistake twice. They screen for it in the document.\n\nThe business plan should address compliance proactively. Identify the accounts in your portable book that will require enhanced due diligence. State the jurisdiction, the relationship type, and why you believe the account is onboardable at the new institution. This transparency is not a weakness. It is the signal that you have done the work and that the number you are presenting is real.\n\nThe structure that works\n\nAfter reviewing and producing business plans across 200 placements in Geneva and Zurich, the structure that consistently advances candidates to the final stage follows this sequence.\n\nOpen with a one-page executive summary that states portable AUM, expected year-one revenue, projected break-even month, and the three or four client segments that constitute your core franchise. This page is what gets read before the committee decides whether to read the rest.\n\nThe second section covers client segmentation. Break your portable book into tranches by AUM size, relationship type, booking centre, and revenue profile. Do not present a single aggregate number. Show the committee how your book is composed, which clients you have spoken to informally about a potential move, and which segments have the highest and lowest portability risk.\n\nThe third section is the revenue model. Build a three-year P&L that shows AUM ramp assumptions by year, ROA assumptions by mandate type, gross revenue, and estimated cost-to-serve. Use conservative assumptions and state them explicitly. A plan that assumes 80% portability in year one will be challenged. A plan that assumes 55% portability in year one and explains why will be respected.\n\nThe fourth section addresses transition risk. Which clients present onboarding complexity? What is the estimated timeline from hire to first client transfer? Are there non-solicit or non-compete obligations that affect timing? Banks want to see that you have thought through the obstacles, not that you have ignored them.\n\nThe fifth section closes with platform rationale. Why this institution specifically? What does the platform offer your clients that your current employer does not? This section is often written as generic flattery. Write it as a specific argument: your UHNW French entrepreneur clients need a platform with a Luxembourg booking centre and a strong credit offering, and this institution provides both. Specificity signals that you have done real analysis, not that you have sent the same plan to five banks simultaneously.\n\nThe numbers that matter in 2025 and 2026\n\nSwiss private banks are currently hiring selectively. The post-UBS-Credit Suisse consolidation has reduced the number of active platforms, which means fewer open mandates but higher quality requirements for those that exist.\n\nThe minimum threshold for a serious conversation at most Geneva and Zurich private banks is CHF 75 million in genuinely portable AUM. The typical mid-tier hire brings CHF 150 to 300 million. Senior hires with UHNW franchises of CHF 500 million or more trigger retention packages and counteroffers at the current employer before the move is concluded.\n\nROA benchmarks vary by segment. Execution-only books average 12 to 18 basis points. Advisory books average 35 to 55 basis points. Discretionary books with structured product penetration can reach 70 to 90 basis points on the right platform. A business plan that does not state the current ROA profile of the portable book is leaving the most important number out of the document.\n\nBreak-even modelling for a CHF 200 million portable book at 45 basis points ROA produces approximately CHF 900,000 in gross revenue in year one, assuming 70% portability in the first twelve months. Against a total hire cost of CHF 600,000 to CHF 800,000, that produces a break-even in months 10 to 11. That is a fundable hire. A book generating 18 basis points at the same AUM level produces CHF 360,000 in year-one revenue against the same cost base. That hire does not break even until year two or later, and will face significant scrutiny.\n\nBefore you write the plan\n\nThe business plan should not be the first time you assess your own portability. It should be the document that captures an assessment you have already done.\n\nThe questions to answer before writing are the same questions the hiring committee will ask. How many of your clients know you personally rather than knowing the institution? How many have you spoken to outside of the bank context in the last twelve months? What is your non-solicit obligation and how long does it run? What fraction of your AUM is in accounts where you are the sole relationship contact? What is the booking centre of your top twenty clients and does that booking centre follow you to the new platform?\n\nThe Executive Partners Portability Score runs through these questions with a structured 30-point framework before any introduction to a client institution is made. That assessment is available anonymously. What comes out of it is a realistic picture of the portable fraction, which is the only number that matters when a hiring committee opens your business plan.`,\n  },\n  {\n    slug: "is-your-aum-portable",\n    ogImage: "/og-articles/og-is-your-aum-portable.jpg",\n    title: "Is Your AUM Actually Portable? The Six Questions Every Private Banker Gets Wrong",\n    seoTitle: "Is Your AUM Portable? The Six Questions Every Private Banker Gets Wrong",\n    seoDescription: "Most private bankers overestimate how much of their book will follow them. Here is the honest framework for testing AUM portability before you move, used by Executive Partners across 200+ placements in Geneva and Zurich.",\n    date: "2026-06-09",\n    summary: "Most private bankers overestimate how much of their book will follow them. Here is the honest framework for testing portability before you move.",\n    linkedinUrl: "",\n    pillar: "P2",\n    subTheme: "Positioning",\n    featured: true,\n    engagementScore: 95,\n    markets: ["CH"],\n    keywords: ["AUM portability private banking", "portable book Geneva", "private banker move Switzerland", "wallet share private banking", "non-solicit clause Switzerland", "NFCI margin private banking"],\n    body: `Banks already know how much of your book will transfer. Most bankers do not.\n\nEvery private banker who has ever considered a move has done the same mental calculation. They look at their book, add up the AUM, multiply by a transfer assumption, and arrive at a number that feels comfortable. Comfortable enough to have a conversation. Comfortable enough to accept a meeting.\n\nThat number is almost always wrong. Not slightly wrong, materially wrong. Across 200+ placements in Geneva and Zurich, the gap between what a banker believes is portable and what actually transfers is the single most consistent source of friction in a placement process. It delays offers, collapses business cases, and occasionally ends careers.\n\nThis article is not about discouraging moves. The Geneva and Zurich markets are active, and the right banker on the right mandate will transfer more than they expect, because the platform does most of the work. It is about the six questions that separate bankers who understand their portability from bankers who are guessing.\n\n## 1. Are your clients loyal to you, or loyal to your institution?\n\nThis sounds obvious. Every banker says their clients are loyal to them personally. The question is how you test it, not how you feel about it.\n\nThe honest test: have you ever changed institutions before? If yes, what transferred? If a banker moved from Credit Suisse to Julius Baer five years ago and brought CHF 180M of a CHF 280M book, they have a real data point. They know which clients followed and, more importantly, why some did not.\n\nIf this is the first potential move, the test is different. Ask yourself which of your clients would give you a new banking mandate today, right now, without a move, if you called and proposed it. Not clients who would take the call warmly. Clients who would actually move assets on the basis of that call. That is the population that transfers. The rest is institutional AUM dressed in relationship clothing.\n\nBanks understand this distinction better than bankers do. The first question any serious hiring institution will ask, not in the formal process but in the actual calibration conversation, is not what is your AUM. It is: tell me about the five clients at the top of your book. Walk me through the relationship. How long have you known them? Have they ever invested their own money based on your advice specifically? Would they bank you personally if you were independent?\n\n## 2. What is your wallet share, and do you know the real number?\n\nWallet share is the proportion of a client\'s total investable wealth that sits with you. A CHF 50M relationship where the client has CHF 400M in total, spread across four institutions, is not a CHF 50M portable relationship. It is, at best, a CHF 30M opportunity, and realistically less once the friction of a move disrupts the convenience logic that kept them at your platform.\n\nThe portability assumption most bankers apply is too generous because they know their own AUM but rarely know the client\'s total picture. Swiss private banking culture makes this harder, clients do not advertise their other banking relationships, and a relationship manager who asks directly can be perceived as intrusive.\n\nThe practical approach: for your top twenty clients, estimate total wealth based on everything you know, property, businesses, lifestyle signals, other platform references, family context. Then apply your AUM as a fraction. In our experience at EP, bankers whose top clients are concentrated above 40% of total estimated wealth in their book tend to transfer well. Bankers where the fraction is below 20% across most of their top clients should plan on a slower, lower transfer curve, not because their relationships are weak, but because a meaningful portion of that AUM is sticky to the institution.\n\nThis is EP\'s framework built from placement experience, not an industry standard. Every book is different. But the exercise forces an honest conversation with yourself before you have it with a bank.\n\n## 3. Do you have a non-solicit clause, and have you read it recently?\n\nThis question has a comfortable answer and a correct answer. The comfortable answer is that non-solicit clauses are common, banks enforce them selectively, and everyone moves anyway. The correct answer is more nuanced.\n\nNon-solicit clauses in Swiss employment contracts are governed by the Swiss Code of Obligations (OR). Whether they are enforceable in practice depends significantly on how they are drafted, what they define as solicitation, and how Swiss courts interpret the specific clause. Swiss courts have been inconsistent on this. A broadly worded clause is harder to enforce than a precisely drafted one, but the uncertainty itself creates risk.\n\nThe practical advice: read the clause yourself, not via a colleague\'s interpretation. If there is ambiguity about what constitutes solicitation, and there usually is, get a thirty-minute opinion from a Swiss employment lawyer before any conversation with a recruiter or a bank. This is not paranoia. It is due diligence. A CHF 300M book is worth more than a half-hour of legal advice.\n\nThe banks you are considering know this too. Any institution making a serious offer will price the non-solicit into the transition package, either through garden leave coverage, NPC buyout, or a structured ramp assumption that does not require year-one transfer of your full book. The existence of a non-solicit is not a blocker. Not understanding its precise terms is.\n\n## 4. How much of your book is cross-border, and what is the compliance status of those relationships?\n\nThis is the question that has caused more friction in placement processes over the last three years than any other. Cross-border private banking relationships, clients domiciled outside Switzerland banking in Geneva or Zurich, are only transferable if they are currently, documentably compliant. Not historically compliant. Ready to be onboarded at a new bank today.\n\nThe KYC and AML standards that a hiring institution will apply to incoming clients have hardened substantially. FINMA enforcement actions resulted in fines totalling more than CHF 100 million imposed on Swiss financial institutions in 2025 alone. The new UBO register introduced via the revised Code of Obligations and AMLA covers more than 600,000 legal entities. Any bank taking on a senior RM with a cross-border book will conduct a pre-approval review of proposed client relationships. That review flags undocumented source of wealth, incomplete beneficial ownership structures, and any CRS or FATCA exposure that has not been properly declared.\n\nThe practical consequence: a CHF 400M cross-border book where 30% of clients have open documentation questions is not a CHF 400M book for portability purposes. It is a CHF 280M book with a compliance tail that will complicate the approval process and potentially the offer terms.\n\nBankers who have proactively managed their client files, who can say with confidence that every relationship in their book is clean, documented, and onboardable, have a real advantage in the current market. This is not a compliance observation. It is a portability observation.\n\n## 5. What is your real revenue margin, and how does it compare to market benchmarks?\n\nThe metric that matters here is net fee and commission income (NFCI) as a proportion of AUM, what hiring institutions use to calculate payback period and three-year P&L contribution. According to PwC\'s Private Banking Market Update 2025, which covers 74 Swiss and Liechtenstein private banks, NFCI margins have remained broadly stable at 58 to 65 basis points across large banks and 58 to 64 basis points for smaller institutions, despite significant pressure from declining interest income.\n\nTotal operating income is higher, 65 bps for large banks, up to 96 to 122 bps for smaller ones, but that figure includes interest income which has been contracting sharply since SNB rates began declining in March 2024 and is not a reliable benchmark for assessing a portable book.\n\nWhat this means practically: a banker presenting a book generating 45 to 50 bps in fee and commission income will face questions, not because the book is weak, but because the hiring bank\'s internal model will show a longer payback period. A CHF 500M book at 50 bps is still CHF 2.5M in annual NFCI, which justifies a strong offer at most platforms. But walking into that conversation without knowing your own number, or with a number that does not match the bank\'s calculation, costs credibility at a moment when credibility matters most.\n\nThe more important point: if your revenue mix is heavily weighted toward discretionary mandates grandfathered at old fee structures, or toward Lombard lending that suppresses advisory revenue, you may be generating solid total income but a weak NFCI margin. Banks model NFCI, not total income.\n\n## 6. What is your actual timeline, and are you in control of it?\n\nMost moves take longer than the banker expects and shorter than the institution would prefer. The realistic timeline from first conversation to day one at a new platform in Geneva is four to seven months for a senior RM mandate: six to eight weeks of process, one to three months of notice or garden leave, and four to eight weeks of onboarding and client notification logistics.\n\nThe question is whether the banker is driving that timeline or reacting to it. Bankers who approach the market with a vague sense that they might move within the next year are often slower to act when the right opportunity appears, and faster to accept suboptimal terms when the timeline accelerates for personal or institutional reasons outside their control.\n\nThe control variable is preparation. Knowing your portability picture, having your client documentation in order, understanding your contractual position, and having a clear view of which platforms are genuinely strategic for your book, this preparation takes two to four weeks to do properly. Bankers who have done it before the first recruiter call are in a structurally better negotiating position than bankers who are discovering their own situation in real time during the process.\n\n## What this means in practice\n\nThe purpose of this framework is not to discourage moves. The Geneva and Zurich markets are more active than the macro commentary suggests. PwC\'s 2025 data confirms that competition for talent is intensifying, personnel costs reached record levels across all bank clusters in 2024, and hiring of relationship managers continued to accelerate. Banks are paying well for bankers who arrive with clarity about their book, their compliance status, their constraints, and their timeline.\n\nThe bankers who get the best outcomes are not necessarily the ones with the largest books. They are the ones who understand their own situation better than the bank does. That advantage is built before the first call, not during it.\n\nIf you want to work through this framework in the context of your own book, the [EP Portability Score tool](/en/portability) runs the calculation in under ten minutes. Or speak with us directly, confidential, no obligation, and no CV required at this stage.`,\n  },\n\n  {\n    slug: "the-geneva-paradox",\n    ogImage: "/og-articles/og-the-geneva-paradox.jpg",\n    title: "The Geneva Paradox",\n    seoTitle: "The Geneva Paradox: Why Geneva\'s Best Bankers Are the Most Frustrated",\n    seoDescription: "Geneva has more private banking talent per square kilometre than any city in the world, and some of the most frustrated senior bankers. The AUM is there. What is missing is the conversation.",\n    linkedinUrl: "",\n    date: "2026-06-11",\n    engagementScore: 87,\n    summary: "Geneva has the talent, the AUM and the infrastructure. What it lacks is the conversation senior RMs actually need, and banks keep substituting compliance reviews for it.",\n    pillar: "P1",\n    subTheme: "Positioning",\n    markets: ["CH"],\n    keywords: ["Geneva private banking talent", "private banking retention Switzerland", "senior RM career conversation", "AUM portability Geneva", "compliance review private banking"],\n    body: `Geneva has more private banking talent per square kilometre than any city in the world. It also has some of the most frustrated senior bankers in the world. Sit down with enough relationship managers across the lake\'s institutions and a pattern emerges that has nothing to do with compensation, bonus pools, or the usual grievances. It has to do with a conversation that almost never happens.\n\nThe AUM is there. The clients are there. The infrastructure, the booking centres, the compliance frameworks, the Lombard lending desks, all of it is there. What is missing is the conversation where a senior RM sits across from someone, whether a manager, an HR partner, or a board member, who actually understands their book, their market, and what they are worth.\n\nMost of them have never had that conversation. What they have had instead are compliance reviews dressed up as career discussions.\n\nWalk into almost any annual review at a Geneva private bank and the structure is recognisable. There is a KYC refresh embedded somewhere in the conversation, even if nobody calls it that. There is a discussion of targets, usually framed around net new money and revenue, with little acknowledgment of how that revenue was actually generated or what it would take to defend it. There is a compliance attestation, sometimes literal, sometimes implicit in the tone, reminding the RM that their book belongs to the institution and that any deviation from policy carries consequences.\n\nWhat there rarely is, is a conversation about the RM as a professional with a portable set of relationships, a market position, and options. Banks have become very good at managing risk and very bad at managing people, and in private banking these are not separable functions, because the asset walking out the door every evening is the relationship itself.\n\nThis is not a new observation. What is less discussed is why the substitution happens, and why it is getting worse rather than better.\n\nThree forces are converging. The first is regulatory. Since the post-2008 wave of cross-border enforcement actions, and accelerating through FATCA, AEOI, and the various national tax amnesty programmes, banks in Geneva and Zurich have built enormous compliance infrastructures. Every client relationship now carries documentation requirements that did not exist fifteen years ago. The annual review cycle has absorbed much of this, because it is the one moment in the year when a manager and an RM are guaranteed to sit down together. The agenda fills with regulatory checkboxes because that is what the institution can measure and defend.\n\nThe second is managerial. Team heads and market heads at most Geneva institutions are themselves senior bankers who were promoted into management without much preparation for it. They are good at client relationships and often uncomfortable having direct conversations about career trajectory, compensation expectations, or the uncomfortable truth that a given RM\'s book may be more portable than the bank would like to admit. It is far easier to default to the templated review, tick the boxes, and move on.\n\nThe third is structural. HR functions in private banking have become risk functions almost as much as people functions. Performance conversations are increasingly documented with an eye toward potential disputes, departures, or litigation, rather than toward genuinely developing the person sitting across the table. The paper trail matters more than the conversation.\n\nNone of this is malicious. It is the rational output of an institutional environment optimised for defensibility. But the effect on the RM is corrosive.\n\nWhen a senior banker with twenty years of relationships and several hundred million in AUM walks out of a review that consisted mainly of compliance attestations and target setting, what they hear is not that they are valued. What they hear is that they are managed.\n\nThis matters because senior RMs in Geneva are, almost without exception, aware of their market value. They know roughly what their book would be worth to an EAM, to a competing institution, or as the seed of an independent practice. They do not need a headhunter to tell them this, although headhunters certainly do. What they often lack is a structured, honest assessment of what would actually transfer, what would not, and what the realistic economics of a move would look like once legal constraints, client consent requirements, and transition costs are factored in.\n\nIn the absence of that conversation internally, RMs increasingly seek it externally. This is one of the quieter drivers of the talent movement that has reshaped Geneva over the past several years. It is rarely a single triggering event, a bad bonus, a reorganisation, a difficult manager. More often it is the cumulative weight of years of reviews that addressed everything except the one question the RM actually wanted answered, whether they are better off staying, and whether anyone at the institution actually knows what they are worth.\n\nBanks that rely on compensation alone to retain senior talent are running what amounts to a holding pattern rather than a retention strategy. Deferred compensation, retention bonuses tied to multi year vesting, and competitive base adjustments all have their place, but they address the symptom rather than the cause. They keep someone in their seat for another cycle without changing the underlying calculation the RM is making about their long term position.\n\nA genuine retention strategy would involve the conversation that is currently missing. It would mean a manager or a dedicated function within the bank being able to say, with credibility, here is what your book looks like from a portability and concentration perspective, here is where you are exposed, here is where you are strong, and here is what we are prepared to do about it. That conversation requires the bank to be honest about things it is often institutionally reluctant to discuss, including the degree to which a given RM\'s relationships are personal rather than institutional.\n\nIt is uncomfortable. It is also exactly the conversation that competing institutions, EAMs, and independent platforms are increasingly willing to have, because for them it is a sales conversation. The bank that will not have an honest conversation about portability with its own senior bankers is effectively ceding that conversation to whoever will.\n\nThe shift does not need to be dramatic. It does not require banks to abandon compliance reviews or pretend regulatory obligations do not exist. It requires separating the two conversations.\n\nThe compliance and target setting discussion can remain exactly as it is, because it serves a real function and cannot be removed. What is needed alongside it is a separate, genuinely strategic conversation, ideally not led by the RM\'s direct line manager alone, that addresses the RM\'s market position honestly. This might involve an external perspective, precisely because an external view is harder to dismiss as either a sales pitch or a management exercise. It might involve a structured assessment of the book\'s composition, its concentration risk, its portability under realistic constraints, and its likely value under different scenarios.\n\nThe point is not to give the RM ammunition to leave. The point is that RMs who have had this conversation tend to make more rational decisions, and rational decisions, when the institution has genuinely strong points to make, often favour staying. The RMs who leave anyway tend to be the ones for whom the institutional case was always weak, and arguably the bank is better positioned dealing with that reality directly than discovering it via a resignation letter.\n\nGeneva\'s concentration of talent and AUM is not going anywhere. The infrastructure advantages, the client base, the regulatory stability of the Swiss booking centre model, these remain real and durable. What is not durable is the assumption that this concentration alone will hold senior bankers in place indefinitely, particularly as portability becomes easier, as EAMs become more sophisticated, and as the next generation of RMs enters a market where mobility is normalised rather than exceptional.\n\nThe paradox is not that Geneva lacks what it needs to retain its best people. It is that the conversation required to do so keeps getting replaced by the conversation that is easier to have. Until that changes, the holding pattern continues, and every senior RM who walks out of another review having heard everything except what they actually wanted to know becomes a little more receptive to the call that eventually comes.\n\nIf you want to work through this for your own book, the [EP Portability Score tool](/en/portability) runs the assessment in under ten minutes. Or speak with us directly, confidential, no obligation, and no CV required at this stage.`,\n  },\n\n  {\n    slug: "compliance-golden-handcuff",\n    ogImage: "/og-articles/og-compliance-golden-handcuff.jpg",\n    title: "Compliance Is the New Golden Handcuff",\n    seoTitle: "Why Compliance Has Become the Real Retention Tool in Swiss Private Banking",\n    seoDescription: "The most effective retention tool in Swiss private banking is not a deferred bonus. It is the KYC file. How regulatory complexity quietly became a barrier to banker mobility.",\n    date: "2026-06-02",\n    engagementScore: 86,\n    summary: "How regulatory complexity became the retention weapon no one admits to using, and why the compliance audit now matters as much as the compensation negotiation.",\n    linkedinUrl: "https://www.linkedin.com/pulse/compliance-new-golden-handcuff-gil-m-chalem--aoh0e/",\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    markets: ["CH"],\n    keywords: ["compliance retention private banking", "KYC portability", "FinSA non-solicitation", "Swiss private banking talent", "banker mobility Switzerland"],\n    body: `The most effective retention tool in Swiss private banking is not a deferred bonus. It is not an equity stake, a title, or a counter-offer. It is a KYC file.\n\nSenior bankers are leaving large institutions and discovering, often mid-negotiation, that the relationship they spent twelve years building does not travel the way they assumed. The clients will follow them. The documentation will not. And without the documentation, re-onboarding a CHF 300 million book at a new institution under current FinSA obligations takes months the banker did not price into their decision. The banks knew this. They built it that way. Nobody said so out loud.\n\nThe scale of compliance investment in private banking is not incidental. A 2024 LexisNexis Risk Solutions study found that the cost of financial crime compliance has increased for 99% of financial institutions in the US and Canada, reaching 61 billion dollars annually. In Europe, the picture is comparable. In the UK alone, banks and fintechs spend an estimated 21,400 pounds per hour fighting financial crime and fraud, with the annual compliance bill reaching 38.3 billion pounds. Deloitte estimates compliance operating costs have increased by over 60% for retail and corporate banks compared to pre-financial crisis levels.\n\nFor Swiss private banks specifically, the regulatory stack has become dense. FinSA, FinIA, FINMA Circular 2025/02, Basel III Endgame, evolving AML obligations, and a proposed federal transparency register for beneficial ownership due in 2026. In June 2025, the Federal Council detailed legislative measures including the introduction of a Senior Managers Regime, new FINMA powers to issue administrative fines, and enhanced early intervention measures. Each layer requires documentation, systems, and institutional infrastructure that individual bankers cannot replicate or carry.\n\nBanking executives now spend 42% of their time on compliance matters, up 75% from 2016, while boards dedicate 43% of their time, up 63% from the same period. The cost is real. But the structural consequence is what the industry does not discuss: all that compliance infrastructure creates an asymmetry between the banker and the bank that grows harder to cross every year.\n\nWhen a relationship manager leaves, the suitability assessments, KYC files, risk classifications, and signed advisory agreements stay. Legally, they belong to the institution. The banker walks out with their relationships and their reputation. The bank keeps the paper trail the next institution needs to onboard those same clients.\n\nHere is the scenario that plays out more often than the industry acknowledges. A banker with CHF 400 million, solid client loyalty, a credible offer on the table. The move makes sense on paper. Then their lawyer maps the non-solicitation exposure, the documentation the new bank will require to satisfy FinSA suitability obligations from scratch, and the realistic timeline to make the book whole again. Eighteen months of rebuild, conservatively. The banker recalculates. Some move anyway. Many do not. The bank never made a counter-offer. It did not need to.\n\nUnder Swiss case law, non-solicitation clauses may even apply to clients who were already clients of the employee before they joined the employer, because those clients legally become clients of the institution. The sole exception applies where a client relationship is driven entirely by the personal attributes of the individual. In practice, proving that exception requires litigation that most departing bankers cannot afford to initiate. The result is a friction cost on mobility that has nothing to do with compensation. It is structural. And it compounds.\n\nThe banks that understood this earliest are not the ones with the most aggressive non-solicitation clauses. They are the ones that built the deepest client documentation systems, the most thorough KYC refresh cycles, the most integrated advisory platforms. Every client interaction logged inside a CRM is a data point the bank owns. Every suitability profile updated through the bank\'s portal is a file the banker cannot replicate at the next institution. Every co-signed investment proposal that lives inside the bank\'s document management system is a piece of the relationship the bank is retaining, not the banker. This is not cynicism. It is architecture. And the most sophisticated institutions have built it deliberately.\n\nThe KPMG 2025 study on Swiss private banking noted that the growing regulatory burden makes it increasingly difficult for even a successful bank to operate, contributing to ongoing consolidation. What the same report does not say is that for the largest surviving institutions, that burden is a competitive advantage. The compliance overhead that kills smaller banks protects larger ones, not just from regulators, but from talent mobility.\n\nThe talent market in Swiss private banking is already under pressure. Private banks lost high-performing relationship managers in 2024 to IAMs and boutiques, further exacerbating the talent shortage for traditional institutions. The bankers who do move are increasingly moving to smaller, less bureaucratically complex environments where the documentation burden is lower and the relationship with the client more portable. The irony is sharp. The regulatory architecture that the large banks built to protect client assets is also protecting the banks from their own talent leaving. And the side effect is a market where the most senior, most experienced bankers face the highest exit costs, regardless of whether their compensation reflects that reality.\n\nThe golden handcuff used to be a deferred bonus with a three-year cliff. It was transparent, negotiable, and eventually paid out. The new handcuff is invisible. It is built into every client file, every suitability form, every KYC refresh cycle. It does not expire. It accumulates. And the longer a banker stays, the deeper the documentation runs, and the higher the exit cost becomes. Loyalty and tenure, once rewarded with seniority, now also function as a trap.\n\nFor any banker considering a move, the compliance audit is now as important as the compensation negotiation. What documentation does your current employer hold on your clients? What can be replicated independently? What client consent is required for transfer? What is the realistic cost, in time and revenue, of rebuilding a book from scratch under current regulatory obligations at a new institution? These are commercial questions, not legal ones. Get answers before you sign anything. If you want a structured read on how much of your book would actually survive a move, the [Portability Readiness Score](/en/portability) maps exactly these constraints, documentation, wallet share, legal exposure, before you open a conversation with anyone.\n\nFor the institutions, the calculus is different but equally clear. The banks that built the deepest client documentation systems, the most integrated advisory platforms, the most thorough KYC refresh cycles, built them for compliance reasons. The retention effect was a consequence. Or so they will tell you.\n\nThe most effective retention tool in private banking today is paperwork. The institutions that understood that first are not talking about it. That, more than anything, tells you how well it works.`,\n  },\n  {\n    slug: "the-alpine-exit",\n    ogImage: "/og-articles/og-the-alpine-exit.jpg",\n    title: "The Alpine Exit",\n    seoTitle: "What Happens to Swiss Private Banking if UBS Moves HQ Abroad",\n    seoDescription: "If UBS relocates its headquarters out of Switzerland, the consequences for Geneva, Zurich and the Swiss private banking talent market go far beyond one bank.",\n    date: "2026-05-26",\n    engagementScore: 85,\n    summary: "What happens to private banking if UBS leaves Switzerland — the structural, human, and competitive consequences that capital markets commentary has missed.",\n    linkedinUrl: "https://www.linkedin.com/pulse/alpine-exit-gil-m-chalem--5dz5e/",\n    pillar: "P1",\n    subTheme: "Positioning",\n    markets: ["CH", "UK", "US"],\n    keywords: ["UBS redomiciliation", "Swiss private banking", "UBS headquarters", "private banking Switzerland 2026"],\n    body: `Picture the lobby of UBS\'s Bahnhofstrasse headquarters on a Tuesday morning in 2027. The Zurich address remains. The legal domicile does not. The building is still there, but the institution that built it is, on paper, American. That scenario is no longer the subject of financial fiction. It is the subject of board-level contingency planning, preliminary meetings in Washington, and some of the most consequential regulatory brinkmanship that Swiss banking has seen since the forced marriage of UBS and Credit Suisse in 2023.\n\nThe trigger is well documented by now. In June 2025, the Swiss Federal Department of Finance proposed that UBS fully capitalise its foreign subsidiaries, up from the current 60% threshold, at a cost of up to 26 billion dollars in additional Common Equity Tier 1 capital. Combined with existing requirements, the bank calculated the total additional CET1 demand at roughly 42 billion dollars. UBS called the proposals neither proportionate nor internationally aligned. That is diplomatic language for: we will not accept this, and if you insist, we will leave.\n\nBy September 2025, reports confirmed that UBS Chairman Colm Kelleher and CEO Sergio Ermotti had held meetings with officials from the Trump administration to explore the conditions for a potential headquarters transfer, possibly structured around an acquisition of a mid-sized American bank. PNC Financial, valued at approximately 79 billion dollars, and Bank of New York, at around 74 billion, were cited as potential targets. Neither UBS nor the White House confirmed the discussions. Neither denied them. The Swiss President, when pressed, noted that the threat of departure was, in her words, not new. That observation may be accurate. What is new is that the conditions for acting on the threat have never been more plausible.\n\nThis article is not primarily about the regulatory dispute. That debate belongs to capital markets analysts and banking lawyers. What interests practitioners in private banking, and what the industry press has largely missed, is the structural, human, and competitive consequence of a genuine UBS redomiciliation. The geography of private banking would not simply shift. It would fracture.\n\nThe [Geneva](/en/markets/geneva) private banking market entered 2026 in a condition that practitioners understand, but that the macro commentary has consistently misread. Headlines from the 2022 to 2024 period described contraction. The reality was more complex. The UBS-Credit Suisse integration shed more than 5,000 roles across Switzerland, and approximately 200 senior Geneva-based bankers relocated to Singapore alone in that period. The total headcount of the sector fell by roughly 15% over two years. What those numbers did not capture is that the roles eliminated were not the roles the market most needed, and the specialists who stayed became harder to recruit than at any point in the previous decade. A market that shrunk also tightened, acutely, in compliance, sustainable finance structuring, and senior cross-border planning. The paradox of private banking talent in 2026 is that supply contracted and demand intensified simultaneously.\n\nInto this context, a UBS headquarters relocation does not arrive as an abstract event. It arrives as a second structural shock to a workforce that has not finished processing the first one. The cantonal government of [Zurich](/en/markets/zurich) offered the most direct public quantification: in 2024, banks in the canton generated 13 billion Swiss francs in gross value added, approximately 8% of the canton\'s total economic output. UBS alone employs roughly 25,000 people in Switzerland, many of them internationally mobile senior professionals whose compensation arrangements include lump-sum taxation structures available in cantons such as Zug. A change of legal domicile would not move all of those people immediately, but it would begin a renegotiation of secondment contracts, remuneration packages, and career trajectories that would, over a cycle of three to five years, thin the talent layer at the top of the Swiss market considerably.\n\nThe broader institutional consequence is harder to quantify but no less real. Switzerland\'s position in global private banking has never rested purely on its regulatory framework or its tax environment. It has rested on the perception that the largest private banking institution in the world chose, generation after generation, to be Swiss. The country\'s political neutrality, its discretion culture, its geographic position between Western Europe and the rest of the world\'s wealth: all of this has been anchored, in the minds of private clients and relationship managers alike, by the fact that UBS sat in Zurich. Remove that anchor, and the positioning of Switzerland as the world\'s premier booking centre becomes, for the first time in modern history, an argument rather than an assumption.\n\nThe instinct of most financial commentators is to frame a UBS redomiciliation as a gain for the United States. That framing is correct in the narrow regulatory sense and misleading in almost every other sense. What would actually arrive in New York or Washington would not be a bank looking for a quieter life. It would be the world\'s largest private banking institution, managing over 7 trillion dollars in client assets and counting approximately half of the global billionaire population among its relationships, entering the domestic US wealth management market with structural advantages that no American competitor can match.\n\nConsider the competitive arithmetic. Morgan Stanley, Merrill Lynch, and JPMorgan Wealth Management are the dominant players in the US ultra-high-net-worth segment. They operate within the constraints of the domestic deposit cap rule, which prevents any American bank from acquiring more than 10% of total US deposits through a single transaction. UBS, as a foreign institution, is not subject to that constraint. A UBS that acquires PNC or Bank of New York does not simply add a domestic distribution network. It bypasses a limitation that has prevented American consolidation at the top of the market for years, and it does so while bringing a client base, a booking infrastructure, and an international platform that no US-built competitor can replicate organically.\n\nFor relationship managers and private bankers working in the United States today, the implications are more personal. UBS Financial Services already manages a significant portion of its global AUM through the US business. A formal headquarters move, accompanied by a domestic acquisition, would elevate that operation from a strategically important division to the institutional centre of gravity. For advisors currently at Merrill, Morgan Stanley, or Raymond James, a fully domiciled UBS becomes a materially different career destination: global platform, European client access, the institutional credibility of 160 years of private banking heritage, and the scale that comes from absorbing a mid-sized American institution.\n\nThere is a dimension to this story that capital markets commentary is constitutionally ill-equipped to address. It is the question of institutional identity, and specifically, what the identity of UBS means to the clients and relationship managers whose decisions are built around it.\n\nPrivate banking relationships are not pure product relationships. A senior relationship manager in Geneva managing a portfolio of French, Francophone African, or Middle Eastern clients did not choose UBS in isolation from the fact that UBS was Swiss. The Swiss identity of the institution was part of the value proposition: the neutrality, the physical distance from the client\'s home jurisdiction, the perception of permanence and discretion that being headquartered in Zurich carried. Some of that identity survives a redomiciliation. Some of it does not. The conversation between a Geneva-based banker and a Moroccan family office, or a Paris-based entrepreneur, or a Gulf-state patriarch, shifts in a way that no amount of branding continuity can prevent when the answer to where is your bank headquartered becomes, in a meaningful legal sense, New York.\n\nThis is not a sentimental observation. It is a retention risk calculation. For the cohort of relationship managers whose books are anchored in clients who specifically chose Swiss domiciliation, a redomiciliation is not neutral. It reopens conversations that have been closed for years. It creates a window, perhaps narrow but real, for competitors in Luxembourg, Liechtenstein, [Singapore](/en/markets/singapore), and the cantonal banks to approach those clients with an argument that did not exist before. That window closes over time as the new reality normalises. But the transition period, which in private banking typically runs three to five years, is long enough to matter.\n\nThe Swiss Federal Council is not unaware of this dynamic. The most likely outcome remains what it has always been in these standoffs: a negotiated middle ground. The capital requirements will be adjusted, the transition period will be extended, and UBS will remain legally Swiss while accelerating its operational centre of gravity toward the US. That outcome is already underway regardless of where the headquarters sits. But the credible threat of departure has changed the conversation permanently, and practitioners in both markets should be building their own contingency thinking now, not after the resolution is announced.\n\nThe alpine view from Bahnhofstrasse is still there. Whether the institution behind it remains defined by it is the question that the private banking world is only beginning to ask seriously.`,\n  },\n  {\n    slug: "what-is-a-relationship-manager-worth",\n    ogImage: "/og-articles/og-what-is-a-relationship-manager-worth.jpg",\n    title: "What Is a Relationship Manager Actually Worth? The Revenue Grid Nobody Shows You Before You Sign",\n    date: "2026-05-21",\n    engagementScore: 88,\n    summary: "There is an internal revenue model the bank built around your candidacy before they made you an offer. It contains their real assumptions about your portable AUM, their ROA projection, and the payback period on your guarantee. This is how to read it.",\n    pillar: "P2",\n    linkedinUrl: "",\n    markets: ["CH", "UK", "UAE", "ASIA"],\n    featured: true,\n    keywords: ["relationship manager salary private banking", "private banker compensation Geneva", "RM package Switzerland", "private banking guarantee negotiation", "what is a relationship manager worth", "private banker salary Zurich Dubai Singapore"],\n    body: `What Is a Relationship Manager Actually Worth? The Revenue Grid Nobody Shows You Before You Sign\n\nThere is a document that exists in every private bank\'s hiring process that you will never be shown. It is not confidential in any formal sense. Nobody has decided to withhold it from you as a matter of policy. It simply never makes it across the table, because sharing it would shift the negotiating dynamic in a direction that does not favour the institution.\n\nIt is the internal revenue model the bank built around your candidacy before they made you an offer.\n\nIt contains their assumptions about your portable AUM, their own ROA projection applied to that AUM, the payback period on your guaranteed compensation, and the net present value of the hire over a three to five year horizon. It is, in short, a precise calculation of what you are worth to them. And the gap between that number and the package they put on the table is the margin they expect to capture.\n\nThis article is about closing that gap. Not through confrontation, but through understanding the grid well enough to negotiate from the same set of numbers the bank is using.\n\n## How Banks Value a Lateral Hire\n\nThe starting point for any bank\'s internal valuation of a senior RM hire is simple: what revenue will this person generate, net of their total cost, over the period of the guarantee and beyond?\n\nThe calculation has four inputs. The first is the portable AUM the bank believes will actually transfer, which is almost always lower than the number in the business plan and reflects their own due diligence on the candidate\'s book. The second is the ROA they apply to that AUM, based on the bank\'s internal benchmarks for the market and client segment in question. The third is the ramp timeline, which reflects the legal situation and the bank\'s experience with similar hires. The fourth is the total cost of the hire: base salary, bonus target, sign-on, guarantee, and the internal cost of onboarding.\n\nThe output is a break-even point. The moment at which the cumulative revenue generated by the hire exceeds the cumulative cost. In Swiss private banking, for a senior lateral hire with a credible portable book, that break-even typically falls somewhere between eighteen and thirty-six months. Below eighteen months, the bank considers the hire low-risk. Above thirty-six months, the hire requires either a stronger conviction on the upside or a more conservative compensation structure.\n\nUnderstanding this framework matters because it explains almost every decision the bank makes during the negotiation. The length of the guarantee is a direct function of the break-even timeline. The size of the sign-on reflects the bank\'s confidence in the portability case. The structure of the bonus, whether it is discretionary or formula-driven, reflects their view of the revenue risk. None of these decisions are arbitrary. They all trace back to the same internal model.\n\n## What You Are Actually Worth: The Market Benchmarks\n\nThe question of what a relationship manager is worth in the open market is one that the industry treats with a peculiar mix of opacity and open secret. Everyone in the business has a rough sense of the numbers. Almost nobody states them clearly.\n\nThe benchmarks that follow are drawn from active mandates and completed placements across the markets where Executive Partners operates. They are indicative rather than precise, because compensation in private banking is genuinely variable and depends on factors that no benchmark can fully capture. But they are close enough to reality to be useful as a starting point.\n\nIn [Geneva](/en/markets/geneva), a senior relationship manager managing a CHF 300 to 500 million book with a credible portable AUM of sixty percent or above and a clean legal situation can typically expect a total first-year package in the range of CHF 350,000 to CHF 550,000, inclusive of base, bonus target, and guarantee. The base salary for a profile at this level sits between CHF 180,000 and CHF 260,000. The guarantee, where offered, is typically structured over twelve to twenty-four months.\n\nIn [Zurich](/en/markets/zurich), the benchmarks are broadly comparable, with a slight compression at the upper end reflecting the different client mix and the dominance of domestic Swiss business in many of the larger institutions.\n\nIn [Dubai](/en/markets/dubai), the structure is different but the economics are comparable when adjusted for the tax-free environment. A senior RM managing a USD 300 to 500 million book can expect a total package in the range of USD 300,000 to USD 500,000, with a higher proportion typically paid as base salary reflecting the cost of living and the absence of a bonus tax advantage.\n\nIn [Singapore](/en/markets/singapore) and Hong Kong, the range is wider, reflecting the greater diversity of client segments and booking centre models. A senior Asian market RM with a strong portable book and language capabilities that match the desk\'s target market can command packages that comfortably exceed the Geneva benchmarks, particularly at the upper end of the AUM range.\n\n[London](/en/markets/london) occupies a specific position in the market. The tax environment is less favourable than Dubai or Switzerland, but the pool of international private banking talent is deep and the client base is genuinely global. Packages at the senior level reflect both the cost of London living and the competitive pressure from the investment banking and asset management sectors for the same talent.\n\n## The Compensation Variables That Matter Most\n\nKnowing the benchmark range is the starting point. Understanding the variables that move a candidate toward the upper or lower end of that range is what allows for a genuinely informed negotiation.\n\nThe single most important variable is portable AUM credibility. A candidate whose business plan has been stress-tested and holds up under scrutiny, whose portability case is specific and honest, and whose legal situation is clean, will consistently command packages at or above the midpoint of the market range. A candidate whose business plan is vague, whose AUM figures are approximate, and whose legal situation is complicated will consistently land below it. The market is not irrational about this. It prices risk accurately.\n\nThe second variable is market specificity. A relationship manager who serves a specific, named market, Turkish, Italian, CIS, LATAM, South African, and who has demonstrable relationships in that market, is a scarcer resource than a generalist, and is priced accordingly. Scarcity drives compensation in private banking at least as reliably as it does in any other professional market.\n\nThe third variable is revenue quality. Two candidates with identical AUM can have very different revenue profiles, and the one with the higher ROA, the more active client base, the greater proportion of discretionary mandates, will command a meaningfully higher package. Banks are not buying AUM. They are buying revenue, and they pay for revenue quality.\n\nThe fourth variable is competitive tension. A candidate who is in process with two or more institutions simultaneously, and who is transparent about that process, will almost always achieve a better outcome than one who is negotiating exclusively with a single bank. This is not a negotiating tactic in any cynical sense. It is simply the natural result of a market functioning correctly. Banks price talent more accurately when they know the talent has options.\n\n## The Guarantee Negotiation\n\nThe guarantee is the most consequential element of a senior RM\'s compensation negotiation, and it is the one that is most frequently mishandled.\n\nThe common mistake is to treat the guarantee as a fixed component of the offer, to be accepted or rejected as presented, rather than as a negotiable variable that reflects the bank\'s internal risk assessment of the hire. The guarantee is, in effect, the bank\'s bet on the business plan. If they believe the portable AUM will transfer at the levels projected, they will guarantee the compensation for the period it takes to get there. If they are uncertain, they will shorten the guarantee or structure it with clawback provisions that transfer the risk back to the RM.\n\nThe most effective approach to the guarantee negotiation is to connect it explicitly to the business plan assumptions. If the bank accepts the portability case at the level presented, the guarantee should reflect the time it takes to realise that case given the legal constraints. A six-month garden leave plus a twelve-month ramp to first wave client transfers implies a minimum eighteen-month guarantee for the hire to make economic sense for either party. A bank that offers twelve months against that profile is either discounting the portability case or pricing the risk asymmetrically. Both of those positions are negotiable.\n\nThe RM who understands this dynamic, who can articulate the connection between the portability timeline and the guarantee structure, will consistently negotiate better outcomes than the one who treats the guarantee as a line item to be pushed up by force of will.\n\n## Reading the Offer Correctly\n\nWhen a private bank puts an offer on the table, it contains more information than the numbers it states. The structure of the offer reveals the bank\'s actual view of the hire.\n\nA high base relative to bonus target suggests the bank is uncertain about the revenue upside and is pricing the hire conservatively. A long guarantee with modest sign-on suggests they believe the portability case but want time to verify it. A short guarantee with a generous sign-on suggests they are confident about year one but uncertain about the longer term. A formula-driven bonus rather than a discretionary one suggests they have done the revenue modelling carefully and are prepared to share the upside but not underwrite the risk.\n\nNone of these structures are inherently good or bad. They are signals. And reading them correctly, understanding what the bank is really saying about their view of the hire, is the precondition for negotiating effectively.\n\nThe RM who can read the offer in these terms, who understands that they are looking at a financial model expressed as a compensation structure, is in a fundamentally stronger position than the one who reads it as a number to be negotiated up. The goal is not to extract the maximum from the bank. The goal is to reach an agreement that accurately reflects what both parties believe the hire is worth. That agreement, when reached on those terms, tends to be the foundation for a relationship that actually works.\n\nIf you would like to understand where your profile sits within these benchmarks before your next conversation, the Executive Partners [Portability Score](/en/portability) and [Business Plan Simulator](/en/bp-simulator) will give you a structured view of your own position in the market.`,\n  },\n  {\n    slug: "private-banker-business-plan",\n    ogImage: "/og-articles/og-private-banking-business-plan.jpg",\n    title: "The Private Banker\'s Business Plan: What Your New Bank Actually Wants to See",\n    seoTitle: "Private Banker Business Plan: What Hiring Committees Actually Want to See",\n    seoDescription: "Most private banker business plans answer the wrong question. This is the AUM portability framework and revenue structure that Swiss and international private banks actually expect.",\n    date: "2026-05-21",\n    engagementScore: 87,\n    summary: "Most business plans in private banking answer the wrong question. This is the structure that sophisticated hiring committees actually believe — and the logic that earns the guarantee.",\n    pillar: "P2",\n    linkedinUrl: "",\n    markets: ["CH", "UK", "UAE", "ASIA"],\n    featured: true,\n    keywords: ["private banker business plan", "RM business plan private banking", "AUM portability", "relationship manager lateral move", "private banking guarantee", "RM ramp timeline"],\n    body: `The Private Banker\'s Business Plan: What Your New Bank Actually Wants to See\n\nEvery senior relationship manager who has been through a serious lateral move in private banking has written a business plan. Most of them have written a bad one. Not bad in the sense of poorly formatted or carelessly researched, but bad in the sense that it answered the wrong question. It told the hiring bank what the RM wanted them to believe, rather than what they actually needed to know.\n\nThe business plan is the most misunderstood document in private banking recruitment. RMs treat it as a sales pitch. Banks treat it as a due diligence exercise. The gap between those two framings is where most lateral moves go wrong before they even begin.\n\nAfter placing over two hundred senior bankers across [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), [London](/en/markets/london), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore), and Hong Kong, I have read enough business plans to know what separates the ones that close at the number the RM wanted from the ones that get quietly discounted before the offer is made. The difference is almost never the quality of the writing. It is the quality of the thinking behind it.\n\nThis article is a guide to building a business plan that a sophisticated hiring committee will actually believe.\n\n## What the Bank Is Really Asking\n\nBefore writing a single line, it is worth understanding what a private bank\'s hiring committee is actually trying to establish when they read a business plan. They are not looking for ambition. They already know the RM is ambitious, or they would not be sitting across the table. They are not looking for a polished narrative about client relationships and market expertise. They have heard that narrative from every candidate who has sat in that chair.\n\nWhat they are looking for is three things, and only three things.\n\nFirst, they want to know whether the revenue projection is credible. Not optimistic, not aspirational, credible. There is a very specific range within which a business plan needs to land to be taken seriously, and it is narrower than most RMs think.\n\nSecond, they want to understand the legal situation clearly enough to model the ramp timeline with some confidence. Garden leave, non-solicitation, non-compete: the hiring committee needs to know what they are underwriting before they can structure an offer.\n\nThird, they want to see evidence that the RM understands their own book well enough to have an honest conversation. The candidate who walks in knowing their average wallet share per client, their return on assets, and their realistic portable percentage in year one is a fundamentally different proposition from the one who states a headline AUM and expects the room to do the rest of the work.\n\nEverything else in the business plan is context. Useful context, sometimes important context, but context nonetheless.\n\n## The Structure That Works\n\nA business plan that lands well in a private banking hiring committee follows a specific sequence. It moves from the current reality to the credible projection, with the supporting logic made explicit at each step. It does not lead with the number. It earns the number.\n\nThe opening section establishes the current book clearly and honestly. Total AUM under management, the number of active client relationships, the average ticket size, the market or markets served, and the approximate revenue generated in the last full year. These figures should be as precise as confidentiality constraints allow. Round numbers are a red flag. A candidate who manages exactly CHF 400 million from exactly fifty clients generating exactly CHF 2 million in revenue has clearly approximated. A candidate who manages CHF 387 million from forty-three active relationships generating CHF 1.9 million has clearly counted.\n\nThe second section addresses composition. What proportion of the book is discretionary versus advisory versus execution-only? What is the breakdown by client domicile and booking centre? Are there EAM relationships in the book, and if so, how are they structured? This section exists because a CHF 400 million book composed primarily of discretionary mandates from long-standing direct relationships is worth dramatically more to a hiring bank than a CHF 400 million book split across EAM relationships, custody-only clients, and recent introductions. The number is the same. The value is not.\n\n## The Portability Case\n\nThe portability section is where most business plans collapse under scrutiny, and it is the section that matters most.\n\nThe standard approach is to apply a transfer percentage to the total AUM and present the result as the year one figure. Seventy percent of CHF 400 million equals CHF 280 million. The committee nods. The offer is structured around CHF 280 million. And then the actual transfer comes in at CHF 140 million and everyone spends the next two years managing the gap.\n\nA credible portability case does not work that way. It works client by client, or at least segment by segment, and it is honest about the variables that will determine the actual outcome.\n\nThe factors that drive portability have been covered in detail in the [AUM portability framework](/en/insights/how-to-calculate-aum-portability) published separately on this site. In the context of the business plan, what matters is demonstrating that the RM has applied that kind of thinking to their own book, rather than simply stating a percentage and hoping the committee accepts it.\n\nA strong portability section identifies the anchor clients, the two or three relationships that represent a disproportionate share of the AUM, and makes a specific case for why each of them will move. It identifies the clients who are genuinely uncertain, where the relationship is strong but the institutional dependency is real, and presents them as the upside scenario rather than the base case. And it identifies the clients who are unlikely to move at all, because the relationship is too institution-dependent, too EAM-driven, or too recently established, and excludes them from the projection entirely.\n\nThat level of honesty is counterintuitive. Most RMs are afraid that excluding clients from the business plan will reduce the offer. In practice, it almost always increases credibility, and credibility is what drives the guarantee.\n\n## The Ramp Timeline\n\nPrivate banks do not underwrite a business plan as a single number. They model it as a cash flow, quarter by quarter, from the date of hire through to the point at which the RM\'s book is generating enough revenue to cover their total cost. That break-even point, sometimes called the payback period, is the internal metric that determines how much risk the institution is prepared to take on the hire.\n\nThe ramp timeline in a business plan needs to reflect the legal reality first and the client migration reality second. If there is a six-month garden leave, the revenue line starts at zero for the first two quarters regardless of any other assumptions. That is not a weakness in the plan. It is a fact, and presenting it clearly signals that the RM understands how banks think about this hire.\n\nAfter the garden leave period, the typical ramp in Swiss private banking follows a specific pattern. The first wave of client transfers, those from the anchor relationships who were briefed before departure and have been waiting, arrives in months seven through nine. The second wave, from relationships that needed more time to process the move, arrives in months twelve through eighteen. The third wave, from clients who needed to see the RM established at the new institution before committing, arrives in year two or later.\n\nA business plan that shows a smooth linear ramp from zero to full AUM over thirty-six months is almost certainly wrong. A business plan that shows a step-function ramp, front-loaded with anchor clients and followed by two subsequent waves with specific timing rationale, is almost certainly right and is far more likely to be believed.\n\n## Revenue Projections\n\nThe revenue projection is where the business plan connects the AUM timeline to the P&L, and it is where the ROA assumption matters enormously.\n\nThe hiring committee will apply their own ROA assumption to whatever AUM figure they accept. If the RM\'s stated ROA is materially higher than the bank\'s internal benchmark, the committee will discount it. If it is materially lower, they will wonder whether the RM\'s client base is the right fit for the platform. The target is a revenue projection that lands within a credible range of what the institution can verify through its own experience with similar books.\n\nIn Swiss private banking, the standard ROA range for a managed book is forty to seventy basis points on AUM. Anything above seventy basis points requires explanation, usually in the form of a concentrated book of active traders or structured product buyers. Anything below forty requires a different explanation, usually in the form of a predominantly cash or custody book that will need to be repositioned over time.\n\nThe business plan should state the ROA assumption explicitly and explain it. A candidate who says "I am projecting sixty basis points because my clients are predominantly discretionary with an average equity allocation of sixty-five percent" is making a specific, verifiable claim. A candidate who says "I expect to generate approximately two percent of AUM in revenue" is making a claim that no sophisticated committee will accept at face value.\n\n## Compensation Framework\n\nThe final section of the business plan is the one that most RMs treat as the starting point rather than the conclusion. The compensation ask.\n\nA well-structured business plan earns the compensation ask by building the logic that supports it. The committee has seen the current book, accepted the portability case, agreed on the ramp timeline, and worked through the revenue projection. By the time the compensation framework appears, it should feel like the natural conclusion of a shared analysis rather than an opening position in a negotiation.\n\nThe elements of a private banking compensation package are well understood: base salary, performance bonus, long-term incentive, sign-on, and guarantee. The guarantee is the most sensitive element and the one that most directly reflects the institution\'s confidence in the business plan. A bank that believes the portability case will offer a meaningful guarantee. A bank that does not will offer a short one, or none at all.\n\nThe RM who understands this dynamic will present a compensation framework that is explicitly linked to the business plan assumptions. If the portability scenario delivers at the base case, the target compensation is X. If it delivers at the upside, it is Y. That kind of conditional structure signals financial sophistication and tends to produce better outcomes than a fixed ask.\n\n## The Document That Builds Trust\n\nThe business plan is not a sales pitch. It is a trust-building exercise. The RM who walks into a hiring committee with a document that is honest about what will move, clear about the timeline, explicit about the assumptions, and realistic about the risks is the RM that institutions want to hire. Not because they are the most optimistic candidate in the room, but because they are the one the bank can actually plan around.\n\nIf you would like to build your business plan using the same framework that Executive Partners applies to every candidate placement, the [Business Plan Simulator](/en/bp-simulator) will walk you through each section and generate a structured output you can take directly into your next conversation.`,\n  },\n  {\n    slug: "how-to-calculate-aum-portability",\n    ogImage: "/og-articles/og-how-to-calculate-aum-portability.jpg",\n    title: "How to Calculate Your AUM Portability: The Framework Private Banks Don\'t Share With You",\n    date: "2026-05-21",\n    engagementScore: 86,\n    summary: "Most business plans in private banking are built backwards. This is the six-block framework that reveals what will actually move — and what won\'t.",\n    pillar: "P2",\n    linkedinUrl: "",\n    markets: ["CH", "UK", "UAE", "ASIA"],\n    featured: true,\n    keywords: ["AUM portability", "private banker business plan", "relationship manager lateral move", "how to calculate AUM portability", "RM break-even timeline", "portable book private banking"],\n    body: `How to Calculate Your AUM Portability: The Framework Private Banks Don\'t Share With You\n\nThere is a conversation that happens in every serious lateral move in private banking, and it almost never happens honestly. A relationship manager sits across from a hiring committee, states a number: CHF 400 million, CHF 600 million, sometimes more. The room nods. Nobody challenges it directly. Nobody asks the questions that would actually reveal whether those assets will follow. And then twelve months later, when the ramp is tracking at thirty percent of the business plan, everyone acts surprised.\n\nThe number is not the problem. The framework behind the number is.\n\nAfter more than two decades placing senior relationship managers across [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), [London](/en/markets/london), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore), and Hong Kong, I have seen the same pattern repeat itself with remarkable consistency. Banks underwrite portability on optimistic assumptions. RMs overstate what will move because they believe their own narrative. And the gap between what was promised and what arrives becomes the defining fact of a relationship that was supposed to be transformative.\n\nThis article is an attempt to give relationship managers, and the institutions considering them, a more honest framework for thinking about portability before anyone sits down at a negotiating table.\n\n## Why the Standard Business Plan Fails\n\nThe conventional business plan in private banking is structured backwards. It starts with a target. Usually whatever number the hiring bank needs to justify the package. Then it works down to a justification. AUM is stated. A transfer percentage is applied. A revenue figure is projected. The document is formatted, the assumptions are buried, and the deal gets done.\n\nThe problem is that portability is not a percentage. It is an outcome shaped by at least six distinct variables, each of which can independently collapse the number. Treating it as a single figure. Seventy percent of CHF 500 million. That is not analysis. It is a rounding error dressed up as a forecast.\n\nThe framework that Executive Partners uses to assess portability breaks the question into six blocks. Each block addresses a different dimension of the risk. Together, they produce a score that reflects not just what an RM claims to manage, but what they can credibly expect to move, and when.\n\n## Block One: AUM Composition and Wallet Share\n\nThe first question is not how much the RM manages. It is how much of each client\'s total wealth they manage.\n\nAn RM with CHF 400 million in AUM and an average wallet share of sixty percent has a very different portability profile from one with CHF 400 million and an average wallet share of fifteen percent. In the first case, the RM is the primary banking relationship. The client\'s financial life runs through them. In the second, they are one of several institutions the client uses, and the relationship is transactional rather than structural.\n\nWallet share is the single most predictive variable in portability analysis, and it is almost never disclosed in a standard business plan. When assessing your own book, the honest question is not what you manage, but what proportion of each client\'s investable assets sits with your current institution. For most RMs, the answer is lower than they think.\n\nThe second dimension within this block is concentration. A book of CHF 400 million spread across eighty clients transfers very differently from the same AUM concentrated in twelve relationships. Concentration creates fragility. The loss of two or three anchor clients can destroy the business case entirely. But it also means that securing those relationships before departure is both possible and decisive.\n\n## Block Two: Revenue Quality\n\nAUM is a stock. Revenue is a flow. And it is the flow that banks actually underwrite.\n\nA relationship manager with a high-AUM, low-revenue book, typical of clients who hold predominantly cash, fiduciaries, or conservative fixed income, will generate a very different return on assets than one whose clients actively trade, hold structured products, or delegate discretionary mandates. The difference can be a factor of three or four on identical AUM figures.\n\nRevenue quality also determines how quickly a book becomes self-sustaining at a new institution. A discretionary book, once transferred, begins generating revenue almost immediately. A more transactional book requires the client to actively re-engage. To take positions, accept ideas, rebuild trust with a new product shelf. That process takes time before it contributes meaningfully to the P&L.\n\nWhen building an honest portability assessment, the starting point is your current revenue per AUM, sometimes called return on assets or ROA. The industry average in Swiss private banking sits between forty and sixty basis points on managed assets. Anything materially above or below that benchmark deserves explanation.\n\n## Block Three: Relationship Depth and Past Portability\n\nThe most reliable predictor of whether clients will follow an RM is whether they have done it before.\n\nAn RM who has made a previous lateral move and retained seventy percent of their book is demonstrating something that no business plan projection can replicate: revealed preference. Their clients chose them over the institution. That is the strongest signal available.\n\nConversely, an RM who has never moved, or who joined their current bank as a graduate and built their book from within the institution\'s infrastructure, faces a genuinely unknown variable. The clients may have been introduced by the bank, may rely on the bank\'s brand for their own counterparty relationships, or may simply have no loyalty to the individual beyond the convenience of inertia.\n\nRelationship depth is assessed through several proxies: the tenure of client relationships, the frequency of direct contact, whether clients know the RM\'s personal contact details, and whether the RM has ever referred clients to other institutions for products their current bank could not provide. The last point is particularly telling. An RM who has occasionally said to a client "we cannot do this here, let me introduce you to someone who can" has demonstrated that their relationship is not captive to the institution. That kind of generosity is, counterintuitively, one of the strongest portability indicators available.\n\n## Block Four: EAM Exposure\n\nExternal asset managers represent a specific and underappreciated portability risk.\n\nWhen a portion of an RM\'s book is sourced through or managed in conjunction with an EAM, the beneficial ownership of that relationship becomes genuinely ambiguous. The EAM may have introduced the client. The EAM may hold the client\'s primary advisory relationship. The EAM may have contractual arrangements with the current booking institution that restrict transfer. In some cases, the EAM will simply direct the assets to whichever institution offers the most favourable terms. Terms that have nothing to do with the RM.\n\nIn practice, EAM-sourced AUM should be treated as non-portable in a base case and potentially portable in an upside scenario. Presenting it as fully transferable without a clear account of the EAM\'s incentives and existing contractual relationships is the fastest way to destroy credibility with a sophisticated hiring committee.\n\n## Block Five: Legal Constraints\n\nNon-compete clauses, non-solicitation agreements, and garden leave provisions are the most underestimated element of any lateral move in private banking.\n\nSwiss law is more permissive than most jurisdictions in this area. Non-compete clauses are enforceable only under specific conditions and for limited periods. But the practical effect of a six-month garden leave combined with a formal non-solicitation undertaking can reduce first-year portability by forty percent or more. Clients do not wait indefinitely. Relationships cool. New RMs are assigned. Inertia, which was working in your favour before departure, begins working against you.\n\nAny honest portability assessment must account for the legal situation explicitly. What does the employment contract say? What is the notice period? Is there a garden leave provision, and has the employer historically enforced it? Has the employer initiated legal action against former employees who moved to competitors?\n\nThese are not hypothetical questions. They are the variables that determine whether a business plan is executable.\n\n## Block Six: Motivation and Timing\n\nThe final block is the one that banks most consistently neglect, because it is the hardest to quantify. But it is often the most decisive.\n\nAn RM who is moving because they have lost confidence in their current institution\'s strategy, because a key client has asked them to move, or because a specific platform capability is unavailable at their current bank, has a fundamentally different portability profile from one who is moving primarily for compensation. In the first set of cases, the RM has a narrative. One they can share with clients, one that positions the move as rational and even client-driven. In the second case, they have a problem. Clients are sophisticated. They understand when a move is about money, and it colours their willingness to follow.\n\nTiming matters equally. An RM who initiates a move at the beginning of a client lifecycle, when relationships are deepening, when assets are growing, when trust is being built, will retain more than one who moves at the end of a cycle, when clients are consolidating, reducing risk, or considering inter-generational transfer to family members who have no relationship with the RM at all.\n\n## What a Credible Portability Number Looks Like\n\nApplying these six blocks honestly to a CHF 500 million book typically produces a number between CHF 150 million and CHF 320 million in year one, depending on the composition of the book and the legal situation. That range is not pessimism. It is realism. And it is the range that sophisticated private banks model internally, regardless of what appears in the business plan they receive.\n\nThe RMs who survive and thrive in lateral moves are not the ones who overstated their book and spent three years trying to close the gap. They are the ones who understood their own portability clearly enough to have an honest conversation before the offer was made, and who chose a platform that gave their clients a credible reason to follow.\n\nIf you would like to apply this framework to your own book before your next conversation, the Executive Partners [Portability Score](/en/portability) walks through each of these six dimensions and produces a structured assessment you can use as the basis for a business plan that will withstand scrutiny.`,\n  },\n  {\n    slug: "the-emotional-strategist",\n    ogImage: "/og-articles/og-the-emotional-strategist.jpg",\n    title: "The Emotional Strategist",\n    date: "2026-05-18",\n    engagementScore: 83,\n    summary: "When AI handles the analysis, the relationship manager is left with the only thing that ever actually mattered. The conversation the machine cannot have.",\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    linkedinUrl: "https://www.linkedin.com/pulse/emotional-strategist-gil-m-chalem",\n    markets: ["CH", "UK", "UAE", "ASIA"],\n    body: `There is a scene playing out in private banking boardrooms across [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), and [Singapore](/en/markets/singapore) right now that tells you everything you need to know about where this industry is heading. A bank\'s leadership team gathers to review the deployment of its new AI advisory stack. The system is impressive: it monitors live portfolios, surfaces next-best-action recommendations in real time, flags compliance anomalies before they become problems, and prepares a meeting agenda for each client interaction in about half the time a senior analyst used to spend doing the same job. The room is pleased. And then someone asks the question that nobody has a clean answer to: if the machine does all of that, what exactly is the relationship manager there to do?\n\nThe answer, it turns out, is the only thing that has ever actually mattered. And it is the one thing the machine cannot do at all.\n\nThe shift that is redefining private banking in 2026 is not the one the technology vendors are selling. The story they tell is one of efficiency gains, of agentic AI systems that can execute complex multi-step workflows autonomously, of advisor desktops that eliminate friction and surface insight on demand. Nearly 70 percent of banking firms now deploy agentic AI models to support their advisory functions, delivering real-time recommendations and continuously monitoring for compliance risks across client portfolios. A purpose-built AI assistant for a top-ten investment management firm, designed to review advisor profiles and meeting notes and generate personalised agendas, cut meeting preparation time by up to 50 percent, saving an estimated 20,000 hours a year across the organisation. These are not marginal improvements. They represent a genuine restructuring of how advisory work gets done.\n\nBut the more interesting story, the one worth paying attention to if you are an RM trying to understand what your career looks like in five years, is what that restructuring exposes. When you remove the data aggregation, the research synthesis, the portfolio monitoring, the compliance preparation, and the administrative overhead from the relationship manager\'s working day, you are left with a residue. And that residue is the whole job.\n\nOliver Wyman describes this as the rise of the Unified Client Brain: a consolidated intelligence layer that integrates a client\'s relationships, global assets, lifestyle preferences, and risk appetite into a single real-time picture accessible to the advisor before any conversation begins. The practical effect is that the RM walks into every client meeting already knowing the technical picture. Which means the meeting itself is no longer about the technical picture. It is about everything else. The family succession conversation that has been deferred for three years because the patriarch finds it uncomfortable. The son who has different values from his father and is being handed a portfolio structured around assets he does not believe in. The client who is considering moving a significant portion of their book to [Dubai](/en/markets/dubai) and has not yet told their banker in Geneva. These are not analytical problems. They are human ones. And they require a set of skills that no model, however capable, is currently equipped to develop.\n\nThe private banking industry has spent the better part of the last decade trying to convince itself that the relationship manager role is primarily a technical one dressed up in soft skills. The logic was understandable: you could measure a portfolio\'s performance, you could benchmark a banker\'s AUM growth, you could count the number of products cross-sold. What you could not easily measure was whether a client trusted their banker with the conversations that mattered most. So the industry defaulted to measuring what it could, and it hired, trained, and promoted accordingly.\n\nThe result is a cohort of senior private bankers who are genuinely excellent at managing portfolios and genuinely uncomfortable with the conversations that now constitute their entire value proposition. This is not a criticism. It is a structural problem that the industry created by treating relationship management as a sales function rather than a counselling one. And it matters now because AI is about to expose it at scale.\n\nUBS has been among the most candid about what this transition actually looks like in practice. The bank\'s Operating Head for Southeast Asia described the firm\'s approach at a wealth management forum in Singapore earlier this year: the focus is not on replacing relationship managers, but on augmenting their capabilities to the point where every interaction carries more substance. What is implicit in that framing is that augmentation only works if the underlying human capability is there to be augmented. If the RM\'s primary contribution was always research and data synthesis, then giving them an AI that does that faster does not augment them. It replaces them, quietly, while leaving their job title intact.\n\nThis is the uncomfortable reality sitting beneath the industry\'s enthusiasm for its own technological transformation. The banks that are investing most heavily in AI infrastructure are simultaneously raising the bar for what it means to be a relationship manager. They are not reducing headcount in the client-facing function, at least not yet. They are changing what they need from those people. And many of the bankers currently in those seats were never hired, trained, or developed for what is now being asked of them.\n\nThe profile of a client who actually needs an emotional strategist is not difficult to sketch. It is, in practice, the majority of the UHNW client base. The global ultra-high-net-worth population is projected to grow to around 587,650 people and control approximately 68 trillion dollars by 2028. Baby Boomers currently hold 44.5 percent of that wealth share. By 2040, that cohort will largely have handed the stewardship of those assets to the next generation of inheritors. That transition is not primarily a financial event. It is a human one.\n\nIn Europe\'s high-net-worth segment alone, nearly 3.2 trillion euros will transfer from one generation to the next in the coming years. Globally, the scale of this intergenerational movement of capital runs into tens of trillions over the next two decades. Research consistently shows that inadequate succession planning is one of the principal causes of intergenerational wealth erosion, not poor investment performance, not adverse market conditions, but the failure to manage the human complexity of passing something of enormous value from one generation to the next.\n\nThe conversation that needs to happen around that transfer is not about asset allocation. It is about values, about family governance, about who gets a seat at the table and who does not, about what the wealth is for. And the banker who sits across from that family and has spent their career becoming expert at portfolio construction and product knowledge is, in the most polite possible framing, underprepared.\n\nNone of this is an argument that technical competence no longer matters. A relationship manager who cannot read a structured product term sheet or explain the mechanics of a Lombard facility or have an intelligent conversation about alternatives allocation is not going to survive in this business regardless of how empathetic they are. The point is sequencing. Technical credibility is the entry ticket. It gets you through the door. But it stopped being the differentiator years ago, and the clients who matter most have known this for some time.\n\nWhat UHNW clients in the Middle East have described to their bankers is instructive: these clients seek senior-level advice, clarity of execution, and institutional capability. But what they are actually weighing when they decide whether to deepen or end a relationship is something more elemental. They want to feel that their banker understands not just their portfolio, but their situation. That is a different thing entirely. A portfolio is a set of numbers. A situation involves a family, a history, a set of pressures and ambitions that no algorithm has been trained to hold.\n\nThe banks that will win the talent war over the next five years, and the individual bankers who will build practices worth building, are those who understand this not as a soft observation about client service, but as a structural shift in what private banking is fundamentally for. The machine will handle the analysis. It will do it faster, more accurately, and with fewer errors than any human team. That is not a threat to the profession. It is a clarification of it.\n\nThe relationship manager who thrives in this environment is not the one who knows the most. It is the one who listens best. Who can hold a difficult conversation without flinching. Who can sit with a client at the moment of genuine uncertainty, a death, a divorce, a business exit gone wrong, a child who is not who the parent hoped they would be, and be genuinely useful rather than merely present. That is the job now. And it turns out it always was.\n\nThe firms deploying AI most aggressively are not reducing their need for exceptional relationship managers. They are raising the standard for what exceptional looks like.\n\nGil M. Chalem, Managing Partner, Executive Partners`,\n  },\n\n  {\n    slug: "the-last-wave",\n    ogImage: "/og-articles/og-the-last-wave.jpg",\n    title: "The Last Wave",\n    seoTitle: "UBS Integration Final Phase: Why Senior Private Bankers Are Leaving Now",\n    seoDescription: "UBS says the Credit Suisse integration is complete. The senior private bankers still inside know the final redundancy phase is just beginning — and the exit window is narrowing.",\n    date: "2026-05-12",\n    engagementScore: 82,\n    summary: "UBS has declared the Credit Suisse integration a success. For the private bankers still inside as H2 2026 begins, the most consequential chapter is the one starting now.",\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    linkedinUrl: "https://www.linkedin.com/pulse/last-wave-gil-m-chalem",\n    markets: ["CH", "UK", "US"],\n    body: `In March 2026, UBS completed the migration of former Credit Suisse Swiss-booked clients onto its platforms and declared the milestone a success. The press release was clean. The numbers were solid. A net profit of three billion dollars in the first quarter alone.\n\nIf you work in Swiss private banking, you were forgiven for reading all of this and feeling that the story was, finally, over.\n\nIt is not over. In fact, for the people who matter most to this industry, the relationship managers, the market heads, the senior bankers sitting on books built across fifteen or twenty years, the most consequential chapter is the one beginning now.\n\nHere is the arithmetic that the press releases do not lead with. When UBS absorbed Credit Suisse in March 2023, it absorbed approximately 45,000 employees overnight. The combined headcount peaked at just under 120,000. Three years later, the bank has reduced its workforce by around 15,000 people. The internal target, never publicly confirmed but reported consistently by Bloomberg and the Financial Times, was always 35,000. That means UBS needs to remove roughly 20,000 more positions to reach the headcount the integration was always designed to achieve. Ermotti himself told reporters in February that the majority of Swiss job reductions would land in the second half of 2026. That is now.\n\nThe clients have been migrated. The systems are being switched off. The people are next.\n\nTo understand why this matters specifically for private banking, you need to understand what the last three years actually looked like from the inside. Not from the investor presentations, but from the desk.\n\nWhen UBS took over Credit Suisse in 2023, the immediate assumption in the market was that a wave of senior banker departures would follow almost immediately. Citi analysts predicted that Credit Suisse could lose roughly a fifth of its wealth management assets in the transition, with worst-case scenarios pointing toward a third. Competitors sharpened their pencils. Julius Baer, Pictet, Lombard Odier, EFG, Vontobel: every serious private bank in [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich) anticipated an extraordinary recruiting window.\n\nWhat actually happened was more complicated. Some bankers moved. Some assets followed. But the wave that everyone anticipated never arrived at the scale or speed that the market expected. The reasons were structural and, in retrospect, predictable.\n\nUBS moved quickly to implement retention packages for front-office talent it wanted to keep. The uncertainty of the integration paradoxically suppressed natural attrition: bankers who might have tested the market in a normal year chose to wait for clarity on their role, their team, their client book classification. People were staying put not out of loyalty, but out of paralysis. When your institution is being reassembled around you, the rational move is often to wait and see whether you are inside or outside the new structure.\n\nThe result is three years of suspended animation for thousands of private bankers in Switzerland. Three years of client conversations that began with reassurance and continued with uncertainty. Three years of competitors who wanted these bankers but could not pry them loose from a bank that had not yet decided what to do with them.\n\nThat period is ending.\n\nThe timing matters in a way that is specific to private banking and rarely discussed in the coverage of this integration. The UHNW client migration, the most senior, most relationship-sensitive, most portable tier of the former Credit Suisse wealth book, was the last to be completed. Reuters reported in late 2025 that UBS had delayed the transfer of some ultra-high-net-worth clients after earlier transfers of less affluent segments revealed operational issues. The delay was prudent. These are the clients where one bad conversation, one system error, one week of not knowing who to call, can cost the bank the relationship permanently.\n\nBut consider the sequence from the perspective of a senior Credit Suisse private banker who survived the integration, kept their book broadly intact through the transition, and has spent three years telling clients that the platform migration will be smooth and that everything will be fine. That banker\'s clients have just, finally, landed on the new system. The relationship is at its most sensitive. The client is watching to see whether the reassurances were warranted.\n\nAnd now comes H2 2026. The job cuts. The restructuring. The moment that UBS reaches for the headcount reduction it has been deferring since 2023.\n\nWhat happens to the client relationship when the banker who nursed them through three years of uncertainty disappears in a restructuring wave six weeks after the platform migration? What does "better than expected retention" look like when measured not against Q1 2026 but against Q4 2026, once the cuts have landed and the banker is gone?\n\nI have been asked this question, in various forms, by senior bankers across Geneva and Zurich throughout this integration. The honest answer is that nobody knows yet. The client migration data that UBS is reporting with quiet satisfaction today is a snapshot taken before the most disruptive personnel changes have occurred. The real retention test has not started.\n\nFor the market around UBS, the question now is whether what did not happen in 2023 happens instead in 2026, and on what terms.\n\nThe dynamics are different. In 2023, a banker leaving UBS in the immediate aftermath of the rescue carried a story: involuntary redundancy, merger disruption, no fault attached. The market understood and the conversations were straightforward. In 2026, a banker leaving UBS three years into the integration carries a more complicated narrative. Were they pushed? Did they choose to go? What does it say about their performance over the integration period that they are only now exiting? These are the questions that a sophisticated hiring team at a competitor will ask, and they require honest answers.\n\nFor candidates, the non-compete and non-solicitation landscape has also evolved since 2023. Swiss banking employment agreements have not gotten looser in three years. A banker who signed a retention package in 2023 or 2024 may now be unwinding deferred compensation structures at the same moment they are trying to negotiate a move. The mathematics of leaving are more complex than they were.\n\nAnd for clients, the experience of a third disruption, first the Credit Suisse crisis, then the UBS takeover, now a restructuring exit by the banker they kept faith with, is genuinely different from the disruption of 2023. Some will absorb it. Others will use it as the moment to diversify custody, restructure their banking relationships, or move to an EAM structure they have been contemplating for years. The client movement that the Swiss private banking market has been anticipating since March 2023 may finally arrive, three years delayed, and concentrated into a much shorter window.\n\nThe beneficiaries are likely to be the same institutions that were watching in 2023: the mid-sized Swiss private banks with genuine UHNW capability, the EAM sector, and the international platforms that have been building out their Swiss offerings precisely in anticipation of this moment. What changes is the urgency on both sides. Bankers who spent three years waiting now have a deadline. Competitors who spent three years waiting now have a window that will not stay open indefinitely.\n\nThere is a phrase that has appeared in nearly every UBS communication about the Credit Suisse integration since 2023: better than expected. Client retention: better than expected. Cost savings: on track, better than expected. It is the language of a bank that has been managing investor confidence through an extraordinarily complex and public three-year process, and that management has largely worked.\n\nWhat it has also done is create a gap between the official narrative and the private banking reality on the ground. In twenty years of placing senior bankers across Geneva, Zurich, [London](/en/markets/london), [Dubai](/en/markets/dubai) and [Singapore](/en/markets/singapore), I cannot recall a period in which so many excellent professionals have spent so long in professional suspension, unable to move freely, telling their clients one thing and privately thinking another.\n\nThe integration is nearly complete. The systems are aligned. The client accounts have moved. UBS is reporting strong profits and will substantially finish this process by year end. All of this is true.\n\nBut for the private bankers still inside the institution as H2 2026 begins, and for the clients they have been managing through three years of disruption, the last wave of this integration is the one that will actually determine what the story meant. Not for the shareholders. For the people.\n\nThat part has not been written yet.\n\nGil M. Chalem, Managing Partner, Executive Partners`,\n  },\n\n  {\n    slug: "switzerland-running-out-banks",\n    ogImage: "/og-articles/og-switzerland-running-out-banks.jpg",\n    title: "Switzerland Is Running Out of Banks",\n    seoTitle: "Switzerland Is Running Out of Private Banks — What the Consolidation Means",\n    seoDescription: "Swiss private banks are consolidating faster than at any point since 2008. The count is shrinking, the platforms are merging, and the talent implications are significant.",\n    date: "2026-05-05",\n    markets: ["CH", "UK", "UAE", "ASIA"],\n    summary: "Why that should worry the people who run them and not the people who own them. Swiss private banking is consolidating at a pace not seen since the 1970s — and the franchise walks out of the building every evening at six.",\n    linkedinUrl: "https://www.linkedin.com/pulse/switzerland-running-out-banks-gil-m-chalem--5lyse/",\n    featured: true,\n    engagementScore: 95,\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    keywords: ["Swiss private banking consolidation", "FINMA licence", "private bank M&A 2026", "Swiss banking talent shortage"],\n    body: `Three hundred and twenty-six. That was the number of licensed banks in Switzerland in 1987. Today, the figure stands at roughly two hundred and thirty-seven across the entire banking system, of which approximately ninety-five are FINMA-authorised private banks. KPMG, in its most recent industry outlook, projects the Swiss private banking population will fall to fifty institutions or fewer within the decade. Fifteen to twenty percent of remaining boutiques those managing less than five billion francs are expected to seek a merger partner or an exit by the end of 2026 alone.\n\nThis is the story everyone in the industry is half-aware of and almost nobody is willing to talk about with the candour it deserves. The Swiss private banking landscape is consolidating at a pace not seen since the 1970s. The conventional reading is that this is a slow-motion tragedy for the smaller institutions and a long-running tailwind for the larger ones. That reading is partially correct and almost entirely beside the point.\n\nThe point, the one I make to candidates and clients in equal measure, is this: consolidation does not redistribute talent. It concentrates it. And in private banking, the people who own the banks are not the people who own the franchise. The franchise is the senior relationship manager, and the relationship manager has never been more valuable, more scarce, or more carefully fought over than today.\n\n## The arithmetic of the squeeze\n\nTo understand why Switzerland is shedding banks at this pace, follow the cost stack. The OECD Pillar Two global minimum tax, in force since January 2024, has compressed net margins for Swiss private banks by between two and three hundred basis points. The revised Banking Act, implementing the Basel III finalisation provisions, requires mid-sized Zurich private banks to hold an additional two to three billion francs in Tier 1 capital. UBS alone has been required to lock up an extra fifteen billion francs in loss-absorbing capacity by the end of 2026. The combined effect of these regulatory layers, on top of the standing pressure from the global minimum tax, is to grind margins on every franc of assets under management lower than at any point in the modern history of Swiss private banking.\n\nThen there is technology. Swiss private banks collectively allocated roughly four point eight billion francs to technology investment in 2024, with Zurich institutions absorbing about sixty percent of that spending. A boutique with three billion francs of assets under management, generating perhaps thirty million in annual revenue, simply cannot fund the platform investment, the cybersecurity remediation, the compliance technology stack, and the AI-driven advisor tooling that the larger institutions now deploy as a matter of course. The cost of running a credible private bank has moved structurally above the revenue capacity of the small ones. That gap is what is driving the consolidation, and it is not closing.\n\nJulius Baer\'s quiet decision in December 2025 to issue notices to clients below its minimum relationship threshold top up or exit was the visible end of a much deeper repositioning across the industry. Below CHF 500,000 of investable assets, the fee income from custody, management, and transactions does not cover the cost of a relationship manager. Below CHF 1 million, it does not justify a senior one. The consolidation we are watching is not just bank-on-bank. It is the simultaneous shedding of every client whose economics no longer work. The industry is concentrating at both ends at once.\n\n## The deals that are happening\n\nThe transactions of the last eighteen months map this dynamic with unusual precision.\n\nIn mid-2025, Gonet completed its acquisition of ONE Swiss Bank, creating a consolidated [Geneva](/en/markets/geneva)-[Zurich private banking](/en/markets/zurich) group operating under the Gonet brand. Two months later, in July 2025, Group Banque Richelieu owned by the Beirut-based Société Générale de Banque au Liban completed the acquisition of Kaleido Private Bank in Zurich, previously controlled by the Baltic group Citadele, and rebranded it Banque Richelieu Switzerland. The transaction brought Richelieu\'s group AUM to roughly ten billion euros.\n\nMost strikingly, in 2025 EFG International acquired the share capital of Cité Gestion SA, the Geneva-based independent private bank, in what KPMG called the largest Swiss private-banking deal in more than a decade. The strategic rationale, in the words of Christophe Utelli, then-CEO of Cité Gestion, was to expand international reach, client segments, product offering, and technology capabilities exactly the four cost stacks a sub-five-billion boutique cannot fund alone. EFG, for its part, ended 2025 with record assets under management of one hundred and eighty-five billion francs, net new assets of eleven point three billion at a six point eight percent annualised growth rate, and a record IFRS net profit of three hundred and twenty-five million francs. The acquirer is not buying because it is desperate. It is buying because it can.\n\nThe cautionary counterpoint is MBaer Merchant Bank. FINMA revoked the bank\'s licence on 6 February 2026, with the liquidation order becoming legally binding on 27 February. Three weeks later, on 26 February, the US Treasury\'s FinCEN proposed naming MBaer a primary money laundering concern under Section 311 of the USA PATRIOT Act, alleging that the bank had funnelled over one hundred million dollars through the US financial system on behalf of actors linked to Iran, Russia, and Venezuela. MBaer held four point nine billion francs in client assets and roughly seven hundred client relationships at the moment its licence was revoked. In the consolidation cycle that has just begun, there are buyers, there are sellers, and there are institutions that simply disappear. Investors and clients should be clear-eyed about which category their counterparty sits in.\n\n## The talent paradox no one expected\n\nThe intuitive expectation, when an industry consolidates this aggressively, is that it should release talent into the market. Bankers leave their absorbed institutions. Compensation falls as supply outstrips demand. Hiring becomes easier. The recruiter\'s life becomes simpler.\n\nThe opposite is true. Senior relationship manager searches that I and my peers used to close in four months before the pandemic now routinely take eight to eleven. Time-to-fill for executive private banking roles in Zurich has stretched from sixty-eight days to ninety-four days in a single year. Compensation for senior bankers in Zurich and Geneva has continued to rise, with signing bonuses for [portable book](/en/portability)s in the order of forty percent of base salary now well within the normal range even as institution-level profitability across the industry has compressed.\n\nThe mechanism is straightforward once you sit with it. The UBS-Credit Suisse integration, far from disgorging talent, consumed it. UBS retained roughly twelve thousand headquarters staff in Zurich and absorbed the former Credit Suisse private banking operations across Paradeplatz and Oerlikon, principally to prevent client attrition during the integration. The professionals who do leave consolidating institutions tend to be operations staff, generalists, and junior advisors. The senior relationship managers with established UHNW client books the only people who actually move the franchise economics are precisely the people the acquiring institutions move heaven and earth to retain.\n\nThe numbers underwrite this logic. A relationship manager with a CHF 2 billion client book represents, depending on margin assumptions, somewhere between fifteen and twenty-five million francs of recurring annual revenue. The cost of losing that book to a competitor, factoring in client attrition during the transition, dwarfs the cost of a forty percent signing bonus or a multi-year retention package. Institution-level economics may be deteriorating. Individual senior banker economics, particularly for those with portable AUM, are improving on every dimension that matters: scarcity, leverage, optionality, and price.\n\nThis is the paradox: the more banks disappear, the more valuable each remaining senior banker becomes. Consolidation does not solve the talent shortage. It deepens it.\n\n## Where Geneva and Zurich now sit\n\nThere is a final dimension to the current moment that deserves attention, because it cuts across the consolidation story in a way most analysts have not yet fully appreciated.\n\nFor three years, the dominant talent corridor in private banking ran from Geneva and Zurich to Dubai. Switzerland lost roughly forty-five experienced private banking professionals to the UAE in 2023 and 2024 alone, drawn by zero personal income tax, faster onboarding, and proximity to the new wave of UHNW migration out of Russia, the UK, [Hong Kong](/en/markets/hong-kong), and parts of South Asia. Swiss banks responded by accelerating their [DIFC](/en/markets/dubai) and ADGM presences. The narrative was that the Gulf was the new Geneva. For a moment, it was not entirely wrong.\n\nThat corridor is now reversing. The US-Israeli air campaign against Iran, the partial closure of the Strait of Hormuz, and the missile and drone attacks on UAE, Bahraini, Qatari, Kuwaiti, and Jordanian targets have done in three months what no marketing campaign by Swiss banks could have done in three years. Bloomberg has reported a wave of Asian families actively reducing their UAE exposure and exploring Hong Kong and [Singapore](/en/markets/singapore) as alternatives. Wall Street firms Goldman Sachs, Morgan Stanley, Citigroup have offered Gulf-based staff the option to relocate temporarily. The hedge fund Millennium is evaluating Jersey and other low-tax jurisdictions for transfers out of Dubai. The premium that Swiss private banking has always charged for neutrality, regulatory stability, and physical distance from any active theatre of war has not been this commercially valuable since 2022.\n\nWhat this means for the consolidation cycle is straightforward. The institutions that survive the next eighteen months will be the ones positioned to absorb a returning wave of UHNW relationship books Asian, Russian-CIS, Levantine, Israeli that were until very recently being booked in Dubai. That capacity exists at the consolidating mid-tier: EFG post-Cité Gestion, UBP, Mirabaud, Edmond de Rothschild, J. Safra Sarasin, Bergos. It does not exist at the boutiques sub-five-billion. It exists at UBS, but at a scale that makes UHNW relationship attention a structural problem rather than a structural opportunity. The middle, in other words, is winning.\n\n## What this means for the people who run banks\n\nThree implications matter for the practitioners reading this newsletter.\n\nFirst, for relationship managers sitting in boutiques below five billion francs of assets, the next eighteen months are asymmetric. There are essentially two outcomes. Either your institution becomes a target, in which case the acquirer will move to retain you with a package designed to keep your book in place and the leverage you have at that moment is the highest it will ever be. Or your institution slowly contracts, sheds clients quietly, and at some point in 2027 or 2028 the difficult conversation arrives. The decision worth making today, calmly and on your own timing rather than under duress, is which of those two scenarios you are in. Boutique RMs who wait passively for the merger to find them will negotiate from a worse position than those who have explored the market in advance.\n\nSecond, for senior bank leadership, the strategic question is no longer whether to participate in the consolidation. The question is which side you are on. Acquirers are extending their distribution, market coverage, and technology platforms by buying. Targets are recognising they cannot fund the cost stack and are preserving optionality by negotiating from strength rather than from compliance with FINMA. The institutions that will fare worst over the next thirty-six months are those that have decided to do neither to neither acquire nor be acquired, but to grind through organic growth in a market where organic growth at sub-scale is mathematically a losing proposition. That posture is not a strategy. It is a stay of execution.\n\nThird, and this is where my professional bias is most explicit, the institutions that will win the talent war over the next eighteen months are the ones that go after individuals proactively rather than waiting for CVs to arrive. The senior relationship manager with a portable book of one billion francs and above is not on the open market. They will not respond to a job posting. They are not visible to a generalist HR function. They are reachable only through targeted, confidential, peer-level outreach and they are now being approached, simultaneously, by acquiring banks with retention packages, by mid-tier institutions with growth ambitions, by single- and multi-family offices building out, and by EAM platforms with FINMA licences in hand. The people who matter have never had more options. The institutions that compete for them have to compete on substance: brand, platform, governance, succession path for the book, and the quality of the conversation about what private banking will look like in five years. The signing bonus is the floor. It is no longer the ceiling.\n\n## The number that matters\n\nThree hundred and twenty-six in 1987. Roughly ninety-five today. Possibly fifty by 2030.\n\nThe simplest reading of those numbers is that Swiss private banking is shrinking. The more accurate reading is that it is concentrating, and that concentration is widening sharply the gap between the institutions that matter and the institutions that are gradually being managed out of existence. That gap, more than any other factor, is what determines where the careers, the AUM, and the next decade of franchise value will sit.\n\nThe senior relationship manager who reads this and concludes that scarcity is on their side is correct. The institution that reads this and concludes it must move now, decisively, on both its M&A posture and its talent strategy is also correct. The boutique owner who reads this and waits another year to have the conversation will discover, when they finally have it, that the buyers have moved on, the bankers have moved on, and the option to be part of the consolidation rather than collateral damage from it has quietly closed.\n\nIn private banking, the people who own the banks are not the people who own the franchise. The franchise walks out of the building every evening at six. Where it walks back in tomorrow morning is the only question that actually matters.`,\n  },\n  {\n    slug: "wall-street-7000-pump-5",\n    ogImage: "/og-articles/og-wall-street-7000-pump-5.jpg",\n    title: "When Wall Street Hits 7,000 and the Pump Hits $5",\n    date: "2026-05-04",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "The two wars your clients are living through and why the decoupling will not last. The S&P at 7,000 is the loudest financial narrative in the world right now. The pump at five dollars is the quietest. They are both telling the truth about the same war.",\n    linkedinUrl: "https://www.linkedin.com/pulse/when-wall-street-hits-7000-pump-5-gil-m-chalem--ssque/",\n    featured: true,\n    engagementScore: 94,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: ["geopolitical risk private banking", "oil price wealth management", "Iran Hormuz private banking", "S&P 7000 client portfolio"],\n    body: `On the morning of 16 April 2026, the S&P 500 closed above 7,000 for the first time in history. Eleven percent above its end-of-March nadir. The Nasdaq punched through 24,000.\n\nThat same morning, the average price of a gallon of gasoline in California crossed five dollars. Brent crude was trading north of one hundred and ten dollars a barrel. Iran\'s blockade of the Strait of Hormuz, through which roughly twenty percent of the world\'s seaborne oil passes, was still in force.\n\nTwo screens. Two stories. Same war.\n\nThis is the most important fact about the financial markets in 2026, and almost nobody in private banking is sitting their clients down to explain it. The equity indices and the real economy have decoupled to a degree we have not seen since the early stages of the pandemic. One of those stories is wrong. Eventually, they reconcile. The job of any serious wealth manager between now and that reconciliation is to make sure their clients are not standing on the wrong side of it when it happens.\n\n## What the market is pricing\n\nOperation Epic Fury, the joint US-Israeli air campaign against Iran, began on 28 February 2026. Within days Iran had retaliated against US bases across the Gulf, struck Saudi and Qatari energy infrastructure, and shut down tanker traffic through Hormuz. The World Bank now describes the resulting disruption as the largest oil supply shock on record, with an initial reduction in global supply of around ten million barrels per day.\n\nThe S&P 500 fell nine percent in March. By 16 April it had not only recovered, it had set new all-time highs. Three forces are propping up the indices, and all three are fragile.\n\nThe first is concentration. Technology and AI-related names now account for roughly half of the S&P 500\'s total market capitalisation, and as Mark Zandi put it bluntly to CNBC, those stocks run on their own dynamic independent of anything, including the war in Iran. When fifty percent of an index is essentially a bet on AI capex, the index becomes a bet on AI capex. The second is earnings. Roughly nine out of every ten S&P 500 companies that have reported first-quarter results have beaten estimates, with aggregate EPS tracking thirteen percent above the year-ago quarter. The third, and the most dangerous, is what traders have named the TACO trade. Trump Always Chickens Out. The thesis is that if oil stays elevated long enough to threaten US gasoline at the pump, the President will pivot, declare victory, and accept whatever ceasefire is on offer. Markets are not pricing the war. They are pricing its ending.\n\nThat narrative may prove right. But it is a narrative that a great deal of capital is now standing on, and the moment it cracks, the move down will be sharp.\n\n## What the pump is pricing\n\nNow look at the other screen. The World Bank\'s April Commodity Markets Outlook forecasts a twenty-four percent surge in energy prices in 2026, the largest annual increase since Russia\'s invasion of Ukraine. Brent is now expected to average eighty-six dollars a barrel for the year, with a stress scenario of one hundred and fifteen if Hormuz disruptions extend. The IMF cut its 2026 global growth forecast to 3.1 percent, lifted headline inflation to 4.4 percent, and cut the eurozone forecast from 1.4 to 1.1 percent. Its severe scenario has global growth falling to two percent.\n\nThe geopolitical multiplier matters here. The same World Bank report finds that during conflict periods, oil price volatility roughly doubles, and a one percent decline in global oil production driven by geopolitical risk pushes prices up an average of eleven and a half percent. Precious metals are forecast to rise forty-two percent in 2026 as safe-haven demand surges. None of these are the price signals of a market that believes the war is nearly over.\n\nSovereign credit tells the same story. The yield on the ten-year US Treasury has moved from 3.97 percent in late February to 4.25 percent today. Three Gulf states are reviewing how they deploy the roughly five trillion dollars sitting in their sovereign wealth funds. JPMorgan has cut its 2026 non-oil growth forecast for the GCC by 1.2 percentage points, with the UAE taking a 2.3 point downgrade the steepest in the region.\n\n## The ripple no chart shows\n\nThis is where the abstraction becomes personal. The S&P at 7,000 is a number on a screen. The pump price is a number on a billboard, paid in cash, every week, by every household, every small business, every logistics operator, every airline, every farm.\n\nUK headline inflation has jumped to 3.3 percent on surging fuel prices. Germany\'s government has stepped in to stop service stations raising pump prices more than once a day. Inflation in developing economies is now projected at 5.1 percent for 2026, a full percentage point higher than was expected before the war. The geographic asymmetry is sharp: China, India, Japan, and South Korea together account for roughly seventy-five percent of the oil and fifty-nine percent of the LNG that flows through Hormuz. Asia is paying most of this bill.\n\nAt the household level, the arithmetic is brutal. The kind of family our industry serves at the upper-mass-affluent end was already contending with a cumulative twenty-five percent rise in CPI since 2020. Add four percent inflation in 2026, with food and energy doing most of the work, and the gap between nominal portfolio gains and real purchasing power widens to a degree most clients have not consciously processed. Their statements show green numbers. Their lives feel poorer. That tension will surface in conversations with their bankers all year.\n\n## What this means for our clients, and our industry\n\nThree observations matter. First, the client base is splitting along an uncomfortable line. Tech wealth founders, partners at venture funds, executives sitting on stock comp at Alphabet or Nvidia is having one of its strongest years on record, and is essentially insulated from the war\'s mechanics. Energy-importing wealth European entrepreneurs, Asian industrialists, anyone whose underlying business has fuel, freight, or fertiliser as a meaningful input is not. The first cohort wants more growth exposure. The second is asking for capital preservation, hedges, gold, short-duration. The relationship managers who can read which client they have in front of them, and resist the temptation to give every client the same model portfolio because the index is at a high, will outperform their peers materially.\n\nSecond, the Gulf wealth corridor is cooling fast. Bloomberg has reported a wave of Asian families actively reducing UAE exposure and exploring [Hong Kong](/en/markets/hong-kong) and [Singapore](/en/markets/singapore) as alternatives. Goldman, Morgan Stanley, and Citigroup have given Gulf-based staff the option to relocate temporarily. Millennium is evaluating Jersey for transfers out of Dubai. For Swiss banks who have invested heavily in their [DIFC](/en/markets/dubai) franchises over the past three years, this is a moment to look hard at booking centre strategy. For [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich), it may be a moment of opportunity. The Swiss private banking proposition neutrality, regulatory stability, distance from any active theatre of war has not been this commercially valuable since 2022.\n\nThird, this is the kind of macro environment in which the truly senior relationship manager earns the seven-figure compensation that the rest of the industry resents. Anyone can manage a client book in a bull market with an obvious narrative. The clients with two-, three-, five-hundred million in investable assets are not asking their bankers for a market view in late April 2026. They are asking whether the person sitting across the desk has thought hard about the divergence between the indices and the real economy, has a position on which side wins, and can articulate a portfolio that reflects that conviction.\n\n## How it ends\n\nEventually the two stories reconcile. Either the equity market is right a ceasefire holds, Hormuz reopens, oil falls back below seventy by autumn, the indices grind higher into year-end or the oil market is right, the conflict drags into the second half, energy prices stay elevated, the IMF\'s severe scenario activates, and the corporate earnings underwriting this rally start being revised down quarter by quarter. In that second scenario, the indices give back not nine percent but twenty-five or thirty.\n\nI do not know which wins. I am not paid to. I am paid to remind the people who run this industry that both are live, that current pricing favours the first by a margin that does not reflect the genuine probability of the second, and that the role of a serious private banker in late April 2026 is to look every client in the eye and ask: if the second story turns out to be the right one, can your portfolio absorb it?\n\nThe S&P at 7,000 is the loudest financial narrative in the world right now. The pump at five dollars is the quietest. They are both telling the truth about the same war. Only one of them can be telling the whole truth.`,\n  },\n  {\n    slug: "americans-already-here",\n    ogImage: "/og-articles/og-americans-already-here.jpg",\n    title: "The Americans Are Already Here",\n    date: "2026-04-28",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "What the UBS headlines are obscuring: the US wealth playbook has become the dominant model in Swiss private banking, arriving through three different doors — JP Morgan, Goldman Sachs, and Julius Baer\'s new CEO.",\n    linkedinUrl: "https://www.linkedin.com/pulse/americans-already-here-gil-m-chalem--ts3we/",\n    featured: true,\n    engagementScore: 93,\n    pillar: "P1",\n    subTheme: "Positioning",\n    keywords: ["US banks Switzerland private banking", "JP Morgan Swiss private banking", "Goldman Sachs Switzerland", "Julius Baer Bollinger strategy"],\n    body: `The Swiss financial press has spent most of the past eighteen months writing about UBS. The capital buffer debate, the CEO succession, the unwinding of Credit Suisse legacy positions: these are real stories, and they matter. They also absorb almost all the oxygen in the room. Meanwhile, in quieter corners of [Zurich](/en/markets/zurich) and [Geneva](/en/markets/geneva), a structural shift has been taking place that will matter more to Swiss private banking over the next five years than the final shape of UBS\'s capital ratio.\n\nThe American wealth model has arrived. Not as a distant threat, not as a future scenario, but as a present reality operating through three distinct channels. And for anyone running a Swiss private bank below the UBS scale, or sitting across from a Relationship Manager with a [portable book](/en/portability) of entrepreneurs, the implications are already measurable.\n\n## The first door: JP Morgan\n\nThe first door is the most visible. JP Morgan\'s Swiss private banking business reached USD 55.6 billion in assets under management at the end of 2024, and grew close to twenty percent in 2025 alone, with roughly half of that coming from net new money rather than market appreciation. The bank has doubled its Swiss AUM between 2020 and 2024, expanded its Zurich and Geneva headcount by thirty percent in 2025, and stated publicly through Matteo Gianini, its head of Swiss private banking, that it intends to double the business again by 2030 and more than double its headcount in the process. This is not a boutique experiment. It is an institutional build, funded and measured, with clarity about what it wants: the ultra-high-net-worth segment in Switzerland, with a strong tilt toward domestic Swiss clients and entrepreneurial wealth linked to the investment bank\'s global coverage.\n\n## The second door: Goldman Sachs\n\nThe second door is narrower but arguably more strategic. Goldman Sachs restarted its Swiss private banking presence in 2019 after a three-year retreat, and in the years since has executed a deliberate UHNW-only strategy targeting clients with at least thirty million dollars of bankable assets. Under Stefan Bollinger, then co-head of Goldman\'s European wealth business and its Swiss country coordinator, the bank poached Dominique Wohnlich from Lombard Odier, Alain Krueger and Marc Mandosse from UBS, respectively the head and deputy of UBS\'s ultra-high-net-worth and family office business in French-speaking Switzerland, and Gabriel Aractingi from UBS\'s Middle East and North Africa desk in Geneva. Bollinger\'s stated ambition was to hire as many as thirty private bankers in Switzerland, underwritten by a hard-edged thesis: serve entrepreneurs and business owners in the window immediately after liquidity events, such as private equity disposals or initial public offerings, with an advisory proposition tightly integrated with Goldman\'s investment banking platform. In January 2026, Goldman reorganised its global wealth management leadership under new co-heads Nishi Somaiya and John Mallory, signalling that the build is now a structural commitment rather than an experimental tilt.\n\n## The third door: the playbook from within\n\nThe third door is the one most people miss, and in some ways the most consequential. In January 2025, Bollinger left Goldman to become CEO of Julius Baer. What this means in practice is that the American playbook has not only walked into Switzerland through two US-headquartered firms, it has also walked into one of the Swiss pure-play houses from the inside. Within twenty weeks of taking over, Bollinger had restructured Julius Baer\'s executive board, cut hundreds of jobs, established a new Global Wealth Management Committee and a Global Products and Solutions unit, created a dedicated UHNW Competence Center, exited the Brazil onshore market, entered Italy onshore, and set out a 2026 to 2028 strategic cycle with targets of four to five percent net new money growth, an adjusted cost-to-income ratio below sixty-seven percent, and at least thirty percent adjusted return on CET1 capital. The financial metrics are conventional. The strategic lens is not. It is the lens Bollinger spent twenty years building at Goldman: segment the book ruthlessly, concentrate on UHNW where advisory depth is paid for, cut what does not scale, and wire the platform to whatever investment banking or alternatives engine sits next door.\n\n## Three doors, one playbook\n\nThree doors, one playbook. The playbook is recognisable once you name it. It prioritises clients with bankable assets above fifty million Swiss francs, or total wealth above 250 million, as Julius Baer\'s new UHNW definition makes explicit. It ties the advisory offering to deal flow that a pure wealth manager cannot replicate on its own: private equity co-investments, pre-IPO access, structured financing against concentrated positions, and the kind of family-office-adjacent advisory that entrepreneurs now expect. It enforces cost discipline at the back and middle office while reallocating budget to front-line advisory capacity and technology. And it accepts, without sentimentality, that the traditional Swiss model of serving every segment with the same relationship architecture no longer clears the cost of capital on either end of the book.\n\nWhich raises a question that the Swiss mid-tier has not fully answered yet. What happens to a bank that is neither UBS nor a US global, neither a pure UHNW boutique nor a family-office offering, and whose comparative advantage has historically been a version of discretion, continuity and relationship depth that the new playbook treats as a given rather than a differentiator?\n\nThe candid answer, based on the conversations I have with senior bankers and HR heads across Geneva, Zurich and Lugano every week, is that the squeeze is already visible in three places.\n\nIt is visible in the revenue mix. Bankers who used to generate a blended return of ninety to one hundred and ten basis points on a mixed HNW and UHNW book are watching the UHNW portion of that book become more demanding and less margin-generous at exactly the moment when their institution needs the UHNW tier to subsidise the rest. The US-model firms are happy to price advisory at a premium for genuine complexity, and to decline the rest of the client\'s wallet if it does not fit.\n\nIt is visible in recruitment economics. The deals being written for UHNW-facing senior bankers with genuinely portable entrepreneurial books have moved in the last twenty-four months. Multi-year guaranteed packages linked to gross revenue rather than a percentage of AUM, enhanced cash at signing, and structured retention vehicles that back-load payment to year three or four are now the norm at the top of the market. For the Swiss mid-tier, this is not a story they can match one for one, and it is not always desirable to try. But it is a story they have to price into their retention plans, because the bankers most targeted are also the ones most difficult to replace.\n\nIt is visible in client segmentation discipline. The US-model firms are comfortable saying no to sub-UHNW relationships that used to feel like a natural part of the Swiss book. Every banker who has moved from a traditional Swiss employer to one of the US houses in the past two years describes the same experience: learning to let go of clients below the threshold, and learning that the economics actually improve when they do. The mid-tier Swiss houses, by contrast, are still carrying long tails of historical relationships that made sense twenty years ago, when booking centre fees and retrocessions disguised the true cost to serve.\n\n## What is not going away\n\nNone of this is an argument that the Swiss model is finished. It is not. The independence, the booking centre neutrality, the multi-generational continuity, the ability to serve a Greek shipping family and an Italian industrial family from the same chair without conflict, these things continue to matter and will continue to command a premium. Lombard Odier, Pictet, UBP, Bordier and the other leading Geneva houses have genuine edge in segments the US banks cannot fully reach: CIS and CEE offshore, LATAM booked out of Switzerland, certain MENA structures, and the family-office-adjacent advisory for families that specifically do not want a US-licensed counterparty. The mid-cap Zurich and Basel houses have their own defensible books in German-speaking Europe and Israel. None of that is going away.\n\nWhat is going away is the assumption that competition comes principally from other Swiss banks of similar size. The competitive set has changed. The benchmark for what an UHNW client expects has been rewritten by firms that think about wealth management as a scalable, platform-intensive, investment-banking-linked business rather than as a trade that begins and ends with the Relationship Manager.\n\nFor senior bankers thinking about where they spend the next five years, the question is no longer simply which Swiss house fits my book best. It is which platform matches the kind of client I actually want to build the rest of my career with. The answers are divergent. Some will rightly conclude that an independent Swiss boutique with a clear segment specialisation gives them more autonomy and more upside than a US global, where they would be one of fifty Managing-Director-grade bankers. Others, particularly those with entrepreneurial books tied to Swiss industry or to post-liquidity-event wealth, will find that the US model is exactly sized for what they do.\n\nFor the Swiss banks themselves, the strategic clarity required is uncomfortable but necessary. Pick a segment and staff it properly. Decide whether the bank is a UHNW house, an HNW house, or a niche market specialist, and align everything behind that choice, from hiring to technology spend to retention architecture. The middle position, the one that tried to be everything to everyone below the scale of a full-service global, is the position most exposed to the playbook imported through three doors over the last five years.\n\nThe headlines will keep being about UBS. That is understandable. UBS is the largest wealth manager in Europe, its capital debate is politically consequential and its leadership transitions are genuinely newsworthy. But for anyone actually running a private bank, sitting across from a senior banker considering a move, or trying to retain a UHNW book in 2026, the story worth watching is quieter and further down the league table. The Americans are already here. They came in through three different doors. And the playbook they brought with them has already become the default.`,\n  },\n\n  {\n    slug: "smoke-difc-dubai-private-banking-2026",\n    ogImage: "/og-articles/og-smoke-difc-dubai-private-banking-2026.jpg",\n    title: "Smoke Over the DIFC",\n    date: "2026-04-27",\n    engagementScore: 84,\n    summary: "Eight weeks in. A ceasefire that held for less than eight hours. And 537 intercepted ballistic missiles later — here is what we actually know about Dubai\'s future as a private banking hub.",\n    pillar: "P1",\n    subTheme: "Positioning",\n    linkedinUrl: "https://www.linkedin.com/pulse/smoke-over-difc-gil-m-chalem--d0lbe/",\n    markets: ["UAE", "ASIA", "CH"],\n    body: `Eight weeks in. A ceasefire that held for less than eight hours. And 537 intercepted ballistic missiles later — here is what we actually know about Dubai\'s future as a private banking hub.\n\nI wrote the first version of this article on the morning of April 17th, two weeks after a plume of black smoke rose over the Dubai International Financial Centre. At the time, the question was whether a single dramatic shock would change the calculus for the wealth management industry. Eight weeks later, the question has become something harder to dismiss: not what the first shock meant, but what sustained conflict has done to the assumptions on which an entire industry built itself.\n\nThe Scale of What Has Happened\n\nWhen I wrote first about the March 13 drone strike on the [DIFC](/en/markets/dubai), I described it as the morning the narrative changed. What I did not know then was that it was also the beginning of a campaign whose scale would dwarf anything we had seen in modern Gulf history.\n\nAs of April 9th, the UAE Ministry of Defence reported that its air defences had intercepted 537 ballistic missiles, 2,256 drones, and 26 cruise missiles launched from Iran since February 28th. Thirteen people have been killed and 224 injured — the majority foreign nationals and migrant workers. The Jebel Ali port, which accounts for approximately 36 percent of Dubai\'s GDP, has had operations repeatedly disrupted. The Fairmont The Palm on Palm Jumeirah took a direct Shahed drone strike. An Oracle cloud data centre in Dubai — home to banking infrastructure serving the entire region — was targeted by the IRGC on April 2nd. A Kuwaiti oil tanker carrying two million barrels of crude was set ablaze by an Iranian drone at Dubai Port, making headlines across the world.\n\nFor anyone working in private banking who was still telling themselves this was containable tail risk, that list deserves to sit on the page for a moment.\n\nThe Response Nobody Talks About\n\nThe DIFC has maintained its official posture of business as usual, and to be fair to its leadership, that posture is not entirely without substance. January 2026 showed 30 percent year-on-year registration growth before the conflict began. The DIFC\'s institutional infrastructure is real, its client base is deep, and its governor has been consistent in messaging resilience.\n\nBut two things happened in early April that tell a more honest story. First, the Dubai Financial Services Authority introduced time-limited relief measures covering licensing requirements, governance and staffing arrangements, regulatory reporting, and supervisory processes. The DFSA chief executive described these as "a bridge to the resumption of normal trading." Second, Dubai\'s broader government approved a AED 1 billion support package for its business sector, effective April 1st.\n\nRegulatory relief packages and emergency stimulus do not get introduced in markets where everything is functioning normally. They get introduced when the regulator needs to acknowledge, on the record, that something exceptional is happening. The DIFC is not collapsing. But the DFSA just told you, in formal regulatory language, that it is not operating as usual.\n\nThe Ceasefire That Wasn\'t\n\nOn April 8th, the United States and Iran agreed to a two-week ceasefire, mediated by Pakistan. Within hours, Iran had launched 35 drone attacks on the UAE alone. The ceasefire was violated before most bankers had booked their flights home.\n\nBloomberg reported that hours after the announcement, an executive from an Abu Dhabi fund booked the first available return flight. A private banker and a hedge fund trader told reporters they were waiting the two weeks out before committing. A Dubai-based finance professional said they were heading back regardless — not because the situation had resolved, but because they had concluded it was unlikely to resolve any time soon, and staying away indefinitely was not a career strategy.\n\nThat last response is the one I find most revealing. The question for the industry is no longer whether Dubai is dangerous. It clearly carries risk it did not carry eighteen months ago. The question is whether the people who built their careers and their client books there have any real alternative. For most of them, the answer is no. Which means the talent pool in Dubai right now is not running on conviction. It is running on inertia, residual commitment, and the absence of a clean exit.\n\nWhat the Information Crackdown Tells You\n\nThere is one development from the past eight weeks that has received far less attention in financial media than it deserves. The UAE government has aggressively restricted independent documentation of the conflict. Dubai Police issued warnings that sharing content contradicting official announcements could lead to imprisonment of at least two years and fines of no less than 200,000 dirhams. Three survivors of a drone strike on a residential tower in Creek Harbour were arrested after sending photos of their damaged home in private messages to reassure relatives they were safe.\n\nI am not making a geopolitical argument here. I am making a business one. Dubai\'s entire value proposition for international wealth management rests on three things: legal predictability, operational transparency, and the confidence of foreign capital. When a government begins arresting people for private messages, and when the financial media cannot independently verify the extent of infrastructure damage because showing the damage is a criminal act, you have introduced a variable that no due diligence framework was built to handle.\n\nThe Capital and the Talent\n\nThe capital flight signals have deepened and confirmed. Asian wealth lawyers in [Singapore](/en/markets/singapore) report continued enquiries, with several large transfers completed. Ryan Lin, a Singapore-based private wealth lawyer, confirmed that six or seven of his twenty Dubai-based clients contacted him about asset transfers, with three actively planning moves to Singapore.\n\nOn the talent side, hotel occupancy in Dubai has fallen 70 to 80 percent. More than 30,000 flights have been cancelled across the region since the conflict began. Around 250,000 short-term rental bookings were cancelled in March alone. The CNBC estimate of infrastructure and economic damage already stands at close to USD 60 billion.\n\nThis is not a story of Dubai failing. It is a story of Dubai absorbing a shock whose full cost has not yet been tallied.\n\nWhat I Am Telling Candidates and Clients Right Now\n\nI place senior private bankers. That is my job. And right now, every conversation I have about Dubai has a section that did not exist before February 28th.\n\nFor candidates considering a Dubai relocation: the opportunity remains real. The client base is not gone. The AUM has not evaporated. But the risk premium on that posting has changed, and any candidate who does not factor that into their negotiation — in terms of compensation structure, institutional backing, contract exit provisions, and the [portability](/en/portability) of their book if the situation deteriorates further — is not thinking clearly. I am advising candidates to treat Dubai today the way senior bankers treated Singapore in 2020: as a genuinely attractive market that requires a more explicit risk conversation than it did before.\n\nFor hiring managers in Dubai: the war for talent in the DIFC has structurally shifted. You are no longer competing only with [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), and Singapore for the same pool of qualified RMs. You are now competing with a perception problem that will take years to fade regardless of how the conflict resolves. Packages need to reflect that.\n\nThe smoke over the DIFC will clear. The question is whether the capital and the bankers come back with it.`,\n  },\n  {\n    slug: "bern-holds-line-ubs-swiss-capital-rules",\n    ogImage: "/og-articles/og-bern-holds-line-ubs-swiss-capital-rules.jpg",\n    title: "Bern Holds the Line",\n    date: "2026-04-23",\n    engagementScore: 81,\n    summary: "Inside yesterday\'s UBS capital rules verdict, and what every senior private banker watching from the inside should already be doing about it.",\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    linkedinUrl: "https://www.linkedin.com/pulse/bern-holds-line-gil-m-chalem--nudte/",\n    markets: ["CH", "UK"],\n    body: `Yesterday afternoon in Bern, Karin Keller-Sutter ended her press conference the way a politician ends one when she knows she has won. A journalist asked her when she planned to step down as Finance Minister. She answered that she liked to work. Then she walked off the stage.\n\nShe did not say the rules would not change. She did not say parliament would not push back. She did not say UBS would not fight. She said the rules are staying.\n\nStaying. Not negotiable. Not revisited. Staying.\n\nIf you are a senior private banker at UBS right now, that is the word that should be sitting on your desk this morning.\n\nWhat Actually Happened\n\nThe Federal Council did two things on Wednesday. It enacted its final Capital Adequacy Ordinance, which it had the unilateral power to impose without parliament. And it submitted the draft amendment to the Banking Act — which governs the far larger question of capital treatment for UBS\'s foreign subsidiaries — to parliament for debate. The first document is now law. The second is the fight that remains.\n\nOn the ordinance, Bern gave way on the details. Capitalised software will now amortise over no more than three years for regulatory capital purposes. On deferred tax assets, the Federal Council walked the original proposal back entirely and kept the treatment aligned with international standards. UBS\'s own statement put the net CET1 impact at approximately USD 4 billion. Below what the market was pricing. Well below the USD 10.8 billion hit analysts had feared.\n\nIf you read that as a retreat, you are reading it wrong.\n\nHere is what I see from my seat in [Geneva](/en/markets/geneva). Keller-Sutter conceded on the file she controlled alone, precisely so she could harden the file she needs parliament to pass. The Banking Act amendment requires UBS to fully back its foreign participations with Common Equity Tier 1 capital, up from the roughly 60 percent threshold in force today. UBS has publicly estimated the capital gap at approximately USD 22 billion. On that question, the government has not moved one centimetre.\n\nKeller-Sutter\'s words at the podium were plain. Switzerland must prevent any situation in which UBS has to be wound down. She declined to call any of this a Swiss Finish. She rejected the compromise proposal tabled by a cross-party group of parliamentarians, which would have allowed Additional Tier 1 instruments to cover up to half of the foreign subsidiaries requirement. The answer is on the public record. The answer is no.\n\nThe Choreography\n\nThis is textbook Bern. A government that intends to hold firm on a politically sensitive measure first clears away the easier complaints so it can isolate the core one. By giving UBS a win on the technicalities, the Federal Council has disarmed the bank\'s cleanest argument against the ordinance. What remains on the table is the question the state was never going to negotiate.\n\nUBS issued its formal response within hours. The word "extreme" appears. Substantive commentary is deferred to the first-quarter results on 29 April, which will be Sergio Ermotti\'s to deliver. Between now and then, UBS will do what it has done for two years: lobby, model, remind everyone who will listen that the balance sheet is twice the size of Swiss GDP.\n\nParliament begins its first closed-door debate on 4 May. Full debate follows in June. The legislative calendar is unlikely to close before the end of 2026. In that window, UBS will push hard for the AT1 compromise, for phased implementation, for anything that converts the 100 percent CET1 requirement into something less capital-expensive. Parliament will almost certainly dilute something. The question is what, and by how much, and whether any of it touches the principle.\n\nWhat This Means for You\n\nIf you are a senior UBS banker watching this unfold, the second-order consequences are already in your compensation file, whether or not you have opened it.\n\nColm Kelleher used his Basel AGM last week to do one thing unambiguously. He tied future share buybacks to the outcome of the capital rules fight. The USD 3 billion buyback planned for 2026 is now explicitly contingent on regulatory clarity. Share buybacks are the mechanism by which UBS delivers a meaningful fraction of senior compensation through equity grants. If buybacks shrink, the deferred portion of your pay shrinks with them.\n\nAnd succession is still frozen. Ermotti could now stay into the second half of 2027. Iqbal Khan runs Asia. Rob Karofsky runs the Americas. None of them has been anointed. The board is increasingly willing to look outside. The organisational chart that should be telling an ambitious senior banker where their career goes in 2028 is still not drawn.\n\nI have spent the last two years watching senior bankers at UBS tell me the same thing in different words. They are not unhappy. They are not angry. They are waiting. They are waiting for the capital rules to settle. They are waiting for succession to clarify.\n\nThe problem with waiting is that the rest of the market is not waiting.\n\nLombard Odier is recruiting. Pictet is recruiting. Julius Baer is recruiting. The EAMs are recruiting. The boutiques are recruiting. Morgan Stanley, JP Morgan Private Bank, Goldman Sachs Private Wealth Management — all of them are calling senior UBS bankers this week, using yesterday\'s news as the opening line. I know this because my phone has already rung.\n\nBern did not compromise yesterday. Bern sequenced. The Swiss state gave a narrow concession on the file it controlled alone in order to protect the wide principle it needs parliament to pass. The ones who are modelling are also taking calls. The ones who are not are still trusting that someone, somewhere, will eventually turn the lights on.\n\nIn my experience, that is not how this works.`,\n  },\n  {\n    slug: "10-billion-myth-swiss-private-banking-consolidation",\n    ogImage: "/og-articles/og-swiss-consolidation-10-billion-myth.jpg",\n    title: "The 10 Billion Myth",\n    date: "2026-04-21",\n    engagementScore: 83,\n    summary: "Why size is the wrong lens on Swiss private banking consolidation — and why the number that has taken on almost mythological status in the market is causing good bankers to make bad career decisions.",\n    pillar: "P1",\n    subTheme: "ScaleVsBoutique",\n    linkedinUrl: "https://www.linkedin.com/pulse/10-billion-myth-why-size-wrong-lens-swiss-private-gil-m-chalem--myq8e/",\n    markets: ["CH"],\n    body: `Every few weeks I have the same conversation with a senior banker who is thinking about moving. The question comes in different forms, but it is always fundamentally the same. Is my bank going to survive? Is the 3 billion franc house I joined six years ago going to be swallowed by a tier-two competitor? Is the 8 billion boutique I am looking at a real opportunity or a slow-motion liquidation?\n\nUnderneath all these questions sits a single number that has taken on almost mythological status in the Swiss market. Ten billion francs of assets under management. The line below which, according to industry consensus, a private bank cannot reasonably expect to be independent a decade from now.\n\nThe consensus is wrong. Not completely wrong. But wrong in a way that matters, because it is causing good bankers to make bad career decisions and good boards to reach for the wrong solutions.\n\nThe Consolidation Numbers Are Real. The Interpretation Is Not.\n\nThe headline figures are accurate. Switzerland had roughly 160 private banking institutions in 2010. By the start of 2024, the KPMG and University of St. Gallen annual study counted 85. By the end of 2025 the number is expected to fall below 80. The recent deal flow backs this up: J. Safra Sarasin acquired Saxo Bank in the largest Swiss private banking transaction in more than a decade. Union Bancaire Privée absorbed Société Générale Private Banking Switzerland. Gonet and ONE swiss bank completed their merger.\n\nSo far, so expected. The industry is shrinking. The narrative writes itself. Small banks are disappearing, therefore small banks cannot survive, therefore any institution below ten billion is a future casualty.\n\nThis is where the analysis stops for most observers, and where it should actually begin. Because the same KPMG study reached a conclusion that received almost no attention in the subsequent press coverage. After analysing geographic and product diversification across Swiss private banks over the 2015 to 2024 period, the researchers identified two distinct business models that delivered higher and sustainable profitability. Not one. Two.\n\nThe first model was the large bank with a significant international presence and comprehensive service offering. The second model — which is the one almost nobody is discussing publicly — was the smaller bank based only in Switzerland with a very focused service offering. Not a big bank. Not a national champion. A focused, semi-local, specialised boutique. Under 10 billion in many cases. And delivering sustainable profitability while the middle of the market consolidates around them.\n\nThe HSG finding is not an opinion piece or a sell-side research note. It is a ten-year dataset. And it confirms what anyone spending time inside these institutions already knows. Size is not the binding constraint. Clarity is.\n\nWhat Actually Kills a Private Bank Under 10 Billion\n\nIn my day-to-day work placing senior bankers, I see three failure patterns, and they appear together more often than separately.\n\nThe first is a cost-to-income ratio stuck above 80 percent. Only 31 percent of Swiss private banks achieved a return on equity above their cost of equity in 2024. Almost two-thirds of banks reported a worse cost-income ratio last year than the year before. A 3 billion franc boutique running at 65 percent cost-income is in a stronger position than a 15 billion franc institution running at 88 percent. The market has just not caught up with that observation yet.\n\nThe second pattern is positional ambiguity. When I read the public-facing materials of a private bank and cannot articulate in one sentence who their target client is, their next five years are going to be difficult. Half the mid-sized Swiss banks still describe themselves as providers of global wealth management to successful individuals and their families. This phrase means nothing. The boutiques that are thriving all pass the one-sentence test. Bergos is a German-speaking European family house. Reichmuth is a Swiss entrepreneur and family-office specialist with a partnership structure and no external shareholders. These institutions picked a lane and committed to it. Their size is not the point. Their identity is.\n\nThe third pattern is the inability to attract or retain genuinely senior bankers. A bank that cannot offer a clear platform proposition, cannot pay competitively because of a stretched cost base, and cannot articulate its next five years to a prospective Managing Director will lose its best people. Every bank I work with that has lost its senior bench over the past three years is, without exception, a bank with one or both of the first two problems.\n\nThe Implication for Senior Bankers\n\nIf you are a senior relationship manager inside an institution that does not demonstrate clarity of positioning, cost discipline, and a credible ability to attract and retain senior talent, the consolidation question is not academic. It is personal. The banks that score badly on all three attributes are the ones that will be sold, restructured, or quietly wound down over the next five years.\n\nThe useful question is not whether your employer will be independent in 2030. The useful question is whether your employer deserves to be. If the honest answer is no, the further question is whether you move now — on your own terms, with your book intact and your optionality at its peak — or whether you wait until the decision is made for you by a board you did not select.\n\nSwiss private banks under 10 billion francs of AUM will not disappear as a category. The undifferentiated ones will. The specialised, well-run and well-capitalised ones will perform better than the current consensus expects. Size is a weak predictor of survival. Clarity of positioning, cost discipline, and the ability to attract and retain genuinely senior bankers are the variables that actually determine the next five years.\n\nThe 10 billion myth is comforting because it is simple. The truth is more useful, and more demanding.`,\n  },\n  {\n    slug: "ubs-ceo-succession-private-banking-2026",\n    title: "The Bank That Can\'t Choose a CEO",\n    date: "2026-04-20",\n    engagementScore: 82,\n    summary: "UBS has just completed its best financial year since acquiring Credit Suisse. And yet it cannot name a successor to its own CEO. Here is what the leadership paralysis means for every senior private banker watching from the inside.",\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    linkedinUrl: "https://www.linkedin.com/pulse/bank-cant-choose-ceo-gil-m-chalem--g9qje/",\n    markets: ["CH", "UK", "US"],\n    body: `Two days ago, Colm Kelleher stood in front of shareholders at the St. Jakobshalle in Basel and said something remarkable. The Chairman of UBS, the world\'s largest wealth manager, told the Annual General Meeting that "key business decisions may soon become unavoidable." He described the Swiss government\'s proposed capital rules as a serious risk to the bank\'s business model. He ruled out shrinking the bank. He reaffirmed growth ambitions in Asia and the United States. And then he added, almost as an afterthought, that UBS wants to remain headquartered in Switzerland.\n\nWants to. Not will. Not intends to. Wants to.\n\nIf you are a senior private banker at UBS right now, you probably noticed the verb. The financial press ran the headline and moved on. But inside the machine, that choice of word is doing a lot of work.\n\nThe Succession Problem\n\nThe day before Kelleher\'s speech, Reuters reported that CEO Sergio Ermotti could remain in his post well into the second half of 2027. The reason is twofold. First, the board wants regulatory clarity before installing a new chief executive. Second, and this is the part that should concern you, no obvious internal successor has emerged. The board is increasingly open to hiring externally.\n\nThink about what that means for a moment. UBS has just completed its best financial year since acquiring Credit Suisse. Net profit of $7.8 billion. Assets under management crossing $7 trillion for the first time. A 22% dividend increase. And yet the bank cannot name a successor to its own CEO. Not because the results are bad. Because the regulatory ground beneath the institution is shifting so fundamentally that the identity of the next leader depends on where UBS will even be headquartered when that person takes the job.\n\nThe Capital Rules Standoff\n\nThe Swiss Federal Council has proposed requiring UBS to fully back its foreign subsidiaries with Common Equity Tier 1 capital. UBS has estimated this would require an additional $22 billion in capital, potentially pushing its CET1 minimum requirement to 17–19%, roughly 50% higher than what comparable banks face in the EU or the US. The bank has called the proposals extreme.\n\nAnd then there is the relocation question. Last November, the Financial Times reported that Kelleher had held private talks with US Treasury Secretary Scott Bessent about what a move to the United States would look like for UBS. Whether or not UBS ever actually moves its headquarters is beside the point. The fact that the conversation is happening at all tells you something about the institutional uncertainty at the very top.\n\nWhat the Paralysis Actually Means on the Ground\n\nWhen the CEO succession is frozen, everything below it freezes too. Not officially. Not in any memo. But in practice. Regional heads cannot commit to multi-year growth mandates because they do not know whether the next CEO will share the same strategic priorities. Hiring committees defer decisions on senior appointments because the reporting lines might change. Promotion tracks that were promised as part of the post-integration settlement get quietly pushed back.\n\nI hear this from UBS private bankers every week. Not all of them. Not even most of them. But the senior ones — the ones managing CHF 500 million or more, the ones who have options, the ones whose phones ring when competitors come calling. Those bankers are not panicking. They are doing something worse: they are waiting. And in this market, waiting is the most expensive thing a senior RM can do.\n\nBecause while UBS is paralysed at the top, the rest of the Swiss private banking market is moving. Lombard Odier has been systematically recruiting senior bankers across Asia, the UK, and Europe. Pictet continues to recruit selectively. Julius Baer has been expanding its RM headcount. The boutiques, the multi-family offices, the EAMs building under new FINMA licences: all of them are actively hiring. All of them are having the conversations that UBS is too distracted to have.\n\nIf UBS has to hold $22 billion in additional capital, that capital has a cost. The cost gets absorbed somewhere. It gets absorbed in smaller bonus pools, in reduced investment in technology and platform, in tighter hiring budgets. The $3 billion buyback planned for 2026 is already explicitly contingent on regulatory clarity. If that clarity does not come, the buyback gets cut, the share price suffers, and the equity portion of your deferred compensation loses value.\n\nI have placed over 200 senior private bankers in my career. I can tell you that the single most common reason a high-performing RM leaves a platform is not compensation. It is not a bad quarter. It is the feeling that the institution has stopped moving forward. That the energy has gone out of the room. That the decisions that matter are being deferred, and nobody is willing to say so out loud.\n\nThat is the atmosphere inside parts of UBS right now.\n\nThe talent window that opened with the Credit Suisse integration is not closing. It is widening. And the reason it is widening is no longer just about integration fatigue or cultural friction. It is about a bank whose leadership is frozen because the institution itself does not yet know what it will look like in three years.\n\nThe ones who realise that are already having conversations. The ones who do not are trusting that someone, somewhere, will eventually turn the lights on.\n\nIn my experience, that is not how this works.`,\n  },\n  {\n    slug: "private-banking-compensation-revenue-grid",\n    ogImage: "/og-articles/og-revenue-grid-private-banking.jpg",\n    title: "The Revenue Grid Nobody Shows You Before You Sign",\n    date: "2026-04-14",\n    engagementScore: 84,\n    summary: "Two bankers. Same AUM. Identical titles. One takes home forty percent more than the other. Here is why — and what you should be negotiating for right now.",\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    linkedinUrl: "https://www.linkedin.com/pulse/revenue-grid-nobody-shows-you-before-sign-gil-m-chalem--w2cwe/",\n    markets: ["CH", "UK", "ASIA"],\n    body: `I want to tell you about a conversation I had recently with two senior relationship managers — both in [Geneva](/en/markets/geneva), both at large private banking institutions, both managing books in the CHF 600 to 700 million range, both with strong client follow rates and clean compliance records. On paper, these are near-identical profiles.\n\nTheir total compensation last year differed by almost CHF 200,000.\n\nNeither of them fully understood why.\n\nThat gap — invisible, unwritten, almost never discussed in the hiring process — is what I want to talk about today. Because after decades of placements across Swiss and international markets, I have come to believe that the compensation structure a private banker accepts when joining an institution matters almost as much as the headline salary they negotiate. And almost nobody in this industry explains the structure honestly before the contract is signed.\n\nThe Number Almost Nobody Talks About\n\nStart with a fact from Oliver Wyman that should be displayed on the wall of every HR department in private banking: research from the firm found that between 25 and 45 percent of all relationship managers at private banks are not profitable to the institution — and that RM payout is not correlated with RM profitability. Read that again. Up to nearly half of all relationship managers cost their bank more than they generate, and the bonus they receive bears no consistent mathematical relationship to the revenue they actually produce.\n\nThe two dominant models in private banking are what I call the formula model and the discretionary model. Understanding which side of that balance you are sitting on, and at what thresholds, is one of the most important pieces of due diligence any senior banker can do before accepting an offer.\n\nThe Discretionary Model\n\nThe discretionary bonus model is the historic default of Swiss and European private banking. You generate revenue. The bank pools that revenue against total costs. A compensation committee — typically at the end of the fourth quarter — decides your bonus. The result is announced. You either accept it or you do not.\n\nJP Morgan Private Bank\'s own published disclosure puts it with admirable candour: investment professionals receive a salary and are eligible for a discretionary bonus, and there is no prescribed relationship between scorecards and compensation. At one of the largest private banking institutions on the planet, there is formally no formula binding your scorecard to your pay.\n\nThe argument against — particularly for the high-performing revenue generator — is that it creates chronic uncertainty, structural opacity, and a power asymmetry that almost always favours the institution over the individual. Industry insiders have begun to say openly that the pure discretionary model is old-fashioned: if people add value, they are entitled to a defined share of business profits, not a figure decided behind closed doors and announced in January.\n\nThe Formula Model\n\nThe formula-based model works on a revenue grid. The banker generates a certain amount of fee income for the institution, and receives a defined percentage of that revenue as variable compensation, usually in graduated bands. Generate CHF 1 million, receive 20 percent. Generate CHF 2 million, receive 25 percent on the marginal revenue above the threshold. The exact numbers vary considerably by institution, market, and seniority level, but the principle is consistent: your pay is a deterministic function of your output, visible in advance and calculable in real time.\n\nEFG Bank has long been associated with this model in the European private banking market, and it has been a meaningful differentiator in their ability to attract entrepreneurial senior relationship managers who want to know, when they move their book, what they will actually earn on it.\n\nThe Hidden Variables Nobody Negotiates\n\nEven within institutions that use formula-based grids, there are structural details that can shift total compensation by tens of thousands of francs without the banker ever being aware they were negotiable.\n\nThe first is the revenue recognition methodology. Does the bank credit the RM for gross revenue from their book, or for net revenue after product costs, platform costs, and internal charges? At some institutions, an RM managing CHF 500 million of client assets generating a gross margin of 80 basis points sees that figure reduced by 15 to 25 percent in internal allocations before the grid is applied.\n\nThe second is the deferred compensation structure. A meaningful portion of the variable pay at many institutions is deferred over one, two, or three years, subject to continued employment and conduct conditions. A banker accepting an offer with 40 percent deferral and a two-year cliff vest is making a fundamentally different economic bet than a banker with an immediate cash bonus. Most candidates read the headline number, sign, and discover the deferral mechanics later.\n\nThe third is the treatment of new money versus existing book revenue. Some institutions grid only on net new revenue generated by the RM, discounting the revenue from a transferred book that the bank regards as already priced into the hiring package. For a banker moving a CHF 800 million book generating CHF 6 million in annual fees, the difference between those two methodologies can represent several hundred thousand francs in year-one compensation.\n\nThe EAM Model: A Different Equation Entirely\n\nNo discussion of private banking compensation is complete without addressing the external asset manager model, which is increasingly the destination of choice for senior relationship managers who have exhausted their patience with both the discretionary and the formula structures.\n\nThe EAM operates on a triangular model: the client entrusts their assets to a custodian bank, but the investment management mandate is held by the EAM. For the relationship manager who joins or founds an EAM, there is no HR committee, no year-end announcement. The revenue the RM generates flows directly into the EAM\'s P&L, and their take-home pay is a defined share — typically between 25 and 40 percent of the revenue the firm attributes to their book, net of operational costs. For a senior RM managing CHF 500 million at a blended margin of 70 basis points generating CHF 3.5 million in annual fees, that can translate into total personal compensation of CHF 800,000 to CHF 1.2 million or more. No equivalent trajectory exists inside most private banks at that AUM level.\n\nThis is why I increasingly tell the senior relationship managers I work with that the compensation negotiation is not the salary discussion. The salary is the baseline. The real negotiation is about the structure. Those conversations are uncomfortable to have. Banks do not naturally volunteer this information. But they are negotiable — particularly for a banker with a clean, portable, revenue-generating book.`,\n  },\n  {\n    slug: "dubai-private-banking-iran-conflict-2026",\n    title: "Dubai\'s Illusion Is Gone. Where Does That Leave You?",\n    date: "2026-03-09",\n    engagementScore: 83,\n    summary: "The Iran conflict has shattered the Gulf\'s reputation as a stable home for private banking talent. For senior bankers caught in the middle — and for those watching from Switzerland — the career implications are real and immediate.",\n    pillar: "P1",\n    subTheme: "Positioning",\n    linkedinUrl: "https://www.linkedin.com/pulse/dubais-illusion-gone-where-does-leave-you-gil-m-chalem--mrdye/",\n    markets: ["UAE", "CH", "ASIA"],\n    body: `Something broke on the morning of February 28th. Not just infrastructure — the idea. [Dubai](/en/markets/dubai)\'s entire value proposition as a global financial hub was built on one promise: that it was a safe, neutral, prosperous island in a difficult neighbourhood. When Iranian missiles struck Dubai International Airport, the Burj Al Arab and Jebel Ali Port in the same weekend, that promise was visibly, publicly, undeniably broken.\n\nI want to be clear about what this is not. This is not a prediction that Dubai is finished, or that every private banker there should be calling a [Geneva](/en/markets/geneva) recruiter this afternoon. What it is, is a moment that forces honest thinking about risk — the kind of thinking that our industry rarely does until it is forced to.\n\nWhat Actually Happened\n\nBetween February 28th and early March, Iran launched 189 ballistic missiles, over 941 drones, and cruise missiles at UAE targets. Dubai International Airport was struck. The Fairmont on Palm Jumeirah was hit by drone debris. The Burj Al Arab sustained damage. Jebel Ali Port caught fire.\n\nThe UAE\'s air defences performed well — the vast majority of projectiles were intercepted — but intercepted missiles still produce shrapnel, debris, and fires. Four people were killed. Over 100 were injured. Tens of thousands of passengers were stranded as regional airspace shut down. Emirates suspended operations. Dubai\'s stock market closed for two days and fell 4.7% on reopening — its worst single session since May 2022.\n\nFamily offices and international wealth managers began quietly reviewing their Middle East exposure. Security firms reported corporate clients requesting evacuation plans for between 1,000 and 3,000 staff.\n\nThe Structural Problem for Private Banking in the Gulf\n\nDubai was never a traditional private banking centre in the Swiss sense. It was a distribution hub — a place where banks placed relationship managers to serve clients from Russia, India, the broader Middle East, and East Africa, who preferred booking their assets in Switzerland or Luxembourg but wanted face time with a banker who understood their world and was nearby.\n\nThat model worked because the equation was simple: the personal risk of being based in Dubai was low, and the commercial upside was high. What the past two weeks have done is change one side of that equation. The personal risk is no longer theoretical.\n\nFor senior bankers managing significant books — CHF 200M, 400M, 600M and above — the question is not only whether they feel safe today. It is whether their clients feel safe. High-net-worth and ultra-high-net-worth clients are not going to park assets in a booking centre they associate with instability, regardless of how sophisticated the bank\'s product offering is.\n\nSwitzerland Does Not Win Automatically\n\nThere will be capital flows towards Switzerland. There already are. But I want to push back on the assumption that this is a simple, clean gain for Swiss private banking. The clients who were in Dubai were there for reasons: proximity, tax efficiency, the feel of a dynamic city, and in many cases, the access to a banker who spoke their language, understood their business culture, and operated in their time zone. Those needs do not disappear because the security situation has deteriorated.\n\nSwitzerland offers something different: neutrality, political stability, institutional depth, a proven regulatory framework, and 200 years of experience managing wealth through European wars, currency crises, and geopolitical shocks. That is a compelling offer. But Swiss banks will need to do real work to absorb the talent and the clients coming out of the Gulf — not simply assume the business will arrive on its own.\n\nWhat This Means for Private Bankers on the Ground\n\nIf you are a senior RM based in Dubai right now, you are managing several things simultaneously: your own personal calculus about where you want to live and work, your clients\' anxiety, and your bank\'s institutional position — which may not yet be clear even to your own management.\n\nFor bankers thinking about their own next move, this is a moment to assess your book\'s [portability](/en/portability) with clear eyes. Where are your clients actually booked? What proportion of your AUM is tied to clients who would follow you to a European platform? What contractual obligations do you have to your current employer? These questions are worth answering now, before you are reacting to events rather than ahead of them.\n\nAnd for bankers based in Switzerland who cover Middle Eastern or Gulf-market clients, this is a moment of significant opportunity — provided you approach it correctly. Clients who are reassessing will not want to feel sold to. They will want to feel understood. The bankers who will win new mandates from this disruption are the ones who pick up the phone this week not with a pitch, but with a genuine check-in.\n\nEither way, we are in a period of genuine uncertainty for private bankers in the Gulf — and a period of genuine opportunity for those positioned to serve that uncertainty well.`,\n  },\n  {\n    slug: "zurich-private-banking-talent-market-2026",\n    title: "Zurich 2026: Why the Private Banking Talent Market Is Turning",\n    date: "2026-02-20",\n    engagementScore: 81,\n    summary: "Record headcount, UBS integration, regulatory tightening — and a competition for senior relationship managers unlike anything Zurich has seen before.",\n    pillar: "P1",\n    subTheme: "Positioning",\n    linkedinUrl: "https://www.linkedin.com/pulse/z%C3%BCrich-2026-warum-der-talentmarkt-im-private-banking-gil-m-chalem--wcq4e/",\n    markets: ["CH"],\n    body: `The latest KPMG study on Swiss Private Banking delivers a finding that should give every senior banker in [Zurich](/en/markets/zurich) pause. Swiss private banks employed more full-time staff in 2024 than at any point in recorded history — 40,464 full-time equivalents in total. At the same time, the number of private banking institutions has fallen by roughly half since 2010.\n\nUBS is excluded from this count for methodological reasons. But the direction is clear: fewer institutions, more headcount per bank, higher concentration of talent inside the remaining houses.\n\nWhat does that mean on the ground in Zurich?\n\nUBS: 3,000 Swiss Roles and a Paradox\n\nCEO Sergio Ermotti confirmed in early February 2026 that the majority of Swiss headcount reductions will take place in the second half of the year — approximately 3,000 roles, primarily following completion of the Credit Suisse IT migration to UBS systems.\n\nAt the end of December 2025, UBS employed 103,200 full-time staff globally — 1,250 fewer than at end of September. Since the acquisition peaked at around 119,000 FTE in mid-2023, roughly 16,000 roles have been eliminated. The internal target of 85,000 FTE by end of 2026 appears unlikely to be met, according to the Financial Times.\n\nThe paradox: while UBS is cutting, other Zurich institutions are hiring selectively and deliberately.\n\nThree Clear Trends\n\nFrom my conversations with desk heads and HR leads in Zurich over recent months, three patterns are consistent.\n\nTargeted acquisition hires at the private banks. Julius Baer, Vontobel, EFG, and UBP are not hiring broadly — they are hiring with precision. The profile they want is specific: relationship managers with an entrepreneurial approach, access to high-growth client segments (entrepreneur families, next-generation clients, international markets), and demonstrable [portability](/en/portability).\n\nThe EAM gap. The external asset manager sector continues to grow, and with it the demand for experienced client advisers who are comfortable in a regulated environment. Industry sources project a shortfall of up to 1,000 client advisers in the Swiss EAM segment over the coming years.\n\nFormer Credit Suisse bankers as a sought-after asset. Bankers who maintained intact client books — whether by remaining inside UBS through the integration or by waiting out the transition period — are now facing a decision. The completion of the IT migration will release many non-compete clauses. In my experience, the strongest candidates move quietly and early.\n\nWhat I Am Seeing in the Mandate Market\n\nCompensation is stable but shifting in structure. Fixed salaries for senior RMs at Director and ED level of CHF 200–350K remain market-standard. The variable component is increasingly tied to sustainable revenue streams — DPM mandate income, lending revenue, recurring fees — rather than pure AUM accumulation.\n\nGerman is mandatory, but no longer sufficient. Swiss-German and standard German are prerequisites for CH-onshore mandates in German-speaking Switzerland. Banks increasingly also require solid English and, ideally, a second language for cross-border segments. The combination of German plus Italian or German plus Russian is being actively sought.\n\nPortability is being scrutinised more rigorously. The era of AUM promises as the primary hiring signal is over. Zurich banks consistently require: a credible wallet-share analysis, a retention history, clean compliance documentation, and a realistic assessment of what proportion of the book is actually transferable within six to twelve months. [Business plan](/en/bp-simulator)s are no longer a formality. They are the filter.\n\nWhat This Means for You\n\nIf you are a relationship manager in Zurich considering a move, the next twelve months represent a window that rarely exists. The combination of the UBS restructuring, targeted hiring initiatives at the private banks, and the growing EAM segment is creating optionality that does not exist in a normal market cycle.\n\nIf you are a desk head or HR lead looking for senior profiles, be aware that the pool of available, qualified candidates will grow in H2 2026 — but the strongest profiles are being approached early and moving discreetly. A structured approach with a realistic business plan and a clear platform proposition is what separates successful hires from those that stall in committee.\n\nThe talent market in Zurich is not tightening. It is turning. The direction of that turn, and who benefits from it, will be determined in the next six to twelve months.`,\n  },\n  {\n    slug: "ai-trap-private-banking-portability",\n    ogImage: "/og-articles/og-ai-trap-private-banking-portability.jpg",\n    title: "The AI Trap Nobody in Private Banking Is Talking About",\n    date: "2026-04-07",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "When the bank\'s technology gets smarter about your clients, what exactly are you taking with you when you leave?",\n    linkedinUrl: "https://www.linkedin.com/pulse/ai-trap-nobody-private-banking-talking-gil-m-chalem--lcvae/",\n    featured: true,\n    engagementScore: 95,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: ["private banking portability", "AI private banking", "banker portability Switzerland", "relationship manager career move", "AUM portability 2026"],\n    body: `When the bank\'s technology gets smarter about your clients, what exactly are you taking with you when you leave?\n\nLet me tell you about a press release I read last week.\n\nOn March 26th, Bank of America announced the full-scale rollout of something they are calling AI-Powered Meeting Journey. It is, by their own description, an integrated solution that searches and consolidates client relationship insights and recent activity into ready-to-use prep materials before every client meeting, then generates summaries and actionable next steps afterwards. The stated purpose is to help advisors redirect meaningful time toward strategic planning and deeper client engagement.\n\nOn the surface this reads as a productivity story. Advisors get more time. Clients get better service. Everyone wins. But I have been in executive search in private banking for long enough to read what is underneath that kind of language and what I see there is a question that the industry is almost entirely failing to ask.\n\nIf the bank\'s AI now knows your clients better than you do, their history, their preferences, their recent concerns, the last three conversations you had with them, who exactly owns that relationship when you walk out the door?\n\n## [Portability](/en/portability) has always been the private banker\'s ultimate asset\n\nThis is not a new observation, but it bears repeating because it is the foundation of everything. The private banker\'s value, what makes the best ones virtually impossible to replace and extraordinarily expensive to lose, is not their investment knowledge, their compliance expertise, or even their personality. It is the fact that their clients trust them personally. Not the institution. Them. The phone number the client uses when something goes wrong at 11pm is the banker\'s mobile. Not the bank\'s switchboard.\n\nThat personal trust is what translates into portability. When a senior relationship manager at a major Swiss private bank decides to move to a competitor, to a boutique, to an EAM, a meaningful portion of their book tends to follow. Industry surveys have consistently shown client follow rates of 40 to 70 percent for senior bankers with established books, depending on the market segment, the nature of the relationships, and the legal constraints in place. It is the single most important number in any private banking hire, and it is the number that hiring committees in [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), [London](/en/markets/london), and [Dubai](/en/markets/dubai) ask about first.\n\nThis is why, in my practice, I spend so much time understanding portability before anything else. Not the AUM headline figure, any banker can claim a number, but the real texture of the relationships underneath it. How long? How personal? Who has the primary contact? Does the client know the bank\'s brand or the banker\'s face?\n\nNow, for the first time in decades, that calculus is being quietly disrupted by something that has nothing to do with regulation, nothing to do with non-solicitation clauses, and nothing to do with market cycles. It is being disrupted by artificial intelligence.\n\n## The technology is not neutral\n\nHere is the dynamic playing out right now across the major private banking institutions. Banks are deploying AI at an extraordinary pace. According to data from Selby Jennings, around half of Swiss financial institutions are already using AI, with a further quarter planning to adopt it within three years. McKinsey has estimated that generative AI could add between $200 billion and $340 billion annually to the global banking sector, primarily through productivity gains. And AI is expected to boost front-office productivity by 27 to 35 percent by 2026.\n\nThe front-office applications being prioritised are not abstract. They are meeting preparation tools, relationship intelligence platforms, next-best-action engines, and CRM systems that build increasingly detailed maps of every client interaction. Every call, every preference, every concern, every product conversation, all of it is being encoded into proprietary platforms that the bank owns and controls. The AI gets better the longer the relationship runs and the more data it processes. It becomes, in effect, an institutional memory for the client relationship.\n\nThis is where the asymmetry begins. The banker brings the trust. The bank builds the data. And when the banker leaves, the trust is portable, it travels with the banker in the form of a phone number that clients will still answer. But the data does not. The meeting prep system stays. The relationship intelligence dashboard stays. The complete interaction history that the AI has been trained on stays. The new banker hired to replace the departing RM gets the benefit of that institutional memory from day one.\n\nIn other words: the more deeply a bank\'s AI learns a banker\'s client relationships, the more the bank, not the banker, becomes the repository of relationship intelligence. And the harder it becomes, psychologically and practically, for a client to fully follow their banker elsewhere.\n\n## The banks know this. They just are not saying it.\n\nThe public messaging around these tools is carefully constructed around the advisor\'s benefit. Bank of America\'s own press release states that the role of the advisor will always remain central to the client relationship and that AI enhances efficiency but cannot replace the valuable judgment, empathy, understanding and personal connection advisors bring to clients. This is almost certainly true in any individual client interaction. A client going through a divorce, planning a business sale, or navigating a generational wealth transfer needs a human. The AI is not going to handle that conversation.\n\nBut the structural effect of these tools on the banker\'s longer-term leverage is a different question entirely, and it is one that the institutions have no commercial incentive to raise. Every layer of AI that encodes a client relationship into a bank\'s proprietary platform is a layer that makes that relationship marginally more institutional and marginally less personal. Not dramatically, not overnight, but consistently, over months and years.\n\nWhat concerns me is not that this technology is being deployed. It is that the banking talent market is not yet pricing in its implications.\n\n## What this means for hiring, now\n\nAccording to the KPMG Clarity on Swiss Private Banking study published last year, Swiss private banks now employ more people than at any point in recorded history, over 40,000 full-time equivalents, even as the total number of private banks has roughly halved since 2010. The remaining institutions are larger, better resourced, and increasingly AI-equipped. And the talent profile they are hiring for is shifting.\n\nSelby Jennings noted earlier this year that private banks are now explicitly prioritising relationship managers with what they describe as clean client portability, meaning RMs whose books are not encumbered by EAM conflicts, non-solicitation clauses, or complex institutional entanglements. That emphasis is not new. What is new is that AI integration is beginning to function as a form of soft entanglement that does not show up in any employment contract.\n\nFrom where I sit running searches across Geneva, Zurich, London, Dubai, [Singapore](/en/markets/singapore), and [Hong Kong](/en/markets/hong-kong), I am already beginning to see the leading indicators of this dynamic. Candidates who have spent five or more years inside heavily digitised private banking environments are sometimes finding that their clients, while personally loyal, have also become comfortable with the bank\'s digital service layer in ways that create friction when they attempt to move. It is subtle. It does not break a placement. But it is a variable that did not exist in the same form even three years ago.\n\nThe institutions least affected by this dynamic, at least for now, are the boutiques, the partnerships, and the EAM ecosystem, precisely because their relationship model is structurally human-centric and their technology stack is lighter. A banker at Lombard Odier or Pictet still operates in an environment where the platform serves the relationship rather than partially substituting for it. That is a meaningful competitive distinction in a world where the AI arms race is accelerating at the bulge bracket.\n\n## The question every senior banker should be asking right now\n\nIf you are a senior relationship manager at a major private banking institution, and you are watching your bank roll out AI meeting tools, relationship intelligence dashboards, and next-best-action platforms, ask yourself this honestly: are these tools serving my relationship with my clients, or are they gradually embedding that relationship more deeply into the bank\'s institutional infrastructure?\n\nThe answer is probably both. The technology genuinely does make you more effective in the short term. It is not a trap in any conspiratorial sense. Nobody at the bank is sitting in a room designing systems specifically to reduce your mobility. They are designing systems to retain clients and increase productivity. But the side effect of that, the gradual encoding of relationship intelligence into proprietary platforms, is real, and its long-term implications for banker portability have not yet been seriously examined.\n\nThe most portable bankers I place are consistently the ones whose client relationships exist most completely in the human domain, in trust built over years of personal interaction, in shared history that the client remembers because the banker made it memorable, in a dynamic where the client\'s first call is always to the banker\'s mobile and only secondarily to anything the bank provides. That kind of relationship is still very much achievable. But it requires a conscious effort to maintain it in an environment where every bank is now incentivised to make itself the primary interface.\n\nThe technology is not going away. The productivity gains are real. The competitive pressure to adopt these tools is genuine, and any banker who ignores them entirely will find themselves at a disadvantage in client servicing within a few years. But there is a difference between using AI as a tool and allowing it to become the relationship. The best private bankers have always understood that distinction intuitively. In 2026, for the first time, they need to understand it strategically.`,\n  },\n\n  {\n    slug: "when-goliath-moves-bahnhofstrasse",\n    ogImage: "/og-articles/og-when-goliath-moves-bahnhofstrasse.jpg",\n    body: `Last November, something happened at the Zunfthaus zur Meisen in [Zurich](/en/markets/zurich) that would have been unthinkable five years ago. At the annual Wealth Management Summit the Swiss private banking industry\'s most intimate gathering of board members and C-level executives, Goldman Sachs was crowned the best private bank in Switzerland. Not the best American bank operating in Switzerland. The best private bank. Period. Beating Julius Baer. Beating Pictet. Beating Lombard Odier. On their own turf, measured by their own metrics.\n\nThe Fin21 study, now in its fourth edition and based on the published financials of 69 Swiss banks, evaluated performance across four criteria: growth, capital strength, efficiency, and prosperity. Goldman Sachs swept the Strongest Growing category among large banks. Its newly appointed General Manager for Switzerland, Pascal Meinherz, reminded the room that out of the firm\'s $1.8 trillion in wealth management assets, a significant portion is invested in private markets exactly the kind of product that UHNW clients now demand and that most Swiss boutiques still struggle to deliver at scale.\n\nAnd Goldman is not alone. J.P. Morgan\'s Private Bank ended 2024 with $1.27 trillion in assets under management, a 27% year-on-year jump and $2.97 trillion in total client assets. They added 260 new client advisors in a single year, bringing their bench strength to 3,775. Their Global Finance Best Private Bank award is now in its fifth consecutive year. Goldman Sachs Private Wealth Management, meanwhile, posted $1.6 trillion in total client assets as of early 2025, with an average account size exceeding $75 million. The average Goldman private banking client has more assets than many Swiss boutique bankers manage across their entire book.\n\nSo the Americans are winning. Story over, right? Not quite. For a very specific category of senior private banker the kind of professional I spend my days placing the rise of US mega-banks on Swiss soil is the best thing that could have happened.\n\n## The paradox nobody is talking about\n\nThe same Fin21 study that crowned Goldman also surfaced a far less comfortable finding. Across the 69 Swiss banks evaluated, median net new money as a percentage of assets under management was 1.5%. Chris Kunzle, the study\'s author and Fin21 founder, was blunt about it on stage: that is stagnation. Not decline, not crisis but for an industry that prides itself on client acquisition, 1.5% is treading water while the rest of the world sprints.\n\nThe KPMG/University of St. Gallen annual study confirmed the pattern. Swiss private banks reached a record CHF 3.4 trillion in assets under management by end of 2024 but most of that growth came from markets, not clients. Net new money was CHF 72 billion industry-wide, which sounds impressive until you realise it represents barely 2% of the base. Twenty-seven banks reported outflows. And the relationship managers hired from UBS and Credit Suisse in recent years have had, in KPMG\'s own carefully chosen words, only a limited impact on new money inflows.\n\nMeanwhile, the consolidation machine keeps grinding. From 160 private banks fifteen years ago, the count has dropped to approximately 80. KPMG expects it to fall below that threshold by end of 2025. The message is unmistakable: scale or die.\n\nSo you have a sector sitting on record assets, generating modest organic growth, watching its ranks thin year after year and now facing American institutions that bring a level of global product capability, capital markets access, and institutional firepower that no Swiss bank, however prestigious, can match pound for pound. The natural conclusion would be despair. But the natural conclusion would be wrong.\n\n## What the Americans cannot replicate\n\nI have spent decades placing senior private bankers across [Geneva](/en/markets/geneva), Zurich, [London](/en/markets/london), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore), [Hong Kong](/en/markets/hong-kong), [Milan](/en/markets/milan), and Lisbon. And there is one question I ask every senior candidate who tells me they are considering a move from a Swiss boutique to a US house: what happens to your client relationships when your desk head changes for the third time in four years?\n\nThe silence is usually the answer.\n\nUS banks operate on a fundamentally different logic. They are public companies. They report quarterly. They have shareholders who expect double-digit earnings growth. When the CEO of J.P. Morgan\'s private bank talks about goals-based planning and OneGS integration, what that translates to at the relationship manager level is a structured hierarchy, a nationally managed book, and an expectation that you will market what you are told to market. The career path is clear, the training is excellent, and the product shelf is vast but the banker\'s autonomy over the client relationship is a fraction of what it would be at a Pictet, a Lombard Odier, or a UBP.\n\nThis is not a criticism. It is a structural reality that flows directly from the ownership model. And it creates a window of opportunity that Swiss boutiques are only beginning to understand.\n\nConsider the ownership structures. Pictet has operated as a partnership for 220 years. Only 47 individuals have ever served as managing partners. The current partners have unlimited personal liability their own wealth is on the line alongside their clients\'. There is no board of external shareholders demanding quarterly optimisation. There is no investment banking division whose interests might occasionally collide with those of the wealth management client. When Pictet\'s website says our independence allows us to set our own business strategy without pressure from external shareholders or creditors, that is not marketing copy. That is a legal fact, enforceable by Swiss law.\n\nLombard Odier, founded in 1796 making it Geneva\'s oldest bank, just moved into a new headquarters in Bellevue designed by Herzog and de Meuron, connected to GeniLac, Geneva\'s renewable thermal energy network. The building is a physical statement: we are not going anywhere. Meanwhile, their seven-year GX digital transformation programme has made them one of only two banks worldwide selected as a pilot for MongoDB\'s AI modernisation project, processing the technology infrastructure for ten other banking groups through their BPO platform.\n\nUBP tells a different story: entrepreneurial, acquisitive, capitalised like a fortress. Their Tier 1 ratio of 28.9% is among the highest in Swiss banking. They have absorbed Coutts International, Danske Bank\'s Luxembourg wealth management, and Societe Generale\'s Swiss and Kleinwort Hambros operations. They just opened in Riyadh. Their culture rewards bankers who build and keeps them.\n\nThese are not banks clinging to the past. These are institutions that have survived Napoleonic wars, two world wars, the end of banking secrecy, the financial crisis, and the Credit Suisse collapse and emerged stronger each time.\n\n## The talent calculus that the numbers do not show\n\nHere is what I see on the ground, every single week, that no study captures.\n\nWhen a UHNW banker at UBS, senior with a CHF 800 million book and Middle Eastern clients and fifteen years in the business, looks at his options, he is doing a very specific calculation. At UBS, he is inside a $4 trillion wealth management machine that is simultaneously trying to complete the most complex banking integration in European history, cutting 35,000 jobs, migrating IT systems, and navigating a Swiss regulatory debate about capital requirements that could reshape the bank\'s ability to return capital to shareholders for years.\n\nAt J.P. Morgan or Goldman, he gets global reach, extraordinary product, and a famous business card. But he also gets quarterly revenue targets set in New York, a structured hierarchy where decisions happen far above his pay grade, and the constant awareness that his client relationships are ultimately the bank\'s relationships, not his own. If he leaves, the book stays behind.\n\nAt a Pictet or a UBP, he gets something neither of those environments can offer: the ability to run his business within a business. Open architecture, genuine open architecture, not the version where the proprietary product just happens to be best in class every quarter. A partnership culture where the CEO might be two doors down the corridor and actually knows his name. A client relationship that, if he ever decides to move again, he has a realistic chance of taking with him. And compensation that, while perhaps lower in absolute terms than a Goldman signing package, is structured in a way that rewards long-term client retention rather than annual production targets.\n\nThe Swiss franc does not hurt either. With inflation at 0.2% and the SNB policy rate at 0%, the purchasing power stability of a Geneva or Zurich salary remains extraordinary compared to what a Manhattan or London paycheck actually delivers after tax and cost of living.\n\n## The generational shift that changes everything\n\nThere is a number buried in recent wealth transfer research that should be on every Swiss private bank\'s strategy deck: 81% of younger HNWIs plan to switch their wealth management firm when they inherit. The $62 trillion intergenerational wealth transfer underway, representing half of the nearly $100 trillion moving from Baby Boomers through 2048, is not a gentle handover. It is a mass disruption event.\n\nAnd this is precisely where the Swiss boutiques have an edge that the American giants will find nearly impossible to replicate.\n\nAt J.P. Morgan, a next-generation client will be onboarded into a system. They will get a goals-based planning module, an AI-powered engagement tool, a beautifully designed mobile app, and a quarterly review with someone who manages 100 or more relationships. At Pictet, they will sit with a private banker who knows their family because their father or grandfather sat in the same chair twenty years ago, in a building that has been there since Napoleon was reshaping Europe. They will get access to ESG mandates built by a firm that has been investing sustainably since before ESG was an acronym. They will get private equity and alternatives structured by a team that does not have to worry about whether Goldman\'s proprietary fund is being pushed this quarter.\n\nThe digitally fluent heir who wants both cutting-edge technology and a genuine human relationship, who wants a banking partner and not a platform, is the Swiss boutique\'s ideal client. And they are about to inherit the earth.\n\n## What this means for your career\n\nIf you are a senior private banker reading this from your desk at a US bank in Geneva or Zurich, I am not telling you to leave tomorrow. The American houses offer real advantages: global product access, capital markets capabilities, structured lending at scale, and brand power that opens doors in every market on the planet.\n\nBut I am telling you to think about what you are optimising for. If it is short-term compensation and brand prestige, the US banks win that contest most quarters. If it is long-term career autonomy, client relationship ownership, and the ability to build something that survives the next restructuring cycle, which in this industry is never more than three years away, then the Swiss boutiques offer something that no amount of Goldman signing bonus can replicate.\n\nThe Fin21 study\'s own data tells the story from the other side. While Goldman won the growth category, the Most Prosperous award went to Mirabaud, a Geneva partnership that has never recorded a loss in 206 years. Most Efficient went to Scobag, a Basel private bank managing 749 million francs per full-time employee. These are not banks that will ever grace the front page of Bloomberg. But they are banks where a senior private banker can build a career, not just hold a job.\n\nThe Americans moved to Bahnhofstrasse because Swiss private banking still matters. The question for the industry and for every professional in it is not whether the Swiss model can survive the arrival of Goliath. It is whether the Swiss boutiques will be bold enough to turn Goliath\'s presence into their greatest recruitment pitch.\n\nGoldman proved that global scale and Swiss-quality service can coexist. Now Pictet, Lombard Odier, UBP, and their peers need to prove that independence, partnership, and generational thinking are not relics. They are the future that $62 trillion in transferring wealth is actively looking for.\n\nThe talent war in Swiss private banking has never been more interesting. And if you are one of the people caught in the middle of it, I would be happy to discuss what I am seeing on the ground.`,\n    title: "When Goliath Moves to Bahnhofstrasse",\n    date: "2026-03-31",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "Goldman Sachs was crowned the best private bank in Switzerland at the annual Wealth Management Summit. The Americans are winning on Swiss turf — but for senior private bankers, this is the best thing that could have happened.",\n    linkedinUrl: "https://www.linkedin.com/pulse/when-goliath-moves-bahnhofstrasse-gil-m-chalem--urvie/",\n    featured: true,\n    engagementScore: 88,\n    pillar: "P1",\n    subTheme: "Positioning",\n    keywords: ["Goldman Sachs Switzerland", "Swiss private banking competition", "US banks Geneva", "private banking career strategy"],\n  },\n  {\n    slug: "35000-jobs-one-question-nobody-asking",\n    ogImage: "/og-articles/og-35000-jobs-one-question-nobody-asking.jpg",\n    seoTitle: "35,000 UBS-Credit Suisse Jobs: The Question Private Bankers Are Not Asking",\n    seoDescription: "120,000 employees. Three years of integration. UBS is entering the final redundancy phase. Here is the question senior private bankers inside UBS are not asking — but should be.",\n    body: `The numbers have been reported enough times that they no longer feel extraordinary. UBS absorbed Credit Suisse in March 2023, in an emergency transaction brokered by the Swiss federal government over a single weekend. Overnight, the combined institution swelled to just under 120,000 employees. It became, by some distance, the world\'s largest wealth manager, a $7 trillion AUM colossus that now counts roughly half of the world\'s billionaires among its private banking clients.\n\nThree years on, the integration is entering its final phase. The legacy Credit Suisse IT systems are being decommissioned. Around 85% of Swiss client accounts have been migrated. CEO Sergio Ermotti confirmed in January that a fresh round of layoffs would begin as soon as the decommissioning is complete.\n\nThe math is well-documented. Approximately 15,000 positions have already been eliminated since the acquisition, less than half of the internally reported target of 35,000, a figure UBS has never publicly confirmed but has never credibly denied. Internal planning documents reported by multiple outlets suggest the bank is targeting a post-integration headcount of around 85,000, compared to 105,000 today. A further 3,000 Swiss positions are expected to go once client migration is finalised. A second wave will follow later in 2026 when the remaining inherited computer platforms are permanently shut down. On current trajectory, this restructuring will be the largest workforce reduction in the history of Swiss finance.\n\nThe industry has spent three years tracking that number, who is going, which divisions are being cut, which markets are being rationalised. What it has almost entirely failed to examine is the question on the other side of the ledger.\n\nWhat happens to the careers of the people who survived?\n\n## Surviving was the rational choice\n\nLet me be clear about that before I say anything else. For most private bankers and Investment Advisors at UBS or the former Credit Suisse, the decision to stay through the integration disruption was professionally sound. Clients needed continuity. The talent market, though active, was not predictable enough in 2023 and early 2024 to justify a move driven primarily by anxiety. And the banks bidding for former Credit Suisse talent, and there were many, were often offering packages contingent on [portability](/en/portability) evidence that was difficult to demonstrate in the middle of an institutional earthquake. Staying close to clients, protecting relationships, and waiting for the dust to settle was the right call.\n\nBut 2026 is not 2023. And I am increasingly concerned that a generation of talented private bankers is treating survival as an outcome rather than what it actually was: a holding pattern. The dust has settled. The integration is concluding. And the question that should now be on every surviving UBS banker\'s desk, not at their performance review but in their own honest reckoning, is this: what does my trajectory actually look like from here?\n\n## The structural reality of post-merger institutions\n\nThere is a structural reality about post-merger institutions that people who have only ever worked inside them rarely see clearly. When two large organisations are combined, the hierarchy does not simply add together. It compresses. The Credit Suisse RM who was a senior figure in his market team, well-known to management, with clear line-of-sight to director-level progression, now operates inside a UBS structure that was already deep before the merger and has absorbed thousands of people at equivalent seniority. The visibility he had before does not transfer. The sponsorship has to be rebuilt, in an organisation that is twice the size and still navigating its own cultural identity.\n\nThe cultural dimension matters more than it is usually acknowledged. UBS and Credit Suisse were not simply two versions of the same institution. They had genuinely different DNA. UBS built its modern private banking around a disciplined, process-driven model oriented toward scale and institutional credibility. Credit Suisse, at its private banking core, operated with more entrepreneurial latitude, closer to the partnership ethos that characterised the [Geneva](/en/markets/geneva) boutique sector, with more decentralised decision-making and a different relationship between senior bankers and the institution. That cultural gap has not been bridged by the legal merger. It is still actively playing out in how decisions get made, how talent gets recognised, and how the merged entity defines what a successful private banker looks like.\n\nWhat this creates, in practice, is a particular kind of friction that is hard to name but easy to feel. The banker who thrived in the Credit Suisse model because of his autonomy, his proximity to clients and to the investment team, and his ability to act quickly now finds those same instincts constrained by a machine designed for a different kind of excellence. He is not failing. He is just not fully deployed. And there is a meaningful difference between those two things when you are in your mid-career peak.\n\n## The attrition paradox\n\nThe attrition data adds another layer. According to reporting by the Financial Times and Finews, UBS\'s voluntary attrition rate, historically around 7% per year, fell below that average at the start of 2025. People were staying, partly out of genuine loyalty, partly out of caution, partly because the non-solicit and retention arrangements embedded in many integration era contracts made moving costly. That drop in attrition is one of the reasons UBS is behind its internal headcount target. The bank had counted on a certain level of natural attrition to help manage the numbers. It did not materialise at the expected rate.\n\nThe consequence for the remaining workforce is a hierarchy that is more congested than it would normally be. Promotion tracks that might have cleared through organic turnover have not cleared. Teams that might have rationalised themselves through voluntary exits are still carrying more layers than they need. For the banker who was expecting to move up within the next two to three years, the queue is longer than the org chart suggests, and it is not getting shorter quickly.\n\nI want to address the counterargument directly, because it is a legitimate one. UBS\'s private banking performance in 2025 was strong. The bank\'s Global Wealth Management division delivered pre-tax profit of $3.94 billion, up nearly 14% on the prior year. Total invested assets reached $7 trillion for the first time. Net new money was positive. By the standard measures of a wealth management franchise, UBS is not a troubled institution. It is, by most metrics, the most successful private bank in the world.\n\nThat is not in dispute. The question is not whether UBS is a good bank. It is whether it is the right bank for every talented private banker currently working inside it. Those are different questions. And the honest answer to the second one, for a significant number of people, is increasingly no.\n\n## The profiles I am concerned about\n\nThe profiles I am talking about are specific. Not the banker whose value proposition is the UBS brand itself, the one whose clients chose the institution before they chose the individual, and whose book requires global booking capability, complex cross-border structuring, and the full product breadth of a $7 trillion platform. For that profile, UBS in 2026 remains an extraordinarily compelling place to be. The platform advantages are real, and they are difficult to replicate elsewhere.\n\nThe profiles I am concerned about are the ones whose competitive advantage is personal. The RM whose relationships are with families, entrepreneurs, and individuals who chose their banker first and the bank second. The Investment Advisor who was hired for his intellectual independence and market conviction, and who has watched that discretion gradually get replaced by house view compliance and model portfolio mandates. The senior banker who was a known figure inside Credit Suisse and has spent three years being quietly invisible inside something four times the size.\n\nFor those profiles, the integration has created a mismatch that is unlikely to resolve itself from within.\n\n## The market outside UBS in 2026\n\nThe market outside UBS in 2026 is more interesting than it has been in a decade. That is not a recruitment pitch, it is a factual observation about supply and demand in the private banking talent pool.\n\nThe Swiss boutique and mid-size sector has not stood still while UBS integrated. Julius Baer grew AUM to CHF 497 billion in 2024, a 16.4% increase. Pictet reached CHF 757 billion in total AUM at year-end 2025, recording CHF 19 billion in net new money. EFG International grew at the same 16.4% rate as Julius Baer, reaching CHF 165.5 billion. UBP, Lombard Odier, Mirabaud, Banque Syz, virtually every significant independent institution in Switzerland has been growing its asset base while simultaneously watching UBS create an unprecedented supply of senior talent, directly or indirectly, through three years of structural disruption. The mandates I am currently working confirm this. Demand for portable, senior, relationship-driven profiles at non-UBS institutions is at a level I have not seen in this market since the post-financial crisis period.\n\nThe window will not stay open indefinitely. As UBS completes its integration and the narrative stabilises, the talent supply that has been loosened will tighten again. The bankers who move in the next 12 to 18 months do so when the market is actively bidding for them, from a position of strength, with their client relationships intact and their track record clearly legible. The ones who wait for the third wave of cuts to make the decision for them will be moving from a more defensive position, in a market that reads defensive moves differently than proactive ones.\n\n## The question worth asking\n\nThe question I would put to any senior private banker currently at UBS is not should I leave. It is more precise than that. Ask yourself whether the trajectory you are on today, not the one you joined for but the one that actually exists in this merged institution, reflects what you are capable of. If the honest answer is yes, stay and build. The platform is extraordinary. If the honest answer is no, or even uncertain, the market right now is in a better position to answer that question than your next annual review will be.\n\nSurvival was the right answer in 2023. In 2026, the right answer is something more ambitious.`,\n    title: "35,000 Jobs. One Question Nobody Is Asking.",\n    date: "2026-03-30",\n    markets: ["CH", "UK", "US", "ASIA"],\n    summary: "UBS absorbed Credit Suisse in March 2023. Three years on, 35,000 jobs are being eliminated. The industry has tracked who is leaving — but almost entirely failed to examine what happens to the careers of the people who survived.",\n    linkedinUrl: "https://www.linkedin.com/pulse/35000-jobs-one-question-nobody-asking-gil-m-chalem--0gdze/",\n    featured: true,\n    engagementScore: 90,\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    keywords: ["UBS Credit Suisse integration", "private banking career", "Swiss banking jobs", "relationship manager career move"],\n  },\n  {\n    slug: "when-safe-haven-isnt-safe-anymore",\n    ogImage: "/og-articles/og-when-safe-haven-isnt-safe-anymore.jpg",\n    body: `There is a sentence that has circulated quietly in wealth management circles for the past twenty years. Dubai is different. It was the answer to every question about regional instability, every concern about proximity to conflict, every client who asked whether it was really wise to base oneself or one\'s assets in the middle of the Gulf. Dubai is different because it had transformed itself into something that the surrounding geography could not touch: a city built on the confidence of foreigners, running on their capital, their talent and their willingness to believe that the rules of the neighbourhood did not apply here.\n\nSince late February 2026, that sentence has become harder to say with a straight face.\n\nWhat has unfolded in the UAE over the past three weeks is not a rumour, not a geopolitical simulation and not a tail risk buried in a risk report. It is documented fact. Iran, retaliating against the US-Israeli bombing campaign, has fired over 314 ballistic missiles, 15 cruise missiles and more than 1,600 drones at the UAE since February 28th. Most were intercepted. But debris falls where it falls. The forecourt of the Fairmont The Palm on Palm Jumeirah caught a Shahed drone strike. The Dubai International Financial Centre took a direct impact. The world\'s busiest international airport sustained damage and was temporarily evacuated. An Amazon Web Services data centre, home to cloud infrastructure serving the regional banking system, was struck by shrapnel, knocking out phone banking services across the country. The Jebel Ali port, which accounts for 36 percent of Dubai\'s GDP, suspended operations after a berth fire caused by intercepted missile debris.\n\nThe human toll, as of March 17th, stands at eight dead and 157 injured, largely migrant workers and foreign nationals. Iran\'s military command has gone further, explicitly threatening to begin targeting banks and financial institutions across the Gulf. For anyone working in private banking, that sentence deserves to sit on the page for a moment.\n\n## The exodus and what it actually means\n\nThe images from the first days of the conflict told a particular story. Private jet brokers reported over 100 client inquiries in a single night. Charter demand reached levels not seen since the pandemic, with a single flight from Riyadh to Europe quoted at up to $350,000. Long queues formed at the UAE-Oman border, people driving hours to reach Muscat airport as an alternative exit point. And in a detail that says more about the kind of people who had built their lives in Dubai than almost anything else: veterinarians and pet hospitals reported being overwhelmed with animals abandoned by fleeing expatriates.\n\nAt the institutional level, the Abu Dhabi and Dubai stock exchanges suspended trading on March 2nd and 3rd, the first wartime closure in UAE market history. When they reopened, the DFM index dropped 5.2 percent in the first session, with banking and real estate stocks leading the selling.\n\nS&P Global has estimated that Gulf banks could face domestic deposit outflows of $307 billion if the conflict deepens significantly, though as of mid-March no major capital flight from the banking system had materialised. The UAE Central Bank moved quickly, launching a resilience package backed by $1.47 trillion in sector assets to signal stability.\n\nWhat the exit data does not yet capture is the slower, quieter reallocation that happens in private banking: the client who does not move their assets this week but asks their RM to prepare a scenario. The family office that begins exploring a [Singapore](/en/markets/singapore) entity structure. The UHNW individual who calls [Geneva](/en/markets/geneva) not to transfer funds but to ask a question they have never asked before. These are the signals that experienced practitioners read long before they show up in deposit flow data.\n\n## $63 billion in play\n\nTo understand what is at stake, it helps to put a number on what Dubai has built. In 2025 alone, Dubai attracted $63 billion in new private wealth inflows, cementing its position as one of the fastest-growing wealth management destinations in the world. The [DIFC](/en/markets/dubai) is home to over 600 financial institutions. Total commercial bank deposits across the GCC reached $2.3 trillion last year, comparable to total deposits in Italy, but with a critical difference: a significant proportion of those deposits are held by non-residents. In the UAE, roughly one in ten dollars on deposit belongs to someone who lives elsewhere.\n\nThat non-resident concentration is Dubai\'s greatest asset in normal times and its greatest vulnerability in a crisis. The wealth that arrived quickly can leave quickly. It has no generational anchor, no real estate mortgage, no school-age children binding it to a postcode. It came for the proposition, the tax efficiency, the connectivity, the safety, and it will re-evaluate that proposition with unsentimental clarity.\n\nThe institutions with the most direct exposure in the DIFC and wider UAE market include Julius Baer, which has built one of its most significant growth engines in the Gulf over the past decade, alongside HSBC Private Banking, UBS, Pictet, EFG International, UBP and a range of smaller Swiss and European private banks that followed their clients east. None of these institutions will be issuing public statements about contingency planning. But every one of them is running the numbers.\n\n## The compliance time bomb\n\nThere is a dimension to this story that the mainstream financial press has covered only partially, and which matters enormously to practitioners in private banking: the regulatory and compliance reckoning that the conflict may force upon Dubai\'s financial architecture.\n\nFor years, Dubai has functioned as a crucial financial corridor for Iranian businesses and individuals seeking to navigate Western sanctions. Shell companies registered across Dubai\'s sprawling free zones have masked the origin of Iranian oil and commodities. Informal currency exchange houses have moved funds across borders outside conventional banking oversight. The US Treasury has sanctioned UAE-based entities repeatedly, and American officials have long stated that enforcement within the UAE has fallen short of the country\'s stated commitments.\n\nThe Wall Street Journal reported in early March that Emirati authorities are now considering a sweeping response: targeted freezes on Iranian-linked shell company assets and a crackdown on the local currency exchanges that sit at the centre of Iran\'s financial plumbing in the region. These are not small adjustments. They would represent a structural transformation of how parts of Dubai\'s financial system operate, and they would land on the compliance and KYC functions of every international private bank operating in the DIFC at exactly the moment those functions are already stretched by client uncertainty and operational disruption.\n\nFor the relationship manager on the ground, this creates a compounding problem. The client asking about asset reallocation may also be a client whose source-of-wealth documentation has always relied on the opacity that Dubai\'s free-zone structure provided. The private banker who has spent years navigating that ambiguity now faces a regulatory environment that may close several of the doors that made certain client relationships manageable. Add to this the reputational scrutiny that any institution with Gulf exposure will face from its home regulator in [Zurich](/en/markets/zurich), Geneva or [London](/en/markets/london), and the compliance calculus shifts considerably.\n\n## The career calculation\n\nI want to speak directly to the practitioners reading this, because the public narrative tends to focus on billionaires and real estate valuations. The private banker on the ground is navigating something more personal and more professionally consequential.\n\nIf you are a relationship manager based in Dubai, and Executive Partners has placed a meaningful number of them across the DIFC and adjacent hubs over the past several years, you are now facing a situation your employment contract did not anticipate. Your clients are calling you, not just their lawyers. Your AUM, a portion of which you have worked years to accumulate and port, is being stress-tested for jurisdictional risk in real time. Some clients are not asking whether to move assets. They are asking which flight to take, and whether their banker is on it.\n\nThe harder question is the professional one. Do you stay? Does staying signal loyalty to your institution, or does it signal a lack of options? If you are an RM with a [portable book](/en/portability), strong relationships across the Gulf\'s HNW community and a genuine network built over a decade of proximity to client life in Dubai, this crisis has clarified something that was always latent in your career: the portability of your clients and the portability of yourself are two entirely separate calculations. And for the first time in many of their careers, private bankers in the Gulf are running both simultaneously.\n\nThe talent market consequence will not be immediate. Banks do not start advertising roles in Geneva for Dubai-based RMs while missiles are still being intercepted overhead. But the conversations are already happening. Several institutions in Switzerland and Singapore have quietly indicated that they are in listening mode, open to approaches from bankers who have built Gulf-facing books and are reassessing their medium-term geography. The candidates who move proactively, with their relationships intact and their documentation in order, will be far better positioned than those who wait for their institution to make the decision for them.\n\nThere is also a generation of younger private bankers in the Gulf, five to ten years into their careers, who chose Dubai over Geneva or Zurich precisely because it felt like the future. The energy, the growth, the client quality, the compensation. Those bankers are now doing a calculation they did not expect to be doing at this stage of their careers. Where do I want the next decade to be built? The answer may still be Dubai. But for the first time, it is genuinely a question rather than an assumption.\n\n## Where the money goes\n\nThe geography of private wealth reallocation under geopolitical stress is rarely as dramatic as the headlines suggest. Wealthy families do not move everything overnight. They probe, they diversify, they ask their bankers questions that sound like curiosity but are actually instruction. And the institutions that benefit are not always the loudest in the room.\n\nSwitzerland remains the default destination, and for good reason. Geneva and Zurich have spent the past forty years building precisely the kind of institutional credibility and political neutrality that becomes acutely valuable when a region\'s safety premium evaporates overnight. The wealth management infrastructure here, the legal framework, the talent density, the discretion, the track record of staying open for business regardless of what is happening elsewhere in the world, does not need to advertise itself in moments like this. It simply receives.\n\nSingapore is the other major beneficiary. Asian HNW families who diversified into Dubai over the past decade, particularly from India, China and Southeast Asia, are now being reminded why Singapore\'s stability commands a premium. Reuters has reported that wealthy Asian clients are actively exploring moving Dubai assets closer to home. The flow is not a flood yet, but the direction is clear.\n\nWhat is less discussed is the opportunity this creates for mid-tier Swiss and European private banks that have always struggled to compete with Dubai\'s growth narrative. The argument for concentration, for building your wealth management life entirely around one jurisdiction\'s momentum, has just been complicated in ways that even the most optimistic Dubai bulls are finding difficult to dismiss.\n\n## The long view\n\nDubai has absorbed shocks before that commentators predicted would be fatal, and it has emerged intact. The 2009 property crisis. The pandemic. Periodic regional tensions that rattled confidence without breaking it. The city\'s leadership understands at a very deep level that its only real product is confidence.\n\nBut there is something categorically different about a conflict that strikes the DIFC, the airport, and the data infrastructure of the banking system. Henley and Partners, who advise wealthy families on residence and citizenship strategies, said publicly that situations like this reinforce the value of what they call global optionality. Internationally mobile families that have diversified their residence and assets across multiple jurisdictions are better positioned than those who concentrated everything in a single location whose safety they took for granted.\n\nThat is the real lesson for the private banking industry, and it is one that practitioners in Geneva and Zurich have always understood intellectually but perhaps struggled to articulate to clients who were enjoying Dubai\'s sunshine, its zero-tax environment and its sense of forward momentum. Jurisdictional diversification is not a product you sell when markets are calm. It is the product you wish you had sold when they are not.\n\nThe conflict\'s resolution will determine whether what we are witnessing is a correction or a turning point. A swift ceasefire and Dubai will recover, markets will stabilise, the HNW community will return, and the city will rebuild its narrative with characteristic speed. If the conflict extends, the damage to Dubai\'s core proposition will be structural in ways that take years to repair and that reshape the careers of everyone who built their professional life around Gulf private banking.\n\nFor now, the phones are ringing in Geneva. And the private bankers picking them up understand, better than most, that the question on the other end of the line is never really about missiles.\n\nIt is always about trust.`,\n    title: "When the Safe Haven Isn\'t Safe Anymore",\n    date: "2026-03-24",\n    markets: ["UAE", "CH", "ASIA"],\n    summary: "Dubai\'s entire value proposition as a global financial hub was built on one promise: that it was a safe, neutral, prosperous island in a difficult neighbourhood. Since late February 2026, that promise has become harder to say with a straight face.",\n    linkedinUrl: "https://www.linkedin.com/pulse/when-safe-haven-isnt-anymore-gil-m-chalem--hiuqe/",\n    featured: true,\n    engagementScore: 87,\n    pillar: "P1",\n    subTheme: "Positioning",\n    keywords: ["Dubai private banking risk", "Middle East wealth management", "private banker Dubai career", "geopolitical risk banking"],\n  },\n  {\n    slug: "julius-baer-cut-jobs-strong-2024",\n    ogImage: "/og-articles/og-julius-baer-cut-jobs-strong-2024.jpg",\n    body: `I had a conversation a few weeks ago with a senior relationship manager at Julius Baer. Good MEA banker. Solid UHNW book, CHF 650 million, with clients he had built over fourteen years. He was not worried. His AUM was up. His client retention was strong. The bank had just posted a 125% jump in net profit. He felt, reasonably enough, that he was on the right side of things.\n\nI did not tell him he was wrong. But I did tell him that the question he should be asking himself had nothing to do with his own performance.\n\nThat is a harder thing to hear than it sounds.\n\n## What actually happened at Julius Baer\n\nTo understand the career lesson here, you have to understand the mechanics of what has been happening at the bank over the last eighteen months, because most of the coverage has focused on the headlines and missed the structure underneath.\n\nStefan Bollinger arrived as CEO in January 2025 after a period that had been, to put it charitably, difficult. In 2023, Julius Baer took CHF 606 million in write-downs on loans extended to Rene Benko\'s Signa real estate empire, which collapsed and dragged the bank\'s profit down by roughly half. It was not just the financial loss that damaged Julius Baer. It was what the Signa exposure revealed about risk governance: a pure-play wealth manager, a bank whose entire identity rests on the quality of its judgment, had concentrated significant credit exposure in a single counterparty in a sector it had no particular expertise managing. FINMA opened an investigation. The reputational damage was real, and it has not fully resolved.\n\n2024 was the recovery year, one of the bank\'s strongest in recent memory. Net profit rebounded to CHF 1.02 billion. AuM grew 16% to CHF 497 billion. Net new money came in at CHF 14.2 billion. Operating income rose 19% to CHF 3.86 billion.\n\nAnd then, within weeks of his arrival, Bollinger announced 400 job cuts, slashed the executive board from 15 members to 5, and set a CHF 110 million cost-reduction target. Shares fell more than 8% on the day.\n\nIf your first reaction to that sequence is confusion, you are not alone.\n\nThe explanation is the cost/income ratio. At 70.9% for 2024, Julius Baer was running one of the least efficient cost structures of any major Swiss private bank, against a target of 64% that Bollinger himself publicly described as still unsatisfactory and far removed from where it needed to be. The bank was growing revenue, growing AuM, attracting net new assets and still could not bring its cost base into alignment with what the business actually generated. That is a categorically different problem from a merger, a market collapse, or a rogue credit exposure. It is a structural problem. And structural problems require structural solutions, not a good quarter.\n\nThere is another number worth noting. The Swiss Bank Employees\' Association pointed out in their public response to the cuts that Julius Baer had added 170 employees the previous year, before eliminating 400 the next. The job cuts were announced before Bollinger had published any strategic plan. You hire, you restructure, you cut. Then you explain the strategy.\n\n## A pattern that goes deeper than one cycle\n\nWhat makes Julius Baer particularly instructive as a case study is that this is not the first time. The Swiss Bank Employees\' Association made a point of noting this in their statement. Julius Baer had already carried out significant layoff rounds in 2020, 2021, and 2024. Three restructuring cycles in five years, and now a fourth. Each time, the logic was similar: cost base too high, headcount not aligned with revenue generation, need to reset.\n\nThis is not a criticism of the bank\'s management. In each of those years there were specific external catalysts, COVID, market volatility, the Signa fallout. Bollinger\'s version is arguably the most structurally coherent of the four, because he is attempting to address the cost/income ratio as a strategic target rather than as a crisis response. The 64% goal, the board reduction from 15 to 5, the decision to have the CEO directly oversee all revenue-generating divisions, these are architectural changes, not cost theater.\n\nBut the pattern should be noticed by anyone thinking about career risk in private banking, because Julius Baer is not an outlier. It is a signal.\n\nThe Swiss wealth management industry is under sustained pressure on margins. The number of Swiss banks has declined steadily for years, from 186 institutions in 2006 to around 100 by the end of the last decade. The consolidation continues. And the pressure on cost/income ratios is not unique to Julius Baer. When a leading franchise, posting record net new money, still has to restructure because its operating model is too expensive, it tells you something about where the pressure is going across the industry.\n\n## The merger risk and the structural risk are not the same thing\n\nIn the piece I wrote recently about the UBS-Credit Suisse integration, I talked about redundancy risk as something that is relatively legible. Two banks become one, two teams become one, someone goes. You can see the shape of it, even if the timing is uncertain.\n\nWhat Julius Baer represents is different, and in some ways harder to navigate, because the risk does not come from overlap. There is no merger logic to trace. There is no duplicated desk to point at. The bank is structurally profitable, growing its asset base, doing the things a wealth manager is supposed to do and still concluding that it employs too many people relative to what those people generate.\n\nIn that environment, the usual defensive instincts fail. You cannot protect yourself by being good at your job, at least not in the way most bankers mean when they say that. You cannot point to a strong 2024. You cannot argue that your book is up. The exposure comes from a different direction entirely: from a management that has decided that the cost structure, not the revenue line, is the problem to solve. And cost structures are solved by looking at headcount ratios and function-by-function economics, not by looking at individual performance reviews.\n\n## What competing banks are doing right now\n\nSomething worth saying explicitly: the talent coming out of Julius Baer during this restructuring is attracting real interest. A bank with CHF 521 billion in assets and a consistent net new money track record has well-trained people, and the UHNW segment that Julius Baer serves, European family wealth, Middle Eastern capital, sophisticated mandates, is exactly what a number of expanding private banks are looking to absorb.\n\nFrom what I see in my own practice, the banks most actively interested in Julius Baer profiles right now are those in the mid-tier Swiss space that have capacity for experienced UHNW relationship managers and are prepared to offer the kind of guarantees that make a move viable. Some international players expanding their [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich) presences are in the same conversation. They are not waiting for the restructuring to conclude before identifying the people they want. In executive search, the strongest mandates move before the candidate pool has fully formed. By the time a restructuring is publicly complete, the best placements have usually already happened.\n\nIf you are a Julius Baer relationship manager reading this and you are not in active conversation with anyone externally, not a headhunter, not a competing bank, not even an informal coffee, you are behind the curve. Not because you need to leave. But because you do not yet know what your options are, and you should.\n\n## The question that most private bankers cannot answer\n\nI want to come back to the banker I mentioned at the start, because his situation illustrates something I see constantly in this market.\n\nHe was not complacent in any meaningful sense. He was doing his job well. His clients were happy. His AUM was growing. By every internal metric his bank uses to evaluate relationship managers, he was performing. The problem was that he had never been forced to think about his career the way a bank thinks about a cost/income ratio, with genuine precision, from the outside in.\n\nWhen I asked him what percentage of his CHF 650 million would realistically follow him to a new institution, he paused for a long time. Then he said something like 70%, maybe 80%. When we worked through it together, client by client, relationship by relationship, looking at how each account originated, who held the decision-making power in each family, which clients had multi-bank relationships versus exclusive arrangements, which ones had credit facilities or structured products lodged with Julius Baer that would make a transition complicated, the portable number was closer to 40%.\n\nThat is not a bad number. CHF 260 million of genuinely portable, self-originated relationship capital is a real asset. But it is a very different conversation than CHF 650 million. And the difference between those two numbers is what a hiring committee actually underwrites when they make you an offer.\n\n## The metrics that actually travel\n\nBecause this keeps coming up in conversations I have at Executive Partners, let me be direct about what a hiring committee at a serious private bank actually evaluates when they look at a senior RM from Julius Baer or anywhere else.\n\nThe first thing is [portability](/en/portability), not your headline AUM but the portion of it that is genuinely yours. Relationships you originated. Clients who chose you personally. Capital that is not institutionally anchored to a platform, a custody arrangement, or a credit facility the client is unwilling to restructure.\n\nThe second is revenue quality. A CHF 650 million book generating 40 basis points of annual revenue is a different business proposition from a CHF 650 million book generating 70 basis points, even if the AUM headline is identical. Hiring committees want to understand your return on assets, the mix between discretionary mandates and advisory and execution-only, and your trajectory on net new asset generation.\n\nThe third is client concentration. If your top three clients represent the majority of your assets, you are a concentrated risk, not a diversified revenue stream. The strongest private banking profiles I place carry a book distributed across 30 to 60 relationships, with no single client representing more than 10 to 15% of total AUM.\n\nThe fourth, and the one that separates the candidates who receive the strongest offers, is the [business plan](/en/bp-simulator). At Executive Partners, we do not present a senior RM to a bank without a credible three-year plan that specifies where the net new assets will come from, what the pipeline looks like, which relationships are already in progress, and what the development strategy for existing clients is. A banker who can articulate this clearly, with specifics not generalities, has done something that most of their peers have not done in years, if ever.\n\n## What this moment actually requires\n\nJulius Baer will likely complete its restructuring broadly on the timeline Bollinger outlined. The cost/income improvement is real. The bank is exiting private debt, cleaning up its remaining real-estate loan exposures, and refocusing on pure wealth management. The strategic direction is clearer now than it was twelve months ago.\n\nBut for anyone inside the institution, or at any Swiss private bank navigating the same kind of structural pressure, the useful response is not to wait and see. It is not to assume that your performance insulates you. It is not to take comfort from the fact that your segment has not been touched yet.\n\nThe useful response is to treat this moment as a forcing function for a conversation you should probably have been having anyway. What is your book actually worth on the open market? What is your portability score? What would a three-year business plan look like if you had to write it today? And who, outside your current institution, knows who you are and what you bring?\n\nThe bankers who emerge from restructuring moments in the strongest position are never the ones who were most secure the week before the announcement. They are the ones who had already done that work, who had a current view of their own value, who had kept their external relationships alive, and who had options before options became urgent.\n\nJulius Baer reported CHF 14.4 billion in net new money in 2025 while simultaneously managing its fourth restructuring cycle in five years and reporting a 25% drop in annual profit. That combination, resilient asset gathering, persistent cost pressure, regulatory overhang, is the condition that defines this moment in Swiss private banking more broadly. It is not unique to one bank, and it will not resolve in one cycle.\n\nIt is a reminder that in this business, the question has never really been whether you are doing a good job today. It is whether you have built a career that holds its value when the context changes.`,\n    title: "Julius Baer Cut Jobs Even After a Strong 2024. Every Private Banker Should Pay Attention.",\n    date: "2026-03-23",\n    markets: ["CH", "UK", "UAE", "ASIA"],\n    summary: "Julius Baer posted a 125% jump in net profit. Then cut 400 jobs and set a CHF 110 million cost-reduction target. The question every private banker should be asking has nothing to do with their own performance.",\n    linkedinUrl: "https://www.linkedin.com/pulse/julius-baer-cut-jobs-even-after-strong-2024-every-pay-gil-m-chalem--nb7be/",\n    featured: true,\n    engagementScore: 89,\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    keywords: ["Julius Baer restructuring", "Swiss private banking jobs", "private banker career risk", "banking cost reduction"],\n  },\n  {\n    slug: "why-senior-rms-going-independent",\n    ogImage: "/og-articles/og-why-senior-rms-going-independent.jpg",\n    body: `Last month I had three separate conversations with senior private bankers who asked me some version of the same question. Not can you help me move to another bank. The question was different. It was: should I just go independent?\n\nOne was at a major Swiss private bank navigating its third restructuring in four years. One had spent fifteen years at an institution he genuinely liked but was watching his client base age without any real platform to develop the next generation of relationships. The third had just lost a significant client to an independent wealth manager who, in his words, had no platform, no brand, and no research department and still won the mandate because the client trusted him personally.\n\nThree different situations. Three different frustrations. One recurring question.\n\nThe EAM model, external asset managers or independent wealth managers working outside the bank structure, is not a new concept in Switzerland. What is new is how often the question comes up in conversations that used to be purely about lateral moves within the banking system. Something has shifted, and I think it is worth being direct about what that shift is, who it actually makes sense for, and what the real costs are that most bankers do not see until it is too late.\n\n## The landscape these bankers are looking at\n\nThe Swiss EAM sector is genuinely substantial. FINMA, which has required all portfolio managers and trustees to hold a formal licence since the Financial Institutions Act came into force in January 2020, had approved a total of 1,532 licences as of February 2025, out of 1,864 applications submitted since the requirement was introduced. That gives you a sense of the scale of the regulated independent wealth management sector in Switzerland, over a thousand institutions, ranging from one-person advisory boutiques to multi-manager platforms overseeing several billion francs.\n\nThe assets under management across this sector are significant. Industry estimates have consistently placed the collective AuM of Swiss EAMs in the range of CHF 300 to 400 billion. What is clear is that custody banks take this segment seriously as a revenue source. UBP, one of the most active EAM custodian banks in [Geneva](/en/markets/geneva), had CHF 23 billion of its total CHF 171.7 billion in AuM attributed to EAM clients as of early 2026. Lombard Odier has been servicing EAMs since 1987. Pictet, J.Safra Sarasin, Mirabaud, Bordier, Banque Syz all run dedicated EAM desks. The infrastructure to support an independent manager is well-developed and genuinely competitive.\n\nOn the M&A side, PwC reported nine publicly disclosed EAM transactions in the first half of 2025 alone, driven by rising regulatory costs, succession planning, and growing private equity interest in consolidating the sector. The consolidation is real, but so is the new formation: many new EAM entrants in 2025 were spin-offs from larger EAM platforms or bank teams, operating with lean structures and focused client rosters.\n\nWhat is accelerating the interest among bank-employed RMs is also structural. In some Swiss financial institutions, up to 60% of results now stem from the EAM department rather than traditional private banking. Banks that used to tolerate EAMs as a minor adjacent business are increasingly dependent on them. That dynamic has not been lost on experienced relationship managers who look at their client book and ask themselves which side of that equation they want to be on.\n\n## What the three people who called me actually had in common\n\nBefore I get into the framework I use to think about this, I want to say something about those three bankers I mentioned at the start, because they illustrate the range of motivations better than any generalisation can.\n\nThe first was genuinely portable. He had built his book himself over a decade, mostly UHNW clients from a specific geographic market where he had personal relationships going back years. His clients knew him, not his bank. When we worked through the portability analysis together, looking at the source of each relationship, the existence of credit facilities or structured products that would anchor clients to the current institution, the concentration of decision-making, the number that emerged was solid. Around 65% of his book had genuine portability. That is a meaningful base to build on as an independent.\n\nThe second banker was a different story. His book was large on paper, CHF 900 million, but the majority of it had come through referrals from the bank\'s private equity network, or from clients introduced through the bank\'s family office platform. The relationships were real and warm. But they were warm to the institution as much as to him personally. His portable number, when we went through it honestly, was closer to 25%. Going independent on 25% of CHF 900 million is a different calculation entirely.\n\nThe third was somewhere in between, but the platform frustration was genuine and I took it seriously. He had watched a client move CHF 80 million to an independent who offered nothing his bank did not offer, except one thing: the client felt ownership of the relationship. He felt like a client of the manager, not a client of the bank. That is a competitive dynamic that matters and that is not going away.\n\n## The real question is not can I go independent — it is what am I actually selling\n\nHere is the thing I tell every banker who asks me about the EAM route. The question you need to answer before anything else is not about the regulatory requirements, the minimum capital, the custody bank selection, or the fee structure. Those are all solvable problems. The question is: what is the asset you are actually selling?\n\nIn a bank, you are selling access to a platform, to a research department, to a credit offering, to a brand that certain clients find reassuring. Your value proposition is partially institutional. The bank lends you credibility, especially with new clients who do not know you personally.\n\nAs an EAM, you are selling yourself. Your judgment, your relationships, your independence. The open architecture custody model means you can genuinely offer multi-bank solutions and product neutrality that an employed relationship manager cannot. That is a real advantage for certain clients. But it only works if the client is choosing you, not just following you out of inertia.\n\nThis is why portability, and not headline AUM, is the single most critical variable in the decision. A banker with CHF 400 million of genuinely portable, self-originated, personally trusted relationships is a better candidate for the EAM model than a banker with CHF 1.2 billion sitting on a book where 70% of the relationships are institutionally anchored. The first person has an asset. The second person has a reporting line.\n\n## What actually going independent costs\n\nI have seen enough of these transitions to be direct about the parts that do not get discussed honestly.\n\nThe compliance infrastructure is more expensive and more time-consuming than most bankers expect. Under the FinIA framework, a FINMA portfolio manager licence requires a defined governance structure, qualified personnel at the management level, minimum equity capital of CHF 100,000, and affiliation with one of five FINMA authorised supervisory organisations. The FINMA licensing process itself can take anywhere from several months to well over a year. FINMA\'s own data shows that in more than 40% of the applications it received in the most recent cohort, it had to request amendments at least five times. This is not a paperwork formality. It is a substantive compliance exercise, and it requires either significant personal bandwidth or the cost of external legal and regulatory counsel to navigate properly.\n\nThen there is the custody bank negotiation. A new EAM with CHF 200 to 300 million does not walk into Pictet or Lombard Odier and receive the same service terms as an established EAM with CHF 2 billion. Minimum asset thresholds for access to certain custody platforms have risen, and banks have become more selective about which new EAMs they onboard. The senior RM who leaves a top-tier private bank and assumes he will have seamless access to the same platforms on day one as an independent is usually in for a recalibration.\n\nFinally, there is the operational reality of running a business. A managing partner of an EAM is not doing pure relationship management. He or she is handling HR, technology decisions, compliance reporting, custody bank relationships, and a hundred other things that the bank absorbed silently in the background. Some bankers discover that they love this. Many discover, somewhat painfully, that they do not.\n\n## The profile that works and the one that does not\n\nBased on the transitions I have observed and the ones I have advised on over the years, there is a reasonably clear profile on both sides of this decision.\n\nGoing independent tends to work well when three things are present simultaneously: a genuinely [portable book](/en/portability) with a high proportion of self-originated, personally trusting relationships; an entrepreneurial disposition that finds the operational complexity of running a business energising rather than distracting; and a client base that is sophisticated enough to understand and value what the independent model offers, multi-custody access, product neutrality, genuine advisory independence. UHNW clients with complex cross-border situations and multiple bank relationships are often well-served by an EAM model. Clients who want the reassurance of a large institutional brand, or whose relationship with the bank is partly driven by credit or structured product access, are not good portability candidates regardless of how warm the personal relationship feels.\n\nGoing independent tends to fail when the book is more institutional than personal, when the motivation is primarily reactive, frustration with a restructuring, irritation with a management decision, a bad performance review year, rather than genuinely strategic, or when the regulatory and operational complexity is underestimated as an administrative nuisance rather than treated as a serious business investment.\n\nThe honest version of this conversation is not should you go independent. It is: are you the kind of asset that generates its own gravity, or are you the kind of asset that performs well within a structure? Both can be excellent. They are not the same thing.\n\n## What I told the three bankers\n\nThe first one, the one with the genuinely portable book and the long personal relationships, I encouraged to take the EAM route seriously. Not immediately. But to spend the next six months building the [business case](/en/bp-simulator) properly: mapping the portability client by client, selecting a custody bank partner, understanding the regulatory requirements, and being honest about the operational dimension. For him, the model fits.\n\nThe second, the one with CHF 900 million on paper and 25% portability, I told him plainly that the EAM route was not the answer to his problem. His problem was that his book was more institutional than personal. The solution to that problem is not to leave the institution. It is to spend the next three years deliberately changing the composition of the book, strengthening personal ties with the clients he genuinely owns, and developing the pipeline that makes him genuinely portable when the time comes. Going independent on 25% of a large book is not freedom. It is a significant step down with a compliance burden on top.\n\nThe third, the one who was losing clients to independents, I told something different. His frustration was real and the competitive dynamic he described was real. But the answer for him was not necessarily to become an EAM. It was to understand more clearly what his clients actually valued about him, and whether the bank\'s platform was genuinely inhibiting that value or whether he was rationalising a structural problem that belonged to him, not to the institution.\n\nThat distinction, whether the constraint is external or internal, is the most important question in this conversation. And in my experience, bankers who are honest enough to sit with it for a while usually find the answer they need.\n\nThe EAM model in Switzerland is robust, well-regulated, and genuinely competitive with the bank model for the right kind of client and the right kind of advisor. But it is not an escape hatch. It is a business. And like any business, it rewards the people who treat it that way from the start.`,\n    title: "Why More Senior RMs Are Asking Me About Going Independent. And What I Tell Them.",\n    date: "2026-03-17",\n    markets: ["CH", "UK", "UAE", "ASIA"],\n    summary: "Last month I had three separate conversations with senior private bankers who asked some version of the same question: should I just go independent? The EAM model is not a new concept. What is new is how often the question comes up.",\n    linkedinUrl: "https://www.linkedin.com/pulse/why-more-senior-rms-asking-me-going-independent-what-i-gil-m-chalem--kglqe/",\n    featured: true,\n    engagementScore: 84,\n    pillar: "P1",\n    subTheme: "ScaleVsBoutique",\n    keywords: ["EAM Switzerland", "independent wealth manager", "private banker going independent", "FINMA portfolio manager licence"],\n  },\n  {\n    slug: "ubs-integration-career-problem",\n    ogImage: "/og-articles/og-ubs-integration-career-problem.jpg",\n    body: `Let me tell you about two phone calls I had last week.\n\nThe first was from a senior RM at UBS in [Zurich](/en/markets/zurich). Twelve years in the business, CHF 800 million book, mostly UHNW clients inherited from the Credit Suisse side. He is watching colleagues get restructured out. He is watching the IT migration disrupt client relationships he spent years building. He wants to explore his options. Fair enough.\n\nThe second call was from a head of desk at a mid-sized [Geneva](/en/markets/geneva) bank. She is trying to hire exactly the kind of profile that first guy represents. She has been looking for months. Cannot find the right person.\n\nHere is the problem: when I looked at that first RM\'s CV, I understood why he would struggle. His profile read like a LinkedIn summary from 2018. CHF 800 million AUM front and centre, a list of employer names, some vague language about delivering bespoke wealth solutions. Nothing that would make a hiring committee sit up.\n\nThis is a pattern I see constantly, and the UBS-Credit Suisse integration is making it worse. Thousands of highly competent bankers are about to enter a job market they have not navigated in years, armed with CVs that fundamentally misunderstand what hiring decisions are actually based on.\n\n## The numbers at UBS\n\nFull-year 2025 net profit came in at $7.8 billion, up 53%. Group invested assets crossed $7 trillion for the first time. About 85% of Swiss-booked Credit Suisse accounts have been migrated onto UBS systems. On paper, this is a success story.\n\nBut underneath those headline numbers, the human reality is more complicated. The merger swelled UBS\'s workforce to nearly 120,000 overnight. Roughly 15,000 positions have been eliminated so far, which is less than half the internal target of 35,000 that Bloomberg reported. CEO Sergio Ermotti confirmed in January 2026 that fresh layoffs were coming, and in February he told reporters that the majority of Swiss job reductions would land in the second half of 2026.\n\nThe UHNW client migration has been particularly messy. UBS delayed the transfer of ultra-high-net-worth Credit Suisse clients from September 2025 to Q1 2026, spreading them across January, February and March waves. Integration teams were overworked, and some glitches emerged in earlier migration waves. Sources close to the process said UBS was concerned that outflows from former Credit Suisse clients could exceed expected levels during the transition.\n\nWhat does all this mean in practical terms? It means the talent market in Swiss private banking is about to get significantly more active. Not just because of layoffs, but because of uncertainty. Relationship managers who have spent two years navigating integration fatigue are reassessing. Some will be pushed. Many more will jump.\n\n## The AUM problem\n\nI have placed senior bankers across Geneva, Zurich, [London](/en/markets/london), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore) and other financial centres. I can tell you with confidence that the single most overrated metric in private banking hiring is AUM.\n\nEvery RM leads with it. Every CV opens with it. And every hiring committee knows that a headline AUM number, on its own, tells them almost nothing useful about whether this person will generate revenue at their bank.\n\nHere is why. AUM is not a measure of skill. It is a measure of circumstance. Did you build that book yourself, or did you inherit it from a retiring colleague? Are those clients genuinely yours, or are they institutionally loyal to the platform you happen to sit on? Will they follow you, or will they stay where their custody agreements, lending facilities and structured products are housed?\n\nThese are the questions hiring managers actually ask. And when your CV does not answer them, you are leaving it to the hiring committee to guess. They will not guess in your favour.\n\n## What actually matters\n\nWhat actually matters breaks down into a handful of dimensions that most CVs completely ignore.\n\nThe first is [portability](/en/portability). Not your total AUM, but what percentage of it would realistically follow you to a new institution. This depends on how you acquired those clients. Self-originated relationships with personal trust are portable. Inherited book clients who have never met you outside of a quarterly review are not. At Executive Partners, we have developed a Portability Score methodology precisely because this distinction is so critical and so poorly understood.\n\nThe second is revenue quality. A CHF 1 billion book generating 30 basis points of revenue is fundamentally different from a CHF 400 million book generating 80 basis points. Hiring managers care about net new asset generation, return on assets, and the mix between discretionary mandates, advisory and execution-only. A banker who brings CHF 50 million in genuine net new money per year is more valuable than one sitting on a CHF 2 billion static book that has not grown in five years.\n\nThe third is client concentration. If your top three clients represent 60% of your AUM, you are a concentrated risk, not a diversified asset. Banks know that one client departure can destroy your economics. The strongest profiles show a well-distributed book across 30 to 60 relationships, with no single client exceeding 10 to 15% of total assets.\n\nThe fourth, and this is the one that separates the serious candidates from the also-rans, is the [business plan](/en/bp-simulator). When I present a candidate to a bank, the first thing they want to see after the CV is a credible three-year business plan. Where will the net new assets come from? What is your pipeline? Which prospects are realistic and which are aspirational? What is your development strategy for existing clients? A banker who can articulate this clearly has done something most of their peers have not: they have thought about their career as a business, not just a job.\n\n## Why this moment is urgent\n\nThe talent coming out of this integration is, on average, very good. Credit Suisse had a strong franchise in certain segments, particularly CIS/CEE, Latin America, and Middle Eastern UHNW. Many of the RMs who served those clients are skilled, well-connected, and carry genuine portable relationships. The market knows this. Competing banks, from Julius Baer to EFG to Lombard Odier to Vontobel to UBP to the international players expanding in the region, are actively building capacity to absorb this talent.\n\nBut there is a window, and it is not unlimited. The most strategic hiring has already begun. Banks that were waiting for the dust to settle are now moving. The second half of 2026, when the bulk of remaining Swiss job cuts will land, will bring the biggest wave of talent movement. If you are an RM at UBS thinking about your next step, you do not want to be one of 500 people entering the market simultaneously. You want to be positioned before the wave hits.\n\nThat means getting your story right now. Not your AUM number. Your story.\n\nWhat did you actually do during the integration? Did you retain clients through the migration? What was the attrition rate on your book versus the broader portfolio? Did you bring in net new assets despite the turmoil? These are the data points that will differentiate you. The integration, for all its pain, is actually a career asset if you know how to frame it. Anyone who held their book together through the most complex bank merger in history has a resilience narrative that is genuinely compelling.\n\nI also want to address something I hear regularly from senior bankers who say they are not actively looking. In this market, passive is not a strategy. The best roles in private banking are never publicly advertised. They are filled through networks, through headhunters, through referrals. By the time a job appears on LinkedIn, the shortlist has usually been finalised weeks ago.\n\nIf you are a senior RM with a genuine book and real client relationships, you owe it to yourself to understand your market value, even if you have no intention of moving tomorrow. Know your Portability Score. Have a current business plan. Keep your CV updated with the metrics that actually matter. Build relationships with the recruiters who specialise in your segment.\n\nBecause in this market, the window opens fast and closes faster.\n\nThe UBS integration will be substantially complete by the end of 2026. The remaining cuts will be concentrated in the second half of this year, particularly after the IT migration is finalised. Wealth management employees have been relatively protected so far, but as the operational infrastructure consolidates, some client-facing roles will become redundant too.\n\nFor competing institutions, this is a generational hiring opportunity. For RMs inside UBS, it is a moment to be honest about whether the post-integration platform serves your clients and your career. And for every senior banker in the market, regardless of where you sit, it is a reminder that your CV is not a historical document. It is a sales pitch. And right now, most of them are pitching the wrong thing.\n\nStop leading with your AUM. Start leading with what makes you portable, productive, and strategic. That is what gets you hired.`,\n    title: "The UBS Integration Is Exposing a Career Problem Most Senior Bankers Don\'t Know They Have",\n    date: "2026-03-10",\n    markets: ["CH", "UK", "UAE", "ASIA"],\n    summary: "The single most overrated metric in private banking hiring is AUM. Every RM leads with it. Every hiring committee knows a headline AUM number tells them almost nothing useful about whether this person will generate revenue at their bank.",\n    linkedinUrl: "https://www.linkedin.com/pulse/ubs-integration-exposing-career-problem-most-senior-dont-m-chalem--e8iac/",\n    featured: true,\n    engagementScore: 91,\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    keywords: ["UBS integration", "private banking CV", "AUM portability", "relationship manager hiring"],\n  },\n  {\n    slug: "storm-warning-tariffs-zero-rates-crypto",\n    ogImage: "/og-articles/og-storm-warning-tariffs-zero-rates-crypto.jpg",\n    body: `I need to talk about what just happened. Because if you are a senior RM and you are not connecting the dots between what went down in late February and your own career, you are sleepwalking.\n\nIn the space of ten days, three things hit at once.\n\nThe US Supreme Court struck down Trump\'s tariffs 6 to 3, no ambiguity. The IEEPA, the legal basis for the broadest trade levies, was ruled unconstitutional for tariff purposes. Gone. That is $160 billion in duties invalidated, and a refund pile that Reuters and Penn-Wharton estimate at over $175 billion, with zero clarity on how or when anyone gets paid back. And before the ink was dry, Trump announced a replacement 15% global tariff under different legal authority and warned that any country trying to exploit the ruling would get hit harder. So the court said no, and the White House said watch me. Markets did not know whether to rally or panic. They did both.\n\nSame day: US core PCE, the Fed\'s favourite inflation gauge, printed at 3%. Highest since late 2023. Stagflation is no longer a hypothetical dinner party topic. It is showing up in the data.\n\nAnd meanwhile, Bitcoin is sitting in the $60,000 to $70,000 range after peaking last year, with spot ETFs bleeding roughly $4 to $4.5 billion over five straight weeks of outflows. The institutional money that poured in during 2024 and 2025 is pulling back.\n\nNow. You might be reading this from your desk in [Geneva](/en/markets/geneva) or [Zurich](/en/markets/zurich) or [Singapore](/en/markets/singapore) thinking, okay, interesting macro stuff, but I have clients to call. That is exactly the problem. This is not background noise. This is the new operating environment for private banking. And it is going to change your job, your product shelf, your comp, and potentially your next career move.\n\n## Your clients are feeling the tariff chaos even if they do not say it\n\nThe Supreme Court ruling was supposed to settle things. It did not. The legal basis shifted, the tariffs morphed, and the uncertainty stayed. Nobody knows what the trade landscape looks like in six months.\n\nIf you have entrepreneurial clients with manufacturing, supply chains, or export exposure, and most of us do, they are staring at a planning horizon that will not stop moving. The IMF\'s January 2026 update puts global growth at 3.3%, which sounds okay until you read the fine print: risks tilted firmly to the downside. UNCTAD is more blunt, they say 2.6%. The US should grow around 2.4% but with so much policy noise baked in that the number almost does not matter. Europe is limping at 1.3%.\n\nClients are asking tougher questions. They want to know what tariff exposure looks like inside their equity allocations. They are worried about the dollar. Rabobank projects EUR/USD at 1.18 within twelve months, and the greenback has been weak. They are hearing about the EU\'s ReArm Europe defence spending push and asking whether that is a real investment theme or just politics. These are not easy conversations, and the bankers who can navigate them are going to stand out.\n\nFor those of us based in Switzerland, there is an extra layer. The SNB cut to 0% in June 2025 and has not budged since. Inflation forecast for 2026: 0.3%. GDP growth: about 1%. According to the EY Banking Barometer 2026, 46% of Swiss banks expect their operating results to decline this year, the worst short-term sentiment in fifteen years. The interest margin windfall from 2022 to 2023 is gone. Commission income keeps sliding. There is no rate hike coming to save anyone, most economists do not expect one until 2027 at the earliest.\n\nSo if you are an RM in this market, the question is simple and uncomfortable: how do you justify your seat?\n\n## Crypto just became your problem\n\nI know. Half of you just rolled your eyes. Stay with me.\n\nIn January 2026, Bloomberg reported that UBS, the world\'s biggest wealth manager with over $6 trillion in client assets, is preparing to offer direct Bitcoin and Ethereum trading to select private banking clients. Starting in Switzerland. With plans to expand to Asia and the US.\n\nThis is not a fintech startup. This is UBS.\n\nThey are not the only ones. Morgan Stanley opened crypto fund access to all wealth management clients in late 2025, not just the high-risk-tolerant ones. BofA and Wells Fargo rolled out spot Bitcoin ETF access for qualified clients. Julius Baer has had digital asset services through AMINA Bank since 2020.\n\nThe regulatory picture is what has changed. The US passed the GENIUS Act, creating a federal framework for stablecoins. The CLARITY Act is moving through Congress. The SEC and CFTC launched a joint initiative to harmonise oversight. Goldman Sachs survey data shows 35% of institutions say regulatory uncertainty is the biggest barrier to adoption, and 32% say clarity is the biggest catalyst. That clarity is arriving now.\n\nThe numbers are hard to ignore. Spot Bitcoin ETF assets peaked near $115 billion before the recent pullback. Ether ETFs crossed $20 billion. Fair-value accounting rules removed the balance-sheet penalty that used to scare off treasurers.\n\nWithin the next year or so, a real share of your UHNW clients will bring this up if they have not already. Not because they are speculating. Because their family office peers in Singapore are quietly allocating 2 to 3% through regulated ETFs. Because their corporate treasury is looking at tokenized bonds. Because their kids think Bitcoin is as obvious as equities. The next generation is not asking permission.\n\nYou do not need to become a crypto evangelist. But you do need to be able to hold a credible conversation about it. The difference between direct custody and ETF exposure. What MiCA means for European clients. How tokenization of real-world assets actually works. If you cannot, someone else will have that conversation with your client. And they will not send them back.\n\n## Zero rates and what they mean for your pay\n\nI will be direct. The return to 0% in Switzerland has changed the economics of private banking in ways that are going to hit relationship managers personally.\n\nSwiss bank aggregate net income dropped from CHF 72.3 billion in 2023 to CHF 69.7 billion in 2024. That interest income from SNB sight deposits, CHF 0.8 billion in 2022, then CHF 7.4 billion in 2023, is gone. Commission income is still falling. And with the SNB forecasting 0.3% inflation and most economists seeing no rate hike before 2027, this is the new normal. Not a dip. A reset.\n\nBanks are responding the way banks always respond: cost pressure, revenue scrutiny, and a microscope on RM productivity. Adding relationship managers does not automatically add revenue. Banks have internalized that. They are measuring revenue per RM now, and they are making decisions based on it.\n\nWhat I am seeing in my placements: banks want candidates who can show active revenue generation, NNA growth, mandate penetration, lending cross-sell. Not just a big AUM number. They are asking about product breadth, structured products, alternatives, private markets, digital assets. And compensation structures are shifting. The guaranteed 18 to 24 month package is getting harder to negotiate. Variable components tied to revenue milestones are becoming the norm, even for senior hires. If you have been in the market recently, you have probably felt this already.\n\n## Where the opportunities actually are\n\nThe talent market across the major hubs is uneven right now, and understanding the landscape matters if you are thinking about a move.\n\nGeneva and Zurich are cautious. The UBS-Credit Suisse integration is still displacing people, and zero rates are squeezing every institution\'s margins. But the flip side is that mid-sized banks, Lombard Odier, Pictet, Julius Baer, Vontobel, EFG, UBP and others, are actively picking up experienced RMs with [portable book](/en/portability)s. The independent asset management sector is also growing and attracting bankers who want more control over their practice.\n\n[Dubai](/en/markets/dubai) is the most active hiring market I see right now. No income tax, a growing UHNW client base, and banks expanding aggressively into Middle Eastern and South Asian wealth. The momentum is undeniable, though the geopolitical situation has introduced variables that did not exist six months ago.\n\nSingapore is hungry but picky. Bank of Singapore is expanding hard, Standard Chartered committed $1.5 billion to affluent banking in Asia. But employment pass rules have tightened, and the talent bottleneck means banks will only move on the most portable, immediately productive candidates. If you cannot demonstrate revenue from day one, Singapore is a tough sell.\n\n[London](/en/markets/london) still works for bankers with strong European and Middle Eastern networks. But it is not a growth story anymore. Post-Brexit complexity and competition from Swiss and Asian hubs have cooled things down.\n\n## What you should actually do with all of this\n\nI will wrap up with three things you can do this week and five things that will determine whether you get hired in this market.\n\nThe three conversations: pick up the phone and ask your entrepreneurial clients whether they have stress-tested their business against a permanent 15% global tariff. Most have not, and the banker who raises it first wins the trust. Sit down with your dollar-heavy clients and reframe FX away from direction and toward their actual spending and liability profile. And when crypto comes up, have a sixty-second answer ready: three routes to exposure, ETFs, direct custody, structured notes, each with different risk, tax, and reporting implications. Not a pitch. An informed answer.\n\nThe five things banks are screening for: consistent net new asset generation over the past three to five years, new money not inherited growth. Lending penetration, Lombard, mortgages, structured lending. Product breadth beyond vanilla advisory, alternatives, structured products, private markets. Digital asset literacy, can you talk about crypto without either dismissing it or overselling it. And compensation realism, are you flexible on structure, or stuck on the old guaranteed model.\n\nI am in these hiring conversations every week across Geneva, Zurich, Dubai, Singapore, and London. The bar has gone up. The bankers who have kept pace are in the strongest position they have been in for a decade. The ones who have not need to move now before the market decides for them.`,\n    title: "Storm Warning: Tariffs, Zero Rates, and Crypto Are Rewriting the Rules for Private Bankers",\n    date: "2026-03-03",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "In the space of ten days, three things hit at once: the US Supreme Court struck down Trump tariffs, core PCE printed at 3%, and Bitcoin bled $4 billion in ETF outflows. This is not background noise. This is the new operating environment for private banking.",\n    linkedinUrl: "https://www.linkedin.com/pulse/storm-warning-tariffs-zero-rates-crypto-rewriting-rules-m-chalem--uzzfe/",\n    featured: true,\n    engagementScore: 82,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: ["private banking macro", "tariffs wealth management", "crypto private banking", "SNB zero rates"],\n  },\n  {\n    slug: "alternative-investment-tipping-point",\n    ogImage: "/og-articles/og-alternative-investment-tipping-point.jpg",\n    body: `Here is something that should keep private bankers alert: individual investors hold roughly 50% of global capital, but only 16% of alternative investment assets. That 34-percentage-point gap represents the addressable market that the entire wealth management industry is now racing to capture.\n\nThis is not just growth. It is a fundamental restructuring of who gets access to institutional-quality investments.\n\nThe walls are coming down. Fast.\n\nAnd if you are a relationship manager still operating on the old playbook where your value comes from exclusive access to private markets, you need to understand what is happening right now.\n\n## The exclusive club just opened its doors\n\nFor decades, alternative investments, private equity, private credit, real estate funds, were the playground of the ultra-wealthy. Minimum checks of $5 to $10 million. Complex legal docs. Opaque fee structures. It was designed to keep people out.\n\nThe logic was simple: alternatives are complex, illiquid, and require sophisticated understanding. Only accredited investors with substantial capital and financial expertise should participate.\n\n2026 is flipping the script.\n\nThree forces are colliding simultaneously, and their combined impact is reshaping the entire wealth management landscape.\n\nProduct innovation is breaking down barriers. Financial institutions are building products that bring private assets into retail portfolios now: target-date funds with built-in PE allocations, interval funds allowing periodic redemptions while maintaining capital for illiquid investments, managed accounts that pool smaller investors to reach institutional minimums, tokenised LP shares, and feeder funds that aggregate retail capital to meet minimum thresholds. The minimums tell the story: traditional private equity at $5 to $10 million minimum, EU ELTIF funds with no minimum whatsoever in many structures, new fintech platforms with fractional positions accessible to retail investors. From $10 million to accessible retail entry points. That is not incremental change. That is disruption.\n\nRegulatory green lights are opening the floodgates. The Trump administration\'s Executive Order is directing regulators to revisit prior guidance and consider pathways for private assets in defined-contribution plans. The potential scale is staggering: approximately $9 trillion in 401(k) assets could become eligible for alternatives allocation. If even 5% of that capital migrates to alternatives over the next several years, it will fundamentally reshape the industry\'s asset base. Meanwhile in Europe, ELTIF 2.0 activated January 2024, dramatically lowering barriers and removing minimum investment requirements in many contexts. This is not tentative exploration. Multiple regulatory jurisdictions are moving in lockstep toward the same conclusion.\n\nTechnology platforms are providing distribution at scale. Fintech platforms are the distribution infrastructure making democratization real: account opening in minutes via web or mobile, fractional investing breaking down traditional share structures, multiple liquidity options, self-directed execution without broker friction. The result: that 34-percentage-point gap between individuals\' share of global capital and their share of alternatives represents the massive addressable market that democratization is designed to capture.\n\n## The numbers that tell the real story\n\nPwC projects private market revenues will hit $432.2 billion by 2030 and account for more than half of total global asset management industry revenues.\n\nBut here is the paradox: 68% of every dollar in the industry is consumed by expenses. Fee pressure is acute: cost is now a primary driver of manager selection and replacement decisions across institutional allocators.\n\nThis collision between massive revenue growth and relentless fee pressure is forcing the entire industry to choose: scale through democratisation or defend high-margin exclusivity with dwindling addressable markets. Most firms are choosing scale.\n\n## What this means for your business\n\nYour clients now expect what was impossible 18 months ago: direct access to the same PE funds, credit opportunities, and real estate projects that only the ultra-wealthy could reach. This is not aspirational. It is becoming a baseline service expectation.\n\nI am seeing this firsthand in recruitment conversations. In my recent searches across [Geneva](/en/markets/geneva), [Dubai](/en/markets/dubai), and [Singapore](/en/markets/singapore), the compensation discussions increasingly hinge on whether the candidate can articulate how they will deliver private market access to the HNW segment, not just UHNW. That skill set is commanding 20 to 30% premiums over traditional wealth managers.\n\nOliver Wyman\'s 2026 Wealth Management Outlook identifies a critical trend: firms are tiering service propositions. The HNW tier with $1 to $10 million in investable assets is becoming digital-first, high-access, largely execution-only services with curated private markets access. The UHNW tier above $10 million remains white-glove service, deeper planning, bespoke structuring, and relationship-driven advice.\n\nThis bifurcation is existential. If you cannot deliver private market access to HNW clients through transparent, user-friendly digital interfaces, they will migrate to platforms that can. Your UHNW clients are not going anywhere yet. But your HNW book? That is vulnerable.\n\n## The skills gap nobody saw coming\n\nDeloitte\'s 2026 investment management outlook is blunt about the talent shift. Demand is rising for product specialisation in alternatives, fundraising expertise, digital fluency and technical integration, and process optimisation. Demand is flat or declining for traditional portfolio construction expertise and passive product knowledge.\n\nHere is what that looks like in practice. The old RM profile: I have relationships with top PE funds and can get my UHNW clients allocated to oversubscribed vehicles. The new RM profile: I can explain to a $2 million client why they should allocate 15% to private credit, which interval funds fit their risk and liquidity profile, how those investments integrate with their taxable accounts, and what the realistic exit scenarios look like over 5 to 7 years. One is relationship leverage. The other is subject matter expertise combined with client education. The latter is what is getting hired in 2026.\n\n## Fee compression is baked into the model\n\nHere is the paradox nobody wants to talk about: democratisation grows total AUM but shrinks profit per AUM. When private market access shifts from exclusive relationship-based sales to scalable digital channels, the friction that justified high advisory fees vanishes. Firms that compensate for margin compression through volume will survive. Those clinging to legacy, high-touch advisory models without demonstrable alpha generation are at risk.\n\n## Private credit: the poster child for democratisation and its risks\n\nPrivate credit is the best case study for understanding both the opportunity and the danger of democratisation. The sector has exploded: estimates place private credit AUM around $3 trillion at the start of 2025, with projections toward $5 trillion by 2029.\n\nHistorically, private credit was purely institutional: large pension funds, insurance companies, and family offices pursuing direct lending strategies that delivered 8 to 12% yields with lower volatility than public markets. Today, retail versions are proliferating: credit interval funds with monthly redemption windows, evergreen structures for continuous retail inflows, 401(k)-eligible private credit funds, BDC structures that trade daily on public exchanges.\n\nFor clients, private credit offers higher yields than investment-grade bonds, lower correlation to public equity markets, and exposure to middle-market lending historically inaccessible. For relationship managers, private credit is a portfolio diversifier that actually makes sense for clients in the $1 to $10 million range who need income but can tolerate some illiquidity.\n\nBut the risks are amplifying. Valuation opacity is a concern: private credit ratings are issued by firms hired and paid by the issuers themselves. Illiquidity mismatches exist: retail-facing funds promise monthly redemptions, but underlying private loans may not be saleable on the same timeline. If redemption requests exceed available liquidity, funds face forced asset sales at depressed prices or gates that suspend withdrawals entirely. The Boston Federal Reserve has explicitly warned about contagion risk between traditional banks and private credit firms.\n\nYour value as a relationship manager is helping clients distinguish between well-structured interval funds with experienced managers and transparent reporting, versus yield-chasing products with opaque portfolios and liquidity mismatches waiting to blow up. Clients can access private credit through robo-advisors. They cannot get that judgment from algorithms.\n\n## Three questions to ask your clients this quarter\n\nIf you are not already having these conversations, start now.\n\nFirst: how much of your portfolio is allocated to private markets, and how does that compare to your risk tolerance and liquidity needs? Most clients have no idea. They might have BDC exposure buried in a target-date fund. Map it out explicitly.\n\nSecond: are you comfortable with the liquidity terms of your existing alternative investments? This is where blow-ups happen. Clients assume they can redeem monthly because the fund offers monthly windows, until redemptions are gated and they realise they are locked in. Walk through realistic liquidity scenarios.\n\nThird: do you want access to private credit, private equity, or real estate, and if so, what outcome are you trying to achieve? This forces clients to articulate why they want alternatives, not just follow the herd. Are they seeking yield? Diversification? Tax efficiency? Capital appreciation? The answer determines the product.\n\n## The bottom line: your moat is shifting\n\nThe democratisation milestone marks the moment the industry stopped defending exclusive access and started building scaled, transparent mechanisms for mass participation. Your value proposition is fundamentally shifting.\n\nThe old model: keeper of institutional secrets, gatekeeper to exclusive funds. The new model: guide through the alternative investment maze, expert evaluator of democratized products.\n\nExclusive access is commoditising. Your moat is not restricting client access to private markets. It is helping clients navigate alternatives wisely.\n\nThe 2026 relationship manager does not differentiate by gatekeeping. They differentiate by expertise: evaluating which democratised products fit each client\'s risk profile, time horizon, and liquidity needs. Understanding which private credit managers have robust underwriting processes. Knowing which evergreen structures offer realistic liquidity. Recognising which platforms deliver genuine value versus expensive noise.\n\nFintech platforms can deliver access. Robo-advisors can allocate capital. But neither can deliver judgment. Judgment requires understanding credit cycles, manager selection, portfolio construction, tax implications, estate planning integration, and behavioral coaching when markets get volatile. That is not scalable. That is not automatable. That is where you come in.\n\nThe question is not whether democratisation will reshape private wealth. It is whether you will lead the transition or be disrupted by it.`,\n    title: "The Alternative Investment Tipping Point: Private Wealth is Going Mainstream",\n    date: "2026-02-24",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "Individual investors hold roughly 50% of global capital but only 16% of alternative investment assets. That 34-percentage-point gap represents the addressable market the entire wealth management industry is now racing to capture.",\n    linkedinUrl: "https://www.linkedin.com/pulse/alternative-investment-tipping-point-private-wealth-going-m-chalem--rzfye/",\n    featured: true,\n    engagementScore: 83,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: ["alternatives private banking", "private equity wealth management", "ELTIF private wealth", "alternative investments HNW"],\n  },\n  {\n    slug: "ubs-crossroads-succession-integration",\n    ogImage: "/og-articles/og-ubs-crossroads-succession-integration.jpg",\n    seoTitle: "UBS CEO Succession 2027: What Private Bankers Need to Know Now",\n    seoDescription: "Ermotti exits by 2027. His successor inherits a $7 trillion UBS mid-integration, under FINMA capital pressure and facing US bank competition on Swiss soil. What this means for private banking talent.",\n    body: `The most consequential leadership transition in global private banking is now underway. Sergio Ermotti, the man who was called back from Swiss Re to steer the emergency acquisition of Credit Suisse, has indicated he expects to step down as CEO of UBS by early 2027. In an interview with Swiss newspaper Tages-Anzeiger published in January 2026, Ermotti stated: I will complete the integration of Credit Suisse and remain CEO at least until the end of 2026 or spring 2027. The Financial Times subsequently reported that his departure is expected around April 2027, shortly after the bank\'s annual general meeting.\n\nWhat comes next will shape the trajectory of the world\'s largest wealth manager and with it, the careers and fortunes of thousands of private bankers across every major financial hub.\n\n## The Ermotti legacy: mission nearly accomplished\n\nLove him or not, Ermotti\'s second stint as CEO has been remarkable. When he returned in April 2023, he inherited a bank that had just absorbed a failing competitor under extraordinary government pressure. The task was clear: integrate Credit Suisse without destroying UBS.\n\nBy most measures, he has delivered. UBS shares have surged nearly 30% over the past year. UBS now manages over $6.6 trillion in invested assets, making it the world\'s largest private wealth manager by a significant margin. In its Q4 2025 earnings report, UBS disclosed that approximately 85% of Swiss-booked Credit Suisse client accounts had been migrated. Cumulative gross cost savings reached $10.7 billion by year-end 2025, with a revised annualized exit-rate target of approximately $13.5 billion by end of 2026.\n\nAnd the feared capital rule overhaul, which could have required UBS to hold an additional $24 billion in equity, appears to be moving toward a parliamentary compromise. Switzerland\'s largest political party backed a proposal in January 2026 that would allow UBS to use convertible bonds to meet part of the new capital requirement, sending the stock to a 17-year high.\n\nBut Ermotti himself has been careful to distinguish between what has been achieved and what remains. The final and most complex phase of the IT integration, decommissioning Credit Suisse\'s remaining legacy systems, is happening right now. The bank still needs to fully shut down all remaining Credit Suisse applications by December 2026. This is the phase where things can still go wrong.\n\n## The succession race: who is in the running\n\nErmotti has stated publicly that he wants to dramatically improve the chances of an internal successor, while the board led by Chairman Colm Kelleher is also evaluating external candidates.\n\nAccording to multiple reports from Reuters, the Financial Times, and Bloomberg, four internal executives have been most frequently cited as potential successors.\n\nIqbal Khan is probably the most well-known candidate outside UBS. A former Credit Suisse executive who joined UBS in 2019, he is now Co-President of Global Wealth Management and President of UBS Asia Pacific, based in [Hong Kong](/en/markets/hong-kong). His career trajectory has been meteoric. Khan is widely recognized as a brilliant networker and an aggressive grower who understands the UHNW client segment deeply. His relocation to Asia in 2024 mirrors historical patterns at UBS where international assignments have served as proving grounds for future CEOs. The question mark: his client-facing brilliance has not yet been tested across the full operational complexity of running a universal bank.\n\nRobert Karofsky holds the mirror role to Khan: Co-President of Global Wealth Management and President of UBS Americas. Before wealth management, he led UBS\'s Investment Bank for years, giving him cross-divisional experience that few candidates can match. He is currently managing through perhaps the most difficult challenge any UBS executive faces: the US wealth management profitability gap. The Americas wealth management pre-tax profit margin rose to approximately 13%, an improvement, but still far below the roughly 30% pre-tax margins reported by competitors such as Morgan Stanley and Merrill Lynch.\n\nAleksandar Ivanovic is perhaps the most surprising name on the list. The head of Asset Management who joined the Group Executive Board only in March 2024, he began his career as an apprentice at UBS in 1992 and has worked across every division of the bank. His asset management unit has recently outperformed every other division at UBS, a fact that has reportedly impressed the board. He is Swiss, deeply embedded in UBS\'s culture, and represents a generational shift.\n\nBeatriz Martin became Group COO in January 2026 after leading the non-core and legacy wind-down, the division responsible for dismantling unwanted Credit Suisse assets. She also serves as President of UBS EMEA. Her operational credibility is formidable. However, her career path has been primarily operational, which could be a consideration in a bank where revenue generation is often seen as the ultimate qualification.\n\n## The capital conundrum: Switzerland versus its only global bank\n\nThe succession story cannot be understood without grasping the regulatory backdrop. In June 2025, the Swiss Federal Council proposed what UBS publicly called extreme new capital requirements. According to UBS\'s own statement, the proposals would require the bank to fully deduct investments in foreign subsidiaries from its CET1 capital. UBS estimated this would require approximately $24 billion in additional CET1 capital on top of roughly $18 billion already earmarked due to existing progressive requirements.\n\nUBS has fought this publicly and fiercely. Ermotti warned that such rules would jeopardise the bank\'s ability to operate from Switzerland. Major shareholder Cevian Capital told the Financial Times that if the reforms passed in their original form, UBS would have no other realistic option than to leave the country.\n\nThe mood has shifted, however. A cross-party parliamentary compromise has gained traction, with the key concession being that up to 50% of the capital requirement for foreign subsidiaries could potentially be met with subordinated debt instruments rather than hard equity. The full parliamentary debate is expected later this year, and most observers now expect a workable outcome, though final clarity may not arrive until after Ermotti has departed.\n\nFor the next CEO, this is existential. The capital framework will determine how much UBS can invest in growth, how aggressively it can return capital to shareholders, and ultimately whether it can justify its global footprint from a Swiss home base.\n\n## The US wealth problem: pain now, gain later\n\nNo analysis of UBS today is complete without addressing what is happening in its Americas wealth management business. According to UBS\'s Q4 2025 earnings, clients withdrew a net $14.1 billion in the quarter, accelerating from $8.6 billion the previous quarter. For the full year, Americas net new assets were negative, even as Global Wealth Management generated $101 billion in net new assets worldwide.\n\nThe advisor departures have been well documented. UBS\'s voluntary attrition rate historically around 7% per year fell below that average at the start of 2025. People were staying, partly out of genuine loyalty, partly out of caution, partly because the non-solicit and retention arrangements embedded in many integration era contracts made moving costly.\n\nThe root cause of the US problem: a deliberate decision by Swiss leadership to restructure US advisor compensation, including eliminating certain team grid arrangements and cutting payout rates for advisors producing between $1 million and $3 million. Ermotti was candid about the trade-off: the bank sacrificed net new money for quality of growth and was willing to lose popularity with advisors who were never growing their business.\n\nUBS has since recalibrated for 2026, reversing some grid cuts and introducing what industry sources describe as the highest top-end payout in the wirehouse business for individual advisors producing $20 million or more. Management expects Americas net new assets to turn positive in the second half of 2026.\n\nBut the structural tension remains: Swiss banking culture, where relationship managers are salaried employees, clashes fundamentally with the US wirehouse model, where advisors view themselves as revenue-generating entrepreneurs. The next CEO will need to decide whether UBS truly wants to compete for US wallet share at American cost levels, or will accept a permanently lower margin in exchange for global scale.\n\n## What this all means for private banking talent\n\nTalent is in motion and the window is open. The combination of Credit Suisse integration, US advisor attrition, and leadership uncertainty has created the most fluid talent market in Swiss and international private banking in a decade. Senior RMs with [portable book](/en/portability)s and strong UHNW relationships have extraordinary leverage right now.\n\nThe next CEO\'s profile will signal strategic direction. If Khan gets the job, expect an aggressive push into Asia-Pacific wealth and UHNW growth. If Karofsky prevails, the Americas business will likely get more investment and patience. If Ivanovic surprises, look for a return to UBS\'s asset management and institutional roots. Each scenario creates different hiring priorities and different opportunities for candidates.\n\nUBS is simultaneously cutting and recruiting. The bank plans to add roles in India while reducing positions in Switzerland, a global rebalancing that will reshape mid-level operations and compliance functions. Meanwhile, client-facing senior bankers remain protected. If you are a revenue generator with a strong book, you have never been more valuable to UBS or to its competitors looking to recruit you.\n\nRegulatory outcomes will determine compensation budgets. If the capital compromise holds, UBS will have significantly more flexibility to invest in talent and pay competitively. If a harder-line proposal resurfaces, expect belt-tightening that could push more bankers toward boutiques and independent wealth managers.\n\n## The bottom line\n\nUBS stands at a genuine inflection point. It has survived what Ermotti himself has called the most complex bank merger in history, doubled its share price, and positioned itself as the undisputed global leader in private wealth. But the next twelve months will determine whether this colossus can transition smoothly to new leadership, complete its technical integration without mishap, resolve its regulatory standoff, and fix its US profitability problem, all at the same time.\n\nFor those of us who operate in this ecosystem every day, advising senior bankers on their next move, helping institutions find their future leaders, this is the most consequential period in private banking in a generation. The decisions being made right now at Bahnhofstrasse 45 will ripple through [Geneva](/en/markets/geneva), [Singapore](/en/markets/singapore), [Dubai](/en/markets/dubai), [London](/en/markets/london), and every other financial center for years to come.`,\n    title: "UBS at the Crossroads: Succession, Integration, and the Fight for Its Future",\n    date: "2026-02-17",\n    markets: ["CH", "UK", "US", "ASIA"],\n    summary: "Sergio Ermotti has indicated he expects to step down as CEO of UBS by early 2027. What comes next will shape the trajectory of the world largest wealth manager and with it, the careers of thousands of private bankers across every major financial hub.",\n    linkedinUrl: "https://www.linkedin.com/pulse/ubs-crossroads-succession-integration-fight-its-gil-m-chalem--blsve/",\n    featured: true,\n    engagementScore: 86,\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    keywords: ["UBS CEO succession", "UBS 2026 strategy", "Swiss banking leadership", "private banking talent UBS"],\n  },\n  {\n    slug: "billionaire-ambitions-2025-ubs-report",\n    body: `In December 2025, UBS released its 11th Billionaire Ambitions Report. Global billionaire wealth has reached an all-time high of $15.8 trillion, with 196 new self-made billionaires contributing $386.5 billion. These UHNW individuals are increasingly mobile, strategic, and selective about where they establish their fortunes.\n\n## The new era of billionaire wealth\n\nThe 196 new billionaires who emerged in 2025 injected $386.5 billion into the global economy, the second-highest annual increase ever recorded by UBS. Technology sector billionaires saw wealth surge by 23.8%, while industrial wealth recorded the fastest sectoral rise at 27.1%.\n\nWomen now comprise 374 billionaires, 12.4% of the total, and their average wealth grew 8.4% to $5.2 billion in 2025, more than doubling the growth rate of men at 3.2%. The next generation of UHNW decision-makers will increasingly include women who have independently built or inherited substantial fortunes.\n\n## The acceleration of generational wealth transfer\n\nIn 2025 alone, 91 heirs inherited a record $297.8 billion, 36% more than in 2024, despite fewer people actually inheriting. More than eight in ten billionaires with children express a desire for their heirs to succeed independently. For relationship managers, the advisory conversation must evolve from how do we preserve your wealth to how do we empower your heirs to build their own legacies.\n\nApproximately 860 multigenerational billionaires now oversee $4.7 trillion in combined assets. Second-generation billionaires are growing at 4.6% annually, third-generation at 12.3%, and fourth-generation and beyond at 10%.\n\n## Billionaire mobility: the competitive threat\n\n36% of billionaires have already relocated at least once, and 9% are actively considering doing so. The top three drivers are virtually equal: better quality of life at 36%, major geopolitical concerns at 36%, and tax efficiency at 35%.\n\nThe UAE has emerged as the world\'s leading wealth magnet, projected to attract a record 9,800 millionaires in 2025. Switzerland is still projected to attract 3,000 millionaires and remain the leading private banking center globally, but the differential growth rates signal a troubling long-term trend.\n\nThe UK has suffered a historic reversal, experiencing a net outflow of 16,500 millionaires in 2025. This serves as a cautionary tale for Switzerland: even a prestigious financial center cannot take its position for granted if policy frameworks become hostile to wealth accumulation.\n\n## Portfolio transformation\n\n42% of billionaires plan to increase their exposure to emerging markets equities over the next 12 months. Swiss wealth managers anticipate private markets will comprise 18% of UHNWI portfolios by 2027. 66% of billionaires cite tariffs as their top concern for 2026, followed by geopolitical conflict at 63% and policy uncertainty at 59%.\n\n## What this means for Swiss private banking\n\nSwiss private banks must attract relationship managers with expertise in geopolitical risk management, emerging markets strategy, private markets underwriting, and cross-border tax optimization. The era of the generalist relationship manager is ending. With 81% of next-generation inheritors planning to switch banks immediately after inheritance, the current generation of relationship managers has limited time to establish deep enough relationships with heirs to survive succession.\n`,\n    title: "Billionaire Ambitions 2025: What UBS New Report Reveals About UHNW Migration and Portfolio Strategy",\n    date: "2025-12-30",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "UBS released its 11th Billionaire Ambitions Report. Global billionaire wealth has reached an all-time high of $15.8 trillion. These UHNW individuals are increasingly mobile, strategic, and selective about where they establish their fortunes.",\n    linkedinUrl: "https://www.linkedin.com/pulse/billionaire-ambitions-2025-what-ubss-new-report-reveals-m-chalem/",\n    featured: false,\n    engagementScore: 78,\n    pillar: "P1",\n    subTheme: "Positioning",\n    keywords: ["billionaire wealth migration", "UHNW relocation", "UBS billionaire report", "private wealth strategy"],\n  },\n  {\n    slug: "week-impacted-wealth-management-december-2025",\n    body: `Four major developments converged in early December 2025 that fundamentally reshape how we think about wealth management, client expectations, and market positioning.\n\n## Bank of America mainstreamed cryptocurrency\n\nOn December 4, Bank of America announced that starting January 5, 2026, all wealth advisors at Merrill, Bank of America Private Bank, and Merrill Edge can now recommend cryptocurrency allocations to any client with no asset minimums. Over 15,000 wealth advisors can now proactively pitch crypto exposure across 70 million customers. The guidance: 1 to 4% allocation depending on risk tolerance.\n\nUntil now, crypto was a request-based product reserved for ultra-high-net-worth clients. That restriction evaporated. Morgan Stanley advised 2 to 4% earlier this year. BlackRock recommended 1 to 2%. Fidelity suggested 2 to 5%. The institutions that spent years dismissing digital assets are now scrambling to offer them.\n\n## The billionaire inheritance explosion\n\nUBS released the Billionaire Ambitions Report 2025 the same week. In 2025, 91 individuals inherited their way to billionaire status, collectively acquiring a record $297.8 billion, 36% more than 2024 despite fewer people inheriting. At least 860 multi-generational billionaires now oversee $4.7 trillion in assets. $5.9 trillion will be inherited by billionaire children over the next 15 years.\n\nMore than 80% of billionaires with children want them to succeed independently. Yet 43% still want their children to carry on the family business. That tension creates extraordinary opportunity for advisors who can navigate the psychology of succession.\n\n## Consolidation accelerated\n\nThree major M&A announcements in one week: Associated Banc-Corp acquiring American National Corporation for $604 million. Three Danish banks merging to form AL Sydbank. Fairstone Bank acquiring Laurentian Bank for $1.9 billion. Leadership transitions, talent integrations, and organizational restructuring create significant recruitment flux.\n\n## The macro backdrop shifted\n\nThe Federal Reserve signaled a more hawkish stance than markets expected, revising down 2025 rate cut projections. Bond markets repriced sharply upward, equity volatility increased, and client conversations about cash positioning became urgent.\n\n## What this week means for your business\n\nCrypto literacy is now table stakes. Your clients will compare your framework against Bank of America\'s. If you cannot answer, they will wonder what else you are behind on. Multi-generational advisory becomes premium work. The $5.9 trillion inheritance wave is happening now. Advisors who can navigate succession and generational transition will command premium compensation.`,\n    title: "The Week That Impacted Wealth Management: December 2025",\n    date: "2025-12-23",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "Goldman Sachs dropped $2 billion on an acquisition, Blackstone aggressively expanded across Europe, and Switzerland finally got serious about post-Credit Suisse reform. December 2025 is shaping up to be a moment you will reference for years.",\n    linkedinUrl: "https://www.linkedin.com/pulse/week-impacted-wealth-management-december-2025-gil-m-chalem/",\n    featured: false,\n    engagementScore: 75,\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    keywords: ["wealth management December 2025", "Goldman Sachs acquisition", "Blackstone Europe", "Swiss banking reform"],\n  },\n  {\n    slug: "final-chapter-2025-ubs-crossroads",\n    body: `The final weeks of 2025 delivered crucial signals about Switzerland\'s financial sector, with UBS navigating critical leadership transitions while the banking industry confronted uncomfortable truths about performance.\n\n## The technology leadership shift\n\nUBS announced a significant restructuring. Mike Dargan, the architect of the bank\'s technology strategy and AI pivot as Group Chief Operations and Technology Officer, stepped down to join Berlin\'s N26 as CEO. His successor arrangement underscores UBS\'s priorities: the Group Technology function now reports directly to Beatriz Martin as Group COO from January 1, 2026. This elevation signals that Ermotti\'s leadership has reframed technology not as an operational detail, but as a strategic imperative.\n\n## The hidden struggle: Credit Suisse integration friction\n\nThis technology reshuffle sits atop an uncomfortable reality. UBS is behind schedule on integrating Credit Suisse\'s ultra-high-net-worth clients. Transfers of certain high-net-worth portfolios were postponed by several months, now scheduled for Q1 2026, originally planned for September 2025. UBS has committed to $13 billion in cost reductions from the merger. If client migrations cannot be delivered smoothly by the March 31 deadline for Swiss accounts, confidence in the broader integration timeline erodes rapidly.\n\n## The capital rules showdown\n\nSwiss lawmakers unveiled a compromise capital regulation proposal on December 12 that immediately propelled UBS shares to a 17-year high: 35.17 CHF, up 4.5%, effectively doubling the stock\'s value since the 2023 Credit Suisse takeover. The proposal suggests 100% capitalisation of international subsidiaries, with flexibility allowing up to 50% of that requirement to be met through AT1 debt rather than pure equity. UBS estimates the regulatory requirement would demand approximately $8 billion in additional capital.\n\n## Sector-wide reckoning\n\nEurogroup Consulting delivered a stark verdict: UBS faces structural cost challenges despite strong market conditions. UBS\'s cost-to-income ratio stands at 81%, among the industry\'s highest. Leaders like Goldman Sachs, Deutsche Bank, and Barclays maintain ratios near or below 60%.\n\n## The wealth transfer imperative\n\nAn estimated $19.4 trillion in wealth is set to transfer to the next generation over the coming decade. UBS\'s wealth management division is critical to capturing this wave, but only if the Credit Suisse integration enables seamless, personalised client experiences. Platform migration delays create competitive vulnerability: clients unhappy with service transitions may shift assets to Julius Baer, Pictet, or cross-border competitors.`,\n    title: "The Final Chapter of 2025: UBS at the Crossroads as Swiss Banking Faces Its Moment of Truth",\n    date: "2025-12-22",\n    markets: ["CH", "UK", "US"],\n    summary: "UBS announced a significant restructuring as Group COO Beatriz Martin takes over technology on January 1, 2026. The Credit Suisse integration is entering its most complex phase, with ultra-high-net-worth client migrations delayed to Q1 2026.",\n    linkedinUrl: "https://www.linkedin.com/pulse/final-chapter-2025-ubs-crossroads-swiss-banking-faces-gil-m-chalem/",\n    featured: false,\n    engagementScore: 76,\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    keywords: ["UBS 2025 results", "UBS COO", "Swiss banking 2025", "Credit Suisse integration delay"],\n  },\n  {\n    slug: "swiss-banking-pivotal-week-ubs-17-year-high",\n    body: `What a week for Swiss private banking. Between UBS shares hitting their highest level since the 2008 financial crisis, the Federal Reserve\'s latest rate decision, and accelerating consolidation, we are witnessing fundamental shifts that will define wealth management for years.\n\n## UBS gets regulatory relief\n\nOn December 12, UBS stock soared over 4.5% to its highest point since February 2008, a 17-year peak. Swiss lawmakers unveiled a capital compromise that significantly softens the regulatory burden. The original government proposal would have required UBS to hold 100% capital backing for foreign subsidiaries, up from 60%, demanding roughly $24 billion in additional equity. The compromise allows use of AT1 bonds instead of pure equity for these subsidiaries, representing substantial cost savings.\n\n## Global rate divergence\n\nThe Federal Reserve delivered its third consecutive rate cut of 2025 on December 10, bringing rates to 3.5 to 3.75%. But officials signaled a sharp slowdown ahead, projecting just one rate cut for all of 2026. Meanwhile, the SNB held steady at 0% with Swiss inflation at 0.0% and GDP growth expected around 1% for 2026. For wealth managers, this divergence creates interesting positioning opportunities but also signals slowing global growth that HNWI clients with equity allocations need to consider.\n\n## The uncomfortable truth: 10,000 more jobs\n\nBehind the celebratory headlines lies a harsher reality. UBS is planning to cut an additional 10,000 jobs by 2027, roughly 9% of its current workforce. UBS has already trimmed approximately 15,000 positions since acquiring Credit Suisse. The bank says cuts will be minimised through natural attrition, early retirement, and internal mobility. But a 10,000-person reduction would bring headcount to roughly 95,000, a 14% decline from the post-merger peak.\n\n## The consolidation wave accelerates\n\nThe number of Swiss private banks fell from 85 at the start of 2024 to fewer than 80 by year-end. PwC projects this number will fall below 60 within a few years. Recent major deals: Gonet and ONE swiss bank completing their [Geneva](/en/markets/geneva) merger; UBP acquiring Societe Generale Private Banking in a CHF 15.1 billion deal; J. Safra Sarasin completing a majority-stake acquisition of Saxo Bank, the largest Swiss private banking deal in over a decade.\n\n## Performance scorecard\n\nAUM growth leaders: UBS Global Wealth Management over USD 4 trillion. Pictet reached CHF 724 billion, up 14%. Julius Baer hit CHF 497.4 billion, up 16.4%. EFG International reached CHF 165.5 billion, also up 16.4%. Almost all major competitors posted double-digit AUM growth. Bankers who can demonstrate [portable book](/en/portability)s and cross-border expertise remain in high demand.`,\n    title: "Swiss Banking Pivotal Week: UBS Hits 17-Year High While Industry Reshapes",\n    date: "2025-12-15",\n    markets: ["CH", "UK", "US"],\n    summary: "UBS stock soared over 4.5% to its highest point since February 2008 after Swiss lawmakers unveiled a capital compromise. Meanwhile the bank plans to cut 10,000 more jobs by 2027. The consolidation wave is accelerating.",\n    linkedinUrl: "https://www.linkedin.com/pulse/swiss-bankings-pivotal-week-ubs-hits-17-year-high-industry-m-chalem/",\n    featured: false,\n    engagementScore: 77,\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    keywords: ["UBS share price", "Swiss banking consolidation", "UBS capital rules", "private banking M&A 2025"],\n  },\n  {\n    slug: "this-week-changed-everything-december-2025",\n    body: `Four major developments converged in early December 2025 that fundamentally reshape wealth management. If you work in this space, you need to understand what happened.\n\n## Bank of America mainstreamed cryptocurrency\n\nBank of America announced that starting January 5, 2026, all wealth advisors at Merrill, Bank of America Private Bank, and Merrill Edge can now recommend cryptocurrency to any client with no asset minimums. Over 15,000 advisors can now proactively pitch crypto exposure. The guidance: 1 to 4% allocation depending on risk tolerance.\n\nUntil now, crypto was request-based, reserved for ultra-high-net-worth clients. That restriction evaporated. Morgan Stanley advised 2 to 4% earlier this year. BlackRock recommended 1 to 2%. Vanguard announced it is opening crypto ETF access to all clients. Your clients will ask about crypto. Having a clear framework is not optional anymore.\n\n## The billionaire inheritance explosion\n\nUBS released the Billionaire Ambitions Report 2025. In 2025, 91 individuals inherited their way to billionaire status, collectively acquiring a record $297.8 billion, 36% more than 2024. At least 860 multi-generational billionaires now oversee $4.7 trillion in assets. $5.9 trillion will be inherited by billionaire children over the next 15 years.\n\nMore than 80% of billionaires with children want them to succeed independently. Yet 43% still want them to carry on the family business. That tension creates extraordinary opportunity for advisors who navigate the psychology of succession.\n\n## Three major M&A deals in one week\n\nAssociated Banc-Corp acquiring American National Corporation for $604 million. Three Danish banks merging to form AL Sydbank. Fairstone Bank acquiring Laurentian Bank for $1.9 billion. Leadership transitions and talent integrations create significant recruitment opportunities across all three.\n\n## The macro backdrop shifted\n\nThe Federal Reserve signaled a more hawkish stance than markets expected, revising down 2025 rate cut projections to just 2 cuts. Bond markets repriced sharply upward. Equity volatility increased particularly in tech and AI stocks. Client conversations about cash positioning and bond allocations became urgent.\n\n## The velocity of change\n\nWhat strikes me most is not any single announcement. It is the velocity of change. The firms that adapted fast, those that built crypto capabilities, family office expertise, and digital-first operating models, are now clearing their competition. The window is open. The question is whether you are positioned to act.`,\n    title: "This Week Changed Everything: Four Events Reshaping Wealth Management",\n    date: "2025-12-09",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "Bank of America announced all 15,000 wealth advisors can now recommend cryptocurrency to any client. UBS released the Billionaire Ambitions Report showing $297.8 billion inherited in 2025. Three major M&A deals announced in one week.",\n    linkedinUrl: "https://www.linkedin.com/pulse/this-week-changed-everything-four-events-reshaping-wealth-m-chalem/",\n    featured: false,\n    engagementScore: 79,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: ["Bank of America crypto", "wealth management crypto", "billionaire inheritance 2025", "banking M&A December 2025"],\n  },\n  {\n    slug: "2025-bonus-outlook-senior-rms",\n    ogImage: "/og-articles/og-2025-bonus-outlook-senior-rms.jpg",\n    body: `In 2025, bonus expectations across private banking remain moderate but stable, with a clear trend toward rewarding measurable performance: [portable book](/en/portability)s, AUM retention, return on assets, and net new money. Regional variances reflect local dynamics, but the need for top talent with proven client loyalty is universal.\n\n## Switzerland: multipliers in the 1.8x to 2.3x range\n\nSwiss banks continue to reward top senior RMs with bonus multipliers between 1.8x and 2.3x base salary, particularly those managing UHNW clients with portfolios from CHF 120 million to CHF 250 million. The emphasis is on sustained AUM retention and cross-border advisory skills, with additional signing bonuses up to 20 to 25% linked to trailing revenues.\n\n## [Dubai](/en/markets/dubai): wider range and higher acceleration\n\nDubai leads the GCC with bonus accelerations beyond Swiss levels for RMs demonstrating strong portable books and deep GCC and NRI client relations. Bonus multipliers range from 2.0x to upwards of 3.0x base salary. Recruitment is aggressive, reflecting rapid regional wealth growth.\n\n## [London](/en/markets/london): selective increases for platform switches\n\nLondon\'s private banking bonuses are cautiously positive, with stable multipliers from 1.7x to 2.2x base salary. Switchers to Tier 1 platforms frequently secure signing bonuses representing 15 to 30% of base.\n\n## New York: premium multipliers for client revenue growth\n\nNew York places a strong premium on revenue growth and portable book size, rewarding senior RMs with multipliers from 2.0x to 2.8x. Performance benchmarks emphasize new asset inflows and high ROA, with discretionary bonuses up to 40% for exceptional contributors.\n\n## [Hong Kong](/en/markets/hong-kong): demand spurs higher bonus potential\n\nHong Kong\'s competitive market sees multipliers in the 2.0x to 2.7x range for senior RMs with strong client books, particularly those navigating Greater Bay Area opportunities.\n\n## Key takeaways\n\nSwiss and Dubai markets offer the most aggressive multiplier potential for portable books. Asia-Pacific hubs reward multi-jurisdictional and sustainable wealth expertise. London and New York provide premium signing bonuses for top talent.\n\nYour bonus will increasingly depend on AUM retention, NNM, ROA, and relationship quality. The guaranteed 18 to 24 month package is getting harder to negotiate. Variable components tied to revenue milestones are becoming the norm. Maximum leverage exists after bonus visibility but before payment. Banks price lateral hires based on expected revenue transfer, not speculation. Those who understand the structure, timing, and portability dynamics negotiate from strength.`,\n    title: "2025 Bonus Outlook: What Senior RMs Should Expect",\n    date: "2025-11-27",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "In 2025, bonus expectations across private banking remain moderate but stable, with a clear trend toward rewarding measurable performance metrics such as portable books, AUM retention, return on assets, and net new money.",\n    linkedinUrl: "https://www.linkedin.com/pulse/2025-bonus-outlook-what-senior-rms-should-expect-gil-m-chalem/",\n    featured: false,\n    engagementScore: 81,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: ["private banking bonus 2025", "relationship manager compensation", "Swiss private banking salary", "private banker bonus Dubai"],\n  },\n  {\n    slug: "ubs-vs-switzerland-24-billion-question",\n    ogImage: "/og-articles/og-ubs-vs-switzerland-24-billion-question.jpg",\n    body: `On November 16, 2025, the Financial Times reported that UBS Chairman Colm Kelleher had held private discussions with US Treasury Secretary Scott Bessent about potentially relocating UBS\'s headquarters from [Zurich](/en/markets/zurich) to the United States.\n\nWithin hours, UBS issued a formal statement reaffirming its commitment to Switzerland.\n\nThe stock barely moved. Investors were not shocked. They were vindicated. The market had been pricing in this possibility for months.\n\nBut here is what most commentators missed: this is not about the US wanting to steal a Swiss bank. It is about Switzerland potentially pricing UBS out of its own home.\n\n## The headline that shook global finance\n\nWhen news broke that UBS\'s chairman was discussing a headquarters relocation with the US Treasury, the initial reaction was predictable: the Americans are raiding Swiss banking. Wrong narrative.\n\nThe real story is far more nuanced and infinitely more consequential. This is about capital adequacy rules, regulatory leverage, and the price of staying Swiss. It is about whether a global mega-bank can afford to be domiciled in a country that is increasingly expensive to operate from.\n\nSwitzerland reaffirmed its commitment to keeping UBS headquartered in Zurich. Good theater, necessary politics. But the underlying tension remains unresolved.\n\n## The regulatory squeeze: how Switzerland created this problem\n\nTo understand why UBS\'s chairman would even have this conversation with the US Treasury, you need to understand Switzerland\'s regulatory architecture and the capital requirements crushing the bank\'s profitability.\n\nSwitzerland does not just regulate banks, it over-regulates them. This is by design. After the 2008 financial crisis and the near-collapse of UBS itself in 2009, Swiss regulators implemented some of the world\'s most stringent capital requirements.\n\nThe Swiss Financial Market Supervisory Authority and the Swiss National Bank implemented requirements that treat systemically important banks, particularly UBS, with exceptional severity. UBS is subject to a leverage ratio of 3.2%, higher than most global banks, capital buffer requirements that exceed Basel III minimums, liquidity coverage ratios that demand extraordinary cash reserves, and stress testing frameworks designed for worst-case scenarios.\n\nThe math is brutal. These requirements force UBS to hold capital that could otherwise be deployed for revenue-generating activities. In a competitive global market, this is a competitive disadvantage, one that costs billions annually in foregone returns and constrained growth.\n\n## The $24 billion question\n\nHere is where it gets serious: Switzerland\'s regulatory framework potentially costs UBS approximately $24 billion in capital that could be deployed elsewhere under different jurisdictions\' rules.\n\nThis is not speculation. Global banking analysts have modelled what UBS\'s capital requirements would be under various regulatory regimes. Under Swiss rules: substantially elevated requirements. Under US Federal Reserve rules: moderately stringent but with more flexibility. Under UK PRA rules: comparable to US but with different stress scenarios. Under [Singapore](/en/markets/singapore)\'s MAS rules: lighter touch for certain portfolios.\n\nThat $24 billion differential represents real economic pressure. It is the difference between deploying capital for client services, technology investment, and shareholder returns versus holding it in non-yielding regulatory compliance buffers.\n\nFor decades, UBS accepted these costs as the price of being Swiss. Switzerland\'s stability, regulatory reputation, and political neutrality were worth the capital burden. But in 2025, three forces converged to change this calculation.\n\nFirst, the post-Credit Suisse integration added complexity and regulatory oversight. FINMA\'s conditions for approving the merger included even more stringent capital requirements for the combined entity. Second, newer wealth management platforms operating from less-regulated jurisdictions are taking market share. They can deploy capital more freely, creating pricing pressure on traditional models. Third, the administration transition in the US created an opening. Treasury Secretary Scott Bessent signalled openness to discussing regulatory frameworks that would make headquarters relocation attractive, potentially with capital relief as an incentive.\n\n## Why UBS\'s chairman had this conversation\n\nColm Kelleher did not wake up one morning and decide to betray Switzerland. The conversation happened because the regulatory math no longer works.\n\nUBS manages USD 4.7 trillion in invested assets globally. To remain competitive against Morgan Stanley, Goldman Sachs, JPMorgan, and emerging wealth platforms, the bank needs capital flexibility. Under current Swiss rules, profitability is constrained by capital requirements, growth is limited by regulatory buffers, competitive positioning deteriorates annually against less-regulated rivals, and shareholder returns are below market expectations. This is not a hypothetical concern. It is a quarterly earnings reality.\n\nWhen Bessent and Kelleher met, they likely discussed regulatory arbitrage: could the US offer a framework where UBS\'s capital requirements decline by 15 to 20%, freeing billions in deployable capital? They also discussed systemic bank status: would UBS receive globally systemically important bank designation under US rules, potentially with different capital treatment than Swiss jurisdiction provides? And tax and legal benefits: what incentives could the federal government offer beyond regulatory relief?\n\nThe conversation was not about relocation happening tomorrow. It was about creating leverage for renegotiating Switzerland\'s capital rules.\n\n## Why Switzerland did not panic — but should be worried\n\nWhen UBS\'s formal statement reaffirmed commitment to Switzerland, the Swiss government likely knew this conversation was coming. The stock barely moved because investors had already priced in the possibility.\n\nBut here is what is unsettling for Switzerland: the conversation happening at all represents a fundamental shift.\n\nFor 150 years, Swiss banking was synonymous with stability, neutrality, and regulatory excellence. UBS relocated to Switzerland in 1912. It has been headquartered in Zurich ever since, through both world wars, through the 1980s Latin American debt crisis, through 2008 to 2009.\n\nThe fact that the chairman would discuss relocation suggests that regulatory stability and political neutrality are no longer sufficient compensation for being locked into expensive capital requirements.\n\n## The larger implications for global banking\n\nThis is not really about UBS leaving Switzerland. It is about three deeper shifts reshaping global banking architecture.\n\nCapital requirements are becoming competitive weapons. Regulators globally now understand that capital requirements directly impact competitiveness. The era of viewing capital requirements purely as safety measures is over. They are now strategic tools for attracting or repelling financial institutions.\n\nRegulatory arbitrage is legitimate strategy. The conversation between UBS and Treasury signals that major financial institutions will increasingly shop for optimal regulatory jurisdictions. The traditional model, you are Swiss so you operate under Swiss rules, is dissolving.\n\nSwitzerland\'s regulatory premium is eroding. For decades, being Swiss meant paying a regulatory premium but gaining credibility. That premium is no longer automatically worth the cost. UBS\'s willingness to discuss relocation proves that regulatory reputation alone cannot overcome competitive disadvantage.\n\n## What happens next\n\nUBS will not relocate, at least not immediately. The political costs are too high, and Switzerland will likely make regulatory concessions to keep its flagship bank.\n\nBut watch for regulatory negotiations: expect Switzerland to announce capital relief measures for UBS, demonstrating that Swiss regulation can be competitive while maintaining safety standards. Watch for structural changes: UBS may spin off certain divisions to lower-cost jurisdictions, Singapore, [Dubai](/en/markets/dubai), or potentially the US, without full relocation. A middle path that achieves capital efficiency without political upheaval. And watch for precedent setting: other major financial institutions will watch closely. If Switzerland grants UBS concessions, the negotiation playbook changes for everyone.\n\n## The bottom line: a system under pressure\n\nSwitzerland built the world\'s most trusted banking system through regulatory excellence and political neutrality. That system is now being tested by economic forces that those tools alone cannot manage.\n\nUBS\'s chairman discussing relocation with the US Treasury is not a threat to Switzerland. It is a warning. It means that regulatory reputation and political stability, while valuable, have become table stakes rather than competitive advantages.\n\nThe real question is not whether UBS will leave Switzerland. It is whether Switzerland can evolve its regulatory framework fast enough to keep global finance institutions competitive while domiciled there.\n\nThat is the conversation happening behind closed doors in Bern right now. And the market is watching very carefully.`,\n    title: "UBS vs. Switzerland: The $24 Billion Question That Could Redraw Global Banking Map",\n    date: "2025-11-25",\n    markets: ["CH", "UK", "US"],\n    summary: "UBS Chairman Colm Kelleher held private discussions with US Treasury Secretary Scott Bessent about potentially relocating UBS headquarters from Zurich to the United States. This is about Switzerland potentially pricing UBS out of its own home.",\n    linkedinUrl: "https://www.linkedin.com/pulse/ubs-vs-switzerland-24-billion-question-could-redraw-global-m-chalem/",\n    featured: false,\n    engagementScore: 84,\n    pillar: "P1",\n    subTheme: "Positioning",\n    keywords: ["UBS headquarters relocation", "UBS Switzerland capital rules", "Swiss banking regulation", "UBS US relocation"],\n  },\n  {\n    slug: "swiss-banking-earthquake-credit-suisse",\n    body: `When UBS acquired Credit Suisse in March 2023, few understood the magnitude of what was actually happening.\n\nIt was not just a bank rescue. It was the beginning of a complete restructuring of Swiss private banking that will define careers, determine winners and losers, and create wealth building opportunities for those positioned correctly.\n\nNearly three years later, the seismic waves are still reverberating and the real story is just beginning.\n\n## The scale of what is happening\n\nIn July 2024, Credit Suisse was officially dissolved from the Swiss commercial register. That legal milestone represented something far more consequential: the beginning of the largest client migration in modern banking history.\n\nApproximately 1.5 million Credit Suisse customer accounts are being transferred to UBS systems throughout 2025. To put that in perspective: this is the biggest operational challenge any bank has undertaken, combined with the greatest market opportunity for competitors in over a decade.\n\nBut here is what most observers are missing: the integration is failing in ways that create unprecedented opportunities for everyone else.\n\n## The UBS paradox: dominance masking dysfunction\n\nUBS now manages over $4.2 trillion in Global Wealth Management invested assets, an unprecedented concentration of wealth management power in Switzerland. It should be unstoppable. It is not.\n\nSince the acquisition, approximately 500 client advisors managing roughly $20 billion in assets have departed UBS. CEO Sergio Ermotti has acknowledged that further outflows are inevitable. Translation: the bank knows talent is bleeding out and cannot stop it.\n\nMore alarming: UBS recently delayed the migration of ultra-high-net-worth clients to Q1 2026 due to technical glitches, system outages, and concerns about higher-than-expected client attrition rates. The bank is struggling with the very thing it should be best at: moving sophisticated wealth relationships.\n\n## The cultural clash that is breaking the merger\n\nThis is not just a technology problem. It is cultural civil war.\n\nCredit Suisse\'s culture was built on risk-taking that appealed to Southeast Asian tycoons and Chinese tech entrepreneurs. UBS\'s culture, shaped by the trauma of 2008, is risk-averse and conservative. You cannot merge those cultures overnight, especially when one is absorbing the other under emergency conditions.\n\nRelationship managers are anxious. Clients are uncertain. And the longer the merger drags on, the more both groups look at alternatives. That is when competitors strike.\n\n## The consolidation tsunami: from 160 banks to fewer than 80\n\nHere is the staggering reality of what is happening to Swiss private banking.\n\nIn 2010, Switzerland had 160 private banking institutions. Today, just 85 at the start of 2024, with projections indicating fewer than 80 will remain by the end of 2025. This represents the most active consolidation period since the 2008 financial crisis. Nine major deals were announced in just ten months between late 2024 and early 2025. Industry experts predict the number could fall to 50 or fewer by 2030.\n\nThe largest transaction of the past decade exemplifies this trend: Safra Sarasin\'s acquisition of Saxo Bank with CHF 88 billion in client assets. Then Union Bancaire Privee acquired Societe Generale Private Banking with CHF 15 billion in AUM.\n\nTranslation: mid-sized institutions are consolidating frantically because they understand the math. Stay independent and get crushed. Merge strategically and survive.\n\nBut here is the paradox: while consolidation accelerates, certain boutique banks are thriving by doing the opposite.\n\n## The boutique advantage: why smaller can win\n\nThis is where the opportunity becomes crystal clear.\n\nSmaller private banks achieved comparable assets under management and net new money growth rates to their largest counterparts in 2023. Why? Former Credit Suisse clients were actively seeking smaller, more specialized institutions as their preferred wealth management partners. This represents a dramatic shift from historical patterns where scale and brand recognition dominated client decision making.\n\nSwiss private banks collectively employed a record 40,464 full-time equivalents in 2024 despite the reduction in the number of institutions. That means surviving banks are investing aggressively in relationship managers to capture displaced assets. On average, Swiss private banks now employ more staff per institution than at any point in the past decade.\n\nPiguet Galland won Best Private Bank Switzerland 2025 not because of size but because of intimate client relationships and specialized expertise. That recognition signals what clients actually want: personalized service over pure scale.\n\n## The talent exodus: where opportunity actually lives\n\nHere is the uncomfortable truth UBS will not admit: retention bonuses are not working.\n\nDespite offering retention bonuses averaging CHF 100,000 in cash plus equivalent amounts in locked UBS shares, experienced Credit Suisse private bankers continue switching to competitors. Teams of relationship managers have moved to Vontobel, Reichmuth and Co, and other mid-sized Swiss private banks, taking valuable client relationships with them.\n\nThis exodus demonstrates a critical insight: financial incentives alone cannot overcome concerns about cultural fit, operational stability, and career prospects.\n\nJulius Baer recruited approximately 190 former Credit Suisse relationship managers in the first year following the acquisition. EFG International, Vontobel, and others similarly invested heavily in recruiting that talent. Why? Because experienced relationship managers are the most efficient path to capturing net new assets. One senior advisor brings $500 million in client relationships. That is worth far more than generic hiring or organic growth.\n\n93% of Swiss private banks plan to hire Client Relationship Managers over the next three years. Yet only 25% of surveyed institutions are satisfied that relationship managers actually achieve their stated asset transfer objectives. Translation: the war for talent is intensifying, but most institutions are losing it.\n\n## What top talent is actually looking for\n\nThe recruitment landscape has fundamentally shifted. Younger professionals are not choosing banks based on compensation alone anymore.\n\nFlexibility, work-life balance, and meaningful impact have emerged as critical factors. Banks aligned with sustainability, ethics, and innovation while offering clear career progression demonstrate significant advantages in talent attraction.\n\nThe shortage of qualified relationship managers capable of serving UHNW clients with complex, multi-jurisdictional requirements has created a seller\'s market for top talent.\n\n## The winners and losers emerge\n\nIn 2024, Swiss private banks demonstrated remarkable resilience with record assets under management and strong financial performance. But the distribution of success was not equal.\n\nJulius Baer and EFG International both achieved impressive 16.4% year-over-year assets under management growth. Julius Baer positioned itself to capture significant market share from displaced advisors and their client portfolios. EFG International\'s strategic expansion in Asia delivered consistent client inflows.\n\nPictet Group recorded 14% growth reaching CHF 724 billion in assets under management. J. Safra Sarasin distinguished itself with a cost-income ratio under 50%, demonstrating remarkable capital efficiency.\n\nThese performance metrics reveal that Swiss wealth management excellence transcends pure scale. Profitability, operational discipline, and client satisfaction remain decisive competitive advantages.\n\n## For mid-sized Swiss banks: a once-in-a-generation window\n\nEFG International, Lombard Odier, Union Bancaire Privee, Edmond de Rothschild, and other mid-sized Swiss private banks face a defining moment.\n\nThe Credit Suisse collapse has shaken confidence in mega-bank models, giving these institutions the opportunity to position themselves as attractive alternatives offering stability, continuity, and personalized attention.\n\nSuccess requires demonstrating not merely that they are different from UBS, but that their business models, risk management, and client service philosophies offer superior long-term value.\n\nGeographic expansion combined with product diversification has proven essential. Banks that expanded into Middle Eastern markets, strengthened Asian presence, and developed specialized capabilities in sustainable finance, family office services, and digital assets have achieved superior risk-adjusted returns and client retention.\n\n## For relationship managers: the seller\'s market\n\nThe current environment presents unprecedented career opportunities for relationship managers with strong client relationships, multi-jurisdictional expertise, and proven track records in HNW and UHNW segments.\n\nProfessionals considering career moves should evaluate employers based on institutional stability, cultural alignment, technology infrastructure, compensation structure, and long-term strategic positioning, not immediate financial incentives alone.\n\nInvestment in continuous professional development, particularly in digital literacy, sustainable finance, alternative investments, and regulatory compliance, enhances career prospects and client service capabilities.\n\nThe most successful relationship managers combine traditional private banking expertise with modern technological fluency and deep understanding of evolving client needs across generations.\n\n## For international players: Goldman Sachs just proved it works\n\nForeign banks capitalizing on uncertainty are surprising everyone. Goldman Sachs has topped traditional Swiss private banking rivals in recent performance rankings, shaking up industry perceptions about the dominance of heritage Swiss institutions.\n\nStandard Chartered, Deutsche Bank, HSBC, and other international banks with Swiss operations are strategically positioning themselves to attract relationship managers and clients seeking alternatives to UBS.\n\n## The bottom line\n\nThe UBS-Credit Suisse integration represents far more than the combination of two banking institutions. It marks a fundamental restructuring of Swiss private banking that will define competitive dynamics, talent flows, and client behavior for the next decade.\n\nThe delayed client migrations, ongoing talent exodus, and persistent integration challenges demonstrate that even well-capitalized institutions with sophisticated management teams face extraordinary complexity when merging operations of this magnitude.\n\nFor competing institutions, the structural changes create a once-in-a-generation opportunity to capture market share, attract top relationship management talent, and establish differentiated positioning based on stability, personalized service, and specialized expertise.\n\nSuccess requires bold strategic vision, disciplined execution, and sustained investment in three pillars of competitive advantage: exceptional talent, superior client service, and operational excellence.\n\nThe Swiss private banking sector will emerge from this transformation period more consolidated, technologically advanced, and globally competitive, but success will not be evenly distributed.\n\nInstitutions that recognize the magnitude of the opportunity, act decisively to capture displaced talent and assets, and maintain unwavering focus on client needs will thrive in the post-Credit Suisse era. Those that hesitate, maintain outdated business models, or fail to invest adequately in talent and technology risk becoming the next consolidation targets in an industry where scale, specialization, and service excellence increasingly determine survival.\n\nThe opportunity is now. The window is closing. The question is: are you positioned to capitalize on it?`,\n    title: "The Swiss Banking Earthquake: How the Credit Suisse Collapse Is Creating the Biggest Opportunity in Private Banking",\n    date: "2025-11-23",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "When UBS acquired Credit Suisse in March 2023, few understood the magnitude of what was actually happening. It was the beginning of a complete restructuring of Swiss private banking that will define careers for a decade.",\n    linkedinUrl: "https://www.linkedin.com/pulse/swiss-banking-earthquake-credit-suisse-collapse-creating-m-chalem/",\n    featured: false,\n    engagementScore: 83,\n    pillar: "P1",\n    subTheme: "M&ARestructuring",\n    keywords: ["Credit Suisse UBS merger", "Swiss private banking opportunity", "private banking talent market", "Swiss banking consolidation"],\n  },\n  {\n    slug: "great-ubs-paradox-us-footprint",\n    body: `UBS just reported $38 billion in global net new assets for Q3 2025 but lost $8.6 billion in the Americas alone. What is really happening?\n\n## The numbers tell a fascinating story\n\nOn October 28, 2025, UBS announced record profitability and successful Credit Suisse integration. The headlines were bullish. But buried in the details was a paradox revealing exactly where the world\'s largest wealth manager, managing USD 4.7 trillion in invested assets, is actually betting its future.\n\nThe geographic divergence was stark. Asia-Pacific delivered plus $9.4 billion in net new assets, up 17% year-over-year. EMEA contributed plus $7.3 billion, up 9%. Switzerland added plus $3.2 billion. And the Americas lost $8.6 billion in absolute outflow.\n\nThis is not a rounding error or temporary blip. This is a strategic reorientation, and it is happening faster than most observers realize.\n\n## The Americas crisis: more than just integration challenges\n\nLet us be direct: UBS\'s US wealth management division is hemorrhaging.\n\nIn Q3 2025 alone, advisors\' assets under management fell by $9 billion as experienced wealth professionals departed. This reflects a deeper structural crisis that goes beyond typical post-merger turbulence.\n\nThe smoking gun is the cost-to-income ratio. In the Americas, it hit an alarming 88%, compared to 72% in EMEA and 75% in Asia-Pacific. For context, a healthy ratio sits between 60 and 70%. UBS\'s US operation is not just inefficient. It is profitability-destroying.\n\nWhat is driving the exodus? Integration fatigue is a major factor. Credit Suisse advisors who survived the merger face a brutal reality: UBS\'s rigid compliance frameworks, different compensation models, and centralized technology platforms are suffocating autonomy. Career advisors are not leaving because they lost their jobs. They are leaving because they lost their independence.\n\nMarket share is also bleeding. Morgan Stanley and Goldman Sachs are stealing market share in pure US domestic wealth management. In November 2025, an entire team managing $3.7 billion in assets left UBS for Morgan Stanley, a direct, public statement about where talent sees opportunity.\n\nAnd there is a compensation crisis. UBS announced a new tiered pay system effective January 1, 2026, but it is too little, too late. The bank hired Morgan Stanley veteran Ben Firestein to lead a recruiting surge specifically targeting advisors earning $1 to $3 million annually. Translation: UBS knows it is bleeding talent and is desperate to stop the bleeding.\n\nThe uncomfortable truth: UBS has lost confidence it can compete on equal footing in the US domestic market. So it is choosing strategic retreat, doubling down on where it can win, pulling back where it cannot.\n\n## The offshore pivot: where UBS is actually winning\n\nWhile the US bleeds, UBS is making calculated, aggressive moves everywhere else.\n\nThe Middle East is capturing fleeing wealth. UBS opened a new Abu Dhabi branch in 2025, complementing its existing [Dubai](/en/markets/dubai) International Financial Centre operations. The timing is anything but coincidental. UK Prime Minister Keir Starmer\'s Labour government implemented aggressive capital gains taxes and wealth taxes, sending waves of British and European ultra-wealthy fleeing to lower-tax jurisdictions. Dubai became the destination of choice. Beatriz Martin Jimenez, UBS\'s EMEA President, stated it plainly: the Middle East is definitely a winner for individuals who have moved away from high-tax systems.\n\nDubai is not just attracting wealthy individuals anymore. It is becoming the global offshore booking center for wealth that would have previously anchored in Switzerland or [London](/en/markets/london). UBS is positioning itself at the center of that migration.\n\nAsia-Pacific is the real growth story. The $9.4 billion in Q3 net new assets flowed primarily from [Hong Kong](/en/markets/hong-kong), where a recovering IPO market and robust family office activity are generating substantial wealth. UBS won Asia\'s Best International Private Bank 2025 from Euromoney, recognition driven by consistent execution in a region where other banks are struggling.\n\nBut here is the strategic masterstroke that matters most: UBS\'s exclusive partnership with India\'s 360 ONE Asset Management, announced April 2025. Rather than building its own India onshore business, which would be complicated, capital-intensive, and a regulatory nightmare, UBS acquired a 4.95% stake in 360 ONE with exclusive rights to manage India\'s onshore wealth. Simultaneously, UBS retained control of 360 ONE\'s [Singapore](/en/markets/singapore)-booked offshore clients. Indian clients use 360 ONE for rupee-based investments and UBS for USD and offshore structures. It is elegant architecture that maximizes efficiency while avoiding regulatory complications that would cripple a direct approach.\n\nSingapore remains UBS\'s critical hub for Non-Resident Indian wealth management, one of the fastest-growing wealth categories globally. In August 2025, UBS reshuffled its NRI team across Singapore and Dubai, signalling aggressive expansion in this high-margin segment.\n\n## The booking center revolution: what this means for private bankers\n\nUBS\'s geographic pivot reflects a profound structural shift in private banking architecture, one that is reshaping where the actual expertise and compensation lives.\n\nThe old model was simple: local onshore advisor, local onshore booking, regulatory complexity handled locally. The new UBS model is different: local onshore advisor connected to offshore booking center in Switzerland, Singapore, or Dubai, with simplified cross-border structuring.\n\nWhy does this matter? Everything.\n\nCareer trajectory is increasingly geographic. If you are advising clients with cross-border complexity, the real expertise is migrating to offshore booking centers. Singapore, Dubai, and [Zurich](/en/markets/zurich) are where sophisticated advisors are accumulating. The US is increasingly becoming a transaction-focused, client-acquisition role, valuable, but not where strategy is made.\n\nCompensation follows complexity. Advisors managing cross-border relationships, navigating tax treaties, structuring family offices, optimizing international wealth flows, command dramatically higher compensation than pure domestic US advisors. UBS\'s compensation crisis partly stems from this reality: they are trying to retain experienced advisors in a geography where the work is increasingly commoditized.\n\nRecruitment is flowing offshore. UBS is actively recruiting in Singapore, Dubai, and Hong Kong. The growth is not in New York or Los Angeles. It is in the financial hubs where offshore wealth concentrates. If you are considering your next move as a wealth management professional, geography is destiny right now.\n\nClient intelligence becomes currency. If you advise ultra-high-net-worth clients with international exposure, understanding which booking centers offer optimal tax efficiency, regulatory flexibility, and privacy is now mission-critical. UBS\'s strategy reveals which jurisdictions the world\'s largest bank trusts most for sophisticated wealth management.\n\n## The larger implication: too big in the US, right size offshore\n\nUBS\'s paradox reveals a fundamental truth most banks will not admit: the mega-bank model does not work uniformly across geographies.\n\nIn the United States, UBS is trapped between impossible positions. Too large to abandon the market, it manages USD 2.28 trillion in invested assets domestically. Too bureaucratic to compete against nimble regional rivals and specialized boutiques.\n\nThe result: selective, strategic retreat. UBS is accepting slower US growth to focus on ultra-high-net-worth relationships and institutional wealth rather than pursuing broad retail expansion it cannot win.\n\nOffshore, UBS has discovered its zone of genius: managing complex, globally mobile wealth for ultra-high-net-worth individuals who demand a true one-stop shop combining tax optimization, regulatory expertise, and sophisticated asset management across multiple jurisdictions.\n\nThe bottom line: UBS is not failing in the US. It is reallocating. The bank is consciously accepting slower domestic growth to invest heavily in offshore expansion where profit margins are higher, competitive positioning is stronger, and the future of global wealth actually lives.\n\n## What this means for you\n\nIf you are a relationship manager or advisor in the Americas, your skills are valuable, but potentially in the wrong geography. Before you commit to your next five years, honestly assess whether staying in the US market aligns with where UBS and the entire wealth management industry is investing.\n\nIf you are based in Asia or EMEA, the resources, compensation, and career acceleration are flowing in your direction. This is your moment to accelerate aggressively. The next five years will determine whether you are positioned at the center of growth or still managing a shrinking pool of legacy relationships.\n\nUBS just told you exactly where they believe the future is. The question is: are you listening?`,\n    title: "The Great UBS Paradox: Why the World Largest Wealth Manager Is Shrinking Its US Footprint While Expanding Everywhere Else",\n    date: "2025-11-19",\n    markets: ["CH", "UK", "US", "ASIA", "UAE"],\n    summary: "UBS just reported $38 billion in global net new assets for Q3 2025 but lost $8.6 billion in the Americas alone. This is a strategic reorientation happening faster than most observers realize.",\n    linkedinUrl: "https://www.linkedin.com/pulse/great-ubs-paradox-why-worlds-largest-wealth-manager-shrinking-m-chalem/",\n    featured: false,\n    engagementScore: 80,\n    pillar: "P1",\n    subTheme: "Positioning",\n    keywords: ["UBS Americas strategy", "UBS Asia expansion", "UBS wealth management", "private banking geographic strategy"],\n  },\n  {\n    slug: "power-shift-private-banking-talent",\n    body: `Something interesting is happening across the global wealth management landscape, a quiet power rebalancing between elite private bankers and the institutions that employ them.\n\nFor years, banks made the rules. They defined pay structures, mobility terms, and KPIs. Even the most accomplished relationship managers operated within these limits and accepted them as part of the industry\'s rhythm.\n\nThat mindset is changing. The shift is not dramatic or absolute, but it is noticeable. Across [Geneva](/en/markets/geneva), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore), [London](/en/markets/london), and New York, senior relationship managers with strong, [portable book](/en/portability)s are negotiating from greater strength and doing it with data, not ego.\n\n## What is driving the change\n\nAccording to the UBS Global Wealth Report 2025, global private wealth grew about 4.6% in 2024, following 4.2% in 2023. The United States added hundreds of thousands of new millionaires that year, now accounting for roughly 40% of global wealth holders.\n\nSwitzerland remains exceptional, with average adult wealth around USD 687,000 in 2024, among the highest levels worldwide. Though growth has slowed slightly, the country\'s role as a global wealth hub remains as relevant as ever.\n\nAs wealth pools globalize, the demand for bankers who understand cross-border complexity keeps rising. Those with portable client relationships, jurisdictional know-how, and exposure to alternative investments have become increasingly valuable and increasingly rare.\n\nPrivate banks remain powerful players, but they now need top performers as much as top performers need them.\n\n## What senior RMs are negotiating today\n\nThe traditional 12-month book-transfer model is evolving. Many institutions now recognize that sophisticated, cross-border books require 18 to 24 months for full migration. Especially in regulated centers like Dubai, Singapore, or [Zurich](/en/markets/zurich), staged transition targets help align expectations. This protects client relationships and minimizes compliance risk, benefiting both bank and banker.\n\nEuropean institutions are slowly adapting their pay models to stay competitive. Relocation or market-differentiation allowances, performance metrics built around net new money, and margins rather than pure AUM are becoming standard. US compensation levels remain higher, typically between USD 230,000 and 320,000 for senior RMs at major platforms. But the gap is narrowing as mobility and transparency make market intelligence more accessible.\n\nTop performers are increasingly asking for more than just pay. They want product access: private-market investments, co-investment opportunities, and family-office services. Julius Baer, UBS, and other major players have been expanding their private-market capabilities to meet this demand. Even so, institutions are balancing empowerment with control, ensuring risk management and compliance stay firmly in place.\n\nClient ownership remains a sensitive issue in private banking mobility. Banks are now more deliberate about contractual clarity, specifying who gets credit for origination, booked assets, and future pipeline across desks and geographies. This transparency not only keeps relationships intact but also prevents costly disagreements and client disruption.\n\n## How different markets are evolving\n\nSwitzerland\'s large institutions remain headquartered here, maintaining a dominant market share and wealth density unmatched globally. Senior RMs with strongly portable cross-border books, especially covering the EU, Middle East, or Latin America, retain high strategic value, though onboarding and regulatory scrutiny remain strict.\n\nDubai has moved firmly into the top tier of wealth hubs over the past few years. Its tax framework, geographic accessibility, and financial regulations make it attractive to both clients and bankers. Competition is heating up for professionals with GCC, India, and Southeast Asia client connectivity, but institutions remain selective on compliance and book validation.\n\nLondon platforms are doubling down on experienced hires. Firms like UBS, HSBC, Coutts, and J.P. Morgan are focusing on bankers with proven international relationships and immediate client portability. Senior RMs relocating from Latin America, the Middle East, or Africa are often fast-tracked into senior compensation bands.\n\nThe United States remains the most competitive private banking market. Firms like Citi, JPMorgan, and boutique platforms increasingly use long-term incentives or equity components to attract mobile global bankers. That said, licensing and compliance requirements keep most banks firmly in control of structure and timing.\n\nAsia\'s private wealth segment continues steady growth. The strongest demand is for bankers who link ASEAN, China, and GCC wealth flows, particularly those with strong product placement capabilities in private markets.\n\n## The new balance of power\n\nThe current environment is not about banks losing control. It is about smarter balance. Institutions are adapting, not surrendering.\n\nCompliance, regulatory, and structural realities still shape final offers, but the conversation has become more mutual. Banks that price talent based on genuine portability and reward long-term relationship quality are winning the talent game.\n\nThe private banking world is in motion. Wealth is rising, regulation is tightening, and clients are diversifying beyond borders. That creates a marketplace where both institutions and relationship managers have real influence, but in different ways.\n\nTop RMs now understand their market worth more deeply than ever. Banks know they must evolve their structures to stay competitive, whether through smarter compensation models, longer ramp-up timelines, or genuine platform empowerment.\n\nIf you are a senior private banker in Switzerland, Dubai, London, New York, Singapore, or [Hong Kong](/en/markets/hong-kong) with a portable book and want to assess your true market value, the conversation starts with an honest look at what you actually own versus what the institution owns.\n\nThe power has shifted. Make sure you are leveraging it.`,\n    title: "The Power Shift: How Private Banking Talent Dynamics Are Evolving",\n    date: "2025-11-18",\n    markets: ["CH", "UK", "UAE", "ASIA"],\n    summary: "Something interesting is happening across the global wealth management landscape — a quiet power rebalancing between elite private bankers and the institutions that employ them. Senior relationship managers with strong portable books are negotiating from greater strength.",\n    linkedinUrl: "https://www.linkedin.com/pulse/power-shift-how-private-banking-talent-dynamics-evolving-m-chalem/",\n    featured: false,\n    engagementScore: 79,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: ["private banking talent", "relationship manager leverage", "private banker negotiation", "wealth management hiring"],\n  },\n  {\n    slug: "unlock-career-move-senior-rms-2025",\n    body: `The private banking recruitment landscape in 2025 is redefining success. Across [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), [Dubai](/en/markets/dubai), [Singapore](/en/markets/singapore), and [London](/en/markets/london), the demand for seasoned Senior Relationship Managers who bring proven, portable UHNW and HNW client portfolios has never been stronger.\n\n## The market moment\n\nThis is not a typical hiring cycle. It is the confluence of three major structural forces that rarely align simultaneously.\n\nThe UBS-Credit Suisse integration continues to displace talent and create client uncertainty at a scale the market has not seen before. Mid-tier Swiss institutions and international banks expanding in key hubs are actively building capacity to absorb both the talent and the clients in motion.\n\nZero interest rates and compressed margins are forcing every Swiss private bank to scrutinise its revenue per relationship manager ratio more carefully. Banks want proven revenue generators, not development projects.\n\nAnd the geographic rebalancing of private wealth, with meaningful flows from the UK, from parts of Asia, and from markets affected by geopolitical disruption, is creating client demand that the existing workforce cannot fully serve.\n\n## What the market is paying for\n\nThe compensation premium is clearly concentrated around specific capabilities. [Portable book](/en/portability)s with a genuine, documented track record of client follow through transitions. Cross-border advisory competence, particularly for clients navigating multi-jurisdictional complexity. Alternatives expertise, as private markets continue to command a growing share of UHNW portfolio allocation. Language and cultural capability for high-growth client segments. The banker who can demonstrate all four is operating in a market where leverage is genuinely exceptional.\n\n## The preparation that makes the difference\n\nThe practitioners who move successfully are those who have prepared with precision. They have done the portability analysis: a clear, client-by-client assessment of what would follow them and what would not. They have developed a [business plan](/en/bp-simulator): a specific, credible projection of net new assets over three years grounded in their actual pipeline. They have reviewed their legal position: notice period, garden leave, non-solicitation provisions. And they have assessed the institutional landscape with genuine rigor: which institutions are growing in their client segment, which are stable, and which are managing their own challenges.\n\nThe private banking career move that creates sustainable value is the one that reflects genuine strategic analysis of where your specific skills and client relationships create the most value over a five to ten year horizon. The window is open. The market is paying for the right profiles. The practitioners who move with precision and preparation will find themselves at the beginning of the best chapter of their careers.`,\n    title: "Unlock Your Next Career Move: Senior RMs with Portable Books in the Spotlight",\n    date: "2025-11-18",\n    markets: ["CH", "UAE", "ASIA"],\n    summary: "The private banking recruitment landscape in 2025 is redefining success. Across Geneva, Zurich, Dubai, and Singapore, the demand for seasoned Senior Relationship Managers who bring proven, portable UHNW and HNW client portfolios has never been stronger.",\n    linkedinUrl: "https://www.linkedin.com/pulse/unlock-your-next-career-move-senior-rms-portable-books-m-chalem/",\n    featured: false,\n    engagementScore: 74,\n    keywords: ["private banking jobs Geneva", "senior RM opportunities", "Dubai private banking jobs", "Singapore wealth management careers"],\n  },\n  {\n    slug: "ubs-potential-us-relocation",\n    body: `Picture this: a 162-year-old Swiss banking institution, one with deep roots in [Zurich](/en/markets/zurich) and a name synonymous with Swiss financial tradition, quietly submits an application for a US national bank charter. This is no longer speculation. It is happening now.\n\nUBS\'s strategic pivot toward the United States represents one of the most consequential shifts in global banking since the 2008 financial crisis.\n\n## The regulatory crossroads\n\nSwiss regulators proposed capital requirements that would force UBS to bolster its loss-absorbing capital by approximately $26 billion, nearly double what global peers like JPMorgan and HSBC must hold. UBS views these requirements as competitively crippling. Senior UBS executives have made their position clear: stay and absorb punishing capital costs, or relocate to a jurisdiction where too-big-to-fail banks operate under more favorable conditions. The Trump administration has already signaled its enthusiasm, with Treasury officials confirming this is what we want.\n\n## More than a headquarters question\n\nIn late October 2025, UBS formally applied for a US national bank charter, making it the first Swiss bank to attempt this. A national bank charter would enable UBS Bank USA to accept deposits directly from clients, provide checking and savings accounts, and extend lending capabilities. This represents a fundamental shift from pure wealth advisory to full-service banking, exactly what is needed to compete with domestic US competitors for the mass-affluent segment.\n\n## The competitive urgency\n\nUBS\'s US wealth division has struggled against Morgan Stanley, Bank of America, and JPMorgan Chase. Pre-tax margins for US wealth operations hover around 4 dollars of profit per 100 dollars of revenue, compared to 25 to 35 dollars for leading competitors.\n\n## The political masterclass\n\nBy discussing potential US relocation with the Trump administration, UBS signals to Swiss regulators that it possesses credible alternatives if capital regulation becomes prohibitively stringent. The conversation was not about relocation happening tomorrow. It was about creating leverage for renegotiating Switzerland\'s capital rules. Switzerland will likely make regulatory concessions to keep its flagship bank.\n\nThe question is no longer whether UBS could relocate. It is whether and under what conditions it will.`,\n    title: "Why UBS Potential US Relocation Could Reshape Global Wealth Management",\n    date: "2025-11-11",\n    markets: ["CH", "US"],\n    summary: "UBS formally applied for a US national bank charter the first Swiss bank to attempt this. This is not merely about moving executive offices. It is a comprehensive reimagining of how UBS serves the world most lucrative wealth management market.",\n    linkedinUrl: "https://www.linkedin.com/pulse/why-ubss-potential-us-relocation-could-reshape-global-wealth-m-chalem/",\n    featured: false,\n    engagementScore: 78,\n    pillar: "P1",\n    subTheme: "Positioning",\n    keywords: ["UBS US bank charter", "UBS national bank", "Swiss bank US relocation", "UBS strategy 2025"],\n  },\n  {\n    slug: "what-netflix-knows-wealth-firms",\n    body: `Something fundamental just shifted in wealth management and most firms are missing it. For decades, clients with similar net worths got similar portfolios. Risk questionnaires divided humanity into five boxes. Investment strategies were copy-pasted across thousands of accounts. Not anymore.\n\nGlobal assets under management hit $159 trillion in 2024, projected to reach $178 trillion by 2029. But 60% of high-net-worth clients now expect personalized portfolios, while 68% demand digital experiences matching Amazon and Netflix. The gap between expectation and delivery is where fortunes will be made and lost.\n\n## The new reality\n\nMillennials and Gen Z are inheriting $83.5 trillion in coming decades. They do not tolerate clunky portals. They demand ESG alignment, crypto exposure, and instant access. When your platform feels like 2005, you are not behind. You are irrelevant.\n\nTrue hyper-personalization is finally possible. Morgan Stanley\'s AI Assistant functions as a research analyst, economist, and strategist combined. DBS Private Bank analyzes 15,000 customer data points to generate personalized nudges, product recommendations, and proactive guidance during life transitions. Imagine: your platform detects a promotion via LinkedIn. Within hours, your advisor reaches out with specific recommendations for tax strategy, contribution adjustments, and portfolio rebalancing. That is happening now at leading firms.\n\n## The psychology advantage\n\nAI combined with behavioral finance creates something powerful. When systems detect emotional decision-making, excessive trading during volatility or reluctance to rebalance, advisors intervene with contextual guidance precisely when needed. Not quarterly check-ins that come too late. Real-time support during moments that matter.\n\n## Values meet portfolios\n\nESG investing will grow from $39.08 trillion in 2025 to $125.17 trillion by 2032. Generic ESG funds fall short. Hyper-personalization delivers granular alignment with individual values. When clients see reports showing tons of carbon avoided, investing becomes values-aligned partnership. That creates advocates, not just clients.\n\n## The hybrid model wins\n\n28% of clients favor digital-only, 35% prefer advisors, 37% want both. Vanguard\'s Personal Advisor Services grew to $220 billion by combining automated allocation with human guidance. The augmented relationship manager equipped with AI tools delivers strategic recommendations while strengthening human connections.\n\n## The loyalty multiplier\n\nClients receiving personalized services show significantly higher loyalty: reduced attrition during volatility, higher AUM through referrals, greater wallet share as they consolidate accounts. The digital transformation is not coming. It is here. The question is not whether to personalize. It is how quickly you can implement.`,\n    title: "What Netflix Knows That Your Wealth Firm Doesn\'t",\n    date: "2025-11-01",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary: "Individual investors hold 50% of global capital but only 16% of alternative assets. Millennials and Gen Z are inheriting $83.5 trillion. The gap between expectation and delivery is where fortunes will be made and lost in wealth management.",\n    linkedinUrl: "https://www.linkedin.com/pulse/what-netflix-knows-your-wealth-firm-doesnt-gil-m-chalem/",\n    featured: false,\n    engagementScore: 76,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: ["wealth management personalization", "AI private banking", "digital wealth management", "next gen wealth"],\n  },\n  {\n    slug: "swiss-private-banking-thriving-against-odds",\n    body: `The Swiss banking world is doing something remarkable. Despite facing the most challenging global environment in years, aggressive US tariffs, currency chaos, and regulatory pressures, Switzerland\'s private banks are not just surviving. They are thriving.\n\n## The numbers tell a story of resilience\n\nSwiss banks are managing CHF 9.21 trillion in assets under management as of H1 2025. What is truly impressive is not just the size but how these institutions are navigating unprecedented headwinds. President Trump\'s 39% levy on Swiss exports, the highest in the developed world, is hammering manufacturers and watchmakers. Yet private banks are posting record profits. The Swiss franc has surged 13% against the dollar this year, which should be crushing international earnings. Instead, leading banks are turning these challenges into opportunities.\n\n## The winners are separating from the pack\n\nUBS reported CHF 1,365 million in net profit for H1 2025 and attracted CHF 25.2 billion in net new money. Julius Baer saw underlying net profit jump 11% to CHF 295 million with CHF 7.9 billion in fresh client assets. EFG International posted their best results ever: CHF 221.2 million in profit, up 36%, with CHF 5.4 billion in net new assets. UBP delivered CHF 120.7 million in profit with a rock-solid Tier 1 capital ratio of 21.3%.\n\n## The survival of the fittest\n\nFewer than 60 pure private banks will likely survive to year-end. Smaller players cannot absorb the compliance costs and technology investments needed to compete. We are already seeing deals like Banque Thaler\'s sale to Credit Agricole and Kaleido Privatbank\'s acquisition by Banque Richelieu France.\n\nThe survivors are investing heavily in AI, digital wealth platforms, and alternative assets. They are offering sophisticated ESG mandates and crypto solutions to UHNW clients. When chaos creates opportunity, market volatility is actually boosting bank revenues. Higher trading volumes mean more fees.\n\n## The digital arms race\n\nWhat separates winners from losers is not just investment performance. It is technology. The leading banks are deploying AI to personalize client experiences, automate compliance, and offer 24/7 digital access while maintaining the legendary Swiss personal touch. This is not optional. Client expectations have fundamentally shifted.\n\n## The bottom line\n\nSwiss private banking is not just weathering the storm. It is being forged stronger by it. The combination of capital strength, digital innovation, and centuries of wealth management expertise is proving difficult to replicate. The weak are consolidating out. The strong are pulling away. And the ultra-wealthy are voting with their wallets.`,\n    title: "Swiss Private Banking: Thriving Against the Odds",\n    date: "2025-10-27",\n    markets: ["CH"],\n    summary: "Swiss banks are managing CHF 9.21 trillion in assets under management as of H1 2025. Despite aggressive US tariffs, currency chaos, and regulatory pressures, Switzerland private banks are not just surviving — they are thriving.",\n    linkedinUrl: "https://www.linkedin.com/pulse/swiss-private-banking-thriving-against-odds-gil-m-chalem/",\n    featured: false,\n    engagementScore: 77,\n    pillar: "P1",\n    subTheme: "Positioning",\n    keywords: ["Swiss private banking 2025", "Swiss AUM record", "UBS Julius Baer EFG results", "Swiss banking resilience"],\n  },\n  {\n    slug: "la-dolce-vita-italy-wealth-management",\n    title: "La Dolce Vita Returns: Why Italy Has Become Europe Hottest Destination for Wealthy Individuals and Bankers",\n    date: "2025-10-19",\n    markets: ["EU", "UK", "CH"],\n    summary: "Italy is eating everyone lunch. While Britain was busy dismantling its non-dom regime, Milan quietly became the most attractive destination for mobile wealth in Europe. Goldman Sachs vice chairmen, billionaire industrialists, the kind of money that moves markets.",\n    linkedinUrl: "https://www.linkedin.com/pulse/la-dolce-vita-returns-why-italy-become-europes-hottest-m-chalem/",\n    featured: false,\n    engagementScore: 79,\n    pillar: "P1",\n    subTheme: "Positioning",\n    keywords: ["Italy wealth management", "Milan private banking", "Italy flat tax regime", "UHNW migration Italy"],\n    body: `Something remarkable is happening in European wealth management. Italy is eating everyone\'s lunch.\n\nWhile Britain was busy dismantling its non-dom regime and patting itself on the back for fiscal responsibility, [Milan](/en/markets/milan) quietly became the most attractive destination for mobile wealth in Europe. We are not talking about retirees looking for sun. We are talking about Goldman Sachs vice chairmen, billionaire industrialists, and the kind of money that moves markets.\n\n## The tax play that actually worked\n\nIn 2017, Italy\'s government made a bet. They introduced a flat tax regime: a fixed annual payment on all foreign income, regardless of how much you actually earn. No wealth tax. No inheritance tax on offshore assets. No complex reporting requirements.\n\nThe pitch was simple and brutal in its effectiveness: pay us a fixed fee, and we will leave the rest alone for 15 years.\n\nFast forward to 2025, and nearly 1,500 individuals are using the regime. The government clearly knows they are onto something good. They have raised the rate twice, first to EUR 200,000 in 2024, now to EUR 300,000 for new applicants in 2026. Existing participants stay grandfathered at their original rates.\n\nHere is the math that matters: if you are earning EUR 5 million annually in foreign income, paying EUR 200,000 represents a 4% effective rate. Compare that to 40 to 50% in most developed markets. The value proposition is absurd.\n\nItaly ranks third globally for millionaire migration in 2025, attracting an estimated 3,600 HNWIs and $21 billion in private capital.\n\nCritics warn that frequent increases could undermine confidence in the regime\'s stability, potentially making it appear unpredictable and therefore less appealing to foreign individuals who value long-term certainty. Yet proponents argue that Italy remains attractive compared to other jurisdictions. [Dubai](/en/markets/dubai) may offer zero tax, but Italy offers lifestyle, legal certainty and proximity to core markets. For wealth managers, the key consideration is whether the tax savings justify the annual payment. Advisers say the regime becomes compelling for clients with at least EUR 5 to 10 million in offshore assets, particularly those exiting less predictable tax systems.\n\n## The United Kingdom exodus: Britain\'s loss, Italy\'s gain\n\nRachel Reeves\' decision to scrap the UK\'s 200-year-old non-dom regime in April 2025 triggered the fastest wealth exodus from Britain in modern history.\n\nUBS projects a 17% decline in UK millionaires by 2028. An estimated 16,500 millionaires left Britain in 2024, taking $92 billion with them. [London](/en/markets/london) has lost 30,000 millionaires over the past decade.\n\nThen came the Richard Gnodde moment. Goldman\'s vice chairman, the person who built their international operations from a few dozen London employees into a global powerhouse, relocated to Milan in April 2025. Others followed: Nassef Sawiris, Lakshmi Mittal, Yoel Zaoui. These are not passive wealth holders. They are operators.\n\nThe pattern is self-reinforcing. Wealthy clients move to Milan. Their bankers follow to service them. More financial infrastructure appears.\n\n## Milan: Europe\'s new financial powerhouse\n\nMilan\'s transformation from regional financial center to genuine European powerhouse represents one of the most remarkable urban economic stories of the 2020s. By end-2023, Italy\'s economy was 4.3% larger than pre-pandemic levels, stronger than Britain, Germany, or France.\n\nItalian private banking AUM hit EUR 1.286 trillion in March 2025, up EUR 115 billion and 9.8% year-over-year. That is not just market appreciation: it is EUR 14 billion in net new money in Q1 alone.\n\nGlobal banks are voting with capital. Julius Baer opened a Milan branch in March 2025. Goldman Sachs and JPMorgan are expanding trading operations. Barclays moved into new Milan offices. Hedge funds like Capstone and Eisler Capital established presences. Charles Russell Speechlys opened a Milan office.\n\nMilan\'s startup ecosystem has experienced fifteen-fold growth over a decade, now valued at EUR 60 billion. The city holds 98% of Italy\'s upcoming data center capacity.\n\n## The real estate boom: property as wealth magnet\n\nItaly\'s attraction for wealthy individuals manifests most visibly in surging luxury real estate prices, particularly in Milan and the Lake Como region.\n\nMilan residential property market has experienced consistent growth, with average prices increasing 31% from EUR 4,200 to EUR 5,512 per square meter over five years. But city averages hide the real action. Prime locations in Centro Storico, Brera, and Porta Nuova reach EUR 10,000 to EUR 15,000 per square meter. Foreign buyers represent 80% of premium property sales.\n\nLake Como has become ground zero. Average prices hit EUR 2,993 per square meter, up 9.27% year-over-year, but ultra-prime lakefront villas are trading at EUR 20,000 per square meter. Multiple offers on well-priced properties are standard. Some premium listings attract ten or more competing bids.\n\nOne senior broker dismissed concerns about the tax increase affecting demand: they operate at a wealth level significantly above the EUR 200,000 flat tax. It is like saying coffee went from EUR 2 to EUR 3. You are not giving up coffee.\n\n## The infrastructure bet\n\nHere is what people miss: Italy is making the largest infrastructure investment in its history, EUR 125 billion by 2032 for strategic works.\n\nThe EUR 194 billion National Recovery and Resilience Plan is transforming the country: EUR 25 billion strengthening rail corridors, EUR 23.8 billion accelerating energy decarbonization, EUR 33.7 billion on energy security, with 1,700 construction sites opened to date.\n\nFor the second consecutive year, Southern Italy\'s economy grew faster than the North, driven by infrastructure spending. That is historically unprecedented.\n\nThis signals to wealthy individuals something crucial: government fiscal discipline, long-term planning capacity, and improving connectivity. It is not just about tax savings. It is about betting on a country that is actually building for the future.\n\n## The lifestyle advantage: more than just tax savings\n\nDubai may offer zero tax, but Italy offers lifestyle, legal certainty, and proximity to core markets. That captures something essential. Ultra-wealthy retirees can accept Dubai\'s cultural limitations. Senior bankers who are still working cannot.\n\nMilan offers international schools for expat families, world-class healthcare, direct flights to major global financial centers, sophisticated dining and culture, Lake Como an hour away, and Rome, Florence, Venice, Tuscany within easy reach.\n\nCost of living remains lower than London or Monaco despite rising luxury prices. Your tax-optimized income stretches further: larger properties, more staff, better schools, superior lifestyle at equal or lower total cost. For families with children, that alignment of financial optimization and quality of life is rare.\n\n## Getting talent in: Italy fixes its immigration problem\n\nItaly just solved a problem most wealth hubs ignore: how do you attract money without the people to service it?\n\nIn July 2025, Italy approved 500,000 work permits for non-EU nationals through 2028, the largest allocation in the country\'s history. What actually changed: pre-departure training so workers get linguistic and cultural preparation before arriving, digital-first processing with faster approvals, and centralized platforms replacing consular office complexity.\n\nFor private banks expanding in Milan, this is critical. Your London team can actually relocate without visa complications. Your Swiss hires can transfer smoothly. You can staff new offices with people who know the clients.\n\n## The competitive map: where Italy actually stands\n\nItaly did not win by accident. It sits in a carefully calculated position between zero-tax havens and high-tax European economies.\n\nThe UAE and Dubai offer zero tax on everything with sophisticated infrastructure. The catch: extreme heat, cultural restrictions, distance from European and US markets. Fine for retirees. Limiting for active bankers who need European deal flow.\n\nThe United States has no special flat tax, but Florida, Texas, and Nevada have zero state income tax. Great if you are building something. Less attractive if you are optimizing existing wealth.\n\nSwitzerland offers cantonal tax competition with centuries of banking tradition. The catch: brutal cost of living, limited cultural appeal, and critically smaller deal flow than major markets.\n\nMonaco is the ultimate zero-tax play with Mediterranean lifestyle. The catch: tiny scale, property prices that make Milan look cheap, impractical for anyone seeking business involvement beyond wealth preservation.\n\nItaly\'s EUR 200,000 flat tax delivers a 4% effective rate on EUR 5 million in foreign income. Compare that to 40 to 50% in most developed markets. But it is not just the rate. Italy offers EU membership and G7 legitimacy, actual business opportunities and deal flow, sophisticated financial infrastructure that can handle complex structures, and lifestyle that beats pure tax havens without compromise.\n\nPortugal killed its non-habitual resident regime in 2024. The UK abolished non-dom status in 2025. Italy\'s main European competitors eliminated themselves, creating a window where Italy faces almost no direct competition.\n\n## The risks ahead\n\nNothing this good lasts forever without challenges.\n\nTax instability is a concern: raising the threshold twice in two years creates perception problems. Ultra-wealthy individuals need long-term certainty. Keep pushing the rate higher, and you risk hitting an inflection point where alternatives look better.\n\nPolitical volatility remains: Meloni\'s government has supported the regime, but Italian politics is unpredictable. Future governments could reverse course if public backlash intensifies over wealthy foreigners driving up costs for locals.\n\nEU regulatory pressure is possible: while Italy has avoided formal challenges so far, increasing coordination on EU tax policy could constrain future flexibility.\n\nSupply constraints are real: Milan and Como face physical limits on new construction in prime locations. If even wealthy people cannot find suitable residences, flows redirect elsewhere.\n\n## The bottom line\n\nHenley and Partners projects 3,600 millionaires relocating to Italy in 2025, bringing $21 billion in private wealth. That ranks Italy third globally for millionaire migration.\n\nFor private banking institutions and wealth managers, Italy\'s rise represents both opportunity and existential threat. Firms without Italian presence risk losing clients relocating from London, Paris, or other European cities.\n\nThe next 3 to 5 years will determine whether Milan\'s ascent is temporary, driven by UK policy mistakes, or a permanent reordering of European wealth management geography.\n\nRight now, the smart money is on permanent. When Goldman vice chairmen start relocating, you know something structural has shifted.`,\n\n  },\n\n  // =========================\n  // 2026 — FEATURED\n  // =========================\n  {\n    slug: "investment-advisor-replacing-rm",\n    ogImage: "/og-articles/og-investment-advisor-replacing-rm.jpg",\n    title: "The Investment Advisor Replacing the Relationship Manager",\n    date: "2025-10-01",\n    markets: ["CH", "UK", "UAE", "ASIA"],\n    summary: "Quietly, without press releases or org chart announcements, power is shifting inside Swiss private banks. Investment Advisors are no longer support functions. They are becoming the decisive voice in whether clients stay, reallocate, or walk away.",\n    linkedinUrl: "https://www.linkedin.com/pulse/investment-advisor-replacing-rm-gil-m-chalem/",\n    featured: false,\n    engagementScore: 80,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: ["investment advisor private banking", "RM vs IA", "private banking advisory", "Swiss private banking talent"],\n    body: `For decades, the Relationship Manager was the unquestioned centre of gravity in private banking. Clients trusted them. Banks rewarded them. Careers were built around them. Today, clients still smile at their RMs. But when it comes to decisions, they listen to someone else.\n\nQuietly, without press releases or org chart announcements, power is shifting inside Swiss private banks. Across UBS, Pictet, Julius Baer, Lombard Odier and UBP, Investment Advisors are no longer support functions. They are becoming the decisive voice in whether clients stay, reallocate, or walk away.\n\n## The RM myth: why the old model is breaking\n\nThe traditional RM model was built for a different era. Thirty years ago, the RM\'s value proposition was clear: access to products, execution capability, discretion and trust, and adequate long-term returns. That world no longer exists.\n\nToday\'s UHNW clients are institutional in mindset. Many sit on investment committees. Many run family offices in parallel. Many benchmark their bank against MSCI World net of fees, private credit indices, and competing banks quarterly, not emotionally. The RM\'s historical levers, access, confidentiality, personal trust, are no longer differentiators. They are table stakes.\n\nWhat clients actually care about in 2026: net portfolio performance after fees, after FX, after tax. Behavioural guidance in volatility. Alternatives done properly. Cross-border structuring across CH, UK, [Dubai](/en/markets/dubai), US. Real customisation. Transparent attribution. Notice what is missing: charisma, golf, trust me I know headquarters. Relationships still matter, but they are no longer the product. The portfolio is.\n\n## What UHNW clients actually want\n\nRecent internal surveys across Swiss private banks show a paradox: over 50% of bankers cite deepening relationships as the top priority while clients increasingly define relationship quality as investment clarity and accountability.\n\nClients ask questions RMs often cannot answer convincingly: why this allocation, why not more alternatives, why is this bond still here, why are we not using direct indexing for tax efficiency? These are Investment Advisor questions. At many banks, the RM does not own the portfolio. The CIO does not know the client. The IA sits in between and increasingly fills the gap.\n\nAround 40% of Swiss UHNW clients now split residency, assets or family presence across multiple jurisdictions. They want specialists who understand currency hedging, tax residency shifts, regulatory frictions, and liquidity across booking centres. When complexity rises, specialists gain power. That specialist is rarely the RM.\n\n## The fracture point\n\nThe CIO is too distant. The RM is too generalist. And clients are no longer patient. This is where the traditional RM-centric model fractures.\n\n## The rise of the client-facing investment brain\n\nA new archetype is emerging. Not the traditional IA. Not the classic RM. But a hybrid with deep portfolio construction expertise, alternatives fluency, client-facing authority, attribution ownership, and cross-border literacy. This person sits in client meetings, defends decisions, pushes back when needed, and owns outcomes. This person can replace the RM as the primary client anchor.\n\n## Career consequences\n\nFor RMs: adapt and become hybrid or lose influence. Relationship alone no longer guarantees relevance. For Investment Advisors: technical credibility plus client authority equals leverage. Compensation is catching up fast. For juniors: investment expertise first, relationship skills second. The order has flipped.\n\nThe banks adapting well: Lombard Odier, aggressively strengthening IA benches and offering compensation parity. Pictet, prioritising investment mindset over pure RM pedigree. Vontobel, with long-standing IA credibility attracting both assets and talent.\n\nIn the next five years, only one thing will matter: who controls the portfolio. Because the person who controls the portfolio controls the conversation, the credibility, and ultimately, the client relationship.`,\n  },\n\n  {\n    slug: "family-office-revolution",\n    ogImage: "/og-articles/og-family-office-revolution.jpg",\n    body: `The family office sector is undergoing a transformation unlike anything seen in decades. What was once a privileged structure reserved for the ultra-wealthy few is rapidly evolving into a sophisticated ecosystem that is reshaping global wealth management.\n\n## The explosive growth trajectory\n\nGlobal family office AUM is projected to reach $5.4 trillion by 2025, growing at 7.5% annually. The number of single-family offices worldwide has exploded from approximately 6,000 in 2019 to over 10,000 today, a 67% increase in just six years. Multi-family offices now manage over $1.2 trillion collectively.\n\nWhat is driving this growth? Three converging forces: the great wealth transfer of $84 trillion moving between generations over the next 20 years, the institutionalisation of UHNW thinking as wealthy families demand institutional-grade services, and the democratisation of access as technology reduces the minimum threshold for cost-effective family office structures.\n\n## The evolution from preservation to optimisation\n\nThe traditional family office focused primarily on wealth preservation: conservative investments, basic tax planning, estate management. Today\'s family offices operate more like sophisticated institutional investors. Direct investment in private companies, co-investment alongside institutional investors, and principal investment strategies now represent 20 to 35% of typical family office portfolios. Alternative investments dominate: private equity at 25 to 30%, hedge funds and alternatives another 15 to 20%, real estate 10 to 15%.\n\n## Geographic shifts\n\n[Singapore](/en/markets/singapore) has positioned itself as Asia\'s premier family office destination, with registered single-family offices growing from approximately 50 in 2017 to over 1,400 by 2025. Dubai\'s [DIFC](/en/markets/dubai) has emerged as the Middle Eastern hub of choice, with family offices growing 40% year-over-year in 2024. Switzerland remains the gold standard for established European family offices. However, the competitive pressure from Singapore and Dubai is real and intensifying.\n\n## The talent war intensifies\n\nFamily offices are winning the talent war against traditional private banks. Compensation packages include both base salary and carried interest participation in direct investments. Work culture is more entrepreneurial, with staff often having direct access to principals. The most sought-after profiles: investment professionals with private equity or hedge fund backgrounds, technology leaders, next-generation advisors who can engage meaningfully with millennial and Gen Z inheritors, and multi-jurisdictional tax and legal specialists.\n\n## The future\n\nThe winners will be those who embrace technology as a core competency, build genuine co-investment networks, develop compelling value propositions for next-generation family members, and create sustainable organizational structures that outlast any individual. The family office revolution is creating extraordinary opportunities for professionals who understand this evolution and can position themselves at its intersection.`,\n    title:\n      "The Family Office Revolution: From Privilege to Power — And the Reckoning That Comes With It",\n    date: "2026-01-27",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary:\n      "Family offices are no longer discreet satellites of private banks — they are becoming competing ecosystems. The growth is structural, and it is reshaping mandates, talent, and how UHNW clients allocate capital globally.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/family-office-revolution-from-privilege-power-comes-gil-m-chalem--1o96e/",\n    featured: true,\n    engagementScore: 80,\n    pillar: "P1",\n    subTheme: "ScaleVsBoutique",\n    keywords: [\n      "family office vs private bank",\n      "wealth management competition",\n      "UHNW ecosystem",\n      "Swiss private banking strategy",\n    ],\n  },\n  {\n    slug: "ubs-unbeatable",\n    ogImage: "/og-articles/og-ubs-unbeatable.jpg",\n    body: `At first glance, the numbers look decisive. UBS manages USD 3.85 trillion in global wealth management assets. It absorbed Credit Suisse\'s remaining private banking operations. It has more relationship managers, more booking centers, more product capabilities, and more balance sheet than any competitor by a significant margin. The conclusion most observers draw: UBS is unbeatable. I think that conclusion is wrong.\n\n## What dominance actually looks like\n\nUBS is dominant. Full stop. No serious analysis suggests otherwise. A UHNW client who needs leveraged financing in [Singapore](/en/markets/singapore), estate planning in [Geneva](/en/markets/geneva), and a structured product in New York simultaneously has one serious option for a fully integrated solution. It is UBS. The Credit Suisse acquisition has deepened that dominance in specific markets. What is not real is the conclusion that dominance translates into unassailability.\n\n## The four vulnerabilities\n\nIntegration fatigue at the client level. When two institutions merge, clients experience the disruption. Account migrations, system changes, new compliance requests, new relationship managers. The Credit Suisse client who was managed by a private banker they had known for fifteen years is now navigating a much larger organisation. That friction creates switching intention in a way that pure market share statistics completely obscure.\n\nCultural dilution. UBS built its modern private banking on a disciplined, process-driven model. Credit Suisse at its best operated with more entrepreneurial latitude. Combining those cultures does not produce a hybrid strength. It typically produces several years of cultural negotiation during which neither identity fully prevails.\n\nTalent mobility. The consolidation has created an unprecedented supply of senior private banking talent in motion, bankers who left Credit Suisse, bankers who chose to leave UBS rather than navigate the integration. This talent is going somewhere. And the institutions absorbing it are building capability that did not exist three years ago.\n\nThe client size mismatch. UBS\'s profitability model is optimised for clients above a certain asset threshold. Below that threshold, the economics do not work particularly well. That creates a natural opportunity for institutions that can serve the CHF 3 to 10 million segment with a focused, cost-effective model that UBS cannot profitably replicate at scale.\n\n## Where the real competition is happening\n\nEFG International has built genuine expertise in the entrepreneurial UHNW market. Its model of motivated, equity-participating relationship managers is fundamentally different from the UBS approach. Pictet has spent 220 years cultivating clients who value institutional permanence and intellectual independence. Lombard Odier has invested in technology and operational infrastructure while maintaining its partnership model.\n\n## The talent market implication\n\nThe most experienced, most portable private banking talent is not uniformly going to UBS. It is going to the institutions that offer the clearest value proposition for a specific client segment. The integration has created a temporary advantage for every non-UBS institution in this market. That window does not stay open indefinitely. Unbeatable is a word that private banking history has consistently punished.`,\n    title: "UBS Just Became Unbeatable",\n    date: "2026-01-20",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary:\n      "Scale, capital, and platform depth are redefining competitive advantage. UBS is consolidating a position that changes hiring patterns, client expectations, and the strategic options available to other private banking players.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/ubs-just-became-unbeatable-gil-m-chalem--pchae/",\n    featured: true,\n    engagementScore: 74,\n    pillar: "P1",\n    subTheme: "Positioning",\n    keywords: [\n      "UBS private banking future",\n      "Swiss private banking strategy",\n      "wealth management consolidation",\n      "platform advantage",\n    ],\n  },\n\n  // =========================\n  // 2025\n  // =========================\n  {\n    slug: "from-zurich-hong-kong-navigating-wealth-multipolar-world",\n    ogImage: "/og-articles/og-from-zurich-hong-kong-navigating-wealth-multipolar-world.jpg",\n    body: `The geography of global private wealth has fundamentally shifted. Where once [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich) served as the unquestioned nerve centers of international wealth management, the world\'s rich are now spreading their assets, their residencies, and their banking relationships across multiple jurisdictions simultaneously. For the private banking professional navigating this shift, the change is not merely operational. It is existential.\n\n## The redistribution is real and accelerating\n\nAsia-Pacific now accounts for approximately one-third of global millionaires, compared to under 20% a decade ago. The Middle East\'s UHNW segment grew at twice the global average. UK wealth outflows have accelerated since the non-dom regime changes, with an estimated $92 billion in private wealth departing in 2024 alone. The multipolar world has arrived.\n\n## What this means for client complexity\n\nA decade ago, a Geneva-based private banker serving a Lebanese family might deal with two jurisdictions: Switzerland for custody, Lebanon for client domicile. Today, that same family might have children in [London](/en/markets/london), Dubai, and Montreal. Assets in Swiss francs, dollars, and dirhams. Business interests across three continents. A next generation that has never set foot in Beirut.\n\nThe number of jurisdictions in play for a typical UHNW client has roughly doubled in ten years. The regulatory touch points have multiplied proportionally. The private banker who built their career serving Swiss-booked European clients with single-domicile families is working with a skill set that no longer covers the full addressable client base.\n\n## The booking center question\n\n[Singapore](/en/markets/singapore) has grown from a regional outpost to a genuine alternative to Geneva and Zurich for Asia-facing wealth. Bank of Singapore, DBS, and the major Swiss private banks with Singapore presences are building genuine depth in structuring, alternatives, and credit that can serve UHNW clients as a primary relationship, not a secondary one.\n\nDubai has followed a similar trajectory, compressing into a decade what Singapore built over three. The [DIFC](/en/markets/dubai) now hosts over 600 financial institutions. For the private banking professional, this creates a genuine career question. The banker who can credibly navigate Geneva, Singapore, and Dubai simultaneously is offering something categorically different.\n\n## The talent market consequence\n\nFive years ago, a strong Swiss private banking profile needed deep expertise in one or two markets and one booking center. Today, the most competitive profiles combine primary expertise in a specific client segment with genuine familiarity across at least two booking center environments. The banks building the most competitive talent pipelines are those that have recognised this shift and structured their hiring accordingly. In a multipolar wealth landscape, the specialist is the banker who can navigate complexity across borders, not the one who has optimised for depth in a single market.`,\n    title: "From Zurich to Hong Kong: Navigating Wealth in a Multipolar World",\n    date: "2025-06-01",\n    markets: ["CH", "UK", "US", "ASIA"],\n    summary:\n      "The global wealth management industry is undergoing a seismic shift, driven by technological innovation, regulatory pressures, and evolving client demands. This analysis examines the distinct strategies employed by leading financial hubs across Switzerland, the United States, Asia, MEA, and Latin America.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/from-zurich-hong-kong-navigating-wealth-multipolar-world-m-chalem--ezase",\n    featured: true,\n    engagementScore: 78,\n  },\n  {\n    slug: "global-markets-outlook-2025-strategic-insights-private-bankers",\n    ogImage: "/og-articles/og-global-markets-outlook-2025.jpg",\n    body: `The global economic landscape in 2025 presents private bankers with a complex tableau of opportunities and risks that demand sophisticated navigation.\n\n## The macro framework\n\nThe IMF projects global growth at 3.3% in 2025, slightly below the historical average of 3.7%. The United States continues to outperform at around 2.5%, driven by resilient consumer spending and technology sector dominance. Europe struggles at approximately 1.2%, constrained by structural competitiveness issues. China targets 5% growth but faces headwinds from property sector deleveraging and demographic pressures. India exceeds 6.5%.\n\nInflation has largely been tamed in developed markets. The US sits at approximately 2.5%, the eurozone at 2.2%. However, the last mile of disinflation is proving stubborn, keeping central banks cautious about aggressive rate cuts.\n\n## The asset allocation implications\n\nUS large-cap equities, while expensive by historical valuation metrics, continue to benefit from technology sector earnings strength and AI productivity gains. Fixed income has been rehabilitated as an asset class after the brutal 2022 repricing. Investment-grade corporate bonds offer yields that make sense in a 2.5% inflation world. For private banking clients who spent the zero-rate era forced into equity risk they did not always want, the return of meaningful fixed income yields represents a genuine portfolio construction improvement.\n\nAlternatives remain the structural growth story. Private equity, private credit, infrastructure, and real assets continue to attract capital from institutional and increasingly UHNW investors. The democratisation of alternatives access through ELTIF structures and interval funds is accelerating the flow of private wealth into these markets. This is the most important structural shift in private banking portfolio construction of the past decade.\n\n## Geopolitical risk as permanent feature\n\nThe geopolitical backdrop is genuinely complex. The US-China relationship has stabilised somewhat but remains structurally competitive. The Middle East situation has introduced new volatility variables. For private bankers, geopolitical risk has moved from background noise to active portfolio consideration. The banker who can engage substantively with scenario analysis is providing genuine value that client-facing technology cannot replicate.\n\n## The technology transformation\n\nAI is genuinely changing private banking. The most immediate impact is operational: compliance, client reporting, portfolio analytics, and meeting preparation are all being improved by AI tools. The deeper impact is on the nature of the advisory relationship itself. As AI systems become better at synthesising market information, the relationship manager\'s value increasingly comes from judgment, context, and the human dimensions of wealth advisory.`,\n    title: "Global Markets Outlook 2025: Strategic Insights for Private Bankers",\n    date: "2025-11-25",\n    markets: ["CH", "UK", "US", "UAE", "ASIA"],\n    summary:\n      "The global economic landscape in 2025 presents a mosaic of opportunities and risks across regions. This data-driven analysis provides strategic insights for Swiss, European, and emerging market wealth managers.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/global-markets-outlook-2025-strategic-insights-gil-m-chalem--hjcre",\n    featured: true,\n    engagementScore: 75,\n  },\n  {\n    slug: "turbulent-time-crisis-resilience-market-leadership-times",\n    ogImage: "/og-articles/og-turbulent-times-crisis-resilience.jpg",\n    body: `What separates private banking leaders who emerge stronger from crises from those who simply survive? The Swiss private banking sector has navigated an extraordinary sequence of disruptions since 2020: the pandemic, the inflation and rate cycle, the Credit Suisse collapse, UBS\'s multi-year integration challenge, and geopolitical volatility affecting client portfolios and mobility.\n\n## Two types of resilience\n\nStructural resilience is the ability of an institution to absorb shocks through capital strength and operational depth. Adaptive resilience is the ability of practitioners to recalibrate their value proposition as circumstances change. Both matter, but in the talent market, it is the second that creates career advantage.\n\n## What adaptive resilience looks like in practice\n\nThe private bankers who have emerged strongest from this sequence share certain characteristics. They maintained and deepened client relationships through periods of institutional instability. When their employer was going through difficulty, they kept clients informed, managed expectations honestly, and preserved trust precisely when the institutional brand was providing less support. That skill, keeping relationships intact when the institutional scaffolding is disrupted, is the most valuable demonstration of genuine [portability](/en/portability).\n\nThey invested in capability building during periods of reduced activity. Practitioners who used the pandemic period or the 2022 dislocation to deepen their knowledge of alternatives, digital assets, or cross-border structuring emerged with a materially stronger advisory offering.\n\nThey read the structural changes correctly and positioned accordingly. The bankers who understood that UBS absorbing Credit Suisse would create a multi-year talent and client dislocation opportunity, and who positioned themselves at institutions ready to absorb that dislocation, made better career decisions than those who simply waited for stability to return.\n\n## The leadership dimension\n\nCrisis periods reveal leadership capacity in ways that normal market conditions do not. Managing a team through an institutional merger requires specific skills: honest communication about uncertainty, the ability to retain key people when external offers are plentiful, and the judgment to know when to protect the team and when to let individuals pursue genuinely better opportunities.\n\n## For the practitioner\n\nThe current moment in Swiss private banking, with a major integration still completing, regulatory frameworks still evolving, and client geography still shifting, is not a period to wait out. It is a period to build. The practitioners who will look back on this moment as the one that defined their trajectory are the ones who used the disruption to deepen relationships, build capabilities, and position themselves at institutions whose strategic direction aligns with where client wealth is actually moving. Crisis resilience is not passivity in the face of turbulence. It is the judgment to know which turbulence to navigate through and which to use as propulsion.`,\n    title:\n      "Turbulent Time: Crisis Resilience and Market Leadership in Turbulent Times (Middle East Conflict)",\n    date: "2025-12-01",\n    markets: ["CH", "UK", "US", "ASIA"],\n    summary:\n      "The Swiss private banking sector demonstrates exceptional stability amid escalating global tensions, with industry assets under management reaching record levels and providing valuable lessons.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/turbulent-time-crisis-resilience-market-leadership-times-m-chalem--wu0fe",\n    featured: true,\n    engagementScore: 80,\n  },\n  {\n    slug: "ubss-silent-earthquake-10000-more-jobs-set-disappear-2027",\n    ogImage: "/og-articles/og-ubss-silent-earthquake.jpg",\n    body: `According to Swiss publication SonntagsBlick, UBS is planning to cut up to 10,000 additional jobs by 2027, reducing total headcount to approximately 95,000 full-time positions. This is not just another round of restructuring. This is a signal that the Credit Suisse integration is far more challenging, far more expensive, and far messier than UBS has publicly acknowledged.\n\n## The numbers\n\nUBS currently employs approximately 110,323 people. Since summer 2023, approximately 15,000 jobs have already been eliminated. With the proposed 10,000 additional cuts, headcount would fall to around 95,000, representing a total reduction of approximately 25,000 positions since the acquisition, nearly 23% of the combined workforce. Approximately 3,000 of these redundancies are expected in Switzerland.\n\nUBS has not officially confirmed these plans and refuses to comment on specific reduction targets. The bank emphasizes cuts should be minimised through natural attrition, early retirement programs, internal mobility, and internalizing external vendor roles. But the numbers do not lie. The cuts are coming.\n\n## Why this is happening now\n\nThis announcement reveals what UBS has not been saying about the Credit Suisse integration. According to SonntagsBlick, numerous complex client relationships from Credit Suisse remain incomplete. Old Credit Suisse legacy systems must continue to be operated because full migration has not been achieved, causing significantly higher operational costs than anticipated.\n\nBy end of Q3 2025, UBS had achieved $10 billion in cost synergies, representing 77% of the $13 billion target. But hitting the full target requires more aggressive job cuts than originally planned.\n\n## What this means for different stakeholders\n\nFor UBS employees globally: if natural attrition has been lower than expected, and the data suggests it has, significant layoffs are unavoidable. If you are at UBS and concerned about your role, now is the time to explore options.\n\nFor rival banks: this creates exceptional recruitment opportunities. Competing banks can acquire UBS talent, often at lower compensation, knowing the bank is about to reduce significantly. Morgan Stanley, Goldman Sachs, Bank of America, and other wealth managers have already been acquiring UBS talent during the integration.\n\nFor wealth management professionals: this is a critical signal for career planning. Competent wealth advisors, relationship managers, and specialists will have significant market demand as competitors build teams.\n\n## The unspoken reality\n\nWhat is most striking is what this reveals about the Credit Suisse integration\'s true state. UBS was confident enough in October 2025 to announce strong Q3 results and continue aggressive capital returns. Yet by December 2025, internal planning is circulating significantly larger job cut numbers. That gap between public confidence and private reality should concern everyone paying attention.\n\nFor UBS employees: the next 18 months will determine your future at the bank. If you are in a vulnerable role, exploring external opportunities now while you have leverage is strategic, not disloyal. The window is open.`,\n    title: "UBS\'s Silent Earthquake: 10,000 More Jobs Set to Disappear by 2027",\n    date: "2025-12-08",\n    markets: ["CH", "UK", "US", "ASIA"],\n    summary:\n      "According to Swiss publication SonntagsBlick, UBS is planning to cut up to 10,000 additional jobs by 2027. This signals that the Credit Suisse integration is more challenging than publicly acknowledged.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/ubss-silent-earthquake-10000-more-jobs-set-disappear-2027-m-chalem--z1axe",\n    featured: true,\n    engagementScore: 85,\n  },\n\n  // =========================\n  // 2024 — ARCHIVE (ALL MISSING ADDED + DATES CORRECT)\n  // =========================\n  {\n    slug: "transforming-wealth-management-global-trends",\n    body: `The wealth management industry stands at an inflection point. Five global trends are converging simultaneously, and the institutions and practitioners who understand their combined effect will shape the next decade of private banking.\n\n## Trend one: the democratisation of sophisticated financial products\n\nAlternative investments, once exclusive to institutional investors and the ultra-wealthy, are becoming accessible to a much broader segment. ELTIF 2.0 in Europe, product innovation in private credit, and technology platforms enabling fractional access are collectively dismantling the barriers that kept these asset classes exclusive. The private banker who built their practice around the implicit exclusivity of alternatives access can no longer rely on that gatekeeping function. The value must come from the quality of advisory judgment applied to that access.\n\n## Trend two: the intergenerational wealth transfer\n\nThe transfer of approximately $84 trillion between generations over the next two decades is not just a wealth management opportunity. It is a relationship disruption event of historic scale. Studies consistently show that 70 to 85% of heirs change their primary financial institution after inheritance. The institutions that retain intergenerational relationships are those that have invested in next-generation engagement long before the transfer occurs.\n\n## Trend three: the technology transformation of advisory\n\nAI and data analytics are fundamentally changing the economics of wealth advisory. Compliance, reporting, portfolio analytics, and meeting preparation are all being automated at pace. The relationship manager role is not disappearing. But its content is shifting toward judgment functions that technology cannot replicate: understanding client context, navigating complex family dynamics, providing perspective during market stress, and building trust that survives institutional transitions.\n\n## Trend four: the geographic rebalancing of private wealth\n\nSwitzerland remains the world\'s leading private banking center by AUM. But the growth is elsewhere. [Singapore](/en/markets/singapore), [Dubai](/en/markets/dubai), and emerging centers in the Middle East are growing faster, attracting both client assets and professional talent. The private banker whose entire career has been built within a single geographic context is working with a progressively narrower slice of the global opportunity.\n\n## Trend five: the regulatory intensification\n\nEvery major private banking jurisdiction has tightened its regulatory framework over the past decade. AML compliance, beneficial ownership transparency, cross-border reporting obligations, and conduct standards are all more demanding than five years ago. The banker who positions themselves as an asset in the compliance conversation, rather than a compliance risk to be managed, is aligned with where institutional value increasingly resides.\n\n## The combined effect\n\nThese five trends do not operate independently. Their intersection rewards a specific type of practitioner: one who can navigate product complexity, build cross-generational relationships, leverage technology without being displaced by it, work comfortably across multiple jurisdictions, and operate with genuine regulatory sophistication.`,\n    title: "Transforming Wealth Management: Global Trends and Best Practices 🌍💼",\n    date: "2024-12-20",\n    markets: ["CH", "UK", "US", "ASIA"],\n    summary:\n      "The private banking and wealth management sector is at a turning point, driven by technological advancements, shifting client expectations, and regulatory complexity. With $72.6 trillion transferring from baby boomers to millennials by 2045, firms must adapt strategies to include broader service offerings and enhanced digital experiences.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/transforming-wealth-management-global-trends-best-gil-m-chalem--jkcqe",\n    featured: false,\n    engagementScore: 76,\n  },\n  {\n    slug: "exodus-ultra-high-net-worth-individuals-from-uk",\n    body: `The British Empire once attracted wealth from across the globe. In 2024 and 2025, that flow has reversed. The exodus of ultra-high-net-worth individuals from the United Kingdom represents one of the most significant wealth redistribution events in modern European history.\n\n## The scale\n\nHenley and Partners estimates approximately 16,500 millionaires left the United Kingdom in 2024, the highest figure ever recorded for any country. Net private wealth outflows are estimated at $92 billion. The trend has accelerated in 2025 following the implementation of the non-domicile regime changes announced in the spring budget.\n\nThe departures are concentrated in the UHNW segment: individuals with assets above $30 million, business owners with cross-border operations, senior finance professionals whose compensation structures were designed around the non-dom framework, and family offices that had established UK residence as part of a broader international structure.\n\n## What changed and why\n\nThe Labour government\'s decision to abolish the non-domicile tax regime, effective April 2025, was the proximate cause. The non-dom system had allowed UK residents domiciled abroad to shelter foreign income and gains from UK taxation for decades. What was perhaps underestimated was the speed and scale of the behavioural response. Wealth does not wait for certainty about implementation details before beginning to move.\n\n## Where the money is going\n\nSwitzerland has been a primary beneficiary, particularly [Geneva](/en/markets/geneva) and [Zurich](/en/markets/zurich) for structured wealth management. [Dubai](/en/markets/dubai) has absorbed a significant portion, particularly from Middle Eastern and South Asian families who had used [London](/en/markets/london) as a European hub but have no particular attachment to European jurisdiction. Italy\'s flat tax regime at EUR 200,000 annually has attracted individuals with European lifestyle preferences.\n\n## The private banking consequence\n\nFor Swiss private banks, the UK exodus has created a specific opportunity. Families departing London with $30 million to $300 million need to restructure their banking relationships, custody arrangements, investment management, and family governance frameworks to reflect new jurisdictional realities. That need for restructuring is precisely the kind of complex, relationship-intensive advisory work that distinguishes the Swiss private banking model. The private banks that have invested in UK-facing relationship managers and in onboarding processes that accommodate the specific complexities of the transition are capturing meaningful new business.`,\n    title:\n      "The Exodus of Ultra High Net Worth and High Net Worth Individuals from the UK: Reasons and Destinations",\n    date: "2024-12-01",\n    markets: ["UK"],\n    summary:\n      "In recent years, the United Kingdom has been witnessing a significant exodus of ultra-high-net-worth individuals seeking greener pastures abroad, with profound implications for British wealth management firms.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/exodus-ultra-high-net-worth-individuals-from-uk-gil-m-chalem--dwize",\n    featured: false,\n    engagementScore: 63,\n  },\n  {\n    slug: "swiss-european-banks-tighten-grip-cis-clients",\n    body: `The redistribution of CIS private wealth after February 2022 has created one of the most significant client segment reshuffles in Swiss private banking history.\n\n## The initial disruption\n\nThe imposition of Western sanctions on Russian individuals following the invasion of Ukraine created immediate and severe disruption to the CIS private banking market. Swiss banks moved quickly to identify exposed clients and restrict services to sanctioned individuals and entities. The process was imperfect, controversial, and remains legally contested in several cases.\n\nWhat is less discussed is the market consequence for the non-sanctioned segment. The CIS UHNW population is not monolithic. A substantial portion of Russian, Kazakh, Ukrainian, and other CIS wealth holders are not subject to sanctions and have legitimate, documented source-of-wealth profiles. Those individuals found themselves treated with heightened suspicion by institutions applying broad-brush risk-aversion to the entire geographic segment. That heightened scrutiny created relationship disruption. And relationship disruption creates switching behavior.\n\n## Where CIS wealth has resettled\n\n[Dubai](/en/markets/dubai) has emerged as the primary beneficiary for Russian and CIS wealth that had previously booked in Switzerland or [London](/en/markets/london). The UAE\'s neutral political position and its lack of participation in the Western sanctions regime made it an immediate alternative.\n\nSwitzerland has not lost its CIS franchise. What has happened is more nuanced: Swiss banks have become significantly more selective about the CIS clients they serve, concentrating on profiles with the clearest KYC documentation, the most demonstrably independent source of wealth, and the most transparent corporate structures.\n\n## The talent dimension\n\nRelationship managers with genuine Russian, Kazakh, or Ukrainian language capability, with authentic cultural knowledge of the CIS wealth segment, and with established client networks that survived the 2022 disruption are among the most actively recruited profiles in Swiss private banking. The banks competing most aggressively for this talent are typically the mid-sized Swiss institutions that see an opportunity to build a differentiated CIS franchise in the space created by the larger banks\' partial withdrawal from the segment.`,\n    title: "Swiss and European Banks Tighten Grip on CIS Clients Amid Sanctions Storm",\n    date: "2024-11-25",\n    markets: ["CH", "UK","CIS",],\n    summary:\n      "Swiss private banks and other European financial institutions are taking significant steps to address compliance and regulatory challenges with Commonwealth of Independent States region clients.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/swiss-european-banks-tighten-grip-cis-clients-amid-storm-m-chalem--age8e",\n    featured: false,\n    engagementScore: 61,\n  },\n  {\n    slug: "swiss-financial-market-developments",\n    body: `Swiss financial markets occupy a unique position in the global architecture: large enough to matter systemically, small enough to be genuinely affected by policy decisions that larger markets would absorb without visible consequence.\n\n## The SNB\'s zero rate environment\n\nThe SNB\'s decision to cut to 0% in June 2025 and hold there reflects the fundamental deflationary pressure of a strong franc, low domestic inflation, and an export sector facing headwinds from currency appreciation and global demand uncertainty. With inflation at 0.3% and GDP growth projected below 1.5%, the SNB has limited room to tighten and limited reason to.\n\nFor Swiss private banks, the zero rate environment is structurally challenging. Banks have now experienced both the pain of prolonged zero rates and the brief windfall of the 2022 to 2023 rate cycle. The risk is that institutions build [business plan](/en/bp-simulator)s around a rate normalization that does not materialise, or alternatively that they cut costs too aggressively during the current trough and are unprepared to scale when conditions improve.\n\n## The regulatory landscape\n\nFINMA has emerged from the Credit Suisse crisis with a clearer mandate and more explicit powers than before. The new too-big-to-fail legislation proposed by the Federal Council would significantly increase capital requirements for systemically important banks. Swiss banking regulation is tightening, not loosening.\n\nFor practitioners, the regulatory intensification creates both constraint and opportunity. In an environment where regulatory expertise is genuinely valuable, practitioners who have invested in understanding the framework have a competitive advantage over those who treat compliance as an administrative burden.\n\n## The franc dynamics\n\nThe Swiss franc\'s continued appreciation against major currencies is a structural reality that Swiss private banking must work within rather than against. For CHF-denominated clients, this is a feature: their wealth is held in one of the world\'s most stable stores of value. The currency expertise that Swiss private bankers have accumulated across decades of managing CHF-denominated wealth alongside internationally diversified assets is among the most genuinely differentiated skill sets in global private banking.`,\n    title: "The Swiss Financial Market developments",\n    date: "2024-11-18",\n    markets: ["CH"],\n    summary:\n      "The Swiss financial market has seen significant developments in recent months, particularly in the areas of regulatory changes, technological innovation, and market consolidation affecting private banking.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/swiss-financial-market-developments-gil-m-chalem--kvone",\n    featured: false,\n    engagementScore: 58,\n  },\n  {\n    slug: "should-private-banks-embrace-bitcoin-clients",\n    body: `The question that private banks spent years deflecting has become unavoidable: should we serve clients who want meaningful cryptocurrency exposure, and if so, how? The institutions that treated this as a reputational question to be managed have discovered it is actually a competitive question to be answered.\n\n## What has changed\n\nThe approval of spot Bitcoin and Ethereum ETFs in the United States, the implementation of MiCA in Europe, and Switzerland\'s own progressive framework through FINMA have collectively created a legitimate institutional infrastructure for digital asset exposure that did not exist three years ago. When BlackRock runs a spot Bitcoin ETF with $40 billion under management, the argument that digital assets are inherently fringe is no longer available to private banks as a policy rationale.\n\n## The client demand is real\n\nA significant portion of UHNW clients below 50 have meaningful personal exposure to digital assets, accumulated through direct purchase, through early-stage company investments, or through participation in token projects. They are not asking their private banker\'s permission to hold Bitcoin. They are asking whether their private banker is capable of helping them think about it as part of a broader wealth management framework. The clients who find their bank cannot engage substantively with this question form a judgment about their bank\'s relevance that accumulates over time.\n\n## What the leading institutions are doing\n\nJulius Baer\'s partnership with AMINA Bank established a credible digital asset offering without requiring the bank to build custody and technical infrastructure from scratch. UBS is preparing to offer Bitcoin and Ethereum trading to select Swiss private banking clients, a signal that the wait-and-see period is ending at the top end of the market.\n\n## The career implication\n\nFor private banking professionals, digital asset literacy has moved from optional enrichment to functional requirement. Not the ability to trade cryptocurrencies or explain consensus mechanisms, but the ability to have an informed conversation about the role of digital assets in a diversified UHNW portfolio, to understand the regulatory framework governing Swiss client access, and to distinguish between the legitimate use cases and the still-significant risk areas. The relationship managers who have developed this literacy are finding it creates differentiation in client conversations.`,\n    title: "Should Private Banks Embrace Bitcoin for Their Clients?",\n    date: "2024-11-10",\n    markets: ["US", "UK", "CH"],\n    summary:\n      "Swiss private banks are facing a pivotal decision regarding Bitcoin and cryptocurrency exposure for their high-net-worth clients, balancing innovation with regulatory compliance.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/should-private-banks-embrace-bitcoin-clients-gil-m-chalem--k0kze",\n    featured: false,\n    engagementScore: 64,\n  },\n  {\n    slug: "latam-private-banking-navigating-challenges",\n    body: `Latin America\'s private banking market presents a paradox that defines careers: immense concentrated wealth, significant structural challenges, and a client base that is among the most loyalty-intensive and relationship-dependent in global private banking.\n\n## The wealth concentration\n\nBrazilian, Mexican, Colombian, Argentine, Chilean, and Peruvian families together house approximately 85,000 dollar millionaires and around 500 UHNW individuals with assets above $100 million. The concentration at the top is extreme. This concentration creates specific dynamics: referrals between UHNW families in the same social and business circles are a primary source of new clients. The banker who has genuine credibility within those networks, built through years of relationship management and demonstrable competence during market crises, commands a franchise that is very difficult for newcomers to displace.\n\n## The offshore dynamic\n\nLatin American private wealth has historically been largely offshore-booked, with Switzerland, Miami, and more recently [Singapore](/en/markets/singapore) serving as primary custody centers. The reasons are structural: political and economic instability, historical currency crises, concerns about legal system reliability, and the legitimate diversification interests of families with cross-border business operations.\n\n[Geneva](/en/markets/geneva) has become a genuine center of Latin American private banking expertise, with relationship managers, legal advisors, and family governance specialists who understand the specific complexities of Latin American family wealth. Switzerland\'s attraction for LATAM UHNW clients combines political neutrality, currency stability, institutional credibility, and the depth of Spanish and Portuguese language capability at Swiss private banks that have invested specifically in this segment.\n\n## The compliance evolution\n\nThe implementation of CRS and bilateral tax information exchange agreements has made undeclared offshore assets essentially unsustainable. The private banker who navigated clients through that transition, helping families restructure legacy accounts into compliant arrangements, is viewed very differently by those clients than one who simply managed portfolios. The trust built through that kind of complex, sensitive advisory work is the foundation of the most durable client relationships in this market.\n\n## The talent implication\n\nSpanish and Portuguese language fluency is a baseline. Cultural familiarity with Latin American business and family dynamics is essential. Knowledge of the specific cross-border tax and structuring questions affecting clients with assets in multiple jurisdictions is increasingly important. Experienced LATAM private bankers with established networks are among the most actively sought-after profiles in Geneva and [Zurich](/en/markets/zurich) right now.`,\n    title: "LATAM Private Banking: Navigating Challenges and Opportunities in a $1.3T Market",\n    date: "2024-11-02",\n    markets: ["LATAM"],\n    summary:\n      "Swiss and US private banks face unique challenges and opportunities in covering the Latin American market, the third-largest globally for wealth management with substantial growth potential.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/latam-private-banking-navigating-challenges-13t-gil-m-chalem--g9jqe",\n    featured: false,\n    engagementScore: 71,\n  },\n  {\n    slug: "latest-news-swiss-financial-market-focus-banks",\n    body: `Swiss financial markets have delivered a sequence of developments over recent months that merit careful attention. The pattern that emerges is one of consolidation, adaptation, and the gradual resolution of uncertainty that has hung over the sector since March 2023.\n\n## The UBS integration approaching completion\n\nThe most consequential ongoing development is the UBS-Credit Suisse integration entering its final and most technically complex phase. The migration of Swiss-booked client accounts is now projected for completion in March 2026. Until the migration is complete, UBS is operating parallel infrastructure with the cost and operational complexity that implies. When it concludes, the bank will have a materially different cost structure and a clearer picture of what the combined franchise actually looks like.\n\nThe talent implications are direct. The conclusion of the integration will trigger a further assessment of headcount requirements, and the indications from UBS management suggest that the total job reduction will be substantially larger than the approximately 15,000 positions already eliminated.\n\n## The mid-tier competitive response\n\nThe Swiss mid-tier private banks have used the UBS integration period strategically. Julius Baer, EFG, Vontobel, Lombard Odier, UBP, and others have all recruited selectively from the displaced talent pool and have pitched their stability and continuity to clients navigating the UBS transition. The mid-tier as a group has grown faster than the sector average over the 2023 to 2025 period.\n\nThe question now is whether that momentum continues as UBS stabilises. My view is that the competitive realignment is more durable than a purely integration-driven disruption. Some of the clients who moved to mid-tier institutions during this period have genuinely better-suited banking relationships than they had before.\n\n## The regulatory implementation\n\nFINMA\'s enhanced supervisory framework is being implemented progressively, with systemically important banks subject to more intensive oversight than they experienced in the pre-Credit Suisse era. The private banks that have invested most systematically in compliance infrastructure are finding that this investment creates a genuine competitive advantage in client acquisition. Sophisticated UHNW clients are increasingly asking about their bank\'s regulatory standing as a component of their due diligence.`,\n    title: "Latest News on the Swiss Financial Market: Focus on Swiss and International Banks",\n    date: "2024-10-25",\n    markets: ["CH"],\n    summary:\n      "Key findings on monetary policy, interest rates, and the SNB\'s strategic direction continue to reshape the competitive landscape for Swiss banks and wealth managers.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/latest-news-swiss-financial-market-focus-banks-gil-m-chalem--vgjve",\n    featured: false,\n    engagementScore: 62,\n  },\n  {\n    slug: "unlocking-growth-cee-region-untapped-potential",\n    body: `Central and Eastern Europe represents one of private banking\'s most significant untapped opportunities. The combination of rapid wealth accumulation, relatively low private banking penetration, and a client base with specific geographic and cultural characteristics creates conditions that reward specialised expertise disproportionately.\n\n## The wealth creation engine\n\nPoland, the Czech Republic, Slovakia, Hungary, Romania, and the Baltic states collectively house a UHNW and HNW population that is meaningfully larger than most Western European practitioners appreciate. The wealth concentration is particularly notable in Poland, where the billionaire and near-billionaire segment has grown faster than in any other CEE market. The Baltic states, particularly Estonia and Latvia, have produced a disproportionate number of technology entrepreneurs relative to their population size.\n\n## The offshore booking question\n\nCEE wealth is characterised by significant offshore booking, historically directed toward Switzerland, Luxembourg, and Austria. The reasons are similar to those driving other emerging market wealth offshore: legal system certainty, political stability, currency diversification, and the desire to hold assets in a jurisdiction with a different risk profile than the home country.\n\nThe CRS implementation has changed the compliance landscape for CEE offshore clients, just as it has for other markets. Families that have structured their offshore holdings correctly are in a stable position. Those who delayed adaptation are in a more complex situation that creates specific advisory demand.\n\n## The relationship manager profile\n\nLanguage capability, whether Polish, Czech, Romanian, or another regional language, provides meaningful competitive advantage. Knowledge of the specific tax and legal frameworks in key CEE markets is valuable. And the ability to navigate the particular family dynamics of first-generation entrepreneurial wealth, where founders are often still active in their businesses and thinking about succession simultaneously, is a genuine differentiator. The private banks with the most developed CEE franchises have built dedicated teams with these characteristics.`,\n    title: "Unlocking Growth: The CEE Region\'s Untapped Potential for Swiss and Global Private Banks",\n    date: "2024-10-18",\n    markets: ["CEE"],\n    summary:\n      "Central and Eastern Europe (CEE) has emerged as a region of increasing importance and opportunity for Swiss and global private banking institutions seeking growth and diversification.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/potential-central-eastern-europe-cee-swiss-private-banks-m-chalem--bpooe",\n    featured: false,\n    engagementScore: 67,\n  },\n  {\n    slug: "why-apac-ultimate-private-banking-hotspot-2025",\n    body: `Asia-Pacific\'s private banking market is growing faster than any other region, generating wealth at a pace that is creating specific and urgent talent demand across the major hubs.\n\n## The growth numbers\n\nAsia-Pacific is home to approximately 6.2 million high-net-worth individuals with combined wealth exceeding $26 trillion. The region added more new millionaires in 2024 than any other geography. [Singapore](/en/markets/singapore) and [Hong Kong](/en/markets/hong-kong) continue to attract the institutional infrastructure to serve this wealth, while emerging hubs in Malaysia, Thailand, and the Philippines are growing from smaller bases.\n\nThe structural drivers of Asia-Pacific wealth creation are not cyclical. Technology entrepreneurship, particularly in Southeast Asia and India, continues to generate wealth at extraordinary rates. Family businesses transitioning from first to second generation are professionalising their wealth management arrangements.\n\n## Singapore as institutional hub\n\nSingapore\'s position as Asia-Pacific\'s primary private banking hub has strengthened considerably over the past five years. The MAS regulatory framework provides the stability and certainty that sophisticated UHNW clients require. The licensed family office count in Singapore now exceeds 1,400, a figure that underscores how seriously the ultra-wealthy segment is taking the jurisdiction as a primary wealth management base rather than simply a booking convenience.\n\n## Hong Kong\'s resilience\n\nHong Kong has navigated a complex several years, and its private banking market has shown more resilience than the headlines might suggest. The UHNW client base in Hong Kong is deeply embedded in Greater China business networks that cannot easily be replicated elsewhere, and the city\'s access to mainland Chinese wealth flows remains a structural advantage that Singapore cannot fully substitute.\n\n## The talent gap\n\nThe fundamental constraint on Asia-Pacific private banking growth is talent. Relationship managers with the right combination of regional language capability, product knowledge, and established client networks are in short supply relative to the demand that institutional growth is creating. Experienced APAC private bankers with established networks are in a market position that their peers without these capabilities cannot easily replicate.`,\n    title: "Why APAC is the Ultimate Private Banking Hotspot for 2025",\n    date: "2024-10-12",\n    markets: ["ASIA"],\n    summary:\n      "Private bankers focusing on the Asia-Pacific market in 2025 are positioned for unprecedented growth and opportunity in emerging wealth segments with strong fundamentals.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/why-apac-ultimate-private-banking-hotspot-2025-gil-m-chalem--bkhce",\n    featured: false,\n    engagementScore: 74,\n  },\n  {\n    slug: "rise-pigs-europes-economic-underdogs",\n    body: `The acronym that was coined to describe economic weakness has become a story of surprising resilience and, in some cases, genuine transformation. Portugal, Italy, Greece, and Spain are not the economic laggards they were characterised as during the European debt crisis. They are increasingly the jurisdictions that sophisticated wealth is choosing as primary or secondary bases.\n\n## What changed\n\nItaly\'s economy grew faster than Germany\'s or France\'s in 2024. Spain\'s GDP expansion has outpaced the eurozone average for three consecutive years. Greece, starting from a lower base, has delivered growth rates that would be creditable for any developed market. Portugal has become Europe\'s most talked-about destination for internationally mobile wealth.\n\nThe structural drivers vary by country, but several themes recur: labour market flexibility improvements, tourism revenue strength, technology sector development particularly in Lisbon and Barcelona, and the deliberate policy choice to use tax incentives to attract internationally mobile wealth and talent.\n\n## The tax regime competition\n\nThe competition to attract mobile wealth through tax incentives has become explicit across Southern Europe. Italy\'s flat tax regime at EUR 200,000 annually. Portugal\'s Non-Habitual Resident program, now closed to new applicants but influential in establishing the precedent. Greece\'s lump-sum tax of EUR 100,000 per year for non-domiciled UHNW individuals. Spain\'s Beckham Law providing income tax benefits for qualifying non-residents.\n\nThese regimes collectively represent a shift in how European governments think about internationally mobile wealth: not as a fiscal leak to be closed but as a resource to be competed for.\n\n## The private banking consequence\n\nFor Swiss and European private banks, the Southern European wealth migration creates specific demand. Families relocating from [London](/en/markets/london), [Geneva](/en/markets/geneva), or New York to [Milan](/en/markets/milan) or Lisbon need banking relationships that understand their new jurisdictional context. The private banks that have built genuine expertise in the specific requirements of the Italian, Portuguese, and Greek wealth management markets are capturing business that generic offshore banking capability cannot service adequately.`,\n    title: "The Rise of the PIGS: Europe\'s Economic Underdogs Take Flight",\n    date: "2024-10-05",\n    markets: ["EU"],\n    summary:\n      "Once whispered in hushed tones, the PIGS acronym—Portugal, Italy, Greece, Spain—now represents Europe\'s emerging economic success stories with implications for wealth management.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/rise-pigs-europes-economic-underdogs-take-flight-gil-m-chalem--1pyme",\n    featured: false,\n    engagementScore: 66,\n  },\n  {\n    slug: "saudi-arabias-economic-landscape-opportunities",\n    body: `Saudi Arabia\'s transformation from a petroleum-dependent economy to a diversified investment powerhouse represents one of the most ambitious economic reform programs of the 21st century, with direct and significant implications for private banking.\n\n## Vision 2030 and its private banking consequences\n\nVision 2030\'s ambition, reducing oil revenue dependence from 70% of government income to below 30%, requires a fundamental restructuring of the Saudi economy that is creating private wealth at a pace the kingdom has not experienced before. New sectors, technology, entertainment, tourism, financial services, are generating a generation of Saudi entrepreneurs whose wealth management needs are different from those of the traditional Saudi UHNW client.\n\n## The Riyadh hub development\n\nRiyadh\'s emergence as a financial center is not merely symbolic. More than 200 international financial institutions have established regional headquarters in Riyadh, including Goldman Sachs, JPMorgan, and UBS. The Capital Market Authority\'s regulatory development has created a framework that supports sophisticated financial services in a way that was not present a decade ago.\n\nFor private banks, the Riyadh expansion represents both a client acquisition opportunity and a talent positioning question. The banks that built early relationships with Saudi UHNW clients through their [Dubai](/en/markets/dubai) or [Geneva](/en/markets/geneva) presences are now extending into Riyadh to deepen those relationships and access the emerging entrepreneurial wealth that may not travel as readily to offshore centers.\n\n## The Islamic finance dimension\n\nSaudi Arabia\'s private banking market has specific requirements around Sharia-compliant investment structures. The private banker who understands sukuk markets, Islamic equity funds, and compliant structuring for family wealth has a competitive advantage that is not easily replicated by general expertise. The major Swiss private banks with significant Gulf presence have invested in this capability, but the depth of genuine expertise is still concentrated in a relatively small number of practitioners.`,\n    title: "Saudi Arabia\'s Economic Landscape and Opportunities for Private Banking",\n    date: "2024-09-28",\n    markets: ["MEA"],\n    summary:\n      "Saudi Arabia is undergoing significant economic transformation driven by its Vision 2030 initiative, creating new opportunities and challenges for private banking firms.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/saudi-arabias-economic-landscape-opportunities-gil-m-chalem--6c2qe",\n    featured: false,\n    engagementScore: 68,\n  },\n  {\n    slug: "battle-gulf-giants-saudi-arabias-vision-2030",\n    body: `The competition between Riyadh and Dubai for Gulf financial sector primacy has moved from diplomatic positioning to genuine institutional rivalry, with consequences for every private bank operating in the region.\n\n## The nature of the competition\n\nDubai built its financial hub status over three decades through regulatory innovation, geographic accessibility, and the deliberate creation of infrastructure, the [DIFC](/en/markets/dubai), Emirates NBD Private Bank, and the regulatory frameworks that attracted international institutions. It succeeded because it offered something the Gulf did not otherwise have: a credible, internationally recognised financial center.\n\nRiyadh\'s response, enabled by the capital deployment capacity of Vision 2030 and the Financial Sector Development Program, is different in character. Saudi Arabia is not trying to replicate the DIFC model. It is trying to make Riyadh the mandatory center for institutions that want access to the Saudi market, which is substantially larger than the UAE market by virtually every economic measure.\n\nThe Regional Headquarters Program, which requires international companies wanting to benefit from Saudi government contracts to establish their regional headquarters in Saudi Arabia, is the most explicit expression of this strategy. Over 200 companies have complied.\n\n## The implications for private banking\n\nThe Gulf is moving from a single-hub model centered on Dubai to a two-hub model where Riyadh and Dubai serve distinct but partially overlapping client bases. Dubai remains the primary international booking center for Gulf private wealth. Riyadh is becoming the mandatory location for institutions that want to actively develop Saudi domestic relationships.\n\n## The talent consequence\n\nPrivate banking talent in the Gulf is reorienting around this two-center reality. The relationship manager based exclusively in Dubai who served Saudi clients remotely is under pressure to either develop a Riyadh presence or cede the domestic Saudi market to institutions that have made the commitment. The banks that have established genuine Riyadh operations, with relationship managers who speak Arabic and understand Saudi business culture, are building franchises that their Dubai-only competitors cannot easily replicate.`,\n    title:\n      "The Battle of the Gulf Giants: Saudi Arabia\'s Vision 2030 vs. Dubai\'s Established Dominance",\n    date: "2024-09-20",\n    markets: ["UAE"],\n    summary:\n      "In the heart of the Middle East, a titanic struggle for economic supremacy is unfolding between Saudi Arabia and Dubai for private banking and wealth management dominance.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/battle-gulf-giants-saudi-arabias-vision-2030-vs-gil-m-chalem--1kvee",\n    featured: false,\n    engagementScore: 75,\n  },\n  {\n    slug: "swiss-private-banking-shake-up-mega-mergers",\n    body: `Swiss private banking has experienced more structural change in the past three years than in the previous three decades. The Credit Suisse emergency acquisition, the subsequent consolidation wave, and the ongoing compression of the sector from over 160 institutions to fewer than 80 have created a fundamentally different competitive landscape.\n\n## The mechanics of consolidation\n\nPrivate banking consolidation in Switzerland follows a well-established pattern. Small and medium-sized institutions face rising compliance costs that their asset base cannot efficiently absorb. They face technology investment requirements that demand scale to justify. And they face talent competition from larger institutions that can offer compensation structures and career development pathways that smaller players cannot match.\n\nThe result is a predictable sequence: cost pressure, margin compression, strategic review, and ultimately the choice between acquisition and a managed exit. The institutions that have avoided this fate are those that have found genuinely differentiated positions, in specific client segments, in geographic markets, in product specialisation, that justify their independent existence.\n\n## The winners and losers of consolidation\n\nThe acquirers that have managed AUM leakage most effectively are those that moved quickly on talent retention, that gave acquired relationship managers clear positioning within the combined institution, and that communicated credibly to clients about service continuity. The institutions that have struggled with acquisitions are those that treated the integration primarily as a balance sheet optimization rather than a client relationship management challenge.\n\n## The independent boutique survival case\n\nAgainst the consolidation trend, a specific category of Swiss private banking institution has demonstrated genuine resilience: the focused boutique with a clearly defined client niche, an ownership model aligned with long-term client interests, and a size that allows for the genuine personalisation that larger institutions struggle to deliver. Their competitive position, precisely because it is built on differentiation rather than scale, is harder to erode than that of the mid-sized generalist that falls between the specialist and the mega-bank.`,\n    title: "Swiss Private Banking Shake-Up: The Mega Mergers Redefining an Iconic Industry",\n    date: "2024-09-12",\n    markets: ["CH"],\n    summary:\n      "Over the past decade, the Swiss financial landscape has witnessed significant consolidation, particularly within its esteemed private banking sector with major implications.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/swiss-private-banking-shake-up-mega-mergers-iconic-gil-m-chalem--etbme",\n    featured: false,\n    engagementScore: 69,\n  },\n  {\n    slug: "traditional-private-banks-vs-family-offices",\n    body: `The comparison between traditional private banks and family offices has moved from theoretical to practically urgent as UHNW clients increasingly choose between the two models for their primary wealth management relationship.\n\n## The structural difference\n\nThe traditional private bank offers breadth: access to global markets, a full product shelf, regulatory certainty, and the institutional credibility of a recognised brand. The relationship manager serves multiple clients simultaneously, typically 30 to 60 relationships, and the bank\'s infrastructure provides the context within which those relationships operate.\n\nThe family office, whether single or multi-family, offers depth: a relationship with practitioners who work exclusively for one family or a small number of families, who understand the family\'s specific situation in comprehensive detail, and who operate with a mandate to serve the family\'s interests without the product distribution incentives that characterise bank advisory.\n\nThe choice between these models is not purely a function of asset size. Families with $50 million sometimes prefer the family office model because of the depth and customisation it offers. Families with $500 million sometimes prefer traditional private banking because of the product access and institutional certainty it provides.\n\n## The convergence trend\n\nThe distinction between the two models is blurring in practice. Traditional private banks are building family office service capabilities within their institutional structures. And multi-family offices are building product access and technology platforms that match what private banks offer. The convergence is client-driven. UHNW families experience their relationship with specific individuals, the quality of advice they receive, and the responsiveness of their advisors. The institutional wrapper matters less than the human relationship within it.\n\n## The talent market implication\n\nPrivate banking professionals are moving into family office roles, attracted by the depth of engagement and the alignment of interests. Family office practitioners are moving into private banking, attracted by scale, product breadth, and institutional resources. For practitioners navigating this boundary, the relevant question is not which model is superior in the abstract but which model is better suited to their specific strengths, their relationship style, and the client segment where they have built their credibility.`,\n    title: "Traditional Private Banks vs. Family Offices",\n    date: "2024-09-05",\n    markets: ["CH", "UK", "US"],\n    summary:\n      "Switzerland has long been a global hub for wealth management. Compare the differences and strategic advantages of traditional private banks versus emerging family office models.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/traditional-private-banks-vs-family-offices-gil-m-chalem--xkwxe",\n    featured: false,\n    engagementScore: 77,\n  },\n  {\n    slug: "how-global-economic-shifts-reshape-high-net-worth",\n    body: `The macroeconomic shifts of the past five years have not affected all wealth segments equally, and understanding the differential impact on the HNW and UHNW population is essential context for private banking practitioners.\n\n## The inflation and rate cycle\n\nThe 2022 to 2023 inflation surge and rate cycle had a specific effect on HNW wealth composition. Rising rates increased returns on cash and fixed income, benefiting wealthy individuals who held these instruments. But the repricing of long-duration assets, from growth equities to real estate to private equity fund valuations, reduced paper wealth for clients with significant allocations to these categories. The net effect varied significantly by portfolio composition. Clients with diversified allocations across geographies and asset classes weathered the period better than those concentrated in a single market or asset class.\n\n## The technology wealth concentration\n\nThe AI investment cycle has created a specific pattern of wealth concentration at the top of the technology sector. The Magnificent Seven\'s outperformance has been so extreme that portfolios with significant technology exposure have substantially outperformed those without. For private banking clients who held large positions in major technology companies, the past two years have been exceptional.\n\nThis concentration creates its own advisory challenge: when a client\'s portfolio is substantially dominated by a few positions that have appreciated dramatically, the risk management conversation becomes both more important and more difficult. The client who has watched a $10 million position become a $40 million position through appreciation is rationally reluctant to diversify, even if the concentration represents a risk that a dispassionate observer would reduce.\n\n## The geographic wealth shift\n\nThe most significant structural shift in global HNW wealth over the past decade has been the acceleration of wealth creation in Asia-Pacific and the Middle East at rates that outpace developed market growth. For Swiss private banks, this shift represents both a client acquisition opportunity and a talent requirement. The relationship manager whose expertise is entirely oriented toward European or American client dynamics is progressively less well-positioned to serve the client segments where wealth is growing fastest.`,\n    title: "How Global Economic Shifts Reshape High-Net-Worth Portfolios",\n    date: "2024-08-28",\n    markets: ["US", "UK", "CH", "ASIA"],\n    summary:\n      "As we approach 2025, high-net-worth individuals face an increasingly complex global economic landscape that directly influences their investment strategies and portfolio decisions.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/how-global-economic-shifts-reshape-high-net-worth-gil-m-chalem--uyl5e",\n    featured: false,\n    engagementScore: 73,\n  },\n  {\n    slug: "changing-face-swiss-private-banking",\n    body: `Swiss private banking in 2026 looks materially different from the sector that existed a decade ago, and the pace of change is accelerating rather than slowing.\n\n## The structural changes\n\nFrom over 180 private banking institutions in 2006, Switzerland now has fewer than 80. The combined AUM of the surviving institutions has grown substantially in the same period, meaning the consolidation has produced larger, better-capitalised entities rather than a diminished sector.\n\nThe partnership model, which was once the defining characteristic of Swiss private banking at the prestige end of the market, has become rarer but more valuable. Pictet, Lombard Odier, Mirabaud, and a handful of others have maintained their partnership structures through pressures that converted many peers into incorporated entities with external shareholders. The market premium that these institutions command in client trust and talent attraction reflects the genuine differentiation that their ownership model provides.\n\n## The talent transformation\n\nThe private banking talent market has shifted in ways that reflect the broader changes in the sector. The relationship manager profile that commanded premium compensation a decade ago, deep expertise in one market, strong personal relationships, a large legacy book, remains valuable but is no longer sufficient for the most competitive career trajectories.\n\nThe profiles attracting the most active interest in 2026 combine relationship depth with portfolio construction competence, jurisdictional breadth with genuine expertise in specific markets, and the interpersonal skills of traditional private banking with the analytical capabilities that increasingly sophisticated clients demand.\n\n## The client evolution\n\nPrivate banking clients are more financially sophisticated than they were a decade ago. The democratisation of investment information, the professionalisation of family governance, and the experience of navigating the 2008 crisis, the 2022 rate shock, and the Credit Suisse collapse have produced a client base that asks harder questions and expects more substantive answers. The private banker who thrives in this environment is not the one who manages client relationships through charm and institutional brand. It is the one who can engage substantively with complex financial questions, who has the intellectual honesty to acknowledge uncertainty, and who has built relationships deep enough to survive the inevitable periods of portfolio underperformance or institutional disruption.`,\n    title: "The Changing Face of Swiss Private Banking",\n    date: "2024-08-20",\n    markets: ["CH"],\n    summary:\n      "Switzerland\'s private banking sector, long renowned for expertise in wealth management, is undergoing significant transformation in response to digital disruption and regulatory changes.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/changing-face-swiss-private-banking-gil-m-chalem--thxhe",\n    featured: false,\n    engagementScore: 71,\n    pillar: "P1",\n    subTheme: "ROAPlatform",\n    keywords: [\n      "Swiss private banking transformation",\n      "wealth management pressure",\n      "compliance costs",\n      "platform dependency",\n    ],\n  },\n  {\n    slug: "ultimate-guide-interview-preparation-recruiters",\n    body: `Preparing for a senior private banking interview requires a fundamentally different approach from most professional interview preparation. The stakes are higher, the questions are more specific, and the ability to demonstrate your value proposition with precision is the difference between an offer and a polite pass.\n\n## The preparation framework\n\nThe first element of effective preparation is a clear and honest articulation of your book. Not the headline AUM, which every candidate leads with, but the texture underneath it: how much is genuinely portable, which relationships are personal versus institutional, what the revenue composition looks like, and what a realistic three-year [business plan](/en/bp-simulator) would contain.\n\nHiring committees at serious private banks have significant experience evaluating books. They have seen candidates who claim CHF 500 million in portable AUM and deliver 20% of that figure after 18 months. They have also seen candidates who modestly project CHF 150 million and bring 90% of it within a year. The latter creates far more value and far more trust. The preparation investment should go into building an honest, specific, and defensible picture of your book before you sit in front of any hiring committee.\n\n## The six question categories\n\nSenior private banking interviews consistently probe six areas. First, your book composition: source of wealth, geographic distribution, institutional versus personal relationships, concentration, and product mix. Be specific. Vague answers are read as evasion.\n\nSecond, [portability](/en/portability) evidence: not claims but evidence. Have you moved before? What followed you? What did not follow you, and why?\n\nThird, your business plan: what would you bring in year one, year two, and year three? Where would the incremental AUM come from? What is your pipeline?\n\nFourth, your legal situation: non-solicitation, garden leave, and any restrictive covenants. Candidates who have not read their employment contracts before a senior interview are visible immediately.\n\nFifth, your market view: what is happening in your client segment, what opportunities do you see, and what risks are you monitoring?\n\nSixth, your motivations: why are you considering a move at this stage of your career, and what specifically makes this institution and this opportunity the right destination?\n\n## The common mistakes\n\nThe most common mistake is leading too strongly with AUM. What hiring managers have not heard often enough is a clear analysis of what makes that book distinctive and portable. The second most common mistake is vagueness about portability. When a hiring committee asks what percentage would follow you, they need an answer grounded in your actual analysis of your relationships, not an optimistic estimate. The third is unpreparedness on legal constraints. You must know your notice period, your garden leave arrangements, and any non-solicitation provisions before sitting in a senior private banking interview.`,\n    title: "The Ultimate Guide to Interview Preparation: A Recruiter\'s Insider Perspective",\n    date: "2024-08-12",\n    markets: ["CH", "UK", "US"],\n    summary:\n      "As a seasoned recruiter, discover the insider perspective on how to prepare for banking and wealth management interviews to significantly improve your chances of success.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/ultimate-guide-interview-preparation-recruiters-gil-m-chalem--ew6pe",\n    featured: false,\n    engagementScore: 74,\n  },\n  {\n    slug: "whale-vs-retail-investor-behavior-decoding-market",\n    body: `Understanding the behavioral differences between institutional or UHNW investors and retail participants is not merely academic. It is the foundation of effective private banking advisory, and it explains patterns in market dynamics that would otherwise appear irrational.\n\n## The information and incentive asymmetry\n\nSophisticated investors operate with advantages that are structural rather than merely technical. They have access to better research, to management teams, to market color from prime brokerage relationships, and to the network intelligence that comes from operating in markets professionally. More importantly, they have incentive structures that encourage longer-term thinking: investment committees, governance frameworks, and in the case of UHNW families, multi-generational perspectives that extend beyond the quarterly reporting cycle.\n\nRetail investors operate under different constraints: shorter time horizons influenced by immediate financial needs, behavioral biases amplified by emotional proximity to their savings, and information environments that prioritise the dramatic and the recent over the structural and the durable.\n\n## The behavioral manifestation in markets\n\nThese differences manifest in predictable patterns. Institutional and sophisticated investors accumulate during periods of retail panic: the 2020 COVID crash, the 2022 rate shock, the periodic cryptocurrency corrections. They reduce risk during periods of retail euphoria: late-stage bull markets, meme stock phenomena, speculative excess in emerging asset classes.\n\nThe private banking client who understands this dynamic is significantly better positioned than one who responds to the same market stimuli as the retail crowd.\n\n## The advisory implication\n\nBehavioral coaching, helping clients maintain their investment discipline during periods of market stress or euphoria, has become an increasingly important component of private banking advisory. The research on outcomes is consistent: clients who maintain their strategic allocations through market cycles significantly outperform those who make reactive changes.\n\nThe relationship manager who has built enough trust to have that behavioral conversation directly and honestly, who can tell a client that their instinct to reduce equity exposure at a market trough is understandable but likely counterproductive, is providing something that technology cannot replicate and that many advisors lack the relationship depth to offer.`,\n    title: "Whale vs. Retail Investor Behavior: Decoding Market Dynamics in Bitcoin Investments",\n    date: "2024-08-05",\n    markets: ["US", "UK", "ASIA"],\n    summary:\n      "The cryptocurrency market operates as a complex ecosystem where institutional whales and retail investors play distinct yet interconnected roles in market dynamics.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/whale-vs-retail-investor-behavior-decoding-market-gil-m-chalem--andie",\n    featured: false,\n    engagementScore: 70,\n  },\n  {\n    slug: "navigating-trumps-economic-storm-private-banks",\n    body: `The Trump administration\'s second-term economic agenda has created a specific set of challenges and opportunities for private banking that are worth examining with clarity rather than political framing.\n\n## The tariff impact on client portfolios\n\nThe broad tariff program, including the 10% baseline on imports from most countries and sector-specific levies exceeding 100% on some categories, has created direct portfolio consequences that private banking clients are actively navigating.\n\nFor clients with significant equity exposure to US-listed companies, the immediate effect has been volatility followed by partial recovery as markets assessed the actual implementation. The net effect on corporate earnings depends heavily on sector and supply chain structure: companies with purely domestic operations are relatively insulated, while those dependent on global supply chains face meaningful margin pressure.\n\nFor clients with international business interests, particularly those operating across supply chains that span tariffed jurisdictions, the strategic questions are more complex. Investment in domestic US manufacturing, supply chain restructuring, and the economics of different geographic production configurations have become active advisory conversations.\n\n## The dollar and currency positioning\n\nRather than the dollar strengthening as import taxes raised domestic prices, the currency has experienced periods of weakness as global investors reassessed the dollar\'s reserve currency status in the context of unpredictable trade policy. For Swiss private banking clients with dollar exposure, this creates both a hedging conversation and a strategic asset allocation question. The franc\'s appreciation against the dollar has reinforced the case for active currency management.\n\n## The deregulation opportunity\n\nThe administration\'s deregulatory stance has created specific opportunities in financial services, energy, and technology. Private equity and private credit have benefited from reduced regulatory burden. Private banking clients with allocation capacity for alternative investments have had genuine opportunities in sectors directly benefiting from the deregulatory agenda. The advisor who can identify these opportunities specifically and credibly is providing value that generic market commentary does not deliver.`,\n    title:\n      "Navigating Trump\'s Economic Storm: How Private Banks and Their Clients Can Secure Assets in 2025",\n    date: "2024-07-28",\n    markets: ["US", "UK", "CH"],\n    summary:\n      "The recent blitz of tariffs, deregulatory actions, and erratic policy shifts requires private banks to develop new strategies for protecting and growing client assets.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/navigating-trumps-economic-storm-how-private-banks-can-gil-m-chalem--9q2de",\n    featured: false,\n    engagementScore: 88,\n  },\n  {\n    slug: "ubs-switzerlands-banking-giant-transformation",\n    body: `No institution in Swiss financial history has undergone a more consequential transformation than UBS over the past three years. Understanding that transformation, its trajectory and its implications, is essential context for anyone operating in Swiss private banking.\n\n## The acquisition and its aftermath\n\nThe emergency acquisition of Credit Suisse in March 2023 was, as UBS CEO Sergio Ermotti has said explicitly, the most complex bank merger in history. Two institutions with different cultures, different technology stacks, different client bases, and different risk philosophies were being combined under regulatory pressure, within a compressed timeline, in the full scrutiny of global financial markets.\n\nWhat is remarkable about the three years since is not that the integration has encountered difficulties, that was inevitable. It is that the core UBS franchise has remained robust through the process. Global Wealth Management delivered strong results in 2024 and 2025, net new money remained positive at the group level, and the capital position has been managed effectively.\n\n## The strategic choices\n\nThe decision to maintain a significant US wealth management franchise, despite the profitability challenges and advisor attrition, reflects a judgment that the long-term opportunity in the world\'s largest wealth market justifies the short-term pain. The decision to accelerate into Asia-Pacific, particularly through the 360 ONE partnership in India and the continued investment in [Hong Kong](/en/markets/hong-kong) and [Singapore](/en/markets/singapore), reflects a clearer line of sight to competitive advantage. UBS\'s franchise in Asian private banking is genuinely world-class, and the structural growth in Asian wealth provides a runway that the mature US market cannot replicate.\n\n## The talent consequence\n\nThe most sought-after UBS profiles are those who have demonstrated the ability to retain client relationships through integration disruption, who have managed the cultural navigation between the two predecessor institutions effectively, and who have built track records in the client segments where UBS has the strongest competitive position. Those profiles exist within the institution, and they are being recruited actively by competitors who recognise that experience navigating a complex merger is genuinely valuable in an industry where the consolidation trend is far from over.`,\n    title: "UBS: Switzerland\'s Banking Giant in Transformation",\n    date: "2024-07-20",\n    markets: ["CH", "UK", "US"],\n    summary:\n      "UBS\'s bold acquisition of Credit Suisse in 2023 has captured the industry\'s attention. This analysis explores the transformation and integration challenges ahead for the combined entity.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/ubs-switzerlands-banking-giant-transformation-gil-m-chalem--fynde",\n    featured: false,\n    engagementScore: 82,\n  },\n  {\n    slug: "how-build-billion-dollar-client-portfolio-banking",\n    body: `Building a portfolio that approaches or exceeds a billion dollars in assets under management is the aspiration of virtually every senior private banker. The practitioners who achieve it consistently share specific characteristics that are worth examining carefully.\n\n## The foundation: client selection\n\nThe billion-dollar portfolio is not built by serving everyone. It is built by making deliberate choices about which client relationships to prioritise. The most productive private banking practices are characterised by concentration in a client segment where the practitioner has genuine competitive advantage: geographic markets where language capability and cultural knowledge create relationship depth, industry sectors where deep familiarity creates advisory credibility, family office segments where complexity rewards genuine governance expertise.\n\nThe practitioners who scatter their effort across every available client segment typically build practices that plateau in the CHF 200 to 400 million range. Those who concentrate where they have genuine advantage tend to build larger books more efficiently.\n\n## The relationship depth imperative\n\nThe billion-dollar portfolio is almost never built on large numbers of moderate relationships. It is typically built on a concentrated number of deep, trusted relationships that have grown over time through consistent advisory quality and genuine partnership.\n\nThe mechanics of this growth model are specific: a practitioner who begins with one anchor relationship of CHF 50 to 100 million typically accesses a network of similar families through referral. Each referral, if served well, becomes another anchor. The compounding effect of trust within high-net-worth social and business networks is the primary driver of large book construction.\n\n## The business development discipline\n\nThe practitioners who build billion-dollar portfolios treat business development with the same discipline they apply to client advisory. They have explicit pipeline management: a clear picture of which prospects are at what stage, what the realistic timeline is, and what the conversion probability is. They have a referral strategy: they understand which existing clients are well-networked in their target segment and actively cultivate those referral relationships.\n\nThe combination of focused client selection, relationship depth, and disciplined business development is the formula that produces the largest private banking practices. It is not complicated. But it requires consistency over years, and the willingness to forgo short-term production in favour of relationship quality that compounds over time.`,\n    title:\n      "How to Build a Billion-Dollar Client Portfolio in International Banking: Lessons from a Top Relationship Manager",\n    date: "2024-07-12",\n    markets: ["US", "UK", "CH"],\n    summary:\n      "In international private banking, only 12% of relationship managers consistently grow their AUM during geopolitical crises. Learn the strategies that differentiate these top performers.",\n    linkedinUrl:\n      "https://www.linkedin.com/pulse/how-build-billion-dollar-client-portfolio-banking-from-gil-m-chalem--uazye",\n    featured: false,\n    engagementScore: 68,\n  },\n  {\n    slug: "efg-bank-switzerland-pioneering-private-banking",\n    title: "EFG Bank Switzerland: Pioneering Private Banking with Entrepreneurial Agility",\n    date: "2024-07-05",\n    markets: ["CH"],\n    summary: "EFG Bank Switzerland has cemented its position as a cornerstone of global wealth management through entrepreneurial agility, strategic vision, and the distinctive Client Relationship Officer model.",\n    linkedinUrl: "https://www.linkedin.com/pulse/efg-bank-switzerland-pioneering-private-banking-gil-m-chalem--tknge",\n    featured: false,\n    engagementScore: 72,\n    keywords: ["EFG International", "Swiss private banking", "CRO model", "private banking careers Switzerland"],\n    body: `EFG International occupies a distinctive position in Swiss private banking: large enough to offer genuine institutional capability, small enough to maintain the entrepreneurial culture that defines its competitive model.\n\n## The EFG model\n\nEFG\'s defining characteristic is its Client Relationship Officer model, in which the front-office practitioners are not employees in the traditional sense but quasi-entrepreneurs operating within an institutional framework. CROs participate in the economics of their book through equity participation in their portfolios, creating alignment between their interests and those of their clients that differs from the salary-plus-bonus model at most institutional competitors.\n\nThis model attracts a specific type of practitioner: motivated, entrepreneurial, relationship-focused, and confident enough in their portable client base to accept economic participation rather than guaranteed compensation. The profile that thrives at EFG is genuinely different from the profile that thrives at UBS or Julius Baer, and the institution has been deliberate about selecting for it.\n\n## The growth trajectory\n\nEFG has grown AUM to approximately CHF 165 billion as of end-2024, representing 16.4% year-over-year growth. Net new money has been consistently positive, and the bank\'s profitability metrics reflect the efficiency of the CRO model: when practitioners are economically aligned with their books, they have strong incentives to both grow and retain client relationships.\n\nThe geographic expansion has been deliberate: EFG has built meaningful presences in [Geneva](/en/markets/geneva), [Zurich](/en/markets/zurich), [London](/en/markets/london), Monaco, Cayman, [Singapore](/en/markets/singapore), [Hong Kong](/en/markets/hong-kong), and other centers without attempting to replicate the global footprint of a UBS or Julius Baer. The focus on markets where the entrepreneurial CRO model resonates has produced more coherent international growth than undifferentiated geographic expansion typically delivers.\n\n## The talent market positioning\n\nEFG is consistently among the most active recruiters in the Swiss private banking talent market, particularly during consolidation periods when experienced CROs and relationship managers are reassessing their institutional affiliations. The combination of the entrepreneurial model, the track record of profitable growth, and the cultural coherence of the institution makes it a credible destination for practitioners who want more ownership over their practice than institutional employment typically provides.\n\nFor the private banker considering a move, EFG represents a genuine alternative to both the mega-bank scale and the boutique limitation. Understanding the specific dynamics of the CRO model, including its economics, its cultural expectations, and its suitability for different practitioner profiles, is essential before engaging with the institution seriously.`,\n  },\n  {\n    slug: "hong-kong-switzerland-offshore-wealth-crown",\n    title: "The Crown Changes Hands",\n    seoTitle: "Hong Kong Overtakes Switzerland as Top Offshore Wealth Hub: What It Means",\n    date: "2026-05-29",\n    engagementScore: 82,\n    summary: "Hong Kong has overtaken Switzerland as the world\'s largest offshore wealth booking centre. Boston Consulting Group called this in 2022. Geneva spent three years debating it instead of preparing for it.",\n    seoDescription: "Hong Kong now books $2.95 trillion in cross-border wealth against Switzerland\'s $2.94 trillion. What the BCG 2026 ranking shift means for Swiss private banking and the talent market.",\n    pillar: "P1",\n    subTheme: "Positioning",\n    markets: ["CH", "ASIA"],\n    linkedinUrl: "https://www.linkedin.com/feed/",\n    keywords: ["Hong Kong wealth management", "Switzerland offshore banking", "BCG Global Wealth Report 2026", "cross-border wealth ranking", "Swiss private banking talent"],\n    body: "For thirty years, Geneva\'s claim to the top of the offshore wealth table was treated as a law of nature. Not a competitive position. Not something that required defending. A fact, like the Alps or the franc. The 2026 Global Wealth Report from Boston Consulting Group ended that assumption in a single data point.\\n\\nHong Kong now books $2.95 trillion in cross-border private wealth. Switzerland books $2.94 trillion. The margin is $10 billion on a base of nearly $3 trillion, which is to say the margin is almost nothing. But the direction is everything. Boston Consulting Group, which has been tracking this convergence since at least 2022, is unambiguous: this reversal is unlikely to be undone. The hubs in Asia are growing faster than the European safe haven. The structural forces driving that divergence are not temporary.\\n\\nThe reaction in Geneva has been some version of surprise. It should not have been.\\n\\nIn 2022, the same institution published a forecast placing Hong Kong ahead of Switzerland before the end of that decade. The Swiss market noted it, debated it in conference panels, added it to the risk section of various strategy presentations, and largely continued as before. That is not a criticism unique to Switzerland. It is what incumbents do. The position felt safe enough that the urgency to act never quite materialised. The $10 billion gap is the cost of that calculation.\\n\\n## Where wealth actually gets created\\n\\nThe mechanics of what happened are not complicated. Hong Kong\'s rise is a direct consequence of where wealth is being generated. China has been producing high-net-worth and ultra-high-net-worth individuals at a rate that no European economy can match. In 2021, the number of Chinese dollar millionaires surpassed the number of German ones. By 2025, Chinese billionaire creation was running at a pace that made Switzerland\'s own domestic wealth generation look almost static by comparison.\\n\\nA booking centre proximate to that wealth creation will attract assets. Hong Kong\'s geographic and cultural position as the gateway between mainland Chinese capital and international markets gives it a structural advantage that Geneva cannot replicate by improving its product offering or tightening its legal framework. The assets are created next door. The relationships are local. The language is Cantonese and Mandarin. The trust is generational and proximity-based.\\n\\nBoston Consulting Group\'s report projects that global financial wealth will grow at roughly 7 percent annually through 2030, assuming that geopolitical tensions and the energy shock ease in the second half of this year. The growth will not be evenly distributed. The fastest expansion will be in Asia, concentrated around the same wealth creation dynamic that has already pushed Hong Kong to the top of the rankings. Switzerland will grow too, but it will grow at a rate that reflects the slower accumulation of wealth in Western Europe and the continued regulatory friction that makes Swiss booking genuinely difficult for a category of clients who might otherwise choose Geneva.\\n\\n## The compliance posture and what it costs\\n\\nThere is an uncomfortable conversation embedded in this data that the Swiss market has generally preferred to avoid. The compliance tightening of the past decade, accelerated dramatically by the events of 2022, has been necessary. The reputational damage from earlier eras, the pressure from FINMA, the cascading effects of the Credit Suisse collapse, and the political imperative to demonstrate that Swiss banking can clean itself up without external imposition, all of these made a stricter, more risk-averse posture not just defensible but essential.\\n\\nThe cost is real, however. A significant proportion of the clients who might have historically booked in Geneva now find the process either too uncertain, too long, or simply too adversarial to be worth the effort. The enhanced due diligence requirements for certain nationalities, the source-of-wealth documentation burden, the restrictions on specific asset categories and geographies, these are not arbitrary inconveniences. They are the product of hard lessons learned at considerable expense. But they are also, as a practical matter, a filter that directs mobile wealth toward jurisdictions with a more accommodating posture.\\n\\nHong Kong has not faced the same regulatory reckoning as Switzerland. Its compliance environment has its own complications, including a legal framework that is increasingly shaped by mainland political priorities in ways that create a different category of risk for internationally mobile clients. But for a specific and very large segment of Asian wealth, Hong Kong\'s compliance burden is simply less than Geneva\'s. The assets follow the path of least resistance, as they always have.\\n\\nBoston Consulting Group\'s note that Hong Kong\'s concentration on mainland China ties its trajectory tightly to economic and regulatory developments there is the other side of this ledger. A jurisdiction that derives its competitive advantage primarily from proximity to one country\'s wealth creation is exposed to that country\'s political and economic trajectory in a way that a genuinely neutral booking centre is not. Switzerland has lost the rankings race for now. It has not lost the argument about long-term stability and political neutrality, which remains the most durable value proposition in private banking for clients who need it most.\\n\\n## The talent question nobody is asking\\n\\nThe conversation I have not seen in the coverage of this week\'s report is the one about people. Rankings and AUM figures describe outcomes. They do not explain the mechanism by which outcomes change. The mechanism is talent, and the talent question in Swiss private banking right now is more urgent than the market seems to appreciate.\\n\\nThe banks that will win the next decade of cross-border wealth management are not the ones with the deepest balance sheet or the most comprehensive product platform. They are the ones with the right bankers in the right seats. Specifically, they are the banks that have invested in building teams with genuine Asian market capability sitting in Geneva and Zurich, not just in their Singapore or Hong Kong offices.\\n\\nMandarin-speaking relationship managers who can service clients with Chinese wealth exposure from a Swiss booking platform are genuinely rare. The combination of private banking technical competence, language capability at a professional financial level, cultural intelligence, and Swiss regulatory literacy is not something you can hire easily or develop quickly. The banks that have those bankers are in a structurally stronger position than any product or platform advantage can create. The banks that have been treating Asian coverage as a regional matter handled from their Asian offices are building a dependency that leaves them exposed.\\n\\nThis is not a theoretical observation. In the mandates I work on regularly, the difficulty of finding a senior relationship manager with credible Asian market coverage in Geneva is among the most consistent constraints I encounter. The candidate pool is thin. The competition for the few strong profiles that exist is intense. The compensation required to move them is high. And the lead time to build a team from scratch is measured in years, not quarters.\\n\\nThe same logic applies, to varying degrees, to other growth markets. The bankers who will generate the next wave of AUM growth in Swiss private banking are disproportionately those who can access the sources of new wealth creation in Asia, in the Gulf, in Latin America, and in the diaspora communities of internationally mobile UHNW families. Building that coverage capability is a talent strategy, not a product strategy.\\n\\n## What Switzerland should do with a $10 billion gap\\n\\nThe right response to this week\'s data is not panic and it is not defensive dismissal. It is a serious conversation about what the Swiss offshore model is actually for, who it serves best, and where its genuine competitive advantage lies in a world where proximity to Asian wealth creation is no longer available as a differentiating factor.\\n\\nSwitzerland\'s case rests on rule of law, political neutrality, institutional stability, multi-generational banking relationships, and a regulatory framework that, for all its friction, provides genuine protection for clients who need predictability over a long time horizon. These are not trivial attributes. They are precisely the attributes that matter most to clients with genuine long-term wealth preservation needs, as distinct from clients who are primarily seeking to capitalise on near-term growth opportunities.\\n\\nThe $10 billion margin between Hong Kong and Switzerland is not the story. The story is the structural divergence in wealth creation geography that produced it, and the question of whether Swiss private banking has built the human capability to access the next generation of that wealth. In some institutions, the answer is a cautious yes. In most, the honest answer is that the work is not yet done.\\n\\nThat conversation needs to start now. The ranking has already changed. The talent pipeline takes years to build.\\n\\n---\\n\\n[1] Boston Consulting Group, Global Wealth Report 2026, published 27 May 2026. Cross-border AUM figures as of end-2025.\\n[2] BCG Global Wealth Report 2022: forecast of Hong Kong displacing Switzerland as largest offshore booking centre.\\n[3] Global financial wealth grew 10.7% in 2025, reaching $333 trillion. Equities contributed 13.2% and gold 44% of asset appreciation, BCG 2026.",\n  },\n  {\n    slug: "wealth-migration-numbers-dont-agree",\n    title: "The Migration Numbers Don\'t Agree, and That Tells You Something",\n    seoTitle: "Capgemini vs Henley: Why Wealth Migration Data Disagrees in 2026",\n    date: "2026-06-16",\n    engagementScore: 70,\n    summary: "Capgemini says the share of wealthy people changing tax residence dropped from 56% to 25% in a year. Henley says 142,000 millionaires are relocating in 2025, a record. Both are widely quoted. Here is what the gap actually means for private bankers.",\n    seoDescription: "Two of the most-cited wealth migration reports contradict each other. What the gap between Capgemini\'s declining intent data and Henley\'s rising relocation numbers means for private banking portability and hiring in 2026.",\n    pillar: "P1",\n    subTheme: "Positioning",\n    markets: ["CH", "UK", "UAE", "US"],\n    linkedinUrl: "https://www.linkedin.com/feed/",\n    keywords: ["wealth migration 2026", "Capgemini World Wealth Report", "Henley Private Wealth Migration Report", "private banking portability", "AUM portability"],\n    body: "Two of the most-cited wealth migration reports in the world currently point in different directions, and almost nobody is pointing it out.\\n\\nThe Financial Times reported this week, citing Capgemini\'s research, that the share of wealthy people who changed their primary tax residence, or planned to, dropped from 56% in 2024 to 25% in 2025. That is not a small move. It is more than a halving in a single year.\\n\\nHenley & Partners, in the same period, is forecasting a record 142,000 millionaire relocations for 2025, up from 134,000 the year before, with a projection of 165,000 by 2026. Their number has been rising every year since 2020.\\n\\nBoth figures are widely quoted. Both cannot be telling the same story.\\n\\n## What\'s actually happening\\n\\nThe honest answer is that they are measuring different things, and the gap between them is the real signal.\\n\\nHenley counts actual relocations and residency applications, the people who finished the process. Capgemini surveyed intent, who says they changed or plan to change. A shrinking intent number alongside a rising completion number suggests something specific: the wave of HNWIs who moved opportunistically during 2022 to 2024, reacting to the UK\'s non-dom changes, the Credit Suisse collapse, and a string of political shocks, has largely already moved. What is left in the completion numbers is a smaller, more deliberate population whose decisions are structural, not reactive: tax planning, succession, business relocation, not headline panic.\\n\\nThis matters more than it sounds. A banker pricing a 2026 business case off a 2023 mental model of everyone moving everywhere is working from the wrong assumption. The volatile, easy-to-poach segment is mostly gone. What remains is harder to move, harder to win, and considerably more loyal once won.\\n\\nSeb Sauerborn, who advises HNWIs directly, has gone further and called the Henley methodology itself misleading, arguing the headline figures overstate how mobile this population actually is. Whether or not that critique fully lands, the fact that someone close to the actual clients is pushing back on the most-cited number in the industry is itself worth noting.\\n\\n## What this means if you are a private banker\\n\\nThree practical implications, regardless of which report you trust more.\\n\\nFirst, the books you are evaluating for portability need a harder look than client moved jurisdiction in the last 18 months. That used to be a reasonable filter. It now risks selecting for the most opportunistic, least loyal segment of your pipeline, the people who left because of a headline, not because of a structural life decision.\\n\\nSecond, the destinations are not evenly attractive anymore. Henley\'s own data shows the UAE with a net inflow of 9,800 millionaires in 2025, the US at 7,500, and Switzerland among the top five destinations, while the UK posts a historic net outflow of 16,500, more than double China\'s outflow. If you are weighing a platform move, the booking-centre conversation in 2026 is not whether a jurisdiction is popular, it is whether that jurisdiction is still gaining the specific segment your book belongs to.\\n\\nThird, banks hiring against speculative inflow numbers are going to be disappointed. If the wealthy who were going to move opportunistically have mostly moved, a 2026 business plan built on continued high-velocity relocation is overoptimistic. The banks asking sharper questions in interviews this year, about real, sticky AUM rather than theoretical pipeline, are the ones reading this correctly.\\n\\n## The actual question\\n\\nNone of this means migration has stopped. It means the easy phase is over.\\n\\nWhat is left is a structurally different, more deliberate population, and the banker who understands that distinction will build a more credible business case than the one still pitching last year\'s headline.\\n\\n---\\n\\n[1] Financial Times, June 2026, citing Capgemini Research Institute data on tax residence relocation intent among wealthy individuals.\\n[2] Henley & Partners, Private Wealth Migration Report 2025: 142,000 projected millionaire relocations in 2025, up from 134,000 in 2024, with a forecast of 165,000 by 2026. UK net outflow of 16,500, UAE net inflow of 9,800, USA net inflow of 7,500, China net outflow of 7,800.\\n[3] Seb Sauerborn, \\"Henley\'s 2025 Migration Report Is Misleading,\\" October 2025.",\n  },\n  {\n    slug: "zurich-talent-unlock-2026",\n    title: "The Zurich Freeze Is Ending, and Most Senior RMs Are Not Ready",\n    seoTitle: "Why 2026 Unlocks Zurich\'s Frozen Private Banking Talent Market",\n    seoDescription: "UBS set 2026 as its deadline to finish integrating Credit Suisse. For senior RMs in Zurich, and the EAMs and boutiques hoping to hire them, that deadline quietly removes the two biggest reasons mobility has been frozen.",\n    date: "2026-06-18",\n    engagementScore: 80,\n    summary: "The financial and operational constraints that have frozen senior banker mobility in Zurich since 2023 are both lifting in 2026, and neither the bankers nor the institutions trying to hire them are fully positioned for what comes next.",\n    linkedinUrl: "",\n    pillar: "P1",\n    subTheme: "Positioning",\n    markets: ["CH"],\n    keywords: ["Zurich private banking talent", "UBS Credit Suisse integration 2026", "senior relationship manager Zurich", "UBS retention bonus clawback", "EAM hiring Zurich 2026"],\n    body: `When UBS completed its emergency takeover of Credit Suisse in 2023, the combined bank\'s headcount jumped to just under 120,000. Three years later, only around 17,500 of those positions have actually disappeared, against an internal target reported by Bloomberg of up to 35,000. UBS has never confirmed the full number publicly, but the gap between what has happened and what is still planned tells its own story, and most of what remains is concentrated in Switzerland, where UBS has previously flagged roughly 3,000 domestic job cuts, with the bulk expected between the second half of 2026 and early 2027.\n\nFor senior relationship managers in Zurich, that timeline matters more than the headline number. Wealth management has fared comparatively well through the integration so far, UBS has been deliberate about retaining the Credit Suisse private bankers it considers critical, along with the clients they brought with them. But fared well so far is not the same as protected indefinitely, and 2026 is the year two of the forces that kept that protection in place both run out at the same time.\n\nThe first force was financial. When UBS closed the deal, it set aside roughly 500 million dollars in retention payments for staff it judged essential, client facing bankers among them. These were not simple cash bonuses. They carried dual vesting schedules running through 2023 and 2024, and Credit Suisse\'s own legacy cash awards came with a separate clawback clause requiring repayment if the employee left within three years. Bloomberg reported that UBS subsequently pursued hundreds of departed bankers to recover a share of more than 600 million Swiss francs under those clauses. Three years from a 2023 award lands in 2026. For senior bankers who have spent two years quietly calculating what leaving would actually cost them, that number is now approaching zero.\n\nThe second force was operational, and it has done more to keep teams in place than any bonus. UBS confirmed in March that it had migrated 1.2 million Credit Suisse client accounts in Switzerland onto its own systems, and the bank is targeting completion of the broader integration by the end of this year. While that migration runs, moving a senior RM, or letting one go, carries operational risk that most management teams have preferred to avoid. Once the systems work is done, that caution has no reason to continue, and people close to the bank\'s planning have already pointed to a second wave of restructuring once the migration lands, concentrated in exactly the timeframe UBS has flagged for its remaining Swiss cuts.\n\nPut the two together and the picture for Zurich is not the orderly wind down most market commentary assumes. It is a release valve opening on both ends at once, financial and operational, landing in the same twelve months as a wave of restructuring UBS has already told the market is coming. The senior RMs who have spent three years unable to move without a financial penalty, working inside an organization too occupied with migration to actively manage their careers, are arriving at the one moment when both constraints lift and the bank\'s own cost pressure starts pointing in the same direction.\n\nThis is not only a story about bankers deciding to leave. It is also a capacity problem for everyone hoping to receive them. Zurich\'s external asset manager and multi family office sector has been the natural landing pad for senior bankers leaving large institutions for years, and it remains a genuinely deep market, competitive, well capitalized, increasingly sophisticated in how it structures partnership and equity arrangements for the people it hires. But most EAMs, boutiques, and competing banks built their 2026 hiring plans during a period when the supply of available senior Zurich RMs was artificially thin. A platform that has not already built relationships with portable candidates, and does not already have a clear answer on equity, transition support, and book building timeline, will be negotiating from a position most of its competitors quietly secured months ago.\n\nFor a banker weighing whether this is the moment, the honest answer depends less on sentiment and more on preparation that should have started already. A book that looks portable on paper rarely survives a real diligence conversation without a genuine breakdown of self originated relationships, inherited accounts, and client concentration. The clawback math needs to be run precisely, not estimated, since the difference between a partially vested award and a fully vested one is the difference between a clean exit and a six figure invoice. And institutions on the receiving end will increasingly ask not just whether a candidate can leave, but why they are leaving now, since timing tied purely to a financial unlock reads very differently from timing tied to a deliberate, well prepared move.\n\nThe Zurich freeze did not end because the market improved. It ended because the mechanisms holding it in place, financial, operational, and budgetary, all ran out of runway in the same calendar year. The senior RMs, and the institutions trying to hire them, who benefit will be the ones who treated 2026 as a planning year well before the calendar caught up with everyone else.`,\n  },\n] as const;')
-print("  \u2713 articles.ts ogImage updated")
+try:
+    update_article(BASE, SLUG, ogImage="/" + ASSETS[0][0].removeprefix("public/"))
+except ArticleError as e:
+    sys.exit(f"✗ {e} (run insert_nri_article.py first)")
 
 print("\nDone. Run:")
 print("  git add -A && git commit -m \"seo: photographic OG image for NRI article\" && git push")
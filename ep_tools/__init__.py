@@ -0,0 +1,4 @@
+"""
+Shared helpers for the repo-root Python scripts (deploy, patch, OG, SEO tools).
+Scripts run from the repo root, so `import ep_tools...` resolves without install.
+"""
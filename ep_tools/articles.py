@@ -0,0 +1,390 @@
+"""
+Insight articles as one record per slug, compiled into app/en/insights/articles.ts.
+
+    data/insights/<slug>.json     one article: every InsightArticle field, body included
+    data/insights/index.json      compiled index: display order + metadata (no bodies)
+    app/en/insights/types.ts      the hand-written types (MarketCode, InsightArticle, ...)
+    app/en/insights/articles.ts   GENERATED: imports each record, exports INSIGHTS
+
+articles.ts imports the JSON records directly, so it depends only on which
+articles exist and in what order. Editing one article rewrites its record and
+the index; adding or removing one also regenerates the import list. Records
+are tracked through the mtime/sha256 cache (.cache/articles.json), so a build
+only opens the records that changed. Reading stats, the search index
+(ep_tools.insights_ingest) and related links (ep_tools.related) are refreshed
+afterwards.
+
+New slugs are listed first (newest first, like the old insert scripts); the
+order of existing articles is kept from the index.
+
+Run from repo root:
+    python3 -m ep_tools.articles build
+    python3 -m ep_tools.articles add path/to/record.json     (insert or replace by slug)
+    python3 -m ep_tools.articles set <slug> <field> <json value>
+    python3 -m ep_tools.articles import                      (one-off: legacy articles.ts -> records)
+"""
+
+import argparse
+import datetime as dt
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from ep_tools import incremental, tsx
+from ep_tools.files import print_summary, read_json, write_text
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+STORE_DIR = "data/insights"
+INDEX = "data/insights/index.json"
+ARTICLES_TS = "app/en/insights/articles.ts"
+TYPES_TS = "app/en/insights/types.ts"
+CACHE_NAME = "articles.json"
+
+REQUIRED = ("slug", "title", "date", "markets", "summary", "linkedinUrl")
+STRING_FIELDS = {"slug", "title", "date", "summary", "linkedinUrl", "body", "pillar", "subTheme",
+                 "ogImage", "seoTitle", "seoDescription"}
+LIST_FIELDS = {"markets", "keywords"}
+BOOL_FIELDS = {"featured", "speakable"}
+NUMBER_FIELDS = {"engagementScore"}
+
+GENERATED_MARK = "// GENERATED by ep_tools.articles"
+_SLUG_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+_TYPE_RE = re.compile(r"export\s+type\s+(\w+)\s*=([^;{]*);")
+ENUM_TYPES = {"markets": "MarketCode", "pillar": "PillarCode", "subTheme": "InsightSubTheme"}  # field -> union
+
+
+class ArticleError(ValueError):
+    pass
+
+
+# --------------------------------------------------------------------------
+# Records
+# --------------------------------------------------------------------------
+
+def record_rel(slug):
+    return f"{STORE_DIR}/{slug}.json"
+
+
+def validate(record, where="record", enums=None):
+    """Raise ArticleError unless `record` has the shape of an InsightArticle.
+
+    `enums` (from enums(base)) also checks markets, pillar and subTheme against
+    the unions in types.ts: articles.ts casts the JSON imports to InsightArticle,
+    so tsc cannot catch a value outside them.
+    """
+    if not isinstance(record, dict):
+        raise ArticleError(f"{where}: expected an object")
+    missing = [k for k in REQUIRED if k not in record]
+    if missing:
+        raise ArticleError(f"{where}: missing {', '.join(missing)}")
+    slug = record["slug"]
+    if not isinstance(slug, str) or not _SLUG_RE.match(slug) or slug == "index":
+        raise ArticleError(f"{where}: bad slug {slug!r}")
+    for key, value in record.items():
+        if key in STRING_FIELDS:
+            ok = isinstance(value, str)
+        elif key in LIST_FIELDS:
+            ok = isinstance(value, list) and all(isinstance(v, str) for v in value)
+        elif key in BOOL_FIELDS:
+            ok = isinstance(value, bool)
+        elif key in NUMBER_FIELDS:
+            ok = isinstance(value, (int, float)) and not isinstance(value, bool)
+        else:
+            raise ArticleError(f"{where}: unknown field {key!r}")
+        if not ok:
+            raise ArticleError(f"{where}: bad value for {key}")
+    try:
+        dt.date.fromisoformat(record["date"])
+    except ValueError:
+        raise ArticleError(f"{where}: date must be YYYY-MM-DD, got {record['date']!r}") from None
+    for key, allowed in (enums or {}).items():
+        values = record.get(key, [])
+        unknown = [v for v in (values if isinstance(values, list) else [values]) if v not in allowed]
+        if unknown:
+            raise ArticleError(f"{where}: {key} {', '.join(map(repr, unknown))} not in "
+                               f"{ENUM_TYPES[key]} ({TYPES_TS})")
+
+
+def render_record(record):
+    return json.dumps(record, ensure_ascii=False, indent=2) + "\n"
+
+
+def load_record(base, slug):
+    path = os.path.join(base, record_rel(slug))
+    if not os.path.exists(path):
+        raise ArticleError(f"no article record for {slug!r} ({record_rel(slug)})")
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_record(base, record):
+    validate(record, record.get("slug", "record") if isinstance(record, dict) else "record", enums(base))
+    return write_text(base, record_rel(record["slug"]), render_record(record))
+
+
+def add_article(base, record, build_after=True):
+    """Insert (or replace) one article record, then rebuild the outputs."""
+    status = save_record(base, record)
+    if build_after:
+        build(base)
+    return status
+
+
+def update_article(base, slug, build_after=True, **fields):
+    """Change fields of one existing article; a value of None removes the field."""
+    record = load_record(base, slug)
+    for key, value in fields.items():
+        if value is None:
+            record.pop(key, None)
+        else:
+            record[key] = value
+    return add_article(base, record, build_after)
+
+
+def enums(base):
+    """{field: allowed values} from the string-literal unions in types.ts (ENUM_TYPES).
+
+    Members naming another union (InsightSubTheme = Pillar1SubTheme | ...) are
+    expanded. Raises ArticleError if a union is missing.
+    """
+    try:
+        with open(os.path.join(base, TYPES_TS), encoding="utf-8") as f:
+            src = f.read()
+    except OSError as e:
+        raise ArticleError(f"{TYPES_TS}: {e}") from None
+    unions = {name: [m.strip() for m in body.split("|") if m.strip()] for name, body in _TYPE_RE.findall(src)}
+
+    def members(name, seen=()):
+        out = set()
+        for m in unions.get(name, []):
+            if m[:1] == '"':
+                out.add(m.strip('"'))
+            elif m in unions and m not in seen:
+                out |= members(m, seen + (name,))
+        return out
+
+    missing = [t for t in ENUM_TYPES.values() if not members(t)]
+    if missing:
+        raise ArticleError(f"{TYPES_TS}: no string union for {', '.join(missing)}")
+    return {field: members(t) for field, t in ENUM_TYPES.items()}
+
+
+# --------------------------------------------------------------------------
+# Build
+# --------------------------------------------------------------------------
+
+def _record_files(base):
+    store = os.path.join(base, STORE_DIR)
+    if not os.path.isdir(store):
+        return []
+    return sorted((f"{STORE_DIR}/{e.name}", e.stat()) for e in os.scandir(store)
+                  if e.is_file() and e.name.endswith(".json") and e.name != os.path.basename(INDEX))
+
+
+def _parse_record(rel, text):
+    """Metadata of one record (everything but the body), validated."""
+    try:
+        record = json.loads(text)
+    except ValueError as e:
+        raise ArticleError(f"{rel}: {e}") from None
+    validate(record, rel)
+    if rel != record_rel(record["slug"]):
+        raise ArticleError(f"{rel}: slug {record['slug']!r} does not match the file name")
+    return {k: v for k, v in record.items() if k != "body"}
+
+
+def _ident(slug):
+    return "a_" + slug.replace("-", "_")
+
+
+def render_articles_ts(order):
+    imports = "\n".join(f'import {_ident(s)} from "@/{STORE_DIR}/{s}.json";' for s in order)
+    items = "\n".join(f"  {_ident(s)}," for s in order)
+    return (f"{GENERATED_MARK} from {STORE_DIR}/*.json. Do not edit by hand:\n"
+            f"// change the records, then run `python3 -m ep_tools.articles build`.\n"
+            f"\n"
+            f'import type {{ InsightArticle }} from "./types";\n'
+            f"{imports}\n"
+            f"\n"
+            f'export * from "./types";\n'
+            f"\n"
+            f"// JSON imports type their strings as string, hence the cast below; the build checks\n"
+            f"// markets, pillar and subTheme against the unions in types.ts instead.\n"
+            f"\n"
+            f"/**\n"
+            f" * 🔹 Insights single source of truth\n"
+            f" */\n"
+            f"export const INSIGHTS: readonly InsightArticle[] = [\n"
+            f"{items}\n"
+            f"] as readonly InsightArticle[];\n")
+
+
+def _order(previous, metas):
+    """Keep the previous display order; new slugs go first, newest first."""
+    kept = [s for s in previous if s in metas]
+    seen = set(kept)
+    new = sorted((s for s in metas if s not in seen), key=lambda s: (metas[s]["date"], s), reverse=True)
+    return new + kept
+
+
+def build(base=BASE, quiet=False):
+    """Refresh the index and articles.ts from the records. Returns stats."""
+    t0 = time.perf_counter()
+    path = incremental.cache_path(base, CACHE_NAME)
+    version = incremental.code_version(sys.modules[__name__])
+    cache, stats = incremental.refresh(base, _record_files(base), incremental.load_index(path, version),
+                                       _parse_record)
+    if incremental.changed(stats):
+        incremental.save_index(path, version, cache)
+
+    metas = {entry["data"]["slug"]: entry["data"] for entry in cache.values()}
+    allowed = enums(base)  # checked on every build: types.ts may have changed under cached records
+    for slug, meta in metas.items():
+        validate(meta, record_rel(slug), allowed)
+
+    previous = (read_json(os.path.join(base, INDEX)) or {}).get("order", [])
+    order = _order(previous, metas)
+    index = {"order": order, "articles": {s: metas[s] for s in order}}
+    statuses = [
+        write_text(base, INDEX, json.dumps(index, ensure_ascii=False, indent=2) + "\n"),
+        write_text(base, ARTICLES_TS, render_articles_ts(order)),
+    ]
+    stats["ms"] = (time.perf_counter() - t0) * 1000
+    if not quiet:
+        print(f"\n  {len(order)} articles ({stats['parsed']} records re-read, "
+              f"{stats['removed']} removed) in {stats['ms']:.0f} ms")
+        print_summary(statuses)
+
+    from ep_tools import insights_ingest, related  # both import this module
+    insights_ingest.ingest(base, quiet)
+    related.build(base, quiet=quiet)
+    return stats
+
+
+def load_index(base=BASE):
+    """The compiled index: {"order": [slug, ...], "articles": {slug: metadata}}."""
+    data = read_json(os.path.join(base, INDEX))
+    if data is None:
+        raise ArticleError(f"{INDEX} missing: run `python3 -m ep_tools.articles build`")
+    return data
+
+
+# --------------------------------------------------------------------------
+# One-off migration from the hand-maintained articles.ts
+# --------------------------------------------------------------------------
+
+_AS_CONST_RE = re.compile(r"\s+as\s+const\s*$")
+
+
+def _literal(raw):
+    raw = _AS_CONST_RE.sub("", raw.strip())
+    if raw in ("true", "false"):
+        return raw == "true"
+    if re.fullmatch(r"-?\d+(?:\.\d+)?", raw):
+        return float(raw) if "." in raw else int(raw)
+    if raw.startswith("["):
+        return [tsx.string_value(raw[s:e]) for s, e in tsx.array_items(raw, 0)]
+    value = tsx.string_value(raw)
+    if value is None:
+        raise ArticleError(f"not a literal: {raw[:60]}")
+    return value
+
+
+def parse_legacy(src):
+    """(types header, [record, ...]) from an articles.ts with inline INSIGHTS objects."""
+    start = tsx.find_const(src, "INSIGHTS")
+    if start < 0:
+        raise ArticleError(f"{ARTICLES_TS}: INSIGHTS array not found")
+    records = []
+    for istart, _ in tsx.array_items(src, start):
+        records.append({k: _literal(src[vs:ve]) for k, vs, ve in tsx.object_entries(src, istart)})
+    header = src[:src.rfind("\n", 0, start) + 1]
+    doc = header.rfind("/**")
+    if doc >= 0 and "INSIGHTS" not in header[doc:] and "export" not in header[doc:]:
+        header = header[:doc]  # the doc comment above INSIGHTS stays in articles.ts
+    header = header.replace(f"// {ARTICLES_TS}", f"// {TYPES_TS}", 1).rstrip() + "\n"
+    return header, records
+
+
+def _node_eval(src):
+    """INSIGHTS as evaluated by node (types stripped), to check the migration."""
+    start = tsx.find_const(src, "INSIGHTS")
+    literal = re.sub(r"\]\s+as\s+const\b", "]", src[start:tsx.match_brace(src, start) + 1])
+    script = "let s='';process.stdin.on('data',d=>s+=d).on('end',()=>process.stdout.write(JSON.stringify(eval(s))))"
+    out = subprocess.run(["node", "-e", script], input=f"({literal})",
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def import_legacy(base=BASE, verify=True):
+    with open(os.path.join(base, ARTICLES_TS), encoding="utf-8") as f:
+        src = f.read()
+    if src.startswith(GENERATED_MARK):
+        raise ArticleError(f"{ARTICLES_TS} is already generated from {STORE_DIR}")
+    header, records = parse_legacy(src)
+    if verify:
+        try:
+            expected = _node_eval(src)
+        except FileNotFoundError:
+            print("  ⚠️  node not found: skipping the round-trip check")
+        else:
+            if expected != records:
+                bad = next(r["slug"] for r, e in zip(records, expected) if r != e)
+                raise ArticleError(f"parsed record differs from node's evaluation: {bad}")
+            print(f"  ✓ {len(records)} records match node's evaluation of {ARTICLES_TS}")
+    seen = set()
+    for i, record in enumerate(records):
+        validate(record, f"INSIGHTS[{i}]")  # build() checks the enums against the types.ts written below
+        if record["slug"] in seen:
+            raise ArticleError(f"duplicate slug {record['slug']}")
+        seen.add(record["slug"])
+
+    statuses = [write_text(base, TYPES_TS, header)]
+    statuses += [write_text(base, record_rel(r["slug"]), render_record(r)) for r in records]
+    order = [r["slug"] for r in records]
+    metas = {r["slug"]: {k: v for k, v in r.items() if k != "body"} for r in records}
+    index = {"order": order, "articles": metas}
+    statuses.append(write_text(base, INDEX, json.dumps(index, ensure_ascii=False, indent=2) + "\n"))
+    print_summary(statuses)
+    return build(base)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Manage insight article records and generate articles.ts.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("build", help="regenerate the index and articles.ts from the records")
+    p = sub.add_parser("add", help="insert or replace an article from a JSON record file")
+    p.add_argument("record")
+    p = sub.add_parser("set", help="set one field of an article (value is JSON; null removes it)")
+    p.add_argument("slug")
+    p.add_argument("field")
+    p.add_argument("value")
+    sub.add_parser("import", help="one-off migration of the hand-written articles.ts into records")
+    args = ap.parse_args(argv)
+
+    try:
+        if args.cmd == "build":
+            build(BASE)
+        elif args.cmd == "add":
+            with open(args.record, encoding="utf-8") as f:
+                add_article(BASE, json.load(f))
+        elif args.cmd == "set":
+            try:
+                value = json.loads(args.value)
+            except ValueError:
+                value = args.value  # bare strings don't need JSON quotes
+            update_article(BASE, args.slug, **{args.field: value})
+        else:
+            import_legacy(BASE)
+    except ArticleError as e:
+        print(f"✗ {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,518 @@
+"""
+Benchmarks of the repo's Python hot paths, with a JSON history that flags regressions.
+
+Each case times one operation on seeded synthetic fixtures (candidates with
+prospect books, a tree of page.tsx files with their SEO manifest, a token
+file), so every run sees the same inputs:
+
+    simulator.projection     bp_model.projection: one candidate's 3-year plan
+    simulator.evaluate       prospect_totals of the candidate's book + bp_model.evaluate
+    simulator.prospect_book  prospect_totals over one large book
+    og.make_og               og_generate_and_patch.make_og: one 1200x630 canvas
+    og.fit_jpeg              og_variants.fit_quality: JPEG quality search at the Twitter size
+    seo.plan_file            patching.plan_file: one page's edits applied in memory
+    seo.plan_manifest        manifest.plan_manifest over the whole page tree (seo_fix_all.py --dry-run)
+    tokens.open              TokenStore load + lifecycle index of the token file
+    tokens.mint              generate_token.py: one token (journal, fsync, snapshot rewrite)
+    tokens.mint_bulk         one campaign of tokens in a single transaction
+
+Per case: ops/sec, p50 / p95 / p99 latency of one op (fast ops are timed in
+batches of at least BATCH_MIN_S so the timer stays out of the figure), the
+peak Python allocation of one op (tracemalloc) and, on Linux, its peak RSS
+growth (VmHWM, which also sees Pillow's pixel buffers). Cases whose
+dependency is missing (Pillow) are reported as skipped.
+
+Each run is appended to .cache/bench_history.json (--history elsewhere, e.g. a
+CI cache). A case is compared with the median of its last BASELINE_RUNS runs
+on the same host, Python and scale (BASELINE_MIN of them at least: one run is
+too noisy a reference), and flagged when its p50 latency is more than
+THRESHOLD slower, or its Python peak grows by more than THRESHOLD and
+MEM_SLACK_KB. ops/sec is 1 / mean latency, so it moves with whatever else the
+machine was doing and is shown next to the flag rather than flagged itself.
+--strict makes a flagged run exit 1.
+
+Run from repo root:
+    python3 -m ep_tools.bench [--only seo] [--quick] [--threshold 0.25] [--strict] [--json]
+    python3 -m ep_tools.bench --list
+"""
+
+import argparse
+import gc
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, NamedTuple
+
+from ep_tools import bp_model, incremental, manifest, patching, tokens
+from ep_tools.files import read_json, write_json_atomic
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+HISTORY_NAME = "bench_history.json"
+HISTORY_MAX = 200       # runs kept in the history file
+BASELINE_RUNS = 5       # a case is compared with the median of this many earlier runs
+BASELINE_MIN = 3        # ... and only flagged once there are at least this many
+THRESHOLD = 0.25        # relative slowdown / growth flagged as a regression
+MEM_SLACK_KB = 64       # ... and memory must also grow by at least this much
+BATCH_MIN_S = 0.0005    # a timed sample runs the op this long at least
+MIN_SAMPLES = 5
+MAX_SAMPLES = 2000
+MEMORY_RUNS = 3
+SEED = 20261019
+
+SCALES = {
+    "full":  {"candidates": 1000, "book": 200, "pages": 200, "tokens": 5000, "bulk": 50, "min_time": 1.0},
+    "quick": {"candidates": 200, "book": 50, "pages": 40, "tokens": 1000, "bulk": 20, "min_time": 0.2},
+}
+
+
+class Skip(Exception):
+    """A case cannot run here (missing optional dependency)."""
+
+
+class Case(NamedTuple):
+    name: str
+    setup: Callable  # (workdir, scale) -> state
+    op: Callable     # (state) -> anything; one timed operation
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+MARKETS = ("CH Onshore", "MEA", "Portugal", "Brazil", "LatAm", "NRI", "Israel", "Asia")
+CITIES = ("Geneva", "Zurich", "Lausanne", "Dubai", "Lisbon", "London", "Singapore")
+SOURCES = ("Self Acquired", "Inherited", "Finder")
+
+
+def prospect_book(size, rng):
+    """`size` prospects as the simulator's prospects table holds them."""
+    book = []
+    for i in range(size):
+        wealth = round(rng.uniform(5, 250), 1)
+        best = round(wealth * rng.uniform(0.05, 0.4), 1)
+        book.append({"Name": f"Prospect {i}", "Source": rng.choice(SOURCES), "Wealth (M)": wealth,
+                     "Best NNM (M)": best, "Worst NNM (M)": round(best * rng.uniform(0.2, 0.8), 1)})
+    return book
+
+
+def candidates(n, seed=SEED):
+    """`n` candidates with the Section 1-4 inputs and a prospect book of 0-40 rows."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        out.append({
+            "years_experience": rng.randint(2, 25),
+            "current_assets": round(rng.uniform(50, 1200), 1),
+            "current_market": rng.choice(MARKETS),
+            "base_salary": float(rng.randrange(120_000, 450_000, 5000)),
+            "last_bonus": float(rng.randrange(0, 400_000, 5000)),
+            "roa": [round(rng.uniform(0.4, 1.4), 2) for _ in range(3)],
+            "number_of_clients": rng.randint(0, 150),
+            "nnm": [round(rng.uniform(0, 120), 1) for _ in range(3)],
+            "prospects": prospect_book(rng.randint(0, 40), rng),
+        })
+    return out
+
+
+PAGE_TEMPLATE = '''import type {{ Metadata }} from "next";
+
+const PAGE_URL = "https://www.execpartners.ch/en/bench-{i}-{slug}";
+
+export const metadata: Metadata = {{
+  title: "{market} Private Banking Recruiter {city} — Senior RM Jobs",
+  description: "Executive Partners places senior relationship managers in {city} — {market} coverage, portable books and confidential mandates at Swiss private banks.",
+  alternates: {{ canonical: PAGE_URL }},
+  openGraph: {{
+    title: "{market} Private Banking Recruiter {city}",
+    url: PAGE_URL,
+    type: "website",
+    siteName: "Executive Partners",
+  }},
+}};
+
+const jsonLd = {{
+  "@context": "https://schema.org",
+  "@type": "Service",
+  name: "Executive Partners — {market} Private Banking {city}",
+  serviceType: "Private Banking Executive Search — {market} Market",
+  areaServed: "{city}",
+}};
+
+export default function Page() {{
+  return (
+    <main className="mx-auto max-w-4xl px-4 py-12">
+      <script type="application/ld+json" dangerouslySetInnerHTML={{{{ __html: JSON.stringify(jsonLd) }}}} />
+{body}
+    </main>
+  );
+}}
+'''
+
+
+def page_tree(root, pages, seed=SEED):
+    """Write `pages` page.tsx files under root/app/en/ and return their manifest
+    sections [(title, [Edit], [])] — the shape of manifests/seo_fix_all.json."""
+    rng = random.Random(seed)
+    sections = []
+    for i in range(pages):
+        market, city = rng.choice(MARKETS), rng.choice(CITIES)
+        slug = f"{market}-{city}".lower().replace(" ", "-")
+        rel = f"app/en/bench-{i}-{slug}/page.tsx"
+        body = "\n".join(
+            f"      <p>{market} bankers in {city} &mdash; paragraph {p}: portability, booking centres, "
+            f"cross-border rules and the {rng.randint(50, 900)}M books our mandates look for.</p>"
+            for p in range(rng.randint(20, 60)))
+        text = PAGE_TEMPLATE.format(i=i, slug=slug, market=market, city=city, body=body)
+        path = os.path.join(root, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        og_end = '    siteName: "Executive Partners",\n  },'
+        og_image = '    images: [{ url: `${PAGE_URL}/og.jpg`, width: 1200, height: 630 }],\n'
+        sections.append((f"Page {i}", [
+            patching.Edit(rel, f'title: "{market} Private Banking Recruiter {city} — Senior RM Jobs",',
+                          f'title: "{market} Private Banking Recruiter {city} | Senior RM Jobs",'),
+            patching.Edit(rel, f'name: "Executive Partners — {market} Private Banking {city}",',
+                          f'name: "Executive Partners | {market} Private Banking {city}",'),
+            patching.Edit(rel, f'serviceType: "Private Banking Executive Search — {market} Market",',
+                          f'serviceType: "Private Banking Executive Search | {market} Market",'),
+            patching.Edit(rel, og_end, og_end.replace("\n  },", "\n" + og_image + "  },")),
+            patching.Edit(rel, " &mdash; ", ", ", None),
+        ], []))
+    return sections
+
+
+def token_file(base, n, seed=SEED):
+    """A token store under base/data/ with `n` live (not yet due for a sweep) tokens."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    store = {}
+    while len(store) < n:
+        token = "".join(rng.choice(tokens.ALPHABET) for _ in range(tokens.LENGTH))
+        created = now - timedelta(days=rng.uniform(0, tokens.TTL_DAYS - 5))
+        used = rng.random() < 0.3
+        store[token] = {
+            "candidateName": f"Candidate {len(store)}", "institution": rng.choice(("UBS", "Pictet", "Julius Baer")),
+            "mandate": rng.choice(("", "CH Onshore RM", "MEA Team Head")),
+            "createdAt": created.isoformat(), "expiresAt": (created + timedelta(days=tokens.TTL_DAYS)).isoformat(),
+            "used": used, "usedAt": (now - timedelta(days=rng.uniform(0, 5))).isoformat() if used else None,
+        }
+    path = os.path.join(base, tokens.STORE)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(store, f, indent=2)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Cases
+# ---------------------------------------------------------------------------
+
+def _cycle(items):
+    return itertools.cycle(items).__next__
+
+
+def _projection(state):
+    c = state()
+    return bp_model.projection(c["nnm"], c["roa"], c["base_salary"])
+
+
+def _evaluate(state):
+    c = state()
+    best = bp_model.prospect_totals(c["prospects"])["Best NNM (M)"]
+    return bp_model.evaluate(c["years_experience"], c["current_assets"], c["current_market"], c["base_salary"],
+                             c["last_bonus"], c["roa"], c["number_of_clients"], c["nnm"], best)
+
+
+def _og_module():
+    if importlib.util.find_spec("PIL") is None:
+        raise Skip("Pillow not installed")
+    spec = importlib.util.spec_from_file_location("og_generate_and_patch", os.path.join(BASE, "og_generate_and_patch.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # defines make_og; its work runs under __main__ only
+    return module
+
+
+def _og_renders(workdir, scale):
+    og = _og_module()
+    return og.make_og, _cycle([spec for _, *spec in og.OG_IMAGES])
+
+
+def _og_canvas(workdir, scale):
+    from ep_tools import og_variants
+
+    og = _og_module()
+    stem, *spec = og.OG_IMAGES[0]
+    return og_variants.resize_cover(og.make_og(*spec), og_variants.SIZES[-1][1])
+
+
+def _fit_jpeg(img):
+    from ep_tools import og_variants
+
+    return og_variants.fit_quality(img, "JPEG", og_variants.SIZES[-1][2])
+
+
+def _page_files(workdir, scale):
+    sections = page_tree(workdir, scale["pages"])
+    files = []
+    for _, edits, _ in sections:
+        with open(os.path.join(workdir, edits[0].rel), encoding="utf-8") as f:
+            files.append((f.read(), edits))
+    return _cycle(files)
+
+
+def _mint_store(workdir, scale):
+    token_file(workdir, scale["tokens"])
+    return tokens.TokenStore(workdir)
+
+
+def _mint(store):
+    return store.mint([tokens.new_entry("Bench Candidate", "Bench Bank", "CH Onshore RM")])
+
+
+CASES = [
+    Case("simulator.projection", lambda w, s: _cycle(candidates(s["candidates"])), _projection),
+    Case("simulator.evaluate", lambda w, s: _cycle(candidates(s["candidates"])), _evaluate),
+    Case("simulator.prospect_book", lambda w, s: prospect_book(s["book"], random.Random(SEED)),
+         bp_model.prospect_totals),
+    Case("og.make_og", _og_renders, lambda st: st[0](*st[1]())),
+    Case("og.fit_jpeg", _og_canvas, _fit_jpeg),
+    Case("seo.plan_file", _page_files, lambda st: patching.plan_file(*st())),
+    Case("seo.plan_manifest", lambda w, s: (w, page_tree(w, s["pages"])),
+         lambda st: manifest.plan_manifest(*st)),
+    Case("tokens.open", lambda w, s: (token_file(w, s["tokens"]), w)[1], tokens.TokenStore),
+    Case("tokens.mint", _mint_store, _mint),
+    Case("tokens.mint_bulk", lambda w, s: (_mint_store(w, s), s["bulk"]),
+         lambda st: st[0].mint([tokens.new_entry(f"Bench {i}", "Bench Bank") for i in range(st[1])])),
+]
+
+
+# ---------------------------------------------------------------------------
+# Measuring
+# ---------------------------------------------------------------------------
+
+def _percentile(values, q):
+    v = sorted(values)
+    return v[min(len(v) - 1, int(round(q * (len(v) - 1))))]
+
+
+def _proc_kb(field):
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _reset_hwm():
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")  # resets VmHWM to the current RSS
+        return True
+    except OSError:
+        return False
+
+
+def time_op(op, state, min_time):
+    """(ops per second, [seconds per op] one per sample)."""
+    op(state)  # warm-up
+    batch = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(batch):
+            op(state)
+        if time.perf_counter() - t0 >= BATCH_MIN_S or batch >= 1 << 16:
+            break
+        batch *= 4
+    samples, start = [], time.perf_counter()
+    while len(samples) < MAX_SAMPLES and (len(samples) < MIN_SAMPLES or time.perf_counter() - start < min_time):
+        t0 = time.perf_counter()
+        for _ in range(batch):
+            op(state)
+        samples.append((time.perf_counter() - t0) / batch)
+    return 1.0 / statistics.fmean(samples), samples
+
+
+def memory_op(op, state, runs=MEMORY_RUNS):
+    """(peak Python KB, peak RSS growth KB or None) of one op, the max over `runs`."""
+    gc.collect()
+    tracemalloc.start()
+    peak = 0
+    try:
+        for _ in range(runs):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            op(state)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    rss = None
+    for _ in range(runs):
+        if not _reset_hwm():
+            break
+        before = _proc_kb("VmRSS")
+        op(state)
+        hwm = _proc_kb("VmHWM")
+        if before is not None and hwm is not None:
+            rss = max(rss or 0, hwm - before)
+    return peak / 1024, rss
+
+
+def run_case(case, scale, min_time=None):
+    """One case's result dict (or {"skipped": reason})."""
+    with tempfile.TemporaryDirectory(prefix="ep-bench-") as workdir:
+        try:
+            state = case.setup(workdir, scale)
+        except Skip as e:
+            return {"skipped": str(e)}
+        ops, samples = time_op(case.op, state, scale["min_time"] if min_time is None else min_time)
+        peak_kb, rss_kb = memory_op(case.op, state)
+    us = [s * 1e6 for s in samples]
+    return {"ops_per_s": round(ops, 1), "p50_us": round(_percentile(us, 0.5), 2),
+            "p95_us": round(_percentile(us, 0.95), 2), "p99_us": round(_percentile(us, 0.99), 2),
+            "samples": len(samples), "peak_kb": round(peak_kb, 1), "rss_kb": rss_kb}
+
+
+# ---------------------------------------------------------------------------
+# History
+# ---------------------------------------------------------------------------
+
+def _commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE, capture_output=True, text=True,
+                             timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return out.stdout.strip() if out.returncode == 0 else ""
+
+
+def environment():
+    return {"python": platform.python_version(), "machine": platform.machine(), "host": platform.node(),
+            "cpus": os.cpu_count()}
+
+
+def load_history(path):
+    return read_json(path, {"runs": []})
+
+
+def baseline(history, run, name, runs=BASELINE_RUNS):
+    """Median ops/s, p50 and peak of `name` over the last `runs` comparable runs, or None."""
+    past = [r["results"][name] for r in history["runs"]
+            if r["env"] == run["env"] and r["scale"] == run["scale"]
+            and "ops_per_s" in r["results"].get(name, {})][-runs:]
+    if not past:
+        return None
+    return {k: statistics.median(p[k] for p in past) for k in ("ops_per_s", "p50_us", "peak_kb")} | {"runs": len(past)}
+
+
+def regressions(result, base, threshold=THRESHOLD):
+    """Human-readable reasons `result` is worse than `base` (empty when it is not)."""
+    out = []
+    if result["p50_us"] > base["p50_us"] * (1 + threshold):
+        out.append(f"p50 {_pct(result['p50_us'], base['p50_us'])} ({_us(base['p50_us'])} → {_us(result['p50_us'])}), "
+                   f"ops/s {_pct(result['ops_per_s'], base['ops_per_s'])}")
+    if (result["peak_kb"] > base["peak_kb"] * (1 + threshold)
+            and result["peak_kb"] - base["peak_kb"] >= MEM_SLACK_KB):
+        out.append(f"peak {base['peak_kb']:.0f} → {result['peak_kb']:.0f} KB")
+    return out
+
+
+def compare(history, run, threshold=THRESHOLD):
+    """{case: {"baseline": ..., "regressions": [...]}} for every measured case of `run`."""
+    out = {}
+    for name, result in run["results"].items():
+        if "ops_per_s" not in result:
+            continue
+        base = baseline(history, run, name)
+        ready = base is not None and base["runs"] >= BASELINE_MIN
+        out[name] = {"baseline": base, "regressions": regressions(result, base, threshold) if ready else []}
+    return out
+
+
+def record(path, history, run):
+    history["runs"] = (history["runs"] + [run])[-HISTORY_MAX:]
+    write_json_atomic(path, history, indent=1)
+
+
+def _pct(new, old):
+    return f"{(new - old) / old * 100:+.0f}%" if old else "n/a"
+
+
+def _us(v):
+    return f"{v / 1000:.2f} ms" if v >= 1000 else f"{v:.1f} µs"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark the Python hot paths and flag regressions against history.")
+    ap.add_argument("--only", action="append", default=[], help="run cases whose name starts with this (repeatable)")
+    ap.add_argument("--quick", action="store_true", help="smaller fixtures and shorter runs (CI smoke)")
+    ap.add_argument("--min-time", type=float, help="seconds of timed samples per case")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD, help="relative change flagged (default 0.25)")
+    ap.add_argument("--history", help=f"history file (default .cache/{HISTORY_NAME})")
+    ap.add_argument("--no-save", action="store_true", help="compare, but do not add this run to the history")
+    ap.add_argument("--json", action="store_true", help="print the run and comparison as JSON")
+    ap.add_argument("--strict", action="store_true", help="exit 1 on any regression")
+    ap.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = ap.parse_args(argv)
+
+    cases = [c for c in CASES if not args.only or c.name.startswith(tuple(args.only))]
+    if args.list or not cases:
+        for c in CASES:
+            print(f"  {c.name}")
+        return 0 if cases else 1
+
+    scale_name = "quick" if args.quick else "full"
+    run = {"at": datetime.now().isoformat(timespec="seconds"), "commit": _commit(), "env": environment(),
+           "scale": scale_name, "results": {}}
+    for case in cases:
+        run["results"][case.name] = run_case(case, SCALES[scale_name], args.min_time)
+
+    path = args.history or incremental.cache_path(BASE, HISTORY_NAME)
+    history = load_history(path)
+    report = compare(history, run, args.threshold)
+    if not args.no_save:
+        record(path, history, run)
+    flagged = sorted(name for name, c in report.items() if c["regressions"])
+
+    if args.json:
+        print(json.dumps({"run": run, "comparison": report}, indent=2, ensure_ascii=False))
+        return 1 if args.strict and flagged else 0
+
+    print(f"  {scale_name} run · Python {run['env']['python']} · {run['commit'] or 'no commit'}")
+    for name, r in run["results"].items():
+        if "skipped" in r:
+            print(f"  -  {name:24} skipped: {r['skipped']}")
+            continue
+        c = report[name]
+        mark = "⚠️" if c["regressions"] else "✓" if c["baseline"] and c["baseline"]["runs"] >= BASELINE_MIN else "="
+        rss = f" · rss {r['rss_kb']} KB" if r["rss_kb"] is not None else ""
+        print(f"  {mark} {name:24} {r['ops_per_s']:>12,.1f} ops/s  p50 {_us(r['p50_us']):>9}  "
+              f"p95 {_us(r['p95_us']):>9}  p99 {_us(r['p99_us']):>9}  peak {r['peak_kb']:,.1f} KB{rss}")
+        if c["regressions"]:
+            print(f"       regression vs median of {c['baseline']['runs']} runs: {'; '.join(c['regressions'])}")
+    if not report:
+        print("  = nothing measured")
+    elif not all(c["baseline"] and c["baseline"]["runs"] >= BASELINE_MIN for c in report.values()):
+        print(f"  = baseline still forming for the cases marked = (needs {BASELINE_MIN} runs on this host/scale)")
+    shown = os.path.relpath(path, BASE) if path.startswith(BASE + os.sep) else path
+    print(f"  {'⚠️ ' + str(len(flagged)) + ' regression(s)' if flagged else '✓ no regressions'}"
+          + ("" if args.no_save else f" · history: {shown}"))
+    return 1 if args.strict and flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
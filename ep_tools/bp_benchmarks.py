@@ -0,0 +1,140 @@
+"""
+Peer percentiles for the simulator's metrics against every BP_Entries submission.
+
+For each segment — (Current Market, Current Role), the market alone, the role
+alone and everyone — and each metric (AUM, avg ROA, 3Y NNM, clients) the
+benchmarks keep a QuantileSketch (ep_tools.sketch). A lookup uses the most
+specific segment with at least MIN_PEERS submissions, so a rare market/role
+pair falls back to its market, then its role, then all peers:
+
+    bench.percentile("aum", 250, market="CH Onshore", role="Director")
+        -> (62, 143, "CH Onshore · Director")        # P62 of 143 peers
+
+State is updated incrementally, never by re-scanning the sheet: sync(ws) folds
+in rows appended since the last sync, record_save(row) a row this process
+just appended and record_replace() swaps a row it rewrote in place for its new
+version (bp_sheet.SheetAggregate). It is persisted in
+.cache/bp_benchmarks.json (sketch counts + rows consumed), so a restarted
+process reads only what was appended while it was down.
+
+Run from repo root:
+    python3 -m ep_tools.bp_benchmarks export.csv [--market X --role Y --aum 250 ...]
+        (builds the cache from a CSV export of BP_Entries, then looks values up)
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+from ep_tools import bp_sheet, incremental
+from ep_tools.files import read_json
+from ep_tools.sketch import QuantileSketch
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+CACHE_NAME = "bp_benchmarks.json"
+METRICS = ("aum", "roa", "nnm_3y", "clients")
+MIN_PEERS = 20
+ALL = "*"
+
+
+def segments(market, role):
+    """Segment keys from most to least specific (a blank market or role collapses its pair)."""
+    return list(dict.fromkeys([(market, role), (market, ALL), (ALL, role), (ALL, ALL)]))
+
+
+def label(segment):
+    market, role = segment
+    if segment == (ALL, ALL):
+        return "all peers"
+    return " · ".join(v for v in (market, role) if v != ALL)
+
+
+class Benchmarks(bp_sheet.SheetAggregate):
+    def __init__(self, path=None):
+        super().__init__(path)
+        self.sketches = {}  # (market, role) -> {metric: QuantileSketch}
+
+    def _add(self, rec):
+        for seg in segments(rec["market"] or ALL, rec["role"] or ALL):
+            metrics = self.sketches.get(seg)
+            if metrics is None:
+                metrics = self.sketches[seg] = {m: QuantileSketch() for m in METRICS}
+            for m in METRICS:
+                metrics[m].add(rec[m])
+
+    def _replace(self, old, rec):
+        for seg in segments(old["market"] or ALL, old["role"] or ALL):
+            for m, sketch in self.sketches.get(seg, {}).items():
+                sketch.remove(old[m])
+        self._add(rec)
+
+    def percentile(self, metric, value, market="", role=""):
+        """(percentile 0-100, peers, segment label) or None when no segment has MIN_PEERS values."""
+        for seg in segments(market or ALL, role or ALL):
+            sketch = self.sketches.get(seg, {}).get(metric)
+            if sketch is not None and sketch.n >= MIN_PEERS:
+                return sketch.percentile(value), sketch.n, label(seg)
+        return None
+
+    def median(self, metric, market=ALL, role=ALL):
+        sketch = self.sketches.get((market, role), {}).get(metric)
+        return sketch.quantile(0.5) if sketch else None
+
+    def _reset(self):
+        self.sketches = {}
+
+    def _state(self):
+        return {"segments": [{"market": m, "role": r, **{k: s.to_json() for k, s in metrics.items()}}
+                             for (m, r), metrics in sorted(self.sketches.items())]}
+
+    def _load_state(self, data):
+        for seg in data["segments"]:
+            self.sketches[(seg["market"], seg["role"])] = {m: QuantileSketch.from_json(seg[m]) for m in METRICS}
+
+
+def load(base=BASE):
+    path = incremental.cache_path(base, CACHE_NAME)
+    return Benchmarks.from_json(read_json(path), path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Build peer benchmarks from a BP_Entries CSV export and query them.")
+    ap.add_argument("csv", help="CSV export of BP_Entries (header row + data rows)")
+    ap.add_argument("--market", default="")
+    ap.add_argument("--role", default="")
+    for m in METRICS:
+        ap.add_argument(f"--{m.replace('_', '-')}", type=float, dest=m)
+    args = ap.parse_args(argv)
+
+    bench = Benchmarks(incremental.cache_path(BASE, CACHE_NAME))
+    try:
+        with open(args.csv, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+    except OSError as e:
+        print(f"✗ {e}")
+        return 1
+    t0 = time.perf_counter()
+    bench.add_rows(rows)
+    bench.cursors[bp_sheet.WORKSHEET] = [len(rows), bp_sheet.row_key(rows[-1]) if rows else None]
+    bench.save()
+    print(f"  ✓ {len(rows)} rows -> {len(bench.sketches)} segments in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    for m in METRICS:
+        value = getattr(args, m)
+        if value is None:
+            continue
+        t0 = time.perf_counter()
+        hit = bench.percentile(m, value, args.market, args.role)
+        us = (time.perf_counter() - t0) * 1e6
+        if hit is None:
+            print(f"  = {m} {value:g}: fewer than {MIN_PEERS} peers")
+        else:
+            pct, n, seg = hit
+            print(f"  {m} {value:g}: P{pct} of {n} ({seg}), {us:.0f} µs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""
+Duplicate BP_Entries submissions: detected at save time, collapsed after the fact.
+
+Every click on the simulator's download button appends a row, so a candidate
+who downloads twice, or changes one field and downloads again, leaves
+near-copies behind. Two rules decide what a new save is:
+
+    duplicate   same content as a row saved less than WINDOW_HOURS earlier
+                (every column but Timestamp, numbers compared as numbers):
+                nothing is written
+    replace     same Candidate Email as a row saved less than WINDOW_HOURS
+                earlier: that row is overwritten with the new version
+    append      anything else
+
+Dedupe keeps the two indexes that answer this in O(1) — content hash and
+email -> (timestamp, row) of the latest save — as a bp_sheet.SheetAggregate,
+so it is synced incrementally and persisted in .cache/bp_dedupe.json like the
+benchmarks and rollups.
+
+`compact` applies the same rules to the rows already in a tab: each group
+of duplicates (same content or same email, with less than WINDOW_HOURS between
+consecutive saves) is collapsed into its latest row, the kept rows are written
+back from row 2 in their original order and the tail is cleared. The tab is
+first copied to a "<tab> backup <date>" tab. Shards (ep_tools.bp_shards) are
+compacted one at a time with --tab. Run it when nobody is
+saving; running aggregates notice the rewrite on their next sync and rebuild.
+
+Run from repo root:
+    python3 -m ep_tools.bp_dedupe compact [--tab 'BP_Entries 2026-Q4']   # dry run
+    python3 -m ep_tools.bp_dedupe compact --apply [--no-backup] [--window-hours 24]
+    python3 -m ep_tools.bp_dedupe compact --csv export.csv [--out compacted.csv]
+"""
+
+import argparse
+import csv
+import hashlib
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from ep_tools import bp_shards, bp_sheet, incremental, sheets_quota
+from ep_tools.files import read_json
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+CACHE_NAME = "bp_dedupe.json"
+WINDOW_HOURS = 24
+STAMP_FORMAT = "%Y-%m-%d %H:%M:%S"  # as streamlit_app.py writes Timestamp
+IGNORED = ("Timestamp",)
+
+
+def _norm(value):
+    if isinstance(value, (int, float)):
+        return repr(float(value))
+    text = " ".join(str(value).split()).casefold()
+    try:
+        return repr(float(text.replace(",", "").replace("'", "")))
+    except ValueError:
+        return text
+
+
+def content_hash(row):
+    """Short sha256 of a row's content, Timestamp excluded, blank cells ignored."""
+    h = hashlib.sha256()
+    for k in sorted(row):
+        v = _norm(row[k])
+        if k in IGNORED or v == "":
+            continue
+        h.update(f"{k}\x1f{v}\x1e".encode("utf-8"))
+    return h.hexdigest()[:20]
+
+
+def _stamp(text):
+    try:
+        return datetime.strptime(text, STAMP_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def _within(earlier, later, window):
+    a, b = _stamp(earlier), _stamp(later)
+    return a is not None and b is not None and timedelta(0) <= b - a < window
+
+
+class Dedupe(bp_sheet.SheetAggregate):
+    FORMAT = 4  # by_hash entries carry the timestamp of the save
+    IDEMPOTENT = True  # re-adding a row only refreshes its row number
+
+    def __init__(self, path=None, window_hours=WINDOW_HOURS):
+        super().__init__(path)
+        self.window = timedelta(hours=window_hours)
+        self.by_hash = {}   # content hash -> [timestamp, (tab, sheet row) or None until synced] of the latest save
+        self.by_email = {}  # email -> [timestamp, (tab, sheet row), content hash] of the latest save
+        self._row_hash = {}  # (tab, sheet row) -> content hash (derived)
+
+    @staticmethod
+    def _parse(row):
+        return {**bp_sheet.parse_row(row), "hash": content_hash(row)}
+
+    def _add(self, rec):
+        h, row, stamp = rec["hash"], rec["where"], rec["key"][0]
+        if row is not None:
+            old = self._row_hash.get(row)
+            if old and old != h and self.by_hash.get(old, [None, None])[1] == row:
+                del self.by_hash[old]  # that row was rewritten in place
+            self._row_hash[row] = h
+        prev = self.by_hash.get(h)
+        if prev is None or prev[0] <= stamp or prev[1] == row:
+            self.by_hash[h] = [stamp, row]
+        if rec["email"]:
+            prev = self.by_email.get(rec["email"])
+            if prev is None or prev[0] <= rec["key"][0] or prev[1] == row:
+                self.by_email[rec["email"]] = [rec["key"][0], row, h]
+
+    def _replace(self, old, rec):
+        self._add(rec)
+
+    def _reset(self):
+        self.by_hash, self.by_email, self._row_hash = {}, {}, {}
+
+    def check(self, row):
+        """("duplicate", where, None) | ("replace", where, key of the row there) | ("append", None, None).
+
+        `where` is (tab, sheet row); a duplicate's may be None when it was saved
+        by this process and not synced yet.
+        """
+        stamp, email = bp_sheet.row_key(row)
+        with self._lock:
+            same = self.by_hash.get(content_hash(row))
+            prev = self.by_email.get(email) if email else None
+        if same and _within(same[0], stamp, self.window):
+            return "duplicate", same[1], None
+        if prev and prev[1] is not None and _within(prev[0], stamp, self.window):
+            return "replace", prev[1], (prev[0], email)
+        return "append", None, None
+
+    def _state(self):
+        return {"window_hours": self.window.total_seconds() / 3600,
+                "by_hash": {h: [t, list(w) if w else None] for h, (t, w) in self.by_hash.items()},
+                "by_email": {e: [t, list(w) if w else None, h] for e, (t, w, h) in self.by_email.items()}}
+
+    def _load_state(self, data):
+        self.window = timedelta(hours=data.get("window_hours", WINDOW_HOURS))
+        self.by_hash = {h: [t, tuple(w) if w else None] for h, (t, w) in data["by_hash"].items()}
+        self.by_email = {e: [t, tuple(w) if w else None, h] for e, (t, w, h) in data["by_email"].items()}
+        self._row_hash = {w: h for h, (t, w) in self.by_hash.items() if w is not None}
+
+
+def load(base=BASE):
+    path = incremental.cache_path(base, CACHE_NAME)
+    return Dedupe.from_json(read_json(path), path)
+
+
+def row_at(ws, row_number, header=None):
+    """Sheet row `row_number` of `ws` as a header-keyed dict (read before overwriting it).
+
+    `header` saves the read of row 1 when the caller knows it (a shard's header).
+    """
+    header = header or ws.row_values(1)
+    cells = list(ws.row_values(row_number))
+    return dict(zip(header, cells + [""] * (len(header) - len(cells))))
+
+
+def save(shards, row, index, aggregates=()):
+    """Save a header-keyed row through the index; returns (action, where).
+
+    The simulator's save path: duplicate check, overwrite or append via the
+    shard router (ep_tools.bp_shards), then the index and `aggregates` learn
+    the row. The reads a save needs wait for tokens as long as its write
+    (sheets_quota.WRITE_PATIENCE). Sheet errors from those reads and from the
+    write propagate (QuotaError included: a replace whose row could not be
+    re-read is not turned into an append, which would recreate the
+    duplicate); the index itself is best effort.
+    """
+    try:
+        with sheets_quota.optional():  # only with read tokens to spare
+            index.sync(shards)
+    except Exception:
+        pass
+    try:
+        action, where, old_key = index.check(row)
+    except Exception:
+        action, where, old_key = "append", None, None  # never lose a save over the index
+    if action == "replace":
+        with sheets_quota.patience(sheets_quota.WRITE_PATIENCE):
+            old_row = row_at(shards.worksheet(where[0]), where[1], shards.header)
+        if bp_sheet.row_key(old_row) != old_key:
+            action, where = "append", None  # the sheet moved under the index (compaction)
+    if action == "duplicate":
+        return action, where
+    if action == "replace":
+        shards.update(where, row)
+    else:
+        where = shards.append(row)
+    for aggregate in (index, *aggregates):
+        try:
+            if action == "replace":
+                aggregate.record_replace(where, old_row, row)
+            else:
+                aggregate.record_save(row, where)
+        except Exception:
+            pass  # picked up by the next sync instead
+    return action, where
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+
+def groups(rows, window_hours=WINDOW_HOURS):
+    """Group id per row: rows with the same content or the same email, saved
+    less than window_hours after the previous such row, share one."""
+    window = timedelta(hours=window_hours)
+    by_hash, by_email, out = {}, {}, []
+    for row in rows:
+        h = content_hash(row)
+        stamp, email = bp_sheet.row_key(row)
+        g = None
+        if h in by_hash and _within(by_hash[h][0], stamp, window):
+            g = by_hash[h][1]
+        if g is None and email in by_email and _within(by_email[email][0], stamp, window):
+            g = by_email[email][1]
+        if g is None:
+            g = len(out)
+        out.append(g)
+        by_hash[h] = (stamp, g)
+        if email:
+            by_email[email] = (stamp, g)
+    return out
+
+
+def compact_rows(rows, window_hours=WINDOW_HOURS):
+    """Indexes of the rows to keep: the last row of each group, in sheet order."""
+    last = {}
+    for i, g in enumerate(groups(rows, window_hours)):
+        last[g] = i
+    return sorted(last.values())
+
+
+def _compact_sheet(args):
+    try:
+        shards = bp_shards.open_shards(BASE)
+        ws = shards.worksheet(args.tab)
+    except Exception as e:
+        print(f"✗ could not open {args.tab}: {e}")
+        return 1
+    header = ws.row_values(1)
+    values = ws.get("A2:ZZ") or []
+    values = [list(v) + [""] * (len(header) - len(v)) for v in values]
+    rows = [dict(zip(header, v)) for v in values]
+    t0 = time.perf_counter()
+    keep = compact_rows(rows, args.window_hours)
+    print(f"  {len(rows)} rows -> {len(keep)} kept, {len(rows) - len(keep)} duplicates "
+          f"({(time.perf_counter() - t0) * 1000:.0f} ms)")
+    if len(keep) == len(rows):
+        print("  = nothing to compact")
+        return 0
+    if not args.apply:
+        print("  = dry run; pass --apply to rewrite the sheet")
+        return 0
+    if not args.no_backup:
+        name = f"{ws.title} backup {datetime.now():%Y-%m-%d %H%M}"
+        ws.duplicate(new_sheet_name=name)
+        print(f"  ✓ backup tab: {name}")
+    ws.update(values=[values[i] for i in keep], range_name="A2", value_input_option="USER_ENTERED")
+    ws.batch_clear([f"A{len(keep) + 2}:ZZ{len(values) + 1}"])
+    shards.set_rows(ws.title, len(keep))  # readers that skip finished tabs re-read this one
+    print(f"  ✓ {ws.title}: {len(keep)} rows written, {len(values) - len(keep)} cleared")
+    return 0
+
+
+def _compact_csv(args):
+    try:
+        with open(args.csv, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            header, rows = reader.fieldnames or [], list(reader)
+    except OSError as e:
+        print(f"✗ {e}")
+        return 1
+    t0 = time.perf_counter()
+    keep = compact_rows(rows, args.window_hours)
+    print(f"  {len(rows)} rows -> {len(keep)} kept, {len(rows) - len(keep)} duplicates "
+          f"({(time.perf_counter() - t0) * 1000:.0f} ms)")
+    if args.out:
+        with open(args.out, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=header)
+            w.writeheader()
+            w.writerows(rows[i] for i in keep)
+        print(f"  ✓ wrote {args.out}")
+    return 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Collapse duplicate BP_Entries submissions into their latest version.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    c = sub.add_parser("compact", help="collapse duplicates in the sheet (or a CSV export)")
+    c.add_argument("--tab", default=bp_sheet.WORKSHEET, help="worksheet to compact (a shard, or the legacy tab)")
+    c.add_argument("--window-hours", type=float, default=WINDOW_HOURS)
+    c.add_argument("--apply", action="store_true", help="rewrite the sheet (default: dry run)")
+    c.add_argument("--no-backup", action="store_true", help="skip the backup tab")
+    c.add_argument("--csv", help="work on a CSV export instead of the sheet")
+    c.add_argument("--out", help="with --csv: write the compacted rows here")
+    args = ap.parse_args(argv)
+    return _compact_csv(args) if args.csv else _compact_sheet(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
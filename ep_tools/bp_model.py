@@ -0,0 +1,126 @@
+"""
+The Business Plan Simulator's numbers: 3-year projection and recruiter score.
+
+streamlit_app.py used to compute these inline between widgets; they live here
+so the app, the tools and the benchmarks (ep_tools.bench) run the same code.
+Amounts follow the app: NNM and AUM in M CHF, salary and revenue in CHF, ROA
+in percent.
+
+    projection(nnm, roa, base_salary)   revenue, fixed cost and net margin per year
+    prospect_totals(prospects)          Wealth / Best NNM / Worst NNM summed over a book
+    evaluate(...)                       score out of 10, traffic-light verdict, reasons
+"""
+
+FIXED_COST_FACTOR = 1.25  # base salary -> fully loaded yearly cost
+PROSPECT_COLUMNS = ("Wealth (M)", "Best NNM (M)", "Worst NNM (M)")
+
+STRONG, MEDIUM, WEAK = "🟢 Strong Candidate", "🟡 Medium Potential", "🔴 Weak Candidate"
+
+
+def revenue(nnm_m, roa_pct):
+    """Yearly revenue in CHF of `nnm_m` M CHF at `roa_pct` %."""
+    return nnm_m * roa_pct / 100 * 1_000_000
+
+
+def projection(nnm, roa, base_salary):
+    """Section 4 / 6 figures for NNM and ROA of years 1..3 (missing values count as 0)."""
+    nnm = [float(v or 0.0) for v in nnm]
+    roa = [float(v or 0.0) for v in roa]
+    base_salary = float(base_salary or 0.0)
+    rev = [revenue(n, r) for n, r in zip(nnm, roa)]
+    fixed_cost = base_salary * FIXED_COST_FACTOR
+    net = [r - fixed_cost for r in rev]
+    total_rev = (nnm[0] * roa[0] + nnm[1] * roa[1] + nnm[2] * roa[2]) / 100 * 1_000_000
+    costs_3y = base_salary * FIXED_COST_FACTOR * 3
+    return {
+        "revenue": rev,
+        "fixed_cost": fixed_cost,
+        "net_margin": net,
+        "gross_total": rev[0] + rev[1] + rev[2],
+        "total_costs": fixed_cost * 3,
+        "net_total": net[0] + net[1] + net[2],
+        "total_revenue_3y": total_rev,
+        "profit_margin_pct": ((total_rev - costs_3y) / total_rev) * 100.0 if total_rev > 0 else 0.0,
+        "total_profit_3y": (rev[0] + rev[1] + rev[2]) - costs_3y,
+    }
+
+
+def prospect_totals(prospects):
+    """{column: sum} over a prospect book (dicts keyed like the prospects table)."""
+    totals = dict.fromkeys(PROSPECT_COLUMNS, 0.0)
+    for p in prospects:
+        for c in PROSPECT_COLUMNS:
+            totals[c] += float(p.get(c) or 0.0)
+    return totals
+
+
+def verdict_for(score):
+    return STRONG if score >= 7 else MEDIUM if score >= 4 else WEAK
+
+
+def evaluate(years_experience, current_assets, current_market, base_salary, last_bonus,
+             roa, number_of_clients, nnm, best_nnm, target_segment="HNWI", tolerance_pct=10):
+    """Admin Mode recruiter evaluation. Returns {score, verdict, positives, risks, flags, avg_roa, total_nnm_3y}.
+
+    `roa` and `nnm` are years 1..3; `best_nnm` is the prospects' Best NNM total.
+    """
+    total_nnm_3y = float(sum(float(v or 0.0) for v in nnm))
+    avg_roa = float(sum(roa) / 3)
+    current_assets = float(current_assets or 0.0)
+    aum_min = 200.0 if (current_market == "CH Onshore" or target_segment == "HNWI") else 300.0
+
+    score = 0
+    pos, neg, flags = [], [], []
+
+    if years_experience >= 7:
+        score += 2; pos.append("Experience ≥7 years in market")
+    elif years_experience >= 6:
+        score += 1; pos.append("Experience 6 years")
+    else:
+        neg.append("Experience <6 years")
+
+    if current_assets >= aum_min:
+        if current_market == "CH Onshore" and current_assets >= 250:
+            score += 2; pos.append("AUM meets CH 250M target")
+        else:
+            score += 2; pos.append(f"AUM ≥ {aum_min}M")
+    else:
+        neg.append(f"AUM shortfall: {aum_min - current_assets:.0f}M")
+
+    if base_salary > 200_000 and last_bonus > 100_000:
+        score += 2; pos.append("Comp indicates hunter profile")
+    elif base_salary <= 150_000 and last_bonus <= 50_000:
+        score -= 1; neg.append("Low comp indicates inherited/low portability")
+    else:
+        flags.append("Comp neutral – clarify origin of book")
+
+    if avg_roa >= 1.0:
+        score += 2; pos.append(f"Avg ROA {avg_roa:.2f}% (excellent)")
+    elif avg_roa >= 0.8:
+        score += 1; pos.append(f"Avg ROA {avg_roa:.2f}% (acceptable)")
+    else:
+        neg.append(f"Avg ROA {avg_roa:.2f}% is low")
+
+    if number_of_clients == 0:
+        flags.append("Clients not provided")
+    elif number_of_clients > 80:
+        neg.append(f"High client count ({number_of_clients}) – likely lower segment")
+    else:
+        score += 1; pos.append("Client load appropriate (≤80)")
+
+    nnm_y1 = float(nnm[0] or 0.0)
+    tol = max(0.0, tolerance_pct) / 100.0
+    if nnm_y1 == 0.0 and best_nnm == 0.0:
+        flags.append("Prospects & NNM Y1 both zero")
+    elif abs(best_nnm - nnm_y1) <= tol * max(nnm_y1, 1e-9):
+        score += 1; pos.append(f"Prospects Best NNM {best_nnm:.1f}M ≈ NNM Y1 {nnm_y1:.1f}M")
+    else:
+        neg.append(f"Prospects {best_nnm:.1f}M vs NNM Y1 {nnm_y1:.1f}M (> {int(tolerance_pct)}% dev)")
+
+    if total_nnm_3y >= (100.0 if target_segment == "HNWI" else 200.0):
+        score += 2; pos.append(f"3Y NNM {total_nnm_3y:.1f}M meets target")
+    else:
+        neg.append(f"3Y NNM {total_nnm_3y:.1f}M below target")
+
+    return {"score": score, "verdict": verdict_for(score), "positives": pos, "risks": neg, "flags": flags,
+            "avg_roa": avg_roa, "total_nnm_3y": total_nnm_3y}
@@ -0,0 +1,188 @@
+"""
+Pre-aggregated BP_Entries rollups for the simulator's Admin Mode dashboard.
+
+One cell per (dimension, value, month) for the dimensions market, location,
+employer — plus ("all", "*", month) for totals — and the same cells with
+month "*" for all time. Each cell holds
+
+    n                 submissions
+    scored, score_sum, scores {score: n}     (candidate-mode saves carry no score)
+    verdicts {"🟢" | "🟡" | "🔴" | "—": n}
+    aum, roa, nnm_3y  QuantileSketch (ep_tools.sketch) for medians
+
+A row touches 2 x 4 cells, so folding one in is O(1); the dashboard's tables
+and charts read a handful of cells and never touch the rows. Rows come in
+through bp_sheet.SheetAggregate (incremental sync + record_save; a row
+rewritten in place by record_replace is taken out of its cells and the new
+version added), persisted in .cache/bp_rollups.json.
+
+Run from repo root:
+    python3 -m ep_tools.bp_rollups export.csv [--dimension market] [--month 2026-10]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+from ep_tools import bp_sheet, incremental
+from ep_tools.files import read_json
+from ep_tools.sketch import QuantileSketch
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+CACHE_NAME = "bp_rollups.json"
+DIMENSIONS = ("market", "location", "employer")
+METRICS = ("aum", "roa", "nnm_3y")
+VERDICTS = ("🟢", "🟡", "🔴", "—")  # strong / medium / weak / not scored
+ALL = "*"
+
+
+def verdict_of(text):
+    return next((v for v in VERDICTS[:3] if text.startswith(v)), "—")
+
+
+def _new_cell():
+    return {"n": 0, "scored": 0, "score_sum": 0.0, "scores": {}, "verdicts": dict.fromkeys(VERDICTS, 0),
+            **{m: QuantileSketch() for m in METRICS}}
+
+
+class Rollups(bp_sheet.SheetAggregate):
+    def __init__(self, path=None):
+        super().__init__(path)
+        self.cells = {}  # (dimension, value, month) -> cell
+
+    def _add(self, rec, sign=1):
+        verdict = verdict_of(rec["verdict"])
+        keys = [("all", ALL)] + [(d, rec[d] or "(blank)") for d in DIMENSIONS]
+        for dim, value in keys:
+            for month in (rec["month"] or "(undated)", ALL):
+                cell = self.cells.get((dim, value, month))
+                if cell is None:
+                    cell = self.cells[(dim, value, month)] = _new_cell()
+                cell["n"] += sign
+                cell["verdicts"][verdict] += sign
+                if verdict != "—" and rec["score"] is not None:
+                    s = int(rec["score"])
+                    cell["scored"] += sign
+                    cell["score_sum"] += sign * s
+                    cell["scores"][s] = cell["scores"].get(s, 0) + sign
+                    if not cell["scores"][s]:
+                        del cell["scores"][s]
+                for m in METRICS:
+                    (cell[m].add if sign > 0 else cell[m].remove)(rec[m])
+                if not cell["n"]:
+                    del self.cells[(dim, value, month)]
+
+    def _replace(self, old, rec):
+        self._add(old, sign=-1)
+        self._add(rec)
+
+    # ------------------------------------------------------------------
+    # Views (what the dashboard renders)
+    # ------------------------------------------------------------------
+
+    def months(self):
+        return sorted(m for d, v, m in self.cells if d == "all" and m != ALL)
+
+    def monthly(self):
+        """[(month, submissions)] oldest first."""
+        return [(m, self.cells[("all", ALL, m)]["n"]) for m in self.months()]
+
+    def table(self, dimension, month=ALL, limit=None):
+        """One summary dict per value of `dimension` in `month`, most submissions first."""
+        rows = []
+        for (d, value, m), cell in self.cells.items():
+            if d != dimension or m != month:
+                continue
+            rows.append(self._summary(dimension, value, cell))
+        rows.sort(key=lambda r: (-r["Submissions"], r[dimension.title()]))
+        return rows[:limit] if limit else rows
+
+    def total(self, month=ALL):
+        cell = self.cells.get(("all", ALL, month))
+        return self._summary("all", "All", cell) if cell else None
+
+    def scores(self, dimension="all", value=ALL, month=ALL):
+        """{score: submissions} for one cell."""
+        cell = self.cells.get((dimension, value, month))
+        return dict(sorted(cell["scores"].items())) if cell else {}
+
+    @staticmethod
+    def _summary(dimension, value, cell):
+        def median(m):
+            q = cell[m].quantile(0.5)
+            return None if q is None else round(q, 2)
+
+        return {
+            dimension.title(): value,
+            "Submissions": cell["n"],
+            "Median AUM (M)": median("aum"),
+            "Median ROA %": median("roa"),
+            "Median 3Y NNM (M)": median("nnm_3y"),
+            "Avg score": round(cell["score_sum"] / cell["scored"], 1) if cell["scored"] else None,
+            **{v: cell["verdicts"][v] for v in VERDICTS},
+        }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _reset(self):
+        self.cells = {}
+
+    def _state(self):
+        cells = []
+        for (d, v, m), c in sorted(self.cells.items()):
+            cells.append({"d": d, "v": v, "m": m, "n": c["n"], "scored": c["scored"], "score_sum": c["score_sum"],
+                          "scores": {str(k): n for k, n in c["scores"].items()}, "verdicts": c["verdicts"],
+                          **{k: c[k].to_json() for k in METRICS}})
+        return {"cells": cells}
+
+    def _load_state(self, data):
+        for c in data["cells"]:
+            self.cells[(c["d"], c["v"], c["m"])] = {
+                "n": c["n"], "scored": c["scored"], "score_sum": c["score_sum"],
+                "scores": {int(k): n for k, n in c["scores"].items()},
+                "verdicts": {**dict.fromkeys(VERDICTS, 0), **c["verdicts"]},
+                **{k: QuantileSketch.from_json(c[k]) for k in METRICS},
+            }
+
+
+def load(base=BASE):
+    path = incremental.cache_path(base, CACHE_NAME)
+    return Rollups.from_json(read_json(path), path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Build admin rollups from a BP_Entries CSV export and print one view.")
+    ap.add_argument("csv", help="CSV export of BP_Entries (header row + data rows)")
+    ap.add_argument("--dimension", choices=DIMENSIONS, default="market")
+    ap.add_argument("--month", default=ALL, help="YYYY-MM (default: all time)")
+    ap.add_argument("--limit", type=int, default=15)
+    args = ap.parse_args(argv)
+
+    cube = Rollups(incremental.cache_path(BASE, CACHE_NAME))
+    try:
+        with open(args.csv, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+    except OSError as e:
+        print(f"✗ {e}")
+        return 1
+    t0 = time.perf_counter()
+    cube.add_rows(rows)
+    cube.cursors[bp_sheet.WORKSHEET] = [len(rows), bp_sheet.row_key(rows[-1]) if rows else None]
+    cube.save()
+    t1 = time.perf_counter()
+    table = cube.table(args.dimension, args.month, args.limit)
+    t2 = time.perf_counter()
+    print(f"  ✓ {len(rows)} rows -> {len(cube.cells)} cells in {(t1 - t0) * 1000:.0f} ms; "
+          f"view in {(t2 - t1) * 1000:.2f} ms\n")
+    for r in table:
+        print("  " + "  ".join(f"{k}={v}" for k, v in r.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""
+BP_Entries split into fixed-size, time-partitioned worksheets.
+
+Saves no longer go to one ever-growing tab. Each row is routed by its
+Timestamp to the shard of its partition (a quarter by default, or a month):
+
+    BP_Entries 2026-Q4          rows 2..SHARD_ROWS+1, created on first use
+    BP_Entries 2026-Q4 #2       opened when the first one is full
+
+The BP_Catalog tab lists every shard:
+
+    Tab | Partition | Part | Status | Rows | Created
+
+    open       still written to
+    full       reached SHARD_ROWS; later saves in its partition go to the next part
+    closed     its partition is over (a later partition was written to)
+    legacy     the original BP_Entries tab
+    splitting  legacy tab whose first Rows rows `split` is copying into shards
+    migrated   legacy tab whose first Rows rows `split` copied into shards
+
+The legacy tab is never finished: the simulator's save goes through the
+shards, but the site's /api/save-bp route still appends to BP_Entries. Readers
+follow it like an open shard, skipping the first Rows rows once it is migrated
+(those are read from the shards).
+
+Rows is filled in once a shard stops changing, so a reader that has already
+folded in that many rows of it skips the tab without a request
+(bp_sheet.SheetAggregate.sync); only open shards and the legacy tab are read on
+each sync. readable(partitions) gives the tabs covering just the partitions
+asked for.
+
+`split` records where it stops (the legacy row count, in Rows) before copying
+and skips rows whose (Timestamp, email) key a shard already holds, so a run that
+failed half way is resumed by running it again.
+
+Run from repo root:
+    python3 -m ep_tools.bp_shards list
+    python3 -m ep_tools.bp_shards split [--apply]     copy legacy BP_Entries rows into shards
+"""
+
+import argparse
+import os
+import sys
+import threading
+from datetime import datetime
+
+from ep_tools import bp_sheet, sheets_quota
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+SCHEME = "quarter"  # or "month"
+SHARD_ROWS = 5000
+CATALOG = "BP_Catalog"
+CATALOG_HEADER = ["Tab", "Partition", "Part", "Status", "Rows", "Created"]
+LEGACY = bp_sheet.WORKSHEET
+LEGACY_PARTITION = "0000"  # sorts before every real partition
+OPEN, FULL, CLOSED, LEGACY_STATUS, MIGRATED = "open", "full", "closed", "legacy", "migrated"
+SPLITTING = "splitting"
+
+
+class ShardError(ValueError):
+    pass
+
+
+def partition_of(stamp, scheme=SCHEME):
+    """'2026-Q4' / '2026-10' for a 'YYYY-MM-DD ...' Timestamp (now, if it does not parse)."""
+    try:
+        when = datetime.strptime(str(stamp)[:7], "%Y-%m")
+    except ValueError:
+        when = datetime.now()
+    if scheme == "month":
+        return f"{when:%Y-%m}"
+    return f"{when.year}-Q{(when.month - 1) // 3 + 1}"
+
+
+def shard_title(partition, part=1):
+    return f"{LEGACY} {partition}" + (f" #{part}" if part > 1 else "")
+
+
+class Shards:
+    """The BP_Entries shards of one spreadsheet: catalog, write routing and read planning."""
+
+    def __init__(self, sh, header, scheme=SCHEME, shard_rows=SHARD_ROWS):
+        self.sh = sh
+        self.header = list(header)
+        self.scheme = scheme
+        self.shard_rows = shard_rows
+        self.entries = []   # catalog rows as dicts, in catalog order
+        self._tabs = {}     # title -> Worksheet
+        self._checked = set()  # shards whose header row was verified by this object
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Catalog
+    # ------------------------------------------------------------------
+
+    def refresh(self):
+        """Re-read the worksheet list and the catalog (creating the catalog on first use)."""
+        self._tabs = {ws.title: ws for ws in self.sh.worksheets()}
+        catalog = self._tabs.get(CATALOG)
+        if catalog is None:
+            try:
+                catalog = self.sh.add_worksheet(title=CATALOG, rows=200, cols=len(CATALOG_HEADER))
+            except Exception:
+                self._tabs = {ws.title: ws for ws in self.sh.worksheets()}  # another process created it first
+                if CATALOG not in self._tabs:
+                    raise
+                catalog = self._tabs[CATALOG]
+            else:
+                rows = [CATALOG_HEADER]
+                legacy = self._tabs.get(LEGACY)
+                if legacy is not None:
+                    rows.append([LEGACY, LEGACY_PARTITION, 1, LEGACY_STATUS, "", _now()])
+                catalog.update(values=rows, range_name="A1", value_input_option="RAW")
+                self._tabs[CATALOG] = catalog
+        values = catalog.get_all_values()
+        self.entries = []
+        for cells in values[1:]:
+            e = dict(zip(CATALOG_HEADER, list(cells) + [""] * len(CATALOG_HEADER)))
+            if not e["Tab"]:
+                continue
+            e["Part"] = int(bp_sheet.num(e["Part"]) or 1)
+            e["Rows"] = None if e["Rows"] == "" else int(bp_sheet.num(e["Rows"]) or 0)
+            self.entries.append(e)
+        return self
+
+    def _entry(self, title):
+        return next((e for e in self.entries if e["Tab"] == title), None)
+
+    def _set_status(self, title, status, rows=None):
+        catalog = self._tabs[CATALOG]
+        n = catalog.col_values(1).index(title) + 1  # other processes may have added rows since refresh()
+        catalog.update(values=[[status, "" if rows is None else rows]], range_name=f"D{n}", value_input_option="RAW")
+        self._entry(title).update(Status=status, Rows=rows)
+
+    def set_rows(self, title, rows):
+        """Record a new row count for a tab that no longer grows (after compaction)."""
+        e = self._entry(title)
+        if e is not None and e["Status"] != OPEN:
+            self._set_status(title, e["Status"], rows)
+
+    @staticmethod
+    def _count(ws):
+        return max(len(ws.col_values(1)) - 1, 0)
+
+    def worksheet(self, title):
+        ws = self._tabs.get(title)
+        if ws is None:  # catalogued by another process after our worksheet list was read
+            self._tabs = {ws.title: ws for ws in self.sh.worksheets()}
+            ws = self._tabs.get(title)
+        if ws is None:
+            raise ShardError(f"no worksheet {title!r} in the catalog")
+        return ws
+
+    def readable(self, partitions=None):
+        """[(title, worksheet, rows or None, head)] to read, oldest first.
+
+        rows is set for tabs that stopped growing; head is the number of data
+        rows at the top to skip (the rows of a migrated legacy tab that are in
+        the shards now). `partitions`: only the tabs of these partitions (the
+        legacy tab has none and is left out).
+        """
+        out = []
+        for e in sorted(self.entries, key=lambda e: (e["Partition"], e["Part"])):
+            if e["Tab"] not in self._tabs:
+                continue
+            if partitions is not None and e["Partition"] not in partitions:
+                continue
+            if e["Partition"] == LEGACY_PARTITION:
+                head = (e["Rows"] or 0) if e["Status"] == MIGRATED else 0
+                out.append((e["Tab"], self._tabs[e["Tab"]], None, head))
+                continue
+            rows = None if e["Status"] == OPEN else e["Rows"]
+            out.append((e["Tab"], self._tabs[e["Tab"]], rows, 0))
+        return out
+
+    def keys(self, partitions):
+        """(Timestamp, email) keys of the rows already in the shards of these partitions."""
+        keys = set()
+        for _, ws, _, _ in self.readable(partitions):
+            rows, _ = bp_sheet.read_rows(ws, 0)
+            keys.update(bp_sheet.row_key(r) for r in rows)
+        return keys
+
+    # ------------------------------------------------------------------
+    # Write routing
+    # ------------------------------------------------------------------
+
+    def _create(self, partition, part):
+        title = shard_title(partition, part)
+        try:
+            ws = self.sh.add_worksheet(title=title, rows=self.shard_rows + 1, cols=len(self.header))
+        except Exception:
+            self.refresh()  # another process created it first (and may not have catalogued it yet)
+            if title not in self._tabs:
+                raise
+            if not self._entry(title):
+                self.entries.append({"Tab": title, "Partition": partition, "Part": part, "Status": OPEN,
+                                     "Rows": None, "Created": _now()})
+            return title
+        ws.update(values=[self.header], range_name="A1", value_input_option="RAW")
+        self._tabs[CATALOG].append_row([title, partition, part, OPEN, "", _now()], value_input_option="RAW")
+        self._tabs[title] = ws
+        self._checked.add(title)
+        self.entries.append({"Tab": title, "Partition": partition, "Part": part, "Status": OPEN,
+                             "Rows": None, "Created": _now()})
+        return title
+
+    def writer(self, stamp):
+        """Title of the shard a row saved at `stamp` goes to; opens / closes shards as needed."""
+        partition = partition_of(stamp, self.scheme)
+        with self._lock:
+            for e in list(self.entries):
+                if e["Status"] == OPEN and e["Partition"] < partition and e["Partition"] != LEGACY_PARTITION:
+                    self._set_status(e["Tab"], CLOSED, self._count(self.worksheet(e["Tab"])))
+            mine = [e for e in self.entries if e["Partition"] == partition]
+            live = [e for e in mine if e["Status"] == OPEN]
+            if live:
+                return max(live, key=lambda e: e["Part"])["Tab"]
+            return self._create(partition, max((e["Part"] for e in mine), default=0) + 1)
+
+    def _ready(self, title):
+        if title not in self._checked:
+            with sheets_quota.patience(sheets_quota.WRITE_PATIENCE):  # reads on the save path
+                ws = self.worksheet(title)
+                header = ws.row_values(1)
+            if header != self.header:
+                ws.update(values=[self.header], range_name="A1", value_input_option="RAW")
+            self._checked.add(title)
+        return self._tabs[title]
+
+    def append(self, row):
+        """Append a header-keyed row to its shard; returns (title, sheet row number or None)."""
+        title = self.writer(row.get("Timestamp", ""))
+        ws = self._ready(title)
+        resp = ws.append_row([row.get(h, "") for h in self.header], value_input_option="USER_ENTERED")
+        n = bp_sheet.appended_row(resp)
+        if n is not None and n - 1 >= self.shard_rows:
+            with self._lock:
+                self._set_status(title, FULL, n - 1)
+        return title, n
+
+    def append_many(self, rows):
+        """Bulk append (split): consecutive rows of a partition go in one request per shard."""
+        written = 0
+        while written < len(rows):
+            partition = partition_of(rows[written].get("Timestamp", ""), self.scheme)
+            title = self.writer(rows[written].get("Timestamp", ""))
+            ws = self._ready(title)
+            room = self.shard_rows - self._count(ws)
+            batch = []
+            while (written + len(batch) < len(rows) and len(batch) < room
+                   and partition_of(rows[written + len(batch)].get("Timestamp", ""), self.scheme) == partition):
+                batch.append(rows[written + len(batch)])
+            if batch:
+                ws.append_rows([[r.get(h, "") for h in self.header] for r in batch],
+                               value_input_option="USER_ENTERED")
+            if len(batch) >= room:
+                with self._lock:
+                    self._set_status(title, FULL, self.shard_rows)
+            written += len(batch)
+        return written
+
+    def update(self, where, row):
+        """Overwrite sheet row `where` = (title, row number) with a header-keyed row."""
+        title, n = where
+        self._ready(title).update(values=[[row.get(h, "") for h in self.header]],
+                                  range_name=f"A{n}", value_input_option="USER_ENTERED")
+
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def open_shards(base=BASE, header=None):
+    sh = bp_sheet.open_spreadsheet(base)
+    if header is None:
+        legacy = next((ws for ws in sh.worksheets() if ws.title == LEGACY), None)
+        header = legacy.row_values(1) if legacy is not None else []
+    return Shards(sh, header).refresh()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Inspect or migrate the time-partitioned BP_Entries shards.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("list", help="print the catalog")
+    s = sub.add_parser("split", help="copy the legacy BP_Entries rows into partition shards")
+    s.add_argument("--apply", action="store_true", help="write the shards (default: dry run)")
+    args = ap.parse_args(argv)
+
+    try:
+        shards = open_shards()
+    except Exception as e:
+        print(f"✗ could not open the spreadsheet: {e}")
+        return 1
+
+    if args.cmd == "list":
+        for e in shards.entries:
+            rows = "?" if e["Rows"] is None else e["Rows"]
+            print(f"  {e['Tab']:28} {e['Partition']:8} {e['Status']:9} rows={rows}")
+        return 0
+
+    legacy = shards._entry(LEGACY)
+    if legacy is None or legacy["Status"] not in (LEGACY_STATUS, SPLITTING):
+        print(f"  = no {LEGACY} tab left to split")
+        return 0
+    if not shards.header:
+        print(f"✗ {LEGACY} has no header row")
+        return 1
+    rows, total = bp_sheet.read_rows(shards.worksheet(LEGACY), 0)
+    if legacy["Status"] == SPLITTING:  # resume: the rows after the recorded count came in since
+        total = legacy["Rows"] or 0
+        rows = rows[:total]
+        print(f"  resuming the split of the first {total} rows")
+    by_partition = {}
+    for r in rows:
+        p = partition_of(r.get("Timestamp", ""), shards.scheme)
+        by_partition[p] = by_partition.get(p, 0) + 1
+    done = shards.keys(set(by_partition))
+    todo = [r for r in rows if bp_sheet.row_key(r) not in done]
+    for p, n in sorted(by_partition.items()):
+        print(f"  {p:8} {n:6} rows")
+    if len(todo) < len(rows):
+        print(f"  = {len(rows) - len(todo)} of them already in the shards")
+    if not args.apply:
+        print("  = dry run; pass --apply to write the shards")
+        return 0
+    if legacy["Status"] == LEGACY_STATUS:
+        shards._set_status(LEGACY, SPLITTING, total)  # before copying, so a failed run resumes at this count
+    todo.sort(key=lambda r: partition_of(r.get("Timestamp", ""), shards.scheme))  # stable: sheet order within
+    written = shards.append_many(todo)
+    shards._set_status(LEGACY, MIGRATED, total)
+    print(f"  ✓ {written} rows copied into {len(by_partition)} partitions; {LEGACY} marked {MIGRATED} "
+          f"at {total} rows (left in place; rows added later are read from it)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,314 @@
+"""
+BP_Entries rows (the simulator's Google Sheet) as typed records, read incrementally.
+
+streamlit_app.py appends one row per download, in HEADER_ORDER. Consumers that
+keep derived state (peer benchmarks, ...) remember how many data rows they have
+folded in and ask only for the rows after that:
+
+    rows, seen = read_rows(ws, seen)        # one ranged values.get, new rows only
+
+parse_row() turns a row (a dict keyed by header, as the app builds it or as
+read back from the sheet) into the fields the tools use:
+
+    key       (Timestamp, email): identifies a save across processes
+    month     "YYYY-MM" of the Timestamp
+    market, role, location, employer, email, name
+    aum       Current AUM (M CHF)
+    roa       average ROA % over the years with NNM (the sheet stores revenue
+              and NNM, not ROA: revenue / (NNM * 1e6) * 100)
+    nnm_3y    NNM Year 1..3 summed (M CHF)
+    clients, score, verdict
+
+SheetAggregate is the base of the derived views (peer benchmarks, admin
+rollups, the duplicate index): it tracks the rows folded in, syncs new ones at
+most every SYNC_SECONDS, folds a row saved by this process in at once
+(remembering its key so the next sync skips it) and persists itself as JSON
+under .cache/. Streamlit sessions share one instance, so a sync runs under a
+per-instance lock from the SYNC_SECONDS check to the cursor update: a second
+caller returns at once instead of reading the same rows again, and
+record_save() waits for a running sync and skips a row it already folded in.
+It reads a plain worksheet or the time-partitioned shards (ep_tools.bp_shards),
+keeping a cursor per tab. Each sync re-reads the last
+row it folded in from a tab; if it holds another candidate's save now, the tab
+was rewritten under it (ep_tools.bp_dedupe compact) and the aggregate rebuilds
+from scratch; it does the same when a tab's skipped head changes (bp_shards
+split moved the legacy tab's rows into shards). A replace (a newer save by the
+same email written over the row, which changes its Timestamp) is not a
+rewrite: the cursor is compared on the email, which a replace keeps. The
+process that replaces a row swaps the old version for the new one in its
+aggregates (record_replace / _replace).
+Subclasses implement _add(record), _replace(old, record), _reset() and the
+_state() / _load_state() pair; records carry their (tab, sheet row) in "where"
+when it is known.
+"""
+
+import os
+import re
+import threading
+import time
+
+from ep_tools.files import write_json_atomic
+
+SHEET_ID = "1A__yEhD_0LYQwBF45wTSbWqdkRe0HAdnnBSj70qgpic"
+WORKSHEET = "BP_Entries"
+SYNC_SECONDS = 300
+
+_NUM_RE = re.compile(r"[^0-9.\-]")
+
+
+def num(value):
+    """Float of a sheet cell ("1,250.5", "CHF 300", 12, ""), or None."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(_NUM_RE.sub("", str(value)) or "x")
+    except ValueError:
+        return None
+
+
+def row_key(row):
+    return (str(row.get("Timestamp", "")).strip(),
+            str(row.get("Candidate Email", "")).strip().lower())
+
+
+def parse_row(row):
+    nnm = [num(row.get(f"NNM Year {y} (M CHF)")) or 0.0 for y in (1, 2, 3)]
+    rev = [num(row.get(f"Revenue Year {y} (CHF)")) or 0.0 for y in (1, 2, 3)]
+    roas = [r / (n * 1_000_000) * 100 for n, r in zip(nnm, rev) if n > 0]
+    stamp = str(row.get("Timestamp", "")).strip()
+    return {
+        "key": row_key(row),
+        "month": stamp[:7] if re.match(r"\d{4}-\d{2}", stamp) else "",
+        "email": row_key(row)[1],
+        "name": str(row.get("Candidate Name", "")).strip(),
+        "market": str(row.get("Current Market", "")).strip(),
+        "role": str(row.get("Current Role", "")).strip(),
+        "location": str(row.get("Candidate Location", "")).strip(),
+        "employer": str(row.get("Current Employer", "")).strip(),
+        "aum": num(row.get("Current AUM (M CHF)")),
+        "roa": sum(roas) / len(roas) if roas else None,
+        "nnm_3y": sum(nnm) if any(nnm) else None,
+        "clients": num(row.get("Current Number of Clients")),
+        "score": num(row.get("Score")),
+        "verdict": str(row.get("AI Evaluation Notes", "")).strip(),
+    }
+
+
+def read_rows(ws, start=0):
+    """Data rows after the first `start` ones, as header-keyed dicts; returns (rows, new start).
+
+    Reads the header and the new rows only (row 1, then A{start + 2}:ZZ).
+    """
+    header = ws.row_values(1)
+    if not header:
+        return [], start
+    values = ws.get(f"A{start + 2}:ZZ") or []
+    rows = []
+    for cells in values:
+        cells = list(cells) + [""] * (len(header) - len(cells))
+        rows.append(dict(zip(header, cells)))
+    return rows, start + len(values)
+
+
+def appended_row(response):
+    """Sheet row number of a single-row append_row() response, or None."""
+    rng = ((response or {}).get("updates") or {}).get("updatedRange", "")
+    m = re.search(r"![A-Z]+(\d+)", rng)
+    return int(m.group(1)) if m else None
+
+
+def open_spreadsheet(base):
+    """The simulator's spreadsheet, for the CLIs.
+
+    Opened with the service account in <repo>/service_account.json. Its API
+    calls draw on the shared quota (ep_tools.sheets_quota); with
+    EP_SHEETS_BACKEND=fake it is the in-process stand-in (ep_tools.fake_sheets).
+    """
+    from ep_tools import fake_sheets, sheets_quota
+
+    if fake_sheets.enabled():
+        gc = fake_sheets.client()
+    else:
+        import gspread
+
+        gc = gspread.service_account(filename=os.path.join(base, "service_account.json"))
+    quota = sheets_quota.default(base)
+    return sheets_quota.limited(quota.call(sheets_quota.READ, gc.open_by_key, SHEET_ID), quota)
+
+
+class SheetAggregate:
+    FORMAT = 3
+    # True when _add() of a row already folded in is harmless: sync then re-adds saved rows
+    IDEMPOTENT = False
+
+    def __init__(self, path=None):
+        self.path = path
+        self.cursors = {}     # tab title -> [data rows folded in, key of the last of them]
+        self.heads = {}       # tab title -> data rows skipped at its top (a migrated legacy tab)
+        self.pending = set()  # keys of rows saved here but not yet seen by sync
+        self.synced_at = 0.0
+        self._lock = threading.Lock()  # Streamlit sessions share one instance
+        self._sync_lock = threading.Lock()  # one sync (check, read, fold, advance) at a time
+
+    _parse = staticmethod(parse_row)
+
+    @property
+    def rows_seen(self):
+        return sum(c[0] - self.heads.get(t, 0) for t, c in self.cursors.items())
+
+    def _add(self, rec):
+        raise NotImplementedError
+
+    def _reset(self):
+        raise NotImplementedError
+
+    def _replace(self, old, rec):
+        """Swap `old`, a record folded in earlier, for `rec`, which overwrote it at rec["where"]."""
+        raise NotImplementedError
+
+    def _reset_all(self):
+        with self._lock:
+            self.cursors, self.heads, self.pending = {}, {}, set()
+            self._reset()
+
+    def add_rows(self, rows, tab=None, first_row=None):
+        """Fold in sheet rows (header-keyed dicts), skipping rows already recorded by record_save.
+
+        `tab` / `first_row`: where rows[0] is in the sheet, when the rows come from it.
+        """
+        added = 0
+        with self._lock:
+            for i, row in enumerate(rows):
+                rec = self._parse(row)
+                rec["where"] = None if first_row is None else (tab, first_row + i)
+                if rec["key"] in self.pending:
+                    self.pending.discard(rec["key"])
+                    continue
+                self._add(rec)
+                added += 1
+        return added
+
+    def record_save(self, row, where=None):
+        """This process appended `row`, at `where` = (tab, sheet row) when known."""
+        with self._sync_lock, self._lock:
+            rec = self._parse(row)
+            rec["where"] = tuple(where) if where and where[1] is not None else None
+            cursor = self.cursors.get(rec["where"][0]) if rec["where"] else None
+            if cursor and rec["where"][1] - 1 <= cursor[0] and not self.IDEMPOTENT:
+                return  # a sync between the append and now already folded it in
+            self._add(rec)
+            if not self.IDEMPOTENT:
+                self.pending.add(rec["key"])
+        self.save()
+
+    def record_replace(self, where, old_row, row):
+        """This process overwrote `where` = (tab, sheet row), holding `old_row`, with `row`."""
+        tab, row_number = where
+        with self._sync_lock, self._lock:
+            old, rec = self._parse(old_row), self._parse(row)
+            old["where"] = rec["where"] = (tab, row_number)
+            cursor = self.cursors.get(tab)
+            folded = old["key"] in self.pending or (cursor and row_number - 1 <= cursor[0])
+            if old["key"] in self.pending:  # the sync will read the new version: skip that instead
+                self.pending.discard(old["key"])
+                self.pending.add(rec["key"])
+            if cursor and row_number == cursor[0] + 1 and cursor[1] == old["key"]:
+                cursor[1] = rec["key"]
+            if folded or self.IDEMPOTENT:  # otherwise the next sync reads the new version
+                self._replace(old, rec)
+        self.save()
+
+    def sync(self, source, force=False):
+        """Read rows appended since the last sync; returns how many were added.
+
+        `source` is a worksheet or a bp_shards.Shards; tabs that stopped growing
+        and are fully folded in are skipped.
+        """
+        if source is None or not self._sync_lock.acquire(blocking=False):
+            return 0  # another session is syncing this instance right now
+        try:
+            if not force and time.time() - self.synced_at < SYNC_SECONDS:
+                return 0
+            return self._sync(source)
+        finally:
+            self._sync_lock.release()
+
+    def _sync(self, source):
+        if hasattr(source, "readable"):
+            tabs = source.readable()
+        else:
+            tabs = [(source.title, source, None, 0)]
+        titles = {title for title, _, _, _ in tabs}
+        heads = {title: head for title, _, _, head in tabs if head}
+        rebuilt = any(t not in titles or self.heads.get(t, 0) != heads.get(t, 0)
+                      for t in self.cursors)
+        if rebuilt:  # a tab left the catalog, or its first rows moved into shards (split)
+            self._reset_all()
+        with self._lock:
+            self.heads = heads
+        added, read = 0, 0
+        for title, ws, final_rows, head in tabs:
+            cursor = self.cursors.get(title)
+            if cursor and final_rows is not None and cursor[0] == final_rows:
+                continue
+            result = self._sync_tab(title, ws, head)
+            if result is None:  # the tab was rewritten (compaction) or rows removed: start over
+                self._reset_all()
+                self._sync(source)
+                return self.rows_seen
+            added, read = added + result[0], read + result[1]
+        with self._lock:
+            self.synced_at = time.time()
+        if read or rebuilt:
+            self.save()
+        return added
+
+    def _sync_tab(self, title, ws, head=0):
+        """(added, read) for one tab, or None if the row it last folded in is another save now.
+
+        The first `head` data rows are skipped on the first read.
+        """
+        seen, last_key = self.cursors.get(title, (head, None))
+        start = max(seen - 1, 0) if last_key else seen
+        rows, total = read_rows(ws, start)
+        if last_key:
+            key = row_key(rows[0]) if rows else None
+            if key != last_key and not (key and last_key[1] and key[1] == last_key[1]):
+                return None
+            if key != last_key and self.IDEMPOTENT:  # replaced in place by another process
+                self.add_rows(rows[:1], tab=title, first_row=start + 2)
+            rows, start = rows[1:], start + 1
+        added = self.add_rows(rows, tab=title, first_row=start + 2)
+        with self._lock:
+            self.cursors[title] = [total, row_key(rows[-1]) if rows else last_key]
+        return added, len(rows)
+
+    def _state(self):
+        raise NotImplementedError
+
+    def _load_state(self, data):
+        raise NotImplementedError
+
+    def to_json(self):
+        with self._lock:
+            return {"format": self.FORMAT,
+                    "cursors": {t: [n, list(k) if k else None]
+                                for t, (n, k) in self.cursors.items()},
+                    "heads": self.heads,
+                    "pending": sorted(list(k) for k in self.pending), **self._state()}
+
+    def save(self):
+        if self.path:
+            write_json_atomic(self.path, self.to_json())
+
+    @classmethod
+    def from_json(cls, data, path=None):
+        agg = cls(path)
+        if data and data.get("format") == cls.FORMAT:
+            agg.cursors = {t: [n, tuple(k) if k else None] for t, (n, k) in data["cursors"].items()}
+            agg.pending = {tuple(k) for k in data.get("pending", [])}
+            agg.heads = data.get("heads", {})
+            agg._load_state(data)
+        return agg
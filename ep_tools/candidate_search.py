@@ -0,0 +1,270 @@
+"""
+Search the talent bench (data/candidates.json): BM25 over profile text with
+region / seniority / function filters.
+
+The index is persisted under .cache/candidates/ and rebuilt automatically when
+data/candidates.json changes (mtime/size, then sha256):
+
+    meta.json                  ids, vocabulary -> (offset, df), facet vocabularies,
+                               source fingerprint, array file names
+    postings-<sha>.npy         int32 doc ids per term, concatenated in vocabulary order
+    impact-<sha>.npy           float32 BM25 contribution of each posting, precomputed
+    facets-<sha>.npy           int32 doc ids per facet token (region / seniority / function)
+
+The arrays are opened with np.load(mmap_mode="r"): loading maps the files
+instead of reading them, and a query touches only the postings of its own
+terms. BM25 depends only on the term and the document, so each posting stores
+its finished score and a query is one scatter-add per term. Array files are named after a hash of their contents and meta.json is
+replaced last, so a reader never sees a half-written index.
+
+Profile text is title + summary + highlights, tokenized like the insights
+search (ep_tools.insights_ingest). Filters match facet tokens: --region
+switzerland matches "Italy / Switzerland"; every token of a filter value must
+be present.
+
+Library:
+    from ep_tools.candidate_search import load
+    index = load()
+    index.search("family office gcc", region="switzerland", k=5)  -> [(id, score), ...]
+
+Run from repo root:
+    python3 -m ep_tools.candidate_search "family office" [--region X] [--seniority X]
+        [--function X] [-k 10] [--source data/candidates.json] [--rebuild]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+from ep_tools import incremental
+from ep_tools.files import read_json, sha256_file, write_json_atomic
+from ep_tools.insights_ingest import fold, tokenize
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+SOURCE = "data/candidates.json"
+INDEX_DIR = "candidates"  # under .cache/
+FACETS = ("region", "seniority", "function")
+TEXT_FIELDS = ("title", "summary", "highlights")
+FORMAT = 1
+
+K1 = 1.2
+B = 0.75
+
+_FACET_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class CandidateIndexError(ValueError):
+    pass
+
+
+def _text(candidate):
+    parts = []
+    for field in TEXT_FIELDS:
+        value = candidate.get(field) or ""
+        parts += value if isinstance(value, list) else [value]
+    return " ".join(parts)
+
+
+def _facet_tokens(value):
+    """Facet values are short labels ("RM / Originator"): no stopword removal."""
+    return _FACET_TOKEN_RE.findall(fold(value or ""))
+
+
+# --------------------------------------------------------------------------
+# Build
+# --------------------------------------------------------------------------
+
+def _fingerprint(path):
+    st = os.stat(path)
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": sha256_file(path)}
+
+
+def build(candidates, index_dir, fingerprint=None):
+    """Write the index for `candidates` (list of profile dicts) into index_dir."""
+    ids, lengths, postings, facets = [], [], {}, {f: {} for f in FACETS}
+    for doc, c in enumerate(candidates):
+        if not c.get("id"):
+            raise CandidateIndexError(f"candidate #{doc} has no id")
+        ids.append(c["id"])
+        tokens = tokenize(_text(c))
+        lengths.append(len(tokens))
+        counts = {}
+        for t in tokens:
+            counts[t] = counts.get(t, 0) + 1
+        for t, tf in counts.items():
+            postings.setdefault(t, []).append((doc, tf))
+        for field in FACETS:
+            for t in set(_facet_tokens(c.get(field))):
+                facets[field].setdefault(t, []).append(doc)
+
+    n = len(ids)
+    avgdl = (sum(lengths) / n if n else 0.0) or 1.0
+    vocab, post_docs, impact = {}, [], []
+    for term in sorted(postings):
+        df = len(postings[term])
+        vocab[term] = [len(post_docs), df]
+        idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        for doc, tf in postings[term]:
+            post_docs.append(doc)
+            impact.append(idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * lengths[doc] / avgdl)))
+    facet_vocab, facet_docs = {}, []
+    for field in FACETS:
+        facet_vocab[field] = {}
+        for token in sorted(facets[field]):
+            facet_vocab[field][token] = [len(facet_docs), len(facets[field][token])]
+            facet_docs += facets[field][token]
+
+    arrays = {
+        "postings": np.array(post_docs, dtype=np.int32),
+        "impact": np.array(impact, dtype=np.float32),
+        "facets": np.array(facet_docs, dtype=np.int32),
+    }
+    h = hashlib.sha256()
+    for name in sorted(arrays):
+        h.update(arrays[name].tobytes())
+    tag = h.hexdigest()[:12]
+    os.makedirs(index_dir, exist_ok=True)
+    files = {}
+    for name, arr in arrays.items():
+        files[name] = f"{name}-{tag}.npy"
+        np.save(os.path.join(index_dir, files[name]), arr)  # new names: never overwrites a live file
+    meta = {
+        "format": FORMAT,
+        "source": fingerprint,
+        "files": files,
+        "ids": ids,
+        "vocab": vocab,
+        "facets": facet_vocab,
+    }
+    write_json_atomic(os.path.join(index_dir, "meta.json"), meta)
+    for name in os.listdir(index_dir):  # arrays of previous builds
+        if name.endswith(".npy") and name not in files.values():
+            os.remove(os.path.join(index_dir, name))
+    return CandidateIndex(index_dir, meta)
+
+
+# --------------------------------------------------------------------------
+# Query
+# --------------------------------------------------------------------------
+
+class CandidateIndex:
+    def __init__(self, index_dir, meta=None):
+        meta = meta or read_json(os.path.join(index_dir, "meta.json"))
+        if not meta or meta.get("format") != FORMAT:
+            raise CandidateIndexError(f"no usable candidate index in {index_dir}")
+        self.meta = meta
+        self.ids = meta["ids"]
+        self.vocab = meta["vocab"]
+        self.facet_vocab = meta["facets"]
+        arrays = {name: np.load(os.path.join(index_dir, f), mmap_mode="r") for name, f in meta["files"].items()}
+        self.postings, self.impact, self.facet_docs = arrays["postings"], arrays["impact"], arrays["facets"]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _facet(self, field, value):
+        """Sorted doc ids whose `field` has every token of `value`."""
+        docs = None
+        for token in _facet_tokens(value):
+            entry = self.facet_vocab[field].get(token)
+            if entry is None:
+                return np.empty(0, dtype=np.int32)
+            off, n = entry
+            hits = self.facet_docs[off:off + n]
+            docs = hits if docs is None else np.intersect1d(docs, hits, assume_unique=True)
+        return docs
+
+    def search(self, query="", k=10, **filters):
+        """[(id, score), ...] best first. Filters: region=, seniority=, function=."""
+        unknown = set(filters) - set(FACETS)
+        if unknown:
+            raise CandidateIndexError(f"unknown filter(s): {', '.join(sorted(unknown))}")
+        allowed = None
+        for field, value in filters.items():
+            if value:
+                docs = self._facet(field, value)
+                allowed = docs if allowed is None else np.intersect1d(allowed, docs, assume_unique=True)
+        terms = [t for t in dict.fromkeys(tokenize(query)) if t in self.vocab]
+        if not terms:
+            if not query.strip():  # filter-only: bench order
+                docs = range(min(k, len(self.ids))) if allowed is None else allowed[:k].tolist()
+                return [(self.ids[d], 0.0) for d in docs]
+            return []
+
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        for term in terms:
+            off, df = self.vocab[term]
+            scores[self.postings[off:off + df]] += self.impact[off:off + df]
+        if allowed is not None:
+            masked = np.zeros_like(scores)
+            masked[allowed] = scores[allowed]
+            scores = masked
+        hits = np.flatnonzero(scores)
+        if len(hits) > k:
+            hits = hits[np.argpartition(-scores[hits], k)[:k]]
+        hits = hits[np.lexsort((hits, -scores[hits]))]
+        return [(self.ids[d], round(float(scores[d]), 4)) for d in hits]
+
+
+def load(base=BASE, source=SOURCE, index_dir=None, rebuild=False):
+    """Open the persisted index, rebuilding it first if `source` changed."""
+    src = os.path.join(base, source)
+    index_dir = index_dir or incremental.cache_path(base, INDEX_DIR)
+    meta = read_json(os.path.join(index_dir, "meta.json"))
+    st = os.stat(src)
+    known = (meta or {}).get("source") or {}
+    fresh = meta and meta.get("format") == FORMAT and not rebuild and (
+        (known.get("mtime_ns"), known.get("size")) == (st.st_mtime_ns, st.st_size)
+        or (known.get("size") == st.st_size and known.get("sha256") == sha256_file(src)))
+    if fresh:
+        return CandidateIndex(index_dir, meta)
+    with open(src, encoding="utf-8") as f:
+        candidates = json.load(f)
+    return build(candidates, index_dir, _fingerprint(src))
+
+
+def load_candidates(base=BASE, source=SOURCE):
+    with open(os.path.join(base, source), encoding="utf-8") as f:
+        return {c["id"]: c for c in json.load(f)}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Search the talent bench (BM25 + field filters).")
+    ap.add_argument("query", nargs="?", default="")
+    for field in FACETS:
+        ap.add_argument(f"--{field}", help=f"only profiles whose {field} contains this")
+    ap.add_argument("-k", type=int, default=10)
+    ap.add_argument("--source", default=SOURCE, help="profiles JSON, relative to the repo root")
+    ap.add_argument("--rebuild", action="store_true", help="rebuild the index even if it looks fresh")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    index = load(BASE, args.source, rebuild=args.rebuild)
+    t1 = time.perf_counter()
+    try:
+        hits = index.search(args.query, args.k, **{f: getattr(args, f) for f in FACETS})
+    except CandidateIndexError as e:
+        print(f"✗ {e}")
+        return 1
+    t2 = time.perf_counter()
+
+    profiles = load_candidates(BASE, args.source)
+    for cid, score in hits:
+        c = profiles.get(cid, {})
+        print(f"  {score:7.3f}  {cid}  {c.get('title', '')}")
+        print(f"           {c.get('function', '')} · {c.get('seniority', '')} · {c.get('region', '')}")
+    print(f"\n{len(hits)} of {len(index)} profiles; load {(t1 - t0) * 1000:.1f} ms, "
+          f"query {(t2 - t1) * 1e6:.0f} µs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
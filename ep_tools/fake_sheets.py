@@ -0,0 +1,497 @@
+"""
+In-process stand-in for Google Sheets, for offline runs of the simulator and load tests.
+
+Implements the part of gspread the app and the BP tools use:
+
+    client       open_by_key(key)                 (one spreadsheet per key, shared by the process)
+    spreadsheet  worksheets(), worksheet(title), add_worksheet(title, rows, cols), del_worksheet(ws)
+    worksheet    title, id, row_count, col_count,
+                 row_values, col_values, get, get_all_values,
+                 update, append_row, append_rows, batch_clear, resize, duplicate
+
+with gspread's semantics where they matter: append_* write after the last
+non-empty row, grow the grid and answer {"updates": {"updatedRange": ...}};
+a write outside the grid fails; values come back as strings with trailing
+blanks trimmed.
+
+Every call goes through the spreadsheet's Backend, which injects
+latency (latency_ms ± jitter) and errors: a share of calls (error_rate) fails
+with a 500, and more than quota_per_minute calls per operation kind in a
+60 s window fail with a 429 like Google's per-user quota. Writes to one
+spreadsheet are serialized, as Sheets does, so concurrent savers queue;
+Backend.stats() reports calls, errors and time spent waiting for that lock.
+
+streamlit_app.py uses it when EP_SHEETS_BACKEND=fake (tuned by
+EP_FAKE_SHEETS_LATENCY_MS / _ERROR_RATE / _QUOTA); ep_tools.bp_sheet's
+open_spreadsheet() too.
+
+Run from repo root:
+    python3 -m ep_tools.fake_sheets loadtest [--sessions 8] [--saves 5] [--latency-ms 120]
+        [--error-rate 0.02] [--quota 60] [--seed-rows 2000]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+BACKEND_ENV = "EP_SHEETS_BACKEND"
+LATENCY_MS = 80.0
+JITTER = 0.5        # latency varies by ± this fraction
+QUOTA_PER_MINUTE = 60
+READS = frozenset({"row_values", "col_values", "get", "get_all_values", "worksheets", "worksheet", "open_by_key"})
+
+_A1_RE = re.compile(r"^(?:'?(?P<sheet>[^!']+)'?!)?(?P<c1>[A-Z]*)(?P<r1>\d*)(?::(?P<c2>[A-Z]*)(?P<r2>\d*))?$")
+
+
+class FakeAPIError(Exception):
+    """Shaped like gspread.exceptions.APIError: .code and "APIError: [code]: message"."""
+
+    def __init__(self, code, message):
+        super().__init__(f"APIError: [{code}]: {message}")
+        self.code = code
+
+
+try:
+    from gspread.exceptions import WorksheetNotFound
+except ImportError:  # the fake must work where gspread is not installed
+    class WorksheetNotFound(Exception):
+        pass
+
+
+def enabled():
+    return os.environ.get(BACKEND_ENV, "").strip().lower() == "fake"
+
+
+def col_number(letters):
+    n = 0
+    for ch in letters:
+        n = n * 26 + ord(ch) - 64
+    return n
+
+
+def col_letters(n):
+    s = ""
+    while n:
+        n, r = divmod(n - 1, 26)
+        s = chr(65 + r) + s
+    return s
+
+
+def parse_a1(rng):
+    """(row1, col1, row2, col2), 1-based and inclusive; None for an open end."""
+    m = _A1_RE.match(rng.strip())
+    if not m:
+        raise FakeAPIError(400, f"Unable to parse range: {rng}")
+    c1 = col_number(m["c1"]) if m["c1"] else 1
+    r1 = int(m["r1"]) if m["r1"] else 1
+    if m["c2"] is None and m["r2"] is None:
+        return r1, c1, r1, c1
+    c2 = col_number(m["c2"]) if m["c2"] else None
+    r2 = int(m["r2"]) if m["r2"] else None
+    return r1, c1, r2, c2
+
+
+def _cell(v):
+    if v is None:
+        return ""
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    return str(v)
+
+
+class Backend:
+    """Latency, errors, quota and write serialization shared by one spreadsheet's objects."""
+
+    def __init__(self, latency_ms=LATENCY_MS, error_rate=0.0, quota_per_minute=QUOTA_PER_MINUTE, seed=None):
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.quota_per_minute = quota_per_minute
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()        # state + counters
+        self._write_lock = threading.Lock()  # one write at a time per spreadsheet
+        self._recent = {"read": deque(), "write": deque()}
+        self.counters = {k: 0 for k in ("reads", "writes", "errors", "throttled")}
+        self.write_wait_s = 0.0
+
+    @classmethod
+    def from_env(cls):
+        return cls(latency_ms=float(os.environ.get("EP_FAKE_SHEETS_LATENCY_MS", LATENCY_MS)),
+                   error_rate=float(os.environ.get("EP_FAKE_SHEETS_ERROR_RATE", "0")),
+                   quota_per_minute=int(os.environ.get("EP_FAKE_SHEETS_QUOTA", QUOTA_PER_MINUTE)))
+
+    def _admit(self, op):
+        now = time.monotonic()
+        with self._lock:
+            recent = self._recent[op]
+            while recent and now - recent[0] > 60:
+                recent.popleft()
+            if self.quota_per_minute and len(recent) >= self.quota_per_minute:
+                self.counters["throttled"] += 1
+                raise FakeAPIError(429, f"Quota exceeded for quota metric '{op.title()} requests' (RESOURCE_EXHAUSTED)")
+            recent.append(now)
+            self.counters[op + "s"] += 1
+            fail = self._rng.random() < self.error_rate
+            delay = self.latency_ms / 1000 * (1 + JITTER * (2 * self._rng.random() - 1))
+            if fail:
+                self.counters["errors"] += 1
+        return delay, fail
+
+    def call(self, name, fn):
+        op = "read" if name in READS else "write"
+        delay, fail = self._admit(op)
+        if op == "write":
+            t0 = time.monotonic()
+            with self._write_lock:
+                waited = time.monotonic() - t0
+                time.sleep(delay)
+                with self._lock:
+                    self.write_wait_s += waited
+                if fail:
+                    raise FakeAPIError(500, "Internal error encountered.")
+                return fn()
+        time.sleep(delay)
+        if fail:
+            raise FakeAPIError(500, "Internal error encountered.")
+        return fn()
+
+    def stats(self):
+        with self._lock:
+            return {**self.counters, "write_wait_s": round(self.write_wait_s, 3)}
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, title, rows, cols, ws_id):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = ws_id
+        self.row_count = rows
+        self.col_count = cols
+        self._rows = []  # list of lists of str, ragged
+
+    def __repr__(self):
+        return f"<FakeWorksheet {self.title!r} id:{self.id}>"
+
+    def _call(self, name, fn):
+        return self.spreadsheet.backend.call(name, fn)
+
+    def _last_row(self):
+        n = len(self._rows)
+        while n and not any(self._rows[n - 1]):
+            n -= 1
+        return n
+
+    def _write(self, r1, c1, values):
+        rows = [list(map(_cell, v)) for v in values]
+        width = max((len(v) for v in rows), default=0)
+        if r1 + len(rows) - 1 > self.row_count or c1 + width - 1 > self.col_count:
+            raise FakeAPIError(400, f"Range exceeds grid limits. Max rows: {self.row_count}, max columns: {self.col_count}")
+        while len(self._rows) < r1 + len(rows) - 1:
+            self._rows.append([])
+        for i, vals in enumerate(rows):
+            line = self._rows[r1 - 1 + i]
+            if len(line) < c1 - 1 + len(vals):
+                line.extend([""] * (c1 - 1 + len(vals) - len(line)))
+            line[c1 - 1:c1 - 1 + len(vals)] = vals
+
+    def _range_name(self, r1, c1, r2, c2):
+        return f"'{self.title}'!{col_letters(c1)}{r1}:{col_letters(c2)}{r2}"
+
+    # ---------------------------------------------------------------- reads
+
+    def row_values(self, row, **_):
+        def fn():
+            line = list(self._rows[row - 1]) if row <= len(self._rows) else []
+            while line and line[-1] == "":
+                line.pop()
+            return line
+        return self._call("row_values", fn)
+
+    def col_values(self, col, **_):
+        def fn():
+            out = [line[col - 1] if len(line) >= col else "" for line in self._rows[:self._last_row()]]
+            while out and out[-1] == "":
+                out.pop()
+            return out
+        return self._call("col_values", fn)
+
+    def get(self, range_name=None, **_):
+        def fn():
+            r1, c1, r2, c2 = parse_a1(range_name) if range_name else (1, 1, None, None)
+            last = self._last_row() if r2 is None else min(r2, self._last_row())
+            out = []
+            for line in self._rows[r1 - 1:last]:
+                cells = line[c1 - 1:c2]
+                while cells and cells[-1] == "":
+                    cells.pop()
+                out.append(cells)
+            while out and not out[-1]:
+                out.pop()
+            return out
+        return self._call("get", fn)
+
+    def get_all_values(self, **_):
+        return self.get()
+
+    # --------------------------------------------------------------- writes
+
+    def update(self, values=None, range_name=None, **_):
+        if isinstance(values, str) and not isinstance(range_name, str):  # gspread 5 order: update("A1", [[...]])
+            values, range_name = range_name, values
+
+        def fn():
+            r1, c1, _, _ = parse_a1(range_name or "A1")
+            self._write(r1, c1, values)
+            return {"updatedRange": self._range_name(r1, c1, r1 + len(values) - 1,
+                                                     c1 + max((len(v) for v in values), default=1) - 1)}
+        return self._call("update", fn)
+
+    def append_rows(self, values, value_input_option=None, **_):
+        def fn():
+            start = self._last_row() + 1
+            end = start + len(values) - 1
+            if end > self.row_count:
+                self.row_count = end  # the API grows the grid for appends
+            width = max((len(v) for v in values), default=1)
+            if width > self.col_count:
+                self.col_count = width
+            self._write(start, 1, values)
+            return {"updates": {"updatedRange": self._range_name(start, 1, end, width),
+                                "updatedRows": len(values)}}
+        return self._call("append_rows", fn)
+
+    def append_row(self, values, value_input_option=None, **kw):
+        return self.append_rows([values], value_input_option, **kw)
+
+    def batch_clear(self, ranges):
+        def fn():
+            for rng in ranges:
+                r1, c1, r2, c2 = parse_a1(rng)
+                for line in self._rows[r1 - 1:r2]:
+                    stop = len(line) if c2 is None else min(c2, len(line))
+                    for j in range(c1 - 1, stop):
+                        line[j] = ""
+            return {"clearedRanges": list(ranges)}
+        return self._call("batch_clear", fn)
+
+    def resize(self, rows=None, cols=None):
+        def fn():
+            if rows is not None:
+                self.row_count = rows
+                del self._rows[rows:]
+            if cols is not None:
+                self.col_count = cols
+                for line in self._rows:
+                    del line[cols:]
+            return {}
+        return self._call("resize", fn)
+
+    def duplicate(self, insert_sheet_index=None, new_sheet_id=None, new_sheet_name=None):
+        def fn():
+            copy = self.spreadsheet._new(new_sheet_name or f"Copy of {self.title}", self.row_count, self.col_count)
+            copy._rows = [list(line) for line in self._rows]
+            return copy
+        return self._call("duplicate", fn)
+
+
+class FakeSpreadsheet:
+    def __init__(self, key, backend=None):
+        self.id = key
+        self.title = f"Fake {key[:8]}"
+        self.backend = backend or Backend()
+        self._tabs = []
+        self._next_id = 0
+
+    def _new(self, title, rows, cols):
+        if any(ws.title == title for ws in self._tabs):
+            raise FakeAPIError(400, f'A sheet with the name "{title}" already exists. Please enter another name.')
+        ws = FakeWorksheet(self, title, rows, cols, self._next_id)
+        self._next_id += 1
+        self._tabs.append(ws)
+        return ws
+
+    def worksheets(self):
+        return self.backend.call("worksheets", lambda: list(self._tabs))
+
+    def worksheet(self, title):
+        def fn():
+            for ws in self._tabs:
+                if ws.title == title:
+                    return ws
+            raise WorksheetNotFound(title)
+        return self.backend.call("worksheet", fn)
+
+    def add_worksheet(self, title, rows=1000, cols=26, index=None):
+        return self.backend.call("add_worksheet", lambda: self._new(title, rows, cols))
+
+    def del_worksheet(self, worksheet):
+        return self.backend.call("del_worksheet", lambda: self._tabs.remove(worksheet))
+
+
+class FakeClient:
+    """gspread.Client look-alike; spreadsheets live as long as the process."""
+
+    _sheets = {}
+    _lock = threading.Lock()
+
+    def __init__(self, backend=None):
+        self.backend = backend
+
+    def open_by_key(self, key):
+        with self._lock:
+            sh = self._sheets.get(key)
+            if sh is None:
+                sh = self._sheets[key] = FakeSpreadsheet(key, self.backend or Backend.from_env())
+        return sh.backend.call("open_by_key", lambda: sh)
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._sheets.clear()
+
+
+def client(backend=None):
+    return FakeClient(backend)
+
+
+# ---------------------------------------------------------------------------
+# Load test
+# ---------------------------------------------------------------------------
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def synthetic_row(i, when=None, email=None):
+    rnd = random.Random(i)
+    nnm = [round(rnd.uniform(5, 80), 1) for _ in range(3)]
+    return {
+        "Timestamp": (when or time.strftime("%Y-%m-%d %H:%M:%S")),
+        "Candidate Name": f"Candidate {i}",
+        "Candidate Email": email or f"candidate{i}@example.com",
+        "Current Role": rnd.choice(["Director", "Executive Director", "Managing Director", "Senior RM"]),
+        "Candidate Location": rnd.choice(["Geneva", "Zurich", "Dubai", "Lisbon"]),
+        "Current Employer": rnd.choice(["UBS", "Julius Baer", "Pictet", "Lombard Odier", "EFG"]),
+        "Current Market": rnd.choice(["CH Onshore", "MEA", "Brazil", "Portugal"]),
+        "Currency": "CHF",
+        "Base Salary": rnd.randrange(180, 400) * 1000,
+        "Current Number of Clients": rnd.randrange(20, 120),
+        "Current AUM (M CHF)": rnd.randrange(100, 1500),
+        **{f"NNM Year {y} (M CHF)": nnm[y - 1] for y in (1, 2, 3)},
+        **{f"Revenue Year {y} (CHF)": round(nnm[y - 1] * 1e6 * rnd.uniform(0.006, 0.012)) for y in (1, 2, 3)},
+        "Score": rnd.randrange(0, 10),
+        "AI Evaluation Notes": rnd.choice(["🟢 Strong", "🟡 Medium", "🔴 Weak"]),
+    }
+
+
+def loadtest(sessions=8, saves=5, latency_ms=LATENCY_MS, error_rate=0.0, quota=QUOTA_PER_MINUTE,
+             seed_rows=0, duplicate_share=0.2, header=None):
+    """Concurrent sessions saving through the app's path; returns a report dict.
+
+    The sessions share one connection (catalog read once, like the app's
+    cached sheet handle) and each saves `saves` rows through
+    bp_dedupe.save() — duplicate check, shard routing, write, index update —
+    under a fresh shared quota (ep_tools.sheets_quota) tuned to `quota`.
+    A `duplicate_share` of saves re-send the session's previous row.
+    """
+    from ep_tools import bp_dedupe, bp_shards, sheets_quota
+
+    header = header or list(synthetic_row(0))
+    backend = Backend(latency_ms=latency_ms, error_rate=error_rate, quota_per_minute=quota, seed=1)
+    sh = FakeSpreadsheet("loadtest", backend)
+    if seed_rows:
+        legacy = sh._new(bp_shards.LEGACY, seed_rows + 1, len(header))
+        legacy._write(1, 1, [header] + [[synthetic_row(-i)[h] for h in header] for i in range(1, seed_rows + 1)])
+    tmp = tempfile.mkdtemp(prefix="ep-loadtest-")
+    limiter = sheets_quota.Quota(os.path.join(tmp, "quota.json"), per_minute={"read": quota, "write": quota})
+    index = bp_dedupe.Dedupe()
+    latencies, actions, failures = [], {}, {}
+    lock = threading.Lock()
+
+    # One connection shared by every session, as streamlit_app.py's cached sheet handle is.
+    shards = bp_shards.Shards(sheets_quota.limited(sh, limiter), header).refresh()
+
+    def session(s):
+        rnd = random.Random(s)
+        last = None
+        for k in range(saves):
+            row = dict(last) if last and rnd.random() < duplicate_share else synthetic_row(s * 1000 + k)
+            t0 = time.perf_counter()
+            try:
+                action, _ = bp_dedupe.save(shards, row, index)
+            except Exception as e:
+                action = None
+                with lock:
+                    failures[type(e).__name__] = failures.get(type(e).__name__, 0) + 1
+            dt = time.perf_counter() - t0
+            with lock:
+                latencies.append(dt)
+                if action:
+                    actions[action] = actions.get(action, 0) + 1
+            last = row
+
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=session, args=(s,)) for s in range(sessions)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+    quota_metrics = limiter.metrics()
+    done = sum(actions.values())
+    return {
+        "sessions": sessions, "saves": sessions * saves, "wall_s": round(wall, 2),
+        "throughput_per_s": round(done / wall, 2) if wall else 0.0,
+        "latency_ms": {f"p{int(q * 100)}": round(_percentile(latencies, q) * 1000, 1) for q in (0.5, 0.95, 0.99)},
+        "actions": actions, "failures": failures,
+        "queue": {"quota_wait_s": round(sum(m["waited_s"] for m in quota_metrics.values()), 2),
+                  "quota_rejected": sum(m["rejected"] for m in quota_metrics.values()),
+                  "optional_skipped": sum(m["skipped"] for m in quota_metrics.values()),
+                  "retries": sum(m["retries"] for m in quota_metrics.values()),
+                  "write_lock_wait_s": backend.stats()["write_wait_s"]},
+        "backend": backend.stats(),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Offline Google Sheets stand-in: load test of the BP save path.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    lt = sub.add_parser("loadtest", help="concurrent sessions saving against the fake sheet")
+    lt.add_argument("--sessions", type=int, default=8)
+    lt.add_argument("--saves", type=int, default=5, help="saves per session")
+    lt.add_argument("--latency-ms", type=float, default=LATENCY_MS)
+    lt.add_argument("--error-rate", type=float, default=0.0)
+    lt.add_argument("--quota", type=int, default=QUOTA_PER_MINUTE, help="calls per minute per kind (fake Google + limiter)")
+    lt.add_argument("--seed-rows", type=int, default=0, help="rows pre-loaded into the legacy BP_Entries tab")
+    lt.add_argument("--duplicates", type=float, default=0.2, help="share of saves that repeat the previous one")
+    args = ap.parse_args(argv)
+
+    r = loadtest(args.sessions, args.saves, args.latency_ms, args.error_rate, args.quota,
+                 args.seed_rows, args.duplicates)
+    print(f"  {r['saves']} saves from {r['sessions']} sessions in {r['wall_s']}s "
+          f"→ {r['throughput_per_s']} saves/s")
+    lat = r["latency_ms"]
+    print(f"  latency  p50 {lat['p50']} ms · p95 {lat['p95']} ms · p99 {lat['p99']} ms")
+    print(f"  actions  {r['actions']}")
+    q = r["queue"]
+    print(f"  queueing quota wait {q['quota_wait_s']}s · rejected {q['quota_rejected']} · "
+          f"optional skipped {q['optional_skipped']} · retries {q['retries']} · "
+          f"write lock wait {q['write_lock_wait_s']}s")
+    print(f"  backend  {r['backend']}")
+    if r["failures"]:
+        print(f"  ⚠️ failures {r['failures']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
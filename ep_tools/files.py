@@ -0,0 +1,168 @@
+"""
+File helpers for the deploy / patch scripts.
+
+Every write is idempotent and atomic: content is compared by sha256 first and
+identical files are left alone (so their mtime doesn't change and incremental
+`next build` caches stay warm); real changes go to a temp file in the same
+directory that is renamed over the target.
+
+Binary assets are referenced by repo path + sha256 instead of being embedded in
+the scripts as base64. They are copied from a source directory only when the
+file in the repo doesn't already hash to the expected value.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+CHUNK = 1 << 20  # 1 MiB
+
+
+def sha256_file(path):
+    """Streamed sha256 of a file (never loads the whole file in memory)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _temp_beside(path):
+    """Temp file in the target's directory, so os.replace() stays atomic."""
+    d = os.path.dirname(path) or "."
+    os.makedirs(d, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=d)
+    os.close(fd)
+    return tmp
+
+
+def _commit_temp(tmp, dest):
+    """Give tmp the permissions dest has (mkstemp creates 0600), then rename over dest."""
+    if os.path.exists(dest):
+        mode = os.stat(dest).st_mode & 0o777
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(tmp, mode)
+    os.replace(tmp, dest)
+
+
+def _atomic_write(dest, write):
+    tmp = _temp_beside(dest)
+    try:
+        write(tmp)
+        _commit_temp(tmp, dest)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def write_text(base, rel, content):
+    """Write content to base/rel only if it differs from what is on disk.
+
+    Prints one line per file: "=" unchanged, "+" created, "✓" updated with a
+    +added/-removed line summary. Returns "unchanged", "created" or "updated".
+    """
+    path = os.path.join(base, rel)
+    data = content.encode("utf-8")
+    old = None
+    if os.path.exists(path):
+        if os.path.getsize(path) == len(data) and sha256_file(path) == hashlib.sha256(data).hexdigest():
+            print(f"  = {rel} (unchanged)")
+            return "unchanged"
+        with open(path, encoding="utf-8") as f:
+            old = f.read()
+
+    def write(tmp):
+        with open(tmp, "wb") as f:
+            f.write(data)
+
+    _atomic_write(path, write)
+    if old is None:
+        print(f"  + {rel} (created, {content.count(chr(10)) + 1} lines)")
+        return "created"
+    added = removed = 0
+    for line in difflib.unified_diff(old.splitlines(), content.splitlines(), lineterm="", n=0):
+        if line.startswith("+") and not line.startswith("+++"):
+            added += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            removed += 1
+    print(f"  ✓ {rel} (+{added} -{removed} lines)")
+    return "updated"
+
+
+def write_bytes(base, rel, data):
+    """Binary counterpart of write_text: skip identical content, else write atomically."""
+    path = os.path.join(base, rel)
+    existed = os.path.exists(path)
+    if existed and os.path.getsize(path) == len(data) and sha256_file(path) == hashlib.sha256(data).hexdigest():
+        print(f"  = {rel} (unchanged)")
+        return "unchanged"
+
+    def write(tmp):
+        with open(tmp, "wb") as f:
+            f.write(data)
+
+    _atomic_write(path, write)
+    print(f"  {'✓' if existed else '+'} {rel} ({len(data):,} bytes)")
+    return "updated" if existed else "created"
+
+
+def write_json_atomic(path, obj, indent=None):
+    """Silently (re)write a JSON cache/index file via temp file + rename.
+
+    Readers never see a half-written file, even if the writer is killed.
+    """
+    data = json.dumps(obj, ensure_ascii=False, indent=indent, separators=None if indent else (",", ":"))
+
+    def write(tmp):
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+
+    _atomic_write(path, write)
+
+
+def read_json(path, default=None):
+    """Load a JSON cache file; a missing or corrupt file yields `default`."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return default
+
+
+def print_summary(statuses):
+    counts = {s: statuses.count(s) for s in ("created", "updated", "unchanged")}
+    print("\n  " + ", ".join(f"{n} {s}" for s, n in counts.items() if n))
+
+
+def copy_if_changed(src, dest, sha256):
+    """Copy src -> dest unless dest already has content hash `sha256`.
+
+    The source is verified against `sha256` before copying, and the copy goes
+    through shutil.copyfile (sendfile / fcopyfile, no userspace buffers) into a
+    temp file that is renamed over dest. Returns "unchanged" or "copied".
+    """
+    if os.path.exists(dest) and sha256_file(dest) == sha256:
+        return "unchanged"
+    if not os.path.exists(src):
+        raise FileNotFoundError(f"asset source not found: {src}")
+    actual = sha256_file(src)
+    if actual != sha256:
+        raise ValueError(f"{src}: sha256 {actual[:12]}… does not match expected {sha256[:12]}…")
+    _atomic_write(dest, lambda tmp: shutil.copyfile(src, tmp))
+    return "copied"
+
+
+def sync_assets(base, assets, src_dir):
+    """Sync [(repo-relative dest, sha256), ...]; sources are src_dir/<basename>."""
+    for rel, sha256 in assets:
+        src = os.path.join(src_dir, os.path.basename(rel))
+        status = copy_if_changed(src, os.path.join(base, rel), sha256)
+        mark = "✓" if status == "copied" else "="
+        print(f"  {mark} {rel} ({status})")
@@ -0,0 +1,89 @@
+"""
+Incremental per-file caches.
+
+An index maps repo-relative path -> {mtime_ns, size, sha256, data}. On refresh a
+file whose mtime and size are unchanged is reused without being opened; one
+whose stat changed but whose sha256 didn't (git checkout, touch) is reused
+after hashing; only genuinely changed files are handed to `parse`, in a
+process pool when there are enough of them to pay for the workers.
+
+Indexes live under .cache/ (gitignored) and are stamped with a hash of the
+parser's source files, so editing the parser invalidates them.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from ep_tools.files import read_json, write_json_atomic
+
+CACHE_DIR = ".cache"
+CACHE_ENV = "EP_CACHE_DIR"  # overrides CACHE_DIR (harnesses keep their state out of the checkout)
+PARALLEL_MIN = 32  # below this, process start-up costs more than it saves
+
+
+def cache_path(base, name):
+    return os.path.join(base, os.environ.get(CACHE_ENV) or CACHE_DIR, name)
+
+
+def code_version(*modules):
+    """Short hash of the given modules' source files."""
+    h = hashlib.sha256()
+    for mod in modules:
+        with open(mod.__file__, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+def load_index(path, version):
+    data = read_json(path, {})
+    if data.get("version") != version:
+        return {}
+    return data.get("files", {})
+
+
+def save_index(path, version, files):
+    write_json_atomic(path, {"version": version, "files": files})
+
+
+def refresh(base, files, index, parse, workers=None):
+    """Bring `index` up to date with `files` ([(rel, os.stat_result)]).
+
+    `parse(rel, text)` must be a module-level function (it may run in a worker
+    process). Returns (new_index, stats) where stats counts cached / rehashed /
+    parsed / removed files.
+    """
+    new, todo = {}, []
+    stats = {"files": len(files), "cached": 0, "rehashed": 0, "parsed": 0, "removed": 0}
+    for rel, st in files:
+        old = index.get(rel)
+        if old and old["mtime_ns"] == st.st_mtime_ns and old["size"] == st.st_size:
+            new[rel] = old
+            stats["cached"] += 1
+            continue
+        with open(os.path.join(base, rel), "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+        if old and old["sha256"] == digest:
+            new[rel] = {**entry, "data": old["data"]}
+            stats["rehashed"] += 1
+            continue
+        new[rel] = entry
+        todo.append((rel, raw.decode("utf-8")))
+    stats["removed"] = len(set(index) - set(new))
+
+    if len(todo) >= PARALLEL_MIN and (workers is None or workers > 1):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(parse, *zip(*todo), chunksize=8)
+            for (rel, _), data in zip(todo, results):
+                new[rel]["data"] = data
+    else:
+        for rel, text in todo:
+            new[rel]["data"] = parse(rel, text)
+    stats["parsed"] = len(todo)
+    return new, stats
+
+
+def changed(stats):
+    return stats["parsed"] or stats["rehashed"] or stats["removed"]
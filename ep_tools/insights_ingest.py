@@ -0,0 +1,259 @@
+"""
+Ingest insight article bodies: reading stats + a client-side search index.
+
+One pass over each record's paragraphs (data/insights/<slug>.json, the markup
+app/en/insights/[slug]/page.tsx renders: "## " / "### " headings, **bold**,
+[text](url)) yields
+
+    words, readingMinutes   words of rendered text, at WORDS_PER_MINUTE
+    excerpt                 first body paragraph, markup stripped, cut at a word
+    headings                [[level, text], ...]
+    keywords                most frequent non-stopword terms [[term, count], ...]
+
+written to data/insights-stats.json, and a weighted term vector feeding the
+inverted index public/search/insights.json, which lib/insights/search.ts loads
+for instant search across all insights:
+
+    {"v": 1,
+     "stop": [...],                                   stopwords the client drops too
+     "docs": [[slug, title, date, readingMinutes, excerpt], ...],   display order
+     "terms": {term: [doc gap, weight, doc gap, weight, ...]}}
+
+Postings are flat pairs; doc ids are gaps from the previous posting (the first
+is absolute), weights are integer term counts with title/keyword/heading
+boosts. Only records whose content changed are re-tokenized (mtime/sha256
+cache in .cache/insights-ingest.json); the index itself is reassembled from
+the cached vectors, well under a second for hundreds of articles.
+
+ep_tools.articles build runs this after regenerating articles.ts.
+
+Run from repo root:
+    python3 -m ep_tools.insights_ingest [--query "aum portability"]
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter
+
+from ep_tools import articles, incremental
+from ep_tools.files import print_summary, read_json, write_text
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+STATS = "data/insights-stats.json"
+SEARCH_INDEX = "public/search/insights.json"
+CACHE_NAME = "insights-ingest.json"
+
+WORDS_PER_MINUTE = 230
+EXCERPT_MAX = 200
+TOP_KEYWORDS = 12
+WEIGHTS = {"title": 5, "keywords": 3, "heading": 2, "summary": 2, "body": 1}
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further had
+has have having he her here hers him his how i if in into is it its itself just me more most my
+no nor not now of off on once only or other our ours out over own same she should so some such
+than that the their theirs them then there these they this those through to too under until up
+very was we were what when where which while who whom why will with would you your yours
+also even every first get got like made make many may might much must new one per said still
+three two us yet
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_HEADING_RE = re.compile(r"^(#{2,3})\s+(.*)$")
+
+
+# --------------------------------------------------------------------------
+# Text
+# --------------------------------------------------------------------------
+
+def fold(text):
+    """Lowercase and strip accents ("Zürich" -> "zurich"), like the client does."""
+    if text.isascii():
+        return text.lower()
+    text = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def tokenize(text):
+    return [t for t in _TOKEN_RE.findall(fold(text)) if len(t) > 1 and t not in STOPWORDS]
+
+
+def plain(markup):
+    """Rendered text of one paragraph: link text kept, URLs and ** dropped."""
+    return _BOLD_RE.sub(r"\1", _LINK_RE.sub(r"\1", markup)).strip()
+
+
+def excerpt_of(text, limit=EXCERPT_MAX):
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    cut = text[:limit - 1]
+    return cut[:cut.rfind(" ")].rstrip(" ,;:-") + "…"
+
+
+def analyze(record):
+    """Stats and weighted term counts for one article, in one pass over the body."""
+    terms = Counter()
+    for field in ("title", "summary"):
+        for t in tokenize(record.get(field, "")):
+            terms[t] += WEIGHTS[field]
+    for keyword in record.get("keywords", []):
+        for t in tokenize(keyword):
+            terms[t] += WEIGHTS["keywords"]
+
+    body_terms = Counter()
+    words, headings, excerpt = 0, [], None
+    for para in record.get("body", "").split("\n\n"):
+        para = para.strip()
+        if not para:
+            continue
+        m = _HEADING_RE.match(para)
+        if m:
+            text = plain(m.group(2))
+            headings.append([len(m.group(1)), text])
+            for t in tokenize(text):
+                terms[t] += WEIGHTS["heading"]
+            words += len(text.split())
+            continue
+        text = plain(para)
+        words += len(text.split())
+        if excerpt is None:
+            excerpt = excerpt_of(text)
+        body_terms.update(tokenize(text))
+    terms.update(body_terms)
+
+    return {
+        "words": words,
+        "readingMinutes": max(1, math.ceil(words / WORDS_PER_MINUTE)),
+        "excerpt": excerpt or excerpt_of(record.get("summary", "")),
+        "headings": headings,
+        "keywords": [[t, n] for t, n in sorted(body_terms.items(), key=lambda kv: (-kv[1], kv[0]))[:TOP_KEYWORDS]],
+        "terms": dict(terms),
+    }
+
+
+def _parse_record(rel, text):
+    record = json.loads(text)
+    return {"slug": record["slug"], "title": record["title"], "date": record["date"], **analyze(record)}
+
+
+# --------------------------------------------------------------------------
+# Index
+# --------------------------------------------------------------------------
+
+def build_index(docs):
+    """Compact inverted index from [analyzed doc, ...] (already in display order)."""
+    postings = {}
+    for i, doc in enumerate(docs):
+        for term, weight in doc["terms"].items():
+            postings.setdefault(term, []).append((i, weight))
+    terms = {}
+    for term in sorted(postings):
+        flat, prev = [], 0
+        for i, weight in postings[term]:
+            flat += (i - prev, weight)
+            prev = i
+        terms[term] = flat
+    return {
+        "v": 1,
+        "stop": sorted(STOPWORDS),
+        "docs": [[d["slug"], d["title"], d["date"], d["readingMinutes"], d["excerpt"]] for d in docs],
+        "terms": terms,
+    }
+
+
+def search(index, query, limit=10):
+    """Rank docs for `query` the way lib/insights/search.ts does: every term must
+    match (the last one as a prefix), score = sum of weight * idf."""
+    q = tokenize(query)
+    if not q:
+        return []
+    n = len(index["docs"])
+    scores = None
+    for k, term in enumerate(q):
+        keys = [t for t in index["terms"] if t.startswith(term)] if k == len(q) - 1 else [term]
+        hits = {}
+        for key in keys:
+            flat = index["terms"].get(key, [])
+            idf = math.log(1 + n / (len(flat) // 2 or 1))
+            doc = 0
+            for gap, weight in zip(flat[::2], flat[1::2]):
+                doc += gap
+                hits[doc] = hits.get(doc, 0) + weight * idf
+        scores = hits if scores is None else {d: s + hits[d] for d, s in scores.items() if d in hits}
+    ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+    return [(index["docs"][d][0], round(s, 2)) for d, s in ranked]
+
+
+def _one_line_per_key(obj):
+    lines = [f"  {json.dumps(k)}: {json.dumps(v, ensure_ascii=False)}" for k, v in obj.items()]
+    return "{\n" + ",\n".join(lines) + "\n}\n"
+
+
+def ingest(base=BASE, quiet=False):
+    """Refresh stats + search index from the article records. Returns stats."""
+    t0 = time.perf_counter()
+    path = incremental.cache_path(base, CACHE_NAME)
+    version = incremental.code_version(sys.modules[__name__])
+    # Tokenizing one article takes about a millisecond: never worth a process pool.
+    cache, stats = incremental.refresh(base, articles._record_files(base), incremental.load_index(path, version),
+                                       _parse_record, workers=1)
+    if incremental.changed(stats):
+        incremental.save_index(path, version, cache)
+
+    by_slug = {entry["data"]["slug"]: entry["data"] for entry in cache.values()}
+    order = [s for s in articles.load_index(base)["order"] if s in by_slug]
+    docs = [by_slug[s] for s in order]
+    per_article = {d["slug"]: {k: d[k] for k in ("words", "readingMinutes", "excerpt", "headings", "keywords")}
+                   for d in docs}
+    index = build_index(docs)
+    statuses = [
+        write_text(base, STATS, _one_line_per_key(per_article)),
+        write_text(base, SEARCH_INDEX, json.dumps(index, ensure_ascii=False, separators=(",", ":")) + "\n"),
+    ]
+
+    # data/articles.json carries hand-entered readMinutes for LinkedIn re-publications.
+    for a in read_json(os.path.join(base, "data/articles.json"), []):
+        computed = per_article.get(a.get("slug"), {}).get("readingMinutes")
+        if computed and a.get("readMinutes") != computed:
+            print(f"  ⚠️  data/articles.json {a['slug']}: readMinutes {a.get('readMinutes')}, body reads in {computed}")
+
+    stats["ms"] = (time.perf_counter() - t0) * 1000
+    stats["terms"] = len(index["terms"])
+    if not quiet:
+        print(f"\n  {len(docs)} articles ({stats['parsed']} re-tokenized), {stats['terms']:,} terms "
+              f"in {stats['ms']:.0f} ms")
+        print_summary(statuses)
+    return stats
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Build insight reading stats and the client-side search index.")
+    ap.add_argument("--query", help="after building, print the top results for this query")
+    args = ap.parse_args(argv)
+    try:
+        ingest(BASE)
+    except articles.ArticleError as e:
+        print(f"✗ {e}")
+        return 1
+    if args.query:
+        with open(os.path.join(BASE, SEARCH_INDEX), encoding="utf-8") as f:
+            index = json.load(f)
+        print()
+        for slug, score in search(index, args.query):
+            print(f"  {score:8.2f}  {slug}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
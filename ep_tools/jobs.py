@@ -0,0 +1,83 @@
+"""
+Open roles from data/jobs.ts (jobsBySlug) and data/jobs.json, as plain dicts.
+
+    slug, title, market, location, seniority, summary, text (every string in the
+    entry), experience_min, languages, salary_min, salary_max, currency,
+    validThrough, active, source
+
+jobs.ts is the canonical list (app/en/jobs/[slug] reads it); jobs.json entries
+(the public jobs feed, with salary bands) fill in slugs jobs.ts doesn't have.
+A job is live if it is not marked inactive and validThrough hasn't passed.
+"""
+
+import datetime as dt
+import json
+import os
+
+from ep_tools import tsx
+
+JOBS_TS = "data/jobs.ts"
+JOBS_JSON = "data/jobs.json"
+
+
+def _job(slug, **fields):
+    job = {"slug": slug, "title": "", "market": "", "location": "", "seniority": "", "summary": "", "text": "",
+           "experience_min": None, "languages": [], "salary_min": None, "salary_max": None, "currency": None,
+           "validThrough": None, "active": True}
+    job.update({k: v for k, v in fields.items() if v is not None})
+    return job
+
+
+def parse_jobs_ts(src):
+    start = tsx.find_const(src, "jobsBySlug", "{")
+    if start < 0:
+        return []
+    jobs = []
+    for slug, vs, ve in tsx.object_entries(src, start):
+        raw = {k: src[a:b].strip() for k, a, b in tsx.object_entries(src, vs)}
+        value = {k: tsx.string_value(v) for k, v in raw.items()}
+        exp = raw.get("experience_min", "")
+        jobs.append(_job(
+            slug, title=value.get("title"), market=value.get("market"), location=value.get("location"),
+            seniority=value.get("seniority"), summary=value.get("summary"),
+            text=" ".join(tsx.string_literals(src, vs, ve)),
+            experience_min=int(exp) if exp.isdigit() else None,
+            languages=tsx.string_array(raw["languages"], 0) if raw.get("languages", "").startswith("[") else None,
+            active=raw.get("active", "true") != "false", source=JOBS_TS))
+    return jobs
+
+
+def parse_jobs_json(text):
+    jobs = []
+    for j in json.loads(text):
+        if not j.get("slug"):
+            continue
+        jobs.append(_job(
+            j["slug"], title=j.get("title"), market=j.get("market"), location=j.get("location"),
+            seniority=j.get("seniority"), summary=j.get("summary"),
+            text=" ".join(str(j.get(k) or "") for k in ("title", "summary", "market", "location", "seniority")),
+            salary_min=j.get("baseSalaryMin"), salary_max=j.get("baseSalaryMax"), currency=j.get("currency"),
+            validThrough=j.get("validThrough"), active=j.get("active", True) not in (False, "false"),
+            source=JOBS_JSON))
+    return jobs
+
+
+def is_live(job, today):
+    until = (job.get("validThrough") or "")[:10]
+    return job.get("active", True) and not (until and until < today)
+
+
+def load_jobs(base, today=None):
+    """Live jobs, jobs.ts first, deduplicated by slug."""
+    today = today or dt.date.today().isoformat()
+    jobs, seen = [], set()
+    for rel, parse in ((JOBS_TS, parse_jobs_ts), (JOBS_JSON, parse_jobs_json)):
+        path = os.path.join(base, rel)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding="utf-8") as f:
+            for job in parse(f.read()):
+                if job["slug"] not in seen and is_live(job, today):
+                    seen.add(job["slug"])
+                    jobs.append(job)
+    return jobs
@@ -0,0 +1,173 @@
+"""
+Declarative patch manifests.
+
+A manifest is a JSON file of sections, each holding edits (file, old, new,
+count) and optionally files to delete:
+
+    {"description": "...",
+     "sections": [{"title": "LATAM page",
+                   "edits": [{"file": "app/en/...", "old": "...", "new": "...", "count": 1}]},
+                  {"title": "Cleanup", "delete": ["app/page.tsx.save"]}]}
+
+`count` is an exact occurrence count, or "all" to replace every occurrence.
+
+The runner validates the whole manifest up front (schema, files present, every
+edit either pending or already applied), plans every file in parallel on a
+thread pool, then writes changed files — or, with --dry-run, prints a unified
+diff and writes nothing.
+
+Run from repo root:
+    python3 -m ep_tools.manifest manifests/seo_fix_all.json [--dry-run] [--keep-going]
+"""
+
+import argparse
+import difflib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from ep_tools.files import write_text
+from ep_tools.patching import Edit, OverlapError, group_by_file, plan_file
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+EDIT_KEYS = {"file", "old", "new", "count"}
+
+
+class ManifestError(ValueError):
+    pass
+
+
+def _edit_from_json(d, where):
+    if not isinstance(d, dict) or set(d) - EDIT_KEYS or not {"file", "old", "new"} <= set(d):
+        raise ManifestError(f"{where}: edit needs file/old/new (+ optional count), got {sorted(d)}")
+    if not all(isinstance(d[k], str) for k in ("file", "old", "new")) or not d["old"]:
+        raise ManifestError(f"{where}: file/old/new must be strings and old non-empty")
+    count = d.get("count", 1)
+    if count == "all":
+        count = None
+    elif not isinstance(count, int) or count < 1:
+        raise ManifestError(f"{where}: count must be a positive integer or \"all\"")
+    return Edit(d["file"], d["old"], d["new"], count)
+
+
+def load_manifest(path):
+    """Parse and schema-check a manifest. Returns [(title, [Edit], [delete paths])]."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    sections = []
+    for i, s in enumerate(data.get("sections", []), 1):
+        title = s.get("title") or f"Section {i}"
+        edits = [_edit_from_json(e, f"{title} #{j}") for j, e in enumerate(s.get("edits", []), 1)]
+        deletes = s.get("delete", [])
+        if not isinstance(deletes, list) or not all(isinstance(p, str) for p in deletes):
+            raise ManifestError(f"{title}: delete must be a list of paths")
+        sections.append((title, edits, deletes))
+    return sections
+
+
+def _plan(base, rel, edits):
+    path = os.path.join(base, rel)
+    if not os.path.exists(path):
+        return rel, None, None, []
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    new_text, results = plan_file(text, edits)
+    return rel, text, new_text, results
+
+
+def plan_manifest(base, sections, workers=None):
+    """Plan every file in parallel. Returns {rel: (old_text, new_text, results)}.
+
+    Raises ManifestError, naming both edits, when two edits of a file overlap.
+    """
+    edits = [e for _, section_edits, _ in sections for e in section_edits]
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            planned = pool.map(lambda item: _plan(base, *item), group_by_file(edits).items())
+            return {rel: (old, new, results) for rel, old, new, results in planned}
+    except OverlapError as e:
+        where = {id(edit): f"{title} #{j}" for title, section_edits, _ in sections
+                 for j, edit in enumerate(section_edits, 1)}
+        a, b = (where.get(id(edit), "?") for edit in e.edits)
+        raise ManifestError(f"{a} and {b} overlap ({e})") from None
+
+
+def _status_line(r):
+    e = r.edit
+    if r.status == "applied":
+        return f"  ✓  {e.rel}" + (f"  ({r.found}x)" if e.count is None else "")
+    if r.status == "already_applied":
+        return f"  =  {e.rel}  (already applied)"
+    if r.status == "not_found":
+        return f"  ✗  {e.rel}  not found: {e.old[:80]!r}"
+    return f"  ✗  {e.rel}  found {r.found}x, expected {e.count}x: {e.old[:80]!r}"
+
+
+def run(base, manifest_path, dry_run=False, keep_going=False, workers=None):
+    sections = load_manifest(manifest_path)
+    plans = plan_manifest(base, sections, workers)
+
+    missing = sorted(rel for rel, (old, _, _) in plans.items() if old is None)
+    results = {id(r.edit): r for _, _, rs in plans.values() if rs for r in rs}
+    problems = [r for r in results.values() if r.status in ("not_found", "count_mismatch")]
+
+    for i, (title, edits, deletes) in enumerate(sections, 1):
+        print(f"\n{i}. {title}")
+        for e in edits:
+            if e.rel in missing:
+                print(f"  ✗  {e.rel}  (file not found)")
+            else:
+                print(_status_line(results[id(e)]))
+        for rel in deletes:
+            state = "delete" if os.path.exists(os.path.join(base, rel)) else "already gone"
+            print(f"  {'✓' if state == 'delete' else '='}  {rel}  ({state})")
+
+    if (missing or problems) and not keep_going:
+        print(f"\n✗ {len(missing)} missing files, {len(problems)} invalid edits — nothing written."
+              " Fix the manifest or pass --keep-going to apply the valid edits.")
+        return 1
+
+    changed = {rel: (old, new) for rel, (old, new, _) in plans.items() if old is not None and old != new}
+    deletes = [rel for _, _, ds in sections for rel in ds if os.path.exists(os.path.join(base, rel))]
+
+    if dry_run:
+        for rel, (old, new) in changed.items():
+            sys.stdout.writelines(difflib.unified_diff(
+                old.splitlines(keepends=True), new.splitlines(keepends=True),
+                fromfile=f"a/{rel}", tofile=f"b/{rel}"))
+        for rel in deletes:
+            print(f"deleted: {rel}")
+        print(f"\n(dry run) {len(changed)} files would change, {len(deletes)} would be deleted.")
+        return 0
+
+    print()
+    for rel, (_, new) in changed.items():
+        write_text(base, rel, new)
+    for rel in deletes:
+        os.remove(os.path.join(base, rel))
+        print(f"  ✓ deleted {rel}")
+    applied = sum(r.status == "applied" for r in results.values())
+    already = sum(r.status == "already_applied" for r in results.values())
+    print(f"\n{applied} edits applied, {already} already applied, {len(changed)} files written.")
+    return 0
+
+
+def main(argv=None, manifest=None):
+    ap = argparse.ArgumentParser(description="Apply a declarative patch manifest.")
+    if manifest is None:
+        ap.add_argument("manifest")
+    ap.add_argument("--dry-run", action="store_true", help="print a unified diff, write nothing")
+    ap.add_argument("--keep-going", action="store_true", help="apply valid edits even if some are invalid")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+    try:
+        return run(BASE, manifest or args.manifest, args.dry_run, args.keep_going, args.workers)
+    except ManifestError as e:
+        print(f"✗ invalid manifest: {e}")
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,425 @@
+"""
+Score every talent-bench profile against every open role.
+
+Candidates come from data/candidates.json, jobs from data/jobs.ts and
+data/jobs.json (ep_tools.jobs, live ones only). Each side becomes a small set
+of feature matrices and every component is computed for the whole
+candidates x jobs grid at once with numpy:
+
+    text        0.35  TF-IDF cosine of profile text vs job text (ep_tools.related)
+    market      0.20  region (and, at half weight, relocation wishes) vs job market
+    seniority   0.15  distance between seniority bands on one ladder
+    function    0.15  function family (RM, COO, risk, ...) vs the job title
+    languages   0.05  required languages, "(plus)" ones at half weight
+    experience  0.05  years in the profile vs experience_min
+    quality     0.05  BP simulator thresholds (AUM, ROA, 3Y NNM, clients)
+
+Components are in [0, 1]; one that can't be judged for a pair (no market in
+the job, no seniority in the profile, ...) counts 0.5 so it neither helps nor
+hurts. The total is their weighted sum, a float32 C x J matrix; top-N per job
+and per candidate are argpartition along each axis.
+
+Quality uses the same thresholds as the Business Plan simulator in
+streamlit_app.py (AUM >= 200M for Swiss onshore roles, 300M otherwise; average
+ROA >= 1.0% / 0.8%; 3Y NNM >= 100M / 200M; <= 80 clients). The bench has no BP
+figures, so they are read from a profile's optional "bp" object
+({"aum": M CHF, "roa": %, "nnm_3y": M CHF, "clients": n}) or from --bp
+(JSON {candidate id: {...}}); failing that an "AUM USD 90m" style mention in
+the profile gives the AUM test alone.
+
+Library:
+    from ep_tools.match import load, match
+    result = match(*load())
+    result.top_for_job("senior-relationship-manager-brazil-2", 5)  -> [(id, score), ...]
+    result.top_for_candidate("EP-2026-051", 5)                     -> [(slug, score), ...]
+
+Run from repo root:
+    python3 -m ep_tools.match [--job SLUG | --candidate ID] [--top 5] [--bp bp.json]
+        [--explain]
+"""
+
+import argparse
+import functools
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+from ep_tools import jobs as jobs_mod
+from ep_tools.candidate_search import SOURCE, _text
+from ep_tools.insights_ingest import fold, tokenize
+from ep_tools.related import MARKET_WORDS, product_blocks, split_rows, tfidf
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+WEIGHTS = {"text": 0.35, "market": 0.20, "seniority": 0.15, "function": 0.15,
+           "languages": 0.05, "experience": 0.05, "quality": 0.05}
+UNKNOWN = 0.5
+TOP = 5
+TEXT_TERMS = 60  # TF-IDF terms kept per side (profiles and job ads are short)
+
+# One ladder for both sides; a label such as "Director / Executive Director" is the band of its parts.
+SENIORITY_LEVELS = {
+    "analyst": 1, "senior analyst": 2, "associate": 2, "manager": 3, "assistant vice president": 3,
+    "senior manager": 4, "lead": 4, "associate director": 4, "vice president": 4, "vp": 4,
+    "director": 5, "senior director": 6, "executive director": 6, "head": 6, "partner": 7,
+    "managing director": 7, "md": 7, "executive committee": 8, "ceo": 8, "coo": 8, "cfo": 8,
+}
+SENIORITY_SPAN = 3  # levels apart at which seniority scores 0
+
+# Function family -> words in a profile's function/title or a job title.
+FUNCTIONS = {
+    "rm": {"rm", "relationship", "banker", "originator", "coverage", "distribution", "eam", "advisory"},
+    "investments": {"investments", "investment", "portfolio", "advisor", "cio"},
+    "operations": {"coo", "operations", "operating", "governance"},
+    "risk": {"risk", "credit", "compliance"},
+    "finance": {"cfo", "finance", "strategy", "controlling"},
+}
+
+LANGUAGES = ("english", "french", "german", "italian", "spanish", "portuguese", "arabic", "russian",
+             "mandarin", "cantonese", "hebrew", "turkish", "greek", "dutch", "polish")
+
+_YEARS_RE = re.compile(r"(\d{1,2})\s*\+?\s*years")
+_AUM_RE = re.compile(r"(?:aum|assets)[^0-9]{0,20}(\d+(?:\.\d+)?)\s*(m|mn|bn|b)\b|"
+                     r"(\d+(?:\.\d+)?)\s*(m|mn|bn|b)\+?\s*(?:of\s+)?(?:aum|assets)")
+_CH_WORDS = MARKET_WORDS["CH"]
+
+
+class MatchError(ValueError):
+    pass
+
+
+# --------------------------------------------------------------------------
+# Features
+# --------------------------------------------------------------------------
+
+# Region, availability, function and seniority labels repeat across a bench: memoised.
+@functools.lru_cache(maxsize=4096)
+def _markets(text):
+    words = set(tokenize(text))
+    return np.array([bool(words & hints) for hints in MARKET_WORDS.values()], dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=4096)
+def _functions(text):
+    words = set(tokenize(text))
+    return np.array([bool(words & hints) for hints in FUNCTIONS.values()], dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=1024)
+def seniority_band(label):
+    """(lowest, highest) level of a seniority label, or (0, 0) if none is recognised."""
+    levels = []
+    for part in re.split(r"[/,|·]", fold(label or "")):
+        part = " ".join(re.findall(r"[a-z]+", part))
+        level = SENIORITY_LEVELS.get(part)
+        if level is None:  # "Senior Private Banker / Director level": longest known phrase inside
+            hits = [(len(k), v) for k, v in SENIORITY_LEVELS.items() if re.search(rf"\b{k}\b", part)]
+            level = max(hits)[1] if hits else None
+        if level is not None:
+            levels.append(level)
+    return (min(levels), max(levels)) if levels else (0, 0)
+
+
+def _years(text):
+    found = [int(y) for y in _YEARS_RE.findall(fold(text))]
+    return max(found) if found else 0
+
+
+def _aum_in(text):
+    """AUM in millions mentioned in the text (largest), or 0."""
+    best = 0.0
+    for m in _AUM_RE.finditer(fold(text)):
+        amount, unit = (m.group(1), m.group(2)) if m.group(1) else (m.group(3), m.group(4))
+        best = max(best, float(amount) * (1000 if unit.startswith("b") else 1))
+    return best
+
+
+def _language_weights(labels):
+    """Job language list -> weight per LANGUAGES entry: 1 required, 0.5 "(plus)"."""
+    w = np.zeros(len(LANGUAGES), dtype=np.float32)
+    for label in labels or []:
+        name = fold(label).split("(")[0].strip()
+        if name in LANGUAGES:
+            w[LANGUAGES.index(name)] = 0.5 if "plus" in fold(label) else 1.0
+    return w
+
+
+def candidate_features(candidates, tokens, bp=None):
+    """Per-profile feature arrays (rows in `candidates` order); tokens[i] is tokenize(profile text)."""
+    bp = bp or {}
+    n = len(candidates)
+    f = {
+        "market": np.zeros((n, len(MARKET_WORDS)), dtype=np.float32),
+        "function": np.zeros((n, len(FUNCTIONS)), dtype=np.float32),
+        "band": np.zeros((n, 2), dtype=np.int8),
+        "languages": np.zeros((n, len(LANGUAGES)), dtype=np.float32),
+        "years": np.zeros(n, dtype=np.float32),
+        # BP figures, NaN when unknown
+        "aum": np.full(n, np.nan, dtype=np.float32),
+        "roa": np.full(n, np.nan, dtype=np.float32),
+        "nnm_3y": np.full(n, np.nan, dtype=np.float32),
+        "clients": np.full(n, np.nan, dtype=np.float32),
+    }
+    for i, c in enumerate(candidates):
+        text = _text(c)
+        f["market"][i] = np.maximum(_markets(c.get("region", "")), 0.5 * _markets(c.get("availability", "")))
+        f["function"][i] = _functions(f"{c.get('function', '')} {c.get('title', '')}")
+        f["band"][i] = seniority_band(c.get("seniority"))
+        spoken = {fold(lang) for lang in c.get("languages", [])} | set(tokens[i])
+        f["languages"][i] = [lang in spoken or lang == "english" for lang in LANGUAGES]
+        f["years"][i] = c.get("years") or _years(text)
+        figures = {**(c.get("bp") or {}), **bp.get(c.get("id"), {})}
+        for key in ("aum", "roa", "nnm_3y", "clients"):
+            if figures.get(key) is not None:
+                f[key][i] = figures[key]
+        if np.isnan(f["aum"][i]):
+            f["aum"][i] = _aum_in(text) or np.nan
+    return f
+
+
+def job_features(jobs):
+    n = len(jobs)
+    f = {
+        "market": np.zeros((n, len(MARKET_WORDS)), dtype=np.float32),
+        "function": np.zeros((n, len(FUNCTIONS)), dtype=np.float32),
+        "band": np.zeros((n, 2), dtype=np.int8),
+        "languages": np.zeros((n, len(LANGUAGES)), dtype=np.float32),
+        "experience_min": np.zeros(n, dtype=np.float32),
+        "aum_min": np.zeros(n, dtype=np.float32),
+    }
+    for i, j in enumerate(jobs):
+        where = f"{j['title']} {j['market']} {j['location']}"
+        f["market"][i] = _markets(where)
+        f["function"][i] = _functions(j["title"])
+        f["band"][i] = seniority_band(j["seniority"] or j["title"])
+        f["languages"][i] = _language_weights(j["languages"])
+        f["experience_min"][i] = j["experience_min"] or 0
+        f["aum_min"][i] = 200.0 if set(tokenize(where)) & _CH_WORDS else 300.0
+    return f
+
+
+def _text_docs(candidates, tokens, jobs):
+    """Term weights: the title counts 3x (it is also part of the profile text / job text)."""
+    docs = [{"terms": _weighted(toks, (2, c.get("title", "")))} for c, toks in zip(candidates, tokens)]
+    docs += [{"terms": _weighted(tokenize(j["text"]), (2, j["title"]), (1, j["summary"]))} for j in jobs]
+    return docs
+
+
+def _weighted(tokens, *extra):
+    terms = Counter(tokens)
+    for boost, text in extra:
+        for t in tokenize(text):
+            terms[t] += boost
+    return terms
+
+
+# --------------------------------------------------------------------------
+# Components (each C x J float32 in [0, 1])
+# --------------------------------------------------------------------------
+
+def _text_scores(candidates, tokens, jobs):
+    x = tfidf(_text_docs(candidates, tokens, jobs), TEXT_TERMS)
+    cand, job = split_rows(x, len(candidates))
+    out = np.empty((len(candidates), len(jobs)), dtype=np.float32)
+    for r0, block in product_blocks(cand, job):
+        out[r0:r0 + len(block)] = block
+    # Raw cosines between a profile and a job ad sit well below 1; scale by the
+    # best pair so the weight means the same on any bench.
+    top = out.max() if out.size else 0.0
+    return out / top if top > 0 else out
+
+
+def _overlap(a, b):
+    """max_k a[:, k] * b[:, k], UNKNOWN where either side has no flag set."""
+    out = np.zeros((len(a), len(b)), dtype=np.float32)
+    for k in range(a.shape[1]):
+        np.maximum(out, np.multiply.outer(a[:, k], b[:, k]), out=out)
+    out[~a.any(axis=1)] = UNKNOWN
+    out[:, ~b.any(axis=1)] = UNKNOWN
+    return out
+
+
+def _seniority_scores(cb, jb):
+    c_lo, c_hi = cb[:, :1].astype(np.float32), cb[:, 1:].astype(np.float32)
+    j_lo, j_hi = jb[:, 0].astype(np.float32), jb[:, 1].astype(np.float32)
+    gap = np.maximum(np.maximum(c_lo - j_hi, j_lo - c_hi), 0)  # 0 when the bands overlap
+    out = np.clip(1 - gap / SENIORITY_SPAN, 0, 1)
+    out[cb[:, 0] == 0] = UNKNOWN
+    out[:, jb[:, 0] == 0] = UNKNOWN
+    return out
+
+
+def _language_scores(spoken, weights):
+    total = weights.sum(axis=1)
+    out = (spoken @ weights.T) / np.where(total > 0, total, 1)
+    out[:, total == 0] = UNKNOWN
+    return out
+
+
+def _experience_scores(years, minimum):
+    out = np.clip(years[:, None] / np.where(minimum > 0, minimum, 1)[None, :], 0, 1)
+    out[years == 0] = UNKNOWN
+    out[:, minimum == 0] = UNKNOWN
+    return out
+
+
+def _quality_scores(cf, jf):
+    """Share of the simulator's points earned among the figures known for a profile."""
+    c, j = len(cf["aum"]), len(jf["aum_min"])
+    points = np.zeros((c, j), dtype=np.float32)
+    possible = np.zeros(c, dtype=np.float32)
+    aum, roa, nnm, clients = cf["aum"], cf["roa"], cf["nnm_3y"], cf["clients"]
+    known = ~np.isnan(aum)
+    points += 2 * (np.nan_to_num(aum)[:, None] >= jf["aum_min"][None, :]) * known[:, None]
+    possible += 2 * known
+    for values, full, half, weight in ((roa, 1.0, 0.8, 2), (nnm, 200.0, 100.0, 2)):
+        known = ~np.isnan(values)
+        v = np.nan_to_num(values)
+        points += (weight * (v >= full) + weight / 2 * ((v >= half) & (v < full)))[:, None] * known[:, None]
+        possible += weight * known
+    known = ~np.isnan(clients)
+    points += ((np.nan_to_num(clients) <= 80) & known)[:, None].astype(np.float32)
+    possible += known
+    out = points / np.where(possible > 0, possible, 1)[:, None]
+    out[possible == 0] = UNKNOWN
+    return out
+
+
+# --------------------------------------------------------------------------
+# Match
+# --------------------------------------------------------------------------
+
+class MatchResult:
+    def __init__(self, candidates, jobs, scores, components):
+        self.candidate_ids = [c["id"] for c in candidates]
+        self.job_slugs = [j["slug"] for j in jobs]
+        self.scores = scores  # C x J float32
+        self.components = components  # name -> C x J float32, or {} if not kept
+        self._cand_row = {cid: i for i, cid in enumerate(self.candidate_ids)}
+        self._job_col = {slug: i for i, slug in enumerate(self.job_slugs)}
+
+    @staticmethod
+    def _top(scores, n):
+        idx = np.arange(len(scores))
+        if len(idx) > n:
+            idx = np.argpartition(-scores, n)[:n]
+        return idx[np.lexsort((idx, -scores[idx]))]
+
+    def top_for_job(self, slug, n=TOP):
+        col = self._job_col.get(slug)
+        if col is None:
+            raise MatchError(f"no live job {slug!r}")
+        scores = self.scores[:, col]
+        return [(self.candidate_ids[i], round(float(scores[i]), 4)) for i in self._top(scores, n)]
+
+    def top_for_candidate(self, cid, n=TOP):
+        row = self._cand_row.get(cid)
+        if row is None:
+            raise MatchError(f"no candidate {cid!r}")
+        scores = self.scores[row]
+        return [(self.job_slugs[i], round(float(scores[i]), 4)) for i in self._top(scores, n)]
+
+    def top_per_job(self, n=TOP):
+        """{slug: [(id, score), ...]} for every job: one argpartition along the candidate axis."""
+        return self._top_along(self.scores.T, n, self.job_slugs, self.candidate_ids)
+
+    def top_per_candidate(self, n=TOP):
+        return self._top_along(self.scores, n, self.candidate_ids, self.job_slugs)
+
+    @staticmethod
+    def _top_along(scores, n, keys, labels):
+        n = min(n, scores.shape[1])
+        if not n:
+            return {k: [] for k in keys}
+        idx = np.argpartition(-scores, n - 1, axis=1)[:, :n]
+        part = np.take_along_axis(scores, idx, axis=1)
+        order = np.lexsort((idx, -part), axis=1)
+        idx, part = np.take_along_axis(idx, order, axis=1), np.take_along_axis(part, order, axis=1)
+        return {k: [(labels[i], round(float(s), 4)) for i, s in zip(row, vals)]
+                for k, row, vals in zip(keys, idx.tolist(), part.tolist())}
+
+    def explain(self, cid, slug):
+        i, j = self._cand_row[cid], self._job_col[slug]
+        return {name: round(float(m[i, j]), 3) for name, m in self.components.items()}
+
+
+def match(candidates, jobs, bp=None, weights=WEIGHTS, keep_components=False):
+    """Score matrix for candidates x jobs (both lists of dicts as loaded by load())."""
+    tokens = [tokenize(_text(c)) for c in candidates]
+    cf, jf = candidate_features(candidates, tokens, bp), job_features(jobs)
+    components = {
+        "text": lambda: _text_scores(candidates, tokens, jobs),
+        "market": lambda: _overlap(cf["market"], jf["market"]),
+        "seniority": lambda: _seniority_scores(cf["band"], jf["band"]),
+        "function": lambda: _overlap(cf["function"], jf["function"]),
+        "languages": lambda: _language_scores(cf["languages"], jf["languages"]),
+        "experience": lambda: _experience_scores(cf["years"], jf["experience_min"]),
+        "quality": lambda: _quality_scores(cf, jf),
+    }
+    scores = np.zeros((len(candidates), len(jobs)), dtype=np.float32)
+    kept = {}
+    for name, weight in weights.items():
+        m = components[name]()
+        scores += weight * m
+        if keep_components:
+            kept[name] = m
+    return MatchResult(candidates, jobs, scores, kept)
+
+
+def load(base=BASE, source=SOURCE, today=None):
+    with open(os.path.join(base, source), encoding="utf-8") as f:
+        candidates = json.load(f)
+    return candidates, jobs_mod.load_jobs(base, today)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Match talent-bench profiles against open roles.")
+    who = ap.add_mutually_exclusive_group()
+    who.add_argument("--job", help="best candidates for this job slug")
+    who.add_argument("--candidate", help="best jobs for this candidate id")
+    ap.add_argument("--top", type=int, default=TOP)
+    ap.add_argument("--source", default=SOURCE, help="profiles JSON, relative to the repo root")
+    ap.add_argument("--bp", help="JSON {candidate id: {aum, roa, nnm_3y, clients}}")
+    ap.add_argument("--explain", action="store_true", help="print the score components per pair")
+    args = ap.parse_args(argv)
+
+    bp = None
+    if args.bp:
+        with open(args.bp, encoding="utf-8") as f:
+            bp = json.load(f)
+    t0 = time.perf_counter()
+    candidates, jobs = load(BASE, args.source)
+    t1 = time.perf_counter()
+    result = match(candidates, jobs, bp, keep_components=args.explain)
+    t2 = time.perf_counter()
+
+    try:
+        if args.job:
+            groups = {args.job: [(cid, s, cid, args.job) for cid, s in result.top_for_job(args.job, args.top)]}
+        elif args.candidate:
+            groups = {args.candidate: [(slug, s, args.candidate, slug)
+                                       for slug, s in result.top_for_candidate(args.candidate, args.top)]}
+        else:
+            groups = {slug: [(cid, s, cid, slug) for cid, s in hits]
+                      for slug, hits in result.top_per_job(args.top).items()}
+    except MatchError as e:
+        print(f"✗ {e}")
+        return 1
+    for key, hits in groups.items():
+        print(f"\n{key}")
+        for label, score, cid, slug in hits:
+            print(f"  {score:6.3f}  {label}")
+            if args.explain:
+                print("          " + "  ".join(f"{k} {v:.2f}" for k, v in result.explain(cid, slug).items()))
+    print(f"\n{len(candidates)} candidates x {len(jobs)} jobs; load {(t1 - t0) * 1000:.0f} ms, "
+          f"match {(t2 - t1) * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Single-pass multi-pattern patch engine.
+
+Edits are grouped by file; each file is read once, every replacement for it is
+applied in one scan with a combined regex, expected counts are validated, and
+the result is written once (atomically, and only if it changed).
+
+    from ep_tools.patching import Edit, apply_edits
+    apply_edits(BASE, [Edit("app/en/jobs/page.tsx", old, new), ...])
+
+`count` is the exact number of occurrences expected (like the old `patch()`);
+`count=None` replaces every occurrence and only requires at least one (`patch_all()`).
+
+An edit whose replacement is already in the file (and whose `old` text only
+survives inside it) is reported as "already_applied", so re-running is a no-op.
+"""
+
+import os
+import re
+from typing import NamedTuple, Optional
+
+from ep_tools.files import write_text
+
+
+class Edit(NamedTuple):
+    rel: str
+    old: str
+    new: str
+    count: Optional[int] = 1
+
+
+class Result(NamedTuple):
+    edit: Edit
+    status: str  # "applied" | "already_applied" | "not_found" | "count_mismatch"
+    found: int
+
+
+class OverlapError(ValueError):
+    """Two edits of one file claim the same text; `edits` holds both."""
+
+    def __init__(self, message, edits):
+        super().__init__(message)
+        self.edits = edits
+
+
+def _combined_pattern(olds):
+    # Longest first so a string that contains another one wins at the same offset.
+    return re.compile("|".join(re.escape(o) for o in sorted(olds, key=len, reverse=True)))
+
+
+def is_applied(text, e):
+    """True if e.new is present and every remaining e.old is part of an e.new
+    (covers insert-style edits where new = old + extra)."""
+    if not e.new or e.new not in text:
+        return False
+    return text.count(e.old) <= text.count(e.new) * e.new.count(e.old)
+
+
+def _one_pass(text, edits):
+    """Apply `edits` to `text` in a single scan. Returns (text, results, deferred).
+
+    Edits whose `old` isn't in `text` yet are deferred rather than failed: they
+    may target output of an earlier edit in the same file.
+    """
+    results, active, counts, deferred = [], {}, {}, []
+    for e in edits:
+        found = text.count(e.old)
+        if is_applied(text, e):
+            results.append(Result(e, "already_applied", 0))
+        elif found == 0:
+            deferred.append(e)
+        elif e.count is not None and found != e.count:
+            results.append(Result(e, "count_mismatch", found))
+        elif e.old in active:
+            raise OverlapError(f"{e.rel}: two edits replace the same text {e.old[:60]!r}", (active[e.old], e))
+        else:
+            active[e.old] = e
+            counts[e.old] = found
+    if not active:
+        return text, results, deferred
+
+    pattern = _combined_pattern(active)
+    hits = dict.fromkeys(active, 0)
+    spans = []
+
+    def repl(m):
+        hits[m.group(0)] += 1
+        spans.append((m.start(), m.end(), m.group(0)))
+        return active[m.group(0)].new
+
+    original, text = text, pattern.sub(repl, text)
+    for old, e in active.items():
+        if hits[old] != counts[old]:
+            # Another edit's `old` overlapped this one and consumed some matches.
+            other = active[_overlapping(original, old, spans)]
+            raise OverlapError(f"{e.rel}: overlapping edits {old[:60]!r} and {other.old[:60]!r}", (e, other))
+        results.append(Result(e, "applied", hits[old]))
+    return text, results, deferred
+
+
+def _overlapping(text, old, spans):
+    """The other edit's `old` whose match (in `spans`) consumed part of an occurrence of `old`."""
+    i = text.find(old)
+    while i >= 0:
+        for start, end, other in spans:
+            if other != old and start < i + len(old) and i < end:
+                return other
+        i = text.find(old, i + len(old))
+    return old
+
+
+def plan_file(text, edits):
+    """Apply all edits for one file in memory. Returns (new_text, results) in edit order."""
+    results = []
+    pending = list(edits)
+    while pending:
+        text, done, deferred = _one_pass(text, pending)
+        results += done
+        if len(deferred) == len(pending):  # nothing new became applicable
+            results += [Result(e, "not_found", 0) for e in deferred]
+            break
+        pending = deferred
+    order = {id(e): i for i, e in enumerate(edits)}
+    results.sort(key=lambda r: order[id(r.edit)])
+    return text, results
+
+
+def group_by_file(edits):
+    files = {}
+    for e in edits:
+        files.setdefault(e.rel, []).append(e)
+    return files
+
+
+def print_results(rel, results):
+    for r in results:
+        e = r.edit
+        if r.status == "applied":
+            extra = f"  ({r.found}x replaced)" if e.count is None else ""
+            print(f"  ✓  {rel}{extra}")
+        elif r.status == "already_applied":
+            print(f"  =  already applied: {rel}")
+        elif r.status == "not_found":
+            print(f"  ⚠️  SKIP (not found): {rel}")
+            print(f"       looking for: {repr(e.old[:80])}")
+        else:
+            print(f"  ⚠️  SKIP (found {r.found}x, expected {e.count}x): {rel}")
+            print(f"       looking for: {repr(e.old[:80])}")
+
+
+def apply_edits(base, edits):
+    """Read each file once, apply its edits in one pass, write it once. Returns all results."""
+    all_results = []
+    for rel, file_edits in group_by_file(edits).items():
+        path = os.path.join(base, rel)
+        if not os.path.exists(path):
+            print(f"  ⚠️  SKIP (file not found): {rel}")
+            all_results += [Result(e, "not_found", 0) for e in file_edits]
+            continue
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        new_text, results = plan_file(text, file_edits)
+        print_results(rel, results)
+        if new_text != text:
+            write_text(base, rel, new_text)
+        all_results += results
+    return all_results
@@ -0,0 +1,292 @@
+"""
+Related links between insights, LinkedIn articles and jobs.
+
+Every document becomes a TF-IDF vector over the insights tokenizer
+(ep_tools.insights_ingest), plus market features so an insight tagged
+"UAE" meets the Dubai jobs:
+
+    insights    data/insights/<slug>.json    /en/insights/<slug>
+    LinkedIn    data/articles.json           /go/linkedin-article/<slug>  (slugs that are
+                                             also insights are folded into the insight)
+    jobs        data/jobs.ts (jobsBySlug)    /en/jobs/<slug>  (active ones)
+                data/jobs.json               /en/jobs/<slug>  (not past validThrough)
+
+Weights are sublinear tf (1 + log tf) with field boosts, times smoothed idf;
+each vector keeps its TOP_TERMS strongest terms and is L2-normalised, so the
+cosine similarity of every pair is one sparse product X @ X.T. With scipy
+installed that is a scipy.sparse product; otherwise the same CSR arrays are
+multiplied with numpy, row block by row block, through the term -> docs view. Each document keeps its top --k articles
+and jobs above MIN_SCORE, written to data/related.json (one line per path):
+
+    {"asOf": "2026-10-19",
+     "links": {"/en/insights/a": {"articles": [path, ...], "jobs": [path, ...]}, ...}}
+
+Jobs past their validThrough on the `asOf` date are left out. A rebuild
+keeps the date recorded in the file, so the same sources give the same
+file on any day; pass --today to move it (and drop the jobs that expired).
+
+Tokenizing is incremental (mtime/sha256 cache in .cache/related.json): adding
+one article re-reads one record; idf and the product are recomputed, which is
+cheap next to tokenizing.
+
+Run from repo root:
+    python3 -m ep_tools.related [--k 4] [--today YYYY-MM-DD] [--show /en/insights/<slug>]
+"""
+
+import argparse
+import datetime as dt
+import json
+import math
+import os
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+from ep_tools import articles, incremental, insights_ingest, jobs, tsx
+from ep_tools.files import print_summary, read_json, write_text
+from ep_tools.insights_ingest import plain, tokenize
+
+try:
+    import scipy.sparse as sparse
+except ImportError:  # numpy fallback below
+    sparse = None
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+OUTPUT = "data/related.json"
+CACHE_NAME = "related.json"
+ARTICLES_JSON = "data/articles.json"
+JOBS_JSON = jobs.JOBS_JSON
+JOBS_TS = jobs.JOBS_TS
+
+K = 4
+MIN_SCORE = 0.05
+TOP_TERMS = 100
+BLOCK_ROWS = 256  # similarity rows materialised at a time
+BOOST = {"title": 3, "summary": 2, "keywords": 2, "market": 3, "text": 1}
+
+# MarketCode (app/en/insights/types.ts) -> words that place a job in that market.
+MARKET_WORDS = {
+    "CH": {"switzerland", "swiss", "zurich", "geneva", "lausanne", "lugano", "onshore"},
+    "UK": {"uk", "london", "united", "kingdom"},
+    "US": {"us", "usa", "york", "miami"},
+    "UAE": {"uae", "dubai", "abu", "dhabi", "difc"},
+    "ASIA": {"asia", "apac", "singapore", "hong", "kong"},
+    "EU": {"europe", "european", "france", "paris", "portugal", "lisbon", "spain", "madrid", "italy",
+           "milan", "benelux", "nordics", "greece", "cyprus", "germany"},
+    "MEA": {"mea", "middle", "africa", "gcc", "saudi", "riyadh", "israel", "israeli", "tel", "aviv"},
+    "LATAM": {"latam", "latin", "brazil", "argentina", "mexico"},
+    "CIS": {"cis", "russian"},
+    "CEE": {"cee"},
+}
+
+
+# --------------------------------------------------------------------------
+# Documents (cached per source file)
+# --------------------------------------------------------------------------
+
+def _market_terms(codes):
+    return {f"@{c.lower()}": BOOST["market"] for c in codes}
+
+
+def _markets_in(text):
+    words = set(tokenize(text))
+    return [code for code, hints in MARKET_WORDS.items() if words & hints]
+
+
+def _terms(fields):
+    """Weighted term counts from [(boost name, text), ...]."""
+    counts = Counter()
+    for name, text in fields:
+        for t in tokenize(text):
+            counts[t] += BOOST[name]
+    return counts
+
+
+def _insight_doc(record):
+    body = " ".join(plain(p.lstrip("# ")) for p in record.get("body", "").split("\n\n"))
+    terms = _terms([("title", record["title"]), ("summary", record["summary"]),
+                    ("keywords", " ".join(record.get("keywords", []))), ("text", body)])
+    terms.update(_market_terms(record["markets"]))
+    return {"path": f"/en/insights/{record['slug']}", "kind": "article", "slug": record["slug"],
+            "terms": dict(terms)}
+
+
+def _linkedin_docs(items):
+    docs = []
+    for a in items:
+        terms = _terms([("title", a.get("title", "")), ("summary", a.get("excerpt", "")),
+                        ("keywords", a.get("category", ""))])
+        docs.append({"path": f"/go/linkedin-article/{a['slug']}", "kind": "article", "slug": a["slug"],
+                     "terms": dict(terms)})
+    return docs
+
+
+def _job_doc(job):
+    where = f"{job['market']} {job['location']}"
+    terms = _terms([("title", job["title"]), ("market", where), ("summary", job["summary"]),
+                    ("text", job["text"])])
+    terms.update(_market_terms(_markets_in(f"{job['title']} {where}")))
+    return {"path": f"/en/jobs/{job['slug']}", "kind": "job", "slug": job["slug"], "terms": dict(terms),
+            "validThrough": job["validThrough"], "active": job["active"]}
+
+
+def _parse_source(rel, text):
+    if rel == JOBS_TS:
+        return [_job_doc(j) for j in jobs.parse_jobs_ts(text)]
+    if rel == ARTICLES_JSON:
+        return _linkedin_docs(json.loads(text))
+    if rel == JOBS_JSON:
+        return [_job_doc(j) for j in jobs.parse_jobs_json(text)]
+    return [_insight_doc(json.loads(text))]
+
+
+def load_documents(base=BASE, today=None):
+    """Live documents in a stable order, deduplicated by path (insights before LinkedIn copies)."""
+    today = today or dt.date.today().isoformat()
+    path = incremental.cache_path(base, CACHE_NAME)
+    version = incremental.code_version(sys.modules[__name__], jobs, tsx, insights_ingest)  # + parsers, tokenizer
+    files = articles._record_files(base) + [(rel, os.stat(os.path.join(base, rel)))
+                                            for rel in (ARTICLES_JSON, JOBS_TS, JOBS_JSON)
+                                            if os.path.exists(os.path.join(base, rel))]
+    cache, stats = incremental.refresh(base, files, incremental.load_index(path, version), _parse_source,
+                                       workers=1)
+    if incremental.changed(stats):
+        incremental.save_index(path, version, cache)
+
+    docs, seen = [], set()
+    for rel, _ in files:  # records first, then articles.json / jobs.ts / jobs.json
+        for doc in cache[rel]["data"]:
+            key = (doc["kind"], doc["slug"])
+            if key in seen or not doc["terms"] or not jobs.is_live(doc, today):
+                continue
+            seen.add(key)
+            docs.append(doc)
+    return docs, stats
+
+
+# --------------------------------------------------------------------------
+# TF-IDF + top-k cosine
+# --------------------------------------------------------------------------
+
+def tfidf(docs, top_terms=TOP_TERMS):
+    """CSR arrays (indptr, indices, data, n_terms) of pruned, L2-normalised TF-IDF rows."""
+    df = Counter(t for d in docs for t in d["terms"])
+    vocab = {t: i for i, t in enumerate(sorted(df))}
+    n = len(docs)
+    idf = {t: math.log((1 + n) / (1 + c)) + 1 for t, c in df.items()}
+    indptr, indices, data = [0], [], []
+    for d in docs:
+        weights = sorted(((1 + math.log(tf)) * idf[t], t) for t, tf in d["terms"].items())[-top_terms:]
+        norm = math.sqrt(sum(w * w for w, _ in weights)) or 1.0
+        for w, t in sorted(weights, key=lambda wt: vocab[wt[1]]):
+            indices.append(vocab[t])
+            data.append(w / norm)
+        indptr.append(len(indices))
+    return (np.array(indptr, dtype=np.int64), np.array(indices, dtype=np.int64),
+            np.array(data, dtype=np.float32), len(vocab))
+
+
+def split_rows(csr, k):
+    """(first k rows, the rest) of CSR arrays (indptr, indices, data, n_terms)."""
+    indptr, indices, data, n_terms = csr
+    cut = indptr[k]
+    return ((indptr[:k + 1], indices[:cut], data[:cut], n_terms),
+            (indptr[k:] - cut, indices[cut:], data[cut:], n_terms))
+
+
+def product_blocks(a, b, block_rows=BLOCK_ROWS):
+    """Yield (first row, dense block of A @ B.T rows) for CSR arrays over the same terms."""
+    a_ptr, a_idx, a_data, n_terms = a
+    b_ptr, b_idx, b_data, _ = b
+    n, m = len(a_ptr) - 1, len(b_ptr) - 1
+    if sparse is not None:
+        prod = (sparse.csr_matrix((a_data, a_idx, a_ptr), shape=(n, n_terms))
+                @ sparse.csr_matrix((b_data, b_idx, b_ptr), shape=(m, n_terms)).T).tocsr()
+        for r0 in range(0, n, block_rows):
+            yield r0, prod[r0:r0 + block_rows].toarray()
+        return
+    # Row-by-column product over B's column (term -> rows) view: each nonzero
+    # (row, term, w) of A meets every posting of its term in B, and the products
+    # are summed per (row, B row) with bincount. Work is sum(df_A * df_B), not n x nnz.
+    order = np.argsort(b_idx, kind="stable")
+    col_ptr = np.concatenate(([0], np.cumsum(np.bincount(b_idx, minlength=n_terms))))
+    col_rows = np.repeat(np.arange(m), np.diff(b_ptr))[order]
+    col_data = b_data[order]
+    for r0 in range(0, n, block_rows):
+        r1 = min(n, r0 + block_rows)
+        lo, hi = a_ptr[r0], a_ptr[r1]
+        rows = np.repeat(np.arange(r1 - r0), np.diff(a_ptr[r0:r1 + 1]))
+        terms, weights = a_idx[lo:hi], a_data[lo:hi]
+        lens = col_ptr[terms + 1] - col_ptr[terms]
+        offsets = np.arange(lens.sum()) - np.repeat(np.cumsum(lens) - lens, lens) + np.repeat(col_ptr[terms], lens)
+        keys = np.repeat(rows, lens) * m + col_rows[offsets]
+        vals = np.repeat(weights, lens) * col_data[offsets]
+        yield r0, np.bincount(keys, weights=vals, minlength=(r1 - r0) * m).reshape(r1 - r0, m)
+
+
+def related(docs, k=K, min_score=MIN_SCORE):
+    """{path: {"articles": [path, ...], "jobs": [path, ...]}} (best first)."""
+    if not docs:
+        return {}
+    groups = {"articles": np.array([d["kind"] == "article" for d in docs]),
+              "jobs": np.array([d["kind"] == "job" for d in docs])}
+    out = {}
+    x = tfidf(docs)
+    for r0, block in product_blocks(x, x):
+        for i, scores in enumerate(block):
+            r = r0 + i
+            scores[r] = 0  # never related to itself
+            entry = {}
+            for name, mask in groups.items():
+                cand = np.flatnonzero(mask & (scores >= min_score))
+                if len(cand) > k:
+                    cand = cand[np.argpartition(-scores[cand], k)[:k]]
+                entry[name] = [docs[j]["path"] for j in cand[np.lexsort((cand, -scores[cand]))]]
+            out[docs[r]["path"]] = entry
+    return out
+
+
+def recorded_date(base=BASE):
+    """The `asOf` date data/related.json was built for (None if there is no such file)."""
+    data = read_json(os.path.join(base, OUTPUT), {})
+    return data.get("asOf") if isinstance(data, dict) else None
+
+
+def build(base=BASE, k=K, today=None, quiet=False):
+    """Write data/related.json for jobs live on `today` (default: its recorded date, else today)."""
+    t0 = time.perf_counter()
+    today = today or recorded_date(base) or dt.date.today().isoformat()
+    docs, stats = load_documents(base, today)
+    links = related(docs, k)
+    lines = [f"    {json.dumps(p)}: {json.dumps(links[p], separators=(',', ':'))}" for p in sorted(links)]
+    status = write_text(base, OUTPUT, f'{{\n  "asOf": "{today}",\n  "links": {{\n' + ",\n".join(lines) + "\n  }\n}\n")
+    stats["ms"] = (time.perf_counter() - t0) * 1000
+    if not quiet:
+        kinds = Counter(d["kind"] for d in docs)
+        print(f"\n  {kinds['article']} articles, {kinds['job']} jobs live on {today} ({stats['parsed']} source files re-read, "
+              f"{'scipy' if sparse is not None else 'numpy'} product) in {stats['ms']:.0f} ms")
+        print_summary([status])
+    return links
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Compute related articles and jobs per page.")
+    ap.add_argument("--k", type=int, default=K, help="links kept per kind")
+    ap.add_argument("--today", type=dt.date.fromisoformat,
+                    help="date jobs must still be valid on (default: the one recorded in data/related.json)")
+    ap.add_argument("--show", help="print the links for this path")
+    args = ap.parse_args(argv)
+    links = build(BASE, args.k, args.today and args.today.isoformat())
+    if args.show:
+        for name, paths in links.get(args.show, {}).items():
+            print(f"\n{name}:")
+            for p in paths:
+                print(f"  {p}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+App Router route discovery.
+
+Walks `app/` for `page.tsx` files (skipping `api/`, private `_folders` and
+`node_modules`) and maps each file to its URL pattern, dropping `(group)`
+segments the way Next.js does.
+"""
+
+import os
+
+APP_DIR = "app"
+PAGE_NAMES = ("page.tsx", "page.ts", "page.jsx", "page.js")
+SKIP_DIRS = {"api", "node_modules", ".next"}
+
+
+def app_files(base, names=PAGE_NAMES):
+    """(rel path, os.stat_result) for every file under app/ named one of `names`, sorted."""
+    found = []
+    stack = [os.path.join(base, APP_DIR)]
+    while stack:
+        d = stack.pop()
+        with os.scandir(d) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS and not entry.name.startswith(("_", ".")):
+                        stack.append(entry.path)
+                elif entry.name in names:
+                    found.append((os.path.relpath(entry.path, base).replace(os.sep, "/"), entry.stat()))
+    return sorted(found)
+
+
+def page_files(base):
+    return app_files(base, PAGE_NAMES)
+
+
+def segments(rel):
+    """URL segments of a page file, route groups removed: app/(m)/en/[slug]/page.tsx -> ["en", "[slug]"]."""
+    parts = rel.split("/")[1:-1]
+    return [p for p in parts if not (p.startswith("(") and p.endswith(")"))]
+
+
+def route_for(rel):
+    return "/" + "/".join(segments(rel))
+
+
+def is_dynamic(rel):
+    return any(s.startswith("[") for s in segments(rel))
+
+
+def robots_disallow(base, rel="public/robots.txt"):
+    """Path prefixes disallowed in the static robots.txt (query-string rules skipped)."""
+    prefixes = []
+    try:
+        with open(os.path.join(base, rel), encoding="utf-8") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                value = value.strip()
+                if key.strip().lower() == "disallow" and value and "?" not in value:
+                    prefixes.append(value.rstrip("$"))
+    except FileNotFoundError:
+        pass
+    return prefixes
+
+
+def is_disallowed(route, prefixes):
+    return any(route == p.rstrip("/") or route.startswith(p.rstrip("/") + "/") for p in prefixes)
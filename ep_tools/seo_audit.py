@@ -0,0 +1,372 @@
+"""
+SEO audit of every app/**/page.tsx.
+
+Extracts each page's metadata — `export const metadata = {...}` or the object
+literals returned by `generateMetadata` — plus JSON-LD `name` / `serviceType`,
+and flags the issues seo_fix_all.py used to fix by hand: over-long titles and
+descriptions, em dashes, missing canonicals, missing robots, missing OG data.
+
+Parsed pages are kept in .cache/seo-audit.json keyed by mtime/size/sha256, so a
+re-audit only re-parses files that changed (a clean re-run takes milliseconds).
+
+Run from repo root:
+    python3 -m ep_tools.seo_audit [--json] [--rule title-too-long] [--strict] [--no-cache]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+from ep_tools import incremental, tsx
+from ep_tools.routes import APP_DIR, app_files, page_files, route_for
+from ep_tools.tsx import line_of, match_brace, object_entries, string_value, top_level_consts
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+INDEX_NAME = "seo-audit.json"
+
+TITLE_MAX = 60
+DESC_MIN = 70
+DESC_MAX = 160
+EM_DASH = "—"
+
+# rule -> (severity, what it means)
+RULES = {
+    "metadata-missing":    ("warn",  "page exports no metadata and no layout above it does"),
+    "title-missing":       ("error", "metadata has no title"),
+    "title-too-long":      ("warn",  f"title longer than {TITLE_MAX} characters"),
+    "description-missing": ("error", "metadata has no description"),
+    "description-too-long": ("warn", f"description longer than {DESC_MAX} characters"),
+    "description-too-short": ("info", f"description shorter than {DESC_MIN} characters"),
+    "canonical-missing":   ("error", "indexable page without alternates.canonical"),
+    "robots-missing":      ("warn",  "metadata has no robots directive"),
+    "og-missing":          ("warn",  "indexable page without openGraph"),
+    "og-image-missing":    ("info",  "openGraph has no images"),
+    "em-dash":             ("warn",  "em dash in a title, description or JSON-LD name/serviceType"),
+}
+SEVERITY_MARK = {"error": "✗", "warn": "⚠️ ", "info": "·"}
+
+_METADATA_RE = re.compile(r"export\s+const\s+metadata\b[^=]*=\s*\{")
+_GENERATE_RE = re.compile(r"export\s+(?:async\s+)?function\s+generateMetadata\s*\(|"
+                          r"export\s+const\s+generateMetadata\b[^=]*=\s*(?:async\s*)?\(")
+_REEXPORT_RE = re.compile(r"export\s*\{[^}]*\b(?:metadata|generateMetadata)\b[^}]*\}\s*from\s*[\"']([^\"']+)")
+_RETURN_OBJ_RE = re.compile(r"\breturn\s*\{")
+_CONTEXT_RE = re.compile(r"""["']@context["']\s*:""")
+_OBJ_START_RE = re.compile(r"[=(\[,:]\s*\{")
+_STATIC_PARAMS_RE = re.compile(r"export\s+(?:async\s+)?function\s+generateStaticParams\s*\(\s*\)[^{]*\{")
+_CONST_NAME_RE = re.compile(r"\b[A-Z][A-Z0-9_]{2,}\b")
+_REDIRECT_RE = re.compile(r"\b(?:permanentRedirect|redirect)\s*\(")
+_JSX_RE = re.compile(r"return\s*\(?\s*<")
+_USE_CLIENT_RE = re.compile(r"""^\s*(?:/[/*].*\n\s*)*["']use client["']""")
+
+
+# --------------------------------------------------------------------------
+# Extraction
+# --------------------------------------------------------------------------
+
+def _field(src, consts, vstart, vend):
+    """Describe one metadata value: literal text, resolved value, line."""
+    raw = src[vstart:vend]
+    value = string_value(raw)
+    if value is None and raw in consts:
+        value = string_value(consts[raw])
+    dynamic = value is None or "${" in value
+    return {"raw": raw, "value": None if dynamic else value, "line": line_of(src, vstart), "pos": vstart}
+
+
+def _entries(src, start):
+    return {key: (vs, ve) for key, vs, ve in object_entries(src, start)}
+
+
+def _metadata_block(src, consts, start, label):
+    """Flatten one metadata object literal into {field path: field}."""
+    fields = {}
+    entries = _entries(src, start)
+
+    def put(path, vs, ve):
+        fields[path] = _field(src, consts, vs, ve)
+
+    if "title" in entries:
+        vs, ve = entries["title"]
+        if src[vs] == "{":
+            sub = _entries(src, vs)
+            key = "absolute" if "absolute" in sub else "default" if "default" in sub else None
+            if key:
+                put("title", *sub[key])
+                fields["title"]["absolute"] = key == "absolute"
+        else:
+            put("title", vs, ve)
+    if "description" in entries:
+        put("description", *entries["description"])
+    if "alternates" in entries:
+        put("alternates", *entries["alternates"])
+        fields["alternates"]["key_pos"] = src.rfind("alternates", 0, entries["alternates"][0])
+    if "alternates" in entries and src[entries["alternates"][0]] == "{":
+        sub = _entries(src, entries["alternates"][0])
+        if "canonical" in sub:
+            put("canonical", *sub["canonical"])
+    if "robots" in entries:
+        put("robots", *entries["robots"])
+        raw = fields["robots"]["raw"]
+        fields["robots"]["noindex"] = bool(re.search(r"index\s*:\s*false|noindex", raw))
+    for group, prefix in (("openGraph", "og"), ("twitter", "twitter")):
+        if group not in entries:
+            continue
+        vs, _ = entries[group]
+        if src[vs] != "{":
+            fields[prefix] = _field(src, consts, *entries[group])
+            continue
+        fields[prefix] = {"raw": "{...}", "value": None, "line": line_of(src, vs), "pos": vs}
+        sub = _entries(src, vs)
+        for key in ("title", "description", "images", "url"):
+            if key in sub:
+                put(f"{prefix}.{key}", *sub[key])
+    return {"label": label, "line": line_of(src, start), "fields": fields}
+
+
+def _generate_metadata_blocks(src, consts, m):
+    paren = m.end() - 1
+    close = match_brace(src, paren)
+    body = src.find("{", close)
+    if body < 0:
+        return []
+    end = match_brace(src, body)
+    blocks = []
+    for r in _RETURN_OBJ_RE.finditer(src, body, end):
+        start = r.end() - 1
+        if not src[start + 1:match_brace(src, start)].strip():  # `return {}` for unknown slugs
+            continue
+        blocks.append(_metadata_block(src, consts, start, f"generateMetadata#{len(blocks) + 1}"))
+    if not blocks:
+        blocks.append({"label": "generateMetadata", "line": line_of(src, m.start()), "fields": None})
+    return blocks
+
+
+def _enclosing_object(src, pos):
+    """Start of the innermost object literal (opened after `=`, `(`, `[`, `,` or `:`) containing pos."""
+    starts = [m.end() - 1 for m in _OBJ_START_RE.finditer(src, 0, pos)]
+    for start in reversed(starts):
+        try:
+            if match_brace(src, start) > pos:
+                return start
+        except ValueError:
+            continue
+    return None
+
+
+def _jsonld(src, consts):
+    found, seen = [], set()
+    for m in _CONTEXT_RE.finditer(src):
+        start = _enclosing_object(src, m.start())
+        if start is None or start in seen:
+            continue
+        seen.add(start)
+        entries = _entries(src, start)
+        ld = {"line": line_of(src, start), "fields": {}}
+        if "@type" in entries:
+            ld["type"] = string_value(src[slice(*entries["@type"])])
+        for key in ("name", "serviceType"):
+            if key in entries:
+                ld["fields"][key] = _field(src, consts, *entries[key])
+        found.append(ld)
+    return found
+
+
+def parse_page(rel, src):
+    """Everything the audit needs from one page file (JSON-serialisable)."""
+    consts = top_level_consts(src)
+    blocks = []
+    m = _METADATA_RE.search(src)
+    if m:
+        blocks.append(_metadata_block(src, consts, m.end() - 1, "metadata"))
+    m = _GENERATE_RE.search(src)
+    if m:
+        blocks += _generate_metadata_blocks(src, consts, m)
+    m = _REEXPORT_RE.search(src)
+    if m:  # `export { metadata } from "../page"`: checked where it is defined
+        blocks.append({"label": f"re-export from {m.group(1)}", "line": line_of(src, m.start()), "fields": None})
+    m = _STATIC_PARAMS_RE.search(src)
+    params = sorted(set(_CONST_NAME_RE.findall(src, m.end(), match_brace(src, m.end() - 1)))) if m else None
+    return {
+        "client": bool(_USE_CLIENT_RE.match(src)),
+        "redirect": bool(_REDIRECT_RE.search(src)) and not _JSX_RE.search(src),
+        "blocks": blocks,
+        "jsonld": _jsonld(src, consts),
+        "static_params": params,  # constants generateStaticParams reads, e.g. ["MARKET_SLUGS"]
+    }
+
+
+def parse_layout(rel, src):
+    return {"metadata": bool(_METADATA_RE.search(src) or _GENERATE_RE.search(src))}
+
+
+# --------------------------------------------------------------------------
+# Rules
+# --------------------------------------------------------------------------
+
+def _finding(rule, field=None, block=None, line=None, value=None, message=None):
+    return {"rule": rule, "severity": RULES[rule][0], "field": field, "block": block,
+            "line": line, "value": value, "message": message or RULES[rule][1]}
+
+
+def _em_dash_findings(label, fields, paths):
+    out = []
+    for path in paths:
+        f = fields.get(path)
+        if f and EM_DASH in (f["value"] or f["raw"]):
+            out.append(_finding("em-dash", path, label, f["line"], f["value"] or f["raw"],
+                                f"em dash in {path}"))
+    return out
+
+
+def check_block(block):
+    label, fields = block["label"], block["fields"]
+    if fields is None:  # generateMetadata builds its result in a helper: nothing to check statically
+        return []
+    out = _em_dash_findings(label, fields, ("title", "description", "og.title", "og.description",
+                                            "twitter.title", "twitter.description"))
+    noindex = fields.get("robots", {}).get("noindex", False)
+
+    title = fields.get("title")
+    if not title:
+        if not noindex:
+            out.append(_finding("title-missing", "title", label, block["line"]))
+    elif title["value"] and len(title["value"]) > TITLE_MAX:
+        out.append(_finding("title-too-long", "title", label, title["line"], title["value"],
+                            f"title is {len(title['value'])} chars (max {TITLE_MAX})"))
+
+    desc = fields.get("description")
+    if not desc:
+        if not noindex:
+            out.append(_finding("description-missing", "description", label, block["line"]))
+    elif desc["value"]:
+        n = len(desc["value"])
+        if n > DESC_MAX:
+            out.append(_finding("description-too-long", "description", label, desc["line"], desc["value"],
+                                f"description is {n} chars (max {DESC_MAX})"))
+        elif n < DESC_MIN:
+            out.append(_finding("description-too-short", "description", label, desc["line"], desc["value"],
+                                f"description is {n} chars (min {DESC_MIN})"))
+
+    if "robots" not in fields:
+        out.append(_finding("robots-missing", "robots", label, block["line"]))
+    if noindex:
+        return out
+    if "canonical" not in fields:
+        out.append(_finding("canonical-missing", "alternates.canonical", label, block["line"]))
+    if "og" not in fields:
+        out.append(_finding("og-missing", "openGraph", label, block["line"]))
+    elif fields["og"]["raw"] == "{...}" and "og.images" not in fields:
+        out.append(_finding("og-image-missing", "openGraph.images", label, fields["og"]["line"]))
+    return out
+
+
+def check_page(rel, page, layouts):
+    """Findings for one parsed page; `layouts` is the set of dirs whose layout exports metadata."""
+    out = []
+    for block in page["blocks"]:
+        out += check_block(block)
+    for ld in page["jsonld"]:
+        out += _em_dash_findings(f"jsonld:{ld.get('type') or '?'}", ld["fields"], ("name", "serviceType"))
+    if not page["blocks"] and not page["redirect"] and not _inherits_metadata(rel, layouts):
+        why = "client component: move metadata to a layout.tsx" if page["client"] else None
+        out.append(_finding("metadata-missing", message=why))
+    return out
+
+
+def _inherits_metadata(rel, layouts):
+    d = os.path.dirname(rel)
+    while d != APP_DIR and d:  # the root layout's defaults don't count
+        if d in layouts:
+            return True
+        d = os.path.dirname(d)
+    return False
+
+
+# --------------------------------------------------------------------------
+# Driver
+# --------------------------------------------------------------------------
+
+def _parse_any(rel, src):
+    return parse_layout(rel, src) if os.path.basename(rel).startswith("layout.") else parse_page(rel, src)
+
+
+def audit(base=BASE, use_cache=True, workers=None):
+    """Parse (incrementally) and check every page.
+
+    Returns (report, stats): report is [(rel, route, page, findings)] sorted by
+    path; stats has the incremental counters plus elapsed milliseconds.
+    """
+    t0 = time.perf_counter()
+    path = incremental.cache_path(base, INDEX_NAME)
+    version = incremental.code_version(sys.modules[__name__], tsx)
+    index = incremental.load_index(path, version) if use_cache else {}
+    files = page_files(base) + app_files(base, ("layout.tsx",))
+    index, stats = incremental.refresh(base, files, index, _parse_any, workers)
+    if incremental.changed(stats) or not use_cache:
+        incremental.save_index(path, version, index)
+
+    layouts = {os.path.dirname(rel) for rel, e in index.items()
+               if os.path.basename(rel).startswith("layout.") and e["data"]["metadata"]}
+    report = []
+    for rel, entry in sorted(index.items()):
+        if os.path.basename(rel).startswith("layout."):
+            continue
+        page = entry["data"]
+        report.append((rel, route_for(rel), page, check_page(rel, page, layouts)))
+    stats["ms"] = (time.perf_counter() - t0) * 1000
+    return report, stats
+
+
+def _print_report(report, stats):
+    total = {}
+    for rel, route, _, findings in report:
+        if not findings:
+            continue
+        print(f"\n{rel}  ({route})")
+        for f in findings:
+            total[f["rule"]] = total.get(f["rule"], 0) + 1
+            where = f"L{f['line']}" if f["line"] else ""
+            loc = " ".join(x for x in (f["block"], f["field"]) if x)
+            print(f"  {SEVERITY_MARK[f['severity']]} {f['rule']:<22} {where:<6} {loc}: {f['message']}")
+            if f["value"]:
+                print(f"       {f['value'][:110]!r}")
+    print("\nSummary")
+    for rule, (severity, _) in RULES.items():
+        if rule in total:
+            print(f"  {SEVERITY_MARK[severity]} {rule:<22} {total[rule]}")
+    flagged = sum(1 for *_, f in report if f)
+    print(f"\n{len(report)} pages, {flagged} with findings — {stats['parsed']} parsed, "
+          f"{stats['cached'] + stats['rehashed']} from cache, {stats['ms']:.0f} ms")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Audit page metadata across app/**/page.tsx.")
+    ap.add_argument("--json", action="store_true", help="machine-readable findings on stdout")
+    ap.add_argument("--rule", action="append", choices=sorted(RULES), help="only report these rules")
+    ap.add_argument("--strict", action="store_true", help="exit 1 on any error or warning")
+    ap.add_argument("--no-cache", action="store_true", help="re-parse every file")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    report, stats = audit(BASE, use_cache=not args.no_cache, workers=args.workers)
+    if args.rule:
+        report = [(rel, route, page, [f for f in fs if f["rule"] in args.rule])
+                  for rel, route, page, fs in report]
+
+    if args.json:
+        out = [{"file": rel, "route": route, **f} for rel, route, _, fs in report for f in fs]
+        json.dump({"findings": out, "stats": stats}, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        _print_report(report, stats)
+
+    failing = any(f["severity"] != "info" for *_, fs in report for f in fs)
+    return 1 if args.strict and failing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""
+Turn SEO audit findings into a patch manifest and apply it.
+
+Fixes the mechanical findings the way seo_fix_all.py did by hand:
+
+  em-dash               " — " becomes " | " in titles / JSON-LD name and serviceType,
+                        ", " in descriptions
+  title-too-long        drop a trailing "| Executive Partners" (only from a plain page
+                        `title`, which the layout template re-brands; absolute titles,
+                        OG / Twitter titles and JSON-LD keep it), then trailing
+                        " | ..." segments until it fits
+  description-too-long  cut to the last full sentence that fits; dropping a clause
+                        changes what the page says, so that is left to a human
+  robots-missing        insert `robots: { index: true, follow: true },` after
+                        `alternates` (index: false for routes robots.txt disallows)
+
+Everything else (missing title, description, canonical, OG) needs a human and is
+listed at the end. The edits are written as a manifest (default
+.cache/seo-autofix.json, keep it with --manifest for review) and applied by
+ep_tools.manifest, so --dry-run prints the unified diff.
+
+Run from repo root:
+    python3 -m ep_tools.seo_autofix [--dry-run] [--rule em-dash] [--manifest PATH]
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from ep_tools import incremental, manifest
+from ep_tools.files import write_json_atomic
+from ep_tools.routes import is_disallowed, robots_disallow
+from ep_tools.seo_audit import BASE, DESC_MAX, DESC_MIN, TITLE_MAX, audit
+from ep_tools.tsx import top_level_consts
+
+FIXABLE = ("em-dash", "title-too-long", "description-too-long", "robots-missing")
+TITLE_FIELDS = {"title", "og.title", "twitter.title", "name", "serviceType"}
+DESC_FIELDS = {"description", "og.description", "twitter.description"}
+
+ROBOTS_INDEX = "robots: { index: true, follow: true },"
+ROBOTS_NOINDEX = "robots: { index: false, follow: false },"
+
+BRAND = "Executive Partners"
+_BRAND_SUFFIX = re.compile(rf"\s*[|–—-]\s*{BRAND}\s*$")
+_DASH = re.compile(r"\s*(?:—|\\u2014)\s*")
+_SENTENCE_END = re.compile(r"(?<=\w\w[.!?])\s+")  # not after initials like "Gil M."
+
+
+# --------------------------------------------------------------------------
+# Text transforms (on the literal's body, so escapes are preserved)
+# --------------------------------------------------------------------------
+
+def fix_dash(body, kind):
+    return _DASH.sub(" | " if kind == "title" else ", ", body)
+
+
+def shorten_title(body, limit=TITLE_MAX, keep_brand=False):
+    """Drop the brand (unless keep_brand: the layout template only re-brands templated
+    page titles), then trailing " | " segments, until body fits. None if it can't."""
+    if len(body) <= limit:
+        return body
+    suffix = ""
+    if keep_brand:
+        m = _BRAND_SUFFIX.search(body)
+        suffix = m.group(0) if m else ""
+    body = _BRAND_SUFFIX.sub("", body)
+    parts = body.split(" | ")
+    if len(parts) > 1 and parts[0] == BRAND and not keep_brand:
+        parts.pop(0)
+    while len(" | ".join(parts) + suffix) > limit and len(parts) > 1:
+        parts.pop()
+    body = " | ".join(parts) + suffix
+    if parts == [BRAND]:  # nothing left but the brand: needs a rewrite
+        return None
+    return body if len(body) <= limit else None
+
+
+def shorten_description(body, limit=DESC_MAX, floor=DESC_MIN):
+    """Cut at the last full sentence that fits. None if that leaves less than `floor`:
+    cutting clauses ("Dubai, Singapore, London and Riyadh." -> "Dubai, Singapore.")
+    changes the meaning, so those descriptions are rewritten by hand."""
+    if len(body) <= limit:
+        return body
+    kept = ""
+    for sentence in _SENTENCE_END.split(body):
+        candidate = f"{kept} {sentence}".strip()
+        if len(candidate) > limit:
+            break
+        kept = candidate
+    return kept if len(kept) >= floor else None
+
+
+# --------------------------------------------------------------------------
+# Findings -> edits
+# --------------------------------------------------------------------------
+
+def _kind(field):
+    return "title" if field in TITLE_FIELDS else "description" if field in DESC_FIELDS else None
+
+
+def _literal_target(field, consts):
+    """The string literal to edit for a field: inline, or the `const` it names."""
+    raw = field["raw"]
+    if raw in consts:
+        raw = consts[raw]
+    if len(raw) < 2 or raw[0] not in "\"'`" or raw[-1] != raw[0]:
+        return None
+    return raw
+
+
+def _literal_edits(rel, text, page, findings):
+    """One edit per distinct literal; rules from every field sharing it are combined."""
+    consts = top_level_consts(text)
+    fields = _fields_by_location(page)
+    wanted = {}  # raw literal -> {"kinds", "rules", "keep_brand"}
+    manual = []
+    for f in findings:
+        if f["rule"] not in ("em-dash", "title-too-long", "description-too-long"):
+            continue
+        field = fields.get((f["block"], f["field"]))
+        raw = field and _literal_target(field, consts)
+        if not raw:
+            manual.append(f)
+            continue
+        w = wanted.setdefault(raw, {"kinds": set(), "rules": set(), "findings": [], "keep_brand": False})
+        # Only a templated page title gets "| Executive Partners" back from the layout.
+        w["keep_brand"] |= f["field"] != "title" or bool(field.get("absolute"))
+        w["kinds"].add(_kind(f["field"]))
+        w["rules"].add(f["rule"])
+        w["findings"].append(f)
+
+    edits = []
+    for raw, w in wanted.items():
+        q, body = raw[0], raw[1:-1]
+        kind = "description" if w["kinds"] == {"description"} else "title"
+        new = fix_dash(body, kind) if "em-dash" in w["rules"] else body
+        if "title-too-long" in w["rules"]:
+            new = shorten_title(new, keep_brand=w["keep_brand"]) if "${" not in new else None
+        elif "description-too-long" in w["rules"]:
+            new = shorten_description(new) if "${" not in new else None
+        if new is None or new == body:
+            manual += w["findings"]
+            continue
+        edits.append({"file": rel, "old": raw, "new": q + new + q, "count": "all"})
+    return edits, manual
+
+
+def _fields_by_location(page):
+    out = {}
+    for block in page["blocks"]:
+        for path, field in (block["fields"] or {}).items():
+            out[(block["label"], path)] = field
+    for ld in page["jsonld"]:
+        for path, field in ld["fields"].items():
+            out[(f"jsonld:{ld.get('type') or '?'}", path)] = field
+    return out
+
+
+def _robots_edit(rel, text, block, noindex):
+    """Insert a robots entry right after `alternates: ...,` (or `description`) in this block."""
+    fields = block["fields"]
+    anchor = fields.get("alternates") or fields.get("description")
+    if not anchor:
+        return None
+    start = anchor.get("key_pos", -1)
+    if start < 0:
+        start = text.rfind("description", 0, anchor["pos"])
+    end = anchor["pos"] + len(anchor["raw"])
+    if text[end:end + 1] == ",":
+        end += 1
+    old = text[start:end]
+    robots = ROBOTS_NOINDEX if noindex else ROBOTS_INDEX
+    line_start = text.rfind("\n", 0, start) + 1
+    indent = text[line_start:start]
+    rest = text[end:text.find("\n", end)]
+    if not old.endswith(",") or text.count(old) != 1:
+        return None
+    if indent.strip() or rest.strip():  # one-line object: insert inline
+        new = f"{old} {robots}"
+    else:
+        new = f"{old}\n{indent}{robots}"
+    return {"file": rel, "old": old, "new": new}
+
+
+def build_manifest(base=BASE, rules=FIXABLE):
+    """Audit, then turn fixable findings into manifest sections. Returns (manifest, manual findings)."""
+    report, stats = audit(base)
+    disallow = robots_disallow(base)
+    sections, manual = [], []
+    for rel, route, page, findings in report:
+        findings = [f for f in findings if f["rule"] in rules]
+        if not findings:
+            continue
+        with open(os.path.join(base, rel), encoding="utf-8") as fh:
+            text = fh.read()
+        edits, skipped = _literal_edits(rel, text, page, findings)
+        manual += [(rel, f) for f in skipped]
+        blocks = {b["label"]: b for b in page["blocks"]}
+        for f in findings:
+            if f["rule"] != "robots-missing":
+                continue
+            edit = _robots_edit(rel, text, blocks[f["block"]], is_disallowed(route, disallow))
+            if edit:
+                edits.append(edit)
+            else:
+                manual.append((rel, f))
+        if edits:
+            sections.append({"title": f"{route}  ({rel})", "edits": edits})
+    for rel, route, page, findings in report:
+        manual += [(rel, f) for f in findings if f["rule"] not in FIXABLE and f["severity"] != "info"]
+    return {"description": "Generated by ep_tools.seo_autofix from seo_audit findings.",
+            "sections": sections}, manual
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Generate and apply fixes for SEO audit findings.")
+    ap.add_argument("--dry-run", action="store_true", help="print a unified diff, write nothing")
+    ap.add_argument("--rule", action="append", choices=FIXABLE, help="only fix these rules")
+    ap.add_argument("--manifest", default=incremental.cache_path(BASE, "seo-autofix.json"),
+                    help="where to write the generated manifest")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    data, manual = build_manifest(BASE, tuple(args.rule or FIXABLE))
+    n = sum(len(s["edits"]) for s in data["sections"])
+    write_json_atomic(args.manifest, data, indent=2)
+    print(f"{n} edits across {len(data['sections'])} pages -> {os.path.relpath(args.manifest, BASE)}")
+
+    status = manifest.run(BASE, args.manifest, dry_run=args.dry_run, workers=args.workers) if n else 0
+
+    if manual:
+        print(f"\n{len(manual)} findings need a hand fix:")
+        for rel, f in manual:
+            print(f"  ⚠️  {rel}  L{f['line'] or '-'}  {f['rule']}  {f['field'] or ''}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
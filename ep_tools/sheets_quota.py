@@ -0,0 +1,344 @@
+"""
+One Sheets API budget for every process that talks to the BP spreadsheet.
+
+The Streamlit processes and the batch tools (bp_dedupe, bp_shards) all use the
+same service account, and Google enforces its quota per account: about 60 read
+and 60 write requests per minute. Each process used to find out only from a
+429 raised in connect_sheet() or on save. Here every gspread call goes
+through a token bucket per operation kind (read / write) whose state lives in
+.cache/sheets_quota.json under an exclusive flock, so all processes on the
+host draw from the same buckets:
+
+    capacity BURST tokens, refilled at (PER_MINUTE - BURST) / 60 per second,
+    so no 60 s window ever holds more than PER_MINUTE calls
+
+A call that finds the bucket empty waits for the next token, for at most its
+patience (READ_PATIENCE / WRITE_PATIENCE), or inside a patience(s) block for
+what is left of the block's deadline: every call in the block shares those s
+seconds. Past that it raises QuotaError without calling Google. Calls inside
+an optional() block (syncs that may be skipped) never wait and leave the last
+RESERVE tokens to the calls that must go through: while the bucket is that low
+or a backoff is on they raise QuotaError without taking a token. A 429 anyway (another
+host, a manual edit burst) empties the bucket and opens a backoff window —
+doubling from BACKOFF_MIN to BACKOFF_MAX seconds, with jitter, halving again
+on each success — that all processes respect; the call is retried up to
+RETRIES times.
+
+limited(obj) wraps a gspread Spreadsheet / Worksheet so its methods go through
+the buckets and the worksheets it returns are wrapped too. Counters (calls,
+retries, throttled, rejected, skipped, errors, seconds waited, calls in the current
+minute) are kept in the same file; metrics() returns them. Taking a token, and
+counting the wait or the rejection that came with it, is one locked
+read-modify-write of the file.
+
+Run from repo root:
+    python3 -m ep_tools.sheets_quota              metrics
+    python3 -m ep_tools.sheets_quota --reset      clear buckets, backoff and counters
+"""
+
+import argparse
+import fcntl
+import json
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+
+from ep_tools import incremental
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+STATE_NAME = "sheets_quota.json"
+READ, WRITE = "read", "write"
+OPS = (READ, WRITE)
+PER_MINUTE = {READ: int(os.environ.get("EP_SHEETS_READS_PER_MIN", "60")),
+              WRITE: int(os.environ.get("EP_SHEETS_WRITES_PER_MIN", "60"))}
+BURST = 10
+READ_PATIENCE = 10.0   # seconds a read may wait for a token
+WRITE_PATIENCE = 30.0  # a save is worth waiting for
+RETRIES = 3
+RESERVE = 3  # tokens optional() calls leave to the ones that must go through
+BACKOFF_MIN, BACKOFF_MAX = 1.0, 64.0
+
+READ_METHODS = frozenset({
+    "row_values", "col_values", "get", "get_values", "get_all_values", "get_all_records", "batch_get",
+    "acell", "cell", "worksheets", "worksheet", "fetch_sheet_metadata",
+})
+WRITE_METHODS = frozenset({
+    "update", "update_cell", "update_acell", "append_row", "append_rows", "insert_row", "insert_rows",
+    "batch_update", "batch_clear", "clear", "resize", "delete_rows", "add_worksheet", "del_worksheet",
+    "duplicate",
+})
+
+_local = threading.local()
+
+
+class QuotaError(ValueError):
+    pass
+
+
+def is_quota_error(e):
+    """True for a gspread APIError (or similar) reporting HTTP 429 / RESOURCE_EXHAUSTED."""
+    if getattr(e, "code", None) == 429 or getattr(getattr(e, "response", None), "status_code", None) == 429:
+        return True
+    text = str(e)
+    return "RESOURCE_EXHAUSTED" in text or "Quota exceeded" in text or "[429]" in text
+
+
+@contextmanager
+def patience(seconds):
+    """Calls on this thread within the block wait at most `seconds` for tokens in total (0: take one or fail).
+
+    The deadline covers the whole block; a nested block cannot extend its enclosing one.
+    """
+    old = getattr(_local, "deadline", None)
+    deadline = time.monotonic() + seconds
+    _local.deadline = deadline if old is None else min(old, deadline)
+    try:
+        yield
+    finally:
+        _local.deadline = old
+
+
+@contextmanager
+def optional(reserve=RESERVE):
+    """Calls on this thread within the block may fail: each takes a token only while more than
+    `reserve` are left and no backoff is on, else raises QuotaError at once without taking one."""
+    old = getattr(_local, "reserve", None)
+    _local.reserve = reserve
+    try:
+        yield
+    finally:
+        _local.reserve = old
+
+
+def _new_state():
+    return {"buckets": {op: {"tokens": float(BURST), "at": time.time(), "backoff": 0.0, "until": 0.0} for op in OPS},
+            "counters": {op: dict.fromkeys(("calls", "retries", "throttled", "rejected", "skipped", "errors"), 0)
+                         | {"waited_s": 0.0} for op in OPS},
+            "recent": {op: {} for op in OPS}}  # op -> {epoch minute: calls}
+
+
+class Quota:
+    def __init__(self, path, per_minute=None, burst=BURST):
+        self.path = path
+        self.per_minute = dict(per_minute or PER_MINUTE)
+        self.burst = burst
+
+    def _rate(self, op):
+        return max(self.per_minute[op] - self.burst, 1) / 60.0
+
+    @contextmanager
+    def _state(self):
+        """The shared state, read and written back under an exclusive flock on the state file."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a+", encoding="utf-8") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or "null") or _new_state()
+                except ValueError:  # torn write from a killed process: start afresh
+                    state = _new_state()
+                yield state
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state, separators=(",", ":")))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _take(self, op, left=None, waited=0.0, reserve=0):
+        """One locked read-modify-write: refill, then take a token if more than `reserve` are left.
+
+        Returns (0.0, backoff) when a token was taken, else (seconds until one may be
+        available, backoff). `waited` is counted with the token; with `left` (seconds the
+        caller may still wait) a delay beyond it is counted as rejected, or as skipped
+        for an optional call (reserve), in the same write.
+        """
+        now = time.time()
+        with self._state() as state:
+            b, counters = state["buckets"][op], state["counters"][op]
+            b["tokens"] = min(self.burst, b["tokens"] + (now - b["at"]) * self._rate(op))
+            b["at"] = now
+            if now < b["until"]:
+                delay = b["until"] - now
+            elif b["tokens"] >= 1 + reserve:
+                b["tokens"] -= 1
+                counters["calls"] += 1
+                counters["waited_s"] += waited
+                minute = str(int(now // 60))
+                recent = state["recent"][op]
+                recent[minute] = recent.get(minute, 0) + 1
+                for m in [m for m in recent if int(m) < int(minute) - 60]:
+                    del recent[m]
+                return 0.0, b["backoff"]
+            else:
+                delay = (1 + reserve - b["tokens"]) / self._rate(op)
+            if left is not None and delay > left:
+                kind = "skipped" if reserve else "rejected"
+                counters[kind] = counters.get(kind, 0) + 1
+                counters["waited_s"] += waited
+            return delay, b["backoff"]
+
+    def try_acquire(self, op):
+        """Take a token: 0.0 if one was taken, else seconds until one may be available."""
+        return self._take(op)[0]
+
+    def acquire(self, op, wait=None):
+        """Block until a token is taken; QuotaError after `wait` seconds
+        (default: what is left of the patience() block, else the op's patience;
+        0 in an optional() block). Returns (seconds waited, backoff in force)."""
+        reserve = getattr(_local, "reserve", None) or 0
+        if reserve:
+            wait = 0.0
+        if wait is None:
+            deadline = getattr(_local, "deadline", None)
+            if deadline is not None:
+                wait = max(deadline - time.monotonic(), 0.0)
+        if wait is None:
+            wait = READ_PATIENCE if op == READ else WRITE_PATIENCE
+        deadline, waited = time.monotonic() + wait, 0.0
+        while True:
+            left = deadline - time.monotonic()
+            delay, backoff = self._take(op, left, waited, reserve)
+            if delay == 0.0:
+                return waited, backoff
+            if delay > left:
+                what = "busy: optional call skipped" if reserve else "quota exhausted"
+                raise QuotaError(f"Google Sheets {op} {what} (next slot in {delay:.0f}s)")
+            time.sleep(delay)
+            waited += delay
+
+    def _count(self, op, **incs):
+        with self._state() as state:
+            for k, v in incs.items():
+                state["counters"][op][k] += v
+
+    def throttled(self, op, retrying=False):
+        """Google answered 429: empty the bucket and back off (shared by every process)."""
+        now = time.time()
+        with self._state() as state:
+            b = state["buckets"][op]
+            b["backoff"] = min(max(b["backoff"] * 2, BACKOFF_MIN), BACKOFF_MAX)
+            b["until"] = max(b["until"], now + b["backoff"] * random.uniform(1.0, 1.25))
+            b["tokens"], b["at"] = 0.0, now
+            state["counters"][op]["throttled"] += 1
+            state["counters"][op]["retries"] += int(retrying)
+
+    def _succeeded(self, op):
+        with self._state() as state:
+            b = state["buckets"][op]
+            if b["backoff"]:
+                b["backoff"] = b["backoff"] / 2 if b["backoff"] > BACKOFF_MIN else 0.0
+
+    def call(self, op, fn, *args, **kwargs):
+        """fn(*args, **kwargs) within the `op` budget, retrying on 429.
+
+        Without a backoff in force this is a single lock of the state file (the token taken).
+        """
+        for attempt in range(RETRIES + 1):
+            _, backoff = self.acquire(op)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not is_quota_error(e):
+                    self._count(op, errors=1)
+                    raise
+                self.throttled(op, retrying=attempt < RETRIES)
+                if attempt == RETRIES:
+                    raise QuotaError(f"Google Sheets {op} quota exhausted after {RETRIES} retries") from e
+                continue
+            if backoff:
+                self._succeeded(op)
+            return result
+
+    def metrics(self):
+        """{op: counters + tokens, backoff_s, blocked_s, per_minute, this_minute} for each op."""
+        now = time.time()
+        with self._state() as state:
+            out = {}
+            for op in OPS:
+                b = state["buckets"][op]
+                tokens = min(self.burst, b["tokens"] + (now - b["at"]) * self._rate(op))
+                minute, recent = int(now // 60), state["recent"][op]
+                out[op] = {"skipped": 0, **state["counters"][op], "tokens": round(tokens, 2), "backoff_s": b["backoff"],
+                           "blocked_s": round(max(b["until"] - now, 0.0), 1), "per_minute": self.per_minute[op],
+                           "this_minute": recent.get(str(minute), 0)}
+        return out
+
+    def reset(self):
+        with self._state() as state:
+            state.clear()
+            state.update(_new_state())
+
+
+@lru_cache(maxsize=None)
+def default(base=BASE):
+    """The process-wide Quota for this checkout (.cache/sheets_quota.json)."""
+    return Quota(incremental.cache_path(base, STATE_NAME))
+
+
+class Limited:
+    """A gspread Spreadsheet / Worksheet whose API calls draw on a Quota."""
+
+    __slots__ = ("_obj", "_quota")
+
+    def __init__(self, obj, quota):
+        self._obj = obj
+        self._quota = quota
+
+    def __getattr__(self, name):
+        attr = getattr(self._obj, name)
+        op = READ if name in READ_METHODS else WRITE if name in WRITE_METHODS else None
+        if op is None or not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            return _wrap(self._quota.call(op, attr, *args, **kwargs), self._quota)
+
+        return call
+
+    def __repr__(self):
+        return f"Limited({self._obj!r})"
+
+
+def _wrap(result, quota):
+    if hasattr(result, "row_values") or hasattr(result, "worksheets"):
+        return Limited(result, quota)
+    if isinstance(result, list) and result and hasattr(result[0], "row_values"):
+        return [Limited(ws, quota) for ws in result]
+    return result
+
+
+def limited(obj, quota=None):
+    return obj if isinstance(obj, Limited) else Limited(obj, quota or default())
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Show (or reset) the shared Sheets API quota state.")
+    ap.add_argument("--reset", action="store_true")
+    ap.add_argument("--json", action="store_true", help="print the metrics as JSON")
+    args = ap.parse_args(argv)
+    quota = default()
+    if args.reset:
+        quota.reset()
+        print("  ✓ quota state reset")
+        return 0
+    metrics = quota.metrics()
+    if args.json:
+        print(json.dumps(metrics, indent=2))
+        return 0
+    for op, m in metrics.items():
+        print(f"  {op:5}  {m['this_minute']:3}/{m['per_minute']} this minute  tokens {m['tokens']:5.2f}  "
+              f"calls {m['calls']}  retries {m['retries']}  429s {m['throttled']}  rejected {m['rejected']}  skipped {m['skipped']}  "
+              f"errors {m['errors']}  waited {m['waited_s']:.1f}s"
+              + (f"  ⚠️ backing off {m['blocked_s']}s" if m["blocked_s"] else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Concurrent-session load test of the Business Plan Simulator (streamlit_app.py).
+
+Drives the app headlessly with Streamlit's AppTest, one AppTest per simulated
+candidate, all in this process — as one Streamlit server holds its sessions,
+sharing the st.cache_resource objects (theme, benchmarks, rollups, duplicate
+index). Each session walks the journey of a real visit, one rerun per
+interaction, the way the browser reruns the script on every widget change:
+
+    open → Section 1 (identity, role, location, employer, market, pay, AUM)
+    → Section 2 NNM → 2 prospects (fill + ➕ Add) → Section 4 ROA
+    → Admin Mode on (segment tolerance) → off → ⬇️ Download (saves the row)
+    → Download again (exercises the duplicate check)
+
+Sheet I/O goes to the in-process fake (ep_tools.fake_sheets, via
+EP_SHEETS_BACKEND=fake) and every cache, including the shared Sheets quota, to
+a temporary EP_CACHE_DIR, so nothing touches Google or the checkout and the
+harness runs in CI. The quota keeps its default per-minute budget, so Sheets
+calls made on reruns show up as time waited for tokens (reported per op).
+
+AppTest swaps a process-global Runtime in for each run, so reruns execute one
+at a time: sessions run concurrently in threads and their reruns queue. For
+this CPU-bound script that is close to how Streamlit's script threads share
+one interpreter's GIL; fake Sheets latency is not overlapped with other
+sessions' work, so with a large --latency-ms the figures are pessimistic.
+Reported:
+
+    rerun latency     p50 / p95 / p99 over all reruns, as a session sees it
+                      (queueing behind other sessions included)
+    service time      the same without the queueing, overall and per step
+    throughput        reruns/s and sessions/min over the wall time
+    memory            RSS growth per live session (all sessions are kept alive
+                      until the end), and peak RSS
+    saves             rows in the fake sheet, save status messages seen
+    quota             Sheets calls, seconds waited and rejections, reads / writes
+
+Exit status 1 when any rerun raised (CI gate).
+
+Run from repo root:
+    python3 -m ep_tools.simulator_load [--sessions 8] [--concurrency 4] [--latency-ms 20] [--json report.json]
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+APP = "streamlit_app.py"
+TIMEOUT = 120  # seconds per rerun
+PAGE = 4096
+
+# AppTest installs a process-global Runtime for the length of each run, so two
+# runs cannot overlap: sessions run in threads, their reruns queue here.
+_RUN_LOCK = threading.Lock()
+
+
+def _rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * PAGE / 2**20
+    except OSError:  # not Linux: fall back to the peak
+        return _peak_mb()
+
+
+def _peak_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+def _percentiles(values):
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    v = sorted(values)
+    pick = lambda q: v[min(len(v) - 1, int(round(q * (len(v) - 1))))]  # noqa: E731
+    return {f"p{int(q * 100)}": round(pick(q) * 1000, 1) for q in (0.5, 0.95, 0.99)}
+
+
+class Session:
+    """One simulated candidate: an AppTest and the timings of its reruns."""
+
+    def __init__(self, n, app_path):
+        from streamlit.testing.v1 import AppTest
+
+        self.n = n
+        self.at = AppTest.from_file(app_path, default_timeout=TIMEOUT)
+        self.timings = []  # (step, seconds incl. queueing, seconds running)
+        self.errors = []
+
+    def _rerun(self, step, run=None):
+        t0 = time.perf_counter()
+        with _RUN_LOCK:
+            t1 = time.perf_counter()
+            (run or self.at.run)()
+        t2 = time.perf_counter()
+        self.timings.append((step, t2 - t0, t2 - t1))
+        if self.at.exception:
+            self.errors.append(f"{step}: {self.at.exception[0].value}")
+
+    def _set(self, kind, label, value, step):
+        widgets = getattr(self.at, kind)
+        widget = next((w for w in widgets if w.label == label), None)
+        if widget is None:
+            self.errors.append(f"{step}: no {kind} {label!r}")
+            return
+        (widget.select(value) if kind == "selectbox" else widget.set_value(value))
+        self._rerun(step)
+
+    def _click(self, label, step):
+        button = next((b for b in self.at.button if b.label == label), None)
+        if button is None:
+            self.errors.append(f"{step}: no button {label!r}")
+            return
+        button.click()
+        self._rerun(step)
+
+    def _download(self, step):
+        # AppTest has no download_button element: send its trigger like the browser does.
+        buttons = self.at.get("download_button")
+        if not buttons:
+            self.errors.append(f"{step}: download button not shown")
+            return
+        states = self.at._tree.get_widget_states()
+        trigger = states.widgets.add()
+        trigger.id = buttons[0].proto.id
+        trigger.trigger_value = True
+        self._rerun(step, lambda: self.at._run(states))
+
+    def journey(self):
+        n = self.n
+        self._rerun("open")
+        for kind, label, value in (
+            ("text_input", "Candidate Name", f"Load Candidate {n}"),
+            ("text_input", "Candidate Email *", f"load{n}@example.com"),
+            ("number_input", "Years of Experience *", 8 + n % 15),
+            ("selectbox", "Current Role *", "Director"),
+            ("selectbox", "Candidate Location *", ("Geneva", "Zurich", "Dubai", "Lisbon")[n % 4]),
+            ("text_input", "Current Employer *", ("UBS", "Pictet", "Julius Baer", "EFG")[n % 4]),
+            ("selectbox", "Current Market *", ("CH Onshore", "MEA", "Portugal", "Brazil")[n % 4]),
+            ("number_input", "Current Base Salary (CHF) *", 250_000 + 1000 * n),
+            ("number_input", "Last Bonus (CHF) *", 80_000),
+            ("number_input", "Current Number of Clients *", 40 + n % 50),
+            ("number_input", "Current Assets Under Management (in million CHF) *", 300.0 + n),
+        ):
+            self._set(kind, label, value, "section1")
+        for y, nnm in ((1, 40.0), (2, 55.0), (3, 70.0)):
+            self._set("number_input", f"NNM Year {y} (in M CHF)", nnm + n % 10, "section2")
+        for p in range(2):
+            for kind, label, value in (("text_input", "Name", f"Prospect {n}-{p}"),
+                                       ("number_input", "Wealth (M)", 20.0 + p),
+                                       ("number_input", "Best NNM (M)", 10.0 + p),
+                                       ("number_input", "Worst NNM (M)", 4.0 + p)):
+                self._set(kind, label, value, "prospect")
+            self._click("➕ Add", "prospect_add")
+        self._set("number_input", "ROA % Year 1", 0.9, "section4")
+        admin = self.at.sidebar.checkbox[0]
+        admin.check()
+        self._rerun("admin_on")
+        self._set("slider", "NNM vs Prospects tolerance (%)", 15, "admin")
+        self.at.sidebar.checkbox[0].uncheck()
+        self._rerun("admin_off")
+        self._download("download")
+        self._download("download_again")
+        return self
+
+    def status_messages(self):
+        return [c.value for c in self.at.caption if "Google Sheet" in c.value]
+
+
+def _saved_rows(fake_sheets):
+    sheet = next(iter(fake_sheets.FakeClient._sheets.values()), None)
+    if sheet is None:
+        return 0
+    return sum(max(len(ws.get_all_values()) - 1, 0) for ws in sheet._tabs if ws.title.startswith("BP_Entries"))
+
+
+def run(sessions=8, concurrency=4, latency_ms=20.0, app=APP):
+    """Run `sessions` journeys, `concurrency` at a time; returns the report dict."""
+    tmp = tempfile.mkdtemp(prefix="ep-simload-")
+    os.environ.update({
+        "EP_SHEETS_BACKEND": "fake",
+        "EP_FAKE_SHEETS_LATENCY_MS": str(latency_ms),
+        "EP_FAKE_SHEETS_QUOTA": "0",  # Google's quota is the limiter's job here (at its default budget)
+        "EP_CACHE_DIR": tmp,
+    })
+    from ep_tools import fake_sheets, sheets_quota
+
+    app_path = os.path.join(BASE, app)
+    Session(-1, app_path).journey()  # warm-up: imports, theme, caches, the shared sheet connection
+    rows0 = _saved_rows(fake_sheets)
+    quota = sheets_quota.default()
+    quota.reset()
+    rss0 = _rss_mb()
+
+    done, lock = [], threading.Lock()
+
+    def one(n):
+        s = Session(n, app_path).journey()
+        with lock:
+            done.append(s)
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for f in [pool.submit(one, n) for n in range(sessions)]:
+            f.result()
+    wall = time.perf_counter() - t0
+    rss1 = _rss_mb()
+
+    timings = [t for s in done for _, t, _ in s.timings]
+    service = [t for s in done for _, _, t in s.timings]
+    by_step = {}
+    for s in done:
+        for step, _, t in s.timings:
+            by_step.setdefault(step, []).append(t)
+    rows = _saved_rows(fake_sheets) - rows0
+    spent = quota.metrics()
+    messages = {}
+    for s in done:
+        for m in s.status_messages():
+            messages[m] = messages.get(m, 0) + 1
+    return {
+        "sessions": sessions, "concurrency": concurrency, "fake_latency_ms": latency_ms,
+        "wall_s": round(wall, 2), "reruns": len(timings),
+        "reruns_per_s": round(len(timings) / wall, 2) if wall else 0.0,
+        "sessions_per_min": round(sessions / wall * 60, 2) if wall else 0.0,
+        "rerun_ms": _percentiles(timings),
+        "service_ms": _percentiles(service),
+        "steps_ms": {step: _percentiles(v) for step, v in by_step.items()},
+        "memory_mb": {"per_session": round((rss1 - rss0) / sessions, 2) if sessions else 0.0,
+                      "rss_start": round(rss0, 1), "rss_end": round(rss1, 1), "peak": round(_peak_mb(), 1)},
+        "saved_rows": rows, "save_messages": messages,
+        "quota": {op: {k: m[k] for k in ("calls", "waited_s", "rejected", "throttled")} for op, m in spent.items()},
+        "errors": [e for s in done for e in s.errors],
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Headless concurrent-session load test of streamlit_app.py.")
+    ap.add_argument("--sessions", type=int, default=8)
+    ap.add_argument("--concurrency", type=int, default=4, help="sessions running at once")
+    ap.add_argument("--latency-ms", type=float, default=20.0, help="fake Sheets API latency")
+    ap.add_argument("--json", help="also write the report here")
+    args = ap.parse_args(argv)
+
+    r = run(args.sessions, args.concurrency, args.latency_ms)
+    print(f"  {r['sessions']} sessions ({r['concurrency']} at a time): {r['reruns']} reruns in {r['wall_s']}s "
+          f"→ {r['reruns_per_s']} reruns/s, {r['sessions_per_min']} sessions/min")
+    for label, key in (("rerun", "rerun_ms"), ("service", "service_ms")):
+        lat = r[key]
+        print(f"  {label:8} p50 {lat['p50']} ms · p95 {lat['p95']} ms · p99 {lat['p99']} ms")
+    for step, p in r["steps_ms"].items():
+        print(f"    {step:15} p50 {p['p50']:7} ms · p95 {p['p95']:7} ms")
+    m = r["memory_mb"]
+    print(f"  memory   {m['per_session']} MB per live session · RSS {m['rss_start']} → {m['rss_end']} MB "
+          f"(peak {m['peak']} MB)")
+    print(f"  saves    {r['saved_rows']} rows · {r['save_messages']}")
+    for op, q in r["quota"].items():
+        print(f"  quota    {op}s: {q['calls']} calls · {q['waited_s']:.1f}s waited · {q['rejected']} rejected")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(r, f, indent=2, ensure_ascii=False)
+        print(f"  ✓ wrote {args.json}")
+    for e in r["errors"][:20]:
+        print(f"  ⚠️ {e}")
+    return 1 if r["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""
+Offline sitemap / robots.txt generator.
+
+app/sitemap.ts builds /sitemap.xml per request, including a jobs API call. This
+build step writes the same information as static files instead:
+
+    sitemap-pages-1.xml      indexable app routes (from the route index)
+    sitemap-markets-1.xml    /en/markets/* and /en/private-banker-jobs/*
+    sitemap-insights-1.xml   /en/insights/<slug>, lastmod = article date
+    sitemap-jobs-1.xml       live jobs from data/jobs.json (FALLBACK_JOB_SLUGS if none)
+    sitemap-index.xml        index of the above
+
+plus a byte-stable .gz next to each file (for nginx gzip_static / CDN upload).
+These are gitignored. With --robots, robots.txt (+ .gz) is written too:
+public/robots.txt's rules with its Sitemap: line pointed at sitemap-index.xml.
+With the default --out public that rewrites the tracked file itself, which is
+the switch-over to the static sitemaps, so it is never done implicitly.
+Shards split at --shard-size URLs (protocol limit 50,000).
+
+Routes are the indexable, sitemap-worthy pages from ep_tools.sitemap_check:
+pages listed in app/sitemap.ts or carrying their own canonical, minus
+redirects, noindex and robots.txt-disallowed paths. data/articles.json only
+contributes dates: its entries are LinkedIn articles, reachable on the site
+only through the noindex /go/linkedin-article/ route.
+
+Output is deterministic (no "now" lastmod), so unchanged inputs rewrite nothing.
+
+Run from repo root:
+    python3 -m ep_tools.sitemap_build [--out public] [--shard-size 50000] [--robots]
+"""
+
+import argparse
+import datetime as dt
+import gzip
+import json
+import os
+import sys
+from xml.sax.saxutils import escape
+
+from ep_tools import incremental, tsx
+from ep_tools.articles import INDEX as INSIGHTS_INDEX
+from ep_tools.files import print_summary, write_bytes, write_text
+from ep_tools.routes import robots_disallow
+from ep_tools.seo_audit import audit
+from ep_tools.sitemap_check import app_routes, load_sources
+from ep_tools.tsx import find_const, string_array
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+SITE = "https://www.execpartners.ch"
+SHARD_SIZE = 50_000
+INDEX_NAME = "sitemap-build.json"
+ROBOTS_SRC = "public/robots.txt"
+JOBS_JSON = "data/jobs.json"
+ARTICLES_JSON = "data/articles.json"
+SITEMAP_TS = "app/sitemap.ts"
+
+# Same weights as app/sitemap.ts.
+DAILY = {"/", "/en", "/insights", "/en/insights"}
+PRIORITY = {"/": 1.0, "/en": 1.0, "/insights": 0.8, "/en/insights": 0.8}
+SECTION_PRIORITY = {"pages": 0.7, "markets": 0.75, "insights": 0.8, "jobs": 0.8}
+
+
+# --------------------------------------------------------------------------
+# Inputs
+# --------------------------------------------------------------------------
+
+def _parse_input(rel, text):
+    if rel == INSIGHTS_INDEX:
+        return {slug: meta["date"] for slug, meta in json.loads(text)["articles"].items()}
+    if rel == SITEMAP_TS:
+        start = find_const(text, "FALLBACK_JOB_SLUGS")
+        return string_array(text, start) if start >= 0 else []
+    return json.loads(text)
+
+
+def load_inputs(base=BASE):
+    path = incremental.cache_path(base, INDEX_NAME)
+    version = incremental.code_version(sys.modules[__name__], tsx)
+    rels = [INSIGHTS_INDEX, SITEMAP_TS, JOBS_JSON, ARTICLES_JSON]
+    files = [(rel, os.stat(os.path.join(base, rel))) for rel in rels if os.path.exists(os.path.join(base, rel))]
+    index, stats = incremental.refresh(base, files, incremental.load_index(path, version), _parse_input)
+    if incremental.changed(stats):
+        incremental.save_index(path, version, index)
+    return {rel: index[rel]["data"] if rel in index else None for rel in rels}
+
+
+def _date(value):
+    """YYYY-MM-DD from an ISO date/datetime string, or None."""
+    if not value:
+        return None
+    try:
+        return dt.date.fromisoformat(str(value)[:10]).isoformat()
+    except ValueError:
+        return None
+
+
+def _live(job, today):
+    until = _date(job.get("validThrough"))
+    return job.get("slug") and job.get("active", True) not in (False, "false") and (until is None or until >= today)
+
+
+def collect(base=BASE, today=None):
+    """{section: [(path, lastmod or None)]} for every URL that belongs in the sitemap."""
+    today = today or dt.date.today().isoformat()
+    report, _ = audit(base)
+    sources = load_sources(base)
+    inputs = load_inputs(base)
+    expected, _, _, _ = app_routes(report, sources, robots_disallow(base))
+
+    # Pages that opted into search: listed in app/sitemap.ts or carrying a canonical.
+    listed = {("/" + p.strip("/")).rstrip("/") or "/" for p in sources["sitemap"]["static"]}
+    canonical = set()
+    for rel, route, page, _ in report:
+        if "[" not in route and any((b["fields"] or {}).get("canonical") for b in page["blocks"]):
+            canonical.add(route)
+    markets = {f"{prefix}/{slug}" for slug in sources["MARKET_SLUGS"]
+               for prefix in ("/en/markets", "/en/private-banker-jobs")}
+    insight_dates = inputs[INSIGHTS_INDEX] or {}
+    for a in inputs[ARTICLES_JSON] or []:  # LinkedIn re-publications of site articles
+        if a.get("slug") in insight_dates and _date(a.get("date")):
+            insight_dates[a["slug"]] = max(filter(None, (insight_dates[a["slug"]], _date(a["date"]))))
+    insights = {f"/en/insights/{slug}" for slug in insight_dates}
+
+    pages = (expected & (listed | canonical)) - markets - insights
+    jobs = [j for j in inputs[JOBS_JSON] or [] if _live(j, today)]
+    job_urls = [(f"/en/jobs/{j['slug']}", _date(j.get("updatedAt") or j.get("datePosted"))) for j in jobs]
+    if not job_urls:  # same fallback as app/sitemap.ts
+        job_urls = [(f"/en/jobs/{slug}", None) for slug in inputs[SITEMAP_TS] or []]
+
+    return {
+        "pages": [(p, None) for p in sorted(pages)],
+        "markets": [(p, None) for p in sorted(markets & expected)],
+        "insights": sorted((f"/en/insights/{s}", _date(d)) for s, d in insight_dates.items()),
+        "jobs": sorted(job_urls),
+    }
+
+
+# --------------------------------------------------------------------------
+# Output
+# --------------------------------------------------------------------------
+
+def _url_entry(section, path, lastmod):
+    loc = SITE + (path if path != "/" else "/")
+    freq = "daily" if path in DAILY else "weekly"
+    priority = PRIORITY.get(path, SECTION_PRIORITY[section])
+    parts = [f"    <loc>{escape(loc)}</loc>"]
+    if lastmod:
+        parts.append(f"    <lastmod>{lastmod}</lastmod>")
+    parts += [f"    <changefreq>{freq}</changefreq>", f"    <priority>{priority}</priority>"]
+    return "  <url>\n" + "\n".join(parts) + "\n  </url>"
+
+
+def _urlset(entries):
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            + "\n".join(entries) + "\n</urlset>\n")
+
+
+def _sitemap_index(names, lastmods):
+    items = []
+    for name in names:
+        lastmod = lastmods.get(name)
+        extra = f"\n    <lastmod>{lastmod}</lastmod>" if lastmod else ""
+        items.append(f"  <sitemap>\n    <loc>{SITE}/{name}</loc>{extra}\n  </sitemap>")
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            + "\n".join(items) + "\n</sitemapindex>\n")
+
+
+def render(sections, shard_size=SHARD_SIZE):
+    """{filename: text} for every shard plus sitemap-index.xml."""
+    files, lastmods = {}, {}
+    for section, urls in sections.items():
+        for n, i in enumerate(range(0, len(urls), shard_size), 1):
+            chunk = urls[i:i + shard_size]
+            name = f"sitemap-{section}-{n}.xml"
+            files[name] = _urlset([_url_entry(section, p, d) for p, d in chunk])
+            dates = [d for _, d in chunk if d]
+            if dates:
+                lastmods[name] = max(dates)
+    files["sitemap-index.xml"] = _sitemap_index(list(files), lastmods)
+    return files
+
+
+def render_robots(base, index_url):
+    """public/robots.txt with its Sitemap: lines pointed at the static index."""
+    with open(os.path.join(base, ROBOTS_SRC), encoding="utf-8") as f:
+        lines = [line.rstrip("\n") for line in f if not line.lower().startswith("sitemap:")]
+    while lines and not lines[-1].strip():
+        lines.pop()
+    return "\n".join(lines) + f"\n\nSitemap: {index_url}\n"
+
+
+def _gzip(text):
+    return gzip.compress(text.encode("utf-8"), compresslevel=9, mtime=0)  # mtime=0: byte-stable
+
+
+def build(base=BASE, out="public", shard_size=SHARD_SIZE, today=None, robots=False):
+    sections = collect(base, today)
+    files = render(sections, shard_size)
+    shards = len(files) - 1  # minus the index
+    if robots:
+        files["robots.txt"] = render_robots(base, f"{SITE}/sitemap-index.xml")
+
+    out_rel = os.path.relpath(os.path.join(base, out), base)
+    stale = {f for f in os.listdir(os.path.join(base, out_rel))
+             if f.startswith("sitemap-") and f.split(".")[0] not in {n.split(".")[0] for n in files}}
+    statuses = []
+    for name, text in files.items():
+        statuses.append(write_text(base, os.path.join(out_rel, name), text))
+        statuses.append(write_bytes(base, os.path.join(out_rel, name + ".gz"), _gzip(text)))
+    for name in sorted(stale):  # shards left over from a bigger previous build
+        os.remove(os.path.join(base, out_rel, name))
+        print(f"  ✓ deleted {os.path.join(out_rel, name)}")
+    counts = ", ".join(f"{len(urls)} {section}" for section, urls in sections.items())
+    print(f"\n  {sum(len(u) for u in sections.values())} URLs ({counts}) in {shards} shards")
+    print_summary(statuses)
+    return files
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Write static sharded sitemaps and robots.txt.")
+    ap.add_argument("--out", default="public", help="output directory, relative to the repo root")
+    ap.add_argument("--shard-size", type=int, default=SHARD_SIZE)
+    ap.add_argument("--robots", action="store_true",
+                    help="also write robots.txt with its Sitemap: line on sitemap-index.xml (rewrites public/robots.txt)")
+    args = ap.parse_args(argv)
+    if not 0 < args.shard_size <= SHARD_SIZE:
+        ap.error(f"--shard-size must be between 1 and {SHARD_SIZE}")
+    build(BASE, args.out, args.shard_size, robots=args.robots)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
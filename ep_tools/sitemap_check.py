@@ -0,0 +1,220 @@
+"""
+Sitemap coverage check: app routes vs app/sitemap.ts.
+
+Routes come from the SEO audit's page index (ep_tools.seo_audit), with dynamic
+segments expanded: [locale] against `locales` in i18n.ts, [city] against
+MARKET_SLUGS, and [slug] against MARKET_SLUGS or INSIGHTS (slugs from
+data/insights/index.json) when the page's generateStaticParams reads them. The sitemap side is the `staticPages` list
+plus every `normalize(base, `...${x}`)` template, expanded from the constant
+its entries are built from (MARKET_SLUGS, INSIGHTS); templates fed by runtime
+data (jobs) cover their route pattern instead.
+
+Reported, all as set differences:
+  missing    indexable routes absent from the sitemap (redirect-only, noindex
+             and robots.txt-disallowed pages are not expected there)
+  stale      sitemap URLs with no page behind them
+  redirects  sitemap URLs whose page only redirects
+
+The source files are parsed through the same mtime/sha256 cache as the audit
+(.cache/sitemap-check.json), so a clean run takes well under a second.
+
+Run from repo root:
+    python3 -m ep_tools.sitemap_check [--json]   (exit 1 on missing/stale entries)
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+from ep_tools import incremental, tsx
+from ep_tools.articles import INDEX as INSIGHTS_INDEX
+from ep_tools.routes import is_disallowed, robots_disallow, segments
+from ep_tools.seo_audit import audit
+from ep_tools.tsx import field_values, find_const, string_array
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+INDEX_NAME = "sitemap-check.json"
+SITEMAP = "app/sitemap.ts"
+SOURCES = {
+    "LOCALES": "i18n.ts",
+    "MARKET_SLUGS": "lib/markets/data.ts",
+    "INSIGHTS": INSIGHTS_INDEX,
+}
+
+_TEMPLATE_RE = re.compile(r"normalize\(\s*base\s*,\s*`([^`]*)`\s*\)")
+_INIT_RE = re.compile(r"\bconst\s+\w+\s*(?::[^=]+)?=\s*([A-Za-z_$][\w$]*)")
+_PLACEHOLDER_RE = re.compile(r"\$\{[^}]*\}")
+
+
+# --------------------------------------------------------------------------
+# Source parsing (cached per file)
+# --------------------------------------------------------------------------
+
+def _parse_sitemap(src):
+    start = find_const(src, "staticPages")
+    static = string_array(src, start) if start >= 0 else []
+    templates = []
+    for m in _TEMPLATE_RE.finditer(src):
+        inits = list(_INIT_RE.finditer(src, 0, m.start()))
+        source = inits[-1].group(1) if inits else None
+        templates.append({"template": m.group(1), "source": source})
+    return {"static": static, "templates": templates}
+
+
+def _parse_source(rel, src):
+    if rel == SITEMAP:
+        return _parse_sitemap(src)
+    if rel == SOURCES["LOCALES"]:
+        return string_array(src, find_const(src, "locales"))
+    if rel == SOURCES["MARKET_SLUGS"]:
+        return field_values(src, "MARKETS", "slug")
+    if rel == SOURCES["INSIGHTS"]:
+        return json.loads(src)["order"]
+    raise ValueError(rel)
+
+
+def load_sources(base=BASE):
+    """{"sitemap": {...}, "LOCALES": [...], "MARKET_SLUGS": [...], "INSIGHTS": [...]} via the cache."""
+    path = incremental.cache_path(base, INDEX_NAME)
+    version = incremental.code_version(sys.modules[__name__], tsx)
+    rels = [SITEMAP] + list(SOURCES.values())
+    files = [(rel, os.stat(os.path.join(base, rel))) for rel in rels]
+    index, stats = incremental.refresh(base, files, incremental.load_index(path, version), _parse_source)
+    if incremental.changed(stats):
+        incremental.save_index(path, version, index)
+    out = {name: index[rel]["data"] for name, rel in SOURCES.items()}
+    out["sitemap"] = index[SITEMAP]["data"]
+    return out
+
+
+# --------------------------------------------------------------------------
+# Route sets
+# --------------------------------------------------------------------------
+
+def _segment_values(seg, page, sources):
+    """Concrete values for one dynamic segment, or None if they're only known at runtime."""
+    params = page["static_params"] or []
+    if seg == "[locale]":
+        return sources["LOCALES"]
+    if seg == "[city]" or (seg == "[slug]" and "MARKET_SLUGS" in params):
+        return sources["MARKET_SLUGS"]
+    if seg == "[slug]" and "INSIGHTS" in params:
+        return sources["INSIGHTS"]
+    return None
+
+
+def _expand(segs, page, sources):
+    paths = [[]]
+    for seg in segs:
+        if not seg.startswith("["):
+            values = [seg]
+        else:
+            values = _segment_values(seg, page, sources)
+            if values is None:
+                return None
+        paths = [p + [v] for p in paths for v in values]
+    return {"/" + "/".join(p) for p in paths}
+
+
+def _noindex(page):
+    blocks = [b for b in page["blocks"] if b["fields"] is not None]
+    return bool(blocks) and all(b["fields"].get("robots", {}).get("noindex") for b in blocks)
+
+
+def app_routes(report, sources, disallow):
+    """Split pages into (expected URLs, redirect URLs, runtime patterns, all concrete URLs).
+
+    Static routes win over dynamic ones (app/de/page.tsx shadows app/[locale]/page.tsx),
+    so dynamic expansions only claim URLs no static page serves.
+    """
+    expected, redirects, patterns, concrete = set(), set(), set(), set()
+    ordered = sorted(report, key=lambda item: "[" in item[0])  # static pages first
+    for rel, route, page, _ in ordered:
+        urls = _expand(segments(rel), page, sources)
+        if urls is None:
+            patterns.add(route)
+            continue
+        urls -= concrete
+        concrete |= urls
+        if page["redirect"]:
+            redirects |= urls
+        elif not _noindex(page):
+            expected |= {u for u in urls if not is_disallowed(u, disallow)}
+    return expected, redirects, patterns, concrete
+
+
+def sitemap_urls(sources):
+    """(concrete URLs, route patterns covered by runtime templates)."""
+    sm = sources["sitemap"]
+    urls = {_normalize(p) for p in sm["static"]}
+    patterns = set()
+    for t in sm["templates"]:
+        values = sources.get(t["source"]) if t["source"] in SOURCES else None
+        if values is None:  # runtime data (the jobs API): the template covers the whole pattern
+            patterns.add(_normalize(_PLACEHOLDER_RE.sub("[slug]", t["template"])))
+            continue
+        urls |= {_normalize(_PLACEHOLDER_RE.sub(v, t["template"])) for v in values}
+    return urls, patterns
+
+
+def _normalize(path):
+    path = re.sub(r"/+", "/", "/" + path.strip())
+    return path.rstrip("/") or "/"
+
+
+def _matches(url, pattern):
+    a, b = url.strip("/").split("/"), pattern.strip("/").split("/")
+    return len(a) == len(b) and all(p.startswith("[") or p == s for s, p in zip(a, b))
+
+
+def check(base=BASE):
+    t0 = time.perf_counter()
+    report, _ = audit(base)
+    sources = load_sources(base)
+    expected, redirects, app_patterns, concrete = app_routes(report, sources, robots_disallow(base))
+    listed, sm_patterns = sitemap_urls(sources)
+
+    missing = {u for u in expected - listed if not any(_matches(u, p) for p in sm_patterns)}
+    unknown = listed - concrete
+    stale = {u for u in unknown if not any(_matches(u, p) for p in app_patterns)}
+    return {
+        "missing": sorted(missing),
+        "stale": sorted(stale),
+        "redirects": sorted(listed & redirects),
+        "runtime_routes": sorted(app_patterns),
+        "counts": {"routes": len(concrete), "expected": len(expected), "sitemap": len(listed)},
+        "ms": (time.perf_counter() - t0) * 1000,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Diff app routes against app/sitemap.ts.")
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args(argv)
+
+    result = check(BASE)
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    else:
+        c = result["counts"]
+        print(f"{c['routes']} concrete routes ({c['expected']} should be indexed), "
+              f"{c['sitemap']} sitemap URLs")
+        for key, mark, title in (("missing", "✗", "Missing from sitemap"),
+                                 ("stale", "✗", "Stale sitemap entries (no page)"),
+                                 ("redirects", "⚠️ ", "Sitemap entries that only redirect"),
+                                 ("runtime_routes", "·", "Dynamic routes not expanded (runtime params)")):
+            if result[key]:
+                print(f"\n{mark} {title} ({len(result[key])})")
+                for url in result[key]:
+                    print(f"    {url}")
+        print(f"\n{result['ms']:.0f} ms")
+    return 1 if result["missing"] or result["stale"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Streaming quantile sketch for non-negative metrics (AUM, ROA, NNM, client counts).
+
+A DDSketch: a value x > 0 goes to bucket ceil(log(x) / log(gamma)) with
+gamma = (1 + alpha) / (1 - alpha), so every quantile comes back within a
+relative error alpha of the true one, whatever the distribution. Values at or
+below MIN_VALUE (a zero AUM, no clients) are counted apart. Adding is O(1)
+(so is removing a value added earlier), two sketches merge by adding their
+bucket counts, and the JSON form is just the counts.
+
+rank() / percentile() use a cumulative table over the dense bucket range,
+rebuilt lazily after adds, so a lookup is one log and one list index.
+"""
+
+import math
+
+ALPHA = 0.01
+MIN_VALUE = 1e-9
+
+
+class QuantileSketch:
+    __slots__ = ("alpha", "_log_gamma", "bins", "zero", "n", "_cdf", "_lo")
+
+    def __init__(self, alpha=ALPHA):
+        self.alpha = alpha
+        self._log_gamma = math.log((1 + alpha) / (1 - alpha))
+        self.bins = {}   # bucket index -> count
+        self.zero = 0
+        self.n = 0
+        self._cdf = None  # cumulative counts for buckets _lo.. (dense), None when stale
+        self._lo = 0
+
+    def __len__(self):
+        return self.n
+
+    def _bucket(self, x):
+        return math.ceil(math.log(x) / self._log_gamma)
+
+    def add(self, x, count=1):
+        if x is None or x != x:  # None / NaN: not a measurement
+            return
+        if x <= MIN_VALUE:
+            self.zero += count
+        else:
+            k = self._bucket(x)
+            self.bins[k] = self.bins.get(k, 0) + count
+        self.n += count
+        self._cdf = None
+
+    def remove(self, x, count=1):
+        """Take back `count` earlier add(x) (a submission rewritten in place)."""
+        if x is None or x != x:
+            return
+        if x <= MIN_VALUE:
+            self.zero -= count
+        else:
+            k = self._bucket(x)
+            left = self.bins.get(k, 0) - count
+            if left > 0:
+                self.bins[k] = left
+            else:
+                self.bins.pop(k, None)
+        self.n -= count
+        self._cdf = None
+
+    def merge(self, other):
+        for k, c in other.bins.items():
+            self.bins[k] = self.bins.get(k, 0) + c
+        self.zero += other.zero
+        self.n += other.n
+        self._cdf = None
+        return self
+
+    def _table(self):
+        if self._cdf is None:
+            self._lo = min(self.bins) if self.bins else 0
+            hi = max(self.bins) if self.bins else -1
+            total, cdf = self.zero, []
+            for k in range(self._lo, hi + 1):
+                total += self.bins.get(k, 0)
+                cdf.append(total)
+            self._cdf = cdf
+        return self._cdf
+
+    def rank(self, x):
+        """Fraction of values below x, counting ties (same bucket) as half."""
+        if not self.n:
+            return None
+        cdf = self._table()
+        if x <= MIN_VALUE:
+            below, same = 0, self.zero
+        else:
+            i = self._bucket(x) - self._lo
+            if i < 0:
+                below, same = self.zero, 0
+            elif i >= len(cdf):
+                below, same = self.n, 0
+            else:
+                below = cdf[i - 1] if i else self.zero
+                same = cdf[i] - below
+        return (below + same / 2) / self.n
+
+    def percentile(self, x):
+        r = self.rank(x)
+        return None if r is None else round(100 * r)
+
+    def quantile(self, q):
+        """Value at quantile q (0..1), within relative error alpha; None if empty."""
+        if not self.n:
+            return None
+        target = q * (self.n - 1)
+        if target < self.zero:
+            return 0.0
+        cdf = self._table()
+        lo, hi = 0, len(cdf) - 1
+        while lo < hi:  # first bucket whose cumulative count exceeds target
+            mid = (lo + hi) // 2
+            if cdf[mid] > target:
+                hi = mid
+            else:
+                lo = mid + 1
+        gamma = math.exp(self._log_gamma)
+        return 2 * gamma ** (lo + self._lo) / (gamma + 1)  # bucket midpoint (relative)
+
+    def to_json(self):
+        return {"a": self.alpha, "z": self.zero, "b": {str(k): c for k, c in sorted(self.bins.items())}}
+
+    @classmethod
+    def from_json(cls, data):
+        s = cls(data.get("a", ALPHA))
+        s.zero = data.get("z", 0)
+        s.bins = {int(k): c for k, c in data.get("b", {}).items()}
+        s.n = s.zero + sum(s.bins.values())
+        return s
@@ -0,0 +1,93 @@
+"""
+The simulator's theme stylesheet (styles/ep.css), minified and content-hashed.
+
+streamlit_app.py injects the theme as a <style> element on every rerun. It
+builds that element once per process (st.cache_resource keyed by the file's
+mtime) from stylesheet() below, so the file is read and minified once, and
+the element is byte-identical across reruns and sessions. Streamlit hashes
+every outgoing message and, for messages of at least
+global.minCachedMessageSize bytes, sends a browser that already has it only
+the hash; .streamlit/config.toml lowers that threshold below the size of the
+theme, so after a session's first run each rerun carries a reference instead
+of the stylesheet.
+
+The minifier is deliberately small: it drops comments and the whitespace
+around { } ; , > and after ":", leaves strings alone and never touches the
+space before ":" (".a :hover" and ".a:hover" are different selectors).
+
+Run from repo root:
+    python3 -m ep_tools.theme [styles/ep.css]     sizes + hash of the injected payload
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import re
+import sys
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+CSS = "styles/ep.css"
+
+_TOKEN_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/""", re.S)
+_SPACE_RE = re.compile(r"\s+")
+_AROUND_RE = re.compile(r"\s*([{};,>])\s*")
+_AFTER_COLON_RE = re.compile(r":\s+")
+
+
+def _squeeze(chunk):
+    chunk = _SPACE_RE.sub(" ", chunk)
+    chunk = _AROUND_RE.sub(r"\1", chunk)
+    chunk = _AFTER_COLON_RE.sub(":", chunk)
+    return chunk.replace(";}", "}").replace(" !important", "!important")
+
+
+def minify(css):
+    out, pos = [], 0
+    pending = ""
+    for m in _TOKEN_RE.finditer(css):
+        pending += css[pos:m.start()]
+        if m.group(1):  # string: flush the code before it, keep it verbatim
+            out.append(_squeeze(pending))
+            out.append(m.group(1))
+            pending = ""
+        else:           # comment: acts as whitespace
+            pending += " "
+        pos = m.end()
+    out.append(_squeeze(pending + css[pos:]))
+    return "".join(out).strip()
+
+
+def stylesheet(css):
+    """(minified css, short sha256 of it)."""
+    mini = minify(css)
+    return mini, hashlib.sha256(mini.encode("utf-8")).hexdigest()[:12]
+
+
+def style_tag(css):
+    mini, digest = stylesheet(css)
+    return f'<style id="ep-theme-{digest}">{mini}</style>'
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Show the minified theme payload.")
+    ap.add_argument("css", nargs="?", default=CSS, help="stylesheet, relative to the repo root")
+    args = ap.parse_args(argv)
+    try:
+        with open(os.path.join(BASE, args.css), encoding="utf-8") as f:
+            raw = f.read()
+    except OSError as e:
+        print(f"✗ {e}")
+        return 1
+    tag = style_tag(raw)
+    mini, digest = stylesheet(raw)
+    for label, text in (("raw <style>", f"<style>{raw}</style>"), ("minified <style>", tag)):
+        data = text.encode("utf-8")
+        print(f"  {label:18} {len(data):7,} bytes  ({len(gzip.compress(data)):,} gzipped)")
+    print(f"  hash               {digest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
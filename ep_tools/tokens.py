@@ -0,0 +1,496 @@
+"""
+Assessment token store: data/assessment-tokens.json behind a lock and a journal.
+
+The JSON file stays what the site reads — a flat {token: entry} map, looked up
+by app/api/token-info/[token] and app/api/submit-assessment (which also flips
+`used` / `usedAt` in place). Writers here go through three steps, all under an
+exclusive flock on data/.assessment-tokens.lock:
+
+    1. reload the snapshot if it changed on disk (another mint, or a used flag
+       written by submit-assessment) and replay data/assessment-tokens.journal
+    2. append the whole transaction as ONE journal line and fsync it
+    3. rewrite the snapshot via temp file + rename, then truncate the journal
+
+A crash after 2 is repaired by the next writer (step 1 replays the line); a
+crash during 2 leaves a torn last line, which replay ignores, so a transaction
+is all or nothing. New tokens are checked against every token already in the
+store before anything is written, and a bulk mint of a whole campaign is one
+transaction and one snapshot rewrite.
+
+The site's own used-flag write is not locked; it is a read-modify-write of
+milliseconds, and step 1 picks it up as long as it isn't interleaved with a
+mint's reload/rename.
+
+Lifecycle: new tokens carry an `expiresAt` (TTL_DAYS after minting), which both
+API routes honour. Entries minted before that have none and never expire, on the
+site or here: a sweep only archives them once they have been used. The store
+keeps an index of tokens by status and by creation / expiry time, and a sweep
+moves tokens that are expired, or were used more than USED_GRACE_DAYS ago, out
+of the snapshot into an append-only archive segment per year:
+
+    data/assessment-tokens.archive/<year>.jsonl   one {"token", ...entry, "archivedAt", "reason"} per line
+
+so the file the site parses holds only live links. Minting sweeps on its own
+once AUTO_SWEEP tokens are due, and new tokens are also checked against the
+archive so a retired link is never handed out again. Archived tokens are no
+longer accepted by the site (token-info 404s, submit-assessment 403s).
+
+Library:
+    from ep_tools.tokens import TokenStore, new_entry
+    store = TokenStore()
+    [(token, entry)] = store.mint([new_entry("Name", "Institution", "Mandate")])
+    store.get(token)  -> entry or None  (dict lookup)
+
+Run from repo root:
+    python3 -m ep_tools.tokens mint "Name" "Institution" ["Mandate"]
+    python3 -m ep_tools.tokens bulk campaign.csv [--mandate X] [--out links.csv]
+    python3 -m ep_tools.tokens get TOKEN          (falls back to the archive)
+    python3 -m ep_tools.tokens stats
+    python3 -m ep_tools.tokens sweep [--grace-days 30] [--dry-run]
+"""
+
+import argparse
+import bisect
+import csv
+import fcntl
+import json
+import os
+import secrets
+import string
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from ep_tools.files import _atomic_write
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # repo root
+
+STORE = "data/assessment-tokens.json"
+JOURNAL = "data/assessment-tokens.journal"
+LOCK = "data/.assessment-tokens.lock"
+ARCHIVE_DIR = "data/assessment-tokens.archive"
+URL = "https://execpartners.ch/en/candidate-assessment/{token}"
+
+ALPHABET = string.ascii_lowercase + string.digits
+LENGTH = 8
+MAX_ATTEMPTS = 20  # fresh draws per token before giving up (36^8 ~ 2.8e12: never hit in practice)
+FIELDS = ("candidateName", "institution", "mandate", "market", "hub")  # what token-info returns
+
+TTL_DAYS = 90          # a link is valid this long after minting
+USED_GRACE_DAYS = 30   # used tokens stay in the snapshot this long (support lookups)
+AUTO_SWEEP = 50        # a mint sweeps when at least this many tokens are due
+
+
+class TokenStoreError(ValueError):
+    pass
+
+
+def new_entry(candidate_name, institution, mandate="", ttl_days=TTL_DAYS, **extra):
+    now = datetime.now()
+    entry = {
+        "candidateName": candidate_name,
+        "institution": institution,
+        "mandate": mandate,
+    }
+    entry.update({k: v for k, v in extra.items() if k in FIELDS and v})
+    entry.update({"createdAt": now.isoformat(), "expiresAt": (now + timedelta(days=ttl_days)).isoformat(),
+                  "used": False, "usedAt": None})
+    return entry
+
+
+def _when(stamp):
+    """Local naive datetime of an ISO stamp: Python writes local naive times,
+    the site writes UTC ("...Z"). None if missing or unreadable."""
+    try:
+        t = datetime.fromisoformat(stamp)
+    except (TypeError, ValueError):
+        return None
+    return t.astimezone().replace(tzinfo=None) if t.tzinfo else t
+
+
+def expires_at(entry):
+    """When the site stops accepting the link; None for entries without `expiresAt` (never)."""
+    return _when(entry.get("expiresAt"))
+
+
+# --------------------------------------------------------------------------
+# Lifecycle index
+# --------------------------------------------------------------------------
+
+class TokenIndex:
+    """Tokens by status ("open" / "used") and sorted by creation and expiry time.
+
+    Kept in step with the store's dict: rebuilt when the snapshot is reloaded,
+    updated per token on commit, so `due()` is a bisect instead of a scan.
+    """
+
+    def __init__(self, tokens=None):
+        self.status = {"open": set(), "used": set()}
+        self.by_created = []  # sorted [(createdAt, token)]
+        self.by_expiry = []   # sorted [(expiresAt, token)], open tokens that have one
+        self._keys = {}       # token -> (status, created key, expiry key or None)
+        for token, entry in (tokens or {}).items():
+            self.add(token, entry)
+
+    def add(self, token, entry):
+        self.discard(token)
+        status = "used" if entry.get("used") else "open"
+        created = (_when(entry.get("createdAt")) or datetime.min, token)
+        when = expires_at(entry) if status == "open" else None
+        expiry = (when, token) if when else None
+        self.status[status].add(token)
+        bisect.insort(self.by_created, created)
+        if expiry:
+            bisect.insort(self.by_expiry, expiry)
+        self._keys[token] = (status, created, expiry)
+
+    def discard(self, token):
+        keys = self._keys.pop(token, None)
+        if keys is None:
+            return
+        status, created, expiry = keys
+        self.status[status].discard(token)
+        del self.by_created[bisect.bisect_left(self.by_created, created)]
+        if expiry:
+            del self.by_expiry[bisect.bisect_left(self.by_expiry, expiry)]
+
+    def created_between(self, start=datetime.min, end=datetime.max):
+        lo = bisect.bisect_left(self.by_created, (start, ""))
+        hi = bisect.bisect_left(self.by_created, (end, ""))
+        return [token for _, token in self.by_created[lo:hi]]
+
+    def expired(self, now):
+        """Open tokens past their expiry."""
+        return [token for _, token in self.by_expiry[:bisect.bisect_right(self.by_expiry, (now, "\uffff"))]]
+
+    def due(self, tokens, now, grace_days=USED_GRACE_DAYS):
+        """{token: reason} of tokens a sweep would archive."""
+        due = {token: "expired" for token in self.expired(now)}
+        cutoff = now - timedelta(days=grace_days)
+        for token in self.status["used"]:
+            used_at = _when(tokens[token].get("usedAt")) or _when(tokens[token].get("createdAt"))
+            if used_at is None or used_at < cutoff:
+                due[token] = "used"
+        return due
+
+
+class TokenStore:
+    def __init__(self, base=BASE):
+        self.base = base
+        self.path = os.path.join(base, STORE)
+        self.journal = os.path.join(base, JOURNAL)
+        self.lock_path = os.path.join(base, LOCK)
+        self.archive_dir = os.path.join(base, ARCHIVE_DIR)
+        self.tokens = {}
+        self.index = TokenIndex()
+        self._seen = None  # (mtime_ns, size) of the snapshot self.tokens was read from
+        self._archived = None  # (segment stamps, token set) cache for collision checks
+        self._refresh()
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def __contains__(self, token):
+        return token in self.tokens
+
+    def get(self, token):
+        return self.tokens.get(token)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _refresh(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self.tokens, self._seen = {}, None
+            self.index = TokenIndex()
+        else:
+            if (st.st_mtime_ns, st.st_size) != self._seen:
+                with open(self.path, encoding="utf-8") as f:
+                    self.tokens = json.load(f)
+                self.index = TokenIndex(self.tokens)
+                self._seen = (st.st_mtime_ns, st.st_size)
+        return self._replay()
+
+    def _replay(self):
+        """Apply complete journal lines; returns how many were applied."""
+        if not os.path.exists(self.journal):
+            return 0
+        applied = 0
+        with open(self.journal, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    txn = json.loads(line)
+                except ValueError:  # torn write: the transaction never committed
+                    break
+                self._apply(txn["set"], txn.get("drop", ()))
+                applied += 1
+        return applied
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _locked(self):
+        os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+        with open(self.lock_path, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _apply(self, changes, drop=()):
+        for token in drop:
+            self.tokens.pop(token, None)
+            self.index.discard(token)
+        for token, entry in changes.items():
+            self.tokens[token] = entry
+            self.index.add(token, entry)
+
+    def _commit(self, changes, drop=()):
+        """Journal `changes` ({token: entry}) and removals, then fold them into the snapshot."""
+        if changes or drop:
+            txn = {"at": datetime.now().isoformat(), "set": changes}
+            if drop:
+                txn["drop"] = sorted(drop)
+            with open(self.journal, "a", encoding="utf-8") as f:
+                f.write(json.dumps(txn, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(changes, drop)
+        self._checkpoint()
+
+    def _checkpoint(self):
+        data = json.dumps(self.tokens, indent=2)
+
+        def write(tmp):
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+
+        _atomic_write(self.path, write)
+        st = os.stat(self.path)
+        self._seen = (st.st_mtime_ns, st.st_size)
+        open(self.journal, "w").close()
+
+    def _taken(self, token, pending):
+        return token in self.tokens or token in pending or token in self.archived_tokens()
+
+    def _draw(self, pending):
+        for _ in range(MAX_ATTEMPTS):
+            token = "".join(secrets.choice(ALPHABET) for _ in range(LENGTH))
+            if not self._taken(token, pending):
+                return token
+        raise TokenStoreError(f"no free token after {MAX_ATTEMPTS} draws")
+
+    def mint(self, entries, tokens=None):
+        """Store `entries` (dicts built by new_entry, or new_entry keyword dicts)
+        under fresh tokens, in one transaction. `tokens` may pin explicit tokens
+        (e.g. re-issuing a link); any that already exists is a collision.
+        Returns [(token, entry), ...]."""
+        entries = [e if "createdAt" in e else new_entry(**e) for e in entries]
+        with self._locked():
+            self._refresh()
+            changes = {}
+            for i, entry in enumerate(entries):
+                token = tokens[i] if tokens and i < len(tokens) and tokens[i] else None
+                if token is None:
+                    token = self._draw(changes)
+                elif self._taken(token, changes):
+                    raise TokenStoreError(f"token {token!r} already exists")
+                changes[token] = entry
+            self._commit(changes)
+            if len(self.index.due(self.tokens, datetime.now())) >= AUTO_SWEEP:
+                self._sweep(datetime.now(), USED_GRACE_DAYS)
+        return list(changes.items())
+
+    def mark_used(self, token, candidate_name=None):
+        """Same update submit-assessment makes, for tokens redeemed elsewhere."""
+        with self._locked():
+            self._refresh()
+            if token not in self.tokens:
+                raise TokenStoreError(f"unknown token {token!r}")
+            entry = dict(self.tokens[token], used=True, usedAt=datetime.now().isoformat())
+            if candidate_name:
+                entry["candidateName"] = candidate_name
+            self._commit({token: entry})
+        return entry
+
+    # ------------------------------------------------------------------
+    # Archive
+    # ------------------------------------------------------------------
+
+    def _segments(self):
+        if not os.path.isdir(self.archive_dir):
+            return []
+        return sorted(os.path.join(self.archive_dir, n) for n in os.listdir(self.archive_dir)
+                      if n.endswith(".jsonl"))
+
+    def _archive_records(self):
+        for seg in self._segments():
+            with open(seg, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:  # torn last line of an interrupted sweep
+                        continue
+
+    def archived_tokens(self):
+        """Every token ever archived (cached until a segment changes)."""
+        stamps = tuple((seg, os.stat(seg).st_mtime_ns, os.stat(seg).st_size) for seg in self._segments())
+        if self._archived is None or self._archived[0] != stamps:
+            self._archived = (stamps, {r["token"] for r in self._archive_records()})
+        return self._archived[1]
+
+    def lookup(self, token):
+        """(entry, "live") from the snapshot, else (record, "archived") or (None, None)."""
+        if token in self.tokens:
+            return self.tokens[token], "live"
+        found = None
+        for record in self._archive_records():  # a re-archived token: last record wins
+            if record.get("token") == token:
+                found = record
+        return (found, "archived") if found else (None, None)
+
+    def _sweep(self, now, grace_days, dry_run=False):
+        due = self.index.due(self.tokens, now, grace_days)
+        if dry_run or not due:
+            return due
+        # Archive first: a crash before the snapshot is rewritten leaves the tokens
+        # in both places, and the next sweep archives them again (lookup keeps the last copy).
+        stamp = now.isoformat()
+        by_year = {}
+        for token in sorted(due, key=lambda t: self.tokens[t].get("createdAt") or ""):
+            record = {"token": token, **self.tokens[token], "archivedAt": stamp, "reason": due[token]}
+            year = (self.tokens[token].get("createdAt") or stamp)[:4]
+            by_year.setdefault(year, []).append(json.dumps(record, ensure_ascii=False))
+        os.makedirs(self.archive_dir, exist_ok=True)
+        for year, lines in sorted(by_year.items()):
+            with open(os.path.join(self.archive_dir, f"{year}.jsonl"), "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        self._commit({}, drop=due)
+        return due
+
+    def sweep(self, now=None, grace_days=USED_GRACE_DAYS, dry_run=False):
+        """Archive expired tokens and tokens used more than grace_days ago; {token: reason}."""
+        with self._locked():
+            self._refresh()
+            return self._sweep(now or datetime.now(), grace_days, dry_run)
+
+    def stats(self, now=None):
+        now = now or datetime.now()
+        return {"open": len(self.index.status["open"]) - len(self.index.expired(now)),
+                "expired": len(self.index.expired(now)), "used": len(self.index.status["used"]),
+                "archived": len(self.archived_tokens()),
+                "snapshot bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0}
+
+    def recover(self):
+        """Fold a journal left by an interrupted writer into the snapshot."""
+        with self._locked():
+            if self._refresh():
+                self._checkpoint()
+                return True
+        return False
+
+
+# --------------------------------------------------------------------------
+# CLI
+# --------------------------------------------------------------------------
+
+def print_link(token, entry):
+    print(f"\n{'='*60}")
+    print(f"  EP Assessment Link Generated")
+    print(f"{'='*60}")
+    print(f"  Candidate  : {entry['candidateName']}")
+    print(f"  Institution: {entry['institution']}")
+    if entry.get("mandate"):
+        print(f"  Mandate    : {entry['mandate']}")
+    print(f"  Token      : {token}")
+    print(f"  URL        : {URL.format(token=token)}")
+    print(f"{'='*60}\n")
+
+
+def read_campaign(path, mandate=""):
+    """Rows of a campaign CSV with a candidateName (or name) and institution column."""
+    rows = []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for n, row in enumerate(csv.DictReader(f), start=2):
+            row = {k.strip(): (v or "").strip() for k, v in row.items() if k}
+            name = row.get("candidateName") or row.get("name")
+            if not name or not row.get("institution"):
+                raise TokenStoreError(f"{path}:{n}: candidateName and institution are required")
+            rows.append({"candidate_name": name, "institution": row["institution"],
+                         "mandate": row.get("mandate") or mandate,
+                         **{k: row.get(k, "") for k in ("market", "hub")}})
+    return rows
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Mint and look up assessment tokens.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("mint", help="one token")
+    p.add_argument("name")
+    p.add_argument("institution")
+    p.add_argument("mandate", nargs="?", default="")
+    p = sub.add_parser("bulk", help="one token per CSV row, in a single transaction")
+    p.add_argument("csv")
+    p.add_argument("--mandate", default="", help="for rows without a mandate column")
+    p.add_argument("--out", help="write token,url,candidateName,... here (default: print)")
+    p = sub.add_parser("get")
+    p.add_argument("token")
+    sub.add_parser("stats", help="tokens per status, archive size")
+    p = sub.add_parser("sweep", help="archive expired and long-used tokens")
+    p.add_argument("--grace-days", type=int, default=USED_GRACE_DAYS)
+    p.add_argument("--dry-run", action="store_true")
+    args = ap.parse_args(argv)
+
+    try:
+        store = TokenStore(BASE)
+        if args.cmd == "get":
+            entry, where = store.lookup(args.token)
+            if entry is None:
+                print(f"✗ unknown token {args.token}")
+                return 1
+            print(f"  ({where})")
+            print(json.dumps(entry, indent=2, ensure_ascii=False))
+        elif args.cmd == "stats":
+            for k, v in store.stats().items():
+                print(f"  {k:15} {v:,}")
+        elif args.cmd == "sweep":
+            due = store.sweep(grace_days=args.grace_days, dry_run=args.dry_run)
+            reasons = {r: list(due.values()).count(r) for r in ("expired", "used")}
+            verb, left = ("would archive", len(store) - len(due)) if args.dry_run else ("archived", len(store))
+            print(f"  {'=' if not due else '✓'} {verb} {reasons['expired']} expired, {reasons['used']} used "
+                  f"-> {ARCHIVE_DIR}/; {left} tokens left in {STORE}")
+        elif args.cmd == "mint":
+            [(token, entry)] = store.mint([new_entry(args.name, args.institution, args.mandate)])
+            print_link(token, entry)
+        else:
+            minted = store.mint(read_campaign(args.csv, args.mandate))
+            rows = [{"token": t, "url": URL.format(token=t), **{k: e.get(k, "") for k in FIELDS}}
+                    for t, e in minted]
+            if args.out:
+                with open(args.out, "w", newline="", encoding="utf-8") as f:
+                    w = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else ["token", "url"])
+                    w.writeheader()
+                    w.writerows(rows)
+                print(f"  ✓ {len(rows)} links -> {args.out}")
+            else:
+                for r in rows:
+                    print(f"  {r['token']}  {r['url']}  {r['candidateName']} ({r['institution']})")
+            print(f"\n  {len(rows)} tokens minted, {len(store)} in {STORE}")
+    except (TokenStoreError, OSError) as e:
+        print(f"✗ {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""
+Just enough TypeScript/TSX lexing to read object literals out of page files.
+
+Not a parser: it skips strings, template literals and comments so braces can be
+matched, then reads the top-level `key: value` entries of an object literal.
+Only ever start it at a known object literal (`= {`, `({`, `return {`) — JSX
+text such as `don't` would otherwise look like an unterminated string.
+"""
+
+import re
+
+OPENERS = {"{": "}", "[": "]", "(": ")"}
+
+_CONST_RE = re.compile(
+    r"""\bconst\s+([A-Za-z_$][\w$]*)\s*(?::\s*[\w.<>\[\] |]+)?=\s*("(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`)""")
+_KEY_RE = re.compile(r"""\s*(?:"([^"]+)"|'([^']+)'|([A-Za-z_$][\w$@-]*))\s*:""")
+_SHORTHAND_RE = re.compile(r"([A-Za-z_$][\w$]*)\s*(?=,|$)")
+_UNICODE_ESC = re.compile(r"\\u\{?([0-9a-fA-F]{4,6})\}?")
+
+
+_STRING_STOP = {'"': re.compile(r'["\\\n]'), "'": re.compile(r"['\\\n]"), "`": re.compile(r"[`\\$]")}
+
+
+def skip_string(src, i):
+    """src[i] is a quote; return the index just past the closing quote."""
+    q = src[i]
+    stop = _STRING_STOP[q]
+    i += 1
+    n = len(src)
+    while i < n:
+        m = stop.search(src, i)
+        if not m:
+            return n
+        i = m.start()
+        c = src[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == q:
+            return i + 1
+        if c == "$":
+            i = match_brace(src, i + 1) + 1 if src.startswith("${", i) else i + 1
+            continue
+        return i  # newline in a '...' / "..." string: unterminated, stop at end of line
+    return n
+
+
+def skip_comment(src, i):
+    """If a comment starts at i, return the index after it, else i."""
+    if src.startswith("//", i):
+        j = src.find("\n", i)
+        return len(src) if j < 0 else j
+    if src.startswith("/*", i):
+        j = src.find("*/", i + 2)
+        return len(src) if j < 0 else j + 2
+    return i
+
+
+def match_brace(src, i):
+    """src[i] is one of {[( ; return the index of its matching closer."""
+    stack = [OPENERS[src[i]]]
+    i += 1
+    n = len(src)
+    while i < n:
+        c = src[i]
+        if c in "\"'`":
+            i = skip_string(src, i)
+            continue
+        if c == "/":
+            j = skip_comment(src, i)
+            if j != i:
+                i = j
+                continue
+        if c in OPENERS:
+            stack.append(OPENERS[c])
+        elif c == stack[-1]:
+            stack.pop()
+            if not stack:
+                return i
+        i += 1
+    raise ValueError("unbalanced brackets")
+
+
+def object_entries(src, start):
+    """Top-level entries of the object literal whose `{` is at src[start].
+
+    Returns [(key, value_start, value_end)] with src[value_start:value_end] the
+    raw value text (stripped). Shorthand `{ description }` yields the name as
+    its own value; spreads and methods are skipped.
+    """
+    end = match_brace(src, start)
+    entries = []
+    i = start + 1
+    while i < end:
+        while i < end and (src[i].isspace() or src[i] == ","):
+            i += 1
+        j = skip_comment(src, i)
+        if j != i:
+            i = j
+            continue
+        m = _KEY_RE.match(src, i, end)
+        if not m:
+            m = _SHORTHAND_RE.match(src, i, end)
+            if m:
+                entries.append((m.group(1), m.start(1), m.end(1)))
+                i = m.end()
+                continue
+            # spread / method: skip to next top-level comma
+            i = _value_end(src, i, end) + 1
+            continue
+        key = m.group(1) or m.group(2) or m.group(3)
+        vstart = m.end()
+        while vstart < end and src[vstart].isspace():
+            vstart += 1
+        vend = _value_end(src, vstart, end)
+        entries.append((key, vstart, len(src[vstart:vend].rstrip()) + vstart))
+        i = vend + 1
+    return entries
+
+
+def array_items(src, start):
+    """Top-level elements of the array literal whose `[` is at src[start]: [(start, end)]."""
+    end = match_brace(src, start)
+    items = []
+    i = start + 1
+    while i < end:
+        while i < end and (src[i].isspace() or src[i] == ","):
+            i += 1
+        j = skip_comment(src, i)
+        if j != i:
+            i = j
+            continue
+        if i >= end:
+            break
+        vend = _value_end(src, i, end)
+        items.append((i, len(src[i:vend].rstrip()) + i))
+        i = vend + 1
+    return items
+
+
+def _value_end(src, i, end):
+    while i < end:
+        c = src[i]
+        if c in "\"'`":
+            i = skip_string(src, i)
+            continue
+        if c == "/":
+            j = skip_comment(src, i)
+            if j != i:
+                i = j
+                continue
+        if c in OPENERS:
+            i = match_brace(src, i) + 1
+            continue
+        if c == ",":
+            return i
+        i += 1
+    return end
+
+
+def string_value(raw):
+    """Python value of a string/template literal, or None if it isn't one.
+
+    `${...}` interpolations in templates are kept verbatim.
+    """
+    raw = raw.strip()
+    if len(raw) < 2 or raw[0] not in "\"'`" or raw[-1] != raw[0]:
+        return None
+    body = raw[1:-1]
+    body = _UNICODE_ESC.sub(lambda m: chr(int(m.group(1), 16)), body)
+    return re.sub(r"\\(.)", lambda m: {"n": "\n", "t": "\t"}.get(m.group(1), m.group(1)), body)
+
+
+def find_const(src, name, opener="["):
+    """Index of the `[` / `{` that starts `const NAME = ...` (exported or not), or -1."""
+    m = re.search(rf"\bconst\s+{re.escape(name)}\b[^=]*=\s*\{opener}", src)
+    return m.end() - 1 if m else -1
+
+
+def field_values(src, name, key):
+    """string values of `key` in each object of the array `const NAME = [{...}, ...]`."""
+    start = find_const(src, name)
+    if start < 0:
+        return []
+    values = []
+    for istart, _ in array_items(src, start):
+        if src[istart] != "{":
+            continue
+        for k, vs, ve in object_entries(src, istart):
+            if k == key:
+                values.append(string_value(src[vs:ve]))
+                break
+    return values
+
+
+def string_array(src, start):
+    """String literals of the array whose `[` is at src[start]."""
+    return [v for v in (string_value(src[a:b]) for a, b in array_items(src, start)) if v is not None]
+
+
+def string_literals(src, start=0, end=None):
+    """Values of every string literal in src[start:end] (comments skipped), e.g. the
+    arguments of `withIntro("...", [...])` as well as plain values."""
+    end = len(src) if end is None else end
+    out, i = [], start
+    while i < end:
+        c = src[i]
+        if c in "\"'`":
+            j = skip_string(src, i)
+            value = string_value(src[i:j])
+            if value is not None:
+                out.append(value)
+            i = j
+        elif src.startswith(("//", "/*"), i):
+            i = skip_comment(src, i)
+        else:
+            i += 1
+    return out
+
+
+def top_level_consts(src):
+    """{NAME: raw literal} for `const NAME = "..."` style string constants."""
+    return {m.group(1): m.group(2) for m in _CONST_RE.finditer(src)}
+
+
+def line_of(src, pos):
+    return src.count("\n", 0, pos) + 1
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 import os
+
+from ep_tools.files import write_text
+
 BASE = os.path.dirname(os.path.abspath(__file__))
-open(os.path.join(BASE, "components/Footer.tsx"), "w", encoding="utf-8").write('// components/Footer.tsx\nimport Link from "next/link";\nimport Image from "next/image";\nimport { ArrowRight, MapPin } from "lucide-react";\n\nconst NAV = [\n  {\n    label: "Candidates",\n    links: [\n      { href: "/en/jobs", text: "Browse Jobs" },\n      { href: "/en/candidates", text: "Career Guidance" },\n      { href: "/en/portability", text: "Portability Score" },\n      { href: "/en/bp-simulator", text: "BP Simulator" },\n    ],\n  },\n  {\n    label: "Employers",\n    links: [\n      { href: "/en/hiring-managers/brief", text: "Brief a Role" },\n      { href: "/en/hiring-managers", text: "Our Process" },\n      { href: "/en/contact", text: "Get a Quote" },\n    ],\n  },\n  {\n    label: "Company",\n    links: [\n      { href: "/en/about", text: "About" },\n      { href: "/en/markets", text: "Markets" },\n      { href: "/en/insights", text: "Insights" },\n      { href: "/en/faq", text: "FAQ" },\n      { href: "/en/contact", text: "Contact" },\n    ],\n  },\n  {\n    label: "Specialists",\n    links: [\n      { href: "/en/latam-private-banking-recruiter-geneva", text: "LATAM" },\n      { href: "/en/mea-private-banking-recruiter-geneva", text: "MEA" },\n      { href: "/en/nri-private-banking-recruiter-switzerland", text: "NRI" },\n      { href: "/en/israeli-market-private-banking-switzerland", text: "Israeli Market" },\n      { href: "/en/apac-private-banking-recruiter-switzerland", text: "APAC" },\n      { href: "/en/private-banking-recruitment-company", text: "Our Firm" },\n    ],\n  },\n];\n\nconst HUBS = [\n  { city: "Geneva", flag: "🇨🇭", slug: "geneva" },\n  { city: "Zurich", flag: "🇨🇭", slug: "zurich" },\n  { city: "London", flag: "🇬🇧", slug: "london" },\n  { city: "Dubai", flag: "🇦🇪", slug: "dubai" },\n  { city: "Riyadh", flag: "🇸🇦", slug: "riyadh" },\n  { city: "Singapore", flag: "🇸🇬", slug: "singapore" },\n  { city: "Hong Kong", flag: "🇭🇰", slug: "hong-kong" },\n  { city: "New York", flag: "🇺🇸", slug: "new-york" },\n  { city: "Miami", flag: "🇺🇸", slug: "miami" },\n  { city: "Paris", flag: "🇫🇷", slug: "paris" },\n  { city: "Milan", flag: "🇮🇹", slug: "milan" },\n  { city: "Madrid", flag: "🇪🇸", slug: "madrid" },\n  { city: "Lisbon", flag: "🇵🇹", slug: "lisbon" },\n  { city: "Tel Aviv", flag: "🇮🇱", slug: "tel-aviv" },\n];\n\nexport default function Footer() {\n  return (\n    <footer className="relative bg-[#05070E] text-white overflow-hidden">\n      {/* Ambient glow */}\n      <div aria-hidden className="pointer-events-none absolute inset-0" style={{background:"radial-gradient(ellipse 70% 35% at 50% 0%, rgba(201,161,74,.10) 0%, transparent 60%)"}} />\n      {/* Gold shimmer line */}\n      <div className="h-px w-full" style={{background:"linear-gradient(90deg, transparent 0%, rgba(201,161,74,.5) 25%, rgba(240,208,96,.85) 50%, rgba(201,161,74,.5) 75%, transparent 100%)"}} />\n\n      <div className="relative mx-auto max-w-7xl px-5 sm:px-6 lg:px-8">\n\n        {/* ── MOBILE ── */}\n        <div className="md:hidden">\n\n          {/* Logo + tagline */}\n          <div className="pt-8 pb-6 flex flex-col items-center text-center border-b border-white/[0.06]">\n            <Image\n              src="/transparent-ep-logo.png"\n              alt="Executive Partners"\n              width={290}\n              height={60}\n              sizes="180px"\n              className="h-auto w-[180px] opacity-90 mb-4"\n            />\n            <div className="flex items-center gap-1.5">\n              <MapPin className="h-3 w-3 flex-shrink-0" style={{color:"#C9A14A"}} />\n              <span className="text-xs tracking-wide" style={{color:"rgba(201,161,74,.7)"}}>Geneva · Zurich · London · Dubai · Singapore</span>\n            </div>\n          </div>\n\n          {/* CTA block — dark with gold border */}\n          <div className="py-5 border-b border-white/[0.06]">\n            <Link href="https://calendly.com/execpartners/15-minute-career-consultation"\n              target="_blank" rel="noopener noreferrer"\n              className="flex flex-col items-center text-center w-full rounded-2xl px-6 py-6 gap-4 transition-all active:scale-[0.99]"\n              style={{background:"rgba(201,161,74,.06)",border:"1px solid rgba(201,161,74,.3)"}}>\n              <div>\n                <div className="text-[10px] font-semibold uppercase tracking-[0.15em] mb-2 text-center" style={{color:"rgba(201,161,74,.8)"}}>Confidential · Senior-level · No obligation</div>\n                <div className="text-lg font-semibold text-white leading-snug">Ready to calibrate<br/>your next move?</div>\n              </div>\n              <div className="inline-flex items-center gap-2 rounded-full px-5 py-2.5 text-sm font-semibold w-full justify-center" style={{background:"linear-gradient(135deg, #C9A14A 0%, #E8C46A 100%)",color:"#090C14",fontWeight:"600"}}>\n                Schedule a confidential call <ArrowRight className="h-4 w-4" />\n              </div>\n            </Link>\n          </div>\n\n          {/* Hub pills */}\n          <div className="py-5 border-b border-white/[0.06]">\n            <div className="text-[10px] font-semibold uppercase tracking-[0.12em] mb-3 text-center" style={{color:"rgba(201,161,74,.6)"}}>Our Hubs</div>\n            <div className="flex flex-wrap gap-1.5 justify-center">\n              {HUBS.map((h) => (\n                <Link key={h.city} href={`/en/markets/${h.slug}`}\n                  className="inline-flex items-center gap-1.5 rounded-full px-3 py-1 text-xs font-medium text-white/70 hover:text-white transition-colors"\n                  style={{background:"rgba(255,255,255,.06)",border:"1px solid rgba(255,255,255,.1)"}}>\n                  <span>{h.flag}</span>{h.city}\n                </Link>\n              ))}\n            </div>\n          </div>\n\n          {/* Nav 2-col */}\n          <div className="py-6 grid grid-cols-3 gap-x-4 gap-y-6 border-b border-white/[0.06]">\n            {NAV.map((col) => (\n              <div key={col.label}>\n                <div className="mb-3.5 text-[10px] font-semibold uppercase tracking-[0.14em] text-center" style={{color:"rgba(201,161,74,.8)"}}>{col.label}</div>\n                <ul className="space-y-3">\n                  {col.links.map((link) => (\n                    <li key={link.href}>\n                      <Link href={link.href} className="text-[13px] font-medium text-white/65 hover:text-white/90 transition-colors block text-center" style={{textDecoration:"none",color:"inherit"}}>{link.text}</Link>\n                    </li>\n                  ))}\n                </ul>\n              </div>\n            ))}\n          </div>\n\n          {/* Bottom bar */}\n          <div className="py-5 flex flex-col gap-2 items-center text-center">\n            <div className="text-[12px] text-white/40">© {new Date().getFullYear()} Executive Partners. All rights reserved.</div>\n            <div className="flex items-center gap-3 text-[11px]">\n              <Link href="/en/privacy" className="text-white/40 hover:text-white/70 transition-colors">GDPR Compliant</Link>\n              <span className="w-px h-3 bg-white/15" />\n              <span className="text-white/30">Confidentiality Guaranteed</span>\n            </div>\n          </div>\n        </div>\n\n        {/* ── DESKTOP ── */}\n        <div className="hidden md:block py-16">\n          <div className="flex items-start justify-between mb-12 pb-12 border-b border-white/[0.06]">\n            <div className="max-w-sm">\n              <Image src="/transparent-ep-logo.png" alt="Executive Partners" width={290} height={60} sizes="220px" className="h-auto w-[220px] opacity-90 mb-4" />\n              <p className="text-sm text-white/80 leading-relaxed">Geneva-based executive search for Private Banking & Wealth Management. 200+ placements across 14 global hubs.</p>\n            </div>\n            <Link href="https://calendly.com/execpartners/15-minute-career-consultation"\n              target="_blank" rel="noopener noreferrer"\n              className="inline-flex items-center gap-2 rounded-full px-5 py-2.5 text-sm font-semibold transition-all hover:brightness-110"\n              style={{background:"linear-gradient(135deg, #C9A14A 0%, #E8C46A 100%)",color:"#0B0E13"}}>\n              Schedule a call <ArrowRight className="h-4 w-4" />\n            </Link>\n          </div>\n          <div className="grid grid-cols-12 gap-10">\n            {NAV.map((col) => (\n              <div key={col.label} className="col-span-2">\n                <h4 className="text-[10px] font-semibold uppercase tracking-[0.14em] mb-4" style={{color:"#C9A14A"}}>{col.label}</h4>\n                <ul className="space-y-3">\n                  {col.links.map((link) => (\n                    <li key={link.href}>\n                      <Link href={link.href} className="text-sm text-white/75 hover:text-white visited:text-white/75 transition-colors">{link.text}</Link>\n                    </li>\n                  ))}\n                </ul>\n              </div>\n            ))}\n            <div className="col-span-4">\n              <h4 className="text-[10px] font-semibold uppercase tracking-[0.14em] mb-4" style={{color:"#C9A14A"}}>Our Hubs</h4>\n              <ul className="grid grid-cols-3 gap-x-6 gap-y-3">\n                {HUBS.map((h) => (\n                  <li key={h.city} className="text-sm text-white/70">\n                    <Link href={`/en/markets/${h.slug}`} className="hover:text-white transition-colors flex items-center gap-2">\n                      <span>{h.flag}</span>{h.city}\n                    </Link>\n                  </li>\n                ))}\n              </ul>\n            </div>\n          </div>\n          <div className="mt-12 pt-8 border-t border-white/[0.06] flex items-center justify-between text-xs text-white/50">\n            <div>© {new Date().getFullYear()} Executive Partners. All rights reserved.</div>\n            <div className="flex items-center gap-4">\n              <Link href="/en/privacy" className="hover:text-white visited:text-white/50 transition-colors">GDPR Compliant</Link>\n              <span className="w-px h-3 bg-white/15" />\n              <span>Confidentiality Guaranteed</span>\n            </div>\n          </div>\n        </div>\n\n      </div>\n    </footer>\n  );\n}\n')
-print("\u2713 Footer.tsx fixed — APAC now above Our Firm")
+write_text(BASE, "components/Footer.tsx", '// components/Footer.tsx\nimport Link from "next/link";\nimport Image from "next/image";\nimport { ArrowRight, MapPin } from "lucide-react";\n\nconst NAV = [\n  {\n    label: "Candidates",\n    links: [\n      { href: "/en/jobs", text: "Browse Jobs" },\n      { href: "/en/candidates", text: "Career Guidance" },\n      { href: "/en/portability", text: "Portability Score" },\n      { href: "/en/bp-simulator", text: "BP Simulator" },\n    ],\n  },\n  {\n    label: "Employers",\n    links: [\n      { href: "/en/hiring-managers/brief", text: "Brief a Role" },\n      { href: "/en/hiring-managers", text: "Our Process" },\n      { href: "/en/contact", text: "Get a Quote" },\n    ],\n  },\n  {\n    label: "Company",\n    links: [\n      { href: "/en/about", text: "About" },\n      { href: "/en/markets", text: "Markets" },\n      { href: "/en/insights", text: "Insights" },\n      { href: "/en/faq", text: "FAQ" },\n      { href: "/en/contact", text: "Contact" },\n    ],\n  },\n  {\n    label: "Specialists",\n    links: [\n      { href: "/en/latam-private-banking-recruiter-geneva", text: "LATAM" },\n      { href: "/en/mea-private-banking-recruiter-geneva", text: "MEA" },\n      { href: "/en/nri-private-banking-recruiter-switzerland", text: "NRI" },\n      { href: "/en/israeli-market-private-banking-switzerland", text: "Israeli Market" },\n      { href: "/en/apac-private-banking-recruiter-switzerland", text: "APAC" },\n      { href: "/en/private-banking-recruitment-company", text: "Our Firm" },\n    ],\n  },\n];\n\nconst HUBS = [\n  { city: "Geneva", flag: "🇨🇭", slug: "geneva" },\n  { city: "Zurich", flag: "🇨🇭", slug: "zurich" },\n  { city: "London", flag: "🇬🇧", slug: "london" },\n  { city: "Dubai", flag: "🇦🇪", slug: "dubai" },\n  { city: "Riyadh", flag: "🇸🇦", slug: "riyadh" },\n  { city: "Singapore", flag: "🇸🇬", slug: "singapore" },\n  { city: "Hong Kong", flag: "🇭🇰", slug: "hong-kong" },\n  { city: "New York", flag: "🇺🇸", slug: "new-york" },\n  { city: "Miami", flag: "🇺🇸", slug: "miami" },\n  { city: "Paris", flag: "🇫🇷", slug: "paris" },\n  { city: "Milan", flag: "🇮🇹", slug: "milan" },\n  { city: "Madrid", flag: "🇪🇸", slug: "madrid" },\n  { city: "Lisbon", flag: "🇵🇹", slug: "lisbon" },\n  { city: "Tel Aviv", flag: "🇮🇱", slug: "tel-aviv" },\n];\n\nexport default function Footer() {\n  return (\n    <footer className="relative bg-[#05070E] text-white overflow-hidden">\n      {/* Ambient glow */}\n      <div aria-hidden className="pointer-events-none absolute inset-0" style={{background:"radial-gradient(ellipse 70% 35% at 50% 0%, rgba(201,161,74,.10) 0%, transparent 60%)"}} />\n      {/* Gold shimmer line */}\n      <div className="h-px w-full" style={{background:"linear-gradient(90deg, transparent 0%, rgba(201,161,74,.5) 25%, rgba(240,208,96,.85) 50%, rgba(201,161,74,.5) 75%, transparent 100%)"}} />\n\n      <div className="relative mx-auto max-w-7xl px-5 sm:px-6 lg:px-8">\n\n        {/* ── MOBILE ── */}\n        <div className="md:hidden">\n\n          {/* Logo + tagline */}\n          <div className="pt-8 pb-6 flex flex-col items-center text-center border-b border-white/[0.06]">\n            <Image\n              src="/transparent-ep-logo.png"\n              alt="Executive Partners"\n              width={290}\n              height={60}\n              sizes="180px"\n              className="h-auto w-[180px] opacity-90 mb-4"\n            />\n            <div className="flex items-center gap-1.5">\n              <MapPin className="h-3 w-3 flex-shrink-0" style={{color:"#C9A14A"}} />\n              <span className="text-xs tracking-wide" style={{color:"rgba(201,161,74,.7)"}}>Geneva · Zurich · London · Dubai · Singapore</span>\n            </div>\n          </div>\n\n          {/* CTA block — dark with gold border */}\n          <div className="py-5 border-b border-white/[0.06]">\n            <Link href="https://calendly.com/execpartners/15-minute-career-consultation"\n              target="_blank" rel="noopener noreferrer"\n              className="flex flex-col items-center text-center w-full rounded-2xl px-6 py-6 gap-4 transition-all active:scale-[0.99]"\n              style={{background:"rgba(201,161,74,.06)",border:"1px solid rgba(201,161,74,.3)"}}>\n              <div>\n                <div className="text-[10px] font-semibold uppercase tracking-[0.15em] mb-2 text-center" style={{color:"rgba(201,161,74,.8)"}}>Confidential · Senior-level · No obligation</div>\n                <div className="text-lg font-semibold text-white leading-snug">Ready to calibrate<br/>your next move?</div>\n              </div>\n              <div className="inline-flex items-center gap-2 rounded-full px-5 py-2.5 text-sm font-semibold w-full justify-center" style={{background:"linear-gradient(135deg, #C9A14A 0%, #E8C46A 100%)",color:"#090C14",fontWeight:"600"}}>\n                Schedule a confidential call <ArrowRight className="h-4 w-4" />\n              </div>\n            </Link>\n          </div>\n\n          {/* Hub pills */}\n          <div className="py-5 border-b border-white/[0.06]">\n            <div className="text-[10px] font-semibold uppercase tracking-[0.12em] mb-3 text-center" style={{color:"rgba(201,161,74,.6)"}}>Our Hubs</div>\n            <div className="flex flex-wrap gap-1.5 justify-center">\n              {HUBS.map((h) => (\n                <Link key={h.city} href={`/en/markets/${h.slug}`}\n                  className="inline-flex items-center gap-1.5 rounded-full px-3 py-1 text-xs font-medium text-white/70 hover:text-white transition-colors"\n                  style={{background:"rgba(255,255,255,.06)",border:"1px solid rgba(255,255,255,.1)"}}>\n                  <span>{h.flag}</span>{h.city}\n                </Link>\n              ))}\n            </div>\n          </div>\n\n          {/* Nav 2-col */}\n          <div className="py-6 grid grid-cols-3 gap-x-4 gap-y-6 border-b border-white/[0.06]">\n            {NAV.map((col) => (\n              <div key={col.label}>\n                <div className="mb-3.5 text-[10px] font-semibold uppercase tracking-[0.14em] text-center" style={{color:"rgba(201,161,74,.8)"}}>{col.label}</div>\n                <ul className="space-y-3">\n                  {col.links.map((link) => (\n                    <li key={link.href}>\n                      <Link href={link.href} className="text-[13px] font-medium text-white/65 hover:text-white/90 transition-colors block text-center" style={{textDecoration:"none",color:"inherit"}}>{link.text}</Link>\n                    </li>\n                  ))}\n                </ul>\n              </div>\n            ))}\n          </div>\n\n          {/* Bottom bar */}\n          <div className="py-5 flex flex-col gap-2 items-center text-center">\n            <div className="text-[12px] text-white/40">© {new Date().getFullYear()} Executive Partners. All rights reserved.</div>\n            <div className="flex items-center gap-3 text-[11px]">\n              <Link href="/en/privacy" className="text-white/40 hover:text-white/70 transition-colors">GDPR Compliant</Link>\n              <span className="w-px h-3 bg-white/15" />\n              <span className="text-white/30">Confidentiality Guaranteed</span>\n            </div>\n          </div>\n        </div>\n\n        {/* ── DESKTOP ── */}\n        <div className="hidden md:block py-16">\n          <div className="flex items-start justify-between mb-12 pb-12 border-b border-white/[0.06]">\n            <div className="max-w-sm">\n              <Image src="/transparent-ep-logo.png" alt="Executive Partners" width={290} height={60} sizes="220px" className="h-auto w-[220px] opacity-90 mb-4" />\n              <p className="text-sm text-white/80 leading-relaxed">Geneva-based executive search for Private Banking & Wealth Management. 200+ placements across 14 global hubs.</p>\n            </div>\n            <Link href="https://calendly.com/execpartners/15-minute-career-consultation"\n              target="_blank" rel="noopener noreferrer"\n              className="inline-flex items-center gap-2 rounded-full px-5 py-2.5 text-sm font-semibold transition-all hover:brightness-110"\n              style={{background:"linear-gradient(135deg, #C9A14A 0%, #E8C46A 100%)",color:"#0B0E13"}}>\n              Schedule a call <ArrowRight className="h-4 w-4" />\n            </Link>\n          </div>\n          <div className="grid grid-cols-12 gap-10">\n            {NAV.map((col) => (\n              <div key={col.label} className="col-span-2">\n                <h4 className="text-[10px] font-semibold uppercase tracking-[0.14em] mb-4" style={{color:"#C9A14A"}}>{col.label}</h4>\n                <ul className="space-y-3">\n                  {col.links.map((link) => (\n                    <li key={link.href}>\n                      <Link href={link.href} className="text-sm text-white/75 hover:text-white visited:text-white/75 transition-colors">{link.text}</Link>\n                    </li>\n                  ))}\n                </ul>\n              </div>\n            ))}\n            <div className="col-span-4">\n              <h4 className="text-[10px] font-semibold uppercase tracking-[0.14em] mb-4" style={{color:"#C9A14A"}}>Our Hubs</h4>\n              <ul className="grid grid-cols-3 gap-x-6 gap-y-3">\n                {HUBS.map((h) => (\n                  <li key={h.city} className="text-sm text-white/70">\n                    <Link href={`/en/markets/${h.slug}`} className="hover:text-white transition-colors flex items-center gap-2">\n                      <span>{h.flag}</span>{h.city}\n                    </Link>\n                  </li>\n                ))}\n              </ul>\n            </div>\n          </div>\n          <div className="mt-12 pt-8 border-t border-white/[0.06] flex items-center justify-between text-xs text-white/50">\n            <div>© {new Date().getFullYear()} Executive Partners. All rights reserved.</div>\n            <div className="flex items-center gap-4">\n              <Link href="/en/privacy" className="hover:text-white visited:text-white/50 transition-colors">GDPR Compliant</Link>\n              <span className="w-px h-3 bg-white/15" />\n              <span>Confidentiality Guaranteed</span>\n            </div>\n          </div>\n        </div>\n\n      </div>\n    </footer>\n  );\n}\n')
+print("Footer.tsx: APAC now above Our Firm")
 print("\nRun: git add -A && git commit -m \"fix: footer Specialists order APAC before Our Firm\" && git push")
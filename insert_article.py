@@ -1,14 +1,26 @@
-path = "app/en/insights/articles.ts"
-with open(path, "r", encoding="utf-8") as f:
-    s = f.read()
+#!/usr/bin/env python3
+"""
+Insert (or replace) an insight article from a JSON record.
 
-anchor = "export const articles: InsightArticle[] = ["
-assert s.count(anchor) == 1, "anchor not found or not unique"
+The record carries the InsightArticle fields (app/en/insights/types.ts) and is
+saved as data/insights/<slug>.json; app/en/insights/articles.ts is regenerated.
+Run from repo root: python3 insert_article.py [/tmp/ep_article.json]
+"""
+import json
+import os
+import sys
 
-new_entry = open("/tmp/ep_article_body.py").read()
-s = s.replace(anchor, anchor + "\n" + new_entry, 1)
+from ep_tools.articles import ArticleError, add_article
 
-with open(path, "w", encoding="utf-8") as f:
-    f.write(s)
+BASE = os.path.dirname(os.path.abspath(__file__))
 
-print("Done. Article inserted.")
+path = sys.argv[1] if len(sys.argv) > 1 else "/tmp/ep_article.json"
+with open(path, encoding="utf-8") as f:
+    record = json.load(f)
+
+try:
+    add_article(BASE, record)
+except ArticleError as e:
+    sys.exit(f"✗ {e}")
+
+print(f"Done. Article inserted: {record['slug']}")
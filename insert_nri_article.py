@@ -1,18 +1,14 @@
 #!/usr/bin/env python3
 """
-Insert NRI PWP article into articles.ts
+Insert NRI PWP article into the insights store (data/insights/<slug>.json)
 Run from repo root: python3 insert_nri_article.py
 """
 import os
+import sys
 
-BASE = os.path.dirname(os.path.abspath(__file__))
-path = os.path.join(BASE, "app/en/insights/articles.ts")
-
-with open(path, "r", encoding="utf-8") as f:
-    s = f.read()
+from ep_tools.articles import ArticleError, add_article
 
-ANCHOR = "export const INSIGHTS: readonly InsightArticle[] = ["
-assert s.count(ANCHOR) == 1, "Anchor not found or not unique"
+BASE = os.path.dirname(os.path.abspath(__file__))
 
 BODY = """
 Switzerland's private banks are not short of ambition when it comes to the NRI market. Non-Resident Indian clients appear on almost every strategic plan in Geneva and Zurich. The segment is listed in pitch decks, referenced in RFPs, and cited during banker interviews as a growth priority. What those plans rarely contain is an honest description of what a genuine NRI Relationship Manager looks like, and why the profile most banks are currently hiring is not the one that builds the franchise they are describing.
@@ -50,27 +46,26 @@ Executive Partners' NRI practice covers NRI private banking recruitment in Genev
 
 WORD_COUNT = len(BODY.split())
 
-NEW_ENTRY = '''  {
-    slug: "nri-private-banking-switzerland-desk-hiring",
-    title: "The NRI Desk Problem in Swiss Private Banking",
-    seoTitle: "NRI Private Banking Switzerland | How to Actually Build the Desk",
-    seoDescription: "Every Swiss bank wants an NRI desk. Most are hiring the wrong profile. A recruiter's view of what genuine NRI private banking coverage requires.",
-    linkedinUrl: "",
-    date: "2026-06-22",
-    summary: "Swiss private banks are adding NRI to their strategic plans but hiring the wrong profile. A recruiter's view of what genuine Non-Resident Indian private banking coverage actually requires, why South Asian is not the same as NRI, and where the real pipeline sits.",
-    pillar: "P2",
-    markets: ["CH", "UK", "UAE", "SG"],
-    keywords: ["NRI private banking", "non-resident Indian wealth management", "NRI private banker Switzerland", "NRI private banking Geneva", "NRI private banking recruiter"],
-    ogImage: "/og-articles/og-nri-private-banking-recruiter-switzerland.jpg",
-    featured: false,
-    body: `''' + BODY + '''`,
-  },
-'''
-
-s = s.replace(ANCHOR, ANCHOR + "\n" + NEW_ENTRY, 1)
-
-with open(path, "w", encoding="utf-8") as f:
-    f.write(s)
-
-print(f"Inserted: nri-private-banking-switzerland-desk-hiring")
+RECORD = {
+    "slug": "nri-private-banking-switzerland-desk-hiring",
+    "title": "The NRI Desk Problem in Swiss Private Banking",
+    "seoTitle": "NRI Private Banking Switzerland | How to Actually Build the Desk",
+    "seoDescription": "Every Swiss bank wants an NRI desk. Most are hiring the wrong profile. A recruiter's view of what genuine NRI private banking coverage requires.",
+    "linkedinUrl": "",
+    "date": "2026-06-22",
+    "summary": "Swiss private banks are adding NRI to their strategic plans but hiring the wrong profile. A recruiter's view of what genuine Non-Resident Indian private banking coverage actually requires, why South Asian is not the same as NRI, and where the real pipeline sits.",
+    "pillar": "P2",
+    "markets": ["CH", "UK", "UAE", "SG"],
+    "keywords": ["NRI private banking", "non-resident Indian wealth management", "NRI private banker Switzerland", "NRI private banking Geneva", "NRI private banking recruiter"],
+    "ogImage": "/og-articles/og-nri-private-banking-recruiter-switzerland.jpg",
+    "featured": False,
+    "body": BODY,
+}
+
+try:
+    add_article(BASE, RECORD)
+except ArticleError as e:
+    sys.exit(f"✗ {e}")
+
+print(f"Inserted: {RECORD['slug']}")
 print(f"Body word count: ~{WORD_COUNT} words")
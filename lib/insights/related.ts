@@ -1,5 +1,6 @@
 // lib/insights/related.ts
 import { INSIGHTS, type InsightArticle } from "@/app/en/insights/articles";
+import RELATED_LINKS from "@/data/related.json";
 
 const yearOf = (iso: string) => (iso || "").slice(0, 4);
 
@@ -85,4 +86,16 @@ export function getInsightsBySubTheme(current: InsightArticle, limit = 3) {
       return engagementOf(b) - engagementOf(a);
     })
     .slice(0, limit);
-}
\ No newline at end of file
+}
+
+export type RelatedLinks = { articles: string[]; jobs: string[] };
+
+/**
+ * ✅ Content-based links (TF-IDF cosine across insights, LinkedIn articles and jobs)
+ * - Generated offline by `python3 -m ep_tools.related` into data/related.json
+ * - Jobs are the ones still valid on the file's `asOf` date
+ * - Keyed by site path: "/en/insights/<slug>", "/en/jobs/<slug>", "/go/linkedin-article/<slug>"
+ */
+export function getRelatedLinks(path: string): RelatedLinks {
+  return (RELATED_LINKS.links as Record<string, RelatedLinks>)[path] ?? { articles: [], jobs: [] };
+}
@@ -0,0 +1,97 @@
+// lib/insights/search.ts
+// Client-side search over public/search/insights.json (built by ep_tools.insights_ingest).
+
+export type InsightSearchDoc = [slug: string, title: string, date: string, readingMinutes: number, excerpt: string];
+
+export type InsightSearchIndex = {
+  v: 1;
+  stop: string[];
+  docs: InsightSearchDoc[];
+  /** term -> flat [docGap, weight, docGap, weight, ...]; the first gap is the doc id itself */
+  terms: Record<string, number[]>;
+};
+
+export type InsightSearchHit = {
+  slug: string;
+  title: string;
+  date: string;
+  readingMinutes: number;
+  excerpt: string;
+  score: number;
+};
+
+export const INSIGHT_SEARCH_INDEX_URL = "/search/insights.json";
+
+let indexPromise: Promise<InsightSearchIndex> | null = null;
+
+/** Fetch the index once per page load. */
+export function loadInsightSearchIndex(): Promise<InsightSearchIndex> {
+  if (!indexPromise) {
+    indexPromise = fetch(INSIGHT_SEARCH_INDEX_URL)
+      .then((r) => {
+        if (!r.ok) throw new Error(`insight search index: HTTP ${r.status}`);
+        return r.json() as Promise<InsightSearchIndex>;
+      })
+      .catch((err) => {
+        indexPromise = null; // allow a retry
+        throw err;
+      });
+  }
+  return indexPromise;
+}
+
+/** Same rules as the Python tokenizer: fold accents, a-z0-9 runs, no stopwords or 1-char tokens. */
+function tokenize(text: string, stop: Set<string>) {
+  const folded = text.toLowerCase().normalize("NFKD").replace(/[\u0300-\u036f]/g, "");
+  return (folded.match(/[a-z0-9]+/g) ?? []).filter((t) => t.length > 1 && !stop.has(t));
+}
+
+const stopSets = new WeakMap<InsightSearchIndex, Set<string>>();
+
+/**
+ * ✅ Every query term must match (the last one as a prefix, for search-as-you-type);
+ * score = sum of weight * idf.
+ */
+export function searchInsights(index: InsightSearchIndex, query: string, limit = 10): InsightSearchHit[] {
+  let stop = stopSets.get(index);
+  if (!stop) {
+    stop = new Set(index.stop);
+    stopSets.set(index, stop);
+  }
+  const q = tokenize(query, stop);
+  if (!q.length) return [];
+
+  const n = index.docs.length;
+  let scores: Map<number, number> | null = null;
+  q.forEach((term, k) => {
+    const keys = k === q.length - 1 ? Object.keys(index.terms).filter((t) => t.startsWith(term)) : [term];
+    const hits = new Map<number, number>();
+    for (const key of keys) {
+      const flat = index.terms[key] ?? [];
+      const idf = Math.log(1 + n / (flat.length / 2 || 1));
+      let doc = 0;
+      for (let i = 0; i < flat.length; i += 2) {
+        doc += flat[i];
+        hits.set(doc, (hits.get(doc) ?? 0) + flat[i + 1] * idf);
+      }
+    }
+    if (scores === null) {
+      scores = hits;
+    } else {
+      const next = new Map<number, number>();
+      for (const [doc, s] of scores) {
+        const h = hits.get(doc);
+        if (h !== undefined) next.set(doc, s + h);
+      }
+      scores = next;
+    }
+  });
+
+  return [...(scores ?? new Map<number, number>()).entries()]
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .slice(0, limit)
+    .map(([doc, score]) => {
+      const [slug, title, date, readingMinutes, excerpt] = index.docs[doc];
+      return { slug, title, date, readingMinutes, excerpt, score };
+    });
+}
@@ -4,18 +4,17 @@ Adds Specialists dropdown to TopNav and Specialists column to Footer.
 Run from repo root: python3 nav_specialists_patch.py
 """
 import os
+
+from ep_tools.files import write_text
+
 BASE = os.path.dirname(os.path.abspath(__file__))
 
 nav = '"use client";\n\nimport Link from "next/link";\nimport { usePathname } from "next/navigation";\nimport { useEffect, useMemo, useRef, useState } from "react";\n\ntype NavItem = { href: string; label: string; external?: boolean };\n\nfunction withBase(base: string, href: string) {\n  if (!href.startsWith("/")) return href;\n  if (!base) return href;\n  if (href.startsWith("/en/")) return href; // avoid double-prefix\n  return `${base}${href}`;\n}\n\nexport default function TopNav() {\n  const pathname = usePathname();\n  const [open, setOpen] = useState(false); // mobile panel\n  const [scrolled, setScrolled] = useState(false);\n  const [dd, setDd] = useState<null | "Tools" | "Insights" | "Specialists">(null); // desktop dropdown\n\n  // ✅ Prevent dropdown from closing instantly when moving cursor button -> panel\n  const closeTimer = useRef<number | null>(null);\n  const openDd = (which: "Tools" | "Insights" | "Specialists") => {\n    if (closeTimer.current) window.clearTimeout(closeTimer.current);\n    setDd(which);\n  };\n  const scheduleCloseDd = () => {\n    if (closeTimer.current) window.clearTimeout(closeTimer.current);\n    closeTimer.current = window.setTimeout(() => setDd(null), 180);\n  };\n\n  // ✅ Nav targets (Markets/Jobs/Candidates/Hiring Managers/About/Contact/Tools/Insights)\n  // have no separate French or German version, so always point at /en regardless of\n  // the current path. Previously this only matched pages already under /en/, so the\n  // bare homepage ("/") and /de fell through to unprefixed links (/markets, /jobs...).\n  const base = "/en";\n\n  // ✅ Normalize pathname for active matching (strip /en)\n  const normalizedPath = useMemo(() => {\n    if (!pathname) return "";\n    return pathname.startsWith("/en/") ? pathname.slice(3) : pathname; // "/en/xyz" -> "/xyz"\n  }, [pathname]);\n\n  // ✅ Active check uses normalizedPath and *unprefixed* route\n  const isActive = (href: string) =>\n    normalizedPath === href || normalizedPath.startsWith(href + "/");\n\n  // ----- Nav structure (unprefixed routes)\n  const TOP: NavItem[] = [\n    { href: "/markets", label: "Markets" },\n    { href: "/jobs", label: "Jobs" },\n    { href: "/candidates", label: "Candidates" },\n    { href: "/hiring-managers", label: "Hiring Managers" },\n    { href: "/about", label: "About" },\n  ];\n\n  const TOOLS: NavItem[] = [\n    { href: "/bp-simulator", label: "Business Plan Simulator" },\n    { href: "/portability", label: "Portability Score" },\n  ];\n\n  const INSIGHTS: NavItem[] = [\n    { href: "/insights", label: "Private Wealth Pulse" },\n    {\n      href: "/insights/private-banking-career-intelligence",\n      label: "Career Intelligence 2026",\n    },\n  ];\n\n  const SPECIALISTS: NavItem[] = [\n    { href: "/latam-private-banking-recruiter-geneva", label: "LATAM Private Banking" },\n    { href: "/mea-private-banking-recruiter-geneva", label: "MEA Private Banking" },\n    { href: "/nri-private-banking-recruiter-switzerland", label: "NRI Private Banking" },\n    { href: "/israeli-market-private-banking-switzerland", label: "Israeli Market" },\n    { href: "/private-banking-recruitment-company", label: "Our Firm" },\n  ];\n\n  const CONTACT: NavItem = { href: "/contact", label: "Contact" };\n\n  // Apply base to internal routes\n  const TOP_BASE = useMemo(\n    () => TOP.map((i) => (i.external ? i : { ...i, href: withBase(base, i.href) })),\n    [base]\n  );\n  const TOOLS_BASE = useMemo(\n    () => TOOLS.map((i) => (i.external ? i : { ...i, href: withBase(base, i.href) })),\n    [base]\n  );\n  const INSIGHTS_BASE = useMemo(\n    () => INSIGHTS.map((i) => (i.external ? i : { ...i, href: withBase(base, i.href) })),\n    [base]\n  );\n  const SPECIALISTS_BASE = useMemo(\n    () => SPECIALISTS.map((i) => (i.external ? i : { ...i, href: withBase(base, i.href) })),\n    [base]\n  );\n\n  const CONTACT_BASE = useMemo(\n    () => (CONTACT.external ? CONTACT : { ...CONTACT, href: withBase(base, CONTACT.href) }),\n    [base]\n  );\n\n  // Body scroll lock when mobile menu is open\n  useEffect(() => {\n    document.body.classList.toggle("ep-lock-scroll", open);\n    return () => document.body.classList.remove("ep-lock-scroll");\n  }, [open]);\n\n  // Close menus on route change\n  useEffect(() => {\n    setOpen(false);\n    setDd(null);\n    document.body.classList.remove("ep-lock-scroll");\n  }, [pathname]);\n\n  // Header style on scroll + ESC to close\n  useEffect(() => {\n    const onScroll = () => setScrolled(window.scrollY > 8);\n    const onKey = (e: KeyboardEvent) => {\n      if (e.key === "Escape") {\n        setOpen(false);\n        setDd(null);\n      }\n    };\n    onScroll();\n    window.addEventListener("scroll", onScroll, { passive: true });\n    window.addEventListener("keydown", onKey);\n    return () => {\n      window.removeEventListener("scroll", onScroll);\n      window.removeEventListener("keydown", onKey);\n    };\n  }, []);\n\n  // Cleanup timer\n  useEffect(() => {\n    return () => {\n      if (closeTimer.current) window.clearTimeout(closeTimer.current);\n    };\n  }, []);\n\n  const bar =\n    "fixed inset-x-0 top-0 z-40 transition-colors " +\n    (scrolled\n      ? "border-b border-white/10 bg-[#050814]/80 backdrop-blur supports-[backdrop-filter]:bg-[#050814]/65"\n      : "bg-transparent");\n\n  const linkClasses = (active: boolean) =>\n    [\n      "relative rounded-full px-3 py-1.5 text-sm whitespace-nowrap transition-colors",\n      active\n        ? "text-[#F5D778] bg-white/5"\n        : "text-slate-200 hover:text-white hover:bg-white/5",\n    ].join(" ");\n\n  const ddButtonClasses = (active: boolean, isOpen: boolean) =>\n    [\n      "relative rounded-full px-3 py-1.5 text-sm whitespace-nowrap transition-colors flex items-center gap-1",\n      active || isOpen\n        ? "text-[#F5D778] bg-white/5"\n        : "text-slate-200 hover:text-white hover:bg-white/5",\n    ].join(" ");\n\n  // ✅ IMPORTANT: open inward & above other elements\n  const ddPanel =\n    "absolute right-0 mt-2 w-72 rounded-2xl border border-white/10 bg-[#050814]/95 backdrop-blur p-2 shadow-xl z-50";\n\n  const ddItemClasses = (active: boolean) =>\n    [\n      "block rounded-xl px-3 py-2 text-sm transition-colors",\n      active\n        ? "bg-white/10 text-[#F5D778]"\n        : "text-slate-200 hover:text-white hover:bg-white/5",\n    ].join(" ");\n\n  const toolsActive = TOOLS.some((i) => isActive(i.href));\n  const insightsActive = INSIGHTS.some((i) => isActive(i.href));\n  const specialistsActive = SPECIALISTS.some((i) => isActive(i.href));\n\n  return (\n    <header className={bar}>\n      <nav className="mx-auto max-w-6xl px-4 sm:px-6 lg:px-8 py-3">\n        <div className="flex items-center justify-between gap-3">\n          {/* Brand */}\n          <Link\n            href={base || "/"}\n            className="shrink-0 text-base sm:text-lg font-semibold tracking-tight text-white hover:text-[#F5D778] transition-colors"\n            aria-label="Executive Partners — Home"\n          >\n            Executive Partners\n          </Link>\n\n          {/* Desktop nav */}\n          <div className="hidden md:flex items-center gap-2">\n            {/* ✅ Left: scrolling links only (no dropdowns inside overflow container) */}\n            <div className="flex items-center gap-2 max-w-[62vw] overflow-x-auto overscroll-x-contain [-webkit-overflow-scrolling:touch] pr-1">\n              {TOP_BASE.map((item) =>\n                item.external ? (\n                  <a\n                    key={item.href}\n                    href={item.href}\n                    target="_blank"\n                    rel="noopener noreferrer"\n                    className={linkClasses(isActive(item.href))}\n                  >\n                    {item.label}\n                  </a>\n                ) : (\n                  <Link\n                    key={item.href}\n                    href={item.href}\n                    className={linkClasses(isActive(item.href))}\n                    aria-current={isActive(item.href) ? "page" : undefined}\n                  >\n                    {item.label}\n                  </Link>\n                )\n              )}\n            </div>\n\n            {/* ✅ Right: dropdowns + CTA (no overflow clipping) */}\n            <div className="relative flex items-center gap-2">\n              {/* Tools dropdown */}\n              <div\n                className="relative"\n                onMouseEnter={() => openDd("Tools")}\n                onMouseLeave={scheduleCloseDd}\n              >\n                <button\n                  type="button"\n                  className={ddButtonClasses(toolsActive, dd === "Tools")}\n                  aria-haspopup="menu"\n                  aria-expanded={dd === "Tools"}\n                  onClick={() => setDd(dd === "Tools" ? null : "Tools")}\n                >\n                  Tools <span className="text-xs opacity-80">▾</span>\n                </button>\n\n                {dd === "Tools" && (\n                  <div\n                    role="menu"\n                    className={ddPanel}\n                    onMouseEnter={() => openDd("Tools")}\n                    onMouseLeave={scheduleCloseDd}\n                  >\n                    {TOOLS_BASE.map((i) => (\n                      <Link\n                        key={i.href}\n                        href={i.href}\n                        role="menuitem"\n                        className={ddItemClasses(isActive(i.href))}\n                        onClick={() => setDd(null)}\n                      >\n                        {i.label}\n                      </Link>\n                    ))}\n                  </div>\n                )}\n              </div>\n\n              {/* Insights dropdown */}\n              <div\n                className="relative"\n                onMouseEnter={() => openDd("Insights")}\n                onMouseLeave={scheduleCloseDd}\n              >\n                <button\n                  type="button"\n                  className={ddButtonClasses(insightsActive, dd === "Insights")}\n                  aria-haspopup="menu"\n                  aria-expanded={dd === "Insights"}\n                  onClick={() => setDd(dd === "Insights" ? null : "Insights")}\n                >\n                  Insights <span className="text-xs opacity-80">▾</span>\n                </button>\n\n                {dd === "Insights" && (\n                  <div\n                    role="menu"\n                    className={ddPanel}\n                    onMouseEnter={() => openDd("Insights")}\n                    onMouseLeave={scheduleCloseDd}\n                  >\n                    {INSIGHTS_BASE.map((i) => (\n                      <Link\n                        key={i.href}\n                        href={i.href}\n                        role="menuitem"\n                        className={ddItemClasses(isActive(i.href))}\n                        onClick={() => setDd(null)}\n                      >\n                        {i.label}\n                      </Link>\n                    ))}\n                  </div>\n                )}\n              </div>\n\n              {/* Specialists dropdown */}\n              <div\n                className="relative"\n                onMouseEnter={() => openDd("Specialists")}\n                onMouseLeave={scheduleCloseDd}\n              >\n                <button\n                  type="button"\n                  className={ddButtonClasses(specialistsActive, dd === "Specialists")}\n                  aria-haspopup="menu"\n                  aria-expanded={dd === "Specialists"}\n                  onClick={() => setDd(dd === "Specialists" ? null : "Specialists")}\n                >\n                  Specialists <span className="text-xs opacity-80">▾</span>\n                </button>\n\n                {dd === "Specialists" && (\n                  <div\n                    role="menu"\n                    className={ddPanel}\n                    onMouseEnter={() => openDd("Specialists")}\n                    onMouseLeave={scheduleCloseDd}\n                  >\n                    {SPECIALISTS_BASE.map((i) => (\n                      <Link\n                        key={i.href}\n                        href={i.href}\n                        role="menuitem"\n                        className={ddItemClasses(isActive(i.href))}\n                        onClick={() => setDd(null)}\n                      >\n                        {i.label}\n                      </Link>\n                    ))}\n                  </div>\n                )}\n              </div>\n\n              {/* German language link */}\n              <Link\n                href="/de"\n                className="rounded-full px-2.5 py-1.5 text-xs font-semibold text-slate-400 hover:text-white hover:bg-white/5 transition-colors"\n                title="Deutsche Version"\n              >\n                DE\n              </Link>\n\n              {/* Contact CTA */}\n              <Link\n                href={CONTACT_BASE.href}\n                className="ml-2 rounded-full bg-[#F5D778] px-4 py-2 text-sm font-semibold text-[#050814] hover:opacity-90 transition"\n              >\n                Contact\n              </Link>\n            </div>\n          </div>\n\n          {/* Mobile burger */}\n          <button\n            type="button"\n            aria-label={open ? "Close menu" : "Open menu"}\n            aria-expanded={open}\n            onClick={() => setOpen((v) => !v)}\n            className="md:hidden rounded-full border border-white/15 bg-white/5 px-3 py-1.5 text-sm text-white hover:bg-white/10"\n          >\n            {open ? "Close" : "Menu"}\n          </button>\n        </div>\n\n        {/* Mobile panel */}\n        <div\n          className={\n            (open ? "mt-3" : "hidden") +\n            " md:hidden rounded-2xl border border-white/10 bg-[#050814]/95 backdrop-blur p-3"\n          }\n        >\n          <ul className="grid gap-1">\n            {TOP_BASE.map((item) => {\n              const active = isActive(item.href.replace(base, "") || item.href);\n              const cls = [\n                "block rounded-md px-3 py-2 text-sm transition-colors",\n                active\n                  ? "bg-white/10 text-[#F5D778]"\n                  : "text-slate-200 hover:text-white hover:bg-white/5",\n              ].join(" ");\n\n              return (\n                <li key={item.href}>\n                  {item.external ? (\n                    <a\n                      href={item.href}\n                      target="_blank"\n                      rel="noopener noreferrer"\n                      className={cls}\n                      onClick={() => setOpen(false)}\n                    >\n                      {item.label}\n                    </a>\n                  ) : (\n                    <Link\n                      href={item.href}\n                      className={cls}\n                      onClick={() => setOpen(false)}\n                      aria-current={active ? "page" : undefined}\n                    >\n                      {item.label}\n                    </Link>\n                  )}\n                </li>\n              );\n            })}\n\n            {/* Mobile section: Tools */}\n            <li className="mt-2 px-3 pt-2 text-xs font-semibold tracking-wider text-slate-400 uppercase">\n              Tools\n            </li>\n            {TOOLS_BASE.map((item) => {\n              const active = isActive(item.href.replace(base, "") || item.href);\n              const cls = [\n                "block rounded-md px-3 py-2 text-sm transition-colors",\n                active\n                  ? "bg-white/10 text-[#F5D778]"\n                  : "text-slate-200 hover:text-white hover:bg-white/5",\n              ].join(" ");\n\n              return (\n                <li key={item.href}>\n                  <Link\n                    href={item.href}\n                    className={cls}\n                    onClick={() => setOpen(false)}\n                    aria-current={active ? "page" : undefined}\n                  >\n                    {item.label}\n                  </Link>\n                </li>\n              );\n            })}\n\n            {/* Mobile section: Insights */}\n            <li className="mt-2 px-3 pt-2 text-xs font-semibold tracking-wider text-slate-400 uppercase">\n              Insights\n            </li>\n            {INSIGHTS_BASE.map((item) => {\n              const active = isActive(item.href.replace(base, "") || item.href);\n              const cls = [\n                "block rounded-md px-3 py-2 text-sm transition-colors",\n                active\n                  ? "bg-white/10 text-[#F5D778]"\n                  : "text-slate-200 hover:text-white hover:bg-white/5",\n              ].join(" ");\n\n              return (\n                <li key={item.href}>\n                  <Link\n                    href={item.href}\n                    className={cls}\n                    onClick={() => setOpen(false)}\n                    aria-current={active ? "page" : undefined}\n                  >\n                    {item.label}\n                  </Link>\n                </li>\n              );\n            })}\n\n            {/* Mobile section: Specialists */}\n            <li className="mt-2 px-3 pt-2 text-xs font-semibold tracking-wider text-slate-400 uppercase">\n              Specialists\n            </li>\n            {SPECIALISTS_BASE.map((item) => {\n              const active = isActive(item.href.replace(base, "") || item.href);\n              const cls = [\n                "block rounded-md px-3 py-2 text-sm transition-colors",\n                active\n                  ? "bg-white/10 text-[#F5D778]"\n                  : "text-slate-200 hover:text-white hover:bg-white/5",\n              ].join(" ");\n              return (\n                <li key={item.href}>\n                  <Link\n                    href={item.href}\n                    className={cls}\n                    onClick={() => setOpen(false)}\n                    aria-current={active ? "page" : undefined}\n                  >\n                    {item.label}\n                  </Link>\n                </li>\n              );\n            })}\n\n            {/* Mobile German language link */}\n            <li className="mt-2">\n              <Link\n                href="/de"\n                className="block rounded-md px-3 py-2 text-sm text-center text-slate-400 hover:text-white hover:bg-white/5 transition-colors"\n                onClick={() => setOpen(false)}\n              >\n                Deutsche Version (DE)\n              </Link>\n            </li>\n\n            {/* Mobile Contact CTA */}\n            <li className="mt-2">\n              <Link\n                href={CONTACT_BASE.href}\n                className="block rounded-xl bg-[#F5D778] px-4 py-3 text-sm font-semibold text-[#050814] text-center hover:opacity-90 transition"\n                onClick={() => setOpen(false)}\n              >\n                Contact\n              </Link>\n            </li>\n          </ul>\n        </div>\n      </nav>\n\n      {/* Subtle divider when not scrolled */}\n      {!scrolled && (\n        <div className="h-px w-full bg-gradient-to-r from-transparent via-white/20 to-transparent" />\n      )}\n    </header>\n  );\n}'
 footer = '// components/Footer.tsx\nimport Link from "next/link";\nimport Image from "next/image";\nimport { ArrowRight, MapPin } from "lucide-react";\n\nconst NAV = [\n  {\n    label: "Candidates",\n    links: [\n      { href: "/en/jobs", text: "Browse Jobs" },\n      { href: "/en/candidates", text: "Career Guidance" },\n      { href: "/en/portability", text: "Portability Score" },\n      { href: "/en/bp-simulator", text: "BP Simulator" },\n    ],\n  },\n  {\n    label: "Employers",\n    links: [\n      { href: "/en/hiring-managers/brief", text: "Brief a Role" },\n      { href: "/en/hiring-managers", text: "Our Process" },\n      { href: "/en/contact", text: "Get a Quote" },\n    ],\n  },\n  {\n    label: "Company",\n    links: [\n      { href: "/en/about", text: "About" },\n      { href: "/en/markets", text: "Markets" },\n      { href: "/en/insights", text: "Insights" },\n      { href: "/en/faq", text: "FAQ" },\n      { href: "/en/contact", text: "Contact" },\n    ],\n  },\n  {\n    label: "Specialists",\n    links: [\n      { href: "/en/latam-private-banking-recruiter-geneva", text: "LATAM" },\n      { href: "/en/mea-private-banking-recruiter-geneva", text: "MEA" },\n      { href: "/en/nri-private-banking-recruiter-switzerland", text: "NRI" },\n      { href: "/en/israeli-market-private-banking-switzerland", text: "Israeli Market" },\n      { href: "/en/private-banking-recruitment-company", text: "Our Firm" },\n    ],\n  },\n];\n\nconst HUBS = [\n  { city: "Geneva", flag: "🇨🇭", slug: "geneva" },\n  { city: "Zurich", flag: "🇨🇭", slug: "zurich" },\n  { city: "London", flag: "🇬🇧", slug: "london" },\n  { city: "Dubai", flag: "🇦🇪", slug: "dubai" },\n  { city: "Riyadh", flag: "🇸🇦", slug: "riyadh" },\n  { city: "Singapore", flag: "🇸🇬", slug: "singapore" },\n  { city: "Hong Kong", flag: "🇭🇰", slug: "hong-kong" },\n  { city: "New York", flag: "🇺🇸", slug: "new-york" },\n  { city: "Miami", flag: "🇺🇸", slug: "miami" },\n  { city: "Paris", flag: "🇫🇷", slug: "paris" },\n  { city: "Milan", flag: "🇮🇹", slug: "milan" },\n  { city: "Madrid", flag: "🇪🇸", slug: "madrid" },\n  { city: "Lisbon", flag: "🇵🇹", slug: "lisbon" },\n  { city: "Tel Aviv", flag: "🇮🇱", slug: "tel-aviv" },\n];\n\nexport default function Footer() {\n  return (\n    <footer className="relative bg-[#05070E] text-white overflow-hidden">\n      {/* Ambient glow */}\n      <div aria-hidden className="pointer-events-none absolute inset-0" style={{background:"radial-gradient(ellipse 70% 35% at 50% 0%, rgba(201,161,74,.10) 0%, transparent 60%)"}} />\n      {/* Gold shimmer line */}\n      <div className="h-px w-full" style={{background:"linear-gradient(90deg, transparent 0%, rgba(201,161,74,.5) 25%, rgba(240,208,96,.85) 50%, rgba(201,161,74,.5) 75%, transparent 100%)"}} />\n\n      <div className="relative mx-auto max-w-7xl px-5 sm:px-6 lg:px-8">\n\n        {/* ── MOBILE ── */}\n        <div className="md:hidden">\n\n          {/* Logo + tagline */}\n          <div className="pt-8 pb-6 flex flex-col items-center text-center border-b border-white/[0.06]">\n            <Image\n              src="/transparent-ep-logo.png"\n              alt="Executive Partners"\n              width={290}\n              height={60}\n              sizes="180px"\n              className="h-auto w-[180px] opacity-90 mb-4"\n            />\n            <div className="flex items-center gap-1.5">\n              <MapPin className="h-3 w-3 flex-shrink-0" style={{color:"#C9A14A"}} />\n              <span className="text-xs tracking-wide" style={{color:"rgba(201,161,74,.7)"}}>Geneva · Zurich · London · Dubai · Singapore</span>\n            </div>\n          </div>\n\n          {/* CTA block — dark with gold border */}\n          <div className="py-5 border-b border-white/[0.06]">\n            <Link href="https://calendly.com/execpartners/15-minute-career-consultation"\n              target="_blank" rel="noopener noreferrer"\n              className="flex flex-col items-center text-center w-full rounded-2xl px-6 py-6 gap-4 transition-all active:scale-[0.99]"\n              style={{background:"rgba(201,161,74,.06)",border:"1px solid rgba(201,161,74,.3)"}}>\n              <div>\n                <div className="text-[10px] font-semibold uppercase tracking-[0.15em] mb-2 text-center" style={{color:"rgba(201,161,74,.8)"}}>Confidential · Senior-level · No obligation</div>\n                <div className="text-lg font-semibold text-white leading-snug">Ready to calibrate<br/>your next move?</div>\n              </div>\n              <div className="inline-flex items-center gap-2 rounded-full px-5 py-2.5 text-sm font-semibold w-full justify-center" style={{background:"linear-gradient(135deg, #C9A14A 0%, #E8C46A 100%)",color:"#090C14",fontWeight:"600"}}>\n                Schedule a confidential call <ArrowRight className="h-4 w-4" />\n              </div>\n            </Link>\n          </div>\n\n          {/* Hub pills */}\n          <div className="py-5 border-b border-white/[0.06]">\n            <div className="text-[10px] font-semibold uppercase tracking-[0.12em] mb-3 text-center" style={{color:"rgba(201,161,74,.6)"}}>Our Hubs</div>\n            <div className="flex flex-wrap gap-1.5 justify-center">\n              {HUBS.map((h) => (\n                <Link key={h.city} href={`/en/markets/${h.slug}`}\n                  className="inline-flex items-center gap-1.5 rounded-full px-3 py-1 text-xs font-medium text-white/70 hover:text-white transition-colors"\n                  style={{background:"rgba(255,255,255,.06)",border:"1px solid rgba(255,255,255,.1)"}}>\n                  <span>{h.flag}</span>{h.city}\n                </Link>\n              ))}\n            </div>\n          </div>\n\n          {/* Nav 2-col */}\n          <div className="py-6 grid grid-cols-3 gap-x-4 gap-y-6 border-b border-white/[0.06]">\n            {NAV.map((col) => (\n              <div key={col.label}>\n                <div className="mb-3.5 text-[10px] font-semibold uppercase tracking-[0.14em] text-center" style={{color:"rgba(201,161,74,.8)"}}>{col.label}</div>\n                <ul className="space-y-3">\n                  {col.links.map((link) => (\n                    <li key={link.href}>\n                      <Link href={link.href} className="text-[13px] font-medium text-white/65 hover:text-white/90 transition-colors block text-center" style={{textDecoration:"none",color:"inherit"}}>{link.text}</Link>\n                    </li>\n                  ))}\n                </ul>\n              </div>\n            ))}\n          </div>\n\n          {/* Bottom bar */}\n          <div className="py-5 flex flex-col gap-2 items-center text-center">\n            <div className="text-[12px] text-white/40">© {new Date().getFullYear()} Executive Partners. All rights reserved.</div>\n            <div className="flex items-center gap-3 text-[11px]">\n              <Link href="/en/privacy" className="text-white/40 hover:text-white/70 transition-colors">GDPR Compliant</Link>\n              <span className="w-px h-3 bg-white/15" />\n              <span className="text-white/30">Confidentiality Guaranteed</span>\n            </div>\n          </div>\n        </div>\n\n        {/* ── DESKTOP ── */}\n        <div className="hidden md:block py-16">\n          <div className="flex items-start justify-between mb-12 pb-12 border-b border-white/[0.06]">\n            <div className="max-w-sm">\n              <Image src="/transparent-ep-logo.png" alt="Executive Partners" width={290} height={60} sizes="220px" className="h-auto w-[220px] opacity-90 mb-4" />\n              <p className="text-sm text-white/80 leading-relaxed">Geneva-based executive search for Private Banking & Wealth Management. 200+ placements across 14 global hubs.</p>\n            </div>\n            <Link href="https://calendly.com/execpartners/15-minute-career-consultation"\n              target="_blank" rel="noopener noreferrer"\n              className="inline-flex items-center gap-2 rounded-full px-5 py-2.5 text-sm font-semibold transition-all hover:brightness-110"\n              style={{background:"linear-gradient(135deg, #C9A14A 0%, #E8C46A 100%)",color:"#0B0E13"}}>\n              Schedule a call <ArrowRight className="h-4 w-4" />\n            </Link>\n          </div>\n          <div className="grid grid-cols-12 gap-10">\n            {NAV.map((col) => (\n              <div key={col.label} className="col-span-2">\n                <h4 className="text-[10px] font-semibold uppercase tracking-[0.14em] mb-4" style={{color:"#C9A14A"}}>{col.label}</h4>\n                <ul className="space-y-3">\n                  {col.links.map((link) => (\n                    <li key={link.href}>\n                      <Link href={link.href} className="text-sm text-white/75 hover:text-white visited:text-white/75 transition-colors">{link.text}</Link>\n                    </li>\n                  ))}\n                </ul>\n              </div>\n            ))}\n            <div className="col-span-4">\n              <h4 className="text-[10px] font-semibold uppercase tracking-[0.14em] mb-4" style={{color:"#C9A14A"}}>Our Hubs</h4>\n              <ul className="grid grid-cols-3 gap-x-6 gap-y-3">\n                {HUBS.map((h) => (\n                  <li key={h.city} className="text-sm text-white/70">\n                    <Link href={`/en/markets/${h.slug}`} className="hover:text-white transition-colors flex items-center gap-2">\n                      <span>{h.flag}</span>{h.city}\n                    </Link>\n                  </li>\n                ))}\n              </ul>\n            </div>\n          </div>\n          <div className="mt-12 pt-8 border-t border-white/[0.06] flex items-center justify-between text-xs text-white/50">\n            <div>© {new Date().getFullYear()} Executive Partners. All rights reserved.</div>\n            <div className="flex items-center gap-4">\n              <Link href="/en/privacy" className="hover:text-white visited:text-white/50 transition-colors">GDPR Compliant</Link>\n              <span className="w-px h-3 bg-white/15" />\n              <span>Confidentiality Guaranteed</span>\n            </div>\n          </div>\n        </div>\n\n      </div>\n    </footer>\n  );\n}\n'
 
-with open(os.path.join(BASE, "components/TopNav.tsx"), "w", encoding="utf-8") as f:
-    f.write(nav)
-print("  \u2713 TopNav.tsx written")
+write_text(BASE, "components/TopNav.tsx", nav)
 
-with open(os.path.join(BASE, "components/Footer.tsx"), "w", encoding="utf-8") as f:
-    f.write(footer)
-print("  \u2713 Footer.tsx written")
+write_text(BASE, "components/Footer.tsx", footer)
 
 print("\nDone. Now run:")
 print("  npx next build")
@@ -3,8 +3,8 @@
 Run from repo root: python3 og_generate_and_patch.py
 Requires: pip install Pillow
 Does two things:
-  1. Generates 4 OG images into public/og-articles/
-  2. Patches the 4 page.tsx files to reference those images
+  1. Generates 4 OG images into public/og-articles/ (OG size as JPEG + WebP, Twitter size as JPEG)
+  2. Patches the 4 page.tsx files' openGraph / twitter images to reference them
 """
 
 import os, sys
@@ -16,6 +16,7 @@ SITE = "https://www.execpartners.ch"
 # ─── 1. Generate OG images ────────────────────────────────────────────────────
 try:
     from PIL import Image, ImageDraw, ImageFont
+    from ep_tools.og_variants import EXT, MIME, SIZES, write_variants
 except ImportError:
     print("PIL not found. Run: pip install Pillow")
     sys.exit(1)
@@ -55,7 +56,7 @@ def load_font(paths, size):
     return ImageFont.load_default()
 
 
-def make_og(filename, tag, line1, line2, subtitle, accent, geo_fn):
+def make_og(tag, line1, line2, subtitle, accent, geo_fn):
     img = Image.new("RGB", (W, H), NAVY)
     draw = ImageDraw.Draw(img)
 
@@ -120,9 +121,7 @@ def make_og(filename, tag, line1, line2, subtitle, accent, geo_fn):
     draw.polygon([(cx, cy - s), (cx + s // 3, cy), (cx, cy + s), (cx - s // 3, cy)],
                  fill=(*GOLD, 160))
 
-    out_path = os.path.join(OUT, filename)
-    img.save(out_path, "JPEG", quality=93, optimize=True)
-    print(f"  \u2713 Generated {filename}")
+    return img
 
 
 # ── Geometric decorations per market ──────────────────────────────────────────
@@ -173,76 +172,88 @@ def geo_israel(draw, a):
         draw.ellipse([(W-65+dx, 100+dy), (W-62+dx, 103+dy)], fill=(*a, 50))
 
 
-print("\n1. Generating OG images...")
-
-make_og("og-latam-private-banking-recruiter-geneva.jpg",
-        "LATIN AMERICA \u00b7 PRIVATE BANKING",
-        "LATAM Private", "Banking Recruiter",
-        "Senior RM Search \u00b7 Geneva \u00b7 Swiss Private Banks",
-        (210, 140, 50), geo_latam)
-
-make_og("og-mea-private-banking-recruiter-geneva.jpg",
-        "MIDDLE EAST & AFRICA \u00b7 PRIVATE BANKING",
-        "MEA Private", "Banking Recruiter",
-        "Senior RM Search \u00b7 GCC \u00b7 Francophone Africa \u00b7 Geneva",
-        (180, 148, 60), geo_mea)
+OG_IMAGES = [
+    ("og-latam-private-banking-recruiter-geneva",
+     "LATIN AMERICA \u00b7 PRIVATE BANKING",
+     "LATAM Private", "Banking Recruiter",
+     "Senior RM Search \u00b7 Geneva \u00b7 Swiss Private Banks",
+     (210, 140, 50), geo_latam),
+    ("og-mea-private-banking-recruiter-geneva",
+     "MIDDLE EAST & AFRICA \u00b7 PRIVATE BANKING",
+     "MEA Private", "Banking Recruiter",
+     "Senior RM Search \u00b7 GCC \u00b7 Francophone Africa \u00b7 Geneva",
+     (180, 148, 60), geo_mea),
+    ("og-nri-private-banking-recruiter-switzerland",
+     "NON-RESIDENT INDIAN \u00b7 PRIVATE BANKING",
+     "NRI Private", "Banking Recruiter",
+     "Senior RM Search \u00b7 Switzerland \u00b7 Geneva \u00b7 Zurich",
+     (100, 160, 210), geo_nri),
+    ("og-israeli-market-private-banking-switzerland",
+     "ISRAELI MARKET \u00b7 PRIVATE BANKING",
+     "Israeli Market", "Private Banking",
+     "Senior RM Search \u00b7 Switzerland \u00b7 ISA Licence \u00b7 Geneva",
+     (100, 180, 200), geo_israel),
+]
 
-make_og("og-nri-private-banking-recruiter-switzerland.jpg",
-        "NON-RESIDENT INDIAN \u00b7 PRIVATE BANKING",
-        "NRI Private", "Banking Recruiter",
-        "Senior RM Search \u00b7 Switzerland \u00b7 Geneva \u00b7 Zurich",
-        (100, 160, 210), geo_nri)
 
-make_og("og-israeli-market-private-banking-switzerland.jpg",
-        "ISRAELI MARKET \u00b7 PRIVATE BANKING",
-        "Israeli Market", "Private Banking",
-        "Senior RM Search \u00b7 Switzerland \u00b7 ISA Licence \u00b7 Geneva",
-        (100, 180, 200), geo_israel)
+def generate():
+    print("\n1. Generating OG images...")
+    # Render each canvas once; the pool encodes every size/format from it.
+    images = [(stem, make_og(*spec)) for stem, *spec in OG_IMAGES]
+    write_variants(images, OUT)
 
 
 # ─── 2. Patch page metadata ────────────────────────────────────────────────────
-print("\n2. Patching page metadata...")
-
-def patch(rel, old, new):
+OG_BLOCK_END = '    url: PAGE_URL,\n    type: "website",\n    siteName: "Executive Partners",\n'
+
+
+def image_metadata(stem):
+    """openGraph images (every OG-size variant, JPEG first) and a twitter block
+    for the -twitter variant, as the generated files are named."""
+    og_lines, twitter = [], None
+    for suffix, (w, h), _, formats in SIZES:
+        for fmt in formats:
+            url = f"${{SITE}}/og-articles/{stem}{suffix}{EXT[fmt]}"
+            if suffix == "":
+                og_lines.append(f'      {{ url: `{url}`, width: {w}, height: {h}, type: "{MIME[fmt]}" }},\n')
+            elif suffix == "-twitter" and twitter is None:
+                twitter = f"`{url}`"
+    return (
+        OG_BLOCK_END + "    images: [\n" + "".join(og_lines) + "    ],\n  },\n"
+        + f'  twitter: {{\n    card: "summary_large_image",\n    images: [{twitter}],\n  }},'
+    )
+
+
+def patch(rel, stem):
     path = os.path.join(BASE, rel)
     if not os.path.exists(path):
         print(f"  SKIP (file not found): {rel}")
         return
     s = open(path, encoding="utf-8").read()
-    if old not in s:
-        if new.split("og-articles")[1].split(".jpg")[0] + ".jpg" in s:
-            print(f"  \u2713 Already patched: {rel}")
-        else:
-            print(f"  SKIP (string not found): {rel}")
+    new = image_metadata(stem)
+    if new in s:
+        print(f"  \u2713 Already patched: {rel}")
         return
-    open(path, "w", encoding="utf-8").write(s.replace(old, new, 1))
-    print(f"  \u2713 {rel}")
-
-
-IMG_BASE = f"`${{SITE}}/og-articles/"
-
-patch(
-    "app/en/latam-private-banking-recruiter-geneva/page.tsx",
-    '    url: PAGE_URL,\n    type: "website",\n    siteName: "Executive Partners",\n  },',
-    '    url: PAGE_URL,\n    type: "website",\n    siteName: "Executive Partners",\n    images: [{ url: `${SITE}/og-articles/og-latam-private-banking-recruiter-geneva.jpg`, width: 1200, height: 630 }],\n  },',
-)
-patch(
-    "app/en/mea-private-banking-recruiter-geneva/page.tsx",
-    '    url: PAGE_URL,\n    type: "website",\n    siteName: "Executive Partners",\n  },',
-    '    url: PAGE_URL,\n    type: "website",\n    siteName: "Executive Partners",\n    images: [{ url: `${SITE}/og-articles/og-mea-private-banking-recruiter-geneva.jpg`, width: 1200, height: 630 }],\n  },',
-)
-patch(
-    "app/en/nri-private-banking-recruiter-switzerland/page.tsx",
-    '    url: PAGE_URL,\n    type: "website",\n    siteName: "Executive Partners",\n  },',
-    '    url: PAGE_URL,\n    type: "website",\n    siteName: "Executive Partners",\n    images: [{ url: `${SITE}/og-articles/og-nri-private-banking-recruiter-switzerland.jpg`, width: 1200, height: 630 }],\n  },',
-)
-patch(
-    "app/en/israeli-market-private-banking-switzerland/page.tsx",
-    '    url: PAGE_URL,\n    type: "website",\n    siteName: "Executive Partners",\n  },',
-    '    url: PAGE_URL,\n    type: "website",\n    siteName: "Executive Partners",\n    images: [{ url: `${SITE}/og-articles/og-israeli-market-private-banking-switzerland.jpg`, width: 1200, height: 630 }],\n  },',
-)
-
-
-print("\n\nDone. Now run:")
-print("  npx next build")
-print('  git add -A && git commit -m "seo: OG images for LATAM, MEA, NRI, Israeli market pages" && git push\n')
+    # The openGraph block without images, or with the single JPEG an earlier run added.
+    jpg_only = f"    images: [{{ url: `${{SITE}}/og-articles/{stem}.jpg`, width: 1200, height: 630 }}],\n"
+    for old in (OG_BLOCK_END + jpg_only + "  },", OG_BLOCK_END + "  },"):
+        if old in s:
+            open(path, "w", encoding="utf-8").write(s.replace(old, new, 1))
+            print(f"  \u2713 {rel}")
+            return
+    print(f"  SKIP (string not found): {rel}")
+
+
+def patch_pages():
+    print("\n2. Patching page metadata...")
+    for stem, *_ in OG_IMAGES:
+        patch(f"app/en/{stem[len('og-'):]}/page.tsx", stem)
+
+
+if __name__ == "__main__":
+    generate()
+    patch_pages()
+
+    print("\n\nDone. Now run:")
+    print("  npx next build")
+    print('  git add -A && git commit -m "seo: OG images for LATAM, MEA, NRI, Israeli market pages" && git push\n')
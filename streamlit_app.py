@@ -41,11 +41,23 @@ p,li,label,span{color:var(--ep-text-dim)}
 [data-testid="stMetricValue"]{color:#fff!important;font-weight:800;letter-spacing:-.01em;font-size:1.35rem}
 a{color:#fff;text-decoration:underline;text-underline-offset:3px}
 """
+from ep_tools.theme import style_tag as _style_tag
+
+@st.cache_resource(show_spinner=False)
+def _theme_tag(css_mtime_ns):
+    """Minified, hashed <style> element; built once per process (and per edit of ep.css)."""
+    try:
+        return _style_tag(CSS_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return _style_tag(_BUILTIN_CSS)
+
 try:
-    css = CSS_PATH.read_text(encoding="utf-8")
-    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
-except Exception:
-    st.markdown(f"<style>{_BUILTIN_CSS}</style>", unsafe_allow_html=True)
+    _css_mtime = CSS_PATH.stat().st_mtime_ns
+except OSError:
+    _css_mtime = None
+# Identical bytes on every rerun: Streamlit sends it by hash once the browser has it
+# (see global.minCachedMessageSize in .streamlit/config.toml).
+st.markdown(_theme_tag(_css_mtime), unsafe_allow_html=True)
 
 # ---------- warnings / env ----------
 import warnings
@@ -71,6 +83,7 @@ try:
 except Exception:
     # keep UI running; show nothing noisy to end users
     gspread = None
+from ep_tools import bp_shards as _bp_shards, fake_sheets as _fake_sheets, sheets_quota as _sheets_quota
 
 # ================== CONFIG ==================
 SHEET_ID = "1A__yEhD_0LYQwBF45wTSbWqdkRe0HAdnnBSj70qgpic"
@@ -114,26 +127,34 @@ def _email_valid(e: str) -> bool:
 
 # ================== SHEETS (robust) ==================
 def connect_sheet():
-    """Returns: (worksheet or None, human_message). Never raises."""
+    """Returns: (bp_shards.Shards or None, human_message). Never raises."""
     global SA_EMAIL, SA_SOURCE
-    if gspread is None:
+    if gspread is None and not _fake_sheets.enabled():
         return None, "gspread not available."
 
     try:
-        sa_path = _service_account_path()
-        if not sa_path.exists():
-            return None, (
-                "⚠️ service_account.json not found next to this script.\n"
-                f"Place the file at: {sa_path}"
-            )
+        if _fake_sheets.enabled():  # EP_SHEETS_BACKEND=fake: in-process sheet for offline runs / load tests
+            SA_SOURCE = "fake backend (ep_tools.fake_sheets)"
+            gc = _fake_sheets.client()
+        else:
+            sa_path = _service_account_path()
+            if not sa_path.exists():
+                return None, (
+                    "⚠️ service_account.json not found next to this script.\n"
+                    f"Place the file at: {sa_path}"
+                )
 
-        SA_SOURCE = f"local-file:{sa_path}"
-        SA_EMAIL = _read_sa_email_from_file(sa_path)
+            SA_SOURCE = f"local-file:{sa_path}"
+            SA_EMAIL = _read_sa_email_from_file(sa_path)
 
-        gc = gspread.service_account(filename=str(sa_path))
+            gc = gspread.service_account(filename=str(sa_path))
 
+        # Every Sheets call draws on the quota shared by all processes (ep_tools.sheets_quota)
+        quota = _sheets_quota.default()
         try:
-            sh = gc.open_by_key(SHEET_ID)
+            sh = _sheets_quota.limited(quota.call(_sheets_quota.READ, gc.open_by_key, SHEET_ID), quota)
+        except _sheets_quota.QuotaError:
+            return None, "⚠️ Google Sheets is busy right now; saving will resume shortly."
         except Exception as e:
             msg = str(e)
             if "PERMISSION_DENIED" in msg or "403" in msg:
@@ -144,28 +165,102 @@ def connect_sheet():
                 return None, "⚠️ Could not connect: Sheet not found. Check SHEET_ID."
             return None, f"⚠️ Google API error while opening sheet: {e}"
 
-        try:
-            ws = sh.worksheet(WORKSHEET_NAME)
-        except gspread.exceptions.WorksheetNotFound:
-            ws = sh.add_worksheet(title=WORKSHEET_NAME, rows=2000, cols=50)
+        # Saves go to per-quarter shards of BP_Entries, listed in BP_Catalog (ep_tools.bp_shards)
+        shards = _bp_shards.Shards(sh, HEADER_ORDER).refresh()
 
-        headers = ws.row_values(1)
-        if headers != HEADER_ORDER:
-            ws.update("A1", [HEADER_ORDER])
-
-        return ws, "✅ Connected to Google Sheet"
+        return shards, "✅ Connected to Google Sheet"
+    except _sheets_quota.QuotaError:
+        return None, "⚠️ Google Sheets is busy right now; saving will resume shortly."
     except Exception as e:
         return None, f"⚠️ Could not connect to Google Sheet: {e}"
 
-def append_in_header_order(ws, data_dict: dict):
-    headers = ws.row_values(1) or HEADER_ORDER
-    row = [data_dict.get(h, "") for h in headers]
-    ws.append_row(row, value_input_option="USER_ENTERED")
+
+SHEET_TTL_S = 600  # a connection (3 quota reads) is reused by every rerun and session for this long
+
+
+class _SheetUnavailable(Exception):
+    pass
+
+
+@st.cache_resource(ttl=SHEET_TTL_S, show_spinner=False)
+def _cached_sheet():
+    shards, status = connect_sheet()
+    if shards is None:
+        raise _SheetUnavailable(status)  # not cached: the next rerun tries again
+    return shards, status
+
+
+def sheet_handle():
+    """connect_sheet() shared per process for SHEET_TTL_S, so reruns don't spend quota on reconnecting."""
+    try:
+        return _cached_sheet()
+    except _SheetUnavailable as e:
+        return None, str(e)
+
 
 def clean_trailing_columns(ws, first_bad_letter="X"):
     ws.batch_clear([f"{first_bad_letter}2:ZZ"])
     ws.resize(cols=len(HEADER_ORDER))
 
+# ================== DUPLICATE SAVES ==================
+from ep_tools import bp_dedupe as _bp_dedupe
+
+@st.cache_resource(show_spinner=False)
+def _save_index():
+    """Per-process content-hash / email index of BP_Entries (ep_tools.bp_dedupe)."""
+    return _bp_dedupe.load()
+
+# ================== PEER BENCHMARKS ==================
+from ep_tools import bp_benchmarks as _bp_benchmarks
+
+@st.cache_resource(show_spinner=False)
+def _peer_benchmarks():
+    """Per-process quantile sketches of past BP_Entries (ep_tools.bp_benchmarks)."""
+    return _bp_benchmarks.load()
+
+def _metric_with_peers(label, shown, metric, value, market, role):
+    st.metric(label, shown)
+    hit = _peer_benchmarks().percentile(metric, value, market, role)
+    st.caption(f"P{hit[0]} vs {hit[1]} peers ({hit[2]})" if hit else "Peer benchmark: not enough submissions yet")
+
+# ================== PROJECTION & SCORING ==================
+from ep_tools import bp_model as _bp_model
+
+# ================== ADMIN DASHBOARD ==================
+from ep_tools import bp_rollups as _bp_rollups
+
+@st.cache_resource(show_spinner=False)
+def _admin_rollups():
+    """Per-process rollup cubes of BP_Entries (ep_tools.bp_rollups)."""
+    return _bp_rollups.load()
+
+def _render_admin_dashboard():
+    cube = _admin_rollups()
+    with st.expander("📈 Submissions dashboard", expanded=False):
+        months = cube.months()
+        if not months:
+            st.caption("No submissions synced yet.")
+            return
+        d1, d2 = st.columns(2)
+        dim = d1.selectbox("Break down by", _bp_rollups.DIMENSIONS, format_func=str.title, key="dash_dim")
+        month = d2.selectbox(
+            "Month", [_bp_rollups.ALL] + months[::-1], key="dash_month",
+            format_func=lambda m: "All time" if m == _bp_rollups.ALL else m,
+        )
+        total = cube.total(month) or {}
+        k1, k2, k3, k4 = st.columns(4)
+        k1.metric("Submissions", f"{total.get('Submissions', 0):,}")
+        for col, key in ((k2, "Median AUM (M)"), (k3, "Median ROA %"), (k4, "Median 3Y NNM (M)")):
+            col.metric(key, "—" if total.get(key) is None else f"{total[key]:,.2f}")
+        st.markdown("**Submissions per month**")
+        st.bar_chart(pd.DataFrame(cube.monthly(), columns=["Month", "Submissions"]).set_index("Month"))
+        st.markdown(f"**By {dim}** (🟢 strong · 🟡 medium · 🔴 weak · — not scored)")
+        st.dataframe(pd.DataFrame(cube.table(dim, month, limit=25)), use_container_width=True, hide_index=True)
+        scores = cube.scores(month=month)
+        if scores:
+            st.markdown("**Score distribution**")
+            st.bar_chart(pd.Series(scores, name="Submissions"))
+
 # ================== MODE (Admin vs Candidate) ==================
 try:
     qp = st.query_params  # new API
@@ -189,12 +284,31 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-worksheet, sheet_status = connect_sheet()
+with _sheets_quota.patience(3):  # don't hold the page for long when the quota is saturated
+    worksheet, sheet_status = sheet_handle()
+try:
+    with _sheets_quota.optional():  # only with tokens to spare, never during a backoff: the sync is optional
+        _peer_benchmarks().sync(worksheet)  # rows appended since the last sync; at most every 5 min
+except Exception:
+    pass  # benchmarks are optional: never block the simulator on them
 if ADMIN_MODE and sheet_status:
     with st.expander("🔎 Connection diagnostics", expanded=False):
         st.caption(sheet_status)
         if SA_SOURCE: st.caption(f"Cred source: {SA_SOURCE}")
         if SA_EMAIL: st.caption(f"Service account email: {SA_EMAIL}")
+        for op, m in _sheets_quota.default().metrics().items():
+            st.caption(
+                f"Sheets {op}s: {m['this_minute']}/{m['per_minute']} this minute · {m['tokens']:.1f} tokens · "
+                f"{m['calls']} calls · {m['throttled']} × 429 · {m['rejected']} rejected · {m['skipped']} skipped · "
+                f"{m['waited_s']:.1f}s waited" + (f" · backing off {m['blocked_s']}s" if m["blocked_s"] else "")
+            )
+if ADMIN_MODE:
+    try:
+        with _sheets_quota.optional():
+            _admin_rollups().sync(worksheet)
+    except Exception:
+        pass
+    _render_admin_dashboard()
 
 st.info("*Fields marked with an asterisk (*) are mandatory and handled confidentially.")
 
@@ -475,17 +589,15 @@ try:
     roa_y2 = roa_cols[1].number_input("ROA % Year 2", min_value=0.0, value=1.0, step=0.1)
     roa_y3 = roa_cols[2].number_input("ROA % Year 3", min_value=0.0, value=1.0, step=0.1)
 
-    # (calculations unchanged)
-    rev1 = (locals().get('nnm_y1') or 0.0) * roa_y1 / 100 * 1_000_000
-    rev2 = (locals().get('nnm_y2') or 0.0) * roa_y2 / 100 * 1_000_000
-    rev3 = (locals().get('nnm_y3') or 0.0) * roa_y3 / 100 * 1_000_000
-    fixed_cost = (locals().get('base_salary') or 0.0) * 1.25
-    nm1 = rev1 - fixed_cost
-    nm2 = rev2 - fixed_cost
-    nm3 = rev3 - fixed_cost
-    gross_total = rev1 + rev2 + rev3
-    total_costs = fixed_cost * 3
-    nm_total = nm1 + nm2 + nm3
+    proj = _bp_model.projection(
+        [locals().get('nnm_y1'), locals().get('nnm_y2'), locals().get('nnm_y3')],
+        [roa_y1, roa_y2, roa_y3],
+        locals().get('base_salary'),
+    )
+    rev1, rev2, rev3 = proj["revenue"]
+    nm1, nm2, nm3 = proj["net_margin"]
+    fixed_cost = proj["fixed_cost"]
+    gross_total, total_costs, nm_total = proj["gross_total"], proj["total_costs"], proj["net_total"]
 
     df_rev = pd.DataFrame(
         {
@@ -516,9 +628,6 @@ try:
         with seg_col2:
             tolerance_pct = st.slider("NNM vs Prospects tolerance (%)", 0, 50, 10, 1)
 
-        total_nnm_3y = float((locals().get('nnm_y1') or 0.0) + (locals().get('nnm_y2') or 0.0) + (locals().get('nnm_y3') or 0.0))
-        avg_roa = float((roa_y1 + roa_y2 + roa_y3) / 3)
-
         current_market = locals().get('current_market', "CH Onshore")
         current_assets = float(locals().get('current_assets') or 0.0)
         base_salary_val2 = float(locals().get('base_salary') or 0.0)
@@ -526,67 +635,16 @@ try:
         years_experience = int(locals().get('years_experience') or 0)
         current_number_clients = int(locals().get('current_number_clients') or 0)
 
-        aum_min = 200.0 if (current_market == "CH Onshore" or target_segment == "HNWI") else 300.0
-
-        score = 0
-        reasons_pos, reasons_neg, flags = [], [], []
-
-        if years_experience >= 7:
-            score += 2; reasons_pos.append("Experience ≥7 years in market")
-        elif years_experience >= 6:
-            score += 1; reasons_pos.append("Experience 6 years")
-        else:
-            reasons_neg.append("Experience <6 years")
-
-        if current_assets >= aum_min:
-            if current_market == "CH Onshore" and current_assets >= 250:
-                score += 2; reasons_pos.append("AUM meets CH 250M target")
-            else:
-                score += 2; reasons_pos.append(f"AUM ≥ {aum_min}M")
-        else:
-            reasons_neg.append(f"AUM shortfall: {aum_min - current_assets:.0f}M")
-
-        if base_salary_val2 > 200_000 and last_bonus > 100_000:
-            score += 2; reasons_pos.append("Comp indicates hunter profile")
-        elif base_salary_val2 <= 150_000 and last_bonus <= 50_000:
-            score -= 1; reasons_neg.append("Low comp indicates inherited/low portability")
-        else:
-            flags.append("Comp neutral – clarify origin of book")
-
-        if avg_roa >= 1.0:
-            score += 2; reasons_pos.append(f"Avg ROA {avg_roa:.2f}% (excellent)")
-        elif avg_roa >= 0.8:
-            score += 1; reasons_pos.append(f"Avg ROA {avg_roa:.2f}% (acceptable)")
-        else:
-            reasons_neg.append(f"Avg ROA {avg_roa:.2f}% is low")
-
-        if current_number_clients == 0:
-            flags.append("Clients not provided")
-        elif current_number_clients > 80:
-            reasons_neg.append(f"High client count ({current_number_clients}) – likely lower segment")
-        else:
-            score += 1; reasons_pos.append("Client load appropriate (≤80)")
-
-        df_pros_check = pd.DataFrame(
-            st.session_state.prospects_list,
-            columns=["Name","Source","Wealth (M)","Best NNM (M)","Worst NNM (M)"]
+        evaluation = _bp_model.evaluate(
+            years_experience, current_assets, current_market, base_salary_val2, last_bonus,
+            [roa_y1, roa_y2, roa_y3], current_number_clients,
+            [locals().get('nnm_y1'), locals().get('nnm_y2'), locals().get('nnm_y3')],
+            _bp_model.prospect_totals(st.session_state.prospects_list)["Best NNM (M)"],
+            target_segment, tolerance_pct,
         )
-        nnm_y1_val = float((locals().get('nnm_y1') or 0.0))
-        best_sum = float(df_pros_check["Best NNM (M)"].sum()) if not df_pros_check.empty else 0.0
-        tol = max(0.0, tolerance_pct) / 100.0
-        if nnm_y1_val == 0.0 and best_sum == 0.0:
-            flags.append("Prospects & NNM Y1 both zero")
-        elif abs(best_sum - nnm_y1_val) <= tol * max(nnm_y1_val, 1e-9):
-            score += 1; reasons_pos.append(f"Prospects Best NNM {best_sum:.1f}M ≈ NNM Y1 {nnm_y1_val:.1f}M")
-        else:
-            reasons_neg.append(f"Prospects {best_sum:.1f}M vs NNM Y1 {nnm_y1_val:.1f}M (> {int(tolerance_pct)}% dev)")
-
-        if total_nnm_3y >= (100.0 if target_segment == "HNWI" else 200.0):
-            score += 2; reasons_pos.append(f"3Y NNM {total_nnm_3y:.1f}M meets target")
-        else:
-            reasons_neg.append(f"3Y NNM {total_nnm_3y:.1f}M below target")
-
-        verdict = "🟢 Strong Candidate" if score >= 7 else "🟡 Medium Potential" if score >= 4 else "🔴 Weak Candidate"
+        score, verdict = evaluation["score"], evaluation["verdict"]
+        reasons_pos, reasons_neg, flags = evaluation["positives"], evaluation["risks"], evaluation["flags"]
+        total_nnm_3y, avg_roa = evaluation["total_nnm_3y"], evaluation["avg_roa"]
 
         st.subheader(f"Traffic Light: {verdict} (score {score}/10)")
         colA, colB, colC = st.columns(3)
@@ -604,10 +662,10 @@ try:
                 st.markdown(f"- ⚠️ {r}")
 
         m1, m2, m3, m4 = st.columns(4)
-        with m1: st.metric("AUM (M)", f"{current_assets:,.0f}")
-        with m2: st.metric("Avg ROA %", f"{avg_roa:.2f}")
-        with m3: st.metric("3Y NNM (M)", f"{total_nnm_3y:.1f}")
-        with m4: st.metric("Clients", f"{int(current_number_clients)}")
+        with m1: _metric_with_peers("AUM (M)", f"{current_assets:,.0f}", "aum", current_assets, current_market, current_role)
+        with m2: _metric_with_peers("Avg ROA %", f"{avg_roa:.2f}", "roa", avg_roa, current_market, current_role)
+        with m3: _metric_with_peers("3Y NNM (M)", f"{total_nnm_3y:.1f}", "nnm_3y", total_nnm_3y, current_market, current_role)
+        with m4: _metric_with_peers("Clients", f"{int(current_number_clients)}", "clients", current_number_clients, current_market, current_role)
 
     else:
         total_nnm_3y = float((locals().get('nnm_y1') or 0.0) + (locals().get('nnm_y2') or 0.0) + (locals().get('nnm_y3') or 0.0))
@@ -616,11 +674,13 @@ try:
         current_number_clients = int(locals().get('current_number_clients') or 0)
 
         st.info("Neutral insights to help you plan your growth (no recruiter scoring shown).")
+        peer_market = locals().get('current_market', "")
+        peer_role = locals().get('current_role', "")
         c1, c2, c3, c4 = st.columns(4)
-        with c1: st.metric("AUM (M)", f"{current_assets:,.0f}")
-        with c2: st.metric("Avg ROA %", f"{avg_roa:.2f}")
-        with c3: st.metric("3Y NNM (M)", f"{total_nnm_3y:.1f}")
-        with c4: st.metric("Clients", f"{int(current_number_clients)}")
+        with c1: _metric_with_peers("AUM (M)", f"{current_assets:,.0f}", "aum", current_assets, peer_market, peer_role)
+        with c2: _metric_with_peers("Avg ROA %", f"{avg_roa:.2f}", "roa", avg_roa, peer_market, peer_role)
+        with c3: _metric_with_peers("3Y NNM (M)", f"{total_nnm_3y:.1f}", "nnm_3y", total_nnm_3y, peer_market, peer_role)
+        with c4: _metric_with_peers("Clients", f"{int(current_number_clients)}", "clients", current_number_clients, peer_market, peer_role)
 
         st.markdown("### 💡 Areas to consider")
         hints = []
@@ -653,13 +713,10 @@ try:
     roa_y3 = float(locals().get('roa_y3') or 0.0)
     base_salary_val = float(locals().get('base_salary') or 0.0)
 
-    total_rev_3y = ((nnm_y1 * roa_y1) + (nnm_y2 * roa_y2) + (nnm_y3 * roa_y3)) / 100 * 1_000_000
-    profit_margin_pct = (((total_rev_3y - (base_salary_val * 1.25 * 3)) / total_rev_3y) * 100.0) if total_rev_3y > 0 else 0.0
-    total_profit_3y = (
-        (nnm_y1 * roa_y1 / 100 * 1_000_000) +
-        (nnm_y2 * roa_y2 / 100 * 1_000_000) +
-        (nnm_y3 * roa_y3 / 100 * 1_000_000)
-    ) - (base_salary_val * 1.25 * 3)
+    proj = _bp_model.projection([nnm_y1, nnm_y2, nnm_y3], [roa_y1, roa_y2, roa_y3], base_salary_val)
+    total_rev_3y = proj["total_revenue_3y"]
+    profit_margin_pct = proj["profit_margin_pct"]
+    total_profit_3y = proj["total_profit_3y"]
 
     # read email from session state to ensure we capture typed value
     email_value = st.session_state.get("candidate_email", "").strip()
@@ -680,9 +737,9 @@ try:
         "NNM Year 1 (M CHF)": nnm_y1,
         "NNM Year 2 (M CHF)": nnm_y2,
         "NNM Year 3 (M CHF)": nnm_y3,
-        "Revenue Year 1 (CHF)": nnm_y1 * roa_y1 / 100 * 1_000_000,
-        "Revenue Year 2 (CHF)": nnm_y2 * roa_y2 / 100 * 1_000_000,
-        "Revenue Year 3 (CHF)": nnm_y3 * roa_y3 / 100 * 1_000_000,
+        "Revenue Year 1 (CHF)": proj["revenue"][0],
+        "Revenue Year 2 (CHF)": proj["revenue"][1],
+        "Revenue Year 3 (CHF)": proj["revenue"][2],
         "Total Revenue 3Y (CHF)": total_rev_3y,
         "Profit Margin (%)": profit_margin_pct,
         "Total Profit 3Y (CHF)": total_profit_3y,
@@ -699,15 +756,24 @@ try:
 
     # Helper: append to Google Sheet (safe)
     def _append_sheet_safe(row: dict):
-        ws = st.session_state.get("worksheet")
-        if not ws:
+        shards = st.session_state.get("worksheet")
+        if not shards:
+            shards, _ = sheet_handle()  # the page may have loaded while the quota was saturated
+        if not shards:
             st.session_state["sheet_status_msg"] = "⚠️ Google Sheet connection not available."
             return
         try:
-            append_in_header_order(ws, row)
-            st.session_state["sheet_status_msg"] = "✅ Saved to Google Sheet"
+            action, _ = _bp_dedupe.save(shards, row, _save_index(), (_peer_benchmarks(), _admin_rollups()))
+        except _sheets_quota.QuotaError:
+            st.session_state["sheet_status_msg"] = "⚠️ Google Sheets is busy right now; please download again in a minute to save."
+            return
         except Exception as e:
             st.session_state["sheet_status_msg"] = f"⚠️ Save error: {e}"
+            return
+        st.session_state["sheet_status_msg"] = {
+            "duplicate": "✅ Already saved to Google Sheet",
+            "replace": "✅ Saved to Google Sheet (updated your earlier save)",
+        }.get(action, "✅ Saved to Google Sheet")
 
     if missing:
         st.warning("To continue, complete **Candidate Email** and **Candidate Location** in **Section 1** above. The preview and the download button will appear here automatically.")